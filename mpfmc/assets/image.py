@@ -2,6 +2,7 @@ from kivy.core.image import Image
 from mpf.core.assets import AssetPool
 
 from mpfmc.assets.mc_asset import McAsset
+from mpfmc.uix.image_sequence import ImageSequence, DEFAULT_BUFFER_FRAMES
 
 # This module has extra comments since it's what we tell people to use as an
 # example of an Asset implementation.
@@ -47,6 +48,26 @@ class ImageAsset(McAsset):
 
         return self._image
 
+    @property
+    def frame_count(self):
+        # Number of frames of the image (1 for still images)
+        if isinstance(self._image, ImageSequence):
+            return self._image.frame_count
+
+        try:
+            return len(self._image.image.textures)
+        except AttributeError:
+            return 0
+
+    @property
+    def memory(self):
+        # Memory (in bytes) used by the frames of a streamed image sequence
+        # (None for images loaded by Kivy)
+        if isinstance(self._image, ImageSequence):
+            return self._image.memory
+
+        return None
+
     def do_load(self):
         # This is the method that's actually called to load the asset from
         # disk. It's called by the loader thread so it's ok to block. However
@@ -56,6 +77,16 @@ class ImageAsset(McAsset):
         # the various load status attributes will be updated automatically,
         # and anything that was waiting for it to load will be called. So
         # all you have to do here is load and return.
+
+        # Zip image sequences and animated gifs with streaming: true only keep
+        # a few decoded frames in memory (see ImageSequence).
+        if (self.config.get('streaming') and
+                self.config['file'].lower().endswith(('.zip', '.gif'))):
+            self._image = ImageSequence(
+                self.config['file'],
+                buffer_frames=self.config.get('streaming_buffer_frames', DEFAULT_BUFFER_FRAMES))
+            return
+
         self._image = Image(self.config['file'],
                             keep_data=False,
                             scale=1.0,
@@ -71,4 +102,7 @@ class ImageAsset(McAsset):
         # complexities, but since it's in the main thread, you need to
         # return quickly.
 
+        if isinstance(self._image, ImageSequence):
+            self._image.unload()
+
         self._image = None
@@ -691,6 +691,10 @@ class SoundInstance(object):
     """An instance of a playing sound asset. This class is essentially a wrapper container
     for sound assets that contains all the overridden parameter values for playback."""
 
+    # Special start_after marker ids (must match the scheduled marker values in track_standard.pxd)
+    START_AFTER_ABOUT_TO_FINISH = -2
+    START_AFTER_END = -3
+
     def __init__(self, sound: Union[SoundAsset, SoundPool],     # noqa
                  context: Optional[str] = None, settings: Optional[dict] = None):
         """Construct sound instance."""
@@ -701,6 +705,9 @@ class SoundInstance(object):
         self.mc = sound.machine
         self._timestamp = self.mc.clock.get_time()
 
+        # BCP commands which caused the sound to play (when the latency tracer is enabled)
+        self._traces = self.mc.latency_tracer.get_sound_traces()
+
         if context and isinstance(context, str):
             self._context = context
         else:
@@ -745,6 +752,9 @@ class SoundInstance(object):
         self._mode_end_action = self._sound.mode_end_action
         self._markers = self._sound.markers
         self._exp_time = None
+        self._start_sample = None
+        self._start_after = None
+        self._start_after_marker = None
 
         if settings is None:
             settings = dict()
@@ -804,6 +814,13 @@ class SoundInstance(object):
         if 'key' in settings:
             self._key = settings['key']
 
+        if 'start_sample' in settings and settings['start_sample'] is not None:
+            self._start_sample = int(settings['start_sample'])
+
+        if 'start_after' in settings and settings['start_after'] is not None:
+            self._start_after = settings['start_after']
+            self._start_after_marker = self._get_start_after_marker_id(settings.get('start_after_marker'))
+
     def __repr__(self):
         """String that's returned if someone prints this object"""
         return '<SoundInstance: {} ({}), Volume={}, Loops={}, Priority={}, Loaded={}, Track={}>'.format(
@@ -910,6 +927,45 @@ class SoundInstance(object):
         """Return the start at time for the sound (in seconds)"""
         return self._start_at
 
+    @property
+    def start_sample(self):
+        """Return the audio clock sample position at which the sound is scheduled to start
+        (None if the sound starts as soon as possible)"""
+        return self._start_sample
+
+    @property
+    def start_after(self):
+        """Return the sound instance whose marker starts this sound (None if not used)"""
+        return self._start_after
+
+    @property
+    def start_after_marker(self):
+        """Return the id of the start_after sound instance marker that starts this sound"""
+        return self._start_after_marker
+
+    def _get_start_after_marker_id(self, marker):
+        """Return the id of the specified start_after sound instance marker (name or id).
+
+        The special marker names 'about_to_finish' (the about to finish marker of the sound)
+        and 'end' (the end of the sound, the default) may also be used.
+        """
+        if marker is None or marker == 'end':
+            return SoundInstance.START_AFTER_END
+
+        if marker == 'about_to_finish':
+            return SoundInstance.START_AFTER_ABOUT_TO_FINISH
+
+        if isinstance(marker, int) and 0 <= marker < self._start_after.marker_count:
+            return marker
+
+        if isinstance(marker, str):
+            for marker_id, settings in enumerate(self._start_after.markers):
+                if settings['name'] == marker.lower():
+                    return marker_id
+
+        raise AudioException("Sound {} cannot be scheduled after marker {} of sound {} "
+                             "(marker does not exist)".format(self.name, marker, self._start_after.name))
+
     @property
     def fade_in(self):
         """Return the fade in time for the sound (in seconds)"""
@@ -1065,6 +1121,9 @@ class SoundInstance(object):
         corresponding actions."""
         self._status = SoundInstanceStatus.playing
         self._played = True
+        if self._traces:
+            self.mc.latency_tracer.sound_started(self._traces, self.mc.sound_system.notification_time)
+            self._traces = None
         if self.events_when_played is not None:
             for event in self.events_when_played:
                 self.mc.post_mc_native_event(event, sound_instance=self)
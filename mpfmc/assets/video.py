@@ -1,10 +1,30 @@
-from kivy.core.video import Video
+import logging
+import time
+from bisect import bisect_right
+from typing import List, Optional, Tuple
+
+from kivy.clock import Clock
+from kivy.core.video import Video, VideoBase
 from kivy.core.video.video_null import VideoNull
+from kivy.graphics.texture import Texture
 from kivy.properties import AliasProperty
 
 from mpf.core.assets import AssetPool
 from mpfmc.assets.mc_asset import McAsset
 
+# Default memory limit (in MB) of the decoded frames of one video
+DEFAULT_CACHE_FRAMES_MAX_MEMORY = 64
+
+# Video settings of the mc which are not in the assets:videos config spec of mpf
+VIDEO_CONFIG_SPEC = {
+    'cache_frames': 'single|bool|False',
+    'cache_frames_max_memory': 'single|num|{}'.format(DEFAULT_CACHE_FRAMES_MAX_MEMORY),
+    'cache_frames_scale': 'single|float|1.0',
+}
+
+# Maximum time (in secs) to wait for the decoder to return a frame
+DECODE_TIMEOUT = 5.0
+
 
 class VideoPool(AssetPool):
 
@@ -38,6 +58,218 @@ class VideoWrapper(Video):
         self.dispatch('on_play')
 
 
+class VideoFrames(object):
+
+    """Decoded frames of a video (RGB bytes and their timestamps)."""
+
+    __slots__ = ["size", "duration", "timestamps", "frames"]
+
+    def __init__(self, size: Tuple[int, int], duration: float, timestamps: List[float],
+                 frames: List[bytes]) -> None:
+        """Initialise frame store."""
+        self.size = size
+        self.duration = duration
+        self.timestamps = timestamps
+        self.frames = frames
+
+    @property
+    def memory(self) -> int:
+        """Return the memory (in bytes) used by the frames."""
+        return sum(len(frame) for frame in self.frames)
+
+    def get_index(self, position: float) -> int:
+        """Return the index of the frame shown at a position (in secs)."""
+        return max(0, bisect_right(self.timestamps, position) - 1)
+
+
+def decode_video_frames(file: str, max_memory: int, scale: float = 1.0) -> Optional[VideoFrames]:
+    """Decode all the frames of a video to RGB bytes (optionally downscaled).
+
+    Returns None when the frames need more than max_memory bytes or when the
+    video cannot be decoded (ffpyplayer is used to decode the video). The video
+    is decoded in real time, so this takes about the duration of the video.
+    """
+    try:
+        from ffpyplayer.pic import SWScale
+        from ffpyplayer.player import MediaPlayer
+    except ImportError:
+        logging.getLogger('VideoAsset').warning(
+            "Cannot cache the frames of video %s because ffpyplayer is not installed", file)
+        return None
+
+    player = MediaPlayer(file, ff_opts={'an': True, 'sn': True, 'sync': 'video', 'out_fmt': 'rgb24'})
+    size = None
+    scaler = None
+    timestamps = list()
+    frames = list()
+    memory = 0
+    timeout = time.monotonic() + DECODE_TIMEOUT
+
+    try:
+        while True:
+            frame, value = player.get_frame()
+            if value == 'eof':
+                break
+
+            if frame is None:
+                if time.monotonic() > timeout:
+                    return None
+                time.sleep(.005)
+                continue
+
+            image, pts = frame
+            if size is None:
+                width, height = image.get_size()
+                size = (width, height)
+                if scale != 1.0:
+                    size = (max(1, int(width * scale)), max(1, int(height * scale)))
+                    scaler = SWScale(width, height, image.get_pixel_format(), ow=size[0], oh=size[1])
+
+            if scaler:
+                image = scaler.scale(image)
+
+            data = bytes(image.to_bytearray()[0])
+            memory += len(data)
+            if memory > max_memory:
+                logging.getLogger('VideoAsset').warning(
+                    "The frames of video %s need more than %s MB, so they are not cached",
+                    file, max_memory // 1048576)
+                return None
+
+            timestamps.append(pts)
+            frames.append(data)
+            timeout = time.monotonic() + DECODE_TIMEOUT
+
+        duration = player.get_metadata()['duration'] or 0
+    finally:
+        player.close_player()
+
+    if not frames:
+        return None
+
+    logging.getLogger('VideoAsset').debug(
+        "Cached %s frames of video %s (%.1f MB)", len(frames), file, memory / 1048576)
+
+    # the first frame is shown from the start
+    timestamps[0] = 0.0
+    return VideoFrames(size, max(duration, timestamps[-1]), timestamps, frames)
+
+
+class CachedVideo(VideoBase):
+
+    """Video which shows the decoded frames of a VideoFrames store.
+
+    The frame shown at the current position is uploaded to the texture when
+    the frame changes, so playing (and looping) the video does not decode it
+    again. Implements the interface of the Kivy video providers.
+    """
+
+    def __init__(self, frames: VideoFrames, **kwargs) -> None:
+        """Initialise cached video."""
+        self._frames = frames
+        self._position = 0.0
+        self._start_time = None
+        self._frame_index = None
+        self._frame_event = None
+        super().__init__(**kwargs)
+        self.register_event_type('on_play')
+        self.register_event_type('on_stop')
+
+    def on_play(self):
+        pass
+
+    def on_stop(self):
+        pass
+
+    def _get_position(self):
+        if self._start_time is not None:
+            return min(Clock.time() - self._start_time, self._frames.duration)
+        return self._position
+
+    def _get_duration(self):
+        return self._frames.duration
+
+    def _set_position(self, pos):
+        # position in secs
+        self._seek_to(pos)
+
+    def seek(self, percent, precise=True):
+        del precise
+        self._seek_to(percent * self._frames.duration)
+
+    def _seek_to(self, position):
+        position = min(max(position, 0.0), self._frames.duration)
+        if self._start_time is not None:
+            self._start_time = Clock.time() - position
+        self._position = position
+        self._show_frame(position)
+
+    def play(self):
+        if self._state == 'playing':
+            return
+
+        if self._texture is None:
+            self._texture = Texture.create(size=self._frames.size, colorfmt='rgb')
+            self._texture.flip_vertical()
+            self._show_frame(self._position)
+            self.dispatch('on_load')
+
+        self._start_time = Clock.time() - self._position
+        self._frame_event = Clock.schedule_interval(self._update_frame, 0)
+        super().play()
+        self.dispatch('on_play')
+
+    def pause(self):
+        self._position = self._get_position()
+        self._stop_updates()
+        super().pause()
+
+    def stop(self):
+        self._position = 0.0
+        self._stop_updates()
+        super().stop()
+        self.dispatch('on_stop')
+
+    def unload(self):
+        self._stop_updates()
+        self._texture = None
+        self._frame_index = None
+        super().unload()
+
+    def _stop_updates(self):
+        self._start_time = None
+        if self._frame_event:
+            self._frame_event.cancel()
+            self._frame_event = None
+
+    def _update_frame(self, dt):
+        del dt
+        position = Clock.time() - self._start_time
+        duration = self._frames.duration
+        if position < duration:
+            self._show_frame(position)
+            return
+
+        if self.eos == 'loop':
+            # keep the timing of the frames across the loop
+            position %= duration if duration > 0 else 1.0
+            self._start_time = Clock.time() - position
+            self._show_frame(position)
+            self.dispatch('on_eos')
+        else:
+            self._position = duration
+            self._do_eos()
+
+    def _show_frame(self, position):
+        index = self._frames.get_index(position)
+        if index == self._frame_index or self._texture is None:
+            return
+
+        self._frame_index = index
+        self._texture.blit_buffer(self._frames.frames[index], colorfmt='rgb', bufferfmt='ubyte')
+        self.dispatch('on_frame')
+
+
 class VideoAsset(McAsset):
 
     attribute = 'videos'
@@ -48,8 +280,15 @@ class VideoAsset(McAsset):
     pool_config_section = 'video_pools'
     asset_group_class = VideoPool
 
+    @classmethod
+    def initialize(cls, machine):
+        """Register the asset class and add the video settings of the mc to the config spec."""
+        machine.config_validator.config_spec['assets']['videos'].update(VIDEO_CONFIG_SPEC)
+        super().initialize(machine)
+
     def __init__(self, mc, name, file, config):
         self._video = None
+        self._frames = None
         super().__init__(mc, name, file, config)
 
         # Setup events to post when video state changes
@@ -66,16 +305,27 @@ class VideoAsset(McAsset):
     def video(self):
         return self._video
 
+    @property
+    def frames(self):
+        """The decoded frames of the video (when cache_frames is enabled)."""
+        return self._frames
+
     def do_load(self):
         # For videos, we need them to load in the main thread, so we do not
-        # load them here and load them via is_loaded() below.
-        pass
+        # load them here and load them via is_loaded() below. Only the frames
+        # of videos with cache_frames: true are decoded here.
+        if self.config['cache_frames'] and not self._frames:
+            self._frames = decode_video_frames(
+                self.file,
+                max_memory=int(self.config['cache_frames_max_memory'] * 1048576),
+                scale=self.config['cache_frames_scale'])
 
     def _do_unload(self):
         if self._video:
             self._video.stop()
             self._video.unload()
             self._video = None
+        self._frames = None
 
     def set_end_behavior(self, eos='stop'):
         assert eos in ('loop', 'pause', 'stop')
@@ -85,7 +335,10 @@ class VideoAsset(McAsset):
         self.loading = False
         self.loaded = True
         self.unloading = False
-        self._video = VideoWrapper(filename=self.file)
+        if self._frames:
+            self._video = CachedVideo(self._frames, filename=self.file)
+        else:
+            self._video = VideoWrapper(filename=self.file)
         self._video.bind(on_load=self._check_duration,
                          on_play=self.on_play,
                          on_stop=self.on_stop)
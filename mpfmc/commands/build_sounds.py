@@ -0,0 +1,134 @@
+"""Converts the sound files of a machine to the audio output format (sound cache)."""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+
+class Command(object):
+
+    """Command which builds the sound cache of a machine."""
+
+    def __init__(self, mpf_path, machine_path, args):
+        """Build the sound cache."""
+        # undo all of Kivy's built-in logging and argument parsing
+        os.environ['KIVY_NO_FILELOG'] = '1'
+        os.environ['KIVY_NO_CONSOLELOG'] = '1'
+        os.environ['KIVY_NO_ARGS'] = '1'
+
+        from mpf.core.config_processor import ConfigProcessor as MpfConfigProcessor
+        from mpf.core.utility_functions import Util
+        import mpfmc
+
+        del mpf_path
+
+        parser = argparse.ArgumentParser(
+            description='Converts all the sound files of the machine to the audio output format of the '
+                        'sound system (sound cache) so they can be loaded without any conversion')
+
+        parser.add_argument("-c",
+                            action="store", dest="configfile",
+                            default="config", metavar='config_file(s)',
+                            help="The name of a config file to load. Default is "
+                                 "config.yaml. Multiple files can be used via a comma-"
+                                 "separated list (no spaces between)")
+
+        parser.add_argument("-C",
+                            action="store", dest="mcconfigfile",
+                            default="mcconfig.yaml",
+                            metavar='config_file',
+                            help="The MPF framework default config file. Default is "
+                                 "<mpf-mc install folder>/mcconfig.yaml")
+
+        parser.add_argument("-f",
+                            action="store_true", dest="force", default=False,
+                            help="Convert all the sound files (even the ones that are "
+                                 "already up to date in the sound cache)")
+
+        parser.add_argument("-v",
+                            action="store_const", dest="loglevel", const=logging.DEBUG,
+                            default=logging.WARNING, help="Enables verbose logging to the console")
+
+        args = parser.parse_args(args)
+        logging.basicConfig(level=args.loglevel, format='%(name)s: %(message)s')
+
+        files = [os.path.join(mpfmc.__path__[0], args.mcconfigfile)]
+        for config_file in Util.string_to_list(args.configfile):
+            files.append(os.path.join(machine_path, "config", config_file))
+        config = MpfConfigProcessor().load_config_files_with_cache(files, "machine", True)
+
+        sys.exit(0 if self.build(machine_path, config, args.force) else 1)
+
+    @staticmethod
+    def get_sound_files(machine_path, config, extensions):
+        """Return the list of sound files in the sounds folders of the machine and its modes."""
+        sounds_folder = config['mpf-mc']['paths']['sounds']
+        folders = [os.path.join(machine_path, sounds_folder)]
+
+        modes_folder = os.path.join(machine_path, config['mpf-mc']['paths']['modes'])
+        if os.path.isdir(modes_folder):
+            for mode in sorted(os.listdir(modes_folder)):
+                folders.append(os.path.join(modes_folder, mode, sounds_folder))
+
+        sound_files = list()
+        for folder in folders:
+            for path, _, file_names in os.walk(folder):
+                for file_name in sorted(file_names):
+                    if os.path.splitext(file_name)[1][1:].lower() in extensions:
+                        sound_files.append(os.path.join(path, file_name))
+
+        return sound_files
+
+    def build(self, machine_path, config, force=False):
+        """Convert the sound files and print a report (returns false if any file failed)."""
+        from mpfmc.core.audio import AudioInterface, SoundSystem
+        from mpfmc.core.audio.sound_cache import SoundCache
+
+        sound_system_config = config.get('sound_system') or dict()
+        rate, channels = SoundSystem.get_output_format(sound_system_config)
+
+        # The offline backend converts sounds to the output format without an audio device (on the
+        # dummy audio driver)
+        audio_interface = AudioInterface(rate=rate, channels=channels, backend='offline')
+        sound_cache = SoundCache(machine_path, rate, channels)
+
+        print("Building sound cache in {} ({} Hz, {} channel(s))".format(sound_cache.folder, rate, channels))
+
+        start_time = time.perf_counter()
+        counts = {'built': 0, 'up to date': 0, 'failed': 0}
+        total_size = 0
+        total_cached_size = 0
+
+        for file_name in self.get_sound_files(machine_path, config, audio_interface.supported_extensions()):
+            result = sound_cache.build_file(audio_interface, file_name, force)
+            counts[result['status']] += 1
+            total_size += result['size']
+            total_cached_size += result['cached_size']
+
+            if result['status'] == 'failed':
+                print("  failed      {}: {}".format(os.path.relpath(file_name, machine_path), result['error']))
+            elif result['status'] == 'built':
+                print("  built       {} ({:.1f} KB -> {:.1f} KB, {:.2f} s)".format(
+                    os.path.relpath(file_name, machine_path), result['size'] / 1024,
+                    result['cached_size'] / 1024, result['time']))
+            else:
+                print("  up to date  {}".format(os.path.relpath(file_name, machine_path)))
+
+        audio_interface.shutdown()
+
+        print("{} built, {} up to date, {} failed. Sound files: {:.1f} MB, sound cache: {:.1f} MB, "
+              "time: {:.2f} s".format(counts['built'], counts['up to date'], counts['failed'],
+                                      total_size / 1048576, total_cached_size / 1048576,
+                                      time.perf_counter() - start_time))
+
+        if not sound_system_config.get('sound_cache'):
+            print("The sound cache is not enabled, use 'sound_cache: true' in the sound_system "
+                  "section of the machine config to load sounds from it")
+
+        return counts['failed'] == 0
+
+
+def get_command():
+    return 'build_sounds', Command
@@ -1,5 +1,6 @@
 from typing import Union, List
 from mpfmc.core.config_collection import ConfigCollection
+from mpfmc.uix.animation import compile_animation_step
 
 MYPY = False
 if MYPY:   # pragma: no cover
@@ -46,6 +47,10 @@ class AnimationCollection(ConfigCollection):
                                  'in its "property" list ({}).'.
                                  format(config['value'], config['property']))
 
+            # compile the settings once so firing the animation only has to bind them to
+            # the widget (and invalid settings are found when the config is loaded)
+            config['_step'] = compile_animation_step(config)
+
         return config
 
 
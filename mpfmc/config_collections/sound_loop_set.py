@@ -81,20 +81,46 @@ class SoundLoopSetCollection(ConfigCollection):
                 if config["sound"] not in self.mc.sounds:
                     raise ValueError("The '{}' sound_loop_set references an invalid sound asset "
                                      "name '{}' in its sound setting".format(name, config["sound"]))
-                if self.mc.sounds[config["sound"]].streaming:
-                    raise ValueError("The '{}' sound_loop_set references a streaming sound asset "
-                                     "'{}' in its sound setting (only in-memory sounds are "
-                                     "supported in loop sets)".format(name, config["sound"]))
 
                 # Validate sound settings in layers (make sure only valid sound assets are referenced)
+                streaming_sounds = [config["sound"]] if self.mc.sounds[config["sound"]].streaming else []
                 for layer in config["layers"]:
                     if layer["sound"] not in self.mc.sounds:
                         raise ValueError("The '{}' sound_loop_set references an invalid sound asset "
                                          "name '{}' in one of its layers".format(name, layer["sound"]))
                     if self.mc.sounds[layer["sound"]].streaming:
-                        raise ValueError("The '{}' sound_loop_set references a streaming sound asset "
-                                         "'{}' in one of its layers (only in-memory sounds are "
-                                         "supported in loop sets)".format(name, layer["sound"]))
-
+                        # A streaming sound is decoded sequentially and can only be played by a
+                        # single layer at a time
+                        if layer["sound"] in streaming_sounds:
+                            raise ValueError("The '{}' sound_loop_set references the streaming sound asset "
+                                             "'{}' more than once (a streaming sound can only be used "
+                                             "by one layer of a loop set)".format(name, layer["sound"]))
+                        streaming_sounds.append(layer["sound"])
+
+    def get_memory_usage(self, name: str) -> dict:
+        """Return the memory used by the sounds of a sound loop set.
+
+        Args:
+            name: The name of the sound loop set.
+
+        Returns:
+            A dictionary with the number of bytes of sample data each sound of the
+            loop set currently holds in memory ('sounds'), the names of the streaming
+            sounds ('streaming', decoded while playing) and the total number of bytes
+            ('total').  Sounds that have not been loaded do not use any memory.
+        """
+        config = self[name]
+        sounds = dict()
+        streaming = list()
+        for sound_name in [config["sound"]] + [layer["sound"] for layer in config["layers"]]:
+            if sound_name in sounds:
+                continue
+
+            sound = self.mc.sounds[sound_name]
+            if sound.streaming:
+                streaming.append(sound_name)
+            sounds[sound_name] = sound.container.memory_size if sound.loaded and sound.container else 0
+
+        return {"sounds": sounds, "streaming": streaming, "total": sum(sounds.values())}
 
 collection_cls = SoundLoopSetCollection
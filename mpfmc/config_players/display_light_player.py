@@ -1,14 +1,13 @@
 from functools import partial
 
-from kivy.graphics.instructions import Callback
 from kivy.uix.relativelayout import RelativeLayout
 
-from kivy.clock import Clock
 from kivy.graphics.fbo import Fbo
 from kivy.graphics.opengl import glReadPixels, GL_RGBA, GL_UNSIGNED_BYTE
 from kivy.graphics.texture import Texture
 
 from mpfmc.core.bcp_config_player import BcpConfigPlayer
+from mpfmc.uix.display import DisplayOutput
 
 
 class McDisplayLightPlayer(BcpConfigPlayer):
@@ -30,7 +29,7 @@ class McDisplayLightPlayer(BcpConfigPlayer):
         if settings['action'] == "play":
             if not self._scheduled:
                 self._scheduled = True
-                Clock.schedule_interval(self._tick, 0)
+                self.machine.frame_pipeline.add_callback('readback', self._render_all)
             if element not in context_dict:
                 context_dict[element] = self._setup_fbo(element, settings, context)
             else:
@@ -58,10 +57,16 @@ class McDisplayLightPlayer(BcpConfigPlayer):
         effect_widget.size = source.size
 
         fbo.add(effect_widget.canvas)
-        with source.canvas:
-            callback = Callback(partial(self._trigger_render, context, element))
 
-        return [fbo, effect_widget, source, settings, True, True, True, callback]
+        # show the cached texture of the display (rendered by the render scheduler)
+        display_output = DisplayOutput(effect_widget, source)
+        effect_widget.add_widget(display_output)
+        display_output.add_display_source(source)
+
+        callback = partial(self._trigger_render, context, element)
+        self.machine.render_scheduler.add_listener(source, callback)
+
+        return [fbo, display_output, source, settings, True, True, True, callback]
 
     def _trigger_render(self, context, element, *args):
         del args
@@ -70,45 +75,29 @@ class McDisplayLightPlayer(BcpConfigPlayer):
             return
         context_dict[element][6] = True
 
-    def _tick(self, dt) -> None:
-        del dt
-        # run this at the end of the tick to make sure all kivy bind callbacks have executed
-        Clock.schedule_once(self._render_all, -1)
-
     def _render_all(self, dt):
         del dt
         for context, instances in self.instances.items():
             for element, instance in instances.items():
-                if not element[5] or not element[6]:
+                if not instance[5] or not instance[6]:
                     continue
                 self._render(instance, element, context)
 
     # pylint: disable-msg=too-many-locals
     def _render(self, instance, element, context):
-        fbo, effect_widget, source, settings, first, _, _, _ = instance
+        fbo, _, source, settings, first, _, _, _ = instance
         instance[4] = False
         instance[6] = False
 
-        # detach the widget from the parent
-        parent = source.parent
-        if parent:
-            parent.remove_display_source(source)
-
-        effect_widget.add_widget(source.container)
-
-        fbo.draw()
-
-        fbo.bind()
-        data = glReadPixels(0, 0, source.native_size[0], source.native_size[1],
-                            GL_RGBA, GL_UNSIGNED_BYTE)
-
-        fbo.release()
+        with self.machine.profiler.measure('readback'):
+            fbo.ask_update()
+            fbo.draw()
 
-        effect_widget.remove_widget(source.container)
+            fbo.bind()
+            data = glReadPixels(0, 0, source.native_size[0], source.native_size[1],
+                                GL_RGBA, GL_UNSIGNED_BYTE)
 
-        # reattach to the parent
-        if parent:
-            parent.add_display_source(source)
+            fbo.release()
 
         if not first:
             # for some reasons we got garbage in the first buffer. we just skip it for now
@@ -141,7 +130,8 @@ class McDisplayLightPlayer(BcpConfigPlayer):
     def clear_context(self, context):
         context_dict = self._get_instance_dict(context)
         for _, instance in context_dict.items():
-            instance[2].canvas.remove(instance[7])
+            self.machine.render_scheduler.remove_listener(instance[2], instance[7])
+            instance[1].remove_display_source(instance[2])
         self._reset_instance_dict(context)
 
 
@@ -148,10 +148,15 @@ class MpfSlidePlayer(PluginPlayer):
             self.machine.config_validator.validate_config('widgets:animations',
                                                           config)
 
-            if len(config['property']) != len(config['value']):
-                raise ValueError('Animation "property" list ({}) is not the '
-                                 'same length as the "end" list ({}).'.
-                                 format(config['property'], config['end']))
+            if len(config['property']) > len(config['value']):
+                raise ValueError('Animation must have at least the same number of settings '
+                                 'in its "value" list ({}) as the number settings '
+                                 'in its "property" list ({}).'.
+                                 format(config['value'], config['property']))
+
+            # The step is not compiled here like in the animations collection of the mc:
+            # the settings are sent to the mc as JSON (and MPF does not load Kivy). The
+            # mc compiles the steps when it creates the widget.
 
         return config
 
@@ -94,8 +94,9 @@ Here are several various examples:
 
             elif player_settings['action'].lower() == 'play_layer':
                 player_settings.setdefault('volume', None)
+                player_settings.setdefault('start_sample', None)
                 track.play_layer(player_settings['layer'], player_settings['fade_in'], player_settings['timing'],
-                                 volume=player_settings['volume'])
+                                 volume=player_settings['volume'], start_sample=player_settings['start_sample'])
 
             elif player_settings['action'].lower() == 'stop_layer':
                 track.stop_layer(player_settings['layer'], player_settings['fade_out'])
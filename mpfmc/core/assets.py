@@ -49,7 +49,8 @@ class ThreadedAssetManager(BaseAssetManager):
         self.loader_queue.put(asset)
 
         if not self._loaded_watcher:
-            self._loaded_watcher = self.machine.clock.schedule_interval(self._check_loader_status, 0)
+            self._loaded_watcher = True
+            self.machine.frame_pipeline.add_callback('assets', self._check_loader_status)
 
     def _check_loader_status(self, *args):
         del args
@@ -67,8 +68,8 @@ class ThreadedAssetManager(BaseAssetManager):
         if self.num_assets_to_load == self.num_assets_loaded:
             self.num_assets_loaded = 0
             self.num_assets_to_load = 0
-            self.machine.clock.unschedule(self._loaded_watcher)
-            self._loaded_watcher = None
+            self.machine.frame_pipeline.remove_callback('assets', self._check_loader_status)
+            self._loaded_watcher = False
 
 
 class AssetLoader(threading.Thread):
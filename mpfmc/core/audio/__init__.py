@@ -1,11 +1,17 @@
 """Audio module provides all the audio features (playing of sounds) for the media controller."""
 import logging
+import os
+import sys
+import threading
+import time
+import traceback
 
 from kivy.clock import Clock
 from mpf.core.case_insensitive_dict import CaseInsensitiveDict
 from mpf.core.utility_functions import Util
-from mpfmc.core.audio.audio_interface import AudioInterface
+from mpfmc.core.audio.audio_interface import AudioInterface, AUDIO_BACKENDS
 from mpfmc.core.audio.audio_exception import AudioException
+from mpfmc.core.audio.sound_cache import SoundCache
 
 __all__ = ('SoundSystem',
            'AudioInterface',
@@ -21,6 +27,20 @@ DEFAULT_AUDIO_CHANNELS = 1
 DEFAULT_MASTER_VOLUME = 0.5
 DEFAULT_TRACK_MAX_SIMULTANEOUS_SOUNDS = 1
 DEFAULT_TRACK_VOLUME = 0.5
+DEFAULT_MIX_BUS = 'int'
+DEFAULT_AUDIO_BACKEND = 'sdl'
+DEFAULT_SOUND_CACHE_ENABLED = False
+DEFAULT_PLAYLIST_DECODE_AHEAD_TIME = 0.0
+
+# The maximum time (in ms) the notification listener waits before checking whether it should stop
+NOTIFICATION_WAIT_TIMEOUT_MS = 100
+
+# Default settings for each type of DSP insert
+DEFAULT_INSERT_SETTINGS = {
+    'eq': {'filter': 'peak', 'frequency': 1000.0, 'q': 0.707, 'gain': '0db'},
+    'limiter': {'threshold': '-1db', 'release': '50ms'},
+    'reverb': {'room_size': 0.5, 'damping': 0.5, 'wet': 0.25, 'dry': 1.0},
+}
 
 
 # pylint: disable=too-many-instance-attributes
@@ -31,6 +51,10 @@ class SoundSystem(object):
     The SoundSystem class is used to read the sound system settings from the
     config file and then initialize the audio interface and create the
     specified tracks.
+
+    Sounds are loaded from the sound cache (sound files already converted to
+    the audio output format, see the build_sounds command) when the
+    ``sound_system: sound_cache: true`` setting is used.
     """
 
     # pylint: disable=invalid-name, too-many-branches
@@ -43,7 +67,11 @@ class SoundSystem(object):
         self.config = dict()
         self.sound_events = dict()
         self.tracks = CaseInsensitiveDict()
-        self.clock_event = None
+        self._queue_tracks = list()     # tracks with a sound queue (standard and playlist tracks)
+        self._notifications_pending = False
+        self.notification_time = None
+        """Time (perf_counter) the pending audio notifications were posted by the audio thread."""
+        self._notification_thread = None
 
         self.log.debug("Loading the Sound System")
 
@@ -83,18 +111,47 @@ class SoundSystem(object):
         if 'master_volume' not in self.config:
             self.config['master_volume'] = DEFAULT_MASTER_VOLUME
 
+        if 'mix_bus' not in self.config:
+            self.config['mix_bus'] = DEFAULT_MIX_BUS
+        elif self.config['mix_bus'] not in ['int', 'float']:
+            self.log.warning("SoundSystem: The mix_bus setting must be either 'int' "
+                             "or 'float'. Default mix bus will be used.")
+            self.config['mix_bus'] = DEFAULT_MIX_BUS
+
+        if 'backend' not in self.config:
+            self.config['backend'] = DEFAULT_AUDIO_BACKEND
+        elif self.config['backend'] not in AUDIO_BACKENDS:
+            self.log.warning("SoundSystem: The backend setting must be one of %s. "
+                             "Default backend will be used.", ', '.join(AUDIO_BACKENDS))
+            self.config['backend'] = DEFAULT_AUDIO_BACKEND
+
+        if 'sound_cache' not in self.config:
+            self.config['sound_cache'] = DEFAULT_SOUND_CACHE_ENABLED
+
+        # DSP inserts can only be used on the floating-point mix bus
+        if self.config['mix_bus'] == 'int' and self._inserts_configured():
+            self.log.debug("SoundSystem: DSP inserts are configured, using the "
+                           "floating-point mix bus")
+            self.config['mix_bus'] = 'float'
+
         # Initialize audio interface library (get audio output)
         try:
             self.audio_interface = AudioInterface(
                 rate=self.config['frequency'],
                 channels=self.config['channels'],
-                buffer_samples=self.config['buffer'])
+                buffer_samples=self.config['buffer'],
+                float_mix_bus=self.config['mix_bus'] == 'float',
+                backend=self.config['backend'])
         except AudioException:
             self.log.error("Could not initialize the audio interface. "
                            "Audio features will not be available.")
             self.audio_interface = None
             return
 
+        # Load sounds already converted to the output format (see the build_sounds command)
+        if self.config['sound_cache']:
+            self.audio_interface.sound_cache = self._get_sound_cache()
+
         # Setup tracks in audio system (including initial volume levels)
         if 'tracks' in self.config:
             for track_name, track_config in self.config['tracks'].items():
@@ -104,16 +161,32 @@ class SoundSystem(object):
             self.log.info("No audio tracks are specified in your machine config file. "
                           "a track named 'default' has been created.")
 
+        # Setup master output DSP inserts
+        if self.config.get('inserts'):
+            self.audio_interface.set_master_inserts(self._parse_inserts('master', self.config['inserts']))
+
         # Set initial master volume level
         self.master_volume = self.config['master_volume']
 
-        # Establish machine tick function callback (will process internal audio events)
-        self.clock_event = Clock.schedule_interval(self.tick, 0)
+        # Audio notifications (sound started, stopped, markers, etc.) are processed right away
+        # on the event loop: the notification listener thread is woken up by the audio thread
+        # and fires a clock trigger, which runs on the next iteration of the Kivy event loop
+        # (independent of the frame pipeline rate). The Kivy clock cannot be interrupted while
+        # it sleeps between two iterations, so the delay is at most one clock iteration.
+        self._notification_trigger = Clock.create_trigger(self._process_notifications, -1)
+
+        # Sounds waiting in the track queues are checked by the audio stage of each frame
+        self.mc.frame_pipeline.add_callback('audio', self.tick)
 
         # Start audio engine processing
         self.audio_interface.enable()
         self._initialized = True
 
+        self._notification_thread = threading.Thread(target=self._notification_listener,
+                                                     name='audio_notification_listener')
+        self._notification_thread.daemon = True
+        self._notification_thread.start()
+
         self.mc.events.add_handler("master_volume_increase", self.master_volume_increase)
         self.mc.events.add_handler("master_volume_decrease", self.master_volume_decrease)
         self.mc.events.add_handler("shutdown", self.shutdown)
@@ -123,6 +196,36 @@ class SoundSystem(object):
         del kwargs
         self.mc.set_machine_var("master_volume", self.audio_interface.get_master_volume())
 
+    @staticmethod
+    def get_output_format(config):
+        """Return the sample rate and number of channels set in a sound_system config.
+
+        The configured output format is the key of the sound cache, used both by the
+        sound system and the build_sounds command.
+        """
+        rate = config.get('frequency', DEFAULT_SAMPLE_RATE)
+        if rate == 'auto':
+            rate = DEFAULT_SAMPLE_RATE
+        return rate, config.get('channels', DEFAULT_AUDIO_CHANNELS)
+
+    def _get_sound_cache(self):
+        """Return the sound cache of the machine (None when it cannot be used)."""
+        rate, channels = self.get_output_format(self.config)
+        sound_cache = SoundCache(self.mc.machine_path, rate, channels)
+
+        if (rate, channels) != (self.audio_interface.sample_rate, self.audio_interface.channels):
+            self.log.warning("SoundSystem: The audio output format (%s Hz, %s channel(s)) is not the "
+                             "configured format, the sound cache will not be used.",
+                             self.audio_interface.sample_rate, self.audio_interface.channels)
+            return None
+
+        if not os.path.isdir(sound_cache.folder):
+            self.log.warning("SoundSystem: The sound cache is enabled but %s does not exist (use the "
+                             "build_sounds command to build it).", sound_cache.folder)
+            return None
+
+        return sound_cache
+
     def shutdown(self, **kwargs):
         """Shuts down the audio interface"""
         del kwargs
@@ -173,6 +276,157 @@ class SoundSystem(object):
         self.master_volume -= delta
         self.log.info("Decreased master volume by %s to %s.", delta, self.master_volume)
 
+    def get_performance_counters(self, reset=False):
+        """Return the audio engine performance counters.
+
+        Args:
+            reset: Whether to reset the counters once they have been read.
+
+        Returns:
+            A dictionary containing the audio callback timing (durations, deadline and
+            histogram), active sound player counts, audio lock wait times and the counters
+            of each track (see AudioInterface.get_performance_counters), or None if the
+            sound system is not enabled.
+        """
+        if not self.enabled:
+            return None
+
+        return self.audio_interface.get_performance_counters(reset)
+
+    def render(self, seconds=0.0, buffer_count=0):
+        """Generate audio using the offline backend (see AudioInterface.render).
+
+        Audio is generated as fast as possible (not in real time) and the audio
+        notifications posted while generating it are processed right away.
+
+        Args:
+            seconds: The duration of the audio to generate.
+            buffer_count: The number of audio buffers to generate.
+
+        Returns:
+            A bytes object containing the generated audio samples.
+        """
+        samples = self.audio_interface.render(seconds, buffer_count)
+        self._process_notifications(0)
+        return samples
+
+    def get_performance_summary(self):
+        """Return a summary of the audio engine performance counters (included in the BCP
+        status report) or None if the sound system is not enabled.
+
+        All times are in microseconds.
+        """
+        counters = self.get_performance_counters()
+        if not counters:
+            return None
+
+        return {
+            'audio_deadline': counters['deadline'],
+            'audio_callback_mean': round(counters['callback_time']['recent_mean'], 1),
+            'audio_callback_p95': counters['callback_time']['recent_p95'],
+            'audio_callback_max': counters['callback_time']['max'],
+            'audio_deadline_overruns': counters['deadline_overruns'],
+            'audio_active_sound_players': counters['active_sound_players']['last'],
+            'audio_lock_wait_max': counters['lock_wait_time']['max'],
+            'audio_streaming_underruns': sum(track['streaming_underruns']
+                                             for track in counters['tracks'].values()),
+        }
+
+    def _inserts_configured(self):
+        """Return true if any DSP inserts are configured (on the master output or any track)."""
+        if self.config.get('inserts'):
+            return True
+
+        for track_config in (self.config.get('tracks') or {}).values():
+            if track_config and track_config.get('inserts'):
+                return True
+
+        return False
+
+    @staticmethod
+    def _parse_inserts(name, inserts):
+        """Validate DSP insert settings and convert them to the values used by the audio interface.
+
+        Args:
+            name: The name of the track (or 'master') the inserts are applied to.
+            inserts: A list of insert settings dictionaries (in processing order).
+
+        Returns:
+            A list of insert settings dictionaries with all default values filled in.
+        """
+        parsed_inserts = list()
+
+        for insert in inserts:
+            if not isinstance(insert, dict) or insert.get('type') not in DEFAULT_INSERT_SETTINGS:
+                raise AudioException("Could not create '{}' inserts - each insert requires a 'type' "
+                                     "setting (eq, limiter, or reverb)".format(name))
+
+            settings = dict(DEFAULT_INSERT_SETTINGS[insert['type']])
+            settings.update(insert)
+
+            if settings['type'] == 'eq':
+                if settings['filter'] not in ['lowpass', 'highpass', 'peak', 'lowshelf', 'highshelf']:
+                    raise AudioException("Could not create '{}' inserts - an illegal value for the eq "
+                                         "'filter' setting was found".format(name))
+                settings['frequency'] = SoundSystem._parse_insert_number(name, settings, 'frequency')
+                settings['q'] = SoundSystem._parse_insert_number(name, settings, 'q')
+                settings['gain'] = SoundSystem._parse_insert_number(name, settings, 'gain', decibels=True)
+
+            elif settings['type'] == 'limiter':
+                settings['threshold'] = SoundSystem._parse_insert_gain(name, settings, 'threshold')
+                settings['release'] = Util.string_to_secs(settings['release'])
+
+            elif settings['type'] == 'reverb':
+                settings['room_size'] = min(max(SoundSystem._parse_insert_number(name, settings, 'room_size'),
+                                                0.0), 1.0)
+                settings['damping'] = min(max(SoundSystem._parse_insert_number(name, settings, 'damping'),
+                                              0.0), 1.0)
+                settings['wet'] = SoundSystem._parse_insert_gain(name, settings, 'wet')
+                settings['dry'] = SoundSystem._parse_insert_gain(name, settings, 'dry')
+
+            parsed_inserts.append(settings)
+
+        return parsed_inserts
+
+    @staticmethod
+    def _parse_insert_number(name, settings, setting, decibels=False):
+        """Return the value of an insert setting as a float.
+
+        Args:
+            name: The name of the track (or 'master') the insert is applied to.
+            settings: The insert settings dictionary.
+            setting: The name of the setting.
+            decibels: Whether the value is in decibels (and may end with 'db').
+
+        Raises an AudioException when the value is not a number.
+        """
+        value = str(settings[setting]).strip()
+        if decibels and value.lower().endswith('db'):
+            value = value[:-2]
+
+        try:
+            return float(value)
+        except ValueError:
+            raise AudioException("Could not create '{}' inserts - an illegal value for the {} '{}' "
+                                 "setting was found ({})".format(name, settings['type'], setting,
+                                                                 settings[setting]))
+
+    @staticmethod
+    def _parse_insert_gain(name, settings, setting):
+        """Return the value of an insert setting as a gain (0.0 to 1.0).
+
+        The value is either a gain or a value in decibels ending with 'db'
+        (like the volume settings). Raises an AudioException when the value is
+        not a number.
+        """
+        if str(settings[setting]).strip().lower().endswith('db'):
+            gain = AudioInterface.db_to_gain(SoundSystem._parse_insert_number(name, settings, setting,
+                                                                              decibels=True))
+        else:
+            gain = SoundSystem._parse_insert_number(name, settings, setting)
+
+        return min(max(gain, 0.0), 1.0)
+
     def _create_track(self, name, config=None):     # noqa
         """Create a track in the audio system with the specified name and configuration.
 
@@ -217,11 +471,16 @@ class SoundSystem(object):
         elif config['type'] == 'playlist':
             config.setdefault('crossfade_time', 0.0)
             config['crossfade_time'] = Util.string_to_secs(config['crossfade_time'])
+            config.setdefault('decode_ahead_time', DEFAULT_PLAYLIST_DECODE_AHEAD_TIME)
+            config['decode_ahead_time'] = Util.string_to_secs(config['decode_ahead_time'])
+            config.setdefault('gapless', False)
 
             track = self.audio_interface.create_playlist_track(self.mc,
                                                                name,
                                                                config['crossfade_time'],
-                                                               config['volume'])
+                                                               config['volume'],
+                                                               config['decode_ahead_time'],
+                                                               config['gapless'])
 
         elif config['type'] == 'sound_loop':
             if 'max_layers' not in config:
@@ -236,6 +495,11 @@ class SoundSystem(object):
             raise AudioException("Could not create '{}' track due to an error".format(name))
 
         self.tracks[name] = track
+        if config['type'] != 'sound_loop':
+            self._queue_tracks.append(track)
+
+        if config.get('inserts'):
+            track.set_inserts(self._parse_inserts(name, config['inserts']))
 
         if 'events_when_stopped' in config and config['events_when_stopped'] is not None:
             track.events_when_stopped = Util.string_to_list(config['events_when_stopped'])
@@ -249,7 +513,39 @@ class SoundSystem(object):
         if 'events_when_resumed' in config and config['events_when_resumed'] is not None:
             track.events_when_resumed = Util.string_to_list(config['events_when_resumed'])
 
-    def tick(self, dt):
-        """Clock callback function"""
+    def _notification_listener(self):
+        """Run loop for the notification listener thread (waits for audio notifications)."""
+        try:  # wrap the so we can send exceptions to the main thread
+            while self._initialized and not self.mc.thread_stopper.is_set():
+                if self.audio_interface.wait_for_notifications(NOTIFICATION_WAIT_TIMEOUT_MS):
+                    if not self._notifications_pending:
+                        self.notification_time = time.perf_counter()
+                        self._notifications_pending = True
+                        self._notification_trigger()
+
+        # pylint: disable-msg=broad-except
+        except Exception:  # pragma: no cover
+            exc_type, exc_value, exc_traceback = sys.exc_info()
+            lines = traceback.format_exception(exc_type, exc_value, exc_traceback)
+            msg = ''.join(line for line in lines)
+            self.mc.crash_queue.put(msg)
+
+    def _process_notifications(self, dt):
+        """Clock trigger callback (processes the audio notifications posted by the audio thread)"""
         del dt
+        if not self.enabled:
+            return
+
+        self._notifications_pending = False
         self.audio_interface.process()
+
+    def tick(self, dt):
+        """Frame pipeline callback (processes the sounds waiting in the track queues)"""
+        del dt
+        if not self.enabled:
+            return
+
+        # Queued sounds may be waiting for their sound to be loaded (or to expire) rather than
+        # for a player to finish, which is not notified by the audio thread
+        if any(track.get_sound_queue_count() for track in self._queue_tracks):
+            self.audio_interface.process()
@@ -12,11 +12,17 @@ from libc.string cimport memset, memcpy
 from cpython.mem cimport PyMem_Malloc, PyMem_Realloc, PyMem_Free
 cimport cpython.pycapsule as pycapsule
 
-from math import pow
+from math import ceil, pow
 import logging
+import os
+import time
+import wave
 
 from mpfmc.core.audio.sdl2 cimport *
 from mpfmc.core.audio.gstreamer cimport *
+from mpfmc.core.audio.mixer cimport *
+from mpfmc.core.audio.dsp cimport *
+from mpfmc.core.audio.perf_counters cimport *
 from mpfmc.core.audio.track cimport *
 from mpfmc.core.audio.track_standard cimport *
 from mpfmc.core.audio.track_sound_loop cimport *
@@ -37,6 +43,11 @@ DEF MAX_MARKERS = 16
 # clicks
 DEF QUICK_FADE_DURATION_SECS = 0.05
 
+# The supported audio backends: 'sdl' plays audio on the audio device (the audio callback
+# is called by SDL), 'offline' does not use an audio device (SDL_Mixer is opened on the dummy
+# audio driver and the audio callback is called by AudioInterface.render, as fast as possible)
+AUDIO_BACKENDS = ('sdl', 'offline')
+
 
 # ---------------------------------------------------------------------------
 #    Global GStreamer helper functions
@@ -59,6 +70,138 @@ def get_gst_version():
     gst_version(&major, &minor, &micro, &nano)
     return major, minor, micro, nano
 
+def benchmark_mixer(int voice_count, int buffer_samples=2048, int channels=2, int iterations=500):
+    """
+    Benchmarks the mixing of a number of voices into a single buffer using the mixing kernel
+    and using the previous per-control-point SDL_MixAudioFormat calls.  No audio device is
+    required.
+    Args:
+        voice_count: The number of voices (playing sounds) to mix
+        buffer_samples: The audio buffer size (in samples per channel)
+        channels: The number of audio channels
+        iterations: The number of buffers to mix for each method
+
+    Returns:
+        A dictionary containing the average time (in microseconds) needed to mix one buffer
+        using the mixing kernel ('kernel') and using SDL_MixAudioFormat ('sdl').
+    """
+    cdef Uint32 sample_count = buffer_samples * channels
+    cdef Uint32 chunk_samples = sample_count // CONTROL_POINTS_PER_BUFFER
+    cdef Sint16 *sources = <Sint16*>PyMem_Malloc(voice_count * sample_count * sizeof(Sint16))
+    cdef Sint32 *accumulator = <Sint32*>PyMem_Malloc(sample_count * sizeof(Sint32))
+    cdef Sint16 *output = <Sint16*>PyMem_Malloc(sample_count * sizeof(Sint16))
+    cdef Uint32 seed = 12345
+    cdef Uint32 i
+    cdef int iteration, voice, control_point
+    cdef Sint32 gain, target_gain
+
+    if sources == NULL or accumulator == NULL or output == NULL:
+        PyMem_Free(sources)
+        PyMem_Free(accumulator)
+        PyMem_Free(output)
+        raise MemoryError()
+
+    # Fill the voices with pseudo-random noise
+    for i in range(voice_count * sample_count):
+        seed = seed * 1103515245 + 12345
+        sources[i] = <Sint16>((seed >> 16) & 0xFFFF)
+
+    # Mixing kernel (volume ramps on every other control point)
+    start = time.perf_counter()
+    with nogil:
+        for iteration in range(iterations):
+            memset(accumulator, 0, sample_count * sizeof(Sint32))
+            for voice in range(voice_count):
+                gain = volume_to_gain(SDL_MIX_MAXVOLUME // 2)
+                for control_point in range(CONTROL_POINTS_PER_BUFFER):
+                    target_gain = volume_to_gain(SDL_MIX_MAXVOLUME // 2 + (control_point & 1))
+                    mix_s16_to_accumulator(accumulator + control_point * chunk_samples,
+                                           sources + voice * sample_count + control_point * chunk_samples,
+                                           chunk_samples, gain, gain_step(gain, target_gain, chunk_samples))
+                    gain = target_gain
+            saturate_accumulator_to_s16(output, accumulator, sample_count)
+    kernel_time = time.perf_counter() - start
+
+    # SDL_MixAudioFormat (one call per voice per control point)
+    start = time.perf_counter()
+    with nogil:
+        for iteration in range(iterations):
+            memset(output, 0, sample_count * sizeof(Sint16))
+            for voice in range(voice_count):
+                for control_point in range(CONTROL_POINTS_PER_BUFFER):
+                    SDL_MixAudioFormat(<Uint8*>(output + control_point * chunk_samples),
+                                       <Uint8*>(sources + voice * sample_count + control_point * chunk_samples),
+                                       AUDIO_S16SYS, chunk_samples * sizeof(Sint16),
+                                       SDL_MIX_MAXVOLUME // 2 + (control_point & 1))
+    sdl_time = time.perf_counter() - start
+
+    PyMem_Free(sources)
+    PyMem_Free(accumulator)
+    PyMem_Free(output)
+
+    return {'kernel': kernel_time * 1000000.0 / iterations,
+            'sdl': sdl_time * 1000000.0 / iterations}
+
+
+def benchmark_dsp_insert(dict settings, int buffer_samples=2048, int channels=2, int sample_rate=44100,
+                         int iterations=500):
+    """
+    Benchmarks the processing of a single DSP insert on one floating-point audio buffer.  No
+    audio device is required.
+    Args:
+        settings: The insert settings dictionary (None to only measure the float bus conversion)
+        buffer_samples: The audio buffer size (in samples per channel)
+        channels: The number of audio channels
+        sample_rate: The audio sample rate
+        iterations: The number of buffers to process
+
+    Returns:
+        The average time (in microseconds) needed to process one buffer.
+    """
+    cdef Uint32 sample_count = buffer_samples * channels
+    cdef Sint16 *source = <Sint16*>PyMem_Malloc(sample_count * sizeof(Sint16))
+    cdef float *buffer = <float*>PyMem_Malloc(sample_count * sizeof(float))
+    cdef Sint16 *output = <Sint16*>PyMem_Malloc(sample_count * sizeof(Sint16))
+    cdef DspChain *chain = NULL
+    cdef Uint32 seed = 12345
+    cdef Uint32 i
+    cdef int iteration
+
+    if source == NULL or buffer == NULL or output == NULL:
+        PyMem_Free(source)
+        PyMem_Free(buffer)
+        PyMem_Free(output)
+        raise MemoryError()
+
+    # Fill the source with pseudo-random noise
+    for i in range(sample_count):
+        seed = seed * 1103515245 + 12345
+        source[i] = <Sint16>((seed >> 16) & 0xFFFF)
+
+    try:
+        if settings is not None:
+            chain = create_dsp_chain([settings], sample_rate, channels)
+    except Exception:
+        PyMem_Free(source)
+        PyMem_Free(buffer)
+        PyMem_Free(output)
+        raise
+
+    start = time.perf_counter()
+    with nogil:
+        for iteration in range(iterations):
+            s16_to_float(buffer, source, sample_count, 1.0, 0.0)
+            process_dsp_chain(chain, buffer, buffer_samples, channels)
+            saturate_float_to_s16(output, buffer, sample_count)
+    elapsed = time.perf_counter() - start
+
+    free_dsp_chain(chain)
+    PyMem_Free(source)
+    PyMem_Free(buffer)
+    PyMem_Free(output)
+
+    return elapsed * 1000000.0 / iterations
+
 
 # ---------------------------------------------------------------------------
 #    AudioInterface class
@@ -70,23 +213,33 @@ cdef class AudioInterface:
     """
     cdef list tracks
     cdef dict playlist_controllers
+    cdef list _master_inserts
     cdef object mc
     cdef object log
+    cdef str _backend
+    cdef bint _offline_enabled
+    cdef object _sound_cache
 
     cdef AudioCallbackData audio_callback_data
 
     def __cinit__(self, *args, **kw):
         pass
 
-    def __init__(self, rate=44100, channels=2, buffer_samples=4096):
+    def __init__(self, rate=44100, channels=2, buffer_samples=4096, float_mix_bus=False, backend='sdl'):
         """
         Initializes the AudioInterface.
         Args:
             rate: The audio sample rate used in the library
             channels: The number of channels to use (1=mono, 2=stereo)
             buffer_samples: The audio buffer size to use (in number of samples, must be power of two)
+            float_mix_bus: Whether or not to mix tracks on a floating-point bus (required for
+                DSP inserts)
+            backend: The audio backend ('sdl' to play audio on the audio device, 'offline' to
+                render audio on demand without an audio device, see render)
         """
         self.log = logging.getLogger("AudioInterface")
+        self._offline_enabled = False
+        self._sound_cache = None
 
         # Initialize threading in the extension library and acquire the Python global interpreter lock
         PyEval_InitThreads()
@@ -102,15 +255,34 @@ cdef class AudioInterface:
             raise AudioException("Unable to initialize Audio Interface: "
                                  "Buffer samples is required to be a power of two")
 
+        if backend not in AUDIO_BACKENDS:
+            self.log.error('Backend is required to be one of %s', ', '.join(AUDIO_BACKENDS))
+            raise AudioException("Unable to initialize Audio Interface: "
+                                 "Unknown audio backend '{}'".format(backend))
+        self._backend = backend
+
         # Warn if a small buffer is used
-        if buffer_samples <= 1024:
+        if buffer_samples <= 1024 and backend == 'sdl':
             self.log.warning('NOTE: You may experience noise and other undesirable sound artifacts '
                              'when you set your buffer at 1024 or smaller.')
 
-        # Initialize the SDL audio system
-        if SDL_InitSubSystem(SDL_INIT_AUDIO) < 0:
-            self.log.error('SDL_InitSubSystem error - %s' % SDL_GetError())
-            raise AudioException('Unable to initialize SDL (SDL_InitSubSystem call failed: %s)' % SDL_GetError())
+        # Initialize the SDL audio system.  The offline backend uses the dummy audio driver (SDL_Mixer
+        # is still needed to load sounds into memory in the output audio format, but no audio device
+        # is used).
+        if backend == 'offline':
+            audio_driver = os.environ.get('SDL_AUDIODRIVER')
+            os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+        try:
+            if SDL_InitSubSystem(SDL_INIT_AUDIO) < 0:
+                self.log.error('SDL_InitSubSystem error - %s' % SDL_GetError())
+                raise AudioException('Unable to initialize SDL (SDL_InitSubSystem call failed: %s)' % SDL_GetError())
+        finally:
+            if backend == 'offline':
+                if audio_driver is None:
+                    del os.environ['SDL_AUDIODRIVER']
+                else:
+                    os.environ['SDL_AUDIODRIVER'] = audio_driver
 
         # Initialize the SDL_Mixer library to establish the output audio format and encoding
         # (sample rate, bit depth, buffer size)
@@ -135,12 +307,31 @@ cdef class AudioInterface:
         SDL_LockAudio()
 
         # Determine the actual audio format in use by the opened audio device.  This may or may not match
-        # the parameters used to initialize the audio interface.
+        # the parameters used to initialize the audio interface (the dummy audio driver used by the
+        # offline backend always uses the requested parameters).
         self.audio_callback_data.buffer_samples = buffer_samples
         Mix_QuerySpec(&self.audio_callback_data.sample_rate,
                       &self.audio_callback_data.format,
                       &self.audio_callback_data.channels)
 
+        # The mixing kernel only supports signed 16-bit samples in native byte order
+        if self.audio_callback_data.format != AUDIO_S16SYS:
+            SDL_UnlockAudio()
+            Mix_CloseAudio()
+            self.log.error('Unsupported audio format in use by the audio device')
+            raise AudioException("Unable to initialize Audio Interface: "
+                                 "Audio device is not using 16-bit signed samples")
+
+        # The audio thread wakes up the notification listener using a semaphore
+        self.audio_callback_data.notification_semaphore = SDL_CreateSemaphore(0)
+        SDL_AtomicSet(&self.audio_callback_data.notification_wakeup_pending, 0)
+        if self.audio_callback_data.notification_semaphore == NULL:
+            SDL_UnlockAudio()
+            Mix_CloseAudio()
+            self.log.error('SDL_CreateSemaphore error - %s' % SDL_GetError())
+            raise AudioException('Unable to initialize Audio Interface: '
+                                 'Could not create notification semaphore (%s)' % SDL_GetError())
+
         # The requested values used to initialize the audio interface.  A pointer to the audio_callback_data
         # structure is passed to the SDL audio callback function and is the source of all audio state
         # and mixing data needed to generate the output signal.
@@ -156,7 +347,27 @@ cdef class AudioInterface:
                                                            )) // self.audio_callback_data.bytes_per_control_point
         self.audio_callback_data.silence = 0
         self.audio_callback_data.track_count = 0
+        self.audio_callback_data.sample_clock = 0
         self.audio_callback_data.tracks = <void**>PyMem_Malloc(MAX_TRACKS * sizeof(TrackState*))
+        self.audio_callback_data.mix_buffer = <Sint32*>PyMem_Malloc(self.audio_callback_data.buffer_samples *
+                                                                   self.audio_callback_data.channels *
+                                                                   sizeof(Sint32))
+        self.audio_callback_data.float_mix_bus = float_mix_bus
+        self.audio_callback_data.float_mix_buffer = NULL
+        self.audio_callback_data.master_gain = self.audio_callback_data.master_volume / <float>SDL_MIX_MAXVOLUME
+        self.audio_callback_data.master_inserts = NULL
+        if float_mix_bus:
+            self.audio_callback_data.float_mix_buffer = <float*>PyMem_Malloc(self.audio_callback_data.buffer_samples *
+                                                                            self.audio_callback_data.channels *
+                                                                            sizeof(float))
+
+        # Performance counters (recorded by the audio callback)
+        self.audio_callback_data.perf_counters = PyMem_Malloc(sizeof(AudioPerfCounters))
+        if self.audio_callback_data.perf_counters != NULL:
+            (<AudioPerfCounters*>self.audio_callback_data.perf_counters).frequency = SDL_GetPerformanceFrequency()
+            (<AudioPerfCounters*>self.audio_callback_data.perf_counters).deadline = <Uint32>(<Uint64>buffer_samples * 1000000 // self.audio_callback_data.sample_rate)
+            AudioInterface._reset_perf_counters(<AudioPerfCounters*>self.audio_callback_data.perf_counters)
+
         self.audio_callback_data.c_log_file = NULL
         # self.audio_callback_data.c_log_file = fopen("D:\\Temp\\Dev\\MPFMC_AudioLibrary.log", "wb")
         # fprintf(self.audio_callback_data.c_log_file, "---------------------------------------------------------------------------\r\n")
@@ -164,16 +375,18 @@ cdef class AudioInterface:
 
         self.log.debug('Settings requested - rate: %d, channels: %d, buffer: %d samples',
                        rate, channels, buffer_samples)
-        self.log.debug('Settings in use - rate: %d, channels: %d, buffer: %d samples (%d bytes @ %d bytes per sample)',
+        self.log.debug('Settings in use - rate: %d, channels: %d, buffer: %d samples (%d bytes @ %d bytes per sample), '
+                       'mix bus: %s, backend: %s',
                        self.audio_callback_data.sample_rate, self.audio_callback_data.channels,
                        self.audio_callback_data.buffer_samples, self.audio_callback_data.buffer_size,
-                       self.audio_callback_data.bytes_per_sample)
+                       self.audio_callback_data.bytes_per_sample, 'float' if float_mix_bus else 'int', backend)
 
         # Unlock the SDL audio callback functions
         SDL_UnlockAudio()
 
         self.tracks = list()
         self.playlist_controllers = dict()
+        self._master_inserts = list()
 
     def __del__(self):
         """Shut down the audio interface and clean up allocated memory"""
@@ -185,6 +398,17 @@ cdef class AudioInterface:
         self.audio_callback_data.track_count = 0
         PyMem_Free(self.audio_callback_data.tracks)
         self.audio_callback_data.tracks = NULL
+        PyMem_Free(self.audio_callback_data.mix_buffer)
+        self.audio_callback_data.mix_buffer = NULL
+        PyMem_Free(self.audio_callback_data.float_mix_buffer)
+        self.audio_callback_data.float_mix_buffer = NULL
+        free_dsp_chain(<DspChain*>self.audio_callback_data.master_inserts)
+        self.audio_callback_data.master_inserts = NULL
+        PyMem_Free(self.audio_callback_data.perf_counters)
+        self.audio_callback_data.perf_counters = NULL
+        if self.audio_callback_data.notification_semaphore != NULL:
+            SDL_DestroySemaphore(self.audio_callback_data.notification_semaphore)
+            self.audio_callback_data.notification_semaphore = NULL
 
         # Remove tracks
         self.tracks.clear()
@@ -249,6 +473,15 @@ cdef class AudioInterface:
         """Converts the specified number of seconds into samples (based on current sample rate)"""
         return int(self.audio_callback_data.sample_rate * seconds)
 
+    def get_sample_clock(self):
+        """Returns the current position of the audio clock (the number of sample frames generated
+        since the audio interface was initialized). This is the position of the first sample of
+        the next audio buffer, sounds scheduled at or before it start at the beginning of that buffer."""
+        SDL_LockAudio()
+        sample_clock = self.audio_callback_data.sample_clock
+        SDL_UnlockAudio()
+        return sample_clock
+
     def convert_seconds_to_buffer_length(self, float seconds):
         """Convert the specified number of seconds into a buffer length (based on current
         sample rate, the number of audio channels, and the number of bytes per sample)."""
@@ -384,6 +617,37 @@ cdef class AudioInterface:
         self.audio_callback_data.master_volume = <Uint8>min(max(volume * SDL_MIX_MAXVOLUME, 0), SDL_MIX_MAXVOLUME)
         SDL_UnlockAudio()
 
+    def get_master_inserts(self):
+        """Return the list of DSP insert settings applied to the master output"""
+        return self._master_inserts
+
+    def set_master_inserts(self, list inserts not None):
+        """
+        Sets the DSP insert chain applied to the master output (requires the floating-point
+        mix bus).
+        Args:
+            inserts: A list of insert settings dictionaries (in processing order)
+        """
+        cdef DspChain *new_chain = NULL
+        cdef DspChain *old_chain
+
+        if not self.audio_callback_data.float_mix_bus:
+            raise AudioException("Could not set master inserts - DSP inserts require the "
+                                 "floating-point mix bus")
+
+        if inserts:
+            new_chain = create_dsp_chain(inserts,
+                                         self.audio_callback_data.sample_rate,
+                                         self.audio_callback_data.channels)
+
+        SDL_LockAudio()
+        old_chain = <DspChain*>self.audio_callback_data.master_inserts
+        self.audio_callback_data.master_inserts = new_chain
+        SDL_UnlockAudio()
+
+        free_dsp_chain(old_chain)
+        self._master_inserts = list(inserts)
+
     def get_settings(self):
         """
         Gets the current audio interface settings. This method is only intended for testing purposes.
@@ -395,11 +659,58 @@ cdef class AudioInterface:
             return {'sample_rate': self.audio_callback_data.sample_rate,
                     'audio_channels': self.audio_callback_data.channels,
                     'buffer_samples': self.audio_callback_data.buffer_samples,
-                    'buffer_size': self.audio_callback_data.buffer_size
+                    'buffer_size': self.audio_callback_data.buffer_size,
+                    'float_mix_bus': self.audio_callback_data.float_mix_bus,
+                    'backend': self._backend
                     }
         else:
             return None
 
+    def get_performance_counters(self, bint reset=False):
+        """
+        Gets the audio engine performance counters (recorded by the audio callback).
+        Args:
+            reset: Whether or not to reset the counters once they have been read
+
+        Returns:
+            A dictionary containing the audio callback deadline (the duration of one audio buffer),
+            the callback durations ('callback_time'), a histogram of callback durations in
+            buckets of 10% of the deadline ('callback_histogram', the last bucket counts the
+            callbacks that missed the deadline), the number of active sound players in recent
+            callbacks ('active_sound_players'), the time the main thread waited for the audio
+            lock while processing the tracks ('lock_wait_time') and the counters of each track
+            ('tracks').  All times are in microseconds.
+        """
+        cdef AudioPerfCounters *counters = <AudioPerfCounters*>self.audio_callback_data.perf_counters
+
+        if counters == NULL:
+            return None
+
+        SDL_LockAudio()
+        performance_counters = {
+            "deadline": counters.deadline,
+            "callback_time": perf_ring_buffer_summary(&counters.callback_time),
+            "callback_histogram": [counters.callback_histogram[bucket] for bucket in range(PERF_HISTOGRAM_BUCKETS)],
+            "deadline_overruns": counters.deadline_overruns,
+            "active_sound_players": perf_ring_buffer_summary(&counters.active_sound_players),
+            "lock_wait_time": perf_ring_buffer_summary(&counters.lock_wait_time),
+        }
+        if reset:
+            AudioInterface._reset_perf_counters(counters)
+        SDL_UnlockAudio()
+
+        performance_counters["tracks"] = {track.name: track.get_performance_counters(reset) for track in self.tracks}
+        return performance_counters
+
+    @staticmethod
+    cdef void _reset_perf_counters(AudioPerfCounters *counters) nogil:
+        """Clears the values recorded in the audio engine performance counters."""
+        counters.deadline_overruns = 0
+        memset(counters.callback_histogram, 0, PERF_HISTOGRAM_BUCKETS * sizeof(Uint64))
+        perf_ring_buffer_reset(&counters.callback_time)
+        perf_ring_buffer_reset(&counters.active_sound_players)
+        perf_ring_buffer_reset(&counters.lock_wait_time)
+
     cdef write_gst_log_message(self, message_type, message):
         """Write GStreamer log message to the mpfmc log"""
         # print(message_type, message)
@@ -410,8 +721,25 @@ cdef class AudioInterface:
         elif message_type == 'info':
             self.log.info(message)
 
+    @property
+    def backend(self):
+        """Return the audio backend in use ('sdl' or 'offline')"""
+        return self._backend
+
+    @property
+    def sample_rate(self):
+        """Return the output sample rate (may differ from the requested rate)"""
+        return self.audio_callback_data.sample_rate
+
+    @property
+    def channels(self):
+        """Return the number of output channels"""
+        return self.audio_callback_data.channels
+
     @property
     def enabled(self):
+        if self._backend == 'offline':
+            return self._offline_enabled
         return SDL_GetAudioStatus() == SDL_AUDIO_PLAYING and Mix_GetMusicHookData() != NULL
 
     def enable(self):
@@ -419,7 +747,10 @@ cdef class AudioInterface:
         Enables audio playback (begins audio processing)
         """
         self.log.debug("Enabling audio playback")
-        Mix_HookMusic(self.audio_callback, &self.audio_callback_data)
+        if self._backend == 'offline':
+            self._offline_enabled = True
+        else:
+            Mix_HookMusic(self.audio_callback, &self.audio_callback_data)
 
     def disable(self):
         """
@@ -427,7 +758,10 @@ cdef class AudioInterface:
         """
         self.log.debug("Disabling audio playback")
         self.stop_all_sounds()
-        Mix_HookMusic(NULL, NULL)
+        if self._backend == 'offline':
+            self._offline_enabled = False
+        else:
+            Mix_HookMusic(NULL, NULL)
 
     def shutdown(self):
         """
@@ -436,6 +770,63 @@ cdef class AudioInterface:
         self.disable()
         Mix_CloseAudio()
 
+    def render(self, float seconds=0.0, int buffer_count=0):
+        """
+        Generates audio using the offline backend (the audio callback is called once for each
+        audio buffer, as fast as possible).  Audio is only generated while audio playback is
+        enabled (silence is returned and the audio clock does not advance otherwise, just like
+        an audio device).
+        Args:
+            seconds: The duration of the audio to generate (rounded up to a whole number of
+                audio buffers)
+            buffer_count: The number of audio buffers to generate (used when it is larger than
+                the number of buffers needed for the specified duration)
+
+        Returns:
+            A bytes object containing the generated audio samples (signed 16-bit samples in
+            native byte order, interleaved by channel).
+        """
+        cdef Uint32 buffer_size = self.audio_callback_data.buffer_size
+        cdef int buffer_num
+        cdef Uint8 *output_buffer
+
+        if self._backend != 'offline':
+            raise AudioException("Could not render audio - rendering requires the offline audio backend")
+
+        buffer_count = max(buffer_count,
+                           <int>ceil(seconds * self.audio_callback_data.sample_rate / self.audio_callback_data.buffer_samples))
+        output = bytearray(buffer_count * buffer_size)
+        if buffer_count == 0 or not self._offline_enabled:
+            return bytes(output)
+
+        output_buffer = output
+        with nogil:
+            for buffer_num in range(buffer_count):
+                AudioInterface.audio_callback(&self.audio_callback_data, output_buffer + buffer_num * buffer_size,
+                                              buffer_size)
+
+        return bytes(output)
+
+    def render_to_wav(self, str file_name not None, float seconds=0.0, int buffer_count=0):
+        """
+        Generates audio using the offline backend (see render) and writes it to a WAV file.
+        Args:
+            file_name: The name of the WAV file to write
+            seconds: The duration of the audio to generate
+            buffer_count: The number of audio buffers to generate
+
+        Returns:
+            The number of sample frames written to the file.
+        """
+        samples = self.render(seconds, buffer_count)
+        with wave.open(file_name, 'wb') as wav_file:
+            wav_file.setnchannels(self.audio_callback_data.channels)
+            wav_file.setsampwidth(self.audio_callback_data.bytes_per_sample)
+            wav_file.setframerate(self.audio_callback_data.sample_rate)
+            wav_file.writeframes(samples)
+
+        return len(samples) // (self.audio_callback_data.bytes_per_sample * self.audio_callback_data.channels)
+
     @staticmethod
     def get_max_tracks():
         """ Returns the maximum number of tracks allowed. """
@@ -592,7 +983,8 @@ cdef class AudioInterface:
 
         return new_track
 
-    def create_playlist_track(self, object mc, str name not None, float crossfade_time=0.0, float volume=1.0):
+    def create_playlist_track(self, object mc, str name not None, float crossfade_time=0.0, float volume=1.0,
+                              float decode_ahead_time=0.0, bint gapless=False):
         """
         Creates a new playlist track in the audio interface
         Args:
@@ -600,6 +992,9 @@ cdef class AudioInterface:
             name: The name of the new track
             crossfade_time: The default crossfade time (secs) to use when fading between sounds
             volume: The track volume (0.0 to 1.0)
+            decode_ahead_time: The time (secs) before a transition at which the next playlist
+                sound is loaded and prepared for playback (0 to disable)
+            gapless: Whether sounds follow each other without any gap or crossfade
 
         Returns:
             A Track object for the newly created track
@@ -643,7 +1038,8 @@ cdef class AudioInterface:
         SDL_UnlockAudio()
 
         # Create playlist controller for the track
-        playlist_controller = PlaylistController(mc, new_track, crossfade_time)
+        playlist_controller = PlaylistController(mc, new_track, crossfade_time,
+                                                 decode_ahead_time=decode_ahead_time, gapless=gapless)
         self.playlist_controllers[name] = playlist_controller
 
         self.log.debug("The '%s' playlist track and controller have successfully been created.", name)
@@ -669,10 +1065,21 @@ cdef class AudioInterface:
         except KeyError:
             return None
 
+    @property
+    def sound_cache(self):
+        """The SoundCache holding the sound files converted to the audio output format (None
+        when sound files are always loaded from their original file)."""
+        return self._sound_cache
+
+    @sound_cache.setter
+    def sound_cache(self, sound_cache):
+        self._sound_cache = sound_cache
+
     def load_sound_file_to_memory(self, str file_name):
         """
         Loads an audio file into a SoundMemoryFile wrapper object for use in a Sound object.
-        Used in asset loading for Sound objects.
+        Used in asset loading for Sound objects.  The converted file from the sound cache is
+        loaded instead when it is available (no sample format conversion is needed).
         Args:
             file_name: The audio file name to load.
 
@@ -680,6 +1087,8 @@ cdef class AudioInterface:
             A SoundMemoryFile wrapper object containing a pointer to the sound sample
             data in memory.  An exception is thrown if the sound is unable to be loaded.
         """
+        if self._sound_cache is not None:
+            file_name = self._sound_cache.get_file(file_name)
         return SoundMemoryFile(file_name, pycapsule.PyCapsule_New(&self.audio_callback_data, NULL, NULL))
 
     def load_sound_file_for_streaming(self, str file_name):
@@ -693,6 +1102,8 @@ cdef class AudioInterface:
             A SoundMemoryFile wrapper object containing a pointer to the sound sample
             data in memory.  An exception is thrown if the sound is unable to be loaded.
         """
+        if self._sound_cache is not None:
+            file_name = self._sound_cache.get_file(file_name)
         return SoundStreamingFile(file_name, pycapsule.PyCapsule_New(&self.audio_callback_data, NULL, NULL))
 
     def unload_sound_file(self, container not None):
@@ -742,10 +1153,32 @@ cdef class AudioInterface:
             track.clear_context(context)
 
     def process(self):
-        """Process tick function for the audio interface."""
+        """Process function for the audio interface (processes track queues and notifications)."""
         for track in self.tracks:
             track.process()
 
+    def wait_for_notifications(self, int timeout_ms):
+        """
+        Blocks the calling thread until a track notification message is posted by the audio
+        thread (or the timeout expires).  This function must not be called from the main thread.
+        Args:
+            timeout_ms: The maximum number of milliseconds to wait
+
+        Returns:
+            True if notification messages are waiting to be processed, False otherwise.
+        """
+        cdef int result
+
+        with nogil:
+            result = SDL_SemWaitTimeout(self.audio_callback_data.notification_semaphore, timeout_ms)
+
+        if result != 0:
+            return False
+
+        # Messages posted from now on will wake up the listener again
+        SDL_AtomicSet(&self.audio_callback_data.notification_wakeup_pending, 0)
+        return True
+
     @staticmethod
     cdef void audio_callback(void* data, Uint8 *output_buffer, int length) nogil:
         """
@@ -765,12 +1198,23 @@ cdef class AudioInterface:
         cdef Uint32 buffer_length = <Uint32> length
         cdef AudioCallbackData *callback_data = <AudioCallbackData*> data
         cdef TrackState *track
+        cdef float target_master_gain
+        cdef AudioPerfCounters *perf_counters
+        cdef Uint64 callback_start, track_start
+        cdef Uint32 callback_time, active_sound_players = 0
 
         if callback_data == NULL:
             return
 
-        # Initialize master output buffer with silence as it arrives uninitialized
-        memset(output_buffer, 0, buffer_length)
+        perf_counters = <AudioPerfCounters*>callback_data.perf_counters
+        callback_start = SDL_GetPerformanceCounter()
+
+        # Initialize master accumulator buffer with silence (all tracks are summed into the 32-bit
+        # accumulator and saturated into the output buffer only once, at the end of the callback)
+        if callback_data.float_mix_bus:
+            memset(callback_data.float_mix_buffer, 0, (buffer_length // callback_data.bytes_per_sample) * sizeof(float))
+        else:
+            memset(callback_data.mix_buffer, 0, (buffer_length // callback_data.bytes_per_sample) * sizeof(Sint32))
 
         # Note: There are three separate loops over the tracks that must remain separate due
         # to various track parameters than can be set for any track during each loop.  Difficult
@@ -797,9 +1241,14 @@ cdef class AudioInterface:
 
             # Call the track's mix callback function (generates audio into track buffer)
             if track.mix_callback_function != NULL:
+                track_start = SDL_GetPerformanceCounter()
                 track.mix_callback_function(track, buffer_length, callback_data)
+                if perf_counters != NULL:
+                    perf_ring_buffer_record(&track.mix_time, perf_elapsed_us(perf_counters, track_start))
+                    active_sound_players += track.active_sound_players
 
-        # Loop over tracks again, applying ducking and mixing down tracks to the master output buffer
+        # Loop over tracks again, applying ducking, track and master volume and mixing down tracks
+        # to the master accumulator buffer
         for track_num in range(callback_data.track_count):
             track = <TrackState*>callback_data.tracks[track_num]
 
@@ -810,5 +1259,39 @@ cdef class AudioInterface:
                                           output_buffer,
                                           buffer_length)
 
-        # Apply master volume to output buffer
-        SDL_MixAudioFormat(output_buffer, output_buffer, callback_data.format, buffer_length, callback_data.master_volume)
+            # Let the track inserts (reverb) ring out after the track is stopped, paused or silent
+            elif callback_data.float_mix_bus:
+                Track.mix_track_tail_to_output(track, callback_data, buffer_length)
+
+        if callback_data.float_mix_bus:
+            # Apply master volume (ramped from the previous callback) and the master insert chain,
+            # then convert the floating-point master bus into the output buffer
+            target_master_gain = callback_data.master_volume / <float>SDL_MIX_MAXVOLUME
+            apply_float_gain(callback_data.float_mix_buffer, buffer_length // callback_data.bytes_per_sample,
+                             callback_data.master_gain,
+                             (target_master_gain - callback_data.master_gain) / (buffer_length // callback_data.bytes_per_sample))
+            callback_data.master_gain = target_master_gain
+            process_dsp_chain(<DspChain*>callback_data.master_inserts, callback_data.float_mix_buffer,
+                              buffer_length // (callback_data.bytes_per_sample * callback_data.channels),
+                              callback_data.channels)
+            saturate_float_to_s16(<Sint16*>output_buffer, callback_data.float_mix_buffer,
+                                  buffer_length // callback_data.bytes_per_sample)
+        else:
+            # Saturate the master accumulator into the output buffer
+            saturate_accumulator_to_s16(<Sint16*>output_buffer, callback_data.mix_buffer,
+                                        buffer_length // callback_data.bytes_per_sample)
+
+        # Advance the audio clock (used to schedule sounds at exact sample positions)
+        callback_data.sample_clock += buffer_length // (callback_data.bytes_per_sample * callback_data.channels)
+
+        # Record the callback duration (the deadline is the duration of the generated audio)
+        if perf_counters != NULL:
+            callback_time = perf_elapsed_us(perf_counters, callback_start)
+            perf_counters.deadline = <Uint32>((<Uint64>(buffer_length // (callback_data.bytes_per_sample * callback_data.channels)) * 1000000) // callback_data.sample_rate)
+            perf_ring_buffer_record(&perf_counters.callback_time, callback_time)
+            perf_ring_buffer_record(&perf_counters.active_sound_players, active_sound_players)
+            if callback_time >= perf_counters.deadline:
+                perf_counters.deadline_overruns += 1
+            if perf_counters.deadline > 0:
+                perf_counters.callback_histogram[min(callback_time * 10 // perf_counters.deadline,
+                                                     PERF_HISTOGRAM_BUCKETS - 1)] += 1
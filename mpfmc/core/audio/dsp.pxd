@@ -0,0 +1,195 @@
+from mpfmc.core.audio.sdl2 cimport *
+
+# ---------------------------------------------------------------------------
+#    DSP insert chain
+#
+#    Inserts process the floating-point mix bus (samples in the range -1.0 to
+#    1.0, interleaved by channel) in place.  Each track may have its own insert
+#    chain and the master output has a separate chain that is processed after
+#    all tracks have been summed.  All processing functions are called from the
+#    audio callback and must not use the GIL.
+# ---------------------------------------------------------------------------
+
+cdef enum:
+    DSP_MAX_INSERTS = 8
+    DSP_MAX_CHANNELS = 2
+    DSP_REVERB_COMB_COUNT = 4
+    DSP_REVERB_ALLPASS_COUNT = 2
+
+cdef enum DspInsertType:
+    # Enumeration of the supported insert types
+    dsp_insert_biquad = 0
+    dsp_insert_limiter = 1
+    dsp_insert_reverb = 2
+
+ctypedef struct BiquadSettings:
+    # Normalized biquad filter coefficients and (transposed direct form II) filter state
+    float b0
+    float b1
+    float b2
+    float a1
+    float a2
+    float z1[DSP_MAX_CHANNELS]
+    float z2[DSP_MAX_CHANNELS]
+
+ctypedef struct LimiterSettings:
+    # Peak limiter (instant attack, exponential release, all channels linked)
+    float threshold
+    float release_coefficient
+    float gain
+
+ctypedef struct ReverbSettings:
+    # Simple Schroeder reverb (parallel damped comb filters followed by series allpass
+    # filters).  All delay lines are allocated in a single block of memory.
+    float *delay_memory
+    float *comb_buffers[DSP_REVERB_COMB_COUNT]
+    Uint32 comb_lengths[DSP_REVERB_COMB_COUNT]
+    Uint32 comb_positions[DSP_REVERB_COMB_COUNT]
+    float comb_filter_stores[DSP_REVERB_COMB_COUNT]
+    float *allpass_buffers[DSP_REVERB_ALLPASS_COUNT]
+    Uint32 allpass_lengths[DSP_REVERB_ALLPASS_COUNT]
+    Uint32 allpass_positions[DSP_REVERB_ALLPASS_COUNT]
+    float feedback
+    float damping
+    float wet
+    float dry
+
+ctypedef struct DspInsert:
+    DspInsertType type
+    BiquadSettings biquad
+    LimiterSettings limiter
+    ReverbSettings reverb
+
+ctypedef struct DspChain:
+    int insert_count
+    DspInsert inserts[DSP_MAX_INSERTS]
+    Uint32 tail_frames              # Number of frames the chain keeps ringing after its input is silent
+    Uint32 tail_frames_remaining    # Number of tail frames still to be processed
+
+
+# ---------------------------------------------------------------------------
+#    Insert processing functions (these functions do not use the GIL)
+# ---------------------------------------------------------------------------
+
+cdef inline void process_biquad(BiquadSettings *biquad, float *buffer, Uint32 frames, int channels) nogil:
+    """
+    Applies a biquad filter to a block of interleaved samples.
+    Args:
+        biquad: The biquad filter settings and state
+        buffer: The floating-point sample buffer (processed in place)
+        frames: The number of frames (samples per channel) to process
+        channels: The number of interleaved channels in the buffer
+    """
+    cdef Uint32 frame
+    cdef int channel
+    cdef float x, y
+    cdef float *sample
+
+    for channel in range(channels):
+        sample = buffer + channel
+        for frame in range(frames):
+            x = sample[0]
+            y = biquad.b0 * x + biquad.z1[channel]
+            biquad.z1[channel] = biquad.b1 * x - biquad.a1 * y + biquad.z2[channel]
+            biquad.z2[channel] = biquad.b2 * x - biquad.a2 * y
+            sample[0] = y
+            sample += channels
+
+cdef inline void process_limiter(LimiterSettings *limiter, float *buffer, Uint32 frames, int channels) nogil:
+    """
+    Applies a peak limiter to a block of interleaved samples.
+    Args:
+        limiter: The limiter settings and state
+        buffer: The floating-point sample buffer (processed in place)
+        frames: The number of frames (samples per channel) to process
+        channels: The number of interleaved channels in the buffer
+    """
+    cdef Uint32 frame
+    cdef int channel
+    cdef float peak, value, target_gain
+    cdef float *sample = buffer
+
+    for frame in range(frames):
+        peak = 0.0
+        for channel in range(channels):
+            value = sample[channel] if sample[channel] >= 0.0 else -sample[channel]
+            if value > peak:
+                peak = value
+
+        # Attack is instantaneous, release is exponential
+        target_gain = limiter.threshold / peak if peak > limiter.threshold else 1.0
+        if target_gain < limiter.gain:
+            limiter.gain = target_gain
+        else:
+            limiter.gain = target_gain + (limiter.gain - target_gain) * limiter.release_coefficient
+
+        for channel in range(channels):
+            sample[channel] *= limiter.gain
+        sample += channels
+
+cdef inline void process_reverb(ReverbSettings *reverb, float *buffer, Uint32 frames, int channels) nogil:
+    """
+    Applies a simple (mono) reverb to a block of interleaved samples.
+    Args:
+        reverb: The reverb settings and state
+        buffer: The floating-point sample buffer (processed in place)
+        frames: The number of frames (samples per channel) to process
+        channels: The number of interleaved channels in the buffer
+    """
+    cdef Uint32 frame
+    cdef int channel, index
+    cdef float input_value, output_value, delayed
+    cdef float *sample = buffer
+
+    for frame in range(frames):
+        input_value = 0.0
+        for channel in range(channels):
+            input_value += sample[channel]
+        input_value /= channels
+
+        # Parallel damped comb filters
+        output_value = 0.0
+        for index in range(DSP_REVERB_COMB_COUNT):
+            delayed = reverb.comb_buffers[index][reverb.comb_positions[index]]
+            reverb.comb_filter_stores[index] = delayed * (1.0 - reverb.damping) + reverb.comb_filter_stores[index] * reverb.damping
+            reverb.comb_buffers[index][reverb.comb_positions[index]] = input_value + reverb.comb_filter_stores[index] * reverb.feedback
+            reverb.comb_positions[index] += 1
+            if reverb.comb_positions[index] >= reverb.comb_lengths[index]:
+                reverb.comb_positions[index] = 0
+            output_value += delayed
+        output_value /= DSP_REVERB_COMB_COUNT
+
+        # Series allpass filters
+        for index in range(DSP_REVERB_ALLPASS_COUNT):
+            delayed = reverb.allpass_buffers[index][reverb.allpass_positions[index]]
+            reverb.allpass_buffers[index][reverb.allpass_positions[index]] = output_value + delayed * 0.5
+            output_value = delayed - output_value
+            reverb.allpass_positions[index] += 1
+            if reverb.allpass_positions[index] >= reverb.allpass_lengths[index]:
+                reverb.allpass_positions[index] = 0
+
+        for channel in range(channels):
+            sample[channel] = sample[channel] * reverb.dry + output_value * reverb.wet
+        sample += channels
+
+cdef inline void process_dsp_chain(DspChain *chain, float *buffer, Uint32 frames, int channels) nogil:
+    """
+    Processes a block of interleaved samples through all the inserts in a chain (in order).
+    Args:
+        chain: The insert chain (may be NULL)
+        buffer: The floating-point sample buffer (processed in place)
+        frames: The number of frames (samples per channel) to process
+        channels: The number of interleaved channels in the buffer
+    """
+    cdef int index
+
+    if chain == NULL:
+        return
+
+    for index in range(chain.insert_count):
+        if chain.inserts[index].type == dsp_insert_biquad:
+            process_biquad(&chain.inserts[index].biquad, buffer, frames, channels)
+        elif chain.inserts[index].type == dsp_insert_limiter:
+            process_limiter(&chain.inserts[index].limiter, buffer, frames, channels)
+        elif chain.inserts[index].type == dsp_insert_reverb:
+            process_reverb(&chain.inserts[index].reverb, buffer, frames, channels)
@@ -50,6 +50,7 @@ cdef extern from 'gst/gst.h':
     ctypedef enum GstSeekFlags:
         GST_SEEK_FLAG_KEY_UNIT
         GST_SEEK_FLAG_FLUSH
+        GST_SEEK_FLAG_ACCURATE
 
     ctypedef enum GstStateChangeReturn:
         pass
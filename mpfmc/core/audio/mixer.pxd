@@ -0,0 +1,158 @@
+cimport cython
+from mpfmc.core.audio.sdl2 cimport *
+
+# ---------------------------------------------------------------------------
+#    Mixing kernel
+#
+#    All voices of a track (and all tracks of the master output) are summed
+#    into a 32-bit accumulator and saturated to 16-bit only once at the end of
+#    the audio callback.  Gains are carried as Q16 fixed-point values (65536 is
+#    unity gain) and may be ramped linearly per sample across a chunk, which
+#    removes the zipper noise caused by stepping the volume at control rate.
+#
+#    The loops below are intentionally kept simple (no function calls, no
+#    branches in the inner loop) so the C compiler is able to auto-vectorize
+#    them.
+# ---------------------------------------------------------------------------
+
+cdef enum:
+    MIXER_UNITY_GAIN = 65536
+
+cdef inline Sint32 volume_to_gain(int volume) nogil:
+    """
+    Converts an SDL mixer volume (0 to SDL_MIX_MAXVOLUME) to a Q16 gain value.
+    Args:
+        volume: The SDL mixer volume (SDL_MIX_MAXVOLUME is 128)
+
+    Returns:
+        The Q16 gain (65536 is unity gain)
+    """
+    return <Sint32>volume << 9
+
+@cython.cdivision(True)
+cdef inline Sint32 gain_step(Sint32 start_gain, Sint32 end_gain, Uint32 sample_count) nogil:
+    """
+    Calculates the per-sample gain increment needed to ramp between two gain values.
+    Args:
+        start_gain: The Q16 gain at the first sample
+        end_gain: The Q16 gain after the last sample
+        sample_count: The number of samples over which to ramp
+
+    Returns:
+        The Q16 gain increment to apply after each sample
+    """
+    if sample_count == 0:
+        return 0
+    return (end_gain - start_gain) // <Sint32>sample_count
+
+cdef inline void mix_s16_to_accumulator(Sint32 *accumulator, const Sint16 *source, Uint32 sample_count,
+                                        Sint32 gain, Sint32 step) nogil:
+    """
+    Mixes 16-bit signed samples into a 32-bit accumulator applying a (ramped) gain.
+    Args:
+        accumulator: The 32-bit accumulator buffer
+        source: The 16-bit source samples
+        sample_count: The number of samples to mix
+        gain: The Q16 gain to apply to the first sample
+        step: The Q16 gain increment to apply after each sample (0 for a constant gain)
+    """
+    cdef Uint32 i
+    cdef Sint32 gain_q15
+
+    if step == 0:
+        if gain == MIXER_UNITY_GAIN:
+            for i in range(sample_count):
+                accumulator[i] += source[i]
+        elif gain > 0:
+            gain_q15 = gain >> 1
+            for i in range(sample_count):
+                accumulator[i] += (source[i] * gain_q15) >> 15
+    else:
+        for i in range(sample_count):
+            accumulator[i] += (source[i] * ((gain + <Sint32>i * step) >> 1)) >> 15
+
+cdef inline void saturate_accumulator_to_s16(Sint16 *output, const Sint32 *accumulator, Uint32 sample_count) nogil:
+    """
+    Converts the 32-bit accumulator to 16-bit signed samples, clipping any out of range values.
+    Args:
+        output: The 16-bit output buffer
+        accumulator: The 32-bit accumulator buffer
+        sample_count: The number of samples to convert
+    """
+    cdef Uint32 i
+    cdef Sint32 value
+
+    for i in range(sample_count):
+        value = accumulator[i]
+        value = 32767 if value > 32767 else value
+        value = -32768 if value < -32768 else value
+        output[i] = <Sint16>value
+
+# ---------------------------------------------------------------------------
+#    Floating-point mix bus
+#
+#    When the floating-point mix bus is enabled, each track buffer is converted
+#    to 32-bit float samples (-1.0 to 1.0) so the track and master insert chains
+#    can process it without clipping between stages.  The master bus is only
+#    clipped once, when it is converted back to 16-bit output samples.
+# ---------------------------------------------------------------------------
+
+cdef inline void s16_to_float(float *output, const Sint16 *source, Uint32 sample_count,
+                              float gain, float step) nogil:
+    """
+    Converts 16-bit signed samples to floating-point samples applying a (ramped) gain.
+    Args:
+        output: The floating-point output buffer
+        source: The 16-bit source samples
+        sample_count: The number of samples to convert
+        gain: The gain (1.0 is unity gain) to apply to the first sample
+        step: The gain increment to apply after each sample (0.0 for a constant gain)
+    """
+    cdef Uint32 i
+
+    for i in range(sample_count):
+        output[i] = source[i] * (gain + i * step) * (1.0 / 32768.0)
+
+cdef inline void mix_float_to_float(float *accumulator, const float *source, Uint32 sample_count) nogil:
+    """
+    Mixes floating-point samples into a floating-point accumulator.
+    Args:
+        accumulator: The floating-point accumulator buffer
+        source: The floating-point source samples
+        sample_count: The number of samples to mix
+    """
+    cdef Uint32 i
+
+    for i in range(sample_count):
+        accumulator[i] += source[i]
+
+cdef inline void apply_float_gain(float *buffer, Uint32 sample_count, float gain, float step) nogil:
+    """
+    Applies a (ramped) gain to floating-point samples in place.
+    Args:
+        buffer: The floating-point sample buffer
+        sample_count: The number of samples to process
+        gain: The gain (1.0 is unity gain) to apply to the first sample
+        step: The gain increment to apply after each sample (0.0 for a constant gain)
+    """
+    cdef Uint32 i
+
+    for i in range(sample_count):
+        buffer[i] *= gain + i * step
+
+cdef inline void saturate_float_to_s16(Sint16 *output, const float *source, Uint32 sample_count) nogil:
+    """
+    Converts floating-point samples to 16-bit signed samples, clipping any out of range values.
+    Args:
+        output: The 16-bit output buffer
+        source: The floating-point source samples
+        sample_count: The number of samples to convert
+    """
+    cdef Uint32 i
+    cdef float value
+
+    for i in range(sample_count):
+        value = source[i] * 32768.0
+        value = 32767.0 if value > 32767.0 else value
+        value = -32768.0 if value < -32768.0 else value
+        output[i] = <Sint16>value
@@ -54,6 +54,31 @@ cdef inline NotificationMessageContainer *_create_notification_message() nogil:
     """
     return <NotificationMessageContainer*>g_slice_alloc0(sizeof(NotificationMessageContainer))
 
+cdef inline void _post_notification_message(NotificationMessageContainer *notification_message,
+                                            TrackState *track) nogil:
+    """
+    Posts a notification message to the track's lock-free notification message list and wakes
+    up the notification listener (if it is not already awake).
+    Args:
+        notification_message: The notification message to post
+        track: The TrackState pointer
+
+    Notes:
+        Messages are pushed onto the front of the list using an atomic compare-and-swap so the
+        list can be taken by the main thread without locking the audio thread.  The list is
+        always taken as a whole (see Track.take_notification_messages).
+    """
+    cdef GSList *node = g_slist_prepend(NULL, notification_message)
+
+    node.next = track.notification_messages
+    while not SDL_AtomicCASPtr(<void**>&track.notification_messages, node.next, node):
+        node.next = track.notification_messages
+
+    # Only the first message posted since the listener last woke up needs to wake it up
+    if track.callback_data != NULL and track.callback_data.notification_semaphore != NULL:
+        if SDL_AtomicSet(&track.callback_data.notification_wakeup_pending, 1) == 0:
+            SDL_SemPost(track.callback_data.notification_semaphore)
+
 cdef inline void send_sound_started_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,
                                                  TrackState *track) nogil:
     """
@@ -71,7 +96,7 @@ cdef inline void send_sound_started_notification(int player, Uint64 sound_id, Ui
         notification_message.sound_id = sound_id
         notification_message.sound_instance_id = sound_instance_id
 
-        track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+        _post_notification_message(notification_message, track)
 
 cdef inline void send_sound_stopped_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,
                                                  TrackState *track) nogil:
@@ -90,7 +115,7 @@ cdef inline void send_sound_stopped_notification(int player, Uint64 sound_id, Ui
         notification_message.sound_id = sound_id
         notification_message.sound_instance_id = sound_instance_id
 
-        track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+        _post_notification_message(notification_message, track)
 
 cdef inline void send_sound_looping_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,
                                                  TrackState *track) nogil:
@@ -109,7 +134,7 @@ cdef inline void send_sound_looping_notification(int player, Uint64 sound_id, Ui
         notification_message.sound_id = sound_id
         notification_message.sound_instance_id = sound_instance_id
 
-        track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+        _post_notification_message(notification_message, track)
 
 cdef inline void send_sound_about_to_finish_notification(int player, long sound_id, long sound_instance_id,
                                                          TrackState *track) nogil:
@@ -128,7 +153,7 @@ cdef inline void send_sound_about_to_finish_notification(int player, long sound_
         notification_message.sound_id = sound_id
         notification_message.sound_instance_id = sound_instance_id
 
-        track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+        _post_notification_message(notification_message, track)
 
 cdef inline void send_sound_marker_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,
                                                 TrackState *track,
@@ -150,7 +175,7 @@ cdef inline void send_sound_marker_notification(int player, Uint64 sound_id, Uin
         notification_message.sound_instance_id = sound_instance_id
         notification_message.data.marker.id = marker_id
 
-        track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+        _post_notification_message(notification_message, track)
 
 cdef inline void send_track_stopped_notification(TrackState *track) nogil:
     """
@@ -161,7 +186,7 @@ cdef inline void send_track_stopped_notification(TrackState *track) nogil:
     cdef NotificationMessageContainer *notification_message = _create_notification_message()
     if notification_message != NULL:
         notification_message.message = notification_track_stopped
-        track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+        _post_notification_message(notification_message, track)
 
 cdef inline void send_track_paused_notification(TrackState *track) nogil:
     """
@@ -172,7 +197,7 @@ cdef inline void send_track_paused_notification(TrackState *track) nogil:
     cdef NotificationMessageContainer *notification_message = _create_notification_message()
     if notification_message != NULL:
         notification_message.message = notification_track_paused
-        track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+        _post_notification_message(notification_message, track)
 
 cdef inline void send_sound_loop_set_started_notification(int sound_loop_set_id, Uint64 sound_id, TrackState *track) nogil:
     """
@@ -190,7 +215,7 @@ cdef inline void send_sound_loop_set_started_notification(int sound_loop_set_id,
         notification_message.sound_instance_id = 0
         notification_message.data.sound_loop_set.id = sound_loop_set_id
 
-        track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+        _post_notification_message(notification_message, track)
 
 cdef inline void send_sound_loop_set_stopped_notification(int sound_loop_set_id, Uint64 sound_id, TrackState *track) nogil:
     """
@@ -208,7 +233,7 @@ cdef inline void send_sound_loop_set_stopped_notification(int sound_loop_set_id,
         notification_message.sound_instance_id = 0
         notification_message.data.sound_loop_set.id = sound_loop_set_id
 
-        track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+        _post_notification_message(notification_message, track)
 
 cdef inline void send_sound_loop_set_looping_notification(int sound_loop_set_id, Uint64 sound_id, TrackState *track) nogil:
     """
@@ -226,5 +251,5 @@ cdef inline void send_sound_loop_set_looping_notification(int sound_loop_set_id,
         notification_message.sound_instance_id = 0
         notification_message.data.sound_loop_set.id = sound_loop_set_id
 
-        track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+        _post_notification_message(notification_message, track)
 
@@ -0,0 +1,86 @@
+from mpfmc.core.audio.sdl2 cimport *
+
+# ---------------------------------------------------------------------------
+#    Audio engine performance counters
+#
+#    The audio callback records how long it takes to generate each buffer
+#    (and how long each track takes to mix its sounds), the number of active
+#    sound players, streaming buffer underruns, and how long the main thread
+#    waits for the audio lock.  Values are stored in fixed-size ring buffers
+#    (no memory is allocated in the audio thread) and are read by the main
+#    thread while holding the audio lock.  All times are in microseconds.
+# ---------------------------------------------------------------------------
+
+cdef enum:
+    PERF_RING_BUFFER_SIZE = 256
+    # Callback durations are counted in buckets of 10% of the callback deadline (the
+    # last bucket holds all callbacks that used up the whole deadline)
+    PERF_HISTOGRAM_BUCKETS = 11
+
+ctypedef struct PerfRingBuffer:
+    # The most recent values (position is the index of the next value to write) along with
+    # the number, total and maximum of all the values recorded since the last reset
+    Uint32 values[PERF_RING_BUFFER_SIZE]
+    Uint32 position
+    Uint64 count
+    Uint64 total
+    Uint32 maximum
+
+ctypedef struct AudioPerfCounters:
+    Uint64 frequency
+    Uint32 deadline
+    Uint64 deadline_overruns
+    Uint64 callback_histogram[PERF_HISTOGRAM_BUCKETS]
+    PerfRingBuffer callback_time
+    PerfRingBuffer active_sound_players
+    PerfRingBuffer lock_wait_time
+
+
+cdef inline void perf_ring_buffer_reset(PerfRingBuffer *ring_buffer) nogil:
+    """Clears all the values recorded in a ring buffer."""
+    ring_buffer.position = 0
+    ring_buffer.count = 0
+    ring_buffer.total = 0
+    ring_buffer.maximum = 0
+
+cdef inline void perf_ring_buffer_record(PerfRingBuffer *ring_buffer, Uint32 value) nogil:
+    """Records a value in a ring buffer (overwriting the oldest value when it is full)."""
+    ring_buffer.values[ring_buffer.position] = value
+    ring_buffer.position = (ring_buffer.position + 1) % PERF_RING_BUFFER_SIZE
+    ring_buffer.count += 1
+    ring_buffer.total += value
+    if value > ring_buffer.maximum:
+        ring_buffer.maximum = value
+
+cdef inline Uint32 perf_elapsed_us(AudioPerfCounters *counters, Uint64 start) nogil:
+    """Returns the number of microseconds elapsed since the specified performance counter value."""
+    return <Uint32>((SDL_GetPerformanceCounter() - start) * 1000000 // counters.frequency)
+
+cdef inline void perf_lock_audio(AudioCallbackData *callback_data) nogil:
+    """Locks the audio callback (SDL_LockAudio) and records the time spent waiting for the lock."""
+    cdef AudioPerfCounters *counters = <AudioPerfCounters*>callback_data.perf_counters
+    cdef Uint64 start
+
+    if counters == NULL:
+        SDL_LockAudio()
+        return
+
+    start = SDL_GetPerformanceCounter()
+    SDL_LockAudio()
+    perf_ring_buffer_record(&counters.lock_wait_time, perf_elapsed_us(counters, start))
+
+cdef inline dict perf_ring_buffer_summary(PerfRingBuffer *ring_buffer):
+    """Returns a dictionary summarizing the values recorded in a ring buffer (must be called
+    while holding the audio lock)."""
+    cdef Uint32 recent_count = <Uint32>min(ring_buffer.count, PERF_RING_BUFFER_SIZE)
+    cdef Uint32 index
+
+    recent = sorted([ring_buffer.values[index] for index in range(recent_count)])
+    return {
+        "count": ring_buffer.count,
+        "last": ring_buffer.values[(ring_buffer.position + PERF_RING_BUFFER_SIZE - 1) % PERF_RING_BUFFER_SIZE] if recent_count else 0,
+        "mean": ring_buffer.total / ring_buffer.count if ring_buffer.count else 0.0,
+        "max": ring_buffer.maximum,
+        "recent_mean": sum(recent) / recent_count if recent_count else 0.0,
+        "recent_p95": recent[(recent_count * 95) // 100] if recent_count else 0,
+    }
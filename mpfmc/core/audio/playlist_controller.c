@@ -730,16 +730,30 @@ static const char *__pyx_filename;
 
 
 static const char *__pyx_f[] = {
-  "mpfmc\\core\\audio\\playlist_controller.pyx",
-  "mpfmc\\core\\audio\\track.pxd",
+  "mpfmc/core/audio/playlist_controller.pyx",
+  "mpfmc/core/audio/dsp.pxd",
+  "mpfmc/core/audio/perf_counters.pxd",
+  "mpfmc/core/audio/track.pxd",
 };
+/* ForceInitThreads.proto */
+#ifndef __PYX_FORCE_INIT_THREADS
+  #define __PYX_FORCE_INIT_THREADS 0
+#endif
+
+/* NoFastGil.proto */
+#define __Pyx_PyGILState_Ensure PyGILState_Ensure
+#define __Pyx_PyGILState_Release PyGILState_Release
+#define __Pyx_FastGIL_Remember()
+#define __Pyx_FastGIL_Forget()
+#define __Pyx_FastGilFuncInit()
+
 
 /*--- Type declarations ---*/
 struct __pyx_obj_5mpfmc_4core_5audio_5track_Track;
 struct __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData;
 typedef struct __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData;
 
-/* "mpfmc/core/audio/sdl2.pxd":229
+/* "mpfmc/core/audio/sdl2.pxd":250
  * # ---------------------------------------------------------------------------
  * 
  * ctypedef struct AudioCallbackData:             # <<<<<<<<<<<<<<
@@ -760,12 +774,186 @@ struct __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData {
   Uint8 silence;
   Uint8 track_count;
   void **tracks;
+  Uint64 sample_clock;
+  Sint32 *mix_buffer;
+  int float_mix_bus;
+  float *float_mix_buffer;
+  float master_gain;
+  void *master_inserts;
+  SDL_sem *notification_semaphore;
+  SDL_atomic_t notification_wakeup_pending;
+  void *perf_counters;
   FILE *c_log_file;
 };
+struct __pyx_t_5mpfmc_4core_5audio_3dsp_BiquadSettings;
+typedef struct __pyx_t_5mpfmc_4core_5audio_3dsp_BiquadSettings __pyx_t_5mpfmc_4core_5audio_3dsp_BiquadSettings;
+struct __pyx_t_5mpfmc_4core_5audio_3dsp_LimiterSettings;
+typedef struct __pyx_t_5mpfmc_4core_5audio_3dsp_LimiterSettings __pyx_t_5mpfmc_4core_5audio_3dsp_LimiterSettings;
+struct __pyx_t_5mpfmc_4core_5audio_3dsp_ReverbSettings;
+typedef struct __pyx_t_5mpfmc_4core_5audio_3dsp_ReverbSettings __pyx_t_5mpfmc_4core_5audio_3dsp_ReverbSettings;
+struct __pyx_t_5mpfmc_4core_5audio_3dsp_DspInsert;
+typedef struct __pyx_t_5mpfmc_4core_5audio_3dsp_DspInsert __pyx_t_5mpfmc_4core_5audio_3dsp_DspInsert;
+struct __pyx_t_5mpfmc_4core_5audio_3dsp_DspChain;
+typedef struct __pyx_t_5mpfmc_4core_5audio_3dsp_DspChain __pyx_t_5mpfmc_4core_5audio_3dsp_DspChain;
+
+/* "mpfmc/core/audio/dsp.pxd":13
+ * # ---------------------------------------------------------------------------
+ * 
+ * cdef enum:             # <<<<<<<<<<<<<<
+ *     DSP_MAX_INSERTS = 8
+ *     DSP_MAX_CHANNELS = 2
+ */
+enum  {
+  __pyx_e_5mpfmc_4core_5audio_3dsp_DSP_MAX_INSERTS = 8,
+  __pyx_e_5mpfmc_4core_5audio_3dsp_DSP_MAX_CHANNELS = 2,
+  __pyx_e_5mpfmc_4core_5audio_3dsp_DSP_REVERB_COMB_COUNT = 4,
+  __pyx_e_5mpfmc_4core_5audio_3dsp_DSP_REVERB_ALLPASS_COUNT = 2
+};
+
+/* "mpfmc/core/audio/dsp.pxd":19
+ *     DSP_REVERB_ALLPASS_COUNT = 2
+ * 
+ * cdef enum DspInsertType:             # <<<<<<<<<<<<<<
+ *     # Enumeration of the supported insert types
+ *     dsp_insert_biquad = 0
+ */
+enum __pyx_t_5mpfmc_4core_5audio_3dsp_DspInsertType {
+  __pyx_e_5mpfmc_4core_5audio_3dsp_dsp_insert_biquad = 0,
+  __pyx_e_5mpfmc_4core_5audio_3dsp_dsp_insert_limiter = 1,
+  __pyx_e_5mpfmc_4core_5audio_3dsp_dsp_insert_reverb = 2
+};
+
+/* "mpfmc/core/audio/dsp.pxd":25
+ *     dsp_insert_reverb = 2
+ * 
+ * ctypedef struct BiquadSettings:             # <<<<<<<<<<<<<<
+ *     # Normalized biquad filter coefficients and (transposed direct form II) filter state
+ *     float b0
+ */
+struct __pyx_t_5mpfmc_4core_5audio_3dsp_BiquadSettings {
+  float b0;
+  float b1;
+  float b2;
+  float a1;
+  float a2;
+  float z1[__pyx_e_5mpfmc_4core_5audio_3dsp_DSP_MAX_CHANNELS];
+  float z2[__pyx_e_5mpfmc_4core_5audio_3dsp_DSP_MAX_CHANNELS];
+};
+
+/* "mpfmc/core/audio/dsp.pxd":35
+ *     float z2[DSP_MAX_CHANNELS]
+ * 
+ * ctypedef struct LimiterSettings:             # <<<<<<<<<<<<<<
+ *     # Peak limiter (instant attack, exponential release, all channels linked)
+ *     float threshold
+ */
+struct __pyx_t_5mpfmc_4core_5audio_3dsp_LimiterSettings {
+  float threshold;
+  float release_coefficient;
+  float gain;
+};
+
+/* "mpfmc/core/audio/dsp.pxd":41
+ *     float gain
+ * 
+ * ctypedef struct ReverbSettings:             # <<<<<<<<<<<<<<
+ *     # Simple Schroeder reverb (parallel damped comb filters followed by series allpass
+ *     # filters).  All delay lines are allocated in a single block of memory.
+ */
+struct __pyx_t_5mpfmc_4core_5audio_3dsp_ReverbSettings {
+  float *delay_memory;
+  float *comb_buffers[__pyx_e_5mpfmc_4core_5audio_3dsp_DSP_REVERB_COMB_COUNT];
+  Uint32 comb_lengths[__pyx_e_5mpfmc_4core_5audio_3dsp_DSP_REVERB_COMB_COUNT];
+  Uint32 comb_positions[__pyx_e_5mpfmc_4core_5audio_3dsp_DSP_REVERB_COMB_COUNT];
+  float comb_filter_stores[__pyx_e_5mpfmc_4core_5audio_3dsp_DSP_REVERB_COMB_COUNT];
+  float *allpass_buffers[__pyx_e_5mpfmc_4core_5audio_3dsp_DSP_REVERB_ALLPASS_COUNT];
+  Uint32 allpass_lengths[__pyx_e_5mpfmc_4core_5audio_3dsp_DSP_REVERB_ALLPASS_COUNT];
+  Uint32 allpass_positions[__pyx_e_5mpfmc_4core_5audio_3dsp_DSP_REVERB_ALLPASS_COUNT];
+  float feedback;
+  float damping;
+  float wet;
+  float dry;
+};
+
+/* "mpfmc/core/audio/dsp.pxd":57
+ *     float dry
+ * 
+ * ctypedef struct DspInsert:             # <<<<<<<<<<<<<<
+ *     DspInsertType type
+ *     BiquadSettings biquad
+ */
+struct __pyx_t_5mpfmc_4core_5audio_3dsp_DspInsert {
+  enum __pyx_t_5mpfmc_4core_5audio_3dsp_DspInsertType type;
+  __pyx_t_5mpfmc_4core_5audio_3dsp_BiquadSettings biquad;
+  __pyx_t_5mpfmc_4core_5audio_3dsp_LimiterSettings limiter;
+  __pyx_t_5mpfmc_4core_5audio_3dsp_ReverbSettings reverb;
+};
+
+/* "mpfmc/core/audio/dsp.pxd":63
+ *     ReverbSettings reverb
+ * 
+ * ctypedef struct DspChain:             # <<<<<<<<<<<<<<
+ *     int insert_count
+ *     DspInsert inserts[DSP_MAX_INSERTS]
+ */
+struct __pyx_t_5mpfmc_4core_5audio_3dsp_DspChain {
+  int insert_count;
+  __pyx_t_5mpfmc_4core_5audio_3dsp_DspInsert inserts[__pyx_e_5mpfmc_4core_5audio_3dsp_DSP_MAX_INSERTS];
+  Uint32 tail_frames;
+  Uint32 tail_frames_remaining;
+};
+struct __pyx_t_5mpfmc_4core_5audio_13perf_counters_PerfRingBuffer;
+typedef struct __pyx_t_5mpfmc_4core_5audio_13perf_counters_PerfRingBuffer __pyx_t_5mpfmc_4core_5audio_13perf_counters_PerfRingBuffer;
+struct __pyx_t_5mpfmc_4core_5audio_13perf_counters_AudioPerfCounters;
+typedef struct __pyx_t_5mpfmc_4core_5audio_13perf_counters_AudioPerfCounters __pyx_t_5mpfmc_4core_5audio_13perf_counters_AudioPerfCounters;
+
+/* "mpfmc/core/audio/perf_counters.pxd":14
+ * # ---------------------------------------------------------------------------
+ * 
+ * cdef enum:             # <<<<<<<<<<<<<<
+ *     PERF_RING_BUFFER_SIZE = 256
+ *     # Callback durations are counted in buckets of 10% of the callback deadline (the
+ */
+enum  {
+  __pyx_e_5mpfmc_4core_5audio_13perf_counters_PERF_RING_BUFFER_SIZE = 0x100,
+  __pyx_e_5mpfmc_4core_5audio_13perf_counters_PERF_HISTOGRAM_BUCKETS = 11
+};
+
+/* "mpfmc/core/audio/perf_counters.pxd":20
+ *     PERF_HISTOGRAM_BUCKETS = 11
+ * 
+ * ctypedef struct PerfRingBuffer:             # <<<<<<<<<<<<<<
+ *     # The most recent values (position is the index of the next value to write) along with
+ *     # the number, total and maximum of all the values recorded since the last reset
+ */
+struct __pyx_t_5mpfmc_4core_5audio_13perf_counters_PerfRingBuffer {
+  Uint32 values[__pyx_e_5mpfmc_4core_5audio_13perf_counters_PERF_RING_BUFFER_SIZE];
+  Uint32 position;
+  Uint64 count;
+  Uint64 total;
+  Uint32 maximum;
+};
+
+/* "mpfmc/core/audio/perf_counters.pxd":29
+ *     Uint32 maximum
+ * 
+ * ctypedef struct AudioPerfCounters:             # <<<<<<<<<<<<<<
+ *     Uint64 frequency
+ *     Uint32 deadline
+ */
+struct __pyx_t_5mpfmc_4core_5audio_13perf_counters_AudioPerfCounters {
+  Uint64 frequency;
+  Uint32 deadline;
+  Uint64 deadline_overruns;
+  Uint64 callback_histogram[__pyx_e_5mpfmc_4core_5audio_13perf_counters_PERF_HISTOGRAM_BUCKETS];
+  __pyx_t_5mpfmc_4core_5audio_13perf_counters_PerfRingBuffer callback_time;
+  __pyx_t_5mpfmc_4core_5audio_13perf_counters_PerfRingBuffer active_sound_players;
+  __pyx_t_5mpfmc_4core_5audio_13perf_counters_PerfRingBuffer lock_wait_time;
+};
 struct __pyx_t_5mpfmc_4core_5audio_5track_TrackState;
 typedef struct __pyx_t_5mpfmc_4core_5audio_5track_TrackState __pyx_t_5mpfmc_4core_5audio_5track_TrackState;
 
-/* "mpfmc/core/audio/track.pxd":10
+/* "mpfmc/core/audio/track.pxd":12
  * 
  * # The number of control points per audio buffer (sets control rate for ducking)
  * cdef enum:             # <<<<<<<<<<<<<<
@@ -776,7 +964,7 @@ enum  {
   __pyx_e_5mpfmc_4core_5audio_5track_CONTROL_POINTS_PER_BUFFER = 8
 };
 
-/* "mpfmc/core/audio/track.pxd":13
+/* "mpfmc/core/audio/track.pxd":15
  *     CONTROL_POINTS_PER_BUFFER = 8
  * 
  * cdef enum:             # <<<<<<<<<<<<<<
@@ -787,18 +975,18 @@ enum  {
   __pyx_e_5mpfmc_4core_5audio_5track_MAX_SIMULTANEOUS_SOUNDS_DEFAULT = 8
 };
 
-/* "mpfmc/core/audio/track.pxd":16
+/* "mpfmc/core/audio/track.pxd":18
  *     MAX_SIMULTANEOUS_SOUNDS_DEFAULT = 8
  * 
  * cdef enum:             # <<<<<<<<<<<<<<
- *     MAX_SIMULTANEOUS_SOUNDS_LIMIT = 32
+ *     MAX_SIMULTANEOUS_SOUNDS_LIMIT = 64
  * 
  */
 enum  {
-  __pyx_e_5mpfmc_4core_5audio_5track_MAX_SIMULTANEOUS_SOUNDS_LIMIT = 32
+  __pyx_e_5mpfmc_4core_5audio_5track_MAX_SIMULTANEOUS_SOUNDS_LIMIT = 64
 };
 
-/* "mpfmc/core/audio/track.pxd":20
+/* "mpfmc/core/audio/track.pxd":22
  * 
  * 
  * cdef enum TrackStatus:             # <<<<<<<<<<<<<<
@@ -813,7 +1001,7 @@ enum __pyx_t_5mpfmc_4core_5audio_5track_TrackStatus {
   __pyx_e_5mpfmc_4core_5audio_5track_track_status_paused = 4
 };
 
-/* "mpfmc/core/audio/track.pxd":27
+/* "mpfmc/core/audio/track.pxd":29
  *     track_status_paused = 4
  * 
  * ctypedef struct TrackState:             # <<<<<<<<<<<<<<
@@ -835,12 +1023,19 @@ struct __pyx_t_5mpfmc_4core_5audio_5track_TrackState {
   Uint32 fade_steps_remaining;
   int buffer_size;
   Uint8 *buffer;
+  Sint32 *mix_buffer;
+  Sint32 mix_gain;
+  float *float_buffer;
+  __pyx_t_5mpfmc_4core_5audio_3dsp_DspChain *inserts;
   GSList *notification_messages;
   int ducking_is_active;
   GArray *ducking_control_points;
+  __pyx_t_5mpfmc_4core_5audio_13perf_counters_PerfRingBuffer mix_time;
+  Uint32 active_sound_players;
+  Uint64 streaming_underruns;
 };
 
-/* "mpfmc/core/audio/track.pxd":51
+/* "mpfmc/core/audio/track.pxd":60
  * #    Track base class
  * # ---------------------------------------------------------------------------
  * cdef class Track:             # <<<<<<<<<<<<<<
@@ -858,6 +1053,7 @@ struct __pyx_obj_5mpfmc_4core_5audio_5track_Track {
   PyObject *mc;
   SDL_AudioDeviceID device_id;
   PyObject *log;
+  PyObject *_inserts;
   __pyx_t_5mpfmc_4core_5audio_5track_TrackState *state;
 };
 
@@ -865,7 +1061,9 @@ struct __pyx_obj_5mpfmc_4core_5audio_5track_Track {
 
 struct __pyx_vtabstruct_5mpfmc_4core_5audio_5track_Track {
   __pyx_t_5mpfmc_4core_5audio_5track_TrackState *(*get_state)(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *);
+  GSList *(*take_notification_messages)(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *);
   void (*mix_track_to_output)(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *, __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData *, Uint8 *, Uint32);
+  void (*mix_track_tail_to_output)(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *, __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData *, Uint32);
 };
 static struct __pyx_vtabstruct_5mpfmc_4core_5audio_5track_Track *__pyx_vtabptr_5mpfmc_4core_5audio_5track_Track;
 
@@ -1031,6 +1229,9 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
         __Pyx__ArgTypeTest(obj, type, name, exact))
 static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact);
 
+/* dict_getitem_default.proto */
+static PyObject* __Pyx_PyDict_GetItemDefault(PyObject* d, PyObject* key, PyObject* default_value);
+
 /* PySequenceContains.proto */
 static CYTHON_INLINE int __Pyx_PySequence_ContainsTF(PyObject* item, PyObject* seq, int eq) {
     int result = PySequence_Contains(seq, item);
@@ -1050,6 +1251,94 @@ static CYTHON_INLINE int __Pyx_PyList_Extend(PyObject* L, PyObject* v) {
 #endif
 }
 
+/* PyFloatBinop.proto */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyFloat_EqObjC(PyObject *op1, PyObject *op2, double floatval, int inplace);
+#else
+#define __Pyx_PyFloat_EqObjC(op1, op2, floatval, inplace)\
+    PyObject_RichCompare(op1, op2, Py_EQ)
+    #endif
+
+/* PyThreadStateGet.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
+#define __Pyx_PyThreadState_assign  __pyx_tstate = __Pyx_PyThreadState_Current;
+#define __Pyx_PyErr_Occurred()  __pyx_tstate->curexc_type
+#else
+#define __Pyx_PyThreadState_declare
+#define __Pyx_PyThreadState_assign
+#define __Pyx_PyErr_Occurred()  PyErr_Occurred()
+#endif
+
+/* PyErrFetchRestore.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)    __Pyx_ErrFetchInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  __Pyx_ErrRestoreInState(__pyx_tstate, type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)    __Pyx_ErrFetchInState(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_PyErr_SetNone(exc) (Py_INCREF(exc), __Pyx_ErrRestore((exc), NULL, NULL))
+#else
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#endif
+#else
+#define __Pyx_PyErr_Clear() PyErr_Clear()
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestoreInState(tstate, type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchInState(tstate, type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
+#endif
+
+/* WriteUnraisableException.proto */
+static void __Pyx_WriteUnraisable(const char *name, int clineno,
+                                  int lineno, const char *filename,
+                                  int full_traceback, int nogil);
+
+/* ListCompAppend.proto */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
+static CYTHON_INLINE int __Pyx_ListComp_Append(PyObject* list, PyObject* x) {
+    PyListObject* L = (PyListObject*) list;
+    Py_ssize_t len = Py_SIZE(list);
+    if (likely(L->allocated > len)) {
+        Py_INCREF(x);
+        PyList_SET_ITEM(list, len, x);
+        Py_SIZE(list) = len+1;
+        return 0;
+    }
+    return PyList_Append(list, x);
+}
+#else
+#define __Pyx_ListComp_Append(L,x) PyList_Append(L,x)
+#endif
+
+/* GetItemInt.proto */
+#define __Pyx_GetItemInt(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Fast(o, (Py_ssize_t)i, is_list, wraparound, boundscheck) :\
+    (is_list ? (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL) :\
+               __Pyx_GetItemInt_Generic(o, to_py_func(i))))
+#define __Pyx_GetItemInt_List(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_List_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+#define __Pyx_GetItemInt_Tuple(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Tuple_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "tuple index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j);
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
+                                                     int is_list, int wraparound, int boundscheck);
+
 /* GetVTable.proto */
 static void* __Pyx_GetVtable(PyObject *dict);
 
@@ -1125,42 +1414,6 @@ static PyObject *__Pyx_Py3MetaclassPrepare(PyObject *metaclass, PyObject *bases,
 static PyObject *__Pyx_Py3ClassCreate(PyObject *metaclass, PyObject *name, PyObject *bases, PyObject *dict,
                                       PyObject *mkw, int calculate_metaclass, int allow_py2_metaclass);
 
-/* PyThreadStateGet.proto */
-#if CYTHON_FAST_THREAD_STATE
-#define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
-#define __Pyx_PyThreadState_assign  __pyx_tstate = __Pyx_PyThreadState_Current;
-#define __Pyx_PyErr_Occurred()  __pyx_tstate->curexc_type
-#else
-#define __Pyx_PyThreadState_declare
-#define __Pyx_PyThreadState_assign
-#define __Pyx_PyErr_Occurred()  PyErr_Occurred()
-#endif
-
-/* PyErrFetchRestore.proto */
-#if CYTHON_FAST_THREAD_STATE
-#define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
-#define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
-#define __Pyx_ErrFetchWithState(type, value, tb)    __Pyx_ErrFetchInState(PyThreadState_GET(), type, value, tb)
-#define __Pyx_ErrRestore(type, value, tb)  __Pyx_ErrRestoreInState(__pyx_tstate, type, value, tb)
-#define __Pyx_ErrFetch(type, value, tb)    __Pyx_ErrFetchInState(__pyx_tstate, type, value, tb)
-static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
-static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
-#if CYTHON_COMPILING_IN_CPYTHON
-#define __Pyx_PyErr_SetNone(exc) (Py_INCREF(exc), __Pyx_ErrRestore((exc), NULL, NULL))
-#else
-#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
-#endif
-#else
-#define __Pyx_PyErr_Clear() PyErr_Clear()
-#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
-#define __Pyx_ErrRestoreWithState(type, value, tb)  PyErr_Restore(type, value, tb)
-#define __Pyx_ErrFetchWithState(type, value, tb)  PyErr_Fetch(type, value, tb)
-#define __Pyx_ErrRestoreInState(tstate, type, value, tb)  PyErr_Restore(type, value, tb)
-#define __Pyx_ErrFetchInState(tstate, type, value, tb)  PyErr_Fetch(type, value, tb)
-#define __Pyx_ErrRestore(type, value, tb)  PyErr_Restore(type, value, tb)
-#define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
-#endif
-
 /* CLineInTraceback.proto */
 #ifdef CYTHON_CLINE_IN_TRACEBACK
 #define __Pyx_CLineForTraceback(tstate, c_line)  (((CYTHON_CLINE_IN_TRACEBACK)) ? c_line : 0)
@@ -1188,14 +1441,26 @@ static void __Pyx_AddTraceback(const char *funcname, int c_line,
                                int py_line, const char *filename);
 
 /* CIntToPy.proto */
-static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
 
-/* CIntFromPy.proto */
-static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_Uint32(Uint32 value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_Uint64(Uint64 value);
 
 /* CIntFromPy.proto */
 static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
 
+/* CIntFromPy.proto */
+static CYTHON_INLINE Uint32 __Pyx_PyInt_As_Uint32(PyObject *);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
+
 /* FastTypeChecks.proto */
 #if CYTHON_COMPILING_IN_CPYTHON
 #define __Pyx_TypeCheck(obj, type) __Pyx_IsSubtype(Py_TYPE(obj), (PyTypeObject *)type)
@@ -1234,6 +1499,15 @@ static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
 
 /* Module declarations from 'mpfmc.core.audio.gstreamer' */
 
+/* Module declarations from 'mpfmc.core.audio.dsp' */
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_3dsp_process_biquad(__pyx_t_5mpfmc_4core_5audio_3dsp_BiquadSettings *, float *, Uint32, int); /*proto*/
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_3dsp_process_limiter(__pyx_t_5mpfmc_4core_5audio_3dsp_LimiterSettings *, float *, Uint32, int); /*proto*/
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_3dsp_process_reverb(__pyx_t_5mpfmc_4core_5audio_3dsp_ReverbSettings *, float *, Uint32, int); /*proto*/
+
+/* Module declarations from 'mpfmc.core.audio.perf_counters' */
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_13perf_counters_perf_ring_buffer_record(__pyx_t_5mpfmc_4core_5audio_13perf_counters_PerfRingBuffer *, Uint32); /*proto*/
+static CYTHON_INLINE Uint32 __pyx_f_5mpfmc_4core_5audio_13perf_counters_perf_elapsed_us(__pyx_t_5mpfmc_4core_5audio_13perf_counters_AudioPerfCounters *, Uint64); /*proto*/
+
 /* Module declarations from 'mpfmc.core.audio.track' */
 static PyTypeObject *__pyx_ptype_5mpfmc_4core_5audio_5track_Track = 0;
 
@@ -1244,28 +1518,45 @@ int __pyx_module_is_main_mpfmc__core__audio__playlist_controller = 0;
 
 /* Implementation of 'mpfmc.core.audio.playlist_controller' */
 static PyObject *__pyx_builtin_property;
+static PyObject *__pyx_builtin_range;
+static PyObject *__pyx_builtin_sum;
+static const char __pyx_k_dt[] = "dt";
 static const char __pyx_k_mc[] = "mc";
 static const char __pyx_k_doc[] = "__doc__";
+static const char __pyx_k_end[] = "end";
+static const char __pyx_k_get[] = "get";
 static const char __pyx_k_log[] = "log";
+static const char __pyx_k_max[] = "max";
+static const char __pyx_k_sum[] = "sum";
 static const char __pyx_k_init[] = "__init__";
+static const char __pyx_k_last[] = "last";
+static const char __pyx_k_load[] = "load";
 static const char __pyx_k_loop[] = "loop";
 static const char __pyx_k_main[] = "__main__";
+static const char __pyx_k_mean[] = "mean";
 static const char __pyx_k_name[] = "name";
 static const char __pyx_k_play[] = "play";
 static const char __pyx_k_repr[] = "__repr__";
 static const char __pyx_k_self[] = "self";
 static const char __pyx_k_stop[] = "stop";
 static const char __pyx_k_test[] = "__test__";
+static const char __pyx_k_clock[] = "clock";
+static const char __pyx_k_count[] = "count";
 static const char __pyx_k_debug[] = "debug";
+static const char __pyx_k_delay[] = "delay";
 static const char __pyx_k_error[] = "error";
 static const char __pyx_k_event[] = "event";
+static const char __pyx_k_loops[] = "loops";
 static const char __pyx_k_lower[] = "lower";
+static const char __pyx_k_range[] = "range";
 static const char __pyx_k_sound[] = "sound";
 static const char __pyx_k_track[] = "track";
+static const char __pyx_k_cancel[] = "cancel";
 static const char __pyx_k_events[] = "events";
 static const char __pyx_k_format[] = "format";
 static const char __pyx_k_import[] = "__import__";
 static const char __pyx_k_kwargs[] = "kwargs";
+static const char __pyx_k_loaded[] = "loaded";
 static const char __pyx_k_module[] = "__module__";
 static const char __pyx_k_repeat[] = "repeat";
 static const char __pyx_k_sounds[] = "sounds";
@@ -1275,32 +1566,46 @@ static const char __pyx_k_advance[] = "advance";
 static const char __pyx_k_context[] = "context";
 static const char __pyx_k_dealloc[] = "__dealloc__";
 static const char __pyx_k_fade_in[] = "fade_in";
+static const char __pyx_k_gapless[] = "gapless";
 static const char __pyx_k_is_busy[] = "_is_busy";
 static const char __pyx_k_logging[] = "logging";
 static const char __pyx_k_partial[] = "partial";
 static const char __pyx_k_prepare[] = "__prepare__";
 static const char __pyx_k_request[] = "request";
 static const char __pyx_k_track_2[] = "_track";
+static const char __pyx_k_callback[] = "callback";
+static const char __pyx_k_duration[] = "duration";
 static const char __pyx_k_fade_out[] = "fade_out";
 static const char __pyx_k_keywords[] = "keywords";
 static const char __pyx_k_playlist[] = "playlist";
 static const char __pyx_k_property[] = "property";
 static const char __pyx_k_qualname[] = "__qualname__";
+static const char __pyx_k_settings[] = "settings";
+static const char __pyx_k_start_at[] = "start_at";
+static const char __pyx_k_container[] = "container";
 static const char __pyx_k_functools[] = "functools";
+static const char __pyx_k_gapless_2[] = "_gapless";
 static const char __pyx_k_getLogger[] = "getLogger";
 static const char __pyx_k_metaclass[] = "__metaclass__";
 static const char __pyx_k_playlists[] = "playlists";
 static const char __pyx_k_play_sound[] = "play_sound";
 static const char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
+static const char __pyx_k_recent_p95[] = "recent_p95";
 static const char __pyx_k_set_repeat[] = "set_repeat";
 static const char __pyx_k_sound_name[] = "sound_name";
 static const char __pyx_k_add_handler[] = "add_handler";
+static const char __pyx_k_recent_mean[] = "recent_mean";
+static const char __pyx_k_start_after[] = "start_after";
+static const char __pyx_k_start_sample[] = "start_sample";
 static const char __pyx_k_clear_context[] = "clear_context";
+static const char __pyx_k_schedule_once[] = "schedule_once";
 static const char __pyx_k_crossfade_time[] = "crossfade_time";
+static const char __pyx_k_has_next_sound[] = "_has_next_sound";
 static const char __pyx_k_max_queue_time[] = "max_queue_time";
 static const char __pyx_k_sound_instance[] = "sound_instance";
+static const char __pyx_k_about_to_finish[] = "about_to_finish";
 static const char __pyx_k_end_of_playlist[] = "end_of_playlist";
-static const char __pyx_k_next_sound_name[] = "next_sound_name";
+static const char __pyx_k_next_sound_name[] = "_next_sound_name";
 static const char __pyx_k_pending_request[] = "_pending_request";
 static const char __pyx_k_player_settings[] = "player_settings";
 static const char __pyx_k_stop_all_sounds[] = "stop_all_sounds";
@@ -1308,46 +1613,77 @@ static const char __pyx_k_PlaylistInstance[] = "PlaylistInstance";
 static const char __pyx_k_crossfade_time_2[] = "_crossfade_time";
 static const char __pyx_k_current_playlist[] = "_current_playlist";
 static const char __pyx_k_fade_out_seconds[] = "fade_out_seconds";
+static const char __pyx_k_decode_ahead_time[] = "decode_ahead_time";
+static const char __pyx_k_next_sound_name_2[] = "next_sound_name";
 static const char __pyx_k_playlist_instance[] = "playlist_instance";
 static const char __pyx_k_Clearing_context_s[] = "Clearing context %s";
 static const char __pyx_k_PlaylistController[] = "PlaylistController";
 static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
 static const char __pyx_k_events_when_played[] = "events_when_played";
+static const char __pyx_k_has_prepared_sound[] = "has_prepared_sound";
+static const char __pyx_k_prepare_next_sound[] = "_prepare_next_sound";
+static const char __pyx_k_start_after_marker[] = "start_after_marker";
+static const char __pyx_k_decode_ahead_time_2[] = "_decode_ahead_time";
 static const char __pyx_k_events_when_looping[] = "events_when_looping";
 static const char __pyx_k_events_when_stopped[] = "events_when_stopped";
 static const char __pyx_k_get_next_sound_name[] = "get_next_sound_name";
 static const char __pyx_k_has_pending_request[] = "has_pending_request";
 static const char __pyx_k_play_playlist_sound[] = "_play_playlist_sound";
+static const char __pyx_k_prepared_sound_name[] = "_prepared_sound_name";
+static const char __pyx_k_stop_playlist_sound[] = "_stop_playlist_sound";
 static const char __pyx_k_stop_sound_instance[] = "stop_sound_instance";
 static const char __pyx_k_PlaylistController_2[] = "<PlaylistController.{}>";
 static const char __pyx_k_about_to_finish_time[] = "about_to_finish_time";
 static const char __pyx_k_post_mc_native_event[] = "post_mc_native_event";
+static const char __pyx_k_cancel_prepared_sound[] = "_cancel_prepared_sound";
 static const char __pyx_k_fading_sound_instance[] = "fading_sound_instance";
+static const char __pyx_k_get_next_sound_name_2[] = "_get_next_sound_name";
+static const char __pyx_k_playlist_sound_played[] = "{}_playlist_sound_played";
 static const char __pyx_k_current_sound_instance[] = "current_sound_instance";
 static const char __pyx_k_playlist_sound_stopped[] = "{}_playlist_sound_stopped";
+static const char __pyx_k_stop_sound_instance_at[] = "stop_sound_instance_at";
 static const char __pyx_k_PlaylistController_name[] = "PlaylistController.name";
 static const char __pyx_k_PlaylistController_play[] = "PlaylistController.play";
 static const char __pyx_k_PlaylistController_stop[] = "PlaylistController.stop";
+static const char __pyx_k_on_current_sound_loaded[] = "_on_current_sound_loaded";
+static const char __pyx_k_prepared_sound_instance[] = "_prepared_sound_instance";
 static const char __pyx_k_PlaylistController_class[] = "\n    PlaylistController class\n    ";
 static const char __pyx_k_PlaylistController_track[] = "PlaylistController.track";
+static const char __pyx_k_on_sound_instance_played[] = "_on_sound_instance_played";
+static const char __pyx_k_prepare_next_sound_event[] = "_prepare_next_sound_event";
 static const char __pyx_k_PlaylistController___init[] = "PlaylistController.__init__";
 static const char __pyx_k_PlaylistController___repr[] = "PlaylistController.__repr__";
 static const char __pyx_k_events_when_sound_changed[] = "events_when_sound_changed";
 static const char __pyx_k_events_when_sound_stopped[] = "events_when_sound_stopped";
 static const char __pyx_k_on_sound_instance_stopped[] = "_on_sound_instance_stopped";
 static const char __pyx_k_PlaylistController_advance[] = "PlaylistController.advance";
+static const char __pyx_k_PlaylistController_gapless[] = "PlaylistController.gapless";
 static const char __pyx_k_PlaylistController__is_busy[] = "PlaylistController._is_busy";
 static const char __pyx_k_events_when_about_to_finish[] = "events_when_about_to_finish";
+static const char __pyx_k_get_playlist_sound_settings[] = "_get_playlist_sound_settings";
 static const char __pyx_k_playlists_by_sound_instance[] = "_playlists_by_sound_instance";
+static const char __pyx_k_schedule_prepare_next_sound[] = "_schedule_prepare_next_sound";
 static const char __pyx_k_Created_PlaylistController_s[] = "Created PlaylistController %s: ";
 static const char __pyx_k_PlaylistController___dealloc[] = "PlaylistController.__dealloc__";
 static const char __pyx_k_PlaylistController_set_repeat[] = "PlaylistController.set_repeat";
 static const char __pyx_k_get_sound_players_in_use_count[] = "get_sound_players_in_use_count";
 static const char __pyx_k_playlist_sound_about_to_finish[] = "{}_playlist_sound_about_to_finish";
+static const char __pyx_k_PlaylistController_decode_ahead[] = "PlaylistController.decode_ahead_time";
+static const char __pyx_k_PlaylistController_has_prepared[] = "PlaylistController.has_prepared_sound";
+static const char __pyx_k_Preparing_sound_s_of_playlist_s[] = "Preparing sound '%s' of playlist '%s' for playback.";
 static const char __pyx_k_on_sound_instance_about_to_fini[] = "_on_sound_instance_about_to_finish";
 static const char __pyx_k_play_Playlist_track_is_too_busy[] = "play - Playlist track is too busy. Delaying play playlist call.";
-static const char __pyx_k_PlaylistController__on_sound_ins[] = "PlaylistController._on_sound_instance_stopped";
+static const char __pyx_k_prepare_next_sound_when_not_bus[] = "_prepare_next_sound_when_not_busy";
+static const char __pyx_k_PlaylistController__cancel_prepa[] = "PlaylistController._cancel_prepared_sound";
+static const char __pyx_k_PlaylistController__get_next_sou[] = "PlaylistController._get_next_sound_name";
+static const char __pyx_k_PlaylistController__get_playlist[] = "PlaylistController._get_playlist_sound_settings";
+static const char __pyx_k_PlaylistController__has_next_sou[] = "PlaylistController._has_next_sound";
+static const char __pyx_k_PlaylistController__on_current_s[] = "PlaylistController._on_current_sound_loaded";
+static const char __pyx_k_PlaylistController__on_sound_ins[] = "PlaylistController._on_sound_instance_played";
 static const char __pyx_k_PlaylistController__play_playlis[] = "PlaylistController._play_playlist_sound";
+static const char __pyx_k_PlaylistController__prepare_next[] = "PlaylistController._prepare_next_sound";
+static const char __pyx_k_PlaylistController__schedule_pre[] = "PlaylistController._schedule_prepare_next_sound";
+static const char __pyx_k_PlaylistController__stop_playlis[] = "PlaylistController._stop_playlist_sound";
 static const char __pyx_k_PlaylistController_clear_context[] = "PlaylistController.clear_context";
 static const char __pyx_k_PlaylistController_crossfade_tim[] = "PlaylistController.crossfade_time";
 static const char __pyx_k_PlaylistController_has_pending_r[] = "PlaylistController.has_pending_request";
@@ -1363,8 +1699,9 @@ static const char __pyx_k_set_repeat_No_playlist_is_curren[] = "set_repeat - No
 static const char __pyx_k_set_repeat_Setting_repeat_for_cu[] = "set_repeat - Setting repeat for currently playlist to {}.";
 static const char __pyx_k_stop_No_playlist_is_currently_pl[] = "stop - No playlist is currently playing. Could not stop current playlist.";
 static const char __pyx_k_stop_Stopping_the_current_playli[] = "stop - Stopping the current playlist ('%s').";
-static const char __pyx_k_PlaylistController__on_sound_ins_2[] = "PlaylistController._on_sound_instance_about_to_finish";
-static const char __pyx_k_mpfmc_core_audio_playlist_contro_2[] = "mpfmc\\core\\audio\\playlist_controller.pyx";
+static const char __pyx_k_PlaylistController__on_sound_ins_2[] = "PlaylistController._on_sound_instance_stopped";
+static const char __pyx_k_PlaylistController__on_sound_ins_3[] = "PlaylistController._on_sound_instance_about_to_finish";
+static const char __pyx_k_mpfmc_core_audio_playlist_contro_2[] = "mpfmc/core/audio/playlist_controller.pyx";
 static PyObject *__pyx_kp_u_Clearing_context_s;
 static PyObject *__pyx_kp_u_Created_PlaylistController_s;
 static PyObject *__pyx_n_s_PlaylistController;
@@ -1373,15 +1710,27 @@ static PyObject *__pyx_kp_u_PlaylistController_2;
 static PyObject *__pyx_n_s_PlaylistController___dealloc;
 static PyObject *__pyx_n_s_PlaylistController___init;
 static PyObject *__pyx_n_s_PlaylistController___repr;
+static PyObject *__pyx_n_s_PlaylistController__cancel_prepa;
+static PyObject *__pyx_n_s_PlaylistController__get_next_sou;
+static PyObject *__pyx_n_s_PlaylistController__get_playlist;
+static PyObject *__pyx_n_s_PlaylistController__has_next_sou;
 static PyObject *__pyx_n_s_PlaylistController__is_busy;
+static PyObject *__pyx_n_s_PlaylistController__on_current_s;
 static PyObject *__pyx_n_s_PlaylistController__on_sound_ins;
 static PyObject *__pyx_n_s_PlaylistController__on_sound_ins_2;
+static PyObject *__pyx_n_s_PlaylistController__on_sound_ins_3;
 static PyObject *__pyx_n_s_PlaylistController__play_playlis;
+static PyObject *__pyx_n_s_PlaylistController__prepare_next;
+static PyObject *__pyx_n_s_PlaylistController__schedule_pre;
+static PyObject *__pyx_n_s_PlaylistController__stop_playlis;
 static PyObject *__pyx_n_s_PlaylistController_advance;
 static PyObject *__pyx_kp_s_PlaylistController_class;
 static PyObject *__pyx_n_s_PlaylistController_clear_context;
 static PyObject *__pyx_n_s_PlaylistController_crossfade_tim;
+static PyObject *__pyx_n_s_PlaylistController_decode_ahead;
+static PyObject *__pyx_n_s_PlaylistController_gapless;
 static PyObject *__pyx_n_s_PlaylistController_has_pending_r;
+static PyObject *__pyx_n_s_PlaylistController_has_prepared;
 static PyObject *__pyx_n_s_PlaylistController_name;
 static PyObject *__pyx_n_s_PlaylistController_play;
 static PyObject *__pyx_kp_u_PlaylistController_s_track_Could;
@@ -1390,23 +1739,37 @@ static PyObject *__pyx_n_s_PlaylistController_stop;
 static PyObject *__pyx_n_s_PlaylistController_stop_all_soun;
 static PyObject *__pyx_n_s_PlaylistController_track;
 static PyObject *__pyx_n_s_PlaylistInstance;
+static PyObject *__pyx_kp_u_Preparing_sound_s_of_playlist_s;
+static PyObject *__pyx_n_u_about_to_finish;
 static PyObject *__pyx_n_u_about_to_finish_time;
 static PyObject *__pyx_n_s_add_handler;
 static PyObject *__pyx_n_s_advance;
 static PyObject *__pyx_kp_u_advance_Advancing_the_current_pl;
 static PyObject *__pyx_kp_u_advance_No_playlist_is_currently;
 static PyObject *__pyx_kp_u_advance_Playlist_track_is_too_bu;
+static PyObject *__pyx_n_s_callback;
+static PyObject *__pyx_n_s_cancel;
+static PyObject *__pyx_n_s_cancel_prepared_sound;
 static PyObject *__pyx_n_s_clear_context;
 static PyObject *__pyx_n_s_cline_in_traceback;
+static PyObject *__pyx_n_s_clock;
+static PyObject *__pyx_n_s_container;
 static PyObject *__pyx_n_s_context;
 static PyObject *__pyx_n_u_context;
+static PyObject *__pyx_n_u_count;
 static PyObject *__pyx_n_s_crossfade_time;
 static PyObject *__pyx_n_s_crossfade_time_2;
 static PyObject *__pyx_n_s_current_playlist;
 static PyObject *__pyx_n_s_current_sound_instance;
 static PyObject *__pyx_n_s_dealloc;
 static PyObject *__pyx_n_s_debug;
+static PyObject *__pyx_n_s_decode_ahead_time;
+static PyObject *__pyx_n_s_decode_ahead_time_2;
+static PyObject *__pyx_n_s_delay;
 static PyObject *__pyx_n_s_doc;
+static PyObject *__pyx_n_s_dt;
+static PyObject *__pyx_n_s_duration;
+static PyObject *__pyx_n_u_end;
 static PyObject *__pyx_n_s_end_of_playlist;
 static PyObject *__pyx_n_s_error;
 static PyObject *__pyx_n_s_event;
@@ -1415,6 +1778,7 @@ static PyObject *__pyx_n_s_events_when_about_to_finish;
 static PyObject *__pyx_n_u_events_when_about_to_finish;
 static PyObject *__pyx_n_s_events_when_looping;
 static PyObject *__pyx_n_s_events_when_played;
+static PyObject *__pyx_n_u_events_when_played;
 static PyObject *__pyx_n_s_events_when_sound_changed;
 static PyObject *__pyx_n_s_events_when_sound_stopped;
 static PyObject *__pyx_n_s_events_when_stopped;
@@ -1426,22 +1790,35 @@ static PyObject *__pyx_n_s_fade_out_seconds;
 static PyObject *__pyx_n_s_fading_sound_instance;
 static PyObject *__pyx_n_s_format;
 static PyObject *__pyx_n_s_functools;
+static PyObject *__pyx_n_s_gapless;
+static PyObject *__pyx_n_s_gapless_2;
+static PyObject *__pyx_n_s_get;
 static PyObject *__pyx_n_s_getLogger;
 static PyObject *__pyx_n_s_get_next_sound_name;
+static PyObject *__pyx_n_s_get_next_sound_name_2;
+static PyObject *__pyx_n_s_get_playlist_sound_settings;
 static PyObject *__pyx_n_s_get_sound_players_in_use_count;
+static PyObject *__pyx_n_s_has_next_sound;
 static PyObject *__pyx_n_s_has_pending_request;
+static PyObject *__pyx_n_s_has_prepared_sound;
 static PyObject *__pyx_n_s_import;
 static PyObject *__pyx_n_s_init;
 static PyObject *__pyx_n_s_is_busy;
 static PyObject *__pyx_n_s_keywords;
 static PyObject *__pyx_n_s_kwargs;
+static PyObject *__pyx_n_u_last;
+static PyObject *__pyx_n_s_load;
+static PyObject *__pyx_n_s_loaded;
 static PyObject *__pyx_n_s_log;
 static PyObject *__pyx_n_s_logging;
 static PyObject *__pyx_n_s_loop;
+static PyObject *__pyx_n_s_loops;
 static PyObject *__pyx_n_s_lower;
 static PyObject *__pyx_n_s_main;
+static PyObject *__pyx_n_u_max;
 static PyObject *__pyx_n_u_max_queue_time;
 static PyObject *__pyx_n_s_mc;
+static PyObject *__pyx_n_u_mean;
 static PyObject *__pyx_n_s_metaclass;
 static PyObject *__pyx_n_s_module;
 static PyObject *__pyx_n_s_mpfmc_config_collections_playlis;
@@ -1449,7 +1826,10 @@ static PyObject *__pyx_n_s_mpfmc_core_audio_playlist_contro;
 static PyObject *__pyx_kp_s_mpfmc_core_audio_playlist_contro_2;
 static PyObject *__pyx_n_s_name;
 static PyObject *__pyx_n_s_next_sound_name;
+static PyObject *__pyx_n_s_next_sound_name_2;
+static PyObject *__pyx_n_s_on_current_sound_loaded;
 static PyObject *__pyx_n_s_on_sound_instance_about_to_fini;
+static PyObject *__pyx_n_s_on_sound_instance_played;
 static PyObject *__pyx_n_s_on_sound_instance_stopped;
 static PyObject *__pyx_n_s_partial;
 static PyObject *__pyx_n_s_pending_request;
@@ -1462,52 +1842,84 @@ static PyObject *__pyx_n_s_player_settings;
 static PyObject *__pyx_n_s_playlist;
 static PyObject *__pyx_n_s_playlist_instance;
 static PyObject *__pyx_kp_u_playlist_sound_about_to_finish;
+static PyObject *__pyx_kp_u_playlist_sound_played;
 static PyObject *__pyx_kp_u_playlist_sound_stopped;
 static PyObject *__pyx_n_s_playlists;
 static PyObject *__pyx_n_s_playlists_by_sound_instance;
 static PyObject *__pyx_n_s_post_mc_native_event;
 static PyObject *__pyx_n_s_prepare;
+static PyObject *__pyx_n_s_prepare_next_sound;
+static PyObject *__pyx_n_s_prepare_next_sound_event;
+static PyObject *__pyx_n_s_prepare_next_sound_when_not_bus;
+static PyObject *__pyx_n_s_prepared_sound_instance;
+static PyObject *__pyx_n_s_prepared_sound_name;
 static PyObject *__pyx_n_s_property;
 static PyObject *__pyx_n_s_pyx_vtable;
 static PyObject *__pyx_n_s_qualname;
+static PyObject *__pyx_n_s_range;
+static PyObject *__pyx_n_u_recent_mean;
+static PyObject *__pyx_n_u_recent_p95;
 static PyObject *__pyx_n_s_repeat;
 static PyObject *__pyx_n_s_repr;
 static PyObject *__pyx_n_s_request;
+static PyObject *__pyx_n_s_schedule_once;
+static PyObject *__pyx_n_s_schedule_prepare_next_sound;
 static PyObject *__pyx_n_s_self;
 static PyObject *__pyx_n_s_set_repeat;
 static PyObject *__pyx_kp_u_set_repeat_No_playlist_is_curren;
 static PyObject *__pyx_kp_u_set_repeat_Setting_repeat_for_cu;
+static PyObject *__pyx_n_s_settings;
 static PyObject *__pyx_n_s_sound;
 static PyObject *__pyx_n_s_sound_instance;
 static PyObject *__pyx_n_s_sound_name;
 static PyObject *__pyx_n_s_sounds;
+static PyObject *__pyx_n_u_start_after;
+static PyObject *__pyx_n_u_start_after_marker;
+static PyObject *__pyx_n_s_start_at;
+static PyObject *__pyx_n_s_start_sample;
+static PyObject *__pyx_n_u_start_sample;
 static PyObject *__pyx_n_s_stop;
 static PyObject *__pyx_kp_u_stop_No_playlist_is_currently_pl;
 static PyObject *__pyx_kp_u_stop_Stopping_the_current_playli;
 static PyObject *__pyx_n_s_stop_all_sounds;
+static PyObject *__pyx_n_s_stop_playlist_sound;
 static PyObject *__pyx_n_s_stop_sound_instance;
+static PyObject *__pyx_n_s_stop_sound_instance_at;
+static PyObject *__pyx_n_s_sum;
 static PyObject *__pyx_n_s_test;
 static PyObject *__pyx_n_s_track;
 static PyObject *__pyx_n_s_track_2;
 static PyObject *__pyx_n_s_values;
 static PyObject *__pyx_n_s_volume;
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController___init__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_mc, PyObject *__pyx_v_track, float __pyx_v_crossfade_time, CYTHON_UNUSED float __pyx_v_volume); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController___init__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_mc, PyObject *__pyx_v_track, float __pyx_v_crossfade_time, CYTHON_UNUSED float __pyx_v_volume, float __pyx_v_decode_ahead_time, int __pyx_v_gapless); /* proto */
 static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_2__dealloc__(CYTHON_UNUSED PyObject *__pyx_self, CYTHON_UNUSED PyObject *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_4__repr__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_6name(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_8track(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_10crossfade_time(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_12has_pending_request(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_14stop_all_sounds(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, float __pyx_v_fade_out_seconds); /* proto */
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_16play(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_playlist, PyObject *__pyx_v_context, PyObject *__pyx_v_player_settings); /* proto */
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_18_is_busy(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_20_play_playlist_sound(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_sound_name, PyObject *__pyx_v_playlist, float __pyx_v_fade_in); /* proto */
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_22stop(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_24advance(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_26set_repeat(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_repeat); /* proto */
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_28_on_sound_instance_stopped(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_sound_instance, CYTHON_UNUSED PyObject *__pyx_v_kwargs); /* proto */
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_30_on_sound_instance_about_to_finish(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_sound_instance, CYTHON_UNUSED PyObject *__pyx_v_kwargs); /* proto */
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_32clear_context(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_context); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_12decode_ahead_time(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_14gapless(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_16has_prepared_sound(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_18has_pending_request(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_20stop_all_sounds(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, float __pyx_v_fade_out_seconds); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_22play(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_playlist, PyObject *__pyx_v_context, PyObject *__pyx_v_player_settings); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_24_is_busy(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_26_play_playlist_sound(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_sound_name, PyObject *__pyx_v_playlist, float __pyx_v_fade_in, PyObject *__pyx_v_start_sample); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_28_get_playlist_sound_settings(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_sound, PyObject *__pyx_v_playlist, float __pyx_v_fade_in); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_30_get_next_sound_name(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_32_has_next_sound(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_playlist); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_34_schedule_prepare_next_sound(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_sound_instance); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_36_on_current_sound_loaded(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_sound_instance, PyObject *__pyx_v_sound); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_38_prepare_next_sound(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_sound_instance, PyObject *__pyx_v_dt); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_40_cancel_prepared_sound(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_42stop(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_start_sample); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_44advance(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_start_sample); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_46_stop_playlist_sound(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_sound_instance, PyObject *__pyx_v_start_sample); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_48set_repeat(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_repeat); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_50_on_sound_instance_played(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_sound_instance, CYTHON_UNUSED PyObject *__pyx_v_kwargs); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_52_on_sound_instance_stopped(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_sound_instance, CYTHON_UNUSED PyObject *__pyx_v_kwargs); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_54_on_sound_instance_about_to_finish(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_sound_instance, CYTHON_UNUSED PyObject *__pyx_v_kwargs); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_56clear_context(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_context); /* proto */
 static PyObject *__pyx_float_0_0;
 static PyObject *__pyx_int_0;
 static PyObject *__pyx_int_1;
@@ -1526,17 +1938,35 @@ static PyObject *__pyx_tuple__18;
 static PyObject *__pyx_tuple__20;
 static PyObject *__pyx_tuple__22;
 static PyObject *__pyx_tuple__24;
-static PyObject *__pyx_tuple__25;
-static PyObject *__pyx_tuple__27;
-static PyObject *__pyx_tuple__29;
+static PyObject *__pyx_tuple__26;
+static PyObject *__pyx_tuple__28;
+static PyObject *__pyx_tuple__30;
 static PyObject *__pyx_tuple__31;
 static PyObject *__pyx_tuple__33;
 static PyObject *__pyx_tuple__35;
-static PyObject *__pyx_tuple__36;
-static PyObject *__pyx_tuple__38;
+static PyObject *__pyx_tuple__37;
 static PyObject *__pyx_tuple__39;
 static PyObject *__pyx_tuple__41;
-static PyObject *__pyx_tuple__42;
+static PyObject *__pyx_tuple__43;
+static PyObject *__pyx_tuple__45;
+static PyObject *__pyx_tuple__46;
+static PyObject *__pyx_tuple__48;
+static PyObject *__pyx_tuple__49;
+static PyObject *__pyx_tuple__51;
+static PyObject *__pyx_tuple__53;
+static PyObject *__pyx_tuple__54;
+static PyObject *__pyx_tuple__56;
+static PyObject *__pyx_tuple__57;
+static PyObject *__pyx_tuple__59;
+static PyObject *__pyx_tuple__60;
+static PyObject *__pyx_tuple__62;
+static PyObject *__pyx_tuple__63;
+static PyObject *__pyx_tuple__65;
+static PyObject *__pyx_tuple__66;
+static PyObject *__pyx_tuple__68;
+static PyObject *__pyx_tuple__69;
+static PyObject *__pyx_tuple__71;
+static PyObject *__pyx_tuple__72;
 static PyObject *__pyx_codeobj__7;
 static PyObject *__pyx_codeobj__9;
 static PyObject *__pyx_codeobj__11;
@@ -1546,26 +1976,38 @@ static PyObject *__pyx_codeobj__17;
 static PyObject *__pyx_codeobj__19;
 static PyObject *__pyx_codeobj__21;
 static PyObject *__pyx_codeobj__23;
-static PyObject *__pyx_codeobj__26;
-static PyObject *__pyx_codeobj__28;
-static PyObject *__pyx_codeobj__30;
+static PyObject *__pyx_codeobj__25;
+static PyObject *__pyx_codeobj__27;
+static PyObject *__pyx_codeobj__29;
 static PyObject *__pyx_codeobj__32;
 static PyObject *__pyx_codeobj__34;
-static PyObject *__pyx_codeobj__37;
+static PyObject *__pyx_codeobj__36;
+static PyObject *__pyx_codeobj__38;
 static PyObject *__pyx_codeobj__40;
-static PyObject *__pyx_codeobj__43;
+static PyObject *__pyx_codeobj__42;
+static PyObject *__pyx_codeobj__44;
+static PyObject *__pyx_codeobj__47;
+static PyObject *__pyx_codeobj__50;
+static PyObject *__pyx_codeobj__52;
+static PyObject *__pyx_codeobj__55;
+static PyObject *__pyx_codeobj__58;
+static PyObject *__pyx_codeobj__61;
+static PyObject *__pyx_codeobj__64;
+static PyObject *__pyx_codeobj__67;
+static PyObject *__pyx_codeobj__70;
+static PyObject *__pyx_codeobj__73;
 
 /* "mpfmc/core/audio/playlist_controller.pyx":19
  *     """
  * 
- *     def __init__(self, object mc, object track, float crossfade_time=0.0, float volume=1.0):             # <<<<<<<<<<<<<<
+ *     def __init__(self, object mc, object track, float crossfade_time=0.0, float volume=1.0,             # <<<<<<<<<<<<<<
+ *                  float decode_ahead_time=0.0, bint gapless=False):
  *         """
- *         Constructor
  */
 
 /* Python wrapper */
 static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_1__init__(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController___init__[] = "PlaylistController.__init__(self, mc, track, float crossfade_time=0.0, float volume=1.0)\n\n        Constructor\n        Args:\n            mc: The media controller app\n            track: The audio track that will be managed by this playlist controller (standard track)\n            crossfade_time: The default crossfade time (secs) to use when fading between sounds\n            volume: The playlist volume (0.0 to 1.0)\n        ";
+static char __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController___init__[] = "PlaylistController.__init__(self, mc, track, float crossfade_time=0.0, float volume=1.0, float decode_ahead_time=0.0, bool gapless=False)\n\n        Constructor\n        Args:\n            mc: The media controller app\n            track: The audio track that will be managed by this playlist controller (standard track)\n            crossfade_time: The default crossfade time (secs) to use when fading between sounds\n            volume: The playlist volume (0.0 to 1.0)\n            decode_ahead_time: The time (secs) before a transition at which the next sound is\n                loaded and prepared for playback (0 to disable, unless gapless)\n            gapless: Whether sounds follow each other without any gap or crossfade\n        ";
 static PyMethodDef __pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_1__init__ = {"__init__", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_1__init__, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController___init__};
 static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_1__init__(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_self = 0;
@@ -1573,16 +2015,22 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   PyObject *__pyx_v_track = 0;
   float __pyx_v_crossfade_time;
   CYTHON_UNUSED float __pyx_v_volume;
+  float __pyx_v_decode_ahead_time;
+  int __pyx_v_gapless;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
   {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_mc,&__pyx_n_s_track,&__pyx_n_s_crossfade_time,&__pyx_n_s_volume,0};
-    PyObject* values[5] = {0,0,0,0,0};
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_mc,&__pyx_n_s_track,&__pyx_n_s_crossfade_time,&__pyx_n_s_volume,&__pyx_n_s_decode_ahead_time,&__pyx_n_s_gapless,0};
+    PyObject* values[7] = {0,0,0,0,0,0,0};
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
       switch (pos_args) {
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
         case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
         CYTHON_FALLTHROUGH;
         case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
@@ -1605,13 +2053,13 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_mc)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 0, 3, 5, 1); __PYX_ERR(0, 19, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__init__", 0, 3, 7, 1); __PYX_ERR(0, 19, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_track)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 0, 3, 5, 2); __PYX_ERR(0, 19, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__init__", 0, 3, 7, 2); __PYX_ERR(0, 19, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  3:
@@ -1625,12 +2073,28 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
           PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_volume);
           if (value) { values[4] = value; kw_args--; }
         }
+        CYTHON_FALLTHROUGH;
+        case  5:
+        if (kw_args > 0) {
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_decode_ahead_time);
+          if (value) { values[5] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  6:
+        if (kw_args > 0) {
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_gapless);
+          if (value) { values[6] = value; kw_args--; }
+        }
       }
       if (unlikely(kw_args > 0)) {
         if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 19, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
         case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
         CYTHON_FALLTHROUGH;
         case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
@@ -1655,23 +2119,49 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
     } else {
       __pyx_v_volume = ((float)((double)1.0));
     }
+    if (values[5]) {
+      __pyx_v_decode_ahead_time = __pyx_PyFloat_AsFloat(values[5]); if (unlikely((__pyx_v_decode_ahead_time == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 20, __pyx_L3_error)
+    } else {
+      __pyx_v_decode_ahead_time = ((float)((double)0.0));
+    }
+    if (values[6]) {
+      __pyx_v_gapless = __Pyx_PyObject_IsTrue(values[6]); if (unlikely((__pyx_v_gapless == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 20, __pyx_L3_error)
+    } else {
+
+      /* "mpfmc/core/audio/playlist_controller.pyx":20
+ * 
+ *     def __init__(self, object mc, object track, float crossfade_time=0.0, float volume=1.0,
+ *                  float decode_ahead_time=0.0, bint gapless=False):             # <<<<<<<<<<<<<<
+ *         """
+ *         Constructor
+ */
+      __pyx_v_gapless = ((int)((int)0));
+    }
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 0, 3, 5, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 19, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__init__", 0, 3, 7, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 19, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController___init__(__pyx_self, __pyx_v_self, __pyx_v_mc, __pyx_v_track, __pyx_v_crossfade_time, __pyx_v_volume);
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController___init__(__pyx_self, __pyx_v_self, __pyx_v_mc, __pyx_v_track, __pyx_v_crossfade_time, __pyx_v_volume, __pyx_v_decode_ahead_time, __pyx_v_gapless);
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":19
+ *     """
+ * 
+ *     def __init__(self, object mc, object track, float crossfade_time=0.0, float volume=1.0,             # <<<<<<<<<<<<<<
+ *                  float decode_ahead_time=0.0, bint gapless=False):
+ *         """
+ */
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController___init__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_mc, PyObject *__pyx_v_track, float __pyx_v_crossfade_time, CYTHON_UNUSED float __pyx_v_volume) {
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController___init__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_mc, PyObject *__pyx_v_track, float __pyx_v_crossfade_time, CYTHON_UNUSED float __pyx_v_volume, float __pyx_v_decode_ahead_time, int __pyx_v_gapless) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -1684,104 +2174,173 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   int __pyx_t_8;
   __Pyx_RefNannySetupContext("__init__", 0);
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":28
- *             volume: The playlist volume (0.0 to 1.0)
+  /* "mpfmc/core/audio/playlist_controller.pyx":32
+ *             gapless: Whether sounds follow each other without any gap or crossfade
  *         """
  *         self.log = logging.getLogger("PlaylistController")             # <<<<<<<<<<<<<<
  *         self.mc = mc
  *         self._track = track
  */
-  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_logging); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 28, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_logging); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 32, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_getLogger); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 28, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_getLogger); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 32, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 28, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 32, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_log, __pyx_t_1) < 0) __PYX_ERR(0, 28, __pyx_L1_error)
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_log, __pyx_t_1) < 0) __PYX_ERR(0, 32, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":29
+  /* "mpfmc/core/audio/playlist_controller.pyx":33
  *         """
  *         self.log = logging.getLogger("PlaylistController")
  *         self.mc = mc             # <<<<<<<<<<<<<<
  *         self._track = track
  *         self._crossfade_time = crossfade_time
  */
-  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_mc, __pyx_v_mc) < 0) __PYX_ERR(0, 29, __pyx_L1_error)
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_mc, __pyx_v_mc) < 0) __PYX_ERR(0, 33, __pyx_L1_error)
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":30
+  /* "mpfmc/core/audio/playlist_controller.pyx":34
  *         self.log = logging.getLogger("PlaylistController")
  *         self.mc = mc
  *         self._track = track             # <<<<<<<<<<<<<<
  *         self._crossfade_time = crossfade_time
- * 
+ *         self._decode_ahead_time = decode_ahead_time
  */
-  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_track_2, __pyx_v_track) < 0) __PYX_ERR(0, 30, __pyx_L1_error)
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_track_2, __pyx_v_track) < 0) __PYX_ERR(0, 34, __pyx_L1_error)
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":31
+  /* "mpfmc/core/audio/playlist_controller.pyx":35
  *         self.mc = mc
  *         self._track = track
  *         self._crossfade_time = crossfade_time             # <<<<<<<<<<<<<<
+ *         self._decode_ahead_time = decode_ahead_time
+ *         self._gapless = gapless
+ */
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_crossfade_time); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 35, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_crossfade_time_2, __pyx_t_1) < 0) __PYX_ERR(0, 35, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":36
+ *         self._track = track
+ *         self._crossfade_time = crossfade_time
+ *         self._decode_ahead_time = decode_ahead_time             # <<<<<<<<<<<<<<
+ *         self._gapless = gapless
+ * 
+ */
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_decode_ahead_time); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 36, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_decode_ahead_time_2, __pyx_t_1) < 0) __PYX_ERR(0, 36, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":37
+ *         self._crossfade_time = crossfade_time
+ *         self._decode_ahead_time = decode_ahead_time
+ *         self._gapless = gapless             # <<<<<<<<<<<<<<
  * 
  *         # Dictionary of PlaylistInstance class objects keyed by SoundInstance ID
  */
-  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_crossfade_time); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 31, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyBool_FromLong(__pyx_v_gapless); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 37, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_crossfade_time_2, __pyx_t_1) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_gapless_2, __pyx_t_1) < 0) __PYX_ERR(0, 37, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":34
+  /* "mpfmc/core/audio/playlist_controller.pyx":40
  * 
  *         # Dictionary of PlaylistInstance class objects keyed by SoundInstance ID
  *         self._playlists_by_sound_instance = dict()             # <<<<<<<<<<<<<<
  * 
  *         # Keep track of current and previous playlist
  */
-  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 34, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 40, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_playlists_by_sound_instance, __pyx_t_1) < 0) __PYX_ERR(0, 34, __pyx_L1_error)
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_playlists_by_sound_instance, __pyx_t_1) < 0) __PYX_ERR(0, 40, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":37
+  /* "mpfmc/core/audio/playlist_controller.pyx":43
  * 
  *         # Keep track of current and previous playlist
  *         self._current_playlist = None             # <<<<<<<<<<<<<<
  * 
  *         # Keeps track of a pending request that cannot be immediately serviced because the
  */
-  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist, Py_None) < 0) __PYX_ERR(0, 37, __pyx_L1_error)
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist, Py_None) < 0) __PYX_ERR(0, 43, __pyx_L1_error)
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":41
+  /* "mpfmc/core/audio/playlist_controller.pyx":47
  *         # Keeps track of a pending request that cannot be immediately serviced because the
  *         # underlying audio track is busy (only 2 players)
  *         self._pending_request = None             # <<<<<<<<<<<<<<
  * 
+ *         # The next sound of the current playlist is prepared ahead of time: it is loaded and
+ */
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_pending_request, Py_None) < 0) __PYX_ERR(0, 47, __pyx_L1_error)
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":53
+ *         # finish marker (crossfade) or its end (gapless).  The name of a sound that has been
+ *         # taken from the playlist but has not been played yet is kept for the next transition.
+ *         self._prepared_sound_instance = None             # <<<<<<<<<<<<<<
+ *         self._prepared_sound_name = None
+ *         self._next_sound_name = None
+ */
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_prepared_sound_instance, Py_None) < 0) __PYX_ERR(0, 53, __pyx_L1_error)
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":54
+ *         # taken from the playlist but has not been played yet is kept for the next transition.
+ *         self._prepared_sound_instance = None
+ *         self._prepared_sound_name = None             # <<<<<<<<<<<<<<
+ *         self._next_sound_name = None
+ *         self._prepare_next_sound_event = None
+ */
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_prepared_sound_name, Py_None) < 0) __PYX_ERR(0, 54, __pyx_L1_error)
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":55
+ *         self._prepared_sound_instance = None
+ *         self._prepared_sound_name = None
+ *         self._next_sound_name = None             # <<<<<<<<<<<<<<
+ *         self._prepare_next_sound_event = None
+ *         self._prepare_next_sound_when_not_busy = False
+ */
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_next_sound_name, Py_None) < 0) __PYX_ERR(0, 55, __pyx_L1_error)
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":56
+ *         self._prepared_sound_name = None
+ *         self._next_sound_name = None
+ *         self._prepare_next_sound_event = None             # <<<<<<<<<<<<<<
+ *         self._prepare_next_sound_when_not_busy = False
+ * 
+ */
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_prepare_next_sound_event, Py_None) < 0) __PYX_ERR(0, 56, __pyx_L1_error)
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":57
+ *         self._next_sound_name = None
+ *         self._prepare_next_sound_event = None
+ *         self._prepare_next_sound_when_not_busy = False             # <<<<<<<<<<<<<<
+ * 
  *         # Create event handlers for sound instance events
  */
-  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_pending_request, Py_None) < 0) __PYX_ERR(0, 41, __pyx_L1_error)
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_prepare_next_sound_when_not_bus, Py_False) < 0) __PYX_ERR(0, 57, __pyx_L1_error)
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":46
- *         # Note: we don't have to worry about played events since the playlist controller will initiate
- *         # playback and therefore will already know when those events are occurring.
- *         self.mc.events.add_handler('{}_playlist_sound_stopped'.format(self.name.lower()),             # <<<<<<<<<<<<<<
- *                                    self._on_sound_instance_stopped, 0)
- *         self.mc.events.add_handler('{}_playlist_sound_about_to_finish'.format(self.name.lower()),
+  /* "mpfmc/core/audio/playlist_controller.pyx":60
+ * 
+ *         # Create event handlers for sound instance events
+ *         self.mc.events.add_handler('{}_playlist_sound_played'.format(self.name.lower()),             # <<<<<<<<<<<<<<
+ *                                    self._on_sound_instance_played)
+ *         self.mc.events.add_handler('{}_playlist_sound_stopped'.format(self.name.lower()),
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_mc); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 46, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_mc); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 60, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_events); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 46, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_events); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 60, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_add_handler); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 46, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_add_handler); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 60, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_playlist_sound_stopped, __pyx_n_s_format); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 46, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_playlist_sound_played, __pyx_n_s_format); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 60, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_name); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 46, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_name); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 60, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_lower); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 46, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_lower); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 60, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
   __pyx_t_6 = NULL;
@@ -1795,10 +2354,10 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
     }
   }
   if (__pyx_t_6) {
-    __pyx_t_5 = __Pyx_PyObject_CallOneArg(__pyx_t_7, __pyx_t_6); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 46, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyObject_CallOneArg(__pyx_t_7, __pyx_t_6); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 60, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
   } else {
-    __pyx_t_5 = __Pyx_PyObject_CallNoArg(__pyx_t_7); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 46, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyObject_CallNoArg(__pyx_t_7); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 60, __pyx_L1_error)
   }
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
@@ -1813,14 +2372,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
     }
   }
   if (!__pyx_t_7) {
-    __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_5); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 46, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_5); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 60, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_GOTREF(__pyx_t_3);
   } else {
     #if CYTHON_FAST_PYCALL
     if (PyFunction_Check(__pyx_t_4)) {
       PyObject *__pyx_temp[2] = {__pyx_t_7, __pyx_t_5};
-      __pyx_t_3 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 46, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 60, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
@@ -1829,34 +2388,34 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
     #if CYTHON_FAST_PYCCALL
     if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
       PyObject *__pyx_temp[2] = {__pyx_t_7, __pyx_t_5};
-      __pyx_t_3 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 46, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 60, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     } else
     #endif
     {
-      __pyx_t_6 = PyTuple_New(1+1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 46, __pyx_L1_error)
+      __pyx_t_6 = PyTuple_New(1+1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 60, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_6);
       __Pyx_GIVEREF(__pyx_t_7); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_7); __pyx_t_7 = NULL;
       __Pyx_GIVEREF(__pyx_t_5);
       PyTuple_SET_ITEM(__pyx_t_6, 0+1, __pyx_t_5);
       __pyx_t_5 = 0;
-      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_6, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 46, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_6, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 60, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
     }
   }
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":47
- *         # playback and therefore will already know when those events are occurring.
+  /* "mpfmc/core/audio/playlist_controller.pyx":61
+ *         # Create event handlers for sound instance events
+ *         self.mc.events.add_handler('{}_playlist_sound_played'.format(self.name.lower()),
+ *                                    self._on_sound_instance_played)             # <<<<<<<<<<<<<<
  *         self.mc.events.add_handler('{}_playlist_sound_stopped'.format(self.name.lower()),
- *                                    self._on_sound_instance_stopped, 0)             # <<<<<<<<<<<<<<
- *         self.mc.events.add_handler('{}_playlist_sound_about_to_finish'.format(self.name.lower()),
- *                                    self._on_sound_instance_about_to_finish)
+ *                                    self._on_sound_instance_stopped, 0)
  */
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_on_sound_instance_stopped); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 47, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_on_sound_instance_played); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 61, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __pyx_t_6 = NULL;
   __pyx_t_8 = 0;
@@ -1872,8 +2431,8 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   }
   #if CYTHON_FAST_PYCALL
   if (PyFunction_Check(__pyx_t_2)) {
-    PyObject *__pyx_temp[4] = {__pyx_t_6, __pyx_t_3, __pyx_t_4, __pyx_int_0};
-    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 3+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 46, __pyx_L1_error)
+    PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_t_3, __pyx_t_4};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 60, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -1882,8 +2441,8 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   #endif
   #if CYTHON_FAST_PYCCALL
   if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
-    PyObject *__pyx_temp[4] = {__pyx_t_6, __pyx_t_3, __pyx_t_4, __pyx_int_0};
-    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 3+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 46, __pyx_L1_error)
+    PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_t_3, __pyx_t_4};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 60, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -1891,7 +2450,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   } else
   #endif
   {
-    __pyx_t_5 = PyTuple_New(3+__pyx_t_8); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 46, __pyx_L1_error)
+    __pyx_t_5 = PyTuple_New(2+__pyx_t_8); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 60, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     if (__pyx_t_6) {
       __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_6); __pyx_t_6 = NULL;
@@ -1900,38 +2459,35 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
     PyTuple_SET_ITEM(__pyx_t_5, 0+__pyx_t_8, __pyx_t_3);
     __Pyx_GIVEREF(__pyx_t_4);
     PyTuple_SET_ITEM(__pyx_t_5, 1+__pyx_t_8, __pyx_t_4);
-    __Pyx_INCREF(__pyx_int_0);
-    __Pyx_GIVEREF(__pyx_int_0);
-    PyTuple_SET_ITEM(__pyx_t_5, 2+__pyx_t_8, __pyx_int_0);
     __pyx_t_3 = 0;
     __pyx_t_4 = 0;
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 46, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 60, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   }
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":48
- *         self.mc.events.add_handler('{}_playlist_sound_stopped'.format(self.name.lower()),
+  /* "mpfmc/core/audio/playlist_controller.pyx":62
+ *         self.mc.events.add_handler('{}_playlist_sound_played'.format(self.name.lower()),
+ *                                    self._on_sound_instance_played)
+ *         self.mc.events.add_handler('{}_playlist_sound_stopped'.format(self.name.lower()),             # <<<<<<<<<<<<<<
  *                                    self._on_sound_instance_stopped, 0)
- *         self.mc.events.add_handler('{}_playlist_sound_about_to_finish'.format(self.name.lower()),             # <<<<<<<<<<<<<<
- *                                    self._on_sound_instance_about_to_finish)
- * 
+ *         self.mc.events.add_handler('{}_playlist_sound_about_to_finish'.format(self.name.lower()),
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_mc); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 48, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_mc); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 62, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_events); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 48, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_events); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 62, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_add_handler); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 48, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_add_handler); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 62, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_playlist_sound_about_to_finish, __pyx_n_s_format); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 48, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_playlist_sound_stopped, __pyx_n_s_format); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 62, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_name); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 48, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_name); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 62, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_lower); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 48, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_lower); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 62, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
   __pyx_t_6 = NULL;
@@ -1945,10 +2501,10 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
     }
   }
   if (__pyx_t_6) {
-    __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_t_7, __pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 48, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_t_7, __pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 62, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
   } else {
-    __pyx_t_3 = __Pyx_PyObject_CallNoArg(__pyx_t_7); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 48, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_CallNoArg(__pyx_t_7); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 62, __pyx_L1_error)
   }
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
@@ -1963,14 +2519,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
     }
   }
   if (!__pyx_t_7) {
-    __pyx_t_5 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 48, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 62, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_GOTREF(__pyx_t_5);
   } else {
     #if CYTHON_FAST_PYCALL
     if (PyFunction_Check(__pyx_t_4)) {
       PyObject *__pyx_temp[2] = {__pyx_t_7, __pyx_t_3};
-      __pyx_t_5 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 48, __pyx_L1_error)
+      __pyx_t_5 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 62, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -1979,34 +2535,34 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
     #if CYTHON_FAST_PYCCALL
     if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
       PyObject *__pyx_temp[2] = {__pyx_t_7, __pyx_t_3};
-      __pyx_t_5 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 48, __pyx_L1_error)
+      __pyx_t_5 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 62, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     } else
     #endif
     {
-      __pyx_t_6 = PyTuple_New(1+1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 48, __pyx_L1_error)
+      __pyx_t_6 = PyTuple_New(1+1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 62, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_6);
       __Pyx_GIVEREF(__pyx_t_7); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_7); __pyx_t_7 = NULL;
       __Pyx_GIVEREF(__pyx_t_3);
       PyTuple_SET_ITEM(__pyx_t_6, 0+1, __pyx_t_3);
       __pyx_t_3 = 0;
-      __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_6, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 48, __pyx_L1_error)
+      __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_6, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 62, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
     }
   }
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":49
- *                                    self._on_sound_instance_stopped, 0)
+  /* "mpfmc/core/audio/playlist_controller.pyx":63
+ *                                    self._on_sound_instance_played)
+ *         self.mc.events.add_handler('{}_playlist_sound_stopped'.format(self.name.lower()),
+ *                                    self._on_sound_instance_stopped, 0)             # <<<<<<<<<<<<<<
  *         self.mc.events.add_handler('{}_playlist_sound_about_to_finish'.format(self.name.lower()),
- *                                    self._on_sound_instance_about_to_finish)             # <<<<<<<<<<<<<<
- * 
- *         self.log.debug("Created PlaylistController %s: ", self._track.name)
+ *                                    self._on_sound_instance_about_to_finish)
  */
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_on_sound_instance_about_to_fini); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 49, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_on_sound_instance_stopped); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 63, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __pyx_t_6 = NULL;
   __pyx_t_8 = 0;
@@ -2022,8 +2578,8 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   }
   #if CYTHON_FAST_PYCALL
   if (PyFunction_Check(__pyx_t_2)) {
-    PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_t_5, __pyx_t_4};
-    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 48, __pyx_L1_error)
+    PyObject *__pyx_temp[4] = {__pyx_t_6, __pyx_t_5, __pyx_t_4, __pyx_int_0};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 3+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 62, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
@@ -2032,8 +2588,8 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   #endif
   #if CYTHON_FAST_PYCCALL
   if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
-    PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_t_5, __pyx_t_4};
-    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 48, __pyx_L1_error)
+    PyObject *__pyx_temp[4] = {__pyx_t_6, __pyx_t_5, __pyx_t_4, __pyx_int_0};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 3+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 62, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
@@ -2041,7 +2597,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   } else
   #endif
   {
-    __pyx_t_3 = PyTuple_New(2+__pyx_t_8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 48, __pyx_L1_error)
+    __pyx_t_3 = PyTuple_New(3+__pyx_t_8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 62, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     if (__pyx_t_6) {
       __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_6); __pyx_t_6 = NULL;
@@ -2050,87 +2606,237 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
     PyTuple_SET_ITEM(__pyx_t_3, 0+__pyx_t_8, __pyx_t_5);
     __Pyx_GIVEREF(__pyx_t_4);
     PyTuple_SET_ITEM(__pyx_t_3, 1+__pyx_t_8, __pyx_t_4);
+    __Pyx_INCREF(__pyx_int_0);
+    __Pyx_GIVEREF(__pyx_int_0);
+    PyTuple_SET_ITEM(__pyx_t_3, 2+__pyx_t_8, __pyx_int_0);
     __pyx_t_5 = 0;
     __pyx_t_4 = 0;
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_3, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 48, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_3, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 62, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   }
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":51
+  /* "mpfmc/core/audio/playlist_controller.pyx":64
+ *         self.mc.events.add_handler('{}_playlist_sound_stopped'.format(self.name.lower()),
+ *                                    self._on_sound_instance_stopped, 0)
+ *         self.mc.events.add_handler('{}_playlist_sound_about_to_finish'.format(self.name.lower()),             # <<<<<<<<<<<<<<
  *                                    self._on_sound_instance_about_to_finish)
  * 
- *         self.log.debug("Created PlaylistController %s: ", self._track.name)             # <<<<<<<<<<<<<<
- * 
- *     def __dealloc__(self):
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_log); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 51, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_mc); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 64, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_debug); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 51, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_events); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 64, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_track_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 51, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_add_handler); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 64, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_name); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 51, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_playlist_sound_about_to_finish, __pyx_n_s_format); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 64, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = NULL;
-  __pyx_t_8 = 0;
-  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
-    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_3);
-    if (likely(__pyx_t_2)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-      __Pyx_INCREF(__pyx_t_2);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_name); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 64, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_lower); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 64, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_6 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_7))) {
+    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_7);
+    if (likely(__pyx_t_6)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_7);
+      __Pyx_INCREF(__pyx_t_6);
       __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_3, function);
+      __Pyx_DECREF_SET(__pyx_t_7, function);
+    }
+  }
+  if (__pyx_t_6) {
+    __pyx_t_5 = __Pyx_PyObject_CallOneArg(__pyx_t_7, __pyx_t_6); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 64, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  } else {
+    __pyx_t_5 = __Pyx_PyObject_CallNoArg(__pyx_t_7); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 64, __pyx_L1_error)
+  }
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_4);
+    if (likely(__pyx_t_7)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_7);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_4, function);
+    }
+  }
+  if (!__pyx_t_7) {
+    __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_5); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 64, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_GOTREF(__pyx_t_3);
+  } else {
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_4)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_7, __pyx_t_5};
+      __pyx_t_3 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 64, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_7, __pyx_t_5};
+      __pyx_t_3 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 64, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_6 = PyTuple_New(1+1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 64, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_GIVEREF(__pyx_t_7); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_7); __pyx_t_7 = NULL;
+      __Pyx_GIVEREF(__pyx_t_5);
+      PyTuple_SET_ITEM(__pyx_t_6, 0+1, __pyx_t_5);
+      __pyx_t_5 = 0;
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_6, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 64, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    }
+  }
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":65
+ *                                    self._on_sound_instance_stopped, 0)
+ *         self.mc.events.add_handler('{}_playlist_sound_about_to_finish'.format(self.name.lower()),
+ *                                    self._on_sound_instance_about_to_finish)             # <<<<<<<<<<<<<<
+ * 
+ *         self.log.debug("Created PlaylistController %s: ", self._track.name)
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_on_sound_instance_about_to_fini); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 65, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_6 = NULL;
+  __pyx_t_8 = 0;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_6)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_6);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
       __pyx_t_8 = 1;
     }
   }
   #if CYTHON_FAST_PYCALL
-  if (PyFunction_Check(__pyx_t_3)) {
+  if (PyFunction_Check(__pyx_t_2)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_t_3, __pyx_t_4};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 64, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_t_3, __pyx_t_4};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 64, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  } else
+  #endif
+  {
+    __pyx_t_5 = PyTuple_New(2+__pyx_t_8); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 64, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    if (__pyx_t_6) {
+      __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_6); __pyx_t_6 = NULL;
+    }
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_5, 0+__pyx_t_8, __pyx_t_3);
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_5, 1+__pyx_t_8, __pyx_t_4);
+    __pyx_t_3 = 0;
+    __pyx_t_4 = 0;
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 64, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":67
+ *                                    self._on_sound_instance_about_to_finish)
+ * 
+ *         self.log.debug("Created PlaylistController %s: ", self._track.name)             # <<<<<<<<<<<<<<
+ * 
+ *     def __dealloc__(self):
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_log); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 67, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_debug); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 67, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_track_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 67, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_name); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 67, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = NULL;
+  __pyx_t_8 = 0;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
+    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_5);
+    if (likely(__pyx_t_2)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+      __Pyx_INCREF(__pyx_t_2);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_5, function);
+      __pyx_t_8 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_5)) {
     PyObject *__pyx_temp[3] = {__pyx_t_2, __pyx_kp_u_Created_PlaylistController_s, __pyx_t_4};
-    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 51, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 67, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   } else
   #endif
   #if CYTHON_FAST_PYCCALL
-  if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_5)) {
     PyObject *__pyx_temp[3] = {__pyx_t_2, __pyx_kp_u_Created_PlaylistController_s, __pyx_t_4};
-    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 51, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 67, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   } else
   #endif
   {
-    __pyx_t_5 = PyTuple_New(2+__pyx_t_8); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 51, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_3 = PyTuple_New(2+__pyx_t_8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 67, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
     if (__pyx_t_2) {
-      __Pyx_GIVEREF(__pyx_t_2); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_2); __pyx_t_2 = NULL;
+      __Pyx_GIVEREF(__pyx_t_2); PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_2); __pyx_t_2 = NULL;
     }
     __Pyx_INCREF(__pyx_kp_u_Created_PlaylistController_s);
     __Pyx_GIVEREF(__pyx_kp_u_Created_PlaylistController_s);
-    PyTuple_SET_ITEM(__pyx_t_5, 0+__pyx_t_8, __pyx_kp_u_Created_PlaylistController_s);
+    PyTuple_SET_ITEM(__pyx_t_3, 0+__pyx_t_8, __pyx_kp_u_Created_PlaylistController_s);
     __Pyx_GIVEREF(__pyx_t_4);
-    PyTuple_SET_ITEM(__pyx_t_5, 1+__pyx_t_8, __pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_3, 1+__pyx_t_8, __pyx_t_4);
     __pyx_t_4 = 0;
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 51, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_3, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 67, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   }
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
   /* "mpfmc/core/audio/playlist_controller.pyx":19
  *     """
  * 
- *     def __init__(self, object mc, object track, float crossfade_time=0.0, float volume=1.0):             # <<<<<<<<<<<<<<
+ *     def __init__(self, object mc, object track, float crossfade_time=0.0, float volume=1.0,             # <<<<<<<<<<<<<<
+ *                  float decode_ahead_time=0.0, bint gapless=False):
  *         """
- *         Constructor
  */
 
   /* function exit code */
@@ -2152,7 +2858,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/playlist_controller.pyx":53
+/* "mpfmc/core/audio/playlist_controller.pyx":69
  *         self.log.debug("Created PlaylistController %s: ", self._track.name)
  * 
  *     def __dealloc__(self):             # <<<<<<<<<<<<<<
@@ -2187,7 +2893,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/playlist_controller.pyx":57
+/* "mpfmc/core/audio/playlist_controller.pyx":73
  *         pass
  * 
  *     def __repr__(self):             # <<<<<<<<<<<<<<
@@ -2220,7 +2926,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   PyObject *__pyx_t_5 = NULL;
   __Pyx_RefNannySetupContext("__repr__", 0);
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":58
+  /* "mpfmc/core/audio/playlist_controller.pyx":74
  * 
  *     def __repr__(self):
  *         return '<PlaylistController.{}>'.format(self.name)             # <<<<<<<<<<<<<<
@@ -2228,9 +2934,9 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
  *     @property
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_PlaylistController_2, __pyx_n_s_format); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 58, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_PlaylistController_2, __pyx_n_s_format); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 74, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_name); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 58, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_name); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 74, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_t_4 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
@@ -2243,14 +2949,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
     }
   }
   if (!__pyx_t_4) {
-    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 58, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 74, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_GOTREF(__pyx_t_1);
   } else {
     #if CYTHON_FAST_PYCALL
     if (PyFunction_Check(__pyx_t_2)) {
       PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_t_3};
-      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 58, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 74, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -2259,20 +2965,20 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
     #if CYTHON_FAST_PYCCALL
     if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
       PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_t_3};
-      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 58, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 74, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     } else
     #endif
     {
-      __pyx_t_5 = PyTuple_New(1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 58, __pyx_L1_error)
+      __pyx_t_5 = PyTuple_New(1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 74, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4); __pyx_t_4 = NULL;
       __Pyx_GIVEREF(__pyx_t_3);
       PyTuple_SET_ITEM(__pyx_t_5, 0+1, __pyx_t_3);
       __pyx_t_3 = 0;
-      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 58, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 74, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     }
@@ -2282,7 +2988,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":57
+  /* "mpfmc/core/audio/playlist_controller.pyx":73
  *         pass
  * 
  *     def __repr__(self):             # <<<<<<<<<<<<<<
@@ -2305,7 +3011,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/playlist_controller.pyx":61
+/* "mpfmc/core/audio/playlist_controller.pyx":77
  * 
  *     @property
  *     def name(self):             # <<<<<<<<<<<<<<
@@ -2335,7 +3041,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("name", 0);
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":63
+  /* "mpfmc/core/audio/playlist_controller.pyx":79
  *     def name(self):
  *         """The name of the playlist controller (and corresponding audio track)"""
  *         return self._track.name             # <<<<<<<<<<<<<<
@@ -2343,16 +3049,16 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
  *     @property
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_track_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 63, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_track_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 79, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_name); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 63, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_name); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 79, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_r = __pyx_t_2;
   __pyx_t_2 = 0;
   goto __pyx_L0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":61
+  /* "mpfmc/core/audio/playlist_controller.pyx":77
  * 
  *     @property
  *     def name(self):             # <<<<<<<<<<<<<<
@@ -2372,7 +3078,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/playlist_controller.pyx":66
+/* "mpfmc/core/audio/playlist_controller.pyx":82
  * 
  *     @property
  *     def track(self):             # <<<<<<<<<<<<<<
@@ -2401,7 +3107,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("track", 0);
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":68
+  /* "mpfmc/core/audio/playlist_controller.pyx":84
  *     def track(self):
  *         """The corresponding audio track the playlist is managing"""
  *         return self._track             # <<<<<<<<<<<<<<
@@ -2409,13 +3115,13 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
  *     @property
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_track_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 68, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_track_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 84, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":66
+  /* "mpfmc/core/audio/playlist_controller.pyx":82
  * 
  *     @property
  *     def track(self):             # <<<<<<<<<<<<<<
@@ -2434,7 +3140,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/playlist_controller.pyx":71
+/* "mpfmc/core/audio/playlist_controller.pyx":87
  * 
  *     @property
  *     def crossfade_time(self):             # <<<<<<<<<<<<<<
@@ -2463,7 +3169,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("crossfade_time", 0);
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":73
+  /* "mpfmc/core/audio/playlist_controller.pyx":89
  *     def crossfade_time(self):
  *         """The time (secs) to use when fading between sounds"""
  *         return self._crossfade_time             # <<<<<<<<<<<<<<
@@ -2471,13 +3177,13 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
  *     @property
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_crossfade_time_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 73, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_crossfade_time_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 89, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":71
+  /* "mpfmc/core/audio/playlist_controller.pyx":87
  * 
  *     @property
  *     def crossfade_time(self):             # <<<<<<<<<<<<<<
@@ -2496,66 +3202,61 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/playlist_controller.pyx":76
+/* "mpfmc/core/audio/playlist_controller.pyx":92
  * 
  *     @property
- *     def has_pending_request(self):             # <<<<<<<<<<<<<<
- *         """Whether the playlist controller has a pending request queued until it is not busy"""
- *         return self._pending_request is not None
+ *     def decode_ahead_time(self):             # <<<<<<<<<<<<<<
+ *         """The time (secs) before a transition at which the next sound is prepared for playback"""
+ *         return self._decode_ahead_time
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_13has_pending_request(PyObject *__pyx_self, PyObject *__pyx_v_self); /*proto*/
-static char __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_12has_pending_request[] = "PlaylistController.has_pending_request(self)\nWhether the playlist controller has a pending request queued until it is not busy";
-static PyMethodDef __pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_13has_pending_request = {"has_pending_request", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_13has_pending_request, METH_O, __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_12has_pending_request};
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_13has_pending_request(PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_13decode_ahead_time(PyObject *__pyx_self, PyObject *__pyx_v_self); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_12decode_ahead_time[] = "PlaylistController.decode_ahead_time(self)\nThe time (secs) before a transition at which the next sound is prepared for playback";
+static PyMethodDef __pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_13decode_ahead_time = {"decode_ahead_time", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_13decode_ahead_time, METH_O, __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_12decode_ahead_time};
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_13decode_ahead_time(PyObject *__pyx_self, PyObject *__pyx_v_self) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("has_pending_request (wrapper)", 0);
-  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_12has_pending_request(__pyx_self, ((PyObject *)__pyx_v_self));
+  __Pyx_RefNannySetupContext("decode_ahead_time (wrapper)", 0);
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_12decode_ahead_time(__pyx_self, ((PyObject *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_12has_pending_request(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_12decode_ahead_time(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  int __pyx_t_2;
-  __Pyx_RefNannySetupContext("has_pending_request", 0);
+  __Pyx_RefNannySetupContext("decode_ahead_time", 0);
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":78
- *     def has_pending_request(self):
- *         """Whether the playlist controller has a pending request queued until it is not busy"""
- *         return self._pending_request is not None             # <<<<<<<<<<<<<<
+  /* "mpfmc/core/audio/playlist_controller.pyx":94
+ *     def decode_ahead_time(self):
+ *         """The time (secs) before a transition at which the next sound is prepared for playback"""
+ *         return self._decode_ahead_time             # <<<<<<<<<<<<<<
  * 
- *     def stop_all_sounds(self, float fade_out_seconds = 0.0):
+ *     @property
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_pending_request); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 78, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = (__pyx_t_1 != Py_None);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_PyBool_FromLong(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 78, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_decode_ahead_time_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 94, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":76
+  /* "mpfmc/core/audio/playlist_controller.pyx":92
  * 
  *     @property
- *     def has_pending_request(self):             # <<<<<<<<<<<<<<
- *         """Whether the playlist controller has a pending request queued until it is not busy"""
- *         return self._pending_request is not None
+ *     def decode_ahead_time(self):             # <<<<<<<<<<<<<<
+ *         """The time (secs) before a transition at which the next sound is prepared for playback"""
+ *         return self._decode_ahead_time
  */
 
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController.has_pending_request", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController.decode_ahead_time", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -2563,149 +3264,374 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/playlist_controller.pyx":80
- *         return self._pending_request is not None
+/* "mpfmc/core/audio/playlist_controller.pyx":97
  * 
- *     def stop_all_sounds(self, float fade_out_seconds = 0.0):             # <<<<<<<<<<<<<<
- *         """
- *         Stops all playing sounds immediately on the playlist track.
+ *     @property
+ *     def gapless(self):             # <<<<<<<<<<<<<<
+ *         """Whether sounds follow each other without any gap or crossfade"""
+ *         return self._gapless
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_15stop_all_sounds(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_14stop_all_sounds[] = "PlaylistController.stop_all_sounds(self, float fade_out_seconds=0.0)\n\n        Stops all playing sounds immediately on the playlist track.\n        Args:\n            fade_out_seconds: The number of seconds to fade out the sounds before stopping\n        ";
-static PyMethodDef __pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_15stop_all_sounds = {"stop_all_sounds", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_15stop_all_sounds, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_14stop_all_sounds};
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_15stop_all_sounds(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_self = 0;
-  float __pyx_v_fade_out_seconds;
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_15gapless(PyObject *__pyx_self, PyObject *__pyx_v_self); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_14gapless[] = "PlaylistController.gapless(self)\nWhether sounds follow each other without any gap or crossfade";
+static PyMethodDef __pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_15gapless = {"gapless", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_15gapless, METH_O, __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_14gapless};
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_15gapless(PyObject *__pyx_self, PyObject *__pyx_v_self) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("stop_all_sounds (wrapper)", 0);
-  {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_fade_out_seconds,0};
-    PyObject* values[2] = {0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
-      switch (pos_args) {
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (pos_args) {
-        case  0:
-        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_self)) != 0)) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        CYTHON_FALLTHROUGH;
-        case  1:
-        if (kw_args > 0) {
-          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_fade_out_seconds);
-          if (value) { values[1] = value; kw_args--; }
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "stop_all_sounds") < 0)) __PYX_ERR(0, 80, __pyx_L3_error)
-      }
-    } else {
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-    }
-    __pyx_v_self = values[0];
-    if (values[1]) {
-      __pyx_v_fade_out_seconds = __pyx_PyFloat_AsFloat(values[1]); if (unlikely((__pyx_v_fade_out_seconds == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 80, __pyx_L3_error)
-    } else {
-      __pyx_v_fade_out_seconds = ((float)((double)0.0));
-    }
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("stop_all_sounds", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 80, __pyx_L3_error)
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController.stop_all_sounds", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_14stop_all_sounds(__pyx_self, __pyx_v_self, __pyx_v_fade_out_seconds);
+  __Pyx_RefNannySetupContext("gapless (wrapper)", 0);
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_14gapless(__pyx_self, ((PyObject *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_14stop_all_sounds(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, float __pyx_v_fade_out_seconds) {
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_14gapless(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  __Pyx_RefNannySetupContext("stop_all_sounds", 0);
+  __Pyx_RefNannySetupContext("gapless", 0);
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":86
- *             fade_out_seconds: The number of seconds to fade out the sounds before stopping
- *         """
- *         self._track.stop_all_sounds(fade_out_seconds)             # <<<<<<<<<<<<<<
+  /* "mpfmc/core/audio/playlist_controller.pyx":99
+ *     def gapless(self):
+ *         """Whether sounds follow each other without any gap or crossfade"""
+ *         return self._gapless             # <<<<<<<<<<<<<<
  * 
- *         # TODO: playlist housekeeping (stopped events, remove instance, etc.)
+ *     @property
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_track_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 86, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_stop_all_sounds); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 86, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = PyFloat_FromDouble(__pyx_v_fade_out_seconds); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 86, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_4 = NULL;
-  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
-    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-    if (likely(__pyx_t_4)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-      __Pyx_INCREF(__pyx_t_4);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_3, function);
-    }
-  }
-  if (!__pyx_t_4) {
-    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 86, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_GOTREF(__pyx_t_1);
-  } else {
-    #if CYTHON_FAST_PYCALL
-    if (PyFunction_Check(__pyx_t_3)) {
-      PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_t_2};
-      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 86, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_gapless_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 99, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":97
+ * 
+ *     @property
+ *     def gapless(self):             # <<<<<<<<<<<<<<
+ *         """Whether sounds follow each other without any gap or crossfade"""
+ *         return self._gapless
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController.gapless", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/playlist_controller.pyx":102
+ * 
+ *     @property
+ *     def has_prepared_sound(self):             # <<<<<<<<<<<<<<
+ *         """Whether the next sound has been prepared and is waiting for the current sound to finish"""
+ *         return self._prepared_sound_instance is not None
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_17has_prepared_sound(PyObject *__pyx_self, PyObject *__pyx_v_self); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_16has_prepared_sound[] = "PlaylistController.has_prepared_sound(self)\nWhether the next sound has been prepared and is waiting for the current sound to finish";
+static PyMethodDef __pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_17has_prepared_sound = {"has_prepared_sound", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_17has_prepared_sound, METH_O, __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_16has_prepared_sound};
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_17has_prepared_sound(PyObject *__pyx_self, PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("has_prepared_sound (wrapper)", 0);
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_16has_prepared_sound(__pyx_self, ((PyObject *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_16has_prepared_sound(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  __Pyx_RefNannySetupContext("has_prepared_sound", 0);
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":104
+ *     def has_prepared_sound(self):
+ *         """Whether the next sound has been prepared and is waiting for the current sound to finish"""
+ *         return self._prepared_sound_instance is not None             # <<<<<<<<<<<<<<
+ * 
+ *     @property
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_prepared_sound_instance); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 104, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = (__pyx_t_1 != Py_None);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyBool_FromLong(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 104, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":102
+ * 
+ *     @property
+ *     def has_prepared_sound(self):             # <<<<<<<<<<<<<<
+ *         """Whether the next sound has been prepared and is waiting for the current sound to finish"""
+ *         return self._prepared_sound_instance is not None
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController.has_prepared_sound", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/playlist_controller.pyx":107
+ * 
+ *     @property
+ *     def has_pending_request(self):             # <<<<<<<<<<<<<<
+ *         """Whether the playlist controller has a pending request queued until it is not busy"""
+ *         return self._pending_request is not None
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_19has_pending_request(PyObject *__pyx_self, PyObject *__pyx_v_self); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_18has_pending_request[] = "PlaylistController.has_pending_request(self)\nWhether the playlist controller has a pending request queued until it is not busy";
+static PyMethodDef __pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_19has_pending_request = {"has_pending_request", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_19has_pending_request, METH_O, __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_18has_pending_request};
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_19has_pending_request(PyObject *__pyx_self, PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("has_pending_request (wrapper)", 0);
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_18has_pending_request(__pyx_self, ((PyObject *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_18has_pending_request(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  __Pyx_RefNannySetupContext("has_pending_request", 0);
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":109
+ *     def has_pending_request(self):
+ *         """Whether the playlist controller has a pending request queued until it is not busy"""
+ *         return self._pending_request is not None             # <<<<<<<<<<<<<<
+ * 
+ *     def stop_all_sounds(self, float fade_out_seconds = 0.0):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_pending_request); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 109, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = (__pyx_t_1 != Py_None);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyBool_FromLong(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 109, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":107
+ * 
+ *     @property
+ *     def has_pending_request(self):             # <<<<<<<<<<<<<<
+ *         """Whether the playlist controller has a pending request queued until it is not busy"""
+ *         return self._pending_request is not None
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController.has_pending_request", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/playlist_controller.pyx":111
+ *         return self._pending_request is not None
+ * 
+ *     def stop_all_sounds(self, float fade_out_seconds = 0.0):             # <<<<<<<<<<<<<<
+ *         """
+ *         Stops all playing sounds immediately on the playlist track.
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_21stop_all_sounds(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_20stop_all_sounds[] = "PlaylistController.stop_all_sounds(self, float fade_out_seconds=0.0)\n\n        Stops all playing sounds immediately on the playlist track.\n        Args:\n            fade_out_seconds: The number of seconds to fade out the sounds before stopping\n        ";
+static PyMethodDef __pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_21stop_all_sounds = {"stop_all_sounds", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_21stop_all_sounds, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_20stop_all_sounds};
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_21stop_all_sounds(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_self = 0;
+  float __pyx_v_fade_out_seconds;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("stop_all_sounds (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_fade_out_seconds,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_self)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_fade_out_seconds);
+          if (value) { values[1] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "stop_all_sounds") < 0)) __PYX_ERR(0, 111, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_self = values[0];
+    if (values[1]) {
+      __pyx_v_fade_out_seconds = __pyx_PyFloat_AsFloat(values[1]); if (unlikely((__pyx_v_fade_out_seconds == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 111, __pyx_L3_error)
+    } else {
+      __pyx_v_fade_out_seconds = ((float)((double)0.0));
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("stop_all_sounds", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 111, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController.stop_all_sounds", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_20stop_all_sounds(__pyx_self, __pyx_v_self, __pyx_v_fade_out_seconds);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_20stop_all_sounds(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, float __pyx_v_fade_out_seconds) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  __Pyx_RefNannySetupContext("stop_all_sounds", 0);
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":117
+ *             fade_out_seconds: The number of seconds to fade out the sounds before stopping
+ *         """
+ *         self._cancel_prepared_sound()             # <<<<<<<<<<<<<<
+ *         self._track.stop_all_sounds(fade_out_seconds)
+ * 
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_cancel_prepared_sound); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 117, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+    }
+  }
+  if (__pyx_t_3) {
+    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 117, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  } else {
+    __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 117, __pyx_L1_error)
+  }
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":118
+ *         """
+ *         self._cancel_prepared_sound()
+ *         self._track.stop_all_sounds(fade_out_seconds)             # <<<<<<<<<<<<<<
+ * 
+ *         # TODO: playlist housekeeping (stopped events, remove instance, etc.)
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_track_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 118, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_stop_all_sounds); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 118, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = PyFloat_FromDouble(__pyx_v_fade_out_seconds); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 118, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+    }
+  }
+  if (!__pyx_t_4) {
+    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 118, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+  } else {
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_3)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_t_2};
+      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 118, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     } else
     #endif
     #if CYTHON_FAST_PYCCALL
     if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
       PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_t_2};
-      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 86, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 118, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     } else
     #endif
     {
-      __pyx_t_5 = PyTuple_New(1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 86, __pyx_L1_error)
+      __pyx_t_5 = PyTuple_New(1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 118, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4); __pyx_t_4 = NULL;
       __Pyx_GIVEREF(__pyx_t_2);
       PyTuple_SET_ITEM(__pyx_t_5, 0+1, __pyx_t_2);
       __pyx_t_2 = 0;
-      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 86, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 118, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     }
@@ -2713,7 +3639,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":80
+  /* "mpfmc/core/audio/playlist_controller.pyx":111
  *         return self._pending_request is not None
  * 
  *     def stop_all_sounds(self, float fade_out_seconds = 0.0):             # <<<<<<<<<<<<<<
@@ -2738,7 +3664,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/playlist_controller.pyx":90
+/* "mpfmc/core/audio/playlist_controller.pyx":122
  *         # TODO: playlist housekeeping (stopped events, remove instance, etc.)
  * 
  *     def play(self, str playlist not None, str context=None, dict player_settings=None):             # <<<<<<<<<<<<<<
@@ -2747,10 +3673,10 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_17play(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_16play[] = "PlaylistController.play(self, unicode playlist, unicode context=None, dict player_settings=None)\n\n        Immediately play a playlist.\n\n        Args:\n            playlist: The name of the playlist asset object to play.\n            context: The calling context (if any)\n            player_settings: Settings to use for playback\n        ";
-static PyMethodDef __pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_17play = {"play", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_17play, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_16play};
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_17play(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_23play(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_22play[] = "PlaylistController.play(self, unicode playlist, unicode context=None, dict player_settings=None)\n\n        Immediately play a playlist.\n\n        Args:\n            playlist: The name of the playlist asset object to play.\n            context: The calling context (if any)\n            player_settings: Settings to use for playback ('start_sample' starts the playlist,\n                and stops the current one, at an audio clock sample position)\n        ";
+static PyMethodDef __pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_23play = {"play", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_23play, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_22play};
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_23play(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_self = 0;
   PyObject *__pyx_v_playlist = 0;
   PyObject *__pyx_v_context = 0;
@@ -2787,7 +3713,7 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_playlist)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("play", 0, 2, 4, 1); __PYX_ERR(0, 90, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("play", 0, 2, 4, 1); __PYX_ERR(0, 122, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
@@ -2803,7 +3729,7 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "play") < 0)) __PYX_ERR(0, 90, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "play") < 0)) __PYX_ERR(0, 122, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -2824,16 +3750,16 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("play", 0, 2, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 90, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("play", 0, 2, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 122, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController.play", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_playlist), (&PyUnicode_Type), 0, "playlist", 1))) __PYX_ERR(0, 90, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_context), (&PyUnicode_Type), 1, "context", 1))) __PYX_ERR(0, 90, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_player_settings), (&PyDict_Type), 1, "player_settings", 1))) __PYX_ERR(0, 90, __pyx_L1_error)
-  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_16play(__pyx_self, __pyx_v_self, __pyx_v_playlist, __pyx_v_context, __pyx_v_player_settings);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_playlist), (&PyUnicode_Type), 0, "playlist", 1))) __PYX_ERR(0, 122, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_context), (&PyUnicode_Type), 1, "context", 1))) __PYX_ERR(0, 122, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_player_settings), (&PyDict_Type), 1, "player_settings", 1))) __PYX_ERR(0, 122, __pyx_L1_error)
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_22play(__pyx_self, __pyx_v_self, __pyx_v_playlist, __pyx_v_context, __pyx_v_player_settings);
 
   /* function exit code */
   goto __pyx_L0;
@@ -2844,7 +3770,8 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_16play(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_playlist, PyObject *__pyx_v_context, PyObject *__pyx_v_player_settings) {
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_22play(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_playlist, PyObject *__pyx_v_context, PyObject *__pyx_v_player_settings) {
+  PyObject *__pyx_v_start_sample = NULL;
   PyObject *__pyx_v_playlist_instance = NULL;
   PyObject *__pyx_v_event = NULL;
   PyObject *__pyx_v_sound_name = NULL;
@@ -2864,16 +3791,16 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   __Pyx_RefNannySetupContext("play", 0);
   __Pyx_INCREF(__pyx_v_player_settings);
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":100
+  /* "mpfmc/core/audio/playlist_controller.pyx":133
  *         """
  * 
  *         self.log.debug("play - Preparing playlist '%s' for playback.", playlist)             # <<<<<<<<<<<<<<
  * 
  *         if player_settings is None:
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_log); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 100, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_log); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 133, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_debug); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 100, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_debug); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 133, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_t_2 = NULL;
@@ -2891,7 +3818,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   #if CYTHON_FAST_PYCALL
   if (PyFunction_Check(__pyx_t_3)) {
     PyObject *__pyx_temp[3] = {__pyx_t_2, __pyx_kp_u_play_Preparing_playlist_s_for_pl, __pyx_v_playlist};
-    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_4, 2+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 100, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_4, 2+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 133, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_GOTREF(__pyx_t_1);
   } else
@@ -2899,13 +3826,13 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   #if CYTHON_FAST_PYCCALL
   if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
     PyObject *__pyx_temp[3] = {__pyx_t_2, __pyx_kp_u_play_Preparing_playlist_s_for_pl, __pyx_v_playlist};
-    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_4, 2+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 100, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_4, 2+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 133, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_GOTREF(__pyx_t_1);
   } else
   #endif
   {
-    __pyx_t_5 = PyTuple_New(2+__pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 100, __pyx_L1_error)
+    __pyx_t_5 = PyTuple_New(2+__pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 133, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     if (__pyx_t_2) {
       __Pyx_GIVEREF(__pyx_t_2); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_2); __pyx_t_2 = NULL;
@@ -2916,14 +3843,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
     __Pyx_INCREF(__pyx_v_playlist);
     __Pyx_GIVEREF(__pyx_v_playlist);
     PyTuple_SET_ITEM(__pyx_t_5, 1+__pyx_t_4, __pyx_v_playlist);
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 100, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 133, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   }
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":102
+  /* "mpfmc/core/audio/playlist_controller.pyx":135
  *         self.log.debug("play - Preparing playlist '%s' for playback.", playlist)
  * 
  *         if player_settings is None:             # <<<<<<<<<<<<<<
@@ -2934,19 +3861,19 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   __pyx_t_7 = (__pyx_t_6 != 0);
   if (__pyx_t_7) {
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":103
+    /* "mpfmc/core/audio/playlist_controller.pyx":136
  * 
  *         if player_settings is None:
  *             player_settings = dict()             # <<<<<<<<<<<<<<
  * 
- *         if playlist not in self.mc.playlists:
+ *         start_sample = player_settings.get('start_sample')
  */
-    __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 103, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 136, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF_SET(__pyx_v_player_settings, ((PyObject*)__pyx_t_1));
     __pyx_t_1 = 0;
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":102
+    /* "mpfmc/core/audio/playlist_controller.pyx":135
  *         self.log.debug("play - Preparing playlist '%s' for playback.", playlist)
  * 
  *         if player_settings is None:             # <<<<<<<<<<<<<<
@@ -2955,44 +3882,60 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
  */
   }
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":105
+  /* "mpfmc/core/audio/playlist_controller.pyx":138
  *             player_settings = dict()
  * 
- *         if playlist not in self.mc.playlists:             # <<<<<<<<<<<<<<
- *             self.log.error("PlaylistController (%s track): Could not play specified playlist "
- *                            "(%s) as it does not exist", self.name, playlist)
+ *         start_sample = player_settings.get('start_sample')             # <<<<<<<<<<<<<<
+ * 
+ *         if playlist not in self.mc.playlists:
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_mc); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 105, __pyx_L1_error)
+  if (unlikely(__pyx_v_player_settings == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "get");
+    __PYX_ERR(0, 138, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_PyDict_GetItemDefault(__pyx_v_player_settings, __pyx_n_u_start_sample, Py_None); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 138, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_playlists); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 105, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_v_start_sample = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":140
+ *         start_sample = player_settings.get('start_sample')
+ * 
+ *         if playlist not in self.mc.playlists:             # <<<<<<<<<<<<<<
+ *             self.log.error("PlaylistController (%s track): Could not play specified playlist "
+ *                            "(%s) as it does not exist", self.name, playlist)
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_mc); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 140, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_playlists); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 140, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_7 = (__Pyx_PySequence_ContainsTF(__pyx_v_playlist, __pyx_t_3, Py_NE)); if (unlikely(__pyx_t_7 < 0)) __PYX_ERR(0, 105, __pyx_L1_error)
+  __pyx_t_7 = (__Pyx_PySequence_ContainsTF(__pyx_v_playlist, __pyx_t_3, Py_NE)); if (unlikely(__pyx_t_7 < 0)) __PYX_ERR(0, 140, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __pyx_t_6 = (__pyx_t_7 != 0);
   if (__pyx_t_6) {
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":106
+    /* "mpfmc/core/audio/playlist_controller.pyx":141
  * 
  *         if playlist not in self.mc.playlists:
  *             self.log.error("PlaylistController (%s track): Could not play specified playlist "             # <<<<<<<<<<<<<<
  *                            "(%s) as it does not exist", self.name, playlist)
  *             return None
  */
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_log); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 106, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_log); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 141, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_error); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 106, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_error); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 141, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":107
+    /* "mpfmc/core/audio/playlist_controller.pyx":142
  *         if playlist not in self.mc.playlists:
  *             self.log.error("PlaylistController (%s track): Could not play specified playlist "
  *                            "(%s) as it does not exist", self.name, playlist)             # <<<<<<<<<<<<<<
  *             return None
  * 
  */
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_name); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 107, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_name); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 142, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __pyx_t_2 = NULL;
     __pyx_t_4 = 0;
@@ -3009,7 +3952,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
     #if CYTHON_FAST_PYCALL
     if (PyFunction_Check(__pyx_t_5)) {
       PyObject *__pyx_temp[4] = {__pyx_t_2, __pyx_kp_u_PlaylistController_s_track_Could, __pyx_t_1, __pyx_v_playlist};
-      __pyx_t_3 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_4, 3+__pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 106, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_4, 3+__pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 141, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -3018,14 +3961,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
     #if CYTHON_FAST_PYCCALL
     if (__Pyx_PyFastCFunction_Check(__pyx_t_5)) {
       PyObject *__pyx_temp[4] = {__pyx_t_2, __pyx_kp_u_PlaylistController_s_track_Could, __pyx_t_1, __pyx_v_playlist};
-      __pyx_t_3 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_4, 3+__pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 106, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_4, 3+__pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 141, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     } else
     #endif
     {
-      __pyx_t_8 = PyTuple_New(3+__pyx_t_4); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 106, __pyx_L1_error)
+      __pyx_t_8 = PyTuple_New(3+__pyx_t_4); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 141, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_8);
       if (__pyx_t_2) {
         __Pyx_GIVEREF(__pyx_t_2); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_2); __pyx_t_2 = NULL;
@@ -3039,27 +3982,27 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
       __Pyx_GIVEREF(__pyx_v_playlist);
       PyTuple_SET_ITEM(__pyx_t_8, 2+__pyx_t_4, __pyx_v_playlist);
       __pyx_t_1 = 0;
-      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_8, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 106, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_8, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 141, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
     }
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":108
+    /* "mpfmc/core/audio/playlist_controller.pyx":143
  *             self.log.error("PlaylistController (%s track): Could not play specified playlist "
  *                            "(%s) as it does not exist", self.name, playlist)
  *             return None             # <<<<<<<<<<<<<<
  * 
- *         # Is there already a previous playlist that is still active (fading)?
+ *         # A sound prepared for the current playlist will not be played
  */
     __Pyx_XDECREF(__pyx_r);
     __Pyx_INCREF(Py_None);
     __pyx_r = Py_None;
     goto __pyx_L0;
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":105
- *             player_settings = dict()
+    /* "mpfmc/core/audio/playlist_controller.pyx":140
+ *         start_sample = player_settings.get('start_sample')
  * 
  *         if playlist not in self.mc.playlists:             # <<<<<<<<<<<<<<
  *             self.log.error("PlaylistController (%s track): Could not play specified playlist "
@@ -3067,14 +4010,43 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
  */
   }
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":111
+  /* "mpfmc/core/audio/playlist_controller.pyx":146
+ * 
+ *         # A sound prepared for the current playlist will not be played
+ *         self._cancel_prepared_sound()             # <<<<<<<<<<<<<<
+ * 
+ *         # Is there already a previous playlist that is still active (fading)?
+ */
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_cancel_prepared_sound); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 146, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_8 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
+    __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_5);
+    if (likely(__pyx_t_8)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+      __Pyx_INCREF(__pyx_t_8);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_5, function);
+    }
+  }
+  if (__pyx_t_8) {
+    __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 146, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  } else {
+    __pyx_t_3 = __Pyx_PyObject_CallNoArg(__pyx_t_5); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 146, __pyx_L1_error)
+  }
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":149
  * 
  *         # Is there already a previous playlist that is still active (fading)?
  *         if self._is_busy():             # <<<<<<<<<<<<<<
  *             # Delay play playlist until track is finished with current crossfade (too busy)
  *             self._pending_request = partial(self.play, playlist=playlist, context=context,
  */
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_is_busy); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 111, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_is_busy); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 149, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __pyx_t_8 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
@@ -3087,80 +4059,80 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
     }
   }
   if (__pyx_t_8) {
-    __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 111, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 149, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
   } else {
-    __pyx_t_3 = __Pyx_PyObject_CallNoArg(__pyx_t_5); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 111, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_CallNoArg(__pyx_t_5); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 149, __pyx_L1_error)
   }
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(0, 111, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(0, 149, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   if (__pyx_t_6) {
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":113
+    /* "mpfmc/core/audio/playlist_controller.pyx":151
  *         if self._is_busy():
  *             # Delay play playlist until track is finished with current crossfade (too busy)
  *             self._pending_request = partial(self.play, playlist=playlist, context=context,             # <<<<<<<<<<<<<<
  *                                             player_settings=player_settings)
  * 
  */
-    __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_partial); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 113, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_partial); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 151, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_play); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 113, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_play); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 151, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_8 = PyTuple_New(1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 113, __pyx_L1_error)
+    __pyx_t_8 = PyTuple_New(1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 151, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_8);
     __Pyx_GIVEREF(__pyx_t_5);
     PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_5);
     __pyx_t_5 = 0;
-    __pyx_t_5 = __Pyx_PyDict_NewPresized(3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 113, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyDict_NewPresized(3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 151, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
-    if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_playlist, __pyx_v_playlist) < 0) __PYX_ERR(0, 113, __pyx_L1_error)
-    if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_context, __pyx_v_context) < 0) __PYX_ERR(0, 113, __pyx_L1_error)
+    if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_playlist, __pyx_v_playlist) < 0) __PYX_ERR(0, 151, __pyx_L1_error)
+    if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_context, __pyx_v_context) < 0) __PYX_ERR(0, 151, __pyx_L1_error)
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":114
+    /* "mpfmc/core/audio/playlist_controller.pyx":152
  *             # Delay play playlist until track is finished with current crossfade (too busy)
  *             self._pending_request = partial(self.play, playlist=playlist, context=context,
  *                                             player_settings=player_settings)             # <<<<<<<<<<<<<<
  * 
  *             self.log.debug("play - Playlist track is too busy. Delaying play playlist call.")
  */
-    if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_player_settings, __pyx_v_player_settings) < 0) __PYX_ERR(0, 113, __pyx_L1_error)
+    if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_player_settings, __pyx_v_player_settings) < 0) __PYX_ERR(0, 151, __pyx_L1_error)
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":113
+    /* "mpfmc/core/audio/playlist_controller.pyx":151
  *         if self._is_busy():
  *             # Delay play playlist until track is finished with current crossfade (too busy)
  *             self._pending_request = partial(self.play, playlist=playlist, context=context,             # <<<<<<<<<<<<<<
  *                                             player_settings=player_settings)
  * 
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_8, __pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 113, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_8, __pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 151, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_pending_request, __pyx_t_1) < 0) __PYX_ERR(0, 113, __pyx_L1_error)
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_pending_request, __pyx_t_1) < 0) __PYX_ERR(0, 151, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":116
+    /* "mpfmc/core/audio/playlist_controller.pyx":154
  *                                             player_settings=player_settings)
  * 
  *             self.log.debug("play - Playlist track is too busy. Delaying play playlist call.")             # <<<<<<<<<<<<<<
  *             return None
  * 
  */
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_log); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 116, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_log); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 154, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_debug); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 116, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_debug); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 154, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 116, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 154, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":117
+    /* "mpfmc/core/audio/playlist_controller.pyx":155
  * 
  *             self.log.debug("play - Playlist track is too busy. Delaying play playlist call.")
  *             return None             # <<<<<<<<<<<<<<
@@ -3172,7 +4144,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
     __pyx_r = Py_None;
     goto __pyx_L0;
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":111
+    /* "mpfmc/core/audio/playlist_controller.pyx":149
  * 
  *         # Is there already a previous playlist that is still active (fading)?
  *         if self._is_busy():             # <<<<<<<<<<<<<<
@@ -3181,43 +4153,43 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
  */
   }
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":120
+  /* "mpfmc/core/audio/playlist_controller.pyx":158
  * 
  *         # Determine settings (override playlist with player settings)
  *         playlist_instance = PlaylistInstance(playlist,             # <<<<<<<<<<<<<<
  *                                              self.mc.playlists[playlist],
  *                                              self.crossfade_time,
  */
-  __pyx_t_5 = __Pyx_GetModuleGlobalName(__pyx_n_s_PlaylistInstance); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 120, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_GetModuleGlobalName(__pyx_n_s_PlaylistInstance); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 158, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":121
+  /* "mpfmc/core/audio/playlist_controller.pyx":159
  *         # Determine settings (override playlist with player settings)
  *         playlist_instance = PlaylistInstance(playlist,
  *                                              self.mc.playlists[playlist],             # <<<<<<<<<<<<<<
  *                                              self.crossfade_time,
  *                                              context,
  */
-  __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_mc); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 121, __pyx_L1_error)
+  __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_mc); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 159, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_8);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_n_s_playlists); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 121, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_n_s_playlists); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 159, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-  __pyx_t_8 = PyObject_GetItem(__pyx_t_3, __pyx_v_playlist); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 121, __pyx_L1_error)
+  __pyx_t_8 = PyObject_GetItem(__pyx_t_3, __pyx_v_playlist); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 159, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_8);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":122
+  /* "mpfmc/core/audio/playlist_controller.pyx":160
  *         playlist_instance = PlaylistInstance(playlist,
  *                                              self.mc.playlists[playlist],
  *                                              self.crossfade_time,             # <<<<<<<<<<<<<<
  *                                              context,
  *                                              player_settings)
  */
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_crossfade_time); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 122, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_crossfade_time); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 160, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":124
+  /* "mpfmc/core/audio/playlist_controller.pyx":162
  *                                              self.crossfade_time,
  *                                              context,
  *                                              player_settings)             # <<<<<<<<<<<<<<
@@ -3239,7 +4211,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   #if CYTHON_FAST_PYCALL
   if (PyFunction_Check(__pyx_t_5)) {
     PyObject *__pyx_temp[6] = {__pyx_t_2, __pyx_v_playlist, __pyx_t_8, __pyx_t_3, __pyx_v_context, __pyx_v_player_settings};
-    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_4, 5+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 120, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_4, 5+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 158, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
@@ -3249,7 +4221,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   #if CYTHON_FAST_PYCCALL
   if (__Pyx_PyFastCFunction_Check(__pyx_t_5)) {
     PyObject *__pyx_temp[6] = {__pyx_t_2, __pyx_v_playlist, __pyx_t_8, __pyx_t_3, __pyx_v_context, __pyx_v_player_settings};
-    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_4, 5+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 120, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_4, 5+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 158, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
@@ -3257,7 +4229,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   } else
   #endif
   {
-    __pyx_t_9 = PyTuple_New(5+__pyx_t_4); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 120, __pyx_L1_error)
+    __pyx_t_9 = PyTuple_New(5+__pyx_t_4); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 158, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_9);
     if (__pyx_t_2) {
       __Pyx_GIVEREF(__pyx_t_2); PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_2); __pyx_t_2 = NULL;
@@ -3277,7 +4249,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
     PyTuple_SET_ITEM(__pyx_t_9, 4+__pyx_t_4, __pyx_v_player_settings);
     __pyx_t_8 = 0;
     __pyx_t_3 = 0;
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_9, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 120, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_9, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 158, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
   }
@@ -3285,27 +4257,27 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   __pyx_v_playlist_instance = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":127
+  /* "mpfmc/core/audio/playlist_controller.pyx":165
  * 
  *         # Is there already a playlist playing?
  *         if self._current_playlist:             # <<<<<<<<<<<<<<
  *             # Already a playlist playing.  We know there is at least one free sound player because
  *             # of the _is_busy() call above.
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 127, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 165, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(0, 127, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(0, 165, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   if (__pyx_t_6) {
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":131
+    /* "mpfmc/core/audio/playlist_controller.pyx":169
  *             # of the _is_busy() call above.
  *             # Stop the current playlist
- *             self.stop()             # <<<<<<<<<<<<<<
+ *             self.stop(start_sample)             # <<<<<<<<<<<<<<
  * 
  *         # Start the new playlist (now becomes the current playlist)
  */
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_stop); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 131, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_stop); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 169, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __pyx_t_9 = NULL;
     if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
@@ -3317,17 +4289,42 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
         __Pyx_DECREF_SET(__pyx_t_5, function);
       }
     }
-    if (__pyx_t_9) {
-      __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_9); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 131, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    if (!__pyx_t_9) {
+      __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_v_start_sample); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 169, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
     } else {
-      __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 131, __pyx_L1_error)
+      #if CYTHON_FAST_PYCALL
+      if (PyFunction_Check(__pyx_t_5)) {
+        PyObject *__pyx_temp[2] = {__pyx_t_9, __pyx_v_start_sample};
+        __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 169, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __Pyx_GOTREF(__pyx_t_1);
+      } else
+      #endif
+      #if CYTHON_FAST_PYCCALL
+      if (__Pyx_PyFastCFunction_Check(__pyx_t_5)) {
+        PyObject *__pyx_temp[2] = {__pyx_t_9, __pyx_v_start_sample};
+        __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 169, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __Pyx_GOTREF(__pyx_t_1);
+      } else
+      #endif
+      {
+        __pyx_t_3 = PyTuple_New(1+1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 169, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __Pyx_GIVEREF(__pyx_t_9); PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_9); __pyx_t_9 = NULL;
+        __Pyx_INCREF(__pyx_v_start_sample);
+        __Pyx_GIVEREF(__pyx_v_start_sample);
+        PyTuple_SET_ITEM(__pyx_t_3, 0+1, __pyx_v_start_sample);
+        __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_3, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 169, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      }
     }
-    __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":127
+    /* "mpfmc/core/audio/playlist_controller.pyx":165
  * 
  *         # Is there already a playlist playing?
  *         if self._current_playlist:             # <<<<<<<<<<<<<<
@@ -3336,34 +4333,43 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
  */
   }
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":134
+  /* "mpfmc/core/audio/playlist_controller.pyx":172
  * 
  *         # Start the new playlist (now becomes the current playlist)
  *         self._current_playlist = playlist_instance             # <<<<<<<<<<<<<<
+ *         self._next_sound_name = None
+ * 
+ */
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist, __pyx_v_playlist_instance) < 0) __PYX_ERR(0, 172, __pyx_L1_error)
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":173
+ *         # Start the new playlist (now becomes the current playlist)
+ *         self._current_playlist = playlist_instance
+ *         self._next_sound_name = None             # <<<<<<<<<<<<<<
  * 
  *         # Post events when played for playlist
  */
-  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist, __pyx_v_playlist_instance) < 0) __PYX_ERR(0, 134, __pyx_L1_error)
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_next_sound_name, Py_None) < 0) __PYX_ERR(0, 173, __pyx_L1_error)
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":137
+  /* "mpfmc/core/audio/playlist_controller.pyx":176
  * 
  *         # Post events when played for playlist
  *         for event in self._current_playlist.events_when_played:             # <<<<<<<<<<<<<<
  *             self.mc.post_mc_native_event(event)
  * 
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 137, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 176, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_events_when_played); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 137, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_events_when_played); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 176, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   if (likely(PyList_CheckExact(__pyx_t_5)) || PyTuple_CheckExact(__pyx_t_5)) {
     __pyx_t_1 = __pyx_t_5; __Pyx_INCREF(__pyx_t_1); __pyx_t_10 = 0;
     __pyx_t_11 = NULL;
   } else {
-    __pyx_t_10 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 137, __pyx_L1_error)
+    __pyx_t_10 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 176, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_11 = Py_TYPE(__pyx_t_1)->tp_iternext; if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 137, __pyx_L1_error)
+    __pyx_t_11 = Py_TYPE(__pyx_t_1)->tp_iternext; if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 176, __pyx_L1_error)
   }
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   for (;;) {
@@ -3371,17 +4377,17 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
       if (likely(PyList_CheckExact(__pyx_t_1))) {
         if (__pyx_t_10 >= PyList_GET_SIZE(__pyx_t_1)) break;
         #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_5 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_10); __Pyx_INCREF(__pyx_t_5); __pyx_t_10++; if (unlikely(0 < 0)) __PYX_ERR(0, 137, __pyx_L1_error)
+        __pyx_t_5 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_10); __Pyx_INCREF(__pyx_t_5); __pyx_t_10++; if (unlikely(0 < 0)) __PYX_ERR(0, 176, __pyx_L1_error)
         #else
-        __pyx_t_5 = PySequence_ITEM(__pyx_t_1, __pyx_t_10); __pyx_t_10++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 137, __pyx_L1_error)
+        __pyx_t_5 = PySequence_ITEM(__pyx_t_1, __pyx_t_10); __pyx_t_10++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 176, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_5);
         #endif
       } else {
         if (__pyx_t_10 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
         #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_5 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_10); __Pyx_INCREF(__pyx_t_5); __pyx_t_10++; if (unlikely(0 < 0)) __PYX_ERR(0, 137, __pyx_L1_error)
+        __pyx_t_5 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_10); __Pyx_INCREF(__pyx_t_5); __pyx_t_10++; if (unlikely(0 < 0)) __PYX_ERR(0, 176, __pyx_L1_error)
         #else
-        __pyx_t_5 = PySequence_ITEM(__pyx_t_1, __pyx_t_10); __pyx_t_10++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 137, __pyx_L1_error)
+        __pyx_t_5 = PySequence_ITEM(__pyx_t_1, __pyx_t_10); __pyx_t_10++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 176, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_5);
         #endif
       }
@@ -3391,7 +4397,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
         PyObject* exc_type = PyErr_Occurred();
         if (exc_type) {
           if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-          else __PYX_ERR(0, 137, __pyx_L1_error)
+          else __PYX_ERR(0, 176, __pyx_L1_error)
         }
         break;
       }
@@ -3400,64 +4406,64 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
     __Pyx_XDECREF_SET(__pyx_v_event, __pyx_t_5);
     __pyx_t_5 = 0;
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":138
+    /* "mpfmc/core/audio/playlist_controller.pyx":177
  *         # Post events when played for playlist
  *         for event in self._current_playlist.events_when_played:
  *             self.mc.post_mc_native_event(event)             # <<<<<<<<<<<<<<
  * 
  *         # Get the next sound to play from playlist
  */
-    __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_mc); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 138, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_9);
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_9, __pyx_n_s_post_mc_native_event); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 138, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_mc); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 177, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-    __pyx_t_9 = NULL;
-    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
-      __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_3);
-      if (likely(__pyx_t_9)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-        __Pyx_INCREF(__pyx_t_9);
+    __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_post_mc_native_event); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 177, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_9);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+        __Pyx_INCREF(__pyx_t_3);
         __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_3, function);
+        __Pyx_DECREF_SET(__pyx_t_9, function);
       }
     }
-    if (!__pyx_t_9) {
-      __pyx_t_5 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_event); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 138, __pyx_L1_error)
+    if (!__pyx_t_3) {
+      __pyx_t_5 = __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_v_event); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 177, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_5);
     } else {
       #if CYTHON_FAST_PYCALL
-      if (PyFunction_Check(__pyx_t_3)) {
-        PyObject *__pyx_temp[2] = {__pyx_t_9, __pyx_v_event};
-        __pyx_t_5 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 138, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+      if (PyFunction_Check(__pyx_t_9)) {
+        PyObject *__pyx_temp[2] = {__pyx_t_3, __pyx_v_event};
+        __pyx_t_5 = __Pyx_PyFunction_FastCall(__pyx_t_9, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 177, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
         __Pyx_GOTREF(__pyx_t_5);
       } else
       #endif
       #if CYTHON_FAST_PYCCALL
-      if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
-        PyObject *__pyx_temp[2] = {__pyx_t_9, __pyx_v_event};
-        __pyx_t_5 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 138, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+      if (__Pyx_PyFastCFunction_Check(__pyx_t_9)) {
+        PyObject *__pyx_temp[2] = {__pyx_t_3, __pyx_v_event};
+        __pyx_t_5 = __Pyx_PyCFunction_FastCall(__pyx_t_9, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 177, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
         __Pyx_GOTREF(__pyx_t_5);
       } else
       #endif
       {
-        __pyx_t_8 = PyTuple_New(1+1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 138, __pyx_L1_error)
+        __pyx_t_8 = PyTuple_New(1+1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 177, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_8);
-        __Pyx_GIVEREF(__pyx_t_9); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_9); __pyx_t_9 = NULL;
+        __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_3); __pyx_t_3 = NULL;
         __Pyx_INCREF(__pyx_v_event);
         __Pyx_GIVEREF(__pyx_v_event);
         PyTuple_SET_ITEM(__pyx_t_8, 0+1, __pyx_v_event);
-        __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_8, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 138, __pyx_L1_error)
+        __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_9, __pyx_t_8, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 177, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_5);
         __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
       }
     }
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":137
+    /* "mpfmc/core/audio/playlist_controller.pyx":176
  * 
  *         # Post events when played for playlist
  *         for event in self._current_playlist.events_when_played:             # <<<<<<<<<<<<<<
@@ -3467,101 +4473,70 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   }
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":141
+  /* "mpfmc/core/audio/playlist_controller.pyx":180
  * 
  *         # Get the next sound to play from playlist
  *         sound_name = self._current_playlist.get_next_sound_name()             # <<<<<<<<<<<<<<
- *         self._play_playlist_sound(sound_name, self._current_playlist)
+ *         self._play_playlist_sound(sound_name, self._current_playlist, start_sample=start_sample)
  * 
  */
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 141, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 180, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_get_next_sound_name); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 141, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_get_next_sound_name); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 180, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __pyx_t_5 = NULL;
-  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
-    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_9);
     if (likely(__pyx_t_5)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
       __Pyx_INCREF(__pyx_t_5);
       __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_3, function);
+      __Pyx_DECREF_SET(__pyx_t_9, function);
     }
   }
   if (__pyx_t_5) {
-    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 141, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 180, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   } else {
-    __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 141, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_t_9); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 180, __pyx_L1_error)
   }
   __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
   __pyx_v_sound_name = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":142
+  /* "mpfmc/core/audio/playlist_controller.pyx":181
  *         # Get the next sound to play from playlist
  *         sound_name = self._current_playlist.get_next_sound_name()
- *         self._play_playlist_sound(sound_name, self._current_playlist)             # <<<<<<<<<<<<<<
+ *         self._play_playlist_sound(sound_name, self._current_playlist, start_sample=start_sample)             # <<<<<<<<<<<<<<
  * 
  *         return playlist_instance
  */
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_play_playlist_sound); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 142, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 142, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_play_playlist_sound); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 181, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 181, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 181, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_8 = NULL;
-  __pyx_t_4 = 0;
-  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
-    __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_3);
-    if (likely(__pyx_t_8)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-      __Pyx_INCREF(__pyx_t_8);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_3, function);
-      __pyx_t_4 = 1;
-    }
-  }
-  #if CYTHON_FAST_PYCALL
-  if (PyFunction_Check(__pyx_t_3)) {
-    PyObject *__pyx_temp[3] = {__pyx_t_8, __pyx_v_sound_name, __pyx_t_5};
-    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_4, 2+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 142, __pyx_L1_error)
-    __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  } else
-  #endif
-  #if CYTHON_FAST_PYCCALL
-  if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
-    PyObject *__pyx_temp[3] = {__pyx_t_8, __pyx_v_sound_name, __pyx_t_5};
-    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_4, 2+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 142, __pyx_L1_error)
-    __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  } else
-  #endif
-  {
-    __pyx_t_9 = PyTuple_New(2+__pyx_t_4); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 142, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_9);
-    if (__pyx_t_8) {
-      __Pyx_GIVEREF(__pyx_t_8); PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_8); __pyx_t_8 = NULL;
-    }
-    __Pyx_INCREF(__pyx_v_sound_name);
-    __Pyx_GIVEREF(__pyx_v_sound_name);
-    PyTuple_SET_ITEM(__pyx_t_9, 0+__pyx_t_4, __pyx_v_sound_name);
-    __Pyx_GIVEREF(__pyx_t_5);
-    PyTuple_SET_ITEM(__pyx_t_9, 1+__pyx_t_4, __pyx_t_5);
-    __pyx_t_5 = 0;
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_9, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 142, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-  }
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_INCREF(__pyx_v_sound_name);
+  __Pyx_GIVEREF(__pyx_v_sound_name);
+  PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_v_sound_name);
+  __Pyx_GIVEREF(__pyx_t_9);
+  PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_t_9);
+  __pyx_t_9 = 0;
+  __pyx_t_9 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 181, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  if (PyDict_SetItem(__pyx_t_9, __pyx_n_s_start_sample, __pyx_v_start_sample) < 0) __PYX_ERR(0, 181, __pyx_L1_error)
+  __pyx_t_8 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_5, __pyx_t_9); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 181, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":144
- *         self._play_playlist_sound(sound_name, self._current_playlist)
+  /* "mpfmc/core/audio/playlist_controller.pyx":183
+ *         self._play_playlist_sound(sound_name, self._current_playlist, start_sample=start_sample)
  * 
  *         return playlist_instance             # <<<<<<<<<<<<<<
  * 
@@ -3572,7 +4547,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   __pyx_r = __pyx_v_playlist_instance;
   goto __pyx_L0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":90
+  /* "mpfmc/core/audio/playlist_controller.pyx":122
  *         # TODO: playlist housekeeping (stopped events, remove instance, etc.)
  * 
  *     def play(self, str playlist not None, str context=None, dict player_settings=None):             # <<<<<<<<<<<<<<
@@ -3591,6 +4566,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController.play", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_start_sample);
   __Pyx_XDECREF(__pyx_v_playlist_instance);
   __Pyx_XDECREF(__pyx_v_event);
   __Pyx_XDECREF(__pyx_v_sound_name);
@@ -3600,7 +4576,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/playlist_controller.pyx":146
+/* "mpfmc/core/audio/playlist_controller.pyx":185
  *         return playlist_instance
  * 
  *     def _is_busy(self):             # <<<<<<<<<<<<<<
@@ -3609,21 +4585,21 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_19_is_busy(PyObject *__pyx_self, PyObject *__pyx_v_self); /*proto*/
-static char __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_18_is_busy[] = "PlaylistController._is_busy(self)\nReturns whether or not all the sound players for the playlist track are currently busy";
-static PyMethodDef __pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_19_is_busy = {"_is_busy", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_19_is_busy, METH_O, __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_18_is_busy};
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_19_is_busy(PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_25_is_busy(PyObject *__pyx_self, PyObject *__pyx_v_self); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_24_is_busy[] = "PlaylistController._is_busy(self)\nReturns whether or not all the sound players for the playlist track are currently busy";
+static PyMethodDef __pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_25_is_busy = {"_is_busy", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_25_is_busy, METH_O, __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_24_is_busy};
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_25_is_busy(PyObject *__pyx_self, PyObject *__pyx_v_self) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("_is_busy (wrapper)", 0);
-  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_18_is_busy(__pyx_self, ((PyObject *)__pyx_v_self));
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_24_is_busy(__pyx_self, ((PyObject *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_18_is_busy(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_24_is_busy(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -3632,16 +4608,16 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   int __pyx_t_4;
   __Pyx_RefNannySetupContext("_is_busy", 0);
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":148
+  /* "mpfmc/core/audio/playlist_controller.pyx":187
  *     def _is_busy(self):
  *         """Returns whether or not all the sound players for the playlist track are currently busy"""
  *         if self._track.get_sound_players_in_use_count() > 1:             # <<<<<<<<<<<<<<
  *             return True
  *         else:
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_track_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 148, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_track_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 187, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_get_sound_players_in_use_count); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 148, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_get_sound_players_in_use_count); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 187, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_t_2 = NULL;
@@ -3655,20 +4631,20 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
     }
   }
   if (__pyx_t_2) {
-    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 148, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 187, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   } else {
-    __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 148, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 187, __pyx_L1_error)
   }
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = PyObject_RichCompare(__pyx_t_1, __pyx_int_1, Py_GT); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 148, __pyx_L1_error)
+  __pyx_t_3 = PyObject_RichCompare(__pyx_t_1, __pyx_int_1, Py_GT); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 187, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(0, 148, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(0, 187, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   if (__pyx_t_4) {
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":149
+    /* "mpfmc/core/audio/playlist_controller.pyx":188
  *         """Returns whether or not all the sound players for the playlist track are currently busy"""
  *         if self._track.get_sound_players_in_use_count() > 1:
  *             return True             # <<<<<<<<<<<<<<
@@ -3680,7 +4656,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
     __pyx_r = Py_True;
     goto __pyx_L0;
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":148
+    /* "mpfmc/core/audio/playlist_controller.pyx":187
  *     def _is_busy(self):
  *         """Returns whether or not all the sound players for the playlist track are currently busy"""
  *         if self._track.get_sound_players_in_use_count() > 1:             # <<<<<<<<<<<<<<
@@ -3689,12 +4665,12 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
  */
   }
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":151
+  /* "mpfmc/core/audio/playlist_controller.pyx":190
  *             return True
  *         else:
  *             return False             # <<<<<<<<<<<<<<
  * 
- *     def _play_playlist_sound(self, str sound_name, object playlist, float fade_in=0.0):
+ *     def _play_playlist_sound(self, str sound_name, object playlist, float fade_in=0.0, start_sample=None):
  */
   /*else*/ {
     __Pyx_XDECREF(__pyx_r);
@@ -3703,7 +4679,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
     goto __pyx_L0;
   }
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":146
+  /* "mpfmc/core/audio/playlist_controller.pyx":185
  *         return playlist_instance
  * 
  *     def _is_busy(self):             # <<<<<<<<<<<<<<
@@ -3724,33 +4700,37 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/playlist_controller.pyx":153
+/* "mpfmc/core/audio/playlist_controller.pyx":192
  *             return False
  * 
- *     def _play_playlist_sound(self, str sound_name, object playlist, float fade_in=0.0):             # <<<<<<<<<<<<<<
+ *     def _play_playlist_sound(self, str sound_name, object playlist, float fade_in=0.0, start_sample=None):             # <<<<<<<<<<<<<<
  *         """
  *         Plays the specified playlist sound
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_21_play_playlist_sound(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_20_play_playlist_sound[] = "PlaylistController._play_playlist_sound(self, unicode sound_name, playlist, float fade_in=0.0)\n\n        Plays the specified playlist sound\n        Args:\n            sound_name: The name of the sound to start playing\n            playlist: The playlist from which the sound came from\n            fade_in: The number of seconds over which to fade in the sound (frequently the\n                crossfade time).\n\n        ";
-static PyMethodDef __pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_21_play_playlist_sound = {"_play_playlist_sound", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_21_play_playlist_sound, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_20_play_playlist_sound};
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_21_play_playlist_sound(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_27_play_playlist_sound(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_26_play_playlist_sound[] = "PlaylistController._play_playlist_sound(self, unicode sound_name, playlist, float fade_in=0.0, start_sample=None)\n\n        Plays the specified playlist sound\n        Args:\n            sound_name: The name of the sound to start playing\n            playlist: The playlist from which the sound came from\n            fade_in: The number of seconds over which to fade in the sound (frequently the\n                crossfade time).\n            start_sample: The audio clock sample position at which to start the sound (None\n                to start it as soon as possible).\n\n        ";
+static PyMethodDef __pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_27_play_playlist_sound = {"_play_playlist_sound", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_27_play_playlist_sound, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_26_play_playlist_sound};
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_27_play_playlist_sound(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_self = 0;
   PyObject *__pyx_v_sound_name = 0;
   PyObject *__pyx_v_playlist = 0;
   float __pyx_v_fade_in;
+  PyObject *__pyx_v_start_sample = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("_play_playlist_sound (wrapper)", 0);
   {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_sound_name,&__pyx_n_s_playlist,&__pyx_n_s_fade_in,0};
-    PyObject* values[4] = {0,0,0,0};
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_sound_name,&__pyx_n_s_playlist,&__pyx_n_s_fade_in,&__pyx_n_s_start_sample,0};
+    PyObject* values[5] = {0,0,0,0,0};
+    values[4] = ((PyObject *)((PyObject *)Py_None));
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
       switch (pos_args) {
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
         case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
         CYTHON_FALLTHROUGH;
         case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
@@ -3771,13 +4751,13 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_sound_name)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("_play_playlist_sound", 0, 3, 4, 1); __PYX_ERR(0, 153, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("_play_playlist_sound", 0, 3, 5, 1); __PYX_ERR(0, 192, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_playlist)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("_play_playlist_sound", 0, 3, 4, 2); __PYX_ERR(0, 153, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("_play_playlist_sound", 0, 3, 5, 2); __PYX_ERR(0, 192, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  3:
@@ -3785,12 +4765,20 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
           PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_fade_in);
           if (value) { values[3] = value; kw_args--; }
         }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (kw_args > 0) {
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_start_sample);
+          if (value) { values[4] = value; kw_args--; }
+        }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "_play_playlist_sound") < 0)) __PYX_ERR(0, 153, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "_play_playlist_sound") < 0)) __PYX_ERR(0, 192, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
         case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
         CYTHON_FALLTHROUGH;
         case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
@@ -3804,21 +4792,22 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
     __pyx_v_sound_name = ((PyObject*)values[1]);
     __pyx_v_playlist = values[2];
     if (values[3]) {
-      __pyx_v_fade_in = __pyx_PyFloat_AsFloat(values[3]); if (unlikely((__pyx_v_fade_in == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 153, __pyx_L3_error)
+      __pyx_v_fade_in = __pyx_PyFloat_AsFloat(values[3]); if (unlikely((__pyx_v_fade_in == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 192, __pyx_L3_error)
     } else {
       __pyx_v_fade_in = ((float)((double)0.0));
     }
+    __pyx_v_start_sample = values[4];
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("_play_playlist_sound", 0, 3, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 153, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("_play_playlist_sound", 0, 3, 5, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 192, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController._play_playlist_sound", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_sound_name), (&PyUnicode_Type), 1, "sound_name", 1))) __PYX_ERR(0, 153, __pyx_L1_error)
-  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_20_play_playlist_sound(__pyx_self, __pyx_v_self, __pyx_v_sound_name, __pyx_v_playlist, __pyx_v_fade_in);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_sound_name), (&PyUnicode_Type), 1, "sound_name", 1))) __PYX_ERR(0, 192, __pyx_L1_error)
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_26_play_playlist_sound(__pyx_self, __pyx_v_self, __pyx_v_sound_name, __pyx_v_playlist, __pyx_v_fade_in, __pyx_v_start_sample);
 
   /* function exit code */
   goto __pyx_L0;
@@ -3829,374 +4818,106 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_20_play_playlist_sound(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_sound_name, PyObject *__pyx_v_playlist, float __pyx_v_fade_in) {
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_26_play_playlist_sound(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_sound_name, PyObject *__pyx_v_playlist, float __pyx_v_fade_in, PyObject *__pyx_v_start_sample) {
   PyObject *__pyx_v_sound = NULL;
-  PyObject *__pyx_v_events_when_stopped = NULL;
-  PyObject *__pyx_v_events_when_about_to_finish = NULL;
   PyObject *__pyx_v_event = NULL;
+  PyObject *__pyx_v_settings = NULL;
   PyObject *__pyx_v_sound_instance = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
-  int __pyx_t_3;
-  int __pyx_t_4;
+  Py_ssize_t __pyx_t_3;
+  PyObject *(*__pyx_t_4)(PyObject *);
   PyObject *__pyx_t_5 = NULL;
   PyObject *__pyx_t_6 = NULL;
   PyObject *__pyx_t_7 = NULL;
-  Py_ssize_t __pyx_t_8;
-  PyObject *(*__pyx_t_9)(PyObject *);
-  int __pyx_t_10;
-  PyObject *__pyx_t_11 = NULL;
+  int __pyx_t_8;
   __Pyx_RefNannySetupContext("_play_playlist_sound", 0);
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":165
+  /* "mpfmc/core/audio/playlist_controller.pyx":206
  * 
  *         # Create sound instance
  *         sound = self.mc.sounds[sound_name]             # <<<<<<<<<<<<<<
  * 
- *         # Add custom events to post when particular sound actions occur (stop, about to finish).
+ *         # Post events when sound changed as a new sound is playing now for the current playlist
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_mc); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 165, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_mc); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 206, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_sounds); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 165, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_sounds); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 206, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyObject_GetItem(__pyx_t_2, __pyx_v_sound_name); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 165, __pyx_L1_error)
+  __pyx_t_1 = PyObject_GetItem(__pyx_t_2, __pyx_v_sound_name); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 206, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_sound = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":169
- *         # Add custom events to post when particular sound actions occur (stop, about to finish).
- *         # These events are used to trigger playlist events (advance, stop)
- *         events_when_stopped = []             # <<<<<<<<<<<<<<
- *         if sound.events_when_stopped:
- *             events_when_stopped.extend(sound.events_when_stopped)
- */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 169, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_events_when_stopped = ((PyObject*)__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "mpfmc/core/audio/playlist_controller.pyx":170
- *         # These events are used to trigger playlist events (advance, stop)
- *         events_when_stopped = []
- *         if sound.events_when_stopped:             # <<<<<<<<<<<<<<
- *             events_when_stopped.extend(sound.events_when_stopped)
- *         events_when_stopped.extend(['{}_playlist_sound_stopped'.format(self.name.lower())])
+  /* "mpfmc/core/audio/playlist_controller.pyx":209
+ * 
+ *         # Post events when sound changed as a new sound is playing now for the current playlist
+ *         for event in self._current_playlist.events_when_sound_changed:             # <<<<<<<<<<<<<<
+ *             self.mc.post_mc_native_event(event)
+ * 
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_sound, __pyx_n_s_events_when_stopped); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 170, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 209, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 170, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_events_when_sound_changed); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 209, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (__pyx_t_3) {
-
-    /* "mpfmc/core/audio/playlist_controller.pyx":171
- *         events_when_stopped = []
- *         if sound.events_when_stopped:
- *             events_when_stopped.extend(sound.events_when_stopped)             # <<<<<<<<<<<<<<
- *         events_when_stopped.extend(['{}_playlist_sound_stopped'.format(self.name.lower())])
- * 
- */
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_sound, __pyx_n_s_events_when_stopped); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 171, __pyx_L1_error)
+  if (likely(PyList_CheckExact(__pyx_t_2)) || PyTuple_CheckExact(__pyx_t_2)) {
+    __pyx_t_1 = __pyx_t_2; __Pyx_INCREF(__pyx_t_1); __pyx_t_3 = 0;
+    __pyx_t_4 = NULL;
+  } else {
+    __pyx_t_3 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 209, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_4 = __Pyx_PyList_Extend(__pyx_v_events_when_stopped, __pyx_t_1); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(0, 171, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-    /* "mpfmc/core/audio/playlist_controller.pyx":170
- *         # These events are used to trigger playlist events (advance, stop)
- *         events_when_stopped = []
- *         if sound.events_when_stopped:             # <<<<<<<<<<<<<<
- *             events_when_stopped.extend(sound.events_when_stopped)
- *         events_when_stopped.extend(['{}_playlist_sound_stopped'.format(self.name.lower())])
- */
+    __pyx_t_4 = Py_TYPE(__pyx_t_1)->tp_iternext; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 209, __pyx_L1_error)
   }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  for (;;) {
+    if (likely(!__pyx_t_4)) {
+      if (likely(PyList_CheckExact(__pyx_t_1))) {
+        if (__pyx_t_3 >= PyList_GET_SIZE(__pyx_t_1)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_2 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_3); __Pyx_INCREF(__pyx_t_2); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 209, __pyx_L1_error)
+        #else
+        __pyx_t_2 = PySequence_ITEM(__pyx_t_1, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 209, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        #endif
+      } else {
+        if (__pyx_t_3 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_2 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_3); __Pyx_INCREF(__pyx_t_2); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 209, __pyx_L1_error)
+        #else
+        __pyx_t_2 = PySequence_ITEM(__pyx_t_1, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 209, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        #endif
+      }
+    } else {
+      __pyx_t_2 = __pyx_t_4(__pyx_t_1);
+      if (unlikely(!__pyx_t_2)) {
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+          else __PYX_ERR(0, 209, __pyx_L1_error)
+        }
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_2);
+    }
+    __Pyx_XDECREF_SET(__pyx_v_event, __pyx_t_2);
+    __pyx_t_2 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":172
- *         if sound.events_when_stopped:
- *             events_when_stopped.extend(sound.events_when_stopped)
- *         events_when_stopped.extend(['{}_playlist_sound_stopped'.format(self.name.lower())])             # <<<<<<<<<<<<<<
+    /* "mpfmc/core/audio/playlist_controller.pyx":210
+ *         # Post events when sound changed as a new sound is playing now for the current playlist
+ *         for event in self._current_playlist.events_when_sound_changed:
+ *             self.mc.post_mc_native_event(event)             # <<<<<<<<<<<<<<
  * 
- *         events_when_about_to_finish = []
+ *         # Play sound on playlist track (override certain settings needed to manage playlist)
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_playlist_sound_stopped, __pyx_n_s_format); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 172, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_name); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 172, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_lower); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 172, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_7);
-  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = NULL;
-  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_7))) {
-    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_7);
-    if (likely(__pyx_t_6)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_7);
-      __Pyx_INCREF(__pyx_t_6);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_7, function);
-    }
-  }
-  if (__pyx_t_6) {
-    __pyx_t_5 = __Pyx_PyObject_CallOneArg(__pyx_t_7, __pyx_t_6); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 172, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  } else {
-    __pyx_t_5 = __Pyx_PyObject_CallNoArg(__pyx_t_7); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 172, __pyx_L1_error)
-  }
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-  __pyx_t_7 = NULL;
-  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
-    __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_2);
-    if (likely(__pyx_t_7)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-      __Pyx_INCREF(__pyx_t_7);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_2, function);
-    }
-  }
-  if (!__pyx_t_7) {
-    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 172, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_GOTREF(__pyx_t_1);
-  } else {
-    #if CYTHON_FAST_PYCALL
-    if (PyFunction_Check(__pyx_t_2)) {
-      PyObject *__pyx_temp[2] = {__pyx_t_7, __pyx_t_5};
-      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 172, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    } else
-    #endif
-    #if CYTHON_FAST_PYCCALL
-    if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
-      PyObject *__pyx_temp[2] = {__pyx_t_7, __pyx_t_5};
-      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 172, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    } else
-    #endif
-    {
-      __pyx_t_6 = PyTuple_New(1+1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 172, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_6);
-      __Pyx_GIVEREF(__pyx_t_7); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_7); __pyx_t_7 = NULL;
-      __Pyx_GIVEREF(__pyx_t_5);
-      PyTuple_SET_ITEM(__pyx_t_6, 0+1, __pyx_t_5);
-      __pyx_t_5 = 0;
-      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 172, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    }
-  }
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 172, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_GIVEREF(__pyx_t_1);
-  PyList_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
-  __pyx_t_1 = 0;
-  __pyx_t_4 = __Pyx_PyList_Extend(__pyx_v_events_when_stopped, __pyx_t_2); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(0, 172, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  /* "mpfmc/core/audio/playlist_controller.pyx":174
- *         events_when_stopped.extend(['{}_playlist_sound_stopped'.format(self.name.lower())])
- * 
- *         events_when_about_to_finish = []             # <<<<<<<<<<<<<<
- *         if sound.events_when_about_to_finish:
- *             events_when_about_to_finish.extend(sound.events_when_about_to_finish)
- */
-  __pyx_t_2 = PyList_New(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 174, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_v_events_when_about_to_finish = ((PyObject*)__pyx_t_2);
-  __pyx_t_2 = 0;
-
-  /* "mpfmc/core/audio/playlist_controller.pyx":175
- * 
- *         events_when_about_to_finish = []
- *         if sound.events_when_about_to_finish:             # <<<<<<<<<<<<<<
- *             events_when_about_to_finish.extend(sound.events_when_about_to_finish)
- *         events_when_about_to_finish.extend(['{}_playlist_sound_about_to_finish'.format(self.name.lower())])
- */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_sound, __pyx_n_s_events_when_about_to_finish); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 175, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 175, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (__pyx_t_3) {
-
-    /* "mpfmc/core/audio/playlist_controller.pyx":176
- *         events_when_about_to_finish = []
- *         if sound.events_when_about_to_finish:
- *             events_when_about_to_finish.extend(sound.events_when_about_to_finish)             # <<<<<<<<<<<<<<
- *         events_when_about_to_finish.extend(['{}_playlist_sound_about_to_finish'.format(self.name.lower())])
- * 
- */
-    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_sound, __pyx_n_s_events_when_about_to_finish); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 176, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_4 = __Pyx_PyList_Extend(__pyx_v_events_when_about_to_finish, __pyx_t_2); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(0, 176, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-    /* "mpfmc/core/audio/playlist_controller.pyx":175
- * 
- *         events_when_about_to_finish = []
- *         if sound.events_when_about_to_finish:             # <<<<<<<<<<<<<<
- *             events_when_about_to_finish.extend(sound.events_when_about_to_finish)
- *         events_when_about_to_finish.extend(['{}_playlist_sound_about_to_finish'.format(self.name.lower())])
- */
-  }
-
-  /* "mpfmc/core/audio/playlist_controller.pyx":177
- *         if sound.events_when_about_to_finish:
- *             events_when_about_to_finish.extend(sound.events_when_about_to_finish)
- *         events_when_about_to_finish.extend(['{}_playlist_sound_about_to_finish'.format(self.name.lower())])             # <<<<<<<<<<<<<<
- * 
- *         # Post events when sound changed as a new sound is playing now for the current playlist
- */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_playlist_sound_about_to_finish, __pyx_n_s_format); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 177, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_name); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 177, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_lower); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 177, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_7);
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = NULL;
-  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_7))) {
-    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_7);
-    if (likely(__pyx_t_5)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_7);
-      __Pyx_INCREF(__pyx_t_5);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_7, function);
-    }
-  }
-  if (__pyx_t_5) {
-    __pyx_t_6 = __Pyx_PyObject_CallOneArg(__pyx_t_7, __pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 177, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  } else {
-    __pyx_t_6 = __Pyx_PyObject_CallNoArg(__pyx_t_7); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 177, __pyx_L1_error)
-  }
-  __Pyx_GOTREF(__pyx_t_6);
-  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-  __pyx_t_7 = NULL;
-  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
-    __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_1);
-    if (likely(__pyx_t_7)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
-      __Pyx_INCREF(__pyx_t_7);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_1, function);
-    }
-  }
-  if (!__pyx_t_7) {
-    __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 177, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __Pyx_GOTREF(__pyx_t_2);
-  } else {
-    #if CYTHON_FAST_PYCALL
-    if (PyFunction_Check(__pyx_t_1)) {
-      PyObject *__pyx_temp[2] = {__pyx_t_7, __pyx_t_6};
-      __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_1, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 177, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    } else
-    #endif
-    #if CYTHON_FAST_PYCCALL
-    if (__Pyx_PyFastCFunction_Check(__pyx_t_1)) {
-      PyObject *__pyx_temp[2] = {__pyx_t_7, __pyx_t_6};
-      __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_1, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 177, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    } else
-    #endif
-    {
-      __pyx_t_5 = PyTuple_New(1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 177, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_5);
-      __Pyx_GIVEREF(__pyx_t_7); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_7); __pyx_t_7 = NULL;
-      __Pyx_GIVEREF(__pyx_t_6);
-      PyTuple_SET_ITEM(__pyx_t_5, 0+1, __pyx_t_6);
-      __pyx_t_6 = 0;
-      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_5, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 177, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    }
-  }
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 177, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_2);
-  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_t_2);
-  __pyx_t_2 = 0;
-  __pyx_t_4 = __Pyx_PyList_Extend(__pyx_v_events_when_about_to_finish, __pyx_t_1); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(0, 177, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "mpfmc/core/audio/playlist_controller.pyx":180
- * 
- *         # Post events when sound changed as a new sound is playing now for the current playlist
- *         for event in self._current_playlist.events_when_sound_changed:             # <<<<<<<<<<<<<<
- *             self.mc.post_mc_native_event(event)
- * 
- */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 180, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_events_when_sound_changed); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 180, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (likely(PyList_CheckExact(__pyx_t_2)) || PyTuple_CheckExact(__pyx_t_2)) {
-    __pyx_t_1 = __pyx_t_2; __Pyx_INCREF(__pyx_t_1); __pyx_t_8 = 0;
-    __pyx_t_9 = NULL;
-  } else {
-    __pyx_t_8 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 180, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_9 = Py_TYPE(__pyx_t_1)->tp_iternext; if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 180, __pyx_L1_error)
-  }
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  for (;;) {
-    if (likely(!__pyx_t_9)) {
-      if (likely(PyList_CheckExact(__pyx_t_1))) {
-        if (__pyx_t_8 >= PyList_GET_SIZE(__pyx_t_1)) break;
-        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_2 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_8); __Pyx_INCREF(__pyx_t_2); __pyx_t_8++; if (unlikely(0 < 0)) __PYX_ERR(0, 180, __pyx_L1_error)
-        #else
-        __pyx_t_2 = PySequence_ITEM(__pyx_t_1, __pyx_t_8); __pyx_t_8++; if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 180, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_2);
-        #endif
-      } else {
-        if (__pyx_t_8 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
-        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_2 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_8); __Pyx_INCREF(__pyx_t_2); __pyx_t_8++; if (unlikely(0 < 0)) __PYX_ERR(0, 180, __pyx_L1_error)
-        #else
-        __pyx_t_2 = PySequence_ITEM(__pyx_t_1, __pyx_t_8); __pyx_t_8++; if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 180, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_2);
-        #endif
-      }
-    } else {
-      __pyx_t_2 = __pyx_t_9(__pyx_t_1);
-      if (unlikely(!__pyx_t_2)) {
-        PyObject* exc_type = PyErr_Occurred();
-        if (exc_type) {
-          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-          else __PYX_ERR(0, 180, __pyx_L1_error)
-        }
-        break;
-      }
-      __Pyx_GOTREF(__pyx_t_2);
-    }
-    __Pyx_XDECREF_SET(__pyx_v_event, __pyx_t_2);
-    __pyx_t_2 = 0;
-
-    /* "mpfmc/core/audio/playlist_controller.pyx":181
- *         # Post events when sound changed as a new sound is playing now for the current playlist
- *         for event in self._current_playlist.events_when_sound_changed:
- *             self.mc.post_mc_native_event(event)             # <<<<<<<<<<<<<<
- * 
- *         # Play sound on playlist track (override certain settings needed to manage playlist)
- */
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_mc); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 181, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_mc); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 210, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_post_mc_native_event); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 181, __pyx_L1_error)
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_post_mc_native_event); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 210, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     __pyx_t_5 = NULL;
@@ -4210,13 +4931,13 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
       }
     }
     if (!__pyx_t_5) {
-      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_v_event); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 181, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_v_event); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 210, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
     } else {
       #if CYTHON_FAST_PYCALL
       if (PyFunction_Check(__pyx_t_6)) {
         PyObject *__pyx_temp[2] = {__pyx_t_5, __pyx_v_event};
-        __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_6, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 181, __pyx_L1_error)
+        __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_6, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 210, __pyx_L1_error)
         __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
         __Pyx_GOTREF(__pyx_t_2);
       } else
@@ -4224,19 +4945,19 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
       #if CYTHON_FAST_PYCCALL
       if (__Pyx_PyFastCFunction_Check(__pyx_t_6)) {
         PyObject *__pyx_temp[2] = {__pyx_t_5, __pyx_v_event};
-        __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_6, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 181, __pyx_L1_error)
+        __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_6, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 210, __pyx_L1_error)
         __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
         __Pyx_GOTREF(__pyx_t_2);
       } else
       #endif
       {
-        __pyx_t_7 = PyTuple_New(1+1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 181, __pyx_L1_error)
+        __pyx_t_7 = PyTuple_New(1+1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 210, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_7);
         __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_5); __pyx_t_5 = NULL;
         __Pyx_INCREF(__pyx_v_event);
         __Pyx_GIVEREF(__pyx_v_event);
         PyTuple_SET_ITEM(__pyx_t_7, 0+1, __pyx_v_event);
-        __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_7, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 181, __pyx_L1_error)
+        __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_7, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 210, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_2);
         __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
       }
@@ -4244,7 +4965,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":180
+    /* "mpfmc/core/audio/playlist_controller.pyx":209
  * 
  *         # Post events when sound changed as a new sound is playing now for the current playlist
  *         for event in self._current_playlist.events_when_sound_changed:             # <<<<<<<<<<<<<<
@@ -4254,162 +4975,171 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   }
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":185
+  /* "mpfmc/core/audio/playlist_controller.pyx":214
  *         # Play sound on playlist track (override certain settings needed to manage playlist)
  *         # Standard track will return a sound instance if play was successful
- *         sound_instance = self._track.play_sound(sound,             # <<<<<<<<<<<<<<
- *                                                 playlist.context,
- *                                                 {
+ *         settings = self._get_playlist_sound_settings(sound, playlist, fade_in)             # <<<<<<<<<<<<<<
+ *         settings['start_sample'] = start_sample
+ *         sound_instance = self._track.play_sound(sound, playlist.context, settings)
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_track_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 185, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_get_playlist_sound_settings); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 214, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_play_sound); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 185, __pyx_L1_error)
+  __pyx_t_6 = PyFloat_FromDouble(__pyx_v_fade_in); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 214, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  /* "mpfmc/core/audio/playlist_controller.pyx":186
- *         # Standard track will return a sound instance if play was successful
- *         sound_instance = self._track.play_sound(sound,
- *                                                 playlist.context,             # <<<<<<<<<<<<<<
- *                                                 {
- *                                                     'fade_in': fade_in,
- */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_playlist, __pyx_n_s_context); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 186, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-
-  /* "mpfmc/core/audio/playlist_controller.pyx":188
- *                                                 playlist.context,
- *                                                 {
- *                                                     'fade_in': fade_in,             # <<<<<<<<<<<<<<
- *                                                     'fade_out': 0.0,
- *                                                     'about_to_finish_time': playlist.crossfade_time,
- */
-  __pyx_t_7 = __Pyx_PyDict_NewPresized(6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 188, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_7);
-  __pyx_t_5 = PyFloat_FromDouble(__pyx_v_fade_in); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 188, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  if (PyDict_SetItem(__pyx_t_7, __pyx_n_u_fade_in, __pyx_t_5) < 0) __PYX_ERR(0, 188, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  if (PyDict_SetItem(__pyx_t_7, __pyx_n_u_fade_out, __pyx_float_0_0) < 0) __PYX_ERR(0, 188, __pyx_L1_error)
-
-  /* "mpfmc/core/audio/playlist_controller.pyx":190
- *                                                     'fade_in': fade_in,
- *                                                     'fade_out': 0.0,
- *                                                     'about_to_finish_time': playlist.crossfade_time,             # <<<<<<<<<<<<<<
- *                                                     'max_queue_time': None,
- *                                                     'events_when_stopped': events_when_stopped,
- */
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_playlist, __pyx_n_s_crossfade_time); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 190, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  if (PyDict_SetItem(__pyx_t_7, __pyx_n_u_about_to_finish_time, __pyx_t_5) < 0) __PYX_ERR(0, 188, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-
-  /* "mpfmc/core/audio/playlist_controller.pyx":191
- *                                                     'fade_out': 0.0,
- *                                                     'about_to_finish_time': playlist.crossfade_time,
- *                                                     'max_queue_time': None,             # <<<<<<<<<<<<<<
- *                                                     'events_when_stopped': events_when_stopped,
- *                                                     'events_when_about_to_finish': events_when_about_to_finish
- */
-  if (PyDict_SetItem(__pyx_t_7, __pyx_n_u_max_queue_time, Py_None) < 0) __PYX_ERR(0, 188, __pyx_L1_error)
-
-  /* "mpfmc/core/audio/playlist_controller.pyx":192
- *                                                     'about_to_finish_time': playlist.crossfade_time,
- *                                                     'max_queue_time': None,
- *                                                     'events_when_stopped': events_when_stopped,             # <<<<<<<<<<<<<<
- *                                                     'events_when_about_to_finish': events_when_about_to_finish
- *                                                 })
- */
-  if (PyDict_SetItem(__pyx_t_7, __pyx_n_u_events_when_stopped, __pyx_v_events_when_stopped) < 0) __PYX_ERR(0, 188, __pyx_L1_error)
-
-  /* "mpfmc/core/audio/playlist_controller.pyx":193
- *                                                     'max_queue_time': None,
- *                                                     'events_when_stopped': events_when_stopped,
- *                                                     'events_when_about_to_finish': events_when_about_to_finish             # <<<<<<<<<<<<<<
- *                                                 })
- * 
- */
-  if (PyDict_SetItem(__pyx_t_7, __pyx_n_u_events_when_about_to_finish, __pyx_v_events_when_about_to_finish) < 0) __PYX_ERR(0, 188, __pyx_L1_error)
-  __pyx_t_5 = NULL;
-  __pyx_t_10 = 0;
-  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
-    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_6);
-    if (likely(__pyx_t_5)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
-      __Pyx_INCREF(__pyx_t_5);
+  __pyx_t_7 = NULL;
+  __pyx_t_8 = 0;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_7)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_7);
       __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_6, function);
-      __pyx_t_10 = 1;
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+      __pyx_t_8 = 1;
     }
   }
   #if CYTHON_FAST_PYCALL
-  if (PyFunction_Check(__pyx_t_6)) {
-    PyObject *__pyx_temp[4] = {__pyx_t_5, __pyx_v_sound, __pyx_t_2, __pyx_t_7};
-    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_10, 3+__pyx_t_10); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 185, __pyx_L1_error)
-    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (PyFunction_Check(__pyx_t_2)) {
+    PyObject *__pyx_temp[4] = {__pyx_t_7, __pyx_v_sound, __pyx_v_playlist, __pyx_t_6};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 3+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 214, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
     __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
   } else
   #endif
   #if CYTHON_FAST_PYCCALL
-  if (__Pyx_PyFastCFunction_Check(__pyx_t_6)) {
-    PyObject *__pyx_temp[4] = {__pyx_t_5, __pyx_v_sound, __pyx_t_2, __pyx_t_7};
-    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_10, 3+__pyx_t_10); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 185, __pyx_L1_error)
-    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
+    PyObject *__pyx_temp[4] = {__pyx_t_7, __pyx_v_sound, __pyx_v_playlist, __pyx_t_6};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 3+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 214, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  } else
+  #endif
+  {
+    __pyx_t_5 = PyTuple_New(3+__pyx_t_8); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 214, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    if (__pyx_t_7) {
+      __Pyx_GIVEREF(__pyx_t_7); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_7); __pyx_t_7 = NULL;
+    }
+    __Pyx_INCREF(__pyx_v_sound);
+    __Pyx_GIVEREF(__pyx_v_sound);
+    PyTuple_SET_ITEM(__pyx_t_5, 0+__pyx_t_8, __pyx_v_sound);
+    __Pyx_INCREF(__pyx_v_playlist);
+    __Pyx_GIVEREF(__pyx_v_playlist);
+    PyTuple_SET_ITEM(__pyx_t_5, 1+__pyx_t_8, __pyx_v_playlist);
+    __Pyx_GIVEREF(__pyx_t_6);
+    PyTuple_SET_ITEM(__pyx_t_5, 2+__pyx_t_8, __pyx_t_6);
+    __pyx_t_6 = 0;
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 214, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_settings = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":215
+ *         # Standard track will return a sound instance if play was successful
+ *         settings = self._get_playlist_sound_settings(sound, playlist, fade_in)
+ *         settings['start_sample'] = start_sample             # <<<<<<<<<<<<<<
+ *         sound_instance = self._track.play_sound(sound, playlist.context, settings)
+ * 
+ */
+  if (unlikely(PyObject_SetItem(__pyx_v_settings, __pyx_n_u_start_sample, __pyx_v_start_sample) < 0)) __PYX_ERR(0, 215, __pyx_L1_error)
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":216
+ *         settings = self._get_playlist_sound_settings(sound, playlist, fade_in)
+ *         settings['start_sample'] = start_sample
+ *         sound_instance = self._track.play_sound(sound, playlist.context, settings)             # <<<<<<<<<<<<<<
+ * 
+ *         # Associate sound instance with playlist instance
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_track_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 216, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_play_sound); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 216, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_playlist, __pyx_n_s_context); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 216, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_6 = NULL;
+  __pyx_t_8 = 0;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
+    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_5);
+    if (likely(__pyx_t_6)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+      __Pyx_INCREF(__pyx_t_6);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_5, function);
+      __pyx_t_8 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_5)) {
+    PyObject *__pyx_temp[4] = {__pyx_t_6, __pyx_v_sound, __pyx_t_2, __pyx_v_settings};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_8, 3+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 216, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_5)) {
+    PyObject *__pyx_temp[4] = {__pyx_t_6, __pyx_v_sound, __pyx_t_2, __pyx_v_settings};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_8, 3+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 216, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
   } else
   #endif
   {
-    __pyx_t_11 = PyTuple_New(3+__pyx_t_10); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 185, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_11);
-    if (__pyx_t_5) {
-      __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_11, 0, __pyx_t_5); __pyx_t_5 = NULL;
+    __pyx_t_7 = PyTuple_New(3+__pyx_t_8); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 216, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    if (__pyx_t_6) {
+      __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_6); __pyx_t_6 = NULL;
     }
     __Pyx_INCREF(__pyx_v_sound);
     __Pyx_GIVEREF(__pyx_v_sound);
-    PyTuple_SET_ITEM(__pyx_t_11, 0+__pyx_t_10, __pyx_v_sound);
+    PyTuple_SET_ITEM(__pyx_t_7, 0+__pyx_t_8, __pyx_v_sound);
     __Pyx_GIVEREF(__pyx_t_2);
-    PyTuple_SET_ITEM(__pyx_t_11, 1+__pyx_t_10, __pyx_t_2);
-    __Pyx_GIVEREF(__pyx_t_7);
-    PyTuple_SET_ITEM(__pyx_t_11, 2+__pyx_t_10, __pyx_t_7);
+    PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_8, __pyx_t_2);
+    __Pyx_INCREF(__pyx_v_settings);
+    __Pyx_GIVEREF(__pyx_v_settings);
+    PyTuple_SET_ITEM(__pyx_t_7, 2+__pyx_t_8, __pyx_v_settings);
     __pyx_t_2 = 0;
-    __pyx_t_7 = 0;
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_11, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 185, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 216, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
   }
-  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __pyx_v_sound_instance = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":197
+  /* "mpfmc/core/audio/playlist_controller.pyx":219
  * 
  *         # Associate sound instance with playlist instance
  *         self._playlists_by_sound_instance[sound_instance] = playlist             # <<<<<<<<<<<<<<
  *         playlist.current_sound_instance = sound_instance
  * 
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_playlists_by_sound_instance); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 197, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_playlists_by_sound_instance); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 219, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (unlikely(PyObject_SetItem(__pyx_t_1, __pyx_v_sound_instance, __pyx_v_playlist) < 0)) __PYX_ERR(0, 197, __pyx_L1_error)
+  if (unlikely(PyObject_SetItem(__pyx_t_1, __pyx_v_sound_instance, __pyx_v_playlist) < 0)) __PYX_ERR(0, 219, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":198
+  /* "mpfmc/core/audio/playlist_controller.pyx":220
  *         # Associate sound instance with playlist instance
  *         self._playlists_by_sound_instance[sound_instance] = playlist
  *         playlist.current_sound_instance = sound_instance             # <<<<<<<<<<<<<<
  * 
- *     def stop(self):
+ *     def _get_playlist_sound_settings(self, object sound, object playlist, float fade_in=0.0):
  */
-  if (__Pyx_PyObject_SetAttrStr(__pyx_v_playlist, __pyx_n_s_current_sound_instance, __pyx_v_sound_instance) < 0) __PYX_ERR(0, 198, __pyx_L1_error)
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_playlist, __pyx_n_s_current_sound_instance, __pyx_v_sound_instance) < 0) __PYX_ERR(0, 220, __pyx_L1_error)
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":153
+  /* "mpfmc/core/audio/playlist_controller.pyx":192
  *             return False
  * 
- *     def _play_playlist_sound(self, str sound_name, object playlist, float fade_in=0.0):             # <<<<<<<<<<<<<<
+ *     def _play_playlist_sound(self, str sound_name, object playlist, float fade_in=0.0, start_sample=None):             # <<<<<<<<<<<<<<
  *         """
  *         Plays the specified playlist sound
  */
@@ -4423,44 +5153,122 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   __Pyx_XDECREF(__pyx_t_5);
   __Pyx_XDECREF(__pyx_t_6);
   __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_XDECREF(__pyx_t_11);
   __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController._play_playlist_sound", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XDECREF(__pyx_v_sound);
-  __Pyx_XDECREF(__pyx_v_events_when_stopped);
-  __Pyx_XDECREF(__pyx_v_events_when_about_to_finish);
   __Pyx_XDECREF(__pyx_v_event);
+  __Pyx_XDECREF(__pyx_v_settings);
   __Pyx_XDECREF(__pyx_v_sound_instance);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/playlist_controller.pyx":200
+/* "mpfmc/core/audio/playlist_controller.pyx":222
  *         playlist.current_sound_instance = sound_instance
  * 
- *     def stop(self):             # <<<<<<<<<<<<<<
- *         """Immediately stop the currently playing playlist. Will fade out using the crossfade setting."""
- *         if not self._current_playlist:
+ *     def _get_playlist_sound_settings(self, object sound, object playlist, float fade_in=0.0):             # <<<<<<<<<<<<<<
+ *         """Returns the settings used to play a playlist sound (overrides certain settings needed
+ *         to manage the playlist)."""
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_23stop(PyObject *__pyx_self, PyObject *__pyx_v_self); /*proto*/
-static char __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_22stop[] = "PlaylistController.stop(self)\nImmediately stop the currently playing playlist. Will fade out using the crossfade setting.";
-static PyMethodDef __pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_23stop = {"stop", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_23stop, METH_O, __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_22stop};
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_23stop(PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_29_get_playlist_sound_settings(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_28_get_playlist_sound_settings[] = "PlaylistController._get_playlist_sound_settings(self, sound, playlist, float fade_in=0.0)\nReturns the settings used to play a playlist sound (overrides certain settings needed\n        to manage the playlist).";
+static PyMethodDef __pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_29_get_playlist_sound_settings = {"_get_playlist_sound_settings", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_29_get_playlist_sound_settings, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_28_get_playlist_sound_settings};
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_29_get_playlist_sound_settings(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_self = 0;
+  PyObject *__pyx_v_sound = 0;
+  PyObject *__pyx_v_playlist = 0;
+  float __pyx_v_fade_in;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("stop (wrapper)", 0);
-  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_22stop(__pyx_self, ((PyObject *)__pyx_v_self));
+  __Pyx_RefNannySetupContext("_get_playlist_sound_settings (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_sound,&__pyx_n_s_playlist,&__pyx_n_s_fade_in,0};
+    PyObject* values[4] = {0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_self)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_sound)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("_get_playlist_sound_settings", 0, 3, 4, 1); __PYX_ERR(0, 222, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_playlist)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("_get_playlist_sound_settings", 0, 3, 4, 2); __PYX_ERR(0, 222, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (kw_args > 0) {
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_fade_in);
+          if (value) { values[3] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "_get_playlist_sound_settings") < 0)) __PYX_ERR(0, 222, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_self = values[0];
+    __pyx_v_sound = values[1];
+    __pyx_v_playlist = values[2];
+    if (values[3]) {
+      __pyx_v_fade_in = __pyx_PyFloat_AsFloat(values[3]); if (unlikely((__pyx_v_fade_in == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 222, __pyx_L3_error)
+    } else {
+      __pyx_v_fade_in = ((float)((double)0.0));
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("_get_playlist_sound_settings", 0, 3, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 222, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController._get_playlist_sound_settings", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_28_get_playlist_sound_settings(__pyx_self, __pyx_v_self, __pyx_v_sound, __pyx_v_playlist, __pyx_v_fade_in);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_22stop(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_28_get_playlist_sound_settings(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_sound, PyObject *__pyx_v_playlist, float __pyx_v_fade_in) {
+  PyObject *__pyx_v_events_when_played = NULL;
+  PyObject *__pyx_v_events_when_stopped = NULL;
+  PyObject *__pyx_v_events_when_about_to_finish = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -4469,1009 +5277,5843 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   PyObject *__pyx_t_4 = NULL;
   PyObject *__pyx_t_5 = NULL;
   PyObject *__pyx_t_6 = NULL;
-  int __pyx_t_7;
-  PyObject *__pyx_t_8 = NULL;
-  PyObject *__pyx_t_9 = NULL;
-  __Pyx_RefNannySetupContext("stop", 0);
+  PyObject *__pyx_t_7 = NULL;
+  __Pyx_RefNannySetupContext("_get_playlist_sound_settings", 0);
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":202
- *     def stop(self):
- *         """Immediately stop the currently playing playlist. Will fade out using the crossfade setting."""
- *         if not self._current_playlist:             # <<<<<<<<<<<<<<
- *             self.log.debug("stop - No playlist is currently playing. Could not stop current playlist.")
- *             return
+  /* "mpfmc/core/audio/playlist_controller.pyx":228
+ *         # Add custom events to post when particular sound actions occur (played, stop, about to finish).
+ *         # These events are used to trigger playlist events (advance, stop)
+ *         events_when_played = []             # <<<<<<<<<<<<<<
+ *         if sound.events_when_played:
+ *             events_when_played.extend(sound.events_when_played)
+ */
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 228, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_events_when_played = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":229
+ *         # These events are used to trigger playlist events (advance, stop)
+ *         events_when_played = []
+ *         if sound.events_when_played:             # <<<<<<<<<<<<<<
+ *             events_when_played.extend(sound.events_when_played)
+ *         events_when_played.extend(['{}_playlist_sound_played'.format(self.name.lower())])
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 202, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_sound, __pyx_n_s_events_when_played); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 229, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 202, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 229, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_3 = ((!__pyx_t_2) != 0);
-  if (__pyx_t_3) {
+  if (__pyx_t_2) {
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":203
- *         """Immediately stop the currently playing playlist. Will fade out using the crossfade setting."""
- *         if not self._current_playlist:
- *             self.log.debug("stop - No playlist is currently playing. Could not stop current playlist.")             # <<<<<<<<<<<<<<
- *             return
+    /* "mpfmc/core/audio/playlist_controller.pyx":230
+ *         events_when_played = []
+ *         if sound.events_when_played:
+ *             events_when_played.extend(sound.events_when_played)             # <<<<<<<<<<<<<<
+ *         events_when_played.extend(['{}_playlist_sound_played'.format(self.name.lower())])
  * 
  */
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_log); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 203, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_debug); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 203, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 203, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_sound, __pyx_n_s_events_when_played); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 230, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_3 = __Pyx_PyList_Extend(__pyx_v_events_when_played, __pyx_t_1); if (unlikely(__pyx_t_3 == ((int)-1))) __PYX_ERR(0, 230, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":204
- *         if not self._current_playlist:
- *             self.log.debug("stop - No playlist is currently playing. Could not stop current playlist.")
- *             return             # <<<<<<<<<<<<<<
- * 
- *         self.log.debug("stop - Stopping the current playlist ('%s').",
- */
-    __Pyx_XDECREF(__pyx_r);
-    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-    goto __pyx_L0;
-
-    /* "mpfmc/core/audio/playlist_controller.pyx":202
- *     def stop(self):
- *         """Immediately stop the currently playing playlist. Will fade out using the crossfade setting."""
- *         if not self._current_playlist:             # <<<<<<<<<<<<<<
- *             self.log.debug("stop - No playlist is currently playing. Could not stop current playlist.")
- *             return
+    /* "mpfmc/core/audio/playlist_controller.pyx":229
+ *         # These events are used to trigger playlist events (advance, stop)
+ *         events_when_played = []
+ *         if sound.events_when_played:             # <<<<<<<<<<<<<<
+ *             events_when_played.extend(sound.events_when_played)
+ *         events_when_played.extend(['{}_playlist_sound_played'.format(self.name.lower())])
  */
   }
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":206
- *             return
- * 
- *         self.log.debug("stop - Stopping the current playlist ('%s').",             # <<<<<<<<<<<<<<
- *                        self._current_playlist.name)
- * 
- */
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_log); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 206, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_debug); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 206, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-
-  /* "mpfmc/core/audio/playlist_controller.pyx":207
- * 
- *         self.log.debug("stop - Stopping the current playlist ('%s').",
- *                        self._current_playlist.name)             # <<<<<<<<<<<<<<
+  /* "mpfmc/core/audio/playlist_controller.pyx":231
+ *         if sound.events_when_played:
+ *             events_when_played.extend(sound.events_when_played)
+ *         events_when_played.extend(['{}_playlist_sound_played'.format(self.name.lower())])             # <<<<<<<<<<<<<<
  * 
- *         # Stop the current sound (if another sound is fading out, let it finish on its own)
+ *         events_when_stopped = []
  */
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 207, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_playlist_sound_played, __pyx_n_s_format); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 231, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_name); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 207, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_name); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 231, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = NULL;
-  __pyx_t_7 = 0;
-  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
-    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_5);
-    if (likely(__pyx_t_4)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
-      __Pyx_INCREF(__pyx_t_4);
+  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_lower); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 231, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_6 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_7))) {
+    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_7);
+    if (likely(__pyx_t_6)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_7);
+      __Pyx_INCREF(__pyx_t_6);
       __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_5, function);
-      __pyx_t_7 = 1;
+      __Pyx_DECREF_SET(__pyx_t_7, function);
     }
   }
-  #if CYTHON_FAST_PYCALL
-  if (PyFunction_Check(__pyx_t_5)) {
-    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_kp_u_stop_Stopping_the_current_playli, __pyx_t_6};
-    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 206, __pyx_L1_error)
-    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  } else
-  #endif
-  #if CYTHON_FAST_PYCCALL
-  if (__Pyx_PyFastCFunction_Check(__pyx_t_5)) {
-    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_kp_u_stop_Stopping_the_current_playli, __pyx_t_6};
-    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 206, __pyx_L1_error)
-    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_GOTREF(__pyx_t_1);
+  if (__pyx_t_6) {
+    __pyx_t_5 = __Pyx_PyObject_CallOneArg(__pyx_t_7, __pyx_t_6); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 231, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  } else
-  #endif
-  {
-    __pyx_t_8 = PyTuple_New(2+__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 206, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_8);
-    if (__pyx_t_4) {
-      __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_4); __pyx_t_4 = NULL;
-    }
-    __Pyx_INCREF(__pyx_kp_u_stop_Stopping_the_current_playli);
-    __Pyx_GIVEREF(__pyx_kp_u_stop_Stopping_the_current_playli);
-    PyTuple_SET_ITEM(__pyx_t_8, 0+__pyx_t_7, __pyx_kp_u_stop_Stopping_the_current_playli);
-    __Pyx_GIVEREF(__pyx_t_6);
-    PyTuple_SET_ITEM(__pyx_t_8, 1+__pyx_t_7, __pyx_t_6);
-    __pyx_t_6 = 0;
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_8, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 206, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  } else {
+    __pyx_t_5 = __Pyx_PyObject_CallNoArg(__pyx_t_7); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 231, __pyx_L1_error)
   }
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "mpfmc/core/audio/playlist_controller.pyx":210
- * 
- *         # Stop the current sound (if another sound is fading out, let it finish on its own)
- *         if self._current_playlist.current_sound_instance:             # <<<<<<<<<<<<<<
- *             self._track.stop_sound_instance(self._current_playlist.current_sound_instance,
- *                                             self._current_playlist.crossfade_time)
- */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 210, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_current_sound_instance); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 210, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 210, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  if (__pyx_t_3) {
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_4);
+    if (likely(__pyx_t_7)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_7);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_4, function);
+    }
+  }
+  if (!__pyx_t_7) {
+    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 231, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+  } else {
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_4)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_7, __pyx_t_5};
+      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 231, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_7, __pyx_t_5};
+      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 231, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_6 = PyTuple_New(1+1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 231, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_GIVEREF(__pyx_t_7); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_7); __pyx_t_7 = NULL;
+      __Pyx_GIVEREF(__pyx_t_5);
+      PyTuple_SET_ITEM(__pyx_t_6, 0+1, __pyx_t_5);
+      __pyx_t_5 = 0;
+      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 231, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    }
+  }
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = PyList_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 231, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyList_SET_ITEM(__pyx_t_4, 0, __pyx_t_1);
+  __pyx_t_1 = 0;
+  __pyx_t_3 = __Pyx_PyList_Extend(__pyx_v_events_when_played, __pyx_t_4); if (unlikely(__pyx_t_3 == ((int)-1))) __PYX_ERR(0, 231, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":211
- *         # Stop the current sound (if another sound is fading out, let it finish on its own)
- *         if self._current_playlist.current_sound_instance:
- *             self._track.stop_sound_instance(self._current_playlist.current_sound_instance,             # <<<<<<<<<<<<<<
- *                                             self._current_playlist.crossfade_time)
+  /* "mpfmc/core/audio/playlist_controller.pyx":233
+ *         events_when_played.extend(['{}_playlist_sound_played'.format(self.name.lower())])
  * 
+ *         events_when_stopped = []             # <<<<<<<<<<<<<<
+ *         if sound.events_when_stopped:
+ *             events_when_stopped.extend(sound.events_when_stopped)
  */
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_track_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 211, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_stop_sound_instance); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 211, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_8);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 211, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_current_sound_instance); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 211, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_4 = PyList_New(0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 233, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_events_when_stopped = ((PyObject*)__pyx_t_4);
+  __pyx_t_4 = 0;
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":212
- *         if self._current_playlist.current_sound_instance:
- *             self._track.stop_sound_instance(self._current_playlist.current_sound_instance,
- *                                             self._current_playlist.crossfade_time)             # <<<<<<<<<<<<<<
+  /* "mpfmc/core/audio/playlist_controller.pyx":234
  * 
- *         self._current_playlist = None
+ *         events_when_stopped = []
+ *         if sound.events_when_stopped:             # <<<<<<<<<<<<<<
+ *             events_when_stopped.extend(sound.events_when_stopped)
+ *         events_when_stopped.extend(['{}_playlist_sound_stopped'.format(self.name.lower())])
  */
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 212, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_crossfade_time); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 212, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_sound, __pyx_n_s_events_when_stopped); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 234, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 234, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (__pyx_t_2) {
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":235
+ *         events_when_stopped = []
+ *         if sound.events_when_stopped:
+ *             events_when_stopped.extend(sound.events_when_stopped)             # <<<<<<<<<<<<<<
+ *         events_when_stopped.extend(['{}_playlist_sound_stopped'.format(self.name.lower())])
+ * 
+ */
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_sound, __pyx_n_s_events_when_stopped); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 235, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = NULL;
-    __pyx_t_7 = 0;
-    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_8))) {
-      __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_8);
-      if (likely(__pyx_t_1)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_8);
-        __Pyx_INCREF(__pyx_t_1);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_8, function);
-        __pyx_t_7 = 1;
-      }
+    __pyx_t_3 = __Pyx_PyList_Extend(__pyx_v_events_when_stopped, __pyx_t_4); if (unlikely(__pyx_t_3 == ((int)-1))) __PYX_ERR(0, 235, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":234
+ * 
+ *         events_when_stopped = []
+ *         if sound.events_when_stopped:             # <<<<<<<<<<<<<<
+ *             events_when_stopped.extend(sound.events_when_stopped)
+ *         events_when_stopped.extend(['{}_playlist_sound_stopped'.format(self.name.lower())])
+ */
+  }
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":236
+ *         if sound.events_when_stopped:
+ *             events_when_stopped.extend(sound.events_when_stopped)
+ *         events_when_stopped.extend(['{}_playlist_sound_stopped'.format(self.name.lower())])             # <<<<<<<<<<<<<<
+ * 
+ *         events_when_about_to_finish = []
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_playlist_sound_stopped, __pyx_n_s_format); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 236, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_name); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 236, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_lower); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 236, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_7))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_7);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_7);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_7, function);
+    }
+  }
+  if (__pyx_t_5) {
+    __pyx_t_6 = __Pyx_PyObject_CallOneArg(__pyx_t_7, __pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 236, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  } else {
+    __pyx_t_6 = __Pyx_PyObject_CallNoArg(__pyx_t_7); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 236, __pyx_L1_error)
+  }
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+    __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_1);
+    if (likely(__pyx_t_7)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+      __Pyx_INCREF(__pyx_t_7);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_1, function);
     }
+  }
+  if (!__pyx_t_7) {
+    __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_6); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 236, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_GOTREF(__pyx_t_4);
+  } else {
     #if CYTHON_FAST_PYCALL
-    if (PyFunction_Check(__pyx_t_8)) {
-      PyObject *__pyx_temp[3] = {__pyx_t_1, __pyx_t_6, __pyx_t_4};
-      __pyx_t_5 = __Pyx_PyFunction_FastCall(__pyx_t_8, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 211, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __Pyx_GOTREF(__pyx_t_5);
+    if (PyFunction_Check(__pyx_t_1)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_7, __pyx_t_6};
+      __pyx_t_4 = __Pyx_PyFunction_FastCall(__pyx_t_1, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 236, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_GOTREF(__pyx_t_4);
       __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     } else
     #endif
     #if CYTHON_FAST_PYCCALL
-    if (__Pyx_PyFastCFunction_Check(__pyx_t_8)) {
-      PyObject *__pyx_temp[3] = {__pyx_t_1, __pyx_t_6, __pyx_t_4};
-      __pyx_t_5 = __Pyx_PyCFunction_FastCall(__pyx_t_8, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 211, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __Pyx_GOTREF(__pyx_t_5);
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_1)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_7, __pyx_t_6};
+      __pyx_t_4 = __Pyx_PyCFunction_FastCall(__pyx_t_1, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 236, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_GOTREF(__pyx_t_4);
       __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     } else
     #endif
     {
-      __pyx_t_9 = PyTuple_New(2+__pyx_t_7); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 211, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_9);
-      if (__pyx_t_1) {
-        __Pyx_GIVEREF(__pyx_t_1); PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_1); __pyx_t_1 = NULL;
-      }
+      __pyx_t_5 = PyTuple_New(1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 236, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_GIVEREF(__pyx_t_7); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_7); __pyx_t_7 = NULL;
       __Pyx_GIVEREF(__pyx_t_6);
-      PyTuple_SET_ITEM(__pyx_t_9, 0+__pyx_t_7, __pyx_t_6);
-      __Pyx_GIVEREF(__pyx_t_4);
-      PyTuple_SET_ITEM(__pyx_t_9, 1+__pyx_t_7, __pyx_t_4);
+      PyTuple_SET_ITEM(__pyx_t_5, 0+1, __pyx_t_6);
       __pyx_t_6 = 0;
-      __pyx_t_4 = 0;
-      __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_8, __pyx_t_9, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 211, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_5);
-      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 236, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     }
-    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 236, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_t_4);
+  __pyx_t_4 = 0;
+  __pyx_t_3 = __Pyx_PyList_Extend(__pyx_v_events_when_stopped, __pyx_t_1); if (unlikely(__pyx_t_3 == ((int)-1))) __PYX_ERR(0, 236, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":210
+  /* "mpfmc/core/audio/playlist_controller.pyx":238
+ *         events_when_stopped.extend(['{}_playlist_sound_stopped'.format(self.name.lower())])
  * 
- *         # Stop the current sound (if another sound is fading out, let it finish on its own)
- *         if self._current_playlist.current_sound_instance:             # <<<<<<<<<<<<<<
- *             self._track.stop_sound_instance(self._current_playlist.current_sound_instance,
- *                                             self._current_playlist.crossfade_time)
+ *         events_when_about_to_finish = []             # <<<<<<<<<<<<<<
+ *         if sound.events_when_about_to_finish:
+ *             events_when_about_to_finish.extend(sound.events_when_about_to_finish)
  */
-  }
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 238, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_events_when_about_to_finish = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":214
- *                                             self._current_playlist.crossfade_time)
+  /* "mpfmc/core/audio/playlist_controller.pyx":239
  * 
- *         self._current_playlist = None             # <<<<<<<<<<<<<<
+ *         events_when_about_to_finish = []
+ *         if sound.events_when_about_to_finish:             # <<<<<<<<<<<<<<
+ *             events_when_about_to_finish.extend(sound.events_when_about_to_finish)
+ *         events_when_about_to_finish.extend(['{}_playlist_sound_about_to_finish'.format(self.name.lower())])
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_sound, __pyx_n_s_events_when_about_to_finish); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 239, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 239, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (__pyx_t_2) {
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":240
+ *         events_when_about_to_finish = []
+ *         if sound.events_when_about_to_finish:
+ *             events_when_about_to_finish.extend(sound.events_when_about_to_finish)             # <<<<<<<<<<<<<<
+ *         events_when_about_to_finish.extend(['{}_playlist_sound_about_to_finish'.format(self.name.lower())])
  * 
- *     def advance(self):
  */
-  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist, Py_None) < 0) __PYX_ERR(0, 214, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_sound, __pyx_n_s_events_when_about_to_finish); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 240, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_3 = __Pyx_PyList_Extend(__pyx_v_events_when_about_to_finish, __pyx_t_1); if (unlikely(__pyx_t_3 == ((int)-1))) __PYX_ERR(0, 240, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":200
- *         playlist.current_sound_instance = sound_instance
+    /* "mpfmc/core/audio/playlist_controller.pyx":239
+ * 
+ *         events_when_about_to_finish = []
+ *         if sound.events_when_about_to_finish:             # <<<<<<<<<<<<<<
+ *             events_when_about_to_finish.extend(sound.events_when_about_to_finish)
+ *         events_when_about_to_finish.extend(['{}_playlist_sound_about_to_finish'.format(self.name.lower())])
+ */
+  }
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":241
+ *         if sound.events_when_about_to_finish:
+ *             events_when_about_to_finish.extend(sound.events_when_about_to_finish)
+ *         events_when_about_to_finish.extend(['{}_playlist_sound_about_to_finish'.format(self.name.lower())])             # <<<<<<<<<<<<<<
+ * 
+ *         return {
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_playlist_sound_about_to_finish, __pyx_n_s_format); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 241, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_name); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 241, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_lower); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 241, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_6 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_7))) {
+    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_7);
+    if (likely(__pyx_t_6)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_7);
+      __Pyx_INCREF(__pyx_t_6);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_7, function);
+    }
+  }
+  if (__pyx_t_6) {
+    __pyx_t_5 = __Pyx_PyObject_CallOneArg(__pyx_t_7, __pyx_t_6); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 241, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  } else {
+    __pyx_t_5 = __Pyx_PyObject_CallNoArg(__pyx_t_7); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 241, __pyx_L1_error)
+  }
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_4);
+    if (likely(__pyx_t_7)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_7);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_4, function);
+    }
+  }
+  if (!__pyx_t_7) {
+    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 241, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+  } else {
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_4)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_7, __pyx_t_5};
+      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 241, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_7, __pyx_t_5};
+      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 241, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_6 = PyTuple_New(1+1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 241, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_GIVEREF(__pyx_t_7); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_7); __pyx_t_7 = NULL;
+      __Pyx_GIVEREF(__pyx_t_5);
+      PyTuple_SET_ITEM(__pyx_t_6, 0+1, __pyx_t_5);
+      __pyx_t_5 = 0;
+      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 241, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    }
+  }
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = PyList_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 241, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyList_SET_ITEM(__pyx_t_4, 0, __pyx_t_1);
+  __pyx_t_1 = 0;
+  __pyx_t_3 = __Pyx_PyList_Extend(__pyx_v_events_when_about_to_finish, __pyx_t_4); if (unlikely(__pyx_t_3 == ((int)-1))) __PYX_ERR(0, 241, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":243
+ *         events_when_about_to_finish.extend(['{}_playlist_sound_about_to_finish'.format(self.name.lower())])
+ * 
+ *         return {             # <<<<<<<<<<<<<<
+ *             'fade_in': fade_in,
+ *             'fade_out': 0.0,
+ */
+  __Pyx_XDECREF(__pyx_r);
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":244
+ * 
+ *         return {
+ *             'fade_in': fade_in,             # <<<<<<<<<<<<<<
+ *             'fade_out': 0.0,
+ *             'about_to_finish_time': playlist.crossfade_time,
+ */
+  __pyx_t_4 = __Pyx_PyDict_NewPresized(7); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 244, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_fade_in); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 244, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_u_fade_in, __pyx_t_1) < 0) __PYX_ERR(0, 244, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_u_fade_out, __pyx_float_0_0) < 0) __PYX_ERR(0, 244, __pyx_L1_error)
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":246
+ *             'fade_in': fade_in,
+ *             'fade_out': 0.0,
+ *             'about_to_finish_time': playlist.crossfade_time,             # <<<<<<<<<<<<<<
+ *             'max_queue_time': None,
+ *             'events_when_played': events_when_played,
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_playlist, __pyx_n_s_crossfade_time); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 246, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_u_about_to_finish_time, __pyx_t_1) < 0) __PYX_ERR(0, 244, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":247
+ *             'fade_out': 0.0,
+ *             'about_to_finish_time': playlist.crossfade_time,
+ *             'max_queue_time': None,             # <<<<<<<<<<<<<<
+ *             'events_when_played': events_when_played,
+ *             'events_when_stopped': events_when_stopped,
+ */
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_u_max_queue_time, Py_None) < 0) __PYX_ERR(0, 244, __pyx_L1_error)
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":248
+ *             'about_to_finish_time': playlist.crossfade_time,
+ *             'max_queue_time': None,
+ *             'events_when_played': events_when_played,             # <<<<<<<<<<<<<<
+ *             'events_when_stopped': events_when_stopped,
+ *             'events_when_about_to_finish': events_when_about_to_finish
+ */
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_u_events_when_played, __pyx_v_events_when_played) < 0) __PYX_ERR(0, 244, __pyx_L1_error)
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":249
+ *             'max_queue_time': None,
+ *             'events_when_played': events_when_played,
+ *             'events_when_stopped': events_when_stopped,             # <<<<<<<<<<<<<<
+ *             'events_when_about_to_finish': events_when_about_to_finish
+ *         }
+ */
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_u_events_when_stopped, __pyx_v_events_when_stopped) < 0) __PYX_ERR(0, 244, __pyx_L1_error)
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":250
+ *             'events_when_played': events_when_played,
+ *             'events_when_stopped': events_when_stopped,
+ *             'events_when_about_to_finish': events_when_about_to_finish             # <<<<<<<<<<<<<<
+ *         }
+ * 
+ */
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_u_events_when_about_to_finish, __pyx_v_events_when_about_to_finish) < 0) __PYX_ERR(0, 244, __pyx_L1_error)
+  __pyx_r = __pyx_t_4;
+  __pyx_t_4 = 0;
+  goto __pyx_L0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":222
+ *         playlist.current_sound_instance = sound_instance
+ * 
+ *     def _get_playlist_sound_settings(self, object sound, object playlist, float fade_in=0.0):             # <<<<<<<<<<<<<<
+ *         """Returns the settings used to play a playlist sound (overrides certain settings needed
+ *         to manage the playlist)."""
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController._get_playlist_sound_settings", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_events_when_played);
+  __Pyx_XDECREF(__pyx_v_events_when_stopped);
+  __Pyx_XDECREF(__pyx_v_events_when_about_to_finish);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/playlist_controller.pyx":253
+ *         }
+ * 
+ *     def _get_next_sound_name(self):             # <<<<<<<<<<<<<<
+ *         """Returns the name of the next sound of the current playlist (a sound that has already
+ *         been taken from the playlist but has not been played is returned first).  Posts the
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_31_get_next_sound_name(PyObject *__pyx_self, PyObject *__pyx_v_self); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_30_get_next_sound_name[] = "PlaylistController._get_next_sound_name(self)\nReturns the name of the next sound of the current playlist (a sound that has already\n        been taken from the playlist but has not been played is returned first).  Posts the\n        playlist looping events when the playlist starts over.";
+static PyMethodDef __pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_31_get_next_sound_name = {"_get_next_sound_name", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_31_get_next_sound_name, METH_O, __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_30_get_next_sound_name};
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_31_get_next_sound_name(PyObject *__pyx_self, PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("_get_next_sound_name (wrapper)", 0);
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_30_get_next_sound_name(__pyx_self, ((PyObject *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_30_get_next_sound_name(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
+  PyObject *__pyx_v_sound_name = NULL;
+  PyObject *__pyx_v_event = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  Py_ssize_t __pyx_t_5;
+  PyObject *(*__pyx_t_6)(PyObject *);
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  __Pyx_RefNannySetupContext("_get_next_sound_name", 0);
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":257
+ *         been taken from the playlist but has not been played is returned first).  Posts the
+ *         playlist looping events when the playlist starts over."""
+ *         if self._next_sound_name is not None:             # <<<<<<<<<<<<<<
+ *             sound_name = self._next_sound_name
+ *             self._next_sound_name = None
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_next_sound_name); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 257, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = (__pyx_t_1 != Py_None);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":258
+ *         playlist looping events when the playlist starts over."""
+ *         if self._next_sound_name is not None:
+ *             sound_name = self._next_sound_name             # <<<<<<<<<<<<<<
+ *             self._next_sound_name = None
+ *             return sound_name
+ */
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_next_sound_name); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 258, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_v_sound_name = __pyx_t_1;
+    __pyx_t_1 = 0;
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":259
+ *         if self._next_sound_name is not None:
+ *             sound_name = self._next_sound_name
+ *             self._next_sound_name = None             # <<<<<<<<<<<<<<
+ *             return sound_name
+ * 
+ */
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_next_sound_name, Py_None) < 0) __PYX_ERR(0, 259, __pyx_L1_error)
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":260
+ *             sound_name = self._next_sound_name
+ *             self._next_sound_name = None
+ *             return sound_name             # <<<<<<<<<<<<<<
+ * 
+ *         # Determine if playlist will now repeat/loop.  Post playlist looping events (if necessary)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_v_sound_name);
+    __pyx_r = __pyx_v_sound_name;
+    goto __pyx_L0;
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":257
+ *         been taken from the playlist but has not been played is returned first).  Posts the
+ *         playlist looping events when the playlist starts over."""
+ *         if self._next_sound_name is not None:             # <<<<<<<<<<<<<<
+ *             sound_name = self._next_sound_name
+ *             self._next_sound_name = None
+ */
+  }
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":263
+ * 
+ *         # Determine if playlist will now repeat/loop.  Post playlist looping events (if necessary)
+ *         if self._current_playlist.end_of_playlist:             # <<<<<<<<<<<<<<
+ *             if self._current_playlist.repeat and self._current_playlist.events_when_looping:
+ *                     for event in self._current_playlist.events_when_looping:
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 263, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_end_of_playlist); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 263, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 263, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (__pyx_t_3) {
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":264
+ *         # Determine if playlist will now repeat/loop.  Post playlist looping events (if necessary)
+ *         if self._current_playlist.end_of_playlist:
+ *             if self._current_playlist.repeat and self._current_playlist.events_when_looping:             # <<<<<<<<<<<<<<
+ *                     for event in self._current_playlist.events_when_looping:
+ *                         self.mc.post_mc_native_event(event)
+ */
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 264, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_repeat); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 264, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 264, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_3 = __pyx_t_2;
+      goto __pyx_L6_bool_binop_done;
+    }
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 264, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_events_when_looping); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 264, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 264, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_3 = __pyx_t_2;
+    __pyx_L6_bool_binop_done:;
+    if (__pyx_t_3) {
+
+      /* "mpfmc/core/audio/playlist_controller.pyx":265
+ *         if self._current_playlist.end_of_playlist:
+ *             if self._current_playlist.repeat and self._current_playlist.events_when_looping:
+ *                     for event in self._current_playlist.events_when_looping:             # <<<<<<<<<<<<<<
+ *                         self.mc.post_mc_native_event(event)
+ * 
+ */
+      __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 265, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_events_when_looping); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 265, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (likely(PyList_CheckExact(__pyx_t_1)) || PyTuple_CheckExact(__pyx_t_1)) {
+        __pyx_t_4 = __pyx_t_1; __Pyx_INCREF(__pyx_t_4); __pyx_t_5 = 0;
+        __pyx_t_6 = NULL;
+      } else {
+        __pyx_t_5 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 265, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __pyx_t_6 = Py_TYPE(__pyx_t_4)->tp_iternext; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 265, __pyx_L1_error)
+      }
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      for (;;) {
+        if (likely(!__pyx_t_6)) {
+          if (likely(PyList_CheckExact(__pyx_t_4))) {
+            if (__pyx_t_5 >= PyList_GET_SIZE(__pyx_t_4)) break;
+            #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+            __pyx_t_1 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_5); __Pyx_INCREF(__pyx_t_1); __pyx_t_5++; if (unlikely(0 < 0)) __PYX_ERR(0, 265, __pyx_L1_error)
+            #else
+            __pyx_t_1 = PySequence_ITEM(__pyx_t_4, __pyx_t_5); __pyx_t_5++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 265, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_1);
+            #endif
+          } else {
+            if (__pyx_t_5 >= PyTuple_GET_SIZE(__pyx_t_4)) break;
+            #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+            __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_5); __Pyx_INCREF(__pyx_t_1); __pyx_t_5++; if (unlikely(0 < 0)) __PYX_ERR(0, 265, __pyx_L1_error)
+            #else
+            __pyx_t_1 = PySequence_ITEM(__pyx_t_4, __pyx_t_5); __pyx_t_5++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 265, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_1);
+            #endif
+          }
+        } else {
+          __pyx_t_1 = __pyx_t_6(__pyx_t_4);
+          if (unlikely(!__pyx_t_1)) {
+            PyObject* exc_type = PyErr_Occurred();
+            if (exc_type) {
+              if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+              else __PYX_ERR(0, 265, __pyx_L1_error)
+            }
+            break;
+          }
+          __Pyx_GOTREF(__pyx_t_1);
+        }
+        __Pyx_XDECREF_SET(__pyx_v_event, __pyx_t_1);
+        __pyx_t_1 = 0;
+
+        /* "mpfmc/core/audio/playlist_controller.pyx":266
+ *             if self._current_playlist.repeat and self._current_playlist.events_when_looping:
+ *                     for event in self._current_playlist.events_when_looping:
+ *                         self.mc.post_mc_native_event(event)             # <<<<<<<<<<<<<<
+ * 
+ *         return self._current_playlist.get_next_sound_name()
+ */
+        __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_mc); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 266, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_7);
+        __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_7, __pyx_n_s_post_mc_native_event); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 266, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+        __pyx_t_7 = NULL;
+        if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_8))) {
+          __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_8);
+          if (likely(__pyx_t_7)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_8);
+            __Pyx_INCREF(__pyx_t_7);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_8, function);
+          }
+        }
+        if (!__pyx_t_7) {
+          __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_8, __pyx_v_event); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 266, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_1);
+        } else {
+          #if CYTHON_FAST_PYCALL
+          if (PyFunction_Check(__pyx_t_8)) {
+            PyObject *__pyx_temp[2] = {__pyx_t_7, __pyx_v_event};
+            __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_8, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 266, __pyx_L1_error)
+            __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+            __Pyx_GOTREF(__pyx_t_1);
+          } else
+          #endif
+          #if CYTHON_FAST_PYCCALL
+          if (__Pyx_PyFastCFunction_Check(__pyx_t_8)) {
+            PyObject *__pyx_temp[2] = {__pyx_t_7, __pyx_v_event};
+            __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_8, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 266, __pyx_L1_error)
+            __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+            __Pyx_GOTREF(__pyx_t_1);
+          } else
+          #endif
+          {
+            __pyx_t_9 = PyTuple_New(1+1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 266, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_9);
+            __Pyx_GIVEREF(__pyx_t_7); PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_7); __pyx_t_7 = NULL;
+            __Pyx_INCREF(__pyx_v_event);
+            __Pyx_GIVEREF(__pyx_v_event);
+            PyTuple_SET_ITEM(__pyx_t_9, 0+1, __pyx_v_event);
+            __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_8, __pyx_t_9, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 266, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_1);
+            __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+          }
+        }
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+        /* "mpfmc/core/audio/playlist_controller.pyx":265
+ *         if self._current_playlist.end_of_playlist:
+ *             if self._current_playlist.repeat and self._current_playlist.events_when_looping:
+ *                     for event in self._current_playlist.events_when_looping:             # <<<<<<<<<<<<<<
+ *                         self.mc.post_mc_native_event(event)
+ * 
+ */
+      }
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+      /* "mpfmc/core/audio/playlist_controller.pyx":264
+ *         # Determine if playlist will now repeat/loop.  Post playlist looping events (if necessary)
+ *         if self._current_playlist.end_of_playlist:
+ *             if self._current_playlist.repeat and self._current_playlist.events_when_looping:             # <<<<<<<<<<<<<<
+ *                     for event in self._current_playlist.events_when_looping:
+ *                         self.mc.post_mc_native_event(event)
+ */
+    }
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":263
+ * 
+ *         # Determine if playlist will now repeat/loop.  Post playlist looping events (if necessary)
+ *         if self._current_playlist.end_of_playlist:             # <<<<<<<<<<<<<<
+ *             if self._current_playlist.repeat and self._current_playlist.events_when_looping:
+ *                     for event in self._current_playlist.events_when_looping:
+ */
+  }
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":268
+ *                         self.mc.post_mc_native_event(event)
+ * 
+ *         return self._current_playlist.get_next_sound_name()             # <<<<<<<<<<<<<<
+ * 
+ *     def _has_next_sound(self, object playlist):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 268, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_get_next_sound_name); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 268, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_8))) {
+    __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_8);
+    if (likely(__pyx_t_1)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_8);
+      __Pyx_INCREF(__pyx_t_1);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_8, function);
+    }
+  }
+  if (__pyx_t_1) {
+    __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_t_8, __pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 268, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  } else {
+    __pyx_t_4 = __Pyx_PyObject_CallNoArg(__pyx_t_8); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 268, __pyx_L1_error)
+  }
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  __pyx_r = __pyx_t_4;
+  __pyx_t_4 = 0;
+  goto __pyx_L0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":253
+ *         }
+ * 
+ *     def _get_next_sound_name(self):             # <<<<<<<<<<<<<<
+ *         """Returns the name of the next sound of the current playlist (a sound that has already
+ *         been taken from the playlist but has not been played is returned first).  Posts the
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController._get_next_sound_name", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_sound_name);
+  __Pyx_XDECREF(__pyx_v_event);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/playlist_controller.pyx":270
+ *         return self._current_playlist.get_next_sound_name()
+ * 
+ *     def _has_next_sound(self, object playlist):             # <<<<<<<<<<<<<<
+ *         """Returns whether there is another sound to play after the current one in the playlist"""
+ *         return not playlist.end_of_playlist or playlist.repeat or self._next_sound_name is not None
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_33_has_next_sound(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_32_has_next_sound[] = "PlaylistController._has_next_sound(self, playlist)\nReturns whether there is another sound to play after the current one in the playlist";
+static PyMethodDef __pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_33_has_next_sound = {"_has_next_sound", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_33_has_next_sound, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_32_has_next_sound};
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_33_has_next_sound(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_self = 0;
+  PyObject *__pyx_v_playlist = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("_has_next_sound (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_playlist,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_self)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_playlist)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("_has_next_sound", 1, 2, 2, 1); __PYX_ERR(0, 270, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "_has_next_sound") < 0)) __PYX_ERR(0, 270, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+    }
+    __pyx_v_self = values[0];
+    __pyx_v_playlist = values[1];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("_has_next_sound", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 270, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController._has_next_sound", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_32_has_next_sound(__pyx_self, __pyx_v_self, __pyx_v_playlist);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_32_has_next_sound(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_playlist) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  __Pyx_RefNannySetupContext("_has_next_sound", 0);
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":272
+ *     def _has_next_sound(self, object playlist):
+ *         """Returns whether there is another sound to play after the current one in the playlist"""
+ *         return not playlist.end_of_playlist or playlist.repeat or self._next_sound_name is not None             # <<<<<<<<<<<<<<
+ * 
+ *     def _schedule_prepare_next_sound(self, sound_instance):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_playlist, __pyx_n_s_end_of_playlist); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 272, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 272, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_4 = (!__pyx_t_3);
+  if (!__pyx_t_4) {
+  } else {
+    __pyx_t_2 = __Pyx_PyBool_FromLong(__pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 272, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L3_bool_binop_done;
+  }
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_playlist, __pyx_n_s_repeat); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 272, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(0, 272, __pyx_L1_error)
+  if (!__pyx_t_4) {
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  } else {
+    __Pyx_INCREF(__pyx_t_2);
+    __pyx_t_1 = __pyx_t_2;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    goto __pyx_L3_bool_binop_done;
+  }
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_next_sound_name); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 272, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = (__pyx_t_2 != Py_None);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyBool_FromLong(__pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 272, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_t_2 = 0;
+  __pyx_L3_bool_binop_done:;
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":270
+ *         return self._current_playlist.get_next_sound_name()
+ * 
+ *     def _has_next_sound(self, object playlist):             # <<<<<<<<<<<<<<
+ *         """Returns whether there is another sound to play after the current one in the playlist"""
+ *         return not playlist.end_of_playlist or playlist.repeat or self._next_sound_name is not None
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController._has_next_sound", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/playlist_controller.pyx":274
+ *         return not playlist.end_of_playlist or playlist.repeat or self._next_sound_name is not None
+ * 
+ *     def _schedule_prepare_next_sound(self, sound_instance):             # <<<<<<<<<<<<<<
+ *         """Schedules the preparation of the next playlist sound the decode ahead time before the
+ *         current sound instance reaches its transition point (about to finish marker or end).  In
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_35_schedule_prepare_next_sound(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_34_schedule_prepare_next_sound[] = "PlaylistController._schedule_prepare_next_sound(self, sound_instance)\nSchedules the preparation of the next playlist sound the decode ahead time before the\n        current sound instance reaches its transition point (about to finish marker or end).  In\n        gapless mode without a decode ahead time, the next sound is prepared right away.";
+static PyMethodDef __pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_35_schedule_prepare_next_sound = {"_schedule_prepare_next_sound", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_35_schedule_prepare_next_sound, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_34_schedule_prepare_next_sound};
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_35_schedule_prepare_next_sound(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_self = 0;
+  PyObject *__pyx_v_sound_instance = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("_schedule_prepare_next_sound (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_sound_instance,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_self)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_sound_instance)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("_schedule_prepare_next_sound", 1, 2, 2, 1); __PYX_ERR(0, 274, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "_schedule_prepare_next_sound") < 0)) __PYX_ERR(0, 274, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+    }
+    __pyx_v_self = values[0];
+    __pyx_v_sound_instance = values[1];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("_schedule_prepare_next_sound", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 274, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController._schedule_prepare_next_sound", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_34_schedule_prepare_next_sound(__pyx_self, __pyx_v_self, __pyx_v_sound_instance);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_34_schedule_prepare_next_sound(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_sound_instance) {
+  PyObject *__pyx_v_delay = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  int __pyx_t_10;
+  PyObject *__pyx_t_11 = NULL;
+  double __pyx_t_12;
+  __Pyx_RefNannySetupContext("_schedule_prepare_next_sound", 0);
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":278
+ *         current sound instance reaches its transition point (about to finish marker or end).  In
+ *         gapless mode without a decode ahead time, the next sound is prepared right away."""
+ *         if (self._decode_ahead_time <= 0.0 and not self._gapless) or sound_instance.loops != 0 or \             # <<<<<<<<<<<<<<
+ *                 not self._has_next_sound(self._current_playlist):
+ *             return
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_decode_ahead_time_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 278, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyObject_RichCompare(__pyx_t_2, __pyx_float_0_0, Py_LE); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 278, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(0, 278, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (!__pyx_t_4) {
+    goto __pyx_L5_next_or;
+  } else {
+  }
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_gapless_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 278, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(0, 278, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_5 = ((!__pyx_t_4) != 0);
+  if (!__pyx_t_5) {
+  } else {
+    __pyx_t_1 = __pyx_t_5;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_L5_next_or:;
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_sound_instance, __pyx_n_s_loops); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 278, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_2 = PyObject_RichCompare(__pyx_t_3, __pyx_int_0, Py_NE); __Pyx_XGOTREF(__pyx_t_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 278, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_5 < 0)) __PYX_ERR(0, 278, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (!__pyx_t_5) {
+  } else {
+    __pyx_t_1 = __pyx_t_5;
+    goto __pyx_L4_bool_binop_done;
+  }
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":279
+ *         gapless mode without a decode ahead time, the next sound is prepared right away."""
+ *         if (self._decode_ahead_time <= 0.0 and not self._gapless) or sound_instance.loops != 0 or \
+ *                 not self._has_next_sound(self._current_playlist):             # <<<<<<<<<<<<<<
+ *             return
+ * 
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_has_next_sound); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 279, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 279, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_7 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_7)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_7);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+    }
+  }
+  if (!__pyx_t_7) {
+    __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 279, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_GOTREF(__pyx_t_2);
+  } else {
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_3)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_7, __pyx_t_6};
+      __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 279, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_7, __pyx_t_6};
+      __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 279, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_8 = PyTuple_New(1+1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 279, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_GIVEREF(__pyx_t_7); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_7); __pyx_t_7 = NULL;
+      __Pyx_GIVEREF(__pyx_t_6);
+      PyTuple_SET_ITEM(__pyx_t_8, 0+1, __pyx_t_6);
+      __pyx_t_6 = 0;
+      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_8, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 279, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    }
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_5 < 0)) __PYX_ERR(0, 279, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_4 = ((!__pyx_t_5) != 0);
+  __pyx_t_1 = __pyx_t_4;
+  __pyx_L4_bool_binop_done:;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":278
+ *         current sound instance reaches its transition point (about to finish marker or end).  In
+ *         gapless mode without a decode ahead time, the next sound is prepared right away."""
+ *         if (self._decode_ahead_time <= 0.0 and not self._gapless) or sound_instance.loops != 0 or \             # <<<<<<<<<<<<<<
+ *                 not self._has_next_sound(self._current_playlist):
+ *             return
+ */
+  if (__pyx_t_1) {
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":280
+ *         if (self._decode_ahead_time <= 0.0 and not self._gapless) or sound_instance.loops != 0 or \
+ *                 not self._has_next_sound(self._current_playlist):
+ *             return             # <<<<<<<<<<<<<<
+ * 
+ *         if sound_instance.sound.container is None:
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":278
+ *         current sound instance reaches its transition point (about to finish marker or end).  In
+ *         gapless mode without a decode ahead time, the next sound is prepared right away."""
+ *         if (self._decode_ahead_time <= 0.0 and not self._gapless) or sound_instance.loops != 0 or \             # <<<<<<<<<<<<<<
+ *                 not self._has_next_sound(self._current_playlist):
+ *             return
+ */
+  }
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":282
+ *             return
+ * 
+ *         if sound_instance.sound.container is None:             # <<<<<<<<<<<<<<
+ *             # The duration of the sound is only known once it has been loaded (e.g. an on demand
+ *             # sound which has been unloaded), schedule the preparation when it has been loaded
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_sound_instance, __pyx_n_s_sound); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 282, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_container); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 282, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_1 = (__pyx_t_3 == Py_None);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_4 = (__pyx_t_1 != 0);
+  if (__pyx_t_4) {
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":285
+ *             # The duration of the sound is only known once it has been loaded (e.g. an on demand
+ *             # sound which has been unloaded), schedule the preparation when it has been loaded
+ *             if not sound_instance.sound.loaded:             # <<<<<<<<<<<<<<
+ *                 sound_instance.sound.load(callback=partial(self._on_current_sound_loaded, sound_instance))
+ *             return
+ */
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_sound_instance, __pyx_n_s_sound); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 285, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_loaded); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 285, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(0, 285, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_1 = ((!__pyx_t_4) != 0);
+    if (__pyx_t_1) {
+
+      /* "mpfmc/core/audio/playlist_controller.pyx":286
+ *             # sound which has been unloaded), schedule the preparation when it has been loaded
+ *             if not sound_instance.sound.loaded:
+ *                 sound_instance.sound.load(callback=partial(self._on_current_sound_loaded, sound_instance))             # <<<<<<<<<<<<<<
+ *             return
+ * 
+ */
+      __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_sound_instance, __pyx_n_s_sound); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 286, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_load); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 286, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __pyx_t_2 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 286, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_6 = __Pyx_GetModuleGlobalName(__pyx_n_s_partial); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 286, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_on_current_sound_loaded); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 286, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      __pyx_t_9 = NULL;
+      __pyx_t_10 = 0;
+      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_6))) {
+        __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_6);
+        if (likely(__pyx_t_9)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+          __Pyx_INCREF(__pyx_t_9);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_6, function);
+          __pyx_t_10 = 1;
+        }
+      }
+      #if CYTHON_FAST_PYCALL
+      if (PyFunction_Check(__pyx_t_6)) {
+        PyObject *__pyx_temp[3] = {__pyx_t_9, __pyx_t_7, __pyx_v_sound_instance};
+        __pyx_t_8 = __Pyx_PyFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_10, 2+__pyx_t_10); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 286, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __Pyx_GOTREF(__pyx_t_8);
+        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      } else
+      #endif
+      #if CYTHON_FAST_PYCCALL
+      if (__Pyx_PyFastCFunction_Check(__pyx_t_6)) {
+        PyObject *__pyx_temp[3] = {__pyx_t_9, __pyx_t_7, __pyx_v_sound_instance};
+        __pyx_t_8 = __Pyx_PyCFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_10, 2+__pyx_t_10); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 286, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __Pyx_GOTREF(__pyx_t_8);
+        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      } else
+      #endif
+      {
+        __pyx_t_11 = PyTuple_New(2+__pyx_t_10); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 286, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_11);
+        if (__pyx_t_9) {
+          __Pyx_GIVEREF(__pyx_t_9); PyTuple_SET_ITEM(__pyx_t_11, 0, __pyx_t_9); __pyx_t_9 = NULL;
+        }
+        __Pyx_GIVEREF(__pyx_t_7);
+        PyTuple_SET_ITEM(__pyx_t_11, 0+__pyx_t_10, __pyx_t_7);
+        __Pyx_INCREF(__pyx_v_sound_instance);
+        __Pyx_GIVEREF(__pyx_v_sound_instance);
+        PyTuple_SET_ITEM(__pyx_t_11, 1+__pyx_t_10, __pyx_v_sound_instance);
+        __pyx_t_7 = 0;
+        __pyx_t_8 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_11, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 286, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+      }
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_callback, __pyx_t_8) < 0) __PYX_ERR(0, 286, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_empty_tuple, __pyx_t_2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 286, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+
+      /* "mpfmc/core/audio/playlist_controller.pyx":285
+ *             # The duration of the sound is only known once it has been loaded (e.g. an on demand
+ *             # sound which has been unloaded), schedule the preparation when it has been loaded
+ *             if not sound_instance.sound.loaded:             # <<<<<<<<<<<<<<
+ *                 sound_instance.sound.load(callback=partial(self._on_current_sound_loaded, sound_instance))
+ *             return
+ */
+    }
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":287
+ *             if not sound_instance.sound.loaded:
+ *                 sound_instance.sound.load(callback=partial(self._on_current_sound_loaded, sound_instance))
+ *             return             # <<<<<<<<<<<<<<
+ * 
+ *         if self._prepare_next_sound_event is not None:
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":282
+ *             return
+ * 
+ *         if sound_instance.sound.container is None:             # <<<<<<<<<<<<<<
+ *             # The duration of the sound is only known once it has been loaded (e.g. an on demand
+ *             # sound which has been unloaded), schedule the preparation when it has been loaded
+ */
+  }
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":289
+ *             return
+ * 
+ *         if self._prepare_next_sound_event is not None:             # <<<<<<<<<<<<<<
+ *             self._prepare_next_sound_event.cancel()
+ * 
+ */
+  __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_prepare_next_sound_event); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 289, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __pyx_t_1 = (__pyx_t_8 != Py_None);
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  __pyx_t_4 = (__pyx_t_1 != 0);
+  if (__pyx_t_4) {
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":290
+ * 
+ *         if self._prepare_next_sound_event is not None:
+ *             self._prepare_next_sound_event.cancel()             # <<<<<<<<<<<<<<
+ * 
+ *         if self._decode_ahead_time <= 0.0:
+ */
+    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_prepare_next_sound_event); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 290, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_cancel); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 290, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_2)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_2);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    if (__pyx_t_2) {
+      __pyx_t_8 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 290, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    } else {
+      __pyx_t_8 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 290, __pyx_L1_error)
+    }
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":289
+ *             return
+ * 
+ *         if self._prepare_next_sound_event is not None:             # <<<<<<<<<<<<<<
+ *             self._prepare_next_sound_event.cancel()
+ * 
+ */
+  }
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":292
+ *             self._prepare_next_sound_event.cancel()
+ * 
+ *         if self._decode_ahead_time <= 0.0:             # <<<<<<<<<<<<<<
+ *             delay = 0.0
+ *         else:
+ */
+  __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_decode_ahead_time_2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 292, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __pyx_t_3 = PyObject_RichCompare(__pyx_t_8, __pyx_float_0_0, Py_LE); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 292, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(0, 292, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (__pyx_t_4) {
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":293
+ * 
+ *         if self._decode_ahead_time <= 0.0:
+ *             delay = 0.0             # <<<<<<<<<<<<<<
+ *         else:
+ *             delay = sound_instance.sound.container.duration - sound_instance.start_at - self._decode_ahead_time
+ */
+    __Pyx_INCREF(__pyx_float_0_0);
+    __pyx_v_delay = __pyx_float_0_0;
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":292
+ *             self._prepare_next_sound_event.cancel()
+ * 
+ *         if self._decode_ahead_time <= 0.0:             # <<<<<<<<<<<<<<
+ *             delay = 0.0
+ *         else:
+ */
+    goto __pyx_L11;
+  }
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":295
+ *             delay = 0.0
+ *         else:
+ *             delay = sound_instance.sound.container.duration - sound_instance.start_at - self._decode_ahead_time             # <<<<<<<<<<<<<<
+ *             if not self._gapless:
+ *                 delay -= self._current_playlist.crossfade_time
+ */
+  /*else*/ {
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_sound_instance, __pyx_n_s_sound); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 295, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_container); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 295, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_n_s_duration); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 295, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_v_sound_instance, __pyx_n_s_start_at); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 295, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_2 = PyNumber_Subtract(__pyx_t_3, __pyx_t_8); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 295, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_decode_ahead_time_2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 295, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_3 = PyNumber_Subtract(__pyx_t_2, __pyx_t_8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 295, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __pyx_v_delay = __pyx_t_3;
+    __pyx_t_3 = 0;
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":296
+ *         else:
+ *             delay = sound_instance.sound.container.duration - sound_instance.start_at - self._decode_ahead_time
+ *             if not self._gapless:             # <<<<<<<<<<<<<<
+ *                 delay -= self._current_playlist.crossfade_time
+ * 
+ */
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_gapless_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 296, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(0, 296, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_1 = ((!__pyx_t_4) != 0);
+    if (__pyx_t_1) {
+
+      /* "mpfmc/core/audio/playlist_controller.pyx":297
+ *             delay = sound_instance.sound.container.duration - sound_instance.start_at - self._decode_ahead_time
+ *             if not self._gapless:
+ *                 delay -= self._current_playlist.crossfade_time             # <<<<<<<<<<<<<<
+ * 
+ *         self._prepare_next_sound_event = self.mc.clock.schedule_once(
+ */
+      __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 297, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_crossfade_time); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 297, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_t_3 = PyNumber_InPlaceSubtract(__pyx_v_delay, __pyx_t_8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 297, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __Pyx_DECREF_SET(__pyx_v_delay, __pyx_t_3);
+      __pyx_t_3 = 0;
+
+      /* "mpfmc/core/audio/playlist_controller.pyx":296
+ *         else:
+ *             delay = sound_instance.sound.container.duration - sound_instance.start_at - self._decode_ahead_time
+ *             if not self._gapless:             # <<<<<<<<<<<<<<
+ *                 delay -= self._current_playlist.crossfade_time
+ * 
+ */
+    }
+  }
+  __pyx_L11:;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":299
+ *                 delay -= self._current_playlist.crossfade_time
+ * 
+ *         self._prepare_next_sound_event = self.mc.clock.schedule_once(             # <<<<<<<<<<<<<<
+ *             partial(self._prepare_next_sound, sound_instance), max(delay, 0.0))
+ * 
+ */
+  __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_mc); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 299, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_n_s_clock); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 299, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_schedule_once); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 299, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":300
+ * 
+ *         self._prepare_next_sound_event = self.mc.clock.schedule_once(
+ *             partial(self._prepare_next_sound, sound_instance), max(delay, 0.0))             # <<<<<<<<<<<<<<
+ * 
+ *     def _on_current_sound_loaded(self, sound_instance, sound=None):
+ */
+  __pyx_t_6 = __Pyx_GetModuleGlobalName(__pyx_n_s_partial); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 300, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_11 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_prepare_next_sound); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 300, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_11);
+  __pyx_t_7 = NULL;
+  __pyx_t_10 = 0;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_6))) {
+    __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_6);
+    if (likely(__pyx_t_7)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+      __Pyx_INCREF(__pyx_t_7);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_6, function);
+      __pyx_t_10 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_6)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_7, __pyx_t_11, __pyx_v_sound_instance};
+    __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_10, 2+__pyx_t_10); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 300, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_6)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_7, __pyx_t_11, __pyx_v_sound_instance};
+    __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_10, 2+__pyx_t_10); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 300, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+  } else
+  #endif
+  {
+    __pyx_t_9 = PyTuple_New(2+__pyx_t_10); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 300, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    if (__pyx_t_7) {
+      __Pyx_GIVEREF(__pyx_t_7); PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_7); __pyx_t_7 = NULL;
+    }
+    __Pyx_GIVEREF(__pyx_t_11);
+    PyTuple_SET_ITEM(__pyx_t_9, 0+__pyx_t_10, __pyx_t_11);
+    __Pyx_INCREF(__pyx_v_sound_instance);
+    __Pyx_GIVEREF(__pyx_v_sound_instance);
+    PyTuple_SET_ITEM(__pyx_t_9, 1+__pyx_t_10, __pyx_v_sound_instance);
+    __pyx_t_11 = 0;
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_9, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 300, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_12 = 0.0;
+  __Pyx_INCREF(__pyx_v_delay);
+  __pyx_t_6 = __pyx_v_delay;
+  __pyx_t_11 = PyFloat_FromDouble(__pyx_t_12); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 300, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_11);
+  __pyx_t_7 = PyObject_RichCompare(__pyx_t_11, __pyx_t_6, Py_GT); __Pyx_XGOTREF(__pyx_t_7); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 300, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_7); if (unlikely(__pyx_t_1 < 0)) __PYX_ERR(0, 300, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  if (__pyx_t_1) {
+    __pyx_t_7 = PyFloat_FromDouble(__pyx_t_12); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 300, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_9 = __pyx_t_7;
+    __pyx_t_7 = 0;
+  } else {
+    __Pyx_INCREF(__pyx_t_6);
+    __pyx_t_9 = __pyx_t_6;
+  }
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_6 = NULL;
+  __pyx_t_10 = 0;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_8))) {
+    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_8);
+    if (likely(__pyx_t_6)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_8);
+      __Pyx_INCREF(__pyx_t_6);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_8, function);
+      __pyx_t_10 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_8)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_t_2, __pyx_t_9};
+    __pyx_t_3 = __Pyx_PyFunction_FastCall(__pyx_t_8, __pyx_temp+1-__pyx_t_10, 2+__pyx_t_10); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 299, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_8)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_t_2, __pyx_t_9};
+    __pyx_t_3 = __Pyx_PyCFunction_FastCall(__pyx_t_8, __pyx_temp+1-__pyx_t_10, 2+__pyx_t_10); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 299, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  } else
+  #endif
+  {
+    __pyx_t_7 = PyTuple_New(2+__pyx_t_10); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 299, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    if (__pyx_t_6) {
+      __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_6); __pyx_t_6 = NULL;
+    }
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_7, 0+__pyx_t_10, __pyx_t_2);
+    __Pyx_INCREF(__pyx_t_9);
+    __Pyx_GIVEREF(__pyx_t_9);
+    PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_10, __pyx_t_9);
+    __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_8, __pyx_t_7, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 299, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":299
+ *                 delay -= self._current_playlist.crossfade_time
+ * 
+ *         self._prepare_next_sound_event = self.mc.clock.schedule_once(             # <<<<<<<<<<<<<<
+ *             partial(self._prepare_next_sound, sound_instance), max(delay, 0.0))
+ * 
+ */
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_prepare_next_sound_event, __pyx_t_3) < 0) __PYX_ERR(0, 299, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":274
+ *         return not playlist.end_of_playlist or playlist.repeat or self._next_sound_name is not None
+ * 
+ *     def _schedule_prepare_next_sound(self, sound_instance):             # <<<<<<<<<<<<<<
+ *         """Schedules the preparation of the next playlist sound the decode ahead time before the
+ *         current sound instance reaches its transition point (about to finish marker or end).  In
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController._schedule_prepare_next_sound", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_delay);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/playlist_controller.pyx":302
+ *             partial(self._prepare_next_sound, sound_instance), max(delay, 0.0))
+ * 
+ *     def _on_current_sound_loaded(self, sound_instance, sound=None):             # <<<<<<<<<<<<<<
+ *         """Callback function called when the sound of the current sound instance has been loaded
+ *         (schedules the preparation of the next sound)."""
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_37_on_current_sound_loaded(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_36_on_current_sound_loaded[] = "PlaylistController._on_current_sound_loaded(self, sound_instance, sound=None)\nCallback function called when the sound of the current sound instance has been loaded\n        (schedules the preparation of the next sound).";
+static PyMethodDef __pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_37_on_current_sound_loaded = {"_on_current_sound_loaded", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_37_on_current_sound_loaded, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_36_on_current_sound_loaded};
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_37_on_current_sound_loaded(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_self = 0;
+  PyObject *__pyx_v_sound_instance = 0;
+  PyObject *__pyx_v_sound = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("_on_current_sound_loaded (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_sound_instance,&__pyx_n_s_sound,0};
+    PyObject* values[3] = {0,0,0};
+    values[2] = ((PyObject *)((PyObject *)Py_None));
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_self)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_sound_instance)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("_on_current_sound_loaded", 0, 2, 3, 1); __PYX_ERR(0, 302, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (kw_args > 0) {
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_sound);
+          if (value) { values[2] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "_on_current_sound_loaded") < 0)) __PYX_ERR(0, 302, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_self = values[0];
+    __pyx_v_sound_instance = values[1];
+    __pyx_v_sound = values[2];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("_on_current_sound_loaded", 0, 2, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 302, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController._on_current_sound_loaded", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_36_on_current_sound_loaded(__pyx_self, __pyx_v_self, __pyx_v_sound_instance, __pyx_v_sound);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_36_on_current_sound_loaded(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_sound_instance, PyObject *__pyx_v_sound) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  __Pyx_RefNannySetupContext("_on_current_sound_loaded", 0);
+  __Pyx_INCREF(__pyx_v_sound);
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":305
+ *         """Callback function called when the sound of the current sound instance has been loaded
+ *         (schedules the preparation of the next sound)."""
+ *         del sound             # <<<<<<<<<<<<<<
+ *         if self._current_playlist is not None and self._current_playlist.current_sound_instance is sound_instance:
+ *             self._schedule_prepare_next_sound(sound_instance)
+ */
+  __Pyx_DECREF(__pyx_v_sound);
+  __pyx_v_sound = NULL;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":306
+ *         (schedules the preparation of the next sound)."""
+ *         del sound
+ *         if self._current_playlist is not None and self._current_playlist.current_sound_instance is sound_instance:             # <<<<<<<<<<<<<<
+ *             self._schedule_prepare_next_sound(sound_instance)
+ * 
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 306, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = (__pyx_t_2 != Py_None);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_4 = (__pyx_t_3 != 0);
+  if (__pyx_t_4) {
+  } else {
+    __pyx_t_1 = __pyx_t_4;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 306, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_current_sound_instance); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 306, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_4 = (__pyx_t_5 == __pyx_v_sound_instance);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_3 = (__pyx_t_4 != 0);
+  __pyx_t_1 = __pyx_t_3;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":307
+ *         del sound
+ *         if self._current_playlist is not None and self._current_playlist.current_sound_instance is sound_instance:
+ *             self._schedule_prepare_next_sound(sound_instance)             # <<<<<<<<<<<<<<
+ * 
+ *     def _prepare_next_sound(self, sound_instance, dt=None):
+ */
+    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_schedule_prepare_next_sound); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 307, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_6 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_2);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_2, function);
+      }
+    }
+    if (!__pyx_t_6) {
+      __pyx_t_5 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_v_sound_instance); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 307, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+    } else {
+      #if CYTHON_FAST_PYCALL
+      if (PyFunction_Check(__pyx_t_2)) {
+        PyObject *__pyx_temp[2] = {__pyx_t_6, __pyx_v_sound_instance};
+        __pyx_t_5 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 307, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+        __Pyx_GOTREF(__pyx_t_5);
+      } else
+      #endif
+      #if CYTHON_FAST_PYCCALL
+      if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
+        PyObject *__pyx_temp[2] = {__pyx_t_6, __pyx_v_sound_instance};
+        __pyx_t_5 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 307, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+        __Pyx_GOTREF(__pyx_t_5);
+      } else
+      #endif
+      {
+        __pyx_t_7 = PyTuple_New(1+1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 307, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_7);
+        __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_6); __pyx_t_6 = NULL;
+        __Pyx_INCREF(__pyx_v_sound_instance);
+        __Pyx_GIVEREF(__pyx_v_sound_instance);
+        PyTuple_SET_ITEM(__pyx_t_7, 0+1, __pyx_v_sound_instance);
+        __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_7, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 307, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      }
+    }
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":306
+ *         (schedules the preparation of the next sound)."""
+ *         del sound
+ *         if self._current_playlist is not None and self._current_playlist.current_sound_instance is sound_instance:             # <<<<<<<<<<<<<<
+ *             self._schedule_prepare_next_sound(sound_instance)
+ * 
+ */
+  }
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":302
+ *             partial(self._prepare_next_sound, sound_instance), max(delay, 0.0))
+ * 
+ *     def _on_current_sound_loaded(self, sound_instance, sound=None):             # <<<<<<<<<<<<<<
+ *         """Callback function called when the sound of the current sound instance has been loaded
+ *         (schedules the preparation of the next sound)."""
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController._on_current_sound_loaded", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_sound);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/playlist_controller.pyx":309
+ *             self._schedule_prepare_next_sound(sound_instance)
+ * 
+ *     def _prepare_next_sound(self, sound_instance, dt=None):             # <<<<<<<<<<<<<<
+ *         """Loads the next playlist sound and schedules it on the track to start when the specified
+ *         (current) sound instance reaches its about to finish marker (crossfade) or its end
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_39_prepare_next_sound(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_38_prepare_next_sound[] = "PlaylistController._prepare_next_sound(self, sound_instance, dt=None)\nLoads the next playlist sound and schedules it on the track to start when the specified\n        (current) sound instance reaches its about to finish marker (crossfade) or its end\n        (gapless or no crossfade).  The track starts the sound at the exact sample position.";
+static PyMethodDef __pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_39_prepare_next_sound = {"_prepare_next_sound", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_39_prepare_next_sound, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_38_prepare_next_sound};
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_39_prepare_next_sound(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_self = 0;
+  PyObject *__pyx_v_sound_instance = 0;
+  PyObject *__pyx_v_dt = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("_prepare_next_sound (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_sound_instance,&__pyx_n_s_dt,0};
+    PyObject* values[3] = {0,0,0};
+    values[2] = ((PyObject *)((PyObject *)Py_None));
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_self)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_sound_instance)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("_prepare_next_sound", 0, 2, 3, 1); __PYX_ERR(0, 309, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (kw_args > 0) {
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_dt);
+          if (value) { values[2] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "_prepare_next_sound") < 0)) __PYX_ERR(0, 309, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_self = values[0];
+    __pyx_v_sound_instance = values[1];
+    __pyx_v_dt = values[2];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("_prepare_next_sound", 0, 2, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 309, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController._prepare_next_sound", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_38_prepare_next_sound(__pyx_self, __pyx_v_self, __pyx_v_sound_instance, __pyx_v_dt);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_38_prepare_next_sound(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_sound_instance, PyObject *__pyx_v_dt) {
+  PyObject *__pyx_v_playlist = NULL;
+  PyObject *__pyx_v_sound_name = NULL;
+  PyObject *__pyx_v_sound = NULL;
+  PyObject *__pyx_v_settings = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  int __pyx_t_8;
+  PyObject *__pyx_t_9 = NULL;
+  __Pyx_RefNannySetupContext("_prepare_next_sound", 0);
+  __Pyx_INCREF(__pyx_v_dt);
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":313
+ *         (current) sound instance reaches its about to finish marker (crossfade) or its end
+ *         (gapless or no crossfade).  The track starts the sound at the exact sample position."""
+ *         del dt             # <<<<<<<<<<<<<<
+ *         self._prepare_next_sound_event = None
+ * 
+ */
+  __Pyx_DECREF(__pyx_v_dt);
+  __pyx_v_dt = NULL;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":314
+ *         (gapless or no crossfade).  The track starts the sound at the exact sample position."""
+ *         del dt
+ *         self._prepare_next_sound_event = None             # <<<<<<<<<<<<<<
+ * 
+ *         playlist = self._current_playlist
+ */
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_prepare_next_sound_event, Py_None) < 0) __PYX_ERR(0, 314, __pyx_L1_error)
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":316
+ *         self._prepare_next_sound_event = None
+ * 
+ *         playlist = self._current_playlist             # <<<<<<<<<<<<<<
+ *         if playlist is None or playlist.current_sound_instance is not sound_instance or \
+ *                 self._prepared_sound_instance is not None:
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 316, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_playlist = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":317
+ * 
+ *         playlist = self._current_playlist
+ *         if playlist is None or playlist.current_sound_instance is not sound_instance or \             # <<<<<<<<<<<<<<
+ *                 self._prepared_sound_instance is not None:
+ *             return
+ */
+  __pyx_t_3 = (__pyx_v_playlist == Py_None);
+  __pyx_t_4 = (__pyx_t_3 != 0);
+  if (!__pyx_t_4) {
+  } else {
+    __pyx_t_2 = __pyx_t_4;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_playlist, __pyx_n_s_current_sound_instance); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 317, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_4 = (__pyx_t_1 != __pyx_v_sound_instance);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = (__pyx_t_4 != 0);
+  if (!__pyx_t_3) {
+  } else {
+    __pyx_t_2 = __pyx_t_3;
+    goto __pyx_L4_bool_binop_done;
+  }
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":318
+ *         playlist = self._current_playlist
+ *         if playlist is None or playlist.current_sound_instance is not sound_instance or \
+ *                 self._prepared_sound_instance is not None:             # <<<<<<<<<<<<<<
+ *             return
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_prepared_sound_instance); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 318, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = (__pyx_t_1 != Py_None);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_4 = (__pyx_t_3 != 0);
+  __pyx_t_2 = __pyx_t_4;
+  __pyx_L4_bool_binop_done:;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":317
+ * 
+ *         playlist = self._current_playlist
+ *         if playlist is None or playlist.current_sound_instance is not sound_instance or \             # <<<<<<<<<<<<<<
+ *                 self._prepared_sound_instance is not None:
+ *             return
+ */
+  if (__pyx_t_2) {
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":319
+ *         if playlist is None or playlist.current_sound_instance is not sound_instance or \
+ *                 self._prepared_sound_instance is not None:
+ *             return             # <<<<<<<<<<<<<<
+ * 
+ *         if self._is_busy():
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":317
+ * 
+ *         playlist = self._current_playlist
+ *         if playlist is None or playlist.current_sound_instance is not sound_instance or \             # <<<<<<<<<<<<<<
+ *                 self._prepared_sound_instance is not None:
+ *             return
+ */
+  }
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":321
+ *             return
+ * 
+ *         if self._is_busy():             # <<<<<<<<<<<<<<
+ *             # A sound is still fading out, prepare the next sound once it has finished
+ *             self._prepare_next_sound_when_not_busy = True
+ */
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_is_busy); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 321, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
+    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_5);
+    if (likely(__pyx_t_6)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+      __Pyx_INCREF(__pyx_t_6);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_5, function);
+    }
+  }
+  if (__pyx_t_6) {
+    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 321, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  } else {
+    __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 321, __pyx_L1_error)
+  }
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 321, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (__pyx_t_2) {
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":323
+ *         if self._is_busy():
+ *             # A sound is still fading out, prepare the next sound once it has finished
+ *             self._prepare_next_sound_when_not_busy = True             # <<<<<<<<<<<<<<
+ *             return
+ * 
+ */
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_prepare_next_sound_when_not_bus, Py_True) < 0) __PYX_ERR(0, 323, __pyx_L1_error)
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":324
+ *             # A sound is still fading out, prepare the next sound once it has finished
+ *             self._prepare_next_sound_when_not_busy = True
+ *             return             # <<<<<<<<<<<<<<
+ * 
+ *         sound_name = self._get_next_sound_name()
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":321
+ *             return
+ * 
+ *         if self._is_busy():             # <<<<<<<<<<<<<<
+ *             # A sound is still fading out, prepare the next sound once it has finished
+ *             self._prepare_next_sound_when_not_busy = True
+ */
+  }
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":326
+ *             return
+ * 
+ *         sound_name = self._get_next_sound_name()             # <<<<<<<<<<<<<<
+ *         if not sound_name:
+ *             return
+ */
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_get_next_sound_name_2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 326, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
+    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_5);
+    if (likely(__pyx_t_6)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+      __Pyx_INCREF(__pyx_t_6);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_5, function);
+    }
+  }
+  if (__pyx_t_6) {
+    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 326, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  } else {
+    __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 326, __pyx_L1_error)
+  }
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_v_sound_name = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":327
+ * 
+ *         sound_name = self._get_next_sound_name()
+ *         if not sound_name:             # <<<<<<<<<<<<<<
+ *             return
+ * 
+ */
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_v_sound_name); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 327, __pyx_L1_error)
+  __pyx_t_4 = ((!__pyx_t_2) != 0);
+  if (__pyx_t_4) {
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":328
+ *         sound_name = self._get_next_sound_name()
+ *         if not sound_name:
+ *             return             # <<<<<<<<<<<<<<
+ * 
+ *         self.log.debug("Preparing sound '%s' of playlist '%s' for playback.", sound_name, playlist.name)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":327
+ * 
+ *         sound_name = self._get_next_sound_name()
+ *         if not sound_name:             # <<<<<<<<<<<<<<
+ *             return
+ * 
+ */
+  }
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":330
+ *             return
+ * 
+ *         self.log.debug("Preparing sound '%s' of playlist '%s' for playback.", sound_name, playlist.name)             # <<<<<<<<<<<<<<
+ * 
+ *         # Loading a streaming sound builds and pre-rolls its pipeline, the track keeps the sound
+ */
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_log); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 330, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_debug); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 330, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_playlist, __pyx_n_s_name); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 330, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_7 = NULL;
+  __pyx_t_8 = 0;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
+    __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_6);
+    if (likely(__pyx_t_7)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+      __Pyx_INCREF(__pyx_t_7);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_6, function);
+      __pyx_t_8 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_6)) {
+    PyObject *__pyx_temp[4] = {__pyx_t_7, __pyx_kp_u_Preparing_sound_s_of_playlist_s, __pyx_v_sound_name, __pyx_t_5};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_8, 3+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 330, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_6)) {
+    PyObject *__pyx_temp[4] = {__pyx_t_7, __pyx_kp_u_Preparing_sound_s_of_playlist_s, __pyx_v_sound_name, __pyx_t_5};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_8, 3+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 330, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  } else
+  #endif
+  {
+    __pyx_t_9 = PyTuple_New(3+__pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 330, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    if (__pyx_t_7) {
+      __Pyx_GIVEREF(__pyx_t_7); PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_7); __pyx_t_7 = NULL;
+    }
+    __Pyx_INCREF(__pyx_kp_u_Preparing_sound_s_of_playlist_s);
+    __Pyx_GIVEREF(__pyx_kp_u_Preparing_sound_s_of_playlist_s);
+    PyTuple_SET_ITEM(__pyx_t_9, 0+__pyx_t_8, __pyx_kp_u_Preparing_sound_s_of_playlist_s);
+    __Pyx_INCREF(__pyx_v_sound_name);
+    __Pyx_GIVEREF(__pyx_v_sound_name);
+    PyTuple_SET_ITEM(__pyx_t_9, 1+__pyx_t_8, __pyx_v_sound_name);
+    __Pyx_GIVEREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_9, 2+__pyx_t_8, __pyx_t_5);
+    __pyx_t_5 = 0;
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_9, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 330, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":334
+ *         # Loading a streaming sound builds and pre-rolls its pipeline, the track keeps the sound
+ *         # decoding while it waits for the transition point
+ *         sound = self.mc.sounds[sound_name]             # <<<<<<<<<<<<<<
+ *         if self._gapless or playlist.crossfade_time == 0.0:
+ *             settings = self._get_playlist_sound_settings(sound, playlist)
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_mc); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 334, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_sounds); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 334, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyObject_GetItem(__pyx_t_6, __pyx_v_sound_name); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 334, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_v_sound = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":335
+ *         # decoding while it waits for the transition point
+ *         sound = self.mc.sounds[sound_name]
+ *         if self._gapless or playlist.crossfade_time == 0.0:             # <<<<<<<<<<<<<<
+ *             settings = self._get_playlist_sound_settings(sound, playlist)
+ *             settings['start_after_marker'] = 'end'
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_gapless_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 335, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 335, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_4 = __pyx_t_2;
+    goto __pyx_L10_bool_binop_done;
+  }
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_playlist, __pyx_n_s_crossfade_time); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 335, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_6 = __Pyx_PyFloat_EqObjC(__pyx_t_1, __pyx_float_0_0, 0.0, 0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 335, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_6); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 335, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_4 = __pyx_t_2;
+  __pyx_L10_bool_binop_done:;
+  if (__pyx_t_4) {
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":336
+ *         sound = self.mc.sounds[sound_name]
+ *         if self._gapless or playlist.crossfade_time == 0.0:
+ *             settings = self._get_playlist_sound_settings(sound, playlist)             # <<<<<<<<<<<<<<
+ *             settings['start_after_marker'] = 'end'
+ *         else:
+ */
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_get_playlist_sound_settings); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 336, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_9 = NULL;
+    __pyx_t_8 = 0;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_1);
+      if (likely(__pyx_t_9)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+        __Pyx_INCREF(__pyx_t_9);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
+        __pyx_t_8 = 1;
+      }
+    }
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_1)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_9, __pyx_v_sound, __pyx_v_playlist};
+      __pyx_t_6 = __Pyx_PyFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 336, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __Pyx_GOTREF(__pyx_t_6);
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_1)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_9, __pyx_v_sound, __pyx_v_playlist};
+      __pyx_t_6 = __Pyx_PyCFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 336, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __Pyx_GOTREF(__pyx_t_6);
+    } else
+    #endif
+    {
+      __pyx_t_5 = PyTuple_New(2+__pyx_t_8); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 336, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      if (__pyx_t_9) {
+        __Pyx_GIVEREF(__pyx_t_9); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_9); __pyx_t_9 = NULL;
+      }
+      __Pyx_INCREF(__pyx_v_sound);
+      __Pyx_GIVEREF(__pyx_v_sound);
+      PyTuple_SET_ITEM(__pyx_t_5, 0+__pyx_t_8, __pyx_v_sound);
+      __Pyx_INCREF(__pyx_v_playlist);
+      __Pyx_GIVEREF(__pyx_v_playlist);
+      PyTuple_SET_ITEM(__pyx_t_5, 1+__pyx_t_8, __pyx_v_playlist);
+      __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_5, NULL); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 336, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_v_settings = __pyx_t_6;
+    __pyx_t_6 = 0;
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":337
+ *         if self._gapless or playlist.crossfade_time == 0.0:
+ *             settings = self._get_playlist_sound_settings(sound, playlist)
+ *             settings['start_after_marker'] = 'end'             # <<<<<<<<<<<<<<
+ *         else:
+ *             settings = self._get_playlist_sound_settings(sound, playlist, playlist.crossfade_time)
+ */
+    if (unlikely(PyObject_SetItem(__pyx_v_settings, __pyx_n_u_start_after_marker, __pyx_n_u_end) < 0)) __PYX_ERR(0, 337, __pyx_L1_error)
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":335
+ *         # decoding while it waits for the transition point
+ *         sound = self.mc.sounds[sound_name]
+ *         if self._gapless or playlist.crossfade_time == 0.0:             # <<<<<<<<<<<<<<
+ *             settings = self._get_playlist_sound_settings(sound, playlist)
+ *             settings['start_after_marker'] = 'end'
+ */
+    goto __pyx_L9;
+  }
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":339
+ *             settings['start_after_marker'] = 'end'
+ *         else:
+ *             settings = self._get_playlist_sound_settings(sound, playlist, playlist.crossfade_time)             # <<<<<<<<<<<<<<
+ *             settings['start_after_marker'] = 'about_to_finish'
+ *         settings['start_after'] = sound_instance
+ */
+  /*else*/ {
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_get_playlist_sound_settings); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 339, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_playlist, __pyx_n_s_crossfade_time); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 339, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_9 = NULL;
+    __pyx_t_8 = 0;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_1);
+      if (likely(__pyx_t_9)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+        __Pyx_INCREF(__pyx_t_9);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
+        __pyx_t_8 = 1;
+      }
+    }
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_1)) {
+      PyObject *__pyx_temp[4] = {__pyx_t_9, __pyx_v_sound, __pyx_v_playlist, __pyx_t_5};
+      __pyx_t_6 = __Pyx_PyFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_8, 3+__pyx_t_8); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 339, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_1)) {
+      PyObject *__pyx_temp[4] = {__pyx_t_9, __pyx_v_sound, __pyx_v_playlist, __pyx_t_5};
+      __pyx_t_6 = __Pyx_PyCFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_8, 3+__pyx_t_8); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 339, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_7 = PyTuple_New(3+__pyx_t_8); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 339, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      if (__pyx_t_9) {
+        __Pyx_GIVEREF(__pyx_t_9); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_9); __pyx_t_9 = NULL;
+      }
+      __Pyx_INCREF(__pyx_v_sound);
+      __Pyx_GIVEREF(__pyx_v_sound);
+      PyTuple_SET_ITEM(__pyx_t_7, 0+__pyx_t_8, __pyx_v_sound);
+      __Pyx_INCREF(__pyx_v_playlist);
+      __Pyx_GIVEREF(__pyx_v_playlist);
+      PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_8, __pyx_v_playlist);
+      __Pyx_GIVEREF(__pyx_t_5);
+      PyTuple_SET_ITEM(__pyx_t_7, 2+__pyx_t_8, __pyx_t_5);
+      __pyx_t_5 = 0;
+      __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_7, NULL); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 339, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_v_settings = __pyx_t_6;
+    __pyx_t_6 = 0;
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":340
+ *         else:
+ *             settings = self._get_playlist_sound_settings(sound, playlist, playlist.crossfade_time)
+ *             settings['start_after_marker'] = 'about_to_finish'             # <<<<<<<<<<<<<<
+ *         settings['start_after'] = sound_instance
+ * 
+ */
+    if (unlikely(PyObject_SetItem(__pyx_v_settings, __pyx_n_u_start_after_marker, __pyx_n_u_about_to_finish) < 0)) __PYX_ERR(0, 340, __pyx_L1_error)
+  }
+  __pyx_L9:;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":341
+ *             settings = self._get_playlist_sound_settings(sound, playlist, playlist.crossfade_time)
+ *             settings['start_after_marker'] = 'about_to_finish'
+ *         settings['start_after'] = sound_instance             # <<<<<<<<<<<<<<
+ * 
+ *         self._prepared_sound_instance = self._track.play_sound(sound, playlist.context, settings)
+ */
+  if (unlikely(PyObject_SetItem(__pyx_v_settings, __pyx_n_u_start_after, __pyx_v_sound_instance) < 0)) __PYX_ERR(0, 341, __pyx_L1_error)
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":343
+ *         settings['start_after'] = sound_instance
+ * 
+ *         self._prepared_sound_instance = self._track.play_sound(sound, playlist.context, settings)             # <<<<<<<<<<<<<<
+ *         if self._prepared_sound_instance is None:
+ *             self._next_sound_name = sound_name
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_track_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 343, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_play_sound); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 343, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_playlist, __pyx_n_s_context); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 343, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_5 = NULL;
+  __pyx_t_8 = 0;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_7))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_7);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_7);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_7, function);
+      __pyx_t_8 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_7)) {
+    PyObject *__pyx_temp[4] = {__pyx_t_5, __pyx_v_sound, __pyx_t_1, __pyx_v_settings};
+    __pyx_t_6 = __Pyx_PyFunction_FastCall(__pyx_t_7, __pyx_temp+1-__pyx_t_8, 3+__pyx_t_8); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 343, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_7)) {
+    PyObject *__pyx_temp[4] = {__pyx_t_5, __pyx_v_sound, __pyx_t_1, __pyx_v_settings};
+    __pyx_t_6 = __Pyx_PyCFunction_FastCall(__pyx_t_7, __pyx_temp+1-__pyx_t_8, 3+__pyx_t_8); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 343, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  } else
+  #endif
+  {
+    __pyx_t_9 = PyTuple_New(3+__pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 343, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    if (__pyx_t_5) {
+      __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_5); __pyx_t_5 = NULL;
+    }
+    __Pyx_INCREF(__pyx_v_sound);
+    __Pyx_GIVEREF(__pyx_v_sound);
+    PyTuple_SET_ITEM(__pyx_t_9, 0+__pyx_t_8, __pyx_v_sound);
+    __Pyx_GIVEREF(__pyx_t_1);
+    PyTuple_SET_ITEM(__pyx_t_9, 1+__pyx_t_8, __pyx_t_1);
+    __Pyx_INCREF(__pyx_v_settings);
+    __Pyx_GIVEREF(__pyx_v_settings);
+    PyTuple_SET_ITEM(__pyx_t_9, 2+__pyx_t_8, __pyx_v_settings);
+    __pyx_t_1 = 0;
+    __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_7, __pyx_t_9, NULL); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 343, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_prepared_sound_instance, __pyx_t_6) < 0) __PYX_ERR(0, 343, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":344
+ * 
+ *         self._prepared_sound_instance = self._track.play_sound(sound, playlist.context, settings)
+ *         if self._prepared_sound_instance is None:             # <<<<<<<<<<<<<<
+ *             self._next_sound_name = sound_name
+ *         else:
+ */
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_prepared_sound_instance); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 344, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_4 = (__pyx_t_6 == Py_None);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_2 = (__pyx_t_4 != 0);
+  if (__pyx_t_2) {
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":345
+ *         self._prepared_sound_instance = self._track.play_sound(sound, playlist.context, settings)
+ *         if self._prepared_sound_instance is None:
+ *             self._next_sound_name = sound_name             # <<<<<<<<<<<<<<
+ *         else:
+ *             self._prepared_sound_name = sound_name
+ */
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_next_sound_name, __pyx_v_sound_name) < 0) __PYX_ERR(0, 345, __pyx_L1_error)
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":344
+ * 
+ *         self._prepared_sound_instance = self._track.play_sound(sound, playlist.context, settings)
+ *         if self._prepared_sound_instance is None:             # <<<<<<<<<<<<<<
+ *             self._next_sound_name = sound_name
+ *         else:
+ */
+    goto __pyx_L12;
+  }
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":347
+ *             self._next_sound_name = sound_name
+ *         else:
+ *             self._prepared_sound_name = sound_name             # <<<<<<<<<<<<<<
+ * 
+ *     def _cancel_prepared_sound(self):
+ */
+  /*else*/ {
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_prepared_sound_name, __pyx_v_sound_name) < 0) __PYX_ERR(0, 347, __pyx_L1_error)
+  }
+  __pyx_L12:;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":309
+ *             self._schedule_prepare_next_sound(sound_instance)
+ * 
+ *     def _prepare_next_sound(self, sound_instance, dt=None):             # <<<<<<<<<<<<<<
+ *         """Loads the next playlist sound and schedules it on the track to start when the specified
+ *         (current) sound instance reaches its about to finish marker (crossfade) or its end
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController._prepare_next_sound", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_playlist);
+  __Pyx_XDECREF(__pyx_v_sound_name);
+  __Pyx_XDECREF(__pyx_v_sound);
+  __Pyx_XDECREF(__pyx_v_settings);
+  __Pyx_XDECREF(__pyx_v_dt);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/playlist_controller.pyx":349
+ *             self._prepared_sound_name = sound_name
+ * 
+ *     def _cancel_prepared_sound(self):             # <<<<<<<<<<<<<<
+ *         """Cancels the prepared next sound (if it has not started yet).  The sound will be the
+ *         next one played by the playlist."""
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_41_cancel_prepared_sound(PyObject *__pyx_self, PyObject *__pyx_v_self); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_40_cancel_prepared_sound[] = "PlaylistController._cancel_prepared_sound(self)\nCancels the prepared next sound (if it has not started yet).  The sound will be the\n        next one played by the playlist.";
+static PyMethodDef __pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_41_cancel_prepared_sound = {"_cancel_prepared_sound", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_41_cancel_prepared_sound, METH_O, __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_40_cancel_prepared_sound};
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_41_cancel_prepared_sound(PyObject *__pyx_self, PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("_cancel_prepared_sound (wrapper)", 0);
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_40_cancel_prepared_sound(__pyx_self, ((PyObject *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_40_cancel_prepared_sound(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
+  PyObject *__pyx_v_sound_instance = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  __Pyx_RefNannySetupContext("_cancel_prepared_sound", 0);
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":352
+ *         """Cancels the prepared next sound (if it has not started yet).  The sound will be the
+ *         next one played by the playlist."""
+ *         if self._prepare_next_sound_event is not None:             # <<<<<<<<<<<<<<
+ *             self._prepare_next_sound_event.cancel()
+ *             self._prepare_next_sound_event = None
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_prepare_next_sound_event); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 352, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = (__pyx_t_1 != Py_None);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":353
+ *         next one played by the playlist."""
+ *         if self._prepare_next_sound_event is not None:
+ *             self._prepare_next_sound_event.cancel()             # <<<<<<<<<<<<<<
+ *             self._prepare_next_sound_event = None
+ *         self._prepare_next_sound_when_not_busy = False
+ */
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_prepare_next_sound_event); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 353, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_cancel); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 353, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_5);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_5, function);
+      }
+    }
+    if (__pyx_t_4) {
+      __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 353, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    } else {
+      __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 353, __pyx_L1_error)
+    }
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":354
+ *         if self._prepare_next_sound_event is not None:
+ *             self._prepare_next_sound_event.cancel()
+ *             self._prepare_next_sound_event = None             # <<<<<<<<<<<<<<
+ *         self._prepare_next_sound_when_not_busy = False
+ * 
+ */
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_prepare_next_sound_event, Py_None) < 0) __PYX_ERR(0, 354, __pyx_L1_error)
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":352
+ *         """Cancels the prepared next sound (if it has not started yet).  The sound will be the
+ *         next one played by the playlist."""
+ *         if self._prepare_next_sound_event is not None:             # <<<<<<<<<<<<<<
+ *             self._prepare_next_sound_event.cancel()
+ *             self._prepare_next_sound_event = None
+ */
+  }
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":355
+ *             self._prepare_next_sound_event.cancel()
+ *             self._prepare_next_sound_event = None
+ *         self._prepare_next_sound_when_not_busy = False             # <<<<<<<<<<<<<<
+ * 
+ *         if self._prepared_sound_instance is not None:
+ */
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_prepare_next_sound_when_not_bus, Py_False) < 0) __PYX_ERR(0, 355, __pyx_L1_error)
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":357
+ *         self._prepare_next_sound_when_not_busy = False
+ * 
+ *         if self._prepared_sound_instance is not None:             # <<<<<<<<<<<<<<
+ *             sound_instance = self._prepared_sound_instance
+ *             self._prepared_sound_instance = None
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_prepared_sound_instance); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 357, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = (__pyx_t_1 != Py_None);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_2 = (__pyx_t_3 != 0);
+  if (__pyx_t_2) {
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":358
+ * 
+ *         if self._prepared_sound_instance is not None:
+ *             sound_instance = self._prepared_sound_instance             # <<<<<<<<<<<<<<
+ *             self._prepared_sound_instance = None
+ *             self._next_sound_name = self._prepared_sound_name
+ */
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_prepared_sound_instance); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 358, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_v_sound_instance = __pyx_t_1;
+    __pyx_t_1 = 0;
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":359
+ *         if self._prepared_sound_instance is not None:
+ *             sound_instance = self._prepared_sound_instance
+ *             self._prepared_sound_instance = None             # <<<<<<<<<<<<<<
+ *             self._next_sound_name = self._prepared_sound_name
+ *             self._prepared_sound_name = None
+ */
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_prepared_sound_instance, Py_None) < 0) __PYX_ERR(0, 359, __pyx_L1_error)
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":360
+ *             sound_instance = self._prepared_sound_instance
+ *             self._prepared_sound_instance = None
+ *             self._next_sound_name = self._prepared_sound_name             # <<<<<<<<<<<<<<
+ *             self._prepared_sound_name = None
+ *             self._track.stop_sound_instance(sound_instance, 0.0)
+ */
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_prepared_sound_name); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 360, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_next_sound_name, __pyx_t_1) < 0) __PYX_ERR(0, 360, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":361
+ *             self._prepared_sound_instance = None
+ *             self._next_sound_name = self._prepared_sound_name
+ *             self._prepared_sound_name = None             # <<<<<<<<<<<<<<
+ *             self._track.stop_sound_instance(sound_instance, 0.0)
+ * 
+ */
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_prepared_sound_name, Py_None) < 0) __PYX_ERR(0, 361, __pyx_L1_error)
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":362
+ *             self._next_sound_name = self._prepared_sound_name
+ *             self._prepared_sound_name = None
+ *             self._track.stop_sound_instance(sound_instance, 0.0)             # <<<<<<<<<<<<<<
+ * 
+ *     def stop(self, start_sample=None):
+ */
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_track_2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 362, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_stop_sound_instance); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 362, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_5 = NULL;
+    __pyx_t_6 = 0;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+        __pyx_t_6 = 1;
+      }
+    }
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_4)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_v_sound_instance, __pyx_float_0_0};
+      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 362, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_GOTREF(__pyx_t_1);
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_v_sound_instance, __pyx_float_0_0};
+      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 362, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_GOTREF(__pyx_t_1);
+    } else
+    #endif
+    {
+      __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 362, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      if (__pyx_t_5) {
+        __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_5); __pyx_t_5 = NULL;
+      }
+      __Pyx_INCREF(__pyx_v_sound_instance);
+      __Pyx_GIVEREF(__pyx_v_sound_instance);
+      PyTuple_SET_ITEM(__pyx_t_7, 0+__pyx_t_6, __pyx_v_sound_instance);
+      __Pyx_INCREF(__pyx_float_0_0);
+      __Pyx_GIVEREF(__pyx_float_0_0);
+      PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_float_0_0);
+      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 362, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":357
+ *         self._prepare_next_sound_when_not_busy = False
+ * 
+ *         if self._prepared_sound_instance is not None:             # <<<<<<<<<<<<<<
+ *             sound_instance = self._prepared_sound_instance
+ *             self._prepared_sound_instance = None
+ */
+  }
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":349
+ *             self._prepared_sound_name = sound_name
+ * 
+ *     def _cancel_prepared_sound(self):             # <<<<<<<<<<<<<<
+ *         """Cancels the prepared next sound (if it has not started yet).  The sound will be the
+ *         next one played by the playlist."""
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController._cancel_prepared_sound", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_sound_instance);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/playlist_controller.pyx":364
+ *             self._track.stop_sound_instance(sound_instance, 0.0)
+ * 
+ *     def stop(self, start_sample=None):             # <<<<<<<<<<<<<<
+ *         """Immediately stop the currently playing playlist. Will fade out using the crossfade setting.
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_43stop(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_42stop[] = "PlaylistController.stop(self, start_sample=None)\nImmediately stop the currently playing playlist. Will fade out using the crossfade setting.\n\n        Args:\n            start_sample: The audio clock sample position at which to start the fade out (None to\n                stop the playlist now).\n        ";
+static PyMethodDef __pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_43stop = {"stop", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_43stop, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_42stop};
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_43stop(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_self = 0;
+  PyObject *__pyx_v_start_sample = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("stop (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_start_sample,0};
+    PyObject* values[2] = {0,0};
+    values[1] = ((PyObject *)((PyObject *)Py_None));
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_self)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_start_sample);
+          if (value) { values[1] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "stop") < 0)) __PYX_ERR(0, 364, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_self = values[0];
+    __pyx_v_start_sample = values[1];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("stop", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 364, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController.stop", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_42stop(__pyx_self, __pyx_v_self, __pyx_v_start_sample);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_42stop(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_start_sample) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  __Pyx_RefNannySetupContext("stop", 0);
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":371
+ *                 stop the playlist now).
+ *         """
+ *         if not self._current_playlist:             # <<<<<<<<<<<<<<
+ *             self.log.debug("stop - No playlist is currently playing. Could not stop current playlist.")
+ *             return
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 371, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 371, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = ((!__pyx_t_2) != 0);
+  if (__pyx_t_3) {
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":372
+ *         """
+ *         if not self._current_playlist:
+ *             self.log.debug("stop - No playlist is currently playing. Could not stop current playlist.")             # <<<<<<<<<<<<<<
+ *             return
+ * 
+ */
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_log); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 372, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_debug); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 372, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 372, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":373
+ *         if not self._current_playlist:
+ *             self.log.debug("stop - No playlist is currently playing. Could not stop current playlist.")
+ *             return             # <<<<<<<<<<<<<<
+ * 
+ *         self.log.debug("stop - Stopping the current playlist ('%s').",
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":371
+ *                 stop the playlist now).
+ *         """
+ *         if not self._current_playlist:             # <<<<<<<<<<<<<<
+ *             self.log.debug("stop - No playlist is currently playing. Could not stop current playlist.")
+ *             return
+ */
+  }
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":375
+ *             return
+ * 
+ *         self.log.debug("stop - Stopping the current playlist ('%s').",             # <<<<<<<<<<<<<<
+ *                        self._current_playlist.name)
+ * 
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_log); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 375, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_debug); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 375, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":376
+ * 
+ *         self.log.debug("stop - Stopping the current playlist ('%s').",
+ *                        self._current_playlist.name)             # <<<<<<<<<<<<<<
+ * 
+ *         self._cancel_prepared_sound()
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 376, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_name); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 376, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = NULL;
+  __pyx_t_7 = 0;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_5);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_5, function);
+      __pyx_t_7 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_5)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_kp_u_stop_Stopping_the_current_playli, __pyx_t_6};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 375, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_5)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_kp_u_stop_Stopping_the_current_playli, __pyx_t_6};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 375, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  } else
+  #endif
+  {
+    __pyx_t_8 = PyTuple_New(2+__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 375, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    if (__pyx_t_4) {
+      __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_4); __pyx_t_4 = NULL;
+    }
+    __Pyx_INCREF(__pyx_kp_u_stop_Stopping_the_current_playli);
+    __Pyx_GIVEREF(__pyx_kp_u_stop_Stopping_the_current_playli);
+    PyTuple_SET_ITEM(__pyx_t_8, 0+__pyx_t_7, __pyx_kp_u_stop_Stopping_the_current_playli);
+    __Pyx_GIVEREF(__pyx_t_6);
+    PyTuple_SET_ITEM(__pyx_t_8, 1+__pyx_t_7, __pyx_t_6);
+    __pyx_t_6 = 0;
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_8, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 375, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":378
+ *                        self._current_playlist.name)
+ * 
+ *         self._cancel_prepared_sound()             # <<<<<<<<<<<<<<
+ *         self._next_sound_name = None
+ * 
+ */
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_cancel_prepared_sound); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 378, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_8 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
+    __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_5);
+    if (likely(__pyx_t_8)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+      __Pyx_INCREF(__pyx_t_8);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_5, function);
+    }
+  }
+  if (__pyx_t_8) {
+    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 378, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  } else {
+    __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 378, __pyx_L1_error)
+  }
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":379
+ * 
+ *         self._cancel_prepared_sound()
+ *         self._next_sound_name = None             # <<<<<<<<<<<<<<
+ * 
+ *         # Stop the current sound (if another sound is fading out, let it finish on its own)
+ */
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_next_sound_name, Py_None) < 0) __PYX_ERR(0, 379, __pyx_L1_error)
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":382
+ * 
+ *         # Stop the current sound (if another sound is fading out, let it finish on its own)
+ *         if self._current_playlist.current_sound_instance:             # <<<<<<<<<<<<<<
+ *             self._stop_playlist_sound(self._current_playlist.current_sound_instance, start_sample)
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 382, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_current_sound_instance); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 382, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 382, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (__pyx_t_3) {
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":383
+ *         # Stop the current sound (if another sound is fading out, let it finish on its own)
+ *         if self._current_playlist.current_sound_instance:
+ *             self._stop_playlist_sound(self._current_playlist.current_sound_instance, start_sample)             # <<<<<<<<<<<<<<
+ * 
+ *         self._current_playlist = None
+ */
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_stop_playlist_sound); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 383, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 383, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_n_s_current_sound_instance); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 383, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __pyx_t_8 = NULL;
+    __pyx_t_7 = 0;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_1);
+      if (likely(__pyx_t_8)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+        __Pyx_INCREF(__pyx_t_8);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
+        __pyx_t_7 = 1;
+      }
+    }
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_1)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_8, __pyx_t_6, __pyx_v_start_sample};
+      __pyx_t_5 = __Pyx_PyFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 383, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_1)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_8, __pyx_t_6, __pyx_v_start_sample};
+      __pyx_t_5 = __Pyx_PyCFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 383, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_4 = PyTuple_New(2+__pyx_t_7); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 383, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      if (__pyx_t_8) {
+        __Pyx_GIVEREF(__pyx_t_8); PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_8); __pyx_t_8 = NULL;
+      }
+      __Pyx_GIVEREF(__pyx_t_6);
+      PyTuple_SET_ITEM(__pyx_t_4, 0+__pyx_t_7, __pyx_t_6);
+      __Pyx_INCREF(__pyx_v_start_sample);
+      __Pyx_GIVEREF(__pyx_v_start_sample);
+      PyTuple_SET_ITEM(__pyx_t_4, 1+__pyx_t_7, __pyx_v_start_sample);
+      __pyx_t_6 = 0;
+      __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 383, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":382
+ * 
+ *         # Stop the current sound (if another sound is fading out, let it finish on its own)
+ *         if self._current_playlist.current_sound_instance:             # <<<<<<<<<<<<<<
+ *             self._stop_playlist_sound(self._current_playlist.current_sound_instance, start_sample)
+ * 
+ */
+  }
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":385
+ *             self._stop_playlist_sound(self._current_playlist.current_sound_instance, start_sample)
+ * 
+ *         self._current_playlist = None             # <<<<<<<<<<<<<<
+ * 
+ *     def advance(self, start_sample=None):
+ */
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist, Py_None) < 0) __PYX_ERR(0, 385, __pyx_L1_error)
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":364
+ *             self._track.stop_sound_instance(sound_instance, 0.0)
+ * 
+ *     def stop(self, start_sample=None):             # <<<<<<<<<<<<<<
+ *         """Immediately stop the currently playing playlist. Will fade out using the crossfade setting.
+ * 
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController.stop", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/playlist_controller.pyx":387
+ *         self._current_playlist = None
+ * 
+ *     def advance(self, start_sample=None):             # <<<<<<<<<<<<<<
+ *         """Advance the currently playing playlist to the next sound.
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_45advance(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_44advance[] = "PlaylistController.advance(self, start_sample=None)\nAdvance the currently playing playlist to the next sound.\n\n        Args:\n            start_sample: The audio clock sample position at which the transition to the next\n                sound starts (None to advance now).\n        ";
+static PyMethodDef __pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_45advance = {"advance", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_45advance, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_44advance};
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_45advance(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_self = 0;
+  PyObject *__pyx_v_start_sample = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("advance (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_start_sample,0};
+    PyObject* values[2] = {0,0};
+    values[1] = ((PyObject *)((PyObject *)Py_None));
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_self)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_start_sample);
+          if (value) { values[1] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "advance") < 0)) __PYX_ERR(0, 387, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_self = values[0];
+    __pyx_v_start_sample = values[1];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("advance", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 387, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController.advance", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_44advance(__pyx_self, __pyx_v_self, __pyx_v_start_sample);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_44advance(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_start_sample) {
+  PyObject *__pyx_v_next_sound_name = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  __Pyx_RefNannySetupContext("advance", 0);
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":396
+ * 
+ *         # If there is no current playlist, do nothing
+ *         if not self._current_playlist:             # <<<<<<<<<<<<<<
+ *             self.log.debug("advance - No playlist is currently playing. Could not advance to next sound")
+ *             return
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 396, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 396, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = ((!__pyx_t_2) != 0);
+  if (__pyx_t_3) {
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":397
+ *         # If there is no current playlist, do nothing
+ *         if not self._current_playlist:
+ *             self.log.debug("advance - No playlist is currently playing. Could not advance to next sound")             # <<<<<<<<<<<<<<
+ *             return
+ * 
+ */
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_log); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 397, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_debug); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 397, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_tuple__4, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 397, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":398
+ *         if not self._current_playlist:
+ *             self.log.debug("advance - No playlist is currently playing. Could not advance to next sound")
+ *             return             # <<<<<<<<<<<<<<
+ * 
+ *         self.log.debug("advance - Advancing the current playlist ('%s') to the next sound.",
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":396
+ * 
+ *         # If there is no current playlist, do nothing
+ *         if not self._current_playlist:             # <<<<<<<<<<<<<<
+ *             self.log.debug("advance - No playlist is currently playing. Could not advance to next sound")
+ *             return
+ */
+  }
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":400
+ *             return
+ * 
+ *         self.log.debug("advance - Advancing the current playlist ('%s') to the next sound.",             # <<<<<<<<<<<<<<
+ *                        self._current_playlist.name)
+ * 
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_log); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 400, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_debug); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 400, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":401
+ * 
+ *         self.log.debug("advance - Advancing the current playlist ('%s') to the next sound.",
+ *                        self._current_playlist.name)             # <<<<<<<<<<<<<<
+ * 
+ *         # A prepared sound will be played now instead (it will not wait for the current sound)
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 401, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_name); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 401, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = NULL;
+  __pyx_t_7 = 0;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_5);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_5, function);
+      __pyx_t_7 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_5)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_kp_u_advance_Advancing_the_current_pl, __pyx_t_6};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 400, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_5)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_kp_u_advance_Advancing_the_current_pl, __pyx_t_6};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 400, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  } else
+  #endif
+  {
+    __pyx_t_8 = PyTuple_New(2+__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 400, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    if (__pyx_t_4) {
+      __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_4); __pyx_t_4 = NULL;
+    }
+    __Pyx_INCREF(__pyx_kp_u_advance_Advancing_the_current_pl);
+    __Pyx_GIVEREF(__pyx_kp_u_advance_Advancing_the_current_pl);
+    PyTuple_SET_ITEM(__pyx_t_8, 0+__pyx_t_7, __pyx_kp_u_advance_Advancing_the_current_pl);
+    __Pyx_GIVEREF(__pyx_t_6);
+    PyTuple_SET_ITEM(__pyx_t_8, 1+__pyx_t_7, __pyx_t_6);
+    __pyx_t_6 = 0;
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_8, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 400, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":404
+ * 
+ *         # A prepared sound will be played now instead (it will not wait for the current sound)
+ *         self._cancel_prepared_sound()             # <<<<<<<<<<<<<<
+ * 
+ *         if self._is_busy():
+ */
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_cancel_prepared_sound); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 404, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_8 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
+    __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_5);
+    if (likely(__pyx_t_8)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+      __Pyx_INCREF(__pyx_t_8);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_5, function);
+    }
+  }
+  if (__pyx_t_8) {
+    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 404, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  } else {
+    __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 404, __pyx_L1_error)
+  }
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":406
+ *         self._cancel_prepared_sound()
+ * 
+ *         if self._is_busy():             # <<<<<<<<<<<<<<
+ *             # Delay advance playlist until track is finished with current crossfade (too busy)
+ *             self._pending_request = partial(self.advance, start_sample=start_sample)
+ */
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_is_busy); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 406, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_8 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
+    __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_5);
+    if (likely(__pyx_t_8)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+      __Pyx_INCREF(__pyx_t_8);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_5, function);
+    }
+  }
+  if (__pyx_t_8) {
+    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 406, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  } else {
+    __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 406, __pyx_L1_error)
+  }
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 406, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (__pyx_t_3) {
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":408
+ *         if self._is_busy():
+ *             # Delay advance playlist until track is finished with current crossfade (too busy)
+ *             self._pending_request = partial(self.advance, start_sample=start_sample)             # <<<<<<<<<<<<<<
+ *             self.log.debug("advance - Playlist track is too busy. Delaying advance to next sound")
+ *             return
+ */
+    __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_partial); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 408, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_advance); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 408, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_8 = PyTuple_New(1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 408, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_GIVEREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_5);
+    __pyx_t_5 = 0;
+    __pyx_t_5 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 408, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_start_sample, __pyx_v_start_sample) < 0) __PYX_ERR(0, 408, __pyx_L1_error)
+    __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_8, __pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 408, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_pending_request, __pyx_t_6) < 0) __PYX_ERR(0, 408, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":409
+ *             # Delay advance playlist until track is finished with current crossfade (too busy)
+ *             self._pending_request = partial(self.advance, start_sample=start_sample)
+ *             self.log.debug("advance - Playlist track is too busy. Delaying advance to next sound")             # <<<<<<<<<<<<<<
+ *             return
+ * 
+ */
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_log); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 409, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_debug); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 409, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_tuple__5, NULL); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 409, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":410
+ *             self._pending_request = partial(self.advance, start_sample=start_sample)
+ *             self.log.debug("advance - Playlist track is too busy. Delaying advance to next sound")
+ *             return             # <<<<<<<<<<<<<<
+ * 
+ *         # Set the next sound in the sound player and calculate the fades based on the crossfade setting
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":406
+ *         self._cancel_prepared_sound()
+ * 
+ *         if self._is_busy():             # <<<<<<<<<<<<<<
+ *             # Delay advance playlist until track is finished with current crossfade (too busy)
+ *             self._pending_request = partial(self.advance, start_sample=start_sample)
+ */
+  }
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":413
+ * 
+ *         # Set the next sound in the sound player and calculate the fades based on the crossfade setting
+ *         next_sound_name = self._get_next_sound_name()             # <<<<<<<<<<<<<<
+ *         if next_sound_name:
+ *             if self._current_playlist.current_sound_instance is not None:
+ */
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_get_next_sound_name_2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 413, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_8 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
+    __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_5);
+    if (likely(__pyx_t_8)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+      __Pyx_INCREF(__pyx_t_8);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_5, function);
+    }
+  }
+  if (__pyx_t_8) {
+    __pyx_t_6 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_8); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 413, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  } else {
+    __pyx_t_6 = __Pyx_PyObject_CallNoArg(__pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 413, __pyx_L1_error)
+  }
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_v_next_sound_name = __pyx_t_6;
+  __pyx_t_6 = 0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":414
+ *         # Set the next sound in the sound player and calculate the fades based on the crossfade setting
+ *         next_sound_name = self._get_next_sound_name()
+ *         if next_sound_name:             # <<<<<<<<<<<<<<
+ *             if self._current_playlist.current_sound_instance is not None:
+ *                 self._stop_playlist_sound(self._current_playlist.current_sound_instance, start_sample)
+ */
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_v_next_sound_name); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 414, __pyx_L1_error)
+  if (__pyx_t_3) {
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":415
+ *         next_sound_name = self._get_next_sound_name()
+ *         if next_sound_name:
+ *             if self._current_playlist.current_sound_instance is not None:             # <<<<<<<<<<<<<<
+ *                 self._stop_playlist_sound(self._current_playlist.current_sound_instance, start_sample)
+ *                 self._current_playlist.fading_sound_instance = self._current_playlist.current_sound_instance
+ */
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 415, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_current_sound_instance); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 415, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_t_3 = (__pyx_t_5 != Py_None);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_2 = (__pyx_t_3 != 0);
+    if (__pyx_t_2) {
+
+      /* "mpfmc/core/audio/playlist_controller.pyx":416
+ *         if next_sound_name:
+ *             if self._current_playlist.current_sound_instance is not None:
+ *                 self._stop_playlist_sound(self._current_playlist.current_sound_instance, start_sample)             # <<<<<<<<<<<<<<
+ *                 self._current_playlist.fading_sound_instance = self._current_playlist.current_sound_instance
+ * 
+ */
+      __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_stop_playlist_sound); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 416, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 416, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_n_s_current_sound_instance); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 416, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __pyx_t_8 = NULL;
+      __pyx_t_7 = 0;
+      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
+        __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_6);
+        if (likely(__pyx_t_8)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+          __Pyx_INCREF(__pyx_t_8);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_6, function);
+          __pyx_t_7 = 1;
+        }
+      }
+      #if CYTHON_FAST_PYCALL
+      if (PyFunction_Check(__pyx_t_6)) {
+        PyObject *__pyx_temp[3] = {__pyx_t_8, __pyx_t_1, __pyx_v_start_sample};
+        __pyx_t_5 = __Pyx_PyFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 416, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __Pyx_GOTREF(__pyx_t_5);
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      } else
+      #endif
+      #if CYTHON_FAST_PYCCALL
+      if (__Pyx_PyFastCFunction_Check(__pyx_t_6)) {
+        PyObject *__pyx_temp[3] = {__pyx_t_8, __pyx_t_1, __pyx_v_start_sample};
+        __pyx_t_5 = __Pyx_PyCFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 416, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __Pyx_GOTREF(__pyx_t_5);
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      } else
+      #endif
+      {
+        __pyx_t_4 = PyTuple_New(2+__pyx_t_7); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 416, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        if (__pyx_t_8) {
+          __Pyx_GIVEREF(__pyx_t_8); PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_8); __pyx_t_8 = NULL;
+        }
+        __Pyx_GIVEREF(__pyx_t_1);
+        PyTuple_SET_ITEM(__pyx_t_4, 0+__pyx_t_7, __pyx_t_1);
+        __Pyx_INCREF(__pyx_v_start_sample);
+        __Pyx_GIVEREF(__pyx_v_start_sample);
+        PyTuple_SET_ITEM(__pyx_t_4, 1+__pyx_t_7, __pyx_v_start_sample);
+        __pyx_t_1 = 0;
+        __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 416, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      }
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+      /* "mpfmc/core/audio/playlist_controller.pyx":417
+ *             if self._current_playlist.current_sound_instance is not None:
+ *                 self._stop_playlist_sound(self._current_playlist.current_sound_instance, start_sample)
+ *                 self._current_playlist.fading_sound_instance = self._current_playlist.current_sound_instance             # <<<<<<<<<<<<<<
+ * 
+ *             self._play_playlist_sound(next_sound_name, self._current_playlist, self._current_playlist.crossfade_time,
+ */
+      __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 417, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_current_sound_instance); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 417, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 417, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      if (__Pyx_PyObject_SetAttrStr(__pyx_t_5, __pyx_n_s_fading_sound_instance, __pyx_t_6) < 0) __PYX_ERR(0, 417, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+      /* "mpfmc/core/audio/playlist_controller.pyx":415
+ *         next_sound_name = self._get_next_sound_name()
+ *         if next_sound_name:
+ *             if self._current_playlist.current_sound_instance is not None:             # <<<<<<<<<<<<<<
+ *                 self._stop_playlist_sound(self._current_playlist.current_sound_instance, start_sample)
+ *                 self._current_playlist.fading_sound_instance = self._current_playlist.current_sound_instance
+ */
+    }
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":419
+ *                 self._current_playlist.fading_sound_instance = self._current_playlist.current_sound_instance
+ * 
+ *             self._play_playlist_sound(next_sound_name, self._current_playlist, self._current_playlist.crossfade_time,             # <<<<<<<<<<<<<<
+ *                                       start_sample)
+ * 
+ */
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_play_playlist_sound); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 419, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 419, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 419, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_crossfade_time); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 419, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":420
+ * 
+ *             self._play_playlist_sound(next_sound_name, self._current_playlist, self._current_playlist.crossfade_time,
+ *                                       start_sample)             # <<<<<<<<<<<<<<
+ * 
+ *     def _stop_playlist_sound(self, sound_instance, start_sample=None):
+ */
+    __pyx_t_1 = NULL;
+    __pyx_t_7 = 0;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
+      __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_6);
+      if (likely(__pyx_t_1)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+        __Pyx_INCREF(__pyx_t_1);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_6, function);
+        __pyx_t_7 = 1;
+      }
+    }
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_6)) {
+      PyObject *__pyx_temp[5] = {__pyx_t_1, __pyx_v_next_sound_name, __pyx_t_4, __pyx_t_8, __pyx_v_start_sample};
+      __pyx_t_5 = __Pyx_PyFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_7, 4+__pyx_t_7); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 419, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_6)) {
+      PyObject *__pyx_temp[5] = {__pyx_t_1, __pyx_v_next_sound_name, __pyx_t_4, __pyx_t_8, __pyx_v_start_sample};
+      __pyx_t_5 = __Pyx_PyCFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_7, 4+__pyx_t_7); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 419, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_9 = PyTuple_New(4+__pyx_t_7); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 419, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      if (__pyx_t_1) {
+        __Pyx_GIVEREF(__pyx_t_1); PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_1); __pyx_t_1 = NULL;
+      }
+      __Pyx_INCREF(__pyx_v_next_sound_name);
+      __Pyx_GIVEREF(__pyx_v_next_sound_name);
+      PyTuple_SET_ITEM(__pyx_t_9, 0+__pyx_t_7, __pyx_v_next_sound_name);
+      __Pyx_GIVEREF(__pyx_t_4);
+      PyTuple_SET_ITEM(__pyx_t_9, 1+__pyx_t_7, __pyx_t_4);
+      __Pyx_GIVEREF(__pyx_t_8);
+      PyTuple_SET_ITEM(__pyx_t_9, 2+__pyx_t_7, __pyx_t_8);
+      __Pyx_INCREF(__pyx_v_start_sample);
+      __Pyx_GIVEREF(__pyx_v_start_sample);
+      PyTuple_SET_ITEM(__pyx_t_9, 3+__pyx_t_7, __pyx_v_start_sample);
+      __pyx_t_4 = 0;
+      __pyx_t_8 = 0;
+      __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_9, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 419, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":414
+ *         # Set the next sound in the sound player and calculate the fades based on the crossfade setting
+ *         next_sound_name = self._get_next_sound_name()
+ *         if next_sound_name:             # <<<<<<<<<<<<<<
+ *             if self._current_playlist.current_sound_instance is not None:
+ *                 self._stop_playlist_sound(self._current_playlist.current_sound_instance, start_sample)
+ */
+  }
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":387
+ *         self._current_playlist = None
+ * 
+ *     def advance(self, start_sample=None):             # <<<<<<<<<<<<<<
+ *         """Advance the currently playing playlist to the next sound.
+ * 
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController.advance", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_next_sound_name);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/playlist_controller.pyx":422
+ *                                       start_sample)
+ * 
+ *     def _stop_playlist_sound(self, sound_instance, start_sample=None):             # <<<<<<<<<<<<<<
+ *         """Stops a playlist sound (fading out using the crossfade setting), now or at an audio
+ *         clock sample position."""
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_47_stop_playlist_sound(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_46_stop_playlist_sound[] = "PlaylistController._stop_playlist_sound(self, sound_instance, start_sample=None)\nStops a playlist sound (fading out using the crossfade setting), now or at an audio\n        clock sample position.";
+static PyMethodDef __pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_47_stop_playlist_sound = {"_stop_playlist_sound", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_47_stop_playlist_sound, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_46_stop_playlist_sound};
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_47_stop_playlist_sound(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_self = 0;
+  PyObject *__pyx_v_sound_instance = 0;
+  PyObject *__pyx_v_start_sample = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("_stop_playlist_sound (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_sound_instance,&__pyx_n_s_start_sample,0};
+    PyObject* values[3] = {0,0,0};
+    values[2] = ((PyObject *)((PyObject *)Py_None));
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_self)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_sound_instance)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("_stop_playlist_sound", 0, 2, 3, 1); __PYX_ERR(0, 422, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (kw_args > 0) {
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_start_sample);
+          if (value) { values[2] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "_stop_playlist_sound") < 0)) __PYX_ERR(0, 422, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_self = values[0];
+    __pyx_v_sound_instance = values[1];
+    __pyx_v_start_sample = values[2];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("_stop_playlist_sound", 0, 2, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 422, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController._stop_playlist_sound", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_46_stop_playlist_sound(__pyx_self, __pyx_v_self, __pyx_v_sound_instance, __pyx_v_start_sample);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_46_stop_playlist_sound(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_sound_instance, PyObject *__pyx_v_start_sample) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  __Pyx_RefNannySetupContext("_stop_playlist_sound", 0);
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":425
+ *         """Stops a playlist sound (fading out using the crossfade setting), now or at an audio
+ *         clock sample position."""
+ *         if start_sample is None:             # <<<<<<<<<<<<<<
+ *             self._track.stop_sound_instance(sound_instance, self._current_playlist.crossfade_time)
+ *         else:
+ */
+  __pyx_t_1 = (__pyx_v_start_sample == Py_None);
+  __pyx_t_2 = (__pyx_t_1 != 0);
+  if (__pyx_t_2) {
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":426
+ *         clock sample position."""
+ *         if start_sample is None:
+ *             self._track.stop_sound_instance(sound_instance, self._current_playlist.crossfade_time)             # <<<<<<<<<<<<<<
+ *         else:
+ *             self._track.stop_sound_instance_at(sound_instance, start_sample, self._current_playlist.crossfade_time)
+ */
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_track_2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 426, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_stop_sound_instance); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 426, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 426, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_crossfade_time); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 426, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = NULL;
+    __pyx_t_7 = 0;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_5);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_5, function);
+        __pyx_t_7 = 1;
+      }
+    }
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_5)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_v_sound_instance, __pyx_t_6};
+      __pyx_t_3 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 426, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_5)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_v_sound_instance, __pyx_t_6};
+      __pyx_t_3 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 426, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_8 = PyTuple_New(2+__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 426, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      if (__pyx_t_4) {
+        __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_4); __pyx_t_4 = NULL;
+      }
+      __Pyx_INCREF(__pyx_v_sound_instance);
+      __Pyx_GIVEREF(__pyx_v_sound_instance);
+      PyTuple_SET_ITEM(__pyx_t_8, 0+__pyx_t_7, __pyx_v_sound_instance);
+      __Pyx_GIVEREF(__pyx_t_6);
+      PyTuple_SET_ITEM(__pyx_t_8, 1+__pyx_t_7, __pyx_t_6);
+      __pyx_t_6 = 0;
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_8, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 426, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":425
+ *         """Stops a playlist sound (fading out using the crossfade setting), now or at an audio
+ *         clock sample position."""
+ *         if start_sample is None:             # <<<<<<<<<<<<<<
+ *             self._track.stop_sound_instance(sound_instance, self._current_playlist.crossfade_time)
+ *         else:
+ */
+    goto __pyx_L3;
+  }
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":428
+ *             self._track.stop_sound_instance(sound_instance, self._current_playlist.crossfade_time)
+ *         else:
+ *             self._track.stop_sound_instance_at(sound_instance, start_sample, self._current_playlist.crossfade_time)             # <<<<<<<<<<<<<<
+ * 
+ *     def set_repeat(self, repeat=True):
+ */
+  /*else*/ {
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_track_2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 428, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_stop_sound_instance_at); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 428, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 428, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_crossfade_time); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 428, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_5 = NULL;
+    __pyx_t_7 = 0;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_8))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_8);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_8);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_8, function);
+        __pyx_t_7 = 1;
+      }
+    }
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_8)) {
+      PyObject *__pyx_temp[4] = {__pyx_t_5, __pyx_v_sound_instance, __pyx_v_start_sample, __pyx_t_6};
+      __pyx_t_3 = __Pyx_PyFunction_FastCall(__pyx_t_8, __pyx_temp+1-__pyx_t_7, 3+__pyx_t_7); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 428, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_8)) {
+      PyObject *__pyx_temp[4] = {__pyx_t_5, __pyx_v_sound_instance, __pyx_v_start_sample, __pyx_t_6};
+      __pyx_t_3 = __Pyx_PyCFunction_FastCall(__pyx_t_8, __pyx_temp+1-__pyx_t_7, 3+__pyx_t_7); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 428, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_4 = PyTuple_New(3+__pyx_t_7); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 428, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      if (__pyx_t_5) {
+        __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_5); __pyx_t_5 = NULL;
+      }
+      __Pyx_INCREF(__pyx_v_sound_instance);
+      __Pyx_GIVEREF(__pyx_v_sound_instance);
+      PyTuple_SET_ITEM(__pyx_t_4, 0+__pyx_t_7, __pyx_v_sound_instance);
+      __Pyx_INCREF(__pyx_v_start_sample);
+      __Pyx_GIVEREF(__pyx_v_start_sample);
+      PyTuple_SET_ITEM(__pyx_t_4, 1+__pyx_t_7, __pyx_v_start_sample);
+      __Pyx_GIVEREF(__pyx_t_6);
+      PyTuple_SET_ITEM(__pyx_t_4, 2+__pyx_t_7, __pyx_t_6);
+      __pyx_t_6 = 0;
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_8, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 428, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  }
+  __pyx_L3:;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":422
+ *                                       start_sample)
+ * 
+ *     def _stop_playlist_sound(self, sound_instance, start_sample=None):             # <<<<<<<<<<<<<<
+ *         """Stops a playlist sound (fading out using the crossfade setting), now or at an audio
+ *         clock sample position."""
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController._stop_playlist_sound", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/playlist_controller.pyx":430
+ *             self._track.stop_sound_instance_at(sound_instance, start_sample, self._current_playlist.crossfade_time)
+ * 
+ *     def set_repeat(self, repeat=True):             # <<<<<<<<<<<<<<
+ *         """Set whether or not the currently playing playlist should repeat when finished."""
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_49set_repeat(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_48set_repeat[] = "PlaylistController.set_repeat(self, repeat=True)\nSet whether or not the currently playing playlist should repeat when finished.";
+static PyMethodDef __pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_49set_repeat = {"set_repeat", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_49set_repeat, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_48set_repeat};
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_49set_repeat(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_self = 0;
+  PyObject *__pyx_v_repeat = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("set_repeat (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_repeat,0};
+    PyObject* values[2] = {0,0};
+    values[1] = ((PyObject *)((PyObject *)Py_True));
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_self)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_repeat);
+          if (value) { values[1] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "set_repeat") < 0)) __PYX_ERR(0, 430, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_self = values[0];
+    __pyx_v_repeat = values[1];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("set_repeat", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 430, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController.set_repeat", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_48set_repeat(__pyx_self, __pyx_v_self, __pyx_v_repeat);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_48set_repeat(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_repeat) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  __Pyx_RefNannySetupContext("set_repeat", 0);
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":433
+ *         """Set whether or not the currently playing playlist should repeat when finished."""
+ * 
+ *         if self._current_playlist:             # <<<<<<<<<<<<<<
+ *             self._current_playlist.loop = repeat
+ *             self.log.debug("set_repeat - Setting repeat for currently playlist to {}.", str(repeat))
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 433, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 433, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (__pyx_t_2) {
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":434
+ * 
+ *         if self._current_playlist:
+ *             self._current_playlist.loop = repeat             # <<<<<<<<<<<<<<
+ *             self.log.debug("set_repeat - Setting repeat for currently playlist to {}.", str(repeat))
+ *         else:
+ */
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 434, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    if (__Pyx_PyObject_SetAttrStr(__pyx_t_1, __pyx_n_s_loop, __pyx_v_repeat) < 0) __PYX_ERR(0, 434, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":435
+ *         if self._current_playlist:
+ *             self._current_playlist.loop = repeat
+ *             self.log.debug("set_repeat - Setting repeat for currently playlist to {}.", str(repeat))             # <<<<<<<<<<<<<<
+ *         else:
+ *             self.log.debug("set_repeat - No playlist is currently playing. "
+ */
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_log); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 435, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_debug); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 435, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 435, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx_v_repeat);
+    __Pyx_GIVEREF(__pyx_v_repeat);
+    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_repeat);
+    __pyx_t_5 = __Pyx_PyObject_Call(((PyObject *)(&PyUnicode_Type)), __pyx_t_3, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 435, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = NULL;
+    __pyx_t_6 = 0;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+        __pyx_t_6 = 1;
+      }
+    }
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_4)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_3, __pyx_kp_u_set_repeat_Setting_repeat_for_cu, __pyx_t_5};
+      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 435, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_3, __pyx_kp_u_set_repeat_Setting_repeat_for_cu, __pyx_t_5};
+      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 435, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 435, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      if (__pyx_t_3) {
+        __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_3); __pyx_t_3 = NULL;
+      }
+      __Pyx_INCREF(__pyx_kp_u_set_repeat_Setting_repeat_for_cu);
+      __Pyx_GIVEREF(__pyx_kp_u_set_repeat_Setting_repeat_for_cu);
+      PyTuple_SET_ITEM(__pyx_t_7, 0+__pyx_t_6, __pyx_kp_u_set_repeat_Setting_repeat_for_cu);
+      __Pyx_GIVEREF(__pyx_t_5);
+      PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_t_5);
+      __pyx_t_5 = 0;
+      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 435, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":433
+ *         """Set whether or not the currently playing playlist should repeat when finished."""
+ * 
+ *         if self._current_playlist:             # <<<<<<<<<<<<<<
+ *             self._current_playlist.loop = repeat
+ *             self.log.debug("set_repeat - Setting repeat for currently playlist to {}.", str(repeat))
+ */
+    goto __pyx_L3;
+  }
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":437
+ *             self.log.debug("set_repeat - Setting repeat for currently playlist to {}.", str(repeat))
+ *         else:
+ *             self.log.debug("set_repeat - No playlist is currently playing. "             # <<<<<<<<<<<<<<
+ *                            "Could not set repeat to {}.", str(repeat))
+ * 
+ */
+  /*else*/ {
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_log); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 437, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_debug); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 437, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":438
+ *         else:
+ *             self.log.debug("set_repeat - No playlist is currently playing. "
+ *                            "Could not set repeat to {}.", str(repeat))             # <<<<<<<<<<<<<<
+ * 
+ *     def _on_sound_instance_played(self, sound_instance=None, **kwargs):
+ */
+    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 438, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_INCREF(__pyx_v_repeat);
+    __Pyx_GIVEREF(__pyx_v_repeat);
+    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_repeat);
+    __pyx_t_5 = __Pyx_PyObject_Call(((PyObject *)(&PyUnicode_Type)), __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 438, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = NULL;
+    __pyx_t_6 = 0;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_7))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_7);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_7);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_7, function);
+        __pyx_t_6 = 1;
+      }
+    }
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_7)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_kp_u_set_repeat_No_playlist_is_curren, __pyx_t_5};
+      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_7, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 437, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_7)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_kp_u_set_repeat_No_playlist_is_curren, __pyx_t_5};
+      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_7, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 437, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_3 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 437, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      if (__pyx_t_4) {
+        __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_4); __pyx_t_4 = NULL;
+      }
+      __Pyx_INCREF(__pyx_kp_u_set_repeat_No_playlist_is_curren);
+      __Pyx_GIVEREF(__pyx_kp_u_set_repeat_No_playlist_is_curren);
+      PyTuple_SET_ITEM(__pyx_t_3, 0+__pyx_t_6, __pyx_kp_u_set_repeat_No_playlist_is_curren);
+      __Pyx_GIVEREF(__pyx_t_5);
+      PyTuple_SET_ITEM(__pyx_t_3, 1+__pyx_t_6, __pyx_t_5);
+      __pyx_t_5 = 0;
+      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_7, __pyx_t_3, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 437, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  }
+  __pyx_L3:;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":430
+ *             self._track.stop_sound_instance_at(sound_instance, start_sample, self._current_playlist.crossfade_time)
+ * 
+ *     def set_repeat(self, repeat=True):             # <<<<<<<<<<<<<<
+ *         """Set whether or not the currently playing playlist should repeat when finished."""
+ * 
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController.set_repeat", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/playlist_controller.pyx":440
+ *                            "Could not set repeat to {}.", str(repeat))
+ * 
+ *     def _on_sound_instance_played(self, sound_instance=None, **kwargs):             # <<<<<<<<<<<<<<
+ *         """Callback function called whenever a playlist sound has started playing."""
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_51_on_sound_instance_played(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_50_on_sound_instance_played[] = "PlaylistController._on_sound_instance_played(self, sound_instance=None, **kwargs)\nCallback function called whenever a playlist sound has started playing.";
+static PyMethodDef __pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_51_on_sound_instance_played = {"_on_sound_instance_played", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_51_on_sound_instance_played, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_50_on_sound_instance_played};
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_51_on_sound_instance_played(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_self = 0;
+  PyObject *__pyx_v_sound_instance = 0;
+  CYTHON_UNUSED PyObject *__pyx_v_kwargs = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("_on_sound_instance_played (wrapper)", 0);
+  __pyx_v_kwargs = PyDict_New(); if (unlikely(!__pyx_v_kwargs)) return NULL;
+  __Pyx_GOTREF(__pyx_v_kwargs);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_sound_instance,0};
+    PyObject* values[2] = {0,0};
+    values[1] = ((PyObject *)((PyObject *)Py_None));
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_self)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_sound_instance);
+          if (value) { values[1] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, __pyx_v_kwargs, values, pos_args, "_on_sound_instance_played") < 0)) __PYX_ERR(0, 440, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_self = values[0];
+    __pyx_v_sound_instance = values[1];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("_on_sound_instance_played", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 440, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_DECREF(__pyx_v_kwargs); __pyx_v_kwargs = 0;
+  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController._on_sound_instance_played", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_50_on_sound_instance_played(__pyx_self, __pyx_v_self, __pyx_v_sound_instance, __pyx_v_kwargs);
+
+  /* function exit code */
+  __Pyx_XDECREF(__pyx_v_kwargs);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_50_on_sound_instance_played(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_sound_instance, CYTHON_UNUSED PyObject *__pyx_v_kwargs) {
+  PyObject *__pyx_v_playlist = NULL;
+  PyObject *__pyx_v_event = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  Py_ssize_t __pyx_t_5;
+  PyObject *(*__pyx_t_6)(PyObject *);
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  int __pyx_t_10;
+  __Pyx_RefNannySetupContext("_on_sound_instance_played", 0);
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":443
+ *         """Callback function called whenever a playlist sound has started playing."""
+ * 
+ *         if sound_instance is None:             # <<<<<<<<<<<<<<
+ *             return
+ * 
+ */
+  __pyx_t_1 = (__pyx_v_sound_instance == Py_None);
+  __pyx_t_2 = (__pyx_t_1 != 0);
+  if (__pyx_t_2) {
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":444
+ * 
+ *         if sound_instance is None:
+ *             return             # <<<<<<<<<<<<<<
+ * 
+ *         if sound_instance is self._prepared_sound_instance:
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":443
+ *         """Callback function called whenever a playlist sound has started playing."""
+ * 
+ *         if sound_instance is None:             # <<<<<<<<<<<<<<
+ *             return
+ * 
+ */
+  }
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":446
+ *             return
+ * 
+ *         if sound_instance is self._prepared_sound_instance:             # <<<<<<<<<<<<<<
+ *             # The prepared sound has started (crossfading with or right after the current sound)
+ *             self._prepared_sound_instance = None
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_prepared_sound_instance); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 446, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_2 = (__pyx_v_sound_instance == __pyx_t_3);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_1 = (__pyx_t_2 != 0);
+  if (__pyx_t_1) {
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":448
+ *         if sound_instance is self._prepared_sound_instance:
+ *             # The prepared sound has started (crossfading with or right after the current sound)
+ *             self._prepared_sound_instance = None             # <<<<<<<<<<<<<<
+ *             self._prepared_sound_name = None
+ *             playlist = self._current_playlist
+ */
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_prepared_sound_instance, Py_None) < 0) __PYX_ERR(0, 448, __pyx_L1_error)
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":449
+ *             # The prepared sound has started (crossfading with or right after the current sound)
+ *             self._prepared_sound_instance = None
+ *             self._prepared_sound_name = None             # <<<<<<<<<<<<<<
+ *             playlist = self._current_playlist
+ * 
+ */
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_prepared_sound_name, Py_None) < 0) __PYX_ERR(0, 449, __pyx_L1_error)
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":450
+ *             self._prepared_sound_instance = None
+ *             self._prepared_sound_name = None
+ *             playlist = self._current_playlist             # <<<<<<<<<<<<<<
+ * 
+ *             # Post events when sound changed as a new sound is playing now for the current playlist
+ */
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 450, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_v_playlist = __pyx_t_3;
+    __pyx_t_3 = 0;
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":453
+ * 
+ *             # Post events when sound changed as a new sound is playing now for the current playlist
+ *             for event in playlist.events_when_sound_changed:             # <<<<<<<<<<<<<<
+ *                 self.mc.post_mc_native_event(event)
+ * 
+ */
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_playlist, __pyx_n_s_events_when_sound_changed); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 453, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    if (likely(PyList_CheckExact(__pyx_t_3)) || PyTuple_CheckExact(__pyx_t_3)) {
+      __pyx_t_4 = __pyx_t_3; __Pyx_INCREF(__pyx_t_4); __pyx_t_5 = 0;
+      __pyx_t_6 = NULL;
+    } else {
+      __pyx_t_5 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 453, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_6 = Py_TYPE(__pyx_t_4)->tp_iternext; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 453, __pyx_L1_error)
+    }
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    for (;;) {
+      if (likely(!__pyx_t_6)) {
+        if (likely(PyList_CheckExact(__pyx_t_4))) {
+          if (__pyx_t_5 >= PyList_GET_SIZE(__pyx_t_4)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_3 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_5); __Pyx_INCREF(__pyx_t_3); __pyx_t_5++; if (unlikely(0 < 0)) __PYX_ERR(0, 453, __pyx_L1_error)
+          #else
+          __pyx_t_3 = PySequence_ITEM(__pyx_t_4, __pyx_t_5); __pyx_t_5++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 453, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          #endif
+        } else {
+          if (__pyx_t_5 >= PyTuple_GET_SIZE(__pyx_t_4)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_5); __Pyx_INCREF(__pyx_t_3); __pyx_t_5++; if (unlikely(0 < 0)) __PYX_ERR(0, 453, __pyx_L1_error)
+          #else
+          __pyx_t_3 = PySequence_ITEM(__pyx_t_4, __pyx_t_5); __pyx_t_5++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 453, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          #endif
+        }
+      } else {
+        __pyx_t_3 = __pyx_t_6(__pyx_t_4);
+        if (unlikely(!__pyx_t_3)) {
+          PyObject* exc_type = PyErr_Occurred();
+          if (exc_type) {
+            if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+            else __PYX_ERR(0, 453, __pyx_L1_error)
+          }
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_3);
+      }
+      __Pyx_XDECREF_SET(__pyx_v_event, __pyx_t_3);
+      __pyx_t_3 = 0;
+
+      /* "mpfmc/core/audio/playlist_controller.pyx":454
+ *             # Post events when sound changed as a new sound is playing now for the current playlist
+ *             for event in playlist.events_when_sound_changed:
+ *                 self.mc.post_mc_native_event(event)             # <<<<<<<<<<<<<<
+ * 
+ *             if playlist.current_sound_instance is not None:
+ */
+      __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_mc); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 454, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_7, __pyx_n_s_post_mc_native_event); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 454, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __pyx_t_7 = NULL;
+      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_8))) {
+        __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_8);
+        if (likely(__pyx_t_7)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_8);
+          __Pyx_INCREF(__pyx_t_7);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_8, function);
+        }
+      }
+      if (!__pyx_t_7) {
+        __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_t_8, __pyx_v_event); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 454, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+      } else {
+        #if CYTHON_FAST_PYCALL
+        if (PyFunction_Check(__pyx_t_8)) {
+          PyObject *__pyx_temp[2] = {__pyx_t_7, __pyx_v_event};
+          __pyx_t_3 = __Pyx_PyFunction_FastCall(__pyx_t_8, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 454, __pyx_L1_error)
+          __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+          __Pyx_GOTREF(__pyx_t_3);
+        } else
+        #endif
+        #if CYTHON_FAST_PYCCALL
+        if (__Pyx_PyFastCFunction_Check(__pyx_t_8)) {
+          PyObject *__pyx_temp[2] = {__pyx_t_7, __pyx_v_event};
+          __pyx_t_3 = __Pyx_PyCFunction_FastCall(__pyx_t_8, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 454, __pyx_L1_error)
+          __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+          __Pyx_GOTREF(__pyx_t_3);
+        } else
+        #endif
+        {
+          __pyx_t_9 = PyTuple_New(1+1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 454, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          __Pyx_GIVEREF(__pyx_t_7); PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_7); __pyx_t_7 = NULL;
+          __Pyx_INCREF(__pyx_v_event);
+          __Pyx_GIVEREF(__pyx_v_event);
+          PyTuple_SET_ITEM(__pyx_t_9, 0+1, __pyx_v_event);
+          __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_8, __pyx_t_9, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 454, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        }
+      }
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+      /* "mpfmc/core/audio/playlist_controller.pyx":453
+ * 
+ *             # Post events when sound changed as a new sound is playing now for the current playlist
+ *             for event in playlist.events_when_sound_changed:             # <<<<<<<<<<<<<<
+ *                 self.mc.post_mc_native_event(event)
+ * 
+ */
+    }
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":456
+ *                 self.mc.post_mc_native_event(event)
+ * 
+ *             if playlist.current_sound_instance is not None:             # <<<<<<<<<<<<<<
+ *                 playlist.fading_sound_instance = playlist.current_sound_instance
+ * 
+ */
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_playlist, __pyx_n_s_current_sound_instance); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 456, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_1 = (__pyx_t_4 != Py_None);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_2 = (__pyx_t_1 != 0);
+    if (__pyx_t_2) {
+
+      /* "mpfmc/core/audio/playlist_controller.pyx":457
+ * 
+ *             if playlist.current_sound_instance is not None:
+ *                 playlist.fading_sound_instance = playlist.current_sound_instance             # <<<<<<<<<<<<<<
+ * 
+ *             self._playlists_by_sound_instance[sound_instance] = playlist
+ */
+      __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_playlist, __pyx_n_s_current_sound_instance); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 457, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      if (__Pyx_PyObject_SetAttrStr(__pyx_v_playlist, __pyx_n_s_fading_sound_instance, __pyx_t_4) < 0) __PYX_ERR(0, 457, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+      /* "mpfmc/core/audio/playlist_controller.pyx":456
+ *                 self.mc.post_mc_native_event(event)
+ * 
+ *             if playlist.current_sound_instance is not None:             # <<<<<<<<<<<<<<
+ *                 playlist.fading_sound_instance = playlist.current_sound_instance
+ * 
+ */
+    }
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":459
+ *                 playlist.fading_sound_instance = playlist.current_sound_instance
+ * 
+ *             self._playlists_by_sound_instance[sound_instance] = playlist             # <<<<<<<<<<<<<<
+ *             playlist.current_sound_instance = sound_instance
+ * 
+ */
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_playlists_by_sound_instance); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 459, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    if (unlikely(PyObject_SetItem(__pyx_t_4, __pyx_v_sound_instance, __pyx_v_playlist) < 0)) __PYX_ERR(0, 459, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":460
+ * 
+ *             self._playlists_by_sound_instance[sound_instance] = playlist
+ *             playlist.current_sound_instance = sound_instance             # <<<<<<<<<<<<<<
+ * 
+ *         # Prepare the sound that follows the current sound of the current playlist
+ */
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_playlist, __pyx_n_s_current_sound_instance, __pyx_v_sound_instance) < 0) __PYX_ERR(0, 460, __pyx_L1_error)
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":446
+ *             return
+ * 
+ *         if sound_instance is self._prepared_sound_instance:             # <<<<<<<<<<<<<<
+ *             # The prepared sound has started (crossfading with or right after the current sound)
+ *             self._prepared_sound_instance = None
+ */
+  }
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":463
+ * 
+ *         # Prepare the sound that follows the current sound of the current playlist
+ *         if self._current_playlist is not None and self._current_playlist.current_sound_instance is sound_instance:             # <<<<<<<<<<<<<<
+ *             self._schedule_prepare_next_sound(sound_instance)
+ * 
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 463, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_1 = (__pyx_t_4 != Py_None);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_10 = (__pyx_t_1 != 0);
+  if (__pyx_t_10) {
+  } else {
+    __pyx_t_2 = __pyx_t_10;
+    goto __pyx_L9_bool_binop_done;
+  }
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 463, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_current_sound_instance); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 463, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_10 = (__pyx_t_3 == __pyx_v_sound_instance);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_1 = (__pyx_t_10 != 0);
+  __pyx_t_2 = __pyx_t_1;
+  __pyx_L9_bool_binop_done:;
+  if (__pyx_t_2) {
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":464
+ *         # Prepare the sound that follows the current sound of the current playlist
+ *         if self._current_playlist is not None and self._current_playlist.current_sound_instance is sound_instance:
+ *             self._schedule_prepare_next_sound(sound_instance)             # <<<<<<<<<<<<<<
+ * 
+ *     def _on_sound_instance_stopped(self, sound_instance=None, **kwargs):
+ */
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_schedule_prepare_next_sound); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 464, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_8 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_8)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_8);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+      }
+    }
+    if (!__pyx_t_8) {
+      __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_v_sound_instance); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 464, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+    } else {
+      #if CYTHON_FAST_PYCALL
+      if (PyFunction_Check(__pyx_t_4)) {
+        PyObject *__pyx_temp[2] = {__pyx_t_8, __pyx_v_sound_instance};
+        __pyx_t_3 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 464, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __Pyx_GOTREF(__pyx_t_3);
+      } else
+      #endif
+      #if CYTHON_FAST_PYCCALL
+      if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
+        PyObject *__pyx_temp[2] = {__pyx_t_8, __pyx_v_sound_instance};
+        __pyx_t_3 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 464, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __Pyx_GOTREF(__pyx_t_3);
+      } else
+      #endif
+      {
+        __pyx_t_9 = PyTuple_New(1+1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 464, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __Pyx_GIVEREF(__pyx_t_8); PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_8); __pyx_t_8 = NULL;
+        __Pyx_INCREF(__pyx_v_sound_instance);
+        __Pyx_GIVEREF(__pyx_v_sound_instance);
+        PyTuple_SET_ITEM(__pyx_t_9, 0+1, __pyx_v_sound_instance);
+        __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_9, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 464, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      }
+    }
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":463
+ * 
+ *         # Prepare the sound that follows the current sound of the current playlist
+ *         if self._current_playlist is not None and self._current_playlist.current_sound_instance is sound_instance:             # <<<<<<<<<<<<<<
+ *             self._schedule_prepare_next_sound(sound_instance)
+ * 
+ */
+  }
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":440
+ *                            "Could not set repeat to {}.", str(repeat))
+ * 
+ *     def _on_sound_instance_played(self, sound_instance=None, **kwargs):             # <<<<<<<<<<<<<<
+ *         """Callback function called whenever a playlist sound has started playing."""
  * 
- *     def stop(self):             # <<<<<<<<<<<<<<
- *         """Immediately stop the currently playing playlist. Will fade out using the crossfade setting."""
- *         if not self._current_playlist:
  */
 
   /* function exit code */
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
   __Pyx_XDECREF(__pyx_t_8);
   __Pyx_XDECREF(__pyx_t_9);
-  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController.stop", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController._on_sound_instance_played", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_playlist);
+  __Pyx_XDECREF(__pyx_v_event);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/playlist_controller.pyx":216
- *         self._current_playlist = None
+/* "mpfmc/core/audio/playlist_controller.pyx":466
+ *             self._schedule_prepare_next_sound(sound_instance)
  * 
- *     def advance(self):             # <<<<<<<<<<<<<<
- *         """Advance the currently playing playlist to the next sound."""
+ *     def _on_sound_instance_stopped(self, sound_instance=None, **kwargs):             # <<<<<<<<<<<<<<
+ *         """Callback function called whenever a playlist sound has finished playing."""
  * 
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_25advance(PyObject *__pyx_self, PyObject *__pyx_v_self); /*proto*/
-static char __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_24advance[] = "PlaylistController.advance(self)\nAdvance the currently playing playlist to the next sound.";
-static PyMethodDef __pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_25advance = {"advance", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_25advance, METH_O, __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_24advance};
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_25advance(PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_53_on_sound_instance_stopped(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_52_on_sound_instance_stopped[] = "PlaylistController._on_sound_instance_stopped(self, sound_instance=None, **kwargs)\nCallback function called whenever a playlist sound has finished playing.";
+static PyMethodDef __pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_53_on_sound_instance_stopped = {"_on_sound_instance_stopped", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_53_on_sound_instance_stopped, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_52_on_sound_instance_stopped};
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_53_on_sound_instance_stopped(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_self = 0;
+  PyObject *__pyx_v_sound_instance = 0;
+  CYTHON_UNUSED PyObject *__pyx_v_kwargs = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("advance (wrapper)", 0);
-  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_24advance(__pyx_self, ((PyObject *)__pyx_v_self));
+  __Pyx_RefNannySetupContext("_on_sound_instance_stopped (wrapper)", 0);
+  __pyx_v_kwargs = PyDict_New(); if (unlikely(!__pyx_v_kwargs)) return NULL;
+  __Pyx_GOTREF(__pyx_v_kwargs);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_sound_instance,0};
+    PyObject* values[2] = {0,0};
+    values[1] = ((PyObject *)((PyObject *)Py_None));
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_self)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_sound_instance);
+          if (value) { values[1] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, __pyx_v_kwargs, values, pos_args, "_on_sound_instance_stopped") < 0)) __PYX_ERR(0, 466, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_self = values[0];
+    __pyx_v_sound_instance = values[1];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("_on_sound_instance_stopped", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 466, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_DECREF(__pyx_v_kwargs); __pyx_v_kwargs = 0;
+  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController._on_sound_instance_stopped", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_52_on_sound_instance_stopped(__pyx_self, __pyx_v_self, __pyx_v_sound_instance, __pyx_v_kwargs);
 
   /* function exit code */
+  __Pyx_XDECREF(__pyx_v_kwargs);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_24advance(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_52_on_sound_instance_stopped(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_sound_instance, CYTHON_UNUSED PyObject *__pyx_v_kwargs) {
+  PyObject *__pyx_v_playlist = NULL;
   PyObject *__pyx_v_event = NULL;
-  PyObject *__pyx_v_next_sound_name = NULL;
+  PyObject *__pyx_v_request = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_1;
   int __pyx_t_2;
   int __pyx_t_3;
   PyObject *__pyx_t_4 = NULL;
   PyObject *__pyx_t_5 = NULL;
   PyObject *__pyx_t_6 = NULL;
-  int __pyx_t_7;
-  PyObject *__pyx_t_8 = NULL;
-  Py_ssize_t __pyx_t_9;
-  PyObject *(*__pyx_t_10)(PyObject *);
-  PyObject *__pyx_t_11 = NULL;
-  __Pyx_RefNannySetupContext("advance", 0);
+  Py_ssize_t __pyx_t_7;
+  PyObject *(*__pyx_t_8)(PyObject *);
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  __Pyx_RefNannySetupContext("_on_sound_instance_stopped", 0);
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":220
+  /* "mpfmc/core/audio/playlist_controller.pyx":469
+ *         """Callback function called whenever a playlist sound has finished playing."""
  * 
- *         # If there is no current playlist, do nothing
- *         if not self._current_playlist:             # <<<<<<<<<<<<<<
- *             self.log.debug("advance - No playlist is currently playing. Could not advance to next sound")
- *             return
+ *         if sound_instance is not None and sound_instance is self._prepared_sound_instance:             # <<<<<<<<<<<<<<
+ *             # The prepared sound was canceled by the track before it started (the current sound
+ *             # stopped before its about to finish marker), play the sound now instead
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 220, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 220, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_3 = ((!__pyx_t_2) != 0);
+  __pyx_t_2 = (__pyx_v_sound_instance != Py_None);
+  __pyx_t_3 = (__pyx_t_2 != 0);
   if (__pyx_t_3) {
+  } else {
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_prepared_sound_instance); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 469, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = (__pyx_v_sound_instance == __pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_2 = (__pyx_t_3 != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":221
- *         # If there is no current playlist, do nothing
- *         if not self._current_playlist:
- *             self.log.debug("advance - No playlist is currently playing. Could not advance to next sound")             # <<<<<<<<<<<<<<
+    /* "mpfmc/core/audio/playlist_controller.pyx":472
+ *             # The prepared sound was canceled by the track before it started (the current sound
+ *             # stopped before its about to finish marker), play the sound now instead
+ *             self._prepared_sound_instance = None             # <<<<<<<<<<<<<<
+ *             self._next_sound_name = self._prepared_sound_name
+ *             self._prepared_sound_name = None
+ */
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_prepared_sound_instance, Py_None) < 0) __PYX_ERR(0, 472, __pyx_L1_error)
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":473
+ *             # stopped before its about to finish marker), play the sound now instead
+ *             self._prepared_sound_instance = None
+ *             self._next_sound_name = self._prepared_sound_name             # <<<<<<<<<<<<<<
+ *             self._prepared_sound_name = None
+ *             self.advance()
+ */
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_prepared_sound_name); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 473, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_next_sound_name, __pyx_t_4) < 0) __PYX_ERR(0, 473, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":474
+ *             self._prepared_sound_instance = None
+ *             self._next_sound_name = self._prepared_sound_name
+ *             self._prepared_sound_name = None             # <<<<<<<<<<<<<<
+ *             self.advance()
+ *             return
+ */
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_prepared_sound_name, Py_None) < 0) __PYX_ERR(0, 474, __pyx_L1_error)
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":475
+ *             self._next_sound_name = self._prepared_sound_name
+ *             self._prepared_sound_name = None
+ *             self.advance()             # <<<<<<<<<<<<<<
  *             return
  * 
  */
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_log); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 221, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_debug); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 221, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_advance); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 475, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_6 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_5);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_5, function);
+      }
+    }
+    if (__pyx_t_6) {
+      __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_6); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 475, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    } else {
+      __pyx_t_4 = __Pyx_PyObject_CallNoArg(__pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 475, __pyx_L1_error)
+    }
     __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_tuple__4, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 221, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":222
- *         if not self._current_playlist:
- *             self.log.debug("advance - No playlist is currently playing. Could not advance to next sound")
+    /* "mpfmc/core/audio/playlist_controller.pyx":476
+ *             self._prepared_sound_name = None
+ *             self.advance()
  *             return             # <<<<<<<<<<<<<<
  * 
- *         self.log.debug("advance - Advancing the current playlist ('%s') to the next sound.",
+ *         if sound_instance is None or sound_instance not in self._playlists_by_sound_instance:
  */
     __Pyx_XDECREF(__pyx_r);
     __pyx_r = Py_None; __Pyx_INCREF(Py_None);
     goto __pyx_L0;
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":220
+    /* "mpfmc/core/audio/playlist_controller.pyx":469
+ *         """Callback function called whenever a playlist sound has finished playing."""
  * 
- *         # If there is no current playlist, do nothing
- *         if not self._current_playlist:             # <<<<<<<<<<<<<<
- *             self.log.debug("advance - No playlist is currently playing. Could not advance to next sound")
+ *         if sound_instance is not None and sound_instance is self._prepared_sound_instance:             # <<<<<<<<<<<<<<
+ *             # The prepared sound was canceled by the track before it started (the current sound
+ *             # stopped before its about to finish marker), play the sound now instead
+ */
+  }
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":478
+ *             return
+ * 
+ *         if sound_instance is None or sound_instance not in self._playlists_by_sound_instance:             # <<<<<<<<<<<<<<
  *             return
+ * 
  */
+  __pyx_t_2 = (__pyx_v_sound_instance == Py_None);
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (!__pyx_t_3) {
+  } else {
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L7_bool_binop_done;
   }
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_playlists_by_sound_instance); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 478, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = (__Pyx_PySequence_ContainsTF(__pyx_v_sound_instance, __pyx_t_4, Py_NE)); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 478, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_2 = (__pyx_t_3 != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L7_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":479
+ * 
+ *         if sound_instance is None or sound_instance not in self._playlists_by_sound_instance:
+ *             return             # <<<<<<<<<<<<<<
+ * 
+ *         # Get playlist for sound_instance and remove it from dictionary of active sounds
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":224
+    /* "mpfmc/core/audio/playlist_controller.pyx":478
  *             return
  * 
- *         self.log.debug("advance - Advancing the current playlist ('%s') to the next sound.",             # <<<<<<<<<<<<<<
- *                        self._current_playlist.name)
+ *         if sound_instance is None or sound_instance not in self._playlists_by_sound_instance:             # <<<<<<<<<<<<<<
+ *             return
+ * 
+ */
+  }
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":482
+ * 
+ *         # Get playlist for sound_instance and remove it from dictionary of active sounds
+ *         playlist = self._playlists_by_sound_instance[sound_instance]             # <<<<<<<<<<<<<<
+ *         del self._playlists_by_sound_instance[sound_instance]
  * 
  */
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_log); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 224, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_playlists_by_sound_instance); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 482, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_debug); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 224, __pyx_L1_error)
+  __pyx_t_5 = PyObject_GetItem(__pyx_t_4, __pyx_v_sound_instance); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 482, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_v_playlist = __pyx_t_5;
+  __pyx_t_5 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":225
+  /* "mpfmc/core/audio/playlist_controller.pyx":483
+ *         # Get playlist for sound_instance and remove it from dictionary of active sounds
+ *         playlist = self._playlists_by_sound_instance[sound_instance]
+ *         del self._playlists_by_sound_instance[sound_instance]             # <<<<<<<<<<<<<<
  * 
- *         self.log.debug("advance - Advancing the current playlist ('%s') to the next sound.",
- *                        self._current_playlist.name)             # <<<<<<<<<<<<<<
+ *         if playlist.current_sound_instance == sound_instance:
+ */
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_playlists_by_sound_instance); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 483, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  if (unlikely(PyObject_DelItem(__pyx_t_5, __pyx_v_sound_instance) < 0)) __PYX_ERR(0, 483, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":485
+ *         del self._playlists_by_sound_instance[sound_instance]
  * 
- *         if self._is_busy():
+ *         if playlist.current_sound_instance == sound_instance:             # <<<<<<<<<<<<<<
+ *             playlist.current_sound_instance = None
+ *         if playlist.fading_sound_instance == sound_instance:
  */
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 225, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_name); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 225, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_playlist, __pyx_n_s_current_sound_instance); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 485, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_4 = PyObject_RichCompare(__pyx_t_5, __pyx_v_sound_instance, Py_EQ); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 485, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_1 < 0)) __PYX_ERR(0, 485, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = NULL;
-  __pyx_t_7 = 0;
-  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
-    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_5);
-    if (likely(__pyx_t_4)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
-      __Pyx_INCREF(__pyx_t_4);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_5, function);
-      __pyx_t_7 = 1;
-    }
-  }
-  #if CYTHON_FAST_PYCALL
-  if (PyFunction_Check(__pyx_t_5)) {
-    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_kp_u_advance_Advancing_the_current_pl, __pyx_t_6};
-    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 224, __pyx_L1_error)
-    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  } else
-  #endif
-  #if CYTHON_FAST_PYCCALL
-  if (__Pyx_PyFastCFunction_Check(__pyx_t_5)) {
-    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_kp_u_advance_Advancing_the_current_pl, __pyx_t_6};
-    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 224, __pyx_L1_error)
-    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  } else
-  #endif
-  {
-    __pyx_t_8 = PyTuple_New(2+__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 224, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_8);
-    if (__pyx_t_4) {
-      __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_4); __pyx_t_4 = NULL;
-    }
-    __Pyx_INCREF(__pyx_kp_u_advance_Advancing_the_current_pl);
-    __Pyx_GIVEREF(__pyx_kp_u_advance_Advancing_the_current_pl);
-    PyTuple_SET_ITEM(__pyx_t_8, 0+__pyx_t_7, __pyx_kp_u_advance_Advancing_the_current_pl);
-    __Pyx_GIVEREF(__pyx_t_6);
-    PyTuple_SET_ITEM(__pyx_t_8, 1+__pyx_t_7, __pyx_t_6);
-    __pyx_t_6 = 0;
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_8, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 224, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  if (__pyx_t_1) {
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":486
+ * 
+ *         if playlist.current_sound_instance == sound_instance:
+ *             playlist.current_sound_instance = None             # <<<<<<<<<<<<<<
+ *         if playlist.fading_sound_instance == sound_instance:
+ *             playlist.fading_sound_instance = None
+ */
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_playlist, __pyx_n_s_current_sound_instance, Py_None) < 0) __PYX_ERR(0, 486, __pyx_L1_error)
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":485
+ *         del self._playlists_by_sound_instance[sound_instance]
+ * 
+ *         if playlist.current_sound_instance == sound_instance:             # <<<<<<<<<<<<<<
+ *             playlist.current_sound_instance = None
+ *         if playlist.fading_sound_instance == sound_instance:
+ */
   }
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":487
+ *         if playlist.current_sound_instance == sound_instance:
+ *             playlist.current_sound_instance = None
+ *         if playlist.fading_sound_instance == sound_instance:             # <<<<<<<<<<<<<<
+ *             playlist.fading_sound_instance = None
+ * 
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_playlist, __pyx_n_s_fading_sound_instance); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 487, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = PyObject_RichCompare(__pyx_t_4, __pyx_v_sound_instance, Py_EQ); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 487, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_1 < 0)) __PYX_ERR(0, 487, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (__pyx_t_1) {
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":227
- *                        self._current_playlist.name)
+    /* "mpfmc/core/audio/playlist_controller.pyx":488
+ *             playlist.current_sound_instance = None
+ *         if playlist.fading_sound_instance == sound_instance:
+ *             playlist.fading_sound_instance = None             # <<<<<<<<<<<<<<
+ * 
+ *         # Post events when sound stopped for playlist
+ */
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_playlist, __pyx_n_s_fading_sound_instance, Py_None) < 0) __PYX_ERR(0, 488, __pyx_L1_error)
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":487
+ *         if playlist.current_sound_instance == sound_instance:
+ *             playlist.current_sound_instance = None
+ *         if playlist.fading_sound_instance == sound_instance:             # <<<<<<<<<<<<<<
+ *             playlist.fading_sound_instance = None
  * 
- *         if self._is_busy():             # <<<<<<<<<<<<<<
- *             # Delay advance playlist until track is finished with current crossfade (too busy)
- *             self._pending_request = partial(self.advance)
  */
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_is_busy); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 227, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_8 = NULL;
-  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
-    __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_5);
-    if (likely(__pyx_t_8)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
-      __Pyx_INCREF(__pyx_t_8);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_5, function);
-    }
   }
-  if (__pyx_t_8) {
-    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 227, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":491
+ * 
+ *         # Post events when sound stopped for playlist
+ *         for event in playlist.events_when_sound_stopped:             # <<<<<<<<<<<<<<
+ *             self.mc.post_mc_native_event(event)
+ * 
+ */
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_playlist, __pyx_n_s_events_when_sound_stopped); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 491, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  if (likely(PyList_CheckExact(__pyx_t_5)) || PyTuple_CheckExact(__pyx_t_5)) {
+    __pyx_t_4 = __pyx_t_5; __Pyx_INCREF(__pyx_t_4); __pyx_t_7 = 0;
+    __pyx_t_8 = NULL;
   } else {
-    __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 227, __pyx_L1_error)
+    __pyx_t_7 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 491, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_8 = Py_TYPE(__pyx_t_4)->tp_iternext; if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 491, __pyx_L1_error)
   }
-  __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 227, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (__pyx_t_3) {
+  for (;;) {
+    if (likely(!__pyx_t_8)) {
+      if (likely(PyList_CheckExact(__pyx_t_4))) {
+        if (__pyx_t_7 >= PyList_GET_SIZE(__pyx_t_4)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_5 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_7); __Pyx_INCREF(__pyx_t_5); __pyx_t_7++; if (unlikely(0 < 0)) __PYX_ERR(0, 491, __pyx_L1_error)
+        #else
+        __pyx_t_5 = PySequence_ITEM(__pyx_t_4, __pyx_t_7); __pyx_t_7++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 491, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        #endif
+      } else {
+        if (__pyx_t_7 >= PyTuple_GET_SIZE(__pyx_t_4)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_5 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_7); __Pyx_INCREF(__pyx_t_5); __pyx_t_7++; if (unlikely(0 < 0)) __PYX_ERR(0, 491, __pyx_L1_error)
+        #else
+        __pyx_t_5 = PySequence_ITEM(__pyx_t_4, __pyx_t_7); __pyx_t_7++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 491, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        #endif
+      }
+    } else {
+      __pyx_t_5 = __pyx_t_8(__pyx_t_4);
+      if (unlikely(!__pyx_t_5)) {
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+          else __PYX_ERR(0, 491, __pyx_L1_error)
+        }
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_5);
+    }
+    __Pyx_XDECREF_SET(__pyx_v_event, __pyx_t_5);
+    __pyx_t_5 = 0;
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":229
- *         if self._is_busy():
- *             # Delay advance playlist until track is finished with current crossfade (too busy)
- *             self._pending_request = partial(self.advance)             # <<<<<<<<<<<<<<
- *             self.log.debug("advance - Playlist track is too busy. Delaying advance to next sound")
- *             return
+    /* "mpfmc/core/audio/playlist_controller.pyx":492
+ *         # Post events when sound stopped for playlist
+ *         for event in playlist.events_when_sound_stopped:
+ *             self.mc.post_mc_native_event(event)             # <<<<<<<<<<<<<<
+ * 
+ *         # Playlist is finished when last sound instance of playlist has completed (and the
  */
-    __pyx_t_5 = __Pyx_GetModuleGlobalName(__pyx_n_s_partial); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 229, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_advance); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 229, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_mc); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 492, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_post_mc_native_event); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 492, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
     __pyx_t_6 = NULL;
-    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_5))) {
-      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_5);
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_9);
       if (likely(__pyx_t_6)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
         __Pyx_INCREF(__pyx_t_6);
         __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_5, function);
+        __Pyx_DECREF_SET(__pyx_t_9, function);
       }
     }
     if (!__pyx_t_6) {
-      __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 229, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_5 = __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_v_event); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 492, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
     } else {
       #if CYTHON_FAST_PYCALL
-      if (PyFunction_Check(__pyx_t_5)) {
-        PyObject *__pyx_temp[2] = {__pyx_t_6, __pyx_t_8};
-        __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 229, __pyx_L1_error)
+      if (PyFunction_Check(__pyx_t_9)) {
+        PyObject *__pyx_temp[2] = {__pyx_t_6, __pyx_v_event};
+        __pyx_t_5 = __Pyx_PyFunction_FastCall(__pyx_t_9, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 492, __pyx_L1_error)
         __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __Pyx_GOTREF(__pyx_t_5);
       } else
       #endif
       #if CYTHON_FAST_PYCCALL
-      if (__Pyx_PyFastCFunction_Check(__pyx_t_5)) {
-        PyObject *__pyx_temp[2] = {__pyx_t_6, __pyx_t_8};
-        __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 229, __pyx_L1_error)
+      if (__Pyx_PyFastCFunction_Check(__pyx_t_9)) {
+        PyObject *__pyx_temp[2] = {__pyx_t_6, __pyx_v_event};
+        __pyx_t_5 = __Pyx_PyCFunction_FastCall(__pyx_t_9, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 492, __pyx_L1_error)
         __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __Pyx_GOTREF(__pyx_t_5);
       } else
       #endif
       {
-        __pyx_t_4 = PyTuple_New(1+1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 229, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_4);
-        __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_6); __pyx_t_6 = NULL;
-        __Pyx_GIVEREF(__pyx_t_8);
-        PyTuple_SET_ITEM(__pyx_t_4, 0+1, __pyx_t_8);
-        __pyx_t_8 = 0;
-        __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_4, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 229, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __pyx_t_10 = PyTuple_New(1+1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 492, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_10);
+        __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_10, 0, __pyx_t_6); __pyx_t_6 = NULL;
+        __Pyx_INCREF(__pyx_v_event);
+        __Pyx_GIVEREF(__pyx_v_event);
+        PyTuple_SET_ITEM(__pyx_t_10, 0+1, __pyx_v_event);
+        __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_9, __pyx_t_10, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 492, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
       }
     }
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_pending_request, __pyx_t_1) < 0) __PYX_ERR(0, 229, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":230
- *             # Delay advance playlist until track is finished with current crossfade (too busy)
- *             self._pending_request = partial(self.advance)
- *             self.log.debug("advance - Playlist track is too busy. Delaying advance to next sound")             # <<<<<<<<<<<<<<
- *             return
+    /* "mpfmc/core/audio/playlist_controller.pyx":491
+ * 
+ *         # Post events when sound stopped for playlist
+ *         for event in playlist.events_when_sound_stopped:             # <<<<<<<<<<<<<<
+ *             self.mc.post_mc_native_event(event)
  * 
  */
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_log); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 230, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_debug); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 230, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_tuple__5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 230, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":231
- *             self._pending_request = partial(self.advance)
- *             self.log.debug("advance - Playlist track is too busy. Delaying advance to next sound")
- *             return             # <<<<<<<<<<<<<<
+  /* "mpfmc/core/audio/playlist_controller.pyx":496
+ *         # Playlist is finished when last sound instance of playlist has completed (and the
+ *         # next sound is not waiting to start)
+ *         if playlist not in self._playlists_by_sound_instance.values() and \             # <<<<<<<<<<<<<<
+ *                 (playlist != self._current_playlist or self._prepared_sound_instance is None):
  * 
- *         # Determine if playlist will now repeat/loop.  Post playlist looping events (if necessary)
  */
-    __Pyx_XDECREF(__pyx_r);
-    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-    goto __pyx_L0;
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_playlists_by_sound_instance); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 496, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_values); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 496, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_9);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_9, function);
+    }
+  }
+  if (__pyx_t_5) {
+    __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 496, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  } else {
+    __pyx_t_4 = __Pyx_PyObject_CallNoArg(__pyx_t_9); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 496, __pyx_L1_error)
+  }
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __pyx_t_2 = (__Pyx_PySequence_ContainsTF(__pyx_v_playlist, __pyx_t_4, Py_NE)); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 496, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+  } else {
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L14_bool_binop_done;
+  }
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":227
- *                        self._current_playlist.name)
+  /* "mpfmc/core/audio/playlist_controller.pyx":497
+ *         # next sound is not waiting to start)
+ *         if playlist not in self._playlists_by_sound_instance.values() and \
+ *                 (playlist != self._current_playlist or self._prepared_sound_instance is None):             # <<<<<<<<<<<<<<
  * 
- *         if self._is_busy():             # <<<<<<<<<<<<<<
- *             # Delay advance playlist until track is finished with current crossfade (too busy)
- *             self._pending_request = partial(self.advance)
+ *             # Playlist has stopped
  */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 497, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_9 = PyObject_RichCompare(__pyx_v_playlist, __pyx_t_4, Py_NE); __Pyx_XGOTREF(__pyx_t_9); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 497, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_9); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 497, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  if (!__pyx_t_3) {
+  } else {
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L14_bool_binop_done;
   }
+  __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_prepared_sound_instance); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 497, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __pyx_t_3 = (__pyx_t_9 == Py_None);
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __pyx_t_2 = (__pyx_t_3 != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L14_bool_binop_done:;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":234
+  /* "mpfmc/core/audio/playlist_controller.pyx":496
+ *         # Playlist is finished when last sound instance of playlist has completed (and the
+ *         # next sound is not waiting to start)
+ *         if playlist not in self._playlists_by_sound_instance.values() and \             # <<<<<<<<<<<<<<
+ *                 (playlist != self._current_playlist or self._prepared_sound_instance is None):
  * 
- *         # Determine if playlist will now repeat/loop.  Post playlist looping events (if necessary)
- *         if self._current_playlist.end_of_playlist:             # <<<<<<<<<<<<<<
- *             if self._current_playlist.repeat and self._current_playlist.events_when_looping:
- *                     for event in self._current_playlist.events_when_looping:
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 234, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_end_of_playlist); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 234, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 234, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  if (__pyx_t_3) {
+  if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":235
- *         # Determine if playlist will now repeat/loop.  Post playlist looping events (if necessary)
- *         if self._current_playlist.end_of_playlist:
- *             if self._current_playlist.repeat and self._current_playlist.events_when_looping:             # <<<<<<<<<<<<<<
- *                     for event in self._current_playlist.events_when_looping:
- *                         self.mc.post_mc_native_event(event)
+    /* "mpfmc/core/audio/playlist_controller.pyx":502
+ * 
+ *             # Trigger any stopped events
+ *             if playlist.events_when_stopped is not None:             # <<<<<<<<<<<<<<
+ *                 for event in playlist.events_when_stopped:
+ *                     self.mc.post_mc_native_event(event)
  */
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 235, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_repeat); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 235, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 235, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_v_playlist, __pyx_n_s_events_when_stopped); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 502, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __pyx_t_1 = (__pyx_t_9 != Py_None);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __pyx_t_2 = (__pyx_t_1 != 0);
     if (__pyx_t_2) {
-    } else {
-      __pyx_t_3 = __pyx_t_2;
-      goto __pyx_L7_bool_binop_done;
-    }
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 235, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_events_when_looping); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 235, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 235, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __pyx_t_3 = __pyx_t_2;
-    __pyx_L7_bool_binop_done:;
-    if (__pyx_t_3) {
 
-      /* "mpfmc/core/audio/playlist_controller.pyx":236
- *         if self._current_playlist.end_of_playlist:
- *             if self._current_playlist.repeat and self._current_playlist.events_when_looping:
- *                     for event in self._current_playlist.events_when_looping:             # <<<<<<<<<<<<<<
- *                         self.mc.post_mc_native_event(event)
+      /* "mpfmc/core/audio/playlist_controller.pyx":503
+ *             # Trigger any stopped events
+ *             if playlist.events_when_stopped is not None:
+ *                 for event in playlist.events_when_stopped:             # <<<<<<<<<<<<<<
+ *                     self.mc.post_mc_native_event(event)
  * 
  */
-      __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 236, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_5);
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_events_when_looping); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 236, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      if (likely(PyList_CheckExact(__pyx_t_1)) || PyTuple_CheckExact(__pyx_t_1)) {
-        __pyx_t_5 = __pyx_t_1; __Pyx_INCREF(__pyx_t_5); __pyx_t_9 = 0;
-        __pyx_t_10 = NULL;
+      __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_v_playlist, __pyx_n_s_events_when_stopped); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 503, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      if (likely(PyList_CheckExact(__pyx_t_9)) || PyTuple_CheckExact(__pyx_t_9)) {
+        __pyx_t_4 = __pyx_t_9; __Pyx_INCREF(__pyx_t_4); __pyx_t_7 = 0;
+        __pyx_t_8 = NULL;
       } else {
-        __pyx_t_9 = -1; __pyx_t_5 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 236, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_5);
-        __pyx_t_10 = Py_TYPE(__pyx_t_5)->tp_iternext; if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 236, __pyx_L1_error)
+        __pyx_t_7 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_t_9); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 503, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __pyx_t_8 = Py_TYPE(__pyx_t_4)->tp_iternext; if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 503, __pyx_L1_error)
       }
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
       for (;;) {
-        if (likely(!__pyx_t_10)) {
-          if (likely(PyList_CheckExact(__pyx_t_5))) {
-            if (__pyx_t_9 >= PyList_GET_SIZE(__pyx_t_5)) break;
+        if (likely(!__pyx_t_8)) {
+          if (likely(PyList_CheckExact(__pyx_t_4))) {
+            if (__pyx_t_7 >= PyList_GET_SIZE(__pyx_t_4)) break;
             #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-            __pyx_t_1 = PyList_GET_ITEM(__pyx_t_5, __pyx_t_9); __Pyx_INCREF(__pyx_t_1); __pyx_t_9++; if (unlikely(0 < 0)) __PYX_ERR(0, 236, __pyx_L1_error)
+            __pyx_t_9 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_7); __Pyx_INCREF(__pyx_t_9); __pyx_t_7++; if (unlikely(0 < 0)) __PYX_ERR(0, 503, __pyx_L1_error)
             #else
-            __pyx_t_1 = PySequence_ITEM(__pyx_t_5, __pyx_t_9); __pyx_t_9++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 236, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_1);
+            __pyx_t_9 = PySequence_ITEM(__pyx_t_4, __pyx_t_7); __pyx_t_7++; if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 503, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_9);
             #endif
           } else {
-            if (__pyx_t_9 >= PyTuple_GET_SIZE(__pyx_t_5)) break;
+            if (__pyx_t_7 >= PyTuple_GET_SIZE(__pyx_t_4)) break;
             #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-            __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_5, __pyx_t_9); __Pyx_INCREF(__pyx_t_1); __pyx_t_9++; if (unlikely(0 < 0)) __PYX_ERR(0, 236, __pyx_L1_error)
+            __pyx_t_9 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_7); __Pyx_INCREF(__pyx_t_9); __pyx_t_7++; if (unlikely(0 < 0)) __PYX_ERR(0, 503, __pyx_L1_error)
             #else
-            __pyx_t_1 = PySequence_ITEM(__pyx_t_5, __pyx_t_9); __pyx_t_9++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 236, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_1);
+            __pyx_t_9 = PySequence_ITEM(__pyx_t_4, __pyx_t_7); __pyx_t_7++; if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 503, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_9);
             #endif
           }
         } else {
-          __pyx_t_1 = __pyx_t_10(__pyx_t_5);
-          if (unlikely(!__pyx_t_1)) {
+          __pyx_t_9 = __pyx_t_8(__pyx_t_4);
+          if (unlikely(!__pyx_t_9)) {
             PyObject* exc_type = PyErr_Occurred();
             if (exc_type) {
               if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-              else __PYX_ERR(0, 236, __pyx_L1_error)
+              else __PYX_ERR(0, 503, __pyx_L1_error)
             }
             break;
           }
-          __Pyx_GOTREF(__pyx_t_1);
+          __Pyx_GOTREF(__pyx_t_9);
         }
-        __Pyx_XDECREF_SET(__pyx_v_event, __pyx_t_1);
-        __pyx_t_1 = 0;
+        __Pyx_XDECREF_SET(__pyx_v_event, __pyx_t_9);
+        __pyx_t_9 = 0;
 
-        /* "mpfmc/core/audio/playlist_controller.pyx":237
- *             if self._current_playlist.repeat and self._current_playlist.events_when_looping:
- *                     for event in self._current_playlist.events_when_looping:
- *                         self.mc.post_mc_native_event(event)             # <<<<<<<<<<<<<<
+        /* "mpfmc/core/audio/playlist_controller.pyx":504
+ *             if playlist.events_when_stopped is not None:
+ *                 for event in playlist.events_when_stopped:
+ *                     self.mc.post_mc_native_event(event)             # <<<<<<<<<<<<<<
  * 
- *         # Set the next sound in the sound player and calculate the fades based on the crossfade setting
+ *             if playlist == self._current_playlist:
  */
-        __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_mc); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 237, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_4);
-        __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_post_mc_native_event); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 237, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_8);
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-        __pyx_t_4 = NULL;
-        if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_8))) {
-          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_8);
-          if (likely(__pyx_t_4)) {
-            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_8);
-            __Pyx_INCREF(__pyx_t_4);
+        __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_mc); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 504, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        __pyx_t_10 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_post_mc_native_event); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 504, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_10);
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __pyx_t_5 = NULL;
+        if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_10))) {
+          __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_10);
+          if (likely(__pyx_t_5)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_10);
+            __Pyx_INCREF(__pyx_t_5);
             __Pyx_INCREF(function);
-            __Pyx_DECREF_SET(__pyx_t_8, function);
+            __Pyx_DECREF_SET(__pyx_t_10, function);
           }
         }
-        if (!__pyx_t_4) {
-          __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_8, __pyx_v_event); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 237, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_1);
+        if (!__pyx_t_5) {
+          __pyx_t_9 = __Pyx_PyObject_CallOneArg(__pyx_t_10, __pyx_v_event); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 504, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_9);
         } else {
           #if CYTHON_FAST_PYCALL
-          if (PyFunction_Check(__pyx_t_8)) {
-            PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_v_event};
-            __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_8, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 237, __pyx_L1_error)
-            __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-            __Pyx_GOTREF(__pyx_t_1);
+          if (PyFunction_Check(__pyx_t_10)) {
+            PyObject *__pyx_temp[2] = {__pyx_t_5, __pyx_v_event};
+            __pyx_t_9 = __Pyx_PyFunction_FastCall(__pyx_t_10, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 504, __pyx_L1_error)
+            __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+            __Pyx_GOTREF(__pyx_t_9);
           } else
           #endif
           #if CYTHON_FAST_PYCCALL
-          if (__Pyx_PyFastCFunction_Check(__pyx_t_8)) {
-            PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_v_event};
-            __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_8, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 237, __pyx_L1_error)
-            __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-            __Pyx_GOTREF(__pyx_t_1);
+          if (__Pyx_PyFastCFunction_Check(__pyx_t_10)) {
+            PyObject *__pyx_temp[2] = {__pyx_t_5, __pyx_v_event};
+            __pyx_t_9 = __Pyx_PyCFunction_FastCall(__pyx_t_10, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 504, __pyx_L1_error)
+            __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+            __Pyx_GOTREF(__pyx_t_9);
           } else
           #endif
           {
-            __pyx_t_6 = PyTuple_New(1+1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 237, __pyx_L1_error)
+            __pyx_t_6 = PyTuple_New(1+1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 504, __pyx_L1_error)
             __Pyx_GOTREF(__pyx_t_6);
-            __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_4); __pyx_t_4 = NULL;
+            __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_5); __pyx_t_5 = NULL;
             __Pyx_INCREF(__pyx_v_event);
             __Pyx_GIVEREF(__pyx_v_event);
             PyTuple_SET_ITEM(__pyx_t_6, 0+1, __pyx_v_event);
-            __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_8, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 237, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_1);
+            __pyx_t_9 = __Pyx_PyObject_Call(__pyx_t_10, __pyx_t_6, NULL); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 504, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_9);
             __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
           }
         }
-        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
 
-        /* "mpfmc/core/audio/playlist_controller.pyx":236
- *         if self._current_playlist.end_of_playlist:
- *             if self._current_playlist.repeat and self._current_playlist.events_when_looping:
- *                     for event in self._current_playlist.events_when_looping:             # <<<<<<<<<<<<<<
- *                         self.mc.post_mc_native_event(event)
+        /* "mpfmc/core/audio/playlist_controller.pyx":503
+ *             # Trigger any stopped events
+ *             if playlist.events_when_stopped is not None:
+ *                 for event in playlist.events_when_stopped:             # <<<<<<<<<<<<<<
+ *                     self.mc.post_mc_native_event(event)
  * 
  */
       }
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-      /* "mpfmc/core/audio/playlist_controller.pyx":235
- *         # Determine if playlist will now repeat/loop.  Post playlist looping events (if necessary)
- *         if self._current_playlist.end_of_playlist:
- *             if self._current_playlist.repeat and self._current_playlist.events_when_looping:             # <<<<<<<<<<<<<<
- *                     for event in self._current_playlist.events_when_looping:
- *                         self.mc.post_mc_native_event(event)
+      /* "mpfmc/core/audio/playlist_controller.pyx":502
+ * 
+ *             # Trigger any stopped events
+ *             if playlist.events_when_stopped is not None:             # <<<<<<<<<<<<<<
+ *                 for event in playlist.events_when_stopped:
+ *                     self.mc.post_mc_native_event(event)
  */
     }
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":234
+    /* "mpfmc/core/audio/playlist_controller.pyx":506
+ *                     self.mc.post_mc_native_event(event)
+ * 
+ *             if playlist == self._current_playlist:             # <<<<<<<<<<<<<<
+ *                 self._current_playlist = None
  * 
- *         # Determine if playlist will now repeat/loop.  Post playlist looping events (if necessary)
- *         if self._current_playlist.end_of_playlist:             # <<<<<<<<<<<<<<
- *             if self._current_playlist.repeat and self._current_playlist.events_when_looping:
- *                     for event in self._current_playlist.events_when_looping:
  */
-  }
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 506, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_9 = PyObject_RichCompare(__pyx_v_playlist, __pyx_t_4, Py_EQ); __Pyx_XGOTREF(__pyx_t_9); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 506, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_9); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 506, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    if (__pyx_t_2) {
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":240
+      /* "mpfmc/core/audio/playlist_controller.pyx":507
+ * 
+ *             if playlist == self._current_playlist:
+ *                 self._current_playlist = None             # <<<<<<<<<<<<<<
+ * 
+ *         # Service any pending request (play, advance)
+ */
+      if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist, Py_None) < 0) __PYX_ERR(0, 507, __pyx_L1_error)
+
+      /* "mpfmc/core/audio/playlist_controller.pyx":506
+ *                     self.mc.post_mc_native_event(event)
+ * 
+ *             if playlist == self._current_playlist:             # <<<<<<<<<<<<<<
+ *                 self._current_playlist = None
  * 
- *         # Set the next sound in the sound player and calculate the fades based on the crossfade setting
- *         next_sound_name = self._current_playlist.get_next_sound_name()             # <<<<<<<<<<<<<<
- *         if next_sound_name:
- *             if self._current_playlist.current_sound_instance is not None:
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 240, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_get_next_sound_name); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 240, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_8);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = NULL;
-  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_8))) {
-    __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_8);
-    if (likely(__pyx_t_1)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_8);
-      __Pyx_INCREF(__pyx_t_1);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_8, function);
     }
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":496
+ *         # Playlist is finished when last sound instance of playlist has completed (and the
+ *         # next sound is not waiting to start)
+ *         if playlist not in self._playlists_by_sound_instance.values() and \             # <<<<<<<<<<<<<<
+ *                 (playlist != self._current_playlist or self._prepared_sound_instance is None):
+ * 
+ */
   }
-  if (__pyx_t_1) {
-    __pyx_t_5 = __Pyx_PyObject_CallOneArg(__pyx_t_8, __pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 240, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  } else {
-    __pyx_t_5 = __Pyx_PyObject_CallNoArg(__pyx_t_8); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 240, __pyx_L1_error)
-  }
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-  __pyx_v_next_sound_name = __pyx_t_5;
-  __pyx_t_5 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":241
- *         # Set the next sound in the sound player and calculate the fades based on the crossfade setting
- *         next_sound_name = self._current_playlist.get_next_sound_name()
- *         if next_sound_name:             # <<<<<<<<<<<<<<
- *             if self._current_playlist.current_sound_instance is not None:
- *                 self._track.stop_sound_instance(self._current_playlist.current_sound_instance,
+  /* "mpfmc/core/audio/playlist_controller.pyx":510
+ * 
+ *         # Service any pending request (play, advance)
+ *         if self._pending_request:             # <<<<<<<<<<<<<<
+ *             request = self._pending_request
+ *             self._pending_request = None
  */
-  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_v_next_sound_name); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 241, __pyx_L1_error)
-  if (__pyx_t_3) {
+  __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_pending_request); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 510, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_9); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 510, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  if (__pyx_t_2) {
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":242
- *         next_sound_name = self._current_playlist.get_next_sound_name()
- *         if next_sound_name:
- *             if self._current_playlist.current_sound_instance is not None:             # <<<<<<<<<<<<<<
- *                 self._track.stop_sound_instance(self._current_playlist.current_sound_instance,
- *                                                 self._current_playlist.crossfade_time)
+    /* "mpfmc/core/audio/playlist_controller.pyx":511
+ *         # Service any pending request (play, advance)
+ *         if self._pending_request:
+ *             request = self._pending_request             # <<<<<<<<<<<<<<
+ *             self._pending_request = None
+ *             request()
  */
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 242, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_current_sound_instance); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 242, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_8);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __pyx_t_3 = (__pyx_t_8 != Py_None);
-    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-    __pyx_t_2 = (__pyx_t_3 != 0);
-    if (__pyx_t_2) {
+    __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_pending_request); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 511, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __pyx_v_request = __pyx_t_9;
+    __pyx_t_9 = 0;
 
-      /* "mpfmc/core/audio/playlist_controller.pyx":243
- *         if next_sound_name:
- *             if self._current_playlist.current_sound_instance is not None:
- *                 self._track.stop_sound_instance(self._current_playlist.current_sound_instance,             # <<<<<<<<<<<<<<
- *                                                 self._current_playlist.crossfade_time)
- *                 self._current_playlist.fading_sound_instance = self._current_playlist.current_sound_instance
+    /* "mpfmc/core/audio/playlist_controller.pyx":512
+ *         if self._pending_request:
+ *             request = self._pending_request
+ *             self._pending_request = None             # <<<<<<<<<<<<<<
+ *             request()
+ * 
  */
-      __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_track_2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 243, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_5);
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_stop_sound_instance); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 243, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 243, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_5);
-      __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_current_sound_instance); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 243, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_6);
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_pending_request, Py_None) < 0) __PYX_ERR(0, 512, __pyx_L1_error)
 
-      /* "mpfmc/core/audio/playlist_controller.pyx":244
- *             if self._current_playlist.current_sound_instance is not None:
- *                 self._track.stop_sound_instance(self._current_playlist.current_sound_instance,
- *                                                 self._current_playlist.crossfade_time)             # <<<<<<<<<<<<<<
- *                 self._current_playlist.fading_sound_instance = self._current_playlist.current_sound_instance
+    /* "mpfmc/core/audio/playlist_controller.pyx":513
+ *             request = self._pending_request
+ *             self._pending_request = None
+ *             request()             # <<<<<<<<<<<<<<
  * 
+ *         # Prepare the next sound if it had to wait for a sound to finish fading out
  */
-      __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 244, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_5);
-      __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_crossfade_time); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 244, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __pyx_t_5 = NULL;
-      __pyx_t_7 = 0;
-      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
-        __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_1);
-        if (likely(__pyx_t_5)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
-          __Pyx_INCREF(__pyx_t_5);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_1, function);
-          __pyx_t_7 = 1;
-        }
-      }
-      #if CYTHON_FAST_PYCALL
-      if (PyFunction_Check(__pyx_t_1)) {
-        PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_t_6, __pyx_t_4};
-        __pyx_t_8 = __Pyx_PyFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 243, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-        __Pyx_GOTREF(__pyx_t_8);
-        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      } else
-      #endif
-      #if CYTHON_FAST_PYCCALL
-      if (__Pyx_PyFastCFunction_Check(__pyx_t_1)) {
-        PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_t_6, __pyx_t_4};
-        __pyx_t_8 = __Pyx_PyCFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 243, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-        __Pyx_GOTREF(__pyx_t_8);
-        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      } else
-      #endif
-      {
-        __pyx_t_11 = PyTuple_New(2+__pyx_t_7); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 243, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_11);
-        if (__pyx_t_5) {
-          __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_11, 0, __pyx_t_5); __pyx_t_5 = NULL;
-        }
-        __Pyx_GIVEREF(__pyx_t_6);
-        PyTuple_SET_ITEM(__pyx_t_11, 0+__pyx_t_7, __pyx_t_6);
-        __Pyx_GIVEREF(__pyx_t_4);
-        PyTuple_SET_ITEM(__pyx_t_11, 1+__pyx_t_7, __pyx_t_4);
-        __pyx_t_6 = 0;
-        __pyx_t_4 = 0;
-        __pyx_t_8 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_11, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 243, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_8);
-        __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+    __Pyx_INCREF(__pyx_v_request);
+    __pyx_t_4 = __pyx_v_request; __pyx_t_10 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_10 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_10)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_10);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
       }
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    }
+    if (__pyx_t_10) {
+      __pyx_t_9 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_10); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 513, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    } else {
+      __pyx_t_9 = __Pyx_PyObject_CallNoArg(__pyx_t_4); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 513, __pyx_L1_error)
+    }
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
 
-      /* "mpfmc/core/audio/playlist_controller.pyx":245
- *                 self._track.stop_sound_instance(self._current_playlist.current_sound_instance,
- *                                                 self._current_playlist.crossfade_time)
- *                 self._current_playlist.fading_sound_instance = self._current_playlist.current_sound_instance             # <<<<<<<<<<<<<<
+    /* "mpfmc/core/audio/playlist_controller.pyx":510
  * 
- *             self._play_playlist_sound(next_sound_name, self._current_playlist, self._current_playlist.crossfade_time)
+ *         # Service any pending request (play, advance)
+ *         if self._pending_request:             # <<<<<<<<<<<<<<
+ *             request = self._pending_request
+ *             self._pending_request = None
  */
-      __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 245, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_8);
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_n_s_current_sound_instance); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 245, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-      __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 245, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_8);
-      if (__Pyx_PyObject_SetAttrStr(__pyx_t_8, __pyx_n_s_fading_sound_instance, __pyx_t_1) < 0) __PYX_ERR(0, 245, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  }
 
-      /* "mpfmc/core/audio/playlist_controller.pyx":242
- *         next_sound_name = self._current_playlist.get_next_sound_name()
- *         if next_sound_name:
- *             if self._current_playlist.current_sound_instance is not None:             # <<<<<<<<<<<<<<
- *                 self._track.stop_sound_instance(self._current_playlist.current_sound_instance,
- *                                                 self._current_playlist.crossfade_time)
+  /* "mpfmc/core/audio/playlist_controller.pyx":516
+ * 
+ *         # Prepare the next sound if it had to wait for a sound to finish fading out
+ *         if self._prepare_next_sound_when_not_busy and self._current_playlist is not None:             # <<<<<<<<<<<<<<
+ *             self._prepare_next_sound_when_not_busy = False
+ *             self._prepare_next_sound(self._current_playlist.current_sound_instance)
  */
-    }
+  __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_prepare_next_sound_when_not_bus); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 516, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_9); if (unlikely(__pyx_t_1 < 0)) __PYX_ERR(0, 516, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  if (__pyx_t_1) {
+  } else {
+    __pyx_t_2 = __pyx_t_1;
+    goto __pyx_L23_bool_binop_done;
+  }
+  __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 516, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __pyx_t_1 = (__pyx_t_9 != Py_None);
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __pyx_t_3 = (__pyx_t_1 != 0);
+  __pyx_t_2 = __pyx_t_3;
+  __pyx_L23_bool_binop_done:;
+  if (__pyx_t_2) {
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":247
- *                 self._current_playlist.fading_sound_instance = self._current_playlist.current_sound_instance
+    /* "mpfmc/core/audio/playlist_controller.pyx":517
+ *         # Prepare the next sound if it had to wait for a sound to finish fading out
+ *         if self._prepare_next_sound_when_not_busy and self._current_playlist is not None:
+ *             self._prepare_next_sound_when_not_busy = False             # <<<<<<<<<<<<<<
+ *             self._prepare_next_sound(self._current_playlist.current_sound_instance)
  * 
- *             self._play_playlist_sound(next_sound_name, self._current_playlist, self._current_playlist.crossfade_time)             # <<<<<<<<<<<<<<
+ */
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_prepare_next_sound_when_not_bus, Py_False) < 0) __PYX_ERR(0, 517, __pyx_L1_error)
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":518
+ *         if self._prepare_next_sound_when_not_busy and self._current_playlist is not None:
+ *             self._prepare_next_sound_when_not_busy = False
+ *             self._prepare_next_sound(self._current_playlist.current_sound_instance)             # <<<<<<<<<<<<<<
  * 
- *     def set_repeat(self, repeat=True):
+ *     def _on_sound_instance_about_to_finish(self, sound_instance=None, **kwargs):
  */
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_play_playlist_sound); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 247, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_11 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 247, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_11);
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 247, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_prepare_next_sound); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 518, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_crossfade_time); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 247, __pyx_L1_error)
+    __pyx_t_10 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 518, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_10);
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_10, __pyx_n_s_current_sound_instance); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 518, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_4 = NULL;
-    __pyx_t_7 = 0;
-    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
-      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_1);
-      if (likely(__pyx_t_4)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
-        __Pyx_INCREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    __pyx_t_10 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_10 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_10)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_10);
         __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_1, function);
-        __pyx_t_7 = 1;
+        __Pyx_DECREF_SET(__pyx_t_4, function);
       }
     }
-    #if CYTHON_FAST_PYCALL
-    if (PyFunction_Check(__pyx_t_1)) {
-      PyObject *__pyx_temp[4] = {__pyx_t_4, __pyx_v_next_sound_name, __pyx_t_11, __pyx_t_6};
-      __pyx_t_8 = __Pyx_PyFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_7, 3+__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 247, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_GOTREF(__pyx_t_8);
-      __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    } else
-    #endif
-    #if CYTHON_FAST_PYCCALL
-    if (__Pyx_PyFastCFunction_Check(__pyx_t_1)) {
-      PyObject *__pyx_temp[4] = {__pyx_t_4, __pyx_v_next_sound_name, __pyx_t_11, __pyx_t_6};
-      __pyx_t_8 = __Pyx_PyCFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_7, 3+__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 247, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_GOTREF(__pyx_t_8);
-      __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+    if (!__pyx_t_10) {
+      __pyx_t_9 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_6); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 518, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    } else
-    #endif
-    {
-      __pyx_t_5 = PyTuple_New(3+__pyx_t_7); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 247, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_5);
-      if (__pyx_t_4) {
-        __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4); __pyx_t_4 = NULL;
+      __Pyx_GOTREF(__pyx_t_9);
+    } else {
+      #if CYTHON_FAST_PYCALL
+      if (PyFunction_Check(__pyx_t_4)) {
+        PyObject *__pyx_temp[2] = {__pyx_t_10, __pyx_t_6};
+        __pyx_t_9 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 518, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
+        __Pyx_GOTREF(__pyx_t_9);
+        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      } else
+      #endif
+      #if CYTHON_FAST_PYCCALL
+      if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
+        PyObject *__pyx_temp[2] = {__pyx_t_10, __pyx_t_6};
+        __pyx_t_9 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 518, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
+        __Pyx_GOTREF(__pyx_t_9);
+        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      } else
+      #endif
+      {
+        __pyx_t_5 = PyTuple_New(1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 518, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        __Pyx_GIVEREF(__pyx_t_10); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_10); __pyx_t_10 = NULL;
+        __Pyx_GIVEREF(__pyx_t_6);
+        PyTuple_SET_ITEM(__pyx_t_5, 0+1, __pyx_t_6);
+        __pyx_t_6 = 0;
+        __pyx_t_9 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_5, NULL); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 518, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
       }
-      __Pyx_INCREF(__pyx_v_next_sound_name);
-      __Pyx_GIVEREF(__pyx_v_next_sound_name);
-      PyTuple_SET_ITEM(__pyx_t_5, 0+__pyx_t_7, __pyx_v_next_sound_name);
-      __Pyx_GIVEREF(__pyx_t_11);
-      PyTuple_SET_ITEM(__pyx_t_5, 1+__pyx_t_7, __pyx_t_11);
-      __Pyx_GIVEREF(__pyx_t_6);
-      PyTuple_SET_ITEM(__pyx_t_5, 2+__pyx_t_7, __pyx_t_6);
-      __pyx_t_11 = 0;
-      __pyx_t_6 = 0;
-      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_5, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 247, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_8);
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":241
- *         # Set the next sound in the sound player and calculate the fades based on the crossfade setting
- *         next_sound_name = self._current_playlist.get_next_sound_name()
- *         if next_sound_name:             # <<<<<<<<<<<<<<
- *             if self._current_playlist.current_sound_instance is not None:
- *                 self._track.stop_sound_instance(self._current_playlist.current_sound_instance,
+    /* "mpfmc/core/audio/playlist_controller.pyx":516
+ * 
+ *         # Prepare the next sound if it had to wait for a sound to finish fading out
+ *         if self._prepare_next_sound_when_not_busy and self._current_playlist is not None:             # <<<<<<<<<<<<<<
+ *             self._prepare_next_sound_when_not_busy = False
+ *             self._prepare_next_sound(self._current_playlist.current_sound_instance)
  */
   }
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":216
- *         self._current_playlist = None
+  /* "mpfmc/core/audio/playlist_controller.pyx":466
+ *             self._schedule_prepare_next_sound(sound_instance)
  * 
- *     def advance(self):             # <<<<<<<<<<<<<<
- *         """Advance the currently playing playlist to the next sound."""
+ *     def _on_sound_instance_stopped(self, sound_instance=None, **kwargs):             # <<<<<<<<<<<<<<
+ *         """Callback function called whenever a playlist sound has finished playing."""
  * 
  */
 
@@ -5479,44 +11121,47 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
   __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_XDECREF(__pyx_t_11);
-  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController.advance", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController._on_sound_instance_stopped", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_playlist);
   __Pyx_XDECREF(__pyx_v_event);
-  __Pyx_XDECREF(__pyx_v_next_sound_name);
+  __Pyx_XDECREF(__pyx_v_request);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/playlist_controller.pyx":249
- *             self._play_playlist_sound(next_sound_name, self._current_playlist, self._current_playlist.crossfade_time)
+/* "mpfmc/core/audio/playlist_controller.pyx":520
+ *             self._prepare_next_sound(self._current_playlist.current_sound_instance)
  * 
- *     def set_repeat(self, repeat=True):             # <<<<<<<<<<<<<<
- *         """Set whether or not the currently playing playlist should repeat when finished."""
+ *     def _on_sound_instance_about_to_finish(self, sound_instance=None, **kwargs):             # <<<<<<<<<<<<<<
+ *         """Callback function called whenever a playlist sound is about to finish playing."""
  * 
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_27set_repeat(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_26set_repeat[] = "PlaylistController.set_repeat(self, repeat=True)\nSet whether or not the currently playing playlist should repeat when finished.";
-static PyMethodDef __pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_27set_repeat = {"set_repeat", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_27set_repeat, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_26set_repeat};
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_27set_repeat(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_55_on_sound_instance_about_to_finish(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_54_on_sound_instance_about_to_finish[] = "PlaylistController._on_sound_instance_about_to_finish(self, sound_instance=None, **kwargs)\nCallback function called whenever a playlist sound is about to finish playing.";
+static PyMethodDef __pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_55_on_sound_instance_about_to_finish = {"_on_sound_instance_about_to_finish", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_55_on_sound_instance_about_to_finish, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_54_on_sound_instance_about_to_finish};
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_55_on_sound_instance_about_to_finish(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_self = 0;
-  PyObject *__pyx_v_repeat = 0;
+  PyObject *__pyx_v_sound_instance = 0;
+  CYTHON_UNUSED PyObject *__pyx_v_kwargs = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("set_repeat (wrapper)", 0);
+  __Pyx_RefNannySetupContext("_on_sound_instance_about_to_finish (wrapper)", 0);
+  __pyx_v_kwargs = PyDict_New(); if (unlikely(!__pyx_v_kwargs)) return NULL;
+  __Pyx_GOTREF(__pyx_v_kwargs);
   {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_repeat,0};
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_sound_instance,0};
     PyObject* values[2] = {0,0};
-    values[1] = ((PyObject *)((PyObject *)Py_True));
+    values[1] = ((PyObject *)((PyObject *)Py_None));
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
@@ -5536,12 +11181,12 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
         CYTHON_FALLTHROUGH;
         case  1:
         if (kw_args > 0) {
-          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_repeat);
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_sound_instance);
           if (value) { values[1] = value; kw_args--; }
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "set_repeat") < 0)) __PYX_ERR(0, 249, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, __pyx_v_kwargs, values, pos_args, "_on_sound_instance_about_to_finish") < 0)) __PYX_ERR(0, 520, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -5553,224 +11198,254 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
       }
     }
     __pyx_v_self = values[0];
-    __pyx_v_repeat = values[1];
+    __pyx_v_sound_instance = values[1];
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("set_repeat", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 249, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("_on_sound_instance_about_to_finish", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 520, __pyx_L3_error)
   __pyx_L3_error:;
-  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController.set_repeat", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_DECREF(__pyx_v_kwargs); __pyx_v_kwargs = 0;
+  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController._on_sound_instance_about_to_finish", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_26set_repeat(__pyx_self, __pyx_v_self, __pyx_v_repeat);
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_54_on_sound_instance_about_to_finish(__pyx_self, __pyx_v_self, __pyx_v_sound_instance, __pyx_v_kwargs);
 
   /* function exit code */
+  __Pyx_XDECREF(__pyx_v_kwargs);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_26set_repeat(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_repeat) {
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_54_on_sound_instance_about_to_finish(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_sound_instance, CYTHON_UNUSED PyObject *__pyx_v_kwargs) {
+  PyObject *__pyx_v_playlist = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_1;
   int __pyx_t_2;
-  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_3;
   PyObject *__pyx_t_4 = NULL;
   PyObject *__pyx_t_5 = NULL;
-  int __pyx_t_6;
+  PyObject *__pyx_t_6 = NULL;
   PyObject *__pyx_t_7 = NULL;
-  __Pyx_RefNannySetupContext("set_repeat", 0);
+  __Pyx_RefNannySetupContext("_on_sound_instance_about_to_finish", 0);
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":252
- *         """Set whether or not the currently playing playlist should repeat when finished."""
+  /* "mpfmc/core/audio/playlist_controller.pyx":523
+ *         """Callback function called whenever a playlist sound is about to finish playing."""
+ * 
+ *         if sound_instance is None or sound_instance not in self._playlists_by_sound_instance:             # <<<<<<<<<<<<<<
+ *             return
  * 
- *         if self._current_playlist:             # <<<<<<<<<<<<<<
- *             self._current_playlist.loop = repeat
- *             self.log.debug("set_repeat - Setting repeat for currently playlist to {}.", str(repeat))
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 252, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 252, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (__pyx_t_2) {
+  __pyx_t_2 = (__pyx_v_sound_instance == Py_None);
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (!__pyx_t_3) {
+  } else {
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_playlists_by_sound_instance); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 523, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = (__Pyx_PySequence_ContainsTF(__pyx_v_sound_instance, __pyx_t_4, Py_NE)); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 523, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_2 = (__pyx_t_3 != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":253
+    /* "mpfmc/core/audio/playlist_controller.pyx":524
  * 
- *         if self._current_playlist:
- *             self._current_playlist.loop = repeat             # <<<<<<<<<<<<<<
- *             self.log.debug("set_repeat - Setting repeat for currently playlist to {}.", str(repeat))
- *         else:
+ *         if sound_instance is None or sound_instance not in self._playlists_by_sound_instance:
+ *             return             # <<<<<<<<<<<<<<
+ * 
+ *         # Get playlist for sound_instance
  */
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 253, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    if (__Pyx_PyObject_SetAttrStr(__pyx_t_1, __pyx_n_s_loop, __pyx_v_repeat) < 0) __PYX_ERR(0, 253, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":254
- *         if self._current_playlist:
- *             self._current_playlist.loop = repeat
- *             self.log.debug("set_repeat - Setting repeat for currently playlist to {}.", str(repeat))             # <<<<<<<<<<<<<<
- *         else:
- *             self.log.debug("set_repeat - No playlist is currently playing. "
+    /* "mpfmc/core/audio/playlist_controller.pyx":523
+ *         """Callback function called whenever a playlist sound is about to finish playing."""
+ * 
+ *         if sound_instance is None or sound_instance not in self._playlists_by_sound_instance:             # <<<<<<<<<<<<<<
+ *             return
+ * 
  */
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_log); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 254, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_debug); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 254, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 254, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_INCREF(__pyx_v_repeat);
-    __Pyx_GIVEREF(__pyx_v_repeat);
-    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_repeat);
-    __pyx_t_5 = __Pyx_PyObject_Call(((PyObject *)(&PyUnicode_Type)), __pyx_t_3, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 254, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_3 = NULL;
-    __pyx_t_6 = 0;
-    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
-      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_4);
-      if (likely(__pyx_t_3)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
-        __Pyx_INCREF(__pyx_t_3);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_4, function);
-        __pyx_t_6 = 1;
-      }
-    }
-    #if CYTHON_FAST_PYCALL
-    if (PyFunction_Check(__pyx_t_4)) {
-      PyObject *__pyx_temp[3] = {__pyx_t_3, __pyx_kp_u_set_repeat_Setting_repeat_for_cu, __pyx_t_5};
-      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 254, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    } else
-    #endif
-    #if CYTHON_FAST_PYCCALL
-    if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
-      PyObject *__pyx_temp[3] = {__pyx_t_3, __pyx_kp_u_set_repeat_Setting_repeat_for_cu, __pyx_t_5};
-      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 254, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    } else
-    #endif
-    {
-      __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 254, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_7);
-      if (__pyx_t_3) {
-        __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_3); __pyx_t_3 = NULL;
-      }
-      __Pyx_INCREF(__pyx_kp_u_set_repeat_Setting_repeat_for_cu);
-      __Pyx_GIVEREF(__pyx_kp_u_set_repeat_Setting_repeat_for_cu);
-      PyTuple_SET_ITEM(__pyx_t_7, 0+__pyx_t_6, __pyx_kp_u_set_repeat_Setting_repeat_for_cu);
-      __Pyx_GIVEREF(__pyx_t_5);
-      PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_t_5);
-      __pyx_t_5 = 0;
-      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 254, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    }
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  }
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":252
- *         """Set whether or not the currently playing playlist should repeat when finished."""
+  /* "mpfmc/core/audio/playlist_controller.pyx":527
  * 
- *         if self._current_playlist:             # <<<<<<<<<<<<<<
- *             self._current_playlist.loop = repeat
- *             self.log.debug("set_repeat - Setting repeat for currently playlist to {}.", str(repeat))
+ *         # Get playlist for sound_instance
+ *         playlist = self._playlists_by_sound_instance[sound_instance]             # <<<<<<<<<<<<<<
+ * 
+ *         # Take no action if the sound is not from the current playlist or if the next sound has
  */
-    goto __pyx_L3;
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_playlists_by_sound_instance); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 527, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = PyObject_GetItem(__pyx_t_4, __pyx_v_sound_instance); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 527, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_v_playlist = __pyx_t_5;
+  __pyx_t_5 = 0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":531
+ *         # Take no action if the sound is not from the current playlist or if the next sound has
+ *         # been prepared (the track starts it at the marker)
+ *         if playlist != self._current_playlist or self._prepared_sound_instance is not None:             # <<<<<<<<<<<<<<
+ *             return
+ * 
+ */
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 531, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_4 = PyObject_RichCompare(__pyx_v_playlist, __pyx_t_5, Py_NE); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 531, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 531, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L7_bool_binop_done;
   }
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_prepared_sound_instance); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 531, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_2 = (__pyx_t_4 != Py_None);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  __pyx_t_1 = __pyx_t_3;
+  __pyx_L7_bool_binop_done:;
+  if (__pyx_t_1) {
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":256
- *             self.log.debug("set_repeat - Setting repeat for currently playlist to {}.", str(repeat))
- *         else:
- *             self.log.debug("set_repeat - No playlist is currently playing. "             # <<<<<<<<<<<<<<
- *                            "Could not set repeat to {}.", str(repeat))
+    /* "mpfmc/core/audio/playlist_controller.pyx":532
+ *         # been prepared (the track starts it at the marker)
+ *         if playlist != self._current_playlist or self._prepared_sound_instance is not None:
+ *             return             # <<<<<<<<<<<<<<
  * 
+ *         # Determine if this is the last sound in the playlist
  */
-  /*else*/ {
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_log); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 256, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_debug); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 256, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":257
- *         else:
- *             self.log.debug("set_repeat - No playlist is currently playing. "
- *                            "Could not set repeat to {}.", str(repeat))             # <<<<<<<<<<<<<<
+    /* "mpfmc/core/audio/playlist_controller.pyx":531
+ *         # Take no action if the sound is not from the current playlist or if the next sound has
+ *         # been prepared (the track starts it at the marker)
+ *         if playlist != self._current_playlist or self._prepared_sound_instance is not None:             # <<<<<<<<<<<<<<
+ *             return
  * 
- *     def _on_sound_instance_stopped(self, sound_instance=None, **kwargs):
  */
-    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 257, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_INCREF(__pyx_v_repeat);
-    __Pyx_GIVEREF(__pyx_v_repeat);
-    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_repeat);
-    __pyx_t_5 = __Pyx_PyObject_Call(((PyObject *)(&PyUnicode_Type)), __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 257, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_4 = NULL;
-    __pyx_t_6 = 0;
-    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_7))) {
-      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_7);
-      if (likely(__pyx_t_4)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_7);
-        __Pyx_INCREF(__pyx_t_4);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_7, function);
-        __pyx_t_6 = 1;
-      }
+  }
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":535
+ * 
+ *         # Determine if this is the last sound in the playlist
+ *         if not self._has_next_sound(playlist):             # <<<<<<<<<<<<<<
+ *             return
+ * 
+ */
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_has_next_sound); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 535, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
+    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_5);
+    if (likely(__pyx_t_6)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+      __Pyx_INCREF(__pyx_t_6);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_5, function);
     }
-    #if CYTHON_FAST_PYCALL
-    if (PyFunction_Check(__pyx_t_7)) {
-      PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_kp_u_set_repeat_No_playlist_is_curren, __pyx_t_5};
-      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_7, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 256, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  }
+  if (!__pyx_t_6) {
+    __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_v_playlist); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 535, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+  } else {
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_5)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_6, __pyx_v_playlist};
+      __pyx_t_4 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 535, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_GOTREF(__pyx_t_4);
     } else
     #endif
     #if CYTHON_FAST_PYCCALL
-    if (__Pyx_PyFastCFunction_Check(__pyx_t_7)) {
-      PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_kp_u_set_repeat_No_playlist_is_curren, __pyx_t_5};
-      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_7, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 256, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_5)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_6, __pyx_v_playlist};
+      __pyx_t_4 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 535, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_GOTREF(__pyx_t_4);
     } else
     #endif
     {
-      __pyx_t_3 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 256, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
-      if (__pyx_t_4) {
-        __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_4); __pyx_t_4 = NULL;
-      }
-      __Pyx_INCREF(__pyx_kp_u_set_repeat_No_playlist_is_curren);
-      __Pyx_GIVEREF(__pyx_kp_u_set_repeat_No_playlist_is_curren);
-      PyTuple_SET_ITEM(__pyx_t_3, 0+__pyx_t_6, __pyx_kp_u_set_repeat_No_playlist_is_curren);
-      __Pyx_GIVEREF(__pyx_t_5);
-      PyTuple_SET_ITEM(__pyx_t_3, 1+__pyx_t_6, __pyx_t_5);
-      __pyx_t_5 = 0;
-      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_7, __pyx_t_3, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 256, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_t_7 = PyTuple_New(1+1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 535, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_6); __pyx_t_6 = NULL;
+      __Pyx_INCREF(__pyx_v_playlist);
+      __Pyx_GIVEREF(__pyx_v_playlist);
+      PyTuple_SET_ITEM(__pyx_t_7, 0+1, __pyx_v_playlist);
+      __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_7, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 535, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    }
+  }
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_1 < 0)) __PYX_ERR(0, 535, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_3 = ((!__pyx_t_1) != 0);
+  if (__pyx_t_3) {
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":536
+ *         # Determine if this is the last sound in the playlist
+ *         if not self._has_next_sound(playlist):
+ *             return             # <<<<<<<<<<<<<<
+ * 
+ *         # Advance to the next sound in the playlist
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":535
+ * 
+ *         # Determine if this is the last sound in the playlist
+ *         if not self._has_next_sound(playlist):             # <<<<<<<<<<<<<<
+ *             return
+ * 
+ */
+  }
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":539
+ * 
+ *         # Advance to the next sound in the playlist
+ *         self.advance()             # <<<<<<<<<<<<<<
+ * 
+ *     def clear_context(self, context):
+ */
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_advance); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 539, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_7 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
+    __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_5);
+    if (likely(__pyx_t_7)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+      __Pyx_INCREF(__pyx_t_7);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_5, function);
     }
+  }
+  if (__pyx_t_7) {
+    __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_7); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 539, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  } else {
+    __pyx_t_4 = __Pyx_PyObject_CallNoArg(__pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 539, __pyx_L1_error)
   }
-  __pyx_L3:;
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":249
- *             self._play_playlist_sound(next_sound_name, self._current_playlist, self._current_playlist.crossfade_time)
+  /* "mpfmc/core/audio/playlist_controller.pyx":520
+ *             self._prepare_next_sound(self._current_playlist.current_sound_instance)
  * 
- *     def set_repeat(self, repeat=True):             # <<<<<<<<<<<<<<
- *         """Set whether or not the currently playing playlist should repeat when finished."""
+ *     def _on_sound_instance_about_to_finish(self, sound_instance=None, **kwargs):             # <<<<<<<<<<<<<<
+ *         """Callback function called whenever a playlist sound is about to finish playing."""
  * 
  */
 
@@ -5778,44 +11453,40 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
   __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController.set_repeat", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController._on_sound_instance_about_to_finish", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_playlist);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/playlist_controller.pyx":259
- *                            "Could not set repeat to {}.", str(repeat))
- * 
- *     def _on_sound_instance_stopped(self, sound_instance=None, **kwargs):             # <<<<<<<<<<<<<<
- *         """Callback function called whenever a playlist sound has finished playing."""
+/* "mpfmc/core/audio/playlist_controller.pyx":541
+ *         self.advance()
  * 
+ *     def clear_context(self, context):             # <<<<<<<<<<<<<<
+ *         """
+ *         Stops the current playlist if it was played from the specified context.
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_29_on_sound_instance_stopped(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_28_on_sound_instance_stopped[] = "PlaylistController._on_sound_instance_stopped(self, sound_instance=None, **kwargs)\nCallback function called whenever a playlist sound has finished playing.";
-static PyMethodDef __pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_29_on_sound_instance_stopped = {"_on_sound_instance_stopped", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_29_on_sound_instance_stopped, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_28_on_sound_instance_stopped};
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_29_on_sound_instance_stopped(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_57clear_context(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_56clear_context[] = "PlaylistController.clear_context(self, context)\n\n        Stops the current playlist if it was played from the specified context.\n\n        Args:\n            context: The context to clear\n        ";
+static PyMethodDef __pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_57clear_context = {"clear_context", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_57clear_context, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_56clear_context};
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_57clear_context(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_self = 0;
-  PyObject *__pyx_v_sound_instance = 0;
-  CYTHON_UNUSED PyObject *__pyx_v_kwargs = 0;
+  PyObject *__pyx_v_context = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("_on_sound_instance_stopped (wrapper)", 0);
-  __pyx_v_kwargs = PyDict_New(); if (unlikely(!__pyx_v_kwargs)) return NULL;
-  __Pyx_GOTREF(__pyx_v_kwargs);
+  __Pyx_RefNannySetupContext("clear_context (wrapper)", 0);
   {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_sound_instance,0};
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_context,0};
     PyObject* values[2] = {0,0};
-    values[1] = ((PyObject *)((PyObject *)Py_None));
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
@@ -5834,1211 +11505,1612 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistCo
         else goto __pyx_L5_argtuple_error;
         CYTHON_FALLTHROUGH;
         case  1:
-        if (kw_args > 0) {
-          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_sound_instance);
-          if (value) { values[1] = value; kw_args--; }
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_context)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("clear_context", 1, 2, 2, 1); __PYX_ERR(0, 541, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, __pyx_v_kwargs, values, pos_args, "_on_sound_instance_stopped") < 0)) __PYX_ERR(0, 259, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "clear_context") < 0)) __PYX_ERR(0, 541, __pyx_L3_error)
       }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
     } else {
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        break;
-        default: goto __pyx_L5_argtuple_error;
-      }
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
     }
     __pyx_v_self = values[0];
-    __pyx_v_sound_instance = values[1];
+    __pyx_v_context = values[1];
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("_on_sound_instance_stopped", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 259, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("clear_context", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 541, __pyx_L3_error)
   __pyx_L3_error:;
-  __Pyx_DECREF(__pyx_v_kwargs); __pyx_v_kwargs = 0;
-  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController._on_sound_instance_stopped", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController.clear_context", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_28_on_sound_instance_stopped(__pyx_self, __pyx_v_self, __pyx_v_sound_instance, __pyx_v_kwargs);
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_56clear_context(__pyx_self, __pyx_v_self, __pyx_v_context);
 
   /* function exit code */
-  __Pyx_XDECREF(__pyx_v_kwargs);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_28_on_sound_instance_stopped(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_sound_instance, CYTHON_UNUSED PyObject *__pyx_v_kwargs) {
-  PyObject *__pyx_v_playlist = NULL;
-  PyObject *__pyx_v_event = NULL;
-  PyObject *__pyx_v_request = NULL;
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_56clear_context(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_context) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  int __pyx_t_2;
-  int __pyx_t_3;
-  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
   PyObject *__pyx_t_5 = NULL;
-  Py_ssize_t __pyx_t_6;
-  PyObject *(*__pyx_t_7)(PyObject *);
-  PyObject *__pyx_t_8 = NULL;
-  PyObject *__pyx_t_9 = NULL;
-  PyObject *__pyx_t_10 = NULL;
-  __Pyx_RefNannySetupContext("_on_sound_instance_stopped", 0);
+  int __pyx_t_6;
+  int __pyx_t_7;
+  int __pyx_t_8;
+  __Pyx_RefNannySetupContext("clear_context", 0);
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":262
- *         """Callback function called whenever a playlist sound has finished playing."""
+  /* "mpfmc/core/audio/playlist_controller.pyx":548
+ *             context: The context to clear
+ *         """
+ *         self.log.debug("Clearing context %s", context)             # <<<<<<<<<<<<<<
  * 
- *         if sound_instance is None or sound_instance not in self._playlists_by_sound_instance:             # <<<<<<<<<<<<<<
- *             return
+ *         if self._current_playlist.context == context:
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_log); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 548, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_debug); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 548, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = NULL;
+  __pyx_t_4 = 0;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_2)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_2);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+      __pyx_t_4 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_2, __pyx_kp_u_Clearing_context_s, __pyx_v_context};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_4, 2+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 548, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_2, __pyx_kp_u_Clearing_context_s, __pyx_v_context};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_4, 2+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 548, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+  } else
+  #endif
+  {
+    __pyx_t_5 = PyTuple_New(2+__pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 548, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    if (__pyx_t_2) {
+      __Pyx_GIVEREF(__pyx_t_2); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_2); __pyx_t_2 = NULL;
+    }
+    __Pyx_INCREF(__pyx_kp_u_Clearing_context_s);
+    __Pyx_GIVEREF(__pyx_kp_u_Clearing_context_s);
+    PyTuple_SET_ITEM(__pyx_t_5, 0+__pyx_t_4, __pyx_kp_u_Clearing_context_s);
+    __Pyx_INCREF(__pyx_v_context);
+    __Pyx_GIVEREF(__pyx_v_context);
+    PyTuple_SET_ITEM(__pyx_t_5, 1+__pyx_t_4, __pyx_v_context);
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 548, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":550
+ *         self.log.debug("Clearing context %s", context)
+ * 
+ *         if self._current_playlist.context == context:             # <<<<<<<<<<<<<<
+ *             self.stop()
  * 
  */
-  __pyx_t_2 = (__pyx_v_sound_instance == Py_None);
-  __pyx_t_3 = (__pyx_t_2 != 0);
-  if (!__pyx_t_3) {
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 550, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_context); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 550, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyObject_RichCompare(__pyx_t_3, __pyx_v_context, Py_EQ); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 550, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(0, 550, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (__pyx_t_6) {
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":551
+ * 
+ *         if self._current_playlist.context == context:
+ *             self.stop()             # <<<<<<<<<<<<<<
+ * 
+ *         # Also need to check if there is a pending request to play another playlist with
+ */
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_stop); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 551, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_5 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    if (__pyx_t_5) {
+      __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 551, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    } else {
+      __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 551, __pyx_L1_error)
+    }
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":550
+ *         self.log.debug("Clearing context %s", context)
+ * 
+ *         if self._current_playlist.context == context:             # <<<<<<<<<<<<<<
+ *             self.stop()
+ * 
+ */
+  }
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":555
+ *         # Also need to check if there is a pending request to play another playlist with
+ *         # the specified context.  If so, delete the pending request.
+ *         if self._pending_request and "context" in self._pending_request.keywords and \             # <<<<<<<<<<<<<<
+ *                 self._pending_request.keywords["context"] == context:
+ *             self._pending_request = None
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_pending_request); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 555, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_7 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_7 < 0)) __PYX_ERR(0, 555, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (__pyx_t_7) {
+  } else {
+    __pyx_t_6 = __pyx_t_7;
+    goto __pyx_L5_bool_binop_done;
+  }
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_pending_request); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 555, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_keywords); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 555, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_7 = (__Pyx_PySequence_ContainsTF(__pyx_n_u_context, __pyx_t_3, Py_EQ)); if (unlikely(__pyx_t_7 < 0)) __PYX_ERR(0, 555, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_8 = (__pyx_t_7 != 0);
+  if (__pyx_t_8) {
   } else {
-    __pyx_t_1 = __pyx_t_3;
-    goto __pyx_L4_bool_binop_done;
+    __pyx_t_6 = __pyx_t_8;
+    goto __pyx_L5_bool_binop_done;
   }
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_playlists_by_sound_instance); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 262, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_3 = (__Pyx_PySequence_ContainsTF(__pyx_v_sound_instance, __pyx_t_4, Py_NE)); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 262, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_2 = (__pyx_t_3 != 0);
-  __pyx_t_1 = __pyx_t_2;
-  __pyx_L4_bool_binop_done:;
-  if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":263
- * 
- *         if sound_instance is None or sound_instance not in self._playlists_by_sound_instance:
- *             return             # <<<<<<<<<<<<<<
- * 
- *         # Get playlist for sound_instance and remove it from dictionary of active sounds
+  /* "mpfmc/core/audio/playlist_controller.pyx":556
+ *         # the specified context.  If so, delete the pending request.
+ *         if self._pending_request and "context" in self._pending_request.keywords and \
+ *                 self._pending_request.keywords["context"] == context:             # <<<<<<<<<<<<<<
+ *             self._pending_request = None
  */
-    __Pyx_XDECREF(__pyx_r);
-    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-    goto __pyx_L0;
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_pending_request); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 556, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_keywords); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 556, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = PyObject_GetItem(__pyx_t_1, __pyx_n_u_context); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 556, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyObject_RichCompare(__pyx_t_3, __pyx_v_context, Py_EQ); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 556, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_8 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_8 < 0)) __PYX_ERR(0, 556, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_6 = __pyx_t_8;
+  __pyx_L5_bool_binop_done:;
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":262
- *         """Callback function called whenever a playlist sound has finished playing."""
- * 
- *         if sound_instance is None or sound_instance not in self._playlists_by_sound_instance:             # <<<<<<<<<<<<<<
- *             return
- * 
+  /* "mpfmc/core/audio/playlist_controller.pyx":555
+ *         # Also need to check if there is a pending request to play another playlist with
+ *         # the specified context.  If so, delete the pending request.
+ *         if self._pending_request and "context" in self._pending_request.keywords and \             # <<<<<<<<<<<<<<
+ *                 self._pending_request.keywords["context"] == context:
+ *             self._pending_request = None
+ */
+  if (__pyx_t_6) {
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":557
+ *         if self._pending_request and "context" in self._pending_request.keywords and \
+ *                 self._pending_request.keywords["context"] == context:
+ *             self._pending_request = None             # <<<<<<<<<<<<<<
+ */
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_pending_request, Py_None) < 0) __PYX_ERR(0, 557, __pyx_L1_error)
+
+    /* "mpfmc/core/audio/playlist_controller.pyx":555
+ *         # Also need to check if there is a pending request to play another playlist with
+ *         # the specified context.  If so, delete the pending request.
+ *         if self._pending_request and "context" in self._pending_request.keywords and \             # <<<<<<<<<<<<<<
+ *                 self._pending_request.keywords["context"] == context:
+ *             self._pending_request = None
  */
   }
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":266
- * 
- *         # Get playlist for sound_instance and remove it from dictionary of active sounds
- *         playlist = self._playlists_by_sound_instance[sound_instance]             # <<<<<<<<<<<<<<
- *         del self._playlists_by_sound_instance[sound_instance]
+  /* "mpfmc/core/audio/playlist_controller.pyx":541
+ *         self.advance()
  * 
+ *     def clear_context(self, context):             # <<<<<<<<<<<<<<
+ *         """
+ *         Stops the current playlist if it was played from the specified context.
  */
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_playlists_by_sound_instance); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 266, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = PyObject_GetItem(__pyx_t_4, __pyx_v_sound_instance); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 266, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_v_playlist = __pyx_t_5;
-  __pyx_t_5 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":267
- *         # Get playlist for sound_instance and remove it from dictionary of active sounds
- *         playlist = self._playlists_by_sound_instance[sound_instance]
- *         del self._playlists_by_sound_instance[sound_instance]             # <<<<<<<<<<<<<<
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController.clear_context", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/dsp.pxd":74
+ * # ---------------------------------------------------------------------------
  * 
- *         if playlist.current_sound_instance == sound_instance:
+ * cdef inline void process_biquad(BiquadSettings *biquad, float *buffer, Uint32 frames, int channels) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Applies a biquad filter to a block of interleaved samples.
  */
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_playlists_by_sound_instance); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 267, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  if (unlikely(PyObject_DelItem(__pyx_t_5, __pyx_v_sound_instance) < 0)) __PYX_ERR(0, 267, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":269
- *         del self._playlists_by_sound_instance[sound_instance]
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_3dsp_process_biquad(__pyx_t_5mpfmc_4core_5audio_3dsp_BiquadSettings *__pyx_v_biquad, float *__pyx_v_buffer, Uint32 __pyx_v_frames, int __pyx_v_channels) {
+  CYTHON_UNUSED Uint32 __pyx_v_frame;
+  int __pyx_v_channel;
+  float __pyx_v_x;
+  float __pyx_v_y;
+  float *__pyx_v_sample;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  Uint32 __pyx_t_3;
+  Uint32 __pyx_t_4;
+
+  /* "mpfmc/core/audio/dsp.pxd":88
+ *     cdef float *sample
  * 
- *         if playlist.current_sound_instance == sound_instance:             # <<<<<<<<<<<<<<
- *             playlist.current_sound_instance = None
- *         if playlist.fading_sound_instance == sound_instance:
+ *     for channel in range(channels):             # <<<<<<<<<<<<<<
+ *         sample = buffer + channel
+ *         for frame in range(frames):
  */
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_playlist, __pyx_n_s_current_sound_instance); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 269, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_4 = PyObject_RichCompare(__pyx_t_5, __pyx_v_sound_instance, Py_EQ); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 269, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_1 < 0)) __PYX_ERR(0, 269, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (__pyx_t_1) {
+  __pyx_t_1 = __pyx_v_channels;
+  for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
+    __pyx_v_channel = __pyx_t_2;
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":270
+    /* "mpfmc/core/audio/dsp.pxd":89
  * 
- *         if playlist.current_sound_instance == sound_instance:
- *             playlist.current_sound_instance = None             # <<<<<<<<<<<<<<
- *         if playlist.fading_sound_instance == sound_instance:
- *             playlist.fading_sound_instance = None
+ *     for channel in range(channels):
+ *         sample = buffer + channel             # <<<<<<<<<<<<<<
+ *         for frame in range(frames):
+ *             x = sample[0]
  */
-    if (__Pyx_PyObject_SetAttrStr(__pyx_v_playlist, __pyx_n_s_current_sound_instance, Py_None) < 0) __PYX_ERR(0, 270, __pyx_L1_error)
+    __pyx_v_sample = (__pyx_v_buffer + __pyx_v_channel);
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":269
- *         del self._playlists_by_sound_instance[sound_instance]
- * 
- *         if playlist.current_sound_instance == sound_instance:             # <<<<<<<<<<<<<<
- *             playlist.current_sound_instance = None
- *         if playlist.fading_sound_instance == sound_instance:
+    /* "mpfmc/core/audio/dsp.pxd":90
+ *     for channel in range(channels):
+ *         sample = buffer + channel
+ *         for frame in range(frames):             # <<<<<<<<<<<<<<
+ *             x = sample[0]
+ *             y = biquad.b0 * x + biquad.z1[channel]
  */
-  }
+    __pyx_t_3 = __pyx_v_frames;
+    for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+      __pyx_v_frame = __pyx_t_4;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":271
- *         if playlist.current_sound_instance == sound_instance:
- *             playlist.current_sound_instance = None
- *         if playlist.fading_sound_instance == sound_instance:             # <<<<<<<<<<<<<<
- *             playlist.fading_sound_instance = None
- * 
+      /* "mpfmc/core/audio/dsp.pxd":91
+ *         sample = buffer + channel
+ *         for frame in range(frames):
+ *             x = sample[0]             # <<<<<<<<<<<<<<
+ *             y = biquad.b0 * x + biquad.z1[channel]
+ *             biquad.z1[channel] = biquad.b1 * x - biquad.a1 * y + biquad.z2[channel]
  */
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_playlist, __pyx_n_s_fading_sound_instance); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 271, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = PyObject_RichCompare(__pyx_t_4, __pyx_v_sound_instance, Py_EQ); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 271, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_1 < 0)) __PYX_ERR(0, 271, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  if (__pyx_t_1) {
+      __pyx_v_x = (__pyx_v_sample[0]);
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":272
- *             playlist.current_sound_instance = None
- *         if playlist.fading_sound_instance == sound_instance:
- *             playlist.fading_sound_instance = None             # <<<<<<<<<<<<<<
- * 
- *         # Post events when sound stopped for playlist
+      /* "mpfmc/core/audio/dsp.pxd":92
+ *         for frame in range(frames):
+ *             x = sample[0]
+ *             y = biquad.b0 * x + biquad.z1[channel]             # <<<<<<<<<<<<<<
+ *             biquad.z1[channel] = biquad.b1 * x - biquad.a1 * y + biquad.z2[channel]
+ *             biquad.z2[channel] = biquad.b2 * x - biquad.a2 * y
  */
-    if (__Pyx_PyObject_SetAttrStr(__pyx_v_playlist, __pyx_n_s_fading_sound_instance, Py_None) < 0) __PYX_ERR(0, 272, __pyx_L1_error)
+      __pyx_v_y = ((__pyx_v_biquad->b0 * __pyx_v_x) + (__pyx_v_biquad->z1[__pyx_v_channel]));
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":271
- *         if playlist.current_sound_instance == sound_instance:
- *             playlist.current_sound_instance = None
- *         if playlist.fading_sound_instance == sound_instance:             # <<<<<<<<<<<<<<
- *             playlist.fading_sound_instance = None
- * 
+      /* "mpfmc/core/audio/dsp.pxd":93
+ *             x = sample[0]
+ *             y = biquad.b0 * x + biquad.z1[channel]
+ *             biquad.z1[channel] = biquad.b1 * x - biquad.a1 * y + biquad.z2[channel]             # <<<<<<<<<<<<<<
+ *             biquad.z2[channel] = biquad.b2 * x - biquad.a2 * y
+ *             sample[0] = y
  */
-  }
+      (__pyx_v_biquad->z1[__pyx_v_channel]) = (((__pyx_v_biquad->b1 * __pyx_v_x) - (__pyx_v_biquad->a1 * __pyx_v_y)) + (__pyx_v_biquad->z2[__pyx_v_channel]));
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":275
- * 
- *         # Post events when sound stopped for playlist
- *         for event in playlist.events_when_sound_stopped:             # <<<<<<<<<<<<<<
- *             self.mc.post_mc_native_event(event)
- * 
+      /* "mpfmc/core/audio/dsp.pxd":94
+ *             y = biquad.b0 * x + biquad.z1[channel]
+ *             biquad.z1[channel] = biquad.b1 * x - biquad.a1 * y + biquad.z2[channel]
+ *             biquad.z2[channel] = biquad.b2 * x - biquad.a2 * y             # <<<<<<<<<<<<<<
+ *             sample[0] = y
+ *             sample += channels
  */
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_playlist, __pyx_n_s_events_when_sound_stopped); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 275, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  if (likely(PyList_CheckExact(__pyx_t_5)) || PyTuple_CheckExact(__pyx_t_5)) {
-    __pyx_t_4 = __pyx_t_5; __Pyx_INCREF(__pyx_t_4); __pyx_t_6 = 0;
-    __pyx_t_7 = NULL;
-  } else {
-    __pyx_t_6 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 275, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_7 = Py_TYPE(__pyx_t_4)->tp_iternext; if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 275, __pyx_L1_error)
-  }
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  for (;;) {
-    if (likely(!__pyx_t_7)) {
-      if (likely(PyList_CheckExact(__pyx_t_4))) {
-        if (__pyx_t_6 >= PyList_GET_SIZE(__pyx_t_4)) break;
-        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_5 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_6); __Pyx_INCREF(__pyx_t_5); __pyx_t_6++; if (unlikely(0 < 0)) __PYX_ERR(0, 275, __pyx_L1_error)
-        #else
-        __pyx_t_5 = PySequence_ITEM(__pyx_t_4, __pyx_t_6); __pyx_t_6++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 275, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_5);
-        #endif
-      } else {
-        if (__pyx_t_6 >= PyTuple_GET_SIZE(__pyx_t_4)) break;
-        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_5 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_6); __Pyx_INCREF(__pyx_t_5); __pyx_t_6++; if (unlikely(0 < 0)) __PYX_ERR(0, 275, __pyx_L1_error)
-        #else
-        __pyx_t_5 = PySequence_ITEM(__pyx_t_4, __pyx_t_6); __pyx_t_6++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 275, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_5);
-        #endif
-      }
-    } else {
-      __pyx_t_5 = __pyx_t_7(__pyx_t_4);
-      if (unlikely(!__pyx_t_5)) {
-        PyObject* exc_type = PyErr_Occurred();
-        if (exc_type) {
-          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-          else __PYX_ERR(0, 275, __pyx_L1_error)
-        }
-        break;
-      }
-      __Pyx_GOTREF(__pyx_t_5);
-    }
-    __Pyx_XDECREF_SET(__pyx_v_event, __pyx_t_5);
-    __pyx_t_5 = 0;
+      (__pyx_v_biquad->z2[__pyx_v_channel]) = ((__pyx_v_biquad->b2 * __pyx_v_x) - (__pyx_v_biquad->a2 * __pyx_v_y));
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":276
- *         # Post events when sound stopped for playlist
- *         for event in playlist.events_when_sound_stopped:
- *             self.mc.post_mc_native_event(event)             # <<<<<<<<<<<<<<
+      /* "mpfmc/core/audio/dsp.pxd":95
+ *             biquad.z1[channel] = biquad.b1 * x - biquad.a1 * y + biquad.z2[channel]
+ *             biquad.z2[channel] = biquad.b2 * x - biquad.a2 * y
+ *             sample[0] = y             # <<<<<<<<<<<<<<
+ *             sample += channels
  * 
- *         # Playlist is finished when last sound instance of playlist has completed
  */
-    __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_mc); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 276, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_8);
-    __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_n_s_post_mc_native_event); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 276, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_9);
-    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-    __pyx_t_8 = NULL;
-    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
-      __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_9);
-      if (likely(__pyx_t_8)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
-        __Pyx_INCREF(__pyx_t_8);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_9, function);
-      }
-    }
-    if (!__pyx_t_8) {
-      __pyx_t_5 = __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_v_event); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 276, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_5);
-    } else {
-      #if CYTHON_FAST_PYCALL
-      if (PyFunction_Check(__pyx_t_9)) {
-        PyObject *__pyx_temp[2] = {__pyx_t_8, __pyx_v_event};
-        __pyx_t_5 = __Pyx_PyFunction_FastCall(__pyx_t_9, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 276, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-        __Pyx_GOTREF(__pyx_t_5);
-      } else
-      #endif
-      #if CYTHON_FAST_PYCCALL
-      if (__Pyx_PyFastCFunction_Check(__pyx_t_9)) {
-        PyObject *__pyx_temp[2] = {__pyx_t_8, __pyx_v_event};
-        __pyx_t_5 = __Pyx_PyCFunction_FastCall(__pyx_t_9, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 276, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-        __Pyx_GOTREF(__pyx_t_5);
-      } else
-      #endif
-      {
-        __pyx_t_10 = PyTuple_New(1+1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 276, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_10);
-        __Pyx_GIVEREF(__pyx_t_8); PyTuple_SET_ITEM(__pyx_t_10, 0, __pyx_t_8); __pyx_t_8 = NULL;
-        __Pyx_INCREF(__pyx_v_event);
-        __Pyx_GIVEREF(__pyx_v_event);
-        PyTuple_SET_ITEM(__pyx_t_10, 0+1, __pyx_v_event);
-        __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_9, __pyx_t_10, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 276, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_5);
-        __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
-      }
-    }
-    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      (__pyx_v_sample[0]) = __pyx_v_y;
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":275
- * 
- *         # Post events when sound stopped for playlist
- *         for event in playlist.events_when_sound_stopped:             # <<<<<<<<<<<<<<
- *             self.mc.post_mc_native_event(event)
+      /* "mpfmc/core/audio/dsp.pxd":96
+ *             biquad.z2[channel] = biquad.b2 * x - biquad.a2 * y
+ *             sample[0] = y
+ *             sample += channels             # <<<<<<<<<<<<<<
  * 
+ * cdef inline void process_limiter(LimiterSettings *limiter, float *buffer, Uint32 frames, int channels) nogil:
  */
+      __pyx_v_sample = (__pyx_v_sample + __pyx_v_channels);
+    }
   }
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":279
- * 
- *         # Playlist is finished when last sound instance of playlist has completed
- *         if playlist not in self._playlists_by_sound_instance.values():             # <<<<<<<<<<<<<<
+  /* "mpfmc/core/audio/dsp.pxd":74
+ * # ---------------------------------------------------------------------------
  * 
- *             # Playlist has stopped
+ * cdef inline void process_biquad(BiquadSettings *biquad, float *buffer, Uint32 frames, int channels) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Applies a biquad filter to a block of interleaved samples.
  */
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_playlists_by_sound_instance); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 279, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_values); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 279, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_9);
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = NULL;
-  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
-    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_9);
-    if (likely(__pyx_t_5)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
-      __Pyx_INCREF(__pyx_t_5);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_9, function);
-    }
-  }
-  if (__pyx_t_5) {
-    __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 279, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  } else {
-    __pyx_t_4 = __Pyx_PyObject_CallNoArg(__pyx_t_9); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 279, __pyx_L1_error)
-  }
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-  __pyx_t_1 = (__Pyx_PySequence_ContainsTF(__pyx_v_playlist, __pyx_t_4, Py_NE)); if (unlikely(__pyx_t_1 < 0)) __PYX_ERR(0, 279, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_2 = (__pyx_t_1 != 0);
-  if (__pyx_t_2) {
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":284
+  /* function exit code */
+}
+
+/* "mpfmc/core/audio/dsp.pxd":98
+ *             sample += channels
+ * 
+ * cdef inline void process_limiter(LimiterSettings *limiter, float *buffer, Uint32 frames, int channels) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Applies a peak limiter to a block of interleaved samples.
+ */
+
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_3dsp_process_limiter(__pyx_t_5mpfmc_4core_5audio_3dsp_LimiterSettings *__pyx_v_limiter, float *__pyx_v_buffer, Uint32 __pyx_v_frames, int __pyx_v_channels) {
+  CYTHON_UNUSED Uint32 __pyx_v_frame;
+  int __pyx_v_channel;
+  float __pyx_v_peak;
+  float __pyx_v_value;
+  float __pyx_v_target_gain;
+  float *__pyx_v_sample;
+  Uint32 __pyx_t_1;
+  Uint32 __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  float __pyx_t_5;
+  int __pyx_t_6;
+  double __pyx_t_7;
+  int __pyx_t_8;
+
+  /* "mpfmc/core/audio/dsp.pxd":110
+ *     cdef int channel
+ *     cdef float peak, value, target_gain
+ *     cdef float *sample = buffer             # <<<<<<<<<<<<<<
  * 
- *             # Trigger any stopped events
- *             if playlist.events_when_stopped is not None:             # <<<<<<<<<<<<<<
- *                 for event in playlist.events_when_stopped:
- *                     self.mc.post_mc_native_event(event)
+ *     for frame in range(frames):
  */
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_playlist, __pyx_n_s_events_when_stopped); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 284, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_2 = (__pyx_t_4 != Py_None);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_1 = (__pyx_t_2 != 0);
-    if (__pyx_t_1) {
+  __pyx_v_sample = __pyx_v_buffer;
 
-      /* "mpfmc/core/audio/playlist_controller.pyx":285
- *             # Trigger any stopped events
- *             if playlist.events_when_stopped is not None:
- *                 for event in playlist.events_when_stopped:             # <<<<<<<<<<<<<<
- *                     self.mc.post_mc_native_event(event)
+  /* "mpfmc/core/audio/dsp.pxd":112
+ *     cdef float *sample = buffer
  * 
+ *     for frame in range(frames):             # <<<<<<<<<<<<<<
+ *         peak = 0.0
+ *         for channel in range(channels):
  */
-      __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_playlist, __pyx_n_s_events_when_stopped); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 285, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_4);
-      if (likely(PyList_CheckExact(__pyx_t_4)) || PyTuple_CheckExact(__pyx_t_4)) {
-        __pyx_t_9 = __pyx_t_4; __Pyx_INCREF(__pyx_t_9); __pyx_t_6 = 0;
-        __pyx_t_7 = NULL;
-      } else {
-        __pyx_t_6 = -1; __pyx_t_9 = PyObject_GetIter(__pyx_t_4); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 285, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_9);
-        __pyx_t_7 = Py_TYPE(__pyx_t_9)->tp_iternext; if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 285, __pyx_L1_error)
-      }
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      for (;;) {
-        if (likely(!__pyx_t_7)) {
-          if (likely(PyList_CheckExact(__pyx_t_9))) {
-            if (__pyx_t_6 >= PyList_GET_SIZE(__pyx_t_9)) break;
-            #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-            __pyx_t_4 = PyList_GET_ITEM(__pyx_t_9, __pyx_t_6); __Pyx_INCREF(__pyx_t_4); __pyx_t_6++; if (unlikely(0 < 0)) __PYX_ERR(0, 285, __pyx_L1_error)
-            #else
-            __pyx_t_4 = PySequence_ITEM(__pyx_t_9, __pyx_t_6); __pyx_t_6++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 285, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_4);
-            #endif
-          } else {
-            if (__pyx_t_6 >= PyTuple_GET_SIZE(__pyx_t_9)) break;
-            #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-            __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_9, __pyx_t_6); __Pyx_INCREF(__pyx_t_4); __pyx_t_6++; if (unlikely(0 < 0)) __PYX_ERR(0, 285, __pyx_L1_error)
-            #else
-            __pyx_t_4 = PySequence_ITEM(__pyx_t_9, __pyx_t_6); __pyx_t_6++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 285, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_4);
-            #endif
-          }
-        } else {
-          __pyx_t_4 = __pyx_t_7(__pyx_t_9);
-          if (unlikely(!__pyx_t_4)) {
-            PyObject* exc_type = PyErr_Occurred();
-            if (exc_type) {
-              if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-              else __PYX_ERR(0, 285, __pyx_L1_error)
-            }
-            break;
-          }
-          __Pyx_GOTREF(__pyx_t_4);
-        }
-        __Pyx_XDECREF_SET(__pyx_v_event, __pyx_t_4);
-        __pyx_t_4 = 0;
+  __pyx_t_1 = __pyx_v_frames;
+  for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
+    __pyx_v_frame = __pyx_t_2;
 
-        /* "mpfmc/core/audio/playlist_controller.pyx":286
- *             if playlist.events_when_stopped is not None:
- *                 for event in playlist.events_when_stopped:
- *                     self.mc.post_mc_native_event(event)             # <<<<<<<<<<<<<<
+    /* "mpfmc/core/audio/dsp.pxd":113
  * 
- *             if playlist == self._current_playlist:
+ *     for frame in range(frames):
+ *         peak = 0.0             # <<<<<<<<<<<<<<
+ *         for channel in range(channels):
+ *             value = sample[channel] if sample[channel] >= 0.0 else -sample[channel]
  */
-        __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_mc); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 286, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_5);
-        __pyx_t_10 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_post_mc_native_event); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 286, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_10);
-        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-        __pyx_t_5 = NULL;
-        if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_10))) {
-          __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_10);
-          if (likely(__pyx_t_5)) {
-            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_10);
-            __Pyx_INCREF(__pyx_t_5);
-            __Pyx_INCREF(function);
-            __Pyx_DECREF_SET(__pyx_t_10, function);
-          }
-        }
-        if (!__pyx_t_5) {
-          __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_t_10, __pyx_v_event); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 286, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_4);
-        } else {
-          #if CYTHON_FAST_PYCALL
-          if (PyFunction_Check(__pyx_t_10)) {
-            PyObject *__pyx_temp[2] = {__pyx_t_5, __pyx_v_event};
-            __pyx_t_4 = __Pyx_PyFunction_FastCall(__pyx_t_10, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 286, __pyx_L1_error)
-            __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-            __Pyx_GOTREF(__pyx_t_4);
-          } else
-          #endif
-          #if CYTHON_FAST_PYCCALL
-          if (__Pyx_PyFastCFunction_Check(__pyx_t_10)) {
-            PyObject *__pyx_temp[2] = {__pyx_t_5, __pyx_v_event};
-            __pyx_t_4 = __Pyx_PyCFunction_FastCall(__pyx_t_10, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 286, __pyx_L1_error)
-            __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-            __Pyx_GOTREF(__pyx_t_4);
-          } else
-          #endif
-          {
-            __pyx_t_8 = PyTuple_New(1+1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 286, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_8);
-            __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_5); __pyx_t_5 = NULL;
-            __Pyx_INCREF(__pyx_v_event);
-            __Pyx_GIVEREF(__pyx_v_event);
-            PyTuple_SET_ITEM(__pyx_t_8, 0+1, __pyx_v_event);
-            __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_10, __pyx_t_8, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 286, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_4);
-            __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-          }
-        }
-        __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_v_peak = 0.0;
 
-        /* "mpfmc/core/audio/playlist_controller.pyx":285
- *             # Trigger any stopped events
- *             if playlist.events_when_stopped is not None:
- *                 for event in playlist.events_when_stopped:             # <<<<<<<<<<<<<<
- *                     self.mc.post_mc_native_event(event)
- * 
+    /* "mpfmc/core/audio/dsp.pxd":114
+ *     for frame in range(frames):
+ *         peak = 0.0
+ *         for channel in range(channels):             # <<<<<<<<<<<<<<
+ *             value = sample[channel] if sample[channel] >= 0.0 else -sample[channel]
+ *             if value > peak:
  */
+    __pyx_t_3 = __pyx_v_channels;
+    for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+      __pyx_v_channel = __pyx_t_4;
+
+      /* "mpfmc/core/audio/dsp.pxd":115
+ *         peak = 0.0
+ *         for channel in range(channels):
+ *             value = sample[channel] if sample[channel] >= 0.0 else -sample[channel]             # <<<<<<<<<<<<<<
+ *             if value > peak:
+ *                 peak = value
+ */
+      if ((((__pyx_v_sample[__pyx_v_channel]) >= 0.0) != 0)) {
+        __pyx_t_5 = (__pyx_v_sample[__pyx_v_channel]);
+      } else {
+        __pyx_t_5 = (-(__pyx_v_sample[__pyx_v_channel]));
       }
-      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __pyx_v_value = __pyx_t_5;
 
-      /* "mpfmc/core/audio/playlist_controller.pyx":284
+      /* "mpfmc/core/audio/dsp.pxd":116
+ *         for channel in range(channels):
+ *             value = sample[channel] if sample[channel] >= 0.0 else -sample[channel]
+ *             if value > peak:             # <<<<<<<<<<<<<<
+ *                 peak = value
  * 
- *             # Trigger any stopped events
- *             if playlist.events_when_stopped is not None:             # <<<<<<<<<<<<<<
- *                 for event in playlist.events_when_stopped:
- *                     self.mc.post_mc_native_event(event)
  */
-    }
+      __pyx_t_6 = ((__pyx_v_value > __pyx_v_peak) != 0);
+      if (__pyx_t_6) {
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":288
- *                     self.mc.post_mc_native_event(event)
- * 
- *             if playlist == self._current_playlist:             # <<<<<<<<<<<<<<
- *                 self._current_playlist = None
+        /* "mpfmc/core/audio/dsp.pxd":117
+ *             value = sample[channel] if sample[channel] >= 0.0 else -sample[channel]
+ *             if value > peak:
+ *                 peak = value             # <<<<<<<<<<<<<<
  * 
+ *         # Attack is instantaneous, release is exponential
  */
-    __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 288, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_9);
-    __pyx_t_4 = PyObject_RichCompare(__pyx_v_playlist, __pyx_t_9, Py_EQ); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 288, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-    __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_1 < 0)) __PYX_ERR(0, 288, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (__pyx_t_1) {
+        __pyx_v_peak = __pyx_v_value;
 
-      /* "mpfmc/core/audio/playlist_controller.pyx":289
- * 
- *             if playlist == self._current_playlist:
- *                 self._current_playlist = None             # <<<<<<<<<<<<<<
+        /* "mpfmc/core/audio/dsp.pxd":116
+ *         for channel in range(channels):
+ *             value = sample[channel] if sample[channel] >= 0.0 else -sample[channel]
+ *             if value > peak:             # <<<<<<<<<<<<<<
+ *                 peak = value
  * 
- *         # Service any pending request (play, advance)
  */
-      if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist, Py_None) < 0) __PYX_ERR(0, 289, __pyx_L1_error)
+      }
+    }
 
-      /* "mpfmc/core/audio/playlist_controller.pyx":288
- *                     self.mc.post_mc_native_event(event)
- * 
- *             if playlist == self._current_playlist:             # <<<<<<<<<<<<<<
- *                 self._current_playlist = None
+    /* "mpfmc/core/audio/dsp.pxd":120
  * 
+ *         # Attack is instantaneous, release is exponential
+ *         target_gain = limiter.threshold / peak if peak > limiter.threshold else 1.0             # <<<<<<<<<<<<<<
+ *         if target_gain < limiter.gain:
+ *             limiter.gain = target_gain
  */
+    if (((__pyx_v_peak > __pyx_v_limiter->threshold) != 0)) {
+      if (unlikely(__pyx_v_peak == 0)) {
+        #ifdef WITH_THREAD
+        PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+        #endif
+        PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+        #ifdef WITH_THREAD
+        __Pyx_PyGILState_Release(__pyx_gilstate_save);
+        #endif
+        __PYX_ERR(1, 120, __pyx_L1_error)
+      }
+      __pyx_t_7 = (__pyx_v_limiter->threshold / __pyx_v_peak);
+    } else {
+      __pyx_t_7 = 1.0;
     }
+    __pyx_v_target_gain = __pyx_t_7;
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":279
- * 
- *         # Playlist is finished when last sound instance of playlist has completed
- *         if playlist not in self._playlists_by_sound_instance.values():             # <<<<<<<<<<<<<<
- * 
- *             # Playlist has stopped
+    /* "mpfmc/core/audio/dsp.pxd":121
+ *         # Attack is instantaneous, release is exponential
+ *         target_gain = limiter.threshold / peak if peak > limiter.threshold else 1.0
+ *         if target_gain < limiter.gain:             # <<<<<<<<<<<<<<
+ *             limiter.gain = target_gain
+ *         else:
  */
-  }
+    __pyx_t_6 = ((__pyx_v_target_gain < __pyx_v_limiter->gain) != 0);
+    if (__pyx_t_6) {
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":292
- * 
- *         # Service any pending request (play, advance)
- *         if self._pending_request:             # <<<<<<<<<<<<<<
- *             request = self._pending_request
- *             self._pending_request = None
+      /* "mpfmc/core/audio/dsp.pxd":122
+ *         target_gain = limiter.threshold / peak if peak > limiter.threshold else 1.0
+ *         if target_gain < limiter.gain:
+ *             limiter.gain = target_gain             # <<<<<<<<<<<<<<
+ *         else:
+ *             limiter.gain = target_gain + (limiter.gain - target_gain) * limiter.release_coefficient
  */
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_pending_request); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 292, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_1 < 0)) __PYX_ERR(0, 292, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (__pyx_t_1) {
+      __pyx_v_limiter->gain = __pyx_v_target_gain;
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":293
- *         # Service any pending request (play, advance)
- *         if self._pending_request:
- *             request = self._pending_request             # <<<<<<<<<<<<<<
- *             self._pending_request = None
- *             request()
+      /* "mpfmc/core/audio/dsp.pxd":121
+ *         # Attack is instantaneous, release is exponential
+ *         target_gain = limiter.threshold / peak if peak > limiter.threshold else 1.0
+ *         if target_gain < limiter.gain:             # <<<<<<<<<<<<<<
+ *             limiter.gain = target_gain
+ *         else:
  */
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_pending_request); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 293, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_v_request = __pyx_t_4;
-    __pyx_t_4 = 0;
+      goto __pyx_L8;
+    }
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":294
- *         if self._pending_request:
- *             request = self._pending_request
- *             self._pending_request = None             # <<<<<<<<<<<<<<
- *             request()
+    /* "mpfmc/core/audio/dsp.pxd":124
+ *             limiter.gain = target_gain
+ *         else:
+ *             limiter.gain = target_gain + (limiter.gain - target_gain) * limiter.release_coefficient             # <<<<<<<<<<<<<<
  * 
+ *         for channel in range(channels):
  */
-    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_pending_request, Py_None) < 0) __PYX_ERR(0, 294, __pyx_L1_error)
+    /*else*/ {
+      __pyx_v_limiter->gain = (__pyx_v_target_gain + ((__pyx_v_limiter->gain - __pyx_v_target_gain) * __pyx_v_limiter->release_coefficient));
+    }
+    __pyx_L8:;
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":295
- *             request = self._pending_request
- *             self._pending_request = None
- *             request()             # <<<<<<<<<<<<<<
+    /* "mpfmc/core/audio/dsp.pxd":126
+ *             limiter.gain = target_gain + (limiter.gain - target_gain) * limiter.release_coefficient
  * 
- *     def _on_sound_instance_about_to_finish(self, sound_instance=None, **kwargs):
+ *         for channel in range(channels):             # <<<<<<<<<<<<<<
+ *             sample[channel] *= limiter.gain
+ *         sample += channels
  */
-    __Pyx_INCREF(__pyx_v_request);
-    __pyx_t_9 = __pyx_v_request; __pyx_t_10 = NULL;
-    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
-      __pyx_t_10 = PyMethod_GET_SELF(__pyx_t_9);
-      if (likely(__pyx_t_10)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
-        __Pyx_INCREF(__pyx_t_10);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_9, function);
-      }
-    }
-    if (__pyx_t_10) {
-      __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_t_10); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 295, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
-    } else {
-      __pyx_t_4 = __Pyx_PyObject_CallNoArg(__pyx_t_9); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 295, __pyx_L1_error)
+    __pyx_t_3 = __pyx_v_channels;
+    for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+      __pyx_v_channel = __pyx_t_4;
+
+      /* "mpfmc/core/audio/dsp.pxd":127
+ * 
+ *         for channel in range(channels):
+ *             sample[channel] *= limiter.gain             # <<<<<<<<<<<<<<
+ *         sample += channels
+ * 
+ */
+      __pyx_t_8 = __pyx_v_channel;
+      (__pyx_v_sample[__pyx_t_8]) = ((__pyx_v_sample[__pyx_t_8]) * __pyx_v_limiter->gain);
     }
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":292
+    /* "mpfmc/core/audio/dsp.pxd":128
+ *         for channel in range(channels):
+ *             sample[channel] *= limiter.gain
+ *         sample += channels             # <<<<<<<<<<<<<<
  * 
- *         # Service any pending request (play, advance)
- *         if self._pending_request:             # <<<<<<<<<<<<<<
- *             request = self._pending_request
- *             self._pending_request = None
+ * cdef inline void process_reverb(ReverbSettings *reverb, float *buffer, Uint32 frames, int channels) nogil:
  */
+    __pyx_v_sample = (__pyx_v_sample + __pyx_v_channels);
   }
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":259
- *                            "Could not set repeat to {}.", str(repeat))
- * 
- *     def _on_sound_instance_stopped(self, sound_instance=None, **kwargs):             # <<<<<<<<<<<<<<
- *         """Callback function called whenever a playlist sound has finished playing."""
+  /* "mpfmc/core/audio/dsp.pxd":98
+ *             sample += channels
  * 
+ * cdef inline void process_limiter(LimiterSettings *limiter, float *buffer, Uint32 frames, int channels) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Applies a peak limiter to a block of interleaved samples.
  */
 
   /* function exit code */
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_XDECREF(__pyx_t_9);
-  __Pyx_XDECREF(__pyx_t_10);
-  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController._on_sound_instance_stopped", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
+  __Pyx_WriteUnraisable("mpfmc.core.audio.dsp.process_limiter", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 1);
   __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_playlist);
-  __Pyx_XDECREF(__pyx_v_event);
-  __Pyx_XDECREF(__pyx_v_request);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
 }
 
-/* "mpfmc/core/audio/playlist_controller.pyx":297
- *             request()
+/* "mpfmc/core/audio/dsp.pxd":130
+ *         sample += channels
  * 
- *     def _on_sound_instance_about_to_finish(self, sound_instance=None, **kwargs):             # <<<<<<<<<<<<<<
- *         """Callback function called whenever a playlist sound is about to finish playing."""
+ * cdef inline void process_reverb(ReverbSettings *reverb, float *buffer, Uint32 frames, int channels) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Applies a simple (mono) reverb to a block of interleaved samples.
+ */
+
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_3dsp_process_reverb(__pyx_t_5mpfmc_4core_5audio_3dsp_ReverbSettings *__pyx_v_reverb, float *__pyx_v_buffer, Uint32 __pyx_v_frames, int __pyx_v_channels) {
+  CYTHON_UNUSED Uint32 __pyx_v_frame;
+  int __pyx_v_channel;
+  int __pyx_v_index;
+  float __pyx_v_input_value;
+  float __pyx_v_output_value;
+  float __pyx_v_delayed;
+  float *__pyx_v_sample;
+  Uint32 __pyx_t_1;
+  Uint32 __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+
+  /* "mpfmc/core/audio/dsp.pxd":142
+ *     cdef int channel, index
+ *     cdef float input_value, output_value, delayed
+ *     cdef float *sample = buffer             # <<<<<<<<<<<<<<
  * 
+ *     for frame in range(frames):
  */
+  __pyx_v_sample = __pyx_v_buffer;
 
-/* Python wrapper */
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_31_on_sound_instance_about_to_finish(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_30_on_sound_instance_about_to_finish[] = "PlaylistController._on_sound_instance_about_to_finish(self, sound_instance=None, **kwargs)\nCallback function called whenever a playlist sound is about to finish playing.";
-static PyMethodDef __pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_31_on_sound_instance_about_to_finish = {"_on_sound_instance_about_to_finish", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_31_on_sound_instance_about_to_finish, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_30_on_sound_instance_about_to_finish};
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_31_on_sound_instance_about_to_finish(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_self = 0;
-  PyObject *__pyx_v_sound_instance = 0;
-  CYTHON_UNUSED PyObject *__pyx_v_kwargs = 0;
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("_on_sound_instance_about_to_finish (wrapper)", 0);
-  __pyx_v_kwargs = PyDict_New(); if (unlikely(!__pyx_v_kwargs)) return NULL;
-  __Pyx_GOTREF(__pyx_v_kwargs);
-  {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_sound_instance,0};
-    PyObject* values[2] = {0,0};
-    values[1] = ((PyObject *)((PyObject *)Py_None));
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
-      switch (pos_args) {
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (pos_args) {
-        case  0:
-        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_self)) != 0)) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        CYTHON_FALLTHROUGH;
-        case  1:
-        if (kw_args > 0) {
-          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_sound_instance);
-          if (value) { values[1] = value; kw_args--; }
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, __pyx_v_kwargs, values, pos_args, "_on_sound_instance_about_to_finish") < 0)) __PYX_ERR(0, 297, __pyx_L3_error)
-      }
-    } else {
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        break;
-        default: goto __pyx_L5_argtuple_error;
+  /* "mpfmc/core/audio/dsp.pxd":144
+ *     cdef float *sample = buffer
+ * 
+ *     for frame in range(frames):             # <<<<<<<<<<<<<<
+ *         input_value = 0.0
+ *         for channel in range(channels):
+ */
+  __pyx_t_1 = __pyx_v_frames;
+  for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
+    __pyx_v_frame = __pyx_t_2;
+
+    /* "mpfmc/core/audio/dsp.pxd":145
+ * 
+ *     for frame in range(frames):
+ *         input_value = 0.0             # <<<<<<<<<<<<<<
+ *         for channel in range(channels):
+ *             input_value += sample[channel]
+ */
+    __pyx_v_input_value = 0.0;
+
+    /* "mpfmc/core/audio/dsp.pxd":146
+ *     for frame in range(frames):
+ *         input_value = 0.0
+ *         for channel in range(channels):             # <<<<<<<<<<<<<<
+ *             input_value += sample[channel]
+ *         input_value /= channels
+ */
+    __pyx_t_3 = __pyx_v_channels;
+    for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+      __pyx_v_channel = __pyx_t_4;
+
+      /* "mpfmc/core/audio/dsp.pxd":147
+ *         input_value = 0.0
+ *         for channel in range(channels):
+ *             input_value += sample[channel]             # <<<<<<<<<<<<<<
+ *         input_value /= channels
+ * 
+ */
+      __pyx_v_input_value = (__pyx_v_input_value + (__pyx_v_sample[__pyx_v_channel]));
+    }
+
+    /* "mpfmc/core/audio/dsp.pxd":148
+ *         for channel in range(channels):
+ *             input_value += sample[channel]
+ *         input_value /= channels             # <<<<<<<<<<<<<<
+ * 
+ *         # Parallel damped comb filters
+ */
+    if (unlikely(__pyx_v_channels == 0)) {
+      #ifdef WITH_THREAD
+      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+      #endif
+      PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+      #ifdef WITH_THREAD
+      __Pyx_PyGILState_Release(__pyx_gilstate_save);
+      #endif
+      __PYX_ERR(1, 148, __pyx_L1_error)
+    }
+    __pyx_v_input_value = (__pyx_v_input_value / __pyx_v_channels);
+
+    /* "mpfmc/core/audio/dsp.pxd":151
+ * 
+ *         # Parallel damped comb filters
+ *         output_value = 0.0             # <<<<<<<<<<<<<<
+ *         for index in range(DSP_REVERB_COMB_COUNT):
+ *             delayed = reverb.comb_buffers[index][reverb.comb_positions[index]]
+ */
+    __pyx_v_output_value = 0.0;
+
+    /* "mpfmc/core/audio/dsp.pxd":152
+ *         # Parallel damped comb filters
+ *         output_value = 0.0
+ *         for index in range(DSP_REVERB_COMB_COUNT):             # <<<<<<<<<<<<<<
+ *             delayed = reverb.comb_buffers[index][reverb.comb_positions[index]]
+ *             reverb.comb_filter_stores[index] = delayed * (1.0 - reverb.damping) + reverb.comb_filter_stores[index] * reverb.damping
+ */
+    __pyx_t_5 = __pyx_e_5mpfmc_4core_5audio_3dsp_DSP_REVERB_COMB_COUNT;
+    for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_5; __pyx_t_3+=1) {
+      __pyx_v_index = __pyx_t_3;
+
+      /* "mpfmc/core/audio/dsp.pxd":153
+ *         output_value = 0.0
+ *         for index in range(DSP_REVERB_COMB_COUNT):
+ *             delayed = reverb.comb_buffers[index][reverb.comb_positions[index]]             # <<<<<<<<<<<<<<
+ *             reverb.comb_filter_stores[index] = delayed * (1.0 - reverb.damping) + reverb.comb_filter_stores[index] * reverb.damping
+ *             reverb.comb_buffers[index][reverb.comb_positions[index]] = input_value + reverb.comb_filter_stores[index] * reverb.feedback
+ */
+      __pyx_v_delayed = ((__pyx_v_reverb->comb_buffers[__pyx_v_index])[(__pyx_v_reverb->comb_positions[__pyx_v_index])]);
+
+      /* "mpfmc/core/audio/dsp.pxd":154
+ *         for index in range(DSP_REVERB_COMB_COUNT):
+ *             delayed = reverb.comb_buffers[index][reverb.comb_positions[index]]
+ *             reverb.comb_filter_stores[index] = delayed * (1.0 - reverb.damping) + reverb.comb_filter_stores[index] * reverb.damping             # <<<<<<<<<<<<<<
+ *             reverb.comb_buffers[index][reverb.comb_positions[index]] = input_value + reverb.comb_filter_stores[index] * reverb.feedback
+ *             reverb.comb_positions[index] += 1
+ */
+      (__pyx_v_reverb->comb_filter_stores[__pyx_v_index]) = ((__pyx_v_delayed * (1.0 - __pyx_v_reverb->damping)) + ((__pyx_v_reverb->comb_filter_stores[__pyx_v_index]) * __pyx_v_reverb->damping));
+
+      /* "mpfmc/core/audio/dsp.pxd":155
+ *             delayed = reverb.comb_buffers[index][reverb.comb_positions[index]]
+ *             reverb.comb_filter_stores[index] = delayed * (1.0 - reverb.damping) + reverb.comb_filter_stores[index] * reverb.damping
+ *             reverb.comb_buffers[index][reverb.comb_positions[index]] = input_value + reverb.comb_filter_stores[index] * reverb.feedback             # <<<<<<<<<<<<<<
+ *             reverb.comb_positions[index] += 1
+ *             if reverb.comb_positions[index] >= reverb.comb_lengths[index]:
+ */
+      ((__pyx_v_reverb->comb_buffers[__pyx_v_index])[(__pyx_v_reverb->comb_positions[__pyx_v_index])]) = (__pyx_v_input_value + ((__pyx_v_reverb->comb_filter_stores[__pyx_v_index]) * __pyx_v_reverb->feedback));
+
+      /* "mpfmc/core/audio/dsp.pxd":156
+ *             reverb.comb_filter_stores[index] = delayed * (1.0 - reverb.damping) + reverb.comb_filter_stores[index] * reverb.damping
+ *             reverb.comb_buffers[index][reverb.comb_positions[index]] = input_value + reverb.comb_filter_stores[index] * reverb.feedback
+ *             reverb.comb_positions[index] += 1             # <<<<<<<<<<<<<<
+ *             if reverb.comb_positions[index] >= reverb.comb_lengths[index]:
+ *                 reverb.comb_positions[index] = 0
+ */
+      __pyx_t_4 = __pyx_v_index;
+      (__pyx_v_reverb->comb_positions[__pyx_t_4]) = ((__pyx_v_reverb->comb_positions[__pyx_t_4]) + 1);
+
+      /* "mpfmc/core/audio/dsp.pxd":157
+ *             reverb.comb_buffers[index][reverb.comb_positions[index]] = input_value + reverb.comb_filter_stores[index] * reverb.feedback
+ *             reverb.comb_positions[index] += 1
+ *             if reverb.comb_positions[index] >= reverb.comb_lengths[index]:             # <<<<<<<<<<<<<<
+ *                 reverb.comb_positions[index] = 0
+ *             output_value += delayed
+ */
+      __pyx_t_6 = (((__pyx_v_reverb->comb_positions[__pyx_v_index]) >= (__pyx_v_reverb->comb_lengths[__pyx_v_index])) != 0);
+      if (__pyx_t_6) {
+
+        /* "mpfmc/core/audio/dsp.pxd":158
+ *             reverb.comb_positions[index] += 1
+ *             if reverb.comb_positions[index] >= reverb.comb_lengths[index]:
+ *                 reverb.comb_positions[index] = 0             # <<<<<<<<<<<<<<
+ *             output_value += delayed
+ *         output_value /= DSP_REVERB_COMB_COUNT
+ */
+        (__pyx_v_reverb->comb_positions[__pyx_v_index]) = 0;
+
+        /* "mpfmc/core/audio/dsp.pxd":157
+ *             reverb.comb_buffers[index][reverb.comb_positions[index]] = input_value + reverb.comb_filter_stores[index] * reverb.feedback
+ *             reverb.comb_positions[index] += 1
+ *             if reverb.comb_positions[index] >= reverb.comb_lengths[index]:             # <<<<<<<<<<<<<<
+ *                 reverb.comb_positions[index] = 0
+ *             output_value += delayed
+ */
       }
+
+      /* "mpfmc/core/audio/dsp.pxd":159
+ *             if reverb.comb_positions[index] >= reverb.comb_lengths[index]:
+ *                 reverb.comb_positions[index] = 0
+ *             output_value += delayed             # <<<<<<<<<<<<<<
+ *         output_value /= DSP_REVERB_COMB_COUNT
+ * 
+ */
+      __pyx_v_output_value = (__pyx_v_output_value + __pyx_v_delayed);
     }
-    __pyx_v_self = values[0];
-    __pyx_v_sound_instance = values[1];
+
+    /* "mpfmc/core/audio/dsp.pxd":160
+ *                 reverb.comb_positions[index] = 0
+ *             output_value += delayed
+ *         output_value /= DSP_REVERB_COMB_COUNT             # <<<<<<<<<<<<<<
+ * 
+ *         # Series allpass filters
+ */
+    if (unlikely(__pyx_e_5mpfmc_4core_5audio_3dsp_DSP_REVERB_COMB_COUNT == 0)) {
+      #ifdef WITH_THREAD
+      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+      #endif
+      PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+      #ifdef WITH_THREAD
+      __Pyx_PyGILState_Release(__pyx_gilstate_save);
+      #endif
+      __PYX_ERR(1, 160, __pyx_L1_error)
+    }
+    __pyx_v_output_value = (__pyx_v_output_value / __pyx_e_5mpfmc_4core_5audio_3dsp_DSP_REVERB_COMB_COUNT);
+
+    /* "mpfmc/core/audio/dsp.pxd":163
+ * 
+ *         # Series allpass filters
+ *         for index in range(DSP_REVERB_ALLPASS_COUNT):             # <<<<<<<<<<<<<<
+ *             delayed = reverb.allpass_buffers[index][reverb.allpass_positions[index]]
+ *             reverb.allpass_buffers[index][reverb.allpass_positions[index]] = output_value + delayed * 0.5
+ */
+    __pyx_t_5 = __pyx_e_5mpfmc_4core_5audio_3dsp_DSP_REVERB_ALLPASS_COUNT;
+    for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_5; __pyx_t_3+=1) {
+      __pyx_v_index = __pyx_t_3;
+
+      /* "mpfmc/core/audio/dsp.pxd":164
+ *         # Series allpass filters
+ *         for index in range(DSP_REVERB_ALLPASS_COUNT):
+ *             delayed = reverb.allpass_buffers[index][reverb.allpass_positions[index]]             # <<<<<<<<<<<<<<
+ *             reverb.allpass_buffers[index][reverb.allpass_positions[index]] = output_value + delayed * 0.5
+ *             output_value = delayed - output_value
+ */
+      __pyx_v_delayed = ((__pyx_v_reverb->allpass_buffers[__pyx_v_index])[(__pyx_v_reverb->allpass_positions[__pyx_v_index])]);
+
+      /* "mpfmc/core/audio/dsp.pxd":165
+ *         for index in range(DSP_REVERB_ALLPASS_COUNT):
+ *             delayed = reverb.allpass_buffers[index][reverb.allpass_positions[index]]
+ *             reverb.allpass_buffers[index][reverb.allpass_positions[index]] = output_value + delayed * 0.5             # <<<<<<<<<<<<<<
+ *             output_value = delayed - output_value
+ *             reverb.allpass_positions[index] += 1
+ */
+      ((__pyx_v_reverb->allpass_buffers[__pyx_v_index])[(__pyx_v_reverb->allpass_positions[__pyx_v_index])]) = (__pyx_v_output_value + (__pyx_v_delayed * 0.5));
+
+      /* "mpfmc/core/audio/dsp.pxd":166
+ *             delayed = reverb.allpass_buffers[index][reverb.allpass_positions[index]]
+ *             reverb.allpass_buffers[index][reverb.allpass_positions[index]] = output_value + delayed * 0.5
+ *             output_value = delayed - output_value             # <<<<<<<<<<<<<<
+ *             reverb.allpass_positions[index] += 1
+ *             if reverb.allpass_positions[index] >= reverb.allpass_lengths[index]:
+ */
+      __pyx_v_output_value = (__pyx_v_delayed - __pyx_v_output_value);
+
+      /* "mpfmc/core/audio/dsp.pxd":167
+ *             reverb.allpass_buffers[index][reverb.allpass_positions[index]] = output_value + delayed * 0.5
+ *             output_value = delayed - output_value
+ *             reverb.allpass_positions[index] += 1             # <<<<<<<<<<<<<<
+ *             if reverb.allpass_positions[index] >= reverb.allpass_lengths[index]:
+ *                 reverb.allpass_positions[index] = 0
+ */
+      __pyx_t_4 = __pyx_v_index;
+      (__pyx_v_reverb->allpass_positions[__pyx_t_4]) = ((__pyx_v_reverb->allpass_positions[__pyx_t_4]) + 1);
+
+      /* "mpfmc/core/audio/dsp.pxd":168
+ *             output_value = delayed - output_value
+ *             reverb.allpass_positions[index] += 1
+ *             if reverb.allpass_positions[index] >= reverb.allpass_lengths[index]:             # <<<<<<<<<<<<<<
+ *                 reverb.allpass_positions[index] = 0
+ * 
+ */
+      __pyx_t_6 = (((__pyx_v_reverb->allpass_positions[__pyx_v_index]) >= (__pyx_v_reverb->allpass_lengths[__pyx_v_index])) != 0);
+      if (__pyx_t_6) {
+
+        /* "mpfmc/core/audio/dsp.pxd":169
+ *             reverb.allpass_positions[index] += 1
+ *             if reverb.allpass_positions[index] >= reverb.allpass_lengths[index]:
+ *                 reverb.allpass_positions[index] = 0             # <<<<<<<<<<<<<<
+ * 
+ *         for channel in range(channels):
+ */
+        (__pyx_v_reverb->allpass_positions[__pyx_v_index]) = 0;
+
+        /* "mpfmc/core/audio/dsp.pxd":168
+ *             output_value = delayed - output_value
+ *             reverb.allpass_positions[index] += 1
+ *             if reverb.allpass_positions[index] >= reverb.allpass_lengths[index]:             # <<<<<<<<<<<<<<
+ *                 reverb.allpass_positions[index] = 0
+ * 
+ */
+      }
+    }
+
+    /* "mpfmc/core/audio/dsp.pxd":171
+ *                 reverb.allpass_positions[index] = 0
+ * 
+ *         for channel in range(channels):             # <<<<<<<<<<<<<<
+ *             sample[channel] = sample[channel] * reverb.dry + output_value * reverb.wet
+ *         sample += channels
+ */
+    __pyx_t_3 = __pyx_v_channels;
+    for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+      __pyx_v_channel = __pyx_t_4;
+
+      /* "mpfmc/core/audio/dsp.pxd":172
+ * 
+ *         for channel in range(channels):
+ *             sample[channel] = sample[channel] * reverb.dry + output_value * reverb.wet             # <<<<<<<<<<<<<<
+ *         sample += channels
+ * 
+ */
+      (__pyx_v_sample[__pyx_v_channel]) = (((__pyx_v_sample[__pyx_v_channel]) * __pyx_v_reverb->dry) + (__pyx_v_output_value * __pyx_v_reverb->wet));
+    }
+
+    /* "mpfmc/core/audio/dsp.pxd":173
+ *         for channel in range(channels):
+ *             sample[channel] = sample[channel] * reverb.dry + output_value * reverb.wet
+ *         sample += channels             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void process_dsp_chain(DspChain *chain, float *buffer, Uint32 frames, int channels) nogil:
+ */
+    __pyx_v_sample = (__pyx_v_sample + __pyx_v_channels);
   }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("_on_sound_instance_about_to_finish", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 297, __pyx_L3_error)
-  __pyx_L3_error:;
-  __Pyx_DECREF(__pyx_v_kwargs); __pyx_v_kwargs = 0;
-  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController._on_sound_instance_about_to_finish", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_30_on_sound_instance_about_to_finish(__pyx_self, __pyx_v_self, __pyx_v_sound_instance, __pyx_v_kwargs);
+
+  /* "mpfmc/core/audio/dsp.pxd":130
+ *         sample += channels
+ * 
+ * cdef inline void process_reverb(ReverbSettings *reverb, float *buffer, Uint32 frames, int channels) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Applies a simple (mono) reverb to a block of interleaved samples.
+ */
 
   /* function exit code */
-  __Pyx_XDECREF(__pyx_v_kwargs);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_WriteUnraisable("mpfmc.core.audio.dsp.process_reverb", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 1);
+  __pyx_L0:;
 }
 
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_30_on_sound_instance_about_to_finish(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_sound_instance, CYTHON_UNUSED PyObject *__pyx_v_kwargs) {
-  PyObject *__pyx_v_playlist = NULL;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
+/* "mpfmc/core/audio/dsp.pxd":175
+ *         sample += channels
+ * 
+ * cdef inline void process_dsp_chain(DspChain *chain, float *buffer, Uint32 frames, int channels) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Processes a block of interleaved samples through all the inserts in a chain (in order).
+ */
+
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_3dsp_process_dsp_chain(__pyx_t_5mpfmc_4core_5audio_3dsp_DspChain *__pyx_v_chain, float *__pyx_v_buffer, Uint32 __pyx_v_frames, int __pyx_v_channels) {
+  int __pyx_v_index;
   int __pyx_t_1;
   int __pyx_t_2;
   int __pyx_t_3;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  __Pyx_RefNannySetupContext("_on_sound_instance_about_to_finish", 0);
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":300
- *         """Callback function called whenever a playlist sound is about to finish playing."""
+  /* "mpfmc/core/audio/dsp.pxd":186
+ *     cdef int index
  * 
- *         if sound_instance is None or sound_instance not in self._playlists_by_sound_instance:             # <<<<<<<<<<<<<<
- *             return
+ *     if chain == NULL:             # <<<<<<<<<<<<<<
+ *         return
  * 
  */
-  __pyx_t_2 = (__pyx_v_sound_instance == Py_None);
-  __pyx_t_3 = (__pyx_t_2 != 0);
-  if (!__pyx_t_3) {
-  } else {
-    __pyx_t_1 = __pyx_t_3;
-    goto __pyx_L4_bool_binop_done;
-  }
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_playlists_by_sound_instance); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 300, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_3 = (__Pyx_PySequence_ContainsTF(__pyx_v_sound_instance, __pyx_t_4, Py_NE)); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 300, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_2 = (__pyx_t_3 != 0);
-  __pyx_t_1 = __pyx_t_2;
-  __pyx_L4_bool_binop_done:;
+  __pyx_t_1 = ((__pyx_v_chain == NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":301
+    /* "mpfmc/core/audio/dsp.pxd":187
  * 
- *         if sound_instance is None or sound_instance not in self._playlists_by_sound_instance:
- *             return             # <<<<<<<<<<<<<<
+ *     if chain == NULL:
+ *         return             # <<<<<<<<<<<<<<
  * 
- *         # Get playlist for sound_instance
+ *     for index in range(chain.insert_count):
  */
-    __Pyx_XDECREF(__pyx_r);
-    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
     goto __pyx_L0;
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":300
- *         """Callback function called whenever a playlist sound is about to finish playing."""
+    /* "mpfmc/core/audio/dsp.pxd":186
+ *     cdef int index
  * 
- *         if sound_instance is None or sound_instance not in self._playlists_by_sound_instance:             # <<<<<<<<<<<<<<
- *             return
+ *     if chain == NULL:             # <<<<<<<<<<<<<<
+ *         return
  * 
  */
   }
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":304
+  /* "mpfmc/core/audio/dsp.pxd":189
+ *         return
  * 
- *         # Get playlist for sound_instance
- *         playlist = self._playlists_by_sound_instance[sound_instance]             # <<<<<<<<<<<<<<
+ *     for index in range(chain.insert_count):             # <<<<<<<<<<<<<<
+ *         if chain.inserts[index].type == dsp_insert_biquad:
+ *             process_biquad(&chain.inserts[index].biquad, buffer, frames, channels)
+ */
+  __pyx_t_2 = __pyx_v_chain->insert_count;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_index = __pyx_t_3;
+
+    /* "mpfmc/core/audio/dsp.pxd":190
  * 
- *         # Take no action if the sound is not from the current playlist
+ *     for index in range(chain.insert_count):
+ *         if chain.inserts[index].type == dsp_insert_biquad:             # <<<<<<<<<<<<<<
+ *             process_biquad(&chain.inserts[index].biquad, buffer, frames, channels)
+ *         elif chain.inserts[index].type == dsp_insert_limiter:
  */
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_playlists_by_sound_instance); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 304, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = PyObject_GetItem(__pyx_t_4, __pyx_v_sound_instance); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 304, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_v_playlist = __pyx_t_5;
-  __pyx_t_5 = 0;
+    __pyx_t_1 = (((__pyx_v_chain->inserts[__pyx_v_index]).type == __pyx_e_5mpfmc_4core_5audio_3dsp_dsp_insert_biquad) != 0);
+    if (__pyx_t_1) {
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":307
+      /* "mpfmc/core/audio/dsp.pxd":191
+ *     for index in range(chain.insert_count):
+ *         if chain.inserts[index].type == dsp_insert_biquad:
+ *             process_biquad(&chain.inserts[index].biquad, buffer, frames, channels)             # <<<<<<<<<<<<<<
+ *         elif chain.inserts[index].type == dsp_insert_limiter:
+ *             process_limiter(&chain.inserts[index].limiter, buffer, frames, channels)
+ */
+      __pyx_f_5mpfmc_4core_5audio_3dsp_process_biquad((&(__pyx_v_chain->inserts[__pyx_v_index]).biquad), __pyx_v_buffer, __pyx_v_frames, __pyx_v_channels);
+
+      /* "mpfmc/core/audio/dsp.pxd":190
  * 
- *         # Take no action if the sound is not from the current playlist
- *         if playlist != self._current_playlist:             # <<<<<<<<<<<<<<
- *             return
+ *     for index in range(chain.insert_count):
+ *         if chain.inserts[index].type == dsp_insert_biquad:             # <<<<<<<<<<<<<<
+ *             process_biquad(&chain.inserts[index].biquad, buffer, frames, channels)
+ *         elif chain.inserts[index].type == dsp_insert_limiter:
+ */
+      goto __pyx_L6;
+    }
+
+    /* "mpfmc/core/audio/dsp.pxd":192
+ *         if chain.inserts[index].type == dsp_insert_biquad:
+ *             process_biquad(&chain.inserts[index].biquad, buffer, frames, channels)
+ *         elif chain.inserts[index].type == dsp_insert_limiter:             # <<<<<<<<<<<<<<
+ *             process_limiter(&chain.inserts[index].limiter, buffer, frames, channels)
+ *         elif chain.inserts[index].type == dsp_insert_reverb:
+ */
+    __pyx_t_1 = (((__pyx_v_chain->inserts[__pyx_v_index]).type == __pyx_e_5mpfmc_4core_5audio_3dsp_dsp_insert_limiter) != 0);
+    if (__pyx_t_1) {
+
+      /* "mpfmc/core/audio/dsp.pxd":193
+ *             process_biquad(&chain.inserts[index].biquad, buffer, frames, channels)
+ *         elif chain.inserts[index].type == dsp_insert_limiter:
+ *             process_limiter(&chain.inserts[index].limiter, buffer, frames, channels)             # <<<<<<<<<<<<<<
+ *         elif chain.inserts[index].type == dsp_insert_reverb:
+ *             process_reverb(&chain.inserts[index].reverb, buffer, frames, channels)
+ */
+      __pyx_f_5mpfmc_4core_5audio_3dsp_process_limiter((&(__pyx_v_chain->inserts[__pyx_v_index]).limiter), __pyx_v_buffer, __pyx_v_frames, __pyx_v_channels);
+
+      /* "mpfmc/core/audio/dsp.pxd":192
+ *         if chain.inserts[index].type == dsp_insert_biquad:
+ *             process_biquad(&chain.inserts[index].biquad, buffer, frames, channels)
+ *         elif chain.inserts[index].type == dsp_insert_limiter:             # <<<<<<<<<<<<<<
+ *             process_limiter(&chain.inserts[index].limiter, buffer, frames, channels)
+ *         elif chain.inserts[index].type == dsp_insert_reverb:
+ */
+      goto __pyx_L6;
+    }
+
+    /* "mpfmc/core/audio/dsp.pxd":194
+ *         elif chain.inserts[index].type == dsp_insert_limiter:
+ *             process_limiter(&chain.inserts[index].limiter, buffer, frames, channels)
+ *         elif chain.inserts[index].type == dsp_insert_reverb:             # <<<<<<<<<<<<<<
+ *             process_reverb(&chain.inserts[index].reverb, buffer, frames, channels)
+ */
+    __pyx_t_1 = (((__pyx_v_chain->inserts[__pyx_v_index]).type == __pyx_e_5mpfmc_4core_5audio_3dsp_dsp_insert_reverb) != 0);
+    if (__pyx_t_1) {
+
+      /* "mpfmc/core/audio/dsp.pxd":195
+ *             process_limiter(&chain.inserts[index].limiter, buffer, frames, channels)
+ *         elif chain.inserts[index].type == dsp_insert_reverb:
+ *             process_reverb(&chain.inserts[index].reverb, buffer, frames, channels)             # <<<<<<<<<<<<<<
+ */
+      __pyx_f_5mpfmc_4core_5audio_3dsp_process_reverb((&(__pyx_v_chain->inserts[__pyx_v_index]).reverb), __pyx_v_buffer, __pyx_v_frames, __pyx_v_channels);
+
+      /* "mpfmc/core/audio/dsp.pxd":194
+ *         elif chain.inserts[index].type == dsp_insert_limiter:
+ *             process_limiter(&chain.inserts[index].limiter, buffer, frames, channels)
+ *         elif chain.inserts[index].type == dsp_insert_reverb:             # <<<<<<<<<<<<<<
+ *             process_reverb(&chain.inserts[index].reverb, buffer, frames, channels)
+ */
+    }
+    __pyx_L6:;
+  }
+
+  /* "mpfmc/core/audio/dsp.pxd":175
+ *         sample += channels
  * 
+ * cdef inline void process_dsp_chain(DspChain *chain, float *buffer, Uint32 frames, int channels) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Processes a block of interleaved samples through all the inserts in a chain (in order).
  */
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 307, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_4 = PyObject_RichCompare(__pyx_v_playlist, __pyx_t_5, Py_NE); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 307, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_1 < 0)) __PYX_ERR(0, 307, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":308
- *         # Take no action if the sound is not from the current playlist
- *         if playlist != self._current_playlist:
- *             return             # <<<<<<<<<<<<<<
+  /* function exit code */
+  __pyx_L0:;
+}
+
+/* "mpfmc/core/audio/perf_counters.pxd":39
  * 
- *         # Determine if this is the last sound in the playlist
+ * 
+ * cdef inline void perf_ring_buffer_reset(PerfRingBuffer *ring_buffer) nogil:             # <<<<<<<<<<<<<<
+ *     """Clears all the values recorded in a ring buffer."""
+ *     ring_buffer.position = 0
  */
-    __Pyx_XDECREF(__pyx_r);
-    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-    goto __pyx_L0;
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":307
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_13perf_counters_perf_ring_buffer_reset(__pyx_t_5mpfmc_4core_5audio_13perf_counters_PerfRingBuffer *__pyx_v_ring_buffer) {
+
+  /* "mpfmc/core/audio/perf_counters.pxd":41
+ * cdef inline void perf_ring_buffer_reset(PerfRingBuffer *ring_buffer) nogil:
+ *     """Clears all the values recorded in a ring buffer."""
+ *     ring_buffer.position = 0             # <<<<<<<<<<<<<<
+ *     ring_buffer.count = 0
+ *     ring_buffer.total = 0
+ */
+  __pyx_v_ring_buffer->position = 0;
+
+  /* "mpfmc/core/audio/perf_counters.pxd":42
+ *     """Clears all the values recorded in a ring buffer."""
+ *     ring_buffer.position = 0
+ *     ring_buffer.count = 0             # <<<<<<<<<<<<<<
+ *     ring_buffer.total = 0
+ *     ring_buffer.maximum = 0
+ */
+  __pyx_v_ring_buffer->count = 0;
+
+  /* "mpfmc/core/audio/perf_counters.pxd":43
+ *     ring_buffer.position = 0
+ *     ring_buffer.count = 0
+ *     ring_buffer.total = 0             # <<<<<<<<<<<<<<
+ *     ring_buffer.maximum = 0
  * 
- *         # Take no action if the sound is not from the current playlist
- *         if playlist != self._current_playlist:             # <<<<<<<<<<<<<<
- *             return
+ */
+  __pyx_v_ring_buffer->total = 0;
+
+  /* "mpfmc/core/audio/perf_counters.pxd":44
+ *     ring_buffer.count = 0
+ *     ring_buffer.total = 0
+ *     ring_buffer.maximum = 0             # <<<<<<<<<<<<<<
  * 
+ * cdef inline void perf_ring_buffer_record(PerfRingBuffer *ring_buffer, Uint32 value) nogil:
  */
-  }
+  __pyx_v_ring_buffer->maximum = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":311
+  /* "mpfmc/core/audio/perf_counters.pxd":39
  * 
- *         # Determine if this is the last sound in the playlist
- *         if playlist.end_of_playlist and not playlist.repeat:             # <<<<<<<<<<<<<<
- *             return
  * 
+ * cdef inline void perf_ring_buffer_reset(PerfRingBuffer *ring_buffer) nogil:             # <<<<<<<<<<<<<<
+ *     """Clears all the values recorded in a ring buffer."""
+ *     ring_buffer.position = 0
  */
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_playlist, __pyx_n_s_end_of_playlist); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 311, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 311, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (__pyx_t_2) {
-  } else {
-    __pyx_t_1 = __pyx_t_2;
-    goto __pyx_L8_bool_binop_done;
+
+  /* function exit code */
+}
+
+/* "mpfmc/core/audio/perf_counters.pxd":46
+ *     ring_buffer.maximum = 0
+ * 
+ * cdef inline void perf_ring_buffer_record(PerfRingBuffer *ring_buffer, Uint32 value) nogil:             # <<<<<<<<<<<<<<
+ *     """Records a value in a ring buffer (overwriting the oldest value when it is full)."""
+ *     ring_buffer.values[ring_buffer.position] = value
+ */
+
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_13perf_counters_perf_ring_buffer_record(__pyx_t_5mpfmc_4core_5audio_13perf_counters_PerfRingBuffer *__pyx_v_ring_buffer, Uint32 __pyx_v_value) {
+  Uint32 __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "mpfmc/core/audio/perf_counters.pxd":48
+ * cdef inline void perf_ring_buffer_record(PerfRingBuffer *ring_buffer, Uint32 value) nogil:
+ *     """Records a value in a ring buffer (overwriting the oldest value when it is full)."""
+ *     ring_buffer.values[ring_buffer.position] = value             # <<<<<<<<<<<<<<
+ *     ring_buffer.position = (ring_buffer.position + 1) % PERF_RING_BUFFER_SIZE
+ *     ring_buffer.count += 1
+ */
+  (__pyx_v_ring_buffer->values[__pyx_v_ring_buffer->position]) = __pyx_v_value;
+
+  /* "mpfmc/core/audio/perf_counters.pxd":49
+ *     """Records a value in a ring buffer (overwriting the oldest value when it is full)."""
+ *     ring_buffer.values[ring_buffer.position] = value
+ *     ring_buffer.position = (ring_buffer.position + 1) % PERF_RING_BUFFER_SIZE             # <<<<<<<<<<<<<<
+ *     ring_buffer.count += 1
+ *     ring_buffer.total += value
+ */
+  __pyx_t_1 = (__pyx_v_ring_buffer->position + 1);
+  if (unlikely(__pyx_e_5mpfmc_4core_5audio_13perf_counters_PERF_RING_BUFFER_SIZE == 0)) {
+    #ifdef WITH_THREAD
+    PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+    #endif
+    PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+    #ifdef WITH_THREAD
+    __Pyx_PyGILState_Release(__pyx_gilstate_save);
+    #endif
+    __PYX_ERR(2, 49, __pyx_L1_error)
   }
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_playlist, __pyx_n_s_repeat); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 311, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 311, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_3 = ((!__pyx_t_2) != 0);
-  __pyx_t_1 = __pyx_t_3;
-  __pyx_L8_bool_binop_done:;
-  if (__pyx_t_1) {
+  __pyx_v_ring_buffer->position = (__pyx_t_1 % __pyx_e_5mpfmc_4core_5audio_13perf_counters_PERF_RING_BUFFER_SIZE);
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":312
- *         # Determine if this is the last sound in the playlist
- *         if playlist.end_of_playlist and not playlist.repeat:
- *             return             # <<<<<<<<<<<<<<
+  /* "mpfmc/core/audio/perf_counters.pxd":50
+ *     ring_buffer.values[ring_buffer.position] = value
+ *     ring_buffer.position = (ring_buffer.position + 1) % PERF_RING_BUFFER_SIZE
+ *     ring_buffer.count += 1             # <<<<<<<<<<<<<<
+ *     ring_buffer.total += value
+ *     if value > ring_buffer.maximum:
+ */
+  __pyx_v_ring_buffer->count = (__pyx_v_ring_buffer->count + 1);
+
+  /* "mpfmc/core/audio/perf_counters.pxd":51
+ *     ring_buffer.position = (ring_buffer.position + 1) % PERF_RING_BUFFER_SIZE
+ *     ring_buffer.count += 1
+ *     ring_buffer.total += value             # <<<<<<<<<<<<<<
+ *     if value > ring_buffer.maximum:
+ *         ring_buffer.maximum = value
+ */
+  __pyx_v_ring_buffer->total = (__pyx_v_ring_buffer->total + __pyx_v_value);
+
+  /* "mpfmc/core/audio/perf_counters.pxd":52
+ *     ring_buffer.count += 1
+ *     ring_buffer.total += value
+ *     if value > ring_buffer.maximum:             # <<<<<<<<<<<<<<
+ *         ring_buffer.maximum = value
  * 
- *         # Advance to the next sound in the playlist
  */
-    __Pyx_XDECREF(__pyx_r);
-    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-    goto __pyx_L0;
+  __pyx_t_2 = ((__pyx_v_value > __pyx_v_ring_buffer->maximum) != 0);
+  if (__pyx_t_2) {
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":311
+    /* "mpfmc/core/audio/perf_counters.pxd":53
+ *     ring_buffer.total += value
+ *     if value > ring_buffer.maximum:
+ *         ring_buffer.maximum = value             # <<<<<<<<<<<<<<
  * 
- *         # Determine if this is the last sound in the playlist
- *         if playlist.end_of_playlist and not playlist.repeat:             # <<<<<<<<<<<<<<
- *             return
+ * cdef inline Uint32 perf_elapsed_us(AudioPerfCounters *counters, Uint64 start) nogil:
+ */
+    __pyx_v_ring_buffer->maximum = __pyx_v_value;
+
+    /* "mpfmc/core/audio/perf_counters.pxd":52
+ *     ring_buffer.count += 1
+ *     ring_buffer.total += value
+ *     if value > ring_buffer.maximum:             # <<<<<<<<<<<<<<
+ *         ring_buffer.maximum = value
  * 
  */
   }
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":315
+  /* "mpfmc/core/audio/perf_counters.pxd":46
+ *     ring_buffer.maximum = 0
  * 
- *         # Advance to the next sound in the playlist
- *         self.advance()             # <<<<<<<<<<<<<<
+ * cdef inline void perf_ring_buffer_record(PerfRingBuffer *ring_buffer, Uint32 value) nogil:             # <<<<<<<<<<<<<<
+ *     """Records a value in a ring buffer (overwriting the oldest value when it is full)."""
+ *     ring_buffer.values[ring_buffer.position] = value
+ */
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_WriteUnraisable("mpfmc.core.audio.perf_counters.perf_ring_buffer_record", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 1);
+  __pyx_L0:;
+}
+
+/* "mpfmc/core/audio/perf_counters.pxd":55
+ *         ring_buffer.maximum = value
  * 
- *     def clear_context(self, context):
+ * cdef inline Uint32 perf_elapsed_us(AudioPerfCounters *counters, Uint64 start) nogil:             # <<<<<<<<<<<<<<
+ *     """Returns the number of microseconds elapsed since the specified performance counter value."""
+ *     return <Uint32>((SDL_GetPerformanceCounter() - start) * 1000000 // counters.frequency)
  */
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_advance); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 315, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_6 = NULL;
-  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
-    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_5);
-    if (likely(__pyx_t_6)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
-      __Pyx_INCREF(__pyx_t_6);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_5, function);
-    }
-  }
-  if (__pyx_t_6) {
-    __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_6); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 315, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  } else {
-    __pyx_t_4 = __Pyx_PyObject_CallNoArg(__pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 315, __pyx_L1_error)
+
+static CYTHON_INLINE Uint32 __pyx_f_5mpfmc_4core_5audio_13perf_counters_perf_elapsed_us(__pyx_t_5mpfmc_4core_5audio_13perf_counters_AudioPerfCounters *__pyx_v_counters, Uint64 __pyx_v_start) {
+  Uint32 __pyx_r;
+  Uint64 __pyx_t_1;
+
+  /* "mpfmc/core/audio/perf_counters.pxd":57
+ * cdef inline Uint32 perf_elapsed_us(AudioPerfCounters *counters, Uint64 start) nogil:
+ *     """Returns the number of microseconds elapsed since the specified performance counter value."""
+ *     return <Uint32>((SDL_GetPerformanceCounter() - start) * 1000000 // counters.frequency)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void perf_lock_audio(AudioCallbackData *callback_data) nogil:
+ */
+  __pyx_t_1 = ((SDL_GetPerformanceCounter() - __pyx_v_start) * 0xF4240);
+  if (unlikely(__pyx_v_counters->frequency == 0)) {
+    #ifdef WITH_THREAD
+    PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+    #endif
+    PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+    #ifdef WITH_THREAD
+    __Pyx_PyGILState_Release(__pyx_gilstate_save);
+    #endif
+    __PYX_ERR(2, 57, __pyx_L1_error)
   }
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_r = ((Uint32)(__pyx_t_1 / __pyx_v_counters->frequency));
+  goto __pyx_L0;
+
+  /* "mpfmc/core/audio/perf_counters.pxd":55
+ *         ring_buffer.maximum = value
+ * 
+ * cdef inline Uint32 perf_elapsed_us(AudioPerfCounters *counters, Uint64 start) nogil:             # <<<<<<<<<<<<<<
+ *     """Returns the number of microseconds elapsed since the specified performance counter value."""
+ *     return <Uint32>((SDL_GetPerformanceCounter() - start) * 1000000 // counters.frequency)
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_WriteUnraisable("mpfmc.core.audio.perf_counters.perf_elapsed_us", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 1);
+  __pyx_r = 0;
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/perf_counters.pxd":59
+ *     return <Uint32>((SDL_GetPerformanceCounter() - start) * 1000000 // counters.frequency)
+ * 
+ * cdef inline void perf_lock_audio(AudioCallbackData *callback_data) nogil:             # <<<<<<<<<<<<<<
+ *     """Locks the audio callback (SDL_LockAudio) and records the time spent waiting for the lock."""
+ *     cdef AudioPerfCounters *counters = <AudioPerfCounters*>callback_data.perf_counters
+ */
+
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_13perf_counters_perf_lock_audio(__pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData *__pyx_v_callback_data) {
+  __pyx_t_5mpfmc_4core_5audio_13perf_counters_AudioPerfCounters *__pyx_v_counters;
+  Uint64 __pyx_v_start;
+  int __pyx_t_1;
+
+  /* "mpfmc/core/audio/perf_counters.pxd":61
+ * cdef inline void perf_lock_audio(AudioCallbackData *callback_data) nogil:
+ *     """Locks the audio callback (SDL_LockAudio) and records the time spent waiting for the lock."""
+ *     cdef AudioPerfCounters *counters = <AudioPerfCounters*>callback_data.perf_counters             # <<<<<<<<<<<<<<
+ *     cdef Uint64 start
+ * 
+ */
+  __pyx_v_counters = ((__pyx_t_5mpfmc_4core_5audio_13perf_counters_AudioPerfCounters *)__pyx_v_callback_data->perf_counters);
+
+  /* "mpfmc/core/audio/perf_counters.pxd":64
+ *     cdef Uint64 start
+ * 
+ *     if counters == NULL:             # <<<<<<<<<<<<<<
+ *         SDL_LockAudio()
+ *         return
+ */
+  __pyx_t_1 = ((__pyx_v_counters == NULL) != 0);
+  if (__pyx_t_1) {
+
+    /* "mpfmc/core/audio/perf_counters.pxd":65
+ * 
+ *     if counters == NULL:
+ *         SDL_LockAudio()             # <<<<<<<<<<<<<<
+ *         return
+ * 
+ */
+    SDL_LockAudio();
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":297
- *             request()
+    /* "mpfmc/core/audio/perf_counters.pxd":66
+ *     if counters == NULL:
+ *         SDL_LockAudio()
+ *         return             # <<<<<<<<<<<<<<
  * 
- *     def _on_sound_instance_about_to_finish(self, sound_instance=None, **kwargs):             # <<<<<<<<<<<<<<
- *         """Callback function called whenever a playlist sound is about to finish playing."""
+ *     start = SDL_GetPerformanceCounter()
+ */
+    goto __pyx_L0;
+
+    /* "mpfmc/core/audio/perf_counters.pxd":64
+ *     cdef Uint64 start
  * 
+ *     if counters == NULL:             # <<<<<<<<<<<<<<
+ *         SDL_LockAudio()
+ *         return
  */
+  }
 
-  /* function exit code */
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController._on_sound_instance_about_to_finish", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_playlist);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
+  /* "mpfmc/core/audio/perf_counters.pxd":68
+ *         return
+ * 
+ *     start = SDL_GetPerformanceCounter()             # <<<<<<<<<<<<<<
+ *     SDL_LockAudio()
+ *     perf_ring_buffer_record(&counters.lock_wait_time, perf_elapsed_us(counters, start))
+ */
+  __pyx_v_start = SDL_GetPerformanceCounter();
 
-/* "mpfmc/core/audio/playlist_controller.pyx":317
- *         self.advance()
+  /* "mpfmc/core/audio/perf_counters.pxd":69
+ * 
+ *     start = SDL_GetPerformanceCounter()
+ *     SDL_LockAudio()             # <<<<<<<<<<<<<<
+ *     perf_ring_buffer_record(&counters.lock_wait_time, perf_elapsed_us(counters, start))
  * 
- *     def clear_context(self, context):             # <<<<<<<<<<<<<<
- *         """
- *         Stops the current playlist if it was played from the specified context.
  */
+  SDL_LockAudio();
 
-/* Python wrapper */
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_33clear_context(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_32clear_context[] = "PlaylistController.clear_context(self, context)\n\n        Stops the current playlist if it was played from the specified context.\n\n        Args:\n            context: The context to clear\n        ";
-static PyMethodDef __pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_33clear_context = {"clear_context", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_33clear_context, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_32clear_context};
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_33clear_context(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_self = 0;
-  PyObject *__pyx_v_context = 0;
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("clear_context (wrapper)", 0);
-  {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_context,0};
-    PyObject* values[2] = {0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
-      switch (pos_args) {
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (pos_args) {
-        case  0:
-        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_self)) != 0)) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        CYTHON_FALLTHROUGH;
-        case  1:
-        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_context)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("clear_context", 1, 2, 2, 1); __PYX_ERR(0, 317, __pyx_L3_error)
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "clear_context") < 0)) __PYX_ERR(0, 317, __pyx_L3_error)
-      }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-    }
-    __pyx_v_self = values[0];
-    __pyx_v_context = values[1];
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("clear_context", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 317, __pyx_L3_error)
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController.clear_context", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_32clear_context(__pyx_self, __pyx_v_self, __pyx_v_context);
+  /* "mpfmc/core/audio/perf_counters.pxd":70
+ *     start = SDL_GetPerformanceCounter()
+ *     SDL_LockAudio()
+ *     perf_ring_buffer_record(&counters.lock_wait_time, perf_elapsed_us(counters, start))             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline dict perf_ring_buffer_summary(PerfRingBuffer *ring_buffer):
+ */
+  __pyx_f_5mpfmc_4core_5audio_13perf_counters_perf_ring_buffer_record((&__pyx_v_counters->lock_wait_time), __pyx_f_5mpfmc_4core_5audio_13perf_counters_perf_elapsed_us(__pyx_v_counters, __pyx_v_start));
+
+  /* "mpfmc/core/audio/perf_counters.pxd":59
+ *     return <Uint32>((SDL_GetPerformanceCounter() - start) * 1000000 // counters.frequency)
+ * 
+ * cdef inline void perf_lock_audio(AudioCallbackData *callback_data) nogil:             # <<<<<<<<<<<<<<
+ *     """Locks the audio callback (SDL_LockAudio) and records the time spent waiting for the lock."""
+ *     cdef AudioPerfCounters *counters = <AudioPerfCounters*>callback_data.perf_counters
+ */
 
   /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
+  __pyx_L0:;
 }
 
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_32clear_context(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_context) {
+/* "mpfmc/core/audio/perf_counters.pxd":72
+ *     perf_ring_buffer_record(&counters.lock_wait_time, perf_elapsed_us(counters, start))
+ * 
+ * cdef inline dict perf_ring_buffer_summary(PerfRingBuffer *ring_buffer):             # <<<<<<<<<<<<<<
+ *     """Returns a dictionary summarizing the values recorded in a ring buffer (must be called
+ *     while holding the audio lock)."""
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5mpfmc_4core_5audio_13perf_counters_perf_ring_buffer_summary(__pyx_t_5mpfmc_4core_5audio_13perf_counters_PerfRingBuffer *__pyx_v_ring_buffer) {
+  Uint32 __pyx_v_recent_count;
+  PyObject *__pyx_v_recent = NULL;
+  Uint32 __pyx_7genexpr__pyx_v_index;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  int __pyx_t_4;
+  int __pyx_t_1;
+  Uint64 __pyx_t_2;
+  Uint64 __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
   PyObject *__pyx_t_5 = NULL;
-  int __pyx_t_6;
-  int __pyx_t_7;
-  int __pyx_t_8;
-  __Pyx_RefNannySetupContext("clear_context", 0);
+  Uint32 __pyx_t_6;
+  Uint32 __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_t_9;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  __Pyx_RefNannySetupContext("perf_ring_buffer_summary", 0);
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":324
- *             context: The context to clear
- *         """
- *         self.log.debug("Clearing context %s", context)             # <<<<<<<<<<<<<<
+  /* "mpfmc/core/audio/perf_counters.pxd":75
+ *     """Returns a dictionary summarizing the values recorded in a ring buffer (must be called
+ *     while holding the audio lock)."""
+ *     cdef Uint32 recent_count = <Uint32>min(ring_buffer.count, PERF_RING_BUFFER_SIZE)             # <<<<<<<<<<<<<<
+ *     cdef Uint32 index
  * 
- *         if self._current_playlist.context == context:
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_log); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 324, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_debug); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 324, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = NULL;
-  __pyx_t_4 = 0;
-  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
-    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_3);
-    if (likely(__pyx_t_2)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-      __Pyx_INCREF(__pyx_t_2);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_3, function);
-      __pyx_t_4 = 1;
-    }
-  }
-  #if CYTHON_FAST_PYCALL
-  if (PyFunction_Check(__pyx_t_3)) {
-    PyObject *__pyx_temp[3] = {__pyx_t_2, __pyx_kp_u_Clearing_context_s, __pyx_v_context};
-    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_4, 2+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 324, __pyx_L1_error)
-    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_GOTREF(__pyx_t_1);
-  } else
-  #endif
-  #if CYTHON_FAST_PYCCALL
-  if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
-    PyObject *__pyx_temp[3] = {__pyx_t_2, __pyx_kp_u_Clearing_context_s, __pyx_v_context};
-    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_4, 2+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 324, __pyx_L1_error)
-    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_GOTREF(__pyx_t_1);
-  } else
-  #endif
-  {
-    __pyx_t_5 = PyTuple_New(2+__pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 324, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    if (__pyx_t_2) {
-      __Pyx_GIVEREF(__pyx_t_2); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_2); __pyx_t_2 = NULL;
-    }
-    __Pyx_INCREF(__pyx_kp_u_Clearing_context_s);
-    __Pyx_GIVEREF(__pyx_kp_u_Clearing_context_s);
-    PyTuple_SET_ITEM(__pyx_t_5, 0+__pyx_t_4, __pyx_kp_u_Clearing_context_s);
-    __Pyx_INCREF(__pyx_v_context);
-    __Pyx_GIVEREF(__pyx_v_context);
-    PyTuple_SET_ITEM(__pyx_t_5, 1+__pyx_t_4, __pyx_v_context);
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 324, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_1 = __pyx_e_5mpfmc_4core_5audio_13perf_counters_PERF_RING_BUFFER_SIZE;
+  __pyx_t_2 = __pyx_v_ring_buffer->count;
+  if (((__pyx_t_1 < __pyx_t_2) != 0)) {
+    __pyx_t_3 = __pyx_t_1;
+  } else {
+    __pyx_t_3 = __pyx_t_2;
   }
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "mpfmc/core/audio/playlist_controller.pyx":326
- *         self.log.debug("Clearing context %s", context)
- * 
- *         if self._current_playlist.context == context:             # <<<<<<<<<<<<<<
- *             self.stop()
- * 
- */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_current_playlist); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 326, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_context); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 326, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyObject_RichCompare(__pyx_t_3, __pyx_v_context, Py_EQ); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 326, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(0, 326, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (__pyx_t_6) {
+  __pyx_v_recent_count = ((Uint32)__pyx_t_3);
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":327
- * 
- *         if self._current_playlist.context == context:
- *             self.stop()             # <<<<<<<<<<<<<<
+  /* "mpfmc/core/audio/perf_counters.pxd":78
+ *     cdef Uint32 index
  * 
- *         # Also need to check if there is a pending request to play another playlist with
+ *     recent = sorted([ring_buffer.values[index] for index in range(recent_count)])             # <<<<<<<<<<<<<<
+ *     return {
+ *         "count": ring_buffer.count,
  */
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_stop); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 327, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_5 = NULL;
-    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
-      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
-      if (likely(__pyx_t_5)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-        __Pyx_INCREF(__pyx_t_5);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_3, function);
-      }
-    }
-    if (__pyx_t_5) {
-      __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 327, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    } else {
-      __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 327, __pyx_L1_error)
+  { /* enter inner scope */
+    __pyx_t_5 = PyList_New(0); if (unlikely(!__pyx_t_5)) __PYX_ERR(2, 78, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_6 = __pyx_v_recent_count;
+    for (__pyx_t_7 = 0; __pyx_t_7 < __pyx_t_6; __pyx_t_7+=1) {
+      __pyx_7genexpr__pyx_v_index = __pyx_t_7;
+      __pyx_t_8 = __Pyx_PyInt_From_Uint32((__pyx_v_ring_buffer->values[__pyx_7genexpr__pyx_v_index])); if (unlikely(!__pyx_t_8)) __PYX_ERR(2, 78, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      if (unlikely(__Pyx_ListComp_Append(__pyx_t_5, (PyObject*)__pyx_t_8))) __PYX_ERR(2, 78, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
     }
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  } /* exit inner scope */
+  __pyx_t_4 = ((PyObject*)__pyx_t_5);
+  __pyx_t_5 = 0;
+  __pyx_t_9 = PyList_Sort(__pyx_t_4); if (unlikely(__pyx_t_9 == ((int)-1))) __PYX_ERR(2, 78, __pyx_L1_error)
+  __pyx_v_recent = ((PyObject*)__pyx_t_4);
+  __pyx_t_4 = 0;
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":326
- *         self.log.debug("Clearing context %s", context)
- * 
- *         if self._current_playlist.context == context:             # <<<<<<<<<<<<<<
- *             self.stop()
+  /* "mpfmc/core/audio/perf_counters.pxd":79
  * 
+ *     recent = sorted([ring_buffer.values[index] for index in range(recent_count)])
+ *     return {             # <<<<<<<<<<<<<<
+ *         "count": ring_buffer.count,
+ *         "last": ring_buffer.values[(ring_buffer.position + PERF_RING_BUFFER_SIZE - 1) % PERF_RING_BUFFER_SIZE] if recent_count else 0,
  */
-  }
+  __Pyx_XDECREF(__pyx_r);
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":331
- *         # Also need to check if there is a pending request to play another playlist with
- *         # the specified context.  If so, delete the pending request.
- *         if self._pending_request and "context" in self._pending_request.keywords and \             # <<<<<<<<<<<<<<
- *                 self._pending_request.keywords["context"] == context:
- *             self._pending_request = None
+  /* "mpfmc/core/audio/perf_counters.pxd":80
+ *     recent = sorted([ring_buffer.values[index] for index in range(recent_count)])
+ *     return {
+ *         "count": ring_buffer.count,             # <<<<<<<<<<<<<<
+ *         "last": ring_buffer.values[(ring_buffer.position + PERF_RING_BUFFER_SIZE - 1) % PERF_RING_BUFFER_SIZE] if recent_count else 0,
+ *         "mean": ring_buffer.total / ring_buffer.count if ring_buffer.count else 0.0,
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_pending_request); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 331, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_7 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_7 < 0)) __PYX_ERR(0, 331, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (__pyx_t_7) {
+  __pyx_t_4 = __Pyx_PyDict_NewPresized(6); if (unlikely(!__pyx_t_4)) __PYX_ERR(2, 80, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __Pyx_PyInt_From_Uint64(__pyx_v_ring_buffer->count); if (unlikely(!__pyx_t_5)) __PYX_ERR(2, 80, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_u_count, __pyx_t_5) < 0) __PYX_ERR(2, 80, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+  /* "mpfmc/core/audio/perf_counters.pxd":81
+ *     return {
+ *         "count": ring_buffer.count,
+ *         "last": ring_buffer.values[(ring_buffer.position + PERF_RING_BUFFER_SIZE - 1) % PERF_RING_BUFFER_SIZE] if recent_count else 0,             # <<<<<<<<<<<<<<
+ *         "mean": ring_buffer.total / ring_buffer.count if ring_buffer.count else 0.0,
+ *         "max": ring_buffer.maximum,
+ */
+  if ((__pyx_v_recent_count != 0)) {
+    __pyx_t_6 = ((__pyx_v_ring_buffer->position + __pyx_e_5mpfmc_4core_5audio_13perf_counters_PERF_RING_BUFFER_SIZE) - 1);
+    if (unlikely(__pyx_e_5mpfmc_4core_5audio_13perf_counters_PERF_RING_BUFFER_SIZE == 0)) {
+      PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+      __PYX_ERR(2, 81, __pyx_L1_error)
+    }
+    __pyx_t_8 = __Pyx_PyInt_From_Uint32((__pyx_v_ring_buffer->values[(__pyx_t_6 % __pyx_e_5mpfmc_4core_5audio_13perf_counters_PERF_RING_BUFFER_SIZE)])); if (unlikely(!__pyx_t_8)) __PYX_ERR(2, 81, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_5 = __pyx_t_8;
+    __pyx_t_8 = 0;
   } else {
-    __pyx_t_6 = __pyx_t_7;
-    goto __pyx_L5_bool_binop_done;
+    __Pyx_INCREF(__pyx_int_0);
+    __pyx_t_5 = __pyx_int_0;
   }
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_pending_request); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 331, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_keywords); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 331, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_7 = (__Pyx_PySequence_ContainsTF(__pyx_n_u_context, __pyx_t_3, Py_EQ)); if (unlikely(__pyx_t_7 < 0)) __PYX_ERR(0, 331, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_8 = (__pyx_t_7 != 0);
-  if (__pyx_t_8) {
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_u_last, __pyx_t_5) < 0) __PYX_ERR(2, 80, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+  /* "mpfmc/core/audio/perf_counters.pxd":82
+ *         "count": ring_buffer.count,
+ *         "last": ring_buffer.values[(ring_buffer.position + PERF_RING_BUFFER_SIZE - 1) % PERF_RING_BUFFER_SIZE] if recent_count else 0,
+ *         "mean": ring_buffer.total / ring_buffer.count if ring_buffer.count else 0.0,             # <<<<<<<<<<<<<<
+ *         "max": ring_buffer.maximum,
+ *         "recent_mean": sum(recent) / recent_count if recent_count else 0.0,
+ */
+  if ((__pyx_v_ring_buffer->count != 0)) {
+    if (unlikely(__pyx_v_ring_buffer->count == 0)) {
+      PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+      __PYX_ERR(2, 82, __pyx_L1_error)
+    }
+    __pyx_t_8 = PyFloat_FromDouble((((double)__pyx_v_ring_buffer->total) / ((double)__pyx_v_ring_buffer->count))); if (unlikely(!__pyx_t_8)) __PYX_ERR(2, 82, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_5 = __pyx_t_8;
+    __pyx_t_8 = 0;
   } else {
-    __pyx_t_6 = __pyx_t_8;
-    goto __pyx_L5_bool_binop_done;
+    __Pyx_INCREF(__pyx_float_0_0);
+    __pyx_t_5 = __pyx_float_0_0;
   }
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_u_mean, __pyx_t_5) < 0) __PYX_ERR(2, 80, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":332
- *         # the specified context.  If so, delete the pending request.
- *         if self._pending_request and "context" in self._pending_request.keywords and \
- *                 self._pending_request.keywords["context"] == context:             # <<<<<<<<<<<<<<
- *             self._pending_request = None
- */
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_pending_request); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 332, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_keywords); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 332, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = PyObject_GetItem(__pyx_t_1, __pyx_n_u_context); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 332, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyObject_RichCompare(__pyx_t_3, __pyx_v_context, Py_EQ); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 332, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_8 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_8 < 0)) __PYX_ERR(0, 332, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_6 = __pyx_t_8;
-  __pyx_L5_bool_binop_done:;
-
-  /* "mpfmc/core/audio/playlist_controller.pyx":331
- *         # Also need to check if there is a pending request to play another playlist with
- *         # the specified context.  If so, delete the pending request.
- *         if self._pending_request and "context" in self._pending_request.keywords and \             # <<<<<<<<<<<<<<
- *                 self._pending_request.keywords["context"] == context:
- *             self._pending_request = None
+  /* "mpfmc/core/audio/perf_counters.pxd":83
+ *         "last": ring_buffer.values[(ring_buffer.position + PERF_RING_BUFFER_SIZE - 1) % PERF_RING_BUFFER_SIZE] if recent_count else 0,
+ *         "mean": ring_buffer.total / ring_buffer.count if ring_buffer.count else 0.0,
+ *         "max": ring_buffer.maximum,             # <<<<<<<<<<<<<<
+ *         "recent_mean": sum(recent) / recent_count if recent_count else 0.0,
+ *         "recent_p95": recent[(recent_count * 95) // 100] if recent_count else 0,
  */
-  if (__pyx_t_6) {
+  __pyx_t_5 = __Pyx_PyInt_From_Uint32(__pyx_v_ring_buffer->maximum); if (unlikely(!__pyx_t_5)) __PYX_ERR(2, 83, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_u_max, __pyx_t_5) < 0) __PYX_ERR(2, 80, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":333
- *         if self._pending_request and "context" in self._pending_request.keywords and \
- *                 self._pending_request.keywords["context"] == context:
- *             self._pending_request = None             # <<<<<<<<<<<<<<
+  /* "mpfmc/core/audio/perf_counters.pxd":84
+ *         "mean": ring_buffer.total / ring_buffer.count if ring_buffer.count else 0.0,
+ *         "max": ring_buffer.maximum,
+ *         "recent_mean": sum(recent) / recent_count if recent_count else 0.0,             # <<<<<<<<<<<<<<
+ *         "recent_p95": recent[(recent_count * 95) // 100] if recent_count else 0,
+ *     }
  */
-    if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_pending_request, Py_None) < 0) __PYX_ERR(0, 333, __pyx_L1_error)
+  if ((__pyx_v_recent_count != 0)) {
+    __pyx_t_8 = PyTuple_New(1); if (unlikely(!__pyx_t_8)) __PYX_ERR(2, 84, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_INCREF(__pyx_v_recent);
+    __Pyx_GIVEREF(__pyx_v_recent);
+    PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_v_recent);
+    __pyx_t_10 = __Pyx_PyObject_Call(__pyx_builtin_sum, __pyx_t_8, NULL); if (unlikely(!__pyx_t_10)) __PYX_ERR(2, 84, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_10);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __pyx_t_8 = __Pyx_PyInt_From_Uint32(__pyx_v_recent_count); if (unlikely(!__pyx_t_8)) __PYX_ERR(2, 84, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_11 = __Pyx_PyNumber_Divide(__pyx_t_10, __pyx_t_8); if (unlikely(!__pyx_t_11)) __PYX_ERR(2, 84, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_11);
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __pyx_t_5 = __pyx_t_11;
+    __pyx_t_11 = 0;
+  } else {
+    __Pyx_INCREF(__pyx_float_0_0);
+    __pyx_t_5 = __pyx_float_0_0;
+  }
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_u_recent_mean, __pyx_t_5) < 0) __PYX_ERR(2, 80, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-    /* "mpfmc/core/audio/playlist_controller.pyx":331
- *         # Also need to check if there is a pending request to play another playlist with
- *         # the specified context.  If so, delete the pending request.
- *         if self._pending_request and "context" in self._pending_request.keywords and \             # <<<<<<<<<<<<<<
- *                 self._pending_request.keywords["context"] == context:
- *             self._pending_request = None
+  /* "mpfmc/core/audio/perf_counters.pxd":85
+ *         "max": ring_buffer.maximum,
+ *         "recent_mean": sum(recent) / recent_count if recent_count else 0.0,
+ *         "recent_p95": recent[(recent_count * 95) // 100] if recent_count else 0,             # <<<<<<<<<<<<<<
+ *     }
  */
+  if ((__pyx_v_recent_count != 0)) {
+    if (unlikely(__pyx_v_recent == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(2, 85, __pyx_L1_error)
+    }
+    __pyx_t_6 = ((__pyx_v_recent_count * 95) / 0x64);
+    __pyx_t_11 = __Pyx_GetItemInt_List(__pyx_v_recent, __pyx_t_6, Uint32, 0, __Pyx_PyInt_From_Uint32, 1, 0, 1); if (unlikely(!__pyx_t_11)) __PYX_ERR(2, 85, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_11);
+    __pyx_t_5 = __pyx_t_11;
+    __pyx_t_11 = 0;
+  } else {
+    __Pyx_INCREF(__pyx_int_0);
+    __pyx_t_5 = __pyx_int_0;
   }
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_u_recent_p95, __pyx_t_5) < 0) __PYX_ERR(2, 80, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_r = ((PyObject*)__pyx_t_4);
+  __pyx_t_4 = 0;
+  goto __pyx_L0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":317
- *         self.advance()
+  /* "mpfmc/core/audio/perf_counters.pxd":72
+ *     perf_ring_buffer_record(&counters.lock_wait_time, perf_elapsed_us(counters, start))
  * 
- *     def clear_context(self, context):             # <<<<<<<<<<<<<<
- *         """
- *         Stops the current playlist if it was played from the specified context.
+ * cdef inline dict perf_ring_buffer_summary(PerfRingBuffer *ring_buffer):             # <<<<<<<<<<<<<<
+ *     """Returns a dictionary summarizing the values recorded in a ring buffer (must be called
+ *     while holding the audio lock)."""
  */
 
   /* function exit code */
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_AddTraceback("mpfmc.core.audio.playlist_controller.PlaylistController.clear_context", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_AddTraceback("mpfmc.core.audio.perf_counters.perf_ring_buffer_summary", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
   __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_recent);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
@@ -7089,15 +13161,27 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_PlaylistController___dealloc, __pyx_k_PlaylistController___dealloc, sizeof(__pyx_k_PlaylistController___dealloc), 0, 0, 1, 1},
   {&__pyx_n_s_PlaylistController___init, __pyx_k_PlaylistController___init, sizeof(__pyx_k_PlaylistController___init), 0, 0, 1, 1},
   {&__pyx_n_s_PlaylistController___repr, __pyx_k_PlaylistController___repr, sizeof(__pyx_k_PlaylistController___repr), 0, 0, 1, 1},
+  {&__pyx_n_s_PlaylistController__cancel_prepa, __pyx_k_PlaylistController__cancel_prepa, sizeof(__pyx_k_PlaylistController__cancel_prepa), 0, 0, 1, 1},
+  {&__pyx_n_s_PlaylistController__get_next_sou, __pyx_k_PlaylistController__get_next_sou, sizeof(__pyx_k_PlaylistController__get_next_sou), 0, 0, 1, 1},
+  {&__pyx_n_s_PlaylistController__get_playlist, __pyx_k_PlaylistController__get_playlist, sizeof(__pyx_k_PlaylistController__get_playlist), 0, 0, 1, 1},
+  {&__pyx_n_s_PlaylistController__has_next_sou, __pyx_k_PlaylistController__has_next_sou, sizeof(__pyx_k_PlaylistController__has_next_sou), 0, 0, 1, 1},
   {&__pyx_n_s_PlaylistController__is_busy, __pyx_k_PlaylistController__is_busy, sizeof(__pyx_k_PlaylistController__is_busy), 0, 0, 1, 1},
+  {&__pyx_n_s_PlaylistController__on_current_s, __pyx_k_PlaylistController__on_current_s, sizeof(__pyx_k_PlaylistController__on_current_s), 0, 0, 1, 1},
   {&__pyx_n_s_PlaylistController__on_sound_ins, __pyx_k_PlaylistController__on_sound_ins, sizeof(__pyx_k_PlaylistController__on_sound_ins), 0, 0, 1, 1},
   {&__pyx_n_s_PlaylistController__on_sound_ins_2, __pyx_k_PlaylistController__on_sound_ins_2, sizeof(__pyx_k_PlaylistController__on_sound_ins_2), 0, 0, 1, 1},
+  {&__pyx_n_s_PlaylistController__on_sound_ins_3, __pyx_k_PlaylistController__on_sound_ins_3, sizeof(__pyx_k_PlaylistController__on_sound_ins_3), 0, 0, 1, 1},
   {&__pyx_n_s_PlaylistController__play_playlis, __pyx_k_PlaylistController__play_playlis, sizeof(__pyx_k_PlaylistController__play_playlis), 0, 0, 1, 1},
+  {&__pyx_n_s_PlaylistController__prepare_next, __pyx_k_PlaylistController__prepare_next, sizeof(__pyx_k_PlaylistController__prepare_next), 0, 0, 1, 1},
+  {&__pyx_n_s_PlaylistController__schedule_pre, __pyx_k_PlaylistController__schedule_pre, sizeof(__pyx_k_PlaylistController__schedule_pre), 0, 0, 1, 1},
+  {&__pyx_n_s_PlaylistController__stop_playlis, __pyx_k_PlaylistController__stop_playlis, sizeof(__pyx_k_PlaylistController__stop_playlis), 0, 0, 1, 1},
   {&__pyx_n_s_PlaylistController_advance, __pyx_k_PlaylistController_advance, sizeof(__pyx_k_PlaylistController_advance), 0, 0, 1, 1},
   {&__pyx_kp_s_PlaylistController_class, __pyx_k_PlaylistController_class, sizeof(__pyx_k_PlaylistController_class), 0, 0, 1, 0},
   {&__pyx_n_s_PlaylistController_clear_context, __pyx_k_PlaylistController_clear_context, sizeof(__pyx_k_PlaylistController_clear_context), 0, 0, 1, 1},
   {&__pyx_n_s_PlaylistController_crossfade_tim, __pyx_k_PlaylistController_crossfade_tim, sizeof(__pyx_k_PlaylistController_crossfade_tim), 0, 0, 1, 1},
+  {&__pyx_n_s_PlaylistController_decode_ahead, __pyx_k_PlaylistController_decode_ahead, sizeof(__pyx_k_PlaylistController_decode_ahead), 0, 0, 1, 1},
+  {&__pyx_n_s_PlaylistController_gapless, __pyx_k_PlaylistController_gapless, sizeof(__pyx_k_PlaylistController_gapless), 0, 0, 1, 1},
   {&__pyx_n_s_PlaylistController_has_pending_r, __pyx_k_PlaylistController_has_pending_r, sizeof(__pyx_k_PlaylistController_has_pending_r), 0, 0, 1, 1},
+  {&__pyx_n_s_PlaylistController_has_prepared, __pyx_k_PlaylistController_has_prepared, sizeof(__pyx_k_PlaylistController_has_prepared), 0, 0, 1, 1},
   {&__pyx_n_s_PlaylistController_name, __pyx_k_PlaylistController_name, sizeof(__pyx_k_PlaylistController_name), 0, 0, 1, 1},
   {&__pyx_n_s_PlaylistController_play, __pyx_k_PlaylistController_play, sizeof(__pyx_k_PlaylistController_play), 0, 0, 1, 1},
   {&__pyx_kp_u_PlaylistController_s_track_Could, __pyx_k_PlaylistController_s_track_Could, sizeof(__pyx_k_PlaylistController_s_track_Could), 0, 1, 0, 0},
@@ -7106,23 +13190,37 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_PlaylistController_stop_all_soun, __pyx_k_PlaylistController_stop_all_soun, sizeof(__pyx_k_PlaylistController_stop_all_soun), 0, 0, 1, 1},
   {&__pyx_n_s_PlaylistController_track, __pyx_k_PlaylistController_track, sizeof(__pyx_k_PlaylistController_track), 0, 0, 1, 1},
   {&__pyx_n_s_PlaylistInstance, __pyx_k_PlaylistInstance, sizeof(__pyx_k_PlaylistInstance), 0, 0, 1, 1},
+  {&__pyx_kp_u_Preparing_sound_s_of_playlist_s, __pyx_k_Preparing_sound_s_of_playlist_s, sizeof(__pyx_k_Preparing_sound_s_of_playlist_s), 0, 1, 0, 0},
+  {&__pyx_n_u_about_to_finish, __pyx_k_about_to_finish, sizeof(__pyx_k_about_to_finish), 0, 1, 0, 1},
   {&__pyx_n_u_about_to_finish_time, __pyx_k_about_to_finish_time, sizeof(__pyx_k_about_to_finish_time), 0, 1, 0, 1},
   {&__pyx_n_s_add_handler, __pyx_k_add_handler, sizeof(__pyx_k_add_handler), 0, 0, 1, 1},
   {&__pyx_n_s_advance, __pyx_k_advance, sizeof(__pyx_k_advance), 0, 0, 1, 1},
   {&__pyx_kp_u_advance_Advancing_the_current_pl, __pyx_k_advance_Advancing_the_current_pl, sizeof(__pyx_k_advance_Advancing_the_current_pl), 0, 1, 0, 0},
   {&__pyx_kp_u_advance_No_playlist_is_currently, __pyx_k_advance_No_playlist_is_currently, sizeof(__pyx_k_advance_No_playlist_is_currently), 0, 1, 0, 0},
   {&__pyx_kp_u_advance_Playlist_track_is_too_bu, __pyx_k_advance_Playlist_track_is_too_bu, sizeof(__pyx_k_advance_Playlist_track_is_too_bu), 0, 1, 0, 0},
+  {&__pyx_n_s_callback, __pyx_k_callback, sizeof(__pyx_k_callback), 0, 0, 1, 1},
+  {&__pyx_n_s_cancel, __pyx_k_cancel, sizeof(__pyx_k_cancel), 0, 0, 1, 1},
+  {&__pyx_n_s_cancel_prepared_sound, __pyx_k_cancel_prepared_sound, sizeof(__pyx_k_cancel_prepared_sound), 0, 0, 1, 1},
   {&__pyx_n_s_clear_context, __pyx_k_clear_context, sizeof(__pyx_k_clear_context), 0, 0, 1, 1},
   {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
+  {&__pyx_n_s_clock, __pyx_k_clock, sizeof(__pyx_k_clock), 0, 0, 1, 1},
+  {&__pyx_n_s_container, __pyx_k_container, sizeof(__pyx_k_container), 0, 0, 1, 1},
   {&__pyx_n_s_context, __pyx_k_context, sizeof(__pyx_k_context), 0, 0, 1, 1},
   {&__pyx_n_u_context, __pyx_k_context, sizeof(__pyx_k_context), 0, 1, 0, 1},
+  {&__pyx_n_u_count, __pyx_k_count, sizeof(__pyx_k_count), 0, 1, 0, 1},
   {&__pyx_n_s_crossfade_time, __pyx_k_crossfade_time, sizeof(__pyx_k_crossfade_time), 0, 0, 1, 1},
   {&__pyx_n_s_crossfade_time_2, __pyx_k_crossfade_time_2, sizeof(__pyx_k_crossfade_time_2), 0, 0, 1, 1},
   {&__pyx_n_s_current_playlist, __pyx_k_current_playlist, sizeof(__pyx_k_current_playlist), 0, 0, 1, 1},
   {&__pyx_n_s_current_sound_instance, __pyx_k_current_sound_instance, sizeof(__pyx_k_current_sound_instance), 0, 0, 1, 1},
   {&__pyx_n_s_dealloc, __pyx_k_dealloc, sizeof(__pyx_k_dealloc), 0, 0, 1, 1},
   {&__pyx_n_s_debug, __pyx_k_debug, sizeof(__pyx_k_debug), 0, 0, 1, 1},
+  {&__pyx_n_s_decode_ahead_time, __pyx_k_decode_ahead_time, sizeof(__pyx_k_decode_ahead_time), 0, 0, 1, 1},
+  {&__pyx_n_s_decode_ahead_time_2, __pyx_k_decode_ahead_time_2, sizeof(__pyx_k_decode_ahead_time_2), 0, 0, 1, 1},
+  {&__pyx_n_s_delay, __pyx_k_delay, sizeof(__pyx_k_delay), 0, 0, 1, 1},
   {&__pyx_n_s_doc, __pyx_k_doc, sizeof(__pyx_k_doc), 0, 0, 1, 1},
+  {&__pyx_n_s_dt, __pyx_k_dt, sizeof(__pyx_k_dt), 0, 0, 1, 1},
+  {&__pyx_n_s_duration, __pyx_k_duration, sizeof(__pyx_k_duration), 0, 0, 1, 1},
+  {&__pyx_n_u_end, __pyx_k_end, sizeof(__pyx_k_end), 0, 1, 0, 1},
   {&__pyx_n_s_end_of_playlist, __pyx_k_end_of_playlist, sizeof(__pyx_k_end_of_playlist), 0, 0, 1, 1},
   {&__pyx_n_s_error, __pyx_k_error, sizeof(__pyx_k_error), 0, 0, 1, 1},
   {&__pyx_n_s_event, __pyx_k_event, sizeof(__pyx_k_event), 0, 0, 1, 1},
@@ -7131,6 +13229,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_u_events_when_about_to_finish, __pyx_k_events_when_about_to_finish, sizeof(__pyx_k_events_when_about_to_finish), 0, 1, 0, 1},
   {&__pyx_n_s_events_when_looping, __pyx_k_events_when_looping, sizeof(__pyx_k_events_when_looping), 0, 0, 1, 1},
   {&__pyx_n_s_events_when_played, __pyx_k_events_when_played, sizeof(__pyx_k_events_when_played), 0, 0, 1, 1},
+  {&__pyx_n_u_events_when_played, __pyx_k_events_when_played, sizeof(__pyx_k_events_when_played), 0, 1, 0, 1},
   {&__pyx_n_s_events_when_sound_changed, __pyx_k_events_when_sound_changed, sizeof(__pyx_k_events_when_sound_changed), 0, 0, 1, 1},
   {&__pyx_n_s_events_when_sound_stopped, __pyx_k_events_when_sound_stopped, sizeof(__pyx_k_events_when_sound_stopped), 0, 0, 1, 1},
   {&__pyx_n_s_events_when_stopped, __pyx_k_events_when_stopped, sizeof(__pyx_k_events_when_stopped), 0, 0, 1, 1},
@@ -7142,22 +13241,35 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_fading_sound_instance, __pyx_k_fading_sound_instance, sizeof(__pyx_k_fading_sound_instance), 0, 0, 1, 1},
   {&__pyx_n_s_format, __pyx_k_format, sizeof(__pyx_k_format), 0, 0, 1, 1},
   {&__pyx_n_s_functools, __pyx_k_functools, sizeof(__pyx_k_functools), 0, 0, 1, 1},
+  {&__pyx_n_s_gapless, __pyx_k_gapless, sizeof(__pyx_k_gapless), 0, 0, 1, 1},
+  {&__pyx_n_s_gapless_2, __pyx_k_gapless_2, sizeof(__pyx_k_gapless_2), 0, 0, 1, 1},
+  {&__pyx_n_s_get, __pyx_k_get, sizeof(__pyx_k_get), 0, 0, 1, 1},
   {&__pyx_n_s_getLogger, __pyx_k_getLogger, sizeof(__pyx_k_getLogger), 0, 0, 1, 1},
   {&__pyx_n_s_get_next_sound_name, __pyx_k_get_next_sound_name, sizeof(__pyx_k_get_next_sound_name), 0, 0, 1, 1},
+  {&__pyx_n_s_get_next_sound_name_2, __pyx_k_get_next_sound_name_2, sizeof(__pyx_k_get_next_sound_name_2), 0, 0, 1, 1},
+  {&__pyx_n_s_get_playlist_sound_settings, __pyx_k_get_playlist_sound_settings, sizeof(__pyx_k_get_playlist_sound_settings), 0, 0, 1, 1},
   {&__pyx_n_s_get_sound_players_in_use_count, __pyx_k_get_sound_players_in_use_count, sizeof(__pyx_k_get_sound_players_in_use_count), 0, 0, 1, 1},
+  {&__pyx_n_s_has_next_sound, __pyx_k_has_next_sound, sizeof(__pyx_k_has_next_sound), 0, 0, 1, 1},
   {&__pyx_n_s_has_pending_request, __pyx_k_has_pending_request, sizeof(__pyx_k_has_pending_request), 0, 0, 1, 1},
+  {&__pyx_n_s_has_prepared_sound, __pyx_k_has_prepared_sound, sizeof(__pyx_k_has_prepared_sound), 0, 0, 1, 1},
   {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
   {&__pyx_n_s_init, __pyx_k_init, sizeof(__pyx_k_init), 0, 0, 1, 1},
   {&__pyx_n_s_is_busy, __pyx_k_is_busy, sizeof(__pyx_k_is_busy), 0, 0, 1, 1},
   {&__pyx_n_s_keywords, __pyx_k_keywords, sizeof(__pyx_k_keywords), 0, 0, 1, 1},
   {&__pyx_n_s_kwargs, __pyx_k_kwargs, sizeof(__pyx_k_kwargs), 0, 0, 1, 1},
+  {&__pyx_n_u_last, __pyx_k_last, sizeof(__pyx_k_last), 0, 1, 0, 1},
+  {&__pyx_n_s_load, __pyx_k_load, sizeof(__pyx_k_load), 0, 0, 1, 1},
+  {&__pyx_n_s_loaded, __pyx_k_loaded, sizeof(__pyx_k_loaded), 0, 0, 1, 1},
   {&__pyx_n_s_log, __pyx_k_log, sizeof(__pyx_k_log), 0, 0, 1, 1},
   {&__pyx_n_s_logging, __pyx_k_logging, sizeof(__pyx_k_logging), 0, 0, 1, 1},
   {&__pyx_n_s_loop, __pyx_k_loop, sizeof(__pyx_k_loop), 0, 0, 1, 1},
+  {&__pyx_n_s_loops, __pyx_k_loops, sizeof(__pyx_k_loops), 0, 0, 1, 1},
   {&__pyx_n_s_lower, __pyx_k_lower, sizeof(__pyx_k_lower), 0, 0, 1, 1},
   {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
+  {&__pyx_n_u_max, __pyx_k_max, sizeof(__pyx_k_max), 0, 1, 0, 1},
   {&__pyx_n_u_max_queue_time, __pyx_k_max_queue_time, sizeof(__pyx_k_max_queue_time), 0, 1, 0, 1},
   {&__pyx_n_s_mc, __pyx_k_mc, sizeof(__pyx_k_mc), 0, 0, 1, 1},
+  {&__pyx_n_u_mean, __pyx_k_mean, sizeof(__pyx_k_mean), 0, 1, 0, 1},
   {&__pyx_n_s_metaclass, __pyx_k_metaclass, sizeof(__pyx_k_metaclass), 0, 0, 1, 1},
   {&__pyx_n_s_module, __pyx_k_module, sizeof(__pyx_k_module), 0, 0, 1, 1},
   {&__pyx_n_s_mpfmc_config_collections_playlis, __pyx_k_mpfmc_config_collections_playlis, sizeof(__pyx_k_mpfmc_config_collections_playlis), 0, 0, 1, 1},
@@ -7165,7 +13277,10 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_k_mpfmc_core_audio_playlist_contro_2, sizeof(__pyx_k_mpfmc_core_audio_playlist_contro_2), 0, 0, 1, 0},
   {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
   {&__pyx_n_s_next_sound_name, __pyx_k_next_sound_name, sizeof(__pyx_k_next_sound_name), 0, 0, 1, 1},
+  {&__pyx_n_s_next_sound_name_2, __pyx_k_next_sound_name_2, sizeof(__pyx_k_next_sound_name_2), 0, 0, 1, 1},
+  {&__pyx_n_s_on_current_sound_loaded, __pyx_k_on_current_sound_loaded, sizeof(__pyx_k_on_current_sound_loaded), 0, 0, 1, 1},
   {&__pyx_n_s_on_sound_instance_about_to_fini, __pyx_k_on_sound_instance_about_to_fini, sizeof(__pyx_k_on_sound_instance_about_to_fini), 0, 0, 1, 1},
+  {&__pyx_n_s_on_sound_instance_played, __pyx_k_on_sound_instance_played, sizeof(__pyx_k_on_sound_instance_played), 0, 0, 1, 1},
   {&__pyx_n_s_on_sound_instance_stopped, __pyx_k_on_sound_instance_stopped, sizeof(__pyx_k_on_sound_instance_stopped), 0, 0, 1, 1},
   {&__pyx_n_s_partial, __pyx_k_partial, sizeof(__pyx_k_partial), 0, 0, 1, 1},
   {&__pyx_n_s_pending_request, __pyx_k_pending_request, sizeof(__pyx_k_pending_request), 0, 0, 1, 1},
@@ -7178,30 +13293,50 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_playlist, __pyx_k_playlist, sizeof(__pyx_k_playlist), 0, 0, 1, 1},
   {&__pyx_n_s_playlist_instance, __pyx_k_playlist_instance, sizeof(__pyx_k_playlist_instance), 0, 0, 1, 1},
   {&__pyx_kp_u_playlist_sound_about_to_finish, __pyx_k_playlist_sound_about_to_finish, sizeof(__pyx_k_playlist_sound_about_to_finish), 0, 1, 0, 0},
+  {&__pyx_kp_u_playlist_sound_played, __pyx_k_playlist_sound_played, sizeof(__pyx_k_playlist_sound_played), 0, 1, 0, 0},
   {&__pyx_kp_u_playlist_sound_stopped, __pyx_k_playlist_sound_stopped, sizeof(__pyx_k_playlist_sound_stopped), 0, 1, 0, 0},
   {&__pyx_n_s_playlists, __pyx_k_playlists, sizeof(__pyx_k_playlists), 0, 0, 1, 1},
   {&__pyx_n_s_playlists_by_sound_instance, __pyx_k_playlists_by_sound_instance, sizeof(__pyx_k_playlists_by_sound_instance), 0, 0, 1, 1},
   {&__pyx_n_s_post_mc_native_event, __pyx_k_post_mc_native_event, sizeof(__pyx_k_post_mc_native_event), 0, 0, 1, 1},
   {&__pyx_n_s_prepare, __pyx_k_prepare, sizeof(__pyx_k_prepare), 0, 0, 1, 1},
+  {&__pyx_n_s_prepare_next_sound, __pyx_k_prepare_next_sound, sizeof(__pyx_k_prepare_next_sound), 0, 0, 1, 1},
+  {&__pyx_n_s_prepare_next_sound_event, __pyx_k_prepare_next_sound_event, sizeof(__pyx_k_prepare_next_sound_event), 0, 0, 1, 1},
+  {&__pyx_n_s_prepare_next_sound_when_not_bus, __pyx_k_prepare_next_sound_when_not_bus, sizeof(__pyx_k_prepare_next_sound_when_not_bus), 0, 0, 1, 1},
+  {&__pyx_n_s_prepared_sound_instance, __pyx_k_prepared_sound_instance, sizeof(__pyx_k_prepared_sound_instance), 0, 0, 1, 1},
+  {&__pyx_n_s_prepared_sound_name, __pyx_k_prepared_sound_name, sizeof(__pyx_k_prepared_sound_name), 0, 0, 1, 1},
   {&__pyx_n_s_property, __pyx_k_property, sizeof(__pyx_k_property), 0, 0, 1, 1},
   {&__pyx_n_s_pyx_vtable, __pyx_k_pyx_vtable, sizeof(__pyx_k_pyx_vtable), 0, 0, 1, 1},
   {&__pyx_n_s_qualname, __pyx_k_qualname, sizeof(__pyx_k_qualname), 0, 0, 1, 1},
+  {&__pyx_n_s_range, __pyx_k_range, sizeof(__pyx_k_range), 0, 0, 1, 1},
+  {&__pyx_n_u_recent_mean, __pyx_k_recent_mean, sizeof(__pyx_k_recent_mean), 0, 1, 0, 1},
+  {&__pyx_n_u_recent_p95, __pyx_k_recent_p95, sizeof(__pyx_k_recent_p95), 0, 1, 0, 1},
   {&__pyx_n_s_repeat, __pyx_k_repeat, sizeof(__pyx_k_repeat), 0, 0, 1, 1},
   {&__pyx_n_s_repr, __pyx_k_repr, sizeof(__pyx_k_repr), 0, 0, 1, 1},
   {&__pyx_n_s_request, __pyx_k_request, sizeof(__pyx_k_request), 0, 0, 1, 1},
+  {&__pyx_n_s_schedule_once, __pyx_k_schedule_once, sizeof(__pyx_k_schedule_once), 0, 0, 1, 1},
+  {&__pyx_n_s_schedule_prepare_next_sound, __pyx_k_schedule_prepare_next_sound, sizeof(__pyx_k_schedule_prepare_next_sound), 0, 0, 1, 1},
   {&__pyx_n_s_self, __pyx_k_self, sizeof(__pyx_k_self), 0, 0, 1, 1},
   {&__pyx_n_s_set_repeat, __pyx_k_set_repeat, sizeof(__pyx_k_set_repeat), 0, 0, 1, 1},
   {&__pyx_kp_u_set_repeat_No_playlist_is_curren, __pyx_k_set_repeat_No_playlist_is_curren, sizeof(__pyx_k_set_repeat_No_playlist_is_curren), 0, 1, 0, 0},
   {&__pyx_kp_u_set_repeat_Setting_repeat_for_cu, __pyx_k_set_repeat_Setting_repeat_for_cu, sizeof(__pyx_k_set_repeat_Setting_repeat_for_cu), 0, 1, 0, 0},
+  {&__pyx_n_s_settings, __pyx_k_settings, sizeof(__pyx_k_settings), 0, 0, 1, 1},
   {&__pyx_n_s_sound, __pyx_k_sound, sizeof(__pyx_k_sound), 0, 0, 1, 1},
   {&__pyx_n_s_sound_instance, __pyx_k_sound_instance, sizeof(__pyx_k_sound_instance), 0, 0, 1, 1},
   {&__pyx_n_s_sound_name, __pyx_k_sound_name, sizeof(__pyx_k_sound_name), 0, 0, 1, 1},
   {&__pyx_n_s_sounds, __pyx_k_sounds, sizeof(__pyx_k_sounds), 0, 0, 1, 1},
+  {&__pyx_n_u_start_after, __pyx_k_start_after, sizeof(__pyx_k_start_after), 0, 1, 0, 1},
+  {&__pyx_n_u_start_after_marker, __pyx_k_start_after_marker, sizeof(__pyx_k_start_after_marker), 0, 1, 0, 1},
+  {&__pyx_n_s_start_at, __pyx_k_start_at, sizeof(__pyx_k_start_at), 0, 0, 1, 1},
+  {&__pyx_n_s_start_sample, __pyx_k_start_sample, sizeof(__pyx_k_start_sample), 0, 0, 1, 1},
+  {&__pyx_n_u_start_sample, __pyx_k_start_sample, sizeof(__pyx_k_start_sample), 0, 1, 0, 1},
   {&__pyx_n_s_stop, __pyx_k_stop, sizeof(__pyx_k_stop), 0, 0, 1, 1},
   {&__pyx_kp_u_stop_No_playlist_is_currently_pl, __pyx_k_stop_No_playlist_is_currently_pl, sizeof(__pyx_k_stop_No_playlist_is_currently_pl), 0, 1, 0, 0},
   {&__pyx_kp_u_stop_Stopping_the_current_playli, __pyx_k_stop_Stopping_the_current_playli, sizeof(__pyx_k_stop_Stopping_the_current_playli), 0, 1, 0, 0},
   {&__pyx_n_s_stop_all_sounds, __pyx_k_stop_all_sounds, sizeof(__pyx_k_stop_all_sounds), 0, 0, 1, 1},
+  {&__pyx_n_s_stop_playlist_sound, __pyx_k_stop_playlist_sound, sizeof(__pyx_k_stop_playlist_sound), 0, 0, 1, 1},
   {&__pyx_n_s_stop_sound_instance, __pyx_k_stop_sound_instance, sizeof(__pyx_k_stop_sound_instance), 0, 0, 1, 1},
+  {&__pyx_n_s_stop_sound_instance_at, __pyx_k_stop_sound_instance_at, sizeof(__pyx_k_stop_sound_instance_at), 0, 0, 1, 1},
+  {&__pyx_n_s_sum, __pyx_k_sum, sizeof(__pyx_k_sum), 0, 0, 1, 1},
   {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
   {&__pyx_n_s_track, __pyx_k_track, sizeof(__pyx_k_track), 0, 0, 1, 1},
   {&__pyx_n_s_track_2, __pyx_k_track_2, sizeof(__pyx_k_track_2), 0, 0, 1, 1},
@@ -7210,7 +13345,9 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {0, 0, 0, 0, 0, 0, 0}
 };
 static int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_property = __Pyx_GetBuiltinName(__pyx_n_s_property); if (!__pyx_builtin_property) __PYX_ERR(0, 60, __pyx_L1_error)
+  __pyx_builtin_property = __Pyx_GetBuiltinName(__pyx_n_s_property); if (!__pyx_builtin_property) __PYX_ERR(0, 76, __pyx_L1_error)
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(1, 88, __pyx_L1_error)
+  __pyx_builtin_sum = __Pyx_GetBuiltinName(__pyx_n_s_sum); if (!__pyx_builtin_sum) __PYX_ERR(2, 84, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -7220,276 +13357,438 @@ static int __Pyx_InitCachedConstants(void) {
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":28
- *             volume: The playlist volume (0.0 to 1.0)
+  /* "mpfmc/core/audio/playlist_controller.pyx":32
+ *             gapless: Whether sounds follow each other without any gap or crossfade
  *         """
  *         self.log = logging.getLogger("PlaylistController")             # <<<<<<<<<<<<<<
  *         self.mc = mc
  *         self._track = track
  */
-  __pyx_tuple_ = PyTuple_Pack(1, __pyx_n_u_PlaylistController); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 28, __pyx_L1_error)
+  __pyx_tuple_ = PyTuple_Pack(1, __pyx_n_u_PlaylistController); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 32, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple_);
   __Pyx_GIVEREF(__pyx_tuple_);
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":116
+  /* "mpfmc/core/audio/playlist_controller.pyx":154
  *                                             player_settings=player_settings)
  * 
  *             self.log.debug("play - Playlist track is too busy. Delaying play playlist call.")             # <<<<<<<<<<<<<<
  *             return None
  * 
  */
-  __pyx_tuple__2 = PyTuple_Pack(1, __pyx_kp_u_play_Playlist_track_is_too_busy); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(0, 116, __pyx_L1_error)
+  __pyx_tuple__2 = PyTuple_Pack(1, __pyx_kp_u_play_Playlist_track_is_too_busy); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(0, 154, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__2);
   __Pyx_GIVEREF(__pyx_tuple__2);
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":203
- *         """Immediately stop the currently playing playlist. Will fade out using the crossfade setting."""
+  /* "mpfmc/core/audio/playlist_controller.pyx":372
+ *         """
  *         if not self._current_playlist:
  *             self.log.debug("stop - No playlist is currently playing. Could not stop current playlist.")             # <<<<<<<<<<<<<<
  *             return
  * 
  */
-  __pyx_tuple__3 = PyTuple_Pack(1, __pyx_kp_u_stop_No_playlist_is_currently_pl); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(0, 203, __pyx_L1_error)
+  __pyx_tuple__3 = PyTuple_Pack(1, __pyx_kp_u_stop_No_playlist_is_currently_pl); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(0, 372, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__3);
   __Pyx_GIVEREF(__pyx_tuple__3);
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":221
+  /* "mpfmc/core/audio/playlist_controller.pyx":397
  *         # If there is no current playlist, do nothing
  *         if not self._current_playlist:
  *             self.log.debug("advance - No playlist is currently playing. Could not advance to next sound")             # <<<<<<<<<<<<<<
  *             return
  * 
  */
-  __pyx_tuple__4 = PyTuple_Pack(1, __pyx_kp_u_advance_No_playlist_is_currently); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(0, 221, __pyx_L1_error)
+  __pyx_tuple__4 = PyTuple_Pack(1, __pyx_kp_u_advance_No_playlist_is_currently); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(0, 397, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__4);
   __Pyx_GIVEREF(__pyx_tuple__4);
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":230
+  /* "mpfmc/core/audio/playlist_controller.pyx":409
  *             # Delay advance playlist until track is finished with current crossfade (too busy)
- *             self._pending_request = partial(self.advance)
+ *             self._pending_request = partial(self.advance, start_sample=start_sample)
  *             self.log.debug("advance - Playlist track is too busy. Delaying advance to next sound")             # <<<<<<<<<<<<<<
  *             return
  * 
  */
-  __pyx_tuple__5 = PyTuple_Pack(1, __pyx_kp_u_advance_Playlist_track_is_too_bu); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(0, 230, __pyx_L1_error)
+  __pyx_tuple__5 = PyTuple_Pack(1, __pyx_kp_u_advance_Playlist_track_is_too_bu); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(0, 409, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__5);
   __Pyx_GIVEREF(__pyx_tuple__5);
 
   /* "mpfmc/core/audio/playlist_controller.pyx":19
  *     """
  * 
- *     def __init__(self, object mc, object track, float crossfade_time=0.0, float volume=1.0):             # <<<<<<<<<<<<<<
+ *     def __init__(self, object mc, object track, float crossfade_time=0.0, float volume=1.0,             # <<<<<<<<<<<<<<
+ *                  float decode_ahead_time=0.0, bint gapless=False):
  *         """
- *         Constructor
  */
-  __pyx_tuple__6 = PyTuple_Pack(5, __pyx_n_s_self, __pyx_n_s_mc, __pyx_n_s_track, __pyx_n_s_crossfade_time, __pyx_n_s_volume); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(0, 19, __pyx_L1_error)
+  __pyx_tuple__6 = PyTuple_Pack(7, __pyx_n_s_self, __pyx_n_s_mc, __pyx_n_s_track, __pyx_n_s_crossfade_time, __pyx_n_s_volume, __pyx_n_s_decode_ahead_time, __pyx_n_s_gapless); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(0, 19, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__6);
   __Pyx_GIVEREF(__pyx_tuple__6);
-  __pyx_codeobj__7 = (PyObject*)__Pyx_PyCode_New(5, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__6, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_init, 19, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__7)) __PYX_ERR(0, 19, __pyx_L1_error)
+  __pyx_codeobj__7 = (PyObject*)__Pyx_PyCode_New(7, 0, 7, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__6, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_init, 19, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__7)) __PYX_ERR(0, 19, __pyx_L1_error)
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":53
+  /* "mpfmc/core/audio/playlist_controller.pyx":69
  *         self.log.debug("Created PlaylistController %s: ", self._track.name)
  * 
  *     def __dealloc__(self):             # <<<<<<<<<<<<<<
  *         """Destructor"""
  *         pass
  */
-  __pyx_tuple__8 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(0, 53, __pyx_L1_error)
+  __pyx_tuple__8 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(0, 69, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__8);
   __Pyx_GIVEREF(__pyx_tuple__8);
-  __pyx_codeobj__9 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__8, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_dealloc, 53, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__9)) __PYX_ERR(0, 53, __pyx_L1_error)
+  __pyx_codeobj__9 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__8, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_dealloc, 69, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__9)) __PYX_ERR(0, 69, __pyx_L1_error)
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":57
+  /* "mpfmc/core/audio/playlist_controller.pyx":73
  *         pass
  * 
  *     def __repr__(self):             # <<<<<<<<<<<<<<
  *         return '<PlaylistController.{}>'.format(self.name)
  * 
  */
-  __pyx_tuple__10 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(0, 57, __pyx_L1_error)
+  __pyx_tuple__10 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(0, 73, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__10);
   __Pyx_GIVEREF(__pyx_tuple__10);
-  __pyx_codeobj__11 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__10, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_repr, 57, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__11)) __PYX_ERR(0, 57, __pyx_L1_error)
+  __pyx_codeobj__11 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__10, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_repr, 73, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__11)) __PYX_ERR(0, 73, __pyx_L1_error)
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":61
+  /* "mpfmc/core/audio/playlist_controller.pyx":77
  * 
  *     @property
  *     def name(self):             # <<<<<<<<<<<<<<
  *         """The name of the playlist controller (and corresponding audio track)"""
  *         return self._track.name
  */
-  __pyx_tuple__12 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(0, 61, __pyx_L1_error)
+  __pyx_tuple__12 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(0, 77, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__12);
   __Pyx_GIVEREF(__pyx_tuple__12);
-  __pyx_codeobj__13 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__12, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_name, 61, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__13)) __PYX_ERR(0, 61, __pyx_L1_error)
+  __pyx_codeobj__13 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__12, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_name, 77, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__13)) __PYX_ERR(0, 77, __pyx_L1_error)
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":66
+  /* "mpfmc/core/audio/playlist_controller.pyx":82
  * 
  *     @property
  *     def track(self):             # <<<<<<<<<<<<<<
  *         """The corresponding audio track the playlist is managing"""
  *         return self._track
  */
-  __pyx_tuple__14 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__14)) __PYX_ERR(0, 66, __pyx_L1_error)
+  __pyx_tuple__14 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__14)) __PYX_ERR(0, 82, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__14);
   __Pyx_GIVEREF(__pyx_tuple__14);
-  __pyx_codeobj__15 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__14, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_track, 66, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__15)) __PYX_ERR(0, 66, __pyx_L1_error)
+  __pyx_codeobj__15 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__14, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_track, 82, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__15)) __PYX_ERR(0, 82, __pyx_L1_error)
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":71
+  /* "mpfmc/core/audio/playlist_controller.pyx":87
  * 
  *     @property
  *     def crossfade_time(self):             # <<<<<<<<<<<<<<
  *         """The time (secs) to use when fading between sounds"""
  *         return self._crossfade_time
  */
-  __pyx_tuple__16 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__16)) __PYX_ERR(0, 71, __pyx_L1_error)
+  __pyx_tuple__16 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__16)) __PYX_ERR(0, 87, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__16);
   __Pyx_GIVEREF(__pyx_tuple__16);
-  __pyx_codeobj__17 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__16, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_crossfade_time, 71, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__17)) __PYX_ERR(0, 71, __pyx_L1_error)
+  __pyx_codeobj__17 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__16, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_crossfade_time, 87, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__17)) __PYX_ERR(0, 87, __pyx_L1_error)
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":76
+  /* "mpfmc/core/audio/playlist_controller.pyx":92
+ * 
+ *     @property
+ *     def decode_ahead_time(self):             # <<<<<<<<<<<<<<
+ *         """The time (secs) before a transition at which the next sound is prepared for playback"""
+ *         return self._decode_ahead_time
+ */
+  __pyx_tuple__18 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__18)) __PYX_ERR(0, 92, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__18);
+  __Pyx_GIVEREF(__pyx_tuple__18);
+  __pyx_codeobj__19 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__18, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_decode_ahead_time, 92, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__19)) __PYX_ERR(0, 92, __pyx_L1_error)
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":97
+ * 
+ *     @property
+ *     def gapless(self):             # <<<<<<<<<<<<<<
+ *         """Whether sounds follow each other without any gap or crossfade"""
+ *         return self._gapless
+ */
+  __pyx_tuple__20 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__20)) __PYX_ERR(0, 97, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__20);
+  __Pyx_GIVEREF(__pyx_tuple__20);
+  __pyx_codeobj__21 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__20, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_gapless, 97, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__21)) __PYX_ERR(0, 97, __pyx_L1_error)
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":102
+ * 
+ *     @property
+ *     def has_prepared_sound(self):             # <<<<<<<<<<<<<<
+ *         """Whether the next sound has been prepared and is waiting for the current sound to finish"""
+ *         return self._prepared_sound_instance is not None
+ */
+  __pyx_tuple__22 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__22)) __PYX_ERR(0, 102, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__22);
+  __Pyx_GIVEREF(__pyx_tuple__22);
+  __pyx_codeobj__23 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__22, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_has_prepared_sound, 102, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__23)) __PYX_ERR(0, 102, __pyx_L1_error)
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":107
  * 
  *     @property
  *     def has_pending_request(self):             # <<<<<<<<<<<<<<
  *         """Whether the playlist controller has a pending request queued until it is not busy"""
  *         return self._pending_request is not None
  */
-  __pyx_tuple__18 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__18)) __PYX_ERR(0, 76, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__18);
-  __Pyx_GIVEREF(__pyx_tuple__18);
-  __pyx_codeobj__19 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__18, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_has_pending_request, 76, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__19)) __PYX_ERR(0, 76, __pyx_L1_error)
+  __pyx_tuple__24 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__24)) __PYX_ERR(0, 107, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__24);
+  __Pyx_GIVEREF(__pyx_tuple__24);
+  __pyx_codeobj__25 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__24, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_has_pending_request, 107, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__25)) __PYX_ERR(0, 107, __pyx_L1_error)
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":80
+  /* "mpfmc/core/audio/playlist_controller.pyx":111
  *         return self._pending_request is not None
  * 
  *     def stop_all_sounds(self, float fade_out_seconds = 0.0):             # <<<<<<<<<<<<<<
  *         """
  *         Stops all playing sounds immediately on the playlist track.
  */
-  __pyx_tuple__20 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_fade_out_seconds); if (unlikely(!__pyx_tuple__20)) __PYX_ERR(0, 80, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__20);
-  __Pyx_GIVEREF(__pyx_tuple__20);
-  __pyx_codeobj__21 = (PyObject*)__Pyx_PyCode_New(2, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__20, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_stop_all_sounds, 80, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__21)) __PYX_ERR(0, 80, __pyx_L1_error)
+  __pyx_tuple__26 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_fade_out_seconds); if (unlikely(!__pyx_tuple__26)) __PYX_ERR(0, 111, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__26);
+  __Pyx_GIVEREF(__pyx_tuple__26);
+  __pyx_codeobj__27 = (PyObject*)__Pyx_PyCode_New(2, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__26, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_stop_all_sounds, 111, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__27)) __PYX_ERR(0, 111, __pyx_L1_error)
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":90
+  /* "mpfmc/core/audio/playlist_controller.pyx":122
  *         # TODO: playlist housekeeping (stopped events, remove instance, etc.)
  * 
  *     def play(self, str playlist not None, str context=None, dict player_settings=None):             # <<<<<<<<<<<<<<
  *         """
  *         Immediately play a playlist.
  */
-  __pyx_tuple__22 = PyTuple_Pack(7, __pyx_n_s_self, __pyx_n_s_playlist, __pyx_n_s_context, __pyx_n_s_player_settings, __pyx_n_s_playlist_instance, __pyx_n_s_event, __pyx_n_s_sound_name); if (unlikely(!__pyx_tuple__22)) __PYX_ERR(0, 90, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__22);
-  __Pyx_GIVEREF(__pyx_tuple__22);
-  __pyx_codeobj__23 = (PyObject*)__Pyx_PyCode_New(4, 0, 7, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__22, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_play, 90, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__23)) __PYX_ERR(0, 90, __pyx_L1_error)
-  __pyx_tuple__24 = PyTuple_Pack(2, ((PyObject *)Py_None), ((PyObject *)Py_None)); if (unlikely(!__pyx_tuple__24)) __PYX_ERR(0, 90, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__24);
-  __Pyx_GIVEREF(__pyx_tuple__24);
+  __pyx_tuple__28 = PyTuple_Pack(8, __pyx_n_s_self, __pyx_n_s_playlist, __pyx_n_s_context, __pyx_n_s_player_settings, __pyx_n_s_start_sample, __pyx_n_s_playlist_instance, __pyx_n_s_event, __pyx_n_s_sound_name); if (unlikely(!__pyx_tuple__28)) __PYX_ERR(0, 122, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__28);
+  __Pyx_GIVEREF(__pyx_tuple__28);
+  __pyx_codeobj__29 = (PyObject*)__Pyx_PyCode_New(4, 0, 8, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__28, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_play, 122, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__29)) __PYX_ERR(0, 122, __pyx_L1_error)
+  __pyx_tuple__30 = PyTuple_Pack(2, ((PyObject *)Py_None), ((PyObject *)Py_None)); if (unlikely(!__pyx_tuple__30)) __PYX_ERR(0, 122, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__30);
+  __Pyx_GIVEREF(__pyx_tuple__30);
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":146
+  /* "mpfmc/core/audio/playlist_controller.pyx":185
  *         return playlist_instance
  * 
  *     def _is_busy(self):             # <<<<<<<<<<<<<<
  *         """Returns whether or not all the sound players for the playlist track are currently busy"""
  *         if self._track.get_sound_players_in_use_count() > 1:
  */
-  __pyx_tuple__25 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__25)) __PYX_ERR(0, 146, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__25);
-  __Pyx_GIVEREF(__pyx_tuple__25);
-  __pyx_codeobj__26 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__25, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_is_busy, 146, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__26)) __PYX_ERR(0, 146, __pyx_L1_error)
+  __pyx_tuple__31 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__31)) __PYX_ERR(0, 185, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__31);
+  __Pyx_GIVEREF(__pyx_tuple__31);
+  __pyx_codeobj__32 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__31, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_is_busy, 185, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__32)) __PYX_ERR(0, 185, __pyx_L1_error)
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":153
+  /* "mpfmc/core/audio/playlist_controller.pyx":192
  *             return False
  * 
- *     def _play_playlist_sound(self, str sound_name, object playlist, float fade_in=0.0):             # <<<<<<<<<<<<<<
+ *     def _play_playlist_sound(self, str sound_name, object playlist, float fade_in=0.0, start_sample=None):             # <<<<<<<<<<<<<<
  *         """
  *         Plays the specified playlist sound
  */
-  __pyx_tuple__27 = PyTuple_Pack(9, __pyx_n_s_self, __pyx_n_s_sound_name, __pyx_n_s_playlist, __pyx_n_s_fade_in, __pyx_n_s_sound, __pyx_n_s_events_when_stopped, __pyx_n_s_events_when_about_to_finish, __pyx_n_s_event, __pyx_n_s_sound_instance); if (unlikely(!__pyx_tuple__27)) __PYX_ERR(0, 153, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__27);
-  __Pyx_GIVEREF(__pyx_tuple__27);
-  __pyx_codeobj__28 = (PyObject*)__Pyx_PyCode_New(4, 0, 9, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__27, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_play_playlist_sound, 153, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__28)) __PYX_ERR(0, 153, __pyx_L1_error)
+  __pyx_tuple__33 = PyTuple_Pack(9, __pyx_n_s_self, __pyx_n_s_sound_name, __pyx_n_s_playlist, __pyx_n_s_fade_in, __pyx_n_s_start_sample, __pyx_n_s_sound, __pyx_n_s_event, __pyx_n_s_settings, __pyx_n_s_sound_instance); if (unlikely(!__pyx_tuple__33)) __PYX_ERR(0, 192, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__33);
+  __Pyx_GIVEREF(__pyx_tuple__33);
+  __pyx_codeobj__34 = (PyObject*)__Pyx_PyCode_New(5, 0, 9, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__33, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_play_playlist_sound, 192, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__34)) __PYX_ERR(0, 192, __pyx_L1_error)
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":200
+  /* "mpfmc/core/audio/playlist_controller.pyx":222
  *         playlist.current_sound_instance = sound_instance
  * 
- *     def stop(self):             # <<<<<<<<<<<<<<
- *         """Immediately stop the currently playing playlist. Will fade out using the crossfade setting."""
- *         if not self._current_playlist:
+ *     def _get_playlist_sound_settings(self, object sound, object playlist, float fade_in=0.0):             # <<<<<<<<<<<<<<
+ *         """Returns the settings used to play a playlist sound (overrides certain settings needed
+ *         to manage the playlist)."""
  */
-  __pyx_tuple__29 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__29)) __PYX_ERR(0, 200, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__29);
-  __Pyx_GIVEREF(__pyx_tuple__29);
-  __pyx_codeobj__30 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__29, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_stop, 200, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__30)) __PYX_ERR(0, 200, __pyx_L1_error)
+  __pyx_tuple__35 = PyTuple_Pack(7, __pyx_n_s_self, __pyx_n_s_sound, __pyx_n_s_playlist, __pyx_n_s_fade_in, __pyx_n_s_events_when_played, __pyx_n_s_events_when_stopped, __pyx_n_s_events_when_about_to_finish); if (unlikely(!__pyx_tuple__35)) __PYX_ERR(0, 222, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__35);
+  __Pyx_GIVEREF(__pyx_tuple__35);
+  __pyx_codeobj__36 = (PyObject*)__Pyx_PyCode_New(4, 0, 7, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__35, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_get_playlist_sound_settings, 222, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__36)) __PYX_ERR(0, 222, __pyx_L1_error)
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":216
+  /* "mpfmc/core/audio/playlist_controller.pyx":253
+ *         }
+ * 
+ *     def _get_next_sound_name(self):             # <<<<<<<<<<<<<<
+ *         """Returns the name of the next sound of the current playlist (a sound that has already
+ *         been taken from the playlist but has not been played is returned first).  Posts the
+ */
+  __pyx_tuple__37 = PyTuple_Pack(3, __pyx_n_s_self, __pyx_n_s_sound_name, __pyx_n_s_event); if (unlikely(!__pyx_tuple__37)) __PYX_ERR(0, 253, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__37);
+  __Pyx_GIVEREF(__pyx_tuple__37);
+  __pyx_codeobj__38 = (PyObject*)__Pyx_PyCode_New(1, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__37, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_get_next_sound_name_2, 253, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__38)) __PYX_ERR(0, 253, __pyx_L1_error)
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":270
+ *         return self._current_playlist.get_next_sound_name()
+ * 
+ *     def _has_next_sound(self, object playlist):             # <<<<<<<<<<<<<<
+ *         """Returns whether there is another sound to play after the current one in the playlist"""
+ *         return not playlist.end_of_playlist or playlist.repeat or self._next_sound_name is not None
+ */
+  __pyx_tuple__39 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_playlist); if (unlikely(!__pyx_tuple__39)) __PYX_ERR(0, 270, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__39);
+  __Pyx_GIVEREF(__pyx_tuple__39);
+  __pyx_codeobj__40 = (PyObject*)__Pyx_PyCode_New(2, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__39, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_has_next_sound, 270, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__40)) __PYX_ERR(0, 270, __pyx_L1_error)
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":274
+ *         return not playlist.end_of_playlist or playlist.repeat or self._next_sound_name is not None
+ * 
+ *     def _schedule_prepare_next_sound(self, sound_instance):             # <<<<<<<<<<<<<<
+ *         """Schedules the preparation of the next playlist sound the decode ahead time before the
+ *         current sound instance reaches its transition point (about to finish marker or end).  In
+ */
+  __pyx_tuple__41 = PyTuple_Pack(3, __pyx_n_s_self, __pyx_n_s_sound_instance, __pyx_n_s_delay); if (unlikely(!__pyx_tuple__41)) __PYX_ERR(0, 274, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__41);
+  __Pyx_GIVEREF(__pyx_tuple__41);
+  __pyx_codeobj__42 = (PyObject*)__Pyx_PyCode_New(2, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__41, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_schedule_prepare_next_sound, 274, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__42)) __PYX_ERR(0, 274, __pyx_L1_error)
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":302
+ *             partial(self._prepare_next_sound, sound_instance), max(delay, 0.0))
+ * 
+ *     def _on_current_sound_loaded(self, sound_instance, sound=None):             # <<<<<<<<<<<<<<
+ *         """Callback function called when the sound of the current sound instance has been loaded
+ *         (schedules the preparation of the next sound)."""
+ */
+  __pyx_tuple__43 = PyTuple_Pack(3, __pyx_n_s_self, __pyx_n_s_sound_instance, __pyx_n_s_sound); if (unlikely(!__pyx_tuple__43)) __PYX_ERR(0, 302, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__43);
+  __Pyx_GIVEREF(__pyx_tuple__43);
+  __pyx_codeobj__44 = (PyObject*)__Pyx_PyCode_New(3, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__43, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_on_current_sound_loaded, 302, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__44)) __PYX_ERR(0, 302, __pyx_L1_error)
+  __pyx_tuple__45 = PyTuple_Pack(1, ((PyObject *)Py_None)); if (unlikely(!__pyx_tuple__45)) __PYX_ERR(0, 302, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__45);
+  __Pyx_GIVEREF(__pyx_tuple__45);
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":309
+ *             self._schedule_prepare_next_sound(sound_instance)
+ * 
+ *     def _prepare_next_sound(self, sound_instance, dt=None):             # <<<<<<<<<<<<<<
+ *         """Loads the next playlist sound and schedules it on the track to start when the specified
+ *         (current) sound instance reaches its about to finish marker (crossfade) or its end
+ */
+  __pyx_tuple__46 = PyTuple_Pack(7, __pyx_n_s_self, __pyx_n_s_sound_instance, __pyx_n_s_dt, __pyx_n_s_playlist, __pyx_n_s_sound_name, __pyx_n_s_sound, __pyx_n_s_settings); if (unlikely(!__pyx_tuple__46)) __PYX_ERR(0, 309, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__46);
+  __Pyx_GIVEREF(__pyx_tuple__46);
+  __pyx_codeobj__47 = (PyObject*)__Pyx_PyCode_New(3, 0, 7, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__46, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_prepare_next_sound, 309, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__47)) __PYX_ERR(0, 309, __pyx_L1_error)
+  __pyx_tuple__48 = PyTuple_Pack(1, ((PyObject *)Py_None)); if (unlikely(!__pyx_tuple__48)) __PYX_ERR(0, 309, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__48);
+  __Pyx_GIVEREF(__pyx_tuple__48);
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":349
+ *             self._prepared_sound_name = sound_name
+ * 
+ *     def _cancel_prepared_sound(self):             # <<<<<<<<<<<<<<
+ *         """Cancels the prepared next sound (if it has not started yet).  The sound will be the
+ *         next one played by the playlist."""
+ */
+  __pyx_tuple__49 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_sound_instance); if (unlikely(!__pyx_tuple__49)) __PYX_ERR(0, 349, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__49);
+  __Pyx_GIVEREF(__pyx_tuple__49);
+  __pyx_codeobj__50 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__49, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_cancel_prepared_sound, 349, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__50)) __PYX_ERR(0, 349, __pyx_L1_error)
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":364
+ *             self._track.stop_sound_instance(sound_instance, 0.0)
+ * 
+ *     def stop(self, start_sample=None):             # <<<<<<<<<<<<<<
+ *         """Immediately stop the currently playing playlist. Will fade out using the crossfade setting.
+ * 
+ */
+  __pyx_tuple__51 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_start_sample); if (unlikely(!__pyx_tuple__51)) __PYX_ERR(0, 364, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__51);
+  __Pyx_GIVEREF(__pyx_tuple__51);
+  __pyx_codeobj__52 = (PyObject*)__Pyx_PyCode_New(2, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__51, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_stop, 364, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__52)) __PYX_ERR(0, 364, __pyx_L1_error)
+  __pyx_tuple__53 = PyTuple_Pack(1, ((PyObject *)Py_None)); if (unlikely(!__pyx_tuple__53)) __PYX_ERR(0, 364, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__53);
+  __Pyx_GIVEREF(__pyx_tuple__53);
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":387
  *         self._current_playlist = None
  * 
- *     def advance(self):             # <<<<<<<<<<<<<<
- *         """Advance the currently playing playlist to the next sound."""
+ *     def advance(self, start_sample=None):             # <<<<<<<<<<<<<<
+ *         """Advance the currently playing playlist to the next sound.
  * 
  */
-  __pyx_tuple__31 = PyTuple_Pack(3, __pyx_n_s_self, __pyx_n_s_event, __pyx_n_s_next_sound_name); if (unlikely(!__pyx_tuple__31)) __PYX_ERR(0, 216, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__31);
-  __Pyx_GIVEREF(__pyx_tuple__31);
-  __pyx_codeobj__32 = (PyObject*)__Pyx_PyCode_New(1, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__31, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_advance, 216, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__32)) __PYX_ERR(0, 216, __pyx_L1_error)
+  __pyx_tuple__54 = PyTuple_Pack(3, __pyx_n_s_self, __pyx_n_s_start_sample, __pyx_n_s_next_sound_name_2); if (unlikely(!__pyx_tuple__54)) __PYX_ERR(0, 387, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__54);
+  __Pyx_GIVEREF(__pyx_tuple__54);
+  __pyx_codeobj__55 = (PyObject*)__Pyx_PyCode_New(2, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__54, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_advance, 387, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__55)) __PYX_ERR(0, 387, __pyx_L1_error)
+  __pyx_tuple__56 = PyTuple_Pack(1, ((PyObject *)Py_None)); if (unlikely(!__pyx_tuple__56)) __PYX_ERR(0, 387, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__56);
+  __Pyx_GIVEREF(__pyx_tuple__56);
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":249
- *             self._play_playlist_sound(next_sound_name, self._current_playlist, self._current_playlist.crossfade_time)
+  /* "mpfmc/core/audio/playlist_controller.pyx":422
+ *                                       start_sample)
+ * 
+ *     def _stop_playlist_sound(self, sound_instance, start_sample=None):             # <<<<<<<<<<<<<<
+ *         """Stops a playlist sound (fading out using the crossfade setting), now or at an audio
+ *         clock sample position."""
+ */
+  __pyx_tuple__57 = PyTuple_Pack(3, __pyx_n_s_self, __pyx_n_s_sound_instance, __pyx_n_s_start_sample); if (unlikely(!__pyx_tuple__57)) __PYX_ERR(0, 422, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__57);
+  __Pyx_GIVEREF(__pyx_tuple__57);
+  __pyx_codeobj__58 = (PyObject*)__Pyx_PyCode_New(3, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__57, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_stop_playlist_sound, 422, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__58)) __PYX_ERR(0, 422, __pyx_L1_error)
+  __pyx_tuple__59 = PyTuple_Pack(1, ((PyObject *)Py_None)); if (unlikely(!__pyx_tuple__59)) __PYX_ERR(0, 422, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__59);
+  __Pyx_GIVEREF(__pyx_tuple__59);
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":430
+ *             self._track.stop_sound_instance_at(sound_instance, start_sample, self._current_playlist.crossfade_time)
  * 
  *     def set_repeat(self, repeat=True):             # <<<<<<<<<<<<<<
  *         """Set whether or not the currently playing playlist should repeat when finished."""
  * 
  */
-  __pyx_tuple__33 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_repeat); if (unlikely(!__pyx_tuple__33)) __PYX_ERR(0, 249, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__33);
-  __Pyx_GIVEREF(__pyx_tuple__33);
-  __pyx_codeobj__34 = (PyObject*)__Pyx_PyCode_New(2, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__33, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_set_repeat, 249, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__34)) __PYX_ERR(0, 249, __pyx_L1_error)
-  __pyx_tuple__35 = PyTuple_Pack(1, ((PyObject *)Py_True)); if (unlikely(!__pyx_tuple__35)) __PYX_ERR(0, 249, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__35);
-  __Pyx_GIVEREF(__pyx_tuple__35);
+  __pyx_tuple__60 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_repeat); if (unlikely(!__pyx_tuple__60)) __PYX_ERR(0, 430, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__60);
+  __Pyx_GIVEREF(__pyx_tuple__60);
+  __pyx_codeobj__61 = (PyObject*)__Pyx_PyCode_New(2, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__60, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_set_repeat, 430, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__61)) __PYX_ERR(0, 430, __pyx_L1_error)
+  __pyx_tuple__62 = PyTuple_Pack(1, ((PyObject *)Py_True)); if (unlikely(!__pyx_tuple__62)) __PYX_ERR(0, 430, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__62);
+  __Pyx_GIVEREF(__pyx_tuple__62);
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":259
+  /* "mpfmc/core/audio/playlist_controller.pyx":440
  *                            "Could not set repeat to {}.", str(repeat))
  * 
+ *     def _on_sound_instance_played(self, sound_instance=None, **kwargs):             # <<<<<<<<<<<<<<
+ *         """Callback function called whenever a playlist sound has started playing."""
+ * 
+ */
+  __pyx_tuple__63 = PyTuple_Pack(5, __pyx_n_s_self, __pyx_n_s_sound_instance, __pyx_n_s_kwargs, __pyx_n_s_playlist, __pyx_n_s_event); if (unlikely(!__pyx_tuple__63)) __PYX_ERR(0, 440, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__63);
+  __Pyx_GIVEREF(__pyx_tuple__63);
+  __pyx_codeobj__64 = (PyObject*)__Pyx_PyCode_New(2, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS|CO_VARKEYWORDS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__63, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_on_sound_instance_played, 440, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__64)) __PYX_ERR(0, 440, __pyx_L1_error)
+  __pyx_tuple__65 = PyTuple_Pack(1, ((PyObject *)Py_None)); if (unlikely(!__pyx_tuple__65)) __PYX_ERR(0, 440, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__65);
+  __Pyx_GIVEREF(__pyx_tuple__65);
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":466
+ *             self._schedule_prepare_next_sound(sound_instance)
+ * 
  *     def _on_sound_instance_stopped(self, sound_instance=None, **kwargs):             # <<<<<<<<<<<<<<
  *         """Callback function called whenever a playlist sound has finished playing."""
  * 
  */
-  __pyx_tuple__36 = PyTuple_Pack(6, __pyx_n_s_self, __pyx_n_s_sound_instance, __pyx_n_s_kwargs, __pyx_n_s_playlist, __pyx_n_s_event, __pyx_n_s_request); if (unlikely(!__pyx_tuple__36)) __PYX_ERR(0, 259, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__36);
-  __Pyx_GIVEREF(__pyx_tuple__36);
-  __pyx_codeobj__37 = (PyObject*)__Pyx_PyCode_New(2, 0, 6, 0, CO_OPTIMIZED|CO_NEWLOCALS|CO_VARKEYWORDS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__36, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_on_sound_instance_stopped, 259, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__37)) __PYX_ERR(0, 259, __pyx_L1_error)
-  __pyx_tuple__38 = PyTuple_Pack(1, ((PyObject *)Py_None)); if (unlikely(!__pyx_tuple__38)) __PYX_ERR(0, 259, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__38);
-  __Pyx_GIVEREF(__pyx_tuple__38);
+  __pyx_tuple__66 = PyTuple_Pack(6, __pyx_n_s_self, __pyx_n_s_sound_instance, __pyx_n_s_kwargs, __pyx_n_s_playlist, __pyx_n_s_event, __pyx_n_s_request); if (unlikely(!__pyx_tuple__66)) __PYX_ERR(0, 466, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__66);
+  __Pyx_GIVEREF(__pyx_tuple__66);
+  __pyx_codeobj__67 = (PyObject*)__Pyx_PyCode_New(2, 0, 6, 0, CO_OPTIMIZED|CO_NEWLOCALS|CO_VARKEYWORDS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__66, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_on_sound_instance_stopped, 466, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__67)) __PYX_ERR(0, 466, __pyx_L1_error)
+  __pyx_tuple__68 = PyTuple_Pack(1, ((PyObject *)Py_None)); if (unlikely(!__pyx_tuple__68)) __PYX_ERR(0, 466, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__68);
+  __Pyx_GIVEREF(__pyx_tuple__68);
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":297
- *             request()
+  /* "mpfmc/core/audio/playlist_controller.pyx":520
+ *             self._prepare_next_sound(self._current_playlist.current_sound_instance)
  * 
  *     def _on_sound_instance_about_to_finish(self, sound_instance=None, **kwargs):             # <<<<<<<<<<<<<<
  *         """Callback function called whenever a playlist sound is about to finish playing."""
  * 
  */
-  __pyx_tuple__39 = PyTuple_Pack(4, __pyx_n_s_self, __pyx_n_s_sound_instance, __pyx_n_s_kwargs, __pyx_n_s_playlist); if (unlikely(!__pyx_tuple__39)) __PYX_ERR(0, 297, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__39);
-  __Pyx_GIVEREF(__pyx_tuple__39);
-  __pyx_codeobj__40 = (PyObject*)__Pyx_PyCode_New(2, 0, 4, 0, CO_OPTIMIZED|CO_NEWLOCALS|CO_VARKEYWORDS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__39, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_on_sound_instance_about_to_fini, 297, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__40)) __PYX_ERR(0, 297, __pyx_L1_error)
-  __pyx_tuple__41 = PyTuple_Pack(1, ((PyObject *)Py_None)); if (unlikely(!__pyx_tuple__41)) __PYX_ERR(0, 297, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__41);
-  __Pyx_GIVEREF(__pyx_tuple__41);
+  __pyx_tuple__69 = PyTuple_Pack(4, __pyx_n_s_self, __pyx_n_s_sound_instance, __pyx_n_s_kwargs, __pyx_n_s_playlist); if (unlikely(!__pyx_tuple__69)) __PYX_ERR(0, 520, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__69);
+  __Pyx_GIVEREF(__pyx_tuple__69);
+  __pyx_codeobj__70 = (PyObject*)__Pyx_PyCode_New(2, 0, 4, 0, CO_OPTIMIZED|CO_NEWLOCALS|CO_VARKEYWORDS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__69, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_on_sound_instance_about_to_fini, 520, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__70)) __PYX_ERR(0, 520, __pyx_L1_error)
+  __pyx_tuple__71 = PyTuple_Pack(1, ((PyObject *)Py_None)); if (unlikely(!__pyx_tuple__71)) __PYX_ERR(0, 520, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__71);
+  __Pyx_GIVEREF(__pyx_tuple__71);
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":317
+  /* "mpfmc/core/audio/playlist_controller.pyx":541
  *         self.advance()
  * 
  *     def clear_context(self, context):             # <<<<<<<<<<<<<<
  *         """
  *         Stops the current playlist if it was played from the specified context.
  */
-  __pyx_tuple__42 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_context); if (unlikely(!__pyx_tuple__42)) __PYX_ERR(0, 317, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__42);
-  __Pyx_GIVEREF(__pyx_tuple__42);
-  __pyx_codeobj__43 = (PyObject*)__Pyx_PyCode_New(2, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__42, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_clear_context, 317, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__43)) __PYX_ERR(0, 317, __pyx_L1_error)
+  __pyx_tuple__72 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_context); if (unlikely(!__pyx_tuple__72)) __PYX_ERR(0, 541, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__72);
+  __Pyx_GIVEREF(__pyx_tuple__72);
+  __pyx_codeobj__73 = (PyObject*)__Pyx_PyCode_New(2, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__72, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_mpfmc_core_audio_playlist_contro_2, __pyx_n_s_clear_context, 541, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__73)) __PYX_ERR(0, 541, __pyx_L1_error)
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -7560,6 +13859,8 @@ static int __pyx_pymod_exec_playlist_controller(PyObject *__pyx_pyinit_module)
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
   __Pyx_RefNannyDeclarations
   #if CYTHON_PEP489_MULTI_PHASE_INIT
   if (__pyx_m && __pyx_m == __pyx_pyinit_module) return 0;
@@ -7648,8 +13949,8 @@ static int __pyx_pymod_exec_playlist_controller(PyObject *__pyx_pyinit_module)
   /*--- Function export code ---*/
   /*--- Type init code ---*/
   /*--- Type import code ---*/
-  __pyx_ptype_5mpfmc_4core_5audio_5track_Track = __Pyx_ImportType("mpfmc.core.audio.track", "Track", sizeof(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track), 1); if (unlikely(!__pyx_ptype_5mpfmc_4core_5audio_5track_Track)) __PYX_ERR(1, 51, __pyx_L1_error)
-  __pyx_vtabptr_5mpfmc_4core_5audio_5track_Track = (struct __pyx_vtabstruct_5mpfmc_4core_5audio_5track_Track*)__Pyx_GetVtable(__pyx_ptype_5mpfmc_4core_5audio_5track_Track->tp_dict); if (unlikely(!__pyx_vtabptr_5mpfmc_4core_5audio_5track_Track)) __PYX_ERR(1, 51, __pyx_L1_error)
+  __pyx_ptype_5mpfmc_4core_5audio_5track_Track = __Pyx_ImportType("mpfmc.core.audio.track", "Track", sizeof(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track), 1); if (unlikely(!__pyx_ptype_5mpfmc_4core_5audio_5track_Track)) __PYX_ERR(3, 60, __pyx_L1_error)
+  __pyx_vtabptr_5mpfmc_4core_5audio_5track_Track = (struct __pyx_vtabstruct_5mpfmc_4core_5audio_5track_Track*)__Pyx_GetVtable(__pyx_ptype_5mpfmc_4core_5audio_5track_Track->tp_dict); if (unlikely(!__pyx_vtabptr_5mpfmc_4core_5audio_5track_Track)) __PYX_ERR(3, 60, __pyx_L1_error)
   /*--- Variable import code ---*/
   /*--- Function import code ---*/
   /*--- Execution code ---*/
@@ -7724,306 +14025,542 @@ static int __pyx_pymod_exec_playlist_controller(PyObject *__pyx_pyinit_module)
   /* "mpfmc/core/audio/playlist_controller.pyx":19
  *     """
  * 
- *     def __init__(self, object mc, object track, float crossfade_time=0.0, float volume=1.0):             # <<<<<<<<<<<<<<
+ *     def __init__(self, object mc, object track, float crossfade_time=0.0, float volume=1.0,             # <<<<<<<<<<<<<<
+ *                  float decode_ahead_time=0.0, bint gapless=False):
  *         """
- *         Constructor
  */
   __pyx_t_2 = PyFloat_FromDouble(((double)0.0)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 19, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_t_3 = PyFloat_FromDouble(((double)1.0)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 19, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 19, __pyx_L1_error)
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":20
+ * 
+ *     def __init__(self, object mc, object track, float crossfade_time=0.0, float volume=1.0,
+ *                  float decode_ahead_time=0.0, bint gapless=False):             # <<<<<<<<<<<<<<
+ *         """
+ *         Constructor
+ */
+  __pyx_t_4 = PyFloat_FromDouble(((double)0.0)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 20, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __Pyx_PyBool_FromLong(((int)0)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 20, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":19
+ *     """
+ * 
+ *     def __init__(self, object mc, object track, float crossfade_time=0.0, float volume=1.0,             # <<<<<<<<<<<<<<
+ *                  float decode_ahead_time=0.0, bint gapless=False):
+ *         """
+ */
+  __pyx_t_6 = PyTuple_New(4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 19, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
   __Pyx_GIVEREF(__pyx_t_2);
-  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_3);
-  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_6, 2, __pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_6, 3, __pyx_t_5);
   __pyx_t_2 = 0;
   __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_1__init__, 0, __pyx_n_s_PlaylistController___init, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__7)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 19, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_3, __pyx_t_4);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_init, __pyx_t_3) < 0) __PYX_ERR(0, 19, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_4 = 0;
+  __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_1__init__, 0, __pyx_n_s_PlaylistController___init, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__7)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 19, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_5, __pyx_t_6);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_init, __pyx_t_5) < 0) __PYX_ERR(0, 19, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":53
+  /* "mpfmc/core/audio/playlist_controller.pyx":69
  *         self.log.debug("Created PlaylistController %s: ", self._track.name)
  * 
  *     def __dealloc__(self):             # <<<<<<<<<<<<<<
  *         """Destructor"""
  *         pass
  */
-  __pyx_t_3 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_3__dealloc__, 0, __pyx_n_s_PlaylistController___dealloc, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__9)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 53, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_dealloc, __pyx_t_3) < 0) __PYX_ERR(0, 53, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_5 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_3__dealloc__, 0, __pyx_n_s_PlaylistController___dealloc, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__9)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 69, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_dealloc, __pyx_t_5) < 0) __PYX_ERR(0, 69, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":57
+  /* "mpfmc/core/audio/playlist_controller.pyx":73
  *         pass
  * 
  *     def __repr__(self):             # <<<<<<<<<<<<<<
  *         return '<PlaylistController.{}>'.format(self.name)
  * 
  */
-  __pyx_t_3 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_5__repr__, 0, __pyx_n_s_PlaylistController___repr, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__11)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 57, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_repr, __pyx_t_3) < 0) __PYX_ERR(0, 57, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_5 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_5__repr__, 0, __pyx_n_s_PlaylistController___repr, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__11)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 73, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_repr, __pyx_t_5) < 0) __PYX_ERR(0, 73, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":61
+  /* "mpfmc/core/audio/playlist_controller.pyx":77
  * 
  *     @property
  *     def name(self):             # <<<<<<<<<<<<<<
  *         """The name of the playlist controller (and corresponding audio track)"""
  *         return self._track.name
  */
-  __pyx_t_3 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_7name, 0, __pyx_n_s_PlaylistController_name, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__13)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 61, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_7name, 0, __pyx_n_s_PlaylistController_name, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__13)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 77, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":60
+  /* "mpfmc/core/audio/playlist_controller.pyx":76
  *         return '<PlaylistController.{}>'.format(self.name)
  * 
  *     @property             # <<<<<<<<<<<<<<
  *     def name(self):
  *         """The name of the playlist controller (and corresponding audio track)"""
  */
-  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 60, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_GIVEREF(__pyx_t_3);
-  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3);
-  __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_property, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 60, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_name, __pyx_t_3) < 0) __PYX_ERR(0, 61, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 76, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_5);
+  __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_builtin_property, __pyx_t_6, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 76, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_name, __pyx_t_5) < 0) __PYX_ERR(0, 77, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":66
+  /* "mpfmc/core/audio/playlist_controller.pyx":82
  * 
  *     @property
  *     def track(self):             # <<<<<<<<<<<<<<
  *         """The corresponding audio track the playlist is managing"""
  *         return self._track
  */
-  __pyx_t_3 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_9track, 0, __pyx_n_s_PlaylistController_track, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__15)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 66, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_9track, 0, __pyx_n_s_PlaylistController_track, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__15)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 82, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":65
+  /* "mpfmc/core/audio/playlist_controller.pyx":81
  *         return self._track.name
  * 
  *     @property             # <<<<<<<<<<<<<<
  *     def track(self):
  *         """The corresponding audio track the playlist is managing"""
  */
-  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 65, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_GIVEREF(__pyx_t_3);
-  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3);
-  __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_property, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 65, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_track, __pyx_t_3) < 0) __PYX_ERR(0, 66, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 81, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_5);
+  __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_builtin_property, __pyx_t_6, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 81, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_track, __pyx_t_5) < 0) __PYX_ERR(0, 82, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":71
+  /* "mpfmc/core/audio/playlist_controller.pyx":87
  * 
  *     @property
  *     def crossfade_time(self):             # <<<<<<<<<<<<<<
  *         """The time (secs) to use when fading between sounds"""
  *         return self._crossfade_time
  */
-  __pyx_t_3 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_11crossfade_time, 0, __pyx_n_s_PlaylistController_crossfade_tim, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__17)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 71, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_11crossfade_time, 0, __pyx_n_s_PlaylistController_crossfade_tim, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__17)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 87, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":70
+  /* "mpfmc/core/audio/playlist_controller.pyx":86
  *         return self._track
  * 
  *     @property             # <<<<<<<<<<<<<<
  *     def crossfade_time(self):
  *         """The time (secs) to use when fading between sounds"""
  */
-  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 70, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_GIVEREF(__pyx_t_3);
-  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3);
-  __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_property, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 70, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_crossfade_time, __pyx_t_3) < 0) __PYX_ERR(0, 71, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 86, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_5);
+  __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_builtin_property, __pyx_t_6, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 86, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_crossfade_time, __pyx_t_5) < 0) __PYX_ERR(0, 87, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":76
+  /* "mpfmc/core/audio/playlist_controller.pyx":92
+ * 
+ *     @property
+ *     def decode_ahead_time(self):             # <<<<<<<<<<<<<<
+ *         """The time (secs) before a transition at which the next sound is prepared for playback"""
+ *         return self._decode_ahead_time
+ */
+  __pyx_t_5 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_13decode_ahead_time, 0, __pyx_n_s_PlaylistController_decode_ahead, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__19)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 92, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":91
+ *         return self._crossfade_time
+ * 
+ *     @property             # <<<<<<<<<<<<<<
+ *     def decode_ahead_time(self):
+ *         """The time (secs) before a transition at which the next sound is prepared for playback"""
+ */
+  __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 91, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_5);
+  __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_builtin_property, __pyx_t_6, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 91, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_decode_ahead_time, __pyx_t_5) < 0) __PYX_ERR(0, 92, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":97
+ * 
+ *     @property
+ *     def gapless(self):             # <<<<<<<<<<<<<<
+ *         """Whether sounds follow each other without any gap or crossfade"""
+ *         return self._gapless
+ */
+  __pyx_t_5 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_15gapless, 0, __pyx_n_s_PlaylistController_gapless, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__21)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 97, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":96
+ *         return self._decode_ahead_time
+ * 
+ *     @property             # <<<<<<<<<<<<<<
+ *     def gapless(self):
+ *         """Whether sounds follow each other without any gap or crossfade"""
+ */
+  __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 96, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_5);
+  __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_builtin_property, __pyx_t_6, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 96, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_gapless, __pyx_t_5) < 0) __PYX_ERR(0, 97, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":102
+ * 
+ *     @property
+ *     def has_prepared_sound(self):             # <<<<<<<<<<<<<<
+ *         """Whether the next sound has been prepared and is waiting for the current sound to finish"""
+ *         return self._prepared_sound_instance is not None
+ */
+  __pyx_t_5 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_17has_prepared_sound, 0, __pyx_n_s_PlaylistController_has_prepared, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__23)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 102, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":101
+ *         return self._gapless
+ * 
+ *     @property             # <<<<<<<<<<<<<<
+ *     def has_prepared_sound(self):
+ *         """Whether the next sound has been prepared and is waiting for the current sound to finish"""
+ */
+  __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 101, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_5);
+  __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_builtin_property, __pyx_t_6, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 101, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_has_prepared_sound, __pyx_t_5) < 0) __PYX_ERR(0, 102, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":107
  * 
  *     @property
  *     def has_pending_request(self):             # <<<<<<<<<<<<<<
  *         """Whether the playlist controller has a pending request queued until it is not busy"""
  *         return self._pending_request is not None
  */
-  __pyx_t_3 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_13has_pending_request, 0, __pyx_n_s_PlaylistController_has_pending_r, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__19)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 76, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_19has_pending_request, 0, __pyx_n_s_PlaylistController_has_pending_r, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__25)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 107, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":75
- *         return self._crossfade_time
+  /* "mpfmc/core/audio/playlist_controller.pyx":106
+ *         return self._prepared_sound_instance is not None
  * 
  *     @property             # <<<<<<<<<<<<<<
  *     def has_pending_request(self):
  *         """Whether the playlist controller has a pending request queued until it is not busy"""
  */
-  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 75, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_GIVEREF(__pyx_t_3);
-  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3);
-  __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_property, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 75, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_has_pending_request, __pyx_t_3) < 0) __PYX_ERR(0, 76, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 106, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_5);
+  __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_builtin_property, __pyx_t_6, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 106, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_has_pending_request, __pyx_t_5) < 0) __PYX_ERR(0, 107, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":80
+  /* "mpfmc/core/audio/playlist_controller.pyx":111
  *         return self._pending_request is not None
  * 
  *     def stop_all_sounds(self, float fade_out_seconds = 0.0):             # <<<<<<<<<<<<<<
  *         """
  *         Stops all playing sounds immediately on the playlist track.
  */
-  __pyx_t_3 = PyFloat_FromDouble(((double)0.0)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 80, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 80, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_GIVEREF(__pyx_t_3);
-  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3);
-  __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_15stop_all_sounds, 0, __pyx_n_s_PlaylistController_stop_all_soun, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__21)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 80, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_3, __pyx_t_4);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_stop_all_sounds, __pyx_t_3) < 0) __PYX_ERR(0, 80, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_5 = PyFloat_FromDouble(((double)0.0)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 111, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 111, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_5);
+  __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_21stop_all_sounds, 0, __pyx_n_s_PlaylistController_stop_all_soun, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__27)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 111, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_5, __pyx_t_6);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_stop_all_sounds, __pyx_t_5) < 0) __PYX_ERR(0, 111, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":90
+  /* "mpfmc/core/audio/playlist_controller.pyx":122
  *         # TODO: playlist housekeeping (stopped events, remove instance, etc.)
  * 
  *     def play(self, str playlist not None, str context=None, dict player_settings=None):             # <<<<<<<<<<<<<<
  *         """
  *         Immediately play a playlist.
  */
-  __pyx_t_3 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_17play, 0, __pyx_n_s_PlaylistController_play, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__23)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 90, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_3, __pyx_tuple__24);
-  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_play, __pyx_t_3) < 0) __PYX_ERR(0, 90, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_5 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_23play, 0, __pyx_n_s_PlaylistController_play, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__29)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 122, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_5, __pyx_tuple__30);
+  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_play, __pyx_t_5) < 0) __PYX_ERR(0, 122, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":146
+  /* "mpfmc/core/audio/playlist_controller.pyx":185
  *         return playlist_instance
  * 
  *     def _is_busy(self):             # <<<<<<<<<<<<<<
  *         """Returns whether or not all the sound players for the playlist track are currently busy"""
  *         if self._track.get_sound_players_in_use_count() > 1:
  */
-  __pyx_t_3 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_19_is_busy, 0, __pyx_n_s_PlaylistController__is_busy, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__26)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 146, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_is_busy, __pyx_t_3) < 0) __PYX_ERR(0, 146, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_5 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_25_is_busy, 0, __pyx_n_s_PlaylistController__is_busy, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__32)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 185, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_is_busy, __pyx_t_5) < 0) __PYX_ERR(0, 185, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":153
+  /* "mpfmc/core/audio/playlist_controller.pyx":192
  *             return False
  * 
- *     def _play_playlist_sound(self, str sound_name, object playlist, float fade_in=0.0):             # <<<<<<<<<<<<<<
+ *     def _play_playlist_sound(self, str sound_name, object playlist, float fade_in=0.0, start_sample=None):             # <<<<<<<<<<<<<<
  *         """
  *         Plays the specified playlist sound
  */
-  __pyx_t_3 = PyFloat_FromDouble(((double)0.0)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 153, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 153, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_GIVEREF(__pyx_t_3);
-  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3);
-  __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_21_play_playlist_sound, 0, __pyx_n_s_PlaylistController__play_playlis, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__28)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 153, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_3, __pyx_t_4);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_play_playlist_sound, __pyx_t_3) < 0) __PYX_ERR(0, 153, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_5 = PyFloat_FromDouble(((double)0.0)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 192, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = PyTuple_New(2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 192, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_5);
+  __Pyx_INCREF(((PyObject *)Py_None));
+  __Pyx_GIVEREF(((PyObject *)Py_None));
+  PyTuple_SET_ITEM(__pyx_t_6, 1, ((PyObject *)Py_None));
+  __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_27_play_playlist_sound, 0, __pyx_n_s_PlaylistController__play_playlis, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__34)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 192, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_5, __pyx_t_6);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_play_playlist_sound, __pyx_t_5) < 0) __PYX_ERR(0, 192, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":200
+  /* "mpfmc/core/audio/playlist_controller.pyx":222
  *         playlist.current_sound_instance = sound_instance
  * 
- *     def stop(self):             # <<<<<<<<<<<<<<
- *         """Immediately stop the currently playing playlist. Will fade out using the crossfade setting."""
- *         if not self._current_playlist:
+ *     def _get_playlist_sound_settings(self, object sound, object playlist, float fade_in=0.0):             # <<<<<<<<<<<<<<
+ *         """Returns the settings used to play a playlist sound (overrides certain settings needed
+ *         to manage the playlist)."""
  */
-  __pyx_t_3 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_23stop, 0, __pyx_n_s_PlaylistController_stop, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__30)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 200, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_stop, __pyx_t_3) < 0) __PYX_ERR(0, 200, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_5 = PyFloat_FromDouble(((double)0.0)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 222, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 222, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_5);
+  __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_29_get_playlist_sound_settings, 0, __pyx_n_s_PlaylistController__get_playlist, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__36)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 222, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_5, __pyx_t_6);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_get_playlist_sound_settings, __pyx_t_5) < 0) __PYX_ERR(0, 222, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":216
+  /* "mpfmc/core/audio/playlist_controller.pyx":253
+ *         }
+ * 
+ *     def _get_next_sound_name(self):             # <<<<<<<<<<<<<<
+ *         """Returns the name of the next sound of the current playlist (a sound that has already
+ *         been taken from the playlist but has not been played is returned first).  Posts the
+ */
+  __pyx_t_5 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_31_get_next_sound_name, 0, __pyx_n_s_PlaylistController__get_next_sou, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__38)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 253, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_get_next_sound_name_2, __pyx_t_5) < 0) __PYX_ERR(0, 253, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":270
+ *         return self._current_playlist.get_next_sound_name()
+ * 
+ *     def _has_next_sound(self, object playlist):             # <<<<<<<<<<<<<<
+ *         """Returns whether there is another sound to play after the current one in the playlist"""
+ *         return not playlist.end_of_playlist or playlist.repeat or self._next_sound_name is not None
+ */
+  __pyx_t_5 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_33_has_next_sound, 0, __pyx_n_s_PlaylistController__has_next_sou, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__40)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 270, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_has_next_sound, __pyx_t_5) < 0) __PYX_ERR(0, 270, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":274
+ *         return not playlist.end_of_playlist or playlist.repeat or self._next_sound_name is not None
+ * 
+ *     def _schedule_prepare_next_sound(self, sound_instance):             # <<<<<<<<<<<<<<
+ *         """Schedules the preparation of the next playlist sound the decode ahead time before the
+ *         current sound instance reaches its transition point (about to finish marker or end).  In
+ */
+  __pyx_t_5 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_35_schedule_prepare_next_sound, 0, __pyx_n_s_PlaylistController__schedule_pre, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__42)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 274, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_schedule_prepare_next_sound, __pyx_t_5) < 0) __PYX_ERR(0, 274, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":302
+ *             partial(self._prepare_next_sound, sound_instance), max(delay, 0.0))
+ * 
+ *     def _on_current_sound_loaded(self, sound_instance, sound=None):             # <<<<<<<<<<<<<<
+ *         """Callback function called when the sound of the current sound instance has been loaded
+ *         (schedules the preparation of the next sound)."""
+ */
+  __pyx_t_5 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_37_on_current_sound_loaded, 0, __pyx_n_s_PlaylistController__on_current_s, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__44)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 302, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_5, __pyx_tuple__45);
+  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_on_current_sound_loaded, __pyx_t_5) < 0) __PYX_ERR(0, 302, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":309
+ *             self._schedule_prepare_next_sound(sound_instance)
+ * 
+ *     def _prepare_next_sound(self, sound_instance, dt=None):             # <<<<<<<<<<<<<<
+ *         """Loads the next playlist sound and schedules it on the track to start when the specified
+ *         (current) sound instance reaches its about to finish marker (crossfade) or its end
+ */
+  __pyx_t_5 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_39_prepare_next_sound, 0, __pyx_n_s_PlaylistController__prepare_next, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__47)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 309, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_5, __pyx_tuple__48);
+  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_prepare_next_sound, __pyx_t_5) < 0) __PYX_ERR(0, 309, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":349
+ *             self._prepared_sound_name = sound_name
+ * 
+ *     def _cancel_prepared_sound(self):             # <<<<<<<<<<<<<<
+ *         """Cancels the prepared next sound (if it has not started yet).  The sound will be the
+ *         next one played by the playlist."""
+ */
+  __pyx_t_5 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_41_cancel_prepared_sound, 0, __pyx_n_s_PlaylistController__cancel_prepa, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__50)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 349, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_cancel_prepared_sound, __pyx_t_5) < 0) __PYX_ERR(0, 349, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":364
+ *             self._track.stop_sound_instance(sound_instance, 0.0)
+ * 
+ *     def stop(self, start_sample=None):             # <<<<<<<<<<<<<<
+ *         """Immediately stop the currently playing playlist. Will fade out using the crossfade setting.
+ * 
+ */
+  __pyx_t_5 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_43stop, 0, __pyx_n_s_PlaylistController_stop, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__52)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 364, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_5, __pyx_tuple__53);
+  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_stop, __pyx_t_5) < 0) __PYX_ERR(0, 364, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":387
  *         self._current_playlist = None
  * 
- *     def advance(self):             # <<<<<<<<<<<<<<
- *         """Advance the currently playing playlist to the next sound."""
+ *     def advance(self, start_sample=None):             # <<<<<<<<<<<<<<
+ *         """Advance the currently playing playlist to the next sound.
  * 
  */
-  __pyx_t_3 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_25advance, 0, __pyx_n_s_PlaylistController_advance, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__32)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 216, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_advance, __pyx_t_3) < 0) __PYX_ERR(0, 216, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_5 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_45advance, 0, __pyx_n_s_PlaylistController_advance, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__55)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 387, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_5, __pyx_tuple__56);
+  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_advance, __pyx_t_5) < 0) __PYX_ERR(0, 387, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":249
- *             self._play_playlist_sound(next_sound_name, self._current_playlist, self._current_playlist.crossfade_time)
+  /* "mpfmc/core/audio/playlist_controller.pyx":422
+ *                                       start_sample)
+ * 
+ *     def _stop_playlist_sound(self, sound_instance, start_sample=None):             # <<<<<<<<<<<<<<
+ *         """Stops a playlist sound (fading out using the crossfade setting), now or at an audio
+ *         clock sample position."""
+ */
+  __pyx_t_5 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_47_stop_playlist_sound, 0, __pyx_n_s_PlaylistController__stop_playlis, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__58)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 422, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_5, __pyx_tuple__59);
+  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_stop_playlist_sound, __pyx_t_5) < 0) __PYX_ERR(0, 422, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":430
+ *             self._track.stop_sound_instance_at(sound_instance, start_sample, self._current_playlist.crossfade_time)
  * 
  *     def set_repeat(self, repeat=True):             # <<<<<<<<<<<<<<
  *         """Set whether or not the currently playing playlist should repeat when finished."""
  * 
  */
-  __pyx_t_3 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_27set_repeat, 0, __pyx_n_s_PlaylistController_set_repeat, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__34)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 249, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_3, __pyx_tuple__35);
-  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_set_repeat, __pyx_t_3) < 0) __PYX_ERR(0, 249, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_5 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_49set_repeat, 0, __pyx_n_s_PlaylistController_set_repeat, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__61)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 430, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_5, __pyx_tuple__62);
+  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_set_repeat, __pyx_t_5) < 0) __PYX_ERR(0, 430, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":259
+  /* "mpfmc/core/audio/playlist_controller.pyx":440
  *                            "Could not set repeat to {}.", str(repeat))
  * 
+ *     def _on_sound_instance_played(self, sound_instance=None, **kwargs):             # <<<<<<<<<<<<<<
+ *         """Callback function called whenever a playlist sound has started playing."""
+ * 
+ */
+  __pyx_t_5 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_51_on_sound_instance_played, 0, __pyx_n_s_PlaylistController__on_sound_ins, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__64)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 440, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_5, __pyx_tuple__65);
+  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_on_sound_instance_played, __pyx_t_5) < 0) __PYX_ERR(0, 440, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+  /* "mpfmc/core/audio/playlist_controller.pyx":466
+ *             self._schedule_prepare_next_sound(sound_instance)
+ * 
  *     def _on_sound_instance_stopped(self, sound_instance=None, **kwargs):             # <<<<<<<<<<<<<<
  *         """Callback function called whenever a playlist sound has finished playing."""
  * 
  */
-  __pyx_t_3 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_29_on_sound_instance_stopped, 0, __pyx_n_s_PlaylistController__on_sound_ins, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__37)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 259, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_3, __pyx_tuple__38);
-  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_on_sound_instance_stopped, __pyx_t_3) < 0) __PYX_ERR(0, 259, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_5 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_53_on_sound_instance_stopped, 0, __pyx_n_s_PlaylistController__on_sound_ins_2, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__67)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 466, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_5, __pyx_tuple__68);
+  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_on_sound_instance_stopped, __pyx_t_5) < 0) __PYX_ERR(0, 466, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":297
- *             request()
+  /* "mpfmc/core/audio/playlist_controller.pyx":520
+ *             self._prepare_next_sound(self._current_playlist.current_sound_instance)
  * 
  *     def _on_sound_instance_about_to_finish(self, sound_instance=None, **kwargs):             # <<<<<<<<<<<<<<
  *         """Callback function called whenever a playlist sound is about to finish playing."""
  * 
  */
-  __pyx_t_3 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_31_on_sound_instance_about_to_finish, 0, __pyx_n_s_PlaylistController__on_sound_ins_2, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__40)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 297, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_3, __pyx_tuple__41);
-  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_on_sound_instance_about_to_fini, __pyx_t_3) < 0) __PYX_ERR(0, 297, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_5 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_55_on_sound_instance_about_to_finish, 0, __pyx_n_s_PlaylistController__on_sound_ins_3, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__70)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 520, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_5, __pyx_tuple__71);
+  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_on_sound_instance_about_to_fini, __pyx_t_5) < 0) __PYX_ERR(0, 520, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "mpfmc/core/audio/playlist_controller.pyx":317
+  /* "mpfmc/core/audio/playlist_controller.pyx":541
  *         self.advance()
  * 
  *     def clear_context(self, context):             # <<<<<<<<<<<<<<
  *         """
  *         Stops the current playlist if it was played from the specified context.
  */
-  __pyx_t_3 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_33clear_context, 0, __pyx_n_s_PlaylistController_clear_context, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__43)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 317, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_clear_context, __pyx_t_3) < 0) __PYX_ERR(0, 317, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_5 = __Pyx_CyFunction_NewEx(&__pyx_mdef_5mpfmc_4core_5audio_19playlist_controller_18PlaylistController_57clear_context, 0, __pyx_n_s_PlaylistController_clear_context, NULL, __pyx_n_s_mpfmc_core_audio_playlist_contro, __pyx_d, ((PyObject *)__pyx_codeobj__73)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 541, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  if (PyObject_SetItem(__pyx_t_1, __pyx_n_s_clear_context, __pyx_t_5) < 0) __PYX_ERR(0, 541, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
   /* "mpfmc/core/audio/playlist_controller.pyx":14
  * #    PlaylistController class
@@ -8032,10 +14569,10 @@ static int __pyx_pymod_exec_playlist_controller(PyObject *__pyx_pyinit_module)
  *     """
  *     PlaylistController class
  */
-  __pyx_t_3 = __Pyx_Py3ClassCreate(((PyObject*)&__Pyx_DefaultClassType), __pyx_n_s_PlaylistController, __pyx_empty_tuple, __pyx_t_1, NULL, 0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 14, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PlaylistController, __pyx_t_3) < 0) __PYX_ERR(0, 14, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_5 = __Pyx_Py3ClassCreate(((PyObject*)&__Pyx_DefaultClassType), __pyx_n_s_PlaylistController, __pyx_empty_tuple, __pyx_t_1, NULL, 0, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 14, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PlaylistController, __pyx_t_5) < 0) __PYX_ERR(0, 14, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
   /* "mpfmc/core/audio/playlist_controller.pyx":1
@@ -8048,6 +14585,14 @@ static int __pyx_pymod_exec_playlist_controller(PyObject *__pyx_pyinit_module)
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_1) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
+  /* "mpfmc/core/audio/perf_counters.pxd":72
+ *     perf_ring_buffer_record(&counters.lock_wait_time, perf_elapsed_us(counters, start))
+ * 
+ * cdef inline dict perf_ring_buffer_summary(PerfRingBuffer *ring_buffer):             # <<<<<<<<<<<<<<
+ *     """Returns a dictionary summarizing the values recorded in a ring buffer (must be called
+ *     while holding the audio lock)."""
+ */
+
   /*--- Wrapped vars code ---*/
 
   goto __pyx_L0;
@@ -8056,6 +14601,8 @@ static int __pyx_pymod_exec_playlist_controller(PyObject *__pyx_pyinit_module)
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
   if (__pyx_m) {
     if (__pyx_d) {
       __Pyx_AddTraceback("init mpfmc.core.audio.playlist_controller", 0, __pyx_lineno, __pyx_filename);
@@ -8532,8 +15079,260 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
     return 0;
 }
 
+/* dict_getitem_default */
+    static PyObject* __Pyx_PyDict_GetItemDefault(PyObject* d, PyObject* key, PyObject* default_value) {
+    PyObject* value;
+#if PY_MAJOR_VERSION >= 3 && !CYTHON_COMPILING_IN_PYPY
+    value = PyDict_GetItemWithError(d, key);
+    if (unlikely(!value)) {
+        if (unlikely(PyErr_Occurred()))
+            return NULL;
+        value = default_value;
+    }
+    Py_INCREF(value);
+#else
+    if (PyString_CheckExact(key) || PyUnicode_CheckExact(key) || PyInt_CheckExact(key)) {
+        value = PyDict_GetItem(d, key);
+        if (unlikely(!value)) {
+            value = default_value;
+        }
+        Py_INCREF(value);
+    } else {
+        if (default_value == Py_None)
+            default_value = NULL;
+        value = PyObject_CallMethodObjArgs(
+            d, __pyx_n_s_get, key, default_value, NULL);
+    }
+#endif
+    return value;
+}
+
+/* PyFloatBinop */
+    #if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyFloat_EqObjC(PyObject *op1, PyObject *op2, double floatval, CYTHON_UNUSED int inplace) {
+    const double b = floatval;
+    double a;
+    if (op1 == op2) {
+        Py_RETURN_TRUE;
+    }
+    if (likely(PyFloat_CheckExact(op1))) {
+        a = PyFloat_AS_DOUBLE(op1);
+    } else
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_CheckExact(op1))) {
+        a = (double) PyInt_AS_LONG(op1);
+    } else
+    #endif
+    if (likely(PyLong_CheckExact(op1))) {
+        #if CYTHON_USE_PYLONG_INTERNALS
+        const digit* digits = ((PyLongObject*)op1)->ob_digit;
+        const Py_ssize_t size = Py_SIZE(op1);
+        switch (size) {
+            case  0: a = 0.0; break;
+            case -1: a = -(double) digits[0]; break;
+            case  1: a = (double) digits[0]; break;
+            case -2:
+            case 2:
+                if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT && ((8 * sizeof(unsigned long) < 53) || (1 * PyLong_SHIFT < 53))) {
+                    a = (double) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                    if ((8 * sizeof(unsigned long) < 53) || (2 * PyLong_SHIFT < 53) || (a < (double) ((PY_LONG_LONG)1 << 53))) {
+                        if (size == -2)
+                            a = -a;
+                        break;
+                    }
+                }
+            case -3:
+            case 3:
+                if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT && ((8 * sizeof(unsigned long) < 53) || (2 * PyLong_SHIFT < 53))) {
+                    a = (double) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                    if ((8 * sizeof(unsigned long) < 53) || (3 * PyLong_SHIFT < 53) || (a < (double) ((PY_LONG_LONG)1 << 53))) {
+                        if (size == -3)
+                            a = -a;
+                        break;
+                    }
+                }
+            case -4:
+            case 4:
+                if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT && ((8 * sizeof(unsigned long) < 53) || (3 * PyLong_SHIFT < 53))) {
+                    a = (double) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                    if ((8 * sizeof(unsigned long) < 53) || (4 * PyLong_SHIFT < 53) || (a < (double) ((PY_LONG_LONG)1 << 53))) {
+                        if (size == -4)
+                            a = -a;
+                        break;
+                    }
+                }
+            default:
+        #else
+        {
+        #endif
+            return PyFloat_Type.tp_richcompare(op2, op1, Py_EQ);
+        }
+    } else {
+        return PyObject_RichCompare(op1, op2, Py_EQ);
+    }
+        if (a == b) {
+            Py_RETURN_TRUE;
+        } else {
+            Py_RETURN_FALSE;
+        }
+}
+#endif
+
+/* PyErrFetchRestore */
+      #if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+}
+#endif
+
+/* WriteUnraisableException */
+      static void __Pyx_WriteUnraisable(const char *name, CYTHON_UNUSED int clineno,
+                                  CYTHON_UNUSED int lineno, CYTHON_UNUSED const char *filename,
+                                  int full_traceback, CYTHON_UNUSED int nogil) {
+    PyObject *old_exc, *old_val, *old_tb;
+    PyObject *ctx;
+    __Pyx_PyThreadState_declare
+#ifdef WITH_THREAD
+    PyGILState_STATE state;
+    if (nogil)
+        state = PyGILState_Ensure();
+#ifdef _MSC_VER
+    else state = (PyGILState_STATE)-1;
+#endif
+#endif
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&old_exc, &old_val, &old_tb);
+    if (full_traceback) {
+        Py_XINCREF(old_exc);
+        Py_XINCREF(old_val);
+        Py_XINCREF(old_tb);
+        __Pyx_ErrRestore(old_exc, old_val, old_tb);
+        PyErr_PrintEx(1);
+    }
+    #if PY_MAJOR_VERSION < 3
+    ctx = PyString_FromString(name);
+    #else
+    ctx = PyUnicode_FromString(name);
+    #endif
+    __Pyx_ErrRestore(old_exc, old_val, old_tb);
+    if (!ctx) {
+        PyErr_WriteUnraisable(Py_None);
+    } else {
+        PyErr_WriteUnraisable(ctx);
+        Py_DECREF(ctx);
+    }
+#ifdef WITH_THREAD
+    if (nogil)
+        PyGILState_Release(state);
+#endif
+}
+
+/* GetItemInt */
+      static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
+    PyObject *r;
+    if (!j) return NULL;
+    r = PyObject_GetItem(o, j);
+    Py_DECREF(j);
+    return r;
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyList_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely((0 <= wrapped_i) & (wrapped_i < PyList_GET_SIZE(o)))) {
+        PyObject *r = PyList_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyTuple_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely((0 <= wrapped_i) & (wrapped_i < PyTuple_GET_SIZE(o)))) {
+        PyObject *r = PyTuple_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i, int is_list,
+                                                     CYTHON_NCP_UNUSED int wraparound,
+                                                     CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS && CYTHON_USE_TYPE_SLOTS
+    if (is_list || PyList_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyList_GET_SIZE(o);
+        if ((!boundscheck) || (likely((n >= 0) & (n < PyList_GET_SIZE(o))))) {
+            PyObject *r = PyList_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    }
+    else if (PyTuple_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyTuple_GET_SIZE(o);
+        if ((!boundscheck) || likely((n >= 0) & (n < PyTuple_GET_SIZE(o)))) {
+            PyObject *r = PyTuple_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    } else {
+        PySequenceMethods *m = Py_TYPE(o)->tp_as_sequence;
+        if (likely(m && m->sq_item)) {
+            if (wraparound && unlikely(i < 0) && likely(m->sq_length)) {
+                Py_ssize_t l = m->sq_length(o);
+                if (likely(l >= 0)) {
+                    i += l;
+                } else {
+                    if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                        return NULL;
+                    PyErr_Clear();
+                }
+            }
+            return m->sq_item(o, i);
+        }
+    }
+#else
+    if (is_list || PySequence_Check(o)) {
+        return PySequence_GetItem(o, i);
+    }
+#endif
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+}
+
 /* GetVTable */
-    static void* __Pyx_GetVtable(PyObject *dict) {
+      static void* __Pyx_GetVtable(PyObject *dict) {
     void* ptr;
     PyObject *ob = PyObject_GetItem(dict, __pyx_n_s_pyx_vtable);
     if (!ob)
@@ -8553,7 +15352,7 @@ bad:
 }
 
 /* Import */
-    static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
+      static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
     PyObject *empty_list = 0;
     PyObject *module = 0;
     PyObject *global_dict = 0;
@@ -8618,7 +15417,7 @@ bad:
 }
 
 /* ImportFrom */
-    static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
+      static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
     PyObject* value = __Pyx_PyObject_GetAttrStr(module, name);
     if (unlikely(!value) && PyErr_ExceptionMatches(PyExc_AttributeError)) {
         PyErr_Format(PyExc_ImportError,
@@ -8632,7 +15431,7 @@ bad:
 }
 
 /* FetchCommonType */
-    static PyTypeObject* __Pyx_FetchCommonType(PyTypeObject* type) {
+      static PyTypeObject* __Pyx_FetchCommonType(PyTypeObject* type) {
     PyObject* fake_module;
     PyTypeObject* cached_type = NULL;
     fake_module = PyImport_AddModule((char*) "_cython_" CYTHON_ABI);
@@ -8671,7 +15470,7 @@ bad:
 }
 
 /* CythonFunction */
-    static PyObject *
+      static PyObject *
 __Pyx_CyFunction_get_doc(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *closure)
 {
     if (unlikely(op->func_doc == NULL)) {
@@ -9264,7 +16063,7 @@ static CYTHON_INLINE void __Pyx_CyFunction_SetAnnotationsDict(PyObject *func, Py
 }
 
 /* CalculateMetaclass */
-        static PyObject *__Pyx_CalculateMetaclass(PyTypeObject *metaclass, PyObject *bases) {
+          static PyObject *__Pyx_CalculateMetaclass(PyTypeObject *metaclass, PyObject *bases) {
     Py_ssize_t i, nbases = PyTuple_GET_SIZE(bases);
     for (i=0; i < nbases; i++) {
         PyTypeObject *tmptype;
@@ -9303,7 +16102,7 @@ static CYTHON_INLINE void __Pyx_CyFunction_SetAnnotationsDict(PyObject *func, Py
 }
 
 /* Py3ClassCreate */
-        static PyObject *__Pyx_Py3MetaclassPrepare(PyObject *metaclass, PyObject *bases, PyObject *name,
+          static PyObject *__Pyx_Py3MetaclassPrepare(PyObject *metaclass, PyObject *bases, PyObject *name,
                                            PyObject *qualname, PyObject *mkw, PyObject *modname, PyObject *doc) {
     PyObject *ns;
     if (metaclass) {
@@ -9360,41 +16159,17 @@ static PyObject *__Pyx_Py3ClassCreate(PyObject *metaclass, PyObject *name, PyObj
     }
     margs = PyTuple_Pack(3, name, bases, dict);
     if (unlikely(!margs)) {
-        result = NULL;
-    } else {
-        result = PyObject_Call(metaclass, margs, mkw);
-        Py_DECREF(margs);
-    }
-    Py_XDECREF(owned_metaclass);
-    return result;
-}
-
-/* PyErrFetchRestore */
-        #if CYTHON_FAST_THREAD_STATE
-static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
-    PyObject *tmp_type, *tmp_value, *tmp_tb;
-    tmp_type = tstate->curexc_type;
-    tmp_value = tstate->curexc_value;
-    tmp_tb = tstate->curexc_traceback;
-    tstate->curexc_type = type;
-    tstate->curexc_value = value;
-    tstate->curexc_traceback = tb;
-    Py_XDECREF(tmp_type);
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(tmp_tb);
-}
-static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
-    *type = tstate->curexc_type;
-    *value = tstate->curexc_value;
-    *tb = tstate->curexc_traceback;
-    tstate->curexc_type = 0;
-    tstate->curexc_value = 0;
-    tstate->curexc_traceback = 0;
+        result = NULL;
+    } else {
+        result = PyObject_Call(metaclass, margs, mkw);
+        Py_DECREF(margs);
+    }
+    Py_XDECREF(owned_metaclass);
+    return result;
 }
-#endif
 
 /* CLineInTraceback */
-        #ifndef CYTHON_CLINE_IN_TRACEBACK
+          #ifndef CYTHON_CLINE_IN_TRACEBACK
 static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_line) {
     PyObject *use_cline;
     PyObject *ptype, *pvalue, *ptraceback;
@@ -9431,7 +16206,7 @@ static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_li
 #endif
 
 /* CodeObjectCache */
-        static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
+          static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
     int start = 0, mid = 0, end = count - 1;
     if (end >= 0 && code_line > entries[end].code_line) {
         return count;
@@ -9511,7 +16286,7 @@ static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
 }
 
 /* AddTraceback */
-        #include "compile.h"
+          #include "compile.h"
 #include "frameobject.h"
 #include "traceback.h"
 static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
@@ -9596,24 +16371,24 @@ bad:
 }
 
 /* CIntToPy */
-        static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
-    const long neg_one = (long) -1, const_zero = (long) 0;
+          static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
+    const int neg_one = (int) -1, const_zero = (int) 0;
     const int is_unsigned = neg_one > const_zero;
     if (is_unsigned) {
-        if (sizeof(long) < sizeof(long)) {
+        if (sizeof(int) < sizeof(long)) {
             return PyInt_FromLong((long) value);
-        } else if (sizeof(long) <= sizeof(unsigned long)) {
+        } else if (sizeof(int) <= sizeof(unsigned long)) {
             return PyLong_FromUnsignedLong((unsigned long) value);
 #ifdef HAVE_LONG_LONG
-        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
             return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
 #endif
         }
     } else {
-        if (sizeof(long) <= sizeof(long)) {
+        if (sizeof(int) <= sizeof(long)) {
             return PyInt_FromLong((long) value);
 #ifdef HAVE_LONG_LONG
-        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
             return PyLong_FromLongLong((PY_LONG_LONG) value);
 #endif
         }
@@ -9621,47 +16396,298 @@ bad:
     {
         int one = 1; int little = (int)*(unsigned char *)&one;
         unsigned char *bytes = (unsigned char *)&value;
-        return _PyLong_FromByteArray(bytes, sizeof(long),
+        return _PyLong_FromByteArray(bytes, sizeof(int),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntFromPyVerify */
+          #define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
+#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
+#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
+    {\
+        func_type value = func_value;\
+        if (sizeof(target_type) < sizeof(func_type)) {\
+            if (unlikely(value != (func_type) (target_type) value)) {\
+                func_type zero = 0;\
+                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
+                    return (target_type) -1;\
+                if (is_unsigned && unlikely(value < zero))\
+                    goto raise_neg_overflow;\
+                else\
+                    goto raise_overflow;\
+            }\
+        }\
+        return (target_type) value;\
+    }
+
+/* CIntToPy */
+          static CYTHON_INLINE PyObject* __Pyx_PyInt_From_Uint32(Uint32 value) {
+    const Uint32 neg_one = (Uint32) -1, const_zero = (Uint32) 0;
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(Uint32) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(Uint32) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(Uint32) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(Uint32) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(Uint32) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(Uint32),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntToPy */
+          static CYTHON_INLINE PyObject* __Pyx_PyInt_From_Uint64(Uint64 value) {
+    const Uint64 neg_one = (Uint64) -1, const_zero = (Uint64) 0;
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(Uint64) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(Uint64) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(Uint64) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(Uint64) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(Uint64) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(Uint64),
                                      little, !is_unsigned);
     }
 }
 
-/* CIntFromPyVerify */
-        #define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
-    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
-#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
-    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
-#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
-    {\
-        func_type value = func_value;\
-        if (sizeof(target_type) < sizeof(func_type)) {\
-            if (unlikely(value != (func_type) (target_type) value)) {\
-                func_type zero = 0;\
-                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
-                    return (target_type) -1;\
-                if (is_unsigned && unlikely(value < zero))\
-                    goto raise_neg_overflow;\
-                else\
-                    goto raise_overflow;\
-            }\
-        }\
-        return (target_type) value;\
-    }
-
 /* CIntFromPy */
-        static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
-    const long neg_one = (long) -1, const_zero = (long) 0;
+          static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
+    const int neg_one = (int) -1, const_zero = (int) 0;
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(int) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(int, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (int) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(int, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 2 * PyLong_SHIFT) {
+                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 3 * PyLong_SHIFT) {
+                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 4 * PyLong_SHIFT) {
+                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (int) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(int) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(int, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(int,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(int) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(int) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            int val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (int) -1;
+        }
+    } else {
+        int val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (int) -1;
+        val = __Pyx_PyInt_As_int(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to int");
+    return (int) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to int");
+    return (int) -1;
+}
+
+/* CIntFromPy */
+          static CYTHON_INLINE Uint32 __Pyx_PyInt_As_Uint32(PyObject *x) {
+    const Uint32 neg_one = (Uint32) -1, const_zero = (Uint32) 0;
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
     if (likely(PyInt_Check(x))) {
-        if (sizeof(long) < sizeof(long)) {
-            __PYX_VERIFY_RETURN_INT(long, long, PyInt_AS_LONG(x))
+        if (sizeof(Uint32) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(Uint32, long, PyInt_AS_LONG(x))
         } else {
             long val = PyInt_AS_LONG(x);
             if (is_unsigned && unlikely(val < 0)) {
                 goto raise_neg_overflow;
             }
-            return (long) val;
+            return (Uint32) val;
         }
     } else
 #endif
@@ -9670,32 +16696,32 @@ bad:
 #if CYTHON_USE_PYLONG_INTERNALS
             const digit* digits = ((PyLongObject*)x)->ob_digit;
             switch (Py_SIZE(x)) {
-                case  0: return (long) 0;
-                case  1: __PYX_VERIFY_RETURN_INT(long, digit, digits[0])
+                case  0: return (Uint32) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(Uint32, digit, digits[0])
                 case 2:
-                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                    if (8 * sizeof(Uint32) > 1 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) >= 2 * PyLong_SHIFT) {
-                            return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                            __PYX_VERIFY_RETURN_INT(Uint32, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(Uint32) >= 2 * PyLong_SHIFT) {
+                            return (Uint32) (((((Uint32)digits[1]) << PyLong_SHIFT) | (Uint32)digits[0]));
                         }
                     }
                     break;
                 case 3:
-                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                    if (8 * sizeof(Uint32) > 2 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) >= 3 * PyLong_SHIFT) {
-                            return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                            __PYX_VERIFY_RETURN_INT(Uint32, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(Uint32) >= 3 * PyLong_SHIFT) {
+                            return (Uint32) (((((((Uint32)digits[2]) << PyLong_SHIFT) | (Uint32)digits[1]) << PyLong_SHIFT) | (Uint32)digits[0]));
                         }
                     }
                     break;
                 case 4:
-                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                    if (8 * sizeof(Uint32) > 3 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) >= 4 * PyLong_SHIFT) {
-                            return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                            __PYX_VERIFY_RETURN_INT(Uint32, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(Uint32) >= 4 * PyLong_SHIFT) {
+                            return (Uint32) (((((((((Uint32)digits[3]) << PyLong_SHIFT) | (Uint32)digits[2]) << PyLong_SHIFT) | (Uint32)digits[1]) << PyLong_SHIFT) | (Uint32)digits[0]));
                         }
                     }
                     break;
@@ -9709,86 +16735,86 @@ bad:
             {
                 int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
                 if (unlikely(result < 0))
-                    return (long) -1;
+                    return (Uint32) -1;
                 if (unlikely(result == 1))
                     goto raise_neg_overflow;
             }
 #endif
-            if (sizeof(long) <= sizeof(unsigned long)) {
-                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
+            if (sizeof(Uint32) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(Uint32, unsigned long, PyLong_AsUnsignedLong(x))
 #ifdef HAVE_LONG_LONG
-            } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
-                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+            } else if (sizeof(Uint32) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(Uint32, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
 #endif
             }
         } else {
 #if CYTHON_USE_PYLONG_INTERNALS
             const digit* digits = ((PyLongObject*)x)->ob_digit;
             switch (Py_SIZE(x)) {
-                case  0: return (long) 0;
-                case -1: __PYX_VERIFY_RETURN_INT(long, sdigit, (sdigit) (-(sdigit)digits[0]))
-                case  1: __PYX_VERIFY_RETURN_INT(long,  digit, +digits[0])
+                case  0: return (Uint32) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(Uint32, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(Uint32,  digit, +digits[0])
                 case -2:
-                    if (8 * sizeof(long) - 1 > 1 * PyLong_SHIFT) {
+                    if (8 * sizeof(Uint32) - 1 > 1 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
-                            return (long) (((long)-1)*(((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(Uint32, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(Uint32) - 1 > 2 * PyLong_SHIFT) {
+                            return (Uint32) (((Uint32)-1)*(((((Uint32)digits[1]) << PyLong_SHIFT) | (Uint32)digits[0])));
                         }
                     }
                     break;
                 case 2:
-                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                    if (8 * sizeof(Uint32) > 1 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
-                            return (long) ((((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(Uint32, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(Uint32) - 1 > 2 * PyLong_SHIFT) {
+                            return (Uint32) ((((((Uint32)digits[1]) << PyLong_SHIFT) | (Uint32)digits[0])));
                         }
                     }
                     break;
                 case -3:
-                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                    if (8 * sizeof(Uint32) - 1 > 2 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
-                            return (long) (((long)-1)*(((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(Uint32, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(Uint32) - 1 > 3 * PyLong_SHIFT) {
+                            return (Uint32) (((Uint32)-1)*(((((((Uint32)digits[2]) << PyLong_SHIFT) | (Uint32)digits[1]) << PyLong_SHIFT) | (Uint32)digits[0])));
                         }
                     }
                     break;
                 case 3:
-                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                    if (8 * sizeof(Uint32) > 2 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
-                            return (long) ((((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(Uint32, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(Uint32) - 1 > 3 * PyLong_SHIFT) {
+                            return (Uint32) ((((((((Uint32)digits[2]) << PyLong_SHIFT) | (Uint32)digits[1]) << PyLong_SHIFT) | (Uint32)digits[0])));
                         }
                     }
                     break;
                 case -4:
-                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                    if (8 * sizeof(Uint32) - 1 > 3 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
-                            return (long) (((long)-1)*(((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(Uint32, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(Uint32) - 1 > 4 * PyLong_SHIFT) {
+                            return (Uint32) (((Uint32)-1)*(((((((((Uint32)digits[3]) << PyLong_SHIFT) | (Uint32)digits[2]) << PyLong_SHIFT) | (Uint32)digits[1]) << PyLong_SHIFT) | (Uint32)digits[0])));
                         }
                     }
                     break;
                 case 4:
-                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                    if (8 * sizeof(Uint32) > 3 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
-                            return (long) ((((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(Uint32, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(Uint32) - 1 > 4 * PyLong_SHIFT) {
+                            return (Uint32) ((((((((((Uint32)digits[3]) << PyLong_SHIFT) | (Uint32)digits[2]) << PyLong_SHIFT) | (Uint32)digits[1]) << PyLong_SHIFT) | (Uint32)digits[0])));
                         }
                     }
                     break;
             }
 #endif
-            if (sizeof(long) <= sizeof(long)) {
-                __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
+            if (sizeof(Uint32) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(Uint32, long, PyLong_AsLong(x))
 #ifdef HAVE_LONG_LONG
-            } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
-                __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
+            } else if (sizeof(Uint32) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(Uint32, PY_LONG_LONG, PyLong_AsLongLong(x))
 #endif
             }
         }
@@ -9797,7 +16823,7 @@ bad:
             PyErr_SetString(PyExc_RuntimeError,
                             "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
 #else
-            long val;
+            Uint32 val;
             PyObject *v = __Pyx_PyNumber_IntOrLong(x);
  #if PY_MAJOR_VERSION < 3
             if (likely(v) && !PyLong_Check(v)) {
@@ -9817,40 +16843,71 @@ bad:
                     return val;
             }
 #endif
-            return (long) -1;
+            return (Uint32) -1;
         }
     } else {
-        long val;
+        Uint32 val;
         PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
-        if (!tmp) return (long) -1;
-        val = __Pyx_PyInt_As_long(tmp);
+        if (!tmp) return (Uint32) -1;
+        val = __Pyx_PyInt_As_Uint32(tmp);
         Py_DECREF(tmp);
         return val;
     }
 raise_overflow:
     PyErr_SetString(PyExc_OverflowError,
-        "value too large to convert to long");
-    return (long) -1;
+        "value too large to convert to Uint32");
+    return (Uint32) -1;
 raise_neg_overflow:
     PyErr_SetString(PyExc_OverflowError,
-        "can't convert negative value to long");
-    return (long) -1;
+        "can't convert negative value to Uint32");
+    return (Uint32) -1;
+}
+
+/* CIntToPy */
+          static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
+    const long neg_one = (long) -1, const_zero = (long) 0;
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(long) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(long) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(long) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(long),
+                                     little, !is_unsigned);
+    }
 }
 
 /* CIntFromPy */
-        static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
-    const int neg_one = (int) -1, const_zero = (int) 0;
+          static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
+    const long neg_one = (long) -1, const_zero = (long) 0;
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
     if (likely(PyInt_Check(x))) {
-        if (sizeof(int) < sizeof(long)) {
-            __PYX_VERIFY_RETURN_INT(int, long, PyInt_AS_LONG(x))
+        if (sizeof(long) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(long, long, PyInt_AS_LONG(x))
         } else {
             long val = PyInt_AS_LONG(x);
             if (is_unsigned && unlikely(val < 0)) {
                 goto raise_neg_overflow;
             }
-            return (int) val;
+            return (long) val;
         }
     } else
 #endif
@@ -9859,32 +16916,32 @@ raise_neg_overflow:
 #if CYTHON_USE_PYLONG_INTERNALS
             const digit* digits = ((PyLongObject*)x)->ob_digit;
             switch (Py_SIZE(x)) {
-                case  0: return (int) 0;
-                case  1: __PYX_VERIFY_RETURN_INT(int, digit, digits[0])
+                case  0: return (long) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(long, digit, digits[0])
                 case 2:
-                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) >= 2 * PyLong_SHIFT) {
-                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 2 * PyLong_SHIFT) {
+                            return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
                         }
                     }
                     break;
                 case 3:
-                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) >= 3 * PyLong_SHIFT) {
-                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 3 * PyLong_SHIFT) {
+                            return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
                         }
                     }
                     break;
                 case 4:
-                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) >= 4 * PyLong_SHIFT) {
-                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 4 * PyLong_SHIFT) {
+                            return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
                         }
                     }
                     break;
@@ -9898,86 +16955,86 @@ raise_neg_overflow:
             {
                 int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
                 if (unlikely(result < 0))
-                    return (int) -1;
+                    return (long) -1;
                 if (unlikely(result == 1))
                     goto raise_neg_overflow;
             }
 #endif
-            if (sizeof(int) <= sizeof(unsigned long)) {
-                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
+            if (sizeof(long) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
 #ifdef HAVE_LONG_LONG
-            } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
-                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+            } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
 #endif
             }
         } else {
 #if CYTHON_USE_PYLONG_INTERNALS
             const digit* digits = ((PyLongObject*)x)->ob_digit;
             switch (Py_SIZE(x)) {
-                case  0: return (int) 0;
-                case -1: __PYX_VERIFY_RETURN_INT(int, sdigit, (sdigit) (-(sdigit)digits[0]))
-                case  1: __PYX_VERIFY_RETURN_INT(int,  digit, +digits[0])
+                case  0: return (long) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(long, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(long,  digit, +digits[0])
                 case -2:
-                    if (8 * sizeof(int) - 1 > 1 * PyLong_SHIFT) {
+                    if (8 * sizeof(long) - 1 > 1 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
-                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
                         }
                     }
                     break;
                 case 2:
-                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
-                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) ((((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
                         }
                     }
                     break;
                 case -3:
-                    if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
-                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
                         }
                     }
                     break;
                 case 3:
-                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
-                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) ((((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
                         }
                     }
                     break;
                 case -4:
-                    if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
-                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
                         }
                     }
                     break;
                 case 4:
-                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
-                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) ((((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
                         }
                     }
                     break;
             }
 #endif
-            if (sizeof(int) <= sizeof(long)) {
-                __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
+            if (sizeof(long) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
 #ifdef HAVE_LONG_LONG
-            } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
-                __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
+            } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
 #endif
             }
         }
@@ -9986,7 +17043,7 @@ raise_neg_overflow:
             PyErr_SetString(PyExc_RuntimeError,
                             "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
 #else
-            int val;
+            long val;
             PyObject *v = __Pyx_PyNumber_IntOrLong(x);
  #if PY_MAJOR_VERSION < 3
             if (likely(v) && !PyLong_Check(v)) {
@@ -10006,28 +17063,28 @@ raise_neg_overflow:
                     return val;
             }
 #endif
-            return (int) -1;
+            return (long) -1;
         }
     } else {
-        int val;
+        long val;
         PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
-        if (!tmp) return (int) -1;
-        val = __Pyx_PyInt_As_int(tmp);
+        if (!tmp) return (long) -1;
+        val = __Pyx_PyInt_As_long(tmp);
         Py_DECREF(tmp);
         return val;
     }
 raise_overflow:
     PyErr_SetString(PyExc_OverflowError,
-        "value too large to convert to int");
-    return (int) -1;
+        "value too large to convert to long");
+    return (long) -1;
 raise_neg_overflow:
     PyErr_SetString(PyExc_OverflowError,
-        "can't convert negative value to int");
-    return (int) -1;
+        "can't convert negative value to long");
+    return (long) -1;
 }
 
 /* FastTypeChecks */
-        #if CYTHON_COMPILING_IN_CPYTHON
+          #if CYTHON_COMPILING_IN_CPYTHON
 static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
     while (a) {
         a = a->tp_base;
@@ -10099,7 +17156,7 @@ static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObj
 #endif
 
 /* CheckBinaryVersion */
-        static int __Pyx_check_binary_version(void) {
+          static int __Pyx_check_binary_version(void) {
     char ctversion[4], rtversion[4];
     PyOS_snprintf(ctversion, 4, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
     PyOS_snprintf(rtversion, 4, "%s", Py_GetVersion());
@@ -10115,7 +17172,7 @@ static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObj
 }
 
 /* ModuleImport */
-        #ifndef __PYX_HAVE_RT_ImportModule
+          #ifndef __PYX_HAVE_RT_ImportModule
 #define __PYX_HAVE_RT_ImportModule
 static PyObject *__Pyx_ImportModule(const char *name) {
     PyObject *py_name = 0;
@@ -10133,7 +17190,7 @@ bad:
 #endif
 
 /* TypeImport */
-        #ifndef __PYX_HAVE_RT_ImportType
+          #ifndef __PYX_HAVE_RT_ImportType
 #define __PYX_HAVE_RT_ImportType
 static PyTypeObject *__Pyx_ImportType(const char *module_name, const char *class_name,
     size_t size, int strict)
@@ -10198,7 +17255,7 @@ bad:
 #endif
 
 /* InitStrings */
-        static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
+          static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
     while (t->p) {
         #if PY_MAJOR_VERSION < 3
         if (t->is_unicode) {
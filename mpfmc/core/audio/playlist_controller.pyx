@@ -16,7 +16,8 @@ class PlaylistController:
     PlaylistController class
     """
 
-    def __init__(self, object mc, object track, float crossfade_time=0.0, float volume=1.0):
+    def __init__(self, object mc, object track, float crossfade_time=0.0, float volume=1.0,
+                 float decode_ahead_time=0.0, bint gapless=False):
         """
         Constructor
         Args:
@@ -24,11 +25,16 @@ class PlaylistController:
             track: The audio track that will be managed by this playlist controller (standard track)
             crossfade_time: The default crossfade time (secs) to use when fading between sounds
             volume: The playlist volume (0.0 to 1.0)
+            decode_ahead_time: The time (secs) before a transition at which the next sound is
+                loaded and prepared for playback (0 to disable, unless gapless)
+            gapless: Whether sounds follow each other without any gap or crossfade
         """
         self.log = logging.getLogger("PlaylistController")
         self.mc = mc
         self._track = track
         self._crossfade_time = crossfade_time
+        self._decode_ahead_time = decode_ahead_time
+        self._gapless = gapless
 
         # Dictionary of PlaylistInstance class objects keyed by SoundInstance ID
         self._playlists_by_sound_instance = dict()
@@ -40,9 +46,19 @@ class PlaylistController:
         # underlying audio track is busy (only 2 players)
         self._pending_request = None
 
+        # The next sound of the current playlist is prepared ahead of time: it is loaded and
+        # scheduled on the track to start exactly when the current sound reaches its about to
+        # finish marker (crossfade) or its end (gapless).  The name of a sound that has been
+        # taken from the playlist but has not been played yet is kept for the next transition.
+        self._prepared_sound_instance = None
+        self._prepared_sound_name = None
+        self._next_sound_name = None
+        self._prepare_next_sound_event = None
+        self._prepare_next_sound_when_not_busy = False
+
         # Create event handlers for sound instance events
-        # Note: we don't have to worry about played events since the playlist controller will initiate
-        # playback and therefore will already know when those events are occurring.
+        self.mc.events.add_handler('{}_playlist_sound_played'.format(self.name.lower()),
+                                   self._on_sound_instance_played)
         self.mc.events.add_handler('{}_playlist_sound_stopped'.format(self.name.lower()),
                                    self._on_sound_instance_stopped, 0)
         self.mc.events.add_handler('{}_playlist_sound_about_to_finish'.format(self.name.lower()),
@@ -72,6 +88,21 @@ class PlaylistController:
         """The time (secs) to use when fading between sounds"""
         return self._crossfade_time
 
+    @property
+    def decode_ahead_time(self):
+        """The time (secs) before a transition at which the next sound is prepared for playback"""
+        return self._decode_ahead_time
+
+    @property
+    def gapless(self):
+        """Whether sounds follow each other without any gap or crossfade"""
+        return self._gapless
+
+    @property
+    def has_prepared_sound(self):
+        """Whether the next sound has been prepared and is waiting for the current sound to finish"""
+        return self._prepared_sound_instance is not None
+
     @property
     def has_pending_request(self):
         """Whether the playlist controller has a pending request queued until it is not busy"""
@@ -83,6 +114,7 @@ class PlaylistController:
         Args:
             fade_out_seconds: The number of seconds to fade out the sounds before stopping
         """
+        self._cancel_prepared_sound()
         self._track.stop_all_sounds(fade_out_seconds)
 
         # TODO: playlist housekeeping (stopped events, remove instance, etc.)
@@ -94,7 +126,8 @@ class PlaylistController:
         Args:
             playlist: The name of the playlist asset object to play.
             context: The calling context (if any)
-            player_settings: Settings to use for playback
+            player_settings: Settings to use for playback ('start_sample' starts the playlist,
+                and stops the current one, at an audio clock sample position)
         """
 
         self.log.debug("play - Preparing playlist '%s' for playback.", playlist)
@@ -102,11 +135,16 @@ class PlaylistController:
         if player_settings is None:
             player_settings = dict()
 
+        start_sample = player_settings.get('start_sample')
+
         if playlist not in self.mc.playlists:
             self.log.error("PlaylistController (%s track): Could not play specified playlist "
                            "(%s) as it does not exist", self.name, playlist)
             return None
 
+        # A sound prepared for the current playlist will not be played
+        self._cancel_prepared_sound()
+
         # Is there already a previous playlist that is still active (fading)?
         if self._is_busy():
             # Delay play playlist until track is finished with current crossfade (too busy)
@@ -128,10 +166,11 @@ class PlaylistController:
             # Already a playlist playing.  We know there is at least one free sound player because
             # of the _is_busy() call above.
             # Stop the current playlist
-            self.stop()
+            self.stop(start_sample)
 
         # Start the new playlist (now becomes the current playlist)
         self._current_playlist = playlist_instance
+        self._next_sound_name = None
 
         # Post events when played for playlist
         for event in self._current_playlist.events_when_played:
@@ -139,7 +178,7 @@ class PlaylistController:
 
         # Get the next sound to play from playlist
         sound_name = self._current_playlist.get_next_sound_name()
-        self._play_playlist_sound(sound_name, self._current_playlist)
+        self._play_playlist_sound(sound_name, self._current_playlist, start_sample=start_sample)
 
         return playlist_instance
 
@@ -150,7 +189,7 @@ class PlaylistController:
         else:
             return False
 
-    def _play_playlist_sound(self, str sound_name, object playlist, float fade_in=0.0):
+    def _play_playlist_sound(self, str sound_name, object playlist, float fade_in=0.0, start_sample=None):
         """
         Plays the specified playlist sound
         Args:
@@ -158,14 +197,39 @@ class PlaylistController:
             playlist: The playlist from which the sound came from
             fade_in: The number of seconds over which to fade in the sound (frequently the
                 crossfade time).
+            start_sample: The audio clock sample position at which to start the sound (None
+                to start it as soon as possible).
 
         """
 
         # Create sound instance
         sound = self.mc.sounds[sound_name]
 
-        # Add custom events to post when particular sound actions occur (stop, about to finish).
+        # Post events when sound changed as a new sound is playing now for the current playlist
+        for event in self._current_playlist.events_when_sound_changed:
+            self.mc.post_mc_native_event(event)
+
+        # Play sound on playlist track (override certain settings needed to manage playlist)
+        # Standard track will return a sound instance if play was successful
+        settings = self._get_playlist_sound_settings(sound, playlist, fade_in)
+        settings['start_sample'] = start_sample
+        sound_instance = self._track.play_sound(sound, playlist.context, settings)
+
+        # Associate sound instance with playlist instance
+        self._playlists_by_sound_instance[sound_instance] = playlist
+        playlist.current_sound_instance = sound_instance
+
+    def _get_playlist_sound_settings(self, object sound, object playlist, float fade_in=0.0):
+        """Returns the settings used to play a playlist sound (overrides certain settings needed
+        to manage the playlist)."""
+
+        # Add custom events to post when particular sound actions occur (played, stop, about to finish).
         # These events are used to trigger playlist events (advance, stop)
+        events_when_played = []
+        if sound.events_when_played:
+            events_when_played.extend(sound.events_when_played)
+        events_when_played.extend(['{}_playlist_sound_played'.format(self.name.lower())])
+
         events_when_stopped = []
         if sound.events_when_stopped:
             events_when_stopped.extend(sound.events_when_stopped)
@@ -176,29 +240,134 @@ class PlaylistController:
             events_when_about_to_finish.extend(sound.events_when_about_to_finish)
         events_when_about_to_finish.extend(['{}_playlist_sound_about_to_finish'.format(self.name.lower())])
 
-        # Post events when sound changed as a new sound is playing now for the current playlist
-        for event in self._current_playlist.events_when_sound_changed:
-            self.mc.post_mc_native_event(event)
+        return {
+            'fade_in': fade_in,
+            'fade_out': 0.0,
+            'about_to_finish_time': playlist.crossfade_time,
+            'max_queue_time': None,
+            'events_when_played': events_when_played,
+            'events_when_stopped': events_when_stopped,
+            'events_when_about_to_finish': events_when_about_to_finish
+        }
+
+    def _get_next_sound_name(self):
+        """Returns the name of the next sound of the current playlist (a sound that has already
+        been taken from the playlist but has not been played is returned first).  Posts the
+        playlist looping events when the playlist starts over."""
+        if self._next_sound_name is not None:
+            sound_name = self._next_sound_name
+            self._next_sound_name = None
+            return sound_name
 
-        # Play sound on playlist track (override certain settings needed to manage playlist)
-        # Standard track will return a sound instance if play was successful
-        sound_instance = self._track.play_sound(sound,
-                                                playlist.context,
-                                                {
-                                                    'fade_in': fade_in,
-                                                    'fade_out': 0.0,
-                                                    'about_to_finish_time': playlist.crossfade_time,
-                                                    'max_queue_time': None,
-                                                    'events_when_stopped': events_when_stopped,
-                                                    'events_when_about_to_finish': events_when_about_to_finish
-                                                })
+        # Determine if playlist will now repeat/loop.  Post playlist looping events (if necessary)
+        if self._current_playlist.end_of_playlist:
+            if self._current_playlist.repeat and self._current_playlist.events_when_looping:
+                    for event in self._current_playlist.events_when_looping:
+                        self.mc.post_mc_native_event(event)
 
-        # Associate sound instance with playlist instance
-        self._playlists_by_sound_instance[sound_instance] = playlist
-        playlist.current_sound_instance = sound_instance
+        return self._current_playlist.get_next_sound_name()
+
+    def _has_next_sound(self, object playlist):
+        """Returns whether there is another sound to play after the current one in the playlist"""
+        return not playlist.end_of_playlist or playlist.repeat or self._next_sound_name is not None
+
+    def _schedule_prepare_next_sound(self, sound_instance):
+        """Schedules the preparation of the next playlist sound the decode ahead time before the
+        current sound instance reaches its transition point (about to finish marker or end).  In
+        gapless mode without a decode ahead time, the next sound is prepared right away."""
+        if (self._decode_ahead_time <= 0.0 and not self._gapless) or sound_instance.loops != 0 or \
+                not self._has_next_sound(self._current_playlist):
+            return
+
+        if sound_instance.sound.container is None:
+            # The duration of the sound is only known once it has been loaded (e.g. an on demand
+            # sound which has been unloaded), schedule the preparation when it has been loaded
+            if not sound_instance.sound.loaded:
+                sound_instance.sound.load(callback=partial(self._on_current_sound_loaded, sound_instance))
+            return
 
-    def stop(self):
-        """Immediately stop the currently playing playlist. Will fade out using the crossfade setting."""
+        if self._prepare_next_sound_event is not None:
+            self._prepare_next_sound_event.cancel()
+
+        if self._decode_ahead_time <= 0.0:
+            delay = 0.0
+        else:
+            delay = sound_instance.sound.container.duration - sound_instance.start_at - self._decode_ahead_time
+            if not self._gapless:
+                delay -= self._current_playlist.crossfade_time
+
+        self._prepare_next_sound_event = self.mc.clock.schedule_once(
+            partial(self._prepare_next_sound, sound_instance), max(delay, 0.0))
+
+    def _on_current_sound_loaded(self, sound_instance, sound=None):
+        """Callback function called when the sound of the current sound instance has been loaded
+        (schedules the preparation of the next sound)."""
+        del sound
+        if self._current_playlist is not None and self._current_playlist.current_sound_instance is sound_instance:
+            self._schedule_prepare_next_sound(sound_instance)
+
+    def _prepare_next_sound(self, sound_instance, dt=None):
+        """Loads the next playlist sound and schedules it on the track to start when the specified
+        (current) sound instance reaches its about to finish marker (crossfade) or its end
+        (gapless or no crossfade).  The track starts the sound at the exact sample position."""
+        del dt
+        self._prepare_next_sound_event = None
+
+        playlist = self._current_playlist
+        if playlist is None or playlist.current_sound_instance is not sound_instance or \
+                self._prepared_sound_instance is not None:
+            return
+
+        if self._is_busy():
+            # A sound is still fading out, prepare the next sound once it has finished
+            self._prepare_next_sound_when_not_busy = True
+            return
+
+        sound_name = self._get_next_sound_name()
+        if not sound_name:
+            return
+
+        self.log.debug("Preparing sound '%s' of playlist '%s' for playback.", sound_name, playlist.name)
+
+        # Loading a streaming sound builds and pre-rolls its pipeline, the track keeps the sound
+        # decoding while it waits for the transition point
+        sound = self.mc.sounds[sound_name]
+        if self._gapless or playlist.crossfade_time == 0.0:
+            settings = self._get_playlist_sound_settings(sound, playlist)
+            settings['start_after_marker'] = 'end'
+        else:
+            settings = self._get_playlist_sound_settings(sound, playlist, playlist.crossfade_time)
+            settings['start_after_marker'] = 'about_to_finish'
+        settings['start_after'] = sound_instance
+
+        self._prepared_sound_instance = self._track.play_sound(sound, playlist.context, settings)
+        if self._prepared_sound_instance is None:
+            self._next_sound_name = sound_name
+        else:
+            self._prepared_sound_name = sound_name
+
+    def _cancel_prepared_sound(self):
+        """Cancels the prepared next sound (if it has not started yet).  The sound will be the
+        next one played by the playlist."""
+        if self._prepare_next_sound_event is not None:
+            self._prepare_next_sound_event.cancel()
+            self._prepare_next_sound_event = None
+        self._prepare_next_sound_when_not_busy = False
+
+        if self._prepared_sound_instance is not None:
+            sound_instance = self._prepared_sound_instance
+            self._prepared_sound_instance = None
+            self._next_sound_name = self._prepared_sound_name
+            self._prepared_sound_name = None
+            self._track.stop_sound_instance(sound_instance, 0.0)
+
+    def stop(self, start_sample=None):
+        """Immediately stop the currently playing playlist. Will fade out using the crossfade setting.
+
+        Args:
+            start_sample: The audio clock sample position at which to start the fade out (None to
+                stop the playlist now).
+        """
         if not self._current_playlist:
             self.log.debug("stop - No playlist is currently playing. Could not stop current playlist.")
             return
@@ -206,15 +375,22 @@ class PlaylistController:
         self.log.debug("stop - Stopping the current playlist ('%s').",
                        self._current_playlist.name)
 
+        self._cancel_prepared_sound()
+        self._next_sound_name = None
+
         # Stop the current sound (if another sound is fading out, let it finish on its own)
         if self._current_playlist.current_sound_instance:
-            self._track.stop_sound_instance(self._current_playlist.current_sound_instance,
-                                            self._current_playlist.crossfade_time)
+            self._stop_playlist_sound(self._current_playlist.current_sound_instance, start_sample)
 
         self._current_playlist = None
 
-    def advance(self):
-        """Advance the currently playing playlist to the next sound."""
+    def advance(self, start_sample=None):
+        """Advance the currently playing playlist to the next sound.
+
+        Args:
+            start_sample: The audio clock sample position at which the transition to the next
+                sound starts (None to advance now).
+        """
 
         # If there is no current playlist, do nothing
         if not self._current_playlist:
@@ -224,27 +400,32 @@ class PlaylistController:
         self.log.debug("advance - Advancing the current playlist ('%s') to the next sound.",
                        self._current_playlist.name)
 
+        # A prepared sound will be played now instead (it will not wait for the current sound)
+        self._cancel_prepared_sound()
+
         if self._is_busy():
             # Delay advance playlist until track is finished with current crossfade (too busy)
-            self._pending_request = partial(self.advance)
+            self._pending_request = partial(self.advance, start_sample=start_sample)
             self.log.debug("advance - Playlist track is too busy. Delaying advance to next sound")
             return
 
-        # Determine if playlist will now repeat/loop.  Post playlist looping events (if necessary)
-        if self._current_playlist.end_of_playlist:
-            if self._current_playlist.repeat and self._current_playlist.events_when_looping:
-                    for event in self._current_playlist.events_when_looping:
-                        self.mc.post_mc_native_event(event)
-
         # Set the next sound in the sound player and calculate the fades based on the crossfade setting
-        next_sound_name = self._current_playlist.get_next_sound_name()
+        next_sound_name = self._get_next_sound_name()
         if next_sound_name:
             if self._current_playlist.current_sound_instance is not None:
-                self._track.stop_sound_instance(self._current_playlist.current_sound_instance,
-                                                self._current_playlist.crossfade_time)
+                self._stop_playlist_sound(self._current_playlist.current_sound_instance, start_sample)
                 self._current_playlist.fading_sound_instance = self._current_playlist.current_sound_instance
 
-            self._play_playlist_sound(next_sound_name, self._current_playlist, self._current_playlist.crossfade_time)
+            self._play_playlist_sound(next_sound_name, self._current_playlist, self._current_playlist.crossfade_time,
+                                      start_sample)
+
+    def _stop_playlist_sound(self, sound_instance, start_sample=None):
+        """Stops a playlist sound (fading out using the crossfade setting), now or at an audio
+        clock sample position."""
+        if start_sample is None:
+            self._track.stop_sound_instance(sound_instance, self._current_playlist.crossfade_time)
+        else:
+            self._track.stop_sound_instance_at(sound_instance, start_sample, self._current_playlist.crossfade_time)
 
     def set_repeat(self, repeat=True):
         """Set whether or not the currently playing playlist should repeat when finished."""
@@ -256,9 +437,44 @@ class PlaylistController:
             self.log.debug("set_repeat - No playlist is currently playing. "
                            "Could not set repeat to {}.", str(repeat))
 
+    def _on_sound_instance_played(self, sound_instance=None, **kwargs):
+        """Callback function called whenever a playlist sound has started playing."""
+
+        if sound_instance is None:
+            return
+
+        if sound_instance is self._prepared_sound_instance:
+            # The prepared sound has started (crossfading with or right after the current sound)
+            self._prepared_sound_instance = None
+            self._prepared_sound_name = None
+            playlist = self._current_playlist
+
+            # Post events when sound changed as a new sound is playing now for the current playlist
+            for event in playlist.events_when_sound_changed:
+                self.mc.post_mc_native_event(event)
+
+            if playlist.current_sound_instance is not None:
+                playlist.fading_sound_instance = playlist.current_sound_instance
+
+            self._playlists_by_sound_instance[sound_instance] = playlist
+            playlist.current_sound_instance = sound_instance
+
+        # Prepare the sound that follows the current sound of the current playlist
+        if self._current_playlist is not None and self._current_playlist.current_sound_instance is sound_instance:
+            self._schedule_prepare_next_sound(sound_instance)
+
     def _on_sound_instance_stopped(self, sound_instance=None, **kwargs):
         """Callback function called whenever a playlist sound has finished playing."""
 
+        if sound_instance is not None and sound_instance is self._prepared_sound_instance:
+            # The prepared sound was canceled by the track before it started (the current sound
+            # stopped before its about to finish marker), play the sound now instead
+            self._prepared_sound_instance = None
+            self._next_sound_name = self._prepared_sound_name
+            self._prepared_sound_name = None
+            self.advance()
+            return
+
         if sound_instance is None or sound_instance not in self._playlists_by_sound_instance:
             return
 
@@ -275,8 +491,10 @@ class PlaylistController:
         for event in playlist.events_when_sound_stopped:
             self.mc.post_mc_native_event(event)
 
-        # Playlist is finished when last sound instance of playlist has completed
-        if playlist not in self._playlists_by_sound_instance.values():
+        # Playlist is finished when last sound instance of playlist has completed (and the
+        # next sound is not waiting to start)
+        if playlist not in self._playlists_by_sound_instance.values() and \
+                (playlist != self._current_playlist or self._prepared_sound_instance is None):
 
             # Playlist has stopped
 
@@ -294,6 +512,11 @@ class PlaylistController:
             self._pending_request = None
             request()
 
+        # Prepare the next sound if it had to wait for a sound to finish fading out
+        if self._prepare_next_sound_when_not_busy and self._current_playlist is not None:
+            self._prepare_next_sound_when_not_busy = False
+            self._prepare_next_sound(self._current_playlist.current_sound_instance)
+
     def _on_sound_instance_about_to_finish(self, sound_instance=None, **kwargs):
         """Callback function called whenever a playlist sound is about to finish playing."""
 
@@ -303,12 +526,13 @@ class PlaylistController:
         # Get playlist for sound_instance
         playlist = self._playlists_by_sound_instance[sound_instance]
 
-        # Take no action if the sound is not from the current playlist
-        if playlist != self._current_playlist:
+        # Take no action if the sound is not from the current playlist or if the next sound has
+        # been prepared (the track starts it at the marker)
+        if playlist != self._current_playlist or self._prepared_sound_instance is not None:
             return
 
         # Determine if this is the last sound in the playlist
-        if playlist.end_of_playlist and not playlist.repeat:
+        if not self._has_next_sound(playlist):
             return
 
         # Advance to the next sound in the playlist
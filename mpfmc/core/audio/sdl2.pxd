@@ -87,6 +87,25 @@ cdef extern from "SDL.h" nogil:
     int SDL_CondSignal(SDL_cond *)
     int SDL_CondWait(SDL_cond *, SDL_mutex *)
 
+    struct SDL_semaphore:
+        pass
+    ctypedef SDL_semaphore SDL_sem
+
+    int SDL_MUTEX_TIMEDOUT
+
+    SDL_sem *SDL_CreateSemaphore(Uint32 initial_value)
+    void SDL_DestroySemaphore(SDL_sem *sem)
+    int SDL_SemPost(SDL_sem *sem)
+    int SDL_SemWaitTimeout(SDL_sem *sem, Uint32 ms)
+
+    ctypedef struct SDL_atomic_t:
+        int value
+
+    int SDL_AtomicSet(SDL_atomic_t *a, int v)
+    int SDL_AtomicGet(SDL_atomic_t *a)
+    SDL_bool SDL_AtomicCASPtr(void **a, void *oldval, void *newval)
+    void *SDL_AtomicSetPtr(void **a, void *v)
+
     struct SDL_Thread:
         pass
 
@@ -126,6 +145,8 @@ cdef extern from "SDL.h" nogil:
     void SDL_free(void *ptr)
 
     Uint32 SDL_GetTicks()
+    Uint64 SDL_GetPerformanceCounter()
+    Uint64 SDL_GetPerformanceFrequency()
 
     struct SDL_version:
         Uint8 major
@@ -243,4 +264,13 @@ ctypedef struct AudioCallbackData:
     Uint8 silence
     Uint8 track_count
     void **tracks
+    Uint64 sample_clock
+    Sint32 *mix_buffer
+    bint float_mix_bus
+    float *float_mix_buffer
+    float master_gain
+    void *master_inserts
+    SDL_sem *notification_semaphore
+    SDL_atomic_t notification_wakeup_pending
+    void *perf_counters
     FILE *c_log_file
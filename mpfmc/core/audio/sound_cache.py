@@ -0,0 +1,131 @@
+"""Cache of sound files converted to the audio output format."""
+import logging
+import os
+import time
+import wave
+
+from mpfmc.core.audio.audio_exception import AudioException
+
+# Sound cache folder (relative to the machine folder)
+SOUND_CACHE_FOLDER = os.path.join('cache', 'sounds')
+
+# All samples are signed 16-bit
+SOUND_CACHE_SAMPLE_WIDTH = 2
+
+
+class SoundCache(object):
+
+    """Cache of sound files converted to the audio output format.
+
+    Sound files are normally converted to the audio output format (sample rate,
+    number of channels and sample format) each time they are loaded into memory,
+    and streaming sounds are converted while they are played. The sound cache
+    holds a copy of each sound file of the machine folder already converted to
+    the output format (uncompressed WAV files) so sounds can be loaded and
+    streamed without any conversion.
+
+    Each output format has its own cache folder (changing the sample rate or
+    number of channels of the sound system does not invalidate the cache of the
+    other formats). A cached file is only used while it is newer than its
+    original sound file. The cache is built using the build_sounds command and
+    used when the ``sound_system: sound_cache: true`` setting is used.
+    """
+
+    def __init__(self, machine_path, rate, channels):
+        """Initialise sound cache."""
+        self.log = logging.getLogger('SoundCache')
+        self.machine_path = os.path.abspath(machine_path)
+        self.rate = rate
+        self.channels = channels
+        self.folder = os.path.join(self.machine_path, SOUND_CACHE_FOLDER, '{}hz_{}ch'.format(rate, channels))
+
+    def get_cached_file_name(self, file_name):
+        """Return the name of the cached file of a sound file (None for files outside of the
+        machine folder)."""
+        relative_name = os.path.relpath(os.path.abspath(file_name), self.machine_path)
+        if relative_name.startswith(os.pardir):
+            return None
+        return os.path.join(self.folder, relative_name + '.wav')
+
+    def is_up_to_date(self, file_name):
+        """Return true if the cached file of a sound file exists and is newer than the sound file."""
+        cached_file_name = self.get_cached_file_name(file_name)
+        if cached_file_name is None:
+            return False
+
+        try:
+            return os.path.getmtime(cached_file_name) >= os.path.getmtime(file_name)
+        except OSError:
+            return False
+
+    def get_file(self, file_name):
+        """Return the name of the file to load for a sound file (the cached file when it is up
+        to date, the sound file otherwise)."""
+        if self.is_up_to_date(file_name):
+            self.log.debug("Using cached file for %s", file_name)
+            return self.get_cached_file_name(file_name)
+        return file_name
+
+    def build_file(self, audio_interface, file_name, force=False):
+        """Convert a sound file to the audio output format and store it in the cache.
+
+        Args:
+            audio_interface: The AudioInterface used to convert the sound (must use the same
+                sample rate and number of channels as the cache)
+            file_name: The sound file to convert
+            force: Convert the sound file even if its cached file is up to date
+
+        Returns:
+            A dictionary with the result ('status' is 'built', 'up to date' or 'failed'), the
+            size of the sound file and of the cached file (bytes) and the conversion time (secs).
+        """
+        cached_file_name = self.get_cached_file_name(file_name)
+        result = {'file': file_name, 'cached_file': cached_file_name, 'status': 'up to date',
+                  'size': os.path.getsize(file_name), 'cached_size': 0, 'time': 0.0, 'error': None}
+
+        if cached_file_name is None:
+            result['status'] = 'failed'
+            result['error'] = 'The file is not in the machine folder'
+            return result
+
+        if not force and self.is_up_to_date(file_name):
+            result['cached_size'] = os.path.getsize(cached_file_name)
+            return result
+
+        start_time = time.perf_counter()
+        try:
+            sound_file = audio_interface.load_sound_file_to_memory(file_name)
+            samples = sound_file.get_samples()
+            sound_file.unload()
+
+            os.makedirs(os.path.dirname(cached_file_name), exist_ok=True)
+            with wave.open(cached_file_name, 'wb') as wav_file:
+                wav_file.setnchannels(self.channels)
+                wav_file.setsampwidth(SOUND_CACHE_SAMPLE_WIDTH)
+                wav_file.setframerate(self.rate)
+                wav_file.writeframes(samples)
+
+            self.verify_file(cached_file_name, len(samples) // (SOUND_CACHE_SAMPLE_WIDTH * self.channels))
+
+        except (AudioException, OSError, wave.Error) as exception:
+            result['status'] = 'failed'
+            result['error'] = str(exception)
+            if os.path.isfile(cached_file_name):
+                os.remove(cached_file_name)
+            return result
+
+        result['status'] = 'built'
+        result['cached_size'] = os.path.getsize(cached_file_name)
+        result['time'] = time.perf_counter() - start_time
+        return result
+
+    def verify_file(self, cached_file_name, frame_count):
+        """Check a cached file is in the audio output format and holds the expected number of
+        sample frames (raises an AudioException otherwise)."""
+        with wave.open(cached_file_name, 'rb') as wav_file:
+            if wav_file.getframerate() != self.rate or wav_file.getnchannels() != self.channels or \
+                    wav_file.getsampwidth() != SOUND_CACHE_SAMPLE_WIDTH:
+                raise AudioException("Cached file {} is not in the audio output format".format(cached_file_name))
+            if wav_file.getnframes() != frame_count:
+                raise AudioException("Cached file {} holds {} sample frames ({} expected)".format(
+                    cached_file_name, wav_file.getnframes(), frame_count))
@@ -730,7 +730,7 @@ static const char *__pyx_filename;
 
 
 static const char *__pyx_f[] = {
-  "mpfmc\\core\\audio\\sound_file.pyx",
+  "mpfmc/core/audio/sound_file.pyx",
   "stringsource",
 };
 /* NoFastGil.proto */
@@ -753,7 +753,7 @@ struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundStreamingFile;
 struct __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData;
 typedef struct __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData;
 
-/* "mpfmc/core/audio/sdl2.pxd":229
+/* "mpfmc/core/audio/sdl2.pxd":250
  * # ---------------------------------------------------------------------------
  * 
  * ctypedef struct AudioCallbackData:             # <<<<<<<<<<<<<<
@@ -774,6 +774,15 @@ struct __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData {
   Uint8 silence;
   Uint8 track_count;
   void **tracks;
+  Uint64 sample_clock;
+  Sint32 *mix_buffer;
+  int float_mix_bus;
+  float *float_mix_buffer;
+  float master_gain;
+  void *master_inserts;
+  SDL_sem *notification_semaphore;
+  SDL_atomic_t notification_wakeup_pending;
+  void *perf_counters;
   FILE *c_log_file;
 };
 struct __pyx_t_5mpfmc_4core_5audio_10sound_file_SampleMemory;
@@ -852,12 +861,12 @@ struct __pyx_t_5mpfmc_4core_5audio_10sound_file_SoundSample {
   double duration;
 };
 
-/* "mpfmc/core/audio/sound_file.pyx":18
- * #    SoundFile class
- * # ---------------------------------------------------------------------------
+/* "mpfmc/core/audio/sound_file.pxd":33
+ * 
+ * 
  * cdef class SoundFile:             # <<<<<<<<<<<<<<
  *     """SoundFile is the base class for wrapper classes used to manage sound sample data."""
- * 
+ *     cdef str file_name
  */
 struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundFile {
   PyObject_HEAD
@@ -868,9 +877,9 @@ struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundFile {
 };
 
 
-/* "mpfmc/core/audio/sound_file.pyx":47
- * #    SoundMemoryFile class
- * # ---------------------------------------------------------------------------
+/* "mpfmc/core/audio/sound_file.pxd":41
+ * 
+ * 
  * cdef class SoundMemoryFile(SoundFile):             # <<<<<<<<<<<<<<
  *     """SoundMemoryFile is a wrapper class to manage sound sample data stored
  *     in memory."""
@@ -881,12 +890,12 @@ struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile {
 };
 
 
-/* "mpfmc/core/audio/sound_file.pyx":123
- * #    SoundStreamingFile class
- * # ---------------------------------------------------------------------------
+/* "mpfmc/core/audio/sound_file.pxd":47
+ * 
+ * 
  * cdef class SoundStreamingFile(SoundFile):             # <<<<<<<<<<<<<<
  *     """SoundStreamingFile is a wrapper class to manage streaming sound sample data."""
- * 
+ *     cdef GstElement *pipeline
  */
 struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundStreamingFile {
   struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundFile __pyx_base;
@@ -1126,6 +1135,9 @@ static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object);
 static void __Pyx_AddTraceback(const char *funcname, int c_line,
                                int py_line, const char *filename);
 
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_gsize(gsize value);
+
 /* CIntToPy.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
 
@@ -1160,14 +1172,14 @@ static int __Pyx_check_binary_version(void);
 static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
 
 
-/* Module declarations from 'cpython.mem' */
-
-/* Module declarations from 'cpython.pycapsule' */
-
 /* Module declarations from 'mpfmc.core.audio.sdl2' */
 
 /* Module declarations from 'mpfmc.core.audio.gstreamer' */
 
+/* Module declarations from 'cpython.mem' */
+
+/* Module declarations from 'cpython.pycapsule' */
+
 /* Module declarations from 'mpfmc.core.audio.sound_file' */
 static PyTypeObject *__pyx_ptype_5mpfmc_4core_5audio_10sound_file_SoundFile = 0;
 static PyTypeObject *__pyx_ptype_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile = 0;
@@ -1299,6 +1311,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_9SoundFile_2__repr__(
 static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_9SoundFile_4load(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundFile *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_9SoundFile_6unload(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundFile *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_9SoundFile_8duration___get__(struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundFile *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_9SoundFile_11memory_size___get__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundFile *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_9SoundFile_8__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundFile *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_9SoundFile_10__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundFile *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
 static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile___init__(struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *__pyx_v_self, PyObject *__pyx_v_file_name, PyObject *__pyx_v_audio_callback_data); /* proto */
@@ -1307,8 +1320,10 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_4__
 static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6load(struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_8unload(struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6loaded___get__(struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_10__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_12__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_11memory_size___get__(struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_10get_samples(struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_12__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_14__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
 static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile___cinit__(struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundStreamingFile *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v_args, CYTHON_UNUSED PyObject *__pyx_v_kwargs); /* proto */
 static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_2__init__(struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundStreamingFile *__pyx_v_self, PyObject *__pyx_v_file_name, PyObject *__pyx_v_audio_callback_data); /* proto */
 static void __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_4__dealloc__(struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundStreamingFile *__pyx_v_self); /* proto */
@@ -1324,6 +1339,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
 static PyObject *__pyx_tp_new_5mpfmc_4core_5audio_10sound_file_SoundFile(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_tp_new_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_tp_new_5mpfmc_4core_5audio_10sound_file_SoundStreamingFile(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_int_0;
 static PyObject *__pyx_tuple_;
 static PyObject *__pyx_tuple__2;
 static PyObject *__pyx_tuple__3;
@@ -1697,7 +1713,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_9SoundFile_8duration_
  *         """Return the duration of the sound file"""
  *         return self.sample.duration             # <<<<<<<<<<<<<<
  * 
- * 
+ *     @property
  */
   __Pyx_XDECREF(__pyx_r);
   __pyx_t_1 = PyFloat_FromDouble(__pyx_v_self->sample.duration); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 41, __pyx_L1_error)
@@ -1725,6 +1741,59 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_9SoundFile_8duration_
   return __pyx_r;
 }
 
+/* "mpfmc/core/audio/sound_file.pyx":44
+ * 
+ *     @property
+ *     def memory_size(self):             # <<<<<<<<<<<<<<
+ *         """Return the number of bytes of sample data held in memory"""
+ *         return 0
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_10sound_file_9SoundFile_11memory_size_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_10sound_file_9SoundFile_11memory_size_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_10sound_file_9SoundFile_11memory_size___get__(((struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundFile *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_9SoundFile_11memory_size___get__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundFile *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__", 0);
+
+  /* "mpfmc/core/audio/sound_file.pyx":46
+ *     def memory_size(self):
+ *         """Return the number of bytes of sample data held in memory"""
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_int_0);
+  __pyx_r = __pyx_int_0;
+  goto __pyx_L0;
+
+  /* "mpfmc/core/audio/sound_file.pyx":44
+ * 
+ *     @property
+ *     def memory_size(self):             # <<<<<<<<<<<<<<
+ *         """Return the number of bytes of sample data held in memory"""
+ *         return 0
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
 /* "(tree fragment)":1
  * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
  *     raise TypeError("self.callback_data,self.sample cannot be converted to a Python object for pickling")
@@ -1834,7 +1903,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_9SoundFile_10__setsta
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/sound_file.pyx":51
+/* "mpfmc/core/audio/sound_file.pyx":56
  *     in memory."""
  * 
  *     def __init__(self, str file_name, object audio_callback_data):             # <<<<<<<<<<<<<<
@@ -1873,11 +1942,11 @@ static int __pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_1__init__
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_audio_callback_data)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, 1); __PYX_ERR(0, 51, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, 1); __PYX_ERR(0, 56, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 51, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 56, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
       goto __pyx_L5_argtuple_error;
@@ -1890,13 +1959,13 @@ static int __pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_1__init__
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 51, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 56, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("mpfmc.core.audio.sound_file.SoundMemoryFile.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return -1;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_file_name), (&PyUnicode_Type), 1, "file_name", 1))) __PYX_ERR(0, 51, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_file_name), (&PyUnicode_Type), 1, "file_name", 1))) __PYX_ERR(0, 56, __pyx_L1_error)
   __pyx_r = __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile___init__(((struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *)__pyx_v_self), __pyx_v_file_name, __pyx_v_audio_callback_data);
 
   /* function exit code */
@@ -1918,14 +1987,14 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile___init__(
   PyObject *__pyx_t_5 = NULL;
   __Pyx_RefNannySetupContext("__init__", 0);
 
-  /* "mpfmc/core/audio/sound_file.pyx":53
+  /* "mpfmc/core/audio/sound_file.pyx":58
  *     def __init__(self, str file_name, object audio_callback_data):
  *         # IMPORTANT: Call super class init function
  *         super().__init__(file_name, audio_callback_data)             # <<<<<<<<<<<<<<
  *         self.log = logging.getLogger("SoundMemoryFile")
  *         self.sample.type = sound_type_memory
  */
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 53, __pyx_L1_error)
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 58, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_INCREF(((PyObject *)__pyx_ptype_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile));
   __Pyx_GIVEREF(((PyObject *)__pyx_ptype_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile));
@@ -1933,10 +2002,10 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile___init__(
   __Pyx_INCREF(((PyObject *)__pyx_v_self));
   __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
   PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_v_self));
-  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_super, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 53, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_super, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 58, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_init); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 53, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_init); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 58, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __pyx_t_3 = NULL;
@@ -1954,7 +2023,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile___init__(
   #if CYTHON_FAST_PYCALL
   if (PyFunction_Check(__pyx_t_2)) {
     PyObject *__pyx_temp[3] = {__pyx_t_3, __pyx_v_file_name, __pyx_v_audio_callback_data};
-    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 2+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 53, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 2+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 58, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_GOTREF(__pyx_t_1);
   } else
@@ -1962,13 +2031,13 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile___init__(
   #if CYTHON_FAST_PYCCALL
   if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
     PyObject *__pyx_temp[3] = {__pyx_t_3, __pyx_v_file_name, __pyx_v_audio_callback_data};
-    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 2+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 53, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 2+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 58, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_GOTREF(__pyx_t_1);
   } else
   #endif
   {
-    __pyx_t_5 = PyTuple_New(2+__pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 53, __pyx_L1_error)
+    __pyx_t_5 = PyTuple_New(2+__pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 58, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     if (__pyx_t_3) {
       __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_3); __pyx_t_3 = NULL;
@@ -1979,26 +2048,26 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile___init__(
     __Pyx_INCREF(__pyx_v_audio_callback_data);
     __Pyx_GIVEREF(__pyx_v_audio_callback_data);
     PyTuple_SET_ITEM(__pyx_t_5, 1+__pyx_t_4, __pyx_v_audio_callback_data);
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 53, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 58, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   }
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":54
+  /* "mpfmc/core/audio/sound_file.pyx":59
  *         # IMPORTANT: Call super class init function
  *         super().__init__(file_name, audio_callback_data)
  *         self.log = logging.getLogger("SoundMemoryFile")             # <<<<<<<<<<<<<<
  *         self.sample.type = sound_type_memory
  *         self.sample.data.memory = <SampleMemory*>PyMem_Malloc(sizeof(SampleMemory))
  */
-  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_logging); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 54, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_logging); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 59, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_getLogger); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 54, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_getLogger); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 59, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_tuple__6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 54, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_tuple__6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 59, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_GIVEREF(__pyx_t_1);
@@ -2007,7 +2076,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile___init__(
   __pyx_v_self->__pyx_base.log = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":55
+  /* "mpfmc/core/audio/sound_file.pyx":60
  *         super().__init__(file_name, audio_callback_data)
  *         self.log = logging.getLogger("SoundMemoryFile")
  *         self.sample.type = sound_type_memory             # <<<<<<<<<<<<<<
@@ -2016,7 +2085,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile___init__(
  */
   __pyx_v_self->__pyx_base.sample.type = __pyx_e_5mpfmc_4core_5audio_10sound_file_sound_type_memory;
 
-  /* "mpfmc/core/audio/sound_file.pyx":56
+  /* "mpfmc/core/audio/sound_file.pyx":61
  *         self.log = logging.getLogger("SoundMemoryFile")
  *         self.sample.type = sound_type_memory
  *         self.sample.data.memory = <SampleMemory*>PyMem_Malloc(sizeof(SampleMemory))             # <<<<<<<<<<<<<<
@@ -2025,7 +2094,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile___init__(
  */
   __pyx_v_self->__pyx_base.sample.data.memory = ((__pyx_t_5mpfmc_4core_5audio_10sound_file_SampleMemory *)PyMem_Malloc((sizeof(__pyx_t_5mpfmc_4core_5audio_10sound_file_SampleMemory))));
 
-  /* "mpfmc/core/audio/sound_file.pyx":57
+  /* "mpfmc/core/audio/sound_file.pyx":62
  *         self.sample.type = sound_type_memory
  *         self.sample.data.memory = <SampleMemory*>PyMem_Malloc(sizeof(SampleMemory))
  *         self.sample.data.memory.data = NULL             # <<<<<<<<<<<<<<
@@ -2034,7 +2103,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile___init__(
  */
   __pyx_v_self->__pyx_base.sample.data.memory->data = NULL;
 
-  /* "mpfmc/core/audio/sound_file.pyx":58
+  /* "mpfmc/core/audio/sound_file.pyx":63
  *         self.sample.data.memory = <SampleMemory*>PyMem_Malloc(sizeof(SampleMemory))
  *         self.sample.data.memory.data = NULL
  *         self.sample.data.memory.size = 0             # <<<<<<<<<<<<<<
@@ -2043,14 +2112,14 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile___init__(
  */
   __pyx_v_self->__pyx_base.sample.data.memory->size = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":60
+  /* "mpfmc/core/audio/sound_file.pyx":65
  *         self.sample.data.memory.size = 0
  * 
  *         self.load()             # <<<<<<<<<<<<<<
  * 
  *     def __dealloc__(self):
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_load); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 60, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_load); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 65, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_t_5 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
@@ -2063,16 +2132,16 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile___init__(
     }
   }
   if (__pyx_t_5) {
-    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 60, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 65, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   } else {
-    __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 60, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 65, __pyx_L1_error)
   }
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":51
+  /* "mpfmc/core/audio/sound_file.pyx":56
  *     in memory."""
  * 
  *     def __init__(self, str file_name, object audio_callback_data):             # <<<<<<<<<<<<<<
@@ -2095,7 +2164,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile___init__(
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/sound_file.pyx":62
+/* "mpfmc/core/audio/sound_file.pyx":67
  *         self.load()
  * 
  *     def __dealloc__(self):             # <<<<<<<<<<<<<<
@@ -2122,14 +2191,14 @@ static void __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_2__deall
   int __pyx_t_4;
   __Pyx_RefNannySetupContext("__dealloc__", 0);
 
-  /* "mpfmc/core/audio/sound_file.pyx":63
+  /* "mpfmc/core/audio/sound_file.pyx":68
  * 
  *     def __dealloc__(self):
  *         self.unload()             # <<<<<<<<<<<<<<
  *         if self.sample.data.memory != NULL:
  *             PyMem_Free(self.sample.data.memory)
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_unload); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 63, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_unload); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 68, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_t_3 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
@@ -2142,16 +2211,16 @@ static void __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_2__deall
     }
   }
   if (__pyx_t_3) {
-    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 63, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 68, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   } else {
-    __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 63, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 68, __pyx_L1_error)
   }
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":64
+  /* "mpfmc/core/audio/sound_file.pyx":69
  *     def __dealloc__(self):
  *         self.unload()
  *         if self.sample.data.memory != NULL:             # <<<<<<<<<<<<<<
@@ -2161,7 +2230,7 @@ static void __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_2__deall
   __pyx_t_4 = ((__pyx_v_self->__pyx_base.sample.data.memory != NULL) != 0);
   if (__pyx_t_4) {
 
-    /* "mpfmc/core/audio/sound_file.pyx":65
+    /* "mpfmc/core/audio/sound_file.pyx":70
  *         self.unload()
  *         if self.sample.data.memory != NULL:
  *             PyMem_Free(self.sample.data.memory)             # <<<<<<<<<<<<<<
@@ -2170,7 +2239,7 @@ static void __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_2__deall
  */
     PyMem_Free(__pyx_v_self->__pyx_base.sample.data.memory);
 
-    /* "mpfmc/core/audio/sound_file.pyx":66
+    /* "mpfmc/core/audio/sound_file.pyx":71
  *         if self.sample.data.memory != NULL:
  *             PyMem_Free(self.sample.data.memory)
  *             self.sample.data.memory = NULL             # <<<<<<<<<<<<<<
@@ -2179,7 +2248,7 @@ static void __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_2__deall
  */
     __pyx_v_self->__pyx_base.sample.data.memory = NULL;
 
-    /* "mpfmc/core/audio/sound_file.pyx":64
+    /* "mpfmc/core/audio/sound_file.pyx":69
  *     def __dealloc__(self):
  *         self.unload()
  *         if self.sample.data.memory != NULL:             # <<<<<<<<<<<<<<
@@ -2188,7 +2257,7 @@ static void __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_2__deall
  */
   }
 
-  /* "mpfmc/core/audio/sound_file.pyx":62
+  /* "mpfmc/core/audio/sound_file.pyx":67
  *         self.load()
  * 
  *     def __dealloc__(self):             # <<<<<<<<<<<<<<
@@ -2207,7 +2276,7 @@ static void __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_2__deall
   __Pyx_RefNannyFinishContext();
 }
 
-/* "mpfmc/core/audio/sound_file.pyx":68
+/* "mpfmc/core/audio/sound_file.pyx":73
  *             self.sample.data.memory = NULL
  * 
  *     def __repr__(self):             # <<<<<<<<<<<<<<
@@ -2240,20 +2309,20 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_4__
   PyObject *__pyx_t_7 = NULL;
   __Pyx_RefNannySetupContext("__repr__", 0);
 
-  /* "mpfmc/core/audio/sound_file.pyx":69
+  /* "mpfmc/core/audio/sound_file.pyx":74
  * 
  *     def __repr__(self):
  *         if self.loaded:             # <<<<<<<<<<<<<<
  *             return '<SoundMemoryFile({}, Loaded=True, sample_duration={}s)>'.format(self.file_name, self.sample.duration)
  *         else:
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_loaded); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 69, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_loaded); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 74, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 69, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 74, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   if (__pyx_t_2) {
 
-    /* "mpfmc/core/audio/sound_file.pyx":70
+    /* "mpfmc/core/audio/sound_file.pyx":75
  *     def __repr__(self):
  *         if self.loaded:
  *             return '<SoundMemoryFile({}, Loaded=True, sample_duration={}s)>'.format(self.file_name, self.sample.duration)             # <<<<<<<<<<<<<<
@@ -2261,9 +2330,9 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_4__
  *             return "<SoundMemoryFile({}, Loaded=False)>".format(self.file_name)
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_SoundMemoryFile_Loaded_True_sam, __pyx_n_s_format); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 70, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_SoundMemoryFile_Loaded_True_sam, __pyx_n_s_format); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 75, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = PyFloat_FromDouble(__pyx_v_self->__pyx_base.sample.duration); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 70, __pyx_L1_error)
+    __pyx_t_4 = PyFloat_FromDouble(__pyx_v_self->__pyx_base.sample.duration); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 75, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __pyx_t_5 = NULL;
     __pyx_t_6 = 0;
@@ -2280,7 +2349,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_4__
     #if CYTHON_FAST_PYCALL
     if (PyFunction_Check(__pyx_t_3)) {
       PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_v_self->__pyx_base.file_name, __pyx_t_4};
-      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 70, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 75, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -2289,14 +2358,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_4__
     #if CYTHON_FAST_PYCCALL
     if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
       PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_v_self->__pyx_base.file_name, __pyx_t_4};
-      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 70, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 75, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     } else
     #endif
     {
-      __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 70, __pyx_L1_error)
+      __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 75, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_7);
       if (__pyx_t_5) {
         __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_5); __pyx_t_5 = NULL;
@@ -2307,7 +2376,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_4__
       __Pyx_GIVEREF(__pyx_t_4);
       PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_t_4);
       __pyx_t_4 = 0;
-      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 70, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 75, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
     }
@@ -2316,7 +2385,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_4__
     __pyx_t_1 = 0;
     goto __pyx_L0;
 
-    /* "mpfmc/core/audio/sound_file.pyx":69
+    /* "mpfmc/core/audio/sound_file.pyx":74
  * 
  *     def __repr__(self):
  *         if self.loaded:             # <<<<<<<<<<<<<<
@@ -2325,7 +2394,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_4__
  */
   }
 
-  /* "mpfmc/core/audio/sound_file.pyx":72
+  /* "mpfmc/core/audio/sound_file.pyx":77
  *             return '<SoundMemoryFile({}, Loaded=True, sample_duration={}s)>'.format(self.file_name, self.sample.duration)
  *         else:
  *             return "<SoundMemoryFile({}, Loaded=False)>".format(self.file_name)             # <<<<<<<<<<<<<<
@@ -2334,7 +2403,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_4__
  */
   /*else*/ {
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_SoundMemoryFile_Loaded_False, __pyx_n_s_format); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 72, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_SoundMemoryFile_Loaded_False, __pyx_n_s_format); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 77, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __pyx_t_7 = NULL;
     if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
@@ -2347,13 +2416,13 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_4__
       }
     }
     if (!__pyx_t_7) {
-      __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_self->__pyx_base.file_name); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 72, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_self->__pyx_base.file_name); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 77, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
     } else {
       #if CYTHON_FAST_PYCALL
       if (PyFunction_Check(__pyx_t_3)) {
         PyObject *__pyx_temp[2] = {__pyx_t_7, __pyx_v_self->__pyx_base.file_name};
-        __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 72, __pyx_L1_error)
+        __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 77, __pyx_L1_error)
         __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
         __Pyx_GOTREF(__pyx_t_1);
       } else
@@ -2361,19 +2430,19 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_4__
       #if CYTHON_FAST_PYCCALL
       if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
         PyObject *__pyx_temp[2] = {__pyx_t_7, __pyx_v_self->__pyx_base.file_name};
-        __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 72, __pyx_L1_error)
+        __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 77, __pyx_L1_error)
         __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
         __Pyx_GOTREF(__pyx_t_1);
       } else
       #endif
       {
-        __pyx_t_4 = PyTuple_New(1+1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 72, __pyx_L1_error)
+        __pyx_t_4 = PyTuple_New(1+1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 77, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_4);
         __Pyx_GIVEREF(__pyx_t_7); PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_7); __pyx_t_7 = NULL;
         __Pyx_INCREF(__pyx_v_self->__pyx_base.file_name);
         __Pyx_GIVEREF(__pyx_v_self->__pyx_base.file_name);
         PyTuple_SET_ITEM(__pyx_t_4, 0+1, __pyx_v_self->__pyx_base.file_name);
-        __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_4, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 72, __pyx_L1_error)
+        __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_4, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 77, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_1);
         __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       }
@@ -2384,7 +2453,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_4__
     goto __pyx_L0;
   }
 
-  /* "mpfmc/core/audio/sound_file.pyx":68
+  /* "mpfmc/core/audio/sound_file.pyx":73
  *             self.sample.data.memory = NULL
  * 
  *     def __repr__(self):             # <<<<<<<<<<<<<<
@@ -2407,7 +2476,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_4__
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/sound_file.pyx":74
+/* "mpfmc/core/audio/sound_file.pyx":79
  *             return "<SoundMemoryFile({}, Loaded=False)>".format(self.file_name)
  * 
  *     def load(self):             # <<<<<<<<<<<<<<
@@ -2445,20 +2514,20 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
   int __pyx_t_9;
   __Pyx_RefNannySetupContext("load", 0);
 
-  /* "mpfmc/core/audio/sound_file.pyx":78
+  /* "mpfmc/core/audio/sound_file.pyx":83
  *         cdef Mix_Chunk *chunk
  * 
  *         if self.loaded:             # <<<<<<<<<<<<<<
  *             return
  * 
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_loaded); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 78, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_loaded); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 83, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 78, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 83, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   if (__pyx_t_2) {
 
-    /* "mpfmc/core/audio/sound_file.pyx":79
+    /* "mpfmc/core/audio/sound_file.pyx":84
  * 
  *         if self.loaded:
  *             return             # <<<<<<<<<<<<<<
@@ -2469,7 +2538,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
     __pyx_r = Py_None; __Pyx_INCREF(Py_None);
     goto __pyx_L0;
 
-    /* "mpfmc/core/audio/sound_file.pyx":78
+    /* "mpfmc/core/audio/sound_file.pyx":83
  *         cdef Mix_Chunk *chunk
  * 
  *         if self.loaded:             # <<<<<<<<<<<<<<
@@ -2478,19 +2547,19 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
  */
   }
 
-  /* "mpfmc/core/audio/sound_file.pyx":81
+  /* "mpfmc/core/audio/sound_file.pyx":86
  *             return
  * 
  *         if not os.path.isfile(self.file_name):             # <<<<<<<<<<<<<<
  *             raise AudioException('Could not locate file ' + self.file_name)
  * 
  */
-  __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_os); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 81, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_os); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 86, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_path); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 81, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_path); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 86, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_isfile); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 81, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_isfile); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 86, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __pyx_t_4 = NULL;
@@ -2504,13 +2573,13 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
     }
   }
   if (!__pyx_t_4) {
-    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_self->__pyx_base.file_name); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 81, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_self->__pyx_base.file_name); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 86, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
   } else {
     #if CYTHON_FAST_PYCALL
     if (PyFunction_Check(__pyx_t_3)) {
       PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_v_self->__pyx_base.file_name};
-      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 81, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 86, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
       __Pyx_GOTREF(__pyx_t_1);
     } else
@@ -2518,39 +2587,39 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
     #if CYTHON_FAST_PYCCALL
     if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
       PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_v_self->__pyx_base.file_name};
-      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 81, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 86, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
       __Pyx_GOTREF(__pyx_t_1);
     } else
     #endif
     {
-      __pyx_t_5 = PyTuple_New(1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 81, __pyx_L1_error)
+      __pyx_t_5 = PyTuple_New(1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 86, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4); __pyx_t_4 = NULL;
       __Pyx_INCREF(__pyx_v_self->__pyx_base.file_name);
       __Pyx_GIVEREF(__pyx_v_self->__pyx_base.file_name);
       PyTuple_SET_ITEM(__pyx_t_5, 0+1, __pyx_v_self->__pyx_base.file_name);
-      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 81, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 86, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     }
   }
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 81, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 86, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_t_6 = ((!__pyx_t_2) != 0);
   if (__pyx_t_6) {
 
-    /* "mpfmc/core/audio/sound_file.pyx":82
+    /* "mpfmc/core/audio/sound_file.pyx":87
  * 
  *         if not os.path.isfile(self.file_name):
  *             raise AudioException('Could not locate file ' + self.file_name)             # <<<<<<<<<<<<<<
  * 
  *         # Load the audio file (will be converted to current sample output format)
  */
-    __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_AudioException); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 82, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_AudioException); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 87, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_5 = __Pyx_PyUnicode_ConcatSafe(__pyx_kp_u_Could_not_locate_file, __pyx_v_self->__pyx_base.file_name); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 82, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyUnicode_ConcatSafe(__pyx_kp_u_Could_not_locate_file, __pyx_v_self->__pyx_base.file_name); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 87, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __pyx_t_4 = NULL;
     if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
@@ -2563,14 +2632,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
       }
     }
     if (!__pyx_t_4) {
-      __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 82, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 87, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
       __Pyx_GOTREF(__pyx_t_1);
     } else {
       #if CYTHON_FAST_PYCALL
       if (PyFunction_Check(__pyx_t_3)) {
         PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_t_5};
-        __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 82, __pyx_L1_error)
+        __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 87, __pyx_L1_error)
         __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
         __Pyx_GOTREF(__pyx_t_1);
         __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
@@ -2579,20 +2648,20 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
       #if CYTHON_FAST_PYCCALL
       if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
         PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_t_5};
-        __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 82, __pyx_L1_error)
+        __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 87, __pyx_L1_error)
         __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
         __Pyx_GOTREF(__pyx_t_1);
         __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
       } else
       #endif
       {
-        __pyx_t_7 = PyTuple_New(1+1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 82, __pyx_L1_error)
+        __pyx_t_7 = PyTuple_New(1+1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 87, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_7);
         __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_4); __pyx_t_4 = NULL;
         __Pyx_GIVEREF(__pyx_t_5);
         PyTuple_SET_ITEM(__pyx_t_7, 0+1, __pyx_t_5);
         __pyx_t_5 = 0;
-        __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 82, __pyx_L1_error)
+        __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 87, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_1);
         __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
       }
@@ -2600,9 +2669,9 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_Raise(__pyx_t_1, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __PYX_ERR(0, 82, __pyx_L1_error)
+    __PYX_ERR(0, 87, __pyx_L1_error)
 
-    /* "mpfmc/core/audio/sound_file.pyx":81
+    /* "mpfmc/core/audio/sound_file.pyx":86
  *             return
  * 
  *         if not os.path.isfile(self.file_name):             # <<<<<<<<<<<<<<
@@ -2611,7 +2680,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
  */
   }
 
-  /* "mpfmc/core/audio/sound_file.pyx":85
+  /* "mpfmc/core/audio/sound_file.pyx":90
  * 
  *         # Load the audio file (will be converted to current sample output format)
  *         chunk = Mix_LoadWAV(self.file_name.encode('utf-8'))             # <<<<<<<<<<<<<<
@@ -2620,15 +2689,15 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
  */
   if (unlikely(__pyx_v_self->__pyx_base.file_name == Py_None)) {
     PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "encode");
-    __PYX_ERR(0, 85, __pyx_L1_error)
+    __PYX_ERR(0, 90, __pyx_L1_error)
   }
-  __pyx_t_1 = PyUnicode_AsUTF8String(__pyx_v_self->__pyx_base.file_name); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 85, __pyx_L1_error)
+  __pyx_t_1 = PyUnicode_AsUTF8String(__pyx_v_self->__pyx_base.file_name); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 90, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_8 = __Pyx_PyBytes_AsWritableString(__pyx_t_1); if (unlikely((!__pyx_t_8) && PyErr_Occurred())) __PYX_ERR(0, 85, __pyx_L1_error)
+  __pyx_t_8 = __Pyx_PyBytes_AsWritableString(__pyx_t_1); if (unlikely((!__pyx_t_8) && PyErr_Occurred())) __PYX_ERR(0, 90, __pyx_L1_error)
   __pyx_v_chunk = Mix_LoadWAV(__pyx_t_8);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":86
+  /* "mpfmc/core/audio/sound_file.pyx":91
  *         # Load the audio file (will be converted to current sample output format)
  *         chunk = Mix_LoadWAV(self.file_name.encode('utf-8'))
  *         if chunk == NULL:             # <<<<<<<<<<<<<<
@@ -2638,16 +2707,16 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
   __pyx_t_6 = ((__pyx_v_chunk == NULL) != 0);
   if (__pyx_t_6) {
 
-    /* "mpfmc/core/audio/sound_file.pyx":87
+    /* "mpfmc/core/audio/sound_file.pyx":92
  *         chunk = Mix_LoadWAV(self.file_name.encode('utf-8'))
  *         if chunk == NULL:
  *             msg = "Could not load sound file {} due to an error: {}".format(self.file_name, SDL_GetError())             # <<<<<<<<<<<<<<
  *             raise AudioException(msg)
  * 
  */
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Could_not_load_sound_file_due_to, __pyx_n_s_format); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 87, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Could_not_load_sound_file_due_to, __pyx_n_s_format); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 92, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_7 = __Pyx_PyBytes_FromString(SDL_GetError()); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 87, __pyx_L1_error)
+    __pyx_t_7 = __Pyx_PyBytes_FromString(SDL_GetError()); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 92, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_7);
     __pyx_t_5 = NULL;
     __pyx_t_9 = 0;
@@ -2664,7 +2733,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
     #if CYTHON_FAST_PYCALL
     if (PyFunction_Check(__pyx_t_3)) {
       PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_v_self->__pyx_base.file_name, __pyx_t_7};
-      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_9, 2+__pyx_t_9); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 87, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_9, 2+__pyx_t_9); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 92, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
@@ -2673,14 +2742,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
     #if CYTHON_FAST_PYCCALL
     if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
       PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_v_self->__pyx_base.file_name, __pyx_t_7};
-      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_9, 2+__pyx_t_9); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 87, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_9, 2+__pyx_t_9); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 92, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
     } else
     #endif
     {
-      __pyx_t_4 = PyTuple_New(2+__pyx_t_9); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 87, __pyx_L1_error)
+      __pyx_t_4 = PyTuple_New(2+__pyx_t_9); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 92, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
       if (__pyx_t_5) {
         __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_5); __pyx_t_5 = NULL;
@@ -2691,7 +2760,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
       __Pyx_GIVEREF(__pyx_t_7);
       PyTuple_SET_ITEM(__pyx_t_4, 1+__pyx_t_9, __pyx_t_7);
       __pyx_t_7 = 0;
-      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_4, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 87, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_4, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 92, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     }
@@ -2699,14 +2768,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
     __pyx_v_msg = __pyx_t_1;
     __pyx_t_1 = 0;
 
-    /* "mpfmc/core/audio/sound_file.pyx":88
+    /* "mpfmc/core/audio/sound_file.pyx":93
  *         if chunk == NULL:
  *             msg = "Could not load sound file {} due to an error: {}".format(self.file_name, SDL_GetError())
  *             raise AudioException(msg)             # <<<<<<<<<<<<<<
  * 
  *         # Save the loaded sample data
  */
-    __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_AudioException); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 88, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_AudioException); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 93, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __pyx_t_4 = NULL;
     if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
@@ -2719,13 +2788,13 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
       }
     }
     if (!__pyx_t_4) {
-      __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_msg); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 88, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_msg); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 93, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
     } else {
       #if CYTHON_FAST_PYCALL
       if (PyFunction_Check(__pyx_t_3)) {
         PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_v_msg};
-        __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 88, __pyx_L1_error)
+        __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 93, __pyx_L1_error)
         __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
         __Pyx_GOTREF(__pyx_t_1);
       } else
@@ -2733,19 +2802,19 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
       #if CYTHON_FAST_PYCCALL
       if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
         PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_v_msg};
-        __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 88, __pyx_L1_error)
+        __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 93, __pyx_L1_error)
         __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
         __Pyx_GOTREF(__pyx_t_1);
       } else
       #endif
       {
-        __pyx_t_7 = PyTuple_New(1+1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 88, __pyx_L1_error)
+        __pyx_t_7 = PyTuple_New(1+1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 93, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_7);
         __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_4); __pyx_t_4 = NULL;
         __Pyx_INCREF(__pyx_v_msg);
         __Pyx_GIVEREF(__pyx_v_msg);
         PyTuple_SET_ITEM(__pyx_t_7, 0+1, __pyx_v_msg);
-        __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 88, __pyx_L1_error)
+        __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 93, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_1);
         __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
       }
@@ -2753,9 +2822,9 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_Raise(__pyx_t_1, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __PYX_ERR(0, 88, __pyx_L1_error)
+    __PYX_ERR(0, 93, __pyx_L1_error)
 
-    /* "mpfmc/core/audio/sound_file.pyx":86
+    /* "mpfmc/core/audio/sound_file.pyx":91
  *         # Load the audio file (will be converted to current sample output format)
  *         chunk = Mix_LoadWAV(self.file_name.encode('utf-8'))
  *         if chunk == NULL:             # <<<<<<<<<<<<<<
@@ -2764,7 +2833,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
  */
   }
 
-  /* "mpfmc/core/audio/sound_file.pyx":91
+  /* "mpfmc/core/audio/sound_file.pyx":96
  * 
  *         # Save the loaded sample data
  *         self.sample.data.memory.size = <gsize>chunk.alen             # <<<<<<<<<<<<<<
@@ -2773,7 +2842,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
  */
   __pyx_v_self->__pyx_base.sample.data.memory->size = ((gsize)__pyx_v_chunk->alen);
 
-  /* "mpfmc/core/audio/sound_file.pyx":92
+  /* "mpfmc/core/audio/sound_file.pyx":97
  *         # Save the loaded sample data
  *         self.sample.data.memory.size = <gsize>chunk.alen
  *         self.sample.data.memory.data = <gpointer>chunk.abuf             # <<<<<<<<<<<<<<
@@ -2782,7 +2851,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
  */
   __pyx_v_self->__pyx_base.sample.data.memory->data = ((gpointer)__pyx_v_chunk->abuf);
 
-  /* "mpfmc/core/audio/sound_file.pyx":95
+  /* "mpfmc/core/audio/sound_file.pyx":100
  * 
  *         # Set the sample duration (in seconds)
  *         self.sample.duration = self.sample.data.memory.size / self.callback_data.seconds_to_bytes_factor             # <<<<<<<<<<<<<<
@@ -2791,11 +2860,11 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
  */
   if (unlikely(__pyx_v_self->__pyx_base.callback_data->seconds_to_bytes_factor == 0)) {
     PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-    __PYX_ERR(0, 95, __pyx_L1_error)
+    __PYX_ERR(0, 100, __pyx_L1_error)
   }
   __pyx_v_self->__pyx_base.sample.duration = (((double)__pyx_v_self->__pyx_base.sample.data.memory->size) / __pyx_v_self->__pyx_base.callback_data->seconds_to_bytes_factor);
 
-  /* "mpfmc/core/audio/sound_file.pyx":101
+  /* "mpfmc/core/audio/sound_file.pyx":106
  *         # can just free the Mix_Chunk structure using SDL_free and the sample buffer will remain intact. The
  *         # sample memory must be freed later when this object is deallocated.
  *         SDL_free(chunk)             # <<<<<<<<<<<<<<
@@ -2804,24 +2873,24 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
  */
   SDL_free(__pyx_v_chunk);
 
-  /* "mpfmc/core/audio/sound_file.pyx":103
+  /* "mpfmc/core/audio/sound_file.pyx":108
  *         SDL_free(chunk)
  * 
  *         self.log.debug('Loaded file: %s Sample duration: %s',             # <<<<<<<<<<<<<<
  *                        self.file_name, self.sample.duration)
  * 
  */
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->__pyx_base.log, __pyx_n_s_debug); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 103, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->__pyx_base.log, __pyx_n_s_debug); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 108, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
 
-  /* "mpfmc/core/audio/sound_file.pyx":104
+  /* "mpfmc/core/audio/sound_file.pyx":109
  * 
  *         self.log.debug('Loaded file: %s Sample duration: %s',
  *                        self.file_name, self.sample.duration)             # <<<<<<<<<<<<<<
  * 
  *     def unload(self):
  */
-  __pyx_t_7 = PyFloat_FromDouble(__pyx_v_self->__pyx_base.sample.duration); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 104, __pyx_L1_error)
+  __pyx_t_7 = PyFloat_FromDouble(__pyx_v_self->__pyx_base.sample.duration); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 109, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
   __pyx_t_4 = NULL;
   __pyx_t_9 = 0;
@@ -2838,7 +2907,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
   #if CYTHON_FAST_PYCALL
   if (PyFunction_Check(__pyx_t_3)) {
     PyObject *__pyx_temp[4] = {__pyx_t_4, __pyx_kp_u_Loaded_file_s_Sample_duration_s, __pyx_v_self->__pyx_base.file_name, __pyx_t_7};
-    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_9, 3+__pyx_t_9); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 103, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_9, 3+__pyx_t_9); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 108, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
@@ -2847,14 +2916,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
   #if CYTHON_FAST_PYCCALL
   if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
     PyObject *__pyx_temp[4] = {__pyx_t_4, __pyx_kp_u_Loaded_file_s_Sample_duration_s, __pyx_v_self->__pyx_base.file_name, __pyx_t_7};
-    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_9, 3+__pyx_t_9); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 103, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_9, 3+__pyx_t_9); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 108, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
   } else
   #endif
   {
-    __pyx_t_5 = PyTuple_New(3+__pyx_t_9); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 103, __pyx_L1_error)
+    __pyx_t_5 = PyTuple_New(3+__pyx_t_9); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 108, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     if (__pyx_t_4) {
       __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4); __pyx_t_4 = NULL;
@@ -2868,14 +2937,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
     __Pyx_GIVEREF(__pyx_t_7);
     PyTuple_SET_ITEM(__pyx_t_5, 2+__pyx_t_9, __pyx_t_7);
     __pyx_t_7 = 0;
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 103, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 108, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   }
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":74
+  /* "mpfmc/core/audio/sound_file.pyx":79
  *             return "<SoundMemoryFile({}, Loaded=False)>".format(self.file_name)
  * 
  *     def load(self):             # <<<<<<<<<<<<<<
@@ -2901,7 +2970,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/sound_file.pyx":106
+/* "mpfmc/core/audio/sound_file.pyx":111
  *                        self.file_name, self.sample.duration)
  * 
  *     def unload(self):             # <<<<<<<<<<<<<<
@@ -2929,7 +2998,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_8un
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("unload", 0);
 
-  /* "mpfmc/core/audio/sound_file.pyx":108
+  /* "mpfmc/core/audio/sound_file.pyx":113
  *     def unload(self):
  *         """Unloads the sample data from memory"""
  *         if self.sample.data.memory.data != NULL:             # <<<<<<<<<<<<<<
@@ -2939,7 +3008,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_8un
   __pyx_t_1 = ((__pyx_v_self->__pyx_base.sample.data.memory->data != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/sound_file.pyx":109
+    /* "mpfmc/core/audio/sound_file.pyx":114
  *         """Unloads the sample data from memory"""
  *         if self.sample.data.memory.data != NULL:
  *             SDL_free(<void*>self.sample.data.memory.data)             # <<<<<<<<<<<<<<
@@ -2948,7 +3017,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_8un
  */
     SDL_free(((void *)__pyx_v_self->__pyx_base.sample.data.memory->data));
 
-    /* "mpfmc/core/audio/sound_file.pyx":108
+    /* "mpfmc/core/audio/sound_file.pyx":113
  *     def unload(self):
  *         """Unloads the sample data from memory"""
  *         if self.sample.data.memory.data != NULL:             # <<<<<<<<<<<<<<
@@ -2957,7 +3026,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_8un
  */
   }
 
-  /* "mpfmc/core/audio/sound_file.pyx":111
+  /* "mpfmc/core/audio/sound_file.pyx":116
  *             SDL_free(<void*>self.sample.data.memory.data)
  * 
  *         self.sample.data.memory.data = NULL             # <<<<<<<<<<<<<<
@@ -2966,7 +3035,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_8un
  */
   __pyx_v_self->__pyx_base.sample.data.memory->data = NULL;
 
-  /* "mpfmc/core/audio/sound_file.pyx":112
+  /* "mpfmc/core/audio/sound_file.pyx":117
  * 
  *         self.sample.data.memory.data = NULL
  *         self.sample.data.memory.size = 0             # <<<<<<<<<<<<<<
@@ -2975,7 +3044,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_8un
  */
   __pyx_v_self->__pyx_base.sample.data.memory->size = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":106
+  /* "mpfmc/core/audio/sound_file.pyx":111
  *                        self.file_name, self.sample.duration)
  * 
  *     def unload(self):             # <<<<<<<<<<<<<<
@@ -2990,7 +3059,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_8un
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/sound_file.pyx":115
+/* "mpfmc/core/audio/sound_file.pyx":120
  * 
  *     @property
  *     def loaded(self):             # <<<<<<<<<<<<<<
@@ -3019,25 +3088,25 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
   PyObject *__pyx_t_3 = NULL;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "mpfmc/core/audio/sound_file.pyx":117
+  /* "mpfmc/core/audio/sound_file.pyx":122
  *     def loaded(self):
  *         """Returns whether or not the sound file data is loaded in memory"""
  *         return self.sample.data.memory.data != NULL and self.sample.data.memory.size > 0             # <<<<<<<<<<<<<<
  * 
- * 
+ *     @property
  */
   __Pyx_XDECREF(__pyx_r);
   __pyx_t_2 = (__pyx_v_self->__pyx_base.sample.data.memory->data != NULL);
   if (__pyx_t_2) {
   } else {
-    __pyx_t_3 = __Pyx_PyBool_FromLong(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 117, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyBool_FromLong(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 122, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __pyx_t_1 = __pyx_t_3;
     __pyx_t_3 = 0;
     goto __pyx_L3_bool_binop_done;
   }
   __pyx_t_2 = (__pyx_v_self->__pyx_base.sample.data.memory->size > 0);
-  __pyx_t_3 = __Pyx_PyBool_FromLong(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 117, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyBool_FromLong(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 122, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_t_1 = __pyx_t_3;
   __pyx_t_3 = 0;
@@ -3046,7 +3115,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":115
+  /* "mpfmc/core/audio/sound_file.pyx":120
  * 
  *     @property
  *     def loaded(self):             # <<<<<<<<<<<<<<
@@ -3066,6 +3135,166 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
   return __pyx_r;
 }
 
+/* "mpfmc/core/audio/sound_file.pyx":125
+ * 
+ *     @property
+ *     def memory_size(self):             # <<<<<<<<<<<<<<
+ *         """Returns the number of bytes of sample data held in memory"""
+ *         return self.sample.data.memory.size
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_11memory_size_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_11memory_size_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_11memory_size___get__(((struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_11memory_size___get__(struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannySetupContext("__get__", 0);
+
+  /* "mpfmc/core/audio/sound_file.pyx":127
+ *     def memory_size(self):
+ *         """Returns the number of bytes of sample data held in memory"""
+ *         return self.sample.data.memory.size             # <<<<<<<<<<<<<<
+ * 
+ *     def get_samples(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_gsize(__pyx_v_self->__pyx_base.sample.data.memory->size); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 127, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "mpfmc/core/audio/sound_file.pyx":125
+ * 
+ *     @property
+ *     def memory_size(self):             # <<<<<<<<<<<<<<
+ *         """Returns the number of bytes of sample data held in memory"""
+ *         return self.sample.data.memory.size
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("mpfmc.core.audio.sound_file.SoundMemoryFile.memory_size.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/sound_file.pyx":129
+ *         return self.sample.data.memory.size
+ * 
+ *     def get_samples(self):             # <<<<<<<<<<<<<<
+ *         """Returns a copy of the sample data (in the audio output format)"""
+ *         if not self.loaded:
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_11get_samples(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_10get_samples[] = "SoundMemoryFile.get_samples(self)\nReturns a copy of the sample data (in the audio output format)";
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_11get_samples(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("get_samples (wrapper)", 0);
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_10get_samples(((struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_10get_samples(struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  __Pyx_RefNannySetupContext("get_samples", 0);
+
+  /* "mpfmc/core/audio/sound_file.pyx":131
+ *     def get_samples(self):
+ *         """Returns a copy of the sample data (in the audio output format)"""
+ *         if not self.loaded:             # <<<<<<<<<<<<<<
+ *             return bytes()
+ *         return (<char*>self.sample.data.memory.data)[:self.sample.data.memory.size]
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_loaded); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 131, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 131, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = ((!__pyx_t_2) != 0);
+  if (__pyx_t_3) {
+
+    /* "mpfmc/core/audio/sound_file.pyx":132
+ *         """Returns a copy of the sample data (in the audio output format)"""
+ *         if not self.loaded:
+ *             return bytes()             # <<<<<<<<<<<<<<
+ *         return (<char*>self.sample.data.memory.data)[:self.sample.data.memory.size]
+ * 
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)(&PyBytes_Type)), __pyx_empty_tuple, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 132, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
+
+    /* "mpfmc/core/audio/sound_file.pyx":131
+ *     def get_samples(self):
+ *         """Returns a copy of the sample data (in the audio output format)"""
+ *         if not self.loaded:             # <<<<<<<<<<<<<<
+ *             return bytes()
+ *         return (<char*>self.sample.data.memory.data)[:self.sample.data.memory.size]
+ */
+  }
+
+  /* "mpfmc/core/audio/sound_file.pyx":133
+ *         if not self.loaded:
+ *             return bytes()
+ *         return (<char*>self.sample.data.memory.data)[:self.sample.data.memory.size]             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyBytes_FromStringAndSize(((char *)__pyx_v_self->__pyx_base.sample.data.memory->data) + 0, __pyx_v_self->__pyx_base.sample.data.memory->size - 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 133, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "mpfmc/core/audio/sound_file.pyx":129
+ *         return self.sample.data.memory.size
+ * 
+ *     def get_samples(self):             # <<<<<<<<<<<<<<
+ *         """Returns a copy of the sample data (in the audio output format)"""
+ *         if not self.loaded:
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("mpfmc.core.audio.sound_file.SoundMemoryFile.get_samples", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
 /* "(tree fragment)":1
  * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
  *     raise TypeError("self.callback_data,self.sample cannot be converted to a Python object for pickling")
@@ -3073,20 +3302,20 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6lo
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_11__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static char __pyx_doc_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_10__reduce_cython__[] = "SoundMemoryFile.__reduce_cython__(self)";
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_11__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_13__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_12__reduce_cython__[] = "SoundMemoryFile.__reduce_cython__(self)";
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_13__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_10__reduce_cython__(((struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *)__pyx_v_self));
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_12__reduce_cython__(((struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_10__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *__pyx_v_self) {
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_12__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -3128,20 +3357,20 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_10_
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_13__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
-static char __pyx_doc_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_12__setstate_cython__[] = "SoundMemoryFile.__setstate_cython__(self, __pyx_state)";
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_13__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_15__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_14__setstate_cython__[] = "SoundMemoryFile.__setstate_cython__(self, __pyx_state)";
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_15__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_12__setstate_cython__(((struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_14__setstate_cython__(((struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_12__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_14__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -3175,7 +3404,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_12_
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/sound_file.pyx":126
+/* "mpfmc/core/audio/sound_file.pyx":142
  *     """SoundStreamingFile is a wrapper class to manage streaming sound sample data."""
  * 
  *     def __cinit__(self, *args, **kwargs):             # <<<<<<<<<<<<<<
@@ -3208,7 +3437,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile___cini
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__cinit__", 0);
 
-  /* "mpfmc/core/audio/sound_file.pyx":128
+  /* "mpfmc/core/audio/sound_file.pyx":144
  *     def __cinit__(self, *args, **kwargs):
  *         """C constructor"""
  *         self.pipeline = NULL             # <<<<<<<<<<<<<<
@@ -3217,7 +3446,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile___cini
  */
   __pyx_v_self->pipeline = NULL;
 
-  /* "mpfmc/core/audio/sound_file.pyx":129
+  /* "mpfmc/core/audio/sound_file.pyx":145
  *         """C constructor"""
  *         self.pipeline = NULL
  *         self.bus = NULL             # <<<<<<<<<<<<<<
@@ -3226,7 +3455,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile___cini
  */
   __pyx_v_self->bus = NULL;
 
-  /* "mpfmc/core/audio/sound_file.pyx":130
+  /* "mpfmc/core/audio/sound_file.pyx":146
  *         self.pipeline = NULL
  *         self.bus = NULL
  *         self.bus_message_handler_id = 0             # <<<<<<<<<<<<<<
@@ -3235,7 +3464,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile___cini
  */
   __pyx_v_self->bus_message_handler_id = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":126
+  /* "mpfmc/core/audio/sound_file.pyx":142
  *     """SoundStreamingFile is a wrapper class to manage streaming sound sample data."""
  * 
  *     def __cinit__(self, *args, **kwargs):             # <<<<<<<<<<<<<<
@@ -3249,7 +3478,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile___cini
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/sound_file.pyx":132
+/* "mpfmc/core/audio/sound_file.pyx":148
  *         self.bus_message_handler_id = 0
  * 
  *     def __init__(self, str file_name, object audio_callback_data):             # <<<<<<<<<<<<<<
@@ -3288,11 +3517,11 @@ static int __pyx_pw_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_3__ini
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_audio_callback_data)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, 1); __PYX_ERR(0, 132, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, 1); __PYX_ERR(0, 148, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 132, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 148, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
       goto __pyx_L5_argtuple_error;
@@ -3305,13 +3534,13 @@ static int __pyx_pw_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_3__ini
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 132, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 148, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("mpfmc.core.audio.sound_file.SoundStreamingFile.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return -1;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_file_name), (&PyUnicode_Type), 1, "file_name", 1))) __PYX_ERR(0, 132, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_file_name), (&PyUnicode_Type), 1, "file_name", 1))) __PYX_ERR(0, 148, __pyx_L1_error)
   __pyx_r = __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_2__init__(((struct __pyx_obj_5mpfmc_4core_5audio_10sound_file_SoundStreamingFile *)__pyx_v_self), __pyx_v_file_name, __pyx_v_audio_callback_data);
 
   /* function exit code */
@@ -3333,14 +3562,14 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_2__ini
   PyObject *__pyx_t_5 = NULL;
   __Pyx_RefNannySetupContext("__init__", 0);
 
-  /* "mpfmc/core/audio/sound_file.pyx":134
+  /* "mpfmc/core/audio/sound_file.pyx":150
  *     def __init__(self, str file_name, object audio_callback_data):
  *         # IMPORTANT: Call super class init function
  *         super().__init__(file_name, audio_callback_data)             # <<<<<<<<<<<<<<
  *         self.log = logging.getLogger("SoundStreamingFile")
  * 
  */
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 134, __pyx_L1_error)
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 150, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_INCREF(((PyObject *)__pyx_ptype_5mpfmc_4core_5audio_10sound_file_SoundStreamingFile));
   __Pyx_GIVEREF(((PyObject *)__pyx_ptype_5mpfmc_4core_5audio_10sound_file_SoundStreamingFile));
@@ -3348,10 +3577,10 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_2__ini
   __Pyx_INCREF(((PyObject *)__pyx_v_self));
   __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
   PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_v_self));
-  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_super, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 134, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_super, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 150, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_init); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 134, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_init); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 150, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __pyx_t_3 = NULL;
@@ -3369,7 +3598,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_2__ini
   #if CYTHON_FAST_PYCALL
   if (PyFunction_Check(__pyx_t_2)) {
     PyObject *__pyx_temp[3] = {__pyx_t_3, __pyx_v_file_name, __pyx_v_audio_callback_data};
-    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 2+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 134, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 2+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 150, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_GOTREF(__pyx_t_1);
   } else
@@ -3377,13 +3606,13 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_2__ini
   #if CYTHON_FAST_PYCCALL
   if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
     PyObject *__pyx_temp[3] = {__pyx_t_3, __pyx_v_file_name, __pyx_v_audio_callback_data};
-    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 2+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 134, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 2+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 150, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_GOTREF(__pyx_t_1);
   } else
   #endif
   {
-    __pyx_t_5 = PyTuple_New(2+__pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 134, __pyx_L1_error)
+    __pyx_t_5 = PyTuple_New(2+__pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 150, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     if (__pyx_t_3) {
       __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_3); __pyx_t_3 = NULL;
@@ -3394,26 +3623,26 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_2__ini
     __Pyx_INCREF(__pyx_v_audio_callback_data);
     __Pyx_GIVEREF(__pyx_v_audio_callback_data);
     PyTuple_SET_ITEM(__pyx_t_5, 1+__pyx_t_4, __pyx_v_audio_callback_data);
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 134, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 150, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   }
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":135
+  /* "mpfmc/core/audio/sound_file.pyx":151
  *         # IMPORTANT: Call super class init function
  *         super().__init__(file_name, audio_callback_data)
  *         self.log = logging.getLogger("SoundStreamingFile")             # <<<<<<<<<<<<<<
  * 
  *         self.sample.type = sound_type_streaming
  */
-  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_logging); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 135, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_logging); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 151, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_getLogger); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 135, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_getLogger); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 151, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_tuple__9, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 135, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_tuple__9, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 151, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_GIVEREF(__pyx_t_1);
@@ -3422,7 +3651,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_2__ini
   __pyx_v_self->__pyx_base.log = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":137
+  /* "mpfmc/core/audio/sound_file.pyx":153
  *         self.log = logging.getLogger("SoundStreamingFile")
  * 
  *         self.sample.type = sound_type_streaming             # <<<<<<<<<<<<<<
@@ -3431,7 +3660,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_2__ini
  */
   __pyx_v_self->__pyx_base.sample.type = __pyx_e_5mpfmc_4core_5audio_10sound_file_sound_type_streaming;
 
-  /* "mpfmc/core/audio/sound_file.pyx":138
+  /* "mpfmc/core/audio/sound_file.pyx":154
  * 
  *         self.sample.type = sound_type_streaming
  *         self.sample.data.stream = <SampleStream*>PyMem_Malloc(sizeof(SampleStream))             # <<<<<<<<<<<<<<
@@ -3440,7 +3669,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_2__ini
  */
   __pyx_v_self->__pyx_base.sample.data.stream = ((__pyx_t_5mpfmc_4core_5audio_10sound_file_SampleStream *)PyMem_Malloc((sizeof(__pyx_t_5mpfmc_4core_5audio_10sound_file_SampleStream))));
 
-  /* "mpfmc/core/audio/sound_file.pyx":139
+  /* "mpfmc/core/audio/sound_file.pyx":155
  *         self.sample.type = sound_type_streaming
  *         self.sample.data.stream = <SampleStream*>PyMem_Malloc(sizeof(SampleStream))
  *         self.sample.data.stream.pipeline = NULL             # <<<<<<<<<<<<<<
@@ -3449,7 +3678,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_2__ini
  */
   __pyx_v_self->__pyx_base.sample.data.stream->pipeline = NULL;
 
-  /* "mpfmc/core/audio/sound_file.pyx":140
+  /* "mpfmc/core/audio/sound_file.pyx":156
  *         self.sample.data.stream = <SampleStream*>PyMem_Malloc(sizeof(SampleStream))
  *         self.sample.data.stream.pipeline = NULL
  *         self.sample.data.stream.sink = NULL             # <<<<<<<<<<<<<<
@@ -3458,7 +3687,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_2__ini
  */
   __pyx_v_self->__pyx_base.sample.data.stream->sink = NULL;
 
-  /* "mpfmc/core/audio/sound_file.pyx":141
+  /* "mpfmc/core/audio/sound_file.pyx":157
  *         self.sample.data.stream.pipeline = NULL
  *         self.sample.data.stream.sink = NULL
  *         self.sample.data.stream.sample = NULL             # <<<<<<<<<<<<<<
@@ -3467,7 +3696,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_2__ini
  */
   __pyx_v_self->__pyx_base.sample.data.stream->sample = NULL;
 
-  /* "mpfmc/core/audio/sound_file.pyx":142
+  /* "mpfmc/core/audio/sound_file.pyx":158
  *         self.sample.data.stream.sink = NULL
  *         self.sample.data.stream.sample = NULL
  *         self.sample.data.stream.buffer = NULL             # <<<<<<<<<<<<<<
@@ -3476,7 +3705,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_2__ini
  */
   __pyx_v_self->__pyx_base.sample.data.stream->buffer = NULL;
 
-  /* "mpfmc/core/audio/sound_file.pyx":143
+  /* "mpfmc/core/audio/sound_file.pyx":159
  *         self.sample.data.stream.sample = NULL
  *         self.sample.data.stream.buffer = NULL
  *         self.sample.data.stream.map_contains_valid_sample_data = 0             # <<<<<<<<<<<<<<
@@ -3485,7 +3714,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_2__ini
  */
   __pyx_v_self->__pyx_base.sample.data.stream->map_contains_valid_sample_data = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":144
+  /* "mpfmc/core/audio/sound_file.pyx":160
  *         self.sample.data.stream.buffer = NULL
  *         self.sample.data.stream.map_contains_valid_sample_data = 0
  *         self.sample.data.stream.map_buffer_pos = 0             # <<<<<<<<<<<<<<
@@ -3494,7 +3723,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_2__ini
  */
   __pyx_v_self->__pyx_base.sample.data.stream->map_buffer_pos = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":145
+  /* "mpfmc/core/audio/sound_file.pyx":161
  *         self.sample.data.stream.map_contains_valid_sample_data = 0
  *         self.sample.data.stream.map_buffer_pos = 0
  *         self.sample.data.stream.null_buffer_count = 0             # <<<<<<<<<<<<<<
@@ -3503,14 +3732,14 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_2__ini
  */
   __pyx_v_self->__pyx_base.sample.data.stream->null_buffer_count = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":147
+  /* "mpfmc/core/audio/sound_file.pyx":163
  *         self.sample.data.stream.null_buffer_count = 0
  * 
  *         self.load()             # <<<<<<<<<<<<<<
  * 
  *     def __dealloc__(self):
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_load); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 147, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_load); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 163, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_t_5 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
@@ -3523,16 +3752,16 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_2__ini
     }
   }
   if (__pyx_t_5) {
-    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 147, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 163, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   } else {
-    __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 147, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 163, __pyx_L1_error)
   }
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":132
+  /* "mpfmc/core/audio/sound_file.pyx":148
  *         self.bus_message_handler_id = 0
  * 
  *     def __init__(self, str file_name, object audio_callback_data):             # <<<<<<<<<<<<<<
@@ -3555,7 +3784,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_2__ini
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/sound_file.pyx":149
+/* "mpfmc/core/audio/sound_file.pyx":165
  *         self.load()
  * 
  *     def __dealloc__(self):             # <<<<<<<<<<<<<<
@@ -3579,7 +3808,7 @@ static void __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_4__de
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("__dealloc__", 0);
 
-  /* "mpfmc/core/audio/sound_file.pyx":150
+  /* "mpfmc/core/audio/sound_file.pyx":166
  * 
  *     def __dealloc__(self):
  *         if self.sample.data.stream != NULL:             # <<<<<<<<<<<<<<
@@ -3589,7 +3818,7 @@ static void __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_4__de
   __pyx_t_1 = ((__pyx_v_self->__pyx_base.sample.data.stream != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/sound_file.pyx":151
+    /* "mpfmc/core/audio/sound_file.pyx":167
  *     def __dealloc__(self):
  *         if self.sample.data.stream != NULL:
  *             PyMem_Free(self.sample.data.stream)             # <<<<<<<<<<<<<<
@@ -3598,7 +3827,7 @@ static void __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_4__de
  */
     PyMem_Free(__pyx_v_self->__pyx_base.sample.data.stream);
 
-    /* "mpfmc/core/audio/sound_file.pyx":152
+    /* "mpfmc/core/audio/sound_file.pyx":168
  *         if self.sample.data.stream != NULL:
  *             PyMem_Free(self.sample.data.stream)
  *             self.sample.data.stream = NULL             # <<<<<<<<<<<<<<
@@ -3607,7 +3836,7 @@ static void __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_4__de
  */
     __pyx_v_self->__pyx_base.sample.data.stream = NULL;
 
-    /* "mpfmc/core/audio/sound_file.pyx":150
+    /* "mpfmc/core/audio/sound_file.pyx":166
  * 
  *     def __dealloc__(self):
  *         if self.sample.data.stream != NULL:             # <<<<<<<<<<<<<<
@@ -3616,7 +3845,7 @@ static void __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_4__de
  */
   }
 
-  /* "mpfmc/core/audio/sound_file.pyx":149
+  /* "mpfmc/core/audio/sound_file.pyx":165
  *         self.load()
  * 
  *     def __dealloc__(self):             # <<<<<<<<<<<<<<
@@ -3628,7 +3857,7 @@ static void __pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_4__de
   __Pyx_RefNannyFinishContext();
 }
 
-/* "mpfmc/core/audio/sound_file.pyx":154
+/* "mpfmc/core/audio/sound_file.pyx":170
  *             self.sample.data.stream = NULL
  * 
  *     def __repr__(self):             # <<<<<<<<<<<<<<
@@ -3661,20 +3890,20 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   PyObject *__pyx_t_7 = NULL;
   __Pyx_RefNannySetupContext("__repr__", 0);
 
-  /* "mpfmc/core/audio/sound_file.pyx":155
+  /* "mpfmc/core/audio/sound_file.pyx":171
  * 
  *     def __repr__(self):
  *         if self.loaded:             # <<<<<<<<<<<<<<
  *             return '<SoundStreamingFile({}, Loaded=True, sample_duration={}s)>'.format(self.file_name,self.sample.duration)
  *         return "<SoundStreamingFile({}, Loaded=False)>".format(self.file_name)
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_loaded); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 155, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_loaded); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 171, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 155, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 171, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   if (__pyx_t_2) {
 
-    /* "mpfmc/core/audio/sound_file.pyx":156
+    /* "mpfmc/core/audio/sound_file.pyx":172
  *     def __repr__(self):
  *         if self.loaded:
  *             return '<SoundStreamingFile({}, Loaded=True, sample_duration={}s)>'.format(self.file_name,self.sample.duration)             # <<<<<<<<<<<<<<
@@ -3682,9 +3911,9 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  * 
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_SoundStreamingFile_Loaded_True, __pyx_n_s_format); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 156, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_SoundStreamingFile_Loaded_True, __pyx_n_s_format); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 172, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = PyFloat_FromDouble(__pyx_v_self->__pyx_base.sample.duration); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 156, __pyx_L1_error)
+    __pyx_t_4 = PyFloat_FromDouble(__pyx_v_self->__pyx_base.sample.duration); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 172, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __pyx_t_5 = NULL;
     __pyx_t_6 = 0;
@@ -3701,7 +3930,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
     #if CYTHON_FAST_PYCALL
     if (PyFunction_Check(__pyx_t_3)) {
       PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_v_self->__pyx_base.file_name, __pyx_t_4};
-      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 156, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 172, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -3710,14 +3939,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
     #if CYTHON_FAST_PYCCALL
     if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
       PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_v_self->__pyx_base.file_name, __pyx_t_4};
-      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 156, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 172, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     } else
     #endif
     {
-      __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 156, __pyx_L1_error)
+      __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 172, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_7);
       if (__pyx_t_5) {
         __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_5); __pyx_t_5 = NULL;
@@ -3728,7 +3957,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
       __Pyx_GIVEREF(__pyx_t_4);
       PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_t_4);
       __pyx_t_4 = 0;
-      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 156, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 172, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
     }
@@ -3737,7 +3966,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
     __pyx_t_1 = 0;
     goto __pyx_L0;
 
-    /* "mpfmc/core/audio/sound_file.pyx":155
+    /* "mpfmc/core/audio/sound_file.pyx":171
  * 
  *     def __repr__(self):
  *         if self.loaded:             # <<<<<<<<<<<<<<
@@ -3746,7 +3975,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   }
 
-  /* "mpfmc/core/audio/sound_file.pyx":157
+  /* "mpfmc/core/audio/sound_file.pyx":173
  *         if self.loaded:
  *             return '<SoundStreamingFile({}, Loaded=True, sample_duration={}s)>'.format(self.file_name,self.sample.duration)
  *         return "<SoundStreamingFile({}, Loaded=False)>".format(self.file_name)             # <<<<<<<<<<<<<<
@@ -3754,7 +3983,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  *     def _gst_init(self):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_SoundStreamingFile_Loaded_False, __pyx_n_s_format); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 157, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_SoundStreamingFile_Loaded_False, __pyx_n_s_format); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 173, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_t_7 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
@@ -3767,13 +3996,13 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
     }
   }
   if (!__pyx_t_7) {
-    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_self->__pyx_base.file_name); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 157, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_self->__pyx_base.file_name); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 173, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
   } else {
     #if CYTHON_FAST_PYCALL
     if (PyFunction_Check(__pyx_t_3)) {
       PyObject *__pyx_temp[2] = {__pyx_t_7, __pyx_v_self->__pyx_base.file_name};
-      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 157, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 173, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
       __Pyx_GOTREF(__pyx_t_1);
     } else
@@ -3781,19 +4010,19 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
     #if CYTHON_FAST_PYCCALL
     if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
       PyObject *__pyx_temp[2] = {__pyx_t_7, __pyx_v_self->__pyx_base.file_name};
-      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 157, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 173, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
       __Pyx_GOTREF(__pyx_t_1);
     } else
     #endif
     {
-      __pyx_t_4 = PyTuple_New(1+1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 157, __pyx_L1_error)
+      __pyx_t_4 = PyTuple_New(1+1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 173, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
       __Pyx_GIVEREF(__pyx_t_7); PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_7); __pyx_t_7 = NULL;
       __Pyx_INCREF(__pyx_v_self->__pyx_base.file_name);
       __Pyx_GIVEREF(__pyx_v_self->__pyx_base.file_name);
       PyTuple_SET_ITEM(__pyx_t_4, 0+1, __pyx_v_self->__pyx_base.file_name);
-      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_4, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 157, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_4, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 173, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     }
@@ -3803,7 +4032,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":154
+  /* "mpfmc/core/audio/sound_file.pyx":170
  *             self.sample.data.stream = NULL
  * 
  *     def __repr__(self):             # <<<<<<<<<<<<<<
@@ -3826,7 +4055,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/sound_file.pyx":159
+/* "mpfmc/core/audio/sound_file.pyx":175
  *         return "<SoundStreamingFile({}, Loaded=False)>".format(self.file_name)
  * 
  *     def _gst_init(self):             # <<<<<<<<<<<<<<
@@ -3865,7 +4094,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   PyObject *__pyx_t_8 = NULL;
   __Pyx_RefNannySetupContext("_gst_init", 0);
 
-  /* "mpfmc/core/audio/sound_file.pyx":160
+  /* "mpfmc/core/audio/sound_file.pyx":176
  * 
  *     def _gst_init(self):
  *         if gst_is_initialized():             # <<<<<<<<<<<<<<
@@ -3875,7 +4104,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   __pyx_t_1 = (gst_is_initialized() != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/sound_file.pyx":161
+    /* "mpfmc/core/audio/sound_file.pyx":177
  *     def _gst_init(self):
  *         if gst_is_initialized():
  *             return True             # <<<<<<<<<<<<<<
@@ -3887,7 +4116,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
     __pyx_r = Py_True;
     goto __pyx_L0;
 
-    /* "mpfmc/core/audio/sound_file.pyx":160
+    /* "mpfmc/core/audio/sound_file.pyx":176
  * 
  *     def _gst_init(self):
  *         if gst_is_initialized():             # <<<<<<<<<<<<<<
@@ -3896,7 +4125,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   }
 
-  /* "mpfmc/core/audio/sound_file.pyx":162
+  /* "mpfmc/core/audio/sound_file.pyx":178
  *         if gst_is_initialized():
  *             return True
  *         cdef int argc = 0             # <<<<<<<<<<<<<<
@@ -3905,7 +4134,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   __pyx_v_argc = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":163
+  /* "mpfmc/core/audio/sound_file.pyx":179
  *             return True
  *         cdef int argc = 0
  *         cdef char **argv = NULL             # <<<<<<<<<<<<<<
@@ -3914,7 +4143,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   __pyx_v_argv = NULL;
 
-  /* "mpfmc/core/audio/sound_file.pyx":165
+  /* "mpfmc/core/audio/sound_file.pyx":181
  *         cdef char **argv = NULL
  *         cdef GError *error
  *         if not gst_init_check(&argc, &argv, &error):             # <<<<<<<<<<<<<<
@@ -3924,26 +4153,26 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   __pyx_t_1 = ((!(gst_init_check((&__pyx_v_argc), (&__pyx_v_argv), (&__pyx_v_error)) != 0)) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/sound_file.pyx":166
+    /* "mpfmc/core/audio/sound_file.pyx":182
  *         cdef GError *error
  *         if not gst_init_check(&argc, &argv, &error):
  *             msg = 'Unable to initialize gstreamer: code={} message={}'.format(             # <<<<<<<<<<<<<<
  *                     error.code, <bytes>error.message)
  *             raise AudioException(msg)
  */
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Unable_to_initialize_gstreamer_c, __pyx_n_s_format); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 166, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Unable_to_initialize_gstreamer_c, __pyx_n_s_format); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 182, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
 
-    /* "mpfmc/core/audio/sound_file.pyx":167
+    /* "mpfmc/core/audio/sound_file.pyx":183
  *         if not gst_init_check(&argc, &argv, &error):
  *             msg = 'Unable to initialize gstreamer: code={} message={}'.format(
  *                     error.code, <bytes>error.message)             # <<<<<<<<<<<<<<
  *             raise AudioException(msg)
  * 
  */
-    __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_error->code); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 167, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_error->code); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 183, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = __Pyx_PyBytes_FromString(__pyx_v_error->message); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 167, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyBytes_FromString(__pyx_v_error->message); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 183, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __pyx_t_6 = NULL;
     __pyx_t_7 = 0;
@@ -3960,7 +4189,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
     #if CYTHON_FAST_PYCALL
     if (PyFunction_Check(__pyx_t_3)) {
       PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_t_4, __pyx_t_5};
-      __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 166, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 182, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -3970,7 +4199,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
     #if CYTHON_FAST_PYCCALL
     if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
       PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_t_4, __pyx_t_5};
-      __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 166, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 182, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -3978,7 +4207,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
     } else
     #endif
     {
-      __pyx_t_8 = PyTuple_New(2+__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 166, __pyx_L1_error)
+      __pyx_t_8 = PyTuple_New(2+__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 182, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_8);
       if (__pyx_t_6) {
         __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_6); __pyx_t_6 = NULL;
@@ -3990,7 +4219,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
       PyTuple_SET_ITEM(__pyx_t_8, 1+__pyx_t_7, __pyx_t_5);
       __pyx_t_4 = 0;
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_8, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 166, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_8, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 182, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
     }
@@ -3998,14 +4227,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
     __pyx_v_msg = __pyx_t_2;
     __pyx_t_2 = 0;
 
-    /* "mpfmc/core/audio/sound_file.pyx":168
+    /* "mpfmc/core/audio/sound_file.pyx":184
  *             msg = 'Unable to initialize gstreamer: code={} message={}'.format(
  *                     error.code, <bytes>error.message)
  *             raise AudioException(msg)             # <<<<<<<<<<<<<<
  * 
  *     def _destroy_pipeline(self):
  */
-    __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_AudioException); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 168, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_AudioException); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 184, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __pyx_t_8 = NULL;
     if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
@@ -4018,13 +4247,13 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
       }
     }
     if (!__pyx_t_8) {
-      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_msg); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 168, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_msg); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 184, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
     } else {
       #if CYTHON_FAST_PYCALL
       if (PyFunction_Check(__pyx_t_3)) {
         PyObject *__pyx_temp[2] = {__pyx_t_8, __pyx_v_msg};
-        __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 168, __pyx_L1_error)
+        __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 184, __pyx_L1_error)
         __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
         __Pyx_GOTREF(__pyx_t_2);
       } else
@@ -4032,19 +4261,19 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
       #if CYTHON_FAST_PYCCALL
       if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
         PyObject *__pyx_temp[2] = {__pyx_t_8, __pyx_v_msg};
-        __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 168, __pyx_L1_error)
+        __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 184, __pyx_L1_error)
         __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
         __Pyx_GOTREF(__pyx_t_2);
       } else
       #endif
       {
-        __pyx_t_5 = PyTuple_New(1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 168, __pyx_L1_error)
+        __pyx_t_5 = PyTuple_New(1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 184, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_5);
         __Pyx_GIVEREF(__pyx_t_8); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_8); __pyx_t_8 = NULL;
         __Pyx_INCREF(__pyx_v_msg);
         __Pyx_GIVEREF(__pyx_v_msg);
         PyTuple_SET_ITEM(__pyx_t_5, 0+1, __pyx_v_msg);
-        __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_5, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 168, __pyx_L1_error)
+        __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_5, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 184, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_2);
         __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
       }
@@ -4052,9 +4281,9 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_Raise(__pyx_t_2, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __PYX_ERR(0, 168, __pyx_L1_error)
+    __PYX_ERR(0, 184, __pyx_L1_error)
 
-    /* "mpfmc/core/audio/sound_file.pyx":165
+    /* "mpfmc/core/audio/sound_file.pyx":181
  *         cdef char **argv = NULL
  *         cdef GError *error
  *         if not gst_init_check(&argc, &argv, &error):             # <<<<<<<<<<<<<<
@@ -4063,7 +4292,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   }
 
-  /* "mpfmc/core/audio/sound_file.pyx":159
+  /* "mpfmc/core/audio/sound_file.pyx":175
  *         return "<SoundStreamingFile({}, Loaded=False)>".format(self.file_name)
  * 
  *     def _gst_init(self):             # <<<<<<<<<<<<<<
@@ -4090,7 +4319,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/sound_file.pyx":170
+/* "mpfmc/core/audio/sound_file.pyx":186
  *             raise AudioException(msg)
  * 
  *     def _destroy_pipeline(self):             # <<<<<<<<<<<<<<
@@ -4121,7 +4350,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   int __pyx_t_2;
   __Pyx_RefNannySetupContext("_destroy_pipeline", 0);
 
-  /* "mpfmc/core/audio/sound_file.pyx":175
+  /* "mpfmc/core/audio/sound_file.pyx":191
  *         cdef GstState current_state, pending_state
  * 
  *         if self.bus != NULL and self.bus_message_handler_id != 0:             # <<<<<<<<<<<<<<
@@ -4139,7 +4368,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   __pyx_L4_bool_binop_done:;
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/sound_file.pyx":176
+    /* "mpfmc/core/audio/sound_file.pyx":192
  * 
  *         if self.bus != NULL and self.bus_message_handler_id != 0:
  *             c_signal_disconnect(<GstElement*>self.bus, self.bus_message_handler_id)             # <<<<<<<<<<<<<<
@@ -4148,7 +4377,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
     c_signal_disconnect(((GstElement *)__pyx_v_self->bus), __pyx_v_self->bus_message_handler_id);
 
-    /* "mpfmc/core/audio/sound_file.pyx":177
+    /* "mpfmc/core/audio/sound_file.pyx":193
  *         if self.bus != NULL and self.bus_message_handler_id != 0:
  *             c_signal_disconnect(<GstElement*>self.bus, self.bus_message_handler_id)
  *             self.bus_message_handler_id = 0             # <<<<<<<<<<<<<<
@@ -4157,7 +4386,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
     __pyx_v_self->bus_message_handler_id = 0;
 
-    /* "mpfmc/core/audio/sound_file.pyx":175
+    /* "mpfmc/core/audio/sound_file.pyx":191
  *         cdef GstState current_state, pending_state
  * 
  *         if self.bus != NULL and self.bus_message_handler_id != 0:             # <<<<<<<<<<<<<<
@@ -4166,7 +4395,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   }
 
-  /* "mpfmc/core/audio/sound_file.pyx":179
+  /* "mpfmc/core/audio/sound_file.pyx":195
  *             self.bus_message_handler_id = 0
  * 
  *         if self.pipeline != NULL:             # <<<<<<<<<<<<<<
@@ -4176,7 +4405,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   __pyx_t_1 = ((__pyx_v_self->pipeline != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/sound_file.pyx":183
+    /* "mpfmc/core/audio/sound_file.pyx":199
  *             # state is set to NULL, we need to query it. We also put a 5s
  *             # timeout for safety, but normally, nobody should hit it.
  *             with nogil:             # <<<<<<<<<<<<<<
@@ -4191,7 +4420,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
         #endif
         /*try:*/ {
 
-          /* "mpfmc/core/audio/sound_file.pyx":184
+          /* "mpfmc/core/audio/sound_file.pyx":200
  *             # timeout for safety, but normally, nobody should hit it.
  *             with nogil:
  *                 gst_element_set_state(self.pipeline, GST_STATE_NULL)             # <<<<<<<<<<<<<<
@@ -4200,7 +4429,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
           gst_element_set_state(__pyx_v_self->pipeline, GST_STATE_NULL);
 
-          /* "mpfmc/core/audio/sound_file.pyx":185
+          /* "mpfmc/core/audio/sound_file.pyx":201
  *             with nogil:
  *                 gst_element_set_state(self.pipeline, GST_STATE_NULL)
  *                 gst_element_get_state(self.pipeline, &current_state,             # <<<<<<<<<<<<<<
@@ -4210,7 +4439,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
           gst_element_get_state(__pyx_v_self->pipeline, (&__pyx_v_current_state), (&__pyx_v_pending_state), ((GstClockTime)5e9));
         }
 
-        /* "mpfmc/core/audio/sound_file.pyx":183
+        /* "mpfmc/core/audio/sound_file.pyx":199
  *             # state is set to NULL, we need to query it. We also put a 5s
  *             # timeout for safety, but normally, nobody should hit it.
  *             with nogil:             # <<<<<<<<<<<<<<
@@ -4229,7 +4458,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
         }
     }
 
-    /* "mpfmc/core/audio/sound_file.pyx":187
+    /* "mpfmc/core/audio/sound_file.pyx":203
  *                 gst_element_get_state(self.pipeline, &current_state,
  *                         &pending_state, <GstClockTime>5e9)
  *             gst_object_unref(self.pipeline)             # <<<<<<<<<<<<<<
@@ -4238,7 +4467,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
     gst_object_unref(__pyx_v_self->pipeline);
 
-    /* "mpfmc/core/audio/sound_file.pyx":179
+    /* "mpfmc/core/audio/sound_file.pyx":195
  *             self.bus_message_handler_id = 0
  * 
  *         if self.pipeline != NULL:             # <<<<<<<<<<<<<<
@@ -4247,7 +4476,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   }
 
-  /* "mpfmc/core/audio/sound_file.pyx":189
+  /* "mpfmc/core/audio/sound_file.pyx":205
  *             gst_object_unref(self.pipeline)
  * 
  *         if self.bus != NULL:             # <<<<<<<<<<<<<<
@@ -4257,7 +4486,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   __pyx_t_1 = ((__pyx_v_self->bus != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/sound_file.pyx":190
+    /* "mpfmc/core/audio/sound_file.pyx":206
  * 
  *         if self.bus != NULL:
  *             gst_object_unref(self.bus)             # <<<<<<<<<<<<<<
@@ -4266,7 +4495,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
     gst_object_unref(__pyx_v_self->bus);
 
-    /* "mpfmc/core/audio/sound_file.pyx":189
+    /* "mpfmc/core/audio/sound_file.pyx":205
  *             gst_object_unref(self.pipeline)
  * 
  *         if self.bus != NULL:             # <<<<<<<<<<<<<<
@@ -4275,7 +4504,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   }
 
-  /* "mpfmc/core/audio/sound_file.pyx":192
+  /* "mpfmc/core/audio/sound_file.pyx":208
  *             gst_object_unref(self.bus)
  * 
  *         self.bus = NULL             # <<<<<<<<<<<<<<
@@ -4284,7 +4513,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   __pyx_v_self->bus = NULL;
 
-  /* "mpfmc/core/audio/sound_file.pyx":193
+  /* "mpfmc/core/audio/sound_file.pyx":209
  * 
  *         self.bus = NULL
  *         self.pipeline = NULL             # <<<<<<<<<<<<<<
@@ -4293,7 +4522,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   __pyx_v_self->pipeline = NULL;
 
-  /* "mpfmc/core/audio/sound_file.pyx":170
+  /* "mpfmc/core/audio/sound_file.pyx":186
  *             raise AudioException(msg)
  * 
  *     def _destroy_pipeline(self):             # <<<<<<<<<<<<<<
@@ -4308,7 +4537,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/sound_file.pyx":195
+/* "mpfmc/core/audio/sound_file.pyx":211
  *         self.pipeline = NULL
  * 
  *     def _construct_pipeline(self):             # <<<<<<<<<<<<<<
@@ -4354,7 +4583,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   GstElement *__pyx_t_11;
   __Pyx_RefNannySetupContext("_construct_pipeline", 0);
 
-  /* "mpfmc/core/audio/sound_file.pyx":199
+  /* "mpfmc/core/audio/sound_file.pyx":215
  *         cdef GError *error
  *         cdef GstSample *sample
  *         cdef gint64 duration = 0             # <<<<<<<<<<<<<<
@@ -4363,7 +4592,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   __pyx_v_duration = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":204
+  /* "mpfmc/core/audio/sound_file.pyx":220
  * 
  *         # If the pipeline has already been created, delete it
  *         if self.pipeline != NULL:             # <<<<<<<<<<<<<<
@@ -4373,14 +4602,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   __pyx_t_1 = ((__pyx_v_self->pipeline != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/sound_file.pyx":205
+    /* "mpfmc/core/audio/sound_file.pyx":221
  *         # If the pipeline has already been created, delete it
  *         if self.pipeline != NULL:
  *             self._destroy_pipeline()             # <<<<<<<<<<<<<<
  * 
  *         # Pipeline structure: uridecodebin --> audioconvert --> audioresample --> appsink
  */
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_destroy_pipeline); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 205, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_destroy_pipeline); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 221, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __pyx_t_4 = NULL;
     if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
@@ -4393,16 +4622,16 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
       }
     }
     if (__pyx_t_4) {
-      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 205, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 221, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     } else {
-      __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 205, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 221, __pyx_L1_error)
     }
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-    /* "mpfmc/core/audio/sound_file.pyx":204
+    /* "mpfmc/core/audio/sound_file.pyx":220
  * 
  *         # If the pipeline has already been created, delete it
  *         if self.pipeline != NULL:             # <<<<<<<<<<<<<<
@@ -4411,7 +4640,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   }
 
-  /* "mpfmc/core/audio/sound_file.pyx":210
+  /* "mpfmc/core/audio/sound_file.pyx":226
  * 
  *         # Create GStreamer pipeline with the specified caps (from a string)
  *         file_path = 'file:///' + self.file_name.replace('\\', '/')             # <<<<<<<<<<<<<<
@@ -4420,17 +4649,17 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   if (unlikely(__pyx_v_self->__pyx_base.file_name == Py_None)) {
     PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "replace");
-    __PYX_ERR(0, 210, __pyx_L1_error)
+    __PYX_ERR(0, 226, __pyx_L1_error)
   }
-  __pyx_t_2 = PyUnicode_Replace(__pyx_v_self->__pyx_base.file_name, __pyx_kp_u__10, __pyx_kp_u__11, -1L); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 210, __pyx_L1_error)
+  __pyx_t_2 = PyUnicode_Replace(__pyx_v_self->__pyx_base.file_name, __pyx_kp_u__10, __pyx_kp_u__11, -1L); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 226, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyUnicode_Concat(__pyx_kp_u_file, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 210, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyUnicode_Concat(__pyx_kp_u_file, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 226, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_file_path = __pyx_t_3;
   __pyx_t_3 = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":211
+  /* "mpfmc/core/audio/sound_file.pyx":227
  *         # Create GStreamer pipeline with the specified caps (from a string)
  *         file_path = 'file:///' + self.file_name.replace('\\', '/')
  *         if SDL_AUDIO_ISLITTLEENDIAN(self.callback_data.format):             # <<<<<<<<<<<<<<
@@ -4440,7 +4669,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   __pyx_t_1 = (SDL_AUDIO_ISLITTLEENDIAN(__pyx_v_self->__pyx_base.callback_data->format) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/sound_file.pyx":212
+    /* "mpfmc/core/audio/sound_file.pyx":228
  *         file_path = 'file:///' + self.file_name.replace('\\', '/')
  *         if SDL_AUDIO_ISLITTLEENDIAN(self.callback_data.format):
  *             audio_format = "S16LE"             # <<<<<<<<<<<<<<
@@ -4450,7 +4679,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
     __Pyx_INCREF(__pyx_n_u_S16LE);
     __pyx_v_audio_format = __pyx_n_u_S16LE;
 
-    /* "mpfmc/core/audio/sound_file.pyx":211
+    /* "mpfmc/core/audio/sound_file.pyx":227
  *         # Create GStreamer pipeline with the specified caps (from a string)
  *         file_path = 'file:///' + self.file_name.replace('\\', '/')
  *         if SDL_AUDIO_ISLITTLEENDIAN(self.callback_data.format):             # <<<<<<<<<<<<<<
@@ -4460,7 +4689,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
     goto __pyx_L4;
   }
 
-  /* "mpfmc/core/audio/sound_file.pyx":214
+  /* "mpfmc/core/audio/sound_file.pyx":230
  *             audio_format = "S16LE"
  *         else:
  *             audio_format = "S16BE"             # <<<<<<<<<<<<<<
@@ -4473,44 +4702,44 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   }
   __pyx_L4:;
 
-  /* "mpfmc/core/audio/sound_file.pyx":215
+  /* "mpfmc/core/audio/sound_file.pyx":231
  *         else:
  *             audio_format = "S16BE"
  *         pipeline_string = 'uridecodebin uri="{}" ! audioconvert ! audioresample ! appsink name=sink caps="audio/x-raw,rate={},channels={},format={},layout=interleaved" sync=true blocksize={}'.format(             # <<<<<<<<<<<<<<
  *             file_path, str(self.callback_data.sample_rate), str(self.callback_data.channels), audio_format, self.callback_data.buffer_size)
  * 
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_uridecodebin_uri_audioconvert_au, __pyx_n_s_format); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 215, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_uridecodebin_uri_audioconvert_au, __pyx_n_s_format); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 231, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
 
-  /* "mpfmc/core/audio/sound_file.pyx":216
+  /* "mpfmc/core/audio/sound_file.pyx":232
  *             audio_format = "S16BE"
  *         pipeline_string = 'uridecodebin uri="{}" ! audioconvert ! audioresample ! appsink name=sink caps="audio/x-raw,rate={},channels={},format={},layout=interleaved" sync=true blocksize={}'.format(
  *             file_path, str(self.callback_data.sample_rate), str(self.callback_data.channels), audio_format, self.callback_data.buffer_size)             # <<<<<<<<<<<<<<
  * 
  *         error = NULL
  */
-  __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_self->__pyx_base.callback_data->sample_rate); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 216, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_self->__pyx_base.callback_data->sample_rate); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 232, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 216, __pyx_L1_error)
+  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 232, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_GIVEREF(__pyx_t_4);
   PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4);
   __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyObject_Call(((PyObject *)(&PyUnicode_Type)), __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 216, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_Call(((PyObject *)(&PyUnicode_Type)), __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 232, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_self->__pyx_base.callback_data->channels); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 216, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_self->__pyx_base.callback_data->channels); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 232, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 216, __pyx_L1_error)
+  __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 232, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_GIVEREF(__pyx_t_5);
   PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_5);
   __pyx_t_5 = 0;
-  __pyx_t_5 = __Pyx_PyObject_Call(((PyObject *)(&PyUnicode_Type)), __pyx_t_6, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 216, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_Call(((PyObject *)(&PyUnicode_Type)), __pyx_t_6, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 232, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyInt_From_Uint32(__pyx_v_self->__pyx_base.callback_data->buffer_size); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 216, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyInt_From_Uint32(__pyx_v_self->__pyx_base.callback_data->buffer_size); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 232, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __pyx_t_7 = NULL;
   __pyx_t_8 = 0;
@@ -4527,7 +4756,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   #if CYTHON_FAST_PYCALL
   if (PyFunction_Check(__pyx_t_2)) {
     PyObject *__pyx_temp[6] = {__pyx_t_7, __pyx_v_file_path, __pyx_t_4, __pyx_t_5, __pyx_v_audio_format, __pyx_t_6};
-    __pyx_t_3 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 5+__pyx_t_8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 215, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 5+__pyx_t_8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 231, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -4538,7 +4767,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   #if CYTHON_FAST_PYCCALL
   if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
     PyObject *__pyx_temp[6] = {__pyx_t_7, __pyx_v_file_path, __pyx_t_4, __pyx_t_5, __pyx_v_audio_format, __pyx_t_6};
-    __pyx_t_3 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 5+__pyx_t_8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 215, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 5+__pyx_t_8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 231, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -4547,7 +4776,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   } else
   #endif
   {
-    __pyx_t_9 = PyTuple_New(5+__pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 215, __pyx_L1_error)
+    __pyx_t_9 = PyTuple_New(5+__pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 231, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_9);
     if (__pyx_t_7) {
       __Pyx_GIVEREF(__pyx_t_7); PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_7); __pyx_t_7 = NULL;
@@ -4567,7 +4796,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
     __pyx_t_4 = 0;
     __pyx_t_5 = 0;
     __pyx_t_6 = 0;
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_9, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 215, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_9, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 231, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
   }
@@ -4575,7 +4804,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   __pyx_v_pipeline_string = __pyx_t_3;
   __pyx_t_3 = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":218
+  /* "mpfmc/core/audio/sound_file.pyx":234
  *             file_path, str(self.callback_data.sample_rate), str(self.callback_data.channels), audio_format, self.callback_data.buffer_size)
  * 
  *         error = NULL             # <<<<<<<<<<<<<<
@@ -4584,23 +4813,23 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   __pyx_v_error = NULL;
 
-  /* "mpfmc/core/audio/sound_file.pyx":219
+  /* "mpfmc/core/audio/sound_file.pyx":235
  * 
  *         error = NULL
  *         self.pipeline = gst_parse_launch(pipeline_string.encode('utf-8'), &error)             # <<<<<<<<<<<<<<
  * 
  *         if error != NULL:
  */
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_pipeline_string, __pyx_n_s_encode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 219, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_pipeline_string, __pyx_n_s_encode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 235, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_tuple__12, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 219, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_tuple__12, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 235, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_10 = __Pyx_PyObject_AsWritableString(__pyx_t_2); if (unlikely((!__pyx_t_10) && PyErr_Occurred())) __PYX_ERR(0, 219, __pyx_L1_error)
+  __pyx_t_10 = __Pyx_PyObject_AsWritableString(__pyx_t_2); if (unlikely((!__pyx_t_10) && PyErr_Occurred())) __PYX_ERR(0, 235, __pyx_L1_error)
   __pyx_v_self->pipeline = gst_parse_launch(__pyx_t_10, (&__pyx_v_error));
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":221
+  /* "mpfmc/core/audio/sound_file.pyx":237
  *         self.pipeline = gst_parse_launch(pipeline_string.encode('utf-8'), &error)
  * 
  *         if error != NULL:             # <<<<<<<<<<<<<<
@@ -4610,18 +4839,18 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   __pyx_t_1 = ((__pyx_v_error != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/sound_file.pyx":222
+    /* "mpfmc/core/audio/sound_file.pyx":238
  * 
  *         if error != NULL:
  *             msg = 'Unable to create a GStreamer pipeline: code={} message={}'.format(error.code, <bytes>error.message)             # <<<<<<<<<<<<<<
  *             raise AudioException(msg)
  * 
  */
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Unable_to_create_a_GStreamer_pip, __pyx_n_s_format); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 222, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Unable_to_create_a_GStreamer_pip, __pyx_n_s_format); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 238, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_9 = __Pyx_PyInt_From_int(__pyx_v_error->code); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 222, __pyx_L1_error)
+    __pyx_t_9 = __Pyx_PyInt_From_int(__pyx_v_error->code); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 238, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_9);
-    __pyx_t_6 = __Pyx_PyBytes_FromString(__pyx_v_error->message); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 222, __pyx_L1_error)
+    __pyx_t_6 = __Pyx_PyBytes_FromString(__pyx_v_error->message); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 238, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
     __pyx_t_5 = NULL;
     __pyx_t_8 = 0;
@@ -4638,7 +4867,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
     #if CYTHON_FAST_PYCALL
     if (PyFunction_Check(__pyx_t_3)) {
       PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_t_9, __pyx_t_6};
-      __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 222, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 238, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
@@ -4648,7 +4877,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
     #if CYTHON_FAST_PYCCALL
     if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
       PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_t_9, __pyx_t_6};
-      __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 222, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 238, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
@@ -4656,7 +4885,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
     } else
     #endif
     {
-      __pyx_t_4 = PyTuple_New(2+__pyx_t_8); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 222, __pyx_L1_error)
+      __pyx_t_4 = PyTuple_New(2+__pyx_t_8); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 238, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
       if (__pyx_t_5) {
         __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_5); __pyx_t_5 = NULL;
@@ -4668,7 +4897,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
       PyTuple_SET_ITEM(__pyx_t_4, 1+__pyx_t_8, __pyx_t_6);
       __pyx_t_9 = 0;
       __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_4, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 222, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_4, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 238, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     }
@@ -4676,14 +4905,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
     __pyx_v_msg = __pyx_t_2;
     __pyx_t_2 = 0;
 
-    /* "mpfmc/core/audio/sound_file.pyx":223
+    /* "mpfmc/core/audio/sound_file.pyx":239
  *         if error != NULL:
  *             msg = 'Unable to create a GStreamer pipeline: code={} message={}'.format(error.code, <bytes>error.message)
  *             raise AudioException(msg)             # <<<<<<<<<<<<<<
  * 
  *         # Get the pipeline bus (the bus allows applications to receive pipeline messages)
  */
-    __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_AudioException); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 223, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_AudioException); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 239, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __pyx_t_4 = NULL;
     if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
@@ -4696,13 +4925,13 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
       }
     }
     if (!__pyx_t_4) {
-      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_msg); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 223, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_msg); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 239, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
     } else {
       #if CYTHON_FAST_PYCALL
       if (PyFunction_Check(__pyx_t_3)) {
         PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_v_msg};
-        __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 223, __pyx_L1_error)
+        __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 239, __pyx_L1_error)
         __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
         __Pyx_GOTREF(__pyx_t_2);
       } else
@@ -4710,19 +4939,19 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
       #if CYTHON_FAST_PYCCALL
       if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
         PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_v_msg};
-        __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 223, __pyx_L1_error)
+        __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 239, __pyx_L1_error)
         __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
         __Pyx_GOTREF(__pyx_t_2);
       } else
       #endif
       {
-        __pyx_t_6 = PyTuple_New(1+1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 223, __pyx_L1_error)
+        __pyx_t_6 = PyTuple_New(1+1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 239, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_6);
         __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_4); __pyx_t_4 = NULL;
         __Pyx_INCREF(__pyx_v_msg);
         __Pyx_GIVEREF(__pyx_v_msg);
         PyTuple_SET_ITEM(__pyx_t_6, 0+1, __pyx_v_msg);
-        __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_6, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 223, __pyx_L1_error)
+        __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_6, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 239, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_2);
         __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
       }
@@ -4730,9 +4959,9 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_Raise(__pyx_t_2, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __PYX_ERR(0, 223, __pyx_L1_error)
+    __PYX_ERR(0, 239, __pyx_L1_error)
 
-    /* "mpfmc/core/audio/sound_file.pyx":221
+    /* "mpfmc/core/audio/sound_file.pyx":237
  *         self.pipeline = gst_parse_launch(pipeline_string.encode('utf-8'), &error)
  * 
  *         if error != NULL:             # <<<<<<<<<<<<<<
@@ -4741,7 +4970,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   }
 
-  /* "mpfmc/core/audio/sound_file.pyx":226
+  /* "mpfmc/core/audio/sound_file.pyx":242
  * 
  *         # Get the pipeline bus (the bus allows applications to receive pipeline messages)
  *         self.bus = gst_pipeline_get_bus(<GstPipeline*>self.pipeline)             # <<<<<<<<<<<<<<
@@ -4750,7 +4979,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   __pyx_v_self->bus = gst_pipeline_get_bus(((GstPipeline *)__pyx_v_self->pipeline));
 
-  /* "mpfmc/core/audio/sound_file.pyx":227
+  /* "mpfmc/core/audio/sound_file.pyx":243
  *         # Get the pipeline bus (the bus allows applications to receive pipeline messages)
  *         self.bus = gst_pipeline_get_bus(<GstPipeline*>self.pipeline)
  *         if self.bus == NULL:             # <<<<<<<<<<<<<<
@@ -4760,23 +4989,23 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   __pyx_t_1 = ((__pyx_v_self->bus == NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/sound_file.pyx":228
+    /* "mpfmc/core/audio/sound_file.pyx":244
  *         self.bus = gst_pipeline_get_bus(<GstPipeline*>self.pipeline)
  *         if self.bus == NULL:
  *             raise AudioException('Unable to get bus from the pipeline')             # <<<<<<<<<<<<<<
  * 
  *         # Enable pipeline messages and callback message handler
  */
-    __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_AudioException); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 228, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_AudioException); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 244, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_tuple__13, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 228, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_tuple__13, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 244, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __PYX_ERR(0, 228, __pyx_L1_error)
+    __PYX_ERR(0, 244, __pyx_L1_error)
 
-    /* "mpfmc/core/audio/sound_file.pyx":227
+    /* "mpfmc/core/audio/sound_file.pyx":243
  *         # Get the pipeline bus (the bus allows applications to receive pipeline messages)
  *         self.bus = gst_pipeline_get_bus(<GstPipeline*>self.pipeline)
  *         if self.bus == NULL:             # <<<<<<<<<<<<<<
@@ -4785,7 +5014,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   }
 
-  /* "mpfmc/core/audio/sound_file.pyx":235
+  /* "mpfmc/core/audio/sound_file.pyx":251
  * 
  *         # Get sink
  *         self.sink = gst_bin_get_by_name(<GstBin*>self.pipeline, "sink")             # <<<<<<<<<<<<<<
@@ -4794,7 +5023,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   __pyx_v_self->sink = gst_bin_get_by_name(((GstBin *)__pyx_v_self->pipeline), ((const gchar *)"sink"));
 
-  /* "mpfmc/core/audio/sound_file.pyx":238
+  /* "mpfmc/core/audio/sound_file.pyx":254
  * 
  *         # Set to PAUSED to make the first frame arrive in the sink
  *         ret = gst_element_set_state(self.pipeline, GST_STATE_PAUSED)             # <<<<<<<<<<<<<<
@@ -4803,7 +5032,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   __pyx_v_ret = gst_element_set_state(__pyx_v_self->pipeline, GST_STATE_PAUSED);
 
-  /* "mpfmc/core/audio/sound_file.pyx":242
+  /* "mpfmc/core/audio/sound_file.pyx":258
  *         # Get the preroll sample (forces the code to wait until the sample has been completely loaded
  *         # which is necessary to retrieve the duration).
  *         sample = c_appsink_pull_preroll(self.sink)             # <<<<<<<<<<<<<<
@@ -4812,7 +5041,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   __pyx_v_sample = c_appsink_pull_preroll(__pyx_v_self->sink);
 
-  /* "mpfmc/core/audio/sound_file.pyx":243
+  /* "mpfmc/core/audio/sound_file.pyx":259
  *         # which is necessary to retrieve the duration).
  *         sample = c_appsink_pull_preroll(self.sink)
  *         if sample != NULL:             # <<<<<<<<<<<<<<
@@ -4822,7 +5051,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   __pyx_t_1 = ((__pyx_v_sample != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/sound_file.pyx":244
+    /* "mpfmc/core/audio/sound_file.pyx":260
  *         sample = c_appsink_pull_preroll(self.sink)
  *         if sample != NULL:
  *             gst_sample_unref(sample)             # <<<<<<<<<<<<<<
@@ -4831,7 +5060,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
     gst_sample_unref(__pyx_v_sample);
 
-    /* "mpfmc/core/audio/sound_file.pyx":243
+    /* "mpfmc/core/audio/sound_file.pyx":259
  *         # which is necessary to retrieve the duration).
  *         sample = c_appsink_pull_preroll(self.sink)
  *         if sample != NULL:             # <<<<<<<<<<<<<<
@@ -4840,7 +5069,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   }
 
-  /* "mpfmc/core/audio/sound_file.pyx":247
+  /* "mpfmc/core/audio/sound_file.pyx":263
  * 
  *         # Get duration of audio file (in nanoseconds)
  *         if not gst_element_query_duration(self.sink, GST_FORMAT_TIME, &duration):             # <<<<<<<<<<<<<<
@@ -4850,7 +5079,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   __pyx_t_1 = ((!(gst_element_query_duration(__pyx_v_self->sink, GST_FORMAT_TIME, (&__pyx_v_duration)) != 0)) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/sound_file.pyx":248
+    /* "mpfmc/core/audio/sound_file.pyx":264
  *         # Get duration of audio file (in nanoseconds)
  *         if not gst_element_query_duration(self.sink, GST_FORMAT_TIME, &duration):
  *             duration = 0             # <<<<<<<<<<<<<<
@@ -4859,7 +5088,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
     __pyx_v_duration = 0;
 
-    /* "mpfmc/core/audio/sound_file.pyx":247
+    /* "mpfmc/core/audio/sound_file.pyx":263
  * 
  *         # Get duration of audio file (in nanoseconds)
  *         if not gst_element_query_duration(self.sink, GST_FORMAT_TIME, &duration):             # <<<<<<<<<<<<<<
@@ -4868,7 +5097,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   }
 
-  /* "mpfmc/core/audio/sound_file.pyx":251
+  /* "mpfmc/core/audio/sound_file.pyx":267
  * 
  *         # Store duration in seconds
  *         self.sample.duration = duration / GST_SECOND             # <<<<<<<<<<<<<<
@@ -4877,11 +5106,11 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   if (unlikely(GST_SECOND == 0)) {
     PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-    __PYX_ERR(0, 251, __pyx_L1_error)
+    __PYX_ERR(0, 267, __pyx_L1_error)
   }
   __pyx_v_self->__pyx_base.sample.duration = (((double)__pyx_v_duration) / ((double)GST_SECOND));
 
-  /* "mpfmc/core/audio/sound_file.pyx":255
+  /* "mpfmc/core/audio/sound_file.pyx":271
  *         # The pipeline should now be ready to play.  Store the pointers to the pipeline
  *         # and appsink in the SampleStream struct for use in the application.
  *         self.sample.data.stream.pipeline = self.pipeline             # <<<<<<<<<<<<<<
@@ -4891,7 +5120,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   __pyx_t_11 = __pyx_v_self->pipeline;
   __pyx_v_self->__pyx_base.sample.data.stream->pipeline = __pyx_t_11;
 
-  /* "mpfmc/core/audio/sound_file.pyx":256
+  /* "mpfmc/core/audio/sound_file.pyx":272
  *         # and appsink in the SampleStream struct for use in the application.
  *         self.sample.data.stream.pipeline = self.pipeline
  *         self.sample.data.stream.sink = self.sink             # <<<<<<<<<<<<<<
@@ -4901,7 +5130,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   __pyx_t_11 = __pyx_v_self->sink;
   __pyx_v_self->__pyx_base.sample.data.stream->sink = __pyx_t_11;
 
-  /* "mpfmc/core/audio/sound_file.pyx":195
+  /* "mpfmc/core/audio/sound_file.pyx":211
  *         self.pipeline = NULL
  * 
  *     def _construct_pipeline(self):             # <<<<<<<<<<<<<<
@@ -4932,7 +5161,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/sound_file.pyx":258
+/* "mpfmc/core/audio/sound_file.pyx":274
  *         self.sample.data.stream.sink = self.sink
  * 
  *     def load(self):             # <<<<<<<<<<<<<<
@@ -4965,14 +5194,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   PyObject *__pyx_t_6 = NULL;
   __Pyx_RefNannySetupContext("load", 0);
 
-  /* "mpfmc/core/audio/sound_file.pyx":264
+  /* "mpfmc/core/audio/sound_file.pyx":280
  *         #    return
  * 
  *         self._gst_init()             # <<<<<<<<<<<<<<
  *         self._construct_pipeline()
  * 
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_gst_init); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 264, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_gst_init); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 280, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_t_3 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
@@ -4985,23 +5214,23 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
     }
   }
   if (__pyx_t_3) {
-    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 264, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 280, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   } else {
-    __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 264, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 280, __pyx_L1_error)
   }
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":265
+  /* "mpfmc/core/audio/sound_file.pyx":281
  * 
  *         self._gst_init()
  *         self._construct_pipeline()             # <<<<<<<<<<<<<<
  * 
  *         self.log.debug('Loaded file: %s Sample duration: %s',
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_construct_pipeline); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 265, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_construct_pipeline); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 281, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_t_3 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
@@ -5014,33 +5243,33 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
     }
   }
   if (__pyx_t_3) {
-    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 265, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 281, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   } else {
-    __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 265, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 281, __pyx_L1_error)
   }
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":267
+  /* "mpfmc/core/audio/sound_file.pyx":283
  *         self._construct_pipeline()
  * 
  *         self.log.debug('Loaded file: %s Sample duration: %s',             # <<<<<<<<<<<<<<
  *                        self.file_name, self.sample.duration)
  * 
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->__pyx_base.log, __pyx_n_s_debug); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 267, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->__pyx_base.log, __pyx_n_s_debug); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 283, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
 
-  /* "mpfmc/core/audio/sound_file.pyx":268
+  /* "mpfmc/core/audio/sound_file.pyx":284
  * 
  *         self.log.debug('Loaded file: %s Sample duration: %s',
  *                        self.file_name, self.sample.duration)             # <<<<<<<<<<<<<<
  * 
  *     def unload(self):
  */
-  __pyx_t_3 = PyFloat_FromDouble(__pyx_v_self->__pyx_base.sample.duration); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 268, __pyx_L1_error)
+  __pyx_t_3 = PyFloat_FromDouble(__pyx_v_self->__pyx_base.sample.duration); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 284, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_t_4 = NULL;
   __pyx_t_5 = 0;
@@ -5057,7 +5286,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   #if CYTHON_FAST_PYCALL
   if (PyFunction_Check(__pyx_t_2)) {
     PyObject *__pyx_temp[4] = {__pyx_t_4, __pyx_kp_u_Loaded_file_s_Sample_duration_s, __pyx_v_self->__pyx_base.file_name, __pyx_t_3};
-    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_5, 3+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 267, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_5, 3+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 283, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -5066,14 +5295,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   #if CYTHON_FAST_PYCCALL
   if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
     PyObject *__pyx_temp[4] = {__pyx_t_4, __pyx_kp_u_Loaded_file_s_Sample_duration_s, __pyx_v_self->__pyx_base.file_name, __pyx_t_3};
-    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_5, 3+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 267, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_5, 3+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 283, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   } else
   #endif
   {
-    __pyx_t_6 = PyTuple_New(3+__pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 267, __pyx_L1_error)
+    __pyx_t_6 = PyTuple_New(3+__pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 283, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
     if (__pyx_t_4) {
       __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_4); __pyx_t_4 = NULL;
@@ -5087,14 +5316,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
     __Pyx_GIVEREF(__pyx_t_3);
     PyTuple_SET_ITEM(__pyx_t_6, 2+__pyx_t_5, __pyx_t_3);
     __pyx_t_3 = 0;
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 267, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 283, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
   }
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":258
+  /* "mpfmc/core/audio/sound_file.pyx":274
  *         self.sample.data.stream.sink = self.sink
  * 
  *     def load(self):             # <<<<<<<<<<<<<<
@@ -5119,7 +5348,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/sound_file.pyx":270
+/* "mpfmc/core/audio/sound_file.pyx":286
  *                        self.file_name, self.sample.duration)
  * 
  *     def unload(self):             # <<<<<<<<<<<<<<
@@ -5147,7 +5376,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("unload", 0);
 
-  /* "mpfmc/core/audio/sound_file.pyx":274
+  /* "mpfmc/core/audio/sound_file.pyx":290
  * 
  *         # Done with the streaming buffer, release references to it
  *         if self.sample.data.stream.map_contains_valid_sample_data:             # <<<<<<<<<<<<<<
@@ -5157,7 +5386,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   __pyx_t_1 = (__pyx_v_self->__pyx_base.sample.data.stream->map_contains_valid_sample_data != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/sound_file.pyx":275
+    /* "mpfmc/core/audio/sound_file.pyx":291
  *         # Done with the streaming buffer, release references to it
  *         if self.sample.data.stream.map_contains_valid_sample_data:
  *             gst_buffer_unmap(self.sample.data.stream.buffer, &self.sample.data.stream.map_info)             # <<<<<<<<<<<<<<
@@ -5166,7 +5395,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
     gst_buffer_unmap(__pyx_v_self->__pyx_base.sample.data.stream->buffer, (&__pyx_v_self->__pyx_base.sample.data.stream->map_info));
 
-    /* "mpfmc/core/audio/sound_file.pyx":276
+    /* "mpfmc/core/audio/sound_file.pyx":292
  *         if self.sample.data.stream.map_contains_valid_sample_data:
  *             gst_buffer_unmap(self.sample.data.stream.buffer, &self.sample.data.stream.map_info)
  *             gst_sample_unref(self.sample.data.stream.sample)             # <<<<<<<<<<<<<<
@@ -5175,7 +5404,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
     gst_sample_unref(__pyx_v_self->__pyx_base.sample.data.stream->sample);
 
-    /* "mpfmc/core/audio/sound_file.pyx":278
+    /* "mpfmc/core/audio/sound_file.pyx":294
  *             gst_sample_unref(self.sample.data.stream.sample)
  * 
  *             self.sample.data.stream.buffer = NULL             # <<<<<<<<<<<<<<
@@ -5184,7 +5413,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
     __pyx_v_self->__pyx_base.sample.data.stream->buffer = NULL;
 
-    /* "mpfmc/core/audio/sound_file.pyx":279
+    /* "mpfmc/core/audio/sound_file.pyx":295
  * 
  *             self.sample.data.stream.buffer = NULL
  *             self.sample.data.stream.sample = NULL             # <<<<<<<<<<<<<<
@@ -5193,7 +5422,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
     __pyx_v_self->__pyx_base.sample.data.stream->sample = NULL;
 
-    /* "mpfmc/core/audio/sound_file.pyx":280
+    /* "mpfmc/core/audio/sound_file.pyx":296
  *             self.sample.data.stream.buffer = NULL
  *             self.sample.data.stream.sample = NULL
  *             self.sample.data.stream.map_buffer_pos = 0             # <<<<<<<<<<<<<<
@@ -5202,7 +5431,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
     __pyx_v_self->__pyx_base.sample.data.stream->map_buffer_pos = 0;
 
-    /* "mpfmc/core/audio/sound_file.pyx":281
+    /* "mpfmc/core/audio/sound_file.pyx":297
  *             self.sample.data.stream.sample = NULL
  *             self.sample.data.stream.map_buffer_pos = 0
  *             self.sample.data.stream.map_contains_valid_sample_data = 0             # <<<<<<<<<<<<<<
@@ -5211,7 +5440,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
     __pyx_v_self->__pyx_base.sample.data.stream->map_contains_valid_sample_data = 0;
 
-    /* "mpfmc/core/audio/sound_file.pyx":274
+    /* "mpfmc/core/audio/sound_file.pyx":290
  * 
  *         # Done with the streaming buffer, release references to it
  *         if self.sample.data.stream.map_contains_valid_sample_data:             # <<<<<<<<<<<<<<
@@ -5220,7 +5449,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   }
 
-  /* "mpfmc/core/audio/sound_file.pyx":284
+  /* "mpfmc/core/audio/sound_file.pyx":300
  * 
  *         # Cleanup the streaming pipeline
  *         gst_element_set_state(self.pipeline, GST_STATE_NULL)             # <<<<<<<<<<<<<<
@@ -5229,7 +5458,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   gst_element_set_state(__pyx_v_self->pipeline, GST_STATE_NULL);
 
-  /* "mpfmc/core/audio/sound_file.pyx":285
+  /* "mpfmc/core/audio/sound_file.pyx":301
  *         # Cleanup the streaming pipeline
  *         gst_element_set_state(self.pipeline, GST_STATE_NULL)
  *         gst_object_unref(self.pipeline)             # <<<<<<<<<<<<<<
@@ -5238,7 +5467,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
  */
   gst_object_unref(__pyx_v_self->pipeline);
 
-  /* "mpfmc/core/audio/sound_file.pyx":270
+  /* "mpfmc/core/audio/sound_file.pyx":286
  *                        self.file_name, self.sample.duration)
  * 
  *     def unload(self):             # <<<<<<<<<<<<<<
@@ -5253,7 +5482,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/sound_file.pyx":288
+/* "mpfmc/core/audio/sound_file.pyx":304
  * 
  *     @property
  *     def loaded(self):             # <<<<<<<<<<<<<<
@@ -5282,7 +5511,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   PyObject *__pyx_t_3 = NULL;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "mpfmc/core/audio/sound_file.pyx":290
+  /* "mpfmc/core/audio/sound_file.pyx":306
  *     def loaded(self):
  *         """Returns whether or not the sound file data is loaded in memory"""
  *         return self.sample.data.stream != NULL and self.sample.data.stream.pipeline != NULL and self.sample.data.stream.sink != NULL             # <<<<<<<<<<<<<<
@@ -5291,7 +5520,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   __pyx_t_2 = (__pyx_v_self->__pyx_base.sample.data.stream != NULL);
   if (__pyx_t_2) {
   } else {
-    __pyx_t_3 = __Pyx_PyBool_FromLong(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 290, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyBool_FromLong(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 306, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __pyx_t_1 = __pyx_t_3;
     __pyx_t_3 = 0;
@@ -5300,14 +5529,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   __pyx_t_2 = (__pyx_v_self->__pyx_base.sample.data.stream->pipeline != NULL);
   if (__pyx_t_2) {
   } else {
-    __pyx_t_3 = __Pyx_PyBool_FromLong(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 290, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyBool_FromLong(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 306, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __pyx_t_1 = __pyx_t_3;
     __pyx_t_3 = 0;
     goto __pyx_L3_bool_binop_done;
   }
   __pyx_t_2 = (__pyx_v_self->__pyx_base.sample.data.stream->sink != NULL);
-  __pyx_t_3 = __Pyx_PyBool_FromLong(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 290, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyBool_FromLong(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 306, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_t_1 = __pyx_t_3;
   __pyx_t_3 = 0;
@@ -5316,7 +5545,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_10sound_file_18SoundStreamingFile_
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "mpfmc/core/audio/sound_file.pyx":288
+  /* "mpfmc/core/audio/sound_file.pyx":304
  * 
  *     @property
  *     def loaded(self):             # <<<<<<<<<<<<<<
@@ -5495,6 +5724,10 @@ static PyObject *__pyx_getprop_5mpfmc_4core_5audio_10sound_file_9SoundFile_durat
   return __pyx_pw_5mpfmc_4core_5audio_10sound_file_9SoundFile_8duration_1__get__(o);
 }
 
+static PyObject *__pyx_getprop_5mpfmc_4core_5audio_10sound_file_9SoundFile_memory_size(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_5mpfmc_4core_5audio_10sound_file_9SoundFile_11memory_size_1__get__(o);
+}
+
 static PyMethodDef __pyx_methods_5mpfmc_4core_5audio_10sound_file_SoundFile[] = {
   {"load", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_10sound_file_9SoundFile_5load, METH_NOARGS, __pyx_doc_5mpfmc_4core_5audio_10sound_file_9SoundFile_4load},
   {"unload", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_10sound_file_9SoundFile_7unload, METH_NOARGS, __pyx_doc_5mpfmc_4core_5audio_10sound_file_9SoundFile_6unload},
@@ -5505,6 +5738,7 @@ static PyMethodDef __pyx_methods_5mpfmc_4core_5audio_10sound_file_SoundFile[] =
 
 static struct PyGetSetDef __pyx_getsets_5mpfmc_4core_5audio_10sound_file_SoundFile[] = {
   {(char *)"duration", __pyx_getprop_5mpfmc_4core_5audio_10sound_file_9SoundFile_duration, 0, (char *)"Return the duration of the sound file", 0},
+  {(char *)"memory_size", __pyx_getprop_5mpfmc_4core_5audio_10sound_file_9SoundFile_memory_size, 0, (char *)"Return the number of bytes of sample data held in memory", 0},
   {0, 0, 0, 0, 0}
 };
 
@@ -5595,16 +5829,22 @@ static PyObject *__pyx_getprop_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFil
   return __pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6loaded_1__get__(o);
 }
 
+static PyObject *__pyx_getprop_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_memory_size(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_11memory_size_1__get__(o);
+}
+
 static PyMethodDef __pyx_methods_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile[] = {
   {"load", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_7load, METH_NOARGS, __pyx_doc_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_6load},
   {"unload", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_9unload, METH_NOARGS, __pyx_doc_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_8unload},
-  {"__reduce_cython__", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_11__reduce_cython__, METH_NOARGS, __pyx_doc_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_10__reduce_cython__},
-  {"__setstate_cython__", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_13__setstate_cython__, METH_O, __pyx_doc_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_12__setstate_cython__},
+  {"get_samples", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_11get_samples, METH_NOARGS, __pyx_doc_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_10get_samples},
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_13__reduce_cython__, METH_NOARGS, __pyx_doc_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_12__reduce_cython__},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_15__setstate_cython__, METH_O, __pyx_doc_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_14__setstate_cython__},
   {0, 0, 0, 0}
 };
 
 static struct PyGetSetDef __pyx_getsets_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile[] = {
   {(char *)"loaded", __pyx_getprop_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_loaded, 0, (char *)"Returns whether or not the sound file data is loaded in memory", 0},
+  {(char *)"memory_size", __pyx_getprop_5mpfmc_4core_5audio_10sound_file_15SoundMemoryFile_memory_size, 0, (char *)"Returns the number of bytes of sample data held in memory", 0},
   {0, 0, 0, 0, 0}
 };
 
@@ -5872,7 +6112,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
 static int __Pyx_InitCachedBuiltins(void) {
   __pyx_builtin_NotImplementedError = __Pyx_GetBuiltinName(__pyx_n_s_NotImplementedError); if (!__pyx_builtin_NotImplementedError) __PYX_ERR(0, 32, __pyx_L1_error)
   __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(1, 2, __pyx_L1_error)
-  __pyx_builtin_super = __Pyx_GetBuiltinName(__pyx_n_s_super); if (!__pyx_builtin_super) __PYX_ERR(0, 53, __pyx_L1_error)
+  __pyx_builtin_super = __Pyx_GetBuiltinName(__pyx_n_s_super); if (!__pyx_builtin_super) __PYX_ERR(0, 58, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -5934,14 +6174,14 @@ static int __Pyx_InitCachedConstants(void) {
   __Pyx_GOTREF(__pyx_tuple__5);
   __Pyx_GIVEREF(__pyx_tuple__5);
 
-  /* "mpfmc/core/audio/sound_file.pyx":54
+  /* "mpfmc/core/audio/sound_file.pyx":59
  *         # IMPORTANT: Call super class init function
  *         super().__init__(file_name, audio_callback_data)
  *         self.log = logging.getLogger("SoundMemoryFile")             # <<<<<<<<<<<<<<
  *         self.sample.type = sound_type_memory
  *         self.sample.data.memory = <SampleMemory*>PyMem_Malloc(sizeof(SampleMemory))
  */
-  __pyx_tuple__6 = PyTuple_Pack(1, __pyx_n_u_SoundMemoryFile); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(0, 54, __pyx_L1_error)
+  __pyx_tuple__6 = PyTuple_Pack(1, __pyx_n_u_SoundMemoryFile); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(0, 59, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__6);
   __Pyx_GIVEREF(__pyx_tuple__6);
 
@@ -5964,36 +6204,36 @@ static int __Pyx_InitCachedConstants(void) {
   __Pyx_GOTREF(__pyx_tuple__8);
   __Pyx_GIVEREF(__pyx_tuple__8);
 
-  /* "mpfmc/core/audio/sound_file.pyx":135
+  /* "mpfmc/core/audio/sound_file.pyx":151
  *         # IMPORTANT: Call super class init function
  *         super().__init__(file_name, audio_callback_data)
  *         self.log = logging.getLogger("SoundStreamingFile")             # <<<<<<<<<<<<<<
  * 
  *         self.sample.type = sound_type_streaming
  */
-  __pyx_tuple__9 = PyTuple_Pack(1, __pyx_n_u_SoundStreamingFile); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(0, 135, __pyx_L1_error)
+  __pyx_tuple__9 = PyTuple_Pack(1, __pyx_n_u_SoundStreamingFile); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(0, 151, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__9);
   __Pyx_GIVEREF(__pyx_tuple__9);
 
-  /* "mpfmc/core/audio/sound_file.pyx":219
+  /* "mpfmc/core/audio/sound_file.pyx":235
  * 
  *         error = NULL
  *         self.pipeline = gst_parse_launch(pipeline_string.encode('utf-8'), &error)             # <<<<<<<<<<<<<<
  * 
  *         if error != NULL:
  */
-  __pyx_tuple__12 = PyTuple_Pack(1, __pyx_kp_u_utf_8); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(0, 219, __pyx_L1_error)
+  __pyx_tuple__12 = PyTuple_Pack(1, __pyx_kp_u_utf_8); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(0, 235, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__12);
   __Pyx_GIVEREF(__pyx_tuple__12);
 
-  /* "mpfmc/core/audio/sound_file.pyx":228
+  /* "mpfmc/core/audio/sound_file.pyx":244
  *         self.bus = gst_pipeline_get_bus(<GstPipeline*>self.pipeline)
  *         if self.bus == NULL:
  *             raise AudioException('Unable to get bus from the pipeline')             # <<<<<<<<<<<<<<
  * 
  *         # Enable pipeline messages and callback message handler
  */
-  __pyx_tuple__13 = PyTuple_Pack(1, __pyx_kp_u_Unable_to_get_bus_from_the_pipel); if (unlikely(!__pyx_tuple__13)) __PYX_ERR(0, 228, __pyx_L1_error)
+  __pyx_tuple__13 = PyTuple_Pack(1, __pyx_kp_u_Unable_to_get_bus_from_the_pipel); if (unlikely(!__pyx_tuple__13)) __PYX_ERR(0, 244, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__13);
   __Pyx_GIVEREF(__pyx_tuple__13);
 
@@ -6024,6 +6264,7 @@ static int __Pyx_InitCachedConstants(void) {
 
 static int __Pyx_InitGlobals(void) {
   if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
+  __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) __PYX_ERR(0, 1, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -6173,16 +6414,16 @@ static int __pyx_pymod_exec_sound_file(PyObject *__pyx_pyinit_module)
   if (__Pyx_setup_reduce((PyObject*)&__pyx_type_5mpfmc_4core_5audio_10sound_file_SoundFile) < 0) __PYX_ERR(0, 18, __pyx_L1_error)
   __pyx_ptype_5mpfmc_4core_5audio_10sound_file_SoundFile = &__pyx_type_5mpfmc_4core_5audio_10sound_file_SoundFile;
   __pyx_type_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile.tp_base = __pyx_ptype_5mpfmc_4core_5audio_10sound_file_SoundFile;
-  if (PyType_Ready(&__pyx_type_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile) < 0) __PYX_ERR(0, 47, __pyx_L1_error)
+  if (PyType_Ready(&__pyx_type_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile) < 0) __PYX_ERR(0, 52, __pyx_L1_error)
   __pyx_type_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile.tp_print = 0;
-  if (PyObject_SetAttrString(__pyx_m, "SoundMemoryFile", (PyObject *)&__pyx_type_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile) < 0) __PYX_ERR(0, 47, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile) < 0) __PYX_ERR(0, 47, __pyx_L1_error)
+  if (PyObject_SetAttrString(__pyx_m, "SoundMemoryFile", (PyObject *)&__pyx_type_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile) < 0) __PYX_ERR(0, 52, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile) < 0) __PYX_ERR(0, 52, __pyx_L1_error)
   __pyx_ptype_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile = &__pyx_type_5mpfmc_4core_5audio_10sound_file_SoundMemoryFile;
   __pyx_type_5mpfmc_4core_5audio_10sound_file_SoundStreamingFile.tp_base = __pyx_ptype_5mpfmc_4core_5audio_10sound_file_SoundFile;
-  if (PyType_Ready(&__pyx_type_5mpfmc_4core_5audio_10sound_file_SoundStreamingFile) < 0) __PYX_ERR(0, 123, __pyx_L1_error)
+  if (PyType_Ready(&__pyx_type_5mpfmc_4core_5audio_10sound_file_SoundStreamingFile) < 0) __PYX_ERR(0, 139, __pyx_L1_error)
   __pyx_type_5mpfmc_4core_5audio_10sound_file_SoundStreamingFile.tp_print = 0;
-  if (PyObject_SetAttrString(__pyx_m, "SoundStreamingFile", (PyObject *)&__pyx_type_5mpfmc_4core_5audio_10sound_file_SoundStreamingFile) < 0) __PYX_ERR(0, 123, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_5mpfmc_4core_5audio_10sound_file_SoundStreamingFile) < 0) __PYX_ERR(0, 123, __pyx_L1_error)
+  if (PyObject_SetAttrString(__pyx_m, "SoundStreamingFile", (PyObject *)&__pyx_type_5mpfmc_4core_5audio_10sound_file_SoundStreamingFile) < 0) __PYX_ERR(0, 139, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_5mpfmc_4core_5audio_10sound_file_SoundStreamingFile) < 0) __PYX_ERR(0, 139, __pyx_L1_error)
   __pyx_ptype_5mpfmc_4core_5audio_10sound_file_SoundStreamingFile = &__pyx_type_5mpfmc_4core_5audio_10sound_file_SoundStreamingFile;
   /*--- Type import code ---*/
   /*--- Variable import code ---*/
@@ -7351,6 +7592,37 @@ bad:
     Py_XDECREF(py_frame);
 }
 
+/* CIntToPy */
+    static CYTHON_INLINE PyObject* __Pyx_PyInt_From_gsize(gsize value) {
+    const gsize neg_one = (gsize) -1, const_zero = (gsize) 0;
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(gsize) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(gsize) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(gsize) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(gsize) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(gsize) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(gsize),
+                                     little, !is_unsigned);
+    }
+}
+
 /* CIntToPy */
     static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
     const int neg_one = (int) -1, const_zero = (int) 0;
@@ -40,6 +40,11 @@ cdef class SoundFile:
         """Return the duration of the sound file"""
         return self.sample.duration
 
+    @property
+    def memory_size(self):
+        """Return the number of bytes of sample data held in memory"""
+        return 0
+
 
 # ---------------------------------------------------------------------------
 #    SoundMemoryFile class
@@ -116,6 +121,17 @@ cdef class SoundMemoryFile(SoundFile):
         """Returns whether or not the sound file data is loaded in memory"""
         return self.sample.data.memory.data != NULL and self.sample.data.memory.size > 0
 
+    @property
+    def memory_size(self):
+        """Returns the number of bytes of sample data held in memory"""
+        return self.sample.data.memory.size
+
+    def get_samples(self):
+        """Returns a copy of the sample data (in the audio output format)"""
+        if not self.loaded:
+            return bytes()
+        return (<char*>self.sample.data.memory.data)[:self.sample.data.memory.size]
+
 
 # ---------------------------------------------------------------------------
 #    SoundStreamingFile class
@@ -0,0 +1,155 @@
+"""Indexed priority queue holding the sounds waiting for a free sound player on a track."""
+from heapq import heappush, heappop, heapify
+
+
+class SoundQueue(object):
+
+    """Priority queue of SoundInstance objects waiting to be played.
+
+    Sound instances are ordered the same way as SoundInstance.__lt__ (highest
+    priority first, then by expiration time and sound instance id). The queue
+    is indexed by sound instance id, sound id, context and key so instances can
+    be found and removed without searching the whole queue. Removed entries are
+    only marked as removed and are discarded once they reach the top of the
+    heap (lazy deletion). The heap is compacted when it holds more removed
+    entries than queued ones.
+    """
+
+    __slots__ = ["_heap", "_entries", "_by_sound_id", "_by_context", "_by_key", "_removed_count"]
+
+    def __init__(self):
+        """Initialise sound queue."""
+        self._heap = list()
+        self._entries = dict()
+        self._by_sound_id = dict()
+        self._by_context = dict()
+        self._by_key = dict()
+        self._removed_count = 0
+
+    def __len__(self):
+        """Return the number of sound instances in the queue."""
+        return len(self._entries)
+
+    def __contains__(self, sound_instance):
+        """Return true if the sound instance is in the queue."""
+        return sound_instance.id in self._entries
+
+    def __iter__(self):
+        """Iterate over the sound instances in the queue (in no particular order)."""
+        return iter([entry[1] for entry in self._entries.values()])
+
+    @staticmethod
+    def _sort_key(sound_instance):
+        """Return the heap sort key for a sound instance (see SoundInstance.__lt__)."""
+        exp_time = sound_instance.exp_time
+        return (-sound_instance.priority,
+                exp_time is not None,
+                -exp_time if exp_time is not None else 0,
+                -sound_instance.id)
+
+    def push(self, sound_instance):
+        """Add a sound instance to the queue (O(log n))."""
+        sound_instance_id = sound_instance.id
+        if sound_instance_id in self._entries:
+            return
+
+        entry = [self._sort_key(sound_instance), sound_instance]
+        self._entries[sound_instance_id] = entry
+        self._by_sound_id.setdefault(sound_instance.sound_id, set()).add(sound_instance_id)
+        self._by_context.setdefault(sound_instance.context, set()).add(sound_instance_id)
+        self._by_key.setdefault(sound_instance.key, set()).add(sound_instance_id)
+        heappush(self._heap, entry)
+
+    def peek(self):
+        """Return the next sound instance in the queue without removing it (None if empty)."""
+        heap = self._heap
+        while heap and heap[0][1] is None:
+            heappop(heap)
+            self._removed_count -= 1
+
+        return heap[0][1] if heap else None
+
+    def pop(self):
+        """Remove and return the next sound instance in the queue (None if empty)."""
+        sound_instance = self.peek()
+        if sound_instance is not None:
+            # The entry is at the top of the heap so it can be discarded right away
+            heappop(self._heap)
+            self._unindex(sound_instance)
+
+        return sound_instance
+
+    def remove(self, sound_instance):
+        """Remove a sound instance from the queue.
+
+        Returns:
+            True if the sound instance was in the queue, False otherwise.
+        """
+        entry = self._unindex(sound_instance)
+        if entry is None:
+            return False
+
+        # Lazy deletion: the entry is discarded once it reaches the top of the heap
+        entry[1] = None
+        self._removed_count += 1
+        if self._removed_count > len(self._entries) and self._removed_count > 16:
+            self._compact()
+
+        return True
+
+    def _unindex(self, sound_instance):
+        """Remove a sound instance from the indexes and return its heap entry (None if not queued)."""
+        sound_instance_id = sound_instance.id
+        entry = self._entries.pop(sound_instance_id, None)
+        if entry is None:
+            return None
+
+        for index, value in ((self._by_sound_id, sound_instance.sound_id),
+                             (self._by_context, sound_instance.context),
+                             (self._by_key, sound_instance.key)):
+            ids = index[value]
+            ids.discard(sound_instance_id)
+            if not ids:
+                del index[value]
+
+        return entry
+
+    def _remove_indexed(self, index, value):
+        """Remove all sound instances with the specified index value and return them."""
+        if value not in index:
+            return list()
+
+        removed = [self._entries[sound_instance_id][1] for sound_instance_id in index[value]]
+        for sound_instance in removed:
+            self.remove(sound_instance)
+
+        return removed
+
+    def remove_sound(self, sound_id):
+        """Remove all instances of the specified sound id from the queue and return them."""
+        return self._remove_indexed(self._by_sound_id, sound_id)
+
+    def remove_context(self, context):
+        """Remove all sound instances with the specified context from the queue and return them."""
+        return self._remove_indexed(self._by_context, context)
+
+    def remove_key(self, key):
+        """Remove all sound instances with the specified key from the queue and return them."""
+        return self._remove_indexed(self._by_key, key)
+
+    def clear(self):
+        """Remove all sound instances from the queue and return them."""
+        removed = [entry[1] for entry in self._entries.values()]
+        self._heap.clear()
+        self._entries.clear()
+        self._by_sound_id.clear()
+        self._by_context.clear()
+        self._by_key.clear()
+        self._removed_count = 0
+        return removed
+
+    def _compact(self):
+        """Rebuild the heap without the removed entries."""
+        self._heap = [entry for entry in self._heap if entry[1] is not None]
+        heapify(self._heap)
+        self._removed_count = 0
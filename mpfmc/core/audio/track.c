@@ -527,6 +527,7 @@ static CYTHON_INLINE float __PYX_NAN() {
 #include "gst/gst.h"
 #include "glib.h"
 #include "gstreamer_helper.h"
+#include <string.h>
 #ifdef _OPENMP
 #include <omp.h>
 #endif /* _OPENMP */
@@ -730,8 +731,10 @@ static const char *__pyx_filename;
 
 
 static const char *__pyx_f[] = {
-  "mpfmc\\core\\audio\\track.pyx",
+  "mpfmc/core/audio/track.pyx",
   "stringsource",
+  "mpfmc/core/audio/dsp.pxd",
+  "mpfmc/core/audio/perf_counters.pxd",
 };
 /* ForceInitThreads.proto */
 #ifndef __PYX_FORCE_INIT_THREADS
@@ -751,7 +754,7 @@ struct __pyx_obj_5mpfmc_4core_5audio_5track_Track;
 struct __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData;
 typedef struct __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData;
 
-/* "mpfmc/core/audio/sdl2.pxd":229
+/* "mpfmc/core/audio/sdl2.pxd":250
  * # ---------------------------------------------------------------------------
  * 
  * ctypedef struct AudioCallbackData:             # <<<<<<<<<<<<<<
@@ -772,8 +775,193 @@ struct __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData {
   Uint8 silence;
   Uint8 track_count;
   void **tracks;
+  Uint64 sample_clock;
+  Sint32 *mix_buffer;
+  int float_mix_bus;
+  float *float_mix_buffer;
+  float master_gain;
+  void *master_inserts;
+  SDL_sem *notification_semaphore;
+  SDL_atomic_t notification_wakeup_pending;
+  void *perf_counters;
   FILE *c_log_file;
 };
+struct __pyx_t_5mpfmc_4core_5audio_3dsp_BiquadSettings;
+typedef struct __pyx_t_5mpfmc_4core_5audio_3dsp_BiquadSettings __pyx_t_5mpfmc_4core_5audio_3dsp_BiquadSettings;
+struct __pyx_t_5mpfmc_4core_5audio_3dsp_LimiterSettings;
+typedef struct __pyx_t_5mpfmc_4core_5audio_3dsp_LimiterSettings __pyx_t_5mpfmc_4core_5audio_3dsp_LimiterSettings;
+struct __pyx_t_5mpfmc_4core_5audio_3dsp_ReverbSettings;
+typedef struct __pyx_t_5mpfmc_4core_5audio_3dsp_ReverbSettings __pyx_t_5mpfmc_4core_5audio_3dsp_ReverbSettings;
+struct __pyx_t_5mpfmc_4core_5audio_3dsp_DspInsert;
+typedef struct __pyx_t_5mpfmc_4core_5audio_3dsp_DspInsert __pyx_t_5mpfmc_4core_5audio_3dsp_DspInsert;
+struct __pyx_t_5mpfmc_4core_5audio_3dsp_DspChain;
+typedef struct __pyx_t_5mpfmc_4core_5audio_3dsp_DspChain __pyx_t_5mpfmc_4core_5audio_3dsp_DspChain;
+
+/* "mpfmc/core/audio/dsp.pxd":13
+ * # ---------------------------------------------------------------------------
+ * 
+ * cdef enum:             # <<<<<<<<<<<<<<
+ *     DSP_MAX_INSERTS = 8
+ *     DSP_MAX_CHANNELS = 2
+ */
+enum  {
+  __pyx_e_5mpfmc_4core_5audio_3dsp_DSP_MAX_INSERTS = 8,
+  __pyx_e_5mpfmc_4core_5audio_3dsp_DSP_MAX_CHANNELS = 2,
+  __pyx_e_5mpfmc_4core_5audio_3dsp_DSP_REVERB_COMB_COUNT = 4,
+  __pyx_e_5mpfmc_4core_5audio_3dsp_DSP_REVERB_ALLPASS_COUNT = 2
+};
+
+/* "mpfmc/core/audio/dsp.pxd":19
+ *     DSP_REVERB_ALLPASS_COUNT = 2
+ * 
+ * cdef enum DspInsertType:             # <<<<<<<<<<<<<<
+ *     # Enumeration of the supported insert types
+ *     dsp_insert_biquad = 0
+ */
+enum __pyx_t_5mpfmc_4core_5audio_3dsp_DspInsertType {
+  __pyx_e_5mpfmc_4core_5audio_3dsp_dsp_insert_biquad = 0,
+  __pyx_e_5mpfmc_4core_5audio_3dsp_dsp_insert_limiter = 1,
+  __pyx_e_5mpfmc_4core_5audio_3dsp_dsp_insert_reverb = 2
+};
+
+/* "mpfmc/core/audio/dsp.pxd":25
+ *     dsp_insert_reverb = 2
+ * 
+ * ctypedef struct BiquadSettings:             # <<<<<<<<<<<<<<
+ *     # Normalized biquad filter coefficients and (transposed direct form II) filter state
+ *     float b0
+ */
+struct __pyx_t_5mpfmc_4core_5audio_3dsp_BiquadSettings {
+  float b0;
+  float b1;
+  float b2;
+  float a1;
+  float a2;
+  float z1[__pyx_e_5mpfmc_4core_5audio_3dsp_DSP_MAX_CHANNELS];
+  float z2[__pyx_e_5mpfmc_4core_5audio_3dsp_DSP_MAX_CHANNELS];
+};
+
+/* "mpfmc/core/audio/dsp.pxd":35
+ *     float z2[DSP_MAX_CHANNELS]
+ * 
+ * ctypedef struct LimiterSettings:             # <<<<<<<<<<<<<<
+ *     # Peak limiter (instant attack, exponential release, all channels linked)
+ *     float threshold
+ */
+struct __pyx_t_5mpfmc_4core_5audio_3dsp_LimiterSettings {
+  float threshold;
+  float release_coefficient;
+  float gain;
+};
+
+/* "mpfmc/core/audio/dsp.pxd":41
+ *     float gain
+ * 
+ * ctypedef struct ReverbSettings:             # <<<<<<<<<<<<<<
+ *     # Simple Schroeder reverb (parallel damped comb filters followed by series allpass
+ *     # filters).  All delay lines are allocated in a single block of memory.
+ */
+struct __pyx_t_5mpfmc_4core_5audio_3dsp_ReverbSettings {
+  float *delay_memory;
+  float *comb_buffers[__pyx_e_5mpfmc_4core_5audio_3dsp_DSP_REVERB_COMB_COUNT];
+  Uint32 comb_lengths[__pyx_e_5mpfmc_4core_5audio_3dsp_DSP_REVERB_COMB_COUNT];
+  Uint32 comb_positions[__pyx_e_5mpfmc_4core_5audio_3dsp_DSP_REVERB_COMB_COUNT];
+  float comb_filter_stores[__pyx_e_5mpfmc_4core_5audio_3dsp_DSP_REVERB_COMB_COUNT];
+  float *allpass_buffers[__pyx_e_5mpfmc_4core_5audio_3dsp_DSP_REVERB_ALLPASS_COUNT];
+  Uint32 allpass_lengths[__pyx_e_5mpfmc_4core_5audio_3dsp_DSP_REVERB_ALLPASS_COUNT];
+  Uint32 allpass_positions[__pyx_e_5mpfmc_4core_5audio_3dsp_DSP_REVERB_ALLPASS_COUNT];
+  float feedback;
+  float damping;
+  float wet;
+  float dry;
+};
+
+/* "mpfmc/core/audio/dsp.pxd":57
+ *     float dry
+ * 
+ * ctypedef struct DspInsert:             # <<<<<<<<<<<<<<
+ *     DspInsertType type
+ *     BiquadSettings biquad
+ */
+struct __pyx_t_5mpfmc_4core_5audio_3dsp_DspInsert {
+  enum __pyx_t_5mpfmc_4core_5audio_3dsp_DspInsertType type;
+  __pyx_t_5mpfmc_4core_5audio_3dsp_BiquadSettings biquad;
+  __pyx_t_5mpfmc_4core_5audio_3dsp_LimiterSettings limiter;
+  __pyx_t_5mpfmc_4core_5audio_3dsp_ReverbSettings reverb;
+};
+
+/* "mpfmc/core/audio/dsp.pxd":63
+ *     ReverbSettings reverb
+ * 
+ * ctypedef struct DspChain:             # <<<<<<<<<<<<<<
+ *     int insert_count
+ *     DspInsert inserts[DSP_MAX_INSERTS]
+ */
+struct __pyx_t_5mpfmc_4core_5audio_3dsp_DspChain {
+  int insert_count;
+  __pyx_t_5mpfmc_4core_5audio_3dsp_DspInsert inserts[__pyx_e_5mpfmc_4core_5audio_3dsp_DSP_MAX_INSERTS];
+  Uint32 tail_frames;
+  Uint32 tail_frames_remaining;
+};
+struct __pyx_t_5mpfmc_4core_5audio_13perf_counters_PerfRingBuffer;
+typedef struct __pyx_t_5mpfmc_4core_5audio_13perf_counters_PerfRingBuffer __pyx_t_5mpfmc_4core_5audio_13perf_counters_PerfRingBuffer;
+struct __pyx_t_5mpfmc_4core_5audio_13perf_counters_AudioPerfCounters;
+typedef struct __pyx_t_5mpfmc_4core_5audio_13perf_counters_AudioPerfCounters __pyx_t_5mpfmc_4core_5audio_13perf_counters_AudioPerfCounters;
+
+/* "mpfmc/core/audio/perf_counters.pxd":14
+ * # ---------------------------------------------------------------------------
+ * 
+ * cdef enum:             # <<<<<<<<<<<<<<
+ *     PERF_RING_BUFFER_SIZE = 256
+ *     # Callback durations are counted in buckets of 10% of the callback deadline (the
+ */
+enum  {
+  __pyx_e_5mpfmc_4core_5audio_13perf_counters_PERF_RING_BUFFER_SIZE = 0x100,
+  __pyx_e_5mpfmc_4core_5audio_13perf_counters_PERF_HISTOGRAM_BUCKETS = 11
+};
+
+/* "mpfmc/core/audio/perf_counters.pxd":20
+ *     PERF_HISTOGRAM_BUCKETS = 11
+ * 
+ * ctypedef struct PerfRingBuffer:             # <<<<<<<<<<<<<<
+ *     # The most recent values (position is the index of the next value to write) along with
+ *     # the number, total and maximum of all the values recorded since the last reset
+ */
+struct __pyx_t_5mpfmc_4core_5audio_13perf_counters_PerfRingBuffer {
+  Uint32 values[__pyx_e_5mpfmc_4core_5audio_13perf_counters_PERF_RING_BUFFER_SIZE];
+  Uint32 position;
+  Uint64 count;
+  Uint64 total;
+  Uint32 maximum;
+};
+
+/* "mpfmc/core/audio/perf_counters.pxd":29
+ *     Uint32 maximum
+ * 
+ * ctypedef struct AudioPerfCounters:             # <<<<<<<<<<<<<<
+ *     Uint64 frequency
+ *     Uint32 deadline
+ */
+struct __pyx_t_5mpfmc_4core_5audio_13perf_counters_AudioPerfCounters {
+  Uint64 frequency;
+  Uint32 deadline;
+  Uint64 deadline_overruns;
+  Uint64 callback_histogram[__pyx_e_5mpfmc_4core_5audio_13perf_counters_PERF_HISTOGRAM_BUCKETS];
+  __pyx_t_5mpfmc_4core_5audio_13perf_counters_PerfRingBuffer callback_time;
+  __pyx_t_5mpfmc_4core_5audio_13perf_counters_PerfRingBuffer active_sound_players;
+  __pyx_t_5mpfmc_4core_5audio_13perf_counters_PerfRingBuffer lock_wait_time;
+};
+
+/* "mpfmc/core/audio/mixer.pxd":18
+ * # ---------------------------------------------------------------------------
+ * 
+ * cdef enum:             # <<<<<<<<<<<<<<
+ *     MIXER_UNITY_GAIN = 65536
+ * 
+ */
+enum  {
+  __pyx_e_5mpfmc_4core_5audio_5mixer_MIXER_UNITY_GAIN = 0x10000
+};
 struct __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageDataLooping;
 typedef struct __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageDataLooping __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageDataLooping;
 struct __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageDataMarker;
@@ -870,7 +1058,7 @@ struct __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageCon
 struct __pyx_t_5mpfmc_4core_5audio_5track_TrackState;
 typedef struct __pyx_t_5mpfmc_4core_5audio_5track_TrackState __pyx_t_5mpfmc_4core_5audio_5track_TrackState;
 
-/* "mpfmc/core/audio/track.pxd":10
+/* "mpfmc/core/audio/track.pxd":12
  * 
  * # The number of control points per audio buffer (sets control rate for ducking)
  * cdef enum:             # <<<<<<<<<<<<<<
@@ -881,7 +1069,7 @@ enum  {
   __pyx_e_5mpfmc_4core_5audio_5track_CONTROL_POINTS_PER_BUFFER = 8
 };
 
-/* "mpfmc/core/audio/track.pxd":13
+/* "mpfmc/core/audio/track.pxd":15
  *     CONTROL_POINTS_PER_BUFFER = 8
  * 
  * cdef enum:             # <<<<<<<<<<<<<<
@@ -892,18 +1080,18 @@ enum  {
   __pyx_e_5mpfmc_4core_5audio_5track_MAX_SIMULTANEOUS_SOUNDS_DEFAULT = 8
 };
 
-/* "mpfmc/core/audio/track.pxd":16
+/* "mpfmc/core/audio/track.pxd":18
  *     MAX_SIMULTANEOUS_SOUNDS_DEFAULT = 8
  * 
  * cdef enum:             # <<<<<<<<<<<<<<
- *     MAX_SIMULTANEOUS_SOUNDS_LIMIT = 32
+ *     MAX_SIMULTANEOUS_SOUNDS_LIMIT = 64
  * 
  */
 enum  {
-  __pyx_e_5mpfmc_4core_5audio_5track_MAX_SIMULTANEOUS_SOUNDS_LIMIT = 32
+  __pyx_e_5mpfmc_4core_5audio_5track_MAX_SIMULTANEOUS_SOUNDS_LIMIT = 64
 };
 
-/* "mpfmc/core/audio/track.pxd":20
+/* "mpfmc/core/audio/track.pxd":22
  * 
  * 
  * cdef enum TrackStatus:             # <<<<<<<<<<<<<<
@@ -918,7 +1106,7 @@ enum __pyx_t_5mpfmc_4core_5audio_5track_TrackStatus {
   __pyx_e_5mpfmc_4core_5audio_5track_track_status_paused = 4
 };
 
-/* "mpfmc/core/audio/track.pxd":27
+/* "mpfmc/core/audio/track.pxd":29
  *     track_status_paused = 4
  * 
  * ctypedef struct TrackState:             # <<<<<<<<<<<<<<
@@ -940,17 +1128,24 @@ struct __pyx_t_5mpfmc_4core_5audio_5track_TrackState {
   Uint32 fade_steps_remaining;
   int buffer_size;
   Uint8 *buffer;
+  Sint32 *mix_buffer;
+  Sint32 mix_gain;
+  float *float_buffer;
+  __pyx_t_5mpfmc_4core_5audio_3dsp_DspChain *inserts;
   GSList *notification_messages;
   int ducking_is_active;
   GArray *ducking_control_points;
+  __pyx_t_5mpfmc_4core_5audio_13perf_counters_PerfRingBuffer mix_time;
+  Uint32 active_sound_players;
+  Uint64 streaming_underruns;
 };
 
-/* "mpfmc/core/audio/track.pyx":18
+/* "mpfmc/core/audio/track.pxd":60
  * #    Track base class
  * # ---------------------------------------------------------------------------
  * cdef class Track:             # <<<<<<<<<<<<<<
- *     """
- *     Track base class
+ * 
+ *     cdef str _name
  */
 struct __pyx_obj_5mpfmc_4core_5audio_5track_Track {
   PyObject_HEAD
@@ -963,14 +1158,25 @@ struct __pyx_obj_5mpfmc_4core_5audio_5track_Track {
   PyObject *mc;
   SDL_AudioDeviceID device_id;
   PyObject *log;
+  PyObject *_inserts;
   __pyx_t_5mpfmc_4core_5audio_5track_TrackState *state;
 };
 
 
 
+/* "mpfmc/core/audio/track.pyx":28
+ * #    Track base class
+ * # ---------------------------------------------------------------------------
+ * cdef class Track:             # <<<<<<<<<<<<<<
+ *     """
+ *     Track base class
+ */
+
 struct __pyx_vtabstruct_5mpfmc_4core_5audio_5track_Track {
   __pyx_t_5mpfmc_4core_5audio_5track_TrackState *(*get_state)(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *);
+  GSList *(*take_notification_messages)(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *);
   void (*mix_track_to_output)(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *, __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData *, Uint8 *, Uint32);
+  void (*mix_track_tail_to_output)(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *, __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData *, Uint32);
 };
 static struct __pyx_vtabstruct_5mpfmc_4core_5audio_5track_Track *__pyx_vtabptr_5mpfmc_4core_5audio_5track_Track;
 
@@ -1106,6 +1312,13 @@ static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObje
 #define __Pyx_PyCFunction_FastCall(func, args, nargs)  (assert(0), NULL)
 #endif
 
+/* None.proto */
+static CYTHON_INLINE int __Pyx_div_int(int, int);
+
+/* UnaryNegOverflows.proto */
+#define UNARY_NEG_WOULD_OVERFLOW(x)\
+        (((x) < 0) & ((unsigned long)(x) == 0-(unsigned long)(x)))
+
 /* PyThreadStateGet.proto */
 #if CYTHON_FAST_THREAD_STATE
 #define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
@@ -1145,18 +1358,174 @@ static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject
 /* RaiseException.proto */
 static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
 
-/* None.proto */
-static CYTHON_INLINE int __Pyx_div_int(int, int);
+/* PyObjectCallMethO.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
+#endif
 
-/* UnaryNegOverflows.proto */
-#define UNARY_NEG_WOULD_OVERFLOW(x)\
-        (((x) < 0) & ((unsigned long)(x) == 0-(unsigned long)(x)))
+/* PyObjectCallOneArg.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
 
 /* WriteUnraisableException.proto */
 static void __Pyx_WriteUnraisable(const char *name, int clineno,
                                   int lineno, const char *filename,
                                   int full_traceback, int nogil);
 
+/* IncludeStringH.proto */
+#include <string.h>
+
+/* BytesEquals.proto */
+static CYTHON_INLINE int __Pyx_PyBytes_Equals(PyObject* s1, PyObject* s2, int equals);
+
+/* UnicodeEquals.proto */
+static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int equals);
+
+/* SaveResetException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_ExceptionSave(type, value, tb)  __Pyx__ExceptionSave(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#define __Pyx_ExceptionReset(type, value, tb)  __Pyx__ExceptionReset(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+#else
+#define __Pyx_ExceptionSave(type, value, tb)   PyErr_GetExcInfo(type, value, tb)
+#define __Pyx_ExceptionReset(type, value, tb)  PyErr_SetExcInfo(type, value, tb)
+#endif
+
+/* PyErrExceptionMatches.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_ExceptionMatches(err) __Pyx_PyErr_ExceptionMatchesInState(__pyx_tstate, err)
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err);
+#else
+#define __Pyx_PyErr_ExceptionMatches(err)  PyErr_ExceptionMatches(err)
+#endif
+
+/* GetException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_GetException(type, value, tb)  __Pyx__GetException(__pyx_tstate, type, value, tb)
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#else
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb);
+#endif
+
+/* PyFloatBinop.proto */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyFloat_TrueDivideCObj(PyObject *op1, PyObject *op2, double floatval, int inplace);
+#else
+#define __Pyx_PyFloat_TrueDivideCObj(op1, op2, floatval, inplace)\
+    (inplace ? PyNumber_InPlaceTrueDivide(op1, op2) : PyNumber_TrueDivide(op1, op2))
+#endif
+
+/* PyFloatBinop.proto */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyFloat_AddObjC(PyObject *op1, PyObject *op2, double floatval, int inplace);
+#else
+#define __Pyx_PyFloat_AddObjC(op1, op2, floatval, inplace)\
+    (inplace ? PyNumber_InPlaceAdd(op1, op2) : PyNumber_Add(op1, op2))
+#endif
+
+/* PyIntBinop.proto */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyInt_FloorDivideObjC(PyObject *op1, PyObject *op2, long intval, int inplace);
+#else
+#define __Pyx_PyInt_FloorDivideObjC(op1, op2, intval, inplace)\
+    (inplace ? PyNumber_InPlaceFloorDivide(op1, op2) : PyNumber_FloorDivide(op1, op2))
+#endif
+
+/* GetItemInt.proto */
+#define __Pyx_GetItemInt(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Fast(o, (Py_ssize_t)i, is_list, wraparound, boundscheck) :\
+    (is_list ? (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL) :\
+               __Pyx_GetItemInt_Generic(o, to_py_func(i))))
+#define __Pyx_GetItemInt_List(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_List_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+#define __Pyx_GetItemInt_Tuple(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Tuple_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "tuple index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j);
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
+                                                     int is_list, int wraparound, int boundscheck);
+
+/* DictGetItem.proto */
+#if PY_MAJOR_VERSION >= 3 && !CYTHON_COMPILING_IN_PYPY
+static PyObject *__Pyx_PyDict_GetItem(PyObject *d, PyObject* key) {
+    PyObject *value;
+    value = PyDict_GetItemWithError(d, key);
+    if (unlikely(!value)) {
+        if (!PyErr_Occurred()) {
+            PyObject* args = PyTuple_Pack(1, key);
+            if (likely(args))
+                PyErr_SetObject(PyExc_KeyError, args);
+            Py_XDECREF(args);
+        }
+        return NULL;
+    }
+    Py_INCREF(value);
+    return value;
+}
+#else
+    #define __Pyx_PyDict_GetItem(d, key) PyObject_GetItem(d, key)
+#endif
+
+/* PyFloatBinop.proto */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyFloat_TrueDivideObjC(PyObject *op1, PyObject *op2, double floatval, int inplace);
+#else
+#define __Pyx_PyFloat_TrueDivideObjC(op1, op2, floatval, inplace)\
+    (inplace ? PyNumber_InPlaceTrueDivide(op1, op2) : PyNumber_TrueDivide(op1, op2))
+#endif
+
+/* PyFloatBinop.proto */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyFloat_SubtractCObj(PyObject *op1, PyObject *op2, double floatval, int inplace);
+#else
+#define __Pyx_PyFloat_SubtractCObj(op1, op2, floatval, inplace)\
+    (inplace ? PyNumber_InPlaceSubtract(op1, op2) : PyNumber_Subtract(op1, op2))
+#endif
+
+/* PyFloatBinop.proto */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyFloat_AddCObj(PyObject *op1, PyObject *op2, double floatval, int inplace);
+#else
+#define __Pyx_PyFloat_AddCObj(op1, op2, floatval, inplace)\
+    (inplace ? PyNumber_InPlaceAdd(op1, op2) : PyNumber_Add(op1, op2))
+#endif
+
+/* PyFloatBinop.proto */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyFloat_SubtractObjC(PyObject *op1, PyObject *op2, double floatval, int inplace);
+#else
+#define __Pyx_PyFloat_SubtractObjC(op1, op2, floatval, inplace)\
+    (inplace ? PyNumber_InPlaceSubtract(op1, op2) : PyNumber_Subtract(op1, op2))
+#endif
+
+/* ListCompAppend.proto */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
+static CYTHON_INLINE int __Pyx_ListComp_Append(PyObject* list, PyObject* x) {
+    PyListObject* L = (PyListObject*) list;
+    Py_ssize_t len = Py_SIZE(list);
+    if (likely(L->allocated > len)) {
+        Py_INCREF(x);
+        PyList_SET_ITEM(list, len, x);
+        Py_SIZE(list) = len+1;
+        return 0;
+    }
+    return PyList_Append(list, x);
+}
+#else
+#define __Pyx_ListComp_Append(L,x) PyList_Append(L,x)
+#endif
+
+/* None.proto */
+static CYTHON_INLINE Sint32 __Pyx_div_Sint32(Sint32, Sint32);
+
 /* SetVTable.proto */
 static int __Pyx_SetVtable(PyObject *dict, void *vtable);
 
@@ -1166,6 +1535,9 @@ static int __Pyx_setup_reduce(PyObject* type_obj);
 /* Import.proto */
 static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level);
 
+/* ImportFrom.proto */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name);
+
 /* CLineInTraceback.proto */
 #ifdef CYTHON_CLINE_IN_TRACEBACK
 #define __Pyx_CLineForTraceback(tstate, c_line)  (((CYTHON_CLINE_IN_TRACEBACK)) ? c_line : 0)
@@ -1195,12 +1567,21 @@ static void __Pyx_AddTraceback(const char *funcname, int c_line,
 /* CIntToPy.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
 
-/* CIntFromPy.proto */
-static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_Uint32(Uint32 value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_Uint64(Uint64 value);
 
 /* CIntToPy.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
 
+/* CIntFromPy.proto */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE Uint32 __Pyx_PyInt_As_Uint32(PyObject *);
+
 /* CIntFromPy.proto */
 static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
 
@@ -1219,31 +1600,62 @@ static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObj
 /* CheckBinaryVersion.proto */
 static int __Pyx_check_binary_version(void);
 
+/* FunctionExport.proto */
+static int __Pyx_ExportFunction(const char *name, void (*f)(void), const char *sig);
+
 /* InitStrings.proto */
 static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
 
 static __pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_f_5mpfmc_4core_5audio_5track_5Track_get_state(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self); /* proto*/
-static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_v_track, __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData *__pyx_v_callback_data, Uint8 *__pyx_v_output_buffer, Uint32 __pyx_v_buffer_length); /* proto*/
+static GSList *__pyx_f_5mpfmc_4core_5audio_5track_5Track_take_notification_messages(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self); /* proto*/
+static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_v_track, __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData *__pyx_v_callback_data, CYTHON_UNUSED Uint8 *__pyx_v_output_buffer, Uint32 __pyx_v_buffer_length); /* proto*/
+static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_tail_to_output(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_v_track, __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData *__pyx_v_callback_data, Uint32 __pyx_v_buffer_length); /* proto*/
+
+/* Module declarations from 'mpfmc.core.audio.sdl2' */
+
+/* Module declarations from 'mpfmc.core.audio.gstreamer' */
+
+/* Module declarations from 'mpfmc.core.audio.dsp' */
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_3dsp_process_biquad(__pyx_t_5mpfmc_4core_5audio_3dsp_BiquadSettings *, float *, Uint32, int); /*proto*/
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_3dsp_process_limiter(__pyx_t_5mpfmc_4core_5audio_3dsp_LimiterSettings *, float *, Uint32, int); /*proto*/
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_3dsp_process_reverb(__pyx_t_5mpfmc_4core_5audio_3dsp_ReverbSettings *, float *, Uint32, int); /*proto*/
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_3dsp_process_dsp_chain(__pyx_t_5mpfmc_4core_5audio_3dsp_DspChain *, float *, Uint32, int); /*proto*/
+
+/* Module declarations from 'mpfmc.core.audio.perf_counters' */
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_13perf_counters_perf_ring_buffer_reset(__pyx_t_5mpfmc_4core_5audio_13perf_counters_PerfRingBuffer *); /*proto*/
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_13perf_counters_perf_ring_buffer_record(__pyx_t_5mpfmc_4core_5audio_13perf_counters_PerfRingBuffer *, Uint32); /*proto*/
+static CYTHON_INLINE Uint32 __pyx_f_5mpfmc_4core_5audio_13perf_counters_perf_elapsed_us(__pyx_t_5mpfmc_4core_5audio_13perf_counters_AudioPerfCounters *, Uint64); /*proto*/
+static CYTHON_INLINE PyObject *__pyx_f_5mpfmc_4core_5audio_13perf_counters_perf_ring_buffer_summary(__pyx_t_5mpfmc_4core_5audio_13perf_counters_PerfRingBuffer *); /*proto*/
 
 /* Module declarations from 'cpython.mem' */
 
 /* Module declarations from 'cpython.pycapsule' */
 
-/* Module declarations from 'mpfmc.core.audio.sdl2' */
-
-/* Module declarations from 'mpfmc.core.audio.gstreamer' */
+/* Module declarations from 'libc.string' */
 
 /* Module declarations from 'mpfmc.core.audio.inline' */
 static CYTHON_INLINE Uint8 __pyx_f_5mpfmc_4core_5audio_6inline_lerpU8(float, Uint8, Uint8); /*proto*/
 static CYTHON_INLINE float __pyx_f_5mpfmc_4core_5audio_6inline_in_out_quad(float); /*proto*/
 
+/* Module declarations from 'cython' */
+
+/* Module declarations from 'mpfmc.core.audio.mixer' */
+static CYTHON_INLINE Sint32 __pyx_f_5mpfmc_4core_5audio_5mixer_gain_step(Sint32, Sint32, Uint32); /*proto*/
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_5mixer_mix_s16_to_accumulator(Sint32 *, Sint16 const *, Uint32, Sint32, Sint32); /*proto*/
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_5mixer_s16_to_float(float *, Sint16 const *, Uint32, float, float); /*proto*/
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_5mixer_mix_float_to_float(float *, float const *, Uint32); /*proto*/
+
 /* Module declarations from 'mpfmc.core.audio.notification_message' */
 static CYTHON_INLINE __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message(void); /*proto*/
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message__post_notification_message(__pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *, __pyx_t_5mpfmc_4core_5audio_5track_TrackState *); /*proto*/
 static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_send_track_stopped_notification(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *); /*proto*/
 static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_send_track_paused_notification(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *); /*proto*/
 
 /* Module declarations from 'mpfmc.core.audio.track' */
 static PyTypeObject *__pyx_ptype_5mpfmc_4core_5audio_5track_Track = 0;
+static __pyx_t_5mpfmc_4core_5audio_3dsp_DspChain *__pyx_f_5mpfmc_4core_5audio_5track_create_dsp_chain(PyObject *, int, int); /*proto*/
+static void __pyx_f_5mpfmc_4core_5audio_5track_free_dsp_chain(__pyx_t_5mpfmc_4core_5audio_3dsp_DspChain *); /*proto*/
+static PyObject *__pyx_f_5mpfmc_4core_5audio_5track__set_biquad_coefficients(__pyx_t_5mpfmc_4core_5audio_3dsp_BiquadSettings *, PyObject *, int); /*proto*/
 #define __Pyx_MODULE_NAME "mpfmc.core.audio.track"
 extern int __pyx_module_is_main_mpfmc__core__audio__track;
 int __pyx_module_is_main_mpfmc__core__audio__track = 0;
@@ -1252,76 +1664,160 @@ int __pyx_module_is_main_mpfmc__core__audio__track = 0;
 static PyObject *__pyx_builtin_round;
 static PyObject *__pyx_builtin_NotImplementedError;
 static PyObject *__pyx_builtin_TypeError;
+static PyObject *__pyx_builtin_MemoryError;
+static PyObject *__pyx_builtin_range;
+static PyObject *__pyx_builtin_sum;
+static const char __pyx_k_q[] = "q";
+static const char __pyx_k_eq[] = "eq";
 static const char __pyx_k_mc[] = "mc";
+static const char __pyx_k_pi[] = "pi";
+static const char __pyx_k_cos[] = "cos";
+static const char __pyx_k_dry[] = "dry";
+static const char __pyx_k_exp[] = "exp";
+static const char __pyx_k_max[] = "max";
+static const char __pyx_k_pow[] = "pow";
+static const char __pyx_k_sin[] = "sin";
+static const char __pyx_k_sum[] = "sum";
+static const char __pyx_k_wet[] = "wet";
+static const char __pyx_k_ceil[] = "ceil";
+static const char __pyx_k_gain[] = "gain";
+static const char __pyx_k_last[] = "last";
 static const char __pyx_k_main[] = "__main__";
+static const char __pyx_k_math[] = "math";
+static const char __pyx_k_mean[] = "mean";
 static const char __pyx_k_name[] = "name";
+static const char __pyx_k_peak[] = "peak";
+static const char __pyx_k_sqrt[] = "sqrt";
 static const char __pyx_k_test[] = "__test__";
+static const char __pyx_k_type[] = "type";
 static const char __pyx_k_Track[] = "Track";
+static const char __pyx_k_count[] = "count";
 static const char __pyx_k_debug[] = "debug";
+static const char __pyx_k_log10[] = "log10";
+static const char __pyx_k_range[] = "range";
+static const char __pyx_k_reset[] = "reset";
 static const char __pyx_k_round[] = "round";
 static const char __pyx_k_track[] = "track";
+static const char __pyx_k_filter[] = "filter";
 static const char __pyx_k_format[] = "format";
 static const char __pyx_k_import[] = "__import__";
 static const char __pyx_k_name_2[] = "__name__";
 static const char __pyx_k_number[] = "number";
 static const char __pyx_k_reduce[] = "__reduce__";
+static const char __pyx_k_reverb[] = "reverb";
 static const char __pyx_k_volume[] = "volume";
 static const char __pyx_k_Track_2[] = "<Track.{}.{}>";
+static const char __pyx_k_damping[] = "damping";
+static const char __pyx_k_limiter[] = "limiter";
 static const char __pyx_k_logging[] = "logging";
+static const char __pyx_k_lowpass[] = "lowpass";
+static const char __pyx_k_release[] = "release";
 static const char __pyx_k_warning[] = "warning";
 static const char __pyx_k_getstate[] = "__getstate__";
+static const char __pyx_k_highpass[] = "highpass";
+static const char __pyx_k_lowshelf[] = "lowshelf";
+static const char __pyx_k_mix_time[] = "mix_time";
 static const char __pyx_k_setstate[] = "__setstate__";
 static const char __pyx_k_TypeError[] = "TypeError";
+static const char __pyx_k_frequency[] = "frequency";
 static const char __pyx_k_getLogger[] = "getLogger";
+static const char __pyx_k_highshelf[] = "highshelf";
 static const char __pyx_k_reduce_ex[] = "__reduce_ex__";
+static const char __pyx_k_room_size[] = "room_size";
+static const char __pyx_k_threshold[] = "threshold";
 static const char __pyx_k_track_num[] = "track_num";
 static const char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
+static const char __pyx_k_recent_p95[] = "recent_p95";
+static const char __pyx_k_MemoryError[] = "MemoryError";
 static const char __pyx_k_buffer_size[] = "buffer_size";
+static const char __pyx_k_recent_mean[] = "recent_mean";
 static const char __pyx_k_fade_seconds[] = "fade_seconds";
 static const char __pyx_k_reduce_cython[] = "__reduce_cython__";
+static const char __pyx_k_AudioException[] = "AudioException";
 static const char __pyx_k_fade_in_seconds[] = "fade_in_seconds";
 static const char __pyx_k_setstate_cython[] = "__setstate_cython__";
 static const char __pyx_k_fade_out_seconds[] = "fade_out_seconds";
 static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
 static const char __pyx_k_events_when_played[] = "events_when_played";
 static const char __pyx_k_NotImplementedError[] = "NotImplementedError";
+static const char __pyx_k_REVERB_COMB_TUNINGS[] = "REVERB_COMB_TUNINGS";
 static const char __pyx_k_audio_callback_data[] = "audio_callback_data";
+static const char __pyx_k_streaming_underruns[] = "streaming_underruns";
+static const char __pyx_k_active_sound_players[] = "active_sound_players";
 static const char __pyx_k_post_mc_native_event[] = "post_mc_native_event";
+static const char __pyx_k_REVERB_ALLPASS_TUNINGS[] = "REVERB_ALLPASS_TUNINGS";
+static const char __pyx_k_Unknown_EQ_filter_type[] = "Unknown EQ filter type '{}'";
+static const char __pyx_k_Unknown_DSP_insert_type[] = "Unknown DSP insert type '{}'";
 static const char __pyx_k_play_Applying_s_second_fade_in[] = "play - Applying %s second fade in";
 static const char __pyx_k_pause_Pause_sound_processing_on[] = "pause - Pause sound processing on track";
 static const char __pyx_k_stop_Applying_s_second_fade_out[] = "stop - Applying %s second fade out";
 static const char __pyx_k_Allocated_track_audio_buffer_d_b[] = "Allocated track audio buffer (%d bytes)";
+static const char __pyx_k_Could_not_set_inserts_on_track_D[] = "Could not set inserts on '{}' track - DSP inserts require the floating-point mix bus";
 static const char __pyx_k_Must_be_overridden_in_derived_cl[] = "Must be overridden in derived class";
+static const char __pyx_k_Too_many_DSP_inserts_the_maximum[] = "Too many DSP inserts ({}), the maximum is {}";
+static const char __pyx_k_mpfmc_core_audio_audio_exception[] = "mpfmc.core.audio.audio_exception";
 static const char __pyx_k_no_default___reduce___due_to_non[] = "no default __reduce__ due to non-trivial __cinit__";
 static const char __pyx_k_pause_Action_may_only_be_used_wh[] = "pause - Action may only be used when a track is playing; action will be ignored.";
 static const char __pyx_k_pause_Applying_s_second_fade_out[] = "pause - Applying %s second fade out";
 static const char __pyx_k_play_Action_may_only_be_used_whe[] = "play - Action may only be used when a track is stopped or is in the process of stopping; action will be ignored.";
 static const char __pyx_k_play_Begin_sound_processing_on_t[] = "play - Begin sound processing on track";
+static const char __pyx_k_set_inserts_d_insert_s_applied_t[] = "set_inserts - %d insert(s) applied to the track";
 static const char __pyx_k_set_volume_Applying_s_second_fad[] = "set_volume - Applying %s second fade to new volume level";
 static const char __pyx_k_set_volume_Interrupting_an_exist[] = "set_volume - Interrupting an existing fade on this track so start a new fade";
 static const char __pyx_k_stop_Action_may_only_be_used_whe[] = "stop - Action may only be used when a track is playing; action will be ignored.";
 static const char __pyx_k_stop_Stop_sound_processing_on_tr[] = "stop - Stop sound processing on track and clear state";
 static PyObject *__pyx_kp_u_Allocated_track_audio_buffer_d_b;
+static PyObject *__pyx_n_s_AudioException;
+static PyObject *__pyx_kp_u_Could_not_set_inserts_on_track_D;
+static PyObject *__pyx_n_s_MemoryError;
 static PyObject *__pyx_kp_u_Must_be_overridden_in_derived_cl;
 static PyObject *__pyx_n_s_NotImplementedError;
+static PyObject *__pyx_n_s_REVERB_ALLPASS_TUNINGS;
+static PyObject *__pyx_n_s_REVERB_COMB_TUNINGS;
+static PyObject *__pyx_kp_u_Too_many_DSP_inserts_the_maximum;
 static PyObject *__pyx_n_u_Track;
 static PyObject *__pyx_kp_u_Track_2;
 static PyObject *__pyx_n_s_TypeError;
+static PyObject *__pyx_kp_u_Unknown_DSP_insert_type;
+static PyObject *__pyx_kp_u_Unknown_EQ_filter_type;
+static PyObject *__pyx_n_u_active_sound_players;
 static PyObject *__pyx_n_s_audio_callback_data;
 static PyObject *__pyx_n_s_buffer_size;
+static PyObject *__pyx_n_s_ceil;
 static PyObject *__pyx_n_s_cline_in_traceback;
+static PyObject *__pyx_n_s_cos;
+static PyObject *__pyx_n_u_count;
+static PyObject *__pyx_n_u_damping;
 static PyObject *__pyx_n_s_debug;
+static PyObject *__pyx_n_u_dry;
+static PyObject *__pyx_n_u_eq;
 static PyObject *__pyx_n_s_events_when_played;
+static PyObject *__pyx_n_s_exp;
 static PyObject *__pyx_n_s_fade_in_seconds;
 static PyObject *__pyx_n_s_fade_out_seconds;
 static PyObject *__pyx_n_s_fade_seconds;
+static PyObject *__pyx_n_u_filter;
 static PyObject *__pyx_n_s_format;
+static PyObject *__pyx_n_u_frequency;
+static PyObject *__pyx_n_u_gain;
 static PyObject *__pyx_n_s_getLogger;
 static PyObject *__pyx_n_s_getstate;
+static PyObject *__pyx_n_u_highpass;
+static PyObject *__pyx_n_u_highshelf;
 static PyObject *__pyx_n_s_import;
+static PyObject *__pyx_n_u_last;
+static PyObject *__pyx_n_u_limiter;
+static PyObject *__pyx_n_s_log10;
 static PyObject *__pyx_n_s_logging;
+static PyObject *__pyx_n_u_lowpass;
+static PyObject *__pyx_n_u_lowshelf;
 static PyObject *__pyx_n_s_main;
+static PyObject *__pyx_n_s_math;
+static PyObject *__pyx_n_u_max;
 static PyObject *__pyx_n_s_mc;
+static PyObject *__pyx_n_u_mean;
+static PyObject *__pyx_n_u_mix_time;
+static PyObject *__pyx_n_s_mpfmc_core_audio_audio_exception;
 static PyObject *__pyx_n_s_name;
 static PyObject *__pyx_n_s_name_2;
 static PyObject *__pyx_kp_s_no_default___reduce___due_to_non;
@@ -1329,27 +1825,46 @@ static PyObject *__pyx_n_s_number;
 static PyObject *__pyx_kp_u_pause_Action_may_only_be_used_wh;
 static PyObject *__pyx_kp_u_pause_Applying_s_second_fade_out;
 static PyObject *__pyx_kp_u_pause_Pause_sound_processing_on;
+static PyObject *__pyx_n_u_peak;
+static PyObject *__pyx_n_s_pi;
 static PyObject *__pyx_kp_u_play_Action_may_only_be_used_whe;
 static PyObject *__pyx_kp_u_play_Applying_s_second_fade_in;
 static PyObject *__pyx_kp_u_play_Begin_sound_processing_on_t;
 static PyObject *__pyx_n_s_post_mc_native_event;
+static PyObject *__pyx_n_s_pow;
 static PyObject *__pyx_n_s_pyx_vtable;
+static PyObject *__pyx_n_u_q;
+static PyObject *__pyx_n_s_range;
+static PyObject *__pyx_n_u_recent_mean;
+static PyObject *__pyx_n_u_recent_p95;
 static PyObject *__pyx_n_s_reduce;
 static PyObject *__pyx_n_s_reduce_cython;
 static PyObject *__pyx_n_s_reduce_ex;
+static PyObject *__pyx_n_u_release;
+static PyObject *__pyx_n_s_reset;
+static PyObject *__pyx_n_u_reverb;
+static PyObject *__pyx_n_u_room_size;
 static PyObject *__pyx_n_s_round;
+static PyObject *__pyx_kp_u_set_inserts_d_insert_s_applied_t;
 static PyObject *__pyx_kp_u_set_volume_Applying_s_second_fad;
 static PyObject *__pyx_kp_u_set_volume_Interrupting_an_exist;
 static PyObject *__pyx_n_s_setstate;
 static PyObject *__pyx_n_s_setstate_cython;
+static PyObject *__pyx_n_s_sin;
+static PyObject *__pyx_n_s_sqrt;
 static PyObject *__pyx_kp_u_stop_Action_may_only_be_used_whe;
 static PyObject *__pyx_kp_u_stop_Applying_s_second_fade_out;
 static PyObject *__pyx_kp_u_stop_Stop_sound_processing_on_tr;
+static PyObject *__pyx_n_u_streaming_underruns;
+static PyObject *__pyx_n_s_sum;
 static PyObject *__pyx_n_s_test;
+static PyObject *__pyx_n_u_threshold;
 static PyObject *__pyx_n_s_track;
 static PyObject *__pyx_n_s_track_num;
+static PyObject *__pyx_n_u_type;
 static PyObject *__pyx_n_s_volume;
 static PyObject *__pyx_n_s_warning;
+static PyObject *__pyx_n_u_wet;
 static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track___cinit__(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v_args, CYTHON_UNUSED PyObject *__pyx_v_kw); /* proto */
 static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self, PyObject *__pyx_v_mc, PyObject *__pyx_v_audio_callback_data, PyObject *__pyx_v_name, int __pyx_v_track_num, int __pyx_v_buffer_size, float __pyx_v_volume); /* proto */
 static void __pyx_pf_5mpfmc_4core_5audio_5track_5Track_4__dealloc__(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self); /* proto */
@@ -1367,17 +1882,38 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_18events_when_paused_2__se
 static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_25supports_in_memory_sounds___get__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_25supports_streaming_sounds___get__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6fading___get__(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_8clear_context(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v_context); /* proto */
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self, float __pyx_v_volume, float __pyx_v_fade_seconds); /* proto */
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self, float __pyx_v_fade_in_seconds); /* proto */
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self, float __pyx_v_fade_out_seconds); /* proto */
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self, float __pyx_v_fade_out_seconds); /* proto */
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_18stop_all_sounds(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self, CYTHON_UNUSED float __pyx_v_fade_out_seconds); /* proto */
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_20process(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_22__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_24__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_7inserts___get__(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_8set_inserts(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self, PyObject *__pyx_v_inserts); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10get_performance_counters(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self, int __pyx_v_reset); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12clear_context(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v_context); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14set_volume(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self, float __pyx_v_volume, float __pyx_v_fade_seconds); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16play(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self, float __pyx_v_fade_in_seconds); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_18stop(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self, float __pyx_v_fade_out_seconds); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_20pause(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self, float __pyx_v_fade_out_seconds); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_22stop_all_sounds(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self, CYTHON_UNUSED float __pyx_v_fade_out_seconds); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_24process(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_26__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_28__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
 static PyObject *__pyx_tp_new_5mpfmc_4core_5audio_5track_Track(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_float_0_0;
+static PyObject *__pyx_float_0_4;
+static PyObject *__pyx_float_0_7;
+static PyObject *__pyx_float_1_0;
+static PyObject *__pyx_float_2_0;
+static PyObject *__pyx_float_0_28;
+static PyObject *__pyx_float_10_0;
+static PyObject *__pyx_float_40_0;
+static PyObject *__pyx_float_neg_1_0;
+static PyObject *__pyx_float_neg_2_0;
+static PyObject *__pyx_int_0;
 static PyObject *__pyx_int_2;
+static PyObject *__pyx_int_441;
+static PyObject *__pyx_int_556;
+static PyObject *__pyx_int_1116;
+static PyObject *__pyx_int_1188;
+static PyObject *__pyx_int_1277;
+static PyObject *__pyx_int_1356;
+static PyObject *__pyx_int_44100;
 static PyObject *__pyx_tuple_;
 static PyObject *__pyx_tuple__2;
 static PyObject *__pyx_tuple__3;
@@ -1394,8 +1930,10 @@ static PyObject *__pyx_tuple__13;
 static PyObject *__pyx_tuple__14;
 static PyObject *__pyx_tuple__15;
 static PyObject *__pyx_tuple__16;
+static PyObject *__pyx_tuple__17;
+static PyObject *__pyx_tuple__18;
 
-/* "mpfmc/core/audio/track.pyx":23
+/* "mpfmc/core/audio/track.pyx":33
  *     """
  * 
  *     def __cinit__(self, *args, **kw):             # <<<<<<<<<<<<<<
@@ -1428,7 +1966,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track___cinit__(struct __pyx_obj
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__cinit__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":25
+  /* "mpfmc/core/audio/track.pyx":35
  *     def __cinit__(self, *args, **kw):
  *         """C constructor"""
  *         self.state = NULL             # <<<<<<<<<<<<<<
@@ -1437,7 +1975,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track___cinit__(struct __pyx_obj
  */
   __pyx_v_self->state = NULL;
 
-  /* "mpfmc/core/audio/track.pyx":26
+  /* "mpfmc/core/audio/track.pyx":36
  *         """C constructor"""
  *         self.state = NULL
  *         self.device_id = 0             # <<<<<<<<<<<<<<
@@ -1446,7 +1984,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track___cinit__(struct __pyx_obj
  */
   __pyx_v_self->device_id = 0;
 
-  /* "mpfmc/core/audio/track.pyx":23
+  /* "mpfmc/core/audio/track.pyx":33
  *     """
  * 
  *     def __cinit__(self, *args, **kw):             # <<<<<<<<<<<<<<
@@ -1460,7 +1998,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track___cinit__(struct __pyx_obj
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":28
+/* "mpfmc/core/audio/track.pyx":38
  *         self.device_id = 0
  * 
  *     def __init__(self, object mc, object audio_callback_data, str name, int track_num, int buffer_size, float volume=1.0):             # <<<<<<<<<<<<<<
@@ -1515,25 +2053,25 @@ static int __pyx_pw_5mpfmc_4core_5audio_5track_5Track_3__init__(PyObject *__pyx_
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_audio_callback_data)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 0, 5, 6, 1); __PYX_ERR(0, 28, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__init__", 0, 5, 6, 1); __PYX_ERR(0, 38, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_name)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 0, 5, 6, 2); __PYX_ERR(0, 28, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__init__", 0, 5, 6, 2); __PYX_ERR(0, 38, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  3:
         if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_track_num)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 0, 5, 6, 3); __PYX_ERR(0, 28, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__init__", 0, 5, 6, 3); __PYX_ERR(0, 38, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  4:
         if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_buffer_size)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 0, 5, 6, 4); __PYX_ERR(0, 28, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__init__", 0, 5, 6, 4); __PYX_ERR(0, 38, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  5:
@@ -1543,7 +2081,7 @@ static int __pyx_pw_5mpfmc_4core_5audio_5track_5Track_3__init__(PyObject *__pyx_
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 28, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 38, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -1561,23 +2099,23 @@ static int __pyx_pw_5mpfmc_4core_5audio_5track_5Track_3__init__(PyObject *__pyx_
     __pyx_v_mc = values[0];
     __pyx_v_audio_callback_data = values[1];
     __pyx_v_name = ((PyObject*)values[2]);
-    __pyx_v_track_num = __Pyx_PyInt_As_int(values[3]); if (unlikely((__pyx_v_track_num == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 28, __pyx_L3_error)
-    __pyx_v_buffer_size = __Pyx_PyInt_As_int(values[4]); if (unlikely((__pyx_v_buffer_size == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 28, __pyx_L3_error)
+    __pyx_v_track_num = __Pyx_PyInt_As_int(values[3]); if (unlikely((__pyx_v_track_num == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 38, __pyx_L3_error)
+    __pyx_v_buffer_size = __Pyx_PyInt_As_int(values[4]); if (unlikely((__pyx_v_buffer_size == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 38, __pyx_L3_error)
     if (values[5]) {
-      __pyx_v_volume = __pyx_PyFloat_AsFloat(values[5]); if (unlikely((__pyx_v_volume == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 28, __pyx_L3_error)
+      __pyx_v_volume = __pyx_PyFloat_AsFloat(values[5]); if (unlikely((__pyx_v_volume == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 38, __pyx_L3_error)
     } else {
       __pyx_v_volume = ((float)1.0);
     }
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 0, 5, 6, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 28, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__init__", 0, 5, 6, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 38, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("mpfmc.core.audio.track.Track.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return -1;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_name), (&PyUnicode_Type), 1, "name", 1))) __PYX_ERR(0, 28, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_name), (&PyUnicode_Type), 1, "name", 1))) __PYX_ERR(0, 38, __pyx_L1_error)
   __pyx_r = __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(((struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)__pyx_v_self), __pyx_v_mc, __pyx_v_audio_callback_data, __pyx_v_name, __pyx_v_track_num, __pyx_v_buffer_size, __pyx_v_volume);
 
   /* function exit code */
@@ -1600,24 +2138,25 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
   int __pyx_t_5;
   PyObject *__pyx_t_6 = NULL;
   void *__pyx_t_7;
-  long __pyx_t_8;
-  float __pyx_t_9;
+  int __pyx_t_8;
+  long __pyx_t_9;
   float __pyx_t_10;
+  float __pyx_t_11;
   __Pyx_RefNannySetupContext("__init__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":39
+  /* "mpfmc/core/audio/track.pyx":49
  *             volume: The track volume (0.0 to 1.0)
  *         """
  *         self.log = logging.getLogger("Track")             # <<<<<<<<<<<<<<
  *         self.mc = mc
  *         self._name = name
  */
-  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_logging); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 39, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_logging); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 49, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_getLogger); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 39, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_getLogger); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 49, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 39, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 49, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_GIVEREF(__pyx_t_1);
@@ -1626,7 +2165,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
   __pyx_v_self->log = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/track.pyx":40
+  /* "mpfmc/core/audio/track.pyx":50
  *         """
  *         self.log = logging.getLogger("Track")
  *         self.mc = mc             # <<<<<<<<<<<<<<
@@ -1639,7 +2178,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
   __Pyx_DECREF(__pyx_v_self->mc);
   __pyx_v_self->mc = __pyx_v_mc;
 
-  /* "mpfmc/core/audio/track.pyx":41
+  /* "mpfmc/core/audio/track.pyx":51
  *         self.log = logging.getLogger("Track")
  *         self.mc = mc
  *         self._name = name             # <<<<<<<<<<<<<<
@@ -1652,7 +2191,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
   __Pyx_DECREF(__pyx_v_self->_name);
   __pyx_v_self->_name = __pyx_v_name;
 
-  /* "mpfmc/core/audio/track.pyx":42
+  /* "mpfmc/core/audio/track.pyx":52
  *         self.mc = mc
  *         self._name = name
  *         self._number = track_num             # <<<<<<<<<<<<<<
@@ -1661,7 +2200,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
  */
   __pyx_v_self->_number = __pyx_v_track_num;
 
-  /* "mpfmc/core/audio/track.pyx":43
+  /* "mpfmc/core/audio/track.pyx":53
  *         self._name = name
  *         self._number = track_num
  *         self._events_when_stopped = None             # <<<<<<<<<<<<<<
@@ -1674,12 +2213,12 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
   __Pyx_DECREF(__pyx_v_self->_events_when_stopped);
   __pyx_v_self->_events_when_stopped = ((PyObject*)Py_None);
 
-  /* "mpfmc/core/audio/track.pyx":44
+  /* "mpfmc/core/audio/track.pyx":54
  *         self._number = track_num
  *         self._events_when_stopped = None
  *         self._events_when_played = None             # <<<<<<<<<<<<<<
  *         self._events_when_paused = None
- * 
+ *         self._inserts = list()
  */
   __Pyx_INCREF(Py_None);
   __Pyx_GIVEREF(Py_None);
@@ -1687,12 +2226,12 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
   __Pyx_DECREF(__pyx_v_self->_events_when_played);
   __pyx_v_self->_events_when_played = ((PyObject*)Py_None);
 
-  /* "mpfmc/core/audio/track.pyx":45
+  /* "mpfmc/core/audio/track.pyx":55
  *         self._events_when_stopped = None
  *         self._events_when_played = None
  *         self._events_when_paused = None             # <<<<<<<<<<<<<<
+ *         self._inserts = list()
  * 
- *         # Allocate memory for the track state (common among all track types)
  */
   __Pyx_INCREF(Py_None);
   __Pyx_GIVEREF(Py_None);
@@ -1700,7 +2239,22 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
   __Pyx_DECREF(__pyx_v_self->_events_when_paused);
   __pyx_v_self->_events_when_paused = ((PyObject*)Py_None);
 
-  /* "mpfmc/core/audio/track.pyx":48
+  /* "mpfmc/core/audio/track.pyx":56
+ *         self._events_when_played = None
+ *         self._events_when_paused = None
+ *         self._inserts = list()             # <<<<<<<<<<<<<<
+ * 
+ *         # Allocate memory for the track state (common among all track types)
+ */
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 56, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v_self->_inserts);
+  __Pyx_DECREF(__pyx_v_self->_inserts);
+  __pyx_v_self->_inserts = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "mpfmc/core/audio/track.pyx":59
  * 
  *         # Allocate memory for the track state (common among all track types)
  *         self.state = <TrackState*> PyMem_Malloc(sizeof(TrackState))             # <<<<<<<<<<<<<<
@@ -1709,7 +2263,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
  */
   __pyx_v_self->state = ((__pyx_t_5mpfmc_4core_5audio_5track_TrackState *)PyMem_Malloc((sizeof(__pyx_t_5mpfmc_4core_5audio_5track_TrackState))));
 
-  /* "mpfmc/core/audio/track.pyx":49
+  /* "mpfmc/core/audio/track.pyx":60
  *         # Allocate memory for the track state (common among all track types)
  *         self.state = <TrackState*> PyMem_Malloc(sizeof(TrackState))
  *         self.state.mix_callback_function = NULL             # <<<<<<<<<<<<<<
@@ -1718,7 +2272,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
  */
   __pyx_v_self->state->mix_callback_function = NULL;
 
-  /* "mpfmc/core/audio/track.pyx":50
+  /* "mpfmc/core/audio/track.pyx":61
  *         self.state = <TrackState*> PyMem_Malloc(sizeof(TrackState))
  *         self.state.mix_callback_function = NULL
  *         self.state.type_state = NULL             # <<<<<<<<<<<<<<
@@ -1727,7 +2281,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
  */
   __pyx_v_self->state->type_state = NULL;
 
-  /* "mpfmc/core/audio/track.pyx":51
+  /* "mpfmc/core/audio/track.pyx":62
  *         self.state.mix_callback_function = NULL
  *         self.state.type_state = NULL
  *         self.state.number = track_num             # <<<<<<<<<<<<<<
@@ -1736,43 +2290,79 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
  */
   __pyx_v_self->state->number = __pyx_v_track_num;
 
-  /* "mpfmc/core/audio/track.pyx":52
+  /* "mpfmc/core/audio/track.pyx":63
  *         self.state.type_state = NULL
  *         self.state.number = track_num
  *         self.state.buffer = <Uint8 *>PyMem_Malloc(buffer_size)             # <<<<<<<<<<<<<<
  *         self.state.buffer_size = buffer_size
- *         self.state.ducking_control_points = g_array_sized_new(False, True, sizeof(guint8), CONTROL_POINTS_PER_BUFFER)
+ *         self.state.mix_buffer = NULL
  */
   __pyx_v_self->state->buffer = ((Uint8 *)PyMem_Malloc(__pyx_v_buffer_size));
 
-  /* "mpfmc/core/audio/track.pyx":53
+  /* "mpfmc/core/audio/track.pyx":64
  *         self.state.number = track_num
  *         self.state.buffer = <Uint8 *>PyMem_Malloc(buffer_size)
  *         self.state.buffer_size = buffer_size             # <<<<<<<<<<<<<<
- *         self.state.ducking_control_points = g_array_sized_new(False, True, sizeof(guint8), CONTROL_POINTS_PER_BUFFER)
- *         self.log.debug("Allocated track audio buffer (%d bytes)", buffer_size)
+ *         self.state.mix_buffer = NULL
+ *         self.state.mix_gain = 0
  */
   __pyx_v_self->state->buffer_size = __pyx_v_buffer_size;
 
-  /* "mpfmc/core/audio/track.pyx":54
+  /* "mpfmc/core/audio/track.pyx":65
  *         self.state.buffer = <Uint8 *>PyMem_Malloc(buffer_size)
  *         self.state.buffer_size = buffer_size
+ *         self.state.mix_buffer = NULL             # <<<<<<<<<<<<<<
+ *         self.state.mix_gain = 0
+ *         self.state.float_buffer = NULL
+ */
+  __pyx_v_self->state->mix_buffer = NULL;
+
+  /* "mpfmc/core/audio/track.pyx":66
+ *         self.state.buffer_size = buffer_size
+ *         self.state.mix_buffer = NULL
+ *         self.state.mix_gain = 0             # <<<<<<<<<<<<<<
+ *         self.state.float_buffer = NULL
+ *         self.state.inserts = NULL
+ */
+  __pyx_v_self->state->mix_gain = 0;
+
+  /* "mpfmc/core/audio/track.pyx":67
+ *         self.state.mix_buffer = NULL
+ *         self.state.mix_gain = 0
+ *         self.state.float_buffer = NULL             # <<<<<<<<<<<<<<
+ *         self.state.inserts = NULL
+ *         self.state.ducking_control_points = g_array_sized_new(False, True, sizeof(guint8), CONTROL_POINTS_PER_BUFFER)
+ */
+  __pyx_v_self->state->float_buffer = NULL;
+
+  /* "mpfmc/core/audio/track.pyx":68
+ *         self.state.mix_gain = 0
+ *         self.state.float_buffer = NULL
+ *         self.state.inserts = NULL             # <<<<<<<<<<<<<<
+ *         self.state.ducking_control_points = g_array_sized_new(False, True, sizeof(guint8), CONTROL_POINTS_PER_BUFFER)
+ *         self.log.debug("Allocated track audio buffer (%d bytes)", buffer_size)
+ */
+  __pyx_v_self->state->inserts = NULL;
+
+  /* "mpfmc/core/audio/track.pyx":69
+ *         self.state.float_buffer = NULL
+ *         self.state.inserts = NULL
  *         self.state.ducking_control_points = g_array_sized_new(False, True, sizeof(guint8), CONTROL_POINTS_PER_BUFFER)             # <<<<<<<<<<<<<<
  *         self.log.debug("Allocated track audio buffer (%d bytes)", buffer_size)
  * 
  */
   __pyx_v_self->state->ducking_control_points = g_array_sized_new(0, 1, (sizeof(guint8)), __pyx_e_5mpfmc_4core_5audio_5track_CONTROL_POINTS_PER_BUFFER);
 
-  /* "mpfmc/core/audio/track.pyx":55
- *         self.state.buffer_size = buffer_size
+  /* "mpfmc/core/audio/track.pyx":70
+ *         self.state.inserts = NULL
  *         self.state.ducking_control_points = g_array_sized_new(False, True, sizeof(guint8), CONTROL_POINTS_PER_BUFFER)
  *         self.log.debug("Allocated track audio buffer (%d bytes)", buffer_size)             # <<<<<<<<<<<<<<
  * 
  *         # The easiest way to pass a C pointer in a constructor is to wrap it in a PyCapsule
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 55, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 70, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_buffer_size); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 55, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_buffer_size); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 70, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_t_4 = NULL;
   __pyx_t_5 = 0;
@@ -1789,7 +2379,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
   #if CYTHON_FAST_PYCALL
   if (PyFunction_Check(__pyx_t_2)) {
     PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_kp_u_Allocated_track_audio_buffer_d_b, __pyx_t_3};
-    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_5, 2+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 55, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_5, 2+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 70, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -1798,14 +2388,14 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
   #if CYTHON_FAST_PYCCALL
   if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
     PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_kp_u_Allocated_track_audio_buffer_d_b, __pyx_t_3};
-    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_5, 2+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 55, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_5, 2+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 70, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   } else
   #endif
   {
-    __pyx_t_6 = PyTuple_New(2+__pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 55, __pyx_L1_error)
+    __pyx_t_6 = PyTuple_New(2+__pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 70, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
     if (__pyx_t_4) {
       __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_4); __pyx_t_4 = NULL;
@@ -1816,25 +2406,78 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
     __Pyx_GIVEREF(__pyx_t_3);
     PyTuple_SET_ITEM(__pyx_t_6, 1+__pyx_t_5, __pyx_t_3);
     __pyx_t_3 = 0;
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 55, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 70, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
   }
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/track.pyx":60
+  /* "mpfmc/core/audio/track.pyx":75
  *         # (see https://docs.python.org/3.4/c-api/capsule.html).  This basically wraps the
  *         # pointer in a Python object. It can be extracted using PyCapsule_GetPointer.
  *         self.state.callback_data = <AudioCallbackData*>pycapsule.PyCapsule_GetPointer(audio_callback_data, NULL)             # <<<<<<<<<<<<<<
  * 
- *         self.state.status = track_status_playing
+ *         # 32-bit accumulator used by the mixing kernel (one entry per 16-bit sample in the track buffer)
  */
-  __pyx_t_7 = PyCapsule_GetPointer(__pyx_v_audio_callback_data, NULL); if (unlikely(__pyx_t_7 == ((void *)NULL) && PyErr_Occurred())) __PYX_ERR(0, 60, __pyx_L1_error)
+  __pyx_t_7 = PyCapsule_GetPointer(__pyx_v_audio_callback_data, NULL); if (unlikely(__pyx_t_7 == ((void *)NULL) && PyErr_Occurred())) __PYX_ERR(0, 75, __pyx_L1_error)
   __pyx_v_self->state->callback_data = ((__pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData *)__pyx_t_7);
 
-  /* "mpfmc/core/audio/track.pyx":62
- *         self.state.callback_data = <AudioCallbackData*>pycapsule.PyCapsule_GetPointer(audio_callback_data, NULL)
+  /* "mpfmc/core/audio/track.pyx":78
+ * 
+ *         # 32-bit accumulator used by the mixing kernel (one entry per 16-bit sample in the track buffer)
+ *         self.state.mix_buffer = <Sint32 *>PyMem_Malloc((buffer_size // self.state.callback_data.bytes_per_sample) * sizeof(Sint32))             # <<<<<<<<<<<<<<
+ * 
+ *         # Floating-point track buffer (only needed when the floating-point mix bus is enabled)
+ */
+  if (unlikely(__pyx_v_self->state->callback_data->bytes_per_sample == 0)) {
+    PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+    __PYX_ERR(0, 78, __pyx_L1_error)
+  }
+  else if (sizeof(int) == sizeof(long) && (!(((Uint8)-1) > 0)) && unlikely(__pyx_v_self->state->callback_data->bytes_per_sample == (Uint8)-1)  && unlikely(UNARY_NEG_WOULD_OVERFLOW(__pyx_v_buffer_size))) {
+    PyErr_SetString(PyExc_OverflowError, "value too large to perform division");
+    __PYX_ERR(0, 78, __pyx_L1_error)
+  }
+  __pyx_v_self->state->mix_buffer = ((Sint32 *)PyMem_Malloc((__Pyx_div_int(__pyx_v_buffer_size, __pyx_v_self->state->callback_data->bytes_per_sample) * (sizeof(Sint32)))));
+
+  /* "mpfmc/core/audio/track.pyx":81
+ * 
+ *         # Floating-point track buffer (only needed when the floating-point mix bus is enabled)
+ *         if self.state.callback_data.float_mix_bus:             # <<<<<<<<<<<<<<
+ *             self.state.float_buffer = <float *>PyMem_Malloc((buffer_size // self.state.callback_data.bytes_per_sample) * sizeof(float))
+ * 
+ */
+  __pyx_t_8 = (__pyx_v_self->state->callback_data->float_mix_bus != 0);
+  if (__pyx_t_8) {
+
+    /* "mpfmc/core/audio/track.pyx":82
+ *         # Floating-point track buffer (only needed when the floating-point mix bus is enabled)
+ *         if self.state.callback_data.float_mix_bus:
+ *             self.state.float_buffer = <float *>PyMem_Malloc((buffer_size // self.state.callback_data.bytes_per_sample) * sizeof(float))             # <<<<<<<<<<<<<<
+ * 
+ *         self.state.status = track_status_playing
+ */
+    if (unlikely(__pyx_v_self->state->callback_data->bytes_per_sample == 0)) {
+      PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+      __PYX_ERR(0, 82, __pyx_L1_error)
+    }
+    else if (sizeof(int) == sizeof(long) && (!(((Uint8)-1) > 0)) && unlikely(__pyx_v_self->state->callback_data->bytes_per_sample == (Uint8)-1)  && unlikely(UNARY_NEG_WOULD_OVERFLOW(__pyx_v_buffer_size))) {
+      PyErr_SetString(PyExc_OverflowError, "value too large to perform division");
+      __PYX_ERR(0, 82, __pyx_L1_error)
+    }
+    __pyx_v_self->state->float_buffer = ((float *)PyMem_Malloc((__Pyx_div_int(__pyx_v_buffer_size, __pyx_v_self->state->callback_data->bytes_per_sample) * (sizeof(float)))));
+
+    /* "mpfmc/core/audio/track.pyx":81
+ * 
+ *         # Floating-point track buffer (only needed when the floating-point mix bus is enabled)
+ *         if self.state.callback_data.float_mix_bus:             # <<<<<<<<<<<<<<
+ *             self.state.float_buffer = <float *>PyMem_Malloc((buffer_size // self.state.callback_data.bytes_per_sample) * sizeof(float))
+ * 
+ */
+  }
+
+  /* "mpfmc/core/audio/track.pyx":84
+ *             self.state.float_buffer = <float *>PyMem_Malloc((buffer_size // self.state.callback_data.bytes_per_sample) * sizeof(float))
  * 
  *         self.state.status = track_status_playing             # <<<<<<<<<<<<<<
  *         self.state.fade_steps = 0
@@ -1842,7 +2485,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
  */
   __pyx_v_self->state->status = __pyx_e_5mpfmc_4core_5audio_5track_track_status_playing;
 
-  /* "mpfmc/core/audio/track.pyx":63
+  /* "mpfmc/core/audio/track.pyx":85
  * 
  *         self.state.status = track_status_playing
  *         self.state.fade_steps = 0             # <<<<<<<<<<<<<<
@@ -1851,7 +2494,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
  */
   __pyx_v_self->state->fade_steps = 0;
 
-  /* "mpfmc/core/audio/track.pyx":64
+  /* "mpfmc/core/audio/track.pyx":86
  *         self.state.status = track_status_playing
  *         self.state.fade_steps = 0
  *         self.state.fade_steps_remaining = 0             # <<<<<<<<<<<<<<
@@ -1860,7 +2503,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
  */
   __pyx_v_self->state->fade_steps_remaining = 0;
 
-  /* "mpfmc/core/audio/track.pyx":65
+  /* "mpfmc/core/audio/track.pyx":87
  *         self.state.fade_steps = 0
  *         self.state.fade_steps_remaining = 0
  *         new_volume = <Uint8>min(max(volume * SDL_MIX_MAXVOLUME, 0), SDL_MIX_MAXVOLUME)             # <<<<<<<<<<<<<<
@@ -1868,22 +2511,22 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
  *         self.state.fade_volume_current = new_volume
  */
   __pyx_t_5 = SDL_MIX_MAXVOLUME;
-  __pyx_t_8 = 0;
-  __pyx_t_9 = (__pyx_v_volume * SDL_MIX_MAXVOLUME);
-  if (((__pyx_t_8 > __pyx_t_9) != 0)) {
-    __pyx_t_10 = __pyx_t_8;
+  __pyx_t_9 = 0;
+  __pyx_t_10 = (__pyx_v_volume * SDL_MIX_MAXVOLUME);
+  if (((__pyx_t_9 > __pyx_t_10) != 0)) {
+    __pyx_t_11 = __pyx_t_9;
   } else {
-    __pyx_t_10 = __pyx_t_9;
+    __pyx_t_11 = __pyx_t_10;
   }
-  __pyx_t_9 = __pyx_t_10;
-  if (((__pyx_t_5 < __pyx_t_9) != 0)) {
-    __pyx_t_10 = __pyx_t_5;
+  __pyx_t_10 = __pyx_t_11;
+  if (((__pyx_t_5 < __pyx_t_10) != 0)) {
+    __pyx_t_11 = __pyx_t_5;
   } else {
-    __pyx_t_10 = __pyx_t_9;
+    __pyx_t_11 = __pyx_t_10;
   }
-  __pyx_v_new_volume = ((Uint8)__pyx_t_10);
+  __pyx_v_new_volume = ((Uint8)__pyx_t_11);
 
-  /* "mpfmc/core/audio/track.pyx":66
+  /* "mpfmc/core/audio/track.pyx":88
  *         self.state.fade_steps_remaining = 0
  *         new_volume = <Uint8>min(max(volume * SDL_MIX_MAXVOLUME, 0), SDL_MIX_MAXVOLUME)
  *         self.state.volume = new_volume             # <<<<<<<<<<<<<<
@@ -1892,7 +2535,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
  */
   __pyx_v_self->state->volume = __pyx_v_new_volume;
 
-  /* "mpfmc/core/audio/track.pyx":67
+  /* "mpfmc/core/audio/track.pyx":89
  *         new_volume = <Uint8>min(max(volume * SDL_MIX_MAXVOLUME, 0), SDL_MIX_MAXVOLUME)
  *         self.state.volume = new_volume
  *         self.state.fade_volume_current = new_volume             # <<<<<<<<<<<<<<
@@ -1901,7 +2544,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
  */
   __pyx_v_self->state->fade_volume_current = __pyx_v_new_volume;
 
-  /* "mpfmc/core/audio/track.pyx":68
+  /* "mpfmc/core/audio/track.pyx":90
  *         self.state.volume = new_volume
  *         self.state.fade_volume_current = new_volume
  *         self.state.fade_volume_start = new_volume             # <<<<<<<<<<<<<<
@@ -1910,7 +2553,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
  */
   __pyx_v_self->state->fade_volume_start = __pyx_v_new_volume;
 
-  /* "mpfmc/core/audio/track.pyx":69
+  /* "mpfmc/core/audio/track.pyx":91
  *         self.state.fade_volume_current = new_volume
  *         self.state.fade_volume_start = new_volume
  *         self.state.fade_volume_target = new_volume             # <<<<<<<<<<<<<<
@@ -1919,16 +2562,43 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
  */
   __pyx_v_self->state->fade_volume_target = __pyx_v_new_volume;
 
-  /* "mpfmc/core/audio/track.pyx":71
+  /* "mpfmc/core/audio/track.pyx":93
  *         self.state.fade_volume_target = new_volume
  * 
  *         self.state.notification_messages = NULL             # <<<<<<<<<<<<<<
  * 
- *     def __dealloc__(self):
+ *         # Performance counters
  */
   __pyx_v_self->state->notification_messages = NULL;
 
-  /* "mpfmc/core/audio/track.pyx":28
+  /* "mpfmc/core/audio/track.pyx":96
+ * 
+ *         # Performance counters
+ *         perf_ring_buffer_reset(&self.state.mix_time)             # <<<<<<<<<<<<<<
+ *         self.state.active_sound_players = 0
+ *         self.state.streaming_underruns = 0
+ */
+  __pyx_f_5mpfmc_4core_5audio_13perf_counters_perf_ring_buffer_reset((&__pyx_v_self->state->mix_time));
+
+  /* "mpfmc/core/audio/track.pyx":97
+ *         # Performance counters
+ *         perf_ring_buffer_reset(&self.state.mix_time)
+ *         self.state.active_sound_players = 0             # <<<<<<<<<<<<<<
+ *         self.state.streaming_underruns = 0
+ * 
+ */
+  __pyx_v_self->state->active_sound_players = 0;
+
+  /* "mpfmc/core/audio/track.pyx":98
+ *         perf_ring_buffer_reset(&self.state.mix_time)
+ *         self.state.active_sound_players = 0
+ *         self.state.streaming_underruns = 0             # <<<<<<<<<<<<<<
+ * 
+ *     def __dealloc__(self):
+ */
+  __pyx_v_self->state->streaming_underruns = 0;
+
+  /* "mpfmc/core/audio/track.pyx":38
  *         self.device_id = 0
  * 
  *     def __init__(self, object mc, object audio_callback_data, str name, int track_num, int buffer_size, float volume=1.0):             # <<<<<<<<<<<<<<
@@ -1952,8 +2622,8 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_2__init__(struct __pyx_obj
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":73
- *         self.state.notification_messages = NULL
+/* "mpfmc/core/audio/track.pyx":100
+ *         self.state.streaming_underruns = 0
  * 
  *     def __dealloc__(self):             # <<<<<<<<<<<<<<
  *         """Destructor"""
@@ -1975,35 +2645,71 @@ static void __pyx_pf_5mpfmc_4core_5audio_5track_5Track_4__dealloc__(struct __pyx
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__dealloc__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":75
+  /* "mpfmc/core/audio/track.pyx":102
  *     def __dealloc__(self):
  *         """Destructor"""
  *         SDL_LockAudio()             # <<<<<<<<<<<<<<
  *         g_array_free(self.state.ducking_control_points, True)
- *         PyMem_Free(self.state)
+ *         free_dsp_chain(self.state.inserts)
  */
   SDL_LockAudio();
 
-  /* "mpfmc/core/audio/track.pyx":76
+  /* "mpfmc/core/audio/track.pyx":103
  *         """Destructor"""
  *         SDL_LockAudio()
  *         g_array_free(self.state.ducking_control_points, True)             # <<<<<<<<<<<<<<
- *         PyMem_Free(self.state)
- *         SDL_UnlockAudio()
+ *         free_dsp_chain(self.state.inserts)
+ *         PyMem_Free(self.state.float_buffer)
  */
   g_array_free(__pyx_v_self->state->ducking_control_points, 1);
 
-  /* "mpfmc/core/audio/track.pyx":77
+  /* "mpfmc/core/audio/track.pyx":104
  *         SDL_LockAudio()
  *         g_array_free(self.state.ducking_control_points, True)
+ *         free_dsp_chain(self.state.inserts)             # <<<<<<<<<<<<<<
+ *         PyMem_Free(self.state.float_buffer)
+ *         PyMem_Free(self.state.mix_buffer)
+ */
+  __pyx_f_5mpfmc_4core_5audio_5track_free_dsp_chain(__pyx_v_self->state->inserts);
+
+  /* "mpfmc/core/audio/track.pyx":105
+ *         g_array_free(self.state.ducking_control_points, True)
+ *         free_dsp_chain(self.state.inserts)
+ *         PyMem_Free(self.state.float_buffer)             # <<<<<<<<<<<<<<
+ *         PyMem_Free(self.state.mix_buffer)
+ *         PyMem_Free(self.state.buffer)
+ */
+  PyMem_Free(__pyx_v_self->state->float_buffer);
+
+  /* "mpfmc/core/audio/track.pyx":106
+ *         free_dsp_chain(self.state.inserts)
+ *         PyMem_Free(self.state.float_buffer)
+ *         PyMem_Free(self.state.mix_buffer)             # <<<<<<<<<<<<<<
+ *         PyMem_Free(self.state.buffer)
+ *         PyMem_Free(self.state)
+ */
+  PyMem_Free(__pyx_v_self->state->mix_buffer);
+
+  /* "mpfmc/core/audio/track.pyx":107
+ *         PyMem_Free(self.state.float_buffer)
+ *         PyMem_Free(self.state.mix_buffer)
+ *         PyMem_Free(self.state.buffer)             # <<<<<<<<<<<<<<
+ *         PyMem_Free(self.state)
+ *         SDL_UnlockAudio()
+ */
+  PyMem_Free(__pyx_v_self->state->buffer);
+
+  /* "mpfmc/core/audio/track.pyx":108
+ *         PyMem_Free(self.state.mix_buffer)
+ *         PyMem_Free(self.state.buffer)
  *         PyMem_Free(self.state)             # <<<<<<<<<<<<<<
  *         SDL_UnlockAudio()
  * 
  */
   PyMem_Free(__pyx_v_self->state);
 
-  /* "mpfmc/core/audio/track.pyx":78
- *         g_array_free(self.state.ducking_control_points, True)
+  /* "mpfmc/core/audio/track.pyx":109
+ *         PyMem_Free(self.state.buffer)
  *         PyMem_Free(self.state)
  *         SDL_UnlockAudio()             # <<<<<<<<<<<<<<
  * 
@@ -2011,8 +2717,8 @@ static void __pyx_pf_5mpfmc_4core_5audio_5track_5Track_4__dealloc__(struct __pyx
  */
   SDL_UnlockAudio();
 
-  /* "mpfmc/core/audio/track.pyx":73
- *         self.state.notification_messages = NULL
+  /* "mpfmc/core/audio/track.pyx":100
+ *         self.state.streaming_underruns = 0
  * 
  *     def __dealloc__(self):             # <<<<<<<<<<<<<<
  *         """Destructor"""
@@ -2023,7 +2729,7 @@ static void __pyx_pf_5mpfmc_4core_5audio_5track_5Track_4__dealloc__(struct __pyx
   __Pyx_RefNannyFinishContext();
 }
 
-/* "mpfmc/core/audio/track.pyx":80
+/* "mpfmc/core/audio/track.pyx":111
  *         SDL_UnlockAudio()
  * 
  *     def __repr__(self):             # <<<<<<<<<<<<<<
@@ -2056,7 +2762,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6__repr__(struct __p
   PyObject *__pyx_t_7 = NULL;
   __Pyx_RefNannySetupContext("__repr__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":81
+  /* "mpfmc/core/audio/track.pyx":112
  * 
  *     def __repr__(self):
  *         return '<Track.{}.{}>'.format(self.number, self.name)             # <<<<<<<<<<<<<<
@@ -2064,11 +2770,11 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6__repr__(struct __p
  *     cdef TrackState *get_state(self):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Track_2, __pyx_n_s_format); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 81, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Track_2, __pyx_n_s_format); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 112, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_number); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 81, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_number); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 112, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_name); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 81, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_name); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 112, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __pyx_t_5 = NULL;
   __pyx_t_6 = 0;
@@ -2085,7 +2791,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6__repr__(struct __p
   #if CYTHON_FAST_PYCALL
   if (PyFunction_Check(__pyx_t_2)) {
     PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_t_3, __pyx_t_4};
-    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 81, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 112, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -2095,7 +2801,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6__repr__(struct __p
   #if CYTHON_FAST_PYCCALL
   if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
     PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_t_3, __pyx_t_4};
-    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 81, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 112, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -2103,7 +2809,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6__repr__(struct __p
   } else
   #endif
   {
-    __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 81, __pyx_L1_error)
+    __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 112, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_7);
     if (__pyx_t_5) {
       __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_5); __pyx_t_5 = NULL;
@@ -2114,7 +2820,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6__repr__(struct __p
     PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_t_4);
     __pyx_t_3 = 0;
     __pyx_t_4 = 0;
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 81, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 112, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
   }
@@ -2123,7 +2829,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6__repr__(struct __p
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "mpfmc/core/audio/track.pyx":80
+  /* "mpfmc/core/audio/track.pyx":111
  *         SDL_UnlockAudio()
  * 
  *     def __repr__(self):             # <<<<<<<<<<<<<<
@@ -2147,7 +2853,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6__repr__(struct __p
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":83
+/* "mpfmc/core/audio/track.pyx":114
  *         return '<Track.{}.{}>'.format(self.number, self.name)
  * 
  *     cdef TrackState *get_state(self):             # <<<<<<<<<<<<<<
@@ -2160,17 +2866,17 @@ static __pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_f_5mpfmc_4core_5audi
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("get_state", 0);
 
-  /* "mpfmc/core/audio/track.pyx":84
+  /* "mpfmc/core/audio/track.pyx":115
  * 
  *     cdef TrackState *get_state(self):
  *         return self.state             # <<<<<<<<<<<<<<
  * 
- *     property name:
+ *     cdef GSList *take_notification_messages(self):
  */
   __pyx_r = __pyx_v_self->state;
   goto __pyx_L0;
 
-  /* "mpfmc/core/audio/track.pyx":83
+  /* "mpfmc/core/audio/track.pyx":114
  *         return '<Track.{}.{}>'.format(self.number, self.name)
  * 
  *     cdef TrackState *get_state(self):             # <<<<<<<<<<<<<<
@@ -2184,7 +2890,74 @@ static __pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_f_5mpfmc_4core_5audi
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":87
+/* "mpfmc/core/audio/track.pyx":117
+ *         return self.state
+ * 
+ *     cdef GSList *take_notification_messages(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Takes all pending notification messages from the track without locking the audio thread.
+ */
+
+static GSList *__pyx_f_5mpfmc_4core_5audio_5track_5Track_take_notification_messages(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self) {
+  GSList *__pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("take_notification_messages", 0);
+
+  /* "mpfmc/core/audio/track.pyx":124
+ *             by the caller, or NULL if there are no pending messages.
+ *         """
+ *         if self.state.notification_messages == NULL:             # <<<<<<<<<<<<<<
+ *             return NULL
+ * 
+ */
+  __pyx_t_1 = ((__pyx_v_self->state->notification_messages == NULL) != 0);
+  if (__pyx_t_1) {
+
+    /* "mpfmc/core/audio/track.pyx":125
+ *         """
+ *         if self.state.notification_messages == NULL:
+ *             return NULL             # <<<<<<<<<<<<<<
+ * 
+ *         return g_slist_reverse(<GSList*>SDL_AtomicSetPtr(<void**>&self.state.notification_messages, NULL))
+ */
+    __pyx_r = NULL;
+    goto __pyx_L0;
+
+    /* "mpfmc/core/audio/track.pyx":124
+ *             by the caller, or NULL if there are no pending messages.
+ *         """
+ *         if self.state.notification_messages == NULL:             # <<<<<<<<<<<<<<
+ *             return NULL
+ * 
+ */
+  }
+
+  /* "mpfmc/core/audio/track.pyx":127
+ *             return NULL
+ * 
+ *         return g_slist_reverse(<GSList*>SDL_AtomicSetPtr(<void**>&self.state.notification_messages, NULL))             # <<<<<<<<<<<<<<
+ * 
+ *     property name:
+ */
+  __pyx_r = g_slist_reverse(((GSList *)SDL_AtomicSetPtr(((void **)(&__pyx_v_self->state->notification_messages)), NULL)));
+  goto __pyx_L0;
+
+  /* "mpfmc/core/audio/track.pyx":117
+ *         return self.state
+ * 
+ *     cdef GSList *take_notification_messages(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Takes all pending notification messages from the track without locking the audio thread.
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/track.pyx":130
  * 
  *     property name:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -2210,7 +2983,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_4name___get__(struct
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":88
+  /* "mpfmc/core/audio/track.pyx":131
  *     property name:
  *         def __get__(self):
  *             return self._name             # <<<<<<<<<<<<<<
@@ -2222,7 +2995,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_4name___get__(struct
   __pyx_r = __pyx_v_self->_name;
   goto __pyx_L0;
 
-  /* "mpfmc/core/audio/track.pyx":87
+  /* "mpfmc/core/audio/track.pyx":130
  * 
  *     property name:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -2237,7 +3010,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_4name___get__(struct
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":91
+/* "mpfmc/core/audio/track.pyx":134
  * 
  *     property volume:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -2265,7 +3038,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6volume___get__(stru
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":92
+  /* "mpfmc/core/audio/track.pyx":135
  *     property volume:
  *         def __get__(self):
  *             return round(self.state.volume / SDL_MIX_MAXVOLUME, 2)             # <<<<<<<<<<<<<<
@@ -2275,11 +3048,11 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6volume___get__(stru
   __Pyx_XDECREF(__pyx_r);
   if (unlikely(SDL_MIX_MAXVOLUME == 0)) {
     PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-    __PYX_ERR(0, 92, __pyx_L1_error)
+    __PYX_ERR(0, 135, __pyx_L1_error)
   }
-  __pyx_t_1 = PyFloat_FromDouble((((double)__pyx_v_self->state->volume) / ((double)SDL_MIX_MAXVOLUME))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 92, __pyx_L1_error)
+  __pyx_t_1 = PyFloat_FromDouble((((double)__pyx_v_self->state->volume) / ((double)SDL_MIX_MAXVOLUME))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 135, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 92, __pyx_L1_error)
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 135, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_1);
   PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
@@ -2287,14 +3060,14 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6volume___get__(stru
   __Pyx_GIVEREF(__pyx_int_2);
   PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_int_2);
   __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_round, __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 92, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_round, __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 135, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "mpfmc/core/audio/track.pyx":91
+  /* "mpfmc/core/audio/track.pyx":134
  * 
  *     property volume:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -2314,7 +3087,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6volume___get__(stru
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":95
+/* "mpfmc/core/audio/track.pyx":138
  * 
  *     @property
  *     def type(self):             # <<<<<<<<<<<<<<
@@ -2341,20 +3114,20 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_4type___get__(CYTHON
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":96
+  /* "mpfmc/core/audio/track.pyx":139
  *     @property
  *     def type(self):
  *         raise NotImplementedError('Must be overridden in derived class')             # <<<<<<<<<<<<<<
  * 
  *     @property
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 96, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 139, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_Raise(__pyx_t_1, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(0, 96, __pyx_L1_error)
+  __PYX_ERR(0, 139, __pyx_L1_error)
 
-  /* "mpfmc/core/audio/track.pyx":95
+  /* "mpfmc/core/audio/track.pyx":138
  * 
  *     @property
  *     def type(self):             # <<<<<<<<<<<<<<
@@ -2372,7 +3145,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_4type___get__(CYTHON
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":99
+/* "mpfmc/core/audio/track.pyx":142
  * 
  *     @property
  *     def number(self):             # <<<<<<<<<<<<<<
@@ -2402,7 +3175,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6number___get__(stru
   PyObject *__pyx_t_3 = NULL;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":101
+  /* "mpfmc/core/audio/track.pyx":144
  *     def number(self):
  *         """Return the track number"""
  *         cdef int number = -1             # <<<<<<<<<<<<<<
@@ -2411,7 +3184,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6number___get__(stru
  */
   __pyx_v_number = -1;
 
-  /* "mpfmc/core/audio/track.pyx":102
+  /* "mpfmc/core/audio/track.pyx":145
  *         """Return the track number"""
  *         cdef int number = -1
  *         if self.state != NULL:             # <<<<<<<<<<<<<<
@@ -2421,7 +3194,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6number___get__(stru
   __pyx_t_1 = ((__pyx_v_self->state != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/track.pyx":103
+    /* "mpfmc/core/audio/track.pyx":146
  *         cdef int number = -1
  *         if self.state != NULL:
  *             SDL_LockAudio()             # <<<<<<<<<<<<<<
@@ -2430,7 +3203,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6number___get__(stru
  */
     SDL_LockAudio();
 
-    /* "mpfmc/core/audio/track.pyx":104
+    /* "mpfmc/core/audio/track.pyx":147
  *         if self.state != NULL:
  *             SDL_LockAudio()
  *             number = self.state.number             # <<<<<<<<<<<<<<
@@ -2440,7 +3213,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6number___get__(stru
     __pyx_t_2 = __pyx_v_self->state->number;
     __pyx_v_number = __pyx_t_2;
 
-    /* "mpfmc/core/audio/track.pyx":105
+    /* "mpfmc/core/audio/track.pyx":148
  *             SDL_LockAudio()
  *             number = self.state.number
  *             SDL_UnlockAudio()             # <<<<<<<<<<<<<<
@@ -2449,7 +3222,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6number___get__(stru
  */
     SDL_UnlockAudio();
 
-    /* "mpfmc/core/audio/track.pyx":102
+    /* "mpfmc/core/audio/track.pyx":145
  *         """Return the track number"""
  *         cdef int number = -1
  *         if self.state != NULL:             # <<<<<<<<<<<<<<
@@ -2458,7 +3231,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6number___get__(stru
  */
   }
 
-  /* "mpfmc/core/audio/track.pyx":106
+  /* "mpfmc/core/audio/track.pyx":149
  *             number = self.state.number
  *             SDL_UnlockAudio()
  *         return number             # <<<<<<<<<<<<<<
@@ -2466,13 +3239,13 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6number___get__(stru
  *     @property
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_number); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 106, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_number); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 149, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_r = __pyx_t_3;
   __pyx_t_3 = 0;
   goto __pyx_L0;
 
-  /* "mpfmc/core/audio/track.pyx":99
+  /* "mpfmc/core/audio/track.pyx":142
  * 
  *     @property
  *     def number(self):             # <<<<<<<<<<<<<<
@@ -2491,7 +3264,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6number___get__(stru
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":109
+/* "mpfmc/core/audio/track.pyx":152
  * 
  *     @property
  *     def events_when_stopped(self):             # <<<<<<<<<<<<<<
@@ -2517,7 +3290,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_19events_when_stoppe
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":111
+  /* "mpfmc/core/audio/track.pyx":154
  *     def events_when_stopped(self):
  *         """Return the list of events that are posted when the track is stopped"""
  *         return self._events_when_stopped             # <<<<<<<<<<<<<<
@@ -2529,7 +3302,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_19events_when_stoppe
   __pyx_r = __pyx_v_self->_events_when_stopped;
   goto __pyx_L0;
 
-  /* "mpfmc/core/audio/track.pyx":109
+  /* "mpfmc/core/audio/track.pyx":152
  * 
  *     @property
  *     def events_when_stopped(self):             # <<<<<<<<<<<<<<
@@ -2544,7 +3317,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_19events_when_stoppe
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":114
+/* "mpfmc/core/audio/track.pyx":157
  * 
  *     @events_when_stopped.setter
  *     def events_when_stopped(self, events):             # <<<<<<<<<<<<<<
@@ -2571,14 +3344,14 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_19events_when_stopped_2__s
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("__set__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":116
+  /* "mpfmc/core/audio/track.pyx":159
  *     def events_when_stopped(self, events):
  *         """Sets the list of events that are posted when the track is stopped"""
  *         self._events_when_stopped = events             # <<<<<<<<<<<<<<
  * 
  *     @property
  */
-  if (!(likely(PyList_CheckExact(__pyx_v_events))||((__pyx_v_events) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "list", Py_TYPE(__pyx_v_events)->tp_name), 0))) __PYX_ERR(0, 116, __pyx_L1_error)
+  if (!(likely(PyList_CheckExact(__pyx_v_events))||((__pyx_v_events) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "list", Py_TYPE(__pyx_v_events)->tp_name), 0))) __PYX_ERR(0, 159, __pyx_L1_error)
   __pyx_t_1 = __pyx_v_events;
   __Pyx_INCREF(__pyx_t_1);
   __Pyx_GIVEREF(__pyx_t_1);
@@ -2587,7 +3360,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_19events_when_stopped_2__s
   __pyx_v_self->_events_when_stopped = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/track.pyx":114
+  /* "mpfmc/core/audio/track.pyx":157
  * 
  *     @events_when_stopped.setter
  *     def events_when_stopped(self, events):             # <<<<<<<<<<<<<<
@@ -2607,7 +3380,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_19events_when_stopped_2__s
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":119
+/* "mpfmc/core/audio/track.pyx":162
  * 
  *     @property
  *     def events_when_played(self):             # <<<<<<<<<<<<<<
@@ -2633,7 +3406,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_18events_when_played
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":121
+  /* "mpfmc/core/audio/track.pyx":164
  *     def events_when_played(self):
  *         """Return the list of events that are posted when the track is played"""
  *         return self._events_when_played             # <<<<<<<<<<<<<<
@@ -2645,7 +3418,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_18events_when_played
   __pyx_r = __pyx_v_self->_events_when_played;
   goto __pyx_L0;
 
-  /* "mpfmc/core/audio/track.pyx":119
+  /* "mpfmc/core/audio/track.pyx":162
  * 
  *     @property
  *     def events_when_played(self):             # <<<<<<<<<<<<<<
@@ -2660,7 +3433,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_18events_when_played
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":124
+/* "mpfmc/core/audio/track.pyx":167
  * 
  *     @events_when_played.setter
  *     def events_when_played(self, events):             # <<<<<<<<<<<<<<
@@ -2687,14 +3460,14 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_18events_when_played_2__se
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("__set__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":126
+  /* "mpfmc/core/audio/track.pyx":169
  *     def events_when_played(self, events):
  *         """Sets the list of events that are posted when the track is played"""
  *         self._events_when_played = events             # <<<<<<<<<<<<<<
  * 
  *     @property
  */
-  if (!(likely(PyList_CheckExact(__pyx_v_events))||((__pyx_v_events) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "list", Py_TYPE(__pyx_v_events)->tp_name), 0))) __PYX_ERR(0, 126, __pyx_L1_error)
+  if (!(likely(PyList_CheckExact(__pyx_v_events))||((__pyx_v_events) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "list", Py_TYPE(__pyx_v_events)->tp_name), 0))) __PYX_ERR(0, 169, __pyx_L1_error)
   __pyx_t_1 = __pyx_v_events;
   __Pyx_INCREF(__pyx_t_1);
   __Pyx_GIVEREF(__pyx_t_1);
@@ -2703,7 +3476,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_18events_when_played_2__se
   __pyx_v_self->_events_when_played = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/track.pyx":124
+  /* "mpfmc/core/audio/track.pyx":167
  * 
  *     @events_when_played.setter
  *     def events_when_played(self, events):             # <<<<<<<<<<<<<<
@@ -2723,7 +3496,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_18events_when_played_2__se
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":129
+/* "mpfmc/core/audio/track.pyx":172
  * 
  *     @property
  *     def events_when_paused(self):             # <<<<<<<<<<<<<<
@@ -2749,7 +3522,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_18events_when_paused
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":131
+  /* "mpfmc/core/audio/track.pyx":174
  *     def events_when_paused(self):
  *         """Return the list of events that are posted when the track is paused"""
  *         return self._events_when_paused             # <<<<<<<<<<<<<<
@@ -2761,7 +3534,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_18events_when_paused
   __pyx_r = __pyx_v_self->_events_when_paused;
   goto __pyx_L0;
 
-  /* "mpfmc/core/audio/track.pyx":129
+  /* "mpfmc/core/audio/track.pyx":172
  * 
  *     @property
  *     def events_when_paused(self):             # <<<<<<<<<<<<<<
@@ -2776,7 +3549,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_18events_when_paused
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":134
+/* "mpfmc/core/audio/track.pyx":177
  * 
  *     @events_when_paused.setter
  *     def events_when_paused(self, events):             # <<<<<<<<<<<<<<
@@ -2803,14 +3576,14 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_18events_when_paused_2__se
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("__set__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":136
+  /* "mpfmc/core/audio/track.pyx":179
  *     def events_when_paused(self, events):
  *         """Sets the list of events that are posted when the track is paused"""
  *         self._events_when_paused = events             # <<<<<<<<<<<<<<
  * 
  *     @property
  */
-  if (!(likely(PyList_CheckExact(__pyx_v_events))||((__pyx_v_events) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "list", Py_TYPE(__pyx_v_events)->tp_name), 0))) __PYX_ERR(0, 136, __pyx_L1_error)
+  if (!(likely(PyList_CheckExact(__pyx_v_events))||((__pyx_v_events) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "list", Py_TYPE(__pyx_v_events)->tp_name), 0))) __PYX_ERR(0, 179, __pyx_L1_error)
   __pyx_t_1 = __pyx_v_events;
   __Pyx_INCREF(__pyx_t_1);
   __Pyx_GIVEREF(__pyx_t_1);
@@ -2819,7 +3592,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_18events_when_paused_2__se
   __pyx_v_self->_events_when_paused = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "mpfmc/core/audio/track.pyx":134
+  /* "mpfmc/core/audio/track.pyx":177
  * 
  *     @events_when_paused.setter
  *     def events_when_paused(self, events):             # <<<<<<<<<<<<<<
@@ -2839,7 +3612,7 @@ static int __pyx_pf_5mpfmc_4core_5audio_5track_5Track_18events_when_paused_2__se
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":139
+/* "mpfmc/core/audio/track.pyx":182
  * 
  *     @property
  *     def supports_in_memory_sounds(self):             # <<<<<<<<<<<<<<
@@ -2866,20 +3639,20 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_25supports_in_memory
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":141
+  /* "mpfmc/core/audio/track.pyx":184
  *     def supports_in_memory_sounds(self):
  *         """Return whether or not track supports in-memory sounds"""
  *         raise NotImplementedError('Must be overridden in derived class')             # <<<<<<<<<<<<<<
  * 
  *     @property
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 141, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 184, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_Raise(__pyx_t_1, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(0, 141, __pyx_L1_error)
+  __PYX_ERR(0, 184, __pyx_L1_error)
 
-  /* "mpfmc/core/audio/track.pyx":139
+  /* "mpfmc/core/audio/track.pyx":182
  * 
  *     @property
  *     def supports_in_memory_sounds(self):             # <<<<<<<<<<<<<<
@@ -2897,7 +3670,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_25supports_in_memory
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":144
+/* "mpfmc/core/audio/track.pyx":187
  * 
  *     @property
  *     def supports_streaming_sounds(self):             # <<<<<<<<<<<<<<
@@ -2924,20 +3697,20 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_25supports_streaming
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":146
+  /* "mpfmc/core/audio/track.pyx":189
  *     def supports_streaming_sounds(self):
  *         """Return whether or not track supports streaming sounds"""
  *         raise NotImplementedError('Must be overridden in derived class')             # <<<<<<<<<<<<<<
  * 
  *     @property
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple__4, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 146, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple__4, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 189, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_Raise(__pyx_t_1, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(0, 146, __pyx_L1_error)
+  __PYX_ERR(0, 189, __pyx_L1_error)
 
-  /* "mpfmc/core/audio/track.pyx":144
+  /* "mpfmc/core/audio/track.pyx":187
  * 
  *     @property
  *     def supports_streaming_sounds(self):             # <<<<<<<<<<<<<<
@@ -2955,7 +3728,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_25supports_streaming
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":149
+/* "mpfmc/core/audio/track.pyx":192
  * 
  *     @property
  *     def fading(self):             # <<<<<<<<<<<<<<
@@ -2984,7 +3757,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6fading___get__(stru
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":151
+  /* "mpfmc/core/audio/track.pyx":194
  *     def fading(self):
  *         """Return whether or not the track is currently fading"""
  *         cdef bint fading = False             # <<<<<<<<<<<<<<
@@ -2993,7 +3766,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6fading___get__(stru
  */
   __pyx_v_fading = 0;
 
-  /* "mpfmc/core/audio/track.pyx":152
+  /* "mpfmc/core/audio/track.pyx":195
  *         """Return whether or not the track is currently fading"""
  *         cdef bint fading = False
  *         if self.state != NULL:             # <<<<<<<<<<<<<<
@@ -3003,7 +3776,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6fading___get__(stru
   __pyx_t_1 = ((__pyx_v_self->state != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/track.pyx":153
+    /* "mpfmc/core/audio/track.pyx":196
  *         cdef bint fading = False
  *         if self.state != NULL:
  *             SDL_LockAudio()             # <<<<<<<<<<<<<<
@@ -3012,7 +3785,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6fading___get__(stru
  */
     SDL_LockAudio();
 
-    /* "mpfmc/core/audio/track.pyx":154
+    /* "mpfmc/core/audio/track.pyx":197
  *         if self.state != NULL:
  *             SDL_LockAudio()
  *             fading = self.state.fade_steps_remaining > 0             # <<<<<<<<<<<<<<
@@ -3021,7 +3794,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6fading___get__(stru
  */
     __pyx_v_fading = (__pyx_v_self->state->fade_steps_remaining > 0);
 
-    /* "mpfmc/core/audio/track.pyx":155
+    /* "mpfmc/core/audio/track.pyx":198
  *             SDL_LockAudio()
  *             fading = self.state.fade_steps_remaining > 0
  *             SDL_UnlockAudio()             # <<<<<<<<<<<<<<
@@ -3030,7 +3803,7 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6fading___get__(stru
  */
     SDL_UnlockAudio();
 
-    /* "mpfmc/core/audio/track.pyx":152
+    /* "mpfmc/core/audio/track.pyx":195
  *         """Return whether or not the track is currently fading"""
  *         cdef bint fading = False
  *         if self.state != NULL:             # <<<<<<<<<<<<<<
@@ -3039,21 +3812,21 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6fading___get__(stru
  */
   }
 
-  /* "mpfmc/core/audio/track.pyx":156
+  /* "mpfmc/core/audio/track.pyx":199
  *             fading = self.state.fade_steps_remaining > 0
  *             SDL_UnlockAudio()
  *         return fading             # <<<<<<<<<<<<<<
  * 
- *     def clear_context(self, context):
+ *     @property
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = __Pyx_PyBool_FromLong(__pyx_v_fading); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 156, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyBool_FromLong(__pyx_v_fading); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 199, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_r = __pyx_t_2;
   __pyx_t_2 = 0;
   goto __pyx_L0;
 
-  /* "mpfmc/core/audio/track.pyx":149
+  /* "mpfmc/core/audio/track.pyx":192
  * 
  *     @property
  *     def fading(self):             # <<<<<<<<<<<<<<
@@ -3072,463 +3845,413 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_6fading___get__(stru
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":158
- *         return fading
+/* "mpfmc/core/audio/track.pyx":202
  * 
- *     def clear_context(self, context):             # <<<<<<<<<<<<<<
- *         """Stop all sounds played from the specified context."""
- *         raise NotImplementedError('Must be overridden in derived class')
+ *     @property
+ *     def inserts(self):             # <<<<<<<<<<<<<<
+ *         """Return the list of DSP insert settings applied to the track (in processing order)"""
+ *         return self._inserts
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_9clear_context(PyObject *__pyx_v_self, PyObject *__pyx_v_context); /*proto*/
-static char __pyx_doc_5mpfmc_4core_5audio_5track_5Track_8clear_context[] = "Track.clear_context(self, context)\nStop all sounds played from the specified context.";
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_9clear_context(PyObject *__pyx_v_self, PyObject *__pyx_v_context) {
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_7inserts_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_7inserts_1__get__(PyObject *__pyx_v_self) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("clear_context (wrapper)", 0);
-  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_5track_5Track_8clear_context(((struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)__pyx_v_self), ((PyObject *)__pyx_v_context));
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_5track_5Track_7inserts___get__(((struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_8clear_context(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v_context) {
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_7inserts___get__(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("clear_context", 0);
+  __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "mpfmc/core/audio/track.pyx":160
- *     def clear_context(self, context):
- *         """Stop all sounds played from the specified context."""
- *         raise NotImplementedError('Must be overridden in derived class')             # <<<<<<<<<<<<<<
+  /* "mpfmc/core/audio/track.pyx":204
+ *     def inserts(self):
+ *         """Return the list of DSP insert settings applied to the track (in processing order)"""
+ *         return self._inserts             # <<<<<<<<<<<<<<
  * 
- *     def set_volume(self, float volume, float fade_seconds = 0.0):
+ *     def set_inserts(self, list inserts not None):
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple__5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 160, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(0, 160, __pyx_L1_error)
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_self->_inserts);
+  __pyx_r = __pyx_v_self->_inserts;
+  goto __pyx_L0;
 
-  /* "mpfmc/core/audio/track.pyx":158
- *         return fading
+  /* "mpfmc/core/audio/track.pyx":202
  * 
- *     def clear_context(self, context):             # <<<<<<<<<<<<<<
- *         """Stop all sounds played from the specified context."""
- *         raise NotImplementedError('Must be overridden in derived class')
+ *     @property
+ *     def inserts(self):             # <<<<<<<<<<<<<<
+ *         """Return the list of DSP insert settings applied to the track (in processing order)"""
+ *         return self._inserts
  */
 
   /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("mpfmc.core.audio.track.Track.clear_context", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
+  __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":162
- *         raise NotImplementedError('Must be overridden in derived class')
+/* "mpfmc/core/audio/track.pyx":206
+ *         return self._inserts
  * 
- *     def set_volume(self, float volume, float fade_seconds = 0.0):             # <<<<<<<<<<<<<<
- *         """Sets the current track volume with an optional fade time"""
- *         cdef Uint8 new_volume = <Uint8>min(max(volume * SDL_MIX_MAXVOLUME, 0), SDL_MIX_MAXVOLUME)
+ *     def set_inserts(self, list inserts not None):             # <<<<<<<<<<<<<<
+ *         """
+ *         Sets the DSP insert chain applied to the track (requires the floating-point mix bus).
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_11set_volume(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_5mpfmc_4core_5audio_5track_5Track_10set_volume[] = "Track.set_volume(self, float volume, float fade_seconds=0.0)\nSets the current track volume with an optional fade time";
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_11set_volume(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  float __pyx_v_volume;
-  float __pyx_v_fade_seconds;
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_9set_inserts(PyObject *__pyx_v_self, PyObject *__pyx_v_inserts); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_5track_5Track_8set_inserts[] = "Track.set_inserts(self, list inserts)\n\n        Sets the DSP insert chain applied to the track (requires the floating-point mix bus).\n        Args:\n            inserts: A list of insert settings dictionaries (in processing order)\n        ";
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_9set_inserts(PyObject *__pyx_v_self, PyObject *__pyx_v_inserts) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("set_volume (wrapper)", 0);
-  {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_volume,&__pyx_n_s_fade_seconds,0};
-    PyObject* values[2] = {0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
-      switch (pos_args) {
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (pos_args) {
-        case  0:
-        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_volume)) != 0)) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        CYTHON_FALLTHROUGH;
-        case  1:
-        if (kw_args > 0) {
-          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_fade_seconds);
-          if (value) { values[1] = value; kw_args--; }
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "set_volume") < 0)) __PYX_ERR(0, 162, __pyx_L3_error)
-      }
-    } else {
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-    }
-    __pyx_v_volume = __pyx_PyFloat_AsFloat(values[0]); if (unlikely((__pyx_v_volume == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 162, __pyx_L3_error)
-    if (values[1]) {
-      __pyx_v_fade_seconds = __pyx_PyFloat_AsFloat(values[1]); if (unlikely((__pyx_v_fade_seconds == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 162, __pyx_L3_error)
-    } else {
-      __pyx_v_fade_seconds = ((float)0.0);
-    }
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("set_volume", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 162, __pyx_L3_error)
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("mpfmc.core.audio.track.Track.set_volume", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(((struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)__pyx_v_self), __pyx_v_volume, __pyx_v_fade_seconds);
+  __Pyx_RefNannySetupContext("set_inserts (wrapper)", 0);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_inserts), (&PyList_Type), 0, "inserts", 1))) __PYX_ERR(0, 206, __pyx_L1_error)
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_5track_5Track_8set_inserts(((struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)__pyx_v_self), ((PyObject*)__pyx_v_inserts));
 
   /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self, float __pyx_v_volume, float __pyx_v_fade_seconds) {
-  Uint8 __pyx_v_new_volume;
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_8set_inserts(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self, PyObject *__pyx_v_inserts) {
+  __pyx_t_5mpfmc_4core_5audio_3dsp_DspChain *__pyx_v_new_chain;
+  __pyx_t_5mpfmc_4core_5audio_3dsp_DspChain *__pyx_v_old_chain;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
-  long __pyx_t_2;
-  float __pyx_t_3;
-  float __pyx_t_4;
-  int __pyx_t_5;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
   PyObject *__pyx_t_6 = NULL;
   PyObject *__pyx_t_7 = NULL;
-  PyObject *__pyx_t_8 = NULL;
-  PyObject *__pyx_t_9 = NULL;
-  PyObject *__pyx_t_10 = NULL;
-  Uint32 __pyx_t_11;
-  Uint8 __pyx_t_12;
-  __Pyx_RefNannySetupContext("set_volume", 0);
+  __pyx_t_5mpfmc_4core_5audio_3dsp_DspChain *__pyx_t_8;
+  Py_ssize_t __pyx_t_9;
+  int __pyx_t_10;
+  __Pyx_RefNannySetupContext("set_inserts", 0);
 
-  /* "mpfmc/core/audio/track.pyx":164
- *     def set_volume(self, float volume, float fade_seconds = 0.0):
- *         """Sets the current track volume with an optional fade time"""
- *         cdef Uint8 new_volume = <Uint8>min(max(volume * SDL_MIX_MAXVOLUME, 0), SDL_MIX_MAXVOLUME)             # <<<<<<<<<<<<<<
- *         SDL_LockAudio()
+  /* "mpfmc/core/audio/track.pyx":212
+ *             inserts: A list of insert settings dictionaries (in processing order)
+ *         """
+ *         cdef DspChain *new_chain = NULL             # <<<<<<<<<<<<<<
+ *         cdef DspChain *old_chain
  * 
  */
-  __pyx_t_1 = SDL_MIX_MAXVOLUME;
-  __pyx_t_2 = 0;
-  __pyx_t_3 = (__pyx_v_volume * SDL_MIX_MAXVOLUME);
-  if (((__pyx_t_2 > __pyx_t_3) != 0)) {
-    __pyx_t_4 = __pyx_t_2;
-  } else {
-    __pyx_t_4 = __pyx_t_3;
-  }
-  __pyx_t_3 = __pyx_t_4;
-  if (((__pyx_t_1 < __pyx_t_3) != 0)) {
-    __pyx_t_4 = __pyx_t_1;
-  } else {
-    __pyx_t_4 = __pyx_t_3;
-  }
-  __pyx_v_new_volume = ((Uint8)__pyx_t_4);
+  __pyx_v_new_chain = NULL;
 
-  /* "mpfmc/core/audio/track.pyx":165
- *         """Sets the current track volume with an optional fade time"""
- *         cdef Uint8 new_volume = <Uint8>min(max(volume * SDL_MIX_MAXVOLUME, 0), SDL_MIX_MAXVOLUME)
- *         SDL_LockAudio()             # <<<<<<<<<<<<<<
+  /* "mpfmc/core/audio/track.pyx":215
+ *         cdef DspChain *old_chain
  * 
- *         # Fades require special logic
+ *         if not self.state.callback_data.float_mix_bus:             # <<<<<<<<<<<<<<
+ *             raise AudioException("Could not set inserts on '{}' track - DSP inserts require the "
+ *                                  "floating-point mix bus".format(self._name))
  */
-  SDL_LockAudio();
+  __pyx_t_1 = ((!(__pyx_v_self->state->callback_data->float_mix_bus != 0)) != 0);
+  if (__pyx_t_1) {
 
-  /* "mpfmc/core/audio/track.pyx":168
+    /* "mpfmc/core/audio/track.pyx":216
+ * 
+ *         if not self.state.callback_data.float_mix_bus:
+ *             raise AudioException("Could not set inserts on '{}' track - DSP inserts require the "             # <<<<<<<<<<<<<<
+ *                                  "floating-point mix bus".format(self._name))
  * 
- *         # Fades require special logic
- *         if fade_seconds > 0:             # <<<<<<<<<<<<<<
- *             if self.state.status == track_status_stopping or self.state.status == track_status_pausing:
- *                 # Fade is ignored if track is in the process of stopping or pausing
- */
-  __pyx_t_5 = ((__pyx_v_fade_seconds > 0.0) != 0);
-  if (__pyx_t_5) {
-
-    /* "mpfmc/core/audio/track.pyx":169
- *         # Fades require special logic
- *         if fade_seconds > 0:
- *             if self.state.status == track_status_stopping or self.state.status == track_status_pausing:             # <<<<<<<<<<<<<<
- *                 # Fade is ignored if track is in the process of stopping or pausing
- *                 self.state.volume = new_volume
  */
-    switch (__pyx_v_self->state->status) {
-      case __pyx_e_5mpfmc_4core_5audio_5track_track_status_stopping:
-      case __pyx_e_5mpfmc_4core_5audio_5track_track_status_pausing:
+    __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_AudioException); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 216, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
 
-      /* "mpfmc/core/audio/track.pyx":171
- *             if self.state.status == track_status_stopping or self.state.status == track_status_pausing:
- *                 # Fade is ignored if track is in the process of stopping or pausing
- *                 self.state.volume = new_volume             # <<<<<<<<<<<<<<
- *             else:
- *                 # If the track is currently in the middle of a fade, the existing fade
+    /* "mpfmc/core/audio/track.pyx":217
+ *         if not self.state.callback_data.float_mix_bus:
+ *             raise AudioException("Could not set inserts on '{}' track - DSP inserts require the "
+ *                                  "floating-point mix bus".format(self._name))             # <<<<<<<<<<<<<<
+ * 
+ *         if inserts:
  */
-      __pyx_v_self->state->volume = __pyx_v_new_volume;
-
-      /* "mpfmc/core/audio/track.pyx":169
- *         # Fades require special logic
- *         if fade_seconds > 0:
- *             if self.state.status == track_status_stopping or self.state.status == track_status_pausing:             # <<<<<<<<<<<<<<
- *                 # Fade is ignored if track is in the process of stopping or pausing
- *                 self.state.volume = new_volume
- */
-      break;
-      default:
-
-      /* "mpfmc/core/audio/track.pyx":176
- *                 # will be interrupted and a new fade will be calculated from the current
- *                 # point of the existing fade
- *                 if self.state.fade_steps_remaining > 0:             # <<<<<<<<<<<<<<
- *                     self.log.debug("set_volume - Interrupting an existing fade on this track so "
- *                                    "start a new fade")
- */
-      __pyx_t_5 = ((__pyx_v_self->state->fade_steps_remaining > 0) != 0);
-      if (__pyx_t_5) {
-
-        /* "mpfmc/core/audio/track.pyx":177
- *                 # point of the existing fade
- *                 if self.state.fade_steps_remaining > 0:
- *                     self.log.debug("set_volume - Interrupting an existing fade on this track so "             # <<<<<<<<<<<<<<
- *                                    "start a new fade")
- * 
- */
-        __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 177, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_6);
-        __pyx_t_7 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_tuple__6, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 177, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Could_not_set_inserts_on_track_D, __pyx_n_s_format); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 217, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_6 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_5);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_5, function);
+      }
+    }
+    if (!__pyx_t_6) {
+      __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_v_self->_name); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 217, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+    } else {
+      #if CYTHON_FAST_PYCALL
+      if (PyFunction_Check(__pyx_t_5)) {
+        PyObject *__pyx_temp[2] = {__pyx_t_6, __pyx_v_self->_name};
+        __pyx_t_4 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 217, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+        __Pyx_GOTREF(__pyx_t_4);
+      } else
+      #endif
+      #if CYTHON_FAST_PYCCALL
+      if (__Pyx_PyFastCFunction_Check(__pyx_t_5)) {
+        PyObject *__pyx_temp[2] = {__pyx_t_6, __pyx_v_self->_name};
+        __pyx_t_4 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 217, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+        __Pyx_GOTREF(__pyx_t_4);
+      } else
+      #endif
+      {
+        __pyx_t_7 = PyTuple_New(1+1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 217, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_7);
-        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+        __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_6); __pyx_t_6 = NULL;
+        __Pyx_INCREF(__pyx_v_self->_name);
+        __Pyx_GIVEREF(__pyx_v_self->_name);
+        PyTuple_SET_ITEM(__pyx_t_7, 0+1, __pyx_v_self->_name);
+        __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_7, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 217, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
         __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-
-        /* "mpfmc/core/audio/track.pyx":176
- *                 # will be interrupted and a new fade will be calculated from the current
- *                 # point of the existing fade
- *                 if self.state.fade_steps_remaining > 0:             # <<<<<<<<<<<<<<
- *                     self.log.debug("set_volume - Interrupting an existing fade on this track so "
- *                                    "start a new fade")
- */
       }
-
-      /* "mpfmc/core/audio/track.pyx":180
- *                                    "start a new fade")
- * 
- *                 self.log.debug("set_volume - Applying %s second fade to new volume level", str(fade_seconds))             # <<<<<<<<<<<<<<
- * 
- *                 # Calculate fade
- */
-      __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 180, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_6);
-      __pyx_t_8 = PyFloat_FromDouble(__pyx_v_fade_seconds); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 180, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_8);
-      __pyx_t_9 = PyTuple_New(1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 180, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_9);
-      __Pyx_GIVEREF(__pyx_t_8);
-      PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_8);
-      __pyx_t_8 = 0;
-      __pyx_t_8 = __Pyx_PyObject_Call(((PyObject *)(&PyUnicode_Type)), __pyx_t_9, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 180, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_8);
-      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-      __pyx_t_9 = NULL;
-      __pyx_t_1 = 0;
-      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
-        __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_6);
-        if (likely(__pyx_t_9)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
-          __Pyx_INCREF(__pyx_t_9);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_6, function);
-          __pyx_t_1 = 1;
-        }
+    }
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_5 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
       }
+    }
+    if (!__pyx_t_5) {
+      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 216, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_GOTREF(__pyx_t_2);
+    } else {
       #if CYTHON_FAST_PYCALL
-      if (PyFunction_Check(__pyx_t_6)) {
-        PyObject *__pyx_temp[3] = {__pyx_t_9, __pyx_kp_u_set_volume_Applying_s_second_fad, __pyx_t_8};
-        __pyx_t_7 = __Pyx_PyFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_1, 2+__pyx_t_1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 180, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
-        __Pyx_GOTREF(__pyx_t_7);
-        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      if (PyFunction_Check(__pyx_t_3)) {
+        PyObject *__pyx_temp[2] = {__pyx_t_5, __pyx_t_4};
+        __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 216, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       } else
       #endif
       #if CYTHON_FAST_PYCCALL
-      if (__Pyx_PyFastCFunction_Check(__pyx_t_6)) {
-        PyObject *__pyx_temp[3] = {__pyx_t_9, __pyx_kp_u_set_volume_Applying_s_second_fad, __pyx_t_8};
-        __pyx_t_7 = __Pyx_PyCFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_1, 2+__pyx_t_1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 180, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
-        __Pyx_GOTREF(__pyx_t_7);
-        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+        PyObject *__pyx_temp[2] = {__pyx_t_5, __pyx_t_4};
+        __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 216, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       } else
       #endif
       {
-        __pyx_t_10 = PyTuple_New(2+__pyx_t_1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 180, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_10);
-        if (__pyx_t_9) {
-          __Pyx_GIVEREF(__pyx_t_9); PyTuple_SET_ITEM(__pyx_t_10, 0, __pyx_t_9); __pyx_t_9 = NULL;
-        }
-        __Pyx_INCREF(__pyx_kp_u_set_volume_Applying_s_second_fad);
-        __Pyx_GIVEREF(__pyx_kp_u_set_volume_Applying_s_second_fad);
-        PyTuple_SET_ITEM(__pyx_t_10, 0+__pyx_t_1, __pyx_kp_u_set_volume_Applying_s_second_fad);
-        __Pyx_GIVEREF(__pyx_t_8);
-        PyTuple_SET_ITEM(__pyx_t_10, 1+__pyx_t_1, __pyx_t_8);
-        __pyx_t_8 = 0;
-        __pyx_t_7 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_10, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 180, __pyx_L1_error)
+        __pyx_t_7 = PyTuple_New(1+1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 216, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_7);
-        __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+        __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_5); __pyx_t_5 = NULL;
+        __Pyx_GIVEREF(__pyx_t_4);
+        PyTuple_SET_ITEM(__pyx_t_7, 0+1, __pyx_t_4);
+        __pyx_t_4 = 0;
+        __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_7, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 216, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
       }
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 216, __pyx_L1_error)
 
-      /* "mpfmc/core/audio/track.pyx":183
+    /* "mpfmc/core/audio/track.pyx":215
+ *         cdef DspChain *old_chain
  * 
- *                 # Calculate fade
- *                 self.state.fade_steps = <Uint32>(fade_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point             # <<<<<<<<<<<<<<
- *                 self.state.fade_steps_remaining = self.state.fade_steps
- *                 self.state.fade_volume_start = self.state.fade_volume_current
+ *         if not self.state.callback_data.float_mix_bus:             # <<<<<<<<<<<<<<
+ *             raise AudioException("Could not set inserts on '{}' track - DSP inserts require the "
+ *                                  "floating-point mix bus".format(self._name))
  */
-      __pyx_t_11 = ((Uint32)(__pyx_v_fade_seconds * __pyx_v_self->state->callback_data->seconds_to_bytes_factor));
-      if (unlikely(__pyx_v_self->state->callback_data->bytes_per_control_point == 0)) {
-        PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
-        __PYX_ERR(0, 183, __pyx_L1_error)
-      }
-      __pyx_v_self->state->fade_steps = (__pyx_t_11 / __pyx_v_self->state->callback_data->bytes_per_control_point);
+  }
 
-      /* "mpfmc/core/audio/track.pyx":184
- *                 # Calculate fade
- *                 self.state.fade_steps = <Uint32>(fade_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
- *                 self.state.fade_steps_remaining = self.state.fade_steps             # <<<<<<<<<<<<<<
- *                 self.state.fade_volume_start = self.state.fade_volume_current
- *                 self.state.fade_volume_target = new_volume
+  /* "mpfmc/core/audio/track.pyx":219
+ *                                  "floating-point mix bus".format(self._name))
+ * 
+ *         if inserts:             # <<<<<<<<<<<<<<
+ *             new_chain = create_dsp_chain(inserts,
+ *                                          self.state.callback_data.sample_rate,
  */
-      __pyx_t_11 = __pyx_v_self->state->fade_steps;
-      __pyx_v_self->state->fade_steps_remaining = __pyx_t_11;
+  __pyx_t_1 = (__pyx_v_inserts != Py_None) && (PyList_GET_SIZE(__pyx_v_inserts) != 0);
+  if (__pyx_t_1) {
 
-      /* "mpfmc/core/audio/track.pyx":185
- *                 self.state.fade_steps = <Uint32>(fade_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
- *                 self.state.fade_steps_remaining = self.state.fade_steps
- *                 self.state.fade_volume_start = self.state.fade_volume_current             # <<<<<<<<<<<<<<
- *                 self.state.fade_volume_target = new_volume
- *                 self.state.volume = new_volume
+    /* "mpfmc/core/audio/track.pyx":220
+ * 
+ *         if inserts:
+ *             new_chain = create_dsp_chain(inserts,             # <<<<<<<<<<<<<<
+ *                                          self.state.callback_data.sample_rate,
+ *                                          self.state.callback_data.channels)
  */
-      __pyx_t_12 = __pyx_v_self->state->fade_volume_current;
-      __pyx_v_self->state->fade_volume_start = __pyx_t_12;
+    __pyx_t_8 = __pyx_f_5mpfmc_4core_5audio_5track_create_dsp_chain(__pyx_v_inserts, __pyx_v_self->state->callback_data->sample_rate, __pyx_v_self->state->callback_data->channels); if (unlikely(__pyx_t_8 == ((__pyx_t_5mpfmc_4core_5audio_3dsp_DspChain *)NULL))) __PYX_ERR(0, 220, __pyx_L1_error)
+    __pyx_v_new_chain = __pyx_t_8;
 
-      /* "mpfmc/core/audio/track.pyx":186
- *                 self.state.fade_steps_remaining = self.state.fade_steps
- *                 self.state.fade_volume_start = self.state.fade_volume_current
- *                 self.state.fade_volume_target = new_volume             # <<<<<<<<<<<<<<
- *                 self.state.volume = new_volume
- *         else:
+    /* "mpfmc/core/audio/track.pyx":219
+ *                                  "floating-point mix bus".format(self._name))
+ * 
+ *         if inserts:             # <<<<<<<<<<<<<<
+ *             new_chain = create_dsp_chain(inserts,
+ *                                          self.state.callback_data.sample_rate,
  */
-      __pyx_v_self->state->fade_volume_target = __pyx_v_new_volume;
+  }
 
-      /* "mpfmc/core/audio/track.pyx":187
- *                 self.state.fade_volume_start = self.state.fade_volume_current
- *                 self.state.fade_volume_target = new_volume
- *                 self.state.volume = new_volume             # <<<<<<<<<<<<<<
- *         else:
- *             self.state.volume = new_volume
+  /* "mpfmc/core/audio/track.pyx":224
+ *                                          self.state.callback_data.channels)
+ * 
+ *         SDL_LockAudio()             # <<<<<<<<<<<<<<
+ *         old_chain = self.state.inserts
+ *         self.state.inserts = new_chain
  */
-      __pyx_v_self->state->volume = __pyx_v_new_volume;
-      break;
-    }
+  SDL_LockAudio();
 
-    /* "mpfmc/core/audio/track.pyx":168
+  /* "mpfmc/core/audio/track.pyx":225
  * 
- *         # Fades require special logic
- *         if fade_seconds > 0:             # <<<<<<<<<<<<<<
- *             if self.state.status == track_status_stopping or self.state.status == track_status_pausing:
- *                 # Fade is ignored if track is in the process of stopping or pausing
+ *         SDL_LockAudio()
+ *         old_chain = self.state.inserts             # <<<<<<<<<<<<<<
+ *         self.state.inserts = new_chain
+ *         SDL_UnlockAudio()
  */
-    goto __pyx_L3;
-  }
+  __pyx_t_8 = __pyx_v_self->state->inserts;
+  __pyx_v_old_chain = __pyx_t_8;
 
-  /* "mpfmc/core/audio/track.pyx":189
- *                 self.state.volume = new_volume
- *         else:
- *             self.state.volume = new_volume             # <<<<<<<<<<<<<<
- *             self.state.fade_volume_current = new_volume
- *             self.state.fade_volume_start = new_volume
+  /* "mpfmc/core/audio/track.pyx":226
+ *         SDL_LockAudio()
+ *         old_chain = self.state.inserts
+ *         self.state.inserts = new_chain             # <<<<<<<<<<<<<<
+ *         SDL_UnlockAudio()
+ * 
  */
-  /*else*/ {
-    __pyx_v_self->state->volume = __pyx_v_new_volume;
+  __pyx_v_self->state->inserts = __pyx_v_new_chain;
 
-    /* "mpfmc/core/audio/track.pyx":190
- *         else:
- *             self.state.volume = new_volume
- *             self.state.fade_volume_current = new_volume             # <<<<<<<<<<<<<<
- *             self.state.fade_volume_start = new_volume
- *             self.state.fade_volume_target = new_volume
+  /* "mpfmc/core/audio/track.pyx":227
+ *         old_chain = self.state.inserts
+ *         self.state.inserts = new_chain
+ *         SDL_UnlockAudio()             # <<<<<<<<<<<<<<
+ * 
+ *         free_dsp_chain(old_chain)
  */
-    __pyx_v_self->state->fade_volume_current = __pyx_v_new_volume;
+  SDL_UnlockAudio();
 
-    /* "mpfmc/core/audio/track.pyx":191
- *             self.state.volume = new_volume
- *             self.state.fade_volume_current = new_volume
- *             self.state.fade_volume_start = new_volume             # <<<<<<<<<<<<<<
- *             self.state.fade_volume_target = new_volume
+  /* "mpfmc/core/audio/track.pyx":229
+ *         SDL_UnlockAudio()
  * 
+ *         free_dsp_chain(old_chain)             # <<<<<<<<<<<<<<
+ *         self._inserts = list(inserts)
+ *         self.log.debug("set_inserts - %d insert(s) applied to the track", len(inserts))
  */
-    __pyx_v_self->state->fade_volume_start = __pyx_v_new_volume;
+  __pyx_f_5mpfmc_4core_5audio_5track_free_dsp_chain(__pyx_v_old_chain);
 
-    /* "mpfmc/core/audio/track.pyx":192
- *             self.state.fade_volume_current = new_volume
- *             self.state.fade_volume_start = new_volume
- *             self.state.fade_volume_target = new_volume             # <<<<<<<<<<<<<<
+  /* "mpfmc/core/audio/track.pyx":230
+ * 
+ *         free_dsp_chain(old_chain)
+ *         self._inserts = list(inserts)             # <<<<<<<<<<<<<<
+ *         self.log.debug("set_inserts - %d insert(s) applied to the track", len(inserts))
  * 
- *         SDL_UnlockAudio()
  */
-    __pyx_v_self->state->fade_volume_target = __pyx_v_new_volume;
-  }
-  __pyx_L3:;
+  __pyx_t_2 = PySequence_List(__pyx_v_inserts); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 230, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __Pyx_GOTREF(__pyx_v_self->_inserts);
+  __Pyx_DECREF(__pyx_v_self->_inserts);
+  __pyx_v_self->_inserts = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
 
-  /* "mpfmc/core/audio/track.pyx":194
- *             self.state.fade_volume_target = new_volume
+  /* "mpfmc/core/audio/track.pyx":231
+ *         free_dsp_chain(old_chain)
+ *         self._inserts = list(inserts)
+ *         self.log.debug("set_inserts - %d insert(s) applied to the track", len(inserts))             # <<<<<<<<<<<<<<
  * 
- *         SDL_UnlockAudio()             # <<<<<<<<<<<<<<
- * 
- *     def play(self, float fade_in_seconds = 0.0):
+ *     def get_performance_counters(self, bint reset=False):
  */
-  SDL_UnlockAudio();
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 231, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_9 = PyList_GET_SIZE(__pyx_v_inserts); if (unlikely(__pyx_t_9 == ((Py_ssize_t)-1))) __PYX_ERR(0, 231, __pyx_L1_error)
+  __pyx_t_7 = PyInt_FromSsize_t(__pyx_t_9); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 231, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_4 = NULL;
+  __pyx_t_10 = 0;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+      __pyx_t_10 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_kp_u_set_inserts_d_insert_s_applied_t, __pyx_t_7};
+    __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_10, 2+__pyx_t_10); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 231, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_kp_u_set_inserts_d_insert_s_applied_t, __pyx_t_7};
+    __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_10, 2+__pyx_t_10); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 231, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  } else
+  #endif
+  {
+    __pyx_t_5 = PyTuple_New(2+__pyx_t_10); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 231, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    if (__pyx_t_4) {
+      __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4); __pyx_t_4 = NULL;
+    }
+    __Pyx_INCREF(__pyx_kp_u_set_inserts_d_insert_s_applied_t);
+    __Pyx_GIVEREF(__pyx_kp_u_set_inserts_d_insert_s_applied_t);
+    PyTuple_SET_ITEM(__pyx_t_5, 0+__pyx_t_10, __pyx_kp_u_set_inserts_d_insert_s_applied_t);
+    __Pyx_GIVEREF(__pyx_t_7);
+    PyTuple_SET_ITEM(__pyx_t_5, 1+__pyx_t_10, __pyx_t_7);
+    __pyx_t_7 = 0;
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_5, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 231, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "mpfmc/core/audio/track.pyx":162
- *         raise NotImplementedError('Must be overridden in derived class')
+  /* "mpfmc/core/audio/track.pyx":206
+ *         return self._inserts
  * 
- *     def set_volume(self, float volume, float fade_seconds = 0.0):             # <<<<<<<<<<<<<<
- *         """Sets the current track volume with an optional fade time"""
- *         cdef Uint8 new_volume = <Uint8>min(max(volume * SDL_MIX_MAXVOLUME, 0), SDL_MIX_MAXVOLUME)
+ *     def set_inserts(self, list inserts not None):             # <<<<<<<<<<<<<<
+ *         """
+ *         Sets the DSP insert chain applied to the track (requires the floating-point mix bus).
  */
 
   /* function exit code */
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
   __Pyx_XDECREF(__pyx_t_6);
   __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_XDECREF(__pyx_t_9);
-  __Pyx_XDECREF(__pyx_t_10);
-  __Pyx_AddTraceback("mpfmc.core.audio.track.Track.set_volume", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("mpfmc.core.audio.track.Track.set_inserts", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -3536,24 +4259,24 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10set_volume(struct
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":196
- *         SDL_UnlockAudio()
+/* "mpfmc/core/audio/track.pyx":233
+ *         self.log.debug("set_inserts - %d insert(s) applied to the track", len(inserts))
  * 
- *     def play(self, float fade_in_seconds = 0.0):             # <<<<<<<<<<<<<<
+ *     def get_performance_counters(self, bint reset=False):             # <<<<<<<<<<<<<<
  *         """
- *         Starts playing the track so it can begin processing sounds. Function has no effect if
+ *         Returns the track performance counters.
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_13play(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_5mpfmc_4core_5audio_5track_5Track_12play[] = "Track.play(self, float fade_in_seconds=0.0)\n\n        Starts playing the track so it can begin processing sounds. Function has no effect if\n        the track is already playing.\n        Args:\n            fade_in_seconds: The number of seconds to fade in the track\n        ";
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_13play(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  float __pyx_v_fade_in_seconds;
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_11get_performance_counters(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_5track_5Track_10get_performance_counters[] = "Track.get_performance_counters(self, bool reset=False)\n\n        Returns the track performance counters.\n        Args:\n            reset: Whether or not to reset the counters once they have been read\n\n        Returns:\n            A dictionary containing the time (in microseconds) needed to mix the track sounds\n            in recent audio callbacks ('mix_time'), the number of sound players active in the\n            last callback ('active_sound_players') and the number of times a streaming sound\n            did not have any samples ready ('streaming_underruns').\n        ";
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_11get_performance_counters(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  int __pyx_v_reset;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("play (wrapper)", 0);
+  __Pyx_RefNannySetupContext("get_performance_counters (wrapper)", 0);
   {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_fade_in_seconds,0};
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_reset,0};
     PyObject* values[1] = {0};
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
@@ -3568,12 +4291,12 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_13play(PyObject *__p
       switch (pos_args) {
         case  0:
         if (kw_args > 0) {
-          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_fade_in_seconds);
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_reset);
           if (value) { values[0] = value; kw_args--; }
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "play") < 0)) __PYX_ERR(0, 196, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "get_performance_counters") < 0)) __PYX_ERR(0, 233, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -3584,480 +4307,248 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_13play(PyObject *__p
       }
     }
     if (values[0]) {
-      __pyx_v_fade_in_seconds = __pyx_PyFloat_AsFloat(values[0]); if (unlikely((__pyx_v_fade_in_seconds == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 196, __pyx_L3_error)
+      __pyx_v_reset = __Pyx_PyObject_IsTrue(values[0]); if (unlikely((__pyx_v_reset == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 233, __pyx_L3_error)
     } else {
-      __pyx_v_fade_in_seconds = ((float)0.0);
+      __pyx_v_reset = ((int)0);
     }
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("play", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 196, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("get_performance_counters", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 233, __pyx_L3_error)
   __pyx_L3_error:;
-  __Pyx_AddTraceback("mpfmc.core.audio.track.Track.play", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("mpfmc.core.audio.track.Track.get_performance_counters", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(((struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)__pyx_v_self), __pyx_v_fade_in_seconds);
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_5track_5Track_10get_performance_counters(((struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)__pyx_v_self), __pyx_v_reset);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12play(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self, float __pyx_v_fade_in_seconds) {
-  PyObject *__pyx_v_event = NULL;
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_10get_performance_counters(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self, int __pyx_v_reset) {
+  PyObject *__pyx_v_counters = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   int __pyx_t_3;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  int __pyx_t_6;
-  PyObject *__pyx_t_7 = NULL;
-  Uint32 __pyx_t_8;
-  Uint8 __pyx_t_9;
-  int __pyx_t_10;
-  Py_ssize_t __pyx_t_11;
-  PyObject *(*__pyx_t_12)(PyObject *);
-  __Pyx_RefNannySetupContext("play", 0);
+  __Pyx_RefNannySetupContext("get_performance_counters", 0);
 
-  /* "mpfmc/core/audio/track.pyx":203
- *             fade_in_seconds: The number of seconds to fade in the track
+  /* "mpfmc/core/audio/track.pyx":245
+ *             did not have any samples ready ('streaming_underruns').
  *         """
- *         self.log.debug("play - Begin sound processing on track")             # <<<<<<<<<<<<<<
- * 
+ *         SDL_LockAudio()             # <<<<<<<<<<<<<<
+ *         counters = {
+ *             "mix_time": perf_ring_buffer_summary(&self.state.mix_time),
+ */
+  SDL_LockAudio();
+
+  /* "mpfmc/core/audio/track.pyx":247
  *         SDL_LockAudio()
+ *         counters = {
+ *             "mix_time": perf_ring_buffer_summary(&self.state.mix_time),             # <<<<<<<<<<<<<<
+ *             "active_sound_players": self.state.active_sound_players,
+ *             "streaming_underruns": self.state.streaming_underruns,
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 203, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 247, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_tuple__7, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 203, __pyx_L1_error)
+  __pyx_t_2 = __pyx_f_5mpfmc_4core_5audio_13perf_counters_perf_ring_buffer_summary((&__pyx_v_self->state->mix_time)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 247, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_u_mix_time, __pyx_t_2) < 0) __PYX_ERR(0, 247, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "mpfmc/core/audio/track.pyx":205
- *         self.log.debug("play - Begin sound processing on track")
- * 
- *         SDL_LockAudio()             # <<<<<<<<<<<<<<
- * 
- *         # Play is only supported when a track is paused, stopped, or is in the process of stopping
+  /* "mpfmc/core/audio/track.pyx":248
+ *         counters = {
+ *             "mix_time": perf_ring_buffer_summary(&self.state.mix_time),
+ *             "active_sound_players": self.state.active_sound_players,             # <<<<<<<<<<<<<<
+ *             "streaming_underruns": self.state.streaming_underruns,
+ *         }
  */
-  SDL_LockAudio();
+  __pyx_t_2 = __Pyx_PyInt_From_Uint32(__pyx_v_self->state->active_sound_players); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 248, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_u_active_sound_players, __pyx_t_2) < 0) __PYX_ERR(0, 247, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "mpfmc/core/audio/track.pyx":208
- * 
- *         # Play is only supported when a track is paused, stopped, or is in the process of stopping
- *         if self.state.status == track_status_paused or \             # <<<<<<<<<<<<<<
- *                         self.state.status == track_status_stopped or \
- *                         self.state.status == track_status_stopping:
+  /* "mpfmc/core/audio/track.pyx":249
+ *             "mix_time": perf_ring_buffer_summary(&self.state.mix_time),
+ *             "active_sound_players": self.state.active_sound_players,
+ *             "streaming_underruns": self.state.streaming_underruns,             # <<<<<<<<<<<<<<
+ *         }
+ *         if reset:
  */
-  switch (__pyx_v_self->state->status) {
-    case __pyx_e_5mpfmc_4core_5audio_5track_track_status_paused:
+  __pyx_t_2 = __Pyx_PyInt_From_Uint64(__pyx_v_self->state->streaming_underruns); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 249, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_u_streaming_underruns, __pyx_t_2) < 0) __PYX_ERR(0, 247, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_counters = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
 
-    /* "mpfmc/core/audio/track.pyx":209
- *         # Play is only supported when a track is paused, stopped, or is in the process of stopping
- *         if self.state.status == track_status_paused or \
- *                         self.state.status == track_status_stopped or \             # <<<<<<<<<<<<<<
- *                         self.state.status == track_status_stopping:
- *             if fade_in_seconds > 0:
+  /* "mpfmc/core/audio/track.pyx":251
+ *             "streaming_underruns": self.state.streaming_underruns,
+ *         }
+ *         if reset:             # <<<<<<<<<<<<<<
+ *             perf_ring_buffer_reset(&self.state.mix_time)
+ *             self.state.streaming_underruns = 0
  */
-    case __pyx_e_5mpfmc_4core_5audio_5track_track_status_stopped:
+  __pyx_t_3 = (__pyx_v_reset != 0);
+  if (__pyx_t_3) {
 
-    /* "mpfmc/core/audio/track.pyx":210
- *         if self.state.status == track_status_paused or \
- *                         self.state.status == track_status_stopped or \
- *                         self.state.status == track_status_stopping:             # <<<<<<<<<<<<<<
- *             if fade_in_seconds > 0:
- *                 # Calculate fade data (steps and volume)
+    /* "mpfmc/core/audio/track.pyx":252
+ *         }
+ *         if reset:
+ *             perf_ring_buffer_reset(&self.state.mix_time)             # <<<<<<<<<<<<<<
+ *             self.state.streaming_underruns = 0
+ *         SDL_UnlockAudio()
  */
-    case __pyx_e_5mpfmc_4core_5audio_5track_track_status_stopping:
+    __pyx_f_5mpfmc_4core_5audio_13perf_counters_perf_ring_buffer_reset((&__pyx_v_self->state->mix_time));
 
-    /* "mpfmc/core/audio/track.pyx":211
- *                         self.state.status == track_status_stopped or \
- *                         self.state.status == track_status_stopping:
- *             if fade_in_seconds > 0:             # <<<<<<<<<<<<<<
- *                 # Calculate fade data (steps and volume)
- *                 self.log.debug("play - Applying %s second fade in", str(fade_in_seconds))
+    /* "mpfmc/core/audio/track.pyx":253
+ *         if reset:
+ *             perf_ring_buffer_reset(&self.state.mix_time)
+ *             self.state.streaming_underruns = 0             # <<<<<<<<<<<<<<
+ *         SDL_UnlockAudio()
+ * 
  */
-    __pyx_t_3 = ((__pyx_v_fade_in_seconds > 0.0) != 0);
-    if (__pyx_t_3) {
+    __pyx_v_self->state->streaming_underruns = 0;
 
-      /* "mpfmc/core/audio/track.pyx":213
- *             if fade_in_seconds > 0:
- *                 # Calculate fade data (steps and volume)
- *                 self.log.debug("play - Applying %s second fade in", str(fade_in_seconds))             # <<<<<<<<<<<<<<
- *                 self.state.fade_steps = <Uint32>(fade_in_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
- *                 self.state.fade_steps_remaining = self.state.fade_steps
+    /* "mpfmc/core/audio/track.pyx":251
+ *             "streaming_underruns": self.state.streaming_underruns,
+ *         }
+ *         if reset:             # <<<<<<<<<<<<<<
+ *             perf_ring_buffer_reset(&self.state.mix_time)
+ *             self.state.streaming_underruns = 0
  */
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 213, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_4 = PyFloat_FromDouble(__pyx_v_fade_in_seconds); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 213, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 213, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_5);
-      __Pyx_GIVEREF(__pyx_t_4);
-      PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4);
-      __pyx_t_4 = 0;
-      __pyx_t_4 = __Pyx_PyObject_Call(((PyObject *)(&PyUnicode_Type)), __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 213, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __pyx_t_5 = NULL;
-      __pyx_t_6 = 0;
-      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
-        __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_1);
-        if (likely(__pyx_t_5)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
-          __Pyx_INCREF(__pyx_t_5);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_1, function);
-          __pyx_t_6 = 1;
-        }
-      }
-      #if CYTHON_FAST_PYCALL
-      if (PyFunction_Check(__pyx_t_1)) {
-        PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_kp_u_play_Applying_s_second_fade_in, __pyx_t_4};
-        __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 213, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-        __Pyx_GOTREF(__pyx_t_2);
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      } else
-      #endif
-      #if CYTHON_FAST_PYCCALL
-      if (__Pyx_PyFastCFunction_Check(__pyx_t_1)) {
-        PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_kp_u_play_Applying_s_second_fade_in, __pyx_t_4};
-        __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 213, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-        __Pyx_GOTREF(__pyx_t_2);
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      } else
-      #endif
-      {
-        __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 213, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_7);
-        if (__pyx_t_5) {
-          __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_5); __pyx_t_5 = NULL;
-        }
-        __Pyx_INCREF(__pyx_kp_u_play_Applying_s_second_fade_in);
-        __Pyx_GIVEREF(__pyx_kp_u_play_Applying_s_second_fade_in);
-        PyTuple_SET_ITEM(__pyx_t_7, 0+__pyx_t_6, __pyx_kp_u_play_Applying_s_second_fade_in);
-        __Pyx_GIVEREF(__pyx_t_4);
-        PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_t_4);
-        __pyx_t_4 = 0;
-        __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_7, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 213, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_2);
-        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-      }
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  }
 
-      /* "mpfmc/core/audio/track.pyx":214
- *                 # Calculate fade data (steps and volume)
- *                 self.log.debug("play - Applying %s second fade in", str(fade_in_seconds))
- *                 self.state.fade_steps = <Uint32>(fade_in_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point             # <<<<<<<<<<<<<<
- *                 self.state.fade_steps_remaining = self.state.fade_steps
- *                 self.state.fade_volume_start = self.state.fade_volume_current
+  /* "mpfmc/core/audio/track.pyx":254
+ *             perf_ring_buffer_reset(&self.state.mix_time)
+ *             self.state.streaming_underruns = 0
+ *         SDL_UnlockAudio()             # <<<<<<<<<<<<<<
+ * 
+ *         return counters
  */
-      __pyx_t_8 = ((Uint32)(__pyx_v_fade_in_seconds * __pyx_v_self->state->callback_data->seconds_to_bytes_factor));
-      if (unlikely(__pyx_v_self->state->callback_data->bytes_per_control_point == 0)) {
-        PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
-        __PYX_ERR(0, 214, __pyx_L1_error)
-      }
-      __pyx_v_self->state->fade_steps = (__pyx_t_8 / __pyx_v_self->state->callback_data->bytes_per_control_point);
+  SDL_UnlockAudio();
 
-      /* "mpfmc/core/audio/track.pyx":215
- *                 self.log.debug("play - Applying %s second fade in", str(fade_in_seconds))
- *                 self.state.fade_steps = <Uint32>(fade_in_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
- *                 self.state.fade_steps_remaining = self.state.fade_steps             # <<<<<<<<<<<<<<
- *                 self.state.fade_volume_start = self.state.fade_volume_current
- *                 self.state.fade_volume_target = self.state.volume
+  /* "mpfmc/core/audio/track.pyx":256
+ *         SDL_UnlockAudio()
+ * 
+ *         return counters             # <<<<<<<<<<<<<<
+ * 
+ *     def clear_context(self, context):
  */
-      __pyx_t_8 = __pyx_v_self->state->fade_steps;
-      __pyx_v_self->state->fade_steps_remaining = __pyx_t_8;
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_counters);
+  __pyx_r = __pyx_v_counters;
+  goto __pyx_L0;
 
-      /* "mpfmc/core/audio/track.pyx":216
- *                 self.state.fade_steps = <Uint32>(fade_in_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
- *                 self.state.fade_steps_remaining = self.state.fade_steps
- *                 self.state.fade_volume_start = self.state.fade_volume_current             # <<<<<<<<<<<<<<
- *                 self.state.fade_volume_target = self.state.volume
- *             else:
+  /* "mpfmc/core/audio/track.pyx":233
+ *         self.log.debug("set_inserts - %d insert(s) applied to the track", len(inserts))
+ * 
+ *     def get_performance_counters(self, bint reset=False):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns the track performance counters.
  */
-      __pyx_t_9 = __pyx_v_self->state->fade_volume_current;
-      __pyx_v_self->state->fade_volume_start = __pyx_t_9;
 
-      /* "mpfmc/core/audio/track.pyx":217
- *                 self.state.fade_steps_remaining = self.state.fade_steps
- *                 self.state.fade_volume_start = self.state.fade_volume_current
- *                 self.state.fade_volume_target = self.state.volume             # <<<<<<<<<<<<<<
- *             else:
- *                 # No fade will occur, simply set volume
- */
-      __pyx_t_9 = __pyx_v_self->state->volume;
-      __pyx_v_self->state->fade_volume_target = __pyx_t_9;
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("mpfmc.core.audio.track.Track.get_performance_counters", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_counters);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-      /* "mpfmc/core/audio/track.pyx":211
- *                         self.state.status == track_status_stopped or \
- *                         self.state.status == track_status_stopping:
- *             if fade_in_seconds > 0:             # <<<<<<<<<<<<<<
- *                 # Calculate fade data (steps and volume)
- *                 self.log.debug("play - Applying %s second fade in", str(fade_in_seconds))
+/* "mpfmc/core/audio/track.pyx":258
+ *         return counters
+ * 
+ *     def clear_context(self, context):             # <<<<<<<<<<<<<<
+ *         """Stop all sounds played from the specified context."""
+ *         raise NotImplementedError('Must be overridden in derived class')
  */
-      goto __pyx_L3;
-    }
 
-    /* "mpfmc/core/audio/track.pyx":220
- *             else:
- *                 # No fade will occur, simply set volume
- *                 self.state.fade_steps = 0             # <<<<<<<<<<<<<<
- *                 self.state.fade_steps_remaining = 0
- *                 self.state.fade_volume_current = self.state.volume
- */
-    /*else*/ {
-      __pyx_v_self->state->fade_steps = 0;
+/* Python wrapper */
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_13clear_context(PyObject *__pyx_v_self, PyObject *__pyx_v_context); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_5track_5Track_12clear_context[] = "Track.clear_context(self, context)\nStop all sounds played from the specified context.";
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_13clear_context(PyObject *__pyx_v_self, PyObject *__pyx_v_context) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("clear_context (wrapper)", 0);
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_5track_5Track_12clear_context(((struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)__pyx_v_self), ((PyObject *)__pyx_v_context));
 
-      /* "mpfmc/core/audio/track.pyx":221
- *                 # No fade will occur, simply set volume
- *                 self.state.fade_steps = 0
- *                 self.state.fade_steps_remaining = 0             # <<<<<<<<<<<<<<
- *                 self.state.fade_volume_current = self.state.volume
- *                 self.state.fade_volume_start = self.state.volume
- */
-      __pyx_v_self->state->fade_steps_remaining = 0;
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-      /* "mpfmc/core/audio/track.pyx":222
- *                 self.state.fade_steps = 0
- *                 self.state.fade_steps_remaining = 0
- *                 self.state.fade_volume_current = self.state.volume             # <<<<<<<<<<<<<<
- *                 self.state.fade_volume_start = self.state.volume
- *                 self.state.fade_volume_target = self.state.volume
- */
-      __pyx_t_9 = __pyx_v_self->state->volume;
-      __pyx_v_self->state->fade_volume_current = __pyx_t_9;
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_12clear_context(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v_context) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannySetupContext("clear_context", 0);
 
-      /* "mpfmc/core/audio/track.pyx":223
- *                 self.state.fade_steps_remaining = 0
- *                 self.state.fade_volume_current = self.state.volume
- *                 self.state.fade_volume_start = self.state.volume             # <<<<<<<<<<<<<<
- *                 self.state.fade_volume_target = self.state.volume
+  /* "mpfmc/core/audio/track.pyx":260
+ *     def clear_context(self, context):
+ *         """Stop all sounds played from the specified context."""
+ *         raise NotImplementedError('Must be overridden in derived class')             # <<<<<<<<<<<<<<
  * 
+ *     def set_volume(self, float volume, float fade_seconds = 0.0):
  */
-      __pyx_t_9 = __pyx_v_self->state->volume;
-      __pyx_v_self->state->fade_volume_start = __pyx_t_9;
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple__5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 260, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(0, 260, __pyx_L1_error)
 
-      /* "mpfmc/core/audio/track.pyx":224
- *                 self.state.fade_volume_current = self.state.volume
- *                 self.state.fade_volume_start = self.state.volume
- *                 self.state.fade_volume_target = self.state.volume             # <<<<<<<<<<<<<<
+  /* "mpfmc/core/audio/track.pyx":258
+ *         return counters
  * 
- *             self.state.status = track_status_playing
- */
-      __pyx_t_9 = __pyx_v_self->state->volume;
-      __pyx_v_self->state->fade_volume_target = __pyx_t_9;
-    }
-    __pyx_L3:;
-
-    /* "mpfmc/core/audio/track.pyx":226
- *                 self.state.fade_volume_target = self.state.volume
- * 
- *             self.state.status = track_status_playing             # <<<<<<<<<<<<<<
- * 
- *             # Trigger any events
- */
-    __pyx_v_self->state->status = __pyx_e_5mpfmc_4core_5audio_5track_track_status_playing;
-
-    /* "mpfmc/core/audio/track.pyx":229
- * 
- *             # Trigger any events
- *             if self.events_when_played is not None:             # <<<<<<<<<<<<<<
- *                 for event in self.events_when_played:
- *                     self.mc.post_mc_native_event(event, track=self._name)
- */
-    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_events_when_played); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 229, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = (__pyx_t_2 != Py_None);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_10 = (__pyx_t_3 != 0);
-    if (__pyx_t_10) {
-
-      /* "mpfmc/core/audio/track.pyx":230
- *             # Trigger any events
- *             if self.events_when_played is not None:
- *                 for event in self.events_when_played:             # <<<<<<<<<<<<<<
- *                     self.mc.post_mc_native_event(event, track=self._name)
- *         else:
- */
-      __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_events_when_played); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 230, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_2);
-      if (likely(PyList_CheckExact(__pyx_t_2)) || PyTuple_CheckExact(__pyx_t_2)) {
-        __pyx_t_1 = __pyx_t_2; __Pyx_INCREF(__pyx_t_1); __pyx_t_11 = 0;
-        __pyx_t_12 = NULL;
-      } else {
-        __pyx_t_11 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 230, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_1);
-        __pyx_t_12 = Py_TYPE(__pyx_t_1)->tp_iternext; if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 230, __pyx_L1_error)
-      }
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      for (;;) {
-        if (likely(!__pyx_t_12)) {
-          if (likely(PyList_CheckExact(__pyx_t_1))) {
-            if (__pyx_t_11 >= PyList_GET_SIZE(__pyx_t_1)) break;
-            #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-            __pyx_t_2 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_11); __Pyx_INCREF(__pyx_t_2); __pyx_t_11++; if (unlikely(0 < 0)) __PYX_ERR(0, 230, __pyx_L1_error)
-            #else
-            __pyx_t_2 = PySequence_ITEM(__pyx_t_1, __pyx_t_11); __pyx_t_11++; if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 230, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_2);
-            #endif
-          } else {
-            if (__pyx_t_11 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
-            #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-            __pyx_t_2 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_11); __Pyx_INCREF(__pyx_t_2); __pyx_t_11++; if (unlikely(0 < 0)) __PYX_ERR(0, 230, __pyx_L1_error)
-            #else
-            __pyx_t_2 = PySequence_ITEM(__pyx_t_1, __pyx_t_11); __pyx_t_11++; if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 230, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_2);
-            #endif
-          }
-        } else {
-          __pyx_t_2 = __pyx_t_12(__pyx_t_1);
-          if (unlikely(!__pyx_t_2)) {
-            PyObject* exc_type = PyErr_Occurred();
-            if (exc_type) {
-              if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-              else __PYX_ERR(0, 230, __pyx_L1_error)
-            }
-            break;
-          }
-          __Pyx_GOTREF(__pyx_t_2);
-        }
-        __Pyx_XDECREF_SET(__pyx_v_event, __pyx_t_2);
-        __pyx_t_2 = 0;
-
-        /* "mpfmc/core/audio/track.pyx":231
- *             if self.events_when_played is not None:
- *                 for event in self.events_when_played:
- *                     self.mc.post_mc_native_event(event, track=self._name)             # <<<<<<<<<<<<<<
- *         else:
- *             self.log.warning("play - Action may only be used when a track is stopped or is in the process "
- */
-        __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->mc, __pyx_n_s_post_mc_native_event); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 231, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_2);
-        __pyx_t_7 = PyTuple_New(1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 231, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_7);
-        __Pyx_INCREF(__pyx_v_event);
-        __Pyx_GIVEREF(__pyx_v_event);
-        PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_v_event);
-        __pyx_t_4 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 231, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_4);
-        if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_track, __pyx_v_self->_name) < 0) __PYX_ERR(0, 231, __pyx_L1_error)
-        __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_7, __pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 231, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_5);
-        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-
-        /* "mpfmc/core/audio/track.pyx":230
- *             # Trigger any events
- *             if self.events_when_played is not None:
- *                 for event in self.events_when_played:             # <<<<<<<<<<<<<<
- *                     self.mc.post_mc_native_event(event, track=self._name)
- *         else:
- */
-      }
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-      /* "mpfmc/core/audio/track.pyx":229
- * 
- *             # Trigger any events
- *             if self.events_when_played is not None:             # <<<<<<<<<<<<<<
- *                 for event in self.events_when_played:
- *                     self.mc.post_mc_native_event(event, track=self._name)
- */
-    }
-
-    /* "mpfmc/core/audio/track.pyx":208
- * 
- *         # Play is only supported when a track is paused, stopped, or is in the process of stopping
- *         if self.state.status == track_status_paused or \             # <<<<<<<<<<<<<<
- *                         self.state.status == track_status_stopped or \
- *                         self.state.status == track_status_stopping:
- */
-    break;
-    default:
-
-    /* "mpfmc/core/audio/track.pyx":233
- *                     self.mc.post_mc_native_event(event, track=self._name)
- *         else:
- *             self.log.warning("play - Action may only be used when a track is stopped or is in the process "             # <<<<<<<<<<<<<<
- *                              "of stopping; action will be ignored.")
- * 
- */
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_warning); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 233, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_tuple__8, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 233, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    break;
-  }
-
-  /* "mpfmc/core/audio/track.pyx":236
- *                              "of stopping; action will be ignored.")
- * 
- *         SDL_UnlockAudio()             # <<<<<<<<<<<<<<
- * 
- *     def stop(self, float fade_out_seconds = 0.0):
- */
-  SDL_UnlockAudio();
-
-  /* "mpfmc/core/audio/track.pyx":196
- *         SDL_UnlockAudio()
- * 
- *     def play(self, float fade_in_seconds = 0.0):             # <<<<<<<<<<<<<<
- *         """
- *         Starts playing the track so it can begin processing sounds. Function has no effect if
+ *     def clear_context(self, context):             # <<<<<<<<<<<<<<
+ *         """Stop all sounds played from the specified context."""
+ *         raise NotImplementedError('Must be overridden in derived class')
  */
 
   /* function exit code */
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_AddTraceback("mpfmc.core.audio.track.Track.play", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("mpfmc.core.audio.track.Track.clear_context", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_event);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":238
- *         SDL_UnlockAudio()
+/* "mpfmc/core/audio/track.pyx":262
+ *         raise NotImplementedError('Must be overridden in derived class')
  * 
- *     def stop(self, float fade_out_seconds = 0.0):             # <<<<<<<<<<<<<<
- *         """
- *         Stops the track and clears out any playing sounds. Function has no effect if the track is
+ *     def set_volume(self, float volume, float fade_seconds = 0.0):             # <<<<<<<<<<<<<<
+ *         """Sets the current track volume with an optional fade time"""
+ *         cdef Uint8 new_volume = <Uint8>min(max(volume * SDL_MIX_MAXVOLUME, 0), SDL_MIX_MAXVOLUME)
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_15stop(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_5mpfmc_4core_5audio_5track_5Track_14stop[] = "Track.stop(self, float fade_out_seconds=0.0)\n\n        Stops the track and clears out any playing sounds. Function has no effect if the track is\n        already stopped.\n        Args:\n            fade_out_seconds: The number of seconds to fade out the track\n        ";
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_15stop(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  float __pyx_v_fade_out_seconds;
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_15set_volume(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_5track_5Track_14set_volume[] = "Track.set_volume(self, float volume, float fade_seconds=0.0)\nSets the current track volume with an optional fade time";
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_15set_volume(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  float __pyx_v_volume;
+  float __pyx_v_fade_seconds;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("stop (wrapper)", 0);
+  __Pyx_RefNannySetupContext("set_volume (wrapper)", 0);
   {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_fade_out_seconds,0};
-    PyObject* values[1] = {0};
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_volume,&__pyx_n_s_fade_seconds,0};
+    PyObject* values[2] = {0,0};
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
       switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
         case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
         CYTHON_FALLTHROUGH;
         case  0: break;
@@ -4066,351 +4557,370 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_15stop(PyObject *__p
       kw_args = PyDict_Size(__pyx_kwds);
       switch (pos_args) {
         case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_volume)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
         if (kw_args > 0) {
-          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_fade_out_seconds);
-          if (value) { values[0] = value; kw_args--; }
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_fade_seconds);
+          if (value) { values[1] = value; kw_args--; }
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "stop") < 0)) __PYX_ERR(0, 238, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "set_volume") < 0)) __PYX_ERR(0, 262, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
         CYTHON_FALLTHROUGH;
-        case  0: break;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
         default: goto __pyx_L5_argtuple_error;
       }
     }
-    if (values[0]) {
-      __pyx_v_fade_out_seconds = __pyx_PyFloat_AsFloat(values[0]); if (unlikely((__pyx_v_fade_out_seconds == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 238, __pyx_L3_error)
+    __pyx_v_volume = __pyx_PyFloat_AsFloat(values[0]); if (unlikely((__pyx_v_volume == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 262, __pyx_L3_error)
+    if (values[1]) {
+      __pyx_v_fade_seconds = __pyx_PyFloat_AsFloat(values[1]); if (unlikely((__pyx_v_fade_seconds == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 262, __pyx_L3_error)
     } else {
-      __pyx_v_fade_out_seconds = ((float)0.0);
+      __pyx_v_fade_seconds = ((float)0.0);
     }
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("stop", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 238, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("set_volume", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 262, __pyx_L3_error)
   __pyx_L3_error:;
-  __Pyx_AddTraceback("mpfmc.core.audio.track.Track.stop", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("mpfmc.core.audio.track.Track.set_volume", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(((struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)__pyx_v_self), __pyx_v_fade_out_seconds);
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_5track_5Track_14set_volume(((struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)__pyx_v_self), __pyx_v_volume, __pyx_v_fade_seconds);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self, float __pyx_v_fade_out_seconds) {
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14set_volume(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self, float __pyx_v_volume, float __pyx_v_fade_seconds) {
+  Uint8 __pyx_v_new_volume;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  int __pyx_t_3;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  int __pyx_t_6;
+  int __pyx_t_1;
+  long __pyx_t_2;
+  float __pyx_t_3;
+  float __pyx_t_4;
+  int __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
   PyObject *__pyx_t_7 = NULL;
-  Uint32 __pyx_t_8;
-  Uint8 __pyx_t_9;
-  __Pyx_RefNannySetupContext("stop", 0);
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  Uint32 __pyx_t_11;
+  Uint8 __pyx_t_12;
+  __Pyx_RefNannySetupContext("set_volume", 0);
 
-  /* "mpfmc/core/audio/track.pyx":245
- *             fade_out_seconds: The number of seconds to fade out the track
- *         """
- *         self.log.debug("stop - Stop sound processing on track and clear state")             # <<<<<<<<<<<<<<
- * 
+  /* "mpfmc/core/audio/track.pyx":264
+ *     def set_volume(self, float volume, float fade_seconds = 0.0):
+ *         """Sets the current track volume with an optional fade time"""
+ *         cdef Uint8 new_volume = <Uint8>min(max(volume * SDL_MIX_MAXVOLUME, 0), SDL_MIX_MAXVOLUME)             # <<<<<<<<<<<<<<
  *         SDL_LockAudio()
+ * 
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 245, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_tuple__9, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 245, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_1 = SDL_MIX_MAXVOLUME;
+  __pyx_t_2 = 0;
+  __pyx_t_3 = (__pyx_v_volume * SDL_MIX_MAXVOLUME);
+  if (((__pyx_t_2 > __pyx_t_3) != 0)) {
+    __pyx_t_4 = __pyx_t_2;
+  } else {
+    __pyx_t_4 = __pyx_t_3;
+  }
+  __pyx_t_3 = __pyx_t_4;
+  if (((__pyx_t_1 < __pyx_t_3) != 0)) {
+    __pyx_t_4 = __pyx_t_1;
+  } else {
+    __pyx_t_4 = __pyx_t_3;
+  }
+  __pyx_v_new_volume = ((Uint8)__pyx_t_4);
 
-  /* "mpfmc/core/audio/track.pyx":247
- *         self.log.debug("stop - Stop sound processing on track and clear state")
- * 
+  /* "mpfmc/core/audio/track.pyx":265
+ *         """Sets the current track volume with an optional fade time"""
+ *         cdef Uint8 new_volume = <Uint8>min(max(volume * SDL_MIX_MAXVOLUME, 0), SDL_MIX_MAXVOLUME)
  *         SDL_LockAudio()             # <<<<<<<<<<<<<<
  * 
- *         # Stop is only supported when a track is playing
+ *         # Fades require special logic
  */
   SDL_LockAudio();
 
-  /* "mpfmc/core/audio/track.pyx":250
- * 
- *         # Stop is only supported when a track is playing
- *         if self.state.status in [track_status_playing, track_status_stopping, track_status_pausing]:             # <<<<<<<<<<<<<<
+  /* "mpfmc/core/audio/track.pyx":268
  * 
- *             if fade_out_seconds > 0:
+ *         # Fades require special logic
+ *         if fade_seconds > 0:             # <<<<<<<<<<<<<<
+ *             if self.state.status == track_status_stopping or self.state.status == track_status_pausing:
+ *                 # Fade is ignored if track is in the process of stopping or pausing
  */
-  switch (__pyx_v_self->state->status) {
-    case __pyx_e_5mpfmc_4core_5audio_5track_track_status_playing:
-    case __pyx_e_5mpfmc_4core_5audio_5track_track_status_stopping:
-    case __pyx_e_5mpfmc_4core_5audio_5track_track_status_pausing:
+  __pyx_t_5 = ((__pyx_v_fade_seconds > 0.0) != 0);
+  if (__pyx_t_5) {
 
-    /* "mpfmc/core/audio/track.pyx":252
- *         if self.state.status in [track_status_playing, track_status_stopping, track_status_pausing]:
- * 
- *             if fade_out_seconds > 0:             # <<<<<<<<<<<<<<
- *                 # Calculate fade data (steps and volume)
- *                 self.log.debug("stop - Applying %s second fade out", str(fade_out_seconds))
- */
-    __pyx_t_3 = ((__pyx_v_fade_out_seconds > 0.0) != 0);
-    if (__pyx_t_3) {
+    /* "mpfmc/core/audio/track.pyx":269
+ *         # Fades require special logic
+ *         if fade_seconds > 0:
+ *             if self.state.status == track_status_stopping or self.state.status == track_status_pausing:             # <<<<<<<<<<<<<<
+ *                 # Fade is ignored if track is in the process of stopping or pausing
+ *                 self.state.volume = new_volume
+ */
+    switch (__pyx_v_self->state->status) {
+      case __pyx_e_5mpfmc_4core_5audio_5track_track_status_stopping:
+      case __pyx_e_5mpfmc_4core_5audio_5track_track_status_pausing:
 
-      /* "mpfmc/core/audio/track.pyx":254
- *             if fade_out_seconds > 0:
- *                 # Calculate fade data (steps and volume)
- *                 self.log.debug("stop - Applying %s second fade out", str(fade_out_seconds))             # <<<<<<<<<<<<<<
- *                 self.state.fade_steps = <Uint32>(fade_out_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
- *                 self.state.fade_steps_remaining = self.state.fade_steps
+      /* "mpfmc/core/audio/track.pyx":271
+ *             if self.state.status == track_status_stopping or self.state.status == track_status_pausing:
+ *                 # Fade is ignored if track is in the process of stopping or pausing
+ *                 self.state.volume = new_volume             # <<<<<<<<<<<<<<
+ *             else:
+ *                 # If the track is currently in the middle of a fade, the existing fade
  */
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 254, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_4 = PyFloat_FromDouble(__pyx_v_fade_out_seconds); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 254, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 254, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_5);
-      __Pyx_GIVEREF(__pyx_t_4);
-      PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4);
-      __pyx_t_4 = 0;
-      __pyx_t_4 = __Pyx_PyObject_Call(((PyObject *)(&PyUnicode_Type)), __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 254, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __pyx_t_5 = NULL;
-      __pyx_t_6 = 0;
-      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
-        __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_1);
-        if (likely(__pyx_t_5)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
-          __Pyx_INCREF(__pyx_t_5);
+      __pyx_v_self->state->volume = __pyx_v_new_volume;
+
+      /* "mpfmc/core/audio/track.pyx":269
+ *         # Fades require special logic
+ *         if fade_seconds > 0:
+ *             if self.state.status == track_status_stopping or self.state.status == track_status_pausing:             # <<<<<<<<<<<<<<
+ *                 # Fade is ignored if track is in the process of stopping or pausing
+ *                 self.state.volume = new_volume
+ */
+      break;
+      default:
+
+      /* "mpfmc/core/audio/track.pyx":276
+ *                 # will be interrupted and a new fade will be calculated from the current
+ *                 # point of the existing fade
+ *                 if self.state.fade_steps_remaining > 0:             # <<<<<<<<<<<<<<
+ *                     self.log.debug("set_volume - Interrupting an existing fade on this track so "
+ *                                    "start a new fade")
+ */
+      __pyx_t_5 = ((__pyx_v_self->state->fade_steps_remaining > 0) != 0);
+      if (__pyx_t_5) {
+
+        /* "mpfmc/core/audio/track.pyx":277
+ *                 # point of the existing fade
+ *                 if self.state.fade_steps_remaining > 0:
+ *                     self.log.debug("set_volume - Interrupting an existing fade on this track so "             # <<<<<<<<<<<<<<
+ *                                    "start a new fade")
+ * 
+ */
+        __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 277, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        __pyx_t_7 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_tuple__6, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 277, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_7);
+        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+
+        /* "mpfmc/core/audio/track.pyx":276
+ *                 # will be interrupted and a new fade will be calculated from the current
+ *                 # point of the existing fade
+ *                 if self.state.fade_steps_remaining > 0:             # <<<<<<<<<<<<<<
+ *                     self.log.debug("set_volume - Interrupting an existing fade on this track so "
+ *                                    "start a new fade")
+ */
+      }
+
+      /* "mpfmc/core/audio/track.pyx":280
+ *                                    "start a new fade")
+ * 
+ *                 self.log.debug("set_volume - Applying %s second fade to new volume level", str(fade_seconds))             # <<<<<<<<<<<<<<
+ * 
+ *                 # Calculate fade
+ */
+      __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 280, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_t_8 = PyFloat_FromDouble(__pyx_v_fade_seconds); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 280, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __pyx_t_9 = PyTuple_New(1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 280, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __Pyx_GIVEREF(__pyx_t_8);
+      PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_8);
+      __pyx_t_8 = 0;
+      __pyx_t_8 = __Pyx_PyObject_Call(((PyObject *)(&PyUnicode_Type)), __pyx_t_9, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 280, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __pyx_t_9 = NULL;
+      __pyx_t_1 = 0;
+      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
+        __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_6);
+        if (likely(__pyx_t_9)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+          __Pyx_INCREF(__pyx_t_9);
           __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_1, function);
-          __pyx_t_6 = 1;
+          __Pyx_DECREF_SET(__pyx_t_6, function);
+          __pyx_t_1 = 1;
         }
       }
       #if CYTHON_FAST_PYCALL
-      if (PyFunction_Check(__pyx_t_1)) {
-        PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_kp_u_stop_Applying_s_second_fade_out, __pyx_t_4};
-        __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 254, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-        __Pyx_GOTREF(__pyx_t_2);
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (PyFunction_Check(__pyx_t_6)) {
+        PyObject *__pyx_temp[3] = {__pyx_t_9, __pyx_kp_u_set_volume_Applying_s_second_fad, __pyx_t_8};
+        __pyx_t_7 = __Pyx_PyFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_1, 2+__pyx_t_1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 280, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __Pyx_GOTREF(__pyx_t_7);
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
       } else
       #endif
       #if CYTHON_FAST_PYCCALL
-      if (__Pyx_PyFastCFunction_Check(__pyx_t_1)) {
-        PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_kp_u_stop_Applying_s_second_fade_out, __pyx_t_4};
-        __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 254, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-        __Pyx_GOTREF(__pyx_t_2);
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (__Pyx_PyFastCFunction_Check(__pyx_t_6)) {
+        PyObject *__pyx_temp[3] = {__pyx_t_9, __pyx_kp_u_set_volume_Applying_s_second_fad, __pyx_t_8};
+        __pyx_t_7 = __Pyx_PyCFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_1, 2+__pyx_t_1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 280, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __Pyx_GOTREF(__pyx_t_7);
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
       } else
       #endif
       {
-        __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 254, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_7);
-        if (__pyx_t_5) {
-          __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_5); __pyx_t_5 = NULL;
+        __pyx_t_10 = PyTuple_New(2+__pyx_t_1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 280, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_10);
+        if (__pyx_t_9) {
+          __Pyx_GIVEREF(__pyx_t_9); PyTuple_SET_ITEM(__pyx_t_10, 0, __pyx_t_9); __pyx_t_9 = NULL;
         }
-        __Pyx_INCREF(__pyx_kp_u_stop_Applying_s_second_fade_out);
-        __Pyx_GIVEREF(__pyx_kp_u_stop_Applying_s_second_fade_out);
-        PyTuple_SET_ITEM(__pyx_t_7, 0+__pyx_t_6, __pyx_kp_u_stop_Applying_s_second_fade_out);
-        __Pyx_GIVEREF(__pyx_t_4);
-        PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_t_4);
-        __pyx_t_4 = 0;
-        __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_7, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 254, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_2);
-        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+        __Pyx_INCREF(__pyx_kp_u_set_volume_Applying_s_second_fad);
+        __Pyx_GIVEREF(__pyx_kp_u_set_volume_Applying_s_second_fad);
+        PyTuple_SET_ITEM(__pyx_t_10, 0+__pyx_t_1, __pyx_kp_u_set_volume_Applying_s_second_fad);
+        __Pyx_GIVEREF(__pyx_t_8);
+        PyTuple_SET_ITEM(__pyx_t_10, 1+__pyx_t_1, __pyx_t_8);
+        __pyx_t_8 = 0;
+        __pyx_t_7 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_10, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 280, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_7);
+        __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
       }
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
 
-      /* "mpfmc/core/audio/track.pyx":255
- *                 # Calculate fade data (steps and volume)
- *                 self.log.debug("stop - Applying %s second fade out", str(fade_out_seconds))
- *                 self.state.fade_steps = <Uint32>(fade_out_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point             # <<<<<<<<<<<<<<
+      /* "mpfmc/core/audio/track.pyx":283
+ * 
+ *                 # Calculate fade
+ *                 self.state.fade_steps = <Uint32>(fade_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point             # <<<<<<<<<<<<<<
  *                 self.state.fade_steps_remaining = self.state.fade_steps
  *                 self.state.fade_volume_start = self.state.fade_volume_current
  */
-      __pyx_t_8 = ((Uint32)(__pyx_v_fade_out_seconds * __pyx_v_self->state->callback_data->seconds_to_bytes_factor));
+      __pyx_t_11 = ((Uint32)(__pyx_v_fade_seconds * __pyx_v_self->state->callback_data->seconds_to_bytes_factor));
       if (unlikely(__pyx_v_self->state->callback_data->bytes_per_control_point == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
-        __PYX_ERR(0, 255, __pyx_L1_error)
+        __PYX_ERR(0, 283, __pyx_L1_error)
       }
-      __pyx_v_self->state->fade_steps = (__pyx_t_8 / __pyx_v_self->state->callback_data->bytes_per_control_point);
+      __pyx_v_self->state->fade_steps = (__pyx_t_11 / __pyx_v_self->state->callback_data->bytes_per_control_point);
 
-      /* "mpfmc/core/audio/track.pyx":256
- *                 self.log.debug("stop - Applying %s second fade out", str(fade_out_seconds))
- *                 self.state.fade_steps = <Uint32>(fade_out_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
+      /* "mpfmc/core/audio/track.pyx":284
+ *                 # Calculate fade
+ *                 self.state.fade_steps = <Uint32>(fade_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
  *                 self.state.fade_steps_remaining = self.state.fade_steps             # <<<<<<<<<<<<<<
  *                 self.state.fade_volume_start = self.state.fade_volume_current
- *                 self.state.fade_volume_target = 0
+ *                 self.state.fade_volume_target = new_volume
  */
-      __pyx_t_8 = __pyx_v_self->state->fade_steps;
-      __pyx_v_self->state->fade_steps_remaining = __pyx_t_8;
+      __pyx_t_11 = __pyx_v_self->state->fade_steps;
+      __pyx_v_self->state->fade_steps_remaining = __pyx_t_11;
 
-      /* "mpfmc/core/audio/track.pyx":257
- *                 self.state.fade_steps = <Uint32>(fade_out_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
+      /* "mpfmc/core/audio/track.pyx":285
+ *                 self.state.fade_steps = <Uint32>(fade_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
  *                 self.state.fade_steps_remaining = self.state.fade_steps
  *                 self.state.fade_volume_start = self.state.fade_volume_current             # <<<<<<<<<<<<<<
- *                 self.state.fade_volume_target = 0
- *                 self.state.status = track_status_stopping
+ *                 self.state.fade_volume_target = new_volume
+ *                 self.state.volume = new_volume
  */
-      __pyx_t_9 = __pyx_v_self->state->fade_volume_current;
-      __pyx_v_self->state->fade_volume_start = __pyx_t_9;
+      __pyx_t_12 = __pyx_v_self->state->fade_volume_current;
+      __pyx_v_self->state->fade_volume_start = __pyx_t_12;
 
-      /* "mpfmc/core/audio/track.pyx":258
+      /* "mpfmc/core/audio/track.pyx":286
  *                 self.state.fade_steps_remaining = self.state.fade_steps
  *                 self.state.fade_volume_start = self.state.fade_volume_current
- *                 self.state.fade_volume_target = 0             # <<<<<<<<<<<<<<
- *                 self.state.status = track_status_stopping
- * 
+ *                 self.state.fade_volume_target = new_volume             # <<<<<<<<<<<<<<
+ *                 self.state.volume = new_volume
+ *         else:
  */
-      __pyx_v_self->state->fade_volume_target = 0;
+      __pyx_v_self->state->fade_volume_target = __pyx_v_new_volume;
 
-      /* "mpfmc/core/audio/track.pyx":259
+      /* "mpfmc/core/audio/track.pyx":287
  *                 self.state.fade_volume_start = self.state.fade_volume_current
- *                 self.state.fade_volume_target = 0
- *                 self.state.status = track_status_stopping             # <<<<<<<<<<<<<<
- * 
- *             else:
+ *                 self.state.fade_volume_target = new_volume
+ *                 self.state.volume = new_volume             # <<<<<<<<<<<<<<
+ *         else:
+ *             self.state.volume = new_volume
  */
-      __pyx_v_self->state->status = __pyx_e_5mpfmc_4core_5audio_5track_track_status_stopping;
+      __pyx_v_self->state->volume = __pyx_v_new_volume;
+      break;
+    }
 
-      /* "mpfmc/core/audio/track.pyx":252
- *         if self.state.status in [track_status_playing, track_status_stopping, track_status_pausing]:
+    /* "mpfmc/core/audio/track.pyx":268
  * 
- *             if fade_out_seconds > 0:             # <<<<<<<<<<<<<<
- *                 # Calculate fade data (steps and volume)
- *                 self.log.debug("stop - Applying %s second fade out", str(fade_out_seconds))
+ *         # Fades require special logic
+ *         if fade_seconds > 0:             # <<<<<<<<<<<<<<
+ *             if self.state.status == track_status_stopping or self.state.status == track_status_pausing:
+ *                 # Fade is ignored if track is in the process of stopping or pausing
  */
-      goto __pyx_L3;
-    }
+    goto __pyx_L3;
+  }
 
-    /* "mpfmc/core/audio/track.pyx":263
- *             else:
- *                 # No fade will occur, simply set volume
- *                 self.state.fade_steps = 0             # <<<<<<<<<<<<<<
- *                 self.state.fade_steps_remaining = 0
- *                 self.state.fade_volume_current = 0
+  /* "mpfmc/core/audio/track.pyx":289
+ *                 self.state.volume = new_volume
+ *         else:
+ *             self.state.volume = new_volume             # <<<<<<<<<<<<<<
+ *             self.state.fade_volume_current = new_volume
+ *             self.state.fade_volume_start = new_volume
  */
-    /*else*/ {
-      __pyx_v_self->state->fade_steps = 0;
+  /*else*/ {
+    __pyx_v_self->state->volume = __pyx_v_new_volume;
 
-      /* "mpfmc/core/audio/track.pyx":264
- *                 # No fade will occur, simply set volume
- *                 self.state.fade_steps = 0
- *                 self.state.fade_steps_remaining = 0             # <<<<<<<<<<<<<<
- *                 self.state.fade_volume_current = 0
- *                 self.state.fade_volume_start = 0
+    /* "mpfmc/core/audio/track.pyx":290
+ *         else:
+ *             self.state.volume = new_volume
+ *             self.state.fade_volume_current = new_volume             # <<<<<<<<<<<<<<
+ *             self.state.fade_volume_start = new_volume
+ *             self.state.fade_volume_target = new_volume
  */
-      __pyx_v_self->state->fade_steps_remaining = 0;
+    __pyx_v_self->state->fade_volume_current = __pyx_v_new_volume;
 
-      /* "mpfmc/core/audio/track.pyx":265
- *                 self.state.fade_steps = 0
- *                 self.state.fade_steps_remaining = 0
- *                 self.state.fade_volume_current = 0             # <<<<<<<<<<<<<<
- *                 self.state.fade_volume_start = 0
- *                 self.state.fade_volume_target = 0
+    /* "mpfmc/core/audio/track.pyx":291
+ *             self.state.volume = new_volume
+ *             self.state.fade_volume_current = new_volume
+ *             self.state.fade_volume_start = new_volume             # <<<<<<<<<<<<<<
+ *             self.state.fade_volume_target = new_volume
+ * 
  */
-      __pyx_v_self->state->fade_volume_current = 0;
+    __pyx_v_self->state->fade_volume_start = __pyx_v_new_volume;
 
-      /* "mpfmc/core/audio/track.pyx":266
- *                 self.state.fade_steps_remaining = 0
- *                 self.state.fade_volume_current = 0
- *                 self.state.fade_volume_start = 0             # <<<<<<<<<<<<<<
- *                 self.state.fade_volume_target = 0
- *                 self.state.status = track_status_stopped
- */
-      __pyx_v_self->state->fade_volume_start = 0;
-
-      /* "mpfmc/core/audio/track.pyx":267
- *                 self.state.fade_volume_current = 0
- *                 self.state.fade_volume_start = 0
- *                 self.state.fade_volume_target = 0             # <<<<<<<<<<<<<<
- *                 self.state.status = track_status_stopped
- *                 send_track_stopped_notification(self.state)
- */
-      __pyx_v_self->state->fade_volume_target = 0;
-
-      /* "mpfmc/core/audio/track.pyx":268
- *                 self.state.fade_volume_start = 0
- *                 self.state.fade_volume_target = 0
- *                 self.state.status = track_status_stopped             # <<<<<<<<<<<<<<
- *                 send_track_stopped_notification(self.state)
- * 
- */
-      __pyx_v_self->state->status = __pyx_e_5mpfmc_4core_5audio_5track_track_status_stopped;
-
-      /* "mpfmc/core/audio/track.pyx":269
- *                 self.state.fade_volume_target = 0
- *                 self.state.status = track_status_stopped
- *                 send_track_stopped_notification(self.state)             # <<<<<<<<<<<<<<
- * 
- *         else:
- */
-      __pyx_f_5mpfmc_4core_5audio_20notification_message_send_track_stopped_notification(__pyx_v_self->state);
-    }
-    __pyx_L3:;
-
-    /* "mpfmc/core/audio/track.pyx":250
- * 
- *         # Stop is only supported when a track is playing
- *         if self.state.status in [track_status_playing, track_status_stopping, track_status_pausing]:             # <<<<<<<<<<<<<<
- * 
- *             if fade_out_seconds > 0:
- */
-    break;
-    default:
-
-    /* "mpfmc/core/audio/track.pyx":272
- * 
- *         else:
- *             self.log.warning("stop - Action may only be used when a track is playing; action "             # <<<<<<<<<<<<<<
- *                              "will be ignored.")
+    /* "mpfmc/core/audio/track.pyx":292
+ *             self.state.fade_volume_current = new_volume
+ *             self.state.fade_volume_start = new_volume
+ *             self.state.fade_volume_target = new_volume             # <<<<<<<<<<<<<<
  * 
+ *         SDL_UnlockAudio()
  */
-    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_warning); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 272, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_tuple__10, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 272, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    break;
+    __pyx_v_self->state->fade_volume_target = __pyx_v_new_volume;
   }
+  __pyx_L3:;
 
-  /* "mpfmc/core/audio/track.pyx":275
- *                              "will be ignored.")
+  /* "mpfmc/core/audio/track.pyx":294
+ *             self.state.fade_volume_target = new_volume
  * 
  *         SDL_UnlockAudio()             # <<<<<<<<<<<<<<
  * 
- *     def pause(self, float fade_out_seconds = 0.0):
+ *     def play(self, float fade_in_seconds = 0.0):
  */
   SDL_UnlockAudio();
 
-  /* "mpfmc/core/audio/track.pyx":238
- *         SDL_UnlockAudio()
+  /* "mpfmc/core/audio/track.pyx":262
+ *         raise NotImplementedError('Must be overridden in derived class')
  * 
- *     def stop(self, float fade_out_seconds = 0.0):             # <<<<<<<<<<<<<<
- *         """
- *         Stops the track and clears out any playing sounds. Function has no effect if the track is
+ *     def set_volume(self, float volume, float fade_seconds = 0.0):             # <<<<<<<<<<<<<<
+ *         """Sets the current track volume with an optional fade time"""
+ *         cdef Uint8 new_volume = <Uint8>min(max(volume * SDL_MIX_MAXVOLUME, 0), SDL_MIX_MAXVOLUME)
  */
 
   /* function exit code */
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
   __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_AddTraceback("mpfmc.core.audio.track.Track.stop", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_AddTraceback("mpfmc.core.audio.track.Track.set_volume", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -4418,24 +4928,24 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_14stop(struct __pyx_
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":277
+/* "mpfmc/core/audio/track.pyx":296
  *         SDL_UnlockAudio()
  * 
- *     def pause(self, float fade_out_seconds = 0.0):             # <<<<<<<<<<<<<<
+ *     def play(self, float fade_in_seconds = 0.0):             # <<<<<<<<<<<<<<
  *         """
- *         Pauses the track. Sounds will continue from where they left off when the track is resumed.
+ *         Starts playing the track so it can begin processing sounds. Function has no effect if
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_17pause(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_5mpfmc_4core_5audio_5track_5Track_16pause[] = "Track.pause(self, float fade_out_seconds=0.0)\n\n        Pauses the track. Sounds will continue from where they left off when the track is resumed.\n        Function has no effect unless the track is playing.\n        Args:\n            fade_out_seconds: The number of seconds to fade out the track\n        ";
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_17pause(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  float __pyx_v_fade_out_seconds;
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_17play(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_5track_5Track_16play[] = "Track.play(self, float fade_in_seconds=0.0)\n\n        Starts playing the track so it can begin processing sounds. Function has no effect if\n        the track is already playing.\n        Args:\n            fade_in_seconds: The number of seconds to fade in the track\n        ";
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_17play(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  float __pyx_v_fade_in_seconds;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("pause (wrapper)", 0);
+  __Pyx_RefNannySetupContext("play (wrapper)", 0);
   {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_fade_out_seconds,0};
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_fade_in_seconds,0};
     PyObject* values[1] = {0};
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
@@ -4450,12 +4960,12 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_17pause(PyObject *__
       switch (pos_args) {
         case  0:
         if (kw_args > 0) {
-          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_fade_out_seconds);
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_fade_in_seconds);
           if (value) { values[0] = value; kw_args--; }
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "pause") < 0)) __PYX_ERR(0, 277, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "play") < 0)) __PYX_ERR(0, 296, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -4466,27 +4976,28 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_17pause(PyObject *__
       }
     }
     if (values[0]) {
-      __pyx_v_fade_out_seconds = __pyx_PyFloat_AsFloat(values[0]); if (unlikely((__pyx_v_fade_out_seconds == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 277, __pyx_L3_error)
+      __pyx_v_fade_in_seconds = __pyx_PyFloat_AsFloat(values[0]); if (unlikely((__pyx_v_fade_in_seconds == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 296, __pyx_L3_error)
     } else {
-      __pyx_v_fade_out_seconds = ((float)0.0);
+      __pyx_v_fade_in_seconds = ((float)0.0);
     }
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("pause", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 277, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("play", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 296, __pyx_L3_error)
   __pyx_L3_error:;
-  __Pyx_AddTraceback("mpfmc.core.audio.track.Track.pause", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("mpfmc.core.audio.track.Track.play", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(((struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)__pyx_v_self), __pyx_v_fade_out_seconds);
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_5track_5Track_16play(((struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)__pyx_v_self), __pyx_v_fade_in_seconds);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self, float __pyx_v_fade_out_seconds) {
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16play(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self, float __pyx_v_fade_in_seconds) {
+  PyObject *__pyx_v_event = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -4498,70 +5009,89 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
   PyObject *__pyx_t_7 = NULL;
   Uint32 __pyx_t_8;
   Uint8 __pyx_t_9;
-  __Pyx_RefNannySetupContext("pause", 0);
+  int __pyx_t_10;
+  Py_ssize_t __pyx_t_11;
+  PyObject *(*__pyx_t_12)(PyObject *);
+  __Pyx_RefNannySetupContext("play", 0);
 
-  /* "mpfmc/core/audio/track.pyx":284
- *             fade_out_seconds: The number of seconds to fade out the track
+  /* "mpfmc/core/audio/track.pyx":303
+ *             fade_in_seconds: The number of seconds to fade in the track
  *         """
- *         self.log.debug("pause - Pause sound processing on track")             # <<<<<<<<<<<<<<
+ *         self.log.debug("play - Begin sound processing on track")             # <<<<<<<<<<<<<<
  * 
  *         SDL_LockAudio()
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 284, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 303, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_tuple__11, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 284, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_tuple__7, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 303, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "mpfmc/core/audio/track.pyx":286
- *         self.log.debug("pause - Pause sound processing on track")
+  /* "mpfmc/core/audio/track.pyx":305
+ *         self.log.debug("play - Begin sound processing on track")
  * 
  *         SDL_LockAudio()             # <<<<<<<<<<<<<<
  * 
- *         # Stop is only supported when a track is playing
+ *         # Play is only supported when a track is paused, stopped, or is in the process of stopping
  */
   SDL_LockAudio();
 
-  /* "mpfmc/core/audio/track.pyx":289
+  /* "mpfmc/core/audio/track.pyx":308
  * 
- *         # Stop is only supported when a track is playing
- *         if self.state.status in [track_status_playing, track_status_stopping, track_status_pausing]:             # <<<<<<<<<<<<<<
- *             if fade_out_seconds > 0:
- *                 # Calculate fade data (steps and volume)
+ *         # Play is only supported when a track is paused, stopped, or is in the process of stopping
+ *         if self.state.status == track_status_paused or \             # <<<<<<<<<<<<<<
+ *                         self.state.status == track_status_stopped or \
+ *                         self.state.status == track_status_stopping:
  */
   switch (__pyx_v_self->state->status) {
-    case __pyx_e_5mpfmc_4core_5audio_5track_track_status_playing:
+    case __pyx_e_5mpfmc_4core_5audio_5track_track_status_paused:
+
+    /* "mpfmc/core/audio/track.pyx":309
+ *         # Play is only supported when a track is paused, stopped, or is in the process of stopping
+ *         if self.state.status == track_status_paused or \
+ *                         self.state.status == track_status_stopped or \             # <<<<<<<<<<<<<<
+ *                         self.state.status == track_status_stopping:
+ *             if fade_in_seconds > 0:
+ */
+    case __pyx_e_5mpfmc_4core_5audio_5track_track_status_stopped:
+
+    /* "mpfmc/core/audio/track.pyx":310
+ *         if self.state.status == track_status_paused or \
+ *                         self.state.status == track_status_stopped or \
+ *                         self.state.status == track_status_stopping:             # <<<<<<<<<<<<<<
+ *             if fade_in_seconds > 0:
+ *                 # Calculate fade data (steps and volume)
+ */
     case __pyx_e_5mpfmc_4core_5audio_5track_track_status_stopping:
-    case __pyx_e_5mpfmc_4core_5audio_5track_track_status_pausing:
 
-    /* "mpfmc/core/audio/track.pyx":290
- *         # Stop is only supported when a track is playing
- *         if self.state.status in [track_status_playing, track_status_stopping, track_status_pausing]:
- *             if fade_out_seconds > 0:             # <<<<<<<<<<<<<<
+    /* "mpfmc/core/audio/track.pyx":311
+ *                         self.state.status == track_status_stopped or \
+ *                         self.state.status == track_status_stopping:
+ *             if fade_in_seconds > 0:             # <<<<<<<<<<<<<<
  *                 # Calculate fade data (steps and volume)
- *                 self.log.debug("pause - Applying %s second fade out", str(fade_out_seconds))
+ *                 self.log.debug("play - Applying %s second fade in", str(fade_in_seconds))
  */
-    __pyx_t_3 = ((__pyx_v_fade_out_seconds > 0.0) != 0);
+    __pyx_t_3 = ((__pyx_v_fade_in_seconds > 0.0) != 0);
     if (__pyx_t_3) {
 
-      /* "mpfmc/core/audio/track.pyx":292
- *             if fade_out_seconds > 0:
+      /* "mpfmc/core/audio/track.pyx":313
+ *             if fade_in_seconds > 0:
  *                 # Calculate fade data (steps and volume)
- *                 self.log.debug("pause - Applying %s second fade out", str(fade_out_seconds))             # <<<<<<<<<<<<<<
- *                 self.state.fade_steps = <Uint32>(fade_out_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
+ *                 self.log.debug("play - Applying %s second fade in", str(fade_in_seconds))             # <<<<<<<<<<<<<<
+ *                 self.state.fade_steps = <Uint32>(fade_in_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
  *                 self.state.fade_steps_remaining = self.state.fade_steps
  */
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 292, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 313, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_4 = PyFloat_FromDouble(__pyx_v_fade_out_seconds); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 292, __pyx_L1_error)
+      __pyx_t_4 = PyFloat_FromDouble(__pyx_v_fade_in_seconds); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 313, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 292, __pyx_L1_error)
+      __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 313, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_GIVEREF(__pyx_t_4);
       PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4);
       __pyx_t_4 = 0;
-      __pyx_t_4 = __Pyx_PyObject_Call(((PyObject *)(&PyUnicode_Type)), __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 292, __pyx_L1_error)
+      __pyx_t_4 = __Pyx_PyObject_Call(((PyObject *)(&PyUnicode_Type)), __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 313, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
       __pyx_t_5 = NULL;
@@ -4578,8 +5108,8 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
       }
       #if CYTHON_FAST_PYCALL
       if (PyFunction_Check(__pyx_t_1)) {
-        PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_kp_u_pause_Applying_s_second_fade_out, __pyx_t_4};
-        __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 292, __pyx_L1_error)
+        PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_kp_u_play_Applying_s_second_fade_in, __pyx_t_4};
+        __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 313, __pyx_L1_error)
         __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
         __Pyx_GOTREF(__pyx_t_2);
         __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -4587,201 +5117,296 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
       #endif
       #if CYTHON_FAST_PYCCALL
       if (__Pyx_PyFastCFunction_Check(__pyx_t_1)) {
-        PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_kp_u_pause_Applying_s_second_fade_out, __pyx_t_4};
-        __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 292, __pyx_L1_error)
+        PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_kp_u_play_Applying_s_second_fade_in, __pyx_t_4};
+        __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 313, __pyx_L1_error)
         __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
         __Pyx_GOTREF(__pyx_t_2);
         __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       } else
       #endif
       {
-        __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 292, __pyx_L1_error)
+        __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 313, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_7);
         if (__pyx_t_5) {
           __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_5); __pyx_t_5 = NULL;
         }
-        __Pyx_INCREF(__pyx_kp_u_pause_Applying_s_second_fade_out);
-        __Pyx_GIVEREF(__pyx_kp_u_pause_Applying_s_second_fade_out);
-        PyTuple_SET_ITEM(__pyx_t_7, 0+__pyx_t_6, __pyx_kp_u_pause_Applying_s_second_fade_out);
+        __Pyx_INCREF(__pyx_kp_u_play_Applying_s_second_fade_in);
+        __Pyx_GIVEREF(__pyx_kp_u_play_Applying_s_second_fade_in);
+        PyTuple_SET_ITEM(__pyx_t_7, 0+__pyx_t_6, __pyx_kp_u_play_Applying_s_second_fade_in);
         __Pyx_GIVEREF(__pyx_t_4);
         PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_t_4);
         __pyx_t_4 = 0;
-        __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_7, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 292, __pyx_L1_error)
+        __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_7, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 313, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_2);
         __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
       }
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-      /* "mpfmc/core/audio/track.pyx":293
+      /* "mpfmc/core/audio/track.pyx":314
  *                 # Calculate fade data (steps and volume)
- *                 self.log.debug("pause - Applying %s second fade out", str(fade_out_seconds))
- *                 self.state.fade_steps = <Uint32>(fade_out_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point             # <<<<<<<<<<<<<<
+ *                 self.log.debug("play - Applying %s second fade in", str(fade_in_seconds))
+ *                 self.state.fade_steps = <Uint32>(fade_in_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point             # <<<<<<<<<<<<<<
  *                 self.state.fade_steps_remaining = self.state.fade_steps
  *                 self.state.fade_volume_start = self.state.fade_volume_current
  */
-      __pyx_t_8 = ((Uint32)(__pyx_v_fade_out_seconds * __pyx_v_self->state->callback_data->seconds_to_bytes_factor));
+      __pyx_t_8 = ((Uint32)(__pyx_v_fade_in_seconds * __pyx_v_self->state->callback_data->seconds_to_bytes_factor));
       if (unlikely(__pyx_v_self->state->callback_data->bytes_per_control_point == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
-        __PYX_ERR(0, 293, __pyx_L1_error)
+        __PYX_ERR(0, 314, __pyx_L1_error)
       }
       __pyx_v_self->state->fade_steps = (__pyx_t_8 / __pyx_v_self->state->callback_data->bytes_per_control_point);
 
-      /* "mpfmc/core/audio/track.pyx":294
- *                 self.log.debug("pause - Applying %s second fade out", str(fade_out_seconds))
- *                 self.state.fade_steps = <Uint32>(fade_out_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
+      /* "mpfmc/core/audio/track.pyx":315
+ *                 self.log.debug("play - Applying %s second fade in", str(fade_in_seconds))
+ *                 self.state.fade_steps = <Uint32>(fade_in_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
  *                 self.state.fade_steps_remaining = self.state.fade_steps             # <<<<<<<<<<<<<<
  *                 self.state.fade_volume_start = self.state.fade_volume_current
- *                 self.state.fade_volume_target = 0
+ *                 self.state.fade_volume_target = self.state.volume
  */
       __pyx_t_8 = __pyx_v_self->state->fade_steps;
       __pyx_v_self->state->fade_steps_remaining = __pyx_t_8;
 
-      /* "mpfmc/core/audio/track.pyx":295
- *                 self.state.fade_steps = <Uint32>(fade_out_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
+      /* "mpfmc/core/audio/track.pyx":316
+ *                 self.state.fade_steps = <Uint32>(fade_in_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
  *                 self.state.fade_steps_remaining = self.state.fade_steps
  *                 self.state.fade_volume_start = self.state.fade_volume_current             # <<<<<<<<<<<<<<
- *                 self.state.fade_volume_target = 0
- *                 self.state.status = track_status_pausing
+ *                 self.state.fade_volume_target = self.state.volume
+ *             else:
  */
       __pyx_t_9 = __pyx_v_self->state->fade_volume_current;
       __pyx_v_self->state->fade_volume_start = __pyx_t_9;
 
-      /* "mpfmc/core/audio/track.pyx":296
+      /* "mpfmc/core/audio/track.pyx":317
  *                 self.state.fade_steps_remaining = self.state.fade_steps
  *                 self.state.fade_volume_start = self.state.fade_volume_current
- *                 self.state.fade_volume_target = 0             # <<<<<<<<<<<<<<
- *                 self.state.status = track_status_pausing
- *             else:
- */
-      __pyx_v_self->state->fade_volume_target = 0;
-
-      /* "mpfmc/core/audio/track.pyx":297
- *                 self.state.fade_volume_start = self.state.fade_volume_current
- *                 self.state.fade_volume_target = 0
- *                 self.state.status = track_status_pausing             # <<<<<<<<<<<<<<
+ *                 self.state.fade_volume_target = self.state.volume             # <<<<<<<<<<<<<<
  *             else:
  *                 # No fade will occur, simply set volume
  */
-      __pyx_v_self->state->status = __pyx_e_5mpfmc_4core_5audio_5track_track_status_pausing;
+      __pyx_t_9 = __pyx_v_self->state->volume;
+      __pyx_v_self->state->fade_volume_target = __pyx_t_9;
 
-      /* "mpfmc/core/audio/track.pyx":290
- *         # Stop is only supported when a track is playing
- *         if self.state.status in [track_status_playing, track_status_stopping, track_status_pausing]:
- *             if fade_out_seconds > 0:             # <<<<<<<<<<<<<<
+      /* "mpfmc/core/audio/track.pyx":311
+ *                         self.state.status == track_status_stopped or \
+ *                         self.state.status == track_status_stopping:
+ *             if fade_in_seconds > 0:             # <<<<<<<<<<<<<<
  *                 # Calculate fade data (steps and volume)
- *                 self.log.debug("pause - Applying %s second fade out", str(fade_out_seconds))
+ *                 self.log.debug("play - Applying %s second fade in", str(fade_in_seconds))
  */
       goto __pyx_L3;
     }
 
-    /* "mpfmc/core/audio/track.pyx":300
+    /* "mpfmc/core/audio/track.pyx":320
  *             else:
  *                 # No fade will occur, simply set volume
  *                 self.state.fade_steps = 0             # <<<<<<<<<<<<<<
  *                 self.state.fade_steps_remaining = 0
- *                 self.state.fade_volume_current = 0
+ *                 self.state.fade_volume_current = self.state.volume
  */
     /*else*/ {
       __pyx_v_self->state->fade_steps = 0;
 
-      /* "mpfmc/core/audio/track.pyx":301
+      /* "mpfmc/core/audio/track.pyx":321
  *                 # No fade will occur, simply set volume
  *                 self.state.fade_steps = 0
  *                 self.state.fade_steps_remaining = 0             # <<<<<<<<<<<<<<
- *                 self.state.fade_volume_current = 0
- *                 self.state.fade_volume_start = 0
+ *                 self.state.fade_volume_current = self.state.volume
+ *                 self.state.fade_volume_start = self.state.volume
  */
       __pyx_v_self->state->fade_steps_remaining = 0;
 
-      /* "mpfmc/core/audio/track.pyx":302
+      /* "mpfmc/core/audio/track.pyx":322
  *                 self.state.fade_steps = 0
  *                 self.state.fade_steps_remaining = 0
- *                 self.state.fade_volume_current = 0             # <<<<<<<<<<<<<<
- *                 self.state.fade_volume_start = 0
- *                 self.state.fade_volume_target = 0
+ *                 self.state.fade_volume_current = self.state.volume             # <<<<<<<<<<<<<<
+ *                 self.state.fade_volume_start = self.state.volume
+ *                 self.state.fade_volume_target = self.state.volume
  */
-      __pyx_v_self->state->fade_volume_current = 0;
+      __pyx_t_9 = __pyx_v_self->state->volume;
+      __pyx_v_self->state->fade_volume_current = __pyx_t_9;
 
-      /* "mpfmc/core/audio/track.pyx":303
+      /* "mpfmc/core/audio/track.pyx":323
  *                 self.state.fade_steps_remaining = 0
- *                 self.state.fade_volume_current = 0
- *                 self.state.fade_volume_start = 0             # <<<<<<<<<<<<<<
- *                 self.state.fade_volume_target = 0
- *                 self.state.status = track_status_paused
- */
-      __pyx_v_self->state->fade_volume_start = 0;
-
-      /* "mpfmc/core/audio/track.pyx":304
- *                 self.state.fade_volume_current = 0
- *                 self.state.fade_volume_start = 0
- *                 self.state.fade_volume_target = 0             # <<<<<<<<<<<<<<
- *                 self.state.status = track_status_paused
- *                 send_track_paused_notification(self.state)
- */
-      __pyx_v_self->state->fade_volume_target = 0;
-
-      /* "mpfmc/core/audio/track.pyx":305
- *                 self.state.fade_volume_start = 0
- *                 self.state.fade_volume_target = 0
- *                 self.state.status = track_status_paused             # <<<<<<<<<<<<<<
- *                 send_track_paused_notification(self.state)
+ *                 self.state.fade_volume_current = self.state.volume
+ *                 self.state.fade_volume_start = self.state.volume             # <<<<<<<<<<<<<<
+ *                 self.state.fade_volume_target = self.state.volume
  * 
  */
-      __pyx_v_self->state->status = __pyx_e_5mpfmc_4core_5audio_5track_track_status_paused;
+      __pyx_t_9 = __pyx_v_self->state->volume;
+      __pyx_v_self->state->fade_volume_start = __pyx_t_9;
 
-      /* "mpfmc/core/audio/track.pyx":306
- *                 self.state.fade_volume_target = 0
- *                 self.state.status = track_status_paused
- *                 send_track_paused_notification(self.state)             # <<<<<<<<<<<<<<
+      /* "mpfmc/core/audio/track.pyx":324
+ *                 self.state.fade_volume_current = self.state.volume
+ *                 self.state.fade_volume_start = self.state.volume
+ *                 self.state.fade_volume_target = self.state.volume             # <<<<<<<<<<<<<<
  * 
- *         else:
+ *             self.state.status = track_status_playing
  */
-      __pyx_f_5mpfmc_4core_5audio_20notification_message_send_track_paused_notification(__pyx_v_self->state);
+      __pyx_t_9 = __pyx_v_self->state->volume;
+      __pyx_v_self->state->fade_volume_target = __pyx_t_9;
     }
     __pyx_L3:;
 
-    /* "mpfmc/core/audio/track.pyx":289
+    /* "mpfmc/core/audio/track.pyx":326
+ *                 self.state.fade_volume_target = self.state.volume
  * 
- *         # Stop is only supported when a track is playing
- *         if self.state.status in [track_status_playing, track_status_stopping, track_status_pausing]:             # <<<<<<<<<<<<<<
- *             if fade_out_seconds > 0:
- *                 # Calculate fade data (steps and volume)
- */
-    break;
-    default:
+ *             self.state.status = track_status_playing             # <<<<<<<<<<<<<<
+ * 
+ *             # Trigger any events
+ */
+    __pyx_v_self->state->status = __pyx_e_5mpfmc_4core_5audio_5track_track_status_playing;
 
-    /* "mpfmc/core/audio/track.pyx":309
+    /* "mpfmc/core/audio/track.pyx":329
  * 
+ *             # Trigger any events
+ *             if self.events_when_played is not None:             # <<<<<<<<<<<<<<
+ *                 for event in self.events_when_played:
+ *                     self.mc.post_mc_native_event(event, track=self._name)
+ */
+    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_events_when_played); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 329, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = (__pyx_t_2 != Py_None);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_10 = (__pyx_t_3 != 0);
+    if (__pyx_t_10) {
+
+      /* "mpfmc/core/audio/track.pyx":330
+ *             # Trigger any events
+ *             if self.events_when_played is not None:
+ *                 for event in self.events_when_played:             # <<<<<<<<<<<<<<
+ *                     self.mc.post_mc_native_event(event, track=self._name)
  *         else:
- *             self.log.warning("pause - Action may only be used when a track is playing; action "             # <<<<<<<<<<<<<<
- *                              "will be ignored.")
+ */
+      __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_events_when_played); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 330, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      if (likely(PyList_CheckExact(__pyx_t_2)) || PyTuple_CheckExact(__pyx_t_2)) {
+        __pyx_t_1 = __pyx_t_2; __Pyx_INCREF(__pyx_t_1); __pyx_t_11 = 0;
+        __pyx_t_12 = NULL;
+      } else {
+        __pyx_t_11 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 330, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __pyx_t_12 = Py_TYPE(__pyx_t_1)->tp_iternext; if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 330, __pyx_L1_error)
+      }
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      for (;;) {
+        if (likely(!__pyx_t_12)) {
+          if (likely(PyList_CheckExact(__pyx_t_1))) {
+            if (__pyx_t_11 >= PyList_GET_SIZE(__pyx_t_1)) break;
+            #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+            __pyx_t_2 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_11); __Pyx_INCREF(__pyx_t_2); __pyx_t_11++; if (unlikely(0 < 0)) __PYX_ERR(0, 330, __pyx_L1_error)
+            #else
+            __pyx_t_2 = PySequence_ITEM(__pyx_t_1, __pyx_t_11); __pyx_t_11++; if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 330, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_2);
+            #endif
+          } else {
+            if (__pyx_t_11 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
+            #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+            __pyx_t_2 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_11); __Pyx_INCREF(__pyx_t_2); __pyx_t_11++; if (unlikely(0 < 0)) __PYX_ERR(0, 330, __pyx_L1_error)
+            #else
+            __pyx_t_2 = PySequence_ITEM(__pyx_t_1, __pyx_t_11); __pyx_t_11++; if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 330, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_2);
+            #endif
+          }
+        } else {
+          __pyx_t_2 = __pyx_t_12(__pyx_t_1);
+          if (unlikely(!__pyx_t_2)) {
+            PyObject* exc_type = PyErr_Occurred();
+            if (exc_type) {
+              if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+              else __PYX_ERR(0, 330, __pyx_L1_error)
+            }
+            break;
+          }
+          __Pyx_GOTREF(__pyx_t_2);
+        }
+        __Pyx_XDECREF_SET(__pyx_v_event, __pyx_t_2);
+        __pyx_t_2 = 0;
+
+        /* "mpfmc/core/audio/track.pyx":331
+ *             if self.events_when_played is not None:
+ *                 for event in self.events_when_played:
+ *                     self.mc.post_mc_native_event(event, track=self._name)             # <<<<<<<<<<<<<<
+ *         else:
+ *             self.log.warning("play - Action may only be used when a track is stopped or is in the process "
+ */
+        __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->mc, __pyx_n_s_post_mc_native_event); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 331, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __pyx_t_7 = PyTuple_New(1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 331, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_7);
+        __Pyx_INCREF(__pyx_v_event);
+        __Pyx_GIVEREF(__pyx_v_event);
+        PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_v_event);
+        __pyx_t_4 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 331, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_track, __pyx_v_self->_name) < 0) __PYX_ERR(0, 331, __pyx_L1_error)
+        __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_7, __pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 331, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+        /* "mpfmc/core/audio/track.pyx":330
+ *             # Trigger any events
+ *             if self.events_when_played is not None:
+ *                 for event in self.events_when_played:             # <<<<<<<<<<<<<<
+ *                     self.mc.post_mc_native_event(event, track=self._name)
+ *         else:
+ */
+      }
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+      /* "mpfmc/core/audio/track.pyx":329
  * 
+ *             # Trigger any events
+ *             if self.events_when_played is not None:             # <<<<<<<<<<<<<<
+ *                 for event in self.events_when_played:
+ *                     self.mc.post_mc_native_event(event, track=self._name)
  */
-    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_warning); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 309, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_tuple__12, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 309, __pyx_L1_error)
+    }
+
+    /* "mpfmc/core/audio/track.pyx":308
+ * 
+ *         # Play is only supported when a track is paused, stopped, or is in the process of stopping
+ *         if self.state.status == track_status_paused or \             # <<<<<<<<<<<<<<
+ *                         self.state.status == track_status_stopped or \
+ *                         self.state.status == track_status_stopping:
+ */
+    break;
+    default:
+
+    /* "mpfmc/core/audio/track.pyx":333
+ *                     self.mc.post_mc_native_event(event, track=self._name)
+ *         else:
+ *             self.log.warning("play - Action may only be used when a track is stopped or is in the process "             # <<<<<<<<<<<<<<
+ *                              "of stopping; action will be ignored.")
+ * 
+ */
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_warning); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 333, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_tuple__8, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 333, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     break;
   }
 
-  /* "mpfmc/core/audio/track.pyx":312
- *                              "will be ignored.")
+  /* "mpfmc/core/audio/track.pyx":336
+ *                              "of stopping; action will be ignored.")
  * 
  *         SDL_UnlockAudio()             # <<<<<<<<<<<<<<
  * 
- *     def stop_all_sounds(self, float fade_out_seconds = 0.0):
+ *     def stop(self, float fade_out_seconds = 0.0):
  */
   SDL_UnlockAudio();
 
-  /* "mpfmc/core/audio/track.pyx":277
+  /* "mpfmc/core/audio/track.pyx":296
  *         SDL_UnlockAudio()
  * 
- *     def pause(self, float fade_out_seconds = 0.0):             # <<<<<<<<<<<<<<
+ *     def play(self, float fade_in_seconds = 0.0):             # <<<<<<<<<<<<<<
  *         """
- *         Pauses the track. Sounds will continue from where they left off when the track is resumed.
+ *         Starts playing the track so it can begin processing sounds. Function has no effect if
  */
 
   /* function exit code */
@@ -4793,30 +5418,31 @@ static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_16pause(struct __pyx
   __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
   __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_AddTraceback("mpfmc.core.audio.track.Track.pause", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("mpfmc.core.audio.track.Track.play", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_event);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "mpfmc/core/audio/track.pyx":314
+/* "mpfmc/core/audio/track.pyx":338
  *         SDL_UnlockAudio()
  * 
- *     def stop_all_sounds(self, float fade_out_seconds = 0.0):             # <<<<<<<<<<<<<<
+ *     def stop(self, float fade_out_seconds = 0.0):             # <<<<<<<<<<<<<<
  *         """
- *         Stops all playing sounds immediately on the track.
+ *         Stops the track and clears out any playing sounds. Function has no effect if the track is
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_19stop_all_sounds(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_5mpfmc_4core_5audio_5track_5Track_18stop_all_sounds[] = "Track.stop_all_sounds(self, float fade_out_seconds=0.0)\n\n        Stops all playing sounds immediately on the track.\n        Args:\n            fade_out_seconds: The number of seconds to fade out the sounds before stopping\n        ";
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_19stop_all_sounds(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  CYTHON_UNUSED float __pyx_v_fade_out_seconds;
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_19stop(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_5track_5Track_18stop[] = "Track.stop(self, float fade_out_seconds=0.0)\n\n        Stops the track and clears out any playing sounds. Function has no effect if the track is\n        already stopped.\n        Args:\n            fade_out_seconds: The number of seconds to fade out the track\n        ";
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_19stop(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  float __pyx_v_fade_out_seconds;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("stop_all_sounds (wrapper)", 0);
+  __Pyx_RefNannySetupContext("stop (wrapper)", 0);
   {
     static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_fade_out_seconds,0};
     PyObject* values[1] = {0};
@@ -4838,7 +5464,7 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_19stop_all_sounds(Py
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "stop_all_sounds") < 0)) __PYX_ERR(0, 314, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "stop") < 0)) __PYX_ERR(0, 338, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -4849,2495 +5475,8551 @@ static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_19stop_all_sounds(Py
       }
     }
     if (values[0]) {
-      __pyx_v_fade_out_seconds = __pyx_PyFloat_AsFloat(values[0]); if (unlikely((__pyx_v_fade_out_seconds == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 314, __pyx_L3_error)
+      __pyx_v_fade_out_seconds = __pyx_PyFloat_AsFloat(values[0]); if (unlikely((__pyx_v_fade_out_seconds == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 338, __pyx_L3_error)
     } else {
       __pyx_v_fade_out_seconds = ((float)0.0);
     }
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("stop_all_sounds", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 314, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("stop", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 338, __pyx_L3_error)
   __pyx_L3_error:;
-  __Pyx_AddTraceback("mpfmc.core.audio.track.Track.stop_all_sounds", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("mpfmc.core.audio.track.Track.stop", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_5track_5Track_18stop_all_sounds(((struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)__pyx_v_self), __pyx_v_fade_out_seconds);
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_5track_5Track_18stop(((struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)__pyx_v_self), __pyx_v_fade_out_seconds);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_18stop_all_sounds(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self, CYTHON_UNUSED float __pyx_v_fade_out_seconds) {
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_18stop(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self, float __pyx_v_fade_out_seconds) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("stop_all_sounds", 0);
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  Uint32 __pyx_t_8;
+  Uint8 __pyx_t_9;
+  __Pyx_RefNannySetupContext("stop", 0);
 
-  /* "mpfmc/core/audio/track.pyx":320
- *             fade_out_seconds: The number of seconds to fade out the sounds before stopping
+  /* "mpfmc/core/audio/track.pyx":345
+ *             fade_out_seconds: The number of seconds to fade out the track
  *         """
- *         raise NotImplementedError('Must be overridden in derived class')             # <<<<<<<<<<<<<<
+ *         self.log.debug("stop - Stop sound processing on track and clear state")             # <<<<<<<<<<<<<<
  * 
- *     def process(self):
+ *         SDL_LockAudio()
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple__13, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 345, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_tuple__9, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 345, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "mpfmc/core/audio/track.pyx":314
- *         SDL_UnlockAudio()
+  /* "mpfmc/core/audio/track.pyx":347
+ *         self.log.debug("stop - Stop sound processing on track and clear state")
  * 
- *     def stop_all_sounds(self, float fade_out_seconds = 0.0):             # <<<<<<<<<<<<<<
- *         """
- *         Stops all playing sounds immediately on the track.
- */
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("mpfmc.core.audio.track.Track.stop_all_sounds", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "mpfmc/core/audio/track.pyx":322
- *         raise NotImplementedError('Must be overridden in derived class')
+ *         SDL_LockAudio()             # <<<<<<<<<<<<<<
  * 
- *     def process(self):             # <<<<<<<<<<<<<<
- *         """Processes the track queue each tick."""
- *         raise NotImplementedError('Must be overridden in derived class')
+ *         # Stop is only supported when a track is playing
  */
+  SDL_LockAudio();
 
-/* Python wrapper */
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_21process(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static char __pyx_doc_5mpfmc_4core_5audio_5track_5Track_20process[] = "Track.process(self)\nProcesses the track queue each tick.";
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_21process(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("process (wrapper)", 0);
-  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_5track_5Track_20process(((struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)__pyx_v_self));
-
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_20process(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("process", 0);
-
-  /* "mpfmc/core/audio/track.pyx":324
- *     def process(self):
- *         """Processes the track queue each tick."""
- *         raise NotImplementedError('Must be overridden in derived class')             # <<<<<<<<<<<<<<
+  /* "mpfmc/core/audio/track.pyx":350
  * 
+ *         # Stop is only supported when a track is playing
+ *         if self.state.status in [track_status_playing, track_status_stopping, track_status_pausing]:             # <<<<<<<<<<<<<<
  * 
+ *             if fade_out_seconds > 0:
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple__14, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 324, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(0, 324, __pyx_L1_error)
+  switch (__pyx_v_self->state->status) {
+    case __pyx_e_5mpfmc_4core_5audio_5track_track_status_playing:
+    case __pyx_e_5mpfmc_4core_5audio_5track_track_status_stopping:
+    case __pyx_e_5mpfmc_4core_5audio_5track_track_status_pausing:
 
-  /* "mpfmc/core/audio/track.pyx":322
- *         raise NotImplementedError('Must be overridden in derived class')
+    /* "mpfmc/core/audio/track.pyx":352
+ *         if self.state.status in [track_status_playing, track_status_stopping, track_status_pausing]:
  * 
- *     def process(self):             # <<<<<<<<<<<<<<
- *         """Processes the track queue each tick."""
- *         raise NotImplementedError('Must be overridden in derived class')
+ *             if fade_out_seconds > 0:             # <<<<<<<<<<<<<<
+ *                 # Calculate fade data (steps and volume)
+ *                 self.log.debug("stop - Applying %s second fade out", str(fade_out_seconds))
  */
+    __pyx_t_3 = ((__pyx_v_fade_out_seconds > 0.0) != 0);
+    if (__pyx_t_3) {
 
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("mpfmc.core.audio.track.Track.process", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "mpfmc/core/audio/track.pyx":338
- * 
- *     @staticmethod
- *     cdef void mix_track_to_output(TrackState *track, AudioCallbackData* callback_data,             # <<<<<<<<<<<<<<
- *                                   Uint8 *output_buffer, Uint32 buffer_length) nogil:
- *         """
+      /* "mpfmc/core/audio/track.pyx":354
+ *             if fade_out_seconds > 0:
+ *                 # Calculate fade data (steps and volume)
+ *                 self.log.debug("stop - Applying %s second fade out", str(fade_out_seconds))             # <<<<<<<<<<<<<<
+ *                 self.state.fade_steps = <Uint32>(fade_out_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
+ *                 self.state.fade_steps_remaining = self.state.fade_steps
  */
-
-static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_v_track, __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData *__pyx_v_callback_data, Uint8 *__pyx_v_output_buffer, Uint32 __pyx_v_buffer_length) {
-  Uint8 *__pyx_v_track_buffer;
-  Uint32 __pyx_v_output_buffer_bytes_remaining;
-  Uint32 __pyx_v_current_chunk_bytes;
-  Uint32 __pyx_v_buffer_pos;
-  Uint8 __pyx_v_control_point;
-  Uint8 __pyx_v_ducking_volume;
-  Uint8 __pyx_v_track_volume;
-  int __pyx_t_1;
-  int __pyx_t_2;
-  Uint16 __pyx_t_3;
-  Uint32 __pyx_t_4;
-  Uint32 __pyx_t_5;
-  Uint8 __pyx_t_6;
-  int __pyx_t_7;
-
-  /* "mpfmc/core/audio/track.pyx":351
- * 
- *         cdef Uint8 *track_buffer
- *         cdef Uint32 output_buffer_bytes_remaining = buffer_length             # <<<<<<<<<<<<<<
- *         cdef Uint32 current_chunk_bytes
- *         cdef Uint32 buffer_pos = 0
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 354, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_4 = PyFloat_FromDouble(__pyx_v_fade_out_seconds); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 354, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 354, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_GIVEREF(__pyx_t_4);
+      PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4);
+      __pyx_t_4 = 0;
+      __pyx_t_4 = __Pyx_PyObject_Call(((PyObject *)(&PyUnicode_Type)), __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 354, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_t_5 = NULL;
+      __pyx_t_6 = 0;
+      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+        __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_1);
+        if (likely(__pyx_t_5)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+          __Pyx_INCREF(__pyx_t_5);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_1, function);
+          __pyx_t_6 = 1;
+        }
+      }
+      #if CYTHON_FAST_PYCALL
+      if (PyFunction_Check(__pyx_t_1)) {
+        PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_kp_u_stop_Applying_s_second_fade_out, __pyx_t_4};
+        __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 354, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      } else
+      #endif
+      #if CYTHON_FAST_PYCCALL
+      if (__Pyx_PyFastCFunction_Check(__pyx_t_1)) {
+        PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_kp_u_stop_Applying_s_second_fade_out, __pyx_t_4};
+        __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 354, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      } else
+      #endif
+      {
+        __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 354, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_7);
+        if (__pyx_t_5) {
+          __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_5); __pyx_t_5 = NULL;
+        }
+        __Pyx_INCREF(__pyx_kp_u_stop_Applying_s_second_fade_out);
+        __Pyx_GIVEREF(__pyx_kp_u_stop_Applying_s_second_fade_out);
+        PyTuple_SET_ITEM(__pyx_t_7, 0+__pyx_t_6, __pyx_kp_u_stop_Applying_s_second_fade_out);
+        __Pyx_GIVEREF(__pyx_t_4);
+        PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_t_4);
+        __pyx_t_4 = 0;
+        __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_7, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 354, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      }
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+      /* "mpfmc/core/audio/track.pyx":355
+ *                 # Calculate fade data (steps and volume)
+ *                 self.log.debug("stop - Applying %s second fade out", str(fade_out_seconds))
+ *                 self.state.fade_steps = <Uint32>(fade_out_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point             # <<<<<<<<<<<<<<
+ *                 self.state.fade_steps_remaining = self.state.fade_steps
+ *                 self.state.fade_volume_start = self.state.fade_volume_current
  */
-  __pyx_v_output_buffer_bytes_remaining = __pyx_v_buffer_length;
+      __pyx_t_8 = ((Uint32)(__pyx_v_fade_out_seconds * __pyx_v_self->state->callback_data->seconds_to_bytes_factor));
+      if (unlikely(__pyx_v_self->state->callback_data->bytes_per_control_point == 0)) {
+        PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+        __PYX_ERR(0, 355, __pyx_L1_error)
+      }
+      __pyx_v_self->state->fade_steps = (__pyx_t_8 / __pyx_v_self->state->callback_data->bytes_per_control_point);
 
-  /* "mpfmc/core/audio/track.pyx":353
- *         cdef Uint32 output_buffer_bytes_remaining = buffer_length
- *         cdef Uint32 current_chunk_bytes
- *         cdef Uint32 buffer_pos = 0             # <<<<<<<<<<<<<<
- *         cdef Uint8 control_point = 0
- *         cdef Uint8 ducking_volume
+      /* "mpfmc/core/audio/track.pyx":356
+ *                 self.log.debug("stop - Applying %s second fade out", str(fade_out_seconds))
+ *                 self.state.fade_steps = <Uint32>(fade_out_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
+ *                 self.state.fade_steps_remaining = self.state.fade_steps             # <<<<<<<<<<<<<<
+ *                 self.state.fade_volume_start = self.state.fade_volume_current
+ *                 self.state.fade_volume_target = 0
  */
-  __pyx_v_buffer_pos = 0;
+      __pyx_t_8 = __pyx_v_self->state->fade_steps;
+      __pyx_v_self->state->fade_steps_remaining = __pyx_t_8;
 
-  /* "mpfmc/core/audio/track.pyx":354
- *         cdef Uint32 current_chunk_bytes
- *         cdef Uint32 buffer_pos = 0
- *         cdef Uint8 control_point = 0             # <<<<<<<<<<<<<<
- *         cdef Uint8 ducking_volume
- *         cdef Uint8 track_volume
+      /* "mpfmc/core/audio/track.pyx":357
+ *                 self.state.fade_steps = <Uint32>(fade_out_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
+ *                 self.state.fade_steps_remaining = self.state.fade_steps
+ *                 self.state.fade_volume_start = self.state.fade_volume_current             # <<<<<<<<<<<<<<
+ *                 self.state.fade_volume_target = 0
+ *                 self.state.status = track_status_stopping
  */
-  __pyx_v_control_point = 0;
+      __pyx_t_9 = __pyx_v_self->state->fade_volume_current;
+      __pyx_v_self->state->fade_volume_start = __pyx_t_9;
 
-  /* "mpfmc/core/audio/track.pyx":358
- *         cdef Uint8 track_volume
- * 
- *         if track == NULL or track.status == track_status_stopped or track.status == track_status_paused:             # <<<<<<<<<<<<<<
- *             return
+      /* "mpfmc/core/audio/track.pyx":358
+ *                 self.state.fade_steps_remaining = self.state.fade_steps
+ *                 self.state.fade_volume_start = self.state.fade_volume_current
+ *                 self.state.fade_volume_target = 0             # <<<<<<<<<<<<<<
+ *                 self.state.status = track_status_stopping
  * 
  */
-  __pyx_t_2 = ((__pyx_v_track == NULL) != 0);
-  if (!__pyx_t_2) {
-  } else {
-    __pyx_t_1 = __pyx_t_2;
-    goto __pyx_L4_bool_binop_done;
-  }
-  switch (__pyx_v_track->status) {
-    case __pyx_e_5mpfmc_4core_5audio_5track_track_status_stopped:
-    case __pyx_e_5mpfmc_4core_5audio_5track_track_status_paused:
-    __pyx_t_2 = 1;
-    break;
-    default:
-    __pyx_t_2 = 0;
-    break;
-  }
-  __pyx_t_1 = __pyx_t_2;
-  __pyx_L4_bool_binop_done:;
-  if (__pyx_t_1) {
+      __pyx_v_self->state->fade_volume_target = 0;
 
-    /* "mpfmc/core/audio/track.pyx":359
- * 
- *         if track == NULL or track.status == track_status_stopped or track.status == track_status_paused:
- *             return             # <<<<<<<<<<<<<<
+      /* "mpfmc/core/audio/track.pyx":359
+ *                 self.state.fade_volume_start = self.state.fade_volume_current
+ *                 self.state.fade_volume_target = 0
+ *                 self.state.status = track_status_stopping             # <<<<<<<<<<<<<<
  * 
- *         track_buffer = <Uint8*>track.buffer
+ *             else:
  */
-    goto __pyx_L0;
+      __pyx_v_self->state->status = __pyx_e_5mpfmc_4core_5audio_5track_track_status_stopping;
 
-    /* "mpfmc/core/audio/track.pyx":358
- *         cdef Uint8 track_volume
- * 
- *         if track == NULL or track.status == track_status_stopped or track.status == track_status_paused:             # <<<<<<<<<<<<<<
- *             return
+      /* "mpfmc/core/audio/track.pyx":352
+ *         if self.state.status in [track_status_playing, track_status_stopping, track_status_pausing]:
  * 
+ *             if fade_out_seconds > 0:             # <<<<<<<<<<<<<<
+ *                 # Calculate fade data (steps and volume)
+ *                 self.log.debug("stop - Applying %s second fade out", str(fade_out_seconds))
  */
-  }
+      goto __pyx_L3;
+    }
 
-  /* "mpfmc/core/audio/track.pyx":361
- *             return
- * 
- *         track_buffer = <Uint8*>track.buffer             # <<<<<<<<<<<<<<
- * 
- *         # Loop over output buffer at control rate
+    /* "mpfmc/core/audio/track.pyx":363
+ *             else:
+ *                 # No fade will occur, simply set volume
+ *                 self.state.fade_steps = 0             # <<<<<<<<<<<<<<
+ *                 self.state.fade_steps_remaining = 0
+ *                 self.state.fade_volume_current = 0
  */
-  __pyx_v_track_buffer = ((Uint8 *)__pyx_v_track->buffer);
+    /*else*/ {
+      __pyx_v_self->state->fade_steps = 0;
 
-  /* "mpfmc/core/audio/track.pyx":364
- * 
- *         # Loop over output buffer at control rate
- *         while output_buffer_bytes_remaining > 0:             # <<<<<<<<<<<<<<
- * 
- *             # Determine the number of bytes to process in the current chunk
+      /* "mpfmc/core/audio/track.pyx":364
+ *                 # No fade will occur, simply set volume
+ *                 self.state.fade_steps = 0
+ *                 self.state.fade_steps_remaining = 0             # <<<<<<<<<<<<<<
+ *                 self.state.fade_volume_current = 0
+ *                 self.state.fade_volume_start = 0
  */
-  while (1) {
-    __pyx_t_1 = ((__pyx_v_output_buffer_bytes_remaining > 0) != 0);
-    if (!__pyx_t_1) break;
+      __pyx_v_self->state->fade_steps_remaining = 0;
 
-    /* "mpfmc/core/audio/track.pyx":367
- * 
- *             # Determine the number of bytes to process in the current chunk
- *             current_chunk_bytes = min(output_buffer_bytes_remaining, callback_data.bytes_per_control_point)             # <<<<<<<<<<<<<<
- * 
- *             # Apply any ducking to the track
+      /* "mpfmc/core/audio/track.pyx":365
+ *                 self.state.fade_steps = 0
+ *                 self.state.fade_steps_remaining = 0
+ *                 self.state.fade_volume_current = 0             # <<<<<<<<<<<<<<
+ *                 self.state.fade_volume_start = 0
+ *                 self.state.fade_volume_target = 0
  */
-    __pyx_t_3 = __pyx_v_callback_data->bytes_per_control_point;
-    __pyx_t_4 = __pyx_v_output_buffer_bytes_remaining;
-    if (((__pyx_t_3 < __pyx_t_4) != 0)) {
-      __pyx_t_5 = __pyx_t_3;
-    } else {
-      __pyx_t_5 = __pyx_t_4;
-    }
-    __pyx_v_current_chunk_bytes = __pyx_t_5;
+      __pyx_v_self->state->fade_volume_current = 0;
 
-    /* "mpfmc/core/audio/track.pyx":370
- * 
- *             # Apply any ducking to the track
- *             if track.ducking_is_active and control_point < CONTROL_POINTS_PER_BUFFER:             # <<<<<<<<<<<<<<
- *                 ducking_volume = g_array_index_uint8(track.ducking_control_points, control_point)
- *             else:
+      /* "mpfmc/core/audio/track.pyx":366
+ *                 self.state.fade_steps_remaining = 0
+ *                 self.state.fade_volume_current = 0
+ *                 self.state.fade_volume_start = 0             # <<<<<<<<<<<<<<
+ *                 self.state.fade_volume_target = 0
+ *                 self.state.status = track_status_stopped
  */
-    __pyx_t_2 = (__pyx_v_track->ducking_is_active != 0);
-    if (__pyx_t_2) {
-    } else {
-      __pyx_t_1 = __pyx_t_2;
-      goto __pyx_L9_bool_binop_done;
-    }
-    __pyx_t_2 = ((__pyx_v_control_point < __pyx_e_5mpfmc_4core_5audio_5track_CONTROL_POINTS_PER_BUFFER) != 0);
-    __pyx_t_1 = __pyx_t_2;
-    __pyx_L9_bool_binop_done:;
-    if (__pyx_t_1) {
+      __pyx_v_self->state->fade_volume_start = 0;
 
-      /* "mpfmc/core/audio/track.pyx":371
- *             # Apply any ducking to the track
- *             if track.ducking_is_active and control_point < CONTROL_POINTS_PER_BUFFER:
- *                 ducking_volume = g_array_index_uint8(track.ducking_control_points, control_point)             # <<<<<<<<<<<<<<
- *             else:
- *                 ducking_volume = SDL_MIX_MAXVOLUME
+      /* "mpfmc/core/audio/track.pyx":367
+ *                 self.state.fade_volume_current = 0
+ *                 self.state.fade_volume_start = 0
+ *                 self.state.fade_volume_target = 0             # <<<<<<<<<<<<<<
+ *                 self.state.status = track_status_stopped
+ *                 send_track_stopped_notification(self.state)
  */
-      __pyx_v_ducking_volume = g_array_index_uint8(__pyx_v_track->ducking_control_points, __pyx_v_control_point);
+      __pyx_v_self->state->fade_volume_target = 0;
 
-      /* "mpfmc/core/audio/track.pyx":370
+      /* "mpfmc/core/audio/track.pyx":368
+ *                 self.state.fade_volume_start = 0
+ *                 self.state.fade_volume_target = 0
+ *                 self.state.status = track_status_stopped             # <<<<<<<<<<<<<<
+ *                 send_track_stopped_notification(self.state)
  * 
- *             # Apply any ducking to the track
- *             if track.ducking_is_active and control_point < CONTROL_POINTS_PER_BUFFER:             # <<<<<<<<<<<<<<
- *                 ducking_volume = g_array_index_uint8(track.ducking_control_points, control_point)
- *             else:
  */
-      goto __pyx_L8;
-    }
+      __pyx_v_self->state->status = __pyx_e_5mpfmc_4core_5audio_5track_track_status_stopped;
 
-    /* "mpfmc/core/audio/track.pyx":373
- *                 ducking_volume = g_array_index_uint8(track.ducking_control_points, control_point)
- *             else:
- *                 ducking_volume = SDL_MIX_MAXVOLUME             # <<<<<<<<<<<<<<
+      /* "mpfmc/core/audio/track.pyx":369
+ *                 self.state.fade_volume_target = 0
+ *                 self.state.status = track_status_stopped
+ *                 send_track_stopped_notification(self.state)             # <<<<<<<<<<<<<<
  * 
- *             # Calculate track volume (handle track fading)
+ *         else:
  */
-    /*else*/ {
-      __pyx_v_ducking_volume = SDL_MIX_MAXVOLUME;
+      __pyx_f_5mpfmc_4core_5audio_20notification_message_send_track_stopped_notification(__pyx_v_self->state);
     }
-    __pyx_L8:;
+    __pyx_L3:;
 
-    /* "mpfmc/core/audio/track.pyx":376
+    /* "mpfmc/core/audio/track.pyx":350
  * 
- *             # Calculate track volume (handle track fading)
- *             if track.fade_steps_remaining > 0:             # <<<<<<<<<<<<<<
- *                 # Note: if the volume interpolation function below appears to be backwards, it is
- *                 # because the fraction is going from 1 to 0 over the fade and not from a more
+ *         # Stop is only supported when a track is playing
+ *         if self.state.status in [track_status_playing, track_status_stopping, track_status_pausing]:             # <<<<<<<<<<<<<<
+ * 
+ *             if fade_out_seconds > 0:
  */
-    __pyx_t_1 = ((__pyx_v_track->fade_steps_remaining > 0) != 0);
-    if (__pyx_t_1) {
+    break;
+    default:
 
-      /* "mpfmc/core/audio/track.pyx":380
- *                 # because the fraction is going from 1 to 0 over the fade and not from a more
- *                 # traditional 0 to 1.  This saves a few calculation cycles and is for efficiency.
- *                 track.fade_volume_current = <Uint8> (lerpU8(in_out_quad(track.fade_steps_remaining / track.fade_steps),             # <<<<<<<<<<<<<<
- *                                                             track.fade_volume_target, track.fade_volume_start))
- *                 track.fade_steps_remaining -= 1
- */
-      if (unlikely(__pyx_v_track->fade_steps == 0)) {
-        #ifdef WITH_THREAD
-        PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-        #endif
-        PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        #ifdef WITH_THREAD
-        __Pyx_PyGILState_Release(__pyx_gilstate_save);
-        #endif
-        __PYX_ERR(0, 380, __pyx_L1_error)
-      }
-
-      /* "mpfmc/core/audio/track.pyx":381
- *                 # traditional 0 to 1.  This saves a few calculation cycles and is for efficiency.
- *                 track.fade_volume_current = <Uint8> (lerpU8(in_out_quad(track.fade_steps_remaining / track.fade_steps),
- *                                                             track.fade_volume_target, track.fade_volume_start))             # <<<<<<<<<<<<<<
- *                 track.fade_steps_remaining -= 1
- *             else:
- */
-      __pyx_v_track->fade_volume_current = ((Uint8)__pyx_f_5mpfmc_4core_5audio_6inline_lerpU8(__pyx_f_5mpfmc_4core_5audio_6inline_in_out_quad((((double)__pyx_v_track->fade_steps_remaining) / ((double)__pyx_v_track->fade_steps))), __pyx_v_track->fade_volume_target, __pyx_v_track->fade_volume_start));
-
-      /* "mpfmc/core/audio/track.pyx":382
- *                 track.fade_volume_current = <Uint8> (lerpU8(in_out_quad(track.fade_steps_remaining / track.fade_steps),
- *                                                             track.fade_volume_target, track.fade_volume_start))
- *                 track.fade_steps_remaining -= 1             # <<<<<<<<<<<<<<
- *             else:
- *                 track.fade_volume_current = track.fade_volume_target
- */
-      __pyx_v_track->fade_steps_remaining = (__pyx_v_track->fade_steps_remaining - 1);
-
-      /* "mpfmc/core/audio/track.pyx":376
- * 
- *             # Calculate track volume (handle track fading)
- *             if track.fade_steps_remaining > 0:             # <<<<<<<<<<<<<<
- *                 # Note: if the volume interpolation function below appears to be backwards, it is
- *                 # because the fraction is going from 1 to 0 over the fade and not from a more
- */
-      goto __pyx_L11;
-    }
-
-    /* "mpfmc/core/audio/track.pyx":384
- *                 track.fade_steps_remaining -= 1
- *             else:
- *                 track.fade_volume_current = track.fade_volume_target             # <<<<<<<<<<<<<<
- *                 if track.status == track_status_stopping:
- *                     track.status = track_status_stopped
- */
-    /*else*/ {
-      __pyx_t_6 = __pyx_v_track->fade_volume_target;
-      __pyx_v_track->fade_volume_current = __pyx_t_6;
-
-      /* "mpfmc/core/audio/track.pyx":385
- *             else:
- *                 track.fade_volume_current = track.fade_volume_target
- *                 if track.status == track_status_stopping:             # <<<<<<<<<<<<<<
- *                     track.status = track_status_stopped
- *                     send_track_stopped_notification(track)
- */
-      switch (__pyx_v_track->status) {
-        case __pyx_e_5mpfmc_4core_5audio_5track_track_status_stopping:
-
-        /* "mpfmc/core/audio/track.pyx":386
- *                 track.fade_volume_current = track.fade_volume_target
- *                 if track.status == track_status_stopping:
- *                     track.status = track_status_stopped             # <<<<<<<<<<<<<<
- *                     send_track_stopped_notification(track)
- *                 elif track.status == track_status_pausing:
- */
-        __pyx_v_track->status = __pyx_e_5mpfmc_4core_5audio_5track_track_status_stopped;
-
-        /* "mpfmc/core/audio/track.pyx":387
- *                 if track.status == track_status_stopping:
- *                     track.status = track_status_stopped
- *                     send_track_stopped_notification(track)             # <<<<<<<<<<<<<<
- *                 elif track.status == track_status_pausing:
- *                     track.status = track_status_paused
- */
-        __pyx_f_5mpfmc_4core_5audio_20notification_message_send_track_stopped_notification(__pyx_v_track);
-
-        /* "mpfmc/core/audio/track.pyx":385
- *             else:
- *                 track.fade_volume_current = track.fade_volume_target
- *                 if track.status == track_status_stopping:             # <<<<<<<<<<<<<<
- *                     track.status = track_status_stopped
- *                     send_track_stopped_notification(track)
- */
-        break;
-
-        /* "mpfmc/core/audio/track.pyx":388
- *                     track.status = track_status_stopped
- *                     send_track_stopped_notification(track)
- *                 elif track.status == track_status_pausing:             # <<<<<<<<<<<<<<
- *                     track.status = track_status_paused
- *                     send_track_paused_notification(track)
- */
-        case __pyx_e_5mpfmc_4core_5audio_5track_track_status_pausing:
-
-        /* "mpfmc/core/audio/track.pyx":389
- *                     send_track_stopped_notification(track)
- *                 elif track.status == track_status_pausing:
- *                     track.status = track_status_paused             # <<<<<<<<<<<<<<
- *                     send_track_paused_notification(track)
- * 
- */
-        __pyx_v_track->status = __pyx_e_5mpfmc_4core_5audio_5track_track_status_paused;
-
-        /* "mpfmc/core/audio/track.pyx":390
- *                 elif track.status == track_status_pausing:
- *                     track.status = track_status_paused
- *                     send_track_paused_notification(track)             # <<<<<<<<<<<<<<
- * 
- *             track_volume = ducking_volume * track.fade_volume_current // SDL_MIX_MAXVOLUME
- */
-        __pyx_f_5mpfmc_4core_5audio_20notification_message_send_track_paused_notification(__pyx_v_track);
-
-        /* "mpfmc/core/audio/track.pyx":388
- *                     track.status = track_status_stopped
- *                     send_track_stopped_notification(track)
- *                 elif track.status == track_status_pausing:             # <<<<<<<<<<<<<<
- *                     track.status = track_status_paused
- *                     send_track_paused_notification(track)
- */
-        break;
-        default: break;
-      }
-    }
-    __pyx_L11:;
-
-    /* "mpfmc/core/audio/track.pyx":392
- *                     send_track_paused_notification(track)
- * 
- *             track_volume = ducking_volume * track.fade_volume_current // SDL_MIX_MAXVOLUME             # <<<<<<<<<<<<<<
- * 
- *             SDL_MixAudioFormat(output_buffer + buffer_pos, track_buffer + buffer_pos, callback_data.format, current_chunk_bytes, track_volume)
- */
-    __pyx_t_7 = (__pyx_v_ducking_volume * __pyx_v_track->fade_volume_current);
-    if (unlikely(SDL_MIX_MAXVOLUME == 0)) {
-      #ifdef WITH_THREAD
-      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-      #endif
-      PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
-      #ifdef WITH_THREAD
-      __Pyx_PyGILState_Release(__pyx_gilstate_save);
-      #endif
-      __PYX_ERR(0, 392, __pyx_L1_error)
-    }
-    else if (sizeof(int) == sizeof(long) && (!(((int)-1) > 0)) && unlikely(SDL_MIX_MAXVOLUME == (int)-1)  && unlikely(UNARY_NEG_WOULD_OVERFLOW(__pyx_t_7))) {
-      #ifdef WITH_THREAD
-      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-      #endif
-      PyErr_SetString(PyExc_OverflowError, "value too large to perform division");
-      #ifdef WITH_THREAD
-      __Pyx_PyGILState_Release(__pyx_gilstate_save);
-      #endif
-      __PYX_ERR(0, 392, __pyx_L1_error)
-    }
-    __pyx_v_track_volume = __Pyx_div_int(__pyx_t_7, SDL_MIX_MAXVOLUME);
-
-    /* "mpfmc/core/audio/track.pyx":394
- *             track_volume = ducking_volume * track.fade_volume_current // SDL_MIX_MAXVOLUME
+    /* "mpfmc/core/audio/track.pyx":372
  * 
- *             SDL_MixAudioFormat(output_buffer + buffer_pos, track_buffer + buffer_pos, callback_data.format, current_chunk_bytes, track_volume)             # <<<<<<<<<<<<<<
+ *         else:
+ *             self.log.warning("stop - Action may only be used when a track is playing; action "             # <<<<<<<<<<<<<<
+ *                              "will be ignored.")
  * 
- *             output_buffer_bytes_remaining -= current_chunk_bytes
  */
-    SDL_MixAudioFormat((__pyx_v_output_buffer + __pyx_v_buffer_pos), (__pyx_v_track_buffer + __pyx_v_buffer_pos), __pyx_v_callback_data->format, __pyx_v_current_chunk_bytes, __pyx_v_track_volume);
+    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_warning); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 372, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_tuple__10, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 372, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    break;
+  }
 
-    /* "mpfmc/core/audio/track.pyx":396
- *             SDL_MixAudioFormat(output_buffer + buffer_pos, track_buffer + buffer_pos, callback_data.format, current_chunk_bytes, track_volume)
+  /* "mpfmc/core/audio/track.pyx":375
+ *                              "will be ignored.")
  * 
- *             output_buffer_bytes_remaining -= current_chunk_bytes             # <<<<<<<<<<<<<<
- *             buffer_pos += current_chunk_bytes
- *             control_point += 1
- */
-    __pyx_v_output_buffer_bytes_remaining = (__pyx_v_output_buffer_bytes_remaining - __pyx_v_current_chunk_bytes);
-
-    /* "mpfmc/core/audio/track.pyx":397
+ *         SDL_UnlockAudio()             # <<<<<<<<<<<<<<
  * 
- *             output_buffer_bytes_remaining -= current_chunk_bytes
- *             buffer_pos += current_chunk_bytes             # <<<<<<<<<<<<<<
- *             control_point += 1
- */
-    __pyx_v_buffer_pos = (__pyx_v_buffer_pos + __pyx_v_current_chunk_bytes);
-
-    /* "mpfmc/core/audio/track.pyx":398
- *             output_buffer_bytes_remaining -= current_chunk_bytes
- *             buffer_pos += current_chunk_bytes
- *             control_point += 1             # <<<<<<<<<<<<<<
+ *     def pause(self, float fade_out_seconds = 0.0):
  */
-    __pyx_v_control_point = (__pyx_v_control_point + 1);
-  }
+  SDL_UnlockAudio();
 
   /* "mpfmc/core/audio/track.pyx":338
+ *         SDL_UnlockAudio()
  * 
- *     @staticmethod
- *     cdef void mix_track_to_output(TrackState *track, AudioCallbackData* callback_data,             # <<<<<<<<<<<<<<
- *                                   Uint8 *output_buffer, Uint32 buffer_length) nogil:
+ *     def stop(self, float fade_out_seconds = 0.0):             # <<<<<<<<<<<<<<
  *         """
+ *         Stops the track and clears out any playing sounds. Function has no effect if the track is
  */
 
   /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_WriteUnraisable("mpfmc.core.audio.track.Track.mix_track_to_output", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 1);
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("mpfmc.core.audio.track.Track.stop", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
   __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
 }
 
-/* "(tree fragment)":1
- * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):
+/* "mpfmc/core/audio/track.pyx":377
+ *         SDL_UnlockAudio()
+ * 
+ *     def pause(self, float fade_out_seconds = 0.0):             # <<<<<<<<<<<<<<
+ *         """
+ *         Pauses the track. Sounds will continue from where they left off when the track is resumed.
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_23__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static char __pyx_doc_5mpfmc_4core_5audio_5track_5Track_22__reduce_cython__[] = "Track.__reduce_cython__(self)";
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_23__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_21pause(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_5track_5Track_20pause[] = "Track.pause(self, float fade_out_seconds=0.0)\n\n        Pauses the track. Sounds will continue from where they left off when the track is resumed.\n        Function has no effect unless the track is playing.\n        Args:\n            fade_out_seconds: The number of seconds to fade out the track\n        ";
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_21pause(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  float __pyx_v_fade_out_seconds;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_5track_5Track_22__reduce_cython__(((struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)__pyx_v_self));
+  __Pyx_RefNannySetupContext("pause (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_fade_out_seconds,0};
+    PyObject* values[1] = {0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (kw_args > 0) {
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_fade_out_seconds);
+          if (value) { values[0] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "pause") < 0)) __PYX_ERR(0, 377, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    if (values[0]) {
+      __pyx_v_fade_out_seconds = __pyx_PyFloat_AsFloat(values[0]); if (unlikely((__pyx_v_fade_out_seconds == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 377, __pyx_L3_error)
+    } else {
+      __pyx_v_fade_out_seconds = ((float)0.0);
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("pause", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 377, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("mpfmc.core.audio.track.Track.pause", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_5track_5Track_20pause(((struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)__pyx_v_self), __pyx_v_fade_out_seconds);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_22__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self) {
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_20pause(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self, float __pyx_v_fade_out_seconds) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  Uint32 __pyx_t_8;
+  Uint8 __pyx_t_9;
+  __Pyx_RefNannySetupContext("pause", 0);
 
-  /* "(tree fragment)":2
- * def __reduce_cython__(self):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
- * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+  /* "mpfmc/core/audio/track.pyx":384
+ *             fade_out_seconds: The number of seconds to fade out the track
+ *         """
+ *         self.log.debug("pause - Pause sound processing on track")             # <<<<<<<<<<<<<<
+ * 
+ *         SDL_LockAudio()
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__15, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 384, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_tuple__11, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 384, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "(tree fragment)":1
- * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):
+  /* "mpfmc/core/audio/track.pyx":386
+ *         self.log.debug("pause - Pause sound processing on track")
+ * 
+ *         SDL_LockAudio()             # <<<<<<<<<<<<<<
+ * 
+ *         # Stop is only supported when a track is playing
  */
+  SDL_LockAudio();
 
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("mpfmc.core.audio.track.Track.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
+  /* "mpfmc/core/audio/track.pyx":389
+ * 
+ *         # Stop is only supported when a track is playing
+ *         if self.state.status in [track_status_playing, track_status_stopping, track_status_pausing]:             # <<<<<<<<<<<<<<
+ *             if fade_out_seconds > 0:
+ *                 # Calculate fade data (steps and volume)
+ */
+  switch (__pyx_v_self->state->status) {
+    case __pyx_e_5mpfmc_4core_5audio_5track_track_status_playing:
+    case __pyx_e_5mpfmc_4core_5audio_5track_track_status_stopping:
+    case __pyx_e_5mpfmc_4core_5audio_5track_track_status_pausing:
 
-/* "(tree fragment)":3
- * def __reduce_cython__(self):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+    /* "mpfmc/core/audio/track.pyx":390
+ *         # Stop is only supported when a track is playing
+ *         if self.state.status in [track_status_playing, track_status_stopping, track_status_pausing]:
+ *             if fade_out_seconds > 0:             # <<<<<<<<<<<<<<
+ *                 # Calculate fade data (steps and volume)
+ *                 self.log.debug("pause - Applying %s second fade out", str(fade_out_seconds))
  */
+    __pyx_t_3 = ((__pyx_v_fade_out_seconds > 0.0) != 0);
+    if (__pyx_t_3) {
 
-/* Python wrapper */
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_25__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
-static char __pyx_doc_5mpfmc_4core_5audio_5track_5Track_24__setstate_cython__[] = "Track.__setstate_cython__(self, __pyx_state)";
-static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_25__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_5track_5Track_24__setstate_cython__(((struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+      /* "mpfmc/core/audio/track.pyx":392
+ *             if fade_out_seconds > 0:
+ *                 # Calculate fade data (steps and volume)
+ *                 self.log.debug("pause - Applying %s second fade out", str(fade_out_seconds))             # <<<<<<<<<<<<<<
+ *                 self.state.fade_steps = <Uint32>(fade_out_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
+ *                 self.state.fade_steps_remaining = self.state.fade_steps
+ */
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_debug); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 392, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_4 = PyFloat_FromDouble(__pyx_v_fade_out_seconds); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 392, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 392, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_GIVEREF(__pyx_t_4);
+      PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4);
+      __pyx_t_4 = 0;
+      __pyx_t_4 = __Pyx_PyObject_Call(((PyObject *)(&PyUnicode_Type)), __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 392, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_t_5 = NULL;
+      __pyx_t_6 = 0;
+      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+        __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_1);
+        if (likely(__pyx_t_5)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+          __Pyx_INCREF(__pyx_t_5);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_1, function);
+          __pyx_t_6 = 1;
+        }
+      }
+      #if CYTHON_FAST_PYCALL
+      if (PyFunction_Check(__pyx_t_1)) {
+        PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_kp_u_pause_Applying_s_second_fade_out, __pyx_t_4};
+        __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 392, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      } else
+      #endif
+      #if CYTHON_FAST_PYCCALL
+      if (__Pyx_PyFastCFunction_Check(__pyx_t_1)) {
+        PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_kp_u_pause_Applying_s_second_fade_out, __pyx_t_4};
+        __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 392, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      } else
+      #endif
+      {
+        __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 392, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_7);
+        if (__pyx_t_5) {
+          __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_5); __pyx_t_5 = NULL;
+        }
+        __Pyx_INCREF(__pyx_kp_u_pause_Applying_s_second_fade_out);
+        __Pyx_GIVEREF(__pyx_kp_u_pause_Applying_s_second_fade_out);
+        PyTuple_SET_ITEM(__pyx_t_7, 0+__pyx_t_6, __pyx_kp_u_pause_Applying_s_second_fade_out);
+        __Pyx_GIVEREF(__pyx_t_4);
+        PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_t_4);
+        __pyx_t_4 = 0;
+        __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_7, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 392, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      }
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
+      /* "mpfmc/core/audio/track.pyx":393
+ *                 # Calculate fade data (steps and volume)
+ *                 self.log.debug("pause - Applying %s second fade out", str(fade_out_seconds))
+ *                 self.state.fade_steps = <Uint32>(fade_out_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point             # <<<<<<<<<<<<<<
+ *                 self.state.fade_steps_remaining = self.state.fade_steps
+ *                 self.state.fade_volume_start = self.state.fade_volume_current
+ */
+      __pyx_t_8 = ((Uint32)(__pyx_v_fade_out_seconds * __pyx_v_self->state->callback_data->seconds_to_bytes_factor));
+      if (unlikely(__pyx_v_self->state->callback_data->bytes_per_control_point == 0)) {
+        PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+        __PYX_ERR(0, 393, __pyx_L1_error)
+      }
+      __pyx_v_self->state->fade_steps = (__pyx_t_8 / __pyx_v_self->state->callback_data->bytes_per_control_point);
 
-static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_24__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+      /* "mpfmc/core/audio/track.pyx":394
+ *                 self.log.debug("pause - Applying %s second fade out", str(fade_out_seconds))
+ *                 self.state.fade_steps = <Uint32>(fade_out_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
+ *                 self.state.fade_steps_remaining = self.state.fade_steps             # <<<<<<<<<<<<<<
+ *                 self.state.fade_volume_start = self.state.fade_volume_current
+ *                 self.state.fade_volume_target = 0
+ */
+      __pyx_t_8 = __pyx_v_self->state->fade_steps;
+      __pyx_v_self->state->fade_steps_remaining = __pyx_t_8;
 
-  /* "(tree fragment)":4
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+      /* "mpfmc/core/audio/track.pyx":395
+ *                 self.state.fade_steps = <Uint32>(fade_out_seconds * self.state.callback_data.seconds_to_bytes_factor) // self.state.callback_data.bytes_per_control_point
+ *                 self.state.fade_steps_remaining = self.state.fade_steps
+ *                 self.state.fade_volume_start = self.state.fade_volume_current             # <<<<<<<<<<<<<<
+ *                 self.state.fade_volume_target = 0
+ *                 self.state.status = track_status_pausing
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__16, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(1, 4, __pyx_L1_error)
+      __pyx_t_9 = __pyx_v_self->state->fade_volume_current;
+      __pyx_v_self->state->fade_volume_start = __pyx_t_9;
 
-  /* "(tree fragment)":3
- * def __reduce_cython__(self):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+      /* "mpfmc/core/audio/track.pyx":396
+ *                 self.state.fade_steps_remaining = self.state.fade_steps
+ *                 self.state.fade_volume_start = self.state.fade_volume_current
+ *                 self.state.fade_volume_target = 0             # <<<<<<<<<<<<<<
+ *                 self.state.status = track_status_pausing
+ *             else:
  */
+      __pyx_v_self->state->fade_volume_target = 0;
 
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("mpfmc.core.audio.track.Track.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
+      /* "mpfmc/core/audio/track.pyx":397
+ *                 self.state.fade_volume_start = self.state.fade_volume_current
+ *                 self.state.fade_volume_target = 0
+ *                 self.state.status = track_status_pausing             # <<<<<<<<<<<<<<
+ *             else:
+ *                 # No fade will occur, simply set volume
+ */
+      __pyx_v_self->state->status = __pyx_e_5mpfmc_4core_5audio_5track_track_status_pausing;
 
-/* "mpfmc/core/audio/notification_message.pxd":50
- * # ---------------------------------------------------------------------------
- * 
- * cdef inline NotificationMessageContainer *_create_notification_message() nogil:             # <<<<<<<<<<<<<<
- *     """
- *     Creates a new notification message.
+      /* "mpfmc/core/audio/track.pyx":390
+ *         # Stop is only supported when a track is playing
+ *         if self.state.status in [track_status_playing, track_status_stopping, track_status_pausing]:
+ *             if fade_out_seconds > 0:             # <<<<<<<<<<<<<<
+ *                 # Calculate fade data (steps and volume)
+ *                 self.log.debug("pause - Applying %s second fade out", str(fade_out_seconds))
  */
+      goto __pyx_L3;
+    }
 
-static CYTHON_INLINE __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message(void) {
-  __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_r;
+    /* "mpfmc/core/audio/track.pyx":400
+ *             else:
+ *                 # No fade will occur, simply set volume
+ *                 self.state.fade_steps = 0             # <<<<<<<<<<<<<<
+ *                 self.state.fade_steps_remaining = 0
+ *                 self.state.fade_volume_current = 0
+ */
+    /*else*/ {
+      __pyx_v_self->state->fade_steps = 0;
 
-  /* "mpfmc/core/audio/notification_message.pxd":55
- *     :return: A pointer to the new notification message.
- *     """
- *     return <NotificationMessageContainer*>g_slice_alloc0(sizeof(NotificationMessageContainer))             # <<<<<<<<<<<<<<
- * 
- * cdef inline void send_sound_started_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,
+      /* "mpfmc/core/audio/track.pyx":401
+ *                 # No fade will occur, simply set volume
+ *                 self.state.fade_steps = 0
+ *                 self.state.fade_steps_remaining = 0             # <<<<<<<<<<<<<<
+ *                 self.state.fade_volume_current = 0
+ *                 self.state.fade_volume_start = 0
  */
-  __pyx_r = ((__pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *)g_slice_alloc0((sizeof(__pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer))));
-  goto __pyx_L0;
+      __pyx_v_self->state->fade_steps_remaining = 0;
 
-  /* "mpfmc/core/audio/notification_message.pxd":50
- * # ---------------------------------------------------------------------------
- * 
- * cdef inline NotificationMessageContainer *_create_notification_message() nogil:             # <<<<<<<<<<<<<<
- *     """
- *     Creates a new notification message.
+      /* "mpfmc/core/audio/track.pyx":402
+ *                 self.state.fade_steps = 0
+ *                 self.state.fade_steps_remaining = 0
+ *                 self.state.fade_volume_current = 0             # <<<<<<<<<<<<<<
+ *                 self.state.fade_volume_start = 0
+ *                 self.state.fade_volume_target = 0
  */
+      __pyx_v_self->state->fade_volume_current = 0;
 
-  /* function exit code */
-  __pyx_L0:;
-  return __pyx_r;
-}
+      /* "mpfmc/core/audio/track.pyx":403
+ *                 self.state.fade_steps_remaining = 0
+ *                 self.state.fade_volume_current = 0
+ *                 self.state.fade_volume_start = 0             # <<<<<<<<<<<<<<
+ *                 self.state.fade_volume_target = 0
+ *                 self.state.status = track_status_paused
+ */
+      __pyx_v_self->state->fade_volume_start = 0;
 
-/* "mpfmc/core/audio/notification_message.pxd":57
- *     return <NotificationMessageContainer*>g_slice_alloc0(sizeof(NotificationMessageContainer))
+      /* "mpfmc/core/audio/track.pyx":404
+ *                 self.state.fade_volume_current = 0
+ *                 self.state.fade_volume_start = 0
+ *                 self.state.fade_volume_target = 0             # <<<<<<<<<<<<<<
+ *                 self.state.status = track_status_paused
+ *                 send_track_paused_notification(self.state)
+ */
+      __pyx_v_self->state->fade_volume_target = 0;
+
+      /* "mpfmc/core/audio/track.pyx":405
+ *                 self.state.fade_volume_start = 0
+ *                 self.state.fade_volume_target = 0
+ *                 self.state.status = track_status_paused             # <<<<<<<<<<<<<<
+ *                 send_track_paused_notification(self.state)
  * 
- * cdef inline void send_sound_started_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,             # <<<<<<<<<<<<<<
- *                                                  TrackState *track) nogil:
- *     """
  */
+      __pyx_v_self->state->status = __pyx_e_5mpfmc_4core_5audio_5track_track_status_paused;
 
-static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_send_sound_started_notification(int __pyx_v_player, Uint64 __pyx_v_sound_id, Uint64 __pyx_v_sound_instance_id, __pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_v_track) {
-  __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_v_notification_message;
-  int __pyx_t_1;
-
-  /* "mpfmc/core/audio/notification_message.pxd":67
- *         track: The TrackState pointer
- *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()             # <<<<<<<<<<<<<<
- *     if notification_message != NULL:
- *         notification_message.message = notification_sound_started
- */
-  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message();
-
-  /* "mpfmc/core/audio/notification_message.pxd":68
- *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
- *     if notification_message != NULL:             # <<<<<<<<<<<<<<
- *         notification_message.message = notification_sound_started
- *         notification_message.player = player
- */
-  __pyx_t_1 = ((__pyx_v_notification_message != NULL) != 0);
-  if (__pyx_t_1) {
-
-    /* "mpfmc/core/audio/notification_message.pxd":69
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
- *     if notification_message != NULL:
- *         notification_message.message = notification_sound_started             # <<<<<<<<<<<<<<
- *         notification_message.player = player
- *         notification_message.sound_id = sound_id
- */
-    __pyx_v_notification_message->message = __pyx_e_5mpfmc_4core_5audio_20notification_message_notification_sound_started;
-
-    /* "mpfmc/core/audio/notification_message.pxd":70
- *     if notification_message != NULL:
- *         notification_message.message = notification_sound_started
- *         notification_message.player = player             # <<<<<<<<<<<<<<
- *         notification_message.sound_id = sound_id
- *         notification_message.sound_instance_id = sound_instance_id
- */
-    __pyx_v_notification_message->player = __pyx_v_player;
-
-    /* "mpfmc/core/audio/notification_message.pxd":71
- *         notification_message.message = notification_sound_started
- *         notification_message.player = player
- *         notification_message.sound_id = sound_id             # <<<<<<<<<<<<<<
- *         notification_message.sound_instance_id = sound_instance_id
+      /* "mpfmc/core/audio/track.pyx":406
+ *                 self.state.fade_volume_target = 0
+ *                 self.state.status = track_status_paused
+ *                 send_track_paused_notification(self.state)             # <<<<<<<<<<<<<<
  * 
+ *         else:
  */
-    __pyx_v_notification_message->sound_id = __pyx_v_sound_id;
+      __pyx_f_5mpfmc_4core_5audio_20notification_message_send_track_paused_notification(__pyx_v_self->state);
+    }
+    __pyx_L3:;
 
-    /* "mpfmc/core/audio/notification_message.pxd":72
- *         notification_message.player = player
- *         notification_message.sound_id = sound_id
- *         notification_message.sound_instance_id = sound_instance_id             # <<<<<<<<<<<<<<
+    /* "mpfmc/core/audio/track.pyx":389
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+ *         # Stop is only supported when a track is playing
+ *         if self.state.status in [track_status_playing, track_status_stopping, track_status_pausing]:             # <<<<<<<<<<<<<<
+ *             if fade_out_seconds > 0:
+ *                 # Calculate fade data (steps and volume)
  */
-    __pyx_v_notification_message->sound_instance_id = __pyx_v_sound_instance_id;
+    break;
+    default:
 
-    /* "mpfmc/core/audio/notification_message.pxd":74
- *         notification_message.sound_instance_id = sound_instance_id
+    /* "mpfmc/core/audio/track.pyx":409
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)             # <<<<<<<<<<<<<<
+ *         else:
+ *             self.log.warning("pause - Action may only be used when a track is playing; action "             # <<<<<<<<<<<<<<
+ *                              "will be ignored.")
  * 
- * cdef inline void send_sound_stopped_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,
  */
-    __pyx_v_track->notification_messages = g_slist_prepend(__pyx_v_track->notification_messages, __pyx_v_notification_message);
+    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->log, __pyx_n_s_warning); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 409, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_tuple__12, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 409, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    break;
+  }
 
-    /* "mpfmc/core/audio/notification_message.pxd":68
- *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
- *     if notification_message != NULL:             # <<<<<<<<<<<<<<
- *         notification_message.message = notification_sound_started
- *         notification_message.player = player
+  /* "mpfmc/core/audio/track.pyx":412
+ *                              "will be ignored.")
+ * 
+ *         SDL_UnlockAudio()             # <<<<<<<<<<<<<<
+ * 
+ *     def stop_all_sounds(self, float fade_out_seconds = 0.0):
  */
-  }
+  SDL_UnlockAudio();
 
-  /* "mpfmc/core/audio/notification_message.pxd":57
- *     return <NotificationMessageContainer*>g_slice_alloc0(sizeof(NotificationMessageContainer))
+  /* "mpfmc/core/audio/track.pyx":377
+ *         SDL_UnlockAudio()
  * 
- * cdef inline void send_sound_started_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,             # <<<<<<<<<<<<<<
- *                                                  TrackState *track) nogil:
- *     """
+ *     def pause(self, float fade_out_seconds = 0.0):             # <<<<<<<<<<<<<<
+ *         """
+ *         Pauses the track. Sounds will continue from where they left off when the track is resumed.
  */
 
   /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("mpfmc.core.audio.track.Track.pause", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
 }
 
-/* "mpfmc/core/audio/notification_message.pxd":76
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+/* "mpfmc/core/audio/track.pyx":414
+ *         SDL_UnlockAudio()
  * 
- * cdef inline void send_sound_stopped_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,             # <<<<<<<<<<<<<<
- *                                                  TrackState *track) nogil:
- *     """
- */
-
-static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_send_sound_stopped_notification(int __pyx_v_player, Uint64 __pyx_v_sound_id, Uint64 __pyx_v_sound_instance_id, __pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_v_track) {
-  __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_v_notification_message;
-  int __pyx_t_1;
-
-  /* "mpfmc/core/audio/notification_message.pxd":86
- *         track: The TrackState pointer
- *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()             # <<<<<<<<<<<<<<
- *     if notification_message != NULL:
- *         notification_message.message = notification_sound_stopped
- */
-  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message();
-
-  /* "mpfmc/core/audio/notification_message.pxd":87
- *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
- *     if notification_message != NULL:             # <<<<<<<<<<<<<<
- *         notification_message.message = notification_sound_stopped
- *         notification_message.player = player
+ *     def stop_all_sounds(self, float fade_out_seconds = 0.0):             # <<<<<<<<<<<<<<
+ *         """
+ *         Stops all playing sounds immediately on the track.
  */
-  __pyx_t_1 = ((__pyx_v_notification_message != NULL) != 0);
-  if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/notification_message.pxd":88
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
- *     if notification_message != NULL:
- *         notification_message.message = notification_sound_stopped             # <<<<<<<<<<<<<<
- *         notification_message.player = player
- *         notification_message.sound_id = sound_id
- */
-    __pyx_v_notification_message->message = __pyx_e_5mpfmc_4core_5audio_20notification_message_notification_sound_stopped;
+/* Python wrapper */
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_23stop_all_sounds(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_5track_5Track_22stop_all_sounds[] = "Track.stop_all_sounds(self, float fade_out_seconds=0.0)\n\n        Stops all playing sounds immediately on the track.\n        Args:\n            fade_out_seconds: The number of seconds to fade out the sounds before stopping\n        ";
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_23stop_all_sounds(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  CYTHON_UNUSED float __pyx_v_fade_out_seconds;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("stop_all_sounds (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_fade_out_seconds,0};
+    PyObject* values[1] = {0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (kw_args > 0) {
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_fade_out_seconds);
+          if (value) { values[0] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "stop_all_sounds") < 0)) __PYX_ERR(0, 414, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    if (values[0]) {
+      __pyx_v_fade_out_seconds = __pyx_PyFloat_AsFloat(values[0]); if (unlikely((__pyx_v_fade_out_seconds == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 414, __pyx_L3_error)
+    } else {
+      __pyx_v_fade_out_seconds = ((float)0.0);
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("stop_all_sounds", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 414, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("mpfmc.core.audio.track.Track.stop_all_sounds", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_5track_5Track_22stop_all_sounds(((struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)__pyx_v_self), __pyx_v_fade_out_seconds);
 
-    /* "mpfmc/core/audio/notification_message.pxd":89
- *     if notification_message != NULL:
- *         notification_message.message = notification_sound_stopped
- *         notification_message.player = player             # <<<<<<<<<<<<<<
- *         notification_message.sound_id = sound_id
- *         notification_message.sound_instance_id = sound_instance_id
- */
-    __pyx_v_notification_message->player = __pyx_v_player;
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-    /* "mpfmc/core/audio/notification_message.pxd":90
- *         notification_message.message = notification_sound_stopped
- *         notification_message.player = player
- *         notification_message.sound_id = sound_id             # <<<<<<<<<<<<<<
- *         notification_message.sound_instance_id = sound_instance_id
- * 
- */
-    __pyx_v_notification_message->sound_id = __pyx_v_sound_id;
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_22stop_all_sounds(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self, CYTHON_UNUSED float __pyx_v_fade_out_seconds) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannySetupContext("stop_all_sounds", 0);
 
-    /* "mpfmc/core/audio/notification_message.pxd":91
- *         notification_message.player = player
- *         notification_message.sound_id = sound_id
- *         notification_message.sound_instance_id = sound_instance_id             # <<<<<<<<<<<<<<
+  /* "mpfmc/core/audio/track.pyx":420
+ *             fade_out_seconds: The number of seconds to fade out the sounds before stopping
+ *         """
+ *         raise NotImplementedError('Must be overridden in derived class')             # <<<<<<<<<<<<<<
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+ *     def process(self):
  */
-    __pyx_v_notification_message->sound_instance_id = __pyx_v_sound_instance_id;
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple__13, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 420, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(0, 420, __pyx_L1_error)
 
-    /* "mpfmc/core/audio/notification_message.pxd":93
- *         notification_message.sound_instance_id = sound_instance_id
- * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)             # <<<<<<<<<<<<<<
+  /* "mpfmc/core/audio/track.pyx":414
+ *         SDL_UnlockAudio()
  * 
- * cdef inline void send_sound_looping_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,
+ *     def stop_all_sounds(self, float fade_out_seconds = 0.0):             # <<<<<<<<<<<<<<
+ *         """
+ *         Stops all playing sounds immediately on the track.
  */
-    __pyx_v_track->notification_messages = g_slist_prepend(__pyx_v_track->notification_messages, __pyx_v_notification_message);
 
-    /* "mpfmc/core/audio/notification_message.pxd":87
- *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
- *     if notification_message != NULL:             # <<<<<<<<<<<<<<
- *         notification_message.message = notification_sound_stopped
- *         notification_message.player = player
- */
-  }
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("mpfmc.core.audio.track.Track.stop_all_sounds", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-  /* "mpfmc/core/audio/notification_message.pxd":76
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+/* "mpfmc/core/audio/track.pyx":422
+ *         raise NotImplementedError('Must be overridden in derived class')
  * 
- * cdef inline void send_sound_stopped_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,             # <<<<<<<<<<<<<<
- *                                                  TrackState *track) nogil:
- *     """
+ *     def process(self):             # <<<<<<<<<<<<<<
+ *         """Processes the track queue each tick."""
+ *         raise NotImplementedError('Must be overridden in derived class')
  */
 
+/* Python wrapper */
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_25process(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_5track_5Track_24process[] = "Track.process(self)\nProcesses the track queue each tick.";
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_25process(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("process (wrapper)", 0);
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_5track_5Track_24process(((struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)__pyx_v_self));
+
   /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
 }
 
-/* "mpfmc/core/audio/notification_message.pxd":95
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_24process(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannySetupContext("process", 0);
+
+  /* "mpfmc/core/audio/track.pyx":424
+ *     def process(self):
+ *         """Processes the track queue each tick."""
+ *         raise NotImplementedError('Must be overridden in derived class')             # <<<<<<<<<<<<<<
+ * 
  * 
- * cdef inline void send_sound_looping_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,             # <<<<<<<<<<<<<<
- *                                                  TrackState *track) nogil:
- *     """
  */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple__14, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 424, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(0, 424, __pyx_L1_error)
 
-static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_send_sound_looping_notification(int __pyx_v_player, Uint64 __pyx_v_sound_id, Uint64 __pyx_v_sound_instance_id, __pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_v_track) {
-  __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_v_notification_message;
-  int __pyx_t_1;
-
-  /* "mpfmc/core/audio/notification_message.pxd":105
- *         track: The TrackState pointer
- *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()             # <<<<<<<<<<<<<<
- *     if notification_message != NULL:
- *         notification_message.message = notification_sound_looping
+  /* "mpfmc/core/audio/track.pyx":422
+ *         raise NotImplementedError('Must be overridden in derived class')
+ * 
+ *     def process(self):             # <<<<<<<<<<<<<<
+ *         """Processes the track queue each tick."""
+ *         raise NotImplementedError('Must be overridden in derived class')
  */
-  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message();
 
-  /* "mpfmc/core/audio/notification_message.pxd":106
- *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
- *     if notification_message != NULL:             # <<<<<<<<<<<<<<
- *         notification_message.message = notification_sound_looping
- *         notification_message.player = player
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("mpfmc.core.audio.track.Track.process", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/track.pyx":438
+ * 
+ *     @staticmethod
+ *     cdef void mix_track_to_output(TrackState *track, AudioCallbackData* callback_data,             # <<<<<<<<<<<<<<
+ *                                   Uint8 *output_buffer, Uint32 buffer_length) nogil:
+ *         """
  */
-  __pyx_t_1 = ((__pyx_v_notification_message != NULL) != 0);
-  if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/notification_message.pxd":107
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
- *     if notification_message != NULL:
- *         notification_message.message = notification_sound_looping             # <<<<<<<<<<<<<<
- *         notification_message.player = player
- *         notification_message.sound_id = sound_id
+static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_v_track, __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData *__pyx_v_callback_data, CYTHON_UNUSED Uint8 *__pyx_v_output_buffer, Uint32 __pyx_v_buffer_length) {
+  Sint16 *__pyx_v_track_buffer;
+  Uint32 __pyx_v_output_buffer_bytes_remaining;
+  Uint32 __pyx_v_current_chunk_bytes;
+  Uint32 __pyx_v_current_chunk_samples;
+  Uint32 __pyx_v_buffer_pos;
+  Uint8 __pyx_v_control_point;
+  Uint8 __pyx_v_ducking_volume;
+  Sint32 __pyx_v_target_gain;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  Uint16 __pyx_t_3;
+  Uint32 __pyx_t_4;
+  Uint32 __pyx_t_5;
+  Uint8 __pyx_t_6;
+  Sint32 __pyx_t_7;
+  int __pyx_t_8;
+
+  /* "mpfmc/core/audio/track.pyx":455
+ * 
+ *         cdef Sint16 *track_buffer
+ *         cdef Uint32 output_buffer_bytes_remaining = buffer_length             # <<<<<<<<<<<<<<
+ *         cdef Uint32 current_chunk_bytes
+ *         cdef Uint32 current_chunk_samples
  */
-    __pyx_v_notification_message->message = __pyx_e_5mpfmc_4core_5audio_20notification_message_notification_sound_looping;
+  __pyx_v_output_buffer_bytes_remaining = __pyx_v_buffer_length;
 
-    /* "mpfmc/core/audio/notification_message.pxd":108
- *     if notification_message != NULL:
- *         notification_message.message = notification_sound_looping
- *         notification_message.player = player             # <<<<<<<<<<<<<<
- *         notification_message.sound_id = sound_id
- *         notification_message.sound_instance_id = sound_instance_id
+  /* "mpfmc/core/audio/track.pyx":458
+ *         cdef Uint32 current_chunk_bytes
+ *         cdef Uint32 current_chunk_samples
+ *         cdef Uint32 buffer_pos = 0             # <<<<<<<<<<<<<<
+ *         cdef Uint8 control_point = 0
+ *         cdef Uint8 ducking_volume
  */
-    __pyx_v_notification_message->player = __pyx_v_player;
+  __pyx_v_buffer_pos = 0;
 
-    /* "mpfmc/core/audio/notification_message.pxd":109
- *         notification_message.message = notification_sound_looping
- *         notification_message.player = player
- *         notification_message.sound_id = sound_id             # <<<<<<<<<<<<<<
- *         notification_message.sound_instance_id = sound_instance_id
- * 
+  /* "mpfmc/core/audio/track.pyx":459
+ *         cdef Uint32 current_chunk_samples
+ *         cdef Uint32 buffer_pos = 0
+ *         cdef Uint8 control_point = 0             # <<<<<<<<<<<<<<
+ *         cdef Uint8 ducking_volume
+ *         cdef Sint32 target_gain
  */
-    __pyx_v_notification_message->sound_id = __pyx_v_sound_id;
+  __pyx_v_control_point = 0;
 
-    /* "mpfmc/core/audio/notification_message.pxd":110
- *         notification_message.player = player
- *         notification_message.sound_id = sound_id
- *         notification_message.sound_instance_id = sound_instance_id             # <<<<<<<<<<<<<<
+  /* "mpfmc/core/audio/track.pyx":463
+ *         cdef Sint32 target_gain
+ * 
+ *         if track == NULL or track.status == track_status_stopped or track.status == track_status_paused:             # <<<<<<<<<<<<<<
+ *             return
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
  */
-    __pyx_v_notification_message->sound_instance_id = __pyx_v_sound_instance_id;
+  __pyx_t_2 = ((__pyx_v_track == NULL) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  switch (__pyx_v_track->status) {
+    case __pyx_e_5mpfmc_4core_5audio_5track_track_status_stopped:
+    case __pyx_e_5mpfmc_4core_5audio_5track_track_status_paused:
+    __pyx_t_2 = 1;
+    break;
+    default:
+    __pyx_t_2 = 0;
+    break;
+  }
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/notification_message.pxd":112
- *         notification_message.sound_instance_id = sound_instance_id
+    /* "mpfmc/core/audio/track.pyx":464
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)             # <<<<<<<<<<<<<<
+ *         if track == NULL or track.status == track_status_stopped or track.status == track_status_paused:
+ *             return             # <<<<<<<<<<<<<<
  * 
- * cdef inline void send_sound_about_to_finish_notification(int player, long sound_id, long sound_instance_id,
+ *         track_buffer = <Sint16*>track.buffer
  */
-    __pyx_v_track->notification_messages = g_slist_prepend(__pyx_v_track->notification_messages, __pyx_v_notification_message);
+    goto __pyx_L0;
 
-    /* "mpfmc/core/audio/notification_message.pxd":106
- *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
- *     if notification_message != NULL:             # <<<<<<<<<<<<<<
- *         notification_message.message = notification_sound_looping
- *         notification_message.player = player
+    /* "mpfmc/core/audio/track.pyx":463
+ *         cdef Sint32 target_gain
+ * 
+ *         if track == NULL or track.status == track_status_stopped or track.status == track_status_paused:             # <<<<<<<<<<<<<<
+ *             return
+ * 
  */
   }
 
-  /* "mpfmc/core/audio/notification_message.pxd":95
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+  /* "mpfmc/core/audio/track.pyx":466
+ *             return
  * 
- * cdef inline void send_sound_looping_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,             # <<<<<<<<<<<<<<
- *                                                  TrackState *track) nogil:
- *     """
+ *         track_buffer = <Sint16*>track.buffer             # <<<<<<<<<<<<<<
+ * 
+ *         # Loop over output buffer at control rate
  */
+  __pyx_v_track_buffer = ((Sint16 *)__pyx_v_track->buffer);
 
-  /* function exit code */
-}
-
-/* "mpfmc/core/audio/notification_message.pxd":114
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+  /* "mpfmc/core/audio/track.pyx":469
  * 
- * cdef inline void send_sound_about_to_finish_notification(int player, long sound_id, long sound_instance_id,             # <<<<<<<<<<<<<<
- *                                                          TrackState *track) nogil:
- *     """
+ *         # Loop over output buffer at control rate
+ *         while output_buffer_bytes_remaining > 0:             # <<<<<<<<<<<<<<
+ * 
+ *             # Determine the number of bytes to process in the current chunk
  */
+  while (1) {
+    __pyx_t_1 = ((__pyx_v_output_buffer_bytes_remaining > 0) != 0);
+    if (!__pyx_t_1) break;
 
-static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_send_sound_about_to_finish_notification(int __pyx_v_player, long __pyx_v_sound_id, long __pyx_v_sound_instance_id, __pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_v_track) {
-  __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_v_notification_message;
-  int __pyx_t_1;
-
-  /* "mpfmc/core/audio/notification_message.pxd":124
- *         track: The TrackState pointer
- *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()             # <<<<<<<<<<<<<<
- *     if notification_message != NULL:
- *         notification_message.message = notification_sound_about_to_finish
+    /* "mpfmc/core/audio/track.pyx":472
+ * 
+ *             # Determine the number of bytes to process in the current chunk
+ *             current_chunk_bytes = min(output_buffer_bytes_remaining, callback_data.bytes_per_control_point)             # <<<<<<<<<<<<<<
+ *             current_chunk_samples = current_chunk_bytes // callback_data.bytes_per_sample
+ * 
  */
-  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message();
+    __pyx_t_3 = __pyx_v_callback_data->bytes_per_control_point;
+    __pyx_t_4 = __pyx_v_output_buffer_bytes_remaining;
+    if (((__pyx_t_3 < __pyx_t_4) != 0)) {
+      __pyx_t_5 = __pyx_t_3;
+    } else {
+      __pyx_t_5 = __pyx_t_4;
+    }
+    __pyx_v_current_chunk_bytes = __pyx_t_5;
 
-  /* "mpfmc/core/audio/notification_message.pxd":125
- *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
- *     if notification_message != NULL:             # <<<<<<<<<<<<<<
- *         notification_message.message = notification_sound_about_to_finish
- *         notification_message.player = player
+    /* "mpfmc/core/audio/track.pyx":473
+ *             # Determine the number of bytes to process in the current chunk
+ *             current_chunk_bytes = min(output_buffer_bytes_remaining, callback_data.bytes_per_control_point)
+ *             current_chunk_samples = current_chunk_bytes // callback_data.bytes_per_sample             # <<<<<<<<<<<<<<
+ * 
+ *             # Apply any ducking to the track
  */
-  __pyx_t_1 = ((__pyx_v_notification_message != NULL) != 0);
-  if (__pyx_t_1) {
+    if (unlikely(__pyx_v_callback_data->bytes_per_sample == 0)) {
+      #ifdef WITH_THREAD
+      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+      #endif
+      PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+      #ifdef WITH_THREAD
+      __Pyx_PyGILState_Release(__pyx_gilstate_save);
+      #endif
+      __PYX_ERR(0, 473, __pyx_L1_error)
+    }
+    __pyx_v_current_chunk_samples = (__pyx_v_current_chunk_bytes / __pyx_v_callback_data->bytes_per_sample);
 
-    /* "mpfmc/core/audio/notification_message.pxd":126
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
- *     if notification_message != NULL:
- *         notification_message.message = notification_sound_about_to_finish             # <<<<<<<<<<<<<<
- *         notification_message.player = player
- *         notification_message.sound_id = sound_id
+    /* "mpfmc/core/audio/track.pyx":476
+ * 
+ *             # Apply any ducking to the track
+ *             if track.ducking_is_active and control_point < CONTROL_POINTS_PER_BUFFER:             # <<<<<<<<<<<<<<
+ *                 ducking_volume = g_array_index_uint8(track.ducking_control_points, control_point)
+ *             else:
  */
-    __pyx_v_notification_message->message = __pyx_e_5mpfmc_4core_5audio_20notification_message_notification_sound_about_to_finish;
+    __pyx_t_2 = (__pyx_v_track->ducking_is_active != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L9_bool_binop_done;
+    }
+    __pyx_t_2 = ((__pyx_v_control_point < __pyx_e_5mpfmc_4core_5audio_5track_CONTROL_POINTS_PER_BUFFER) != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L9_bool_binop_done:;
+    if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/notification_message.pxd":127
- *     if notification_message != NULL:
- *         notification_message.message = notification_sound_about_to_finish
- *         notification_message.player = player             # <<<<<<<<<<<<<<
- *         notification_message.sound_id = sound_id
- *         notification_message.sound_instance_id = sound_instance_id
+      /* "mpfmc/core/audio/track.pyx":477
+ *             # Apply any ducking to the track
+ *             if track.ducking_is_active and control_point < CONTROL_POINTS_PER_BUFFER:
+ *                 ducking_volume = g_array_index_uint8(track.ducking_control_points, control_point)             # <<<<<<<<<<<<<<
+ *             else:
+ *                 ducking_volume = SDL_MIX_MAXVOLUME
  */
-    __pyx_v_notification_message->player = __pyx_v_player;
+      __pyx_v_ducking_volume = g_array_index_uint8(__pyx_v_track->ducking_control_points, __pyx_v_control_point);
 
-    /* "mpfmc/core/audio/notification_message.pxd":128
- *         notification_message.message = notification_sound_about_to_finish
- *         notification_message.player = player
- *         notification_message.sound_id = sound_id             # <<<<<<<<<<<<<<
- *         notification_message.sound_instance_id = sound_instance_id
+      /* "mpfmc/core/audio/track.pyx":476
  * 
+ *             # Apply any ducking to the track
+ *             if track.ducking_is_active and control_point < CONTROL_POINTS_PER_BUFFER:             # <<<<<<<<<<<<<<
+ *                 ducking_volume = g_array_index_uint8(track.ducking_control_points, control_point)
+ *             else:
  */
-    __pyx_v_notification_message->sound_id = __pyx_v_sound_id;
+      goto __pyx_L8;
+    }
 
-    /* "mpfmc/core/audio/notification_message.pxd":129
- *         notification_message.player = player
- *         notification_message.sound_id = sound_id
- *         notification_message.sound_instance_id = sound_instance_id             # <<<<<<<<<<<<<<
+    /* "mpfmc/core/audio/track.pyx":479
+ *                 ducking_volume = g_array_index_uint8(track.ducking_control_points, control_point)
+ *             else:
+ *                 ducking_volume = SDL_MIX_MAXVOLUME             # <<<<<<<<<<<<<<
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+ *             # Calculate track volume (handle track fading)
  */
-    __pyx_v_notification_message->sound_instance_id = __pyx_v_sound_instance_id;
+    /*else*/ {
+      __pyx_v_ducking_volume = SDL_MIX_MAXVOLUME;
+    }
+    __pyx_L8:;
 
-    /* "mpfmc/core/audio/notification_message.pxd":131
- *         notification_message.sound_instance_id = sound_instance_id
+    /* "mpfmc/core/audio/track.pyx":482
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)             # <<<<<<<<<<<<<<
- * 
- * cdef inline void send_sound_marker_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,
- */
-    __pyx_v_track->notification_messages = g_slist_prepend(__pyx_v_track->notification_messages, __pyx_v_notification_message);
-
-    /* "mpfmc/core/audio/notification_message.pxd":125
- *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
- *     if notification_message != NULL:             # <<<<<<<<<<<<<<
- *         notification_message.message = notification_sound_about_to_finish
- *         notification_message.player = player
+ *             # Calculate track volume (handle track fading)
+ *             if track.fade_steps_remaining > 0:             # <<<<<<<<<<<<<<
+ *                 # Note: if the volume interpolation function below appears to be backwards, it is
+ *                 # because the fraction is going from 1 to 0 over the fade and not from a more
  */
-  }
+    __pyx_t_1 = ((__pyx_v_track->fade_steps_remaining > 0) != 0);
+    if (__pyx_t_1) {
 
-  /* "mpfmc/core/audio/notification_message.pxd":114
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
- * 
- * cdef inline void send_sound_about_to_finish_notification(int player, long sound_id, long sound_instance_id,             # <<<<<<<<<<<<<<
- *                                                          TrackState *track) nogil:
- *     """
+      /* "mpfmc/core/audio/track.pyx":486
+ *                 # because the fraction is going from 1 to 0 over the fade and not from a more
+ *                 # traditional 0 to 1.  This saves a few calculation cycles and is for efficiency.
+ *                 track.fade_volume_current = <Uint8> (lerpU8(in_out_quad(track.fade_steps_remaining / track.fade_steps),             # <<<<<<<<<<<<<<
+ *                                                             track.fade_volume_target, track.fade_volume_start))
+ *                 track.fade_steps_remaining -= 1
  */
+      if (unlikely(__pyx_v_track->fade_steps == 0)) {
+        #ifdef WITH_THREAD
+        PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+        #endif
+        PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+        #ifdef WITH_THREAD
+        __Pyx_PyGILState_Release(__pyx_gilstate_save);
+        #endif
+        __PYX_ERR(0, 486, __pyx_L1_error)
+      }
 
-  /* function exit code */
-}
+      /* "mpfmc/core/audio/track.pyx":487
+ *                 # traditional 0 to 1.  This saves a few calculation cycles and is for efficiency.
+ *                 track.fade_volume_current = <Uint8> (lerpU8(in_out_quad(track.fade_steps_remaining / track.fade_steps),
+ *                                                             track.fade_volume_target, track.fade_volume_start))             # <<<<<<<<<<<<<<
+ *                 track.fade_steps_remaining -= 1
+ *             else:
+ */
+      __pyx_v_track->fade_volume_current = ((Uint8)__pyx_f_5mpfmc_4core_5audio_6inline_lerpU8(__pyx_f_5mpfmc_4core_5audio_6inline_in_out_quad((((double)__pyx_v_track->fade_steps_remaining) / ((double)__pyx_v_track->fade_steps))), __pyx_v_track->fade_volume_target, __pyx_v_track->fade_volume_start));
 
-/* "mpfmc/core/audio/notification_message.pxd":133
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
- * 
- * cdef inline void send_sound_marker_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,             # <<<<<<<<<<<<<<
- *                                                 TrackState *track,
- *                                                 int marker_id) nogil:
+      /* "mpfmc/core/audio/track.pyx":488
+ *                 track.fade_volume_current = <Uint8> (lerpU8(in_out_quad(track.fade_steps_remaining / track.fade_steps),
+ *                                                             track.fade_volume_target, track.fade_volume_start))
+ *                 track.fade_steps_remaining -= 1             # <<<<<<<<<<<<<<
+ *             else:
+ *                 track.fade_volume_current = track.fade_volume_target
  */
+      __pyx_v_track->fade_steps_remaining = (__pyx_v_track->fade_steps_remaining - 1);
 
-static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_send_sound_marker_notification(int __pyx_v_player, Uint64 __pyx_v_sound_id, Uint64 __pyx_v_sound_instance_id, __pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_v_track, int __pyx_v_marker_id) {
-  __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_v_notification_message;
-  int __pyx_t_1;
+      /* "mpfmc/core/audio/track.pyx":482
+ * 
+ *             # Calculate track volume (handle track fading)
+ *             if track.fade_steps_remaining > 0:             # <<<<<<<<<<<<<<
+ *                 # Note: if the volume interpolation function below appears to be backwards, it is
+ *                 # because the fraction is going from 1 to 0 over the fade and not from a more
+ */
+      goto __pyx_L11;
+    }
 
-  /* "mpfmc/core/audio/notification_message.pxd":145
- *         marker_id: The id of the marker being sent for the specified sound
- *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()             # <<<<<<<<<<<<<<
- *     if notification_message != NULL:
- *         notification_message.message = notification_sound_marker
+    /* "mpfmc/core/audio/track.pyx":490
+ *                 track.fade_steps_remaining -= 1
+ *             else:
+ *                 track.fade_volume_current = track.fade_volume_target             # <<<<<<<<<<<<<<
+ *                 if track.status == track_status_stopping:
+ *                     track.status = track_status_stopped
  */
-  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message();
+    /*else*/ {
+      __pyx_t_6 = __pyx_v_track->fade_volume_target;
+      __pyx_v_track->fade_volume_current = __pyx_t_6;
 
-  /* "mpfmc/core/audio/notification_message.pxd":146
- *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
- *     if notification_message != NULL:             # <<<<<<<<<<<<<<
- *         notification_message.message = notification_sound_marker
- *         notification_message.player = player
+      /* "mpfmc/core/audio/track.pyx":491
+ *             else:
+ *                 track.fade_volume_current = track.fade_volume_target
+ *                 if track.status == track_status_stopping:             # <<<<<<<<<<<<<<
+ *                     track.status = track_status_stopped
+ *                     send_track_stopped_notification(track)
  */
-  __pyx_t_1 = ((__pyx_v_notification_message != NULL) != 0);
-  if (__pyx_t_1) {
+      switch (__pyx_v_track->status) {
+        case __pyx_e_5mpfmc_4core_5audio_5track_track_status_stopping:
 
-    /* "mpfmc/core/audio/notification_message.pxd":147
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
- *     if notification_message != NULL:
- *         notification_message.message = notification_sound_marker             # <<<<<<<<<<<<<<
- *         notification_message.player = player
- *         notification_message.sound_id = sound_id
+        /* "mpfmc/core/audio/track.pyx":492
+ *                 track.fade_volume_current = track.fade_volume_target
+ *                 if track.status == track_status_stopping:
+ *                     track.status = track_status_stopped             # <<<<<<<<<<<<<<
+ *                     send_track_stopped_notification(track)
+ *                 elif track.status == track_status_pausing:
  */
-    __pyx_v_notification_message->message = __pyx_e_5mpfmc_4core_5audio_20notification_message_notification_sound_marker;
+        __pyx_v_track->status = __pyx_e_5mpfmc_4core_5audio_5track_track_status_stopped;
 
-    /* "mpfmc/core/audio/notification_message.pxd":148
- *     if notification_message != NULL:
- *         notification_message.message = notification_sound_marker
- *         notification_message.player = player             # <<<<<<<<<<<<<<
- *         notification_message.sound_id = sound_id
- *         notification_message.sound_instance_id = sound_instance_id
+        /* "mpfmc/core/audio/track.pyx":493
+ *                 if track.status == track_status_stopping:
+ *                     track.status = track_status_stopped
+ *                     send_track_stopped_notification(track)             # <<<<<<<<<<<<<<
+ *                 elif track.status == track_status_pausing:
+ *                     track.status = track_status_paused
  */
-    __pyx_v_notification_message->player = __pyx_v_player;
+        __pyx_f_5mpfmc_4core_5audio_20notification_message_send_track_stopped_notification(__pyx_v_track);
 
-    /* "mpfmc/core/audio/notification_message.pxd":149
- *         notification_message.message = notification_sound_marker
- *         notification_message.player = player
- *         notification_message.sound_id = sound_id             # <<<<<<<<<<<<<<
- *         notification_message.sound_instance_id = sound_instance_id
- *         notification_message.data.marker.id = marker_id
+        /* "mpfmc/core/audio/track.pyx":491
+ *             else:
+ *                 track.fade_volume_current = track.fade_volume_target
+ *                 if track.status == track_status_stopping:             # <<<<<<<<<<<<<<
+ *                     track.status = track_status_stopped
+ *                     send_track_stopped_notification(track)
  */
-    __pyx_v_notification_message->sound_id = __pyx_v_sound_id;
+        break;
 
-    /* "mpfmc/core/audio/notification_message.pxd":150
- *         notification_message.player = player
- *         notification_message.sound_id = sound_id
- *         notification_message.sound_instance_id = sound_instance_id             # <<<<<<<<<<<<<<
- *         notification_message.data.marker.id = marker_id
- * 
+        /* "mpfmc/core/audio/track.pyx":494
+ *                     track.status = track_status_stopped
+ *                     send_track_stopped_notification(track)
+ *                 elif track.status == track_status_pausing:             # <<<<<<<<<<<<<<
+ *                     track.status = track_status_paused
+ *                     send_track_paused_notification(track)
  */
-    __pyx_v_notification_message->sound_instance_id = __pyx_v_sound_instance_id;
+        case __pyx_e_5mpfmc_4core_5audio_5track_track_status_pausing:
 
-    /* "mpfmc/core/audio/notification_message.pxd":151
- *         notification_message.sound_id = sound_id
- *         notification_message.sound_instance_id = sound_instance_id
- *         notification_message.data.marker.id = marker_id             # <<<<<<<<<<<<<<
+        /* "mpfmc/core/audio/track.pyx":495
+ *                     send_track_stopped_notification(track)
+ *                 elif track.status == track_status_pausing:
+ *                     track.status = track_status_paused             # <<<<<<<<<<<<<<
+ *                     send_track_paused_notification(track)
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
  */
-    __pyx_v_notification_message->data.marker.id = __pyx_v_marker_id;
+        __pyx_v_track->status = __pyx_e_5mpfmc_4core_5audio_5track_track_status_paused;
 
-    /* "mpfmc/core/audio/notification_message.pxd":153
- *         notification_message.data.marker.id = marker_id
- * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)             # <<<<<<<<<<<<<<
+        /* "mpfmc/core/audio/track.pyx":496
+ *                 elif track.status == track_status_pausing:
+ *                     track.status = track_status_paused
+ *                     send_track_paused_notification(track)             # <<<<<<<<<<<<<<
  * 
- * cdef inline void send_track_stopped_notification(TrackState *track) nogil:
+ *             if callback_data.float_mix_bus:
  */
-    __pyx_v_track->notification_messages = g_slist_prepend(__pyx_v_track->notification_messages, __pyx_v_notification_message);
+        __pyx_f_5mpfmc_4core_5audio_20notification_message_send_track_paused_notification(__pyx_v_track);
 
-    /* "mpfmc/core/audio/notification_message.pxd":146
- *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
- *     if notification_message != NULL:             # <<<<<<<<<<<<<<
- *         notification_message.message = notification_sound_marker
- *         notification_message.player = player
+        /* "mpfmc/core/audio/track.pyx":494
+ *                     track.status = track_status_stopped
+ *                     send_track_stopped_notification(track)
+ *                 elif track.status == track_status_pausing:             # <<<<<<<<<<<<<<
+ *                     track.status = track_status_paused
+ *                     send_track_paused_notification(track)
  */
-  }
+        break;
+        default: break;
+      }
+    }
+    __pyx_L11:;
 
-  /* "mpfmc/core/audio/notification_message.pxd":133
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+    /* "mpfmc/core/audio/track.pyx":498
+ *                     send_track_paused_notification(track)
  * 
- * cdef inline void send_sound_marker_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,             # <<<<<<<<<<<<<<
- *                                                 TrackState *track,
- *                                                 int marker_id) nogil:
+ *             if callback_data.float_mix_bus:             # <<<<<<<<<<<<<<
+ *                 # Combined ducking and track volume as a Q16 gain (the two 7-bit volumes multiplied
+ *                 # together are a 14-bit value).  Master volume is applied to the master bus.
  */
+    __pyx_t_1 = (__pyx_v_callback_data->float_mix_bus != 0);
+    if (__pyx_t_1) {
 
-  /* function exit code */
-}
-
-/* "mpfmc/core/audio/notification_message.pxd":155
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+      /* "mpfmc/core/audio/track.pyx":501
+ *                 # Combined ducking and track volume as a Q16 gain (the two 7-bit volumes multiplied
+ *                 # together are a 14-bit value).  Master volume is applied to the master bus.
+ *                 target_gain = (<Sint32>ducking_volume * track.fade_volume_current) << 2             # <<<<<<<<<<<<<<
  * 
- * cdef inline void send_track_stopped_notification(TrackState *track) nogil:             # <<<<<<<<<<<<<<
- *     """
- *     Sends a track stopped notification
+ *                 # Convert to floating-point samples, ramping from the gain used at the end of the
  */
+      __pyx_v_target_gain = ((((Sint32)__pyx_v_ducking_volume) * __pyx_v_track->fade_volume_current) << 2);
 
-static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_send_track_stopped_notification(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_v_track) {
-  __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_v_notification_message;
-  int __pyx_t_1;
-
-  /* "mpfmc/core/audio/notification_message.pxd":161
- *         track: The TrackState pointer
- *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()             # <<<<<<<<<<<<<<
- *     if notification_message != NULL:
- *         notification_message.message = notification_track_stopped
+      /* "mpfmc/core/audio/track.pyx":505
+ *                 # Convert to floating-point samples, ramping from the gain used at the end of the
+ *                 # previous chunk to avoid zipper noise
+ *                 s16_to_float(track.float_buffer + buffer_pos // callback_data.bytes_per_sample,             # <<<<<<<<<<<<<<
+ *                              track_buffer + buffer_pos // callback_data.bytes_per_sample,
+ *                              current_chunk_samples,
  */
-  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message();
+      if (unlikely(__pyx_v_callback_data->bytes_per_sample == 0)) {
+        #ifdef WITH_THREAD
+        PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+        #endif
+        PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+        #ifdef WITH_THREAD
+        __Pyx_PyGILState_Release(__pyx_gilstate_save);
+        #endif
+        __PYX_ERR(0, 505, __pyx_L1_error)
+      }
 
-  /* "mpfmc/core/audio/notification_message.pxd":162
- *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
- *     if notification_message != NULL:             # <<<<<<<<<<<<<<
- *         notification_message.message = notification_track_stopped
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+      /* "mpfmc/core/audio/track.pyx":506
+ *                 # previous chunk to avoid zipper noise
+ *                 s16_to_float(track.float_buffer + buffer_pos // callback_data.bytes_per_sample,
+ *                              track_buffer + buffer_pos // callback_data.bytes_per_sample,             # <<<<<<<<<<<<<<
+ *                              current_chunk_samples,
+ *                              track.mix_gain / <float>MIXER_UNITY_GAIN,
  */
-  __pyx_t_1 = ((__pyx_v_notification_message != NULL) != 0);
-  if (__pyx_t_1) {
+      if (unlikely(__pyx_v_callback_data->bytes_per_sample == 0)) {
+        #ifdef WITH_THREAD
+        PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+        #endif
+        PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+        #ifdef WITH_THREAD
+        __Pyx_PyGILState_Release(__pyx_gilstate_save);
+        #endif
+        __PYX_ERR(0, 506, __pyx_L1_error)
+      }
 
-    /* "mpfmc/core/audio/notification_message.pxd":163
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
- *     if notification_message != NULL:
- *         notification_message.message = notification_track_stopped             # <<<<<<<<<<<<<<
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
- * 
+      /* "mpfmc/core/audio/track.pyx":508
+ *                              track_buffer + buffer_pos // callback_data.bytes_per_sample,
+ *                              current_chunk_samples,
+ *                              track.mix_gain / <float>MIXER_UNITY_GAIN,             # <<<<<<<<<<<<<<
+ *                              gain_step(track.mix_gain, target_gain, current_chunk_samples) / <float>MIXER_UNITY_GAIN)
+ *             else:
  */
-    __pyx_v_notification_message->message = __pyx_e_5mpfmc_4core_5audio_20notification_message_notification_track_stopped;
+      if (unlikely(((float)__pyx_e_5mpfmc_4core_5audio_5mixer_MIXER_UNITY_GAIN) == 0)) {
+        #ifdef WITH_THREAD
+        PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+        #endif
+        PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+        #ifdef WITH_THREAD
+        __Pyx_PyGILState_Release(__pyx_gilstate_save);
+        #endif
+        __PYX_ERR(0, 508, __pyx_L1_error)
+      }
 
-    /* "mpfmc/core/audio/notification_message.pxd":164
- *     if notification_message != NULL:
- *         notification_message.message = notification_track_stopped
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)             # <<<<<<<<<<<<<<
- * 
- * cdef inline void send_track_paused_notification(TrackState *track) nogil:
+      /* "mpfmc/core/audio/track.pyx":509
+ *                              current_chunk_samples,
+ *                              track.mix_gain / <float>MIXER_UNITY_GAIN,
+ *                              gain_step(track.mix_gain, target_gain, current_chunk_samples) / <float>MIXER_UNITY_GAIN)             # <<<<<<<<<<<<<<
+ *             else:
+ *                 # Combined ducking, track and master volume as a Q16 gain (the three 7-bit volumes
  */
-    __pyx_v_track->notification_messages = g_slist_prepend(__pyx_v_track->notification_messages, __pyx_v_notification_message);
+      __pyx_t_7 = __pyx_f_5mpfmc_4core_5audio_5mixer_gain_step(__pyx_v_track->mix_gain, __pyx_v_target_gain, __pyx_v_current_chunk_samples);
+      if (unlikely(((float)__pyx_e_5mpfmc_4core_5audio_5mixer_MIXER_UNITY_GAIN) == 0)) {
+        #ifdef WITH_THREAD
+        PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+        #endif
+        PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+        #ifdef WITH_THREAD
+        __Pyx_PyGILState_Release(__pyx_gilstate_save);
+        #endif
+        __PYX_ERR(0, 509, __pyx_L1_error)
+      }
 
-    /* "mpfmc/core/audio/notification_message.pxd":162
- *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
- *     if notification_message != NULL:             # <<<<<<<<<<<<<<
- *         notification_message.message = notification_track_stopped
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+      /* "mpfmc/core/audio/track.pyx":505
+ *                 # Convert to floating-point samples, ramping from the gain used at the end of the
+ *                 # previous chunk to avoid zipper noise
+ *                 s16_to_float(track.float_buffer + buffer_pos // callback_data.bytes_per_sample,             # <<<<<<<<<<<<<<
+ *                              track_buffer + buffer_pos // callback_data.bytes_per_sample,
+ *                              current_chunk_samples,
  */
-  }
+      __pyx_f_5mpfmc_4core_5audio_5mixer_s16_to_float((__pyx_v_track->float_buffer + (__pyx_v_buffer_pos / __pyx_v_callback_data->bytes_per_sample)), (__pyx_v_track_buffer + (__pyx_v_buffer_pos / __pyx_v_callback_data->bytes_per_sample)), __pyx_v_current_chunk_samples, (((float)__pyx_v_track->mix_gain) / ((float)__pyx_e_5mpfmc_4core_5audio_5mixer_MIXER_UNITY_GAIN)), (((float)__pyx_t_7) / ((float)__pyx_e_5mpfmc_4core_5audio_5mixer_MIXER_UNITY_GAIN)));
 
-  /* "mpfmc/core/audio/notification_message.pxd":155
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+      /* "mpfmc/core/audio/track.pyx":498
+ *                     send_track_paused_notification(track)
  * 
- * cdef inline void send_track_stopped_notification(TrackState *track) nogil:             # <<<<<<<<<<<<<<
- *     """
- *     Sends a track stopped notification
+ *             if callback_data.float_mix_bus:             # <<<<<<<<<<<<<<
+ *                 # Combined ducking and track volume as a Q16 gain (the two 7-bit volumes multiplied
+ *                 # together are a 14-bit value).  Master volume is applied to the master bus.
  */
+      goto __pyx_L12;
+    }
 
-  /* function exit code */
-}
+    /* "mpfmc/core/audio/track.pyx":513
+ *                 # Combined ducking, track and master volume as a Q16 gain (the three 7-bit volumes
+ *                 # multiplied together are a 21-bit value).
+ *                 target_gain = (<Sint32>ducking_volume * track.fade_volume_current * callback_data.master_volume) >> 5             # <<<<<<<<<<<<<<
+ * 
+ *                 # Ramp from the gain used at the end of the previous chunk to avoid zipper noise
+ */
+    /*else*/ {
+      __pyx_v_target_gain = (((((Sint32)__pyx_v_ducking_volume) * __pyx_v_track->fade_volume_current) * __pyx_v_callback_data->master_volume) >> 5);
 
-/* "mpfmc/core/audio/notification_message.pxd":166
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+      /* "mpfmc/core/audio/track.pyx":516
  * 
- * cdef inline void send_track_paused_notification(TrackState *track) nogil:             # <<<<<<<<<<<<<<
- *     """
- *     Sends a track paused notification
- */
-
-static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_send_track_paused_notification(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_v_track) {
-  __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_v_notification_message;
-  int __pyx_t_1;
-
-  /* "mpfmc/core/audio/notification_message.pxd":172
- *         track: The TrackState pointer
- *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()             # <<<<<<<<<<<<<<
- *     if notification_message != NULL:
- *         notification_message.message = notification_track_paused
+ *                 # Ramp from the gain used at the end of the previous chunk to avoid zipper noise
+ *                 mix_s16_to_accumulator(callback_data.mix_buffer + buffer_pos // callback_data.bytes_per_sample,             # <<<<<<<<<<<<<<
+ *                                        track_buffer + buffer_pos // callback_data.bytes_per_sample,
+ *                                        current_chunk_samples,
  */
-  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message();
+      if (unlikely(__pyx_v_callback_data->bytes_per_sample == 0)) {
+        #ifdef WITH_THREAD
+        PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+        #endif
+        PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+        #ifdef WITH_THREAD
+        __Pyx_PyGILState_Release(__pyx_gilstate_save);
+        #endif
+        __PYX_ERR(0, 516, __pyx_L1_error)
+      }
 
-  /* "mpfmc/core/audio/notification_message.pxd":173
- *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
- *     if notification_message != NULL:             # <<<<<<<<<<<<<<
- *         notification_message.message = notification_track_paused
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+      /* "mpfmc/core/audio/track.pyx":517
+ *                 # Ramp from the gain used at the end of the previous chunk to avoid zipper noise
+ *                 mix_s16_to_accumulator(callback_data.mix_buffer + buffer_pos // callback_data.bytes_per_sample,
+ *                                        track_buffer + buffer_pos // callback_data.bytes_per_sample,             # <<<<<<<<<<<<<<
+ *                                        current_chunk_samples,
+ *                                        track.mix_gain,
  */
-  __pyx_t_1 = ((__pyx_v_notification_message != NULL) != 0);
-  if (__pyx_t_1) {
+      if (unlikely(__pyx_v_callback_data->bytes_per_sample == 0)) {
+        #ifdef WITH_THREAD
+        PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+        #endif
+        PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+        #ifdef WITH_THREAD
+        __Pyx_PyGILState_Release(__pyx_gilstate_save);
+        #endif
+        __PYX_ERR(0, 517, __pyx_L1_error)
+      }
 
-    /* "mpfmc/core/audio/notification_message.pxd":174
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
- *     if notification_message != NULL:
- *         notification_message.message = notification_track_paused             # <<<<<<<<<<<<<<
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+      /* "mpfmc/core/audio/track.pyx":516
  * 
+ *                 # Ramp from the gain used at the end of the previous chunk to avoid zipper noise
+ *                 mix_s16_to_accumulator(callback_data.mix_buffer + buffer_pos // callback_data.bytes_per_sample,             # <<<<<<<<<<<<<<
+ *                                        track_buffer + buffer_pos // callback_data.bytes_per_sample,
+ *                                        current_chunk_samples,
  */
-    __pyx_v_notification_message->message = __pyx_e_5mpfmc_4core_5audio_20notification_message_notification_track_paused;
+      __pyx_f_5mpfmc_4core_5audio_5mixer_mix_s16_to_accumulator((__pyx_v_callback_data->mix_buffer + (__pyx_v_buffer_pos / __pyx_v_callback_data->bytes_per_sample)), (__pyx_v_track_buffer + (__pyx_v_buffer_pos / __pyx_v_callback_data->bytes_per_sample)), __pyx_v_current_chunk_samples, __pyx_v_track->mix_gain, __pyx_f_5mpfmc_4core_5audio_5mixer_gain_step(__pyx_v_track->mix_gain, __pyx_v_target_gain, __pyx_v_current_chunk_samples));
+    }
+    __pyx_L12:;
 
-    /* "mpfmc/core/audio/notification_message.pxd":175
- *     if notification_message != NULL:
- *         notification_message.message = notification_track_paused
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)             # <<<<<<<<<<<<<<
+    /* "mpfmc/core/audio/track.pyx":521
+ *                                        track.mix_gain,
+ *                                        gain_step(track.mix_gain, target_gain, current_chunk_samples))
+ *             track.mix_gain = target_gain             # <<<<<<<<<<<<<<
  * 
- * cdef inline void send_sound_loop_set_started_notification(int sound_loop_set_id, Uint64 sound_id, TrackState *track) nogil:
+ *             output_buffer_bytes_remaining -= current_chunk_bytes
  */
-    __pyx_v_track->notification_messages = g_slist_prepend(__pyx_v_track->notification_messages, __pyx_v_notification_message);
+    __pyx_v_track->mix_gain = __pyx_v_target_gain;
 
-    /* "mpfmc/core/audio/notification_message.pxd":173
- *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
- *     if notification_message != NULL:             # <<<<<<<<<<<<<<
- *         notification_message.message = notification_track_paused
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+    /* "mpfmc/core/audio/track.pyx":523
+ *             track.mix_gain = target_gain
+ * 
+ *             output_buffer_bytes_remaining -= current_chunk_bytes             # <<<<<<<<<<<<<<
+ *             buffer_pos += current_chunk_bytes
+ *             control_point += 1
  */
-  }
+    __pyx_v_output_buffer_bytes_remaining = (__pyx_v_output_buffer_bytes_remaining - __pyx_v_current_chunk_bytes);
 
-  /* "mpfmc/core/audio/notification_message.pxd":166
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+    /* "mpfmc/core/audio/track.pyx":524
+ * 
+ *             output_buffer_bytes_remaining -= current_chunk_bytes
+ *             buffer_pos += current_chunk_bytes             # <<<<<<<<<<<<<<
+ *             control_point += 1
  * 
- * cdef inline void send_track_paused_notification(TrackState *track) nogil:             # <<<<<<<<<<<<<<
- *     """
- *     Sends a track paused notification
  */
+    __pyx_v_buffer_pos = (__pyx_v_buffer_pos + __pyx_v_current_chunk_bytes);
 
-  /* function exit code */
-}
-
-/* "mpfmc/core/audio/notification_message.pxd":177
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+    /* "mpfmc/core/audio/track.pyx":525
+ *             output_buffer_bytes_remaining -= current_chunk_bytes
+ *             buffer_pos += current_chunk_bytes
+ *             control_point += 1             # <<<<<<<<<<<<<<
  * 
- * cdef inline void send_sound_loop_set_started_notification(int sound_loop_set_id, Uint64 sound_id, TrackState *track) nogil:             # <<<<<<<<<<<<<<
- *     """
- *     Sends a sound_loop_set started notification
+ *         # Run the track insert chain and mix the track into the floating-point master bus
  */
+    __pyx_v_control_point = (__pyx_v_control_point + 1);
+  }
 
-static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_send_sound_loop_set_started_notification(int __pyx_v_sound_loop_set_id, Uint64 __pyx_v_sound_id, __pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_v_track) {
-  __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_v_notification_message;
-  int __pyx_t_1;
-
-  /* "mpfmc/core/audio/notification_message.pxd":185
- *         track: The TrackState pointer
- *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()             # <<<<<<<<<<<<<<
- *     if notification_message != NULL:
- *         notification_message.message = notification_sound_loop_set_started
+  /* "mpfmc/core/audio/track.pyx":528
+ * 
+ *         # Run the track insert chain and mix the track into the floating-point master bus
+ *         if callback_data.float_mix_bus:             # <<<<<<<<<<<<<<
+ *             process_dsp_chain(track.inserts, track.float_buffer,
+ *                               buffer_length // (callback_data.bytes_per_sample * callback_data.channels),
  */
-  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message();
+  __pyx_t_1 = (__pyx_v_callback_data->float_mix_bus != 0);
+  if (__pyx_t_1) {
 
-  /* "mpfmc/core/audio/notification_message.pxd":186
- *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
- *     if notification_message != NULL:             # <<<<<<<<<<<<<<
- *         notification_message.message = notification_sound_loop_set_started
- *         notification_message.player = 0
+    /* "mpfmc/core/audio/track.pyx":530
+ *         if callback_data.float_mix_bus:
+ *             process_dsp_chain(track.inserts, track.float_buffer,
+ *                               buffer_length // (callback_data.bytes_per_sample * callback_data.channels),             # <<<<<<<<<<<<<<
+ *                               callback_data.channels)
+ *             mix_float_to_float(callback_data.float_mix_buffer, track.float_buffer,
  */
-  __pyx_t_1 = ((__pyx_v_notification_message != NULL) != 0);
-  if (__pyx_t_1) {
+    __pyx_t_8 = (__pyx_v_callback_data->bytes_per_sample * __pyx_v_callback_data->channels);
+    if (unlikely(__pyx_t_8 == 0)) {
+      #ifdef WITH_THREAD
+      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+      #endif
+      PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+      #ifdef WITH_THREAD
+      __Pyx_PyGILState_Release(__pyx_gilstate_save);
+      #endif
+      __PYX_ERR(0, 530, __pyx_L1_error)
+    }
 
-    /* "mpfmc/core/audio/notification_message.pxd":187
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
- *     if notification_message != NULL:
- *         notification_message.message = notification_sound_loop_set_started             # <<<<<<<<<<<<<<
- *         notification_message.player = 0
- *         notification_message.sound_id = sound_id
+    /* "mpfmc/core/audio/track.pyx":529
+ *         # Run the track insert chain and mix the track into the floating-point master bus
+ *         if callback_data.float_mix_bus:
+ *             process_dsp_chain(track.inserts, track.float_buffer,             # <<<<<<<<<<<<<<
+ *                               buffer_length // (callback_data.bytes_per_sample * callback_data.channels),
+ *                               callback_data.channels)
  */
-    __pyx_v_notification_message->message = __pyx_e_5mpfmc_4core_5audio_20notification_message_notification_sound_loop_set_started;
+    __pyx_f_5mpfmc_4core_5audio_3dsp_process_dsp_chain(__pyx_v_track->inserts, __pyx_v_track->float_buffer, (__pyx_v_buffer_length / __pyx_t_8), __pyx_v_callback_data->channels);
 
-    /* "mpfmc/core/audio/notification_message.pxd":188
- *     if notification_message != NULL:
- *         notification_message.message = notification_sound_loop_set_started
- *         notification_message.player = 0             # <<<<<<<<<<<<<<
- *         notification_message.sound_id = sound_id
- *         notification_message.sound_instance_id = 0
+    /* "mpfmc/core/audio/track.pyx":533
+ *                               callback_data.channels)
+ *             mix_float_to_float(callback_data.float_mix_buffer, track.float_buffer,
+ *                                buffer_length // callback_data.bytes_per_sample)             # <<<<<<<<<<<<<<
+ * 
+ *             # The insert chain keeps ringing (reverb) once the track stops producing audio
  */
-    __pyx_v_notification_message->player = 0;
+    if (unlikely(__pyx_v_callback_data->bytes_per_sample == 0)) {
+      #ifdef WITH_THREAD
+      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+      #endif
+      PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+      #ifdef WITH_THREAD
+      __Pyx_PyGILState_Release(__pyx_gilstate_save);
+      #endif
+      __PYX_ERR(0, 533, __pyx_L1_error)
+    }
 
-    /* "mpfmc/core/audio/notification_message.pxd":189
- *         notification_message.message = notification_sound_loop_set_started
- *         notification_message.player = 0
- *         notification_message.sound_id = sound_id             # <<<<<<<<<<<<<<
- *         notification_message.sound_instance_id = 0
- *         notification_message.data.sound_loop_set.id = sound_loop_set_id
+    /* "mpfmc/core/audio/track.pyx":532
+ *                               buffer_length // (callback_data.bytes_per_sample * callback_data.channels),
+ *                               callback_data.channels)
+ *             mix_float_to_float(callback_data.float_mix_buffer, track.float_buffer,             # <<<<<<<<<<<<<<
+ *                                buffer_length // callback_data.bytes_per_sample)
+ * 
  */
-    __pyx_v_notification_message->sound_id = __pyx_v_sound_id;
+    __pyx_f_5mpfmc_4core_5audio_5mixer_mix_float_to_float(__pyx_v_callback_data->float_mix_buffer, __pyx_v_track->float_buffer, (__pyx_v_buffer_length / __pyx_v_callback_data->bytes_per_sample));
 
-    /* "mpfmc/core/audio/notification_message.pxd":190
- *         notification_message.player = 0
- *         notification_message.sound_id = sound_id
- *         notification_message.sound_instance_id = 0             # <<<<<<<<<<<<<<
- *         notification_message.data.sound_loop_set.id = sound_loop_set_id
+    /* "mpfmc/core/audio/track.pyx":536
+ * 
+ *             # The insert chain keeps ringing (reverb) once the track stops producing audio
+ *             if track.inserts != NULL:             # <<<<<<<<<<<<<<
+ *                 track.inserts.tail_frames_remaining = track.inserts.tail_frames
  * 
  */
-    __pyx_v_notification_message->sound_instance_id = 0;
+    __pyx_t_1 = ((__pyx_v_track->inserts != NULL) != 0);
+    if (__pyx_t_1) {
 
-    /* "mpfmc/core/audio/notification_message.pxd":191
- *         notification_message.sound_id = sound_id
- *         notification_message.sound_instance_id = 0
- *         notification_message.data.sound_loop_set.id = sound_loop_set_id             # <<<<<<<<<<<<<<
+      /* "mpfmc/core/audio/track.pyx":537
+ *             # The insert chain keeps ringing (reverb) once the track stops producing audio
+ *             if track.inserts != NULL:
+ *                 track.inserts.tail_frames_remaining = track.inserts.tail_frames             # <<<<<<<<<<<<<<
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+ *     @staticmethod
  */
-    __pyx_v_notification_message->data.sound_loop_set.id = __pyx_v_sound_loop_set_id;
+      __pyx_t_5 = __pyx_v_track->inserts->tail_frames;
+      __pyx_v_track->inserts->tail_frames_remaining = __pyx_t_5;
 
-    /* "mpfmc/core/audio/notification_message.pxd":193
- *         notification_message.data.sound_loop_set.id = sound_loop_set_id
+      /* "mpfmc/core/audio/track.pyx":536
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)             # <<<<<<<<<<<<<<
+ *             # The insert chain keeps ringing (reverb) once the track stops producing audio
+ *             if track.inserts != NULL:             # <<<<<<<<<<<<<<
+ *                 track.inserts.tail_frames_remaining = track.inserts.tail_frames
  * 
- * cdef inline void send_sound_loop_set_stopped_notification(int sound_loop_set_id, Uint64 sound_id, TrackState *track) nogil:
  */
-    __pyx_v_track->notification_messages = g_slist_prepend(__pyx_v_track->notification_messages, __pyx_v_notification_message);
+    }
 
-    /* "mpfmc/core/audio/notification_message.pxd":186
- *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
- *     if notification_message != NULL:             # <<<<<<<<<<<<<<
- *         notification_message.message = notification_sound_loop_set_started
- *         notification_message.player = 0
+    /* "mpfmc/core/audio/track.pyx":528
+ * 
+ *         # Run the track insert chain and mix the track into the floating-point master bus
+ *         if callback_data.float_mix_bus:             # <<<<<<<<<<<<<<
+ *             process_dsp_chain(track.inserts, track.float_buffer,
+ *                               buffer_length // (callback_data.bytes_per_sample * callback_data.channels),
  */
   }
 
-  /* "mpfmc/core/audio/notification_message.pxd":177
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+  /* "mpfmc/core/audio/track.pyx":438
  * 
- * cdef inline void send_sound_loop_set_started_notification(int sound_loop_set_id, Uint64 sound_id, TrackState *track) nogil:             # <<<<<<<<<<<<<<
- *     """
- *     Sends a sound_loop_set started notification
+ *     @staticmethod
+ *     cdef void mix_track_to_output(TrackState *track, AudioCallbackData* callback_data,             # <<<<<<<<<<<<<<
+ *                                   Uint8 *output_buffer, Uint32 buffer_length) nogil:
+ *         """
  */
 
   /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_WriteUnraisable("mpfmc.core.audio.track.Track.mix_track_to_output", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 1);
+  __pyx_L0:;
 }
 
-/* "mpfmc/core/audio/notification_message.pxd":195
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+/* "mpfmc/core/audio/track.pyx":540
  * 
- * cdef inline void send_sound_loop_set_stopped_notification(int sound_loop_set_id, Uint64 sound_id, TrackState *track) nogil:             # <<<<<<<<<<<<<<
- *     """
- *     Sends a sound_loop_set stopped notification
+ *     @staticmethod
+ *     cdef void mix_track_tail_to_output(TrackState *track, AudioCallbackData* callback_data,             # <<<<<<<<<<<<<<
+ *                                        Uint32 buffer_length) nogil:
+ *         """
  */
 
-static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_send_sound_loop_set_stopped_notification(int __pyx_v_sound_loop_set_id, Uint64 __pyx_v_sound_id, __pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_v_track) {
-  __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_v_notification_message;
+static void __pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_tail_to_output(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_v_track, __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData *__pyx_v_callback_data, Uint32 __pyx_v_buffer_length) {
+  Uint32 __pyx_v_frames;
   int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
 
-  /* "mpfmc/core/audio/notification_message.pxd":203
- *         track: The TrackState pointer
- *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()             # <<<<<<<<<<<<<<
- *     if notification_message != NULL:
- *         notification_message.message = notification_sound_loop_set_stopped
+  /* "mpfmc/core/audio/track.pyx":551
+ *             buffer_length: The audio buffer size to process.
+ *         """
+ *         cdef Uint32 frames = buffer_length // (callback_data.bytes_per_sample * callback_data.channels)             # <<<<<<<<<<<<<<
+ * 
+ *         if track == NULL or track.inserts == NULL or track.inserts.tail_frames_remaining == 0:
  */
-  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message();
+  __pyx_t_1 = (__pyx_v_callback_data->bytes_per_sample * __pyx_v_callback_data->channels);
+  if (unlikely(__pyx_t_1 == 0)) {
+    #ifdef WITH_THREAD
+    PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+    #endif
+    PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+    #ifdef WITH_THREAD
+    __Pyx_PyGILState_Release(__pyx_gilstate_save);
+    #endif
+    __PYX_ERR(0, 551, __pyx_L1_error)
+  }
+  __pyx_v_frames = (__pyx_v_buffer_length / __pyx_t_1);
 
-  /* "mpfmc/core/audio/notification_message.pxd":204
- *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
- *     if notification_message != NULL:             # <<<<<<<<<<<<<<
- *         notification_message.message = notification_sound_loop_set_stopped
- *         notification_message.player = 0
+  /* "mpfmc/core/audio/track.pyx":553
+ *         cdef Uint32 frames = buffer_length // (callback_data.bytes_per_sample * callback_data.channels)
+ * 
+ *         if track == NULL or track.inserts == NULL or track.inserts.tail_frames_remaining == 0:             # <<<<<<<<<<<<<<
+ *             return
+ * 
  */
-  __pyx_t_1 = ((__pyx_v_notification_message != NULL) != 0);
-  if (__pyx_t_1) {
+  __pyx_t_3 = ((__pyx_v_track == NULL) != 0);
+  if (!__pyx_t_3) {
+  } else {
+    __pyx_t_2 = __pyx_t_3;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_3 = ((__pyx_v_track->inserts == NULL) != 0);
+  if (!__pyx_t_3) {
+  } else {
+    __pyx_t_2 = __pyx_t_3;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_3 = ((__pyx_v_track->inserts->tail_frames_remaining == 0) != 0);
+  __pyx_t_2 = __pyx_t_3;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_2) {
 
-    /* "mpfmc/core/audio/notification_message.pxd":205
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
- *     if notification_message != NULL:
- *         notification_message.message = notification_sound_loop_set_stopped             # <<<<<<<<<<<<<<
- *         notification_message.player = 0
- *         notification_message.sound_id = sound_id
+    /* "mpfmc/core/audio/track.pyx":554
+ * 
+ *         if track == NULL or track.inserts == NULL or track.inserts.tail_frames_remaining == 0:
+ *             return             # <<<<<<<<<<<<<<
+ * 
+ *         memset(track.float_buffer, 0, (buffer_length // callback_data.bytes_per_sample) * sizeof(float))
  */
-    __pyx_v_notification_message->message = __pyx_e_5mpfmc_4core_5audio_20notification_message_notification_sound_loop_set_stopped;
+    goto __pyx_L0;
 
-    /* "mpfmc/core/audio/notification_message.pxd":206
- *     if notification_message != NULL:
- *         notification_message.message = notification_sound_loop_set_stopped
- *         notification_message.player = 0             # <<<<<<<<<<<<<<
- *         notification_message.sound_id = sound_id
- *         notification_message.sound_instance_id = 0
+    /* "mpfmc/core/audio/track.pyx":553
+ *         cdef Uint32 frames = buffer_length // (callback_data.bytes_per_sample * callback_data.channels)
+ * 
+ *         if track == NULL or track.inserts == NULL or track.inserts.tail_frames_remaining == 0:             # <<<<<<<<<<<<<<
+ *             return
+ * 
  */
-    __pyx_v_notification_message->player = 0;
+  }
 
-    /* "mpfmc/core/audio/notification_message.pxd":207
- *         notification_message.message = notification_sound_loop_set_stopped
- *         notification_message.player = 0
- *         notification_message.sound_id = sound_id             # <<<<<<<<<<<<<<
- *         notification_message.sound_instance_id = 0
- *         notification_message.data.sound_loop_set.id = sound_loop_set_id
+  /* "mpfmc/core/audio/track.pyx":556
+ *             return
+ * 
+ *         memset(track.float_buffer, 0, (buffer_length // callback_data.bytes_per_sample) * sizeof(float))             # <<<<<<<<<<<<<<
+ *         process_dsp_chain(track.inserts, track.float_buffer, frames, callback_data.channels)
+ *         mix_float_to_float(callback_data.float_mix_buffer, track.float_buffer,
  */
-    __pyx_v_notification_message->sound_id = __pyx_v_sound_id;
+  if (unlikely(__pyx_v_callback_data->bytes_per_sample == 0)) {
+    #ifdef WITH_THREAD
+    PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+    #endif
+    PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+    #ifdef WITH_THREAD
+    __Pyx_PyGILState_Release(__pyx_gilstate_save);
+    #endif
+    __PYX_ERR(0, 556, __pyx_L1_error)
+  }
+  memset(__pyx_v_track->float_buffer, 0, ((__pyx_v_buffer_length / __pyx_v_callback_data->bytes_per_sample) * (sizeof(float))));
 
-    /* "mpfmc/core/audio/notification_message.pxd":208
- *         notification_message.player = 0
- *         notification_message.sound_id = sound_id
- *         notification_message.sound_instance_id = 0             # <<<<<<<<<<<<<<
- *         notification_message.data.sound_loop_set.id = sound_loop_set_id
+  /* "mpfmc/core/audio/track.pyx":557
  * 
+ *         memset(track.float_buffer, 0, (buffer_length // callback_data.bytes_per_sample) * sizeof(float))
+ *         process_dsp_chain(track.inserts, track.float_buffer, frames, callback_data.channels)             # <<<<<<<<<<<<<<
+ *         mix_float_to_float(callback_data.float_mix_buffer, track.float_buffer,
+ *                            buffer_length // callback_data.bytes_per_sample)
  */
-    __pyx_v_notification_message->sound_instance_id = 0;
+  __pyx_f_5mpfmc_4core_5audio_3dsp_process_dsp_chain(__pyx_v_track->inserts, __pyx_v_track->float_buffer, __pyx_v_frames, __pyx_v_callback_data->channels);
 
-    /* "mpfmc/core/audio/notification_message.pxd":209
- *         notification_message.sound_id = sound_id
- *         notification_message.sound_instance_id = 0
- *         notification_message.data.sound_loop_set.id = sound_loop_set_id             # <<<<<<<<<<<<<<
+  /* "mpfmc/core/audio/track.pyx":559
+ *         process_dsp_chain(track.inserts, track.float_buffer, frames, callback_data.channels)
+ *         mix_float_to_float(callback_data.float_mix_buffer, track.float_buffer,
+ *                            buffer_length // callback_data.bytes_per_sample)             # <<<<<<<<<<<<<<
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+ *         if track.inserts.tail_frames_remaining > frames:
  */
-    __pyx_v_notification_message->data.sound_loop_set.id = __pyx_v_sound_loop_set_id;
+  if (unlikely(__pyx_v_callback_data->bytes_per_sample == 0)) {
+    #ifdef WITH_THREAD
+    PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+    #endif
+    PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+    #ifdef WITH_THREAD
+    __Pyx_PyGILState_Release(__pyx_gilstate_save);
+    #endif
+    __PYX_ERR(0, 559, __pyx_L1_error)
+  }
 
-    /* "mpfmc/core/audio/notification_message.pxd":211
- *         notification_message.data.sound_loop_set.id = sound_loop_set_id
+  /* "mpfmc/core/audio/track.pyx":558
+ *         memset(track.float_buffer, 0, (buffer_length // callback_data.bytes_per_sample) * sizeof(float))
+ *         process_dsp_chain(track.inserts, track.float_buffer, frames, callback_data.channels)
+ *         mix_float_to_float(callback_data.float_mix_buffer, track.float_buffer,             # <<<<<<<<<<<<<<
+ *                            buffer_length // callback_data.bytes_per_sample)
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)             # <<<<<<<<<<<<<<
+ */
+  __pyx_f_5mpfmc_4core_5audio_5mixer_mix_float_to_float(__pyx_v_callback_data->float_mix_buffer, __pyx_v_track->float_buffer, (__pyx_v_buffer_length / __pyx_v_callback_data->bytes_per_sample));
+
+  /* "mpfmc/core/audio/track.pyx":561
+ *                            buffer_length // callback_data.bytes_per_sample)
  * 
- * cdef inline void send_sound_loop_set_looping_notification(int sound_loop_set_id, Uint64 sound_id, TrackState *track) nogil:
+ *         if track.inserts.tail_frames_remaining > frames:             # <<<<<<<<<<<<<<
+ *             track.inserts.tail_frames_remaining -= frames
+ *         else:
  */
-    __pyx_v_track->notification_messages = g_slist_prepend(__pyx_v_track->notification_messages, __pyx_v_notification_message);
+  __pyx_t_2 = ((__pyx_v_track->inserts->tail_frames_remaining > __pyx_v_frames) != 0);
+  if (__pyx_t_2) {
 
-    /* "mpfmc/core/audio/notification_message.pxd":204
- *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
- *     if notification_message != NULL:             # <<<<<<<<<<<<<<
- *         notification_message.message = notification_sound_loop_set_stopped
- *         notification_message.player = 0
+    /* "mpfmc/core/audio/track.pyx":562
+ * 
+ *         if track.inserts.tail_frames_remaining > frames:
+ *             track.inserts.tail_frames_remaining -= frames             # <<<<<<<<<<<<<<
+ *         else:
+ *             track.inserts.tail_frames_remaining = 0
+ */
+    __pyx_v_track->inserts->tail_frames_remaining = (__pyx_v_track->inserts->tail_frames_remaining - __pyx_v_frames);
+
+    /* "mpfmc/core/audio/track.pyx":561
+ *                            buffer_length // callback_data.bytes_per_sample)
+ * 
+ *         if track.inserts.tail_frames_remaining > frames:             # <<<<<<<<<<<<<<
+ *             track.inserts.tail_frames_remaining -= frames
+ *         else:
  */
+    goto __pyx_L7;
   }
 
-  /* "mpfmc/core/audio/notification_message.pxd":195
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+  /* "mpfmc/core/audio/track.pyx":564
+ *             track.inserts.tail_frames_remaining -= frames
+ *         else:
+ *             track.inserts.tail_frames_remaining = 0             # <<<<<<<<<<<<<<
  * 
- * cdef inline void send_sound_loop_set_stopped_notification(int sound_loop_set_id, Uint64 sound_id, TrackState *track) nogil:             # <<<<<<<<<<<<<<
- *     """
- *     Sends a sound_loop_set stopped notification
+ * 
+ */
+  /*else*/ {
+    __pyx_v_track->inserts->tail_frames_remaining = 0;
+  }
+  __pyx_L7:;
+
+  /* "mpfmc/core/audio/track.pyx":540
+ * 
+ *     @staticmethod
+ *     cdef void mix_track_tail_to_output(TrackState *track, AudioCallbackData* callback_data,             # <<<<<<<<<<<<<<
+ *                                        Uint32 buffer_length) nogil:
+ *         """
  */
 
   /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_WriteUnraisable("mpfmc.core.audio.track.Track.mix_track_tail_to_output", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 1);
+  __pyx_L0:;
 }
 
-/* "mpfmc/core/audio/notification_message.pxd":213
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
- * 
- * cdef inline void send_sound_loop_set_looping_notification(int sound_loop_set_id, Uint64 sound_id, TrackState *track) nogil:             # <<<<<<<<<<<<<<
- *     """
- *     Sends a sound_loop_set looping notification
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
  */
 
-static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_send_sound_loop_set_looping_notification(int __pyx_v_sound_loop_set_id, Uint64 __pyx_v_sound_id, __pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_v_track) {
-  __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_v_notification_message;
-  int __pyx_t_1;
+/* Python wrapper */
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_27__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_5track_5Track_26__reduce_cython__[] = "Track.__reduce_cython__(self)";
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_27__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_5track_5Track_26__reduce_cython__(((struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)__pyx_v_self));
 
-  /* "mpfmc/core/audio/notification_message.pxd":221
- *         track: The TrackState pointer
- *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()             # <<<<<<<<<<<<<<
- *     if notification_message != NULL:
- *         notification_message.message = notification_sound_loop_set_looping
- */
-  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message();
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-  /* "mpfmc/core/audio/notification_message.pxd":222
- *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
- *     if notification_message != NULL:             # <<<<<<<<<<<<<<
- *         notification_message.message = notification_sound_loop_set_looping
- *         notification_message.player = 0
- */
-  __pyx_t_1 = ((__pyx_v_notification_message != NULL) != 0);
-  if (__pyx_t_1) {
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_26__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
 
-    /* "mpfmc/core/audio/notification_message.pxd":223
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
- *     if notification_message != NULL:
- *         notification_message.message = notification_sound_loop_set_looping             # <<<<<<<<<<<<<<
- *         notification_message.player = 0
- *         notification_message.sound_id = sound_id
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  */
-    __pyx_v_notification_message->message = __pyx_e_5mpfmc_4core_5audio_20notification_message_notification_sound_loop_set_looping;
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__15, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 2, __pyx_L1_error)
 
-    /* "mpfmc/core/audio/notification_message.pxd":224
- *     if notification_message != NULL:
- *         notification_message.message = notification_sound_loop_set_looping
- *         notification_message.player = 0             # <<<<<<<<<<<<<<
- *         notification_message.sound_id = sound_id
- *         notification_message.sound_instance_id = 0
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
  */
-    __pyx_v_notification_message->player = 0;
 
-    /* "mpfmc/core/audio/notification_message.pxd":225
- *         notification_message.message = notification_sound_loop_set_looping
- *         notification_message.player = 0
- *         notification_message.sound_id = sound_id             # <<<<<<<<<<<<<<
- *         notification_message.sound_instance_id = 0
- *         notification_message.data.sound_loop_set.id = sound_loop_set_id
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("mpfmc.core.audio.track.Track.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  */
-    __pyx_v_notification_message->sound_id = __pyx_v_sound_id;
 
-    /* "mpfmc/core/audio/notification_message.pxd":226
- *         notification_message.player = 0
- *         notification_message.sound_id = sound_id
- *         notification_message.sound_instance_id = 0             # <<<<<<<<<<<<<<
- *         notification_message.data.sound_loop_set.id = sound_loop_set_id
- * 
+/* Python wrapper */
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_29__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static char __pyx_doc_5mpfmc_4core_5audio_5track_5Track_28__setstate_cython__[] = "Track.__setstate_cython__(self, __pyx_state)";
+static PyObject *__pyx_pw_5mpfmc_4core_5audio_5track_5Track_29__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5mpfmc_4core_5audio_5track_5Track_28__setstate_cython__(((struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5mpfmc_4core_5audio_5track_5Track_28__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
  */
-    __pyx_v_notification_message->sound_instance_id = 0;
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__16, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 4, __pyx_L1_error)
 
-    /* "mpfmc/core/audio/notification_message.pxd":227
- *         notification_message.sound_id = sound_id
- *         notification_message.sound_instance_id = 0
- *         notification_message.data.sound_loop_set.id = sound_loop_set_id             # <<<<<<<<<<<<<<
- * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  */
-    __pyx_v_notification_message->data.sound_loop_set.id = __pyx_v_sound_loop_set_id;
 
-    /* "mpfmc/core/audio/notification_message.pxd":229
- *         notification_message.data.sound_loop_set.id = sound_loop_set_id
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("mpfmc.core.audio.track.Track.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/track.pyx":570
+ * #    DSP insert chain functions
+ * # ---------------------------------------------------------------------------
+ * cdef DspChain *create_dsp_chain(list inserts, int sample_rate, int channels) except NULL:             # <<<<<<<<<<<<<<
+ *     """
+ *     Creates a DSP insert chain from a list of insert settings.
+ */
+
+static __pyx_t_5mpfmc_4core_5audio_3dsp_DspChain *__pyx_f_5mpfmc_4core_5audio_5track_create_dsp_chain(PyObject *__pyx_v_inserts, int __pyx_v_sample_rate, CYTHON_UNUSED int __pyx_v_channels) {
+  __pyx_t_5mpfmc_4core_5audio_3dsp_DspChain *__pyx_v_chain;
+  __pyx_t_5mpfmc_4core_5audio_3dsp_DspInsert *__pyx_v_insert;
+  int __pyx_v_index;
+  int __pyx_v_delay;
+  Uint32 __pyx_v_total_length;
+  Uint32 __pyx_v_longest_comb;
+  PyObject *__pyx_v_settings = NULL;
+  __pyx_t_5mpfmc_4core_5audio_3dsp_DspChain *__pyx_r;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  int __pyx_t_10;
+  PyObject *__pyx_t_11 = NULL;
+  PyObject *__pyx_t_12 = NULL;
+  PyObject *__pyx_t_13 = NULL;
+  PyObject *__pyx_t_14 = NULL;
+  float __pyx_t_15;
+  double __pyx_t_16;
+  int __pyx_t_17;
+  long __pyx_t_18;
+  Uint32 __pyx_t_19;
+  Uint32 __pyx_t_20;
+  Uint32 __pyx_t_21;
+  PyObject *__pyx_t_22 = NULL;
+  __Pyx_RefNannySetupContext("create_dsp_chain", 0);
+
+  /* "mpfmc/core/audio/track.pyx":586
+ *     cdef Uint32 total_length, longest_comb
+ * 
+ *     if len(inserts) > DSP_MAX_INSERTS:             # <<<<<<<<<<<<<<
+ *         raise AudioException("Too many DSP inserts ({}), the maximum is {}".format(len(inserts), DSP_MAX_INSERTS))
+ * 
+ */
+  if (unlikely(__pyx_v_inserts == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 586, __pyx_L1_error)
+  }
+  __pyx_t_1 = PyList_GET_SIZE(__pyx_v_inserts); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 586, __pyx_L1_error)
+  __pyx_t_2 = ((__pyx_t_1 > __pyx_e_5mpfmc_4core_5audio_3dsp_DSP_MAX_INSERTS) != 0);
+  if (__pyx_t_2) {
+
+    /* "mpfmc/core/audio/track.pyx":587
  * 
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)             # <<<<<<<<<<<<<<
+ *     if len(inserts) > DSP_MAX_INSERTS:
+ *         raise AudioException("Too many DSP inserts ({}), the maximum is {}".format(len(inserts), DSP_MAX_INSERTS))             # <<<<<<<<<<<<<<
  * 
+ *     chain = <DspChain*>PyMem_Malloc(sizeof(DspChain))
  */
-    __pyx_v_track->notification_messages = g_slist_prepend(__pyx_v_track->notification_messages, __pyx_v_notification_message);
+    __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_AudioException); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 587, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Too_many_DSP_inserts_the_maximum, __pyx_n_s_format); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 587, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    if (unlikely(__pyx_v_inserts == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+      __PYX_ERR(0, 587, __pyx_L1_error)
+    }
+    __pyx_t_1 = PyList_GET_SIZE(__pyx_v_inserts); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 587, __pyx_L1_error)
+    __pyx_t_7 = PyInt_FromSsize_t(__pyx_t_1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 587, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_8 = __Pyx_PyInt_From_int(__pyx_e_5mpfmc_4core_5audio_3dsp_DSP_MAX_INSERTS); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 587, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_9 = NULL;
+    __pyx_t_10 = 0;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
+      __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_6);
+      if (likely(__pyx_t_9)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+        __Pyx_INCREF(__pyx_t_9);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_6, function);
+        __pyx_t_10 = 1;
+      }
+    }
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_6)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_9, __pyx_t_7, __pyx_t_8};
+      __pyx_t_5 = __Pyx_PyFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_10, 2+__pyx_t_10); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 587, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_6)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_9, __pyx_t_7, __pyx_t_8};
+      __pyx_t_5 = __Pyx_PyCFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_10, 2+__pyx_t_10); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 587, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_11 = PyTuple_New(2+__pyx_t_10); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 587, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_11);
+      if (__pyx_t_9) {
+        __Pyx_GIVEREF(__pyx_t_9); PyTuple_SET_ITEM(__pyx_t_11, 0, __pyx_t_9); __pyx_t_9 = NULL;
+      }
+      __Pyx_GIVEREF(__pyx_t_7);
+      PyTuple_SET_ITEM(__pyx_t_11, 0+__pyx_t_10, __pyx_t_7);
+      __Pyx_GIVEREF(__pyx_t_8);
+      PyTuple_SET_ITEM(__pyx_t_11, 1+__pyx_t_10, __pyx_t_8);
+      __pyx_t_7 = 0;
+      __pyx_t_8 = 0;
+      __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_11, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 587, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_t_6 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+      }
+    }
+    if (!__pyx_t_6) {
+      __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_5); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 587, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_GOTREF(__pyx_t_3);
+    } else {
+      #if CYTHON_FAST_PYCALL
+      if (PyFunction_Check(__pyx_t_4)) {
+        PyObject *__pyx_temp[2] = {__pyx_t_6, __pyx_t_5};
+        __pyx_t_3 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 587, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+        __Pyx_GOTREF(__pyx_t_3);
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      } else
+      #endif
+      #if CYTHON_FAST_PYCCALL
+      if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
+        PyObject *__pyx_temp[2] = {__pyx_t_6, __pyx_t_5};
+        __pyx_t_3 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 587, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+        __Pyx_GOTREF(__pyx_t_3);
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      } else
+      #endif
+      {
+        __pyx_t_11 = PyTuple_New(1+1); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 587, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_11);
+        __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_11, 0, __pyx_t_6); __pyx_t_6 = NULL;
+        __Pyx_GIVEREF(__pyx_t_5);
+        PyTuple_SET_ITEM(__pyx_t_11, 0+1, __pyx_t_5);
+        __pyx_t_5 = 0;
+        __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_11, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 587, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+      }
+    }
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(0, 587, __pyx_L1_error)
 
-    /* "mpfmc/core/audio/notification_message.pxd":222
- *     """
- *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
- *     if notification_message != NULL:             # <<<<<<<<<<<<<<
- *         notification_message.message = notification_sound_loop_set_looping
- *         notification_message.player = 0
+    /* "mpfmc/core/audio/track.pyx":586
+ *     cdef Uint32 total_length, longest_comb
+ * 
+ *     if len(inserts) > DSP_MAX_INSERTS:             # <<<<<<<<<<<<<<
+ *         raise AudioException("Too many DSP inserts ({}), the maximum is {}".format(len(inserts), DSP_MAX_INSERTS))
+ * 
  */
   }
 
-  /* "mpfmc/core/audio/notification_message.pxd":213
- *         track.notification_messages = g_slist_prepend(track.notification_messages, notification_message)
+  /* "mpfmc/core/audio/track.pyx":589
+ *         raise AudioException("Too many DSP inserts ({}), the maximum is {}".format(len(inserts), DSP_MAX_INSERTS))
  * 
- * cdef inline void send_sound_loop_set_looping_notification(int sound_loop_set_id, Uint64 sound_id, TrackState *track) nogil:             # <<<<<<<<<<<<<<
- *     """
- *     Sends a sound_loop_set looping notification
+ *     chain = <DspChain*>PyMem_Malloc(sizeof(DspChain))             # <<<<<<<<<<<<<<
+ *     if chain == NULL:
+ *         raise MemoryError()
  */
+  __pyx_v_chain = ((__pyx_t_5mpfmc_4core_5audio_3dsp_DspChain *)PyMem_Malloc((sizeof(__pyx_t_5mpfmc_4core_5audio_3dsp_DspChain))));
 
-  /* function exit code */
-}
+  /* "mpfmc/core/audio/track.pyx":590
+ * 
+ *     chain = <DspChain*>PyMem_Malloc(sizeof(DspChain))
+ *     if chain == NULL:             # <<<<<<<<<<<<<<
+ *         raise MemoryError()
+ * 
+ */
+  __pyx_t_2 = ((__pyx_v_chain == NULL) != 0);
+  if (__pyx_t_2) {
 
-/* "mpfmc/core/audio/inline.pxd":7
- * # ---------------------------------------------------------------------------
+    /* "mpfmc/core/audio/track.pyx":591
+ *     chain = <DspChain*>PyMem_Malloc(sizeof(DspChain))
+ *     if chain == NULL:
+ *         raise MemoryError()             # <<<<<<<<<<<<<<
  * 
- * cdef inline Uint8 lerpU8(float progress, Uint8 a, Uint8 b) nogil:             # <<<<<<<<<<<<<<
- *     """
- *     Linearly interpolate between 2 8-bit values.
+ *     memset(chain, 0, sizeof(DspChain))
  */
+    PyErr_NoMemory(); __PYX_ERR(0, 591, __pyx_L1_error)
 
-static CYTHON_INLINE Uint8 __pyx_f_5mpfmc_4core_5audio_6inline_lerpU8(float __pyx_v_progress, Uint8 __pyx_v_a, Uint8 __pyx_v_b) {
-  Uint8 __pyx_r;
+    /* "mpfmc/core/audio/track.pyx":590
+ * 
+ *     chain = <DspChain*>PyMem_Malloc(sizeof(DspChain))
+ *     if chain == NULL:             # <<<<<<<<<<<<<<
+ *         raise MemoryError()
+ * 
+ */
+  }
 
-  /* "mpfmc/core/audio/inline.pxd":18
- *         New 8-bit value between the supplied values
- *     """
- *     return <Uint8> ((1.0 - progress) * a + progress * b)             # <<<<<<<<<<<<<<
+  /* "mpfmc/core/audio/track.pyx":593
+ *         raise MemoryError()
  * 
- * cdef inline float in_out_quad(float progress) nogil:
+ *     memset(chain, 0, sizeof(DspChain))             # <<<<<<<<<<<<<<
+ * 
+ *     for settings in inserts:
  */
-  __pyx_r = ((Uint8)(((1.0 - __pyx_v_progress) * __pyx_v_a) + (__pyx_v_progress * __pyx_v_b)));
-  goto __pyx_L0;
+  memset(__pyx_v_chain, 0, (sizeof(__pyx_t_5mpfmc_4core_5audio_3dsp_DspChain)));
 
-  /* "mpfmc/core/audio/inline.pxd":7
- * # ---------------------------------------------------------------------------
+  /* "mpfmc/core/audio/track.pyx":595
+ *     memset(chain, 0, sizeof(DspChain))
  * 
- * cdef inline Uint8 lerpU8(float progress, Uint8 a, Uint8 b) nogil:             # <<<<<<<<<<<<<<
- *     """
- *     Linearly interpolate between 2 8-bit values.
+ *     for settings in inserts:             # <<<<<<<<<<<<<<
+ *         insert = &chain.inserts[chain.insert_count]
+ *         chain.insert_count += 1
  */
+  if (unlikely(__pyx_v_inserts == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+    __PYX_ERR(0, 595, __pyx_L1_error)
+  }
+  __pyx_t_3 = __pyx_v_inserts; __Pyx_INCREF(__pyx_t_3); __pyx_t_1 = 0;
+  for (;;) {
+    if (__pyx_t_1 >= PyList_GET_SIZE(__pyx_t_3)) break;
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    __pyx_t_4 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_1); __Pyx_INCREF(__pyx_t_4); __pyx_t_1++; if (unlikely(0 < 0)) __PYX_ERR(0, 595, __pyx_L1_error)
+    #else
+    __pyx_t_4 = PySequence_ITEM(__pyx_t_3, __pyx_t_1); __pyx_t_1++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 595, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    #endif
+    __Pyx_XDECREF_SET(__pyx_v_settings, __pyx_t_4);
+    __pyx_t_4 = 0;
 
-  /* function exit code */
-  __pyx_L0:;
-  return __pyx_r;
-}
-
-/* "mpfmc/core/audio/inline.pxd":20
- *     return <Uint8> ((1.0 - progress) * a + progress * b)
+    /* "mpfmc/core/audio/track.pyx":596
+ * 
+ *     for settings in inserts:
+ *         insert = &chain.inserts[chain.insert_count]             # <<<<<<<<<<<<<<
+ *         chain.insert_count += 1
  * 
- * cdef inline float in_out_quad(float progress) nogil:             # <<<<<<<<<<<<<<
- *     """
- *     A quadratic easing function used for smoother audio fading
  */
+    __pyx_v_insert = (&(__pyx_v_chain->inserts[__pyx_v_chain->insert_count]));
 
-static CYTHON_INLINE float __pyx_f_5mpfmc_4core_5audio_6inline_in_out_quad(float __pyx_v_progress) {
-  float __pyx_v_p;
-  float __pyx_r;
-  int __pyx_t_1;
-
-  /* "mpfmc/core/audio/inline.pxd":30
- *     """
- *     cdef float p
- *     p = progress * 2             # <<<<<<<<<<<<<<
- *     if p < 1:
- *         return 0.5 * p * p
+    /* "mpfmc/core/audio/track.pyx":597
+ *     for settings in inserts:
+ *         insert = &chain.inserts[chain.insert_count]
+ *         chain.insert_count += 1             # <<<<<<<<<<<<<<
+ * 
+ *         if settings['type'] == 'eq':
  */
-  __pyx_v_p = (__pyx_v_progress * 2.0);
+    __pyx_v_chain->insert_count = (__pyx_v_chain->insert_count + 1);
 
-  /* "mpfmc/core/audio/inline.pxd":31
- *     cdef float p
- *     p = progress * 2
- *     if p < 1:             # <<<<<<<<<<<<<<
- *         return 0.5 * p * p
- *     p -= 1.0
+    /* "mpfmc/core/audio/track.pyx":599
+ *         chain.insert_count += 1
+ * 
+ *         if settings['type'] == 'eq':             # <<<<<<<<<<<<<<
+ *             insert.type = dsp_insert_biquad
+ *             try:
  */
-  __pyx_t_1 = ((__pyx_v_p < 1.0) != 0);
-  if (__pyx_t_1) {
+    __pyx_t_4 = PyObject_GetItem(__pyx_v_settings, __pyx_n_u_type); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 599, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_2 = (__Pyx_PyUnicode_Equals(__pyx_t_4, __pyx_n_u_eq, Py_EQ)); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 599, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (__pyx_t_2) {
 
-    /* "mpfmc/core/audio/inline.pxd":32
- *     p = progress * 2
- *     if p < 1:
- *         return 0.5 * p * p             # <<<<<<<<<<<<<<
- *     p -= 1.0
- *     return -0.5 * (p * (p - 2.0) - 1.0)
+      /* "mpfmc/core/audio/track.pyx":600
+ * 
+ *         if settings['type'] == 'eq':
+ *             insert.type = dsp_insert_biquad             # <<<<<<<<<<<<<<
+ *             try:
+ *                 _set_biquad_coefficients(&insert.biquad, settings, sample_rate)
  */
-    __pyx_r = ((0.5 * __pyx_v_p) * __pyx_v_p);
-    goto __pyx_L0;
+      __pyx_v_insert->type = __pyx_e_5mpfmc_4core_5audio_3dsp_dsp_insert_biquad;
 
-    /* "mpfmc/core/audio/inline.pxd":31
- *     cdef float p
- *     p = progress * 2
- *     if p < 1:             # <<<<<<<<<<<<<<
- *         return 0.5 * p * p
- *     p -= 1.0
+      /* "mpfmc/core/audio/track.pyx":601
+ *         if settings['type'] == 'eq':
+ *             insert.type = dsp_insert_biquad
+ *             try:             # <<<<<<<<<<<<<<
+ *                 _set_biquad_coefficients(&insert.biquad, settings, sample_rate)
+ *             except Exception:
  */
-  }
+      {
+        __Pyx_PyThreadState_declare
+        __Pyx_PyThreadState_assign
+        __Pyx_ExceptionSave(&__pyx_t_12, &__pyx_t_13, &__pyx_t_14);
+        __Pyx_XGOTREF(__pyx_t_12);
+        __Pyx_XGOTREF(__pyx_t_13);
+        __Pyx_XGOTREF(__pyx_t_14);
+        /*try:*/ {
+
+          /* "mpfmc/core/audio/track.pyx":602
+ *             insert.type = dsp_insert_biquad
+ *             try:
+ *                 _set_biquad_coefficients(&insert.biquad, settings, sample_rate)             # <<<<<<<<<<<<<<
+ *             except Exception:
+ *                 free_dsp_chain(chain)
+ */
+          if (!(likely(PyDict_CheckExact(__pyx_v_settings))||((__pyx_v_settings) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "dict", Py_TYPE(__pyx_v_settings)->tp_name), 0))) __PYX_ERR(0, 602, __pyx_L8_error)
+          __pyx_t_4 = __pyx_f_5mpfmc_4core_5audio_5track__set_biquad_coefficients((&__pyx_v_insert->biquad), ((PyObject*)__pyx_v_settings), __pyx_v_sample_rate); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 602, __pyx_L8_error)
+          __Pyx_GOTREF(__pyx_t_4);
+          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+          /* "mpfmc/core/audio/track.pyx":601
+ *         if settings['type'] == 'eq':
+ *             insert.type = dsp_insert_biquad
+ *             try:             # <<<<<<<<<<<<<<
+ *                 _set_biquad_coefficients(&insert.biquad, settings, sample_rate)
+ *             except Exception:
+ */
+        }
+        __Pyx_XDECREF(__pyx_t_12); __pyx_t_12 = 0;
+        __Pyx_XDECREF(__pyx_t_13); __pyx_t_13 = 0;
+        __Pyx_XDECREF(__pyx_t_14); __pyx_t_14 = 0;
+        goto __pyx_L15_try_end;
+        __pyx_L8_error:;
+        __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __Pyx_XDECREF(__pyx_t_11); __pyx_t_11 = 0;
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+        /* "mpfmc/core/audio/track.pyx":603
+ *             try:
+ *                 _set_biquad_coefficients(&insert.biquad, settings, sample_rate)
+ *             except Exception:             # <<<<<<<<<<<<<<
+ *                 free_dsp_chain(chain)
+ *                 raise
+ */
+        __pyx_t_10 = __Pyx_PyErr_ExceptionMatches(((PyObject *)(&((PyTypeObject*)PyExc_Exception)[0])));
+        if (__pyx_t_10) {
+          __Pyx_AddTraceback("mpfmc.core.audio.track.create_dsp_chain", __pyx_clineno, __pyx_lineno, __pyx_filename);
+          if (__Pyx_GetException(&__pyx_t_4, &__pyx_t_11, &__pyx_t_5) < 0) __PYX_ERR(0, 603, __pyx_L10_except_error)
+          __Pyx_GOTREF(__pyx_t_4);
+          __Pyx_GOTREF(__pyx_t_11);
+          __Pyx_GOTREF(__pyx_t_5);
+
+          /* "mpfmc/core/audio/track.pyx":604
+ *                 _set_biquad_coefficients(&insert.biquad, settings, sample_rate)
+ *             except Exception:
+ *                 free_dsp_chain(chain)             # <<<<<<<<<<<<<<
+ *                 raise
+ * 
+ */
+          __pyx_f_5mpfmc_4core_5audio_5track_free_dsp_chain(__pyx_v_chain);
+
+          /* "mpfmc/core/audio/track.pyx":605
+ *             except Exception:
+ *                 free_dsp_chain(chain)
+ *                 raise             # <<<<<<<<<<<<<<
+ * 
+ *         elif settings['type'] == 'limiter':
+ */
+          __Pyx_GIVEREF(__pyx_t_4);
+          __Pyx_GIVEREF(__pyx_t_11);
+          __Pyx_XGIVEREF(__pyx_t_5);
+          __Pyx_ErrRestoreWithState(__pyx_t_4, __pyx_t_11, __pyx_t_5);
+          __pyx_t_4 = 0; __pyx_t_11 = 0; __pyx_t_5 = 0; 
+          __PYX_ERR(0, 605, __pyx_L10_except_error)
+        }
+        goto __pyx_L10_except_error;
+        __pyx_L10_except_error:;
+
+        /* "mpfmc/core/audio/track.pyx":601
+ *         if settings['type'] == 'eq':
+ *             insert.type = dsp_insert_biquad
+ *             try:             # <<<<<<<<<<<<<<
+ *                 _set_biquad_coefficients(&insert.biquad, settings, sample_rate)
+ *             except Exception:
+ */
+        __Pyx_XGIVEREF(__pyx_t_12);
+        __Pyx_XGIVEREF(__pyx_t_13);
+        __Pyx_XGIVEREF(__pyx_t_14);
+        __Pyx_ExceptionReset(__pyx_t_12, __pyx_t_13, __pyx_t_14);
+        goto __pyx_L1_error;
+        __pyx_L15_try_end:;
+      }
 
-  /* "mpfmc/core/audio/inline.pxd":33
- *     if p < 1:
- *         return 0.5 * p * p
- *     p -= 1.0             # <<<<<<<<<<<<<<
- *     return -0.5 * (p * (p - 2.0) - 1.0)
+      /* "mpfmc/core/audio/track.pyx":599
+ *         chain.insert_count += 1
  * 
+ *         if settings['type'] == 'eq':             # <<<<<<<<<<<<<<
+ *             insert.type = dsp_insert_biquad
+ *             try:
  */
-  __pyx_v_p = (__pyx_v_p - 1.0);
+      goto __pyx_L7;
+    }
 
-  /* "mpfmc/core/audio/inline.pxd":34
- *         return 0.5 * p * p
- *     p -= 1.0
- *     return -0.5 * (p * (p - 2.0) - 1.0)             # <<<<<<<<<<<<<<
+    /* "mpfmc/core/audio/track.pyx":607
+ *                 raise
  * 
+ *         elif settings['type'] == 'limiter':             # <<<<<<<<<<<<<<
+ *             insert.type = dsp_insert_limiter
+ *             insert.limiter.threshold = settings['threshold']
  */
-  __pyx_r = (-0.5 * ((__pyx_v_p * (__pyx_v_p - 2.0)) - 1.0));
-  goto __pyx_L0;
+    __pyx_t_5 = PyObject_GetItem(__pyx_v_settings, __pyx_n_u_type); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 607, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_2 = (__Pyx_PyUnicode_Equals(__pyx_t_5, __pyx_n_u_limiter, Py_EQ)); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 607, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (__pyx_t_2) {
 
-  /* "mpfmc/core/audio/inline.pxd":20
- *     return <Uint8> ((1.0 - progress) * a + progress * b)
+      /* "mpfmc/core/audio/track.pyx":608
  * 
- * cdef inline float in_out_quad(float progress) nogil:             # <<<<<<<<<<<<<<
- *     """
- *     A quadratic easing function used for smoother audio fading
+ *         elif settings['type'] == 'limiter':
+ *             insert.type = dsp_insert_limiter             # <<<<<<<<<<<<<<
+ *             insert.limiter.threshold = settings['threshold']
+ *             insert.limiter.release_coefficient = exp(-1.0 / (max(settings['release'], 0.001) * sample_rate))
  */
+      __pyx_v_insert->type = __pyx_e_5mpfmc_4core_5audio_3dsp_dsp_insert_limiter;
 
-  /* function exit code */
-  __pyx_L0:;
-  return __pyx_r;
-}
-static struct __pyx_vtabstruct_5mpfmc_4core_5audio_5track_Track __pyx_vtable_5mpfmc_4core_5audio_5track_Track;
+      /* "mpfmc/core/audio/track.pyx":609
+ *         elif settings['type'] == 'limiter':
+ *             insert.type = dsp_insert_limiter
+ *             insert.limiter.threshold = settings['threshold']             # <<<<<<<<<<<<<<
+ *             insert.limiter.release_coefficient = exp(-1.0 / (max(settings['release'], 0.001) * sample_rate))
+ *             insert.limiter.gain = 1.0
+ */
+      __pyx_t_5 = PyObject_GetItem(__pyx_v_settings, __pyx_n_u_threshold); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 609, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_15 = __pyx_PyFloat_AsFloat(__pyx_t_5); if (unlikely((__pyx_t_15 == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 609, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_v_insert->limiter.threshold = __pyx_t_15;
 
-static PyObject *__pyx_tp_new_5mpfmc_4core_5audio_5track_Track(PyTypeObject *t, PyObject *a, PyObject *k) {
-  struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *p;
-  PyObject *o;
-  if (likely((t->tp_flags & Py_TPFLAGS_IS_ABSTRACT) == 0)) {
-    o = (*t->tp_alloc)(t, 0);
-  } else {
-    o = (PyObject *) PyBaseObject_Type.tp_new(t, __pyx_empty_tuple, 0);
-  }
-  if (unlikely(!o)) return 0;
-  p = ((struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)o);
-  p->__pyx_vtab = __pyx_vtabptr_5mpfmc_4core_5audio_5track_Track;
-  p->_name = ((PyObject*)Py_None); Py_INCREF(Py_None);
-  p->_events_when_stopped = ((PyObject*)Py_None); Py_INCREF(Py_None);
-  p->_events_when_played = ((PyObject*)Py_None); Py_INCREF(Py_None);
-  p->_events_when_paused = ((PyObject*)Py_None); Py_INCREF(Py_None);
-  p->mc = Py_None; Py_INCREF(Py_None);
-  p->log = Py_None; Py_INCREF(Py_None);
-  if (unlikely(__pyx_pw_5mpfmc_4core_5audio_5track_5Track_1__cinit__(o, a, k) < 0)) goto bad;
-  return o;
-  bad:
-  Py_DECREF(o); o = 0;
-  return NULL;
-}
+      /* "mpfmc/core/audio/track.pyx":610
+ *             insert.type = dsp_insert_limiter
+ *             insert.limiter.threshold = settings['threshold']
+ *             insert.limiter.release_coefficient = exp(-1.0 / (max(settings['release'], 0.001) * sample_rate))             # <<<<<<<<<<<<<<
+ *             insert.limiter.gain = 1.0
+ * 
+ */
+      __pyx_t_11 = __Pyx_GetModuleGlobalName(__pyx_n_s_exp); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 610, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_11);
+      __pyx_t_16 = 0.001;
+      __pyx_t_4 = PyObject_GetItem(__pyx_v_settings, __pyx_n_u_release); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 610, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_8 = PyFloat_FromDouble(__pyx_t_16); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 610, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __pyx_t_7 = PyObject_RichCompare(__pyx_t_8, __pyx_t_4, Py_GT); __Pyx_XGOTREF(__pyx_t_7); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 610, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_7); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 610, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      if (__pyx_t_2) {
+        __pyx_t_7 = PyFloat_FromDouble(__pyx_t_16); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 610, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_7);
+        __pyx_t_6 = __pyx_t_7;
+        __pyx_t_7 = 0;
+      } else {
+        __Pyx_INCREF(__pyx_t_4);
+        __pyx_t_6 = __pyx_t_4;
+      }
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_sample_rate); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 610, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_7 = PyNumber_Multiply(__pyx_t_6, __pyx_t_4); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 610, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __pyx_t_4 = __Pyx_PyFloat_TrueDivideCObj(__pyx_float_neg_1_0, __pyx_t_7, -1.0, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 610, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __pyx_t_7 = NULL;
+      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_11))) {
+        __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_11);
+        if (likely(__pyx_t_7)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_11);
+          __Pyx_INCREF(__pyx_t_7);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_11, function);
+        }
+      }
+      if (!__pyx_t_7) {
+        __pyx_t_5 = __Pyx_PyObject_CallOneArg(__pyx_t_11, __pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 610, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __Pyx_GOTREF(__pyx_t_5);
+      } else {
+        #if CYTHON_FAST_PYCALL
+        if (PyFunction_Check(__pyx_t_11)) {
+          PyObject *__pyx_temp[2] = {__pyx_t_7, __pyx_t_4};
+          __pyx_t_5 = __Pyx_PyFunction_FastCall(__pyx_t_11, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 610, __pyx_L1_error)
+          __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+          __Pyx_GOTREF(__pyx_t_5);
+          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        } else
+        #endif
+        #if CYTHON_FAST_PYCCALL
+        if (__Pyx_PyFastCFunction_Check(__pyx_t_11)) {
+          PyObject *__pyx_temp[2] = {__pyx_t_7, __pyx_t_4};
+          __pyx_t_5 = __Pyx_PyCFunction_FastCall(__pyx_t_11, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 610, __pyx_L1_error)
+          __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+          __Pyx_GOTREF(__pyx_t_5);
+          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        } else
+        #endif
+        {
+          __pyx_t_6 = PyTuple_New(1+1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 610, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_6);
+          __Pyx_GIVEREF(__pyx_t_7); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_7); __pyx_t_7 = NULL;
+          __Pyx_GIVEREF(__pyx_t_4);
+          PyTuple_SET_ITEM(__pyx_t_6, 0+1, __pyx_t_4);
+          __pyx_t_4 = 0;
+          __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_11, __pyx_t_6, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 610, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_5);
+          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+        }
+      }
+      __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+      __pyx_t_15 = __pyx_PyFloat_AsFloat(__pyx_t_5); if (unlikely((__pyx_t_15 == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 610, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_v_insert->limiter.release_coefficient = __pyx_t_15;
 
-static void __pyx_tp_dealloc_5mpfmc_4core_5audio_5track_Track(PyObject *o) {
-  struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *p = (struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)o;
-  #if CYTHON_USE_TP_FINALIZE
-  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && !_PyGC_FINALIZED(o)) {
-    if (PyObject_CallFinalizerFromDealloc(o)) return;
-  }
-  #endif
-  PyObject_GC_UnTrack(o);
-  {
-    PyObject *etype, *eval, *etb;
-    PyErr_Fetch(&etype, &eval, &etb);
-    ++Py_REFCNT(o);
-    __pyx_pw_5mpfmc_4core_5audio_5track_5Track_5__dealloc__(o);
-    --Py_REFCNT(o);
-    PyErr_Restore(etype, eval, etb);
-  }
-  Py_CLEAR(p->_name);
-  Py_CLEAR(p->_events_when_stopped);
-  Py_CLEAR(p->_events_when_played);
-  Py_CLEAR(p->_events_when_paused);
-  Py_CLEAR(p->mc);
-  Py_CLEAR(p->log);
-  (*Py_TYPE(o)->tp_free)(o);
-}
+      /* "mpfmc/core/audio/track.pyx":611
+ *             insert.limiter.threshold = settings['threshold']
+ *             insert.limiter.release_coefficient = exp(-1.0 / (max(settings['release'], 0.001) * sample_rate))
+ *             insert.limiter.gain = 1.0             # <<<<<<<<<<<<<<
+ * 
+ *         elif settings['type'] == 'reverb':
+ */
+      __pyx_v_insert->limiter.gain = 1.0;
 
-static int __pyx_tp_traverse_5mpfmc_4core_5audio_5track_Track(PyObject *o, visitproc v, void *a) {
-  int e;
-  struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *p = (struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)o;
-  if (p->_events_when_stopped) {
-    e = (*v)(p->_events_when_stopped, a); if (e) return e;
-  }
-  if (p->_events_when_played) {
-    e = (*v)(p->_events_when_played, a); if (e) return e;
-  }
-  if (p->_events_when_paused) {
-    e = (*v)(p->_events_when_paused, a); if (e) return e;
-  }
-  if (p->mc) {
-    e = (*v)(p->mc, a); if (e) return e;
-  }
-  if (p->log) {
-    e = (*v)(p->log, a); if (e) return e;
-  }
-  return 0;
-}
+      /* "mpfmc/core/audio/track.pyx":607
+ *                 raise
+ * 
+ *         elif settings['type'] == 'limiter':             # <<<<<<<<<<<<<<
+ *             insert.type = dsp_insert_limiter
+ *             insert.limiter.threshold = settings['threshold']
+ */
+      goto __pyx_L7;
+    }
 
-static int __pyx_tp_clear_5mpfmc_4core_5audio_5track_Track(PyObject *o) {
-  PyObject* tmp;
-  struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *p = (struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)o;
-  tmp = ((PyObject*)p->_events_when_stopped);
-  p->_events_when_stopped = ((PyObject*)Py_None); Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  tmp = ((PyObject*)p->_events_when_played);
-  p->_events_when_played = ((PyObject*)Py_None); Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  tmp = ((PyObject*)p->_events_when_paused);
-  p->_events_when_paused = ((PyObject*)Py_None); Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  tmp = ((PyObject*)p->mc);
-  p->mc = Py_None; Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  tmp = ((PyObject*)p->log);
-  p->log = Py_None; Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  return 0;
-}
+    /* "mpfmc/core/audio/track.pyx":613
+ *             insert.limiter.gain = 1.0
+ * 
+ *         elif settings['type'] == 'reverb':             # <<<<<<<<<<<<<<
+ *             insert.type = dsp_insert_reverb
+ *             insert.reverb.feedback = settings['room_size'] * 0.28 + 0.7
+ */
+    __pyx_t_5 = PyObject_GetItem(__pyx_v_settings, __pyx_n_u_type); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 613, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_2 = (__Pyx_PyUnicode_Equals(__pyx_t_5, __pyx_n_u_reverb, Py_EQ)); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 613, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (__pyx_t_2) {
 
-static PyObject *__pyx_getprop_5mpfmc_4core_5audio_5track_5Track_name(PyObject *o, CYTHON_UNUSED void *x) {
-  return __pyx_pw_5mpfmc_4core_5audio_5track_5Track_4name_1__get__(o);
-}
+      /* "mpfmc/core/audio/track.pyx":614
+ * 
+ *         elif settings['type'] == 'reverb':
+ *             insert.type = dsp_insert_reverb             # <<<<<<<<<<<<<<
+ *             insert.reverb.feedback = settings['room_size'] * 0.28 + 0.7
+ *             insert.reverb.damping = settings['damping'] * 0.4
+ */
+      __pyx_v_insert->type = __pyx_e_5mpfmc_4core_5audio_3dsp_dsp_insert_reverb;
 
-static PyObject *__pyx_getprop_5mpfmc_4core_5audio_5track_5Track_volume(PyObject *o, CYTHON_UNUSED void *x) {
-  return __pyx_pw_5mpfmc_4core_5audio_5track_5Track_6volume_1__get__(o);
-}
+      /* "mpfmc/core/audio/track.pyx":615
+ *         elif settings['type'] == 'reverb':
+ *             insert.type = dsp_insert_reverb
+ *             insert.reverb.feedback = settings['room_size'] * 0.28 + 0.7             # <<<<<<<<<<<<<<
+ *             insert.reverb.damping = settings['damping'] * 0.4
+ *             insert.reverb.wet = settings['wet']
+ */
+      __pyx_t_5 = PyObject_GetItem(__pyx_v_settings, __pyx_n_u_room_size); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 615, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_11 = PyNumber_Multiply(__pyx_t_5, __pyx_float_0_28); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 615, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_11);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_t_5 = __Pyx_PyFloat_AddObjC(__pyx_t_11, __pyx_float_0_7, 0.7, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 615, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+      __pyx_t_15 = __pyx_PyFloat_AsFloat(__pyx_t_5); if (unlikely((__pyx_t_15 == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 615, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_v_insert->reverb.feedback = __pyx_t_15;
 
-static PyObject *__pyx_getprop_5mpfmc_4core_5audio_5track_5Track_type(PyObject *o, CYTHON_UNUSED void *x) {
-  return __pyx_pw_5mpfmc_4core_5audio_5track_5Track_4type_1__get__(o);
-}
+      /* "mpfmc/core/audio/track.pyx":616
+ *             insert.type = dsp_insert_reverb
+ *             insert.reverb.feedback = settings['room_size'] * 0.28 + 0.7
+ *             insert.reverb.damping = settings['damping'] * 0.4             # <<<<<<<<<<<<<<
+ *             insert.reverb.wet = settings['wet']
+ *             insert.reverb.dry = settings['dry']
+ */
+      __pyx_t_5 = PyObject_GetItem(__pyx_v_settings, __pyx_n_u_damping); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 616, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_11 = PyNumber_Multiply(__pyx_t_5, __pyx_float_0_4); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 616, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_11);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_t_15 = __pyx_PyFloat_AsFloat(__pyx_t_11); if (unlikely((__pyx_t_15 == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 616, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+      __pyx_v_insert->reverb.damping = __pyx_t_15;
+
+      /* "mpfmc/core/audio/track.pyx":617
+ *             insert.reverb.feedback = settings['room_size'] * 0.28 + 0.7
+ *             insert.reverb.damping = settings['damping'] * 0.4
+ *             insert.reverb.wet = settings['wet']             # <<<<<<<<<<<<<<
+ *             insert.reverb.dry = settings['dry']
+ * 
+ */
+      __pyx_t_11 = PyObject_GetItem(__pyx_v_settings, __pyx_n_u_wet); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 617, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_11);
+      __pyx_t_15 = __pyx_PyFloat_AsFloat(__pyx_t_11); if (unlikely((__pyx_t_15 == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 617, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+      __pyx_v_insert->reverb.wet = __pyx_t_15;
+
+      /* "mpfmc/core/audio/track.pyx":618
+ *             insert.reverb.damping = settings['damping'] * 0.4
+ *             insert.reverb.wet = settings['wet']
+ *             insert.reverb.dry = settings['dry']             # <<<<<<<<<<<<<<
+ * 
+ *             # Scale the delay line lengths to the sample rate and allocate all of them in one block
+ */
+      __pyx_t_11 = PyObject_GetItem(__pyx_v_settings, __pyx_n_u_dry); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 618, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_11);
+      __pyx_t_15 = __pyx_PyFloat_AsFloat(__pyx_t_11); if (unlikely((__pyx_t_15 == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 618, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+      __pyx_v_insert->reverb.dry = __pyx_t_15;
+
+      /* "mpfmc/core/audio/track.pyx":621
+ * 
+ *             # Scale the delay line lengths to the sample rate and allocate all of them in one block
+ *             total_length = 0             # <<<<<<<<<<<<<<
+ *             for index in range(DSP_REVERB_COMB_COUNT):
+ *                 insert.reverb.comb_lengths[index] = max(1, REVERB_COMB_TUNINGS[index] * sample_rate // 44100)
+ */
+      __pyx_v_total_length = 0;
+
+      /* "mpfmc/core/audio/track.pyx":622
+ *             # Scale the delay line lengths to the sample rate and allocate all of them in one block
+ *             total_length = 0
+ *             for index in range(DSP_REVERB_COMB_COUNT):             # <<<<<<<<<<<<<<
+ *                 insert.reverb.comb_lengths[index] = max(1, REVERB_COMB_TUNINGS[index] * sample_rate // 44100)
+ *                 total_length += insert.reverb.comb_lengths[index]
+ */
+      __pyx_t_17 = __pyx_e_5mpfmc_4core_5audio_3dsp_DSP_REVERB_COMB_COUNT;
+      for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_17; __pyx_t_10+=1) {
+        __pyx_v_index = __pyx_t_10;
+
+        /* "mpfmc/core/audio/track.pyx":623
+ *             total_length = 0
+ *             for index in range(DSP_REVERB_COMB_COUNT):
+ *                 insert.reverb.comb_lengths[index] = max(1, REVERB_COMB_TUNINGS[index] * sample_rate // 44100)             # <<<<<<<<<<<<<<
+ *                 total_length += insert.reverb.comb_lengths[index]
+ *             for index in range(DSP_REVERB_ALLPASS_COUNT):
+ */
+        __pyx_t_11 = __Pyx_GetModuleGlobalName(__pyx_n_s_REVERB_COMB_TUNINGS); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 623, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_11);
+        __pyx_t_5 = __Pyx_GetItemInt(__pyx_t_11, __pyx_v_index, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 623, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+        __pyx_t_11 = __Pyx_PyInt_From_int(__pyx_v_sample_rate); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 623, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_11);
+        __pyx_t_6 = PyNumber_Multiply(__pyx_t_5, __pyx_t_11); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 623, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+        __pyx_t_11 = __Pyx_PyInt_FloorDivideObjC(__pyx_t_6, __pyx_int_44100, 0xAC44, 0); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 623, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_11);
+        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+        __pyx_t_18 = 1;
+        __pyx_t_5 = __Pyx_PyInt_From_long(__pyx_t_18); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 623, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        __pyx_t_4 = PyObject_RichCompare(__pyx_t_11, __pyx_t_5, Py_GT); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 623, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 623, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (__pyx_t_2) {
+          __Pyx_INCREF(__pyx_t_11);
+          __pyx_t_6 = __pyx_t_11;
+        } else {
+          __pyx_t_4 = __Pyx_PyInt_From_long(__pyx_t_18); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 623, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_4);
+          __pyx_t_6 = __pyx_t_4;
+          __pyx_t_4 = 0;
+        }
+        __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+        __pyx_t_19 = __Pyx_PyInt_As_Uint32(__pyx_t_6); if (unlikely((__pyx_t_19 == ((Uint32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 623, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+        (__pyx_v_insert->reverb.comb_lengths[__pyx_v_index]) = __pyx_t_19;
 
-static PyObject *__pyx_getprop_5mpfmc_4core_5audio_5track_5Track_number(PyObject *o, CYTHON_UNUSED void *x) {
-  return __pyx_pw_5mpfmc_4core_5audio_5track_5Track_6number_1__get__(o);
-}
+        /* "mpfmc/core/audio/track.pyx":624
+ *             for index in range(DSP_REVERB_COMB_COUNT):
+ *                 insert.reverb.comb_lengths[index] = max(1, REVERB_COMB_TUNINGS[index] * sample_rate // 44100)
+ *                 total_length += insert.reverb.comb_lengths[index]             # <<<<<<<<<<<<<<
+ *             for index in range(DSP_REVERB_ALLPASS_COUNT):
+ *                 insert.reverb.allpass_lengths[index] = max(1, REVERB_ALLPASS_TUNINGS[index] * sample_rate // 44100)
+ */
+        __pyx_v_total_length = (__pyx_v_total_length + (__pyx_v_insert->reverb.comb_lengths[__pyx_v_index]));
+      }
 
-static PyObject *__pyx_getprop_5mpfmc_4core_5audio_5track_5Track_events_when_stopped(PyObject *o, CYTHON_UNUSED void *x) {
-  return __pyx_pw_5mpfmc_4core_5audio_5track_5Track_19events_when_stopped_1__get__(o);
-}
+      /* "mpfmc/core/audio/track.pyx":625
+ *                 insert.reverb.comb_lengths[index] = max(1, REVERB_COMB_TUNINGS[index] * sample_rate // 44100)
+ *                 total_length += insert.reverb.comb_lengths[index]
+ *             for index in range(DSP_REVERB_ALLPASS_COUNT):             # <<<<<<<<<<<<<<
+ *                 insert.reverb.allpass_lengths[index] = max(1, REVERB_ALLPASS_TUNINGS[index] * sample_rate // 44100)
+ *                 total_length += insert.reverb.allpass_lengths[index]
+ */
+      __pyx_t_17 = __pyx_e_5mpfmc_4core_5audio_3dsp_DSP_REVERB_ALLPASS_COUNT;
+      for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_17; __pyx_t_10+=1) {
+        __pyx_v_index = __pyx_t_10;
 
-static int __pyx_setprop_5mpfmc_4core_5audio_5track_5Track_events_when_stopped(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
-  if (v) {
-    return __pyx_pw_5mpfmc_4core_5audio_5track_5Track_19events_when_stopped_3__set__(o, v);
-  }
-  else {
-    PyErr_SetString(PyExc_NotImplementedError, "__del__");
-    return -1;
-  }
-}
-
-static PyObject *__pyx_getprop_5mpfmc_4core_5audio_5track_5Track_events_when_played(PyObject *o, CYTHON_UNUSED void *x) {
-  return __pyx_pw_5mpfmc_4core_5audio_5track_5Track_18events_when_played_1__get__(o);
-}
-
-static int __pyx_setprop_5mpfmc_4core_5audio_5track_5Track_events_when_played(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
-  if (v) {
-    return __pyx_pw_5mpfmc_4core_5audio_5track_5Track_18events_when_played_3__set__(o, v);
-  }
-  else {
-    PyErr_SetString(PyExc_NotImplementedError, "__del__");
-    return -1;
-  }
-}
-
-static PyObject *__pyx_getprop_5mpfmc_4core_5audio_5track_5Track_events_when_paused(PyObject *o, CYTHON_UNUSED void *x) {
-  return __pyx_pw_5mpfmc_4core_5audio_5track_5Track_18events_when_paused_1__get__(o);
-}
-
-static int __pyx_setprop_5mpfmc_4core_5audio_5track_5Track_events_when_paused(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
-  if (v) {
-    return __pyx_pw_5mpfmc_4core_5audio_5track_5Track_18events_when_paused_3__set__(o, v);
-  }
-  else {
-    PyErr_SetString(PyExc_NotImplementedError, "__del__");
-    return -1;
-  }
-}
+        /* "mpfmc/core/audio/track.pyx":626
+ *                 total_length += insert.reverb.comb_lengths[index]
+ *             for index in range(DSP_REVERB_ALLPASS_COUNT):
+ *                 insert.reverb.allpass_lengths[index] = max(1, REVERB_ALLPASS_TUNINGS[index] * sample_rate // 44100)             # <<<<<<<<<<<<<<
+ *                 total_length += insert.reverb.allpass_lengths[index]
+ * 
+ */
+        __pyx_t_6 = __Pyx_GetModuleGlobalName(__pyx_n_s_REVERB_ALLPASS_TUNINGS); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 626, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        __pyx_t_11 = __Pyx_GetItemInt(__pyx_t_6, __pyx_v_index, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 626, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_11);
+        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+        __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_sample_rate); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 626, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        __pyx_t_4 = PyNumber_Multiply(__pyx_t_11, __pyx_t_6); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 626, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+        __pyx_t_6 = __Pyx_PyInt_FloorDivideObjC(__pyx_t_4, __pyx_int_44100, 0xAC44, 0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 626, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __pyx_t_18 = 1;
+        __pyx_t_11 = __Pyx_PyInt_From_long(__pyx_t_18); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 626, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_11);
+        __pyx_t_5 = PyObject_RichCompare(__pyx_t_6, __pyx_t_11, Py_GT); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 626, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+        __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 626, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+        if (__pyx_t_2) {
+          __Pyx_INCREF(__pyx_t_6);
+          __pyx_t_4 = __pyx_t_6;
+        } else {
+          __pyx_t_5 = __Pyx_PyInt_From_long(__pyx_t_18); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 626, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_5);
+          __pyx_t_4 = __pyx_t_5;
+          __pyx_t_5 = 0;
+        }
+        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+        __pyx_t_19 = __Pyx_PyInt_As_Uint32(__pyx_t_4); if (unlikely((__pyx_t_19 == ((Uint32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 626, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        (__pyx_v_insert->reverb.allpass_lengths[__pyx_v_index]) = __pyx_t_19;
 
-static PyObject *__pyx_getprop_5mpfmc_4core_5audio_5track_5Track_supports_in_memory_sounds(PyObject *o, CYTHON_UNUSED void *x) {
-  return __pyx_pw_5mpfmc_4core_5audio_5track_5Track_25supports_in_memory_sounds_1__get__(o);
-}
+        /* "mpfmc/core/audio/track.pyx":627
+ *             for index in range(DSP_REVERB_ALLPASS_COUNT):
+ *                 insert.reverb.allpass_lengths[index] = max(1, REVERB_ALLPASS_TUNINGS[index] * sample_rate // 44100)
+ *                 total_length += insert.reverb.allpass_lengths[index]             # <<<<<<<<<<<<<<
+ * 
+ *             insert.reverb.delay_memory = <float*>PyMem_Malloc(total_length * sizeof(float))
+ */
+        __pyx_v_total_length = (__pyx_v_total_length + (__pyx_v_insert->reverb.allpass_lengths[__pyx_v_index]));
+      }
 
-static PyObject *__pyx_getprop_5mpfmc_4core_5audio_5track_5Track_supports_streaming_sounds(PyObject *o, CYTHON_UNUSED void *x) {
-  return __pyx_pw_5mpfmc_4core_5audio_5track_5Track_25supports_streaming_sounds_1__get__(o);
-}
+      /* "mpfmc/core/audio/track.pyx":629
+ *                 total_length += insert.reverb.allpass_lengths[index]
+ * 
+ *             insert.reverb.delay_memory = <float*>PyMem_Malloc(total_length * sizeof(float))             # <<<<<<<<<<<<<<
+ *             if insert.reverb.delay_memory == NULL:
+ *                 free_dsp_chain(chain)
+ */
+      __pyx_v_insert->reverb.delay_memory = ((float *)PyMem_Malloc((__pyx_v_total_length * (sizeof(float)))));
 
-static PyObject *__pyx_getprop_5mpfmc_4core_5audio_5track_5Track_fading(PyObject *o, CYTHON_UNUSED void *x) {
-  return __pyx_pw_5mpfmc_4core_5audio_5track_5Track_6fading_1__get__(o);
-}
+      /* "mpfmc/core/audio/track.pyx":630
+ * 
+ *             insert.reverb.delay_memory = <float*>PyMem_Malloc(total_length * sizeof(float))
+ *             if insert.reverb.delay_memory == NULL:             # <<<<<<<<<<<<<<
+ *                 free_dsp_chain(chain)
+ *                 raise MemoryError()
+ */
+      __pyx_t_2 = ((__pyx_v_insert->reverb.delay_memory == NULL) != 0);
+      if (__pyx_t_2) {
 
-static PyMethodDef __pyx_methods_5mpfmc_4core_5audio_5track_Track[] = {
-  {"clear_context", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_5track_5Track_9clear_context, METH_O, __pyx_doc_5mpfmc_4core_5audio_5track_5Track_8clear_context},
-  {"set_volume", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_5track_5Track_11set_volume, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5mpfmc_4core_5audio_5track_5Track_10set_volume},
-  {"play", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_5track_5Track_13play, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5mpfmc_4core_5audio_5track_5Track_12play},
-  {"stop", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_5track_5Track_15stop, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5mpfmc_4core_5audio_5track_5Track_14stop},
-  {"pause", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_5track_5Track_17pause, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5mpfmc_4core_5audio_5track_5Track_16pause},
-  {"stop_all_sounds", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_5track_5Track_19stop_all_sounds, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5mpfmc_4core_5audio_5track_5Track_18stop_all_sounds},
-  {"process", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_5track_5Track_21process, METH_NOARGS, __pyx_doc_5mpfmc_4core_5audio_5track_5Track_20process},
-  {"__reduce_cython__", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_5track_5Track_23__reduce_cython__, METH_NOARGS, __pyx_doc_5mpfmc_4core_5audio_5track_5Track_22__reduce_cython__},
-  {"__setstate_cython__", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_5track_5Track_25__setstate_cython__, METH_O, __pyx_doc_5mpfmc_4core_5audio_5track_5Track_24__setstate_cython__},
-  {0, 0, 0, 0}
-};
+        /* "mpfmc/core/audio/track.pyx":631
+ *             insert.reverb.delay_memory = <float*>PyMem_Malloc(total_length * sizeof(float))
+ *             if insert.reverb.delay_memory == NULL:
+ *                 free_dsp_chain(chain)             # <<<<<<<<<<<<<<
+ *                 raise MemoryError()
+ *             memset(insert.reverb.delay_memory, 0, total_length * sizeof(float))
+ */
+        __pyx_f_5mpfmc_4core_5audio_5track_free_dsp_chain(__pyx_v_chain);
 
-static struct PyGetSetDef __pyx_getsets_5mpfmc_4core_5audio_5track_Track[] = {
-  {(char *)"name", __pyx_getprop_5mpfmc_4core_5audio_5track_5Track_name, 0, (char *)0, 0},
-  {(char *)"volume", __pyx_getprop_5mpfmc_4core_5audio_5track_5Track_volume, 0, (char *)0, 0},
-  {(char *)"type", __pyx_getprop_5mpfmc_4core_5audio_5track_5Track_type, 0, (char *)0, 0},
-  {(char *)"number", __pyx_getprop_5mpfmc_4core_5audio_5track_5Track_number, 0, (char *)"Return the track number", 0},
-  {(char *)"events_when_stopped", __pyx_getprop_5mpfmc_4core_5audio_5track_5Track_events_when_stopped, __pyx_setprop_5mpfmc_4core_5audio_5track_5Track_events_when_stopped, (char *)"Return the list of events that are posted when the track is stopped", 0},
-  {(char *)"events_when_played", __pyx_getprop_5mpfmc_4core_5audio_5track_5Track_events_when_played, __pyx_setprop_5mpfmc_4core_5audio_5track_5Track_events_when_played, (char *)"Return the list of events that are posted when the track is played", 0},
-  {(char *)"events_when_paused", __pyx_getprop_5mpfmc_4core_5audio_5track_5Track_events_when_paused, __pyx_setprop_5mpfmc_4core_5audio_5track_5Track_events_when_paused, (char *)"Return the list of events that are posted when the track is paused", 0},
-  {(char *)"supports_in_memory_sounds", __pyx_getprop_5mpfmc_4core_5audio_5track_5Track_supports_in_memory_sounds, 0, (char *)"Return whether or not track supports in-memory sounds", 0},
-  {(char *)"supports_streaming_sounds", __pyx_getprop_5mpfmc_4core_5audio_5track_5Track_supports_streaming_sounds, 0, (char *)"Return whether or not track supports streaming sounds", 0},
-  {(char *)"fading", __pyx_getprop_5mpfmc_4core_5audio_5track_5Track_fading, 0, (char *)"Return whether or not the track is currently fading", 0},
-  {0, 0, 0, 0, 0}
-};
+        /* "mpfmc/core/audio/track.pyx":632
+ *             if insert.reverb.delay_memory == NULL:
+ *                 free_dsp_chain(chain)
+ *                 raise MemoryError()             # <<<<<<<<<<<<<<
+ *             memset(insert.reverb.delay_memory, 0, total_length * sizeof(float))
+ * 
+ */
+        PyErr_NoMemory(); __PYX_ERR(0, 632, __pyx_L1_error)
 
-static PyTypeObject __pyx_type_5mpfmc_4core_5audio_5track_Track = {
-  PyVarObject_HEAD_INIT(0, 0)
-  "mpfmc.core.audio.track.Track", /*tp_name*/
-  sizeof(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_5mpfmc_4core_5audio_5track_Track, /*tp_dealloc*/
-  0, /*tp_print*/
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*tp_compare*/
-  #endif
-  #if PY_MAJOR_VERSION >= 3
-  0, /*tp_as_async*/
-  #endif
-  __pyx_pw_5mpfmc_4core_5audio_5track_5Track_7__repr__, /*tp_repr*/
-  0, /*tp_as_number*/
-  0, /*tp_as_sequence*/
-  0, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  0, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
-  "Track(mc, audio_callback_data, unicode name, int track_num, int buffer_size, float volume=1.0)\n\n    Track base class\n    ", /*tp_doc*/
-  __pyx_tp_traverse_5mpfmc_4core_5audio_5track_Track, /*tp_traverse*/
-  __pyx_tp_clear_5mpfmc_4core_5audio_5track_Track, /*tp_clear*/
-  0, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  0, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_5mpfmc_4core_5audio_5track_Track, /*tp_methods*/
-  0, /*tp_members*/
-  __pyx_getsets_5mpfmc_4core_5audio_5track_Track, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  0, /*tp_dictoffset*/
-  __pyx_pw_5mpfmc_4core_5audio_5track_5Track_3__init__, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_5mpfmc_4core_5audio_5track_Track, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-  0, /*tp_del*/
-  0, /*tp_version_tag*/
-  #if PY_VERSION_HEX >= 0x030400a1
-  0, /*tp_finalize*/
-  #endif
-};
+        /* "mpfmc/core/audio/track.pyx":630
+ * 
+ *             insert.reverb.delay_memory = <float*>PyMem_Malloc(total_length * sizeof(float))
+ *             if insert.reverb.delay_memory == NULL:             # <<<<<<<<<<<<<<
+ *                 free_dsp_chain(chain)
+ *                 raise MemoryError()
+ */
+      }
 
-static PyMethodDef __pyx_methods[] = {
-  {0, 0, 0, 0}
-};
+      /* "mpfmc/core/audio/track.pyx":633
+ *                 free_dsp_chain(chain)
+ *                 raise MemoryError()
+ *             memset(insert.reverb.delay_memory, 0, total_length * sizeof(float))             # <<<<<<<<<<<<<<
+ * 
+ *             delay = 0
+ */
+      memset(__pyx_v_insert->reverb.delay_memory, 0, (__pyx_v_total_length * (sizeof(float))));
 
-#if PY_MAJOR_VERSION >= 3
-#if CYTHON_PEP489_MULTI_PHASE_INIT
-static PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def); /*proto*/
-static int __pyx_pymod_exec_track(PyObject* module); /*proto*/
-static PyModuleDef_Slot __pyx_moduledef_slots[] = {
-  {Py_mod_create, (void*)__pyx_pymod_create},
-  {Py_mod_exec, (void*)__pyx_pymod_exec_track},
-  {0, NULL}
-};
-#endif
+      /* "mpfmc/core/audio/track.pyx":635
+ *             memset(insert.reverb.delay_memory, 0, total_length * sizeof(float))
+ * 
+ *             delay = 0             # <<<<<<<<<<<<<<
+ *             for index in range(DSP_REVERB_COMB_COUNT):
+ *                 insert.reverb.comb_buffers[index] = insert.reverb.delay_memory + delay
+ */
+      __pyx_v_delay = 0;
 
-static struct PyModuleDef __pyx_moduledef = {
-    PyModuleDef_HEAD_INIT,
-    "track",
-    0, /* m_doc */
-  #if CYTHON_PEP489_MULTI_PHASE_INIT
-    0, /* m_size */
-  #else
-    -1, /* m_size */
-  #endif
-    __pyx_methods /* m_methods */,
-  #if CYTHON_PEP489_MULTI_PHASE_INIT
-    __pyx_moduledef_slots, /* m_slots */
-  #else
-    NULL, /* m_reload */
-  #endif
-    NULL, /* m_traverse */
-    NULL, /* m_clear */
-    NULL /* m_free */
-};
-#endif
+      /* "mpfmc/core/audio/track.pyx":636
+ * 
+ *             delay = 0
+ *             for index in range(DSP_REVERB_COMB_COUNT):             # <<<<<<<<<<<<<<
+ *                 insert.reverb.comb_buffers[index] = insert.reverb.delay_memory + delay
+ *                 delay += insert.reverb.comb_lengths[index]
+ */
+      __pyx_t_17 = __pyx_e_5mpfmc_4core_5audio_3dsp_DSP_REVERB_COMB_COUNT;
+      for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_17; __pyx_t_10+=1) {
+        __pyx_v_index = __pyx_t_10;
 
-static __Pyx_StringTabEntry __pyx_string_tab[] = {
-  {&__pyx_kp_u_Allocated_track_audio_buffer_d_b, __pyx_k_Allocated_track_audio_buffer_d_b, sizeof(__pyx_k_Allocated_track_audio_buffer_d_b), 0, 1, 0, 0},
-  {&__pyx_kp_u_Must_be_overridden_in_derived_cl, __pyx_k_Must_be_overridden_in_derived_cl, sizeof(__pyx_k_Must_be_overridden_in_derived_cl), 0, 1, 0, 0},
-  {&__pyx_n_s_NotImplementedError, __pyx_k_NotImplementedError, sizeof(__pyx_k_NotImplementedError), 0, 0, 1, 1},
-  {&__pyx_n_u_Track, __pyx_k_Track, sizeof(__pyx_k_Track), 0, 1, 0, 1},
-  {&__pyx_kp_u_Track_2, __pyx_k_Track_2, sizeof(__pyx_k_Track_2), 0, 1, 0, 0},
-  {&__pyx_n_s_TypeError, __pyx_k_TypeError, sizeof(__pyx_k_TypeError), 0, 0, 1, 1},
-  {&__pyx_n_s_audio_callback_data, __pyx_k_audio_callback_data, sizeof(__pyx_k_audio_callback_data), 0, 0, 1, 1},
-  {&__pyx_n_s_buffer_size, __pyx_k_buffer_size, sizeof(__pyx_k_buffer_size), 0, 0, 1, 1},
-  {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
-  {&__pyx_n_s_debug, __pyx_k_debug, sizeof(__pyx_k_debug), 0, 0, 1, 1},
-  {&__pyx_n_s_events_when_played, __pyx_k_events_when_played, sizeof(__pyx_k_events_when_played), 0, 0, 1, 1},
-  {&__pyx_n_s_fade_in_seconds, __pyx_k_fade_in_seconds, sizeof(__pyx_k_fade_in_seconds), 0, 0, 1, 1},
-  {&__pyx_n_s_fade_out_seconds, __pyx_k_fade_out_seconds, sizeof(__pyx_k_fade_out_seconds), 0, 0, 1, 1},
-  {&__pyx_n_s_fade_seconds, __pyx_k_fade_seconds, sizeof(__pyx_k_fade_seconds), 0, 0, 1, 1},
-  {&__pyx_n_s_format, __pyx_k_format, sizeof(__pyx_k_format), 0, 0, 1, 1},
-  {&__pyx_n_s_getLogger, __pyx_k_getLogger, sizeof(__pyx_k_getLogger), 0, 0, 1, 1},
-  {&__pyx_n_s_getstate, __pyx_k_getstate, sizeof(__pyx_k_getstate), 0, 0, 1, 1},
-  {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
-  {&__pyx_n_s_logging, __pyx_k_logging, sizeof(__pyx_k_logging), 0, 0, 1, 1},
-  {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
-  {&__pyx_n_s_mc, __pyx_k_mc, sizeof(__pyx_k_mc), 0, 0, 1, 1},
-  {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
-  {&__pyx_n_s_name_2, __pyx_k_name_2, sizeof(__pyx_k_name_2), 0, 0, 1, 1},
-  {&__pyx_kp_s_no_default___reduce___due_to_non, __pyx_k_no_default___reduce___due_to_non, sizeof(__pyx_k_no_default___reduce___due_to_non), 0, 0, 1, 0},
-  {&__pyx_n_s_number, __pyx_k_number, sizeof(__pyx_k_number), 0, 0, 1, 1},
-  {&__pyx_kp_u_pause_Action_may_only_be_used_wh, __pyx_k_pause_Action_may_only_be_used_wh, sizeof(__pyx_k_pause_Action_may_only_be_used_wh), 0, 1, 0, 0},
-  {&__pyx_kp_u_pause_Applying_s_second_fade_out, __pyx_k_pause_Applying_s_second_fade_out, sizeof(__pyx_k_pause_Applying_s_second_fade_out), 0, 1, 0, 0},
-  {&__pyx_kp_u_pause_Pause_sound_processing_on, __pyx_k_pause_Pause_sound_processing_on, sizeof(__pyx_k_pause_Pause_sound_processing_on), 0, 1, 0, 0},
-  {&__pyx_kp_u_play_Action_may_only_be_used_whe, __pyx_k_play_Action_may_only_be_used_whe, sizeof(__pyx_k_play_Action_may_only_be_used_whe), 0, 1, 0, 0},
-  {&__pyx_kp_u_play_Applying_s_second_fade_in, __pyx_k_play_Applying_s_second_fade_in, sizeof(__pyx_k_play_Applying_s_second_fade_in), 0, 1, 0, 0},
-  {&__pyx_kp_u_play_Begin_sound_processing_on_t, __pyx_k_play_Begin_sound_processing_on_t, sizeof(__pyx_k_play_Begin_sound_processing_on_t), 0, 1, 0, 0},
-  {&__pyx_n_s_post_mc_native_event, __pyx_k_post_mc_native_event, sizeof(__pyx_k_post_mc_native_event), 0, 0, 1, 1},
-  {&__pyx_n_s_pyx_vtable, __pyx_k_pyx_vtable, sizeof(__pyx_k_pyx_vtable), 0, 0, 1, 1},
-  {&__pyx_n_s_reduce, __pyx_k_reduce, sizeof(__pyx_k_reduce), 0, 0, 1, 1},
-  {&__pyx_n_s_reduce_cython, __pyx_k_reduce_cython, sizeof(__pyx_k_reduce_cython), 0, 0, 1, 1},
-  {&__pyx_n_s_reduce_ex, __pyx_k_reduce_ex, sizeof(__pyx_k_reduce_ex), 0, 0, 1, 1},
-  {&__pyx_n_s_round, __pyx_k_round, sizeof(__pyx_k_round), 0, 0, 1, 1},
-  {&__pyx_kp_u_set_volume_Applying_s_second_fad, __pyx_k_set_volume_Applying_s_second_fad, sizeof(__pyx_k_set_volume_Applying_s_second_fad), 0, 1, 0, 0},
-  {&__pyx_kp_u_set_volume_Interrupting_an_exist, __pyx_k_set_volume_Interrupting_an_exist, sizeof(__pyx_k_set_volume_Interrupting_an_exist), 0, 1, 0, 0},
-  {&__pyx_n_s_setstate, __pyx_k_setstate, sizeof(__pyx_k_setstate), 0, 0, 1, 1},
-  {&__pyx_n_s_setstate_cython, __pyx_k_setstate_cython, sizeof(__pyx_k_setstate_cython), 0, 0, 1, 1},
-  {&__pyx_kp_u_stop_Action_may_only_be_used_whe, __pyx_k_stop_Action_may_only_be_used_whe, sizeof(__pyx_k_stop_Action_may_only_be_used_whe), 0, 1, 0, 0},
-  {&__pyx_kp_u_stop_Applying_s_second_fade_out, __pyx_k_stop_Applying_s_second_fade_out, sizeof(__pyx_k_stop_Applying_s_second_fade_out), 0, 1, 0, 0},
-  {&__pyx_kp_u_stop_Stop_sound_processing_on_tr, __pyx_k_stop_Stop_sound_processing_on_tr, sizeof(__pyx_k_stop_Stop_sound_processing_on_tr), 0, 1, 0, 0},
-  {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
-  {&__pyx_n_s_track, __pyx_k_track, sizeof(__pyx_k_track), 0, 0, 1, 1},
-  {&__pyx_n_s_track_num, __pyx_k_track_num, sizeof(__pyx_k_track_num), 0, 0, 1, 1},
-  {&__pyx_n_s_volume, __pyx_k_volume, sizeof(__pyx_k_volume), 0, 0, 1, 1},
-  {&__pyx_n_s_warning, __pyx_k_warning, sizeof(__pyx_k_warning), 0, 0, 1, 1},
-  {0, 0, 0, 0, 0, 0, 0}
-};
-static int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_round = __Pyx_GetBuiltinName(__pyx_n_s_round); if (!__pyx_builtin_round) __PYX_ERR(0, 92, __pyx_L1_error)
-  __pyx_builtin_NotImplementedError = __Pyx_GetBuiltinName(__pyx_n_s_NotImplementedError); if (!__pyx_builtin_NotImplementedError) __PYX_ERR(0, 96, __pyx_L1_error)
-  __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(1, 2, __pyx_L1_error)
-  return 0;
-  __pyx_L1_error:;
-  return -1;
-}
+        /* "mpfmc/core/audio/track.pyx":637
+ *             delay = 0
+ *             for index in range(DSP_REVERB_COMB_COUNT):
+ *                 insert.reverb.comb_buffers[index] = insert.reverb.delay_memory + delay             # <<<<<<<<<<<<<<
+ *                 delay += insert.reverb.comb_lengths[index]
+ *             for index in range(DSP_REVERB_ALLPASS_COUNT):
+ */
+        (__pyx_v_insert->reverb.comb_buffers[__pyx_v_index]) = (__pyx_v_insert->reverb.delay_memory + __pyx_v_delay);
 
-static int __Pyx_InitCachedConstants(void) {
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
+        /* "mpfmc/core/audio/track.pyx":638
+ *             for index in range(DSP_REVERB_COMB_COUNT):
+ *                 insert.reverb.comb_buffers[index] = insert.reverb.delay_memory + delay
+ *                 delay += insert.reverb.comb_lengths[index]             # <<<<<<<<<<<<<<
+ *             for index in range(DSP_REVERB_ALLPASS_COUNT):
+ *                 insert.reverb.allpass_buffers[index] = insert.reverb.delay_memory + delay
+ */
+        __pyx_v_delay = (__pyx_v_delay + (__pyx_v_insert->reverb.comb_lengths[__pyx_v_index]));
+      }
 
-  /* "mpfmc/core/audio/track.pyx":39
- *             volume: The track volume (0.0 to 1.0)
- *         """
- *         self.log = logging.getLogger("Track")             # <<<<<<<<<<<<<<
- *         self.mc = mc
- *         self._name = name
+      /* "mpfmc/core/audio/track.pyx":639
+ *                 insert.reverb.comb_buffers[index] = insert.reverb.delay_memory + delay
+ *                 delay += insert.reverb.comb_lengths[index]
+ *             for index in range(DSP_REVERB_ALLPASS_COUNT):             # <<<<<<<<<<<<<<
+ *                 insert.reverb.allpass_buffers[index] = insert.reverb.delay_memory + delay
+ *                 delay += insert.reverb.allpass_lengths[index]
  */
-  __pyx_tuple_ = PyTuple_Pack(1, __pyx_n_u_Track); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 39, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple_);
-  __Pyx_GIVEREF(__pyx_tuple_);
+      __pyx_t_17 = __pyx_e_5mpfmc_4core_5audio_3dsp_DSP_REVERB_ALLPASS_COUNT;
+      for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_17; __pyx_t_10+=1) {
+        __pyx_v_index = __pyx_t_10;
 
-  /* "mpfmc/core/audio/track.pyx":96
- *     @property
- *     def type(self):
- *         raise NotImplementedError('Must be overridden in derived class')             # <<<<<<<<<<<<<<
+        /* "mpfmc/core/audio/track.pyx":640
+ *                 delay += insert.reverb.comb_lengths[index]
+ *             for index in range(DSP_REVERB_ALLPASS_COUNT):
+ *                 insert.reverb.allpass_buffers[index] = insert.reverb.delay_memory + delay             # <<<<<<<<<<<<<<
+ *                 delay += insert.reverb.allpass_lengths[index]
  * 
- *     @property
  */
-  __pyx_tuple__2 = PyTuple_Pack(1, __pyx_kp_u_Must_be_overridden_in_derived_cl); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(0, 96, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__2);
-  __Pyx_GIVEREF(__pyx_tuple__2);
+        (__pyx_v_insert->reverb.allpass_buffers[__pyx_v_index]) = (__pyx_v_insert->reverb.delay_memory + __pyx_v_delay);
 
-  /* "mpfmc/core/audio/track.pyx":141
- *     def supports_in_memory_sounds(self):
- *         """Return whether or not track supports in-memory sounds"""
- *         raise NotImplementedError('Must be overridden in derived class')             # <<<<<<<<<<<<<<
+        /* "mpfmc/core/audio/track.pyx":641
+ *             for index in range(DSP_REVERB_ALLPASS_COUNT):
+ *                 insert.reverb.allpass_buffers[index] = insert.reverb.delay_memory + delay
+ *                 delay += insert.reverb.allpass_lengths[index]             # <<<<<<<<<<<<<<
  * 
- *     @property
+ *             # The tail lasts until the longest comb filter has decayed by 60 dB
  */
-  __pyx_tuple__3 = PyTuple_Pack(1, __pyx_kp_u_Must_be_overridden_in_derived_cl); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(0, 141, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__3);
-  __Pyx_GIVEREF(__pyx_tuple__3);
+        __pyx_v_delay = (__pyx_v_delay + (__pyx_v_insert->reverb.allpass_lengths[__pyx_v_index]));
+      }
 
-  /* "mpfmc/core/audio/track.pyx":146
- *     def supports_streaming_sounds(self):
- *         """Return whether or not track supports streaming sounds"""
- *         raise NotImplementedError('Must be overridden in derived class')             # <<<<<<<<<<<<<<
+      /* "mpfmc/core/audio/track.pyx":644
+ * 
+ *             # The tail lasts until the longest comb filter has decayed by 60 dB
+ *             longest_comb = 0             # <<<<<<<<<<<<<<
+ *             for index in range(DSP_REVERB_COMB_COUNT):
+ *                 longest_comb = max(longest_comb, insert.reverb.comb_lengths[index])
+ */
+      __pyx_v_longest_comb = 0;
+
+      /* "mpfmc/core/audio/track.pyx":645
+ *             # The tail lasts until the longest comb filter has decayed by 60 dB
+ *             longest_comb = 0
+ *             for index in range(DSP_REVERB_COMB_COUNT):             # <<<<<<<<<<<<<<
+ *                 longest_comb = max(longest_comb, insert.reverb.comb_lengths[index])
+ *             chain.tail_frames += <Uint32>ceil(longest_comb * 3.0 / -log10(insert.reverb.feedback))
+ */
+      __pyx_t_17 = __pyx_e_5mpfmc_4core_5audio_3dsp_DSP_REVERB_COMB_COUNT;
+      for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_17; __pyx_t_10+=1) {
+        __pyx_v_index = __pyx_t_10;
+
+        /* "mpfmc/core/audio/track.pyx":646
+ *             longest_comb = 0
+ *             for index in range(DSP_REVERB_COMB_COUNT):
+ *                 longest_comb = max(longest_comb, insert.reverb.comb_lengths[index])             # <<<<<<<<<<<<<<
+ *             chain.tail_frames += <Uint32>ceil(longest_comb * 3.0 / -log10(insert.reverb.feedback))
+ *             for index in range(DSP_REVERB_ALLPASS_COUNT):
+ */
+        __pyx_t_19 = (__pyx_v_insert->reverb.comb_lengths[__pyx_v_index]);
+        __pyx_t_20 = __pyx_v_longest_comb;
+        if (((__pyx_t_19 > __pyx_t_20) != 0)) {
+          __pyx_t_21 = __pyx_t_19;
+        } else {
+          __pyx_t_21 = __pyx_t_20;
+        }
+        __pyx_v_longest_comb = __pyx_t_21;
+      }
+
+      /* "mpfmc/core/audio/track.pyx":647
+ *             for index in range(DSP_REVERB_COMB_COUNT):
+ *                 longest_comb = max(longest_comb, insert.reverb.comb_lengths[index])
+ *             chain.tail_frames += <Uint32>ceil(longest_comb * 3.0 / -log10(insert.reverb.feedback))             # <<<<<<<<<<<<<<
+ *             for index in range(DSP_REVERB_ALLPASS_COUNT):
+ *                 chain.tail_frames += insert.reverb.allpass_lengths[index]
+ */
+      __pyx_t_6 = __Pyx_GetModuleGlobalName(__pyx_n_s_ceil); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 647, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_t_5 = PyFloat_FromDouble((__pyx_v_longest_comb * 3.0)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 647, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_7 = __Pyx_GetModuleGlobalName(__pyx_n_s_log10); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 647, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      __pyx_t_8 = PyFloat_FromDouble(__pyx_v_insert->reverb.feedback); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 647, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __pyx_t_9 = NULL;
+      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_7))) {
+        __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_7);
+        if (likely(__pyx_t_9)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_7);
+          __Pyx_INCREF(__pyx_t_9);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_7, function);
+        }
+      }
+      if (!__pyx_t_9) {
+        __pyx_t_11 = __Pyx_PyObject_CallOneArg(__pyx_t_7, __pyx_t_8); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 647, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __Pyx_GOTREF(__pyx_t_11);
+      } else {
+        #if CYTHON_FAST_PYCALL
+        if (PyFunction_Check(__pyx_t_7)) {
+          PyObject *__pyx_temp[2] = {__pyx_t_9, __pyx_t_8};
+          __pyx_t_11 = __Pyx_PyFunction_FastCall(__pyx_t_7, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 647, __pyx_L1_error)
+          __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+          __Pyx_GOTREF(__pyx_t_11);
+          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        } else
+        #endif
+        #if CYTHON_FAST_PYCCALL
+        if (__Pyx_PyFastCFunction_Check(__pyx_t_7)) {
+          PyObject *__pyx_temp[2] = {__pyx_t_9, __pyx_t_8};
+          __pyx_t_11 = __Pyx_PyCFunction_FastCall(__pyx_t_7, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 647, __pyx_L1_error)
+          __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+          __Pyx_GOTREF(__pyx_t_11);
+          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        } else
+        #endif
+        {
+          __pyx_t_22 = PyTuple_New(1+1); if (unlikely(!__pyx_t_22)) __PYX_ERR(0, 647, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_22);
+          __Pyx_GIVEREF(__pyx_t_9); PyTuple_SET_ITEM(__pyx_t_22, 0, __pyx_t_9); __pyx_t_9 = NULL;
+          __Pyx_GIVEREF(__pyx_t_8);
+          PyTuple_SET_ITEM(__pyx_t_22, 0+1, __pyx_t_8);
+          __pyx_t_8 = 0;
+          __pyx_t_11 = __Pyx_PyObject_Call(__pyx_t_7, __pyx_t_22, NULL); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 647, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_11);
+          __Pyx_DECREF(__pyx_t_22); __pyx_t_22 = 0;
+        }
+      }
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __pyx_t_7 = PyNumber_Negative(__pyx_t_11); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 647, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+      __pyx_t_11 = __Pyx_PyNumber_Divide(__pyx_t_5, __pyx_t_7); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 647, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_11);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __pyx_t_7 = NULL;
+      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_6))) {
+        __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_6);
+        if (likely(__pyx_t_7)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+          __Pyx_INCREF(__pyx_t_7);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_6, function);
+        }
+      }
+      if (!__pyx_t_7) {
+        __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_t_11); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 647, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+        __Pyx_GOTREF(__pyx_t_4);
+      } else {
+        #if CYTHON_FAST_PYCALL
+        if (PyFunction_Check(__pyx_t_6)) {
+          PyObject *__pyx_temp[2] = {__pyx_t_7, __pyx_t_11};
+          __pyx_t_4 = __Pyx_PyFunction_FastCall(__pyx_t_6, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 647, __pyx_L1_error)
+          __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+          __Pyx_GOTREF(__pyx_t_4);
+          __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+        } else
+        #endif
+        #if CYTHON_FAST_PYCCALL
+        if (__Pyx_PyFastCFunction_Check(__pyx_t_6)) {
+          PyObject *__pyx_temp[2] = {__pyx_t_7, __pyx_t_11};
+          __pyx_t_4 = __Pyx_PyCFunction_FastCall(__pyx_t_6, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 647, __pyx_L1_error)
+          __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+          __Pyx_GOTREF(__pyx_t_4);
+          __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+        } else
+        #endif
+        {
+          __pyx_t_5 = PyTuple_New(1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 647, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_5);
+          __Pyx_GIVEREF(__pyx_t_7); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_7); __pyx_t_7 = NULL;
+          __Pyx_GIVEREF(__pyx_t_11);
+          PyTuple_SET_ITEM(__pyx_t_5, 0+1, __pyx_t_11);
+          __pyx_t_11 = 0;
+          __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 647, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_4);
+          __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+        }
+      }
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __pyx_t_21 = __Pyx_PyInt_As_Uint32(__pyx_t_4); if (unlikely((__pyx_t_21 == ((Uint32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 647, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __pyx_v_chain->tail_frames = (__pyx_v_chain->tail_frames + ((Uint32)__pyx_t_21));
+
+      /* "mpfmc/core/audio/track.pyx":648
+ *                 longest_comb = max(longest_comb, insert.reverb.comb_lengths[index])
+ *             chain.tail_frames += <Uint32>ceil(longest_comb * 3.0 / -log10(insert.reverb.feedback))
+ *             for index in range(DSP_REVERB_ALLPASS_COUNT):             # <<<<<<<<<<<<<<
+ *                 chain.tail_frames += insert.reverb.allpass_lengths[index]
  * 
- *     @property
  */
-  __pyx_tuple__4 = PyTuple_Pack(1, __pyx_kp_u_Must_be_overridden_in_derived_cl); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(0, 146, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__4);
-  __Pyx_GIVEREF(__pyx_tuple__4);
+      __pyx_t_17 = __pyx_e_5mpfmc_4core_5audio_3dsp_DSP_REVERB_ALLPASS_COUNT;
+      for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_17; __pyx_t_10+=1) {
+        __pyx_v_index = __pyx_t_10;
 
-  /* "mpfmc/core/audio/track.pyx":160
- *     def clear_context(self, context):
- *         """Stop all sounds played from the specified context."""
- *         raise NotImplementedError('Must be overridden in derived class')             # <<<<<<<<<<<<<<
+        /* "mpfmc/core/audio/track.pyx":649
+ *             chain.tail_frames += <Uint32>ceil(longest_comb * 3.0 / -log10(insert.reverb.feedback))
+ *             for index in range(DSP_REVERB_ALLPASS_COUNT):
+ *                 chain.tail_frames += insert.reverb.allpass_lengths[index]             # <<<<<<<<<<<<<<
  * 
- *     def set_volume(self, float volume, float fade_seconds = 0.0):
+ *         else:
  */
-  __pyx_tuple__5 = PyTuple_Pack(1, __pyx_kp_u_Must_be_overridden_in_derived_cl); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(0, 160, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__5);
-  __Pyx_GIVEREF(__pyx_tuple__5);
+        __pyx_v_chain->tail_frames = (__pyx_v_chain->tail_frames + (__pyx_v_insert->reverb.allpass_lengths[__pyx_v_index]));
+      }
 
-  /* "mpfmc/core/audio/track.pyx":177
- *                 # point of the existing fade
- *                 if self.state.fade_steps_remaining > 0:
- *                     self.log.debug("set_volume - Interrupting an existing fade on this track so "             # <<<<<<<<<<<<<<
- *                                    "start a new fade")
+      /* "mpfmc/core/audio/track.pyx":613
+ *             insert.limiter.gain = 1.0
  * 
+ *         elif settings['type'] == 'reverb':             # <<<<<<<<<<<<<<
+ *             insert.type = dsp_insert_reverb
+ *             insert.reverb.feedback = settings['room_size'] * 0.28 + 0.7
  */
-  __pyx_tuple__6 = PyTuple_Pack(1, __pyx_kp_u_set_volume_Interrupting_an_exist); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(0, 177, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__6);
-  __Pyx_GIVEREF(__pyx_tuple__6);
+      goto __pyx_L7;
+    }
 
-  /* "mpfmc/core/audio/track.pyx":203
- *             fade_in_seconds: The number of seconds to fade in the track
- *         """
- *         self.log.debug("play - Begin sound processing on track")             # <<<<<<<<<<<<<<
+    /* "mpfmc/core/audio/track.pyx":652
+ * 
+ *         else:
+ *             free_dsp_chain(chain)             # <<<<<<<<<<<<<<
+ *             raise AudioException("Unknown DSP insert type '{}'".format(settings['type']))
  * 
- *         SDL_LockAudio()
  */
-  __pyx_tuple__7 = PyTuple_Pack(1, __pyx_kp_u_play_Begin_sound_processing_on_t); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(0, 203, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__7);
-  __Pyx_GIVEREF(__pyx_tuple__7);
+    /*else*/ {
+      __pyx_f_5mpfmc_4core_5audio_5track_free_dsp_chain(__pyx_v_chain);
 
-  /* "mpfmc/core/audio/track.pyx":233
- *                     self.mc.post_mc_native_event(event, track=self._name)
+      /* "mpfmc/core/audio/track.pyx":653
  *         else:
- *             self.log.warning("play - Action may only be used when a track is stopped or is in the process "             # <<<<<<<<<<<<<<
- *                              "of stopping; action will be ignored.")
+ *             free_dsp_chain(chain)
+ *             raise AudioException("Unknown DSP insert type '{}'".format(settings['type']))             # <<<<<<<<<<<<<<
  * 
+ *     return chain
  */
-  __pyx_tuple__8 = PyTuple_Pack(1, __pyx_kp_u_play_Action_may_only_be_used_whe); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(0, 233, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__8);
-  __Pyx_GIVEREF(__pyx_tuple__8);
+      __pyx_t_6 = __Pyx_GetModuleGlobalName(__pyx_n_s_AudioException); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 653, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_t_11 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Unknown_DSP_insert_type, __pyx_n_s_format); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 653, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_11);
+      __pyx_t_7 = PyObject_GetItem(__pyx_v_settings, __pyx_n_u_type); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 653, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      __pyx_t_22 = NULL;
+      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_11))) {
+        __pyx_t_22 = PyMethod_GET_SELF(__pyx_t_11);
+        if (likely(__pyx_t_22)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_11);
+          __Pyx_INCREF(__pyx_t_22);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_11, function);
+        }
+      }
+      if (!__pyx_t_22) {
+        __pyx_t_5 = __Pyx_PyObject_CallOneArg(__pyx_t_11, __pyx_t_7); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 653, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+        __Pyx_GOTREF(__pyx_t_5);
+      } else {
+        #if CYTHON_FAST_PYCALL
+        if (PyFunction_Check(__pyx_t_11)) {
+          PyObject *__pyx_temp[2] = {__pyx_t_22, __pyx_t_7};
+          __pyx_t_5 = __Pyx_PyFunction_FastCall(__pyx_t_11, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 653, __pyx_L1_error)
+          __Pyx_XDECREF(__pyx_t_22); __pyx_t_22 = 0;
+          __Pyx_GOTREF(__pyx_t_5);
+          __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+        } else
+        #endif
+        #if CYTHON_FAST_PYCCALL
+        if (__Pyx_PyFastCFunction_Check(__pyx_t_11)) {
+          PyObject *__pyx_temp[2] = {__pyx_t_22, __pyx_t_7};
+          __pyx_t_5 = __Pyx_PyCFunction_FastCall(__pyx_t_11, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 653, __pyx_L1_error)
+          __Pyx_XDECREF(__pyx_t_22); __pyx_t_22 = 0;
+          __Pyx_GOTREF(__pyx_t_5);
+          __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+        } else
+        #endif
+        {
+          __pyx_t_8 = PyTuple_New(1+1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 653, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_8);
+          __Pyx_GIVEREF(__pyx_t_22); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_22); __pyx_t_22 = NULL;
+          __Pyx_GIVEREF(__pyx_t_7);
+          PyTuple_SET_ITEM(__pyx_t_8, 0+1, __pyx_t_7);
+          __pyx_t_7 = 0;
+          __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_11, __pyx_t_8, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 653, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_5);
+          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        }
+      }
+      __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+      __pyx_t_11 = NULL;
+      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_6))) {
+        __pyx_t_11 = PyMethod_GET_SELF(__pyx_t_6);
+        if (likely(__pyx_t_11)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+          __Pyx_INCREF(__pyx_t_11);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_6, function);
+        }
+      }
+      if (!__pyx_t_11) {
+        __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 653, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __Pyx_GOTREF(__pyx_t_4);
+      } else {
+        #if CYTHON_FAST_PYCALL
+        if (PyFunction_Check(__pyx_t_6)) {
+          PyObject *__pyx_temp[2] = {__pyx_t_11, __pyx_t_5};
+          __pyx_t_4 = __Pyx_PyFunction_FastCall(__pyx_t_6, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 653, __pyx_L1_error)
+          __Pyx_XDECREF(__pyx_t_11); __pyx_t_11 = 0;
+          __Pyx_GOTREF(__pyx_t_4);
+          __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+        } else
+        #endif
+        #if CYTHON_FAST_PYCCALL
+        if (__Pyx_PyFastCFunction_Check(__pyx_t_6)) {
+          PyObject *__pyx_temp[2] = {__pyx_t_11, __pyx_t_5};
+          __pyx_t_4 = __Pyx_PyCFunction_FastCall(__pyx_t_6, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 653, __pyx_L1_error)
+          __Pyx_XDECREF(__pyx_t_11); __pyx_t_11 = 0;
+          __Pyx_GOTREF(__pyx_t_4);
+          __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+        } else
+        #endif
+        {
+          __pyx_t_8 = PyTuple_New(1+1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 653, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_8);
+          __Pyx_GIVEREF(__pyx_t_11); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_11); __pyx_t_11 = NULL;
+          __Pyx_GIVEREF(__pyx_t_5);
+          PyTuple_SET_ITEM(__pyx_t_8, 0+1, __pyx_t_5);
+          __pyx_t_5 = 0;
+          __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_8, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 653, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_4);
+          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        }
+      }
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_Raise(__pyx_t_4, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __PYX_ERR(0, 653, __pyx_L1_error)
+    }
+    __pyx_L7:;
 
-  /* "mpfmc/core/audio/track.pyx":245
- *             fade_out_seconds: The number of seconds to fade out the track
- *         """
- *         self.log.debug("stop - Stop sound processing on track and clear state")             # <<<<<<<<<<<<<<
+    /* "mpfmc/core/audio/track.pyx":595
+ *     memset(chain, 0, sizeof(DspChain))
  * 
- *         SDL_LockAudio()
+ *     for settings in inserts:             # <<<<<<<<<<<<<<
+ *         insert = &chain.inserts[chain.insert_count]
+ *         chain.insert_count += 1
  */
-  __pyx_tuple__9 = PyTuple_Pack(1, __pyx_kp_u_stop_Stop_sound_processing_on_tr); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(0, 245, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__9);
-  __Pyx_GIVEREF(__pyx_tuple__9);
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "mpfmc/core/audio/track.pyx":272
+  /* "mpfmc/core/audio/track.pyx":655
+ *             raise AudioException("Unknown DSP insert type '{}'".format(settings['type']))
  * 
- *         else:
- *             self.log.warning("stop - Action may only be used when a track is playing; action "             # <<<<<<<<<<<<<<
- *                              "will be ignored.")
+ *     return chain             # <<<<<<<<<<<<<<
  * 
+ * cdef void free_dsp_chain(DspChain *chain):
  */
-  __pyx_tuple__10 = PyTuple_Pack(1, __pyx_kp_u_stop_Action_may_only_be_used_whe); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(0, 272, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__10);
-  __Pyx_GIVEREF(__pyx_tuple__10);
+  __pyx_r = __pyx_v_chain;
+  goto __pyx_L0;
 
-  /* "mpfmc/core/audio/track.pyx":284
- *             fade_out_seconds: The number of seconds to fade out the track
- *         """
- *         self.log.debug("pause - Pause sound processing on track")             # <<<<<<<<<<<<<<
+  /* "mpfmc/core/audio/track.pyx":570
+ * #    DSP insert chain functions
+ * # ---------------------------------------------------------------------------
+ * cdef DspChain *create_dsp_chain(list inserts, int sample_rate, int channels) except NULL:             # <<<<<<<<<<<<<<
+ *     """
+ *     Creates a DSP insert chain from a list of insert settings.
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_XDECREF(__pyx_t_22);
+  __Pyx_AddTraceback("mpfmc.core.audio.track.create_dsp_chain", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_settings);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/track.pyx":657
+ *     return chain
  * 
- *         SDL_LockAudio()
+ * cdef void free_dsp_chain(DspChain *chain):             # <<<<<<<<<<<<<<
+ *     """
+ *     Frees a DSP insert chain (and any memory allocated by its inserts).
  */
-  __pyx_tuple__11 = PyTuple_Pack(1, __pyx_kp_u_pause_Pause_sound_processing_on); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(0, 284, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__11);
-  __Pyx_GIVEREF(__pyx_tuple__11);
 
-  /* "mpfmc/core/audio/track.pyx":309
+static void __pyx_f_5mpfmc_4core_5audio_5track_free_dsp_chain(__pyx_t_5mpfmc_4core_5audio_3dsp_DspChain *__pyx_v_chain) {
+  int __pyx_v_index;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  __Pyx_RefNannySetupContext("free_dsp_chain", 0);
+
+  /* "mpfmc/core/audio/track.pyx":665
+ *     cdef int index
  * 
- *         else:
- *             self.log.warning("pause - Action may only be used when a track is playing; action "             # <<<<<<<<<<<<<<
- *                              "will be ignored.")
+ *     if chain == NULL:             # <<<<<<<<<<<<<<
+ *         return
  * 
  */
-  __pyx_tuple__12 = PyTuple_Pack(1, __pyx_kp_u_pause_Action_may_only_be_used_wh); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(0, 309, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__12);
-  __Pyx_GIVEREF(__pyx_tuple__12);
+  __pyx_t_1 = ((__pyx_v_chain == NULL) != 0);
+  if (__pyx_t_1) {
 
-  /* "mpfmc/core/audio/track.pyx":320
- *             fade_out_seconds: The number of seconds to fade out the sounds before stopping
- *         """
- *         raise NotImplementedError('Must be overridden in derived class')             # <<<<<<<<<<<<<<
+    /* "mpfmc/core/audio/track.pyx":666
  * 
- *     def process(self):
+ *     if chain == NULL:
+ *         return             # <<<<<<<<<<<<<<
+ * 
+ *     for index in range(chain.insert_count):
  */
-  __pyx_tuple__13 = PyTuple_Pack(1, __pyx_kp_u_Must_be_overridden_in_derived_cl); if (unlikely(!__pyx_tuple__13)) __PYX_ERR(0, 320, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__13);
-  __Pyx_GIVEREF(__pyx_tuple__13);
+    goto __pyx_L0;
 
-  /* "mpfmc/core/audio/track.pyx":324
- *     def process(self):
- *         """Processes the track queue each tick."""
- *         raise NotImplementedError('Must be overridden in derived class')             # <<<<<<<<<<<<<<
+    /* "mpfmc/core/audio/track.pyx":665
+ *     cdef int index
  * 
+ *     if chain == NULL:             # <<<<<<<<<<<<<<
+ *         return
  * 
  */
-  __pyx_tuple__14 = PyTuple_Pack(1, __pyx_kp_u_Must_be_overridden_in_derived_cl); if (unlikely(!__pyx_tuple__14)) __PYX_ERR(0, 324, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__14);
-  __Pyx_GIVEREF(__pyx_tuple__14);
+  }
 
-  /* "(tree fragment)":2
- * def __reduce_cython__(self):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
- * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+  /* "mpfmc/core/audio/track.pyx":668
+ *         return
+ * 
+ *     for index in range(chain.insert_count):             # <<<<<<<<<<<<<<
+ *         if chain.inserts[index].type == dsp_insert_reverb:
+ *             PyMem_Free(chain.inserts[index].reverb.delay_memory)
  */
-  __pyx_tuple__15 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__15)) __PYX_ERR(1, 2, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__15);
-  __Pyx_GIVEREF(__pyx_tuple__15);
+  __pyx_t_2 = __pyx_v_chain->insert_count;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_index = __pyx_t_3;
 
-  /* "(tree fragment)":4
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+    /* "mpfmc/core/audio/track.pyx":669
+ * 
+ *     for index in range(chain.insert_count):
+ *         if chain.inserts[index].type == dsp_insert_reverb:             # <<<<<<<<<<<<<<
+ *             PyMem_Free(chain.inserts[index].reverb.delay_memory)
+ * 
  */
-  __pyx_tuple__16 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__16)) __PYX_ERR(1, 4, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__16);
-  __Pyx_GIVEREF(__pyx_tuple__16);
-  __Pyx_RefNannyFinishContext();
-  return 0;
-  __pyx_L1_error:;
-  __Pyx_RefNannyFinishContext();
-  return -1;
-}
+    __pyx_t_1 = (((__pyx_v_chain->inserts[__pyx_v_index]).type == __pyx_e_5mpfmc_4core_5audio_3dsp_dsp_insert_reverb) != 0);
+    if (__pyx_t_1) {
 
-static int __Pyx_InitGlobals(void) {
-  if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  __pyx_int_2 = PyInt_FromLong(2); if (unlikely(!__pyx_int_2)) __PYX_ERR(0, 1, __pyx_L1_error)
-  return 0;
-  __pyx_L1_error:;
-  return -1;
-}
+      /* "mpfmc/core/audio/track.pyx":670
+ *     for index in range(chain.insert_count):
+ *         if chain.inserts[index].type == dsp_insert_reverb:
+ *             PyMem_Free(chain.inserts[index].reverb.delay_memory)             # <<<<<<<<<<<<<<
+ * 
+ *     PyMem_Free(chain)
+ */
+      PyMem_Free((__pyx_v_chain->inserts[__pyx_v_index]).reverb.delay_memory);
 
-#if PY_MAJOR_VERSION < 3
-PyMODINIT_FUNC inittrack(void); /*proto*/
-PyMODINIT_FUNC inittrack(void)
-#else
-PyMODINIT_FUNC PyInit_track(void); /*proto*/
-PyMODINIT_FUNC PyInit_track(void)
-#if CYTHON_PEP489_MULTI_PHASE_INIT
-{
-  return PyModuleDef_Init(&__pyx_moduledef);
-}
-static int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name) {
-    PyObject *value = PyObject_GetAttrString(spec, from_name);
-    int result = 0;
-    if (likely(value)) {
-        result = PyDict_SetItemString(moddict, to_name, value);
-        Py_DECREF(value);
-    } else if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
-        PyErr_Clear();
-    } else {
-        result = -1;
+      /* "mpfmc/core/audio/track.pyx":669
+ * 
+ *     for index in range(chain.insert_count):
+ *         if chain.inserts[index].type == dsp_insert_reverb:             # <<<<<<<<<<<<<<
+ *             PyMem_Free(chain.inserts[index].reverb.delay_memory)
+ * 
+ */
     }
-    return result;
-}
-static PyObject* __pyx_pymod_create(PyObject *spec, CYTHON_UNUSED PyModuleDef *def) {
-    PyObject *module = NULL, *moddict, *modname;
-    if (__pyx_m)
-        return __Pyx_NewRef(__pyx_m);
-    modname = PyObject_GetAttrString(spec, "name");
-    if (unlikely(!modname)) goto bad;
-    module = PyModule_NewObject(modname);
-    Py_DECREF(modname);
-    if (unlikely(!module)) goto bad;
-    moddict = PyModule_GetDict(module);
-    if (unlikely(!moddict)) goto bad;
-    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "loader", "__loader__") < 0)) goto bad;
-    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "origin", "__file__") < 0)) goto bad;
-    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "parent", "__package__") < 0)) goto bad;
-    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "submodule_search_locations", "__path__") < 0)) goto bad;
-    return module;
-bad:
-    Py_XDECREF(module);
-    return NULL;
+  }
+
+  /* "mpfmc/core/audio/track.pyx":672
+ *             PyMem_Free(chain.inserts[index].reverb.delay_memory)
+ * 
+ *     PyMem_Free(chain)             # <<<<<<<<<<<<<<
+ * 
+ * cdef _set_biquad_coefficients(BiquadSettings *biquad, dict settings, int sample_rate):
+ */
+  PyMem_Free(__pyx_v_chain);
+
+  /* "mpfmc/core/audio/track.pyx":657
+ *     return chain
+ * 
+ * cdef void free_dsp_chain(DspChain *chain):             # <<<<<<<<<<<<<<
+ *     """
+ *     Frees a DSP insert chain (and any memory allocated by its inserts).
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
 }
 
-
-static int __pyx_pymod_exec_track(PyObject *__pyx_pyinit_module)
-#endif
-#endif
-{
-  PyObject *__pyx_t_1 = NULL;
+/* "mpfmc/core/audio/track.pyx":674
+ *     PyMem_Free(chain)
+ * 
+ * cdef _set_biquad_coefficients(BiquadSettings *biquad, dict settings, int sample_rate):             # <<<<<<<<<<<<<<
+ *     """
+ *     Calculates normalized biquad filter coefficients (see the Audio EQ Cookbook by Robert
+ */
+
+static PyObject *__pyx_f_5mpfmc_4core_5audio_5track__set_biquad_coefficients(__pyx_t_5mpfmc_4core_5audio_3dsp_BiquadSettings *__pyx_v_biquad, PyObject *__pyx_v_settings, int __pyx_v_sample_rate) {
+  PyObject *__pyx_v_frequency = NULL;
+  PyObject *__pyx_v_a = NULL;
+  PyObject *__pyx_v_w0 = NULL;
+  PyObject *__pyx_v_cos_w0 = NULL;
+  PyObject *__pyx_v_alpha = NULL;
+  PyObject *__pyx_v_filter_type = NULL;
+  PyObject *__pyx_v_b0 = NULL;
+  PyObject *__pyx_v_b1 = NULL;
+  PyObject *__pyx_v_b2 = NULL;
+  PyObject *__pyx_v_a0 = NULL;
+  PyObject *__pyx_v_a1 = NULL;
+  PyObject *__pyx_v_a2 = NULL;
+  PyObject *__pyx_v_shelf = NULL;
+  PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  #if CYTHON_PEP489_MULTI_PHASE_INIT
-  if (__pyx_m && __pyx_m == __pyx_pyinit_module) return 0;
-  #endif
-  #if CYTHON_REFNANNY
-  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
-  if (!__Pyx_RefNanny) {
-      PyErr_Clear();
-      __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
-      if (!__Pyx_RefNanny)
-          Py_FatalError("failed to import 'refnanny' module");
+  double __pyx_t_1;
+  double __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
+  int __pyx_t_8;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  float __pyx_t_11;
+  __Pyx_RefNannySetupContext("_set_biquad_coefficients", 0);
+
+  /* "mpfmc/core/audio/track.pyx":683
+ *         sample_rate: The audio sample rate
+ *     """
+ *     frequency = min(max(settings['frequency'], 1.0), sample_rate * 0.49)             # <<<<<<<<<<<<<<
+ *     a = pow(10.0, settings['gain'] / 40.0)
+ *     w0 = 2.0 * pi * frequency / sample_rate
+ */
+  __pyx_t_1 = (__pyx_v_sample_rate * 0.49);
+  __pyx_t_2 = 1.0;
+  if (unlikely(__pyx_v_settings == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(0, 683, __pyx_L1_error)
   }
-  #endif
-  __Pyx_RefNannySetupContext("PyMODINIT_FUNC PyInit_track(void)", 0);
-  if (__Pyx_check_binary_version() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_unicode)) __PYX_ERR(0, 1, __pyx_L1_error)
-  #ifdef __Pyx_CyFunction_USED
-  if (__pyx_CyFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  #endif
-  #ifdef __Pyx_FusedFunction_USED
-  if (__pyx_FusedFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  #endif
-  #ifdef __Pyx_Coroutine_USED
-  if (__pyx_Coroutine_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  #endif
-  #ifdef __Pyx_Generator_USED
-  if (__pyx_Generator_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  #endif
-  #ifdef __Pyx_AsyncGen_USED
-  if (__pyx_AsyncGen_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  #endif
-  #ifdef __Pyx_StopAsyncIteration_USED
-  if (__pyx_StopAsyncIteration_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  #endif
-  /*--- Library function declarations ---*/
-  /*--- Threads initialization code ---*/
-  #if defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
-  #ifdef WITH_THREAD /* Python build with threading support? */
-  PyEval_InitThreads();
-  #endif
-  #endif
-  /*--- Module creation code ---*/
-  #if CYTHON_PEP489_MULTI_PHASE_INIT
-  __pyx_m = __pyx_pyinit_module;
-  Py_INCREF(__pyx_m);
-  #else
-  #if PY_MAJOR_VERSION < 3
-  __pyx_m = Py_InitModule4("track", __pyx_methods, 0, 0, PYTHON_API_VERSION); Py_XINCREF(__pyx_m);
-  #else
-  __pyx_m = PyModule_Create(&__pyx_moduledef);
-  #endif
-  if (unlikely(!__pyx_m)) __PYX_ERR(0, 1, __pyx_L1_error)
-  #endif
-  __pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_d)) __PYX_ERR(0, 1, __pyx_L1_error)
-  Py_INCREF(__pyx_d);
-  __pyx_b = PyImport_AddModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_b)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_cython_runtime = PyImport_AddModule((char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
-  #if CYTHON_COMPILING_IN_PYPY
-  Py_INCREF(__pyx_b);
-  #endif
-  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  /*--- Initialize various global constants etc. ---*/
-  if (__Pyx_InitGlobals() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
-  if (__Pyx_init_sys_getdefaultencoding_params() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  #endif
-  if (__pyx_module_is_main_mpfmc__core__audio__track) {
-    if (PyObject_SetAttrString(__pyx_m, "__name__", __pyx_n_s_main) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyDict_GetItem(__pyx_v_settings, __pyx_n_u_frequency); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 683, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = PyFloat_FromDouble(__pyx_t_2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 683, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = PyObject_RichCompare(__pyx_t_5, __pyx_t_3, Py_GT); __Pyx_XGOTREF(__pyx_t_6); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 683, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_7 = __Pyx_PyObject_IsTrue(__pyx_t_6); if (unlikely(__pyx_t_7 < 0)) __PYX_ERR(0, 683, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (__pyx_t_7) {
+    __pyx_t_6 = PyFloat_FromDouble(__pyx_t_2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 683, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_4 = __pyx_t_6;
+    __pyx_t_6 = 0;
+  } else {
+    __Pyx_INCREF(__pyx_t_3);
+    __pyx_t_4 = __pyx_t_3;
   }
-  #if PY_MAJOR_VERSION >= 3
-  {
-    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(0, 1, __pyx_L1_error)
-    if (!PyDict_GetItemString(modules, "mpfmc.core.audio.track")) {
-      if (unlikely(PyDict_SetItemString(modules, "mpfmc.core.audio.track", __pyx_m) < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_INCREF(__pyx_t_4);
+  __pyx_t_3 = __pyx_t_4;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_6 = PyFloat_FromDouble(__pyx_t_1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 683, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_5 = PyObject_RichCompare(__pyx_t_6, __pyx_t_3, Py_LT); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 683, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_7 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_7 < 0)) __PYX_ERR(0, 683, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (__pyx_t_7) {
+    __pyx_t_5 = PyFloat_FromDouble(__pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 683, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_4 = __pyx_t_5;
+    __pyx_t_5 = 0;
+  } else {
+    __Pyx_INCREF(__pyx_t_3);
+    __pyx_t_4 = __pyx_t_3;
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = __pyx_t_4;
+  __Pyx_INCREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_v_frequency = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "mpfmc/core/audio/track.pyx":684
+ *     """
+ *     frequency = min(max(settings['frequency'], 1.0), sample_rate * 0.49)
+ *     a = pow(10.0, settings['gain'] / 40.0)             # <<<<<<<<<<<<<<
+ *     w0 = 2.0 * pi * frequency / sample_rate
+ *     cos_w0 = cos(w0)
+ */
+  __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_pow); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 684, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  if (unlikely(__pyx_v_settings == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(0, 684, __pyx_L1_error)
+  }
+  __pyx_t_5 = __Pyx_PyDict_GetItem(__pyx_v_settings, __pyx_n_u_gain); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 684, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = __Pyx_PyFloat_TrueDivideObjC(__pyx_t_5, __pyx_float_40_0, 40.0, 0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 684, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = NULL;
+  __pyx_t_8 = 0;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_4, function);
+      __pyx_t_8 = 1;
     }
   }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_4)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_float_10_0, __pyx_t_6};
+    __pyx_t_3 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 684, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_float_10_0, __pyx_t_6};
+    __pyx_t_3 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 684, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  } else
   #endif
-  /*--- Builtin init code ---*/
-  if (__Pyx_InitCachedBuiltins() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  /*--- Constants init code ---*/
-  if (__Pyx_InitCachedConstants() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  /*--- Global init code ---*/
-  /*--- Variable export code ---*/
-  /*--- Function export code ---*/
-  /*--- Type init code ---*/
-  __pyx_vtabptr_5mpfmc_4core_5audio_5track_Track = &__pyx_vtable_5mpfmc_4core_5audio_5track_Track;
-  __pyx_vtable_5mpfmc_4core_5audio_5track_Track.get_state = (__pyx_t_5mpfmc_4core_5audio_5track_TrackState *(*)(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *))__pyx_f_5mpfmc_4core_5audio_5track_5Track_get_state;
-  __pyx_vtable_5mpfmc_4core_5audio_5track_Track.mix_track_to_output = (void (*)(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *, __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData *, Uint8 *, Uint32))__pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output;
-  if (PyType_Ready(&__pyx_type_5mpfmc_4core_5audio_5track_Track) < 0) __PYX_ERR(0, 18, __pyx_L1_error)
-  __pyx_type_5mpfmc_4core_5audio_5track_Track.tp_print = 0;
-  #if CYTHON_COMPILING_IN_CPYTHON
   {
-    PyObject *wrapper = PyObject_GetAttrString((PyObject *)&__pyx_type_5mpfmc_4core_5audio_5track_Track, "__init__"); if (unlikely(!wrapper)) __PYX_ERR(0, 18, __pyx_L1_error)
-    if (Py_TYPE(wrapper) == &PyWrapperDescr_Type) {
-      __pyx_wrapperbase_5mpfmc_4core_5audio_5track_5Track_2__init__ = *((PyWrapperDescrObject *)wrapper)->d_base;
-      __pyx_wrapperbase_5mpfmc_4core_5audio_5track_5Track_2__init__.doc = __pyx_doc_5mpfmc_4core_5audio_5track_5Track_2__init__;
-      ((PyWrapperDescrObject *)wrapper)->d_base = &__pyx_wrapperbase_5mpfmc_4core_5audio_5track_5Track_2__init__;
+    __pyx_t_9 = PyTuple_New(2+__pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 684, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    if (__pyx_t_5) {
+      __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_5); __pyx_t_5 = NULL;
     }
+    __Pyx_INCREF(__pyx_float_10_0);
+    __Pyx_GIVEREF(__pyx_float_10_0);
+    PyTuple_SET_ITEM(__pyx_t_9, 0+__pyx_t_8, __pyx_float_10_0);
+    __Pyx_GIVEREF(__pyx_t_6);
+    PyTuple_SET_ITEM(__pyx_t_9, 1+__pyx_t_8, __pyx_t_6);
+    __pyx_t_6 = 0;
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_9, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 684, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
   }
-  #endif
-  if (__Pyx_SetVtable(__pyx_type_5mpfmc_4core_5audio_5track_Track.tp_dict, __pyx_vtabptr_5mpfmc_4core_5audio_5track_Track) < 0) __PYX_ERR(0, 18, __pyx_L1_error)
-  if (PyObject_SetAttrString(__pyx_m, "Track", (PyObject *)&__pyx_type_5mpfmc_4core_5audio_5track_Track) < 0) __PYX_ERR(0, 18, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_5mpfmc_4core_5audio_5track_Track) < 0) __PYX_ERR(0, 18, __pyx_L1_error)
-  __pyx_ptype_5mpfmc_4core_5audio_5track_Track = &__pyx_type_5mpfmc_4core_5audio_5track_Track;
-  /*--- Type import code ---*/
-  /*--- Variable import code ---*/
-  /*--- Function import code ---*/
-  /*--- Execution code ---*/
-  #if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
-  if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  #endif
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_v_a = __pyx_t_3;
+  __pyx_t_3 = 0;
 
-  /* "mpfmc/core/audio/track.pyx":6
- * from cpython.mem cimport PyMem_Malloc, PyMem_Realloc, PyMem_Free
- * cimport cpython.pycapsule as pycapsule
- * import logging             # <<<<<<<<<<<<<<
+  /* "mpfmc/core/audio/track.pyx":685
+ *     frequency = min(max(settings['frequency'], 1.0), sample_rate * 0.49)
+ *     a = pow(10.0, settings['gain'] / 40.0)
+ *     w0 = 2.0 * pi * frequency / sample_rate             # <<<<<<<<<<<<<<
+ *     cos_w0 = cos(w0)
+ *     alpha = sin(w0) / (2.0 * max(settings['q'], 0.01))
+ */
+  __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_pi); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 685, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = PyNumber_Multiply(__pyx_float_2_0, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 685, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = PyNumber_Multiply(__pyx_t_4, __pyx_v_frequency); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 685, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_sample_rate); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 685, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_9 = __Pyx_PyNumber_Divide(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 685, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_v_w0 = __pyx_t_9;
+  __pyx_t_9 = 0;
+
+  /* "mpfmc/core/audio/track.pyx":686
+ *     a = pow(10.0, settings['gain'] / 40.0)
+ *     w0 = 2.0 * pi * frequency / sample_rate
+ *     cos_w0 = cos(w0)             # <<<<<<<<<<<<<<
+ *     alpha = sin(w0) / (2.0 * max(settings['q'], 0.01))
+ *     filter_type = settings['filter']
+ */
+  __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_cos); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 686, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_4);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_4, function);
+    }
+  }
+  if (!__pyx_t_3) {
+    __pyx_t_9 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_v_w0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 686, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+  } else {
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_4)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_3, __pyx_v_w0};
+      __pyx_t_9 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 686, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_GOTREF(__pyx_t_9);
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_3, __pyx_v_w0};
+      __pyx_t_9 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 686, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_GOTREF(__pyx_t_9);
+    } else
+    #endif
+    {
+      __pyx_t_6 = PyTuple_New(1+1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 686, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_3); __pyx_t_3 = NULL;
+      __Pyx_INCREF(__pyx_v_w0);
+      __Pyx_GIVEREF(__pyx_v_w0);
+      PyTuple_SET_ITEM(__pyx_t_6, 0+1, __pyx_v_w0);
+      __pyx_t_9 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_6, NULL); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 686, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    }
+  }
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_v_cos_w0 = __pyx_t_9;
+  __pyx_t_9 = 0;
+
+  /* "mpfmc/core/audio/track.pyx":687
+ *     w0 = 2.0 * pi * frequency / sample_rate
+ *     cos_w0 = cos(w0)
+ *     alpha = sin(w0) / (2.0 * max(settings['q'], 0.01))             # <<<<<<<<<<<<<<
+ *     filter_type = settings['filter']
  * 
- * from mpfmc.core.audio.sdl2 cimport *
  */
-  __pyx_t_1 = __Pyx_Import(__pyx_n_s_logging, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 6, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_logging, __pyx_t_1) < 0) __PYX_ERR(0, 6, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_sin); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 687, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_6 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_4);
+    if (likely(__pyx_t_6)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_6);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_4, function);
+    }
+  }
+  if (!__pyx_t_6) {
+    __pyx_t_9 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_v_w0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 687, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+  } else {
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_4)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_6, __pyx_v_w0};
+      __pyx_t_9 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 687, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_GOTREF(__pyx_t_9);
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_6, __pyx_v_w0};
+      __pyx_t_9 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 687, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_GOTREF(__pyx_t_9);
+    } else
+    #endif
+    {
+      __pyx_t_3 = PyTuple_New(1+1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 687, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_6); __pyx_t_6 = NULL;
+      __Pyx_INCREF(__pyx_v_w0);
+      __Pyx_GIVEREF(__pyx_v_w0);
+      PyTuple_SET_ITEM(__pyx_t_3, 0+1, __pyx_v_w0);
+      __pyx_t_9 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_3, NULL); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 687, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    }
+  }
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_1 = 0.01;
+  if (unlikely(__pyx_v_settings == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(0, 687, __pyx_L1_error)
+  }
+  __pyx_t_4 = __Pyx_PyDict_GetItem(__pyx_v_settings, __pyx_n_u_q); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 687, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_6 = PyFloat_FromDouble(__pyx_t_1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 687, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_5 = PyObject_RichCompare(__pyx_t_6, __pyx_t_4, Py_GT); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 687, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_7 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_7 < 0)) __PYX_ERR(0, 687, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (__pyx_t_7) {
+    __pyx_t_5 = PyFloat_FromDouble(__pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 687, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_3 = __pyx_t_5;
+    __pyx_t_5 = 0;
+  } else {
+    __Pyx_INCREF(__pyx_t_4);
+    __pyx_t_3 = __pyx_t_4;
+  }
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = PyNumber_Multiply(__pyx_float_2_0, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 687, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = __Pyx_PyNumber_Divide(__pyx_t_9, __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 687, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_v_alpha = __pyx_t_3;
+  __pyx_t_3 = 0;
 
-  /* "mpfmc/core/audio/track.pyx":1
- * #!python             # <<<<<<<<<<<<<<
- * #cython: embedsignature=True, language_level=3
+  /* "mpfmc/core/audio/track.pyx":688
+ *     cos_w0 = cos(w0)
+ *     alpha = sin(w0) / (2.0 * max(settings['q'], 0.01))
+ *     filter_type = settings['filter']             # <<<<<<<<<<<<<<
  * 
+ *     if filter_type == 'lowpass':
  */
-  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_1) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (unlikely(__pyx_v_settings == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(0, 688, __pyx_L1_error)
+  }
+  __pyx_t_3 = __Pyx_PyDict_GetItem(__pyx_v_settings, __pyx_n_u_filter); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 688, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_v_filter_type = __pyx_t_3;
+  __pyx_t_3 = 0;
 
-  /* "mpfmc/core/audio/inline.pxd":20
- *     return <Uint8> ((1.0 - progress) * a + progress * b)
+  /* "mpfmc/core/audio/track.pyx":690
+ *     filter_type = settings['filter']
  * 
- * cdef inline float in_out_quad(float progress) nogil:             # <<<<<<<<<<<<<<
- *     """
- *     A quadratic easing function used for smoother audio fading
+ *     if filter_type == 'lowpass':             # <<<<<<<<<<<<<<
+ *         b0, b1, b2 = (1.0 - cos_w0) / 2.0, 1.0 - cos_w0, (1.0 - cos_w0) / 2.0
+ *         a0, a1, a2 = 1.0 + alpha, -2.0 * cos_w0, 1.0 - alpha
  */
+  __pyx_t_7 = (__Pyx_PyUnicode_Equals(__pyx_v_filter_type, __pyx_n_u_lowpass, Py_EQ)); if (unlikely(__pyx_t_7 < 0)) __PYX_ERR(0, 690, __pyx_L1_error)
+  if (__pyx_t_7) {
 
-  /*--- Wrapped vars code ---*/
+    /* "mpfmc/core/audio/track.pyx":691
+ * 
+ *     if filter_type == 'lowpass':
+ *         b0, b1, b2 = (1.0 - cos_w0) / 2.0, 1.0 - cos_w0, (1.0 - cos_w0) / 2.0             # <<<<<<<<<<<<<<
+ *         a0, a1, a2 = 1.0 + alpha, -2.0 * cos_w0, 1.0 - alpha
+ *     elif filter_type == 'highpass':
+ */
+    __pyx_t_3 = __Pyx_PyFloat_SubtractCObj(__pyx_float_1_0, __pyx_v_cos_w0, 1.0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 691, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = __Pyx_PyFloat_TrueDivideObjC(__pyx_t_3, __pyx_float_2_0, 2.0, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 691, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = __Pyx_PyFloat_SubtractCObj(__pyx_float_1_0, __pyx_v_cos_w0, 1.0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 691, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_9 = __Pyx_PyFloat_SubtractCObj(__pyx_float_1_0, __pyx_v_cos_w0, 1.0, 0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 691, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __pyx_t_5 = __Pyx_PyFloat_TrueDivideObjC(__pyx_t_9, __pyx_float_2_0, 2.0, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 691, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __pyx_v_b0 = __pyx_t_4;
+    __pyx_t_4 = 0;
+    __pyx_v_b1 = __pyx_t_3;
+    __pyx_t_3 = 0;
+    __pyx_v_b2 = __pyx_t_5;
+    __pyx_t_5 = 0;
 
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  if (__pyx_m) {
-    if (__pyx_d) {
-      __Pyx_AddTraceback("init mpfmc.core.audio.track", 0, __pyx_lineno, __pyx_filename);
-    }
-    Py_DECREF(__pyx_m); __pyx_m = 0;
-  } else if (!PyErr_Occurred()) {
-    PyErr_SetString(PyExc_ImportError, "init mpfmc.core.audio.track");
+    /* "mpfmc/core/audio/track.pyx":692
+ *     if filter_type == 'lowpass':
+ *         b0, b1, b2 = (1.0 - cos_w0) / 2.0, 1.0 - cos_w0, (1.0 - cos_w0) / 2.0
+ *         a0, a1, a2 = 1.0 + alpha, -2.0 * cos_w0, 1.0 - alpha             # <<<<<<<<<<<<<<
+ *     elif filter_type == 'highpass':
+ *         b0, b1, b2 = (1.0 + cos_w0) / 2.0, -(1.0 + cos_w0), (1.0 + cos_w0) / 2.0
+ */
+    __pyx_t_5 = __Pyx_PyFloat_AddCObj(__pyx_float_1_0, __pyx_v_alpha, 1.0, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 692, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_3 = PyNumber_Multiply(__pyx_float_neg_2_0, __pyx_v_cos_w0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 692, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = __Pyx_PyFloat_SubtractCObj(__pyx_float_1_0, __pyx_v_alpha, 1.0, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 692, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_v_a0 = __pyx_t_5;
+    __pyx_t_5 = 0;
+    __pyx_v_a1 = __pyx_t_3;
+    __pyx_t_3 = 0;
+    __pyx_v_a2 = __pyx_t_4;
+    __pyx_t_4 = 0;
+
+    /* "mpfmc/core/audio/track.pyx":690
+ *     filter_type = settings['filter']
+ * 
+ *     if filter_type == 'lowpass':             # <<<<<<<<<<<<<<
+ *         b0, b1, b2 = (1.0 - cos_w0) / 2.0, 1.0 - cos_w0, (1.0 - cos_w0) / 2.0
+ *         a0, a1, a2 = 1.0 + alpha, -2.0 * cos_w0, 1.0 - alpha
+ */
+    goto __pyx_L3;
   }
+
+  /* "mpfmc/core/audio/track.pyx":693
+ *         b0, b1, b2 = (1.0 - cos_w0) / 2.0, 1.0 - cos_w0, (1.0 - cos_w0) / 2.0
+ *         a0, a1, a2 = 1.0 + alpha, -2.0 * cos_w0, 1.0 - alpha
+ *     elif filter_type == 'highpass':             # <<<<<<<<<<<<<<
+ *         b0, b1, b2 = (1.0 + cos_w0) / 2.0, -(1.0 + cos_w0), (1.0 + cos_w0) / 2.0
+ *         a0, a1, a2 = 1.0 + alpha, -2.0 * cos_w0, 1.0 - alpha
+ */
+  __pyx_t_7 = (__Pyx_PyUnicode_Equals(__pyx_v_filter_type, __pyx_n_u_highpass, Py_EQ)); if (unlikely(__pyx_t_7 < 0)) __PYX_ERR(0, 693, __pyx_L1_error)
+  if (__pyx_t_7) {
+
+    /* "mpfmc/core/audio/track.pyx":694
+ *         a0, a1, a2 = 1.0 + alpha, -2.0 * cos_w0, 1.0 - alpha
+ *     elif filter_type == 'highpass':
+ *         b0, b1, b2 = (1.0 + cos_w0) / 2.0, -(1.0 + cos_w0), (1.0 + cos_w0) / 2.0             # <<<<<<<<<<<<<<
+ *         a0, a1, a2 = 1.0 + alpha, -2.0 * cos_w0, 1.0 - alpha
+ *     elif filter_type == 'peak':
+ */
+    __pyx_t_4 = __Pyx_PyFloat_AddCObj(__pyx_float_1_0, __pyx_v_cos_w0, 1.0, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 694, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_3 = __Pyx_PyFloat_TrueDivideObjC(__pyx_t_4, __pyx_float_2_0, 2.0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 694, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = __Pyx_PyFloat_AddCObj(__pyx_float_1_0, __pyx_v_cos_w0, 1.0, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 694, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = PyNumber_Negative(__pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 694, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = __Pyx_PyFloat_AddCObj(__pyx_float_1_0, __pyx_v_cos_w0, 1.0, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 694, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_9 = __Pyx_PyFloat_TrueDivideObjC(__pyx_t_4, __pyx_float_2_0, 2.0, 0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 694, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_v_b0 = __pyx_t_3;
+    __pyx_t_3 = 0;
+    __pyx_v_b1 = __pyx_t_5;
+    __pyx_t_5 = 0;
+    __pyx_v_b2 = __pyx_t_9;
+    __pyx_t_9 = 0;
+
+    /* "mpfmc/core/audio/track.pyx":695
+ *     elif filter_type == 'highpass':
+ *         b0, b1, b2 = (1.0 + cos_w0) / 2.0, -(1.0 + cos_w0), (1.0 + cos_w0) / 2.0
+ *         a0, a1, a2 = 1.0 + alpha, -2.0 * cos_w0, 1.0 - alpha             # <<<<<<<<<<<<<<
+ *     elif filter_type == 'peak':
+ *         b0, b1, b2 = 1.0 + alpha * a, -2.0 * cos_w0, 1.0 - alpha * a
+ */
+    __pyx_t_9 = __Pyx_PyFloat_AddCObj(__pyx_float_1_0, __pyx_v_alpha, 1.0, 0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 695, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __pyx_t_5 = PyNumber_Multiply(__pyx_float_neg_2_0, __pyx_v_cos_w0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 695, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_3 = __Pyx_PyFloat_SubtractCObj(__pyx_float_1_0, __pyx_v_alpha, 1.0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 695, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_v_a0 = __pyx_t_9;
+    __pyx_t_9 = 0;
+    __pyx_v_a1 = __pyx_t_5;
+    __pyx_t_5 = 0;
+    __pyx_v_a2 = __pyx_t_3;
+    __pyx_t_3 = 0;
+
+    /* "mpfmc/core/audio/track.pyx":693
+ *         b0, b1, b2 = (1.0 - cos_w0) / 2.0, 1.0 - cos_w0, (1.0 - cos_w0) / 2.0
+ *         a0, a1, a2 = 1.0 + alpha, -2.0 * cos_w0, 1.0 - alpha
+ *     elif filter_type == 'highpass':             # <<<<<<<<<<<<<<
+ *         b0, b1, b2 = (1.0 + cos_w0) / 2.0, -(1.0 + cos_w0), (1.0 + cos_w0) / 2.0
+ *         a0, a1, a2 = 1.0 + alpha, -2.0 * cos_w0, 1.0 - alpha
+ */
+    goto __pyx_L3;
+  }
+
+  /* "mpfmc/core/audio/track.pyx":696
+ *         b0, b1, b2 = (1.0 + cos_w0) / 2.0, -(1.0 + cos_w0), (1.0 + cos_w0) / 2.0
+ *         a0, a1, a2 = 1.0 + alpha, -2.0 * cos_w0, 1.0 - alpha
+ *     elif filter_type == 'peak':             # <<<<<<<<<<<<<<
+ *         b0, b1, b2 = 1.0 + alpha * a, -2.0 * cos_w0, 1.0 - alpha * a
+ *         a0, a1, a2 = 1.0 + alpha / a, -2.0 * cos_w0, 1.0 - alpha / a
+ */
+  __pyx_t_7 = (__Pyx_PyUnicode_Equals(__pyx_v_filter_type, __pyx_n_u_peak, Py_EQ)); if (unlikely(__pyx_t_7 < 0)) __PYX_ERR(0, 696, __pyx_L1_error)
+  if (__pyx_t_7) {
+
+    /* "mpfmc/core/audio/track.pyx":697
+ *         a0, a1, a2 = 1.0 + alpha, -2.0 * cos_w0, 1.0 - alpha
+ *     elif filter_type == 'peak':
+ *         b0, b1, b2 = 1.0 + alpha * a, -2.0 * cos_w0, 1.0 - alpha * a             # <<<<<<<<<<<<<<
+ *         a0, a1, a2 = 1.0 + alpha / a, -2.0 * cos_w0, 1.0 - alpha / a
+ *     elif filter_type == 'lowshelf':
+ */
+    __pyx_t_3 = PyNumber_Multiply(__pyx_v_alpha, __pyx_v_a); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 697, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_5 = __Pyx_PyFloat_AddCObj(__pyx_float_1_0, __pyx_t_3, 1.0, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 697, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = PyNumber_Multiply(__pyx_float_neg_2_0, __pyx_v_cos_w0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 697, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_9 = PyNumber_Multiply(__pyx_v_alpha, __pyx_v_a); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 697, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __pyx_t_4 = __Pyx_PyFloat_SubtractCObj(__pyx_float_1_0, __pyx_t_9, 1.0, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 697, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __pyx_v_b0 = __pyx_t_5;
+    __pyx_t_5 = 0;
+    __pyx_v_b1 = __pyx_t_3;
+    __pyx_t_3 = 0;
+    __pyx_v_b2 = __pyx_t_4;
+    __pyx_t_4 = 0;
+
+    /* "mpfmc/core/audio/track.pyx":698
+ *     elif filter_type == 'peak':
+ *         b0, b1, b2 = 1.0 + alpha * a, -2.0 * cos_w0, 1.0 - alpha * a
+ *         a0, a1, a2 = 1.0 + alpha / a, -2.0 * cos_w0, 1.0 - alpha / a             # <<<<<<<<<<<<<<
+ *     elif filter_type == 'lowshelf':
+ *         shelf = 2.0 * sqrt(a) * alpha
+ */
+    __pyx_t_4 = __Pyx_PyNumber_Divide(__pyx_v_alpha, __pyx_v_a); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 698, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_3 = __Pyx_PyFloat_AddCObj(__pyx_float_1_0, __pyx_t_4, 1.0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 698, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = PyNumber_Multiply(__pyx_float_neg_2_0, __pyx_v_cos_w0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 698, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = __Pyx_PyNumber_Divide(__pyx_v_alpha, __pyx_v_a); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 698, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_9 = __Pyx_PyFloat_SubtractCObj(__pyx_float_1_0, __pyx_t_5, 1.0, 0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 698, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_v_a0 = __pyx_t_3;
+    __pyx_t_3 = 0;
+    __pyx_v_a1 = __pyx_t_4;
+    __pyx_t_4 = 0;
+    __pyx_v_a2 = __pyx_t_9;
+    __pyx_t_9 = 0;
+
+    /* "mpfmc/core/audio/track.pyx":696
+ *         b0, b1, b2 = (1.0 + cos_w0) / 2.0, -(1.0 + cos_w0), (1.0 + cos_w0) / 2.0
+ *         a0, a1, a2 = 1.0 + alpha, -2.0 * cos_w0, 1.0 - alpha
+ *     elif filter_type == 'peak':             # <<<<<<<<<<<<<<
+ *         b0, b1, b2 = 1.0 + alpha * a, -2.0 * cos_w0, 1.0 - alpha * a
+ *         a0, a1, a2 = 1.0 + alpha / a, -2.0 * cos_w0, 1.0 - alpha / a
+ */
+    goto __pyx_L3;
+  }
+
+  /* "mpfmc/core/audio/track.pyx":699
+ *         b0, b1, b2 = 1.0 + alpha * a, -2.0 * cos_w0, 1.0 - alpha * a
+ *         a0, a1, a2 = 1.0 + alpha / a, -2.0 * cos_w0, 1.0 - alpha / a
+ *     elif filter_type == 'lowshelf':             # <<<<<<<<<<<<<<
+ *         shelf = 2.0 * sqrt(a) * alpha
+ *         b0 = a * ((a + 1.0) - (a - 1.0) * cos_w0 + shelf)
+ */
+  __pyx_t_7 = (__Pyx_PyUnicode_Equals(__pyx_v_filter_type, __pyx_n_u_lowshelf, Py_EQ)); if (unlikely(__pyx_t_7 < 0)) __PYX_ERR(0, 699, __pyx_L1_error)
+  if (__pyx_t_7) {
+
+    /* "mpfmc/core/audio/track.pyx":700
+ *         a0, a1, a2 = 1.0 + alpha / a, -2.0 * cos_w0, 1.0 - alpha / a
+ *     elif filter_type == 'lowshelf':
+ *         shelf = 2.0 * sqrt(a) * alpha             # <<<<<<<<<<<<<<
+ *         b0 = a * ((a + 1.0) - (a - 1.0) * cos_w0 + shelf)
+ *         b1 = 2.0 * a * ((a - 1.0) - (a + 1.0) * cos_w0)
+ */
+    __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_sqrt); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 700, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_3 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+      }
+    }
+    if (!__pyx_t_3) {
+      __pyx_t_9 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_v_a); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 700, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+    } else {
+      #if CYTHON_FAST_PYCALL
+      if (PyFunction_Check(__pyx_t_4)) {
+        PyObject *__pyx_temp[2] = {__pyx_t_3, __pyx_v_a};
+        __pyx_t_9 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 700, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __Pyx_GOTREF(__pyx_t_9);
+      } else
+      #endif
+      #if CYTHON_FAST_PYCCALL
+      if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
+        PyObject *__pyx_temp[2] = {__pyx_t_3, __pyx_v_a};
+        __pyx_t_9 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 700, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __Pyx_GOTREF(__pyx_t_9);
+      } else
+      #endif
+      {
+        __pyx_t_5 = PyTuple_New(1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 700, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_3); __pyx_t_3 = NULL;
+        __Pyx_INCREF(__pyx_v_a);
+        __Pyx_GIVEREF(__pyx_v_a);
+        PyTuple_SET_ITEM(__pyx_t_5, 0+1, __pyx_v_a);
+        __pyx_t_9 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_5, NULL); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 700, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      }
+    }
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = PyNumber_Multiply(__pyx_float_2_0, __pyx_t_9); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 700, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __pyx_t_9 = PyNumber_Multiply(__pyx_t_4, __pyx_v_alpha); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 700, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_v_shelf = __pyx_t_9;
+    __pyx_t_9 = 0;
+
+    /* "mpfmc/core/audio/track.pyx":701
+ *     elif filter_type == 'lowshelf':
+ *         shelf = 2.0 * sqrt(a) * alpha
+ *         b0 = a * ((a + 1.0) - (a - 1.0) * cos_w0 + shelf)             # <<<<<<<<<<<<<<
+ *         b1 = 2.0 * a * ((a - 1.0) - (a + 1.0) * cos_w0)
+ *         b2 = a * ((a + 1.0) - (a - 1.0) * cos_w0 - shelf)
+ */
+    __pyx_t_9 = __Pyx_PyFloat_AddObjC(__pyx_v_a, __pyx_float_1_0, 1.0, 0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 701, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __pyx_t_4 = __Pyx_PyFloat_SubtractObjC(__pyx_v_a, __pyx_float_1_0, 1.0, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 701, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = PyNumber_Multiply(__pyx_t_4, __pyx_v_cos_w0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 701, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = PyNumber_Subtract(__pyx_t_9, __pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 701, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_5 = PyNumber_Add(__pyx_t_4, __pyx_v_shelf); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 701, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = PyNumber_Multiply(__pyx_v_a, __pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 701, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_v_b0 = __pyx_t_4;
+    __pyx_t_4 = 0;
+
+    /* "mpfmc/core/audio/track.pyx":702
+ *         shelf = 2.0 * sqrt(a) * alpha
+ *         b0 = a * ((a + 1.0) - (a - 1.0) * cos_w0 + shelf)
+ *         b1 = 2.0 * a * ((a - 1.0) - (a + 1.0) * cos_w0)             # <<<<<<<<<<<<<<
+ *         b2 = a * ((a + 1.0) - (a - 1.0) * cos_w0 - shelf)
+ *         a0 = (a + 1.0) + (a - 1.0) * cos_w0 + shelf
+ */
+    __pyx_t_4 = PyNumber_Multiply(__pyx_float_2_0, __pyx_v_a); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 702, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = __Pyx_PyFloat_SubtractObjC(__pyx_v_a, __pyx_float_1_0, 1.0, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 702, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_9 = __Pyx_PyFloat_AddObjC(__pyx_v_a, __pyx_float_1_0, 1.0, 0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 702, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __pyx_t_3 = PyNumber_Multiply(__pyx_t_9, __pyx_v_cos_w0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 702, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __pyx_t_9 = PyNumber_Subtract(__pyx_t_5, __pyx_t_3); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 702, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = PyNumber_Multiply(__pyx_t_4, __pyx_t_9); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 702, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __pyx_v_b1 = __pyx_t_3;
+    __pyx_t_3 = 0;
+
+    /* "mpfmc/core/audio/track.pyx":703
+ *         b0 = a * ((a + 1.0) - (a - 1.0) * cos_w0 + shelf)
+ *         b1 = 2.0 * a * ((a - 1.0) - (a + 1.0) * cos_w0)
+ *         b2 = a * ((a + 1.0) - (a - 1.0) * cos_w0 - shelf)             # <<<<<<<<<<<<<<
+ *         a0 = (a + 1.0) + (a - 1.0) * cos_w0 + shelf
+ *         a1 = -2.0 * ((a - 1.0) + (a + 1.0) * cos_w0)
+ */
+    __pyx_t_3 = __Pyx_PyFloat_AddObjC(__pyx_v_a, __pyx_float_1_0, 1.0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 703, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_9 = __Pyx_PyFloat_SubtractObjC(__pyx_v_a, __pyx_float_1_0, 1.0, 0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 703, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __pyx_t_4 = PyNumber_Multiply(__pyx_t_9, __pyx_v_cos_w0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 703, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __pyx_t_9 = PyNumber_Subtract(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 703, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = PyNumber_Subtract(__pyx_t_9, __pyx_v_shelf); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 703, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __pyx_t_9 = PyNumber_Multiply(__pyx_v_a, __pyx_t_4); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 703, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_v_b2 = __pyx_t_9;
+    __pyx_t_9 = 0;
+
+    /* "mpfmc/core/audio/track.pyx":704
+ *         b1 = 2.0 * a * ((a - 1.0) - (a + 1.0) * cos_w0)
+ *         b2 = a * ((a + 1.0) - (a - 1.0) * cos_w0 - shelf)
+ *         a0 = (a + 1.0) + (a - 1.0) * cos_w0 + shelf             # <<<<<<<<<<<<<<
+ *         a1 = -2.0 * ((a - 1.0) + (a + 1.0) * cos_w0)
+ *         a2 = (a + 1.0) + (a - 1.0) * cos_w0 - shelf
+ */
+    __pyx_t_9 = __Pyx_PyFloat_AddObjC(__pyx_v_a, __pyx_float_1_0, 1.0, 0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 704, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __pyx_t_4 = __Pyx_PyFloat_SubtractObjC(__pyx_v_a, __pyx_float_1_0, 1.0, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 704, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_3 = PyNumber_Multiply(__pyx_t_4, __pyx_v_cos_w0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 704, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = PyNumber_Add(__pyx_t_9, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 704, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = PyNumber_Add(__pyx_t_4, __pyx_v_shelf); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 704, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_v_a0 = __pyx_t_3;
+    __pyx_t_3 = 0;
+
+    /* "mpfmc/core/audio/track.pyx":705
+ *         b2 = a * ((a + 1.0) - (a - 1.0) * cos_w0 - shelf)
+ *         a0 = (a + 1.0) + (a - 1.0) * cos_w0 + shelf
+ *         a1 = -2.0 * ((a - 1.0) + (a + 1.0) * cos_w0)             # <<<<<<<<<<<<<<
+ *         a2 = (a + 1.0) + (a - 1.0) * cos_w0 - shelf
+ *     elif filter_type == 'highshelf':
+ */
+    __pyx_t_3 = __Pyx_PyFloat_SubtractObjC(__pyx_v_a, __pyx_float_1_0, 1.0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 705, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = __Pyx_PyFloat_AddObjC(__pyx_v_a, __pyx_float_1_0, 1.0, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 705, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_9 = PyNumber_Multiply(__pyx_t_4, __pyx_v_cos_w0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 705, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = PyNumber_Add(__pyx_t_3, __pyx_t_9); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 705, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __pyx_t_9 = PyNumber_Multiply(__pyx_float_neg_2_0, __pyx_t_4); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 705, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_v_a1 = __pyx_t_9;
+    __pyx_t_9 = 0;
+
+    /* "mpfmc/core/audio/track.pyx":706
+ *         a0 = (a + 1.0) + (a - 1.0) * cos_w0 + shelf
+ *         a1 = -2.0 * ((a - 1.0) + (a + 1.0) * cos_w0)
+ *         a2 = (a + 1.0) + (a - 1.0) * cos_w0 - shelf             # <<<<<<<<<<<<<<
+ *     elif filter_type == 'highshelf':
+ *         shelf = 2.0 * sqrt(a) * alpha
+ */
+    __pyx_t_9 = __Pyx_PyFloat_AddObjC(__pyx_v_a, __pyx_float_1_0, 1.0, 0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 706, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __pyx_t_4 = __Pyx_PyFloat_SubtractObjC(__pyx_v_a, __pyx_float_1_0, 1.0, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 706, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_3 = PyNumber_Multiply(__pyx_t_4, __pyx_v_cos_w0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 706, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = PyNumber_Add(__pyx_t_9, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 706, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = PyNumber_Subtract(__pyx_t_4, __pyx_v_shelf); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 706, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_v_a2 = __pyx_t_3;
+    __pyx_t_3 = 0;
+
+    /* "mpfmc/core/audio/track.pyx":699
+ *         b0, b1, b2 = 1.0 + alpha * a, -2.0 * cos_w0, 1.0 - alpha * a
+ *         a0, a1, a2 = 1.0 + alpha / a, -2.0 * cos_w0, 1.0 - alpha / a
+ *     elif filter_type == 'lowshelf':             # <<<<<<<<<<<<<<
+ *         shelf = 2.0 * sqrt(a) * alpha
+ *         b0 = a * ((a + 1.0) - (a - 1.0) * cos_w0 + shelf)
+ */
+    goto __pyx_L3;
+  }
+
+  /* "mpfmc/core/audio/track.pyx":707
+ *         a1 = -2.0 * ((a - 1.0) + (a + 1.0) * cos_w0)
+ *         a2 = (a + 1.0) + (a - 1.0) * cos_w0 - shelf
+ *     elif filter_type == 'highshelf':             # <<<<<<<<<<<<<<
+ *         shelf = 2.0 * sqrt(a) * alpha
+ *         b0 = a * ((a + 1.0) + (a - 1.0) * cos_w0 + shelf)
+ */
+  __pyx_t_7 = (__Pyx_PyUnicode_Equals(__pyx_v_filter_type, __pyx_n_u_highshelf, Py_EQ)); if (unlikely(__pyx_t_7 < 0)) __PYX_ERR(0, 707, __pyx_L1_error)
+  if (__pyx_t_7) {
+
+    /* "mpfmc/core/audio/track.pyx":708
+ *         a2 = (a + 1.0) + (a - 1.0) * cos_w0 - shelf
+ *     elif filter_type == 'highshelf':
+ *         shelf = 2.0 * sqrt(a) * alpha             # <<<<<<<<<<<<<<
+ *         b0 = a * ((a + 1.0) + (a - 1.0) * cos_w0 + shelf)
+ *         b1 = -2.0 * a * ((a - 1.0) + (a + 1.0) * cos_w0)
+ */
+    __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_sqrt); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 708, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_9 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_9)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_9);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+      }
+    }
+    if (!__pyx_t_9) {
+      __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_v_a); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 708, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+    } else {
+      #if CYTHON_FAST_PYCALL
+      if (PyFunction_Check(__pyx_t_4)) {
+        PyObject *__pyx_temp[2] = {__pyx_t_9, __pyx_v_a};
+        __pyx_t_3 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 708, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __Pyx_GOTREF(__pyx_t_3);
+      } else
+      #endif
+      #if CYTHON_FAST_PYCCALL
+      if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
+        PyObject *__pyx_temp[2] = {__pyx_t_9, __pyx_v_a};
+        __pyx_t_3 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 708, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __Pyx_GOTREF(__pyx_t_3);
+      } else
+      #endif
+      {
+        __pyx_t_5 = PyTuple_New(1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 708, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        __Pyx_GIVEREF(__pyx_t_9); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_9); __pyx_t_9 = NULL;
+        __Pyx_INCREF(__pyx_v_a);
+        __Pyx_GIVEREF(__pyx_v_a);
+        PyTuple_SET_ITEM(__pyx_t_5, 0+1, __pyx_v_a);
+        __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_5, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 708, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      }
+    }
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = PyNumber_Multiply(__pyx_float_2_0, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 708, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = PyNumber_Multiply(__pyx_t_4, __pyx_v_alpha); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 708, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_v_shelf = __pyx_t_3;
+    __pyx_t_3 = 0;
+
+    /* "mpfmc/core/audio/track.pyx":709
+ *     elif filter_type == 'highshelf':
+ *         shelf = 2.0 * sqrt(a) * alpha
+ *         b0 = a * ((a + 1.0) + (a - 1.0) * cos_w0 + shelf)             # <<<<<<<<<<<<<<
+ *         b1 = -2.0 * a * ((a - 1.0) + (a + 1.0) * cos_w0)
+ *         b2 = a * ((a + 1.0) + (a - 1.0) * cos_w0 - shelf)
+ */
+    __pyx_t_3 = __Pyx_PyFloat_AddObjC(__pyx_v_a, __pyx_float_1_0, 1.0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 709, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = __Pyx_PyFloat_SubtractObjC(__pyx_v_a, __pyx_float_1_0, 1.0, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 709, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = PyNumber_Multiply(__pyx_t_4, __pyx_v_cos_w0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 709, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = PyNumber_Add(__pyx_t_3, __pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 709, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_5 = PyNumber_Add(__pyx_t_4, __pyx_v_shelf); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 709, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = PyNumber_Multiply(__pyx_v_a, __pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 709, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_v_b0 = __pyx_t_4;
+    __pyx_t_4 = 0;
+
+    /* "mpfmc/core/audio/track.pyx":710
+ *         shelf = 2.0 * sqrt(a) * alpha
+ *         b0 = a * ((a + 1.0) + (a - 1.0) * cos_w0 + shelf)
+ *         b1 = -2.0 * a * ((a - 1.0) + (a + 1.0) * cos_w0)             # <<<<<<<<<<<<<<
+ *         b2 = a * ((a + 1.0) + (a - 1.0) * cos_w0 - shelf)
+ *         a0 = (a + 1.0) - (a - 1.0) * cos_w0 + shelf
+ */
+    __pyx_t_4 = PyNumber_Multiply(__pyx_float_neg_2_0, __pyx_v_a); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 710, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = __Pyx_PyFloat_SubtractObjC(__pyx_v_a, __pyx_float_1_0, 1.0, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 710, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_3 = __Pyx_PyFloat_AddObjC(__pyx_v_a, __pyx_float_1_0, 1.0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 710, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_9 = PyNumber_Multiply(__pyx_t_3, __pyx_v_cos_w0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 710, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = PyNumber_Add(__pyx_t_5, __pyx_t_9); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 710, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __pyx_t_9 = PyNumber_Multiply(__pyx_t_4, __pyx_t_3); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 710, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_v_b1 = __pyx_t_9;
+    __pyx_t_9 = 0;
+
+    /* "mpfmc/core/audio/track.pyx":711
+ *         b0 = a * ((a + 1.0) + (a - 1.0) * cos_w0 + shelf)
+ *         b1 = -2.0 * a * ((a - 1.0) + (a + 1.0) * cos_w0)
+ *         b2 = a * ((a + 1.0) + (a - 1.0) * cos_w0 - shelf)             # <<<<<<<<<<<<<<
+ *         a0 = (a + 1.0) - (a - 1.0) * cos_w0 + shelf
+ *         a1 = 2.0 * ((a - 1.0) - (a + 1.0) * cos_w0)
+ */
+    __pyx_t_9 = __Pyx_PyFloat_AddObjC(__pyx_v_a, __pyx_float_1_0, 1.0, 0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 711, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __pyx_t_3 = __Pyx_PyFloat_SubtractObjC(__pyx_v_a, __pyx_float_1_0, 1.0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 711, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = PyNumber_Multiply(__pyx_t_3, __pyx_v_cos_w0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 711, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = PyNumber_Add(__pyx_t_9, __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 711, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = PyNumber_Subtract(__pyx_t_3, __pyx_v_shelf); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 711, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = PyNumber_Multiply(__pyx_v_a, __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 711, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_v_b2 = __pyx_t_3;
+    __pyx_t_3 = 0;
+
+    /* "mpfmc/core/audio/track.pyx":712
+ *         b1 = -2.0 * a * ((a - 1.0) + (a + 1.0) * cos_w0)
+ *         b2 = a * ((a + 1.0) + (a - 1.0) * cos_w0 - shelf)
+ *         a0 = (a + 1.0) - (a - 1.0) * cos_w0 + shelf             # <<<<<<<<<<<<<<
+ *         a1 = 2.0 * ((a - 1.0) - (a + 1.0) * cos_w0)
+ *         a2 = (a + 1.0) - (a - 1.0) * cos_w0 - shelf
+ */
+    __pyx_t_3 = __Pyx_PyFloat_AddObjC(__pyx_v_a, __pyx_float_1_0, 1.0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 712, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = __Pyx_PyFloat_SubtractObjC(__pyx_v_a, __pyx_float_1_0, 1.0, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 712, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_9 = PyNumber_Multiply(__pyx_t_4, __pyx_v_cos_w0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 712, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = PyNumber_Subtract(__pyx_t_3, __pyx_t_9); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 712, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __pyx_t_9 = PyNumber_Add(__pyx_t_4, __pyx_v_shelf); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 712, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_v_a0 = __pyx_t_9;
+    __pyx_t_9 = 0;
+
+    /* "mpfmc/core/audio/track.pyx":713
+ *         b2 = a * ((a + 1.0) + (a - 1.0) * cos_w0 - shelf)
+ *         a0 = (a + 1.0) - (a - 1.0) * cos_w0 + shelf
+ *         a1 = 2.0 * ((a - 1.0) - (a + 1.0) * cos_w0)             # <<<<<<<<<<<<<<
+ *         a2 = (a + 1.0) - (a - 1.0) * cos_w0 - shelf
+ *     else:
+ */
+    __pyx_t_9 = __Pyx_PyFloat_SubtractObjC(__pyx_v_a, __pyx_float_1_0, 1.0, 0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 713, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __pyx_t_4 = __Pyx_PyFloat_AddObjC(__pyx_v_a, __pyx_float_1_0, 1.0, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 713, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_3 = PyNumber_Multiply(__pyx_t_4, __pyx_v_cos_w0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 713, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = PyNumber_Subtract(__pyx_t_9, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 713, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = PyNumber_Multiply(__pyx_float_2_0, __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 713, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_v_a1 = __pyx_t_3;
+    __pyx_t_3 = 0;
+
+    /* "mpfmc/core/audio/track.pyx":714
+ *         a0 = (a + 1.0) - (a - 1.0) * cos_w0 + shelf
+ *         a1 = 2.0 * ((a - 1.0) - (a + 1.0) * cos_w0)
+ *         a2 = (a + 1.0) - (a - 1.0) * cos_w0 - shelf             # <<<<<<<<<<<<<<
+ *     else:
+ *         raise AudioException("Unknown EQ filter type '{}'".format(filter_type))
+ */
+    __pyx_t_3 = __Pyx_PyFloat_AddObjC(__pyx_v_a, __pyx_float_1_0, 1.0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 714, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = __Pyx_PyFloat_SubtractObjC(__pyx_v_a, __pyx_float_1_0, 1.0, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 714, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_9 = PyNumber_Multiply(__pyx_t_4, __pyx_v_cos_w0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 714, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = PyNumber_Subtract(__pyx_t_3, __pyx_t_9); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 714, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __pyx_t_9 = PyNumber_Subtract(__pyx_t_4, __pyx_v_shelf); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 714, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_v_a2 = __pyx_t_9;
+    __pyx_t_9 = 0;
+
+    /* "mpfmc/core/audio/track.pyx":707
+ *         a1 = -2.0 * ((a - 1.0) + (a + 1.0) * cos_w0)
+ *         a2 = (a + 1.0) + (a - 1.0) * cos_w0 - shelf
+ *     elif filter_type == 'highshelf':             # <<<<<<<<<<<<<<
+ *         shelf = 2.0 * sqrt(a) * alpha
+ *         b0 = a * ((a + 1.0) + (a - 1.0) * cos_w0 + shelf)
+ */
+    goto __pyx_L3;
+  }
+
+  /* "mpfmc/core/audio/track.pyx":716
+ *         a2 = (a + 1.0) - (a - 1.0) * cos_w0 - shelf
+ *     else:
+ *         raise AudioException("Unknown EQ filter type '{}'".format(filter_type))             # <<<<<<<<<<<<<<
+ * 
+ *     biquad.b0 = b0 / a0
+ */
+  /*else*/ {
+    __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_AudioException); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 716, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Unknown_EQ_filter_type, __pyx_n_s_format); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 716, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_6 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_5);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_5, function);
+      }
+    }
+    if (!__pyx_t_6) {
+      __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_v_filter_type); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 716, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+    } else {
+      #if CYTHON_FAST_PYCALL
+      if (PyFunction_Check(__pyx_t_5)) {
+        PyObject *__pyx_temp[2] = {__pyx_t_6, __pyx_v_filter_type};
+        __pyx_t_3 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 716, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+        __Pyx_GOTREF(__pyx_t_3);
+      } else
+      #endif
+      #if CYTHON_FAST_PYCCALL
+      if (__Pyx_PyFastCFunction_Check(__pyx_t_5)) {
+        PyObject *__pyx_temp[2] = {__pyx_t_6, __pyx_v_filter_type};
+        __pyx_t_3 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 716, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+        __Pyx_GOTREF(__pyx_t_3);
+      } else
+      #endif
+      {
+        __pyx_t_10 = PyTuple_New(1+1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 716, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_10);
+        __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_10, 0, __pyx_t_6); __pyx_t_6 = NULL;
+        __Pyx_INCREF(__pyx_v_filter_type);
+        __Pyx_GIVEREF(__pyx_v_filter_type);
+        PyTuple_SET_ITEM(__pyx_t_10, 0+1, __pyx_v_filter_type);
+        __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_10, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 716, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+      }
+    }
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_5 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+      }
+    }
+    if (!__pyx_t_5) {
+      __pyx_t_9 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_3); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 716, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_GOTREF(__pyx_t_9);
+    } else {
+      #if CYTHON_FAST_PYCALL
+      if (PyFunction_Check(__pyx_t_4)) {
+        PyObject *__pyx_temp[2] = {__pyx_t_5, __pyx_t_3};
+        __pyx_t_9 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 716, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __Pyx_GOTREF(__pyx_t_9);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      } else
+      #endif
+      #if CYTHON_FAST_PYCCALL
+      if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
+        PyObject *__pyx_temp[2] = {__pyx_t_5, __pyx_t_3};
+        __pyx_t_9 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 716, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __Pyx_GOTREF(__pyx_t_9);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      } else
+      #endif
+      {
+        __pyx_t_10 = PyTuple_New(1+1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 716, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_10);
+        __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_10, 0, __pyx_t_5); __pyx_t_5 = NULL;
+        __Pyx_GIVEREF(__pyx_t_3);
+        PyTuple_SET_ITEM(__pyx_t_10, 0+1, __pyx_t_3);
+        __pyx_t_3 = 0;
+        __pyx_t_9 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_10, NULL); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 716, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+      }
+    }
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_Raise(__pyx_t_9, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __PYX_ERR(0, 716, __pyx_L1_error)
+  }
+  __pyx_L3:;
+
+  /* "mpfmc/core/audio/track.pyx":718
+ *         raise AudioException("Unknown EQ filter type '{}'".format(filter_type))
+ * 
+ *     biquad.b0 = b0 / a0             # <<<<<<<<<<<<<<
+ *     biquad.b1 = b1 / a0
+ *     biquad.b2 = b2 / a0
+ */
+  __pyx_t_9 = __Pyx_PyNumber_Divide(__pyx_v_b0, __pyx_v_a0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 718, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __pyx_t_11 = __pyx_PyFloat_AsFloat(__pyx_t_9); if (unlikely((__pyx_t_11 == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 718, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __pyx_v_biquad->b0 = __pyx_t_11;
+
+  /* "mpfmc/core/audio/track.pyx":719
+ * 
+ *     biquad.b0 = b0 / a0
+ *     biquad.b1 = b1 / a0             # <<<<<<<<<<<<<<
+ *     biquad.b2 = b2 / a0
+ *     biquad.a1 = a1 / a0
+ */
+  __pyx_t_9 = __Pyx_PyNumber_Divide(__pyx_v_b1, __pyx_v_a0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 719, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __pyx_t_11 = __pyx_PyFloat_AsFloat(__pyx_t_9); if (unlikely((__pyx_t_11 == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 719, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __pyx_v_biquad->b1 = __pyx_t_11;
+
+  /* "mpfmc/core/audio/track.pyx":720
+ *     biquad.b0 = b0 / a0
+ *     biquad.b1 = b1 / a0
+ *     biquad.b2 = b2 / a0             # <<<<<<<<<<<<<<
+ *     biquad.a1 = a1 / a0
+ *     biquad.a2 = a2 / a0
+ */
+  __pyx_t_9 = __Pyx_PyNumber_Divide(__pyx_v_b2, __pyx_v_a0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 720, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __pyx_t_11 = __pyx_PyFloat_AsFloat(__pyx_t_9); if (unlikely((__pyx_t_11 == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 720, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __pyx_v_biquad->b2 = __pyx_t_11;
+
+  /* "mpfmc/core/audio/track.pyx":721
+ *     biquad.b1 = b1 / a0
+ *     biquad.b2 = b2 / a0
+ *     biquad.a1 = a1 / a0             # <<<<<<<<<<<<<<
+ *     biquad.a2 = a2 / a0
+ */
+  __pyx_t_9 = __Pyx_PyNumber_Divide(__pyx_v_a1, __pyx_v_a0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 721, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __pyx_t_11 = __pyx_PyFloat_AsFloat(__pyx_t_9); if (unlikely((__pyx_t_11 == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 721, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __pyx_v_biquad->a1 = __pyx_t_11;
+
+  /* "mpfmc/core/audio/track.pyx":722
+ *     biquad.b2 = b2 / a0
+ *     biquad.a1 = a1 / a0
+ *     biquad.a2 = a2 / a0             # <<<<<<<<<<<<<<
+ */
+  __pyx_t_9 = __Pyx_PyNumber_Divide(__pyx_v_a2, __pyx_v_a0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 722, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __pyx_t_11 = __pyx_PyFloat_AsFloat(__pyx_t_9); if (unlikely((__pyx_t_11 == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 722, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __pyx_v_biquad->a2 = __pyx_t_11;
+
+  /* "mpfmc/core/audio/track.pyx":674
+ *     PyMem_Free(chain)
+ * 
+ * cdef _set_biquad_coefficients(BiquadSettings *biquad, dict settings, int sample_rate):             # <<<<<<<<<<<<<<
+ *     """
+ *     Calculates normalized biquad filter coefficients (see the Audio EQ Cookbook by Robert
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_AddTraceback("mpfmc.core.audio.track._set_biquad_coefficients", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
   __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_frequency);
+  __Pyx_XDECREF(__pyx_v_a);
+  __Pyx_XDECREF(__pyx_v_w0);
+  __Pyx_XDECREF(__pyx_v_cos_w0);
+  __Pyx_XDECREF(__pyx_v_alpha);
+  __Pyx_XDECREF(__pyx_v_filter_type);
+  __Pyx_XDECREF(__pyx_v_b0);
+  __Pyx_XDECREF(__pyx_v_b1);
+  __Pyx_XDECREF(__pyx_v_b2);
+  __Pyx_XDECREF(__pyx_v_a0);
+  __Pyx_XDECREF(__pyx_v_a1);
+  __Pyx_XDECREF(__pyx_v_a2);
+  __Pyx_XDECREF(__pyx_v_shelf);
+  __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
-  #if CYTHON_PEP489_MULTI_PHASE_INIT
-  return (__pyx_m != NULL) ? 0 : -1;
-  #elif PY_MAJOR_VERSION >= 3
-  return __pyx_m;
-  #else
-  return;
-  #endif
+  return __pyx_r;
 }
 
-/* --- Runtime support code --- */
-/* Refnanny */
-#if CYTHON_REFNANNY
-static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
-    PyObject *m = NULL, *p = NULL;
-    void *r = NULL;
-    m = PyImport_ImportModule((char *)modname);
-    if (!m) goto end;
-    p = PyObject_GetAttrString(m, (char *)"RefNannyAPI");
-    if (!p) goto end;
-    r = PyLong_AsVoidPtr(p);
-end:
-    Py_XDECREF(p);
-    Py_XDECREF(m);
-    return (__Pyx_RefNannyAPIStruct *)r;
+/* "mpfmc/core/audio/dsp.pxd":74
+ * # ---------------------------------------------------------------------------
+ * 
+ * cdef inline void process_biquad(BiquadSettings *biquad, float *buffer, Uint32 frames, int channels) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Applies a biquad filter to a block of interleaved samples.
+ */
+
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_3dsp_process_biquad(__pyx_t_5mpfmc_4core_5audio_3dsp_BiquadSettings *__pyx_v_biquad, float *__pyx_v_buffer, Uint32 __pyx_v_frames, int __pyx_v_channels) {
+  CYTHON_UNUSED Uint32 __pyx_v_frame;
+  int __pyx_v_channel;
+  float __pyx_v_x;
+  float __pyx_v_y;
+  float *__pyx_v_sample;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  Uint32 __pyx_t_3;
+  Uint32 __pyx_t_4;
+
+  /* "mpfmc/core/audio/dsp.pxd":88
+ *     cdef float *sample
+ * 
+ *     for channel in range(channels):             # <<<<<<<<<<<<<<
+ *         sample = buffer + channel
+ *         for frame in range(frames):
+ */
+  __pyx_t_1 = __pyx_v_channels;
+  for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
+    __pyx_v_channel = __pyx_t_2;
+
+    /* "mpfmc/core/audio/dsp.pxd":89
+ * 
+ *     for channel in range(channels):
+ *         sample = buffer + channel             # <<<<<<<<<<<<<<
+ *         for frame in range(frames):
+ *             x = sample[0]
+ */
+    __pyx_v_sample = (__pyx_v_buffer + __pyx_v_channel);
+
+    /* "mpfmc/core/audio/dsp.pxd":90
+ *     for channel in range(channels):
+ *         sample = buffer + channel
+ *         for frame in range(frames):             # <<<<<<<<<<<<<<
+ *             x = sample[0]
+ *             y = biquad.b0 * x + biquad.z1[channel]
+ */
+    __pyx_t_3 = __pyx_v_frames;
+    for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+      __pyx_v_frame = __pyx_t_4;
+
+      /* "mpfmc/core/audio/dsp.pxd":91
+ *         sample = buffer + channel
+ *         for frame in range(frames):
+ *             x = sample[0]             # <<<<<<<<<<<<<<
+ *             y = biquad.b0 * x + biquad.z1[channel]
+ *             biquad.z1[channel] = biquad.b1 * x - biquad.a1 * y + biquad.z2[channel]
+ */
+      __pyx_v_x = (__pyx_v_sample[0]);
+
+      /* "mpfmc/core/audio/dsp.pxd":92
+ *         for frame in range(frames):
+ *             x = sample[0]
+ *             y = biquad.b0 * x + biquad.z1[channel]             # <<<<<<<<<<<<<<
+ *             biquad.z1[channel] = biquad.b1 * x - biquad.a1 * y + biquad.z2[channel]
+ *             biquad.z2[channel] = biquad.b2 * x - biquad.a2 * y
+ */
+      __pyx_v_y = ((__pyx_v_biquad->b0 * __pyx_v_x) + (__pyx_v_biquad->z1[__pyx_v_channel]));
+
+      /* "mpfmc/core/audio/dsp.pxd":93
+ *             x = sample[0]
+ *             y = biquad.b0 * x + biquad.z1[channel]
+ *             biquad.z1[channel] = biquad.b1 * x - biquad.a1 * y + biquad.z2[channel]             # <<<<<<<<<<<<<<
+ *             biquad.z2[channel] = biquad.b2 * x - biquad.a2 * y
+ *             sample[0] = y
+ */
+      (__pyx_v_biquad->z1[__pyx_v_channel]) = (((__pyx_v_biquad->b1 * __pyx_v_x) - (__pyx_v_biquad->a1 * __pyx_v_y)) + (__pyx_v_biquad->z2[__pyx_v_channel]));
+
+      /* "mpfmc/core/audio/dsp.pxd":94
+ *             y = biquad.b0 * x + biquad.z1[channel]
+ *             biquad.z1[channel] = biquad.b1 * x - biquad.a1 * y + biquad.z2[channel]
+ *             biquad.z2[channel] = biquad.b2 * x - biquad.a2 * y             # <<<<<<<<<<<<<<
+ *             sample[0] = y
+ *             sample += channels
+ */
+      (__pyx_v_biquad->z2[__pyx_v_channel]) = ((__pyx_v_biquad->b2 * __pyx_v_x) - (__pyx_v_biquad->a2 * __pyx_v_y));
+
+      /* "mpfmc/core/audio/dsp.pxd":95
+ *             biquad.z1[channel] = biquad.b1 * x - biquad.a1 * y + biquad.z2[channel]
+ *             biquad.z2[channel] = biquad.b2 * x - biquad.a2 * y
+ *             sample[0] = y             # <<<<<<<<<<<<<<
+ *             sample += channels
+ * 
+ */
+      (__pyx_v_sample[0]) = __pyx_v_y;
+
+      /* "mpfmc/core/audio/dsp.pxd":96
+ *             biquad.z2[channel] = biquad.b2 * x - biquad.a2 * y
+ *             sample[0] = y
+ *             sample += channels             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void process_limiter(LimiterSettings *limiter, float *buffer, Uint32 frames, int channels) nogil:
+ */
+      __pyx_v_sample = (__pyx_v_sample + __pyx_v_channels);
+    }
+  }
+
+  /* "mpfmc/core/audio/dsp.pxd":74
+ * # ---------------------------------------------------------------------------
+ * 
+ * cdef inline void process_biquad(BiquadSettings *biquad, float *buffer, Uint32 frames, int channels) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Applies a biquad filter to a block of interleaved samples.
+ */
+
+  /* function exit code */
 }
-#endif
+
+/* "mpfmc/core/audio/dsp.pxd":98
+ *             sample += channels
+ * 
+ * cdef inline void process_limiter(LimiterSettings *limiter, float *buffer, Uint32 frames, int channels) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Applies a peak limiter to a block of interleaved samples.
+ */
+
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_3dsp_process_limiter(__pyx_t_5mpfmc_4core_5audio_3dsp_LimiterSettings *__pyx_v_limiter, float *__pyx_v_buffer, Uint32 __pyx_v_frames, int __pyx_v_channels) {
+  CYTHON_UNUSED Uint32 __pyx_v_frame;
+  int __pyx_v_channel;
+  float __pyx_v_peak;
+  float __pyx_v_value;
+  float __pyx_v_target_gain;
+  float *__pyx_v_sample;
+  Uint32 __pyx_t_1;
+  Uint32 __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  float __pyx_t_5;
+  int __pyx_t_6;
+  double __pyx_t_7;
+  int __pyx_t_8;
+
+  /* "mpfmc/core/audio/dsp.pxd":110
+ *     cdef int channel
+ *     cdef float peak, value, target_gain
+ *     cdef float *sample = buffer             # <<<<<<<<<<<<<<
+ * 
+ *     for frame in range(frames):
+ */
+  __pyx_v_sample = __pyx_v_buffer;
+
+  /* "mpfmc/core/audio/dsp.pxd":112
+ *     cdef float *sample = buffer
+ * 
+ *     for frame in range(frames):             # <<<<<<<<<<<<<<
+ *         peak = 0.0
+ *         for channel in range(channels):
+ */
+  __pyx_t_1 = __pyx_v_frames;
+  for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
+    __pyx_v_frame = __pyx_t_2;
+
+    /* "mpfmc/core/audio/dsp.pxd":113
+ * 
+ *     for frame in range(frames):
+ *         peak = 0.0             # <<<<<<<<<<<<<<
+ *         for channel in range(channels):
+ *             value = sample[channel] if sample[channel] >= 0.0 else -sample[channel]
+ */
+    __pyx_v_peak = 0.0;
+
+    /* "mpfmc/core/audio/dsp.pxd":114
+ *     for frame in range(frames):
+ *         peak = 0.0
+ *         for channel in range(channels):             # <<<<<<<<<<<<<<
+ *             value = sample[channel] if sample[channel] >= 0.0 else -sample[channel]
+ *             if value > peak:
+ */
+    __pyx_t_3 = __pyx_v_channels;
+    for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+      __pyx_v_channel = __pyx_t_4;
+
+      /* "mpfmc/core/audio/dsp.pxd":115
+ *         peak = 0.0
+ *         for channel in range(channels):
+ *             value = sample[channel] if sample[channel] >= 0.0 else -sample[channel]             # <<<<<<<<<<<<<<
+ *             if value > peak:
+ *                 peak = value
+ */
+      if ((((__pyx_v_sample[__pyx_v_channel]) >= 0.0) != 0)) {
+        __pyx_t_5 = (__pyx_v_sample[__pyx_v_channel]);
+      } else {
+        __pyx_t_5 = (-(__pyx_v_sample[__pyx_v_channel]));
+      }
+      __pyx_v_value = __pyx_t_5;
+
+      /* "mpfmc/core/audio/dsp.pxd":116
+ *         for channel in range(channels):
+ *             value = sample[channel] if sample[channel] >= 0.0 else -sample[channel]
+ *             if value > peak:             # <<<<<<<<<<<<<<
+ *                 peak = value
+ * 
+ */
+      __pyx_t_6 = ((__pyx_v_value > __pyx_v_peak) != 0);
+      if (__pyx_t_6) {
+
+        /* "mpfmc/core/audio/dsp.pxd":117
+ *             value = sample[channel] if sample[channel] >= 0.0 else -sample[channel]
+ *             if value > peak:
+ *                 peak = value             # <<<<<<<<<<<<<<
+ * 
+ *         # Attack is instantaneous, release is exponential
+ */
+        __pyx_v_peak = __pyx_v_value;
+
+        /* "mpfmc/core/audio/dsp.pxd":116
+ *         for channel in range(channels):
+ *             value = sample[channel] if sample[channel] >= 0.0 else -sample[channel]
+ *             if value > peak:             # <<<<<<<<<<<<<<
+ *                 peak = value
+ * 
+ */
+      }
+    }
+
+    /* "mpfmc/core/audio/dsp.pxd":120
+ * 
+ *         # Attack is instantaneous, release is exponential
+ *         target_gain = limiter.threshold / peak if peak > limiter.threshold else 1.0             # <<<<<<<<<<<<<<
+ *         if target_gain < limiter.gain:
+ *             limiter.gain = target_gain
+ */
+    if (((__pyx_v_peak > __pyx_v_limiter->threshold) != 0)) {
+      if (unlikely(__pyx_v_peak == 0)) {
+        #ifdef WITH_THREAD
+        PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+        #endif
+        PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+        #ifdef WITH_THREAD
+        __Pyx_PyGILState_Release(__pyx_gilstate_save);
+        #endif
+        __PYX_ERR(2, 120, __pyx_L1_error)
+      }
+      __pyx_t_7 = (__pyx_v_limiter->threshold / __pyx_v_peak);
+    } else {
+      __pyx_t_7 = 1.0;
+    }
+    __pyx_v_target_gain = __pyx_t_7;
+
+    /* "mpfmc/core/audio/dsp.pxd":121
+ *         # Attack is instantaneous, release is exponential
+ *         target_gain = limiter.threshold / peak if peak > limiter.threshold else 1.0
+ *         if target_gain < limiter.gain:             # <<<<<<<<<<<<<<
+ *             limiter.gain = target_gain
+ *         else:
+ */
+    __pyx_t_6 = ((__pyx_v_target_gain < __pyx_v_limiter->gain) != 0);
+    if (__pyx_t_6) {
+
+      /* "mpfmc/core/audio/dsp.pxd":122
+ *         target_gain = limiter.threshold / peak if peak > limiter.threshold else 1.0
+ *         if target_gain < limiter.gain:
+ *             limiter.gain = target_gain             # <<<<<<<<<<<<<<
+ *         else:
+ *             limiter.gain = target_gain + (limiter.gain - target_gain) * limiter.release_coefficient
+ */
+      __pyx_v_limiter->gain = __pyx_v_target_gain;
+
+      /* "mpfmc/core/audio/dsp.pxd":121
+ *         # Attack is instantaneous, release is exponential
+ *         target_gain = limiter.threshold / peak if peak > limiter.threshold else 1.0
+ *         if target_gain < limiter.gain:             # <<<<<<<<<<<<<<
+ *             limiter.gain = target_gain
+ *         else:
+ */
+      goto __pyx_L8;
+    }
+
+    /* "mpfmc/core/audio/dsp.pxd":124
+ *             limiter.gain = target_gain
+ *         else:
+ *             limiter.gain = target_gain + (limiter.gain - target_gain) * limiter.release_coefficient             # <<<<<<<<<<<<<<
+ * 
+ *         for channel in range(channels):
+ */
+    /*else*/ {
+      __pyx_v_limiter->gain = (__pyx_v_target_gain + ((__pyx_v_limiter->gain - __pyx_v_target_gain) * __pyx_v_limiter->release_coefficient));
+    }
+    __pyx_L8:;
+
+    /* "mpfmc/core/audio/dsp.pxd":126
+ *             limiter.gain = target_gain + (limiter.gain - target_gain) * limiter.release_coefficient
+ * 
+ *         for channel in range(channels):             # <<<<<<<<<<<<<<
+ *             sample[channel] *= limiter.gain
+ *         sample += channels
+ */
+    __pyx_t_3 = __pyx_v_channels;
+    for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+      __pyx_v_channel = __pyx_t_4;
+
+      /* "mpfmc/core/audio/dsp.pxd":127
+ * 
+ *         for channel in range(channels):
+ *             sample[channel] *= limiter.gain             # <<<<<<<<<<<<<<
+ *         sample += channels
+ * 
+ */
+      __pyx_t_8 = __pyx_v_channel;
+      (__pyx_v_sample[__pyx_t_8]) = ((__pyx_v_sample[__pyx_t_8]) * __pyx_v_limiter->gain);
+    }
+
+    /* "mpfmc/core/audio/dsp.pxd":128
+ *         for channel in range(channels):
+ *             sample[channel] *= limiter.gain
+ *         sample += channels             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void process_reverb(ReverbSettings *reverb, float *buffer, Uint32 frames, int channels) nogil:
+ */
+    __pyx_v_sample = (__pyx_v_sample + __pyx_v_channels);
+  }
+
+  /* "mpfmc/core/audio/dsp.pxd":98
+ *             sample += channels
+ * 
+ * cdef inline void process_limiter(LimiterSettings *limiter, float *buffer, Uint32 frames, int channels) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Applies a peak limiter to a block of interleaved samples.
+ */
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_WriteUnraisable("mpfmc.core.audio.dsp.process_limiter", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 1);
+  __pyx_L0:;
+}
+
+/* "mpfmc/core/audio/dsp.pxd":130
+ *         sample += channels
+ * 
+ * cdef inline void process_reverb(ReverbSettings *reverb, float *buffer, Uint32 frames, int channels) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Applies a simple (mono) reverb to a block of interleaved samples.
+ */
+
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_3dsp_process_reverb(__pyx_t_5mpfmc_4core_5audio_3dsp_ReverbSettings *__pyx_v_reverb, float *__pyx_v_buffer, Uint32 __pyx_v_frames, int __pyx_v_channels) {
+  CYTHON_UNUSED Uint32 __pyx_v_frame;
+  int __pyx_v_channel;
+  int __pyx_v_index;
+  float __pyx_v_input_value;
+  float __pyx_v_output_value;
+  float __pyx_v_delayed;
+  float *__pyx_v_sample;
+  Uint32 __pyx_t_1;
+  Uint32 __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+
+  /* "mpfmc/core/audio/dsp.pxd":142
+ *     cdef int channel, index
+ *     cdef float input_value, output_value, delayed
+ *     cdef float *sample = buffer             # <<<<<<<<<<<<<<
+ * 
+ *     for frame in range(frames):
+ */
+  __pyx_v_sample = __pyx_v_buffer;
+
+  /* "mpfmc/core/audio/dsp.pxd":144
+ *     cdef float *sample = buffer
+ * 
+ *     for frame in range(frames):             # <<<<<<<<<<<<<<
+ *         input_value = 0.0
+ *         for channel in range(channels):
+ */
+  __pyx_t_1 = __pyx_v_frames;
+  for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
+    __pyx_v_frame = __pyx_t_2;
+
+    /* "mpfmc/core/audio/dsp.pxd":145
+ * 
+ *     for frame in range(frames):
+ *         input_value = 0.0             # <<<<<<<<<<<<<<
+ *         for channel in range(channels):
+ *             input_value += sample[channel]
+ */
+    __pyx_v_input_value = 0.0;
+
+    /* "mpfmc/core/audio/dsp.pxd":146
+ *     for frame in range(frames):
+ *         input_value = 0.0
+ *         for channel in range(channels):             # <<<<<<<<<<<<<<
+ *             input_value += sample[channel]
+ *         input_value /= channels
+ */
+    __pyx_t_3 = __pyx_v_channels;
+    for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+      __pyx_v_channel = __pyx_t_4;
+
+      /* "mpfmc/core/audio/dsp.pxd":147
+ *         input_value = 0.0
+ *         for channel in range(channels):
+ *             input_value += sample[channel]             # <<<<<<<<<<<<<<
+ *         input_value /= channels
+ * 
+ */
+      __pyx_v_input_value = (__pyx_v_input_value + (__pyx_v_sample[__pyx_v_channel]));
+    }
+
+    /* "mpfmc/core/audio/dsp.pxd":148
+ *         for channel in range(channels):
+ *             input_value += sample[channel]
+ *         input_value /= channels             # <<<<<<<<<<<<<<
+ * 
+ *         # Parallel damped comb filters
+ */
+    if (unlikely(__pyx_v_channels == 0)) {
+      #ifdef WITH_THREAD
+      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+      #endif
+      PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+      #ifdef WITH_THREAD
+      __Pyx_PyGILState_Release(__pyx_gilstate_save);
+      #endif
+      __PYX_ERR(2, 148, __pyx_L1_error)
+    }
+    __pyx_v_input_value = (__pyx_v_input_value / __pyx_v_channels);
+
+    /* "mpfmc/core/audio/dsp.pxd":151
+ * 
+ *         # Parallel damped comb filters
+ *         output_value = 0.0             # <<<<<<<<<<<<<<
+ *         for index in range(DSP_REVERB_COMB_COUNT):
+ *             delayed = reverb.comb_buffers[index][reverb.comb_positions[index]]
+ */
+    __pyx_v_output_value = 0.0;
+
+    /* "mpfmc/core/audio/dsp.pxd":152
+ *         # Parallel damped comb filters
+ *         output_value = 0.0
+ *         for index in range(DSP_REVERB_COMB_COUNT):             # <<<<<<<<<<<<<<
+ *             delayed = reverb.comb_buffers[index][reverb.comb_positions[index]]
+ *             reverb.comb_filter_stores[index] = delayed * (1.0 - reverb.damping) + reverb.comb_filter_stores[index] * reverb.damping
+ */
+    __pyx_t_5 = __pyx_e_5mpfmc_4core_5audio_3dsp_DSP_REVERB_COMB_COUNT;
+    for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_5; __pyx_t_3+=1) {
+      __pyx_v_index = __pyx_t_3;
+
+      /* "mpfmc/core/audio/dsp.pxd":153
+ *         output_value = 0.0
+ *         for index in range(DSP_REVERB_COMB_COUNT):
+ *             delayed = reverb.comb_buffers[index][reverb.comb_positions[index]]             # <<<<<<<<<<<<<<
+ *             reverb.comb_filter_stores[index] = delayed * (1.0 - reverb.damping) + reverb.comb_filter_stores[index] * reverb.damping
+ *             reverb.comb_buffers[index][reverb.comb_positions[index]] = input_value + reverb.comb_filter_stores[index] * reverb.feedback
+ */
+      __pyx_v_delayed = ((__pyx_v_reverb->comb_buffers[__pyx_v_index])[(__pyx_v_reverb->comb_positions[__pyx_v_index])]);
+
+      /* "mpfmc/core/audio/dsp.pxd":154
+ *         for index in range(DSP_REVERB_COMB_COUNT):
+ *             delayed = reverb.comb_buffers[index][reverb.comb_positions[index]]
+ *             reverb.comb_filter_stores[index] = delayed * (1.0 - reverb.damping) + reverb.comb_filter_stores[index] * reverb.damping             # <<<<<<<<<<<<<<
+ *             reverb.comb_buffers[index][reverb.comb_positions[index]] = input_value + reverb.comb_filter_stores[index] * reverb.feedback
+ *             reverb.comb_positions[index] += 1
+ */
+      (__pyx_v_reverb->comb_filter_stores[__pyx_v_index]) = ((__pyx_v_delayed * (1.0 - __pyx_v_reverb->damping)) + ((__pyx_v_reverb->comb_filter_stores[__pyx_v_index]) * __pyx_v_reverb->damping));
+
+      /* "mpfmc/core/audio/dsp.pxd":155
+ *             delayed = reverb.comb_buffers[index][reverb.comb_positions[index]]
+ *             reverb.comb_filter_stores[index] = delayed * (1.0 - reverb.damping) + reverb.comb_filter_stores[index] * reverb.damping
+ *             reverb.comb_buffers[index][reverb.comb_positions[index]] = input_value + reverb.comb_filter_stores[index] * reverb.feedback             # <<<<<<<<<<<<<<
+ *             reverb.comb_positions[index] += 1
+ *             if reverb.comb_positions[index] >= reverb.comb_lengths[index]:
+ */
+      ((__pyx_v_reverb->comb_buffers[__pyx_v_index])[(__pyx_v_reverb->comb_positions[__pyx_v_index])]) = (__pyx_v_input_value + ((__pyx_v_reverb->comb_filter_stores[__pyx_v_index]) * __pyx_v_reverb->feedback));
+
+      /* "mpfmc/core/audio/dsp.pxd":156
+ *             reverb.comb_filter_stores[index] = delayed * (1.0 - reverb.damping) + reverb.comb_filter_stores[index] * reverb.damping
+ *             reverb.comb_buffers[index][reverb.comb_positions[index]] = input_value + reverb.comb_filter_stores[index] * reverb.feedback
+ *             reverb.comb_positions[index] += 1             # <<<<<<<<<<<<<<
+ *             if reverb.comb_positions[index] >= reverb.comb_lengths[index]:
+ *                 reverb.comb_positions[index] = 0
+ */
+      __pyx_t_4 = __pyx_v_index;
+      (__pyx_v_reverb->comb_positions[__pyx_t_4]) = ((__pyx_v_reverb->comb_positions[__pyx_t_4]) + 1);
+
+      /* "mpfmc/core/audio/dsp.pxd":157
+ *             reverb.comb_buffers[index][reverb.comb_positions[index]] = input_value + reverb.comb_filter_stores[index] * reverb.feedback
+ *             reverb.comb_positions[index] += 1
+ *             if reverb.comb_positions[index] >= reverb.comb_lengths[index]:             # <<<<<<<<<<<<<<
+ *                 reverb.comb_positions[index] = 0
+ *             output_value += delayed
+ */
+      __pyx_t_6 = (((__pyx_v_reverb->comb_positions[__pyx_v_index]) >= (__pyx_v_reverb->comb_lengths[__pyx_v_index])) != 0);
+      if (__pyx_t_6) {
+
+        /* "mpfmc/core/audio/dsp.pxd":158
+ *             reverb.comb_positions[index] += 1
+ *             if reverb.comb_positions[index] >= reverb.comb_lengths[index]:
+ *                 reverb.comb_positions[index] = 0             # <<<<<<<<<<<<<<
+ *             output_value += delayed
+ *         output_value /= DSP_REVERB_COMB_COUNT
+ */
+        (__pyx_v_reverb->comb_positions[__pyx_v_index]) = 0;
+
+        /* "mpfmc/core/audio/dsp.pxd":157
+ *             reverb.comb_buffers[index][reverb.comb_positions[index]] = input_value + reverb.comb_filter_stores[index] * reverb.feedback
+ *             reverb.comb_positions[index] += 1
+ *             if reverb.comb_positions[index] >= reverb.comb_lengths[index]:             # <<<<<<<<<<<<<<
+ *                 reverb.comb_positions[index] = 0
+ *             output_value += delayed
+ */
+      }
+
+      /* "mpfmc/core/audio/dsp.pxd":159
+ *             if reverb.comb_positions[index] >= reverb.comb_lengths[index]:
+ *                 reverb.comb_positions[index] = 0
+ *             output_value += delayed             # <<<<<<<<<<<<<<
+ *         output_value /= DSP_REVERB_COMB_COUNT
+ * 
+ */
+      __pyx_v_output_value = (__pyx_v_output_value + __pyx_v_delayed);
+    }
+
+    /* "mpfmc/core/audio/dsp.pxd":160
+ *                 reverb.comb_positions[index] = 0
+ *             output_value += delayed
+ *         output_value /= DSP_REVERB_COMB_COUNT             # <<<<<<<<<<<<<<
+ * 
+ *         # Series allpass filters
+ */
+    if (unlikely(__pyx_e_5mpfmc_4core_5audio_3dsp_DSP_REVERB_COMB_COUNT == 0)) {
+      #ifdef WITH_THREAD
+      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+      #endif
+      PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+      #ifdef WITH_THREAD
+      __Pyx_PyGILState_Release(__pyx_gilstate_save);
+      #endif
+      __PYX_ERR(2, 160, __pyx_L1_error)
+    }
+    __pyx_v_output_value = (__pyx_v_output_value / __pyx_e_5mpfmc_4core_5audio_3dsp_DSP_REVERB_COMB_COUNT);
+
+    /* "mpfmc/core/audio/dsp.pxd":163
+ * 
+ *         # Series allpass filters
+ *         for index in range(DSP_REVERB_ALLPASS_COUNT):             # <<<<<<<<<<<<<<
+ *             delayed = reverb.allpass_buffers[index][reverb.allpass_positions[index]]
+ *             reverb.allpass_buffers[index][reverb.allpass_positions[index]] = output_value + delayed * 0.5
+ */
+    __pyx_t_5 = __pyx_e_5mpfmc_4core_5audio_3dsp_DSP_REVERB_ALLPASS_COUNT;
+    for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_5; __pyx_t_3+=1) {
+      __pyx_v_index = __pyx_t_3;
+
+      /* "mpfmc/core/audio/dsp.pxd":164
+ *         # Series allpass filters
+ *         for index in range(DSP_REVERB_ALLPASS_COUNT):
+ *             delayed = reverb.allpass_buffers[index][reverb.allpass_positions[index]]             # <<<<<<<<<<<<<<
+ *             reverb.allpass_buffers[index][reverb.allpass_positions[index]] = output_value + delayed * 0.5
+ *             output_value = delayed - output_value
+ */
+      __pyx_v_delayed = ((__pyx_v_reverb->allpass_buffers[__pyx_v_index])[(__pyx_v_reverb->allpass_positions[__pyx_v_index])]);
+
+      /* "mpfmc/core/audio/dsp.pxd":165
+ *         for index in range(DSP_REVERB_ALLPASS_COUNT):
+ *             delayed = reverb.allpass_buffers[index][reverb.allpass_positions[index]]
+ *             reverb.allpass_buffers[index][reverb.allpass_positions[index]] = output_value + delayed * 0.5             # <<<<<<<<<<<<<<
+ *             output_value = delayed - output_value
+ *             reverb.allpass_positions[index] += 1
+ */
+      ((__pyx_v_reverb->allpass_buffers[__pyx_v_index])[(__pyx_v_reverb->allpass_positions[__pyx_v_index])]) = (__pyx_v_output_value + (__pyx_v_delayed * 0.5));
+
+      /* "mpfmc/core/audio/dsp.pxd":166
+ *             delayed = reverb.allpass_buffers[index][reverb.allpass_positions[index]]
+ *             reverb.allpass_buffers[index][reverb.allpass_positions[index]] = output_value + delayed * 0.5
+ *             output_value = delayed - output_value             # <<<<<<<<<<<<<<
+ *             reverb.allpass_positions[index] += 1
+ *             if reverb.allpass_positions[index] >= reverb.allpass_lengths[index]:
+ */
+      __pyx_v_output_value = (__pyx_v_delayed - __pyx_v_output_value);
+
+      /* "mpfmc/core/audio/dsp.pxd":167
+ *             reverb.allpass_buffers[index][reverb.allpass_positions[index]] = output_value + delayed * 0.5
+ *             output_value = delayed - output_value
+ *             reverb.allpass_positions[index] += 1             # <<<<<<<<<<<<<<
+ *             if reverb.allpass_positions[index] >= reverb.allpass_lengths[index]:
+ *                 reverb.allpass_positions[index] = 0
+ */
+      __pyx_t_4 = __pyx_v_index;
+      (__pyx_v_reverb->allpass_positions[__pyx_t_4]) = ((__pyx_v_reverb->allpass_positions[__pyx_t_4]) + 1);
+
+      /* "mpfmc/core/audio/dsp.pxd":168
+ *             output_value = delayed - output_value
+ *             reverb.allpass_positions[index] += 1
+ *             if reverb.allpass_positions[index] >= reverb.allpass_lengths[index]:             # <<<<<<<<<<<<<<
+ *                 reverb.allpass_positions[index] = 0
+ * 
+ */
+      __pyx_t_6 = (((__pyx_v_reverb->allpass_positions[__pyx_v_index]) >= (__pyx_v_reverb->allpass_lengths[__pyx_v_index])) != 0);
+      if (__pyx_t_6) {
+
+        /* "mpfmc/core/audio/dsp.pxd":169
+ *             reverb.allpass_positions[index] += 1
+ *             if reverb.allpass_positions[index] >= reverb.allpass_lengths[index]:
+ *                 reverb.allpass_positions[index] = 0             # <<<<<<<<<<<<<<
+ * 
+ *         for channel in range(channels):
+ */
+        (__pyx_v_reverb->allpass_positions[__pyx_v_index]) = 0;
+
+        /* "mpfmc/core/audio/dsp.pxd":168
+ *             output_value = delayed - output_value
+ *             reverb.allpass_positions[index] += 1
+ *             if reverb.allpass_positions[index] >= reverb.allpass_lengths[index]:             # <<<<<<<<<<<<<<
+ *                 reverb.allpass_positions[index] = 0
+ * 
+ */
+      }
+    }
+
+    /* "mpfmc/core/audio/dsp.pxd":171
+ *                 reverb.allpass_positions[index] = 0
+ * 
+ *         for channel in range(channels):             # <<<<<<<<<<<<<<
+ *             sample[channel] = sample[channel] * reverb.dry + output_value * reverb.wet
+ *         sample += channels
+ */
+    __pyx_t_3 = __pyx_v_channels;
+    for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+      __pyx_v_channel = __pyx_t_4;
+
+      /* "mpfmc/core/audio/dsp.pxd":172
+ * 
+ *         for channel in range(channels):
+ *             sample[channel] = sample[channel] * reverb.dry + output_value * reverb.wet             # <<<<<<<<<<<<<<
+ *         sample += channels
+ * 
+ */
+      (__pyx_v_sample[__pyx_v_channel]) = (((__pyx_v_sample[__pyx_v_channel]) * __pyx_v_reverb->dry) + (__pyx_v_output_value * __pyx_v_reverb->wet));
+    }
+
+    /* "mpfmc/core/audio/dsp.pxd":173
+ *         for channel in range(channels):
+ *             sample[channel] = sample[channel] * reverb.dry + output_value * reverb.wet
+ *         sample += channels             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void process_dsp_chain(DspChain *chain, float *buffer, Uint32 frames, int channels) nogil:
+ */
+    __pyx_v_sample = (__pyx_v_sample + __pyx_v_channels);
+  }
+
+  /* "mpfmc/core/audio/dsp.pxd":130
+ *         sample += channels
+ * 
+ * cdef inline void process_reverb(ReverbSettings *reverb, float *buffer, Uint32 frames, int channels) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Applies a simple (mono) reverb to a block of interleaved samples.
+ */
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_WriteUnraisable("mpfmc.core.audio.dsp.process_reverb", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 1);
+  __pyx_L0:;
+}
+
+/* "mpfmc/core/audio/dsp.pxd":175
+ *         sample += channels
+ * 
+ * cdef inline void process_dsp_chain(DspChain *chain, float *buffer, Uint32 frames, int channels) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Processes a block of interleaved samples through all the inserts in a chain (in order).
+ */
+
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_3dsp_process_dsp_chain(__pyx_t_5mpfmc_4core_5audio_3dsp_DspChain *__pyx_v_chain, float *__pyx_v_buffer, Uint32 __pyx_v_frames, int __pyx_v_channels) {
+  int __pyx_v_index;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+
+  /* "mpfmc/core/audio/dsp.pxd":186
+ *     cdef int index
+ * 
+ *     if chain == NULL:             # <<<<<<<<<<<<<<
+ *         return
+ * 
+ */
+  __pyx_t_1 = ((__pyx_v_chain == NULL) != 0);
+  if (__pyx_t_1) {
+
+    /* "mpfmc/core/audio/dsp.pxd":187
+ * 
+ *     if chain == NULL:
+ *         return             # <<<<<<<<<<<<<<
+ * 
+ *     for index in range(chain.insert_count):
+ */
+    goto __pyx_L0;
+
+    /* "mpfmc/core/audio/dsp.pxd":186
+ *     cdef int index
+ * 
+ *     if chain == NULL:             # <<<<<<<<<<<<<<
+ *         return
+ * 
+ */
+  }
+
+  /* "mpfmc/core/audio/dsp.pxd":189
+ *         return
+ * 
+ *     for index in range(chain.insert_count):             # <<<<<<<<<<<<<<
+ *         if chain.inserts[index].type == dsp_insert_biquad:
+ *             process_biquad(&chain.inserts[index].biquad, buffer, frames, channels)
+ */
+  __pyx_t_2 = __pyx_v_chain->insert_count;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_index = __pyx_t_3;
+
+    /* "mpfmc/core/audio/dsp.pxd":190
+ * 
+ *     for index in range(chain.insert_count):
+ *         if chain.inserts[index].type == dsp_insert_biquad:             # <<<<<<<<<<<<<<
+ *             process_biquad(&chain.inserts[index].biquad, buffer, frames, channels)
+ *         elif chain.inserts[index].type == dsp_insert_limiter:
+ */
+    __pyx_t_1 = (((__pyx_v_chain->inserts[__pyx_v_index]).type == __pyx_e_5mpfmc_4core_5audio_3dsp_dsp_insert_biquad) != 0);
+    if (__pyx_t_1) {
+
+      /* "mpfmc/core/audio/dsp.pxd":191
+ *     for index in range(chain.insert_count):
+ *         if chain.inserts[index].type == dsp_insert_biquad:
+ *             process_biquad(&chain.inserts[index].biquad, buffer, frames, channels)             # <<<<<<<<<<<<<<
+ *         elif chain.inserts[index].type == dsp_insert_limiter:
+ *             process_limiter(&chain.inserts[index].limiter, buffer, frames, channels)
+ */
+      __pyx_f_5mpfmc_4core_5audio_3dsp_process_biquad((&(__pyx_v_chain->inserts[__pyx_v_index]).biquad), __pyx_v_buffer, __pyx_v_frames, __pyx_v_channels);
+
+      /* "mpfmc/core/audio/dsp.pxd":190
+ * 
+ *     for index in range(chain.insert_count):
+ *         if chain.inserts[index].type == dsp_insert_biquad:             # <<<<<<<<<<<<<<
+ *             process_biquad(&chain.inserts[index].biquad, buffer, frames, channels)
+ *         elif chain.inserts[index].type == dsp_insert_limiter:
+ */
+      goto __pyx_L6;
+    }
+
+    /* "mpfmc/core/audio/dsp.pxd":192
+ *         if chain.inserts[index].type == dsp_insert_biquad:
+ *             process_biquad(&chain.inserts[index].biquad, buffer, frames, channels)
+ *         elif chain.inserts[index].type == dsp_insert_limiter:             # <<<<<<<<<<<<<<
+ *             process_limiter(&chain.inserts[index].limiter, buffer, frames, channels)
+ *         elif chain.inserts[index].type == dsp_insert_reverb:
+ */
+    __pyx_t_1 = (((__pyx_v_chain->inserts[__pyx_v_index]).type == __pyx_e_5mpfmc_4core_5audio_3dsp_dsp_insert_limiter) != 0);
+    if (__pyx_t_1) {
+
+      /* "mpfmc/core/audio/dsp.pxd":193
+ *             process_biquad(&chain.inserts[index].biquad, buffer, frames, channels)
+ *         elif chain.inserts[index].type == dsp_insert_limiter:
+ *             process_limiter(&chain.inserts[index].limiter, buffer, frames, channels)             # <<<<<<<<<<<<<<
+ *         elif chain.inserts[index].type == dsp_insert_reverb:
+ *             process_reverb(&chain.inserts[index].reverb, buffer, frames, channels)
+ */
+      __pyx_f_5mpfmc_4core_5audio_3dsp_process_limiter((&(__pyx_v_chain->inserts[__pyx_v_index]).limiter), __pyx_v_buffer, __pyx_v_frames, __pyx_v_channels);
+
+      /* "mpfmc/core/audio/dsp.pxd":192
+ *         if chain.inserts[index].type == dsp_insert_biquad:
+ *             process_biquad(&chain.inserts[index].biquad, buffer, frames, channels)
+ *         elif chain.inserts[index].type == dsp_insert_limiter:             # <<<<<<<<<<<<<<
+ *             process_limiter(&chain.inserts[index].limiter, buffer, frames, channels)
+ *         elif chain.inserts[index].type == dsp_insert_reverb:
+ */
+      goto __pyx_L6;
+    }
+
+    /* "mpfmc/core/audio/dsp.pxd":194
+ *         elif chain.inserts[index].type == dsp_insert_limiter:
+ *             process_limiter(&chain.inserts[index].limiter, buffer, frames, channels)
+ *         elif chain.inserts[index].type == dsp_insert_reverb:             # <<<<<<<<<<<<<<
+ *             process_reverb(&chain.inserts[index].reverb, buffer, frames, channels)
+ */
+    __pyx_t_1 = (((__pyx_v_chain->inserts[__pyx_v_index]).type == __pyx_e_5mpfmc_4core_5audio_3dsp_dsp_insert_reverb) != 0);
+    if (__pyx_t_1) {
+
+      /* "mpfmc/core/audio/dsp.pxd":195
+ *             process_limiter(&chain.inserts[index].limiter, buffer, frames, channels)
+ *         elif chain.inserts[index].type == dsp_insert_reverb:
+ *             process_reverb(&chain.inserts[index].reverb, buffer, frames, channels)             # <<<<<<<<<<<<<<
+ */
+      __pyx_f_5mpfmc_4core_5audio_3dsp_process_reverb((&(__pyx_v_chain->inserts[__pyx_v_index]).reverb), __pyx_v_buffer, __pyx_v_frames, __pyx_v_channels);
+
+      /* "mpfmc/core/audio/dsp.pxd":194
+ *         elif chain.inserts[index].type == dsp_insert_limiter:
+ *             process_limiter(&chain.inserts[index].limiter, buffer, frames, channels)
+ *         elif chain.inserts[index].type == dsp_insert_reverb:             # <<<<<<<<<<<<<<
+ *             process_reverb(&chain.inserts[index].reverb, buffer, frames, channels)
+ */
+    }
+    __pyx_L6:;
+  }
+
+  /* "mpfmc/core/audio/dsp.pxd":175
+ *         sample += channels
+ * 
+ * cdef inline void process_dsp_chain(DspChain *chain, float *buffer, Uint32 frames, int channels) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Processes a block of interleaved samples through all the inserts in a chain (in order).
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+}
+
+/* "mpfmc/core/audio/perf_counters.pxd":39
+ * 
+ * 
+ * cdef inline void perf_ring_buffer_reset(PerfRingBuffer *ring_buffer) nogil:             # <<<<<<<<<<<<<<
+ *     """Clears all the values recorded in a ring buffer."""
+ *     ring_buffer.position = 0
+ */
+
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_13perf_counters_perf_ring_buffer_reset(__pyx_t_5mpfmc_4core_5audio_13perf_counters_PerfRingBuffer *__pyx_v_ring_buffer) {
+
+  /* "mpfmc/core/audio/perf_counters.pxd":41
+ * cdef inline void perf_ring_buffer_reset(PerfRingBuffer *ring_buffer) nogil:
+ *     """Clears all the values recorded in a ring buffer."""
+ *     ring_buffer.position = 0             # <<<<<<<<<<<<<<
+ *     ring_buffer.count = 0
+ *     ring_buffer.total = 0
+ */
+  __pyx_v_ring_buffer->position = 0;
+
+  /* "mpfmc/core/audio/perf_counters.pxd":42
+ *     """Clears all the values recorded in a ring buffer."""
+ *     ring_buffer.position = 0
+ *     ring_buffer.count = 0             # <<<<<<<<<<<<<<
+ *     ring_buffer.total = 0
+ *     ring_buffer.maximum = 0
+ */
+  __pyx_v_ring_buffer->count = 0;
+
+  /* "mpfmc/core/audio/perf_counters.pxd":43
+ *     ring_buffer.position = 0
+ *     ring_buffer.count = 0
+ *     ring_buffer.total = 0             # <<<<<<<<<<<<<<
+ *     ring_buffer.maximum = 0
+ * 
+ */
+  __pyx_v_ring_buffer->total = 0;
+
+  /* "mpfmc/core/audio/perf_counters.pxd":44
+ *     ring_buffer.count = 0
+ *     ring_buffer.total = 0
+ *     ring_buffer.maximum = 0             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void perf_ring_buffer_record(PerfRingBuffer *ring_buffer, Uint32 value) nogil:
+ */
+  __pyx_v_ring_buffer->maximum = 0;
+
+  /* "mpfmc/core/audio/perf_counters.pxd":39
+ * 
+ * 
+ * cdef inline void perf_ring_buffer_reset(PerfRingBuffer *ring_buffer) nogil:             # <<<<<<<<<<<<<<
+ *     """Clears all the values recorded in a ring buffer."""
+ *     ring_buffer.position = 0
+ */
+
+  /* function exit code */
+}
+
+/* "mpfmc/core/audio/perf_counters.pxd":46
+ *     ring_buffer.maximum = 0
+ * 
+ * cdef inline void perf_ring_buffer_record(PerfRingBuffer *ring_buffer, Uint32 value) nogil:             # <<<<<<<<<<<<<<
+ *     """Records a value in a ring buffer (overwriting the oldest value when it is full)."""
+ *     ring_buffer.values[ring_buffer.position] = value
+ */
+
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_13perf_counters_perf_ring_buffer_record(__pyx_t_5mpfmc_4core_5audio_13perf_counters_PerfRingBuffer *__pyx_v_ring_buffer, Uint32 __pyx_v_value) {
+  Uint32 __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "mpfmc/core/audio/perf_counters.pxd":48
+ * cdef inline void perf_ring_buffer_record(PerfRingBuffer *ring_buffer, Uint32 value) nogil:
+ *     """Records a value in a ring buffer (overwriting the oldest value when it is full)."""
+ *     ring_buffer.values[ring_buffer.position] = value             # <<<<<<<<<<<<<<
+ *     ring_buffer.position = (ring_buffer.position + 1) % PERF_RING_BUFFER_SIZE
+ *     ring_buffer.count += 1
+ */
+  (__pyx_v_ring_buffer->values[__pyx_v_ring_buffer->position]) = __pyx_v_value;
+
+  /* "mpfmc/core/audio/perf_counters.pxd":49
+ *     """Records a value in a ring buffer (overwriting the oldest value when it is full)."""
+ *     ring_buffer.values[ring_buffer.position] = value
+ *     ring_buffer.position = (ring_buffer.position + 1) % PERF_RING_BUFFER_SIZE             # <<<<<<<<<<<<<<
+ *     ring_buffer.count += 1
+ *     ring_buffer.total += value
+ */
+  __pyx_t_1 = (__pyx_v_ring_buffer->position + 1);
+  if (unlikely(__pyx_e_5mpfmc_4core_5audio_13perf_counters_PERF_RING_BUFFER_SIZE == 0)) {
+    #ifdef WITH_THREAD
+    PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+    #endif
+    PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+    #ifdef WITH_THREAD
+    __Pyx_PyGILState_Release(__pyx_gilstate_save);
+    #endif
+    __PYX_ERR(3, 49, __pyx_L1_error)
+  }
+  __pyx_v_ring_buffer->position = (__pyx_t_1 % __pyx_e_5mpfmc_4core_5audio_13perf_counters_PERF_RING_BUFFER_SIZE);
+
+  /* "mpfmc/core/audio/perf_counters.pxd":50
+ *     ring_buffer.values[ring_buffer.position] = value
+ *     ring_buffer.position = (ring_buffer.position + 1) % PERF_RING_BUFFER_SIZE
+ *     ring_buffer.count += 1             # <<<<<<<<<<<<<<
+ *     ring_buffer.total += value
+ *     if value > ring_buffer.maximum:
+ */
+  __pyx_v_ring_buffer->count = (__pyx_v_ring_buffer->count + 1);
+
+  /* "mpfmc/core/audio/perf_counters.pxd":51
+ *     ring_buffer.position = (ring_buffer.position + 1) % PERF_RING_BUFFER_SIZE
+ *     ring_buffer.count += 1
+ *     ring_buffer.total += value             # <<<<<<<<<<<<<<
+ *     if value > ring_buffer.maximum:
+ *         ring_buffer.maximum = value
+ */
+  __pyx_v_ring_buffer->total = (__pyx_v_ring_buffer->total + __pyx_v_value);
+
+  /* "mpfmc/core/audio/perf_counters.pxd":52
+ *     ring_buffer.count += 1
+ *     ring_buffer.total += value
+ *     if value > ring_buffer.maximum:             # <<<<<<<<<<<<<<
+ *         ring_buffer.maximum = value
+ * 
+ */
+  __pyx_t_2 = ((__pyx_v_value > __pyx_v_ring_buffer->maximum) != 0);
+  if (__pyx_t_2) {
+
+    /* "mpfmc/core/audio/perf_counters.pxd":53
+ *     ring_buffer.total += value
+ *     if value > ring_buffer.maximum:
+ *         ring_buffer.maximum = value             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline Uint32 perf_elapsed_us(AudioPerfCounters *counters, Uint64 start) nogil:
+ */
+    __pyx_v_ring_buffer->maximum = __pyx_v_value;
+
+    /* "mpfmc/core/audio/perf_counters.pxd":52
+ *     ring_buffer.count += 1
+ *     ring_buffer.total += value
+ *     if value > ring_buffer.maximum:             # <<<<<<<<<<<<<<
+ *         ring_buffer.maximum = value
+ * 
+ */
+  }
+
+  /* "mpfmc/core/audio/perf_counters.pxd":46
+ *     ring_buffer.maximum = 0
+ * 
+ * cdef inline void perf_ring_buffer_record(PerfRingBuffer *ring_buffer, Uint32 value) nogil:             # <<<<<<<<<<<<<<
+ *     """Records a value in a ring buffer (overwriting the oldest value when it is full)."""
+ *     ring_buffer.values[ring_buffer.position] = value
+ */
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_WriteUnraisable("mpfmc.core.audio.perf_counters.perf_ring_buffer_record", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 1);
+  __pyx_L0:;
+}
+
+/* "mpfmc/core/audio/perf_counters.pxd":55
+ *         ring_buffer.maximum = value
+ * 
+ * cdef inline Uint32 perf_elapsed_us(AudioPerfCounters *counters, Uint64 start) nogil:             # <<<<<<<<<<<<<<
+ *     """Returns the number of microseconds elapsed since the specified performance counter value."""
+ *     return <Uint32>((SDL_GetPerformanceCounter() - start) * 1000000 // counters.frequency)
+ */
+
+static CYTHON_INLINE Uint32 __pyx_f_5mpfmc_4core_5audio_13perf_counters_perf_elapsed_us(__pyx_t_5mpfmc_4core_5audio_13perf_counters_AudioPerfCounters *__pyx_v_counters, Uint64 __pyx_v_start) {
+  Uint32 __pyx_r;
+  Uint64 __pyx_t_1;
+
+  /* "mpfmc/core/audio/perf_counters.pxd":57
+ * cdef inline Uint32 perf_elapsed_us(AudioPerfCounters *counters, Uint64 start) nogil:
+ *     """Returns the number of microseconds elapsed since the specified performance counter value."""
+ *     return <Uint32>((SDL_GetPerformanceCounter() - start) * 1000000 // counters.frequency)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void perf_lock_audio(AudioCallbackData *callback_data) nogil:
+ */
+  __pyx_t_1 = ((SDL_GetPerformanceCounter() - __pyx_v_start) * 0xF4240);
+  if (unlikely(__pyx_v_counters->frequency == 0)) {
+    #ifdef WITH_THREAD
+    PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+    #endif
+    PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+    #ifdef WITH_THREAD
+    __Pyx_PyGILState_Release(__pyx_gilstate_save);
+    #endif
+    __PYX_ERR(3, 57, __pyx_L1_error)
+  }
+  __pyx_r = ((Uint32)(__pyx_t_1 / __pyx_v_counters->frequency));
+  goto __pyx_L0;
+
+  /* "mpfmc/core/audio/perf_counters.pxd":55
+ *         ring_buffer.maximum = value
+ * 
+ * cdef inline Uint32 perf_elapsed_us(AudioPerfCounters *counters, Uint64 start) nogil:             # <<<<<<<<<<<<<<
+ *     """Returns the number of microseconds elapsed since the specified performance counter value."""
+ *     return <Uint32>((SDL_GetPerformanceCounter() - start) * 1000000 // counters.frequency)
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_WriteUnraisable("mpfmc.core.audio.perf_counters.perf_elapsed_us", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 1);
+  __pyx_r = 0;
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/perf_counters.pxd":59
+ *     return <Uint32>((SDL_GetPerformanceCounter() - start) * 1000000 // counters.frequency)
+ * 
+ * cdef inline void perf_lock_audio(AudioCallbackData *callback_data) nogil:             # <<<<<<<<<<<<<<
+ *     """Locks the audio callback (SDL_LockAudio) and records the time spent waiting for the lock."""
+ *     cdef AudioPerfCounters *counters = <AudioPerfCounters*>callback_data.perf_counters
+ */
+
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_13perf_counters_perf_lock_audio(__pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData *__pyx_v_callback_data) {
+  __pyx_t_5mpfmc_4core_5audio_13perf_counters_AudioPerfCounters *__pyx_v_counters;
+  Uint64 __pyx_v_start;
+  int __pyx_t_1;
+
+  /* "mpfmc/core/audio/perf_counters.pxd":61
+ * cdef inline void perf_lock_audio(AudioCallbackData *callback_data) nogil:
+ *     """Locks the audio callback (SDL_LockAudio) and records the time spent waiting for the lock."""
+ *     cdef AudioPerfCounters *counters = <AudioPerfCounters*>callback_data.perf_counters             # <<<<<<<<<<<<<<
+ *     cdef Uint64 start
+ * 
+ */
+  __pyx_v_counters = ((__pyx_t_5mpfmc_4core_5audio_13perf_counters_AudioPerfCounters *)__pyx_v_callback_data->perf_counters);
+
+  /* "mpfmc/core/audio/perf_counters.pxd":64
+ *     cdef Uint64 start
+ * 
+ *     if counters == NULL:             # <<<<<<<<<<<<<<
+ *         SDL_LockAudio()
+ *         return
+ */
+  __pyx_t_1 = ((__pyx_v_counters == NULL) != 0);
+  if (__pyx_t_1) {
+
+    /* "mpfmc/core/audio/perf_counters.pxd":65
+ * 
+ *     if counters == NULL:
+ *         SDL_LockAudio()             # <<<<<<<<<<<<<<
+ *         return
+ * 
+ */
+    SDL_LockAudio();
+
+    /* "mpfmc/core/audio/perf_counters.pxd":66
+ *     if counters == NULL:
+ *         SDL_LockAudio()
+ *         return             # <<<<<<<<<<<<<<
+ * 
+ *     start = SDL_GetPerformanceCounter()
+ */
+    goto __pyx_L0;
+
+    /* "mpfmc/core/audio/perf_counters.pxd":64
+ *     cdef Uint64 start
+ * 
+ *     if counters == NULL:             # <<<<<<<<<<<<<<
+ *         SDL_LockAudio()
+ *         return
+ */
+  }
+
+  /* "mpfmc/core/audio/perf_counters.pxd":68
+ *         return
+ * 
+ *     start = SDL_GetPerformanceCounter()             # <<<<<<<<<<<<<<
+ *     SDL_LockAudio()
+ *     perf_ring_buffer_record(&counters.lock_wait_time, perf_elapsed_us(counters, start))
+ */
+  __pyx_v_start = SDL_GetPerformanceCounter();
+
+  /* "mpfmc/core/audio/perf_counters.pxd":69
+ * 
+ *     start = SDL_GetPerformanceCounter()
+ *     SDL_LockAudio()             # <<<<<<<<<<<<<<
+ *     perf_ring_buffer_record(&counters.lock_wait_time, perf_elapsed_us(counters, start))
+ * 
+ */
+  SDL_LockAudio();
+
+  /* "mpfmc/core/audio/perf_counters.pxd":70
+ *     start = SDL_GetPerformanceCounter()
+ *     SDL_LockAudio()
+ *     perf_ring_buffer_record(&counters.lock_wait_time, perf_elapsed_us(counters, start))             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline dict perf_ring_buffer_summary(PerfRingBuffer *ring_buffer):
+ */
+  __pyx_f_5mpfmc_4core_5audio_13perf_counters_perf_ring_buffer_record((&__pyx_v_counters->lock_wait_time), __pyx_f_5mpfmc_4core_5audio_13perf_counters_perf_elapsed_us(__pyx_v_counters, __pyx_v_start));
+
+  /* "mpfmc/core/audio/perf_counters.pxd":59
+ *     return <Uint32>((SDL_GetPerformanceCounter() - start) * 1000000 // counters.frequency)
+ * 
+ * cdef inline void perf_lock_audio(AudioCallbackData *callback_data) nogil:             # <<<<<<<<<<<<<<
+ *     """Locks the audio callback (SDL_LockAudio) and records the time spent waiting for the lock."""
+ *     cdef AudioPerfCounters *counters = <AudioPerfCounters*>callback_data.perf_counters
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+}
+
+/* "mpfmc/core/audio/perf_counters.pxd":72
+ *     perf_ring_buffer_record(&counters.lock_wait_time, perf_elapsed_us(counters, start))
+ * 
+ * cdef inline dict perf_ring_buffer_summary(PerfRingBuffer *ring_buffer):             # <<<<<<<<<<<<<<
+ *     """Returns a dictionary summarizing the values recorded in a ring buffer (must be called
+ *     while holding the audio lock)."""
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5mpfmc_4core_5audio_13perf_counters_perf_ring_buffer_summary(__pyx_t_5mpfmc_4core_5audio_13perf_counters_PerfRingBuffer *__pyx_v_ring_buffer) {
+  Uint32 __pyx_v_recent_count;
+  PyObject *__pyx_v_recent = NULL;
+  Uint32 __pyx_7genexpr__pyx_v_index;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  Uint64 __pyx_t_2;
+  Uint64 __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  Uint32 __pyx_t_6;
+  Uint32 __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_t_9;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  __Pyx_RefNannySetupContext("perf_ring_buffer_summary", 0);
+
+  /* "mpfmc/core/audio/perf_counters.pxd":75
+ *     """Returns a dictionary summarizing the values recorded in a ring buffer (must be called
+ *     while holding the audio lock)."""
+ *     cdef Uint32 recent_count = <Uint32>min(ring_buffer.count, PERF_RING_BUFFER_SIZE)             # <<<<<<<<<<<<<<
+ *     cdef Uint32 index
+ * 
+ */
+  __pyx_t_1 = __pyx_e_5mpfmc_4core_5audio_13perf_counters_PERF_RING_BUFFER_SIZE;
+  __pyx_t_2 = __pyx_v_ring_buffer->count;
+  if (((__pyx_t_1 < __pyx_t_2) != 0)) {
+    __pyx_t_3 = __pyx_t_1;
+  } else {
+    __pyx_t_3 = __pyx_t_2;
+  }
+  __pyx_v_recent_count = ((Uint32)__pyx_t_3);
+
+  /* "mpfmc/core/audio/perf_counters.pxd":78
+ *     cdef Uint32 index
+ * 
+ *     recent = sorted([ring_buffer.values[index] for index in range(recent_count)])             # <<<<<<<<<<<<<<
+ *     return {
+ *         "count": ring_buffer.count,
+ */
+  { /* enter inner scope */
+    __pyx_t_5 = PyList_New(0); if (unlikely(!__pyx_t_5)) __PYX_ERR(3, 78, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_6 = __pyx_v_recent_count;
+    for (__pyx_t_7 = 0; __pyx_t_7 < __pyx_t_6; __pyx_t_7+=1) {
+      __pyx_7genexpr__pyx_v_index = __pyx_t_7;
+      __pyx_t_8 = __Pyx_PyInt_From_Uint32((__pyx_v_ring_buffer->values[__pyx_7genexpr__pyx_v_index])); if (unlikely(!__pyx_t_8)) __PYX_ERR(3, 78, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      if (unlikely(__Pyx_ListComp_Append(__pyx_t_5, (PyObject*)__pyx_t_8))) __PYX_ERR(3, 78, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    }
+  } /* exit inner scope */
+  __pyx_t_4 = ((PyObject*)__pyx_t_5);
+  __pyx_t_5 = 0;
+  __pyx_t_9 = PyList_Sort(__pyx_t_4); if (unlikely(__pyx_t_9 == ((int)-1))) __PYX_ERR(3, 78, __pyx_L1_error)
+  __pyx_v_recent = ((PyObject*)__pyx_t_4);
+  __pyx_t_4 = 0;
+
+  /* "mpfmc/core/audio/perf_counters.pxd":79
+ * 
+ *     recent = sorted([ring_buffer.values[index] for index in range(recent_count)])
+ *     return {             # <<<<<<<<<<<<<<
+ *         "count": ring_buffer.count,
+ *         "last": ring_buffer.values[(ring_buffer.position + PERF_RING_BUFFER_SIZE - 1) % PERF_RING_BUFFER_SIZE] if recent_count else 0,
+ */
+  __Pyx_XDECREF(__pyx_r);
+
+  /* "mpfmc/core/audio/perf_counters.pxd":80
+ *     recent = sorted([ring_buffer.values[index] for index in range(recent_count)])
+ *     return {
+ *         "count": ring_buffer.count,             # <<<<<<<<<<<<<<
+ *         "last": ring_buffer.values[(ring_buffer.position + PERF_RING_BUFFER_SIZE - 1) % PERF_RING_BUFFER_SIZE] if recent_count else 0,
+ *         "mean": ring_buffer.total / ring_buffer.count if ring_buffer.count else 0.0,
+ */
+  __pyx_t_4 = __Pyx_PyDict_NewPresized(6); if (unlikely(!__pyx_t_4)) __PYX_ERR(3, 80, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __Pyx_PyInt_From_Uint64(__pyx_v_ring_buffer->count); if (unlikely(!__pyx_t_5)) __PYX_ERR(3, 80, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_u_count, __pyx_t_5) < 0) __PYX_ERR(3, 80, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+  /* "mpfmc/core/audio/perf_counters.pxd":81
+ *     return {
+ *         "count": ring_buffer.count,
+ *         "last": ring_buffer.values[(ring_buffer.position + PERF_RING_BUFFER_SIZE - 1) % PERF_RING_BUFFER_SIZE] if recent_count else 0,             # <<<<<<<<<<<<<<
+ *         "mean": ring_buffer.total / ring_buffer.count if ring_buffer.count else 0.0,
+ *         "max": ring_buffer.maximum,
+ */
+  if ((__pyx_v_recent_count != 0)) {
+    __pyx_t_6 = ((__pyx_v_ring_buffer->position + __pyx_e_5mpfmc_4core_5audio_13perf_counters_PERF_RING_BUFFER_SIZE) - 1);
+    if (unlikely(__pyx_e_5mpfmc_4core_5audio_13perf_counters_PERF_RING_BUFFER_SIZE == 0)) {
+      PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+      __PYX_ERR(3, 81, __pyx_L1_error)
+    }
+    __pyx_t_8 = __Pyx_PyInt_From_Uint32((__pyx_v_ring_buffer->values[(__pyx_t_6 % __pyx_e_5mpfmc_4core_5audio_13perf_counters_PERF_RING_BUFFER_SIZE)])); if (unlikely(!__pyx_t_8)) __PYX_ERR(3, 81, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_5 = __pyx_t_8;
+    __pyx_t_8 = 0;
+  } else {
+    __Pyx_INCREF(__pyx_int_0);
+    __pyx_t_5 = __pyx_int_0;
+  }
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_u_last, __pyx_t_5) < 0) __PYX_ERR(3, 80, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+  /* "mpfmc/core/audio/perf_counters.pxd":82
+ *         "count": ring_buffer.count,
+ *         "last": ring_buffer.values[(ring_buffer.position + PERF_RING_BUFFER_SIZE - 1) % PERF_RING_BUFFER_SIZE] if recent_count else 0,
+ *         "mean": ring_buffer.total / ring_buffer.count if ring_buffer.count else 0.0,             # <<<<<<<<<<<<<<
+ *         "max": ring_buffer.maximum,
+ *         "recent_mean": sum(recent) / recent_count if recent_count else 0.0,
+ */
+  if ((__pyx_v_ring_buffer->count != 0)) {
+    if (unlikely(__pyx_v_ring_buffer->count == 0)) {
+      PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+      __PYX_ERR(3, 82, __pyx_L1_error)
+    }
+    __pyx_t_8 = PyFloat_FromDouble((((double)__pyx_v_ring_buffer->total) / ((double)__pyx_v_ring_buffer->count))); if (unlikely(!__pyx_t_8)) __PYX_ERR(3, 82, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_5 = __pyx_t_8;
+    __pyx_t_8 = 0;
+  } else {
+    __Pyx_INCREF(__pyx_float_0_0);
+    __pyx_t_5 = __pyx_float_0_0;
+  }
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_u_mean, __pyx_t_5) < 0) __PYX_ERR(3, 80, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+  /* "mpfmc/core/audio/perf_counters.pxd":83
+ *         "last": ring_buffer.values[(ring_buffer.position + PERF_RING_BUFFER_SIZE - 1) % PERF_RING_BUFFER_SIZE] if recent_count else 0,
+ *         "mean": ring_buffer.total / ring_buffer.count if ring_buffer.count else 0.0,
+ *         "max": ring_buffer.maximum,             # <<<<<<<<<<<<<<
+ *         "recent_mean": sum(recent) / recent_count if recent_count else 0.0,
+ *         "recent_p95": recent[(recent_count * 95) // 100] if recent_count else 0,
+ */
+  __pyx_t_5 = __Pyx_PyInt_From_Uint32(__pyx_v_ring_buffer->maximum); if (unlikely(!__pyx_t_5)) __PYX_ERR(3, 83, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_u_max, __pyx_t_5) < 0) __PYX_ERR(3, 80, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+  /* "mpfmc/core/audio/perf_counters.pxd":84
+ *         "mean": ring_buffer.total / ring_buffer.count if ring_buffer.count else 0.0,
+ *         "max": ring_buffer.maximum,
+ *         "recent_mean": sum(recent) / recent_count if recent_count else 0.0,             # <<<<<<<<<<<<<<
+ *         "recent_p95": recent[(recent_count * 95) // 100] if recent_count else 0,
+ *     }
+ */
+  if ((__pyx_v_recent_count != 0)) {
+    __pyx_t_8 = PyTuple_New(1); if (unlikely(!__pyx_t_8)) __PYX_ERR(3, 84, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_INCREF(__pyx_v_recent);
+    __Pyx_GIVEREF(__pyx_v_recent);
+    PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_v_recent);
+    __pyx_t_10 = __Pyx_PyObject_Call(__pyx_builtin_sum, __pyx_t_8, NULL); if (unlikely(!__pyx_t_10)) __PYX_ERR(3, 84, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_10);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __pyx_t_8 = __Pyx_PyInt_From_Uint32(__pyx_v_recent_count); if (unlikely(!__pyx_t_8)) __PYX_ERR(3, 84, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_11 = __Pyx_PyNumber_Divide(__pyx_t_10, __pyx_t_8); if (unlikely(!__pyx_t_11)) __PYX_ERR(3, 84, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_11);
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __pyx_t_5 = __pyx_t_11;
+    __pyx_t_11 = 0;
+  } else {
+    __Pyx_INCREF(__pyx_float_0_0);
+    __pyx_t_5 = __pyx_float_0_0;
+  }
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_u_recent_mean, __pyx_t_5) < 0) __PYX_ERR(3, 80, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+  /* "mpfmc/core/audio/perf_counters.pxd":85
+ *         "max": ring_buffer.maximum,
+ *         "recent_mean": sum(recent) / recent_count if recent_count else 0.0,
+ *         "recent_p95": recent[(recent_count * 95) // 100] if recent_count else 0,             # <<<<<<<<<<<<<<
+ *     }
+ */
+  if ((__pyx_v_recent_count != 0)) {
+    if (unlikely(__pyx_v_recent == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(3, 85, __pyx_L1_error)
+    }
+    __pyx_t_6 = ((__pyx_v_recent_count * 95) / 0x64);
+    __pyx_t_11 = __Pyx_GetItemInt_List(__pyx_v_recent, __pyx_t_6, Uint32, 0, __Pyx_PyInt_From_Uint32, 1, 0, 1); if (unlikely(!__pyx_t_11)) __PYX_ERR(3, 85, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_11);
+    __pyx_t_5 = __pyx_t_11;
+    __pyx_t_11 = 0;
+  } else {
+    __Pyx_INCREF(__pyx_int_0);
+    __pyx_t_5 = __pyx_int_0;
+  }
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_u_recent_p95, __pyx_t_5) < 0) __PYX_ERR(3, 80, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_r = ((PyObject*)__pyx_t_4);
+  __pyx_t_4 = 0;
+  goto __pyx_L0;
+
+  /* "mpfmc/core/audio/perf_counters.pxd":72
+ *     perf_ring_buffer_record(&counters.lock_wait_time, perf_elapsed_us(counters, start))
+ * 
+ * cdef inline dict perf_ring_buffer_summary(PerfRingBuffer *ring_buffer):             # <<<<<<<<<<<<<<
+ *     """Returns a dictionary summarizing the values recorded in a ring buffer (must be called
+ *     while holding the audio lock)."""
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_AddTraceback("mpfmc.core.audio.perf_counters.perf_ring_buffer_summary", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_recent);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/inline.pxd":7
+ * # ---------------------------------------------------------------------------
+ * 
+ * cdef inline Uint8 lerpU8(float progress, Uint8 a, Uint8 b) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Linearly interpolate between 2 8-bit values.
+ */
+
+static CYTHON_INLINE Uint8 __pyx_f_5mpfmc_4core_5audio_6inline_lerpU8(float __pyx_v_progress, Uint8 __pyx_v_a, Uint8 __pyx_v_b) {
+  Uint8 __pyx_r;
+
+  /* "mpfmc/core/audio/inline.pxd":18
+ *         New 8-bit value between the supplied values
+ *     """
+ *     return <Uint8> ((1.0 - progress) * a + progress * b)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline float in_out_quad(float progress) nogil:
+ */
+  __pyx_r = ((Uint8)(((1.0 - __pyx_v_progress) * __pyx_v_a) + (__pyx_v_progress * __pyx_v_b)));
+  goto __pyx_L0;
+
+  /* "mpfmc/core/audio/inline.pxd":7
+ * # ---------------------------------------------------------------------------
+ * 
+ * cdef inline Uint8 lerpU8(float progress, Uint8 a, Uint8 b) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Linearly interpolate between 2 8-bit values.
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/inline.pxd":20
+ *     return <Uint8> ((1.0 - progress) * a + progress * b)
+ * 
+ * cdef inline float in_out_quad(float progress) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     A quadratic easing function used for smoother audio fading
+ */
+
+static CYTHON_INLINE float __pyx_f_5mpfmc_4core_5audio_6inline_in_out_quad(float __pyx_v_progress) {
+  float __pyx_v_p;
+  float __pyx_r;
+  int __pyx_t_1;
+
+  /* "mpfmc/core/audio/inline.pxd":30
+ *     """
+ *     cdef float p
+ *     p = progress * 2             # <<<<<<<<<<<<<<
+ *     if p < 1:
+ *         return 0.5 * p * p
+ */
+  __pyx_v_p = (__pyx_v_progress * 2.0);
+
+  /* "mpfmc/core/audio/inline.pxd":31
+ *     cdef float p
+ *     p = progress * 2
+ *     if p < 1:             # <<<<<<<<<<<<<<
+ *         return 0.5 * p * p
+ *     p -= 1.0
+ */
+  __pyx_t_1 = ((__pyx_v_p < 1.0) != 0);
+  if (__pyx_t_1) {
+
+    /* "mpfmc/core/audio/inline.pxd":32
+ *     p = progress * 2
+ *     if p < 1:
+ *         return 0.5 * p * p             # <<<<<<<<<<<<<<
+ *     p -= 1.0
+ *     return -0.5 * (p * (p - 2.0) - 1.0)
+ */
+    __pyx_r = ((0.5 * __pyx_v_p) * __pyx_v_p);
+    goto __pyx_L0;
+
+    /* "mpfmc/core/audio/inline.pxd":31
+ *     cdef float p
+ *     p = progress * 2
+ *     if p < 1:             # <<<<<<<<<<<<<<
+ *         return 0.5 * p * p
+ *     p -= 1.0
+ */
+  }
+
+  /* "mpfmc/core/audio/inline.pxd":33
+ *     if p < 1:
+ *         return 0.5 * p * p
+ *     p -= 1.0             # <<<<<<<<<<<<<<
+ *     return -0.5 * (p * (p - 2.0) - 1.0)
+ * 
+ */
+  __pyx_v_p = (__pyx_v_p - 1.0);
+
+  /* "mpfmc/core/audio/inline.pxd":34
+ *         return 0.5 * p * p
+ *     p -= 1.0
+ *     return -0.5 * (p * (p - 2.0) - 1.0)             # <<<<<<<<<<<<<<
+ * 
+ */
+  __pyx_r = (-0.5 * ((__pyx_v_p * (__pyx_v_p - 2.0)) - 1.0));
+  goto __pyx_L0;
+
+  /* "mpfmc/core/audio/inline.pxd":20
+ *     return <Uint8> ((1.0 - progress) * a + progress * b)
+ * 
+ * cdef inline float in_out_quad(float progress) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     A quadratic easing function used for smoother audio fading
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/mixer.pxd":21
+ *     MIXER_UNITY_GAIN = 65536
+ * 
+ * cdef inline Sint32 volume_to_gain(int volume) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Converts an SDL mixer volume (0 to SDL_MIX_MAXVOLUME) to a Q16 gain value.
+ */
+
+static CYTHON_INLINE Sint32 __pyx_f_5mpfmc_4core_5audio_5mixer_volume_to_gain(int __pyx_v_volume) {
+  Sint32 __pyx_r;
+
+  /* "mpfmc/core/audio/mixer.pxd":30
+ *         The Q16 gain (65536 is unity gain)
+ *     """
+ *     return <Sint32>volume << 9             # <<<<<<<<<<<<<<
+ * 
+ * @cython.cdivision(True)
+ */
+  __pyx_r = (((Sint32)__pyx_v_volume) << 9);
+  goto __pyx_L0;
+
+  /* "mpfmc/core/audio/mixer.pxd":21
+ *     MIXER_UNITY_GAIN = 65536
+ * 
+ * cdef inline Sint32 volume_to_gain(int volume) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Converts an SDL mixer volume (0 to SDL_MIX_MAXVOLUME) to a Q16 gain value.
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/mixer.pxd":33
+ * 
+ * @cython.cdivision(True)
+ * cdef inline Sint32 gain_step(Sint32 start_gain, Sint32 end_gain, Uint32 sample_count) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Calculates the per-sample gain increment needed to ramp between two gain values.
+ */
+
+static CYTHON_INLINE Sint32 __pyx_f_5mpfmc_4core_5audio_5mixer_gain_step(Sint32 __pyx_v_start_gain, Sint32 __pyx_v_end_gain, Uint32 __pyx_v_sample_count) {
+  Sint32 __pyx_r;
+  int __pyx_t_1;
+
+  /* "mpfmc/core/audio/mixer.pxd":44
+ *         The Q16 gain increment to apply after each sample
+ *     """
+ *     if sample_count == 0:             # <<<<<<<<<<<<<<
+ *         return 0
+ *     return (end_gain - start_gain) // <Sint32>sample_count
+ */
+  __pyx_t_1 = ((__pyx_v_sample_count == 0) != 0);
+  if (__pyx_t_1) {
+
+    /* "mpfmc/core/audio/mixer.pxd":45
+ *     """
+ *     if sample_count == 0:
+ *         return 0             # <<<<<<<<<<<<<<
+ *     return (end_gain - start_gain) // <Sint32>sample_count
+ * 
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "mpfmc/core/audio/mixer.pxd":44
+ *         The Q16 gain increment to apply after each sample
+ *     """
+ *     if sample_count == 0:             # <<<<<<<<<<<<<<
+ *         return 0
+ *     return (end_gain - start_gain) // <Sint32>sample_count
+ */
+  }
+
+  /* "mpfmc/core/audio/mixer.pxd":46
+ *     if sample_count == 0:
+ *         return 0
+ *     return (end_gain - start_gain) // <Sint32>sample_count             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void mix_s16_to_accumulator(Sint32 *accumulator, const Sint16 *source, Uint32 sample_count,
+ */
+  __pyx_r = __Pyx_div_Sint32((__pyx_v_end_gain - __pyx_v_start_gain), ((Sint32)__pyx_v_sample_count));
+  goto __pyx_L0;
+
+  /* "mpfmc/core/audio/mixer.pxd":33
+ * 
+ * @cython.cdivision(True)
+ * cdef inline Sint32 gain_step(Sint32 start_gain, Sint32 end_gain, Uint32 sample_count) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Calculates the per-sample gain increment needed to ramp between two gain values.
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/mixer.pxd":48
+ *     return (end_gain - start_gain) // <Sint32>sample_count
+ * 
+ * cdef inline void mix_s16_to_accumulator(Sint32 *accumulator, const Sint16 *source, Uint32 sample_count,             # <<<<<<<<<<<<<<
+ *                                         Sint32 gain, Sint32 step) nogil:
+ *     """
+ */
+
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_5mixer_mix_s16_to_accumulator(Sint32 *__pyx_v_accumulator, Sint16 const *__pyx_v_source, Uint32 __pyx_v_sample_count, Sint32 __pyx_v_gain, Sint32 __pyx_v_step) {
+  Uint32 __pyx_v_i;
+  Sint32 __pyx_v_gain_q15;
+  int __pyx_t_1;
+  Uint32 __pyx_t_2;
+  Uint32 __pyx_t_3;
+  Uint32 __pyx_t_4;
+
+  /* "mpfmc/core/audio/mixer.pxd":62
+ *     cdef Sint32 gain_q15
+ * 
+ *     if step == 0:             # <<<<<<<<<<<<<<
+ *         if gain == MIXER_UNITY_GAIN:
+ *             for i in range(sample_count):
+ */
+  __pyx_t_1 = ((__pyx_v_step == 0) != 0);
+  if (__pyx_t_1) {
+
+    /* "mpfmc/core/audio/mixer.pxd":63
+ * 
+ *     if step == 0:
+ *         if gain == MIXER_UNITY_GAIN:             # <<<<<<<<<<<<<<
+ *             for i in range(sample_count):
+ *                 accumulator[i] += source[i]
+ */
+    __pyx_t_1 = ((__pyx_v_gain == __pyx_e_5mpfmc_4core_5audio_5mixer_MIXER_UNITY_GAIN) != 0);
+    if (__pyx_t_1) {
+
+      /* "mpfmc/core/audio/mixer.pxd":64
+ *     if step == 0:
+ *         if gain == MIXER_UNITY_GAIN:
+ *             for i in range(sample_count):             # <<<<<<<<<<<<<<
+ *                 accumulator[i] += source[i]
+ *         elif gain > 0:
+ */
+      __pyx_t_2 = __pyx_v_sample_count;
+      for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+        __pyx_v_i = __pyx_t_3;
+
+        /* "mpfmc/core/audio/mixer.pxd":65
+ *         if gain == MIXER_UNITY_GAIN:
+ *             for i in range(sample_count):
+ *                 accumulator[i] += source[i]             # <<<<<<<<<<<<<<
+ *         elif gain > 0:
+ *             gain_q15 = gain >> 1
+ */
+        __pyx_t_4 = __pyx_v_i;
+        (__pyx_v_accumulator[__pyx_t_4]) = ((__pyx_v_accumulator[__pyx_t_4]) + (__pyx_v_source[__pyx_v_i]));
+      }
+
+      /* "mpfmc/core/audio/mixer.pxd":63
+ * 
+ *     if step == 0:
+ *         if gain == MIXER_UNITY_GAIN:             # <<<<<<<<<<<<<<
+ *             for i in range(sample_count):
+ *                 accumulator[i] += source[i]
+ */
+      goto __pyx_L4;
+    }
+
+    /* "mpfmc/core/audio/mixer.pxd":66
+ *             for i in range(sample_count):
+ *                 accumulator[i] += source[i]
+ *         elif gain > 0:             # <<<<<<<<<<<<<<
+ *             gain_q15 = gain >> 1
+ *             for i in range(sample_count):
+ */
+    __pyx_t_1 = ((__pyx_v_gain > 0) != 0);
+    if (__pyx_t_1) {
+
+      /* "mpfmc/core/audio/mixer.pxd":67
+ *                 accumulator[i] += source[i]
+ *         elif gain > 0:
+ *             gain_q15 = gain >> 1             # <<<<<<<<<<<<<<
+ *             for i in range(sample_count):
+ *                 accumulator[i] += (source[i] * gain_q15) >> 15
+ */
+      __pyx_v_gain_q15 = (__pyx_v_gain >> 1);
+
+      /* "mpfmc/core/audio/mixer.pxd":68
+ *         elif gain > 0:
+ *             gain_q15 = gain >> 1
+ *             for i in range(sample_count):             # <<<<<<<<<<<<<<
+ *                 accumulator[i] += (source[i] * gain_q15) >> 15
+ *     else:
+ */
+      __pyx_t_2 = __pyx_v_sample_count;
+      for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+        __pyx_v_i = __pyx_t_3;
+
+        /* "mpfmc/core/audio/mixer.pxd":69
+ *             gain_q15 = gain >> 1
+ *             for i in range(sample_count):
+ *                 accumulator[i] += (source[i] * gain_q15) >> 15             # <<<<<<<<<<<<<<
+ *     else:
+ *         for i in range(sample_count):
+ */
+        __pyx_t_4 = __pyx_v_i;
+        (__pyx_v_accumulator[__pyx_t_4]) = ((__pyx_v_accumulator[__pyx_t_4]) + (((__pyx_v_source[__pyx_v_i]) * __pyx_v_gain_q15) >> 15));
+      }
+
+      /* "mpfmc/core/audio/mixer.pxd":66
+ *             for i in range(sample_count):
+ *                 accumulator[i] += source[i]
+ *         elif gain > 0:             # <<<<<<<<<<<<<<
+ *             gain_q15 = gain >> 1
+ *             for i in range(sample_count):
+ */
+    }
+    __pyx_L4:;
+
+    /* "mpfmc/core/audio/mixer.pxd":62
+ *     cdef Sint32 gain_q15
+ * 
+ *     if step == 0:             # <<<<<<<<<<<<<<
+ *         if gain == MIXER_UNITY_GAIN:
+ *             for i in range(sample_count):
+ */
+    goto __pyx_L3;
+  }
+
+  /* "mpfmc/core/audio/mixer.pxd":71
+ *                 accumulator[i] += (source[i] * gain_q15) >> 15
+ *     else:
+ *         for i in range(sample_count):             # <<<<<<<<<<<<<<
+ *             accumulator[i] += (source[i] * ((gain + <Sint32>i * step) >> 1)) >> 15
+ * 
+ */
+  /*else*/ {
+    __pyx_t_2 = __pyx_v_sample_count;
+    for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+      __pyx_v_i = __pyx_t_3;
+
+      /* "mpfmc/core/audio/mixer.pxd":72
+ *     else:
+ *         for i in range(sample_count):
+ *             accumulator[i] += (source[i] * ((gain + <Sint32>i * step) >> 1)) >> 15             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void saturate_accumulator_to_s16(Sint16 *output, const Sint32 *accumulator, Uint32 sample_count) nogil:
+ */
+      __pyx_t_4 = __pyx_v_i;
+      (__pyx_v_accumulator[__pyx_t_4]) = ((__pyx_v_accumulator[__pyx_t_4]) + (((__pyx_v_source[__pyx_v_i]) * ((__pyx_v_gain + (((Sint32)__pyx_v_i) * __pyx_v_step)) >> 1)) >> 15));
+    }
+  }
+  __pyx_L3:;
+
+  /* "mpfmc/core/audio/mixer.pxd":48
+ *     return (end_gain - start_gain) // <Sint32>sample_count
+ * 
+ * cdef inline void mix_s16_to_accumulator(Sint32 *accumulator, const Sint16 *source, Uint32 sample_count,             # <<<<<<<<<<<<<<
+ *                                         Sint32 gain, Sint32 step) nogil:
+ *     """
+ */
+
+  /* function exit code */
+}
+
+/* "mpfmc/core/audio/mixer.pxd":74
+ *             accumulator[i] += (source[i] * ((gain + <Sint32>i * step) >> 1)) >> 15
+ * 
+ * cdef inline void saturate_accumulator_to_s16(Sint16 *output, const Sint32 *accumulator, Uint32 sample_count) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Converts the 32-bit accumulator to 16-bit signed samples, clipping any out of range values.
+ */
+
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_5mixer_saturate_accumulator_to_s16(Sint16 *__pyx_v_output, Sint32 const *__pyx_v_accumulator, Uint32 __pyx_v_sample_count) {
+  Uint32 __pyx_v_i;
+  Sint32 __pyx_v_value;
+  Uint32 __pyx_t_1;
+  Uint32 __pyx_t_2;
+  Sint32 __pyx_t_3;
+
+  /* "mpfmc/core/audio/mixer.pxd":85
+ *     cdef Sint32 value
+ * 
+ *     for i in range(sample_count):             # <<<<<<<<<<<<<<
+ *         value = accumulator[i]
+ *         value = 32767 if value > 32767 else value
+ */
+  __pyx_t_1 = __pyx_v_sample_count;
+  for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
+    __pyx_v_i = __pyx_t_2;
+
+    /* "mpfmc/core/audio/mixer.pxd":86
+ * 
+ *     for i in range(sample_count):
+ *         value = accumulator[i]             # <<<<<<<<<<<<<<
+ *         value = 32767 if value > 32767 else value
+ *         value = -32768 if value < -32768 else value
+ */
+    __pyx_v_value = (__pyx_v_accumulator[__pyx_v_i]);
+
+    /* "mpfmc/core/audio/mixer.pxd":87
+ *     for i in range(sample_count):
+ *         value = accumulator[i]
+ *         value = 32767 if value > 32767 else value             # <<<<<<<<<<<<<<
+ *         value = -32768 if value < -32768 else value
+ *         output[i] = <Sint16>value
+ */
+    if (((__pyx_v_value > 0x7FFF) != 0)) {
+      __pyx_t_3 = 0x7FFF;
+    } else {
+      __pyx_t_3 = __pyx_v_value;
+    }
+    __pyx_v_value = __pyx_t_3;
+
+    /* "mpfmc/core/audio/mixer.pxd":88
+ *         value = accumulator[i]
+ *         value = 32767 if value > 32767 else value
+ *         value = -32768 if value < -32768 else value             # <<<<<<<<<<<<<<
+ *         output[i] = <Sint16>value
+ * 
+ */
+    if (((__pyx_v_value < -32768L) != 0)) {
+      __pyx_t_3 = -32768L;
+    } else {
+      __pyx_t_3 = __pyx_v_value;
+    }
+    __pyx_v_value = __pyx_t_3;
+
+    /* "mpfmc/core/audio/mixer.pxd":89
+ *         value = 32767 if value > 32767 else value
+ *         value = -32768 if value < -32768 else value
+ *         output[i] = <Sint16>value             # <<<<<<<<<<<<<<
+ * 
+ * # ---------------------------------------------------------------------------
+ */
+    (__pyx_v_output[__pyx_v_i]) = ((Sint16)__pyx_v_value);
+  }
+
+  /* "mpfmc/core/audio/mixer.pxd":74
+ *             accumulator[i] += (source[i] * ((gain + <Sint32>i * step) >> 1)) >> 15
+ * 
+ * cdef inline void saturate_accumulator_to_s16(Sint16 *output, const Sint32 *accumulator, Uint32 sample_count) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Converts the 32-bit accumulator to 16-bit signed samples, clipping any out of range values.
+ */
+
+  /* function exit code */
+}
+
+/* "mpfmc/core/audio/mixer.pxd":100
+ * # ---------------------------------------------------------------------------
+ * 
+ * cdef inline void s16_to_float(float *output, const Sint16 *source, Uint32 sample_count,             # <<<<<<<<<<<<<<
+ *                               float gain, float step) nogil:
+ *     """
+ */
+
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_5mixer_s16_to_float(float *__pyx_v_output, Sint16 const *__pyx_v_source, Uint32 __pyx_v_sample_count, float __pyx_v_gain, float __pyx_v_step) {
+  Uint32 __pyx_v_i;
+  Uint32 __pyx_t_1;
+  Uint32 __pyx_t_2;
+
+  /* "mpfmc/core/audio/mixer.pxd":113
+ *     cdef Uint32 i
+ * 
+ *     for i in range(sample_count):             # <<<<<<<<<<<<<<
+ *         output[i] = source[i] * (gain + i * step) * (1.0 / 32768.0)
+ * 
+ */
+  __pyx_t_1 = __pyx_v_sample_count;
+  for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
+    __pyx_v_i = __pyx_t_2;
+
+    /* "mpfmc/core/audio/mixer.pxd":114
+ * 
+ *     for i in range(sample_count):
+ *         output[i] = source[i] * (gain + i * step) * (1.0 / 32768.0)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void mix_float_to_float(float *accumulator, const float *source, Uint32 sample_count) nogil:
+ */
+    (__pyx_v_output[__pyx_v_i]) = (((__pyx_v_source[__pyx_v_i]) * (__pyx_v_gain + (__pyx_v_i * __pyx_v_step))) * (1.0 / 32768.0));
+  }
+
+  /* "mpfmc/core/audio/mixer.pxd":100
+ * # ---------------------------------------------------------------------------
+ * 
+ * cdef inline void s16_to_float(float *output, const Sint16 *source, Uint32 sample_count,             # <<<<<<<<<<<<<<
+ *                               float gain, float step) nogil:
+ *     """
+ */
+
+  /* function exit code */
+}
+
+/* "mpfmc/core/audio/mixer.pxd":116
+ *         output[i] = source[i] * (gain + i * step) * (1.0 / 32768.0)
+ * 
+ * cdef inline void mix_float_to_float(float *accumulator, const float *source, Uint32 sample_count) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Mixes floating-point samples into a floating-point accumulator.
+ */
+
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_5mixer_mix_float_to_float(float *__pyx_v_accumulator, float const *__pyx_v_source, Uint32 __pyx_v_sample_count) {
+  Uint32 __pyx_v_i;
+  Uint32 __pyx_t_1;
+  Uint32 __pyx_t_2;
+  Uint32 __pyx_t_3;
+
+  /* "mpfmc/core/audio/mixer.pxd":126
+ *     cdef Uint32 i
+ * 
+ *     for i in range(sample_count):             # <<<<<<<<<<<<<<
+ *         accumulator[i] += source[i]
+ * 
+ */
+  __pyx_t_1 = __pyx_v_sample_count;
+  for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
+    __pyx_v_i = __pyx_t_2;
+
+    /* "mpfmc/core/audio/mixer.pxd":127
+ * 
+ *     for i in range(sample_count):
+ *         accumulator[i] += source[i]             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void apply_float_gain(float *buffer, Uint32 sample_count, float gain, float step) nogil:
+ */
+    __pyx_t_3 = __pyx_v_i;
+    (__pyx_v_accumulator[__pyx_t_3]) = ((__pyx_v_accumulator[__pyx_t_3]) + (__pyx_v_source[__pyx_v_i]));
+  }
+
+  /* "mpfmc/core/audio/mixer.pxd":116
+ *         output[i] = source[i] * (gain + i * step) * (1.0 / 32768.0)
+ * 
+ * cdef inline void mix_float_to_float(float *accumulator, const float *source, Uint32 sample_count) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Mixes floating-point samples into a floating-point accumulator.
+ */
+
+  /* function exit code */
+}
+
+/* "mpfmc/core/audio/mixer.pxd":129
+ *         accumulator[i] += source[i]
+ * 
+ * cdef inline void apply_float_gain(float *buffer, Uint32 sample_count, float gain, float step) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Applies a (ramped) gain to floating-point samples in place.
+ */
+
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_5mixer_apply_float_gain(float *__pyx_v_buffer, Uint32 __pyx_v_sample_count, float __pyx_v_gain, float __pyx_v_step) {
+  Uint32 __pyx_v_i;
+  Uint32 __pyx_t_1;
+  Uint32 __pyx_t_2;
+  Uint32 __pyx_t_3;
+
+  /* "mpfmc/core/audio/mixer.pxd":140
+ *     cdef Uint32 i
+ * 
+ *     for i in range(sample_count):             # <<<<<<<<<<<<<<
+ *         buffer[i] *= gain + i * step
+ * 
+ */
+  __pyx_t_1 = __pyx_v_sample_count;
+  for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
+    __pyx_v_i = __pyx_t_2;
+
+    /* "mpfmc/core/audio/mixer.pxd":141
+ * 
+ *     for i in range(sample_count):
+ *         buffer[i] *= gain + i * step             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void saturate_float_to_s16(Sint16 *output, const float *source, Uint32 sample_count) nogil:
+ */
+    __pyx_t_3 = __pyx_v_i;
+    (__pyx_v_buffer[__pyx_t_3]) = ((__pyx_v_buffer[__pyx_t_3]) * (__pyx_v_gain + (__pyx_v_i * __pyx_v_step)));
+  }
+
+  /* "mpfmc/core/audio/mixer.pxd":129
+ *         accumulator[i] += source[i]
+ * 
+ * cdef inline void apply_float_gain(float *buffer, Uint32 sample_count, float gain, float step) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Applies a (ramped) gain to floating-point samples in place.
+ */
+
+  /* function exit code */
+}
+
+/* "mpfmc/core/audio/mixer.pxd":143
+ *         buffer[i] *= gain + i * step
+ * 
+ * cdef inline void saturate_float_to_s16(Sint16 *output, const float *source, Uint32 sample_count) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Converts floating-point samples to 16-bit signed samples, clipping any out of range values.
+ */
+
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_5mixer_saturate_float_to_s16(Sint16 *__pyx_v_output, float const *__pyx_v_source, Uint32 __pyx_v_sample_count) {
+  Uint32 __pyx_v_i;
+  float __pyx_v_value;
+  Uint32 __pyx_t_1;
+  Uint32 __pyx_t_2;
+  double __pyx_t_3;
+
+  /* "mpfmc/core/audio/mixer.pxd":154
+ *     cdef float value
+ * 
+ *     for i in range(sample_count):             # <<<<<<<<<<<<<<
+ *         value = source[i] * 32768.0
+ *         value = 32767.0 if value > 32767.0 else value
+ */
+  __pyx_t_1 = __pyx_v_sample_count;
+  for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
+    __pyx_v_i = __pyx_t_2;
+
+    /* "mpfmc/core/audio/mixer.pxd":155
+ * 
+ *     for i in range(sample_count):
+ *         value = source[i] * 32768.0             # <<<<<<<<<<<<<<
+ *         value = 32767.0 if value > 32767.0 else value
+ *         value = -32768.0 if value < -32768.0 else value
+ */
+    __pyx_v_value = ((__pyx_v_source[__pyx_v_i]) * 32768.0);
+
+    /* "mpfmc/core/audio/mixer.pxd":156
+ *     for i in range(sample_count):
+ *         value = source[i] * 32768.0
+ *         value = 32767.0 if value > 32767.0 else value             # <<<<<<<<<<<<<<
+ *         value = -32768.0 if value < -32768.0 else value
+ *         output[i] = <Sint16>value
+ */
+    if (((__pyx_v_value > 32767.0) != 0)) {
+      __pyx_t_3 = 32767.0;
+    } else {
+      __pyx_t_3 = __pyx_v_value;
+    }
+    __pyx_v_value = __pyx_t_3;
+
+    /* "mpfmc/core/audio/mixer.pxd":157
+ *         value = source[i] * 32768.0
+ *         value = 32767.0 if value > 32767.0 else value
+ *         value = -32768.0 if value < -32768.0 else value             # <<<<<<<<<<<<<<
+ *         output[i] = <Sint16>value
+ */
+    if (((__pyx_v_value < -32768.0) != 0)) {
+      __pyx_t_3 = -32768.0;
+    } else {
+      __pyx_t_3 = __pyx_v_value;
+    }
+    __pyx_v_value = __pyx_t_3;
+
+    /* "mpfmc/core/audio/mixer.pxd":158
+ *         value = 32767.0 if value > 32767.0 else value
+ *         value = -32768.0 if value < -32768.0 else value
+ *         output[i] = <Sint16>value             # <<<<<<<<<<<<<<
+ */
+    (__pyx_v_output[__pyx_v_i]) = ((Sint16)__pyx_v_value);
+  }
+
+  /* "mpfmc/core/audio/mixer.pxd":143
+ *         buffer[i] *= gain + i * step
+ * 
+ * cdef inline void saturate_float_to_s16(Sint16 *output, const float *source, Uint32 sample_count) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Converts floating-point samples to 16-bit signed samples, clipping any out of range values.
+ */
+
+  /* function exit code */
+}
+
+/* "mpfmc/core/audio/notification_message.pxd":50
+ * # ---------------------------------------------------------------------------
+ * 
+ * cdef inline NotificationMessageContainer *_create_notification_message() nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Creates a new notification message.
+ */
+
+static CYTHON_INLINE __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message(void) {
+  __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_r;
+
+  /* "mpfmc/core/audio/notification_message.pxd":55
+ *     :return: A pointer to the new notification message.
+ *     """
+ *     return <NotificationMessageContainer*>g_slice_alloc0(sizeof(NotificationMessageContainer))             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void _post_notification_message(NotificationMessageContainer *notification_message,
+ */
+  __pyx_r = ((__pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *)g_slice_alloc0((sizeof(__pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer))));
+  goto __pyx_L0;
+
+  /* "mpfmc/core/audio/notification_message.pxd":50
+ * # ---------------------------------------------------------------------------
+ * 
+ * cdef inline NotificationMessageContainer *_create_notification_message() nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Creates a new notification message.
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "mpfmc/core/audio/notification_message.pxd":57
+ *     return <NotificationMessageContainer*>g_slice_alloc0(sizeof(NotificationMessageContainer))
+ * 
+ * cdef inline void _post_notification_message(NotificationMessageContainer *notification_message,             # <<<<<<<<<<<<<<
+ *                                             TrackState *track) nogil:
+ *     """
+ */
+
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message__post_notification_message(__pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_v_notification_message, __pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_v_track) {
+  GSList *__pyx_v_node;
+  GSList *__pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+
+  /* "mpfmc/core/audio/notification_message.pxd":71
+ *         always taken as a whole (see Track.take_notification_messages).
+ *     """
+ *     cdef GSList *node = g_slist_prepend(NULL, notification_message)             # <<<<<<<<<<<<<<
+ * 
+ *     node.next = track.notification_messages
+ */
+  __pyx_v_node = g_slist_prepend(NULL, __pyx_v_notification_message);
+
+  /* "mpfmc/core/audio/notification_message.pxd":73
+ *     cdef GSList *node = g_slist_prepend(NULL, notification_message)
+ * 
+ *     node.next = track.notification_messages             # <<<<<<<<<<<<<<
+ *     while not SDL_AtomicCASPtr(<void**>&track.notification_messages, node.next, node):
+ *         node.next = track.notification_messages
+ */
+  __pyx_t_1 = __pyx_v_track->notification_messages;
+  __pyx_v_node->next = __pyx_t_1;
+
+  /* "mpfmc/core/audio/notification_message.pxd":74
+ * 
+ *     node.next = track.notification_messages
+ *     while not SDL_AtomicCASPtr(<void**>&track.notification_messages, node.next, node):             # <<<<<<<<<<<<<<
+ *         node.next = track.notification_messages
+ * 
+ */
+  while (1) {
+    __pyx_t_2 = ((!SDL_AtomicCASPtr(((void **)(&__pyx_v_track->notification_messages)), __pyx_v_node->next, __pyx_v_node)) != 0);
+    if (!__pyx_t_2) break;
+
+    /* "mpfmc/core/audio/notification_message.pxd":75
+ *     node.next = track.notification_messages
+ *     while not SDL_AtomicCASPtr(<void**>&track.notification_messages, node.next, node):
+ *         node.next = track.notification_messages             # <<<<<<<<<<<<<<
+ * 
+ *     # Only the first message posted since the listener last woke up needs to wake it up
+ */
+    __pyx_t_1 = __pyx_v_track->notification_messages;
+    __pyx_v_node->next = __pyx_t_1;
+  }
+
+  /* "mpfmc/core/audio/notification_message.pxd":78
+ * 
+ *     # Only the first message posted since the listener last woke up needs to wake it up
+ *     if track.callback_data != NULL and track.callback_data.notification_semaphore != NULL:             # <<<<<<<<<<<<<<
+ *         if SDL_AtomicSet(&track.callback_data.notification_wakeup_pending, 1) == 0:
+ *             SDL_SemPost(track.callback_data.notification_semaphore)
+ */
+  __pyx_t_3 = ((__pyx_v_track->callback_data != NULL) != 0);
+  if (__pyx_t_3) {
+  } else {
+    __pyx_t_2 = __pyx_t_3;
+    goto __pyx_L6_bool_binop_done;
+  }
+  __pyx_t_3 = ((__pyx_v_track->callback_data->notification_semaphore != NULL) != 0);
+  __pyx_t_2 = __pyx_t_3;
+  __pyx_L6_bool_binop_done:;
+  if (__pyx_t_2) {
+
+    /* "mpfmc/core/audio/notification_message.pxd":79
+ *     # Only the first message posted since the listener last woke up needs to wake it up
+ *     if track.callback_data != NULL and track.callback_data.notification_semaphore != NULL:
+ *         if SDL_AtomicSet(&track.callback_data.notification_wakeup_pending, 1) == 0:             # <<<<<<<<<<<<<<
+ *             SDL_SemPost(track.callback_data.notification_semaphore)
+ * 
+ */
+    __pyx_t_2 = ((SDL_AtomicSet((&__pyx_v_track->callback_data->notification_wakeup_pending), 1) == 0) != 0);
+    if (__pyx_t_2) {
+
+      /* "mpfmc/core/audio/notification_message.pxd":80
+ *     if track.callback_data != NULL and track.callback_data.notification_semaphore != NULL:
+ *         if SDL_AtomicSet(&track.callback_data.notification_wakeup_pending, 1) == 0:
+ *             SDL_SemPost(track.callback_data.notification_semaphore)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void send_sound_started_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,
+ */
+      SDL_SemPost(__pyx_v_track->callback_data->notification_semaphore);
+
+      /* "mpfmc/core/audio/notification_message.pxd":79
+ *     # Only the first message posted since the listener last woke up needs to wake it up
+ *     if track.callback_data != NULL and track.callback_data.notification_semaphore != NULL:
+ *         if SDL_AtomicSet(&track.callback_data.notification_wakeup_pending, 1) == 0:             # <<<<<<<<<<<<<<
+ *             SDL_SemPost(track.callback_data.notification_semaphore)
+ * 
+ */
+    }
+
+    /* "mpfmc/core/audio/notification_message.pxd":78
+ * 
+ *     # Only the first message posted since the listener last woke up needs to wake it up
+ *     if track.callback_data != NULL and track.callback_data.notification_semaphore != NULL:             # <<<<<<<<<<<<<<
+ *         if SDL_AtomicSet(&track.callback_data.notification_wakeup_pending, 1) == 0:
+ *             SDL_SemPost(track.callback_data.notification_semaphore)
+ */
+  }
+
+  /* "mpfmc/core/audio/notification_message.pxd":57
+ *     return <NotificationMessageContainer*>g_slice_alloc0(sizeof(NotificationMessageContainer))
+ * 
+ * cdef inline void _post_notification_message(NotificationMessageContainer *notification_message,             # <<<<<<<<<<<<<<
+ *                                             TrackState *track) nogil:
+ *     """
+ */
+
+  /* function exit code */
+}
+
+/* "mpfmc/core/audio/notification_message.pxd":82
+ *             SDL_SemPost(track.callback_data.notification_semaphore)
+ * 
+ * cdef inline void send_sound_started_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,             # <<<<<<<<<<<<<<
+ *                                                  TrackState *track) nogil:
+ *     """
+ */
+
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_send_sound_started_notification(int __pyx_v_player, Uint64 __pyx_v_sound_id, Uint64 __pyx_v_sound_instance_id, __pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_v_track) {
+  __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_v_notification_message;
+  int __pyx_t_1;
+
+  /* "mpfmc/core/audio/notification_message.pxd":92
+ *         track: The TrackState pointer
+ *     """
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message()             # <<<<<<<<<<<<<<
+ *     if notification_message != NULL:
+ *         notification_message.message = notification_sound_started
+ */
+  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message();
+
+  /* "mpfmc/core/audio/notification_message.pxd":93
+ *     """
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     if notification_message != NULL:             # <<<<<<<<<<<<<<
+ *         notification_message.message = notification_sound_started
+ *         notification_message.player = player
+ */
+  __pyx_t_1 = ((__pyx_v_notification_message != NULL) != 0);
+  if (__pyx_t_1) {
+
+    /* "mpfmc/core/audio/notification_message.pxd":94
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     if notification_message != NULL:
+ *         notification_message.message = notification_sound_started             # <<<<<<<<<<<<<<
+ *         notification_message.player = player
+ *         notification_message.sound_id = sound_id
+ */
+    __pyx_v_notification_message->message = __pyx_e_5mpfmc_4core_5audio_20notification_message_notification_sound_started;
+
+    /* "mpfmc/core/audio/notification_message.pxd":95
+ *     if notification_message != NULL:
+ *         notification_message.message = notification_sound_started
+ *         notification_message.player = player             # <<<<<<<<<<<<<<
+ *         notification_message.sound_id = sound_id
+ *         notification_message.sound_instance_id = sound_instance_id
+ */
+    __pyx_v_notification_message->player = __pyx_v_player;
+
+    /* "mpfmc/core/audio/notification_message.pxd":96
+ *         notification_message.message = notification_sound_started
+ *         notification_message.player = player
+ *         notification_message.sound_id = sound_id             # <<<<<<<<<<<<<<
+ *         notification_message.sound_instance_id = sound_instance_id
+ * 
+ */
+    __pyx_v_notification_message->sound_id = __pyx_v_sound_id;
+
+    /* "mpfmc/core/audio/notification_message.pxd":97
+ *         notification_message.player = player
+ *         notification_message.sound_id = sound_id
+ *         notification_message.sound_instance_id = sound_instance_id             # <<<<<<<<<<<<<<
+ * 
+ *         _post_notification_message(notification_message, track)
+ */
+    __pyx_v_notification_message->sound_instance_id = __pyx_v_sound_instance_id;
+
+    /* "mpfmc/core/audio/notification_message.pxd":99
+ *         notification_message.sound_instance_id = sound_instance_id
+ * 
+ *         _post_notification_message(notification_message, track)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void send_sound_stopped_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,
+ */
+    __pyx_f_5mpfmc_4core_5audio_20notification_message__post_notification_message(__pyx_v_notification_message, __pyx_v_track);
+
+    /* "mpfmc/core/audio/notification_message.pxd":93
+ *     """
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     if notification_message != NULL:             # <<<<<<<<<<<<<<
+ *         notification_message.message = notification_sound_started
+ *         notification_message.player = player
+ */
+  }
+
+  /* "mpfmc/core/audio/notification_message.pxd":82
+ *             SDL_SemPost(track.callback_data.notification_semaphore)
+ * 
+ * cdef inline void send_sound_started_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,             # <<<<<<<<<<<<<<
+ *                                                  TrackState *track) nogil:
+ *     """
+ */
+
+  /* function exit code */
+}
+
+/* "mpfmc/core/audio/notification_message.pxd":101
+ *         _post_notification_message(notification_message, track)
+ * 
+ * cdef inline void send_sound_stopped_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,             # <<<<<<<<<<<<<<
+ *                                                  TrackState *track) nogil:
+ *     """
+ */
+
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_send_sound_stopped_notification(int __pyx_v_player, Uint64 __pyx_v_sound_id, Uint64 __pyx_v_sound_instance_id, __pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_v_track) {
+  __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_v_notification_message;
+  int __pyx_t_1;
+
+  /* "mpfmc/core/audio/notification_message.pxd":111
+ *         track: The TrackState pointer
+ *     """
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message()             # <<<<<<<<<<<<<<
+ *     if notification_message != NULL:
+ *         notification_message.message = notification_sound_stopped
+ */
+  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message();
+
+  /* "mpfmc/core/audio/notification_message.pxd":112
+ *     """
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     if notification_message != NULL:             # <<<<<<<<<<<<<<
+ *         notification_message.message = notification_sound_stopped
+ *         notification_message.player = player
+ */
+  __pyx_t_1 = ((__pyx_v_notification_message != NULL) != 0);
+  if (__pyx_t_1) {
+
+    /* "mpfmc/core/audio/notification_message.pxd":113
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     if notification_message != NULL:
+ *         notification_message.message = notification_sound_stopped             # <<<<<<<<<<<<<<
+ *         notification_message.player = player
+ *         notification_message.sound_id = sound_id
+ */
+    __pyx_v_notification_message->message = __pyx_e_5mpfmc_4core_5audio_20notification_message_notification_sound_stopped;
+
+    /* "mpfmc/core/audio/notification_message.pxd":114
+ *     if notification_message != NULL:
+ *         notification_message.message = notification_sound_stopped
+ *         notification_message.player = player             # <<<<<<<<<<<<<<
+ *         notification_message.sound_id = sound_id
+ *         notification_message.sound_instance_id = sound_instance_id
+ */
+    __pyx_v_notification_message->player = __pyx_v_player;
+
+    /* "mpfmc/core/audio/notification_message.pxd":115
+ *         notification_message.message = notification_sound_stopped
+ *         notification_message.player = player
+ *         notification_message.sound_id = sound_id             # <<<<<<<<<<<<<<
+ *         notification_message.sound_instance_id = sound_instance_id
+ * 
+ */
+    __pyx_v_notification_message->sound_id = __pyx_v_sound_id;
+
+    /* "mpfmc/core/audio/notification_message.pxd":116
+ *         notification_message.player = player
+ *         notification_message.sound_id = sound_id
+ *         notification_message.sound_instance_id = sound_instance_id             # <<<<<<<<<<<<<<
+ * 
+ *         _post_notification_message(notification_message, track)
+ */
+    __pyx_v_notification_message->sound_instance_id = __pyx_v_sound_instance_id;
+
+    /* "mpfmc/core/audio/notification_message.pxd":118
+ *         notification_message.sound_instance_id = sound_instance_id
+ * 
+ *         _post_notification_message(notification_message, track)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void send_sound_looping_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,
+ */
+    __pyx_f_5mpfmc_4core_5audio_20notification_message__post_notification_message(__pyx_v_notification_message, __pyx_v_track);
+
+    /* "mpfmc/core/audio/notification_message.pxd":112
+ *     """
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     if notification_message != NULL:             # <<<<<<<<<<<<<<
+ *         notification_message.message = notification_sound_stopped
+ *         notification_message.player = player
+ */
+  }
+
+  /* "mpfmc/core/audio/notification_message.pxd":101
+ *         _post_notification_message(notification_message, track)
+ * 
+ * cdef inline void send_sound_stopped_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,             # <<<<<<<<<<<<<<
+ *                                                  TrackState *track) nogil:
+ *     """
+ */
+
+  /* function exit code */
+}
+
+/* "mpfmc/core/audio/notification_message.pxd":120
+ *         _post_notification_message(notification_message, track)
+ * 
+ * cdef inline void send_sound_looping_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,             # <<<<<<<<<<<<<<
+ *                                                  TrackState *track) nogil:
+ *     """
+ */
+
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_send_sound_looping_notification(int __pyx_v_player, Uint64 __pyx_v_sound_id, Uint64 __pyx_v_sound_instance_id, __pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_v_track) {
+  __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_v_notification_message;
+  int __pyx_t_1;
+
+  /* "mpfmc/core/audio/notification_message.pxd":130
+ *         track: The TrackState pointer
+ *     """
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message()             # <<<<<<<<<<<<<<
+ *     if notification_message != NULL:
+ *         notification_message.message = notification_sound_looping
+ */
+  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message();
+
+  /* "mpfmc/core/audio/notification_message.pxd":131
+ *     """
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     if notification_message != NULL:             # <<<<<<<<<<<<<<
+ *         notification_message.message = notification_sound_looping
+ *         notification_message.player = player
+ */
+  __pyx_t_1 = ((__pyx_v_notification_message != NULL) != 0);
+  if (__pyx_t_1) {
+
+    /* "mpfmc/core/audio/notification_message.pxd":132
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     if notification_message != NULL:
+ *         notification_message.message = notification_sound_looping             # <<<<<<<<<<<<<<
+ *         notification_message.player = player
+ *         notification_message.sound_id = sound_id
+ */
+    __pyx_v_notification_message->message = __pyx_e_5mpfmc_4core_5audio_20notification_message_notification_sound_looping;
+
+    /* "mpfmc/core/audio/notification_message.pxd":133
+ *     if notification_message != NULL:
+ *         notification_message.message = notification_sound_looping
+ *         notification_message.player = player             # <<<<<<<<<<<<<<
+ *         notification_message.sound_id = sound_id
+ *         notification_message.sound_instance_id = sound_instance_id
+ */
+    __pyx_v_notification_message->player = __pyx_v_player;
+
+    /* "mpfmc/core/audio/notification_message.pxd":134
+ *         notification_message.message = notification_sound_looping
+ *         notification_message.player = player
+ *         notification_message.sound_id = sound_id             # <<<<<<<<<<<<<<
+ *         notification_message.sound_instance_id = sound_instance_id
+ * 
+ */
+    __pyx_v_notification_message->sound_id = __pyx_v_sound_id;
+
+    /* "mpfmc/core/audio/notification_message.pxd":135
+ *         notification_message.player = player
+ *         notification_message.sound_id = sound_id
+ *         notification_message.sound_instance_id = sound_instance_id             # <<<<<<<<<<<<<<
+ * 
+ *         _post_notification_message(notification_message, track)
+ */
+    __pyx_v_notification_message->sound_instance_id = __pyx_v_sound_instance_id;
+
+    /* "mpfmc/core/audio/notification_message.pxd":137
+ *         notification_message.sound_instance_id = sound_instance_id
+ * 
+ *         _post_notification_message(notification_message, track)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void send_sound_about_to_finish_notification(int player, long sound_id, long sound_instance_id,
+ */
+    __pyx_f_5mpfmc_4core_5audio_20notification_message__post_notification_message(__pyx_v_notification_message, __pyx_v_track);
+
+    /* "mpfmc/core/audio/notification_message.pxd":131
+ *     """
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     if notification_message != NULL:             # <<<<<<<<<<<<<<
+ *         notification_message.message = notification_sound_looping
+ *         notification_message.player = player
+ */
+  }
+
+  /* "mpfmc/core/audio/notification_message.pxd":120
+ *         _post_notification_message(notification_message, track)
+ * 
+ * cdef inline void send_sound_looping_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,             # <<<<<<<<<<<<<<
+ *                                                  TrackState *track) nogil:
+ *     """
+ */
+
+  /* function exit code */
+}
+
+/* "mpfmc/core/audio/notification_message.pxd":139
+ *         _post_notification_message(notification_message, track)
+ * 
+ * cdef inline void send_sound_about_to_finish_notification(int player, long sound_id, long sound_instance_id,             # <<<<<<<<<<<<<<
+ *                                                          TrackState *track) nogil:
+ *     """
+ */
+
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_send_sound_about_to_finish_notification(int __pyx_v_player, long __pyx_v_sound_id, long __pyx_v_sound_instance_id, __pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_v_track) {
+  __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_v_notification_message;
+  int __pyx_t_1;
+
+  /* "mpfmc/core/audio/notification_message.pxd":149
+ *         track: The TrackState pointer
+ *     """
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message()             # <<<<<<<<<<<<<<
+ *     if notification_message != NULL:
+ *         notification_message.message = notification_sound_about_to_finish
+ */
+  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message();
+
+  /* "mpfmc/core/audio/notification_message.pxd":150
+ *     """
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     if notification_message != NULL:             # <<<<<<<<<<<<<<
+ *         notification_message.message = notification_sound_about_to_finish
+ *         notification_message.player = player
+ */
+  __pyx_t_1 = ((__pyx_v_notification_message != NULL) != 0);
+  if (__pyx_t_1) {
+
+    /* "mpfmc/core/audio/notification_message.pxd":151
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     if notification_message != NULL:
+ *         notification_message.message = notification_sound_about_to_finish             # <<<<<<<<<<<<<<
+ *         notification_message.player = player
+ *         notification_message.sound_id = sound_id
+ */
+    __pyx_v_notification_message->message = __pyx_e_5mpfmc_4core_5audio_20notification_message_notification_sound_about_to_finish;
+
+    /* "mpfmc/core/audio/notification_message.pxd":152
+ *     if notification_message != NULL:
+ *         notification_message.message = notification_sound_about_to_finish
+ *         notification_message.player = player             # <<<<<<<<<<<<<<
+ *         notification_message.sound_id = sound_id
+ *         notification_message.sound_instance_id = sound_instance_id
+ */
+    __pyx_v_notification_message->player = __pyx_v_player;
+
+    /* "mpfmc/core/audio/notification_message.pxd":153
+ *         notification_message.message = notification_sound_about_to_finish
+ *         notification_message.player = player
+ *         notification_message.sound_id = sound_id             # <<<<<<<<<<<<<<
+ *         notification_message.sound_instance_id = sound_instance_id
+ * 
+ */
+    __pyx_v_notification_message->sound_id = __pyx_v_sound_id;
+
+    /* "mpfmc/core/audio/notification_message.pxd":154
+ *         notification_message.player = player
+ *         notification_message.sound_id = sound_id
+ *         notification_message.sound_instance_id = sound_instance_id             # <<<<<<<<<<<<<<
+ * 
+ *         _post_notification_message(notification_message, track)
+ */
+    __pyx_v_notification_message->sound_instance_id = __pyx_v_sound_instance_id;
+
+    /* "mpfmc/core/audio/notification_message.pxd":156
+ *         notification_message.sound_instance_id = sound_instance_id
+ * 
+ *         _post_notification_message(notification_message, track)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void send_sound_marker_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,
+ */
+    __pyx_f_5mpfmc_4core_5audio_20notification_message__post_notification_message(__pyx_v_notification_message, __pyx_v_track);
+
+    /* "mpfmc/core/audio/notification_message.pxd":150
+ *     """
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     if notification_message != NULL:             # <<<<<<<<<<<<<<
+ *         notification_message.message = notification_sound_about_to_finish
+ *         notification_message.player = player
+ */
+  }
+
+  /* "mpfmc/core/audio/notification_message.pxd":139
+ *         _post_notification_message(notification_message, track)
+ * 
+ * cdef inline void send_sound_about_to_finish_notification(int player, long sound_id, long sound_instance_id,             # <<<<<<<<<<<<<<
+ *                                                          TrackState *track) nogil:
+ *     """
+ */
+
+  /* function exit code */
+}
+
+/* "mpfmc/core/audio/notification_message.pxd":158
+ *         _post_notification_message(notification_message, track)
+ * 
+ * cdef inline void send_sound_marker_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,             # <<<<<<<<<<<<<<
+ *                                                 TrackState *track,
+ *                                                 int marker_id) nogil:
+ */
+
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_send_sound_marker_notification(int __pyx_v_player, Uint64 __pyx_v_sound_id, Uint64 __pyx_v_sound_instance_id, __pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_v_track, int __pyx_v_marker_id) {
+  __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_v_notification_message;
+  int __pyx_t_1;
+
+  /* "mpfmc/core/audio/notification_message.pxd":170
+ *         marker_id: The id of the marker being sent for the specified sound
+ *     """
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message()             # <<<<<<<<<<<<<<
+ *     if notification_message != NULL:
+ *         notification_message.message = notification_sound_marker
+ */
+  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message();
+
+  /* "mpfmc/core/audio/notification_message.pxd":171
+ *     """
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     if notification_message != NULL:             # <<<<<<<<<<<<<<
+ *         notification_message.message = notification_sound_marker
+ *         notification_message.player = player
+ */
+  __pyx_t_1 = ((__pyx_v_notification_message != NULL) != 0);
+  if (__pyx_t_1) {
+
+    /* "mpfmc/core/audio/notification_message.pxd":172
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     if notification_message != NULL:
+ *         notification_message.message = notification_sound_marker             # <<<<<<<<<<<<<<
+ *         notification_message.player = player
+ *         notification_message.sound_id = sound_id
+ */
+    __pyx_v_notification_message->message = __pyx_e_5mpfmc_4core_5audio_20notification_message_notification_sound_marker;
+
+    /* "mpfmc/core/audio/notification_message.pxd":173
+ *     if notification_message != NULL:
+ *         notification_message.message = notification_sound_marker
+ *         notification_message.player = player             # <<<<<<<<<<<<<<
+ *         notification_message.sound_id = sound_id
+ *         notification_message.sound_instance_id = sound_instance_id
+ */
+    __pyx_v_notification_message->player = __pyx_v_player;
+
+    /* "mpfmc/core/audio/notification_message.pxd":174
+ *         notification_message.message = notification_sound_marker
+ *         notification_message.player = player
+ *         notification_message.sound_id = sound_id             # <<<<<<<<<<<<<<
+ *         notification_message.sound_instance_id = sound_instance_id
+ *         notification_message.data.marker.id = marker_id
+ */
+    __pyx_v_notification_message->sound_id = __pyx_v_sound_id;
+
+    /* "mpfmc/core/audio/notification_message.pxd":175
+ *         notification_message.player = player
+ *         notification_message.sound_id = sound_id
+ *         notification_message.sound_instance_id = sound_instance_id             # <<<<<<<<<<<<<<
+ *         notification_message.data.marker.id = marker_id
+ * 
+ */
+    __pyx_v_notification_message->sound_instance_id = __pyx_v_sound_instance_id;
+
+    /* "mpfmc/core/audio/notification_message.pxd":176
+ *         notification_message.sound_id = sound_id
+ *         notification_message.sound_instance_id = sound_instance_id
+ *         notification_message.data.marker.id = marker_id             # <<<<<<<<<<<<<<
+ * 
+ *         _post_notification_message(notification_message, track)
+ */
+    __pyx_v_notification_message->data.marker.id = __pyx_v_marker_id;
+
+    /* "mpfmc/core/audio/notification_message.pxd":178
+ *         notification_message.data.marker.id = marker_id
+ * 
+ *         _post_notification_message(notification_message, track)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void send_track_stopped_notification(TrackState *track) nogil:
+ */
+    __pyx_f_5mpfmc_4core_5audio_20notification_message__post_notification_message(__pyx_v_notification_message, __pyx_v_track);
+
+    /* "mpfmc/core/audio/notification_message.pxd":171
+ *     """
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     if notification_message != NULL:             # <<<<<<<<<<<<<<
+ *         notification_message.message = notification_sound_marker
+ *         notification_message.player = player
+ */
+  }
+
+  /* "mpfmc/core/audio/notification_message.pxd":158
+ *         _post_notification_message(notification_message, track)
+ * 
+ * cdef inline void send_sound_marker_notification(int player, Uint64 sound_id, Uint64 sound_instance_id,             # <<<<<<<<<<<<<<
+ *                                                 TrackState *track,
+ *                                                 int marker_id) nogil:
+ */
+
+  /* function exit code */
+}
+
+/* "mpfmc/core/audio/notification_message.pxd":180
+ *         _post_notification_message(notification_message, track)
+ * 
+ * cdef inline void send_track_stopped_notification(TrackState *track) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Sends a track stopped notification
+ */
+
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_send_track_stopped_notification(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_v_track) {
+  __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_v_notification_message;
+  int __pyx_t_1;
+
+  /* "mpfmc/core/audio/notification_message.pxd":186
+ *         track: The TrackState pointer
+ *     """
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message()             # <<<<<<<<<<<<<<
+ *     if notification_message != NULL:
+ *         notification_message.message = notification_track_stopped
+ */
+  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message();
+
+  /* "mpfmc/core/audio/notification_message.pxd":187
+ *     """
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     if notification_message != NULL:             # <<<<<<<<<<<<<<
+ *         notification_message.message = notification_track_stopped
+ *         _post_notification_message(notification_message, track)
+ */
+  __pyx_t_1 = ((__pyx_v_notification_message != NULL) != 0);
+  if (__pyx_t_1) {
+
+    /* "mpfmc/core/audio/notification_message.pxd":188
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     if notification_message != NULL:
+ *         notification_message.message = notification_track_stopped             # <<<<<<<<<<<<<<
+ *         _post_notification_message(notification_message, track)
+ * 
+ */
+    __pyx_v_notification_message->message = __pyx_e_5mpfmc_4core_5audio_20notification_message_notification_track_stopped;
+
+    /* "mpfmc/core/audio/notification_message.pxd":189
+ *     if notification_message != NULL:
+ *         notification_message.message = notification_track_stopped
+ *         _post_notification_message(notification_message, track)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void send_track_paused_notification(TrackState *track) nogil:
+ */
+    __pyx_f_5mpfmc_4core_5audio_20notification_message__post_notification_message(__pyx_v_notification_message, __pyx_v_track);
+
+    /* "mpfmc/core/audio/notification_message.pxd":187
+ *     """
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     if notification_message != NULL:             # <<<<<<<<<<<<<<
+ *         notification_message.message = notification_track_stopped
+ *         _post_notification_message(notification_message, track)
+ */
+  }
+
+  /* "mpfmc/core/audio/notification_message.pxd":180
+ *         _post_notification_message(notification_message, track)
+ * 
+ * cdef inline void send_track_stopped_notification(TrackState *track) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Sends a track stopped notification
+ */
+
+  /* function exit code */
+}
+
+/* "mpfmc/core/audio/notification_message.pxd":191
+ *         _post_notification_message(notification_message, track)
+ * 
+ * cdef inline void send_track_paused_notification(TrackState *track) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Sends a track paused notification
+ */
+
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_send_track_paused_notification(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_v_track) {
+  __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_v_notification_message;
+  int __pyx_t_1;
+
+  /* "mpfmc/core/audio/notification_message.pxd":197
+ *         track: The TrackState pointer
+ *     """
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message()             # <<<<<<<<<<<<<<
+ *     if notification_message != NULL:
+ *         notification_message.message = notification_track_paused
+ */
+  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message();
+
+  /* "mpfmc/core/audio/notification_message.pxd":198
+ *     """
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     if notification_message != NULL:             # <<<<<<<<<<<<<<
+ *         notification_message.message = notification_track_paused
+ *         _post_notification_message(notification_message, track)
+ */
+  __pyx_t_1 = ((__pyx_v_notification_message != NULL) != 0);
+  if (__pyx_t_1) {
+
+    /* "mpfmc/core/audio/notification_message.pxd":199
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     if notification_message != NULL:
+ *         notification_message.message = notification_track_paused             # <<<<<<<<<<<<<<
+ *         _post_notification_message(notification_message, track)
+ * 
+ */
+    __pyx_v_notification_message->message = __pyx_e_5mpfmc_4core_5audio_20notification_message_notification_track_paused;
+
+    /* "mpfmc/core/audio/notification_message.pxd":200
+ *     if notification_message != NULL:
+ *         notification_message.message = notification_track_paused
+ *         _post_notification_message(notification_message, track)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void send_sound_loop_set_started_notification(int sound_loop_set_id, Uint64 sound_id, TrackState *track) nogil:
+ */
+    __pyx_f_5mpfmc_4core_5audio_20notification_message__post_notification_message(__pyx_v_notification_message, __pyx_v_track);
+
+    /* "mpfmc/core/audio/notification_message.pxd":198
+ *     """
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     if notification_message != NULL:             # <<<<<<<<<<<<<<
+ *         notification_message.message = notification_track_paused
+ *         _post_notification_message(notification_message, track)
+ */
+  }
+
+  /* "mpfmc/core/audio/notification_message.pxd":191
+ *         _post_notification_message(notification_message, track)
+ * 
+ * cdef inline void send_track_paused_notification(TrackState *track) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Sends a track paused notification
+ */
+
+  /* function exit code */
+}
+
+/* "mpfmc/core/audio/notification_message.pxd":202
+ *         _post_notification_message(notification_message, track)
+ * 
+ * cdef inline void send_sound_loop_set_started_notification(int sound_loop_set_id, Uint64 sound_id, TrackState *track) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Sends a sound_loop_set started notification
+ */
+
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_send_sound_loop_set_started_notification(int __pyx_v_sound_loop_set_id, Uint64 __pyx_v_sound_id, __pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_v_track) {
+  __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_v_notification_message;
+  int __pyx_t_1;
+
+  /* "mpfmc/core/audio/notification_message.pxd":210
+ *         track: The TrackState pointer
+ *     """
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message()             # <<<<<<<<<<<<<<
+ *     if notification_message != NULL:
+ *         notification_message.message = notification_sound_loop_set_started
+ */
+  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message();
+
+  /* "mpfmc/core/audio/notification_message.pxd":211
+ *     """
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     if notification_message != NULL:             # <<<<<<<<<<<<<<
+ *         notification_message.message = notification_sound_loop_set_started
+ *         notification_message.player = 0
+ */
+  __pyx_t_1 = ((__pyx_v_notification_message != NULL) != 0);
+  if (__pyx_t_1) {
+
+    /* "mpfmc/core/audio/notification_message.pxd":212
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     if notification_message != NULL:
+ *         notification_message.message = notification_sound_loop_set_started             # <<<<<<<<<<<<<<
+ *         notification_message.player = 0
+ *         notification_message.sound_id = sound_id
+ */
+    __pyx_v_notification_message->message = __pyx_e_5mpfmc_4core_5audio_20notification_message_notification_sound_loop_set_started;
+
+    /* "mpfmc/core/audio/notification_message.pxd":213
+ *     if notification_message != NULL:
+ *         notification_message.message = notification_sound_loop_set_started
+ *         notification_message.player = 0             # <<<<<<<<<<<<<<
+ *         notification_message.sound_id = sound_id
+ *         notification_message.sound_instance_id = 0
+ */
+    __pyx_v_notification_message->player = 0;
+
+    /* "mpfmc/core/audio/notification_message.pxd":214
+ *         notification_message.message = notification_sound_loop_set_started
+ *         notification_message.player = 0
+ *         notification_message.sound_id = sound_id             # <<<<<<<<<<<<<<
+ *         notification_message.sound_instance_id = 0
+ *         notification_message.data.sound_loop_set.id = sound_loop_set_id
+ */
+    __pyx_v_notification_message->sound_id = __pyx_v_sound_id;
+
+    /* "mpfmc/core/audio/notification_message.pxd":215
+ *         notification_message.player = 0
+ *         notification_message.sound_id = sound_id
+ *         notification_message.sound_instance_id = 0             # <<<<<<<<<<<<<<
+ *         notification_message.data.sound_loop_set.id = sound_loop_set_id
+ * 
+ */
+    __pyx_v_notification_message->sound_instance_id = 0;
+
+    /* "mpfmc/core/audio/notification_message.pxd":216
+ *         notification_message.sound_id = sound_id
+ *         notification_message.sound_instance_id = 0
+ *         notification_message.data.sound_loop_set.id = sound_loop_set_id             # <<<<<<<<<<<<<<
+ * 
+ *         _post_notification_message(notification_message, track)
+ */
+    __pyx_v_notification_message->data.sound_loop_set.id = __pyx_v_sound_loop_set_id;
+
+    /* "mpfmc/core/audio/notification_message.pxd":218
+ *         notification_message.data.sound_loop_set.id = sound_loop_set_id
+ * 
+ *         _post_notification_message(notification_message, track)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void send_sound_loop_set_stopped_notification(int sound_loop_set_id, Uint64 sound_id, TrackState *track) nogil:
+ */
+    __pyx_f_5mpfmc_4core_5audio_20notification_message__post_notification_message(__pyx_v_notification_message, __pyx_v_track);
+
+    /* "mpfmc/core/audio/notification_message.pxd":211
+ *     """
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     if notification_message != NULL:             # <<<<<<<<<<<<<<
+ *         notification_message.message = notification_sound_loop_set_started
+ *         notification_message.player = 0
+ */
+  }
+
+  /* "mpfmc/core/audio/notification_message.pxd":202
+ *         _post_notification_message(notification_message, track)
+ * 
+ * cdef inline void send_sound_loop_set_started_notification(int sound_loop_set_id, Uint64 sound_id, TrackState *track) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Sends a sound_loop_set started notification
+ */
+
+  /* function exit code */
+}
+
+/* "mpfmc/core/audio/notification_message.pxd":220
+ *         _post_notification_message(notification_message, track)
+ * 
+ * cdef inline void send_sound_loop_set_stopped_notification(int sound_loop_set_id, Uint64 sound_id, TrackState *track) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Sends a sound_loop_set stopped notification
+ */
+
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_send_sound_loop_set_stopped_notification(int __pyx_v_sound_loop_set_id, Uint64 __pyx_v_sound_id, __pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_v_track) {
+  __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_v_notification_message;
+  int __pyx_t_1;
+
+  /* "mpfmc/core/audio/notification_message.pxd":228
+ *         track: The TrackState pointer
+ *     """
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message()             # <<<<<<<<<<<<<<
+ *     if notification_message != NULL:
+ *         notification_message.message = notification_sound_loop_set_stopped
+ */
+  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message();
+
+  /* "mpfmc/core/audio/notification_message.pxd":229
+ *     """
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     if notification_message != NULL:             # <<<<<<<<<<<<<<
+ *         notification_message.message = notification_sound_loop_set_stopped
+ *         notification_message.player = 0
+ */
+  __pyx_t_1 = ((__pyx_v_notification_message != NULL) != 0);
+  if (__pyx_t_1) {
+
+    /* "mpfmc/core/audio/notification_message.pxd":230
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     if notification_message != NULL:
+ *         notification_message.message = notification_sound_loop_set_stopped             # <<<<<<<<<<<<<<
+ *         notification_message.player = 0
+ *         notification_message.sound_id = sound_id
+ */
+    __pyx_v_notification_message->message = __pyx_e_5mpfmc_4core_5audio_20notification_message_notification_sound_loop_set_stopped;
+
+    /* "mpfmc/core/audio/notification_message.pxd":231
+ *     if notification_message != NULL:
+ *         notification_message.message = notification_sound_loop_set_stopped
+ *         notification_message.player = 0             # <<<<<<<<<<<<<<
+ *         notification_message.sound_id = sound_id
+ *         notification_message.sound_instance_id = 0
+ */
+    __pyx_v_notification_message->player = 0;
+
+    /* "mpfmc/core/audio/notification_message.pxd":232
+ *         notification_message.message = notification_sound_loop_set_stopped
+ *         notification_message.player = 0
+ *         notification_message.sound_id = sound_id             # <<<<<<<<<<<<<<
+ *         notification_message.sound_instance_id = 0
+ *         notification_message.data.sound_loop_set.id = sound_loop_set_id
+ */
+    __pyx_v_notification_message->sound_id = __pyx_v_sound_id;
+
+    /* "mpfmc/core/audio/notification_message.pxd":233
+ *         notification_message.player = 0
+ *         notification_message.sound_id = sound_id
+ *         notification_message.sound_instance_id = 0             # <<<<<<<<<<<<<<
+ *         notification_message.data.sound_loop_set.id = sound_loop_set_id
+ * 
+ */
+    __pyx_v_notification_message->sound_instance_id = 0;
+
+    /* "mpfmc/core/audio/notification_message.pxd":234
+ *         notification_message.sound_id = sound_id
+ *         notification_message.sound_instance_id = 0
+ *         notification_message.data.sound_loop_set.id = sound_loop_set_id             # <<<<<<<<<<<<<<
+ * 
+ *         _post_notification_message(notification_message, track)
+ */
+    __pyx_v_notification_message->data.sound_loop_set.id = __pyx_v_sound_loop_set_id;
+
+    /* "mpfmc/core/audio/notification_message.pxd":236
+ *         notification_message.data.sound_loop_set.id = sound_loop_set_id
+ * 
+ *         _post_notification_message(notification_message, track)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void send_sound_loop_set_looping_notification(int sound_loop_set_id, Uint64 sound_id, TrackState *track) nogil:
+ */
+    __pyx_f_5mpfmc_4core_5audio_20notification_message__post_notification_message(__pyx_v_notification_message, __pyx_v_track);
+
+    /* "mpfmc/core/audio/notification_message.pxd":229
+ *     """
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     if notification_message != NULL:             # <<<<<<<<<<<<<<
+ *         notification_message.message = notification_sound_loop_set_stopped
+ *         notification_message.player = 0
+ */
+  }
+
+  /* "mpfmc/core/audio/notification_message.pxd":220
+ *         _post_notification_message(notification_message, track)
+ * 
+ * cdef inline void send_sound_loop_set_stopped_notification(int sound_loop_set_id, Uint64 sound_id, TrackState *track) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Sends a sound_loop_set stopped notification
+ */
+
+  /* function exit code */
+}
+
+/* "mpfmc/core/audio/notification_message.pxd":238
+ *         _post_notification_message(notification_message, track)
+ * 
+ * cdef inline void send_sound_loop_set_looping_notification(int sound_loop_set_id, Uint64 sound_id, TrackState *track) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Sends a sound_loop_set looping notification
+ */
+
+static CYTHON_INLINE void __pyx_f_5mpfmc_4core_5audio_20notification_message_send_sound_loop_set_looping_notification(int __pyx_v_sound_loop_set_id, Uint64 __pyx_v_sound_id, __pyx_t_5mpfmc_4core_5audio_5track_TrackState *__pyx_v_track) {
+  __pyx_t_5mpfmc_4core_5audio_20notification_message_NotificationMessageContainer *__pyx_v_notification_message;
+  int __pyx_t_1;
+
+  /* "mpfmc/core/audio/notification_message.pxd":246
+ *         track: The TrackState pointer
+ *     """
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message()             # <<<<<<<<<<<<<<
+ *     if notification_message != NULL:
+ *         notification_message.message = notification_sound_loop_set_looping
+ */
+  __pyx_v_notification_message = __pyx_f_5mpfmc_4core_5audio_20notification_message__create_notification_message();
+
+  /* "mpfmc/core/audio/notification_message.pxd":247
+ *     """
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     if notification_message != NULL:             # <<<<<<<<<<<<<<
+ *         notification_message.message = notification_sound_loop_set_looping
+ *         notification_message.player = 0
+ */
+  __pyx_t_1 = ((__pyx_v_notification_message != NULL) != 0);
+  if (__pyx_t_1) {
+
+    /* "mpfmc/core/audio/notification_message.pxd":248
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     if notification_message != NULL:
+ *         notification_message.message = notification_sound_loop_set_looping             # <<<<<<<<<<<<<<
+ *         notification_message.player = 0
+ *         notification_message.sound_id = sound_id
+ */
+    __pyx_v_notification_message->message = __pyx_e_5mpfmc_4core_5audio_20notification_message_notification_sound_loop_set_looping;
+
+    /* "mpfmc/core/audio/notification_message.pxd":249
+ *     if notification_message != NULL:
+ *         notification_message.message = notification_sound_loop_set_looping
+ *         notification_message.player = 0             # <<<<<<<<<<<<<<
+ *         notification_message.sound_id = sound_id
+ *         notification_message.sound_instance_id = 0
+ */
+    __pyx_v_notification_message->player = 0;
+
+    /* "mpfmc/core/audio/notification_message.pxd":250
+ *         notification_message.message = notification_sound_loop_set_looping
+ *         notification_message.player = 0
+ *         notification_message.sound_id = sound_id             # <<<<<<<<<<<<<<
+ *         notification_message.sound_instance_id = 0
+ *         notification_message.data.sound_loop_set.id = sound_loop_set_id
+ */
+    __pyx_v_notification_message->sound_id = __pyx_v_sound_id;
+
+    /* "mpfmc/core/audio/notification_message.pxd":251
+ *         notification_message.player = 0
+ *         notification_message.sound_id = sound_id
+ *         notification_message.sound_instance_id = 0             # <<<<<<<<<<<<<<
+ *         notification_message.data.sound_loop_set.id = sound_loop_set_id
+ * 
+ */
+    __pyx_v_notification_message->sound_instance_id = 0;
+
+    /* "mpfmc/core/audio/notification_message.pxd":252
+ *         notification_message.sound_id = sound_id
+ *         notification_message.sound_instance_id = 0
+ *         notification_message.data.sound_loop_set.id = sound_loop_set_id             # <<<<<<<<<<<<<<
+ * 
+ *         _post_notification_message(notification_message, track)
+ */
+    __pyx_v_notification_message->data.sound_loop_set.id = __pyx_v_sound_loop_set_id;
+
+    /* "mpfmc/core/audio/notification_message.pxd":254
+ *         notification_message.data.sound_loop_set.id = sound_loop_set_id
+ * 
+ *         _post_notification_message(notification_message, track)             # <<<<<<<<<<<<<<
+ * 
+ */
+    __pyx_f_5mpfmc_4core_5audio_20notification_message__post_notification_message(__pyx_v_notification_message, __pyx_v_track);
+
+    /* "mpfmc/core/audio/notification_message.pxd":247
+ *     """
+ *     cdef NotificationMessageContainer *notification_message = _create_notification_message()
+ *     if notification_message != NULL:             # <<<<<<<<<<<<<<
+ *         notification_message.message = notification_sound_loop_set_looping
+ *         notification_message.player = 0
+ */
+  }
+
+  /* "mpfmc/core/audio/notification_message.pxd":238
+ *         _post_notification_message(notification_message, track)
+ * 
+ * cdef inline void send_sound_loop_set_looping_notification(int sound_loop_set_id, Uint64 sound_id, TrackState *track) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Sends a sound_loop_set looping notification
+ */
+
+  /* function exit code */
+}
+static struct __pyx_vtabstruct_5mpfmc_4core_5audio_5track_Track __pyx_vtable_5mpfmc_4core_5audio_5track_Track;
+
+static PyObject *__pyx_tp_new_5mpfmc_4core_5audio_5track_Track(PyTypeObject *t, PyObject *a, PyObject *k) {
+  struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *p;
+  PyObject *o;
+  if (likely((t->tp_flags & Py_TPFLAGS_IS_ABSTRACT) == 0)) {
+    o = (*t->tp_alloc)(t, 0);
+  } else {
+    o = (PyObject *) PyBaseObject_Type.tp_new(t, __pyx_empty_tuple, 0);
+  }
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)o);
+  p->__pyx_vtab = __pyx_vtabptr_5mpfmc_4core_5audio_5track_Track;
+  p->_name = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  p->_events_when_stopped = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  p->_events_when_played = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  p->_events_when_paused = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  p->mc = Py_None; Py_INCREF(Py_None);
+  p->log = Py_None; Py_INCREF(Py_None);
+  p->_inserts = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  if (unlikely(__pyx_pw_5mpfmc_4core_5audio_5track_5Track_1__cinit__(o, a, k) < 0)) goto bad;
+  return o;
+  bad:
+  Py_DECREF(o); o = 0;
+  return NULL;
+}
+
+static void __pyx_tp_dealloc_5mpfmc_4core_5audio_5track_Track(PyObject *o) {
+  struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *p = (struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)o;
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && !_PyGC_FINALIZED(o)) {
+    if (PyObject_CallFinalizerFromDealloc(o)) return;
+  }
+  #endif
+  PyObject_GC_UnTrack(o);
+  {
+    PyObject *etype, *eval, *etb;
+    PyErr_Fetch(&etype, &eval, &etb);
+    ++Py_REFCNT(o);
+    __pyx_pw_5mpfmc_4core_5audio_5track_5Track_5__dealloc__(o);
+    --Py_REFCNT(o);
+    PyErr_Restore(etype, eval, etb);
+  }
+  Py_CLEAR(p->_name);
+  Py_CLEAR(p->_events_when_stopped);
+  Py_CLEAR(p->_events_when_played);
+  Py_CLEAR(p->_events_when_paused);
+  Py_CLEAR(p->mc);
+  Py_CLEAR(p->log);
+  Py_CLEAR(p->_inserts);
+  (*Py_TYPE(o)->tp_free)(o);
+}
+
+static int __pyx_tp_traverse_5mpfmc_4core_5audio_5track_Track(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *p = (struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)o;
+  if (p->_events_when_stopped) {
+    e = (*v)(p->_events_when_stopped, a); if (e) return e;
+  }
+  if (p->_events_when_played) {
+    e = (*v)(p->_events_when_played, a); if (e) return e;
+  }
+  if (p->_events_when_paused) {
+    e = (*v)(p->_events_when_paused, a); if (e) return e;
+  }
+  if (p->mc) {
+    e = (*v)(p->mc, a); if (e) return e;
+  }
+  if (p->log) {
+    e = (*v)(p->log, a); if (e) return e;
+  }
+  if (p->_inserts) {
+    e = (*v)(p->_inserts, a); if (e) return e;
+  }
+  return 0;
+}
+
+static int __pyx_tp_clear_5mpfmc_4core_5audio_5track_Track(PyObject *o) {
+  PyObject* tmp;
+  struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *p = (struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *)o;
+  tmp = ((PyObject*)p->_events_when_stopped);
+  p->_events_when_stopped = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->_events_when_played);
+  p->_events_when_played = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->_events_when_paused);
+  p->_events_when_paused = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->mc);
+  p->mc = Py_None; Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->log);
+  p->log = Py_None; Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->_inserts);
+  p->_inserts = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  return 0;
+}
+
+static PyObject *__pyx_getprop_5mpfmc_4core_5audio_5track_5Track_name(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_5mpfmc_4core_5audio_5track_5Track_4name_1__get__(o);
+}
+
+static PyObject *__pyx_getprop_5mpfmc_4core_5audio_5track_5Track_volume(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_5mpfmc_4core_5audio_5track_5Track_6volume_1__get__(o);
+}
+
+static PyObject *__pyx_getprop_5mpfmc_4core_5audio_5track_5Track_type(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_5mpfmc_4core_5audio_5track_5Track_4type_1__get__(o);
+}
+
+static PyObject *__pyx_getprop_5mpfmc_4core_5audio_5track_5Track_number(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_5mpfmc_4core_5audio_5track_5Track_6number_1__get__(o);
+}
+
+static PyObject *__pyx_getprop_5mpfmc_4core_5audio_5track_5Track_events_when_stopped(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_5mpfmc_4core_5audio_5track_5Track_19events_when_stopped_1__get__(o);
+}
+
+static int __pyx_setprop_5mpfmc_4core_5audio_5track_5Track_events_when_stopped(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_5mpfmc_4core_5audio_5track_5Track_19events_when_stopped_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_5mpfmc_4core_5audio_5track_5Track_events_when_played(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_5mpfmc_4core_5audio_5track_5Track_18events_when_played_1__get__(o);
+}
+
+static int __pyx_setprop_5mpfmc_4core_5audio_5track_5Track_events_when_played(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_5mpfmc_4core_5audio_5track_5Track_18events_when_played_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_5mpfmc_4core_5audio_5track_5Track_events_when_paused(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_5mpfmc_4core_5audio_5track_5Track_18events_when_paused_1__get__(o);
+}
+
+static int __pyx_setprop_5mpfmc_4core_5audio_5track_5Track_events_when_paused(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_5mpfmc_4core_5audio_5track_5Track_18events_when_paused_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_5mpfmc_4core_5audio_5track_5Track_supports_in_memory_sounds(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_5mpfmc_4core_5audio_5track_5Track_25supports_in_memory_sounds_1__get__(o);
+}
+
+static PyObject *__pyx_getprop_5mpfmc_4core_5audio_5track_5Track_supports_streaming_sounds(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_5mpfmc_4core_5audio_5track_5Track_25supports_streaming_sounds_1__get__(o);
+}
+
+static PyObject *__pyx_getprop_5mpfmc_4core_5audio_5track_5Track_fading(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_5mpfmc_4core_5audio_5track_5Track_6fading_1__get__(o);
+}
+
+static PyObject *__pyx_getprop_5mpfmc_4core_5audio_5track_5Track_inserts(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_5mpfmc_4core_5audio_5track_5Track_7inserts_1__get__(o);
+}
+
+static PyMethodDef __pyx_methods_5mpfmc_4core_5audio_5track_Track[] = {
+  {"set_inserts", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_5track_5Track_9set_inserts, METH_O, __pyx_doc_5mpfmc_4core_5audio_5track_5Track_8set_inserts},
+  {"get_performance_counters", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_5track_5Track_11get_performance_counters, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5mpfmc_4core_5audio_5track_5Track_10get_performance_counters},
+  {"clear_context", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_5track_5Track_13clear_context, METH_O, __pyx_doc_5mpfmc_4core_5audio_5track_5Track_12clear_context},
+  {"set_volume", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_5track_5Track_15set_volume, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5mpfmc_4core_5audio_5track_5Track_14set_volume},
+  {"play", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_5track_5Track_17play, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5mpfmc_4core_5audio_5track_5Track_16play},
+  {"stop", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_5track_5Track_19stop, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5mpfmc_4core_5audio_5track_5Track_18stop},
+  {"pause", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_5track_5Track_21pause, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5mpfmc_4core_5audio_5track_5Track_20pause},
+  {"stop_all_sounds", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_5track_5Track_23stop_all_sounds, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5mpfmc_4core_5audio_5track_5Track_22stop_all_sounds},
+  {"process", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_5track_5Track_25process, METH_NOARGS, __pyx_doc_5mpfmc_4core_5audio_5track_5Track_24process},
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_5track_5Track_27__reduce_cython__, METH_NOARGS, __pyx_doc_5mpfmc_4core_5audio_5track_5Track_26__reduce_cython__},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_5mpfmc_4core_5audio_5track_5Track_29__setstate_cython__, METH_O, __pyx_doc_5mpfmc_4core_5audio_5track_5Track_28__setstate_cython__},
+  {0, 0, 0, 0}
+};
+
+static struct PyGetSetDef __pyx_getsets_5mpfmc_4core_5audio_5track_Track[] = {
+  {(char *)"name", __pyx_getprop_5mpfmc_4core_5audio_5track_5Track_name, 0, (char *)0, 0},
+  {(char *)"volume", __pyx_getprop_5mpfmc_4core_5audio_5track_5Track_volume, 0, (char *)0, 0},
+  {(char *)"type", __pyx_getprop_5mpfmc_4core_5audio_5track_5Track_type, 0, (char *)0, 0},
+  {(char *)"number", __pyx_getprop_5mpfmc_4core_5audio_5track_5Track_number, 0, (char *)"Return the track number", 0},
+  {(char *)"events_when_stopped", __pyx_getprop_5mpfmc_4core_5audio_5track_5Track_events_when_stopped, __pyx_setprop_5mpfmc_4core_5audio_5track_5Track_events_when_stopped, (char *)"Return the list of events that are posted when the track is stopped", 0},
+  {(char *)"events_when_played", __pyx_getprop_5mpfmc_4core_5audio_5track_5Track_events_when_played, __pyx_setprop_5mpfmc_4core_5audio_5track_5Track_events_when_played, (char *)"Return the list of events that are posted when the track is played", 0},
+  {(char *)"events_when_paused", __pyx_getprop_5mpfmc_4core_5audio_5track_5Track_events_when_paused, __pyx_setprop_5mpfmc_4core_5audio_5track_5Track_events_when_paused, (char *)"Return the list of events that are posted when the track is paused", 0},
+  {(char *)"supports_in_memory_sounds", __pyx_getprop_5mpfmc_4core_5audio_5track_5Track_supports_in_memory_sounds, 0, (char *)"Return whether or not track supports in-memory sounds", 0},
+  {(char *)"supports_streaming_sounds", __pyx_getprop_5mpfmc_4core_5audio_5track_5Track_supports_streaming_sounds, 0, (char *)"Return whether or not track supports streaming sounds", 0},
+  {(char *)"fading", __pyx_getprop_5mpfmc_4core_5audio_5track_5Track_fading, 0, (char *)"Return whether or not the track is currently fading", 0},
+  {(char *)"inserts", __pyx_getprop_5mpfmc_4core_5audio_5track_5Track_inserts, 0, (char *)"Return the list of DSP insert settings applied to the track (in processing order)", 0},
+  {0, 0, 0, 0, 0}
+};
+
+static PyTypeObject __pyx_type_5mpfmc_4core_5audio_5track_Track = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "mpfmc.core.audio.track.Track", /*tp_name*/
+  sizeof(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_5mpfmc_4core_5audio_5track_Track, /*tp_dealloc*/
+  0, /*tp_print*/
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  __pyx_pw_5mpfmc_4core_5audio_5track_5Track_7__repr__, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  "Track(mc, audio_callback_data, unicode name, int track_num, int buffer_size, float volume=1.0)\n\n    Track base class\n    ", /*tp_doc*/
+  __pyx_tp_traverse_5mpfmc_4core_5audio_5track_Track, /*tp_traverse*/
+  __pyx_tp_clear_5mpfmc_4core_5audio_5track_Track, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_5mpfmc_4core_5audio_5track_Track, /*tp_methods*/
+  0, /*tp_members*/
+  __pyx_getsets_5mpfmc_4core_5audio_5track_Track, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  __pyx_pw_5mpfmc_4core_5audio_5track_5Track_3__init__, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_5mpfmc_4core_5audio_5track_Track, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+};
+
+static PyMethodDef __pyx_methods[] = {
+  {0, 0, 0, 0}
+};
+
+#if PY_MAJOR_VERSION >= 3
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+static PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def); /*proto*/
+static int __pyx_pymod_exec_track(PyObject* module); /*proto*/
+static PyModuleDef_Slot __pyx_moduledef_slots[] = {
+  {Py_mod_create, (void*)__pyx_pymod_create},
+  {Py_mod_exec, (void*)__pyx_pymod_exec_track},
+  {0, NULL}
+};
+#endif
+
+static struct PyModuleDef __pyx_moduledef = {
+    PyModuleDef_HEAD_INIT,
+    "track",
+    0, /* m_doc */
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    0, /* m_size */
+  #else
+    -1, /* m_size */
+  #endif
+    __pyx_methods /* m_methods */,
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    __pyx_moduledef_slots, /* m_slots */
+  #else
+    NULL, /* m_reload */
+  #endif
+    NULL, /* m_traverse */
+    NULL, /* m_clear */
+    NULL /* m_free */
+};
+#endif
+
+static __Pyx_StringTabEntry __pyx_string_tab[] = {
+  {&__pyx_kp_u_Allocated_track_audio_buffer_d_b, __pyx_k_Allocated_track_audio_buffer_d_b, sizeof(__pyx_k_Allocated_track_audio_buffer_d_b), 0, 1, 0, 0},
+  {&__pyx_n_s_AudioException, __pyx_k_AudioException, sizeof(__pyx_k_AudioException), 0, 0, 1, 1},
+  {&__pyx_kp_u_Could_not_set_inserts_on_track_D, __pyx_k_Could_not_set_inserts_on_track_D, sizeof(__pyx_k_Could_not_set_inserts_on_track_D), 0, 1, 0, 0},
+  {&__pyx_n_s_MemoryError, __pyx_k_MemoryError, sizeof(__pyx_k_MemoryError), 0, 0, 1, 1},
+  {&__pyx_kp_u_Must_be_overridden_in_derived_cl, __pyx_k_Must_be_overridden_in_derived_cl, sizeof(__pyx_k_Must_be_overridden_in_derived_cl), 0, 1, 0, 0},
+  {&__pyx_n_s_NotImplementedError, __pyx_k_NotImplementedError, sizeof(__pyx_k_NotImplementedError), 0, 0, 1, 1},
+  {&__pyx_n_s_REVERB_ALLPASS_TUNINGS, __pyx_k_REVERB_ALLPASS_TUNINGS, sizeof(__pyx_k_REVERB_ALLPASS_TUNINGS), 0, 0, 1, 1},
+  {&__pyx_n_s_REVERB_COMB_TUNINGS, __pyx_k_REVERB_COMB_TUNINGS, sizeof(__pyx_k_REVERB_COMB_TUNINGS), 0, 0, 1, 1},
+  {&__pyx_kp_u_Too_many_DSP_inserts_the_maximum, __pyx_k_Too_many_DSP_inserts_the_maximum, sizeof(__pyx_k_Too_many_DSP_inserts_the_maximum), 0, 1, 0, 0},
+  {&__pyx_n_u_Track, __pyx_k_Track, sizeof(__pyx_k_Track), 0, 1, 0, 1},
+  {&__pyx_kp_u_Track_2, __pyx_k_Track_2, sizeof(__pyx_k_Track_2), 0, 1, 0, 0},
+  {&__pyx_n_s_TypeError, __pyx_k_TypeError, sizeof(__pyx_k_TypeError), 0, 0, 1, 1},
+  {&__pyx_kp_u_Unknown_DSP_insert_type, __pyx_k_Unknown_DSP_insert_type, sizeof(__pyx_k_Unknown_DSP_insert_type), 0, 1, 0, 0},
+  {&__pyx_kp_u_Unknown_EQ_filter_type, __pyx_k_Unknown_EQ_filter_type, sizeof(__pyx_k_Unknown_EQ_filter_type), 0, 1, 0, 0},
+  {&__pyx_n_u_active_sound_players, __pyx_k_active_sound_players, sizeof(__pyx_k_active_sound_players), 0, 1, 0, 1},
+  {&__pyx_n_s_audio_callback_data, __pyx_k_audio_callback_data, sizeof(__pyx_k_audio_callback_data), 0, 0, 1, 1},
+  {&__pyx_n_s_buffer_size, __pyx_k_buffer_size, sizeof(__pyx_k_buffer_size), 0, 0, 1, 1},
+  {&__pyx_n_s_ceil, __pyx_k_ceil, sizeof(__pyx_k_ceil), 0, 0, 1, 1},
+  {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
+  {&__pyx_n_s_cos, __pyx_k_cos, sizeof(__pyx_k_cos), 0, 0, 1, 1},
+  {&__pyx_n_u_count, __pyx_k_count, sizeof(__pyx_k_count), 0, 1, 0, 1},
+  {&__pyx_n_u_damping, __pyx_k_damping, sizeof(__pyx_k_damping), 0, 1, 0, 1},
+  {&__pyx_n_s_debug, __pyx_k_debug, sizeof(__pyx_k_debug), 0, 0, 1, 1},
+  {&__pyx_n_u_dry, __pyx_k_dry, sizeof(__pyx_k_dry), 0, 1, 0, 1},
+  {&__pyx_n_u_eq, __pyx_k_eq, sizeof(__pyx_k_eq), 0, 1, 0, 1},
+  {&__pyx_n_s_events_when_played, __pyx_k_events_when_played, sizeof(__pyx_k_events_when_played), 0, 0, 1, 1},
+  {&__pyx_n_s_exp, __pyx_k_exp, sizeof(__pyx_k_exp), 0, 0, 1, 1},
+  {&__pyx_n_s_fade_in_seconds, __pyx_k_fade_in_seconds, sizeof(__pyx_k_fade_in_seconds), 0, 0, 1, 1},
+  {&__pyx_n_s_fade_out_seconds, __pyx_k_fade_out_seconds, sizeof(__pyx_k_fade_out_seconds), 0, 0, 1, 1},
+  {&__pyx_n_s_fade_seconds, __pyx_k_fade_seconds, sizeof(__pyx_k_fade_seconds), 0, 0, 1, 1},
+  {&__pyx_n_u_filter, __pyx_k_filter, sizeof(__pyx_k_filter), 0, 1, 0, 1},
+  {&__pyx_n_s_format, __pyx_k_format, sizeof(__pyx_k_format), 0, 0, 1, 1},
+  {&__pyx_n_u_frequency, __pyx_k_frequency, sizeof(__pyx_k_frequency), 0, 1, 0, 1},
+  {&__pyx_n_u_gain, __pyx_k_gain, sizeof(__pyx_k_gain), 0, 1, 0, 1},
+  {&__pyx_n_s_getLogger, __pyx_k_getLogger, sizeof(__pyx_k_getLogger), 0, 0, 1, 1},
+  {&__pyx_n_s_getstate, __pyx_k_getstate, sizeof(__pyx_k_getstate), 0, 0, 1, 1},
+  {&__pyx_n_u_highpass, __pyx_k_highpass, sizeof(__pyx_k_highpass), 0, 1, 0, 1},
+  {&__pyx_n_u_highshelf, __pyx_k_highshelf, sizeof(__pyx_k_highshelf), 0, 1, 0, 1},
+  {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
+  {&__pyx_n_u_last, __pyx_k_last, sizeof(__pyx_k_last), 0, 1, 0, 1},
+  {&__pyx_n_u_limiter, __pyx_k_limiter, sizeof(__pyx_k_limiter), 0, 1, 0, 1},
+  {&__pyx_n_s_log10, __pyx_k_log10, sizeof(__pyx_k_log10), 0, 0, 1, 1},
+  {&__pyx_n_s_logging, __pyx_k_logging, sizeof(__pyx_k_logging), 0, 0, 1, 1},
+  {&__pyx_n_u_lowpass, __pyx_k_lowpass, sizeof(__pyx_k_lowpass), 0, 1, 0, 1},
+  {&__pyx_n_u_lowshelf, __pyx_k_lowshelf, sizeof(__pyx_k_lowshelf), 0, 1, 0, 1},
+  {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
+  {&__pyx_n_s_math, __pyx_k_math, sizeof(__pyx_k_math), 0, 0, 1, 1},
+  {&__pyx_n_u_max, __pyx_k_max, sizeof(__pyx_k_max), 0, 1, 0, 1},
+  {&__pyx_n_s_mc, __pyx_k_mc, sizeof(__pyx_k_mc), 0, 0, 1, 1},
+  {&__pyx_n_u_mean, __pyx_k_mean, sizeof(__pyx_k_mean), 0, 1, 0, 1},
+  {&__pyx_n_u_mix_time, __pyx_k_mix_time, sizeof(__pyx_k_mix_time), 0, 1, 0, 1},
+  {&__pyx_n_s_mpfmc_core_audio_audio_exception, __pyx_k_mpfmc_core_audio_audio_exception, sizeof(__pyx_k_mpfmc_core_audio_audio_exception), 0, 0, 1, 1},
+  {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
+  {&__pyx_n_s_name_2, __pyx_k_name_2, sizeof(__pyx_k_name_2), 0, 0, 1, 1},
+  {&__pyx_kp_s_no_default___reduce___due_to_non, __pyx_k_no_default___reduce___due_to_non, sizeof(__pyx_k_no_default___reduce___due_to_non), 0, 0, 1, 0},
+  {&__pyx_n_s_number, __pyx_k_number, sizeof(__pyx_k_number), 0, 0, 1, 1},
+  {&__pyx_kp_u_pause_Action_may_only_be_used_wh, __pyx_k_pause_Action_may_only_be_used_wh, sizeof(__pyx_k_pause_Action_may_only_be_used_wh), 0, 1, 0, 0},
+  {&__pyx_kp_u_pause_Applying_s_second_fade_out, __pyx_k_pause_Applying_s_second_fade_out, sizeof(__pyx_k_pause_Applying_s_second_fade_out), 0, 1, 0, 0},
+  {&__pyx_kp_u_pause_Pause_sound_processing_on, __pyx_k_pause_Pause_sound_processing_on, sizeof(__pyx_k_pause_Pause_sound_processing_on), 0, 1, 0, 0},
+  {&__pyx_n_u_peak, __pyx_k_peak, sizeof(__pyx_k_peak), 0, 1, 0, 1},
+  {&__pyx_n_s_pi, __pyx_k_pi, sizeof(__pyx_k_pi), 0, 0, 1, 1},
+  {&__pyx_kp_u_play_Action_may_only_be_used_whe, __pyx_k_play_Action_may_only_be_used_whe, sizeof(__pyx_k_play_Action_may_only_be_used_whe), 0, 1, 0, 0},
+  {&__pyx_kp_u_play_Applying_s_second_fade_in, __pyx_k_play_Applying_s_second_fade_in, sizeof(__pyx_k_play_Applying_s_second_fade_in), 0, 1, 0, 0},
+  {&__pyx_kp_u_play_Begin_sound_processing_on_t, __pyx_k_play_Begin_sound_processing_on_t, sizeof(__pyx_k_play_Begin_sound_processing_on_t), 0, 1, 0, 0},
+  {&__pyx_n_s_post_mc_native_event, __pyx_k_post_mc_native_event, sizeof(__pyx_k_post_mc_native_event), 0, 0, 1, 1},
+  {&__pyx_n_s_pow, __pyx_k_pow, sizeof(__pyx_k_pow), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_vtable, __pyx_k_pyx_vtable, sizeof(__pyx_k_pyx_vtable), 0, 0, 1, 1},
+  {&__pyx_n_u_q, __pyx_k_q, sizeof(__pyx_k_q), 0, 1, 0, 1},
+  {&__pyx_n_s_range, __pyx_k_range, sizeof(__pyx_k_range), 0, 0, 1, 1},
+  {&__pyx_n_u_recent_mean, __pyx_k_recent_mean, sizeof(__pyx_k_recent_mean), 0, 1, 0, 1},
+  {&__pyx_n_u_recent_p95, __pyx_k_recent_p95, sizeof(__pyx_k_recent_p95), 0, 1, 0, 1},
+  {&__pyx_n_s_reduce, __pyx_k_reduce, sizeof(__pyx_k_reduce), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce_cython, __pyx_k_reduce_cython, sizeof(__pyx_k_reduce_cython), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce_ex, __pyx_k_reduce_ex, sizeof(__pyx_k_reduce_ex), 0, 0, 1, 1},
+  {&__pyx_n_u_release, __pyx_k_release, sizeof(__pyx_k_release), 0, 1, 0, 1},
+  {&__pyx_n_s_reset, __pyx_k_reset, sizeof(__pyx_k_reset), 0, 0, 1, 1},
+  {&__pyx_n_u_reverb, __pyx_k_reverb, sizeof(__pyx_k_reverb), 0, 1, 0, 1},
+  {&__pyx_n_u_room_size, __pyx_k_room_size, sizeof(__pyx_k_room_size), 0, 1, 0, 1},
+  {&__pyx_n_s_round, __pyx_k_round, sizeof(__pyx_k_round), 0, 0, 1, 1},
+  {&__pyx_kp_u_set_inserts_d_insert_s_applied_t, __pyx_k_set_inserts_d_insert_s_applied_t, sizeof(__pyx_k_set_inserts_d_insert_s_applied_t), 0, 1, 0, 0},
+  {&__pyx_kp_u_set_volume_Applying_s_second_fad, __pyx_k_set_volume_Applying_s_second_fad, sizeof(__pyx_k_set_volume_Applying_s_second_fad), 0, 1, 0, 0},
+  {&__pyx_kp_u_set_volume_Interrupting_an_exist, __pyx_k_set_volume_Interrupting_an_exist, sizeof(__pyx_k_set_volume_Interrupting_an_exist), 0, 1, 0, 0},
+  {&__pyx_n_s_setstate, __pyx_k_setstate, sizeof(__pyx_k_setstate), 0, 0, 1, 1},
+  {&__pyx_n_s_setstate_cython, __pyx_k_setstate_cython, sizeof(__pyx_k_setstate_cython), 0, 0, 1, 1},
+  {&__pyx_n_s_sin, __pyx_k_sin, sizeof(__pyx_k_sin), 0, 0, 1, 1},
+  {&__pyx_n_s_sqrt, __pyx_k_sqrt, sizeof(__pyx_k_sqrt), 0, 0, 1, 1},
+  {&__pyx_kp_u_stop_Action_may_only_be_used_whe, __pyx_k_stop_Action_may_only_be_used_whe, sizeof(__pyx_k_stop_Action_may_only_be_used_whe), 0, 1, 0, 0},
+  {&__pyx_kp_u_stop_Applying_s_second_fade_out, __pyx_k_stop_Applying_s_second_fade_out, sizeof(__pyx_k_stop_Applying_s_second_fade_out), 0, 1, 0, 0},
+  {&__pyx_kp_u_stop_Stop_sound_processing_on_tr, __pyx_k_stop_Stop_sound_processing_on_tr, sizeof(__pyx_k_stop_Stop_sound_processing_on_tr), 0, 1, 0, 0},
+  {&__pyx_n_u_streaming_underruns, __pyx_k_streaming_underruns, sizeof(__pyx_k_streaming_underruns), 0, 1, 0, 1},
+  {&__pyx_n_s_sum, __pyx_k_sum, sizeof(__pyx_k_sum), 0, 0, 1, 1},
+  {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
+  {&__pyx_n_u_threshold, __pyx_k_threshold, sizeof(__pyx_k_threshold), 0, 1, 0, 1},
+  {&__pyx_n_s_track, __pyx_k_track, sizeof(__pyx_k_track), 0, 0, 1, 1},
+  {&__pyx_n_s_track_num, __pyx_k_track_num, sizeof(__pyx_k_track_num), 0, 0, 1, 1},
+  {&__pyx_n_u_type, __pyx_k_type, sizeof(__pyx_k_type), 0, 1, 0, 1},
+  {&__pyx_n_s_volume, __pyx_k_volume, sizeof(__pyx_k_volume), 0, 0, 1, 1},
+  {&__pyx_n_s_warning, __pyx_k_warning, sizeof(__pyx_k_warning), 0, 0, 1, 1},
+  {&__pyx_n_u_wet, __pyx_k_wet, sizeof(__pyx_k_wet), 0, 1, 0, 1},
+  {0, 0, 0, 0, 0, 0, 0}
+};
+static int __Pyx_InitCachedBuiltins(void) {
+  __pyx_builtin_round = __Pyx_GetBuiltinName(__pyx_n_s_round); if (!__pyx_builtin_round) __PYX_ERR(0, 135, __pyx_L1_error)
+  __pyx_builtin_NotImplementedError = __Pyx_GetBuiltinName(__pyx_n_s_NotImplementedError); if (!__pyx_builtin_NotImplementedError) __PYX_ERR(0, 139, __pyx_L1_error)
+  __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(1, 2, __pyx_L1_error)
+  __pyx_builtin_MemoryError = __Pyx_GetBuiltinName(__pyx_n_s_MemoryError); if (!__pyx_builtin_MemoryError) __PYX_ERR(0, 591, __pyx_L1_error)
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 622, __pyx_L1_error)
+  __pyx_builtin_sum = __Pyx_GetBuiltinName(__pyx_n_s_sum); if (!__pyx_builtin_sum) __PYX_ERR(3, 84, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static int __Pyx_InitCachedConstants(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
+
+  /* "mpfmc/core/audio/track.pyx":49
+ *             volume: The track volume (0.0 to 1.0)
+ *         """
+ *         self.log = logging.getLogger("Track")             # <<<<<<<<<<<<<<
+ *         self.mc = mc
+ *         self._name = name
+ */
+  __pyx_tuple_ = PyTuple_Pack(1, __pyx_n_u_Track); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 49, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple_);
+  __Pyx_GIVEREF(__pyx_tuple_);
+
+  /* "mpfmc/core/audio/track.pyx":139
+ *     @property
+ *     def type(self):
+ *         raise NotImplementedError('Must be overridden in derived class')             # <<<<<<<<<<<<<<
+ * 
+ *     @property
+ */
+  __pyx_tuple__2 = PyTuple_Pack(1, __pyx_kp_u_Must_be_overridden_in_derived_cl); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(0, 139, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__2);
+  __Pyx_GIVEREF(__pyx_tuple__2);
+
+  /* "mpfmc/core/audio/track.pyx":184
+ *     def supports_in_memory_sounds(self):
+ *         """Return whether or not track supports in-memory sounds"""
+ *         raise NotImplementedError('Must be overridden in derived class')             # <<<<<<<<<<<<<<
+ * 
+ *     @property
+ */
+  __pyx_tuple__3 = PyTuple_Pack(1, __pyx_kp_u_Must_be_overridden_in_derived_cl); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(0, 184, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__3);
+  __Pyx_GIVEREF(__pyx_tuple__3);
+
+  /* "mpfmc/core/audio/track.pyx":189
+ *     def supports_streaming_sounds(self):
+ *         """Return whether or not track supports streaming sounds"""
+ *         raise NotImplementedError('Must be overridden in derived class')             # <<<<<<<<<<<<<<
+ * 
+ *     @property
+ */
+  __pyx_tuple__4 = PyTuple_Pack(1, __pyx_kp_u_Must_be_overridden_in_derived_cl); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(0, 189, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__4);
+  __Pyx_GIVEREF(__pyx_tuple__4);
+
+  /* "mpfmc/core/audio/track.pyx":260
+ *     def clear_context(self, context):
+ *         """Stop all sounds played from the specified context."""
+ *         raise NotImplementedError('Must be overridden in derived class')             # <<<<<<<<<<<<<<
+ * 
+ *     def set_volume(self, float volume, float fade_seconds = 0.0):
+ */
+  __pyx_tuple__5 = PyTuple_Pack(1, __pyx_kp_u_Must_be_overridden_in_derived_cl); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(0, 260, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__5);
+  __Pyx_GIVEREF(__pyx_tuple__5);
+
+  /* "mpfmc/core/audio/track.pyx":277
+ *                 # point of the existing fade
+ *                 if self.state.fade_steps_remaining > 0:
+ *                     self.log.debug("set_volume - Interrupting an existing fade on this track so "             # <<<<<<<<<<<<<<
+ *                                    "start a new fade")
+ * 
+ */
+  __pyx_tuple__6 = PyTuple_Pack(1, __pyx_kp_u_set_volume_Interrupting_an_exist); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(0, 277, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__6);
+  __Pyx_GIVEREF(__pyx_tuple__6);
+
+  /* "mpfmc/core/audio/track.pyx":303
+ *             fade_in_seconds: The number of seconds to fade in the track
+ *         """
+ *         self.log.debug("play - Begin sound processing on track")             # <<<<<<<<<<<<<<
+ * 
+ *         SDL_LockAudio()
+ */
+  __pyx_tuple__7 = PyTuple_Pack(1, __pyx_kp_u_play_Begin_sound_processing_on_t); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(0, 303, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__7);
+  __Pyx_GIVEREF(__pyx_tuple__7);
+
+  /* "mpfmc/core/audio/track.pyx":333
+ *                     self.mc.post_mc_native_event(event, track=self._name)
+ *         else:
+ *             self.log.warning("play - Action may only be used when a track is stopped or is in the process "             # <<<<<<<<<<<<<<
+ *                              "of stopping; action will be ignored.")
+ * 
+ */
+  __pyx_tuple__8 = PyTuple_Pack(1, __pyx_kp_u_play_Action_may_only_be_used_whe); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(0, 333, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__8);
+  __Pyx_GIVEREF(__pyx_tuple__8);
+
+  /* "mpfmc/core/audio/track.pyx":345
+ *             fade_out_seconds: The number of seconds to fade out the track
+ *         """
+ *         self.log.debug("stop - Stop sound processing on track and clear state")             # <<<<<<<<<<<<<<
+ * 
+ *         SDL_LockAudio()
+ */
+  __pyx_tuple__9 = PyTuple_Pack(1, __pyx_kp_u_stop_Stop_sound_processing_on_tr); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(0, 345, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__9);
+  __Pyx_GIVEREF(__pyx_tuple__9);
+
+  /* "mpfmc/core/audio/track.pyx":372
+ * 
+ *         else:
+ *             self.log.warning("stop - Action may only be used when a track is playing; action "             # <<<<<<<<<<<<<<
+ *                              "will be ignored.")
+ * 
+ */
+  __pyx_tuple__10 = PyTuple_Pack(1, __pyx_kp_u_stop_Action_may_only_be_used_whe); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(0, 372, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__10);
+  __Pyx_GIVEREF(__pyx_tuple__10);
+
+  /* "mpfmc/core/audio/track.pyx":384
+ *             fade_out_seconds: The number of seconds to fade out the track
+ *         """
+ *         self.log.debug("pause - Pause sound processing on track")             # <<<<<<<<<<<<<<
+ * 
+ *         SDL_LockAudio()
+ */
+  __pyx_tuple__11 = PyTuple_Pack(1, __pyx_kp_u_pause_Pause_sound_processing_on); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(0, 384, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__11);
+  __Pyx_GIVEREF(__pyx_tuple__11);
+
+  /* "mpfmc/core/audio/track.pyx":409
+ * 
+ *         else:
+ *             self.log.warning("pause - Action may only be used when a track is playing; action "             # <<<<<<<<<<<<<<
+ *                              "will be ignored.")
+ * 
+ */
+  __pyx_tuple__12 = PyTuple_Pack(1, __pyx_kp_u_pause_Action_may_only_be_used_wh); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(0, 409, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__12);
+  __Pyx_GIVEREF(__pyx_tuple__12);
+
+  /* "mpfmc/core/audio/track.pyx":420
+ *             fade_out_seconds: The number of seconds to fade out the sounds before stopping
+ *         """
+ *         raise NotImplementedError('Must be overridden in derived class')             # <<<<<<<<<<<<<<
+ * 
+ *     def process(self):
+ */
+  __pyx_tuple__13 = PyTuple_Pack(1, __pyx_kp_u_Must_be_overridden_in_derived_cl); if (unlikely(!__pyx_tuple__13)) __PYX_ERR(0, 420, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__13);
+  __Pyx_GIVEREF(__pyx_tuple__13);
+
+  /* "mpfmc/core/audio/track.pyx":424
+ *     def process(self):
+ *         """Processes the track queue each tick."""
+ *         raise NotImplementedError('Must be overridden in derived class')             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_tuple__14 = PyTuple_Pack(1, __pyx_kp_u_Must_be_overridden_in_derived_cl); if (unlikely(!__pyx_tuple__14)) __PYX_ERR(0, 424, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__14);
+  __Pyx_GIVEREF(__pyx_tuple__14);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
+  __pyx_tuple__15 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__15)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__15);
+  __Pyx_GIVEREF(__pyx_tuple__15);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ */
+  __pyx_tuple__16 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__16)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__16);
+  __Pyx_GIVEREF(__pyx_tuple__16);
+
+  /* "mpfmc/core/audio/track.pyx":21
+ * 
+ * # Reverb delay line lengths (in samples at 44.1 kHz, scaled to the actual sample rate)
+ * REVERB_COMB_TUNINGS = (1116, 1188, 1277, 1356)             # <<<<<<<<<<<<<<
+ * REVERB_ALLPASS_TUNINGS = (556, 441)
+ * 
+ */
+  __pyx_tuple__17 = PyTuple_Pack(4, __pyx_int_1116, __pyx_int_1188, __pyx_int_1277, __pyx_int_1356); if (unlikely(!__pyx_tuple__17)) __PYX_ERR(0, 21, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__17);
+  __Pyx_GIVEREF(__pyx_tuple__17);
+
+  /* "mpfmc/core/audio/track.pyx":22
+ * # Reverb delay line lengths (in samples at 44.1 kHz, scaled to the actual sample rate)
+ * REVERB_COMB_TUNINGS = (1116, 1188, 1277, 1356)
+ * REVERB_ALLPASS_TUNINGS = (556, 441)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_tuple__18 = PyTuple_Pack(2, __pyx_int_556, __pyx_int_441); if (unlikely(!__pyx_tuple__18)) __PYX_ERR(0, 22, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__18);
+  __Pyx_GIVEREF(__pyx_tuple__18);
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_InitGlobals(void) {
+  if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
+  __pyx_float_0_0 = PyFloat_FromDouble(0.0); if (unlikely(!__pyx_float_0_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_4 = PyFloat_FromDouble(0.4); if (unlikely(!__pyx_float_0_4)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_7 = PyFloat_FromDouble(0.7); if (unlikely(!__pyx_float_0_7)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_1_0 = PyFloat_FromDouble(1.0); if (unlikely(!__pyx_float_1_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_2_0 = PyFloat_FromDouble(2.0); if (unlikely(!__pyx_float_2_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_28 = PyFloat_FromDouble(0.28); if (unlikely(!__pyx_float_0_28)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_10_0 = PyFloat_FromDouble(10.0); if (unlikely(!__pyx_float_10_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_40_0 = PyFloat_FromDouble(40.0); if (unlikely(!__pyx_float_40_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_neg_1_0 = PyFloat_FromDouble(-1.0); if (unlikely(!__pyx_float_neg_1_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_neg_2_0 = PyFloat_FromDouble(-2.0); if (unlikely(!__pyx_float_neg_2_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_2 = PyInt_FromLong(2); if (unlikely(!__pyx_int_2)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_441 = PyInt_FromLong(441); if (unlikely(!__pyx_int_441)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_556 = PyInt_FromLong(556); if (unlikely(!__pyx_int_556)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_1116 = PyInt_FromLong(1116); if (unlikely(!__pyx_int_1116)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_1188 = PyInt_FromLong(1188); if (unlikely(!__pyx_int_1188)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_1277 = PyInt_FromLong(1277); if (unlikely(!__pyx_int_1277)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_1356 = PyInt_FromLong(1356); if (unlikely(!__pyx_int_1356)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_44100 = PyInt_FromLong(44100L); if (unlikely(!__pyx_int_44100)) __PYX_ERR(0, 1, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+#if PY_MAJOR_VERSION < 3
+PyMODINIT_FUNC inittrack(void); /*proto*/
+PyMODINIT_FUNC inittrack(void)
+#else
+PyMODINIT_FUNC PyInit_track(void); /*proto*/
+PyMODINIT_FUNC PyInit_track(void)
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+{
+  return PyModuleDef_Init(&__pyx_moduledef);
+}
+static int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name) {
+    PyObject *value = PyObject_GetAttrString(spec, from_name);
+    int result = 0;
+    if (likely(value)) {
+        result = PyDict_SetItemString(moddict, to_name, value);
+        Py_DECREF(value);
+    } else if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Clear();
+    } else {
+        result = -1;
+    }
+    return result;
+}
+static PyObject* __pyx_pymod_create(PyObject *spec, CYTHON_UNUSED PyModuleDef *def) {
+    PyObject *module = NULL, *moddict, *modname;
+    if (__pyx_m)
+        return __Pyx_NewRef(__pyx_m);
+    modname = PyObject_GetAttrString(spec, "name");
+    if (unlikely(!modname)) goto bad;
+    module = PyModule_NewObject(modname);
+    Py_DECREF(modname);
+    if (unlikely(!module)) goto bad;
+    moddict = PyModule_GetDict(module);
+    if (unlikely(!moddict)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "loader", "__loader__") < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "origin", "__file__") < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "parent", "__package__") < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "submodule_search_locations", "__path__") < 0)) goto bad;
+    return module;
+bad:
+    Py_XDECREF(module);
+    return NULL;
+}
+
+
+static int __pyx_pymod_exec_track(PyObject *__pyx_pyinit_module)
+#endif
+#endif
+{
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  __Pyx_RefNannyDeclarations
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  if (__pyx_m && __pyx_m == __pyx_pyinit_module) return 0;
+  #endif
+  #if CYTHON_REFNANNY
+  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
+  if (!__Pyx_RefNanny) {
+      PyErr_Clear();
+      __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
+      if (!__Pyx_RefNanny)
+          Py_FatalError("failed to import 'refnanny' module");
+  }
+  #endif
+  __Pyx_RefNannySetupContext("PyMODINIT_FUNC PyInit_track(void)", 0);
+  if (__Pyx_check_binary_version() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_unicode)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pyx_CyFunction_USED
+  if (__pyx_CyFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_FusedFunction_USED
+  if (__pyx_FusedFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Coroutine_USED
+  if (__pyx_Coroutine_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Generator_USED
+  if (__pyx_Generator_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_AsyncGen_USED
+  if (__pyx_AsyncGen_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_StopAsyncIteration_USED
+  if (__pyx_StopAsyncIteration_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  /*--- Library function declarations ---*/
+  /*--- Threads initialization code ---*/
+  #if defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
+  #ifdef WITH_THREAD /* Python build with threading support? */
+  PyEval_InitThreads();
+  #endif
+  #endif
+  /*--- Module creation code ---*/
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  __pyx_m = __pyx_pyinit_module;
+  Py_INCREF(__pyx_m);
+  #else
+  #if PY_MAJOR_VERSION < 3
+  __pyx_m = Py_InitModule4("track", __pyx_methods, 0, 0, PYTHON_API_VERSION); Py_XINCREF(__pyx_m);
+  #else
+  __pyx_m = PyModule_Create(&__pyx_moduledef);
+  #endif
+  if (unlikely(!__pyx_m)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  __pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_d)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_d);
+  __pyx_b = PyImport_AddModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_b)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_cython_runtime = PyImport_AddModule((char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #if CYTHON_COMPILING_IN_PYPY
+  Py_INCREF(__pyx_b);
+  #endif
+  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
+  /*--- Initialize various global constants etc. ---*/
+  if (__Pyx_InitGlobals() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
+  if (__Pyx_init_sys_getdefaultencoding_params() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  if (__pyx_module_is_main_mpfmc__core__audio__track) {
+    if (PyObject_SetAttrString(__pyx_m, "__name__", __pyx_n_s_main) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  }
+  #if PY_MAJOR_VERSION >= 3
+  {
+    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(0, 1, __pyx_L1_error)
+    if (!PyDict_GetItemString(modules, "mpfmc.core.audio.track")) {
+      if (unlikely(PyDict_SetItemString(modules, "mpfmc.core.audio.track", __pyx_m) < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+    }
+  }
+  #endif
+  /*--- Builtin init code ---*/
+  if (__Pyx_InitCachedBuiltins() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Constants init code ---*/
+  if (__Pyx_InitCachedConstants() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Global init code ---*/
+  /*--- Variable export code ---*/
+  /*--- Function export code ---*/
+  if (__Pyx_ExportFunction("create_dsp_chain", (void (*)(void))__pyx_f_5mpfmc_4core_5audio_5track_create_dsp_chain, "__pyx_t_5mpfmc_4core_5audio_3dsp_DspChain *(PyObject *, int, int)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ExportFunction("free_dsp_chain", (void (*)(void))__pyx_f_5mpfmc_4core_5audio_5track_free_dsp_chain, "void (__pyx_t_5mpfmc_4core_5audio_3dsp_DspChain *)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Type init code ---*/
+  __pyx_vtabptr_5mpfmc_4core_5audio_5track_Track = &__pyx_vtable_5mpfmc_4core_5audio_5track_Track;
+  __pyx_vtable_5mpfmc_4core_5audio_5track_Track.get_state = (__pyx_t_5mpfmc_4core_5audio_5track_TrackState *(*)(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *))__pyx_f_5mpfmc_4core_5audio_5track_5Track_get_state;
+  __pyx_vtable_5mpfmc_4core_5audio_5track_Track.take_notification_messages = (GSList *(*)(struct __pyx_obj_5mpfmc_4core_5audio_5track_Track *))__pyx_f_5mpfmc_4core_5audio_5track_5Track_take_notification_messages;
+  __pyx_vtable_5mpfmc_4core_5audio_5track_Track.mix_track_to_output = (void (*)(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *, __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData *, Uint8 *, Uint32))__pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_to_output;
+  __pyx_vtable_5mpfmc_4core_5audio_5track_Track.mix_track_tail_to_output = (void (*)(__pyx_t_5mpfmc_4core_5audio_5track_TrackState *, __pyx_t_5mpfmc_4core_5audio_4sdl2_AudioCallbackData *, Uint32))__pyx_f_5mpfmc_4core_5audio_5track_5Track_mix_track_tail_to_output;
+  if (PyType_Ready(&__pyx_type_5mpfmc_4core_5audio_5track_Track) < 0) __PYX_ERR(0, 28, __pyx_L1_error)
+  __pyx_type_5mpfmc_4core_5audio_5track_Track.tp_print = 0;
+  #if CYTHON_COMPILING_IN_CPYTHON
+  {
+    PyObject *wrapper = PyObject_GetAttrString((PyObject *)&__pyx_type_5mpfmc_4core_5audio_5track_Track, "__init__"); if (unlikely(!wrapper)) __PYX_ERR(0, 28, __pyx_L1_error)
+    if (Py_TYPE(wrapper) == &PyWrapperDescr_Type) {
+      __pyx_wrapperbase_5mpfmc_4core_5audio_5track_5Track_2__init__ = *((PyWrapperDescrObject *)wrapper)->d_base;
+      __pyx_wrapperbase_5mpfmc_4core_5audio_5track_5Track_2__init__.doc = __pyx_doc_5mpfmc_4core_5audio_5track_5Track_2__init__;
+      ((PyWrapperDescrObject *)wrapper)->d_base = &__pyx_wrapperbase_5mpfmc_4core_5audio_5track_5Track_2__init__;
+    }
+  }
+  #endif
+  if (__Pyx_SetVtable(__pyx_type_5mpfmc_4core_5audio_5track_Track.tp_dict, __pyx_vtabptr_5mpfmc_4core_5audio_5track_Track) < 0) __PYX_ERR(0, 28, __pyx_L1_error)
+  if (PyObject_SetAttrString(__pyx_m, "Track", (PyObject *)&__pyx_type_5mpfmc_4core_5audio_5track_Track) < 0) __PYX_ERR(0, 28, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_5mpfmc_4core_5audio_5track_Track) < 0) __PYX_ERR(0, 28, __pyx_L1_error)
+  __pyx_ptype_5mpfmc_4core_5audio_5track_Track = &__pyx_type_5mpfmc_4core_5audio_5track_Track;
+  /*--- Type import code ---*/
+  /*--- Variable import code ---*/
+  /*--- Function import code ---*/
+  /*--- Execution code ---*/
+  #if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
+  if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+
+  /* "mpfmc/core/audio/track.pyx":7
+ * cimport cpython.pycapsule as pycapsule
+ * from libc.string cimport memset
+ * from math import ceil, cos, exp, log10, pi, pow, sin, sqrt             # <<<<<<<<<<<<<<
+ * import logging
+ * 
+ */
+  __pyx_t_1 = PyList_New(8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_n_s_ceil);
+  __Pyx_GIVEREF(__pyx_n_s_ceil);
+  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_ceil);
+  __Pyx_INCREF(__pyx_n_s_cos);
+  __Pyx_GIVEREF(__pyx_n_s_cos);
+  PyList_SET_ITEM(__pyx_t_1, 1, __pyx_n_s_cos);
+  __Pyx_INCREF(__pyx_n_s_exp);
+  __Pyx_GIVEREF(__pyx_n_s_exp);
+  PyList_SET_ITEM(__pyx_t_1, 2, __pyx_n_s_exp);
+  __Pyx_INCREF(__pyx_n_s_log10);
+  __Pyx_GIVEREF(__pyx_n_s_log10);
+  PyList_SET_ITEM(__pyx_t_1, 3, __pyx_n_s_log10);
+  __Pyx_INCREF(__pyx_n_s_pi);
+  __Pyx_GIVEREF(__pyx_n_s_pi);
+  PyList_SET_ITEM(__pyx_t_1, 4, __pyx_n_s_pi);
+  __Pyx_INCREF(__pyx_n_s_pow);
+  __Pyx_GIVEREF(__pyx_n_s_pow);
+  PyList_SET_ITEM(__pyx_t_1, 5, __pyx_n_s_pow);
+  __Pyx_INCREF(__pyx_n_s_sin);
+  __Pyx_GIVEREF(__pyx_n_s_sin);
+  PyList_SET_ITEM(__pyx_t_1, 6, __pyx_n_s_sin);
+  __Pyx_INCREF(__pyx_n_s_sqrt);
+  __Pyx_GIVEREF(__pyx_n_s_sqrt);
+  PyList_SET_ITEM(__pyx_t_1, 7, __pyx_n_s_sqrt);
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s_math, __pyx_t_1, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_ceil); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_ceil, __pyx_t_1) < 0) __PYX_ERR(0, 7, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_cos); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_cos, __pyx_t_1) < 0) __PYX_ERR(0, 7, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_exp); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_exp, __pyx_t_1) < 0) __PYX_ERR(0, 7, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_log10); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_log10, __pyx_t_1) < 0) __PYX_ERR(0, 7, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_pi); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pi, __pyx_t_1) < 0) __PYX_ERR(0, 7, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_pow); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pow, __pyx_t_1) < 0) __PYX_ERR(0, 7, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_sin); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_sin, __pyx_t_1) < 0) __PYX_ERR(0, 7, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_sqrt); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_sqrt, __pyx_t_1) < 0) __PYX_ERR(0, 7, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "mpfmc/core/audio/track.pyx":8
+ * from libc.string cimport memset
+ * from math import ceil, cos, exp, log10, pi, pow, sin, sqrt
+ * import logging             # <<<<<<<<<<<<<<
+ * 
+ * from mpfmc.core.audio.sdl2 cimport *
+ */
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s_logging, 0, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 8, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_logging, __pyx_t_2) < 0) __PYX_ERR(0, 8, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "mpfmc/core/audio/track.pyx":17
+ * from mpfmc.core.audio.notification_message cimport *
+ * from mpfmc.core.audio.track cimport *
+ * from mpfmc.core.audio.audio_exception import AudioException             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 17, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_n_s_AudioException);
+  __Pyx_GIVEREF(__pyx_n_s_AudioException);
+  PyList_SET_ITEM(__pyx_t_2, 0, __pyx_n_s_AudioException);
+  __pyx_t_1 = __Pyx_Import(__pyx_n_s_mpfmc_core_audio_audio_exception, __pyx_t_2, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 17, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_1, __pyx_n_s_AudioException); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 17, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_AudioException, __pyx_t_2) < 0) __PYX_ERR(0, 17, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "mpfmc/core/audio/track.pyx":21
+ * 
+ * # Reverb delay line lengths (in samples at 44.1 kHz, scaled to the actual sample rate)
+ * REVERB_COMB_TUNINGS = (1116, 1188, 1277, 1356)             # <<<<<<<<<<<<<<
+ * REVERB_ALLPASS_TUNINGS = (556, 441)
+ * 
+ */
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_REVERB_COMB_TUNINGS, __pyx_tuple__17) < 0) __PYX_ERR(0, 21, __pyx_L1_error)
+
+  /* "mpfmc/core/audio/track.pyx":22
+ * # Reverb delay line lengths (in samples at 44.1 kHz, scaled to the actual sample rate)
+ * REVERB_COMB_TUNINGS = (1116, 1188, 1277, 1356)
+ * REVERB_ALLPASS_TUNINGS = (556, 441)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_REVERB_ALLPASS_TUNINGS, __pyx_tuple__18) < 0) __PYX_ERR(0, 22, __pyx_L1_error)
+
+  /* "mpfmc/core/audio/track.pyx":1
+ * #!python             # <<<<<<<<<<<<<<
+ * #cython: embedsignature=True, language_level=3
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_1) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "mpfmc/core/audio/notification_message.pxd":238
+ *         _post_notification_message(notification_message, track)
+ * 
+ * cdef inline void send_sound_loop_set_looping_notification(int sound_loop_set_id, Uint64 sound_id, TrackState *track) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Sends a sound_loop_set looping notification
+ */
+
+  /*--- Wrapped vars code ---*/
+
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  if (__pyx_m) {
+    if (__pyx_d) {
+      __Pyx_AddTraceback("init mpfmc.core.audio.track", 0, __pyx_lineno, __pyx_filename);
+    }
+    Py_DECREF(__pyx_m); __pyx_m = 0;
+  } else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_ImportError, "init mpfmc.core.audio.track");
+  }
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  return (__pyx_m != NULL) ? 0 : -1;
+  #elif PY_MAJOR_VERSION >= 3
+  return __pyx_m;
+  #else
+  return;
+  #endif
+}
+
+/* --- Runtime support code --- */
+/* Refnanny */
+#if CYTHON_REFNANNY
+static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
+    PyObject *m = NULL, *p = NULL;
+    void *r = NULL;
+    m = PyImport_ImportModule((char *)modname);
+    if (!m) goto end;
+    p = PyObject_GetAttrString(m, (char *)"RefNannyAPI");
+    if (!p) goto end;
+    r = PyLong_AsVoidPtr(p);
+end:
+    Py_XDECREF(p);
+    Py_XDECREF(m);
+    return (__Pyx_RefNannyAPIStruct *)r;
+}
+#endif
 
 /* GetBuiltinName */
 static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
@@ -7345,245 +14027,599 @@ static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
     if (unlikely(!result)) {
         PyErr_Format(PyExc_NameError,
 #if PY_MAJOR_VERSION >= 3
-            "name '%U' is not defined", name);
+            "name '%U' is not defined", name);
+#else
+            "name '%.200s' is not defined", PyString_AS_STRING(name));
+#endif
+    }
+    return result;
+}
+
+/* KeywordStringCheck */
+static int __Pyx_CheckKeywordStrings(
+    PyObject *kwdict,
+    const char* function_name,
+    int kw_allowed)
+{
+    PyObject* key = 0;
+    Py_ssize_t pos = 0;
+#if CYTHON_COMPILING_IN_PYPY
+    if (!kw_allowed && PyDict_Next(kwdict, &pos, &key, 0))
+        goto invalid_keyword;
+    return 1;
+#else
+    while (PyDict_Next(kwdict, &pos, &key, 0)) {
+        #if PY_MAJOR_VERSION < 3
+        if (unlikely(!PyString_Check(key)))
+        #endif
+            if (unlikely(!PyUnicode_Check(key)))
+                goto invalid_keyword_type;
+    }
+    if ((!kw_allowed) && unlikely(key))
+        goto invalid_keyword;
+    return 1;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() keywords must be strings", function_name);
+    return 0;
+#endif
+invalid_keyword:
+    PyErr_Format(PyExc_TypeError,
+    #if PY_MAJOR_VERSION < 3
+        "%.200s() got an unexpected keyword argument '%.200s'",
+        function_name, PyString_AsString(key));
+    #else
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    #endif
+    return 0;
+}
+
+/* RaiseArgTupleInvalid */
+static void __Pyx_RaiseArgtupleInvalid(
+    const char* func_name,
+    int exact,
+    Py_ssize_t num_min,
+    Py_ssize_t num_max,
+    Py_ssize_t num_found)
+{
+    Py_ssize_t num_expected;
+    const char *more_or_less;
+    if (num_found < num_min) {
+        num_expected = num_min;
+        more_or_less = "at least";
+    } else {
+        num_expected = num_max;
+        more_or_less = "at most";
+    }
+    if (exact) {
+        more_or_less = "exactly";
+    }
+    PyErr_Format(PyExc_TypeError,
+                 "%.200s() takes %.8s %" CYTHON_FORMAT_SSIZE_T "d positional argument%.1s (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                 func_name, more_or_less, num_expected,
+                 (num_expected == 1) ? "" : "s", num_found);
+}
+
+/* RaiseDoubleKeywords */
+static void __Pyx_RaiseDoubleKeywordsError(
+    const char* func_name,
+    PyObject* kw_name)
+{
+    PyErr_Format(PyExc_TypeError,
+        #if PY_MAJOR_VERSION >= 3
+        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
+        #else
+        "%s() got multiple values for keyword argument '%s'", func_name,
+        PyString_AsString(kw_name));
+        #endif
+}
+
+/* ParseKeywords */
+static int __Pyx_ParseOptionalKeywords(
+    PyObject *kwds,
+    PyObject **argnames[],
+    PyObject *kwds2,
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    const char* function_name)
+{
+    PyObject *key = 0, *value = 0;
+    Py_ssize_t pos = 0;
+    PyObject*** name;
+    PyObject*** first_kw_arg = argnames + num_pos_args;
+    while (PyDict_Next(kwds, &pos, &key, &value)) {
+        name = first_kw_arg;
+        while (*name && (**name != key)) name++;
+        if (*name) {
+            values[name-argnames] = value;
+            continue;
+        }
+        name = first_kw_arg;
+        #if PY_MAJOR_VERSION < 3
+        if (likely(PyString_CheckExact(key)) || likely(PyString_Check(key))) {
+            while (*name) {
+                if ((CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**name) == PyString_GET_SIZE(key))
+                        && _PyString_Eq(**name, key)) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    if ((**argname == key) || (
+                            (CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**argname) == PyString_GET_SIZE(key))
+                             && _PyString_Eq(**argname, key))) {
+                        goto arg_passed_twice;
+                    }
+                    argname++;
+                }
+            }
+        } else
+        #endif
+        if (likely(PyUnicode_Check(key))) {
+            while (*name) {
+                int cmp = (**name == key) ? 0 :
+                #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                    (PyUnicode_GET_SIZE(**name) != PyUnicode_GET_SIZE(key)) ? 1 :
+                #endif
+                    PyUnicode_Compare(**name, key);
+                if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                if (cmp == 0) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    int cmp = (**argname == key) ? 0 :
+                    #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                        (PyUnicode_GET_SIZE(**argname) != PyUnicode_GET_SIZE(key)) ? 1 :
+                    #endif
+                        PyUnicode_Compare(**argname, key);
+                    if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                    if (cmp == 0) goto arg_passed_twice;
+                    argname++;
+                }
+            }
+        } else
+            goto invalid_keyword_type;
+        if (kwds2) {
+            if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
+        } else {
+            goto invalid_keyword;
+        }
+    }
+    return 0;
+arg_passed_twice:
+    __Pyx_RaiseDoubleKeywordsError(function_name, key);
+    goto bad;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() keywords must be strings", function_name);
+    goto bad;
+invalid_keyword:
+    PyErr_Format(PyExc_TypeError,
+    #if PY_MAJOR_VERSION < 3
+        "%.200s() got an unexpected keyword argument '%.200s'",
+        function_name, PyString_AsString(key));
+    #else
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    #endif
+bad:
+    return -1;
+}
+
+/* ArgTypeTest */
+static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact)
+{
+    if (unlikely(!type)) {
+        PyErr_SetString(PyExc_SystemError, "Missing type object");
+        return 0;
+    }
+    else if (exact) {
+        #if PY_MAJOR_VERSION == 2
+        if ((type == &PyBaseString_Type) && likely(__Pyx_PyBaseString_CheckExact(obj))) return 1;
+        #endif
+    }
+    else {
+        if (likely(__Pyx_TypeCheck(obj, type))) return 1;
+    }
+    PyErr_Format(PyExc_TypeError,
+        "Argument '%.200s' has incorrect type (expected %.200s, got %.200s)",
+        name, type->tp_name, Py_TYPE(obj)->tp_name);
+    return 0;
+}
+
+/* GetModuleGlobalName */
+static CYTHON_INLINE PyObject *__Pyx_GetModuleGlobalName(PyObject *name) {
+    PyObject *result;
+#if !CYTHON_AVOID_BORROWED_REFS
+    result = PyDict_GetItem(__pyx_d, name);
+    if (likely(result)) {
+        Py_INCREF(result);
+    } else {
+#else
+    result = PyObject_GetItem(__pyx_d, name);
+    if (!result) {
+        PyErr_Clear();
+#endif
+        result = __Pyx_GetBuiltinName(name);
+    }
+    return result;
+}
+
+/* PyObjectCall */
+  #if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    PyObject *result;
+    ternaryfunc call = func->ob_type->tp_call;
+    if (unlikely(!call))
+        return PyObject_Call(func, arg, kw);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = (*call)(func, arg, kw);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyFunctionFastCall */
+  #if CYTHON_FAST_PYCALL
+#include "frameobject.h"
+static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args, Py_ssize_t na,
+                                               PyObject *globals) {
+    PyFrameObject *f;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject **fastlocals;
+    Py_ssize_t i;
+    PyObject *result;
+    assert(globals != NULL);
+    /* XXX Perhaps we should create a specialized
+       PyFrame_New() that doesn't take locals, but does
+       take builtins without sanity checking them.
+       */
+    assert(tstate != NULL);
+    f = PyFrame_New(tstate, co, globals, NULL);
+    if (f == NULL) {
+        return NULL;
+    }
+    fastlocals = f->f_localsplus;
+    for (i = 0; i < na; i++) {
+        Py_INCREF(*args);
+        fastlocals[i] = *args++;
+    }
+    result = PyEval_EvalFrameEx(f,0);
+    ++tstate->recursion_depth;
+    Py_DECREF(f);
+    --tstate->recursion_depth;
+    return result;
+}
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, int nargs, PyObject *kwargs) {
+    PyCodeObject *co = (PyCodeObject *)PyFunction_GET_CODE(func);
+    PyObject *globals = PyFunction_GET_GLOBALS(func);
+    PyObject *argdefs = PyFunction_GET_DEFAULTS(func);
+    PyObject *closure;
+#if PY_MAJOR_VERSION >= 3
+    PyObject *kwdefs;
+#endif
+    PyObject *kwtuple, **k;
+    PyObject **d;
+    Py_ssize_t nd;
+    Py_ssize_t nk;
+    PyObject *result;
+    assert(kwargs == NULL || PyDict_Check(kwargs));
+    nk = kwargs ? PyDict_Size(kwargs) : 0;
+    if (Py_EnterRecursiveCall((char*)" while calling a Python object")) {
+        return NULL;
+    }
+    if (
+#if PY_MAJOR_VERSION >= 3
+            co->co_kwonlyargcount == 0 &&
+#endif
+            likely(kwargs == NULL || nk == 0) &&
+            co->co_flags == (CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE)) {
+        if (argdefs == NULL && co->co_argcount == nargs) {
+            result = __Pyx_PyFunction_FastCallNoKw(co, args, nargs, globals);
+            goto done;
+        }
+        else if (nargs == 0 && argdefs != NULL
+                 && co->co_argcount == Py_SIZE(argdefs)) {
+            /* function called with no arguments, but all parameters have
+               a default value: use default values as arguments .*/
+            args = &PyTuple_GET_ITEM(argdefs, 0);
+            result =__Pyx_PyFunction_FastCallNoKw(co, args, Py_SIZE(argdefs), globals);
+            goto done;
+        }
+    }
+    if (kwargs != NULL) {
+        Py_ssize_t pos, i;
+        kwtuple = PyTuple_New(2 * nk);
+        if (kwtuple == NULL) {
+            result = NULL;
+            goto done;
+        }
+        k = &PyTuple_GET_ITEM(kwtuple, 0);
+        pos = i = 0;
+        while (PyDict_Next(kwargs, &pos, &k[i], &k[i+1])) {
+            Py_INCREF(k[i]);
+            Py_INCREF(k[i+1]);
+            i += 2;
+        }
+        nk = i / 2;
+    }
+    else {
+        kwtuple = NULL;
+        k = NULL;
+    }
+    closure = PyFunction_GET_CLOSURE(func);
+#if PY_MAJOR_VERSION >= 3
+    kwdefs = PyFunction_GET_KW_DEFAULTS(func);
+#endif
+    if (argdefs != NULL) {
+        d = &PyTuple_GET_ITEM(argdefs, 0);
+        nd = Py_SIZE(argdefs);
+    }
+    else {
+        d = NULL;
+        nd = 0;
+    }
+#if PY_MAJOR_VERSION >= 3
+    result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
+                               args, nargs,
+                               k, (int)nk,
+                               d, (int)nd, kwdefs, closure);
 #else
-            "name '%.200s' is not defined", PyString_AS_STRING(name));
+    result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
+                               args, nargs,
+                               k, (int)nk,
+                               d, (int)nd, closure);
 #endif
-    }
+    Py_XDECREF(kwtuple);
+done:
+    Py_LeaveRecursiveCall();
     return result;
 }
-
-/* KeywordStringCheck */
-static int __Pyx_CheckKeywordStrings(
-    PyObject *kwdict,
-    const char* function_name,
-    int kw_allowed)
-{
-    PyObject* key = 0;
-    Py_ssize_t pos = 0;
-#if CYTHON_COMPILING_IN_PYPY
-    if (!kw_allowed && PyDict_Next(kwdict, &pos, &key, 0))
-        goto invalid_keyword;
-    return 1;
-#else
-    while (PyDict_Next(kwdict, &pos, &key, 0)) {
-        #if PY_MAJOR_VERSION < 3
-        if (unlikely(!PyString_Check(key)))
-        #endif
-            if (unlikely(!PyUnicode_Check(key)))
-                goto invalid_keyword_type;
-    }
-    if ((!kw_allowed) && unlikely(key))
-        goto invalid_keyword;
-    return 1;
-invalid_keyword_type:
-    PyErr_Format(PyExc_TypeError,
-        "%.200s() keywords must be strings", function_name);
-    return 0;
 #endif
-invalid_keyword:
-    PyErr_Format(PyExc_TypeError,
-    #if PY_MAJOR_VERSION < 3
-        "%.200s() got an unexpected keyword argument '%.200s'",
-        function_name, PyString_AsString(key));
-    #else
-        "%s() got an unexpected keyword argument '%U'",
-        function_name, key);
-    #endif
-    return 0;
-}
+#endif
 
-/* RaiseArgTupleInvalid */
-static void __Pyx_RaiseArgtupleInvalid(
-    const char* func_name,
-    int exact,
-    Py_ssize_t num_min,
-    Py_ssize_t num_max,
-    Py_ssize_t num_found)
-{
-    Py_ssize_t num_expected;
-    const char *more_or_less;
-    if (num_found < num_min) {
-        num_expected = num_min;
-        more_or_less = "at least";
+/* PyCFunctionFastCall */
+  #if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject * __Pyx_PyCFunction_FastCall(PyObject *func_obj, PyObject **args, Py_ssize_t nargs) {
+    PyCFunctionObject *func = (PyCFunctionObject*)func_obj;
+    PyCFunction meth = PyCFunction_GET_FUNCTION(func);
+    PyObject *self = PyCFunction_GET_SELF(func);
+    int flags = PyCFunction_GET_FLAGS(func);
+    assert(PyCFunction_Check(func));
+    assert(METH_FASTCALL == (flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS)));
+    assert(nargs >= 0);
+    assert(nargs == 0 || args != NULL);
+    /* _PyCFunction_FastCallDict() must not be called with an exception set,
+       because it may clear it (directly or indirectly) and so the
+       caller loses its exception */
+    assert(!PyErr_Occurred());
+    if ((PY_VERSION_HEX < 0x030700A0) || unlikely(flags & METH_KEYWORDS)) {
+        return (*((__Pyx_PyCFunctionFastWithKeywords)meth)) (self, args, nargs, NULL);
     } else {
-        num_expected = num_max;
-        more_or_less = "at most";
-    }
-    if (exact) {
-        more_or_less = "exactly";
+        return (*((__Pyx_PyCFunctionFast)meth)) (self, args, nargs);
     }
-    PyErr_Format(PyExc_TypeError,
-                 "%.200s() takes %.8s %" CYTHON_FORMAT_SSIZE_T "d positional argument%.1s (%" CYTHON_FORMAT_SSIZE_T "d given)",
-                 func_name, more_or_less, num_expected,
-                 (num_expected == 1) ? "" : "s", num_found);
 }
+#endif
 
-/* RaiseDoubleKeywords */
-static void __Pyx_RaiseDoubleKeywordsError(
-    const char* func_name,
-    PyObject* kw_name)
-{
-    PyErr_Format(PyExc_TypeError,
-        #if PY_MAJOR_VERSION >= 3
-        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
-        #else
-        "%s() got multiple values for keyword argument '%s'", func_name,
-        PyString_AsString(kw_name));
-        #endif
+/* None */
+  static CYTHON_INLINE int __Pyx_div_int(int a, int b) {
+    int q = a / b;
+    int r = a - q*b;
+    q -= ((r != 0) & ((r ^ b) < 0));
+    return q;
 }
 
-/* ParseKeywords */
-static int __Pyx_ParseOptionalKeywords(
-    PyObject *kwds,
-    PyObject **argnames[],
-    PyObject *kwds2,
-    PyObject *values[],
-    Py_ssize_t num_pos_args,
-    const char* function_name)
-{
-    PyObject *key = 0, *value = 0;
-    Py_ssize_t pos = 0;
-    PyObject*** name;
-    PyObject*** first_kw_arg = argnames + num_pos_args;
-    while (PyDict_Next(kwds, &pos, &key, &value)) {
-        name = first_kw_arg;
-        while (*name && (**name != key)) name++;
-        if (*name) {
-            values[name-argnames] = value;
-            continue;
+/* PyErrFetchRestore */
+  #if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+}
+#endif
+
+/* RaiseException */
+  #if PY_MAJOR_VERSION < 3
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb,
+                        CYTHON_UNUSED PyObject *cause) {
+    __Pyx_PyThreadState_declare
+    Py_XINCREF(type);
+    if (!value || value == Py_None)
+        value = NULL;
+    else
+        Py_INCREF(value);
+    if (!tb || tb == Py_None)
+        tb = NULL;
+    else {
+        Py_INCREF(tb);
+        if (!PyTraceBack_Check(tb)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: arg 3 must be a traceback or None");
+            goto raise_error;
         }
-        name = first_kw_arg;
-        #if PY_MAJOR_VERSION < 3
-        if (likely(PyString_CheckExact(key)) || likely(PyString_Check(key))) {
-            while (*name) {
-                if ((CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**name) == PyString_GET_SIZE(key))
-                        && _PyString_Eq(**name, key)) {
-                    values[name-argnames] = value;
-                    break;
-                }
-                name++;
-            }
-            if (*name) continue;
-            else {
-                PyObject*** argname = argnames;
-                while (argname != first_kw_arg) {
-                    if ((**argname == key) || (
-                            (CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**argname) == PyString_GET_SIZE(key))
-                             && _PyString_Eq(**argname, key))) {
-                        goto arg_passed_twice;
-                    }
-                    argname++;
-                }
-            }
-        } else
-        #endif
-        if (likely(PyUnicode_Check(key))) {
-            while (*name) {
-                int cmp = (**name == key) ? 0 :
-                #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
-                    (PyUnicode_GET_SIZE(**name) != PyUnicode_GET_SIZE(key)) ? 1 :
-                #endif
-                    PyUnicode_Compare(**name, key);
-                if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
-                if (cmp == 0) {
-                    values[name-argnames] = value;
-                    break;
-                }
-                name++;
-            }
-            if (*name) continue;
-            else {
-                PyObject*** argname = argnames;
-                while (argname != first_kw_arg) {
-                    int cmp = (**argname == key) ? 0 :
-                    #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
-                        (PyUnicode_GET_SIZE(**argname) != PyUnicode_GET_SIZE(key)) ? 1 :
-                    #endif
-                        PyUnicode_Compare(**argname, key);
-                    if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
-                    if (cmp == 0) goto arg_passed_twice;
-                    argname++;
-                }
-            }
-        } else
-            goto invalid_keyword_type;
-        if (kwds2) {
-            if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
-        } else {
-            goto invalid_keyword;
+    }
+    if (PyType_Check(type)) {
+#if CYTHON_COMPILING_IN_PYPY
+        if (!value) {
+            Py_INCREF(Py_None);
+            value = Py_None;
+        }
+#endif
+        PyErr_NormalizeException(&type, &value, &tb);
+    } else {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto raise_error;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(type);
+        Py_INCREF(type);
+        if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: exception class must be a subclass of BaseException");
+            goto raise_error;
         }
     }
-    return 0;
-arg_passed_twice:
-    __Pyx_RaiseDoubleKeywordsError(function_name, key);
-    goto bad;
-invalid_keyword_type:
-    PyErr_Format(PyExc_TypeError,
-        "%.200s() keywords must be strings", function_name);
-    goto bad;
-invalid_keyword:
-    PyErr_Format(PyExc_TypeError,
-    #if PY_MAJOR_VERSION < 3
-        "%.200s() got an unexpected keyword argument '%.200s'",
-        function_name, PyString_AsString(key));
-    #else
-        "%s() got an unexpected keyword argument '%U'",
-        function_name, key);
-    #endif
-bad:
-    return -1;
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrRestore(type, value, tb);
+    return;
+raise_error:
+    Py_XDECREF(value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+    return;
 }
-
-/* ArgTypeTest */
-static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact)
-{
-    if (unlikely(!type)) {
-        PyErr_SetString(PyExc_SystemError, "Missing type object");
-        return 0;
+#else
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
+    PyObject* owned_instance = NULL;
+    if (tb == Py_None) {
+        tb = 0;
+    } else if (tb && !PyTraceBack_Check(tb)) {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: arg 3 must be a traceback or None");
+        goto bad;
     }
-    else if (exact) {
-        #if PY_MAJOR_VERSION == 2
-        if ((type == &PyBaseString_Type) && likely(__Pyx_PyBaseString_CheckExact(obj))) return 1;
-        #endif
+    if (value == Py_None)
+        value = 0;
+    if (PyExceptionInstance_Check(type)) {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto bad;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(value);
+    } else if (PyExceptionClass_Check(type)) {
+        PyObject *instance_class = NULL;
+        if (value && PyExceptionInstance_Check(value)) {
+            instance_class = (PyObject*) Py_TYPE(value);
+            if (instance_class != type) {
+                int is_subclass = PyObject_IsSubclass(instance_class, type);
+                if (!is_subclass) {
+                    instance_class = NULL;
+                } else if (unlikely(is_subclass == -1)) {
+                    goto bad;
+                } else {
+                    type = instance_class;
+                }
+            }
+        }
+        if (!instance_class) {
+            PyObject *args;
+            if (!value)
+                args = PyTuple_New(0);
+            else if (PyTuple_Check(value)) {
+                Py_INCREF(value);
+                args = value;
+            } else
+                args = PyTuple_Pack(1, value);
+            if (!args)
+                goto bad;
+            owned_instance = PyObject_Call(type, args, NULL);
+            Py_DECREF(args);
+            if (!owned_instance)
+                goto bad;
+            value = owned_instance;
+            if (!PyExceptionInstance_Check(value)) {
+                PyErr_Format(PyExc_TypeError,
+                             "calling %R should have returned an instance of "
+                             "BaseException, not %R",
+                             type, Py_TYPE(value));
+                goto bad;
+            }
+        }
+    } else {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: exception class must be a subclass of BaseException");
+        goto bad;
     }
-    else {
-        if (likely(__Pyx_TypeCheck(obj, type))) return 1;
+    if (cause) {
+        PyObject *fixed_cause;
+        if (cause == Py_None) {
+            fixed_cause = NULL;
+        } else if (PyExceptionClass_Check(cause)) {
+            fixed_cause = PyObject_CallObject(cause, NULL);
+            if (fixed_cause == NULL)
+                goto bad;
+        } else if (PyExceptionInstance_Check(cause)) {
+            fixed_cause = cause;
+            Py_INCREF(fixed_cause);
+        } else {
+            PyErr_SetString(PyExc_TypeError,
+                            "exception causes must derive from "
+                            "BaseException");
+            goto bad;
+        }
+        PyException_SetCause(value, fixed_cause);
     }
-    PyErr_Format(PyExc_TypeError,
-        "Argument '%.200s' has incorrect type (expected %.200s, got %.200s)",
-        name, type->tp_name, Py_TYPE(obj)->tp_name);
-    return 0;
-}
-
-/* GetModuleGlobalName */
-static CYTHON_INLINE PyObject *__Pyx_GetModuleGlobalName(PyObject *name) {
-    PyObject *result;
-#if !CYTHON_AVOID_BORROWED_REFS
-    result = PyDict_GetItem(__pyx_d, name);
-    if (likely(result)) {
-        Py_INCREF(result);
-    } else {
+    PyErr_SetObject(type, value);
+    if (tb) {
+#if CYTHON_COMPILING_IN_PYPY
+        PyObject *tmp_type, *tmp_value, *tmp_tb;
+        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
+        Py_INCREF(tb);
+        PyErr_Restore(tmp_type, tmp_value, tb);
+        Py_XDECREF(tmp_tb);
 #else
-    result = PyObject_GetItem(__pyx_d, name);
-    if (!result) {
-        PyErr_Clear();
+        PyThreadState *tstate = __Pyx_PyThreadState_Current;
+        PyObject* tmp_tb = tstate->curexc_traceback;
+        if (tb != tmp_tb) {
+            Py_INCREF(tb);
+            tstate->curexc_traceback = tb;
+            Py_XDECREF(tmp_tb);
+        }
 #endif
-        result = __Pyx_GetBuiltinName(name);
     }
-    return result;
+bad:
+    Py_XDECREF(owned_instance);
+    return;
 }
+#endif
 
-/* PyObjectCall */
+/* PyObjectCallMethO */
   #if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
-    PyObject *result;
-    ternaryfunc call = func->ob_type->tp_call;
-    if (unlikely(!call))
-        return PyObject_Call(func, arg, kw);
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
+    PyObject *self, *result;
+    PyCFunction cfunc;
+    cfunc = PyCFunction_GET_FUNCTION(func);
+    self = PyCFunction_GET_SELF(func);
     if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
         return NULL;
-    result = (*call)(func, arg, kw);
+    result = cfunc(self, arg);
     Py_LeaveRecursiveCall();
     if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
         PyErr_SetString(
@@ -7594,384 +14630,998 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg
 }
 #endif
 
-/* PyFunctionFastCall */
-  #if CYTHON_FAST_PYCALL
-#include "frameobject.h"
-static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args, Py_ssize_t na,
-                                               PyObject *globals) {
-    PyFrameObject *f;
-    PyThreadState *tstate = __Pyx_PyThreadState_Current;
-    PyObject **fastlocals;
-    Py_ssize_t i;
+/* PyObjectCallOneArg */
+  #if CYTHON_COMPILING_IN_CPYTHON
+static PyObject* __Pyx__PyObject_CallOneArg(PyObject *func, PyObject *arg) {
     PyObject *result;
-    assert(globals != NULL);
-    /* XXX Perhaps we should create a specialized
-       PyFrame_New() that doesn't take locals, but does
-       take builtins without sanity checking them.
-       */
-    assert(tstate != NULL);
-    f = PyFrame_New(tstate, co, globals, NULL);
-    if (f == NULL) {
-        return NULL;
+    PyObject *args = PyTuple_New(1);
+    if (unlikely(!args)) return NULL;
+    Py_INCREF(arg);
+    PyTuple_SET_ITEM(args, 0, arg);
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, &arg, 1);
     }
-    fastlocals = f->f_localsplus;
-    for (i = 0; i < na; i++) {
-        Py_INCREF(*args);
-        fastlocals[i] = *args++;
+#endif
+    if (likely(PyCFunction_Check(func))) {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_O)) {
+            return __Pyx_PyObject_CallMethO(func, arg);
+#if CYTHON_FAST_PYCCALL
+        } else if (PyCFunction_GET_FLAGS(func) & METH_FASTCALL) {
+            return __Pyx_PyCFunction_FastCall(func, &arg, 1);
+#endif
+        }
+    }
+    return __Pyx__PyObject_CallOneArg(func, arg);
+}
+#else
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_Pack(1, arg);
+    if (unlikely(!args)) return NULL;
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+#endif
+
+/* WriteUnraisableException */
+  static void __Pyx_WriteUnraisable(const char *name, CYTHON_UNUSED int clineno,
+                                  CYTHON_UNUSED int lineno, CYTHON_UNUSED const char *filename,
+                                  int full_traceback, CYTHON_UNUSED int nogil) {
+    PyObject *old_exc, *old_val, *old_tb;
+    PyObject *ctx;
+    __Pyx_PyThreadState_declare
+#ifdef WITH_THREAD
+    PyGILState_STATE state;
+    if (nogil)
+        state = PyGILState_Ensure();
+#ifdef _MSC_VER
+    else state = (PyGILState_STATE)-1;
+#endif
+#endif
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&old_exc, &old_val, &old_tb);
+    if (full_traceback) {
+        Py_XINCREF(old_exc);
+        Py_XINCREF(old_val);
+        Py_XINCREF(old_tb);
+        __Pyx_ErrRestore(old_exc, old_val, old_tb);
+        PyErr_PrintEx(1);
+    }
+    #if PY_MAJOR_VERSION < 3
+    ctx = PyString_FromString(name);
+    #else
+    ctx = PyUnicode_FromString(name);
+    #endif
+    __Pyx_ErrRestore(old_exc, old_val, old_tb);
+    if (!ctx) {
+        PyErr_WriteUnraisable(Py_None);
+    } else {
+        PyErr_WriteUnraisable(ctx);
+        Py_DECREF(ctx);
+    }
+#ifdef WITH_THREAD
+    if (nogil)
+        PyGILState_Release(state);
+#endif
+}
+
+/* BytesEquals */
+  static CYTHON_INLINE int __Pyx_PyBytes_Equals(PyObject* s1, PyObject* s2, int equals) {
+#if CYTHON_COMPILING_IN_PYPY
+    return PyObject_RichCompareBool(s1, s2, equals);
+#else
+    if (s1 == s2) {
+        return (equals == Py_EQ);
+    } else if (PyBytes_CheckExact(s1) & PyBytes_CheckExact(s2)) {
+        const char *ps1, *ps2;
+        Py_ssize_t length = PyBytes_GET_SIZE(s1);
+        if (length != PyBytes_GET_SIZE(s2))
+            return (equals == Py_NE);
+        ps1 = PyBytes_AS_STRING(s1);
+        ps2 = PyBytes_AS_STRING(s2);
+        if (ps1[0] != ps2[0]) {
+            return (equals == Py_NE);
+        } else if (length == 1) {
+            return (equals == Py_EQ);
+        } else {
+            int result;
+#if CYTHON_USE_UNICODE_INTERNALS
+            Py_hash_t hash1, hash2;
+            hash1 = ((PyBytesObject*)s1)->ob_shash;
+            hash2 = ((PyBytesObject*)s2)->ob_shash;
+            if (hash1 != hash2 && hash1 != -1 && hash2 != -1) {
+                return (equals == Py_NE);
+            }
+#endif
+            result = memcmp(ps1, ps2, (size_t)length);
+            return (equals == Py_EQ) ? (result == 0) : (result != 0);
+        }
+    } else if ((s1 == Py_None) & PyBytes_CheckExact(s2)) {
+        return (equals == Py_NE);
+    } else if ((s2 == Py_None) & PyBytes_CheckExact(s1)) {
+        return (equals == Py_NE);
+    } else {
+        int result;
+        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
+        if (!py_result)
+            return -1;
+        result = __Pyx_PyObject_IsTrue(py_result);
+        Py_DECREF(py_result);
+        return result;
     }
-    result = PyEval_EvalFrameEx(f,0);
-    ++tstate->recursion_depth;
-    Py_DECREF(f);
-    --tstate->recursion_depth;
-    return result;
+#endif
 }
-#if 1 || PY_VERSION_HEX < 0x030600B1
-static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, int nargs, PyObject *kwargs) {
-    PyCodeObject *co = (PyCodeObject *)PyFunction_GET_CODE(func);
-    PyObject *globals = PyFunction_GET_GLOBALS(func);
-    PyObject *argdefs = PyFunction_GET_DEFAULTS(func);
-    PyObject *closure;
-#if PY_MAJOR_VERSION >= 3
-    PyObject *kwdefs;
+
+/* UnicodeEquals */
+  static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int equals) {
+#if CYTHON_COMPILING_IN_PYPY
+    return PyObject_RichCompareBool(s1, s2, equals);
+#else
+#if PY_MAJOR_VERSION < 3
+    PyObject* owned_ref = NULL;
 #endif
-    PyObject *kwtuple, **k;
-    PyObject **d;
-    Py_ssize_t nd;
-    Py_ssize_t nk;
-    PyObject *result;
-    assert(kwargs == NULL || PyDict_Check(kwargs));
-    nk = kwargs ? PyDict_Size(kwargs) : 0;
-    if (Py_EnterRecursiveCall((char*)" while calling a Python object")) {
-        return NULL;
+    int s1_is_unicode, s2_is_unicode;
+    if (s1 == s2) {
+        goto return_eq;
+    }
+    s1_is_unicode = PyUnicode_CheckExact(s1);
+    s2_is_unicode = PyUnicode_CheckExact(s2);
+#if PY_MAJOR_VERSION < 3
+    if ((s1_is_unicode & (!s2_is_unicode)) && PyString_CheckExact(s2)) {
+        owned_ref = PyUnicode_FromObject(s2);
+        if (unlikely(!owned_ref))
+            return -1;
+        s2 = owned_ref;
+        s2_is_unicode = 1;
+    } else if ((s2_is_unicode & (!s1_is_unicode)) && PyString_CheckExact(s1)) {
+        owned_ref = PyUnicode_FromObject(s1);
+        if (unlikely(!owned_ref))
+            return -1;
+        s1 = owned_ref;
+        s1_is_unicode = 1;
+    } else if (((!s2_is_unicode) & (!s1_is_unicode))) {
+        return __Pyx_PyBytes_Equals(s1, s2, equals);
     }
-    if (
-#if PY_MAJOR_VERSION >= 3
-            co->co_kwonlyargcount == 0 &&
 #endif
-            likely(kwargs == NULL || nk == 0) &&
-            co->co_flags == (CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE)) {
-        if (argdefs == NULL && co->co_argcount == nargs) {
-            result = __Pyx_PyFunction_FastCallNoKw(co, args, nargs, globals);
-            goto done;
+    if (s1_is_unicode & s2_is_unicode) {
+        Py_ssize_t length;
+        int kind;
+        void *data1, *data2;
+        if (unlikely(__Pyx_PyUnicode_READY(s1) < 0) || unlikely(__Pyx_PyUnicode_READY(s2) < 0))
+            return -1;
+        length = __Pyx_PyUnicode_GET_LENGTH(s1);
+        if (length != __Pyx_PyUnicode_GET_LENGTH(s2)) {
+            goto return_ne;
         }
-        else if (nargs == 0 && argdefs != NULL
-                 && co->co_argcount == Py_SIZE(argdefs)) {
-            /* function called with no arguments, but all parameters have
-               a default value: use default values as arguments .*/
-            args = &PyTuple_GET_ITEM(argdefs, 0);
-            result =__Pyx_PyFunction_FastCallNoKw(co, args, Py_SIZE(argdefs), globals);
-            goto done;
+#if CYTHON_USE_UNICODE_INTERNALS
+        {
+            Py_hash_t hash1, hash2;
+        #if CYTHON_PEP393_ENABLED
+            hash1 = ((PyASCIIObject*)s1)->hash;
+            hash2 = ((PyASCIIObject*)s2)->hash;
+        #else
+            hash1 = ((PyUnicodeObject*)s1)->hash;
+            hash2 = ((PyUnicodeObject*)s2)->hash;
+        #endif
+            if (hash1 != hash2 && hash1 != -1 && hash2 != -1) {
+                goto return_ne;
+            }
         }
-    }
-    if (kwargs != NULL) {
-        Py_ssize_t pos, i;
-        kwtuple = PyTuple_New(2 * nk);
-        if (kwtuple == NULL) {
-            result = NULL;
-            goto done;
+#endif
+        kind = __Pyx_PyUnicode_KIND(s1);
+        if (kind != __Pyx_PyUnicode_KIND(s2)) {
+            goto return_ne;
         }
-        k = &PyTuple_GET_ITEM(kwtuple, 0);
-        pos = i = 0;
-        while (PyDict_Next(kwargs, &pos, &k[i], &k[i+1])) {
-            Py_INCREF(k[i]);
-            Py_INCREF(k[i+1]);
-            i += 2;
+        data1 = __Pyx_PyUnicode_DATA(s1);
+        data2 = __Pyx_PyUnicode_DATA(s2);
+        if (__Pyx_PyUnicode_READ(kind, data1, 0) != __Pyx_PyUnicode_READ(kind, data2, 0)) {
+            goto return_ne;
+        } else if (length == 1) {
+            goto return_eq;
+        } else {
+            int result = memcmp(data1, data2, (size_t)(length * kind));
+            #if PY_MAJOR_VERSION < 3
+            Py_XDECREF(owned_ref);
+            #endif
+            return (equals == Py_EQ) ? (result == 0) : (result != 0);
         }
-        nk = i / 2;
-    }
-    else {
-        kwtuple = NULL;
-        k = NULL;
-    }
-    closure = PyFunction_GET_CLOSURE(func);
-#if PY_MAJOR_VERSION >= 3
-    kwdefs = PyFunction_GET_KW_DEFAULTS(func);
-#endif
-    if (argdefs != NULL) {
-        d = &PyTuple_GET_ITEM(argdefs, 0);
-        nd = Py_SIZE(argdefs);
-    }
-    else {
-        d = NULL;
-        nd = 0;
+    } else if ((s1 == Py_None) & s2_is_unicode) {
+        goto return_ne;
+    } else if ((s2 == Py_None) & s1_is_unicode) {
+        goto return_ne;
+    } else {
+        int result;
+        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
+        if (!py_result)
+            return -1;
+        result = __Pyx_PyObject_IsTrue(py_result);
+        Py_DECREF(py_result);
+        return result;
     }
-#if PY_MAJOR_VERSION >= 3
-    result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
-                               args, nargs,
-                               k, (int)nk,
-                               d, (int)nd, kwdefs, closure);
-#else
-    result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
-                               args, nargs,
-                               k, (int)nk,
-                               d, (int)nd, closure);
+return_eq:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(owned_ref);
+    #endif
+    return (equals == Py_EQ);
+return_ne:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(owned_ref);
+    #endif
+    return (equals == Py_NE);
 #endif
-    Py_XDECREF(kwtuple);
-done:
-    Py_LeaveRecursiveCall();
-    return result;
 }
-#endif
+
+/* SaveResetException */
+  #if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    #if PY_VERSION_HEX >= 0x030700A2
+    *type = tstate->exc_state.exc_type;
+    *value = tstate->exc_state.exc_value;
+    *tb = tstate->exc_state.exc_traceback;
+    #else
+    *type = tstate->exc_type;
+    *value = tstate->exc_value;
+    *tb = tstate->exc_traceback;
+    #endif
+    Py_XINCREF(*type);
+    Py_XINCREF(*value);
+    Py_XINCREF(*tb);
+}
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    #if PY_VERSION_HEX >= 0x030700A2
+    tmp_type = tstate->exc_state.exc_type;
+    tmp_value = tstate->exc_state.exc_value;
+    tmp_tb = tstate->exc_state.exc_traceback;
+    tstate->exc_state.exc_type = type;
+    tstate->exc_state.exc_value = value;
+    tstate->exc_state.exc_traceback = tb;
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = type;
+    tstate->exc_value = value;
+    tstate->exc_traceback = tb;
+    #endif
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
 #endif
 
-/* PyCFunctionFastCall */
-  #if CYTHON_FAST_PYCCALL
-static CYTHON_INLINE PyObject * __Pyx_PyCFunction_FastCall(PyObject *func_obj, PyObject **args, Py_ssize_t nargs) {
-    PyCFunctionObject *func = (PyCFunctionObject*)func_obj;
-    PyCFunction meth = PyCFunction_GET_FUNCTION(func);
-    PyObject *self = PyCFunction_GET_SELF(func);
-    int flags = PyCFunction_GET_FLAGS(func);
-    assert(PyCFunction_Check(func));
-    assert(METH_FASTCALL == (flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS)));
-    assert(nargs >= 0);
-    assert(nargs == 0 || args != NULL);
-    /* _PyCFunction_FastCallDict() must not be called with an exception set,
-       because it may clear it (directly or indirectly) and so the
-       caller loses its exception */
-    assert(!PyErr_Occurred());
-    if ((PY_VERSION_HEX < 0x030700A0) || unlikely(flags & METH_KEYWORDS)) {
-        return (*((__Pyx_PyCFunctionFastWithKeywords)meth)) (self, args, nargs, NULL);
-    } else {
-        return (*((__Pyx_PyCFunctionFast)meth)) (self, args, nargs);
+/* PyErrExceptionMatches */
+  #if CYTHON_FAST_THREAD_STATE
+static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        if (__Pyx_PyErr_GivenExceptionMatches(exc_type, PyTuple_GET_ITEM(tuple, i))) return 1;
     }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err) {
+    PyObject *exc_type = tstate->curexc_type;
+    if (exc_type == err) return 1;
+    if (unlikely(!exc_type)) return 0;
+    if (unlikely(PyTuple_Check(err)))
+        return __Pyx_PyErr_ExceptionMatchesTuple(exc_type, err);
+    return __Pyx_PyErr_GivenExceptionMatches(exc_type, err);
 }
 #endif
 
-/* PyErrFetchRestore */
+/* GetException */
   #if CYTHON_FAST_THREAD_STATE
-static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+#else
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb) {
+#endif
+    PyObject *local_type, *local_value, *local_tb;
+#if CYTHON_FAST_THREAD_STATE
     PyObject *tmp_type, *tmp_value, *tmp_tb;
-    tmp_type = tstate->curexc_type;
-    tmp_value = tstate->curexc_value;
-    tmp_tb = tstate->curexc_traceback;
-    tstate->curexc_type = type;
-    tstate->curexc_value = value;
-    tstate->curexc_traceback = tb;
+    local_type = tstate->curexc_type;
+    local_value = tstate->curexc_value;
+    local_tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+#else
+    PyErr_Fetch(&local_type, &local_value, &local_tb);
+#endif
+    PyErr_NormalizeException(&local_type, &local_value, &local_tb);
+#if CYTHON_FAST_THREAD_STATE
+    if (unlikely(tstate->curexc_type))
+#else
+    if (unlikely(PyErr_Occurred()))
+#endif
+        goto bad;
+    #if PY_MAJOR_VERSION >= 3
+    if (local_tb) {
+        if (unlikely(PyException_SetTraceback(local_value, local_tb) < 0))
+            goto bad;
+    }
+    #endif
+    Py_XINCREF(local_tb);
+    Py_XINCREF(local_type);
+    Py_XINCREF(local_value);
+    *type = local_type;
+    *value = local_value;
+    *tb = local_tb;
+#if CYTHON_FAST_THREAD_STATE
+    #if PY_VERSION_HEX >= 0x030700A2
+    tmp_type = tstate->exc_state.exc_type;
+    tmp_value = tstate->exc_state.exc_value;
+    tmp_tb = tstate->exc_state.exc_traceback;
+    tstate->exc_state.exc_type = local_type;
+    tstate->exc_state.exc_value = local_value;
+    tstate->exc_state.exc_traceback = local_tb;
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = local_type;
+    tstate->exc_value = local_value;
+    tstate->exc_traceback = local_tb;
+    #endif
     Py_XDECREF(tmp_type);
     Py_XDECREF(tmp_value);
     Py_XDECREF(tmp_tb);
+#else
+    PyErr_SetExcInfo(local_type, local_value, local_tb);
+#endif
+    return 0;
+bad:
+    *type = 0;
+    *value = 0;
+    *tb = 0;
+    Py_XDECREF(local_type);
+    Py_XDECREF(local_value);
+    Py_XDECREF(local_tb);
+    return -1;
 }
-static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
-    *type = tstate->curexc_type;
-    *value = tstate->curexc_value;
-    *tb = tstate->curexc_traceback;
-    tstate->curexc_type = 0;
-    tstate->curexc_value = 0;
-    tstate->curexc_traceback = 0;
+
+/* PyFloatBinop */
+    #if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyFloat_TrueDivideCObj(PyObject *op1, PyObject *op2, double floatval, CYTHON_UNUSED int inplace) {
+    const double a = floatval;
+    double b, result;
+    if (likely(PyFloat_CheckExact(op2))) {
+        b = PyFloat_AS_DOUBLE(op2);
+    } else
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_CheckExact(op2))) {
+        b = (double) PyInt_AS_LONG(op2);
+    } else
+    #endif
+    if (likely(PyLong_CheckExact(op2))) {
+        #if CYTHON_USE_PYLONG_INTERNALS
+        const digit* digits = ((PyLongObject*)op2)->ob_digit;
+        const Py_ssize_t size = Py_SIZE(op2);
+        switch (size) {
+            case  0: b = 0.0; break;
+            case -1: b = -(double) digits[0]; break;
+            case  1: b = (double) digits[0]; break;
+            case -2:
+            case 2:
+                if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT && ((8 * sizeof(unsigned long) < 53) || (1 * PyLong_SHIFT < 53))) {
+                    b = (double) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                    if ((8 * sizeof(unsigned long) < 53) || (2 * PyLong_SHIFT < 53) || (b < (double) ((PY_LONG_LONG)1 << 53))) {
+                        if (size == -2)
+                            b = -b;
+                        break;
+                    }
+                }
+            case -3:
+            case 3:
+                if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT && ((8 * sizeof(unsigned long) < 53) || (2 * PyLong_SHIFT < 53))) {
+                    b = (double) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                    if ((8 * sizeof(unsigned long) < 53) || (3 * PyLong_SHIFT < 53) || (b < (double) ((PY_LONG_LONG)1 << 53))) {
+                        if (size == -3)
+                            b = -b;
+                        break;
+                    }
+                }
+            case -4:
+            case 4:
+                if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT && ((8 * sizeof(unsigned long) < 53) || (3 * PyLong_SHIFT < 53))) {
+                    b = (double) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                    if ((8 * sizeof(unsigned long) < 53) || (4 * PyLong_SHIFT < 53) || (b < (double) ((PY_LONG_LONG)1 << 53))) {
+                        if (size == -4)
+                            b = -b;
+                        break;
+                    }
+                }
+            default:
+        #else
+        {
+        #endif
+            b = PyLong_AsDouble(op2);
+            if (unlikely(b == -1.0 && PyErr_Occurred())) return NULL;
+        }
+    } else {
+        return (inplace ? PyNumber_InPlaceTrueDivide : PyNumber_TrueDivide)(op1, op2);
+    }
+        PyFPE_START_PROTECT("divide", return NULL)
+        result = a / b;
+        PyFPE_END_PROTECT(result)
+        return PyFloat_FromDouble(result);
+}
+#endif
+
+/* PyFloatBinop */
+      #if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyFloat_AddObjC(PyObject *op1, PyObject *op2, double floatval, CYTHON_UNUSED int inplace) {
+    const double b = floatval;
+    double a, result;
+    if (likely(PyFloat_CheckExact(op1))) {
+        a = PyFloat_AS_DOUBLE(op1);
+    } else
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_CheckExact(op1))) {
+        a = (double) PyInt_AS_LONG(op1);
+    } else
+    #endif
+    if (likely(PyLong_CheckExact(op1))) {
+        #if CYTHON_USE_PYLONG_INTERNALS
+        const digit* digits = ((PyLongObject*)op1)->ob_digit;
+        const Py_ssize_t size = Py_SIZE(op1);
+        switch (size) {
+            case  0: a = 0.0; break;
+            case -1: a = -(double) digits[0]; break;
+            case  1: a = (double) digits[0]; break;
+            case -2:
+            case 2:
+                if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT && ((8 * sizeof(unsigned long) < 53) || (1 * PyLong_SHIFT < 53))) {
+                    a = (double) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                    if ((8 * sizeof(unsigned long) < 53) || (2 * PyLong_SHIFT < 53) || (a < (double) ((PY_LONG_LONG)1 << 53))) {
+                        if (size == -2)
+                            a = -a;
+                        break;
+                    }
+                }
+            case -3:
+            case 3:
+                if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT && ((8 * sizeof(unsigned long) < 53) || (2 * PyLong_SHIFT < 53))) {
+                    a = (double) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                    if ((8 * sizeof(unsigned long) < 53) || (3 * PyLong_SHIFT < 53) || (a < (double) ((PY_LONG_LONG)1 << 53))) {
+                        if (size == -3)
+                            a = -a;
+                        break;
+                    }
+                }
+            case -4:
+            case 4:
+                if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT && ((8 * sizeof(unsigned long) < 53) || (3 * PyLong_SHIFT < 53))) {
+                    a = (double) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                    if ((8 * sizeof(unsigned long) < 53) || (4 * PyLong_SHIFT < 53) || (a < (double) ((PY_LONG_LONG)1 << 53))) {
+                        if (size == -4)
+                            a = -a;
+                        break;
+                    }
+                }
+            default:
+        #else
+        {
+        #endif
+            a = PyLong_AsDouble(op1);
+            if (unlikely(a == -1.0 && PyErr_Occurred())) return NULL;
+        }
+    } else {
+        return (inplace ? PyNumber_InPlaceAdd : PyNumber_Add)(op1, op2);
+    }
+        PyFPE_START_PROTECT("add", return NULL)
+        result = a + b;
+        PyFPE_END_PROTECT(result)
+        return PyFloat_FromDouble(result);
 }
 #endif
-
-/* RaiseException */
-  #if PY_MAJOR_VERSION < 3
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb,
-                        CYTHON_UNUSED PyObject *cause) {
-    __Pyx_PyThreadState_declare
-    Py_XINCREF(type);
-    if (!value || value == Py_None)
-        value = NULL;
-    else
-        Py_INCREF(value);
-    if (!tb || tb == Py_None)
-        tb = NULL;
-    else {
-        Py_INCREF(tb);
-        if (!PyTraceBack_Check(tb)) {
-            PyErr_SetString(PyExc_TypeError,
-                "raise: arg 3 must be a traceback or None");
-            goto raise_error;
+
+/* PyIntBinop */
+        #if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyInt_FloorDivideObjC(PyObject *op1, PyObject *op2, CYTHON_UNUSED long intval, CYTHON_UNUSED int inplace) {
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_CheckExact(op1))) {
+        const long b = intval;
+        long x;
+        long a = PyInt_AS_LONG(op1);
+            if (unlikely(b == -1 && ((unsigned long)a) == 0-(unsigned long)a))
+                return PyInt_Type.tp_as_number->nb_floor_divide(op1, op2);
+            else {
+                long q, r;
+                q = a / b;
+                r = a - q*b;
+                q -= ((r != 0) & ((r ^ b) < 0));
+                x = q;
+            }
+            return PyInt_FromLong(x);
+    }
+    #endif
+    #if CYTHON_USE_PYLONG_INTERNALS
+    if (likely(PyLong_CheckExact(op1))) {
+        const long b = intval;
+        long a, x;
+#ifdef HAVE_LONG_LONG
+        const PY_LONG_LONG llb = intval;
+        PY_LONG_LONG lla, llx;
+#endif
+        const digit* digits = ((PyLongObject*)op1)->ob_digit;
+        const Py_ssize_t size = Py_SIZE(op1);
+        if (likely(__Pyx_sst_abs(size) <= 1)) {
+            a = likely(size) ? digits[0] : 0;
+            if (size == -1) a = -a;
+        } else {
+            switch (size) {
+                case -2:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        a = -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                case 2:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        a = (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                case -3:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        a = -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                case 3:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        a = (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                case -4:
+                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                        a = -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                case 4:
+                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                        a = (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                default: return PyLong_Type.tp_as_number->nb_floor_divide(op1, op2);
+            }
         }
+                {
+                    long q, r;
+                    q = a / b;
+                    r = a - q*b;
+                    q -= ((r != 0) & ((r ^ b) < 0));
+                    x = q;
+                }
+            return PyLong_FromLong(x);
+#ifdef HAVE_LONG_LONG
+        long_long:
+                {
+                    PY_LONG_LONG q, r;
+                    q = lla / llb;
+                    r = lla - q*llb;
+                    q -= ((r != 0) & ((r ^ llb) < 0));
+                    llx = q;
+                }
+            return PyLong_FromLongLong(llx);
+#endif
+        
+        
     }
-    if (PyType_Check(type)) {
-#if CYTHON_COMPILING_IN_PYPY
-        if (!value) {
-            Py_INCREF(Py_None);
-            value = Py_None;
-        }
+    #endif
+    return (inplace ? PyNumber_InPlaceFloorDivide : PyNumber_FloorDivide)(op1, op2);
+}
 #endif
-        PyErr_NormalizeException(&type, &value, &tb);
-    } else {
-        if (value) {
-            PyErr_SetString(PyExc_TypeError,
-                "instance exception may not have a separate value");
-            goto raise_error;
-        }
-        value = type;
-        type = (PyObject*) Py_TYPE(type);
-        Py_INCREF(type);
-        if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
-            PyErr_SetString(PyExc_TypeError,
-                "raise: exception class must be a subclass of BaseException");
-            goto raise_error;
-        }
+
+/* GetItemInt */
+        static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
+    PyObject *r;
+    if (!j) return NULL;
+    r = PyObject_GetItem(o, j);
+    Py_DECREF(j);
+    return r;
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyList_GET_SIZE(o);
     }
-    __Pyx_PyThreadState_assign
-    __Pyx_ErrRestore(type, value, tb);
-    return;
-raise_error:
-    Py_XDECREF(value);
-    Py_XDECREF(type);
-    Py_XDECREF(tb);
-    return;
+    if ((!boundscheck) || likely((0 <= wrapped_i) & (wrapped_i < PyList_GET_SIZE(o)))) {
+        PyObject *r = PyList_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
 }
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyTuple_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely((0 <= wrapped_i) & (wrapped_i < PyTuple_GET_SIZE(o)))) {
+        PyObject *r = PyTuple_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
 #else
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
-    PyObject* owned_instance = NULL;
-    if (tb == Py_None) {
-        tb = 0;
-    } else if (tb && !PyTraceBack_Check(tb)) {
-        PyErr_SetString(PyExc_TypeError,
-            "raise: arg 3 must be a traceback or None");
-        goto bad;
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i, int is_list,
+                                                     CYTHON_NCP_UNUSED int wraparound,
+                                                     CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS && CYTHON_USE_TYPE_SLOTS
+    if (is_list || PyList_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyList_GET_SIZE(o);
+        if ((!boundscheck) || (likely((n >= 0) & (n < PyList_GET_SIZE(o))))) {
+            PyObject *r = PyList_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
     }
-    if (value == Py_None)
-        value = 0;
-    if (PyExceptionInstance_Check(type)) {
-        if (value) {
-            PyErr_SetString(PyExc_TypeError,
-                "instance exception may not have a separate value");
-            goto bad;
+    else if (PyTuple_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyTuple_GET_SIZE(o);
+        if ((!boundscheck) || likely((n >= 0) & (n < PyTuple_GET_SIZE(o)))) {
+            PyObject *r = PyTuple_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
         }
-        value = type;
-        type = (PyObject*) Py_TYPE(value);
-    } else if (PyExceptionClass_Check(type)) {
-        PyObject *instance_class = NULL;
-        if (value && PyExceptionInstance_Check(value)) {
-            instance_class = (PyObject*) Py_TYPE(value);
-            if (instance_class != type) {
-                int is_subclass = PyObject_IsSubclass(instance_class, type);
-                if (!is_subclass) {
-                    instance_class = NULL;
-                } else if (unlikely(is_subclass == -1)) {
-                    goto bad;
+    } else {
+        PySequenceMethods *m = Py_TYPE(o)->tp_as_sequence;
+        if (likely(m && m->sq_item)) {
+            if (wraparound && unlikely(i < 0) && likely(m->sq_length)) {
+                Py_ssize_t l = m->sq_length(o);
+                if (likely(l >= 0)) {
+                    i += l;
                 } else {
-                    type = instance_class;
+                    if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                        return NULL;
+                    PyErr_Clear();
                 }
             }
+            return m->sq_item(o, i);
         }
-        if (!instance_class) {
-            PyObject *args;
-            if (!value)
-                args = PyTuple_New(0);
-            else if (PyTuple_Check(value)) {
-                Py_INCREF(value);
-                args = value;
-            } else
-                args = PyTuple_Pack(1, value);
-            if (!args)
-                goto bad;
-            owned_instance = PyObject_Call(type, args, NULL);
-            Py_DECREF(args);
-            if (!owned_instance)
-                goto bad;
-            value = owned_instance;
-            if (!PyExceptionInstance_Check(value)) {
-                PyErr_Format(PyExc_TypeError,
-                             "calling %R should have returned an instance of "
-                             "BaseException, not %R",
-                             type, Py_TYPE(value));
-                goto bad;
-            }
-        }
-    } else {
-        PyErr_SetString(PyExc_TypeError,
-            "raise: exception class must be a subclass of BaseException");
-        goto bad;
-    }
-    if (cause) {
-        PyObject *fixed_cause;
-        if (cause == Py_None) {
-            fixed_cause = NULL;
-        } else if (PyExceptionClass_Check(cause)) {
-            fixed_cause = PyObject_CallObject(cause, NULL);
-            if (fixed_cause == NULL)
-                goto bad;
-        } else if (PyExceptionInstance_Check(cause)) {
-            fixed_cause = cause;
-            Py_INCREF(fixed_cause);
-        } else {
-            PyErr_SetString(PyExc_TypeError,
-                            "exception causes must derive from "
-                            "BaseException");
-            goto bad;
-        }
-        PyException_SetCause(value, fixed_cause);
     }
-    PyErr_SetObject(type, value);
-    if (tb) {
-#if CYTHON_COMPILING_IN_PYPY
-        PyObject *tmp_type, *tmp_value, *tmp_tb;
-        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
-        Py_INCREF(tb);
-        PyErr_Restore(tmp_type, tmp_value, tb);
-        Py_XDECREF(tmp_tb);
 #else
-        PyThreadState *tstate = __Pyx_PyThreadState_Current;
-        PyObject* tmp_tb = tstate->curexc_traceback;
-        if (tb != tmp_tb) {
-            Py_INCREF(tb);
-            tstate->curexc_traceback = tb;
-            Py_XDECREF(tmp_tb);
-        }
+    if (is_list || PySequence_Check(o)) {
+        return PySequence_GetItem(o, i);
+    }
 #endif
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+}
+
+/* PyFloatBinop */
+        #if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyFloat_TrueDivideObjC(PyObject *op1, PyObject *op2, double floatval, CYTHON_UNUSED int inplace) {
+    const double b = floatval;
+    double a, result;
+    if (likely(PyFloat_CheckExact(op1))) {
+        a = PyFloat_AS_DOUBLE(op1);
+    } else
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_CheckExact(op1))) {
+        a = (double) PyInt_AS_LONG(op1);
+    } else
+    #endif
+    if (likely(PyLong_CheckExact(op1))) {
+        #if CYTHON_USE_PYLONG_INTERNALS
+        const digit* digits = ((PyLongObject*)op1)->ob_digit;
+        const Py_ssize_t size = Py_SIZE(op1);
+        switch (size) {
+            case  0: a = 0.0; break;
+            case -1: a = -(double) digits[0]; break;
+            case  1: a = (double) digits[0]; break;
+            case -2:
+            case 2:
+                if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT && ((8 * sizeof(unsigned long) < 53) || (1 * PyLong_SHIFT < 53))) {
+                    a = (double) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                    if ((8 * sizeof(unsigned long) < 53) || (2 * PyLong_SHIFT < 53) || (a < (double) ((PY_LONG_LONG)1 << 53))) {
+                        if (size == -2)
+                            a = -a;
+                        break;
+                    }
+                }
+            case -3:
+            case 3:
+                if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT && ((8 * sizeof(unsigned long) < 53) || (2 * PyLong_SHIFT < 53))) {
+                    a = (double) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                    if ((8 * sizeof(unsigned long) < 53) || (3 * PyLong_SHIFT < 53) || (a < (double) ((PY_LONG_LONG)1 << 53))) {
+                        if (size == -3)
+                            a = -a;
+                        break;
+                    }
+                }
+            case -4:
+            case 4:
+                if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT && ((8 * sizeof(unsigned long) < 53) || (3 * PyLong_SHIFT < 53))) {
+                    a = (double) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                    if ((8 * sizeof(unsigned long) < 53) || (4 * PyLong_SHIFT < 53) || (a < (double) ((PY_LONG_LONG)1 << 53))) {
+                        if (size == -4)
+                            a = -a;
+                        break;
+                    }
+                }
+            default:
+        #else
+        {
+        #endif
+            a = PyLong_AsDouble(op1);
+            if (unlikely(a == -1.0 && PyErr_Occurred())) return NULL;
+        }
+    } else {
+        return (inplace ? PyNumber_InPlaceTrueDivide : PyNumber_TrueDivide)(op1, op2);
     }
-bad:
-    Py_XDECREF(owned_instance);
-    return;
+        PyFPE_START_PROTECT("divide", return NULL)
+        result = a / b;
+        PyFPE_END_PROTECT(result)
+        return PyFloat_FromDouble(result);
 }
 #endif
 
-/* None */
-  static CYTHON_INLINE int __Pyx_div_int(int a, int b) {
-    int q = a / b;
-    int r = a - q*b;
-    q -= ((r != 0) & ((r ^ b) < 0));
-    return q;
+/* PyFloatBinop */
+          #if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyFloat_SubtractCObj(PyObject *op1, PyObject *op2, double floatval, CYTHON_UNUSED int inplace) {
+    const double a = floatval;
+    double b, result;
+    if (likely(PyFloat_CheckExact(op2))) {
+        b = PyFloat_AS_DOUBLE(op2);
+    } else
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_CheckExact(op2))) {
+        b = (double) PyInt_AS_LONG(op2);
+    } else
+    #endif
+    if (likely(PyLong_CheckExact(op2))) {
+        #if CYTHON_USE_PYLONG_INTERNALS
+        const digit* digits = ((PyLongObject*)op2)->ob_digit;
+        const Py_ssize_t size = Py_SIZE(op2);
+        switch (size) {
+            case  0: b = 0.0; break;
+            case -1: b = -(double) digits[0]; break;
+            case  1: b = (double) digits[0]; break;
+            case -2:
+            case 2:
+                if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT && ((8 * sizeof(unsigned long) < 53) || (1 * PyLong_SHIFT < 53))) {
+                    b = (double) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                    if ((8 * sizeof(unsigned long) < 53) || (2 * PyLong_SHIFT < 53) || (b < (double) ((PY_LONG_LONG)1 << 53))) {
+                        if (size == -2)
+                            b = -b;
+                        break;
+                    }
+                }
+            case -3:
+            case 3:
+                if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT && ((8 * sizeof(unsigned long) < 53) || (2 * PyLong_SHIFT < 53))) {
+                    b = (double) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                    if ((8 * sizeof(unsigned long) < 53) || (3 * PyLong_SHIFT < 53) || (b < (double) ((PY_LONG_LONG)1 << 53))) {
+                        if (size == -3)
+                            b = -b;
+                        break;
+                    }
+                }
+            case -4:
+            case 4:
+                if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT && ((8 * sizeof(unsigned long) < 53) || (3 * PyLong_SHIFT < 53))) {
+                    b = (double) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                    if ((8 * sizeof(unsigned long) < 53) || (4 * PyLong_SHIFT < 53) || (b < (double) ((PY_LONG_LONG)1 << 53))) {
+                        if (size == -4)
+                            b = -b;
+                        break;
+                    }
+                }
+            default:
+        #else
+        {
+        #endif
+            b = PyLong_AsDouble(op2);
+            if (unlikely(b == -1.0 && PyErr_Occurred())) return NULL;
+        }
+    } else {
+        return (inplace ? PyNumber_InPlaceSubtract : PyNumber_Subtract)(op1, op2);
+    }
+        PyFPE_START_PROTECT("subtract", return NULL)
+        result = a - b;
+        PyFPE_END_PROTECT(result)
+        return PyFloat_FromDouble(result);
 }
-
-/* WriteUnraisableException */
-  static void __Pyx_WriteUnraisable(const char *name, CYTHON_UNUSED int clineno,
-                                  CYTHON_UNUSED int lineno, CYTHON_UNUSED const char *filename,
-                                  int full_traceback, CYTHON_UNUSED int nogil) {
-    PyObject *old_exc, *old_val, *old_tb;
-    PyObject *ctx;
-    __Pyx_PyThreadState_declare
-#ifdef WITH_THREAD
-    PyGILState_STATE state;
-    if (nogil)
-        state = PyGILState_Ensure();
-#ifdef _MSC_VER
-    else state = (PyGILState_STATE)-1;
 #endif
-#endif
-    __Pyx_PyThreadState_assign
-    __Pyx_ErrFetch(&old_exc, &old_val, &old_tb);
-    if (full_traceback) {
-        Py_XINCREF(old_exc);
-        Py_XINCREF(old_val);
-        Py_XINCREF(old_tb);
-        __Pyx_ErrRestore(old_exc, old_val, old_tb);
-        PyErr_PrintEx(1);
-    }
+
+/* PyFloatBinop */
+            #if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyFloat_AddCObj(PyObject *op1, PyObject *op2, double floatval, CYTHON_UNUSED int inplace) {
+    const double a = floatval;
+    double b, result;
+    if (likely(PyFloat_CheckExact(op2))) {
+        b = PyFloat_AS_DOUBLE(op2);
+    } else
     #if PY_MAJOR_VERSION < 3
-    ctx = PyString_FromString(name);
-    #else
-    ctx = PyUnicode_FromString(name);
+    if (likely(PyInt_CheckExact(op2))) {
+        b = (double) PyInt_AS_LONG(op2);
+    } else
     #endif
-    __Pyx_ErrRestore(old_exc, old_val, old_tb);
-    if (!ctx) {
-        PyErr_WriteUnraisable(Py_None);
+    if (likely(PyLong_CheckExact(op2))) {
+        #if CYTHON_USE_PYLONG_INTERNALS
+        const digit* digits = ((PyLongObject*)op2)->ob_digit;
+        const Py_ssize_t size = Py_SIZE(op2);
+        switch (size) {
+            case  0: b = 0.0; break;
+            case -1: b = -(double) digits[0]; break;
+            case  1: b = (double) digits[0]; break;
+            case -2:
+            case 2:
+                if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT && ((8 * sizeof(unsigned long) < 53) || (1 * PyLong_SHIFT < 53))) {
+                    b = (double) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                    if ((8 * sizeof(unsigned long) < 53) || (2 * PyLong_SHIFT < 53) || (b < (double) ((PY_LONG_LONG)1 << 53))) {
+                        if (size == -2)
+                            b = -b;
+                        break;
+                    }
+                }
+            case -3:
+            case 3:
+                if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT && ((8 * sizeof(unsigned long) < 53) || (2 * PyLong_SHIFT < 53))) {
+                    b = (double) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                    if ((8 * sizeof(unsigned long) < 53) || (3 * PyLong_SHIFT < 53) || (b < (double) ((PY_LONG_LONG)1 << 53))) {
+                        if (size == -3)
+                            b = -b;
+                        break;
+                    }
+                }
+            case -4:
+            case 4:
+                if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT && ((8 * sizeof(unsigned long) < 53) || (3 * PyLong_SHIFT < 53))) {
+                    b = (double) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                    if ((8 * sizeof(unsigned long) < 53) || (4 * PyLong_SHIFT < 53) || (b < (double) ((PY_LONG_LONG)1 << 53))) {
+                        if (size == -4)
+                            b = -b;
+                        break;
+                    }
+                }
+            default:
+        #else
+        {
+        #endif
+            b = PyLong_AsDouble(op2);
+            if (unlikely(b == -1.0 && PyErr_Occurred())) return NULL;
+        }
+    } else {
+        return (inplace ? PyNumber_InPlaceAdd : PyNumber_Add)(op1, op2);
+    }
+        PyFPE_START_PROTECT("add", return NULL)
+        result = a + b;
+        PyFPE_END_PROTECT(result)
+        return PyFloat_FromDouble(result);
+}
+#endif
+
+/* PyFloatBinop */
+              #if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyFloat_SubtractObjC(PyObject *op1, PyObject *op2, double floatval, CYTHON_UNUSED int inplace) {
+    const double b = floatval;
+    double a, result;
+    if (likely(PyFloat_CheckExact(op1))) {
+        a = PyFloat_AS_DOUBLE(op1);
+    } else
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_CheckExact(op1))) {
+        a = (double) PyInt_AS_LONG(op1);
+    } else
+    #endif
+    if (likely(PyLong_CheckExact(op1))) {
+        #if CYTHON_USE_PYLONG_INTERNALS
+        const digit* digits = ((PyLongObject*)op1)->ob_digit;
+        const Py_ssize_t size = Py_SIZE(op1);
+        switch (size) {
+            case  0: a = 0.0; break;
+            case -1: a = -(double) digits[0]; break;
+            case  1: a = (double) digits[0]; break;
+            case -2:
+            case 2:
+                if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT && ((8 * sizeof(unsigned long) < 53) || (1 * PyLong_SHIFT < 53))) {
+                    a = (double) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                    if ((8 * sizeof(unsigned long) < 53) || (2 * PyLong_SHIFT < 53) || (a < (double) ((PY_LONG_LONG)1 << 53))) {
+                        if (size == -2)
+                            a = -a;
+                        break;
+                    }
+                }
+            case -3:
+            case 3:
+                if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT && ((8 * sizeof(unsigned long) < 53) || (2 * PyLong_SHIFT < 53))) {
+                    a = (double) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                    if ((8 * sizeof(unsigned long) < 53) || (3 * PyLong_SHIFT < 53) || (a < (double) ((PY_LONG_LONG)1 << 53))) {
+                        if (size == -3)
+                            a = -a;
+                        break;
+                    }
+                }
+            case -4:
+            case 4:
+                if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT && ((8 * sizeof(unsigned long) < 53) || (3 * PyLong_SHIFT < 53))) {
+                    a = (double) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                    if ((8 * sizeof(unsigned long) < 53) || (4 * PyLong_SHIFT < 53) || (a < (double) ((PY_LONG_LONG)1 << 53))) {
+                        if (size == -4)
+                            a = -a;
+                        break;
+                    }
+                }
+            default:
+        #else
+        {
+        #endif
+            a = PyLong_AsDouble(op1);
+            if (unlikely(a == -1.0 && PyErr_Occurred())) return NULL;
+        }
     } else {
-        PyErr_WriteUnraisable(ctx);
-        Py_DECREF(ctx);
+        return (inplace ? PyNumber_InPlaceSubtract : PyNumber_Subtract)(op1, op2);
     }
-#ifdef WITH_THREAD
-    if (nogil)
-        PyGILState_Release(state);
+        PyFPE_START_PROTECT("subtract", return NULL)
+        result = a - b;
+        PyFPE_END_PROTECT(result)
+        return PyFloat_FromDouble(result);
+}
 #endif
+
+/* None */
+                static CYTHON_INLINE Sint32 __Pyx_div_Sint32(Sint32 a, Sint32 b) {
+    Sint32 q = a / b;
+    Sint32 r = a - q*b;
+    q -= ((r != 0) & ((r ^ b) < 0));
+    return q;
 }
 
 /* SetVTable */
-  static int __Pyx_SetVtable(PyObject *dict, void *vtable) {
+                static int __Pyx_SetVtable(PyObject *dict, void *vtable) {
 #if PY_VERSION_HEX >= 0x02070000
     PyObject *ob = PyCapsule_New(vtable, 0, 0);
 #else
@@ -7989,7 +15639,7 @@ bad:
 }
 
 /* SetupReduce */
-  static int __Pyx_setup_reduce_is_named(PyObject* meth, PyObject* name) {
+                static int __Pyx_setup_reduce_is_named(PyObject* meth, PyObject* name) {
   int ret;
   PyObject *name_attr;
   name_attr = __Pyx_PyObject_GetAttrStr(meth, __pyx_n_s_name_2);
@@ -8065,7 +15715,7 @@ GOOD:
 }
 
 /* Import */
-  static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
+                static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
     PyObject *empty_list = 0;
     PyObject *module = 0;
     PyObject *global_dict = 0;
@@ -8129,8 +15779,22 @@ bad:
     return module;
 }
 
+/* ImportFrom */
+                static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
+    PyObject* value = __Pyx_PyObject_GetAttrStr(module, name);
+    if (unlikely(!value) && PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Format(PyExc_ImportError,
+        #if PY_MAJOR_VERSION < 3
+            "cannot import name %.230s", PyString_AS_STRING(name));
+        #else
+            "cannot import name %S", name);
+        #endif
+    }
+    return value;
+}
+
 /* CLineInTraceback */
-  #ifndef CYTHON_CLINE_IN_TRACEBACK
+                #ifndef CYTHON_CLINE_IN_TRACEBACK
 static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_line) {
     PyObject *use_cline;
     PyObject *ptype, *pvalue, *ptraceback;
@@ -8167,7 +15831,7 @@ static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_li
 #endif
 
 /* CodeObjectCache */
-  static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
+                static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
     int start = 0, mid = 0, end = count - 1;
     if (end >= 0 && code_line > entries[end].code_line) {
         return count;
@@ -8247,7 +15911,7 @@ static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
 }
 
 /* AddTraceback */
-  #include "compile.h"
+                #include "compile.h"
 #include "frameobject.h"
 #include "traceback.h"
 static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
@@ -8332,7 +15996,7 @@ bad:
 }
 
 /* CIntFromPyVerify */
-  #define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+                #define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
     __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
 #define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
     __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
@@ -8354,7 +16018,7 @@ bad:
     }
 
 /* CIntToPy */
-  static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
+                static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
     const int neg_one = (int) -1, const_zero = (int) 0;
     const int is_unsigned = neg_one > const_zero;
     if (is_unsigned) {
@@ -8384,8 +16048,101 @@ bad:
     }
 }
 
+/* CIntToPy */
+                static CYTHON_INLINE PyObject* __Pyx_PyInt_From_Uint32(Uint32 value) {
+    const Uint32 neg_one = (Uint32) -1, const_zero = (Uint32) 0;
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(Uint32) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(Uint32) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(Uint32) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(Uint32) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(Uint32) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(Uint32),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntToPy */
+                static CYTHON_INLINE PyObject* __Pyx_PyInt_From_Uint64(Uint64 value) {
+    const Uint64 neg_one = (Uint64) -1, const_zero = (Uint64) 0;
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(Uint64) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(Uint64) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(Uint64) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(Uint64) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(Uint64) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(Uint64),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntToPy */
+                static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
+    const long neg_one = (long) -1, const_zero = (long) 0;
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(long) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(long) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(long) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(long),
+                                     little, !is_unsigned);
+    }
+}
+
 /* CIntFromPy */
-  static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
+                static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
     const int neg_one = (int) -1, const_zero = (int) 0;
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
@@ -8573,39 +16330,197 @@ raise_neg_overflow:
     return (int) -1;
 }
 
-/* CIntToPy */
-  static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
-    const long neg_one = (long) -1, const_zero = (long) 0;
+/* CIntFromPy */
+                static CYTHON_INLINE Uint32 __Pyx_PyInt_As_Uint32(PyObject *x) {
+    const Uint32 neg_one = (Uint32) -1, const_zero = (Uint32) 0;
     const int is_unsigned = neg_one > const_zero;
-    if (is_unsigned) {
-        if (sizeof(long) < sizeof(long)) {
-            return PyInt_FromLong((long) value);
-        } else if (sizeof(long) <= sizeof(unsigned long)) {
-            return PyLong_FromUnsignedLong((unsigned long) value);
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(Uint32) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(Uint32, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (Uint32) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (Uint32) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(Uint32, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(Uint32) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(Uint32, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(Uint32) >= 2 * PyLong_SHIFT) {
+                            return (Uint32) (((((Uint32)digits[1]) << PyLong_SHIFT) | (Uint32)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(Uint32) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(Uint32, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(Uint32) >= 3 * PyLong_SHIFT) {
+                            return (Uint32) (((((((Uint32)digits[2]) << PyLong_SHIFT) | (Uint32)digits[1]) << PyLong_SHIFT) | (Uint32)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(Uint32) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(Uint32, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(Uint32) >= 4 * PyLong_SHIFT) {
+                            return (Uint32) (((((((((Uint32)digits[3]) << PyLong_SHIFT) | (Uint32)digits[2]) << PyLong_SHIFT) | (Uint32)digits[1]) << PyLong_SHIFT) | (Uint32)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (Uint32) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(Uint32) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(Uint32, unsigned long, PyLong_AsUnsignedLong(x))
 #ifdef HAVE_LONG_LONG
-        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
-            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+            } else if (sizeof(Uint32) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(Uint32, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
 #endif
-        }
-    } else {
-        if (sizeof(long) <= sizeof(long)) {
-            return PyInt_FromLong((long) value);
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (Uint32) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(Uint32, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(Uint32,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(Uint32) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(Uint32, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(Uint32) - 1 > 2 * PyLong_SHIFT) {
+                            return (Uint32) (((Uint32)-1)*(((((Uint32)digits[1]) << PyLong_SHIFT) | (Uint32)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(Uint32) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(Uint32, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(Uint32) - 1 > 2 * PyLong_SHIFT) {
+                            return (Uint32) ((((((Uint32)digits[1]) << PyLong_SHIFT) | (Uint32)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(Uint32) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(Uint32, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(Uint32) - 1 > 3 * PyLong_SHIFT) {
+                            return (Uint32) (((Uint32)-1)*(((((((Uint32)digits[2]) << PyLong_SHIFT) | (Uint32)digits[1]) << PyLong_SHIFT) | (Uint32)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(Uint32) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(Uint32, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(Uint32) - 1 > 3 * PyLong_SHIFT) {
+                            return (Uint32) ((((((((Uint32)digits[2]) << PyLong_SHIFT) | (Uint32)digits[1]) << PyLong_SHIFT) | (Uint32)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(Uint32) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(Uint32, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(Uint32) - 1 > 4 * PyLong_SHIFT) {
+                            return (Uint32) (((Uint32)-1)*(((((((((Uint32)digits[3]) << PyLong_SHIFT) | (Uint32)digits[2]) << PyLong_SHIFT) | (Uint32)digits[1]) << PyLong_SHIFT) | (Uint32)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(Uint32) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(Uint32, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(Uint32) - 1 > 4 * PyLong_SHIFT) {
+                            return (Uint32) ((((((((((Uint32)digits[3]) << PyLong_SHIFT) | (Uint32)digits[2]) << PyLong_SHIFT) | (Uint32)digits[1]) << PyLong_SHIFT) | (Uint32)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(Uint32) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(Uint32, long, PyLong_AsLong(x))
 #ifdef HAVE_LONG_LONG
-        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
-            return PyLong_FromLongLong((PY_LONG_LONG) value);
+            } else if (sizeof(Uint32) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(Uint32, PY_LONG_LONG, PyLong_AsLongLong(x))
 #endif
+            }
         }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            Uint32 val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (Uint32) -1;
+        }
+    } else {
+        Uint32 val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (Uint32) -1;
+        val = __Pyx_PyInt_As_Uint32(tmp);
+        Py_DECREF(tmp);
+        return val;
     }
-    {
-        int one = 1; int little = (int)*(unsigned char *)&one;
-        unsigned char *bytes = (unsigned char *)&value;
-        return _PyLong_FromByteArray(bytes, sizeof(long),
-                                     little, !is_unsigned);
-    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to Uint32");
+    return (Uint32) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to Uint32");
+    return (Uint32) -1;
 }
 
 /* CIntFromPy */
-  static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
+                static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
     const long neg_one = (long) -1, const_zero = (long) 0;
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
@@ -8794,7 +16709,7 @@ raise_neg_overflow:
 }
 
 /* FastTypeChecks */
-  #if CYTHON_COMPILING_IN_CPYTHON
+                #if CYTHON_COMPILING_IN_CPYTHON
 static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
     while (a) {
         a = a->tp_base;
@@ -8866,7 +16781,7 @@ static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObj
 #endif
 
 /* CheckBinaryVersion */
-  static int __Pyx_check_binary_version(void) {
+                static int __Pyx_check_binary_version(void) {
     char ctversion[4], rtversion[4];
     PyOS_snprintf(ctversion, 4, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
     PyOS_snprintf(rtversion, 4, "%s", Py_GetVersion());
@@ -8881,8 +16796,45 @@ static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObj
     return 0;
 }
 
+/* FunctionExport */
+                static int __Pyx_ExportFunction(const char *name, void (*f)(void), const char *sig) {
+    PyObject *d = 0;
+    PyObject *cobj = 0;
+    union {
+        void (*fp)(void);
+        void *p;
+    } tmp;
+    d = PyObject_GetAttrString(__pyx_m, (char *)"__pyx_capi__");
+    if (!d) {
+        PyErr_Clear();
+        d = PyDict_New();
+        if (!d)
+            goto bad;
+        Py_INCREF(d);
+        if (PyModule_AddObject(__pyx_m, (char *)"__pyx_capi__", d) < 0)
+            goto bad;
+    }
+    tmp.fp = f;
+#if PY_VERSION_HEX >= 0x02070000
+    cobj = PyCapsule_New(tmp.p, sig, 0);
+#else
+    cobj = PyCObject_FromVoidPtrAndDesc(tmp.p, (void *)sig, 0);
+#endif
+    if (!cobj)
+        goto bad;
+    if (PyDict_SetItemString(d, name, cobj) < 0)
+        goto bad;
+    Py_DECREF(cobj);
+    Py_DECREF(d);
+    return 0;
+bad:
+    Py_XDECREF(cobj);
+    Py_XDECREF(d);
+    return -1;
+}
+
 /* InitStrings */
-  static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
+                static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
     while (t->p) {
         #if PY_MAJOR_VERSION < 3
         if (t->is_unicode) {
@@ -1,5 +1,7 @@
 from mpfmc.core.audio.sdl2 cimport *
 from mpfmc.core.audio.gstreamer cimport *
+from mpfmc.core.audio.dsp cimport *
+from mpfmc.core.audio.perf_counters cimport *
 
 
 # ---------------------------------------------------------------------------
@@ -14,7 +16,7 @@ cdef enum:
     MAX_SIMULTANEOUS_SOUNDS_DEFAULT = 8
 
 cdef enum:
-    MAX_SIMULTANEOUS_SOUNDS_LIMIT = 32
+    MAX_SIMULTANEOUS_SOUNDS_LIMIT = 64
 
 
 cdef enum TrackStatus:
@@ -40,9 +42,16 @@ ctypedef struct TrackState:
     Uint32 fade_steps_remaining
     int buffer_size
     Uint8 *buffer
+    Sint32 *mix_buffer
+    Sint32 mix_gain
+    float *float_buffer
+    DspChain *inserts
     GSList *notification_messages
     bint ducking_is_active
     GArray* ducking_control_points
+    PerfRingBuffer mix_time
+    Uint32 active_sound_players
+    Uint64 streaming_underruns
 
 
 # ---------------------------------------------------------------------------
@@ -58,6 +67,7 @@ cdef class Track:
     cdef object mc
     cdef SDL_AudioDeviceID device_id
     cdef object log
+    cdef list _inserts
 
     # Track attributes need to be stored in a C struct in order for them to be accessible in
     # the SDL callback functions without the GIL (for performance reasons).  The TrackState
@@ -65,6 +75,7 @@ cdef class Track:
     cdef TrackState *state
 
     cdef TrackState *get_state(self)
+    cdef GSList *take_notification_messages(self)
 
     # ---------------------------------------------------------------------------
     #    Static C functions designed to be called from the static audio callback
@@ -73,3 +84,14 @@ cdef class Track:
     @staticmethod
     cdef void mix_track_to_output(TrackState *track, AudioCallbackData* callback_data,
                                   Uint8 *output_buffer, Uint32 buffer_length) nogil
+
+    @staticmethod
+    cdef void mix_track_tail_to_output(TrackState *track, AudioCallbackData* callback_data,
+                                       Uint32 buffer_length) nogil
+
+
+# ---------------------------------------------------------------------------
+#    DSP insert chain functions
+# ---------------------------------------------------------------------------
+cdef DspChain *create_dsp_chain(list inserts, int sample_rate, int channels) except NULL
+cdef void free_dsp_chain(DspChain *chain)
@@ -3,13 +3,23 @@
 
 from cpython.mem cimport PyMem_Malloc, PyMem_Realloc, PyMem_Free
 cimport cpython.pycapsule as pycapsule
+from libc.string cimport memset
+from math import ceil, cos, exp, log10, pi, pow, sin, sqrt
 import logging
 
 from mpfmc.core.audio.sdl2 cimport *
 from mpfmc.core.audio.gstreamer cimport *
 from mpfmc.core.audio.inline cimport lerpU8, in_out_quad
+from mpfmc.core.audio.mixer cimport *
+from mpfmc.core.audio.dsp cimport *
 from mpfmc.core.audio.notification_message cimport *
 from mpfmc.core.audio.track cimport *
+from mpfmc.core.audio.audio_exception import AudioException
+
+
+# Reverb delay line lengths (in samples at 44.1 kHz, scaled to the actual sample rate)
+REVERB_COMB_TUNINGS = (1116, 1188, 1277, 1356)
+REVERB_ALLPASS_TUNINGS = (556, 441)
 
 
 # ---------------------------------------------------------------------------
@@ -43,6 +53,7 @@ cdef class Track:
         self._events_when_stopped = None
         self._events_when_played = None
         self._events_when_paused = None
+        self._inserts = list()
 
         # Allocate memory for the track state (common among all track types)
         self.state = <TrackState*> PyMem_Malloc(sizeof(TrackState))
@@ -51,6 +62,10 @@ cdef class Track:
         self.state.number = track_num
         self.state.buffer = <Uint8 *>PyMem_Malloc(buffer_size)
         self.state.buffer_size = buffer_size
+        self.state.mix_buffer = NULL
+        self.state.mix_gain = 0
+        self.state.float_buffer = NULL
+        self.state.inserts = NULL
         self.state.ducking_control_points = g_array_sized_new(False, True, sizeof(guint8), CONTROL_POINTS_PER_BUFFER)
         self.log.debug("Allocated track audio buffer (%d bytes)", buffer_size)
 
@@ -59,6 +74,13 @@ cdef class Track:
         # pointer in a Python object. It can be extracted using PyCapsule_GetPointer.
         self.state.callback_data = <AudioCallbackData*>pycapsule.PyCapsule_GetPointer(audio_callback_data, NULL)
 
+        # 32-bit accumulator used by the mixing kernel (one entry per 16-bit sample in the track buffer)
+        self.state.mix_buffer = <Sint32 *>PyMem_Malloc((buffer_size // self.state.callback_data.bytes_per_sample) * sizeof(Sint32))
+
+        # Floating-point track buffer (only needed when the floating-point mix bus is enabled)
+        if self.state.callback_data.float_mix_bus:
+            self.state.float_buffer = <float *>PyMem_Malloc((buffer_size // self.state.callback_data.bytes_per_sample) * sizeof(float))
+
         self.state.status = track_status_playing
         self.state.fade_steps = 0
         self.state.fade_steps_remaining = 0
@@ -70,10 +92,19 @@ cdef class Track:
 
         self.state.notification_messages = NULL
 
+        # Performance counters
+        perf_ring_buffer_reset(&self.state.mix_time)
+        self.state.active_sound_players = 0
+        self.state.streaming_underruns = 0
+
     def __dealloc__(self):
         """Destructor"""
         SDL_LockAudio()
         g_array_free(self.state.ducking_control_points, True)
+        free_dsp_chain(self.state.inserts)
+        PyMem_Free(self.state.float_buffer)
+        PyMem_Free(self.state.mix_buffer)
+        PyMem_Free(self.state.buffer)
         PyMem_Free(self.state)
         SDL_UnlockAudio()
 
@@ -83,6 +114,18 @@ cdef class Track:
     cdef TrackState *get_state(self):
         return self.state
 
+    cdef GSList *take_notification_messages(self):
+        """
+        Takes all pending notification messages from the track without locking the audio thread.
+        Returns:
+            A GSList of notification messages (in the order they were posted) that must be freed
+            by the caller, or NULL if there are no pending messages.
+        """
+        if self.state.notification_messages == NULL:
+            return NULL
+
+        return g_slist_reverse(<GSList*>SDL_AtomicSetPtr(<void**>&self.state.notification_messages, NULL))
+
     property name:
         def __get__(self):
             return self._name
@@ -155,6 +198,63 @@ cdef class Track:
             SDL_UnlockAudio()
         return fading
 
+    @property
+    def inserts(self):
+        """Return the list of DSP insert settings applied to the track (in processing order)"""
+        return self._inserts
+
+    def set_inserts(self, list inserts not None):
+        """
+        Sets the DSP insert chain applied to the track (requires the floating-point mix bus).
+        Args:
+            inserts: A list of insert settings dictionaries (in processing order)
+        """
+        cdef DspChain *new_chain = NULL
+        cdef DspChain *old_chain
+
+        if not self.state.callback_data.float_mix_bus:
+            raise AudioException("Could not set inserts on '{}' track - DSP inserts require the "
+                                 "floating-point mix bus".format(self._name))
+
+        if inserts:
+            new_chain = create_dsp_chain(inserts,
+                                         self.state.callback_data.sample_rate,
+                                         self.state.callback_data.channels)
+
+        SDL_LockAudio()
+        old_chain = self.state.inserts
+        self.state.inserts = new_chain
+        SDL_UnlockAudio()
+
+        free_dsp_chain(old_chain)
+        self._inserts = list(inserts)
+        self.log.debug("set_inserts - %d insert(s) applied to the track", len(inserts))
+
+    def get_performance_counters(self, bint reset=False):
+        """
+        Returns the track performance counters.
+        Args:
+            reset: Whether or not to reset the counters once they have been read
+
+        Returns:
+            A dictionary containing the time (in microseconds) needed to mix the track sounds
+            in recent audio callbacks ('mix_time'), the number of sound players active in the
+            last callback ('active_sound_players') and the number of times a streaming sound
+            did not have any samples ready ('streaming_underruns').
+        """
+        SDL_LockAudio()
+        counters = {
+            "mix_time": perf_ring_buffer_summary(&self.state.mix_time),
+            "active_sound_players": self.state.active_sound_players,
+            "streaming_underruns": self.state.streaming_underruns,
+        }
+        if reset:
+            perf_ring_buffer_reset(&self.state.mix_time)
+            self.state.streaming_underruns = 0
+        SDL_UnlockAudio()
+
+        return counters
+
     def clear_context(self, context):
         """Stop all sounds played from the specified context."""
         raise NotImplementedError('Must be overridden in derived class')
@@ -338,33 +438,39 @@ cdef class Track:
     cdef void mix_track_to_output(TrackState *track, AudioCallbackData* callback_data,
                                   Uint8 *output_buffer, Uint32 buffer_length) nogil:
         """
-        Applies ducking and mixes a track buffer into the master audio output buffer.
+        Applies ducking and mixes a track buffer into the master audio accumulator buffer (or
+        into the floating-point master bus, after processing the track insert chain, when the
+        floating-point mix bus is enabled).
         Args:
             track: The track's state structure
             callback_data: The audio callback data structure
-            output_buffer: The master audio output buffer.
+            output_buffer: The master audio output buffer (unused, the track is mixed into
+                the master accumulator which is saturated into the output buffer once all
+                tracks have been mixed).
             buffer_length: The audio buffer size to process.
     
         """
 
-        cdef Uint8 *track_buffer
+        cdef Sint16 *track_buffer
         cdef Uint32 output_buffer_bytes_remaining = buffer_length
         cdef Uint32 current_chunk_bytes
+        cdef Uint32 current_chunk_samples
         cdef Uint32 buffer_pos = 0
         cdef Uint8 control_point = 0
         cdef Uint8 ducking_volume
-        cdef Uint8 track_volume
+        cdef Sint32 target_gain
 
         if track == NULL or track.status == track_status_stopped or track.status == track_status_paused:
             return
 
-        track_buffer = <Uint8*>track.buffer
+        track_buffer = <Sint16*>track.buffer
 
         # Loop over output buffer at control rate
         while output_buffer_bytes_remaining > 0:
 
             # Determine the number of bytes to process in the current chunk
             current_chunk_bytes = min(output_buffer_bytes_remaining, callback_data.bytes_per_control_point)
+            current_chunk_samples = current_chunk_bytes // callback_data.bytes_per_sample
 
             # Apply any ducking to the track
             if track.ducking_is_active and control_point < CONTROL_POINTS_PER_BUFFER:
@@ -389,10 +495,228 @@ cdef class Track:
                     track.status = track_status_paused
                     send_track_paused_notification(track)
 
-            track_volume = ducking_volume * track.fade_volume_current // SDL_MIX_MAXVOLUME
-
-            SDL_MixAudioFormat(output_buffer + buffer_pos, track_buffer + buffer_pos, callback_data.format, current_chunk_bytes, track_volume)
+            if callback_data.float_mix_bus:
+                # Combined ducking and track volume as a Q16 gain (the two 7-bit volumes multiplied
+                # together are a 14-bit value).  Master volume is applied to the master bus.
+                target_gain = (<Sint32>ducking_volume * track.fade_volume_current) << 2
+
+                # Convert to floating-point samples, ramping from the gain used at the end of the
+                # previous chunk to avoid zipper noise
+                s16_to_float(track.float_buffer + buffer_pos // callback_data.bytes_per_sample,
+                             track_buffer + buffer_pos // callback_data.bytes_per_sample,
+                             current_chunk_samples,
+                             track.mix_gain / <float>MIXER_UNITY_GAIN,
+                             gain_step(track.mix_gain, target_gain, current_chunk_samples) / <float>MIXER_UNITY_GAIN)
+            else:
+                # Combined ducking, track and master volume as a Q16 gain (the three 7-bit volumes
+                # multiplied together are a 21-bit value).
+                target_gain = (<Sint32>ducking_volume * track.fade_volume_current * callback_data.master_volume) >> 5
+
+                # Ramp from the gain used at the end of the previous chunk to avoid zipper noise
+                mix_s16_to_accumulator(callback_data.mix_buffer + buffer_pos // callback_data.bytes_per_sample,
+                                       track_buffer + buffer_pos // callback_data.bytes_per_sample,
+                                       current_chunk_samples,
+                                       track.mix_gain,
+                                       gain_step(track.mix_gain, target_gain, current_chunk_samples))
+            track.mix_gain = target_gain
 
             output_buffer_bytes_remaining -= current_chunk_bytes
             buffer_pos += current_chunk_bytes
             control_point += 1
+
+        # Run the track insert chain and mix the track into the floating-point master bus
+        if callback_data.float_mix_bus:
+            process_dsp_chain(track.inserts, track.float_buffer,
+                              buffer_length // (callback_data.bytes_per_sample * callback_data.channels),
+                              callback_data.channels)
+            mix_float_to_float(callback_data.float_mix_buffer, track.float_buffer,
+                               buffer_length // callback_data.bytes_per_sample)
+
+            # The insert chain keeps ringing (reverb) once the track stops producing audio
+            if track.inserts != NULL:
+                track.inserts.tail_frames_remaining = track.inserts.tail_frames
+
+    @staticmethod
+    cdef void mix_track_tail_to_output(TrackState *track, AudioCallbackData* callback_data,
+                                       Uint32 buffer_length) nogil:
+        """
+        Runs the track insert chain on silence and mixes its output into the floating-point
+        master bus.  Called for tracks that are not active (stopped, paused, or no sounds
+        playing) so the tail of a reverb insert decays instead of being cut off.
+        Args:
+            track: The track's state structure
+            callback_data: The audio callback data structure
+            buffer_length: The audio buffer size to process.
+        """
+        cdef Uint32 frames = buffer_length // (callback_data.bytes_per_sample * callback_data.channels)
+
+        if track == NULL or track.inserts == NULL or track.inserts.tail_frames_remaining == 0:
+            return
+
+        memset(track.float_buffer, 0, (buffer_length // callback_data.bytes_per_sample) * sizeof(float))
+        process_dsp_chain(track.inserts, track.float_buffer, frames, callback_data.channels)
+        mix_float_to_float(callback_data.float_mix_buffer, track.float_buffer,
+                           buffer_length // callback_data.bytes_per_sample)
+
+        if track.inserts.tail_frames_remaining > frames:
+            track.inserts.tail_frames_remaining -= frames
+        else:
+            track.inserts.tail_frames_remaining = 0
+
+
+# ---------------------------------------------------------------------------
+#    DSP insert chain functions
+# ---------------------------------------------------------------------------
+cdef DspChain *create_dsp_chain(list inserts, int sample_rate, int channels) except NULL:
+    """
+    Creates a DSP insert chain from a list of insert settings.
+    Args:
+        inserts: A list of insert settings dictionaries (in processing order)
+        sample_rate: The audio sample rate
+        channels: The number of audio channels
+
+    Returns:
+        A pointer to the newly allocated insert chain (must be freed using free_dsp_chain)
+    """
+    cdef DspChain *chain
+    cdef DspInsert *insert
+    cdef int index, delay
+    cdef Uint32 total_length, longest_comb
+
+    if len(inserts) > DSP_MAX_INSERTS:
+        raise AudioException("Too many DSP inserts ({}), the maximum is {}".format(len(inserts), DSP_MAX_INSERTS))
+
+    chain = <DspChain*>PyMem_Malloc(sizeof(DspChain))
+    if chain == NULL:
+        raise MemoryError()
+
+    memset(chain, 0, sizeof(DspChain))
+
+    for settings in inserts:
+        insert = &chain.inserts[chain.insert_count]
+        chain.insert_count += 1
+
+        if settings['type'] == 'eq':
+            insert.type = dsp_insert_biquad
+            try:
+                _set_biquad_coefficients(&insert.biquad, settings, sample_rate)
+            except Exception:
+                free_dsp_chain(chain)
+                raise
+
+        elif settings['type'] == 'limiter':
+            insert.type = dsp_insert_limiter
+            insert.limiter.threshold = settings['threshold']
+            insert.limiter.release_coefficient = exp(-1.0 / (max(settings['release'], 0.001) * sample_rate))
+            insert.limiter.gain = 1.0
+
+        elif settings['type'] == 'reverb':
+            insert.type = dsp_insert_reverb
+            insert.reverb.feedback = settings['room_size'] * 0.28 + 0.7
+            insert.reverb.damping = settings['damping'] * 0.4
+            insert.reverb.wet = settings['wet']
+            insert.reverb.dry = settings['dry']
+
+            # Scale the delay line lengths to the sample rate and allocate all of them in one block
+            total_length = 0
+            for index in range(DSP_REVERB_COMB_COUNT):
+                insert.reverb.comb_lengths[index] = max(1, REVERB_COMB_TUNINGS[index] * sample_rate // 44100)
+                total_length += insert.reverb.comb_lengths[index]
+            for index in range(DSP_REVERB_ALLPASS_COUNT):
+                insert.reverb.allpass_lengths[index] = max(1, REVERB_ALLPASS_TUNINGS[index] * sample_rate // 44100)
+                total_length += insert.reverb.allpass_lengths[index]
+
+            insert.reverb.delay_memory = <float*>PyMem_Malloc(total_length * sizeof(float))
+            if insert.reverb.delay_memory == NULL:
+                free_dsp_chain(chain)
+                raise MemoryError()
+            memset(insert.reverb.delay_memory, 0, total_length * sizeof(float))
+
+            delay = 0
+            for index in range(DSP_REVERB_COMB_COUNT):
+                insert.reverb.comb_buffers[index] = insert.reverb.delay_memory + delay
+                delay += insert.reverb.comb_lengths[index]
+            for index in range(DSP_REVERB_ALLPASS_COUNT):
+                insert.reverb.allpass_buffers[index] = insert.reverb.delay_memory + delay
+                delay += insert.reverb.allpass_lengths[index]
+
+            # The tail lasts until the longest comb filter has decayed by 60 dB
+            longest_comb = 0
+            for index in range(DSP_REVERB_COMB_COUNT):
+                longest_comb = max(longest_comb, insert.reverb.comb_lengths[index])
+            chain.tail_frames += <Uint32>ceil(longest_comb * 3.0 / -log10(insert.reverb.feedback))
+            for index in range(DSP_REVERB_ALLPASS_COUNT):
+                chain.tail_frames += insert.reverb.allpass_lengths[index]
+
+        else:
+            free_dsp_chain(chain)
+            raise AudioException("Unknown DSP insert type '{}'".format(settings['type']))
+
+    return chain
+
+cdef void free_dsp_chain(DspChain *chain):
+    """
+    Frees a DSP insert chain (and any memory allocated by its inserts).
+    Args:
+        chain: The insert chain to free (may be NULL)
+    """
+    cdef int index
+
+    if chain == NULL:
+        return
+
+    for index in range(chain.insert_count):
+        if chain.inserts[index].type == dsp_insert_reverb:
+            PyMem_Free(chain.inserts[index].reverb.delay_memory)
+
+    PyMem_Free(chain)
+
+cdef _set_biquad_coefficients(BiquadSettings *biquad, dict settings, int sample_rate):
+    """
+    Calculates normalized biquad filter coefficients (see the Audio EQ Cookbook by Robert
+    Bristow-Johnson).
+    Args:
+        biquad: The biquad settings to update
+        settings: The EQ insert settings dictionary (filter, frequency, q, and gain in dB)
+        sample_rate: The audio sample rate
+    """
+    frequency = min(max(settings['frequency'], 1.0), sample_rate * 0.49)
+    a = pow(10.0, settings['gain'] / 40.0)
+    w0 = 2.0 * pi * frequency / sample_rate
+    cos_w0 = cos(w0)
+    alpha = sin(w0) / (2.0 * max(settings['q'], 0.01))
+    filter_type = settings['filter']
+
+    if filter_type == 'lowpass':
+        b0, b1, b2 = (1.0 - cos_w0) / 2.0, 1.0 - cos_w0, (1.0 - cos_w0) / 2.0
+        a0, a1, a2 = 1.0 + alpha, -2.0 * cos_w0, 1.0 - alpha
+    elif filter_type == 'highpass':
+        b0, b1, b2 = (1.0 + cos_w0) / 2.0, -(1.0 + cos_w0), (1.0 + cos_w0) / 2.0
+        a0, a1, a2 = 1.0 + alpha, -2.0 * cos_w0, 1.0 - alpha
+    elif filter_type == 'peak':
+        b0, b1, b2 = 1.0 + alpha * a, -2.0 * cos_w0, 1.0 - alpha * a
+        a0, a1, a2 = 1.0 + alpha / a, -2.0 * cos_w0, 1.0 - alpha / a
+    elif filter_type == 'lowshelf':
+        shelf = 2.0 * sqrt(a) * alpha
+        b0 = a * ((a + 1.0) - (a - 1.0) * cos_w0 + shelf)
+        b1 = 2.0 * a * ((a - 1.0) - (a + 1.0) * cos_w0)
+        b2 = a * ((a + 1.0) - (a - 1.0) * cos_w0 - shelf)
+        a0 = (a + 1.0) + (a - 1.0) * cos_w0 + shelf
+        a1 = -2.0 * ((a - 1.0) + (a + 1.0) * cos_w0)
+        a2 = (a + 1.0) + (a - 1.0) * cos_w0 - shelf
+    elif filter_type == 'highshelf':
+        shelf = 2.0 * sqrt(a) * alpha
+        b0 = a * ((a + 1.0) + (a - 1.0) * cos_w0 + shelf)
+        b1 = -2.0 * a * ((a - 1.0) + (a + 1.0) * cos_w0)
+        b2 = a * ((a + 1.0) + (a - 1.0) * cos_w0 - shelf)
+        a0 = (a + 1.0) - (a - 1.0) * cos_w0 + shelf
+        a1 = 2.0 * ((a - 1.0) - (a + 1.0) * cos_w0)
+        a2 = (a + 1.0) - (a - 1.0) * cos_w0 - shelf
+    else:
+        raise AudioException("Unknown EQ filter type '{}'".format(filter_type))
+
+    biquad.b0 = b0 / a0
+    biquad.b1 = b1 / a0
+    biquad.b2 = b2 / a0
+    biquad.a1 = a1 / a0
+    biquad.a2 = a2 / a0
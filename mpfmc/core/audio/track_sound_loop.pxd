@@ -10,6 +10,7 @@ from mpfmc.core.audio.notification_message cimport *
 # ---------------------------------------------------------------------------
 cdef enum:
     do_not_stop_loop = 0xFFFFFFFF
+    stream_pos_unknown = 0xFFFFFFFF
 
 cdef enum LayerStatus:
     layer_stopped = 0
@@ -17,10 +18,12 @@ cdef enum LayerStatus:
     layer_playing = 2
     layer_fading_in = 3
     layer_fading_out = 4
+    layer_scheduled = 5
 
 ctypedef struct SoundLoopLayerSettings:
     LayerStatus status
     SoundSample *sound
+    Uint32 length
     Uint8 volume
     long sound_loop_set_id
     Uint64 sound_id
@@ -30,6 +33,11 @@ ctypedef struct SoundLoopLayerSettings:
     bint looping
     Uint8 marker_count
     GArray *markers
+    Uint64 start_sample
+    Uint32 stream_pos           # Streaming sounds: position of the next bytes read from the stream
+    Uint8 *stream_head          # Streaming sounds: cache of the beginning of the sound
+    Uint32 stream_head_size
+    Uint32 stream_head_filled
 
 cdef enum SoundLoopSetPlayerStatus:
     # Enumeration of the possible sound loop set player status values.
@@ -46,6 +54,7 @@ ctypedef struct SoundLoopSetPlayer:
     GSList *layers     # An array of SoundLoopLayerSettings objects
     Uint32 sample_pos
     Uint32 stop_loop_at_pos
+    Uint64 start_sample
     float tempo
 
 ctypedef struct TrackSoundLoopState:
@@ -68,11 +77,19 @@ cdef class TrackSoundLoop(Track):
     cdef TrackSoundLoopState *type_state
     cdef long _sound_loop_set_counter
     cdef dict _active_sound_loop_sets
+    cdef object _pending_sound_loop_set
 
     cdef process_notification_message(self, NotificationMessageContainer *notification_message)
 
     cdef _initialize_player(self, SoundLoopSetPlayer *player)
     cdef _apply_layer_settings(self, SoundLoopLayerSettings *layer, dict layer_settings)
+    cdef _set_layer_sound(self, SoundLoopLayerSettings *layer, object sound)
+    cdef _cue_layer(self, SoundLoopLayerSettings *layer, Uint32 sample_pos)
+    cdef _pause_layer(self, SoundLoopLayerSettings *layer)
+    cdef _pause_streaming_layers(self, SoundLoopSetPlayer *player)
+    cdef bint _is_sound_in_use(self, Uint64 sound_id)
+    cdef Uint32 _get_layer_memory(self, SoundLoopLayerSettings *layer)
+    cdef Uint32 _get_player_memory(self, SoundLoopSetPlayer *player)
     cdef _reset_layer(self, SoundLoopLayerSettings *layer)
     cdef _reset_player_layers(self, SoundLoopSetPlayer *player)
     cdef inline Uint32 _round_sample_pos_up_to_interval(self, Uint32 sample_pos, Uint32 interval)
@@ -82,3 +99,9 @@ cdef class TrackSoundLoop(Track):
 
 
 cdef SoundLoopLayerSettings *_create_sound_loop_layer_settings() nogil
+cdef Uint32 get_active_layer_count(SoundLoopSetPlayer *player) nogil
+cdef void mix_layer_samples(TrackState *track, SoundLoopLayerSettings *layer, Uint32 sample_pos,
+                            Uint32 track_buffer_pos, Uint32 length, int volume,
+                            AudioCallbackData *callback_data) nogil
+cdef void seek_streaming_layer(SoundLoopLayerSettings *layer, Uint32 sample_pos,
+                               AudioCallbackData *callback_data) nogil
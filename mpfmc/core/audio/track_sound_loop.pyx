@@ -2,10 +2,12 @@
 #cython: embedsignature=True, language_level=3
 
 from libc.stdio cimport FILE, fopen, fprintf, sprintf, fflush, fclose
+from libc.string cimport memcpy
 from cpython.mem cimport PyMem_Malloc, PyMem_Realloc, PyMem_Free
 cimport cpython.pycapsule as pycapsule
 import cython
 import logging
+from functools import partial
 from math import ceil, floor
 
 from mpfmc.core.audio.sdl2 cimport *
@@ -14,8 +16,13 @@ from mpfmc.core.audio.track cimport *
 from mpfmc.core.audio.inline cimport in_out_quad
 from mpfmc.core.audio.notification_message cimport *
 from mpfmc.core.audio.track_sound_loop cimport *
+from mpfmc.core.audio.sound_file cimport *
 from mpfmc.core.audio.audio_exception import AudioException
 
+# The length of the beginning of streaming layer sounds that is cached in memory (secs).  The cached
+# samples are played while the stream seeks back to continue after them when the loop starts over.
+STREAMING_LAYER_CACHE_TIME = 1.0
+
 
 # ---------------------------------------------------------------------------
 #    TrackSoundLoop class
@@ -62,6 +69,7 @@ cdef class TrackSoundLoop(Track):
 
         self._sound_loop_set_counter = 0
         self._active_sound_loop_sets = dict()
+        self._pending_sound_loop_set = None
 
         self.log.debug("Created Track %d %s", self.number, self.name)
 
@@ -103,7 +111,7 @@ cdef class TrackSoundLoop(Track):
     @property
     def supports_streaming_sounds(self):
         """Return whether or not track accepts streaming sounds"""
-        return False
+        return True
 
     cdef _initialize_player(self, SoundLoopSetPlayer *player):
         """Initializes a SoundLoopSetPlayer struct."""
@@ -112,6 +120,7 @@ cdef class TrackSoundLoop(Track):
             player.length = 0
             player.master_sound_layer.status = layer_playing
             player.master_sound_layer.sound = NULL
+            player.master_sound_layer.length = 0
             player.master_sound_layer.volume = 0
             player.master_sound_layer.sound_loop_set_id = 0
             player.master_sound_layer.sound_id = 0
@@ -121,9 +130,14 @@ cdef class TrackSoundLoop(Track):
             player.master_sound_layer.looping = True
             player.master_sound_layer.marker_count = 0
             player.master_sound_layer.markers = NULL
+            player.master_sound_layer.stream_pos = stream_pos_unknown
+            player.master_sound_layer.stream_head = NULL
+            player.master_sound_layer.stream_head_size = 0
+            player.master_sound_layer.stream_head_filled = 0
             player.layers = NULL
             player.sample_pos = 0
             player.stop_loop_at_pos = do_not_stop_loop
+            player.start_sample = 0
 
     def stop_all_sounds(self, float fade_out_seconds = 0.0):
         """
@@ -176,34 +190,30 @@ cdef class TrackSoundLoop(Track):
         pass
 
     def process(self):
-        """Processes track messages each tick."""
-
-        # Lock the mutex to ensure no audio data is changed during the playback processing
-        # (multi-threaded protection)
-        SDL_LockAudio()
+        """Processes any pending track notification messages."""
 
-        # Process track notification messages
-        if self.state.notification_messages != NULL:
-            self.state.notification_messages = g_slist_reverse(self.state.notification_messages)
-            iterator = self.state.notification_messages
-            while iterator != NULL:
-                self.process_notification_message(<NotificationMessageContainer*>iterator.data)
-                g_slice_free1(sizeof(NotificationMessageContainer), iterator.data)
-                iterator = iterator.next
+        cdef GSList *notification_messages
+        cdef GSList *iterator
 
-            g_slist_free(self.state.notification_messages)
-            self.state.notification_messages = NULL
+        # Process track notification messages (the message list is taken without locking the
+        # audio thread, the lock is only taken while each message is processed)
+        notification_messages = self.take_notification_messages()
+        iterator = notification_messages
+        while iterator != NULL:
+            self.process_notification_message(<NotificationMessageContainer*>iterator.data)
+            g_slice_free1(sizeof(NotificationMessageContainer), iterator.data)
+            iterator = iterator.next
 
-        # Unlock the mutex since we are done accessing the audio data
-        SDL_UnlockAudio()
+        g_slist_free(notification_messages)
 
     cdef process_notification_message(self, NotificationMessageContainer *notification_message):
         """Process a notification message to this track"""
+        cdef SoundLoopSetPlayer *player
 
         if notification_message == NULL:
             return
 
-        SDL_LockAudio()
+        perf_lock_audio(self.state.callback_data)
 
         # Check for track notification messages first (they do not need sound instance information)
         if notification_message.message in (notification_track_stopped, notification_track_paused):
@@ -257,6 +267,13 @@ cdef class TrackSoundLoop(Track):
                 self.log.debug("Removing sound_loop_set settings %d from active list", notification_message.data.sound_loop_set.id)
                 del self._active_sound_loop_sets[notification_message.data.sound_loop_set.id]
 
+                # Streaming sounds of the stopped sound loop set no longer need to be decoded
+                for player_num in range(2):
+                    player = self.type_state.current if player_num == 0 else self.type_state.next
+                    if player.status == player_idle and \
+                            player.master_sound_layer.sound_loop_set_id == notification_message.data.sound_loop_set.id:
+                        self._pause_streaming_layers(player)
+
             elif notification_message.message == notification_sound_loop_set_looping:
                 if sound_loop_set_settings['events_when_looping'] is not None:
                     for event in sound_loop_set_settings['events_when_looping']:
@@ -297,6 +314,7 @@ cdef class TrackSoundLoop(Track):
         """
         cdef SoundLoopSetPlayer *player
         cdef SoundLoopLayerSettings *layer
+        cdef GSList *layer_iterator
         cdef bint player_already_playing = False
 
         self.log.debug("play_sound_loop_set - Preparing sound_loop_set '%s' for playback.", sound_loop_set)
@@ -316,6 +334,7 @@ cdef class TrackSoundLoop(Track):
         player_settings.setdefault('timing', 'loop_end')
         player_settings.setdefault('interval', 1)
         player_settings.setdefault('synchronize', False)
+        player_settings.setdefault('start_sample', None)
         player_settings['sound'] = sound_loop_set['sound']
         player_settings['context'] = context
 
@@ -326,22 +345,47 @@ cdef class TrackSoundLoop(Track):
                            "not be located, could not play loop set", player_settings['sound'])
             return
 
-        if not self.mc.sounds[player_settings['sound']].loaded:
-            self.log.error("play_sound_loop_set - sound %s in sound_loop_set was "
-                           "not loaded, could not play loop set", player_settings['sound'])
+        # A sound loop set is played once its master sound has been loaded (the sound is loaded
+        # now if necessary, along with the layer sounds).  A loop set queued until the end of the
+        # current loop is therefore ready at the first loop boundary after it has been loaded.
+        # The container of the sound is checked as the sound is not flagged as loaded until all
+        # its load callbacks (including the one playing the loop set) have been called.
+        sound = self.mc.sounds[player_settings['sound']]
+        if sound.container is None:
+            self.log.debug("play_sound_loop_set - sound %s in sound_loop_set is not loaded, "
+                           "the loop set will be played once it has been loaded", player_settings['sound'])
+            request = partial(self.play_sound_loop_set, sound_loop_set, context, player_settings)
+            self._pending_sound_loop_set = request
+            sound.load(callback=partial(self._on_sound_loop_set_sound_loaded, request))
+
+            for layer_settings in sound_loop_set['layers']:
+                layer_sound = self.mc.sounds[layer_settings['sound']]
+                if layer_sound.container is None and not layer_sound.loading:
+                    layer_sound.load()
             return
 
+        self._pending_sound_loop_set = None
+
         SDL_LockAudio()
 
+        # The 'sample' timing starts the loop set at an audio clock sample position (a position
+        # that has already been reached starts the loop set now)
+        timing = player_settings['timing']
+        if timing == 'sample' and (player_settings['start_sample'] is None or
+                                   player_settings['start_sample'] <= self.state.callback_data.sample_clock):
+            timing = 'now'
+
         # Determine current track player status so we can determine what action(s) should be
         # taken to play the requested loop set.  There should never be a situation where the
         # current player is idle while the next one is playing.
-        if self.type_state.current.status == player_idle:
+        if self.type_state.current.status in (player_idle, player_pending):
 
-            # The current player is idle.  This is the simplest case as the queue and
-            # synchronize settings can be ignored as we simply start playing the requested
-            # loop set immediately on the current player.
+            # The current player is idle (or waiting to start at a sample position, in which case
+            # it is replaced).  This is the simplest case as the queue and synchronize settings can
+            # be ignored as we simply start playing the requested loop set on the current player.
             player = self.type_state.current
+            if player.status == player_pending and player.master_sound_layer.sound_loop_set_id in self._active_sound_loop_sets:
+                del self._active_sound_loop_sets[player.master_sound_layer.sound_loop_set_id]
             self._reset_player_layers(player)
             player_already_playing = False
             player.stop_loop_at_pos = do_not_stop_loop
@@ -376,7 +420,7 @@ cdef class TrackSoundLoop(Track):
         if player_already_playing:
 
             # Determine if playing immediately or queuing until next loop
-            if player_settings['timing'] == 'loop_end':
+            if timing == 'loop_end':
                 # Queue until the end of the current loop
                 player.status = player_pending
                 player.sample_pos = player_settings['start_at'] * self.state.callback_data.seconds_to_bytes_factor
@@ -384,7 +428,7 @@ cdef class TrackSoundLoop(Track):
 
                 # print("play_sound_loop_set - loop_end")
 
-            elif player_settings['timing'] == 'next_time_interval':
+            elif timing == 'next_time_interval':
                 # Set currently playing sample to end at the next specified time interval multiple
                 player.status = player_pending
                 self.type_state.current.stop_loop_at_pos = self._round_sample_pos_up_to_interval(
@@ -402,7 +446,7 @@ cdef class TrackSoundLoop(Track):
 
                 # print("play_sound_loop_set - next_time_interval - sample_pos, stop_loop_at_pos, length:", self.type_state.current.sample_pos, self.type_state.current.stop_loop_at_pos, self.type_state.current.length)
 
-            elif player_settings['timing'] == 'next_beat_interval':
+            elif timing == 'next_beat_interval':
                 # Set currently playing sample to end at the next specified beat interval multiple
                 player.status = player_pending
                 self.type_state.current.stop_loop_at_pos = self._round_sample_pos_up_to_interval(
@@ -419,6 +463,21 @@ cdef class TrackSoundLoop(Track):
                 if self.type_state.current.stop_loop_at_pos < <Uint32>(0.01 * self.state.callback_data.seconds_to_bytes_factor):
                     self.type_state.current.stop_loop_at_pos = self.type_state.current.length
 
+            elif timing == 'sample':
+                # Set currently playing sample to end at the specified audio clock sample position (the
+                # position must fall within one loop length, positions further away are wrapped)
+                player.status = player_pending
+                stop_loop_at_pos = self.type_state.current.sample_pos + \
+                    (player_settings['start_sample'] - self.state.callback_data.sample_clock) * \
+                    self.state.callback_data.bytes_per_sample * self.state.callback_data.channels
+
+                if stop_loop_at_pos - self.type_state.current.sample_pos > self.type_state.current.length:
+                    self.log.warning("play_sound_loop_set - start_sample is more than one loop away, "
+                                     "the loop set will be started earlier than requested")
+
+                # Adjust currently playing sample end position to ensure it is within the sample
+                self.type_state.current.stop_loop_at_pos = (stop_loop_at_pos - 1) % self.type_state.current.length + 1
+
             else:
                 # Play now
 
@@ -445,7 +504,11 @@ cdef class TrackSoundLoop(Track):
                     player.status = player_playing
 
         else:
-            if player.master_sound_layer.fade_steps_remaining > 0:
+            if timing == 'sample':
+                # Wait until the audio clock reaches the start position (started by the audio callback)
+                player.status = player_pending
+                player.start_sample = player_settings['start_sample']
+            elif player.master_sound_layer.fade_steps_remaining > 0:
                 player.status = player_fading_in
             else:
                 player.status = player_playing
@@ -467,7 +530,7 @@ cdef class TrackSoundLoop(Track):
 
         # Determine master sound length
         if player.master_sound_layer.sound != NULL:
-            player.length = <Uint32>player.master_sound_layer.sound.data.memory.size
+            player.length = player.master_sound_layer.length
             player.tempo = player_settings['tempo']
 
             # Adjust sample position to ensure it is within the sample
@@ -479,7 +542,7 @@ cdef class TrackSoundLoop(Track):
             player.status = player_idle
 
         # Setup sound loop set layers
-        for layer_settings in sound_loop_set['layers']:
+        for layer_index, layer_settings in enumerate(sound_loop_set['layers']):
             layer = _create_sound_loop_layer_settings()
             self._apply_layer_settings(layer, layer_settings)
 
@@ -491,6 +554,27 @@ cdef class TrackSoundLoop(Track):
             # Append layer
             player.layers = g_slist_append(player.layers, layer)
 
+            # A layer sound that has not been loaded is loaded now, the layer is silent until
+            # the sound has been loaded
+            layer_sound = self.mc.sounds[layer_settings['sound']]
+            if layer_sound.container is None:
+                layer_sound.load(callback=partial(self._on_layer_sound_loaded,
+                                                  self._sound_loop_set_counter, layer_index))
+
+        # Streaming sounds seek to the start position and start decoding now so they are ready
+        # when the loop set starts
+        if player.status != player_idle:
+            self._cue_layer(&player.master_sound_layer, player.sample_pos)
+            layer_iterator = player.layers
+            while layer_iterator != NULL:
+                layer = <SoundLoopLayerSettings*>layer_iterator.data
+                if layer.status == layer_playing:
+                    self._cue_layer(layer, player.sample_pos)
+                layer_iterator = layer_iterator.next
+
+        self.log.debug("play_sound_loop_set - sound_loop_set uses %d bytes of memory",
+                       self._get_player_memory(player))
+
         # Send sound_loop_set started notification (if not pending/queued)
         if player.status not in (player_idle, player_pending):
             send_sound_loop_set_started_notification(player.master_sound_layer.sound_loop_set_id,
@@ -501,8 +585,6 @@ cdef class TrackSoundLoop(Track):
         SDL_UnlockAudio()
 
     cdef _apply_layer_settings(self, SoundLoopLayerSettings *layer, dict layer_settings):
-        cdef SoundFile sound_container
-
         if 'initial_state' not in layer_settings or layer_settings['initial_state'] == 'play':
             layer.status = layer_playing
         else:
@@ -513,15 +595,14 @@ cdef class TrackSoundLoop(Track):
         else:
             layer.sound_loop_set_id = 0
 
-        # Set layer sound
+        # Set layer sound (a sound that has not been loaded yet is set once it has been loaded)
         sound = self.mc.sounds[layer_settings['sound']]
-
-        # TODO: What to do when sound is not loaded?
-        # TODO: Perhaps load sounds and delay play until loaded?
-
-        sound_container = sound.container
-        layer.sound = cython.address(sound_container.sample)
         layer.sound_id = sound.id
+        layer.sound = NULL
+        layer.length = 0
+        layer.stream_pos = stream_pos_unknown
+        if sound.container is not None:
+            self._set_layer_sound(layer, sound)
 
         # By default, all layers will continue to loop when played
         layer.looping = True
@@ -543,6 +624,143 @@ cdef class TrackSoundLoop(Track):
                                         index,
                                         <guint>(sound.markers[index]['time'] * self.state.callback_data.seconds_to_bytes_factor))
 
+    cdef _set_layer_sound(self, SoundLoopLayerSettings *layer, object sound):
+        """Sets the (loaded) sound played by a layer.  A cache is allocated for the beginning
+        of a streaming sound."""
+        cdef SoundFile sound_container = sound.container
+        cdef Uint32 bytes_per_frame = self.state.callback_data.bytes_per_sample * self.state.callback_data.channels
+
+        layer.sound = cython.address(sound_container.sample)
+        layer.stream_pos = stream_pos_unknown
+        layer.stream_head_filled = 0
+
+        if layer.sound.type == sound_type_memory:
+            layer.length = <Uint32>layer.sound.data.memory.size
+        else:
+            layer.length = <Uint32>(layer.sound.duration * self.state.callback_data.seconds_to_bytes_factor) // bytes_per_frame * bytes_per_frame
+
+            if layer.stream_head != NULL:
+                PyMem_Free(layer.stream_head)
+            layer.stream_head_size = min(layer.length,
+                                         <Uint32>(STREAMING_LAYER_CACHE_TIME * self.state.callback_data.seconds_to_bytes_factor) // bytes_per_frame * bytes_per_frame)
+            layer.stream_head = <Uint8*>PyMem_Malloc(layer.stream_head_size)
+            if layer.stream_head == NULL:
+                layer.stream_head_size = 0
+
+    cdef _cue_layer(self, SoundLoopLayerSettings *layer, Uint32 sample_pos):
+        """Prepares a streaming layer to play from the specified position: the stream seeks ahead
+        of time and starts decoding so the samples are ready when the layer starts.  The stream
+        does not seek if the position is stream_pos_unknown."""
+        if layer == NULL or layer.sound == NULL or layer.sound.type != sound_type_streaming:
+            return
+
+        # The beginning of the sound is played from the cache (once it has been filled)
+        if sample_pos != stream_pos_unknown:
+            if sample_pos < layer.stream_head_filled:
+                sample_pos = layer.stream_head_filled
+            if sample_pos != layer.stream_pos:
+                seek_streaming_layer(layer, sample_pos, self.state.callback_data)
+
+        with nogil:
+            gst_element_set_state(layer.sound.data.stream.pipeline, GST_STATE_PLAYING)
+
+    cdef _pause_layer(self, SoundLoopLayerSettings *layer):
+        """Stops decoding the stream of a streaming layer (unless the sound is still played by
+        another layer)."""
+        if layer == NULL or layer.sound == NULL or layer.sound.type != sound_type_streaming or \
+                self._is_sound_in_use(layer.sound_id):
+            return
+
+        with nogil:
+            gst_element_set_state(layer.sound.data.stream.pipeline, GST_STATE_PAUSED)
+
+    cdef _pause_streaming_layers(self, SoundLoopSetPlayer *player):
+        """Stops decoding the streams of all the streaming layers of a sound loop set player."""
+        cdef GSList *iterator
+
+        self._pause_layer(&player.master_sound_layer)
+        iterator = player.layers
+        while iterator != NULL:
+            self._pause_layer(<SoundLoopLayerSettings*>iterator.data)
+            iterator = iterator.next
+
+    cdef bint _is_sound_in_use(self, Uint64 sound_id):
+        """Returns whether a sound is played by any layer of an active sound loop set player."""
+        cdef SoundLoopSetPlayer *player
+        cdef SoundLoopLayerSettings *layer
+        cdef GSList *iterator
+
+        for player_num in range(2):
+            player = self.type_state.current if player_num == 0 else self.type_state.next
+            if player.status == player_idle:
+                continue
+
+            if player.master_sound_layer.sound_id == sound_id:
+                return True
+
+            iterator = player.layers
+            while iterator != NULL:
+                layer = <SoundLoopLayerSettings*>iterator.data
+                if layer.sound_id == sound_id and layer.status != layer_stopped:
+                    return True
+                iterator = iterator.next
+
+        return False
+
+    def _on_sound_loop_set_sound_loaded(self, request, *args):
+        """Called when the master sound of a sound loop set waiting to be played has been loaded."""
+        del args
+        if self._pending_sound_loop_set is request:
+            self._pending_sound_loop_set = None
+            request()
+
+    def _on_layer_sound_loaded(self, long sound_loop_set_id, int layer_index, *args):
+        """Called when a layer sound of an active sound loop set has been loaded (on demand)."""
+        cdef SoundLoopSetPlayer *player
+        cdef SoundLoopLayerSettings *layer
+        del args
+
+        SDL_LockAudio()
+
+        for player_num in range(2):
+            player = self.type_state.current if player_num == 0 else self.type_state.next
+            if player.status == player_idle or player.master_sound_layer.sound_loop_set_id != sound_loop_set_id:
+                continue
+
+            layer = <SoundLoopLayerSettings*>g_slist_nth_data(player.layers, layer_index)
+            if layer != NULL and layer.sound == NULL:
+                self._set_layer_sound(layer, self.mc.sounds_by_id[layer.sound_id])
+                if layer.status != layer_stopped:
+                    self._cue_layer(layer, stream_pos_unknown)
+
+        SDL_UnlockAudio()
+
+    cdef Uint32 _get_layer_memory(self, SoundLoopLayerSettings *layer):
+        """Returns the number of bytes of sample data a layer holds in memory."""
+        if layer == NULL or layer.sound == NULL:
+            return 0
+        if layer.sound.type == sound_type_memory:
+            return layer.length
+        return layer.stream_head_size
+
+    cdef Uint32 _get_player_memory(self, SoundLoopSetPlayer *player):
+        """Returns the number of bytes of sample data the sound loop set of a player holds in memory
+        (a sound played by several layers is counted once)."""
+        cdef GSList *iterator
+        cdef SoundLoopLayerSettings *layer
+        cdef Uint32 memory = self._get_layer_memory(&player.master_sound_layer)
+
+        sound_ids = {player.master_sound_layer.sound_id}
+        iterator = player.layers
+        while iterator != NULL:
+            layer = <SoundLoopLayerSettings*>iterator.data
+            if layer.sound_id not in sound_ids:
+                sound_ids.add(layer.sound_id)
+                memory += self._get_layer_memory(layer)
+            iterator = iterator.next
+
+        return memory
+
     def stop_current_sound_loop_set(self, fade_out=None):
         """
         Stops the currently playing sound loop set.
@@ -550,10 +768,21 @@ cdef class TrackSoundLoop(Track):
             fade_out: The number of seconds over which to fade out the currently playing
                       sound loop set before stopping.
         """
+        # A sound loop set waiting for its sound to be loaded will no longer be played
+        self._pending_sound_loop_set = None
+
         SDL_LockAudio()
 
         self.log.debug("Stopping current sound loop set")
 
+        # A sound loop set that is scheduled to start at a sample position is simply canceled
+        if self.type_state.current.status == player_pending:
+            self.type_state.current.status = player_idle
+            if self.type_state.current.master_sound_layer.sound_loop_set_id in self._active_sound_loop_sets:
+                del self._active_sound_loop_sets[self.type_state.current.master_sound_layer.sound_loop_set_id]
+            SDL_UnlockAudio()
+            return
+
         if self.type_state.current.status not in (player_playing, player_fading_in, player_fading_out):
             self.log.info("Unable to stop sound loop set - no sound loop set is currently playing.")
             SDL_UnlockAudio()
@@ -622,16 +851,19 @@ cdef class TrackSoundLoop(Track):
 
         SDL_UnlockAudio()
 
-    def play_layer(self, int layer, float fade_in=0.0, str timing="loop_end", volume=None):
+    def play_layer(self, int layer, float fade_in=0.0, str timing="loop_end", volume=None, start_sample=None):
         """
         Plays the specified layer number in the currently playing sound loop set.
 
         Args:
             layer: The layer number to play (1-based array position).
             fade_in: The number of seconds over which to fade in the layer.
-            timing: Flag indicating whether the layer should be played immediately ('now')
-                    or queued until the next loop of the master layer loop ('loop_end').
+            timing: Flag indicating whether the layer should be played immediately ('now'),
+                    queued until the next loop of the master layer loop ('loop_end') or
+                    at the audio clock sample position specified by start_sample ('sample').
             volume: The layer volume (overrides sound loop set setting if not None)
+            start_sample: The audio clock sample position at which to start the layer
+                    (only used with the 'sample' timing).
         """
         cdef SoundLoopLayerSettings *layer_settings
 
@@ -672,12 +904,20 @@ cdef class TrackSoundLoop(Track):
 
         if timing == 'loop_end':
             layer_settings.status = layer_queued
+            self._cue_layer(layer_settings, 0)
 
         elif timing == 'now':
             if layer_settings.fade_in_steps > 0:
                 layer_settings.status = layer_fading_in
             else:
                 layer_settings.status = layer_playing
+            self._cue_layer(layer_settings, stream_pos_unknown)
+
+        elif timing == 'sample' and start_sample is not None:
+            layer_settings.start_sample = start_sample
+            layer_settings.status = layer_scheduled
+            self._cue_layer(layer_settings, stream_pos_unknown)
+
         else:
             self.log.error("Unknown timing value specified: %s", timing)
             SDL_UnlockAudio()
@@ -731,6 +971,7 @@ cdef class TrackSoundLoop(Track):
         else:
             # TODO: Could perform a quick fade out rather than an abrupt stop
             layer_settings.status = layer_stopped
+            self._pause_layer(layer_settings)
 
         SDL_UnlockAudio()
 
@@ -782,6 +1023,11 @@ cdef class TrackSoundLoop(Track):
             if layer.markers != NULL:
                 g_array_free(layer.markers, True)
                 layer.markers = NULL
+            if layer.stream_head != NULL:
+                PyMem_Free(layer.stream_head)
+                layer.stream_head = NULL
+                layer.stream_head_size = 0
+                layer.stream_head_filled = 0
 
     cdef _reset_player_layers(self, SoundLoopSetPlayer *player):
         """Reset (free memory) for sound loop set player layers."""
@@ -831,7 +1077,9 @@ cdef class TrackSoundLoop(Track):
                     layers.append({
                         "status": TrackSoundLoop.layer_status_to_text(layer.status),
                         "sound_id": layer.sound_id,
-                        "sound_length": layer.sound.data.memory.size,
+                        "sound_length": layer.length,
+                        "streaming": layer.sound != NULL and layer.sound.type == sound_type_streaming,
+                        "memory": self._get_layer_memory(layer),
                         "volume": layer.volume,
                         "fade_in_steps": layer.fade_in_steps,
                         "fade_out_steps": layer.fade_out_steps,
@@ -847,6 +1095,8 @@ cdef class TrackSoundLoop(Track):
                     "length": player.length,
                     "sound_id": player.master_sound_layer.sound_id,
                     "volume": player.master_sound_layer.volume,
+                    "streaming": player.master_sound_layer.sound != NULL and player.master_sound_layer.sound.type == sound_type_streaming,
+                    "memory": self._get_player_memory(player),
                     "layers": layers,
                     "sample_pos": player.sample_pos,
                     "stop_loop_at_pos": player.stop_loop_at_pos,
@@ -901,6 +1151,7 @@ cdef class TrackSoundLoop(Track):
             layer_playing: "playing",
             layer_fading_in: "fading in",
             layer_fading_out: "fading out",
+            layer_scheduled: "scheduled",
         }
 
         try:
@@ -957,16 +1208,42 @@ cdef class TrackSoundLoop(Track):
 
         # Setup local variables
         cdef Uint32 track_buffer_pos
+        cdef Uint32 bytes_per_frame = callback_data.bytes_per_sample * callback_data.channels
+
+        track.active_sound_players = 0
 
         # If the current player is idle, the track is not active so there is nothing to do
         if sound_loop_track.current == NULL or sound_loop_track.current.status == player_idle:
             return
 
-        # Set flag indicating there is at least some activity on the track (it is active)
-        track.active = True
+        # Count the playing layers (master and additional layers) of both players
+        track.active_sound_players = get_active_layer_count(sound_loop_track.current) + \
+                                     get_active_layer_count(sound_loop_track.next)
 
         # Process the current loop player (fill the track buffer with samples)
         track_buffer_pos = 0
+
+        # A loop set scheduled to start at an audio clock sample position starts at the exact
+        # position in the buffer (it is not active until then)
+        if sound_loop_track.current.status == player_pending:
+            if sound_loop_track.current.start_sample >= callback_data.sample_clock + buffer_length // bytes_per_frame:
+                return
+
+            if sound_loop_track.current.start_sample > callback_data.sample_clock:
+                track_buffer_pos = <Uint32>(sound_loop_track.current.start_sample - callback_data.sample_clock) * bytes_per_frame
+
+            if sound_loop_track.current.master_sound_layer.fade_steps_remaining > 0:
+                sound_loop_track.current.status = player_fading_in
+            else:
+                sound_loop_track.current.status = player_playing
+
+            send_sound_loop_set_started_notification(sound_loop_track.current.master_sound_layer.sound_loop_set_id,
+                                                     sound_loop_track.current.master_sound_layer.sound_id,
+                                                     track)
+
+        # Set flag indicating there is at least some activity on the track (it is active)
+        track.active = True
+
         while track_buffer_pos < buffer_length and sound_loop_track.current.status \
                 in (player_playing, player_fading_in, player_fading_out):
 
@@ -1069,7 +1346,10 @@ cdef Uint32 get_player_sound_samples(TrackState *track, SoundLoopSetPlayer *play
     cdef Uint8 player_volume, layer_volume
     cdef Uint32 layer_sample_pos, layer_bytes_remaining, layer_chunk_bytes, current_chunk_bytes, temp_chunk_bytes
     cdef Uint32 layer_track_buffer_pos_offset
+    cdef Uint32 layer_start_offset
     cdef Uint32 buffer_bytes_remaining = buffer_length - track_buffer_pos
+    cdef Uint32 bytes_per_frame = callback_data.bytes_per_sample * callback_data.channels
+    cdef Uint64 chunk_start_sample
 
     # Loop over the output buffer
     while buffer_bytes_remaining > 0:
@@ -1107,11 +1387,10 @@ cdef Uint32 get_player_sound_samples(TrackState *track, SoundLoopSetPlayer *play
             return buffer_length
 
         # Get master layer samples
-        SDL_MixAudioFormat(track.buffer + track_buffer_pos,
-                           <Uint8*>player.master_sound_layer.sound.data.memory.data + player.sample_pos,
-                           track.callback_data.format,
-                           current_chunk_bytes,
-                           player_volume * player.master_sound_layer.volume // SDL_MIX_MAXVOLUME)
+        mix_layer_samples(track, &player.master_sound_layer, player.sample_pos, track_buffer_pos,
+                          current_chunk_bytes,
+                          player_volume * player.master_sound_layer.volume // SDL_MIX_MAXVOLUME,
+                          callback_data)
 
         # Process markers (do any markers fall in the current chunk?)
         # Note: the current sample position has already been incremented when the sample data was received so
@@ -1138,10 +1417,23 @@ cdef Uint32 get_player_sound_samples(TrackState *track, SoundLoopSetPlayer *play
                 if not layer.looping:
                     layer.status = layer_stopped
 
+            # A layer scheduled at an audio clock sample position starts at the exact position in the chunk
+            layer_start_offset = 0
+            if layer.status == layer_scheduled:
+                chunk_start_sample = callback_data.sample_clock + track_buffer_pos // bytes_per_frame
+                if layer.start_sample < chunk_start_sample + current_chunk_bytes // bytes_per_frame:
+                    if layer.start_sample > chunk_start_sample:
+                        layer_start_offset = <Uint32>(layer.start_sample - chunk_start_sample) * bytes_per_frame
+
+                    if layer.fade_steps_remaining > 0:
+                        layer.status = layer_fading_in
+                    else:
+                        layer.status = layer_playing
+
             if layer.status in (layer_playing, layer_fading_in, layer_fading_out):
-                layer_track_buffer_pos_offset = 0
-                layer_sample_pos = player.sample_pos
-                layer_bytes_remaining = current_chunk_bytes
+                layer_track_buffer_pos_offset = layer_start_offset
+                layer_sample_pos = player.sample_pos + layer_start_offset
+                layer_bytes_remaining = current_chunk_bytes - layer_start_offset
 
                 while layer_bytes_remaining > 0:
                     if layer.status == layer_playing:
@@ -1162,12 +1454,13 @@ cdef Uint32 get_player_sound_samples(TrackState *track, SoundLoopSetPlayer *play
                                 layer.status = layer_stopped
                                 layer_bytes_remaining = 0
 
-                    if layer_sample_pos < layer.sound.data.memory.size:
-                        SDL_MixAudioFormat(track.buffer + track_buffer_pos + layer_track_buffer_pos_offset,
-                                           <Uint8*>layer.sound.data.memory.data + layer_sample_pos,
-                                           callback_data.format,
-                                           min(layer_chunk_bytes, layer.sound.data.memory.size - layer_sample_pos),
-                                           player_volume * layer_volume // SDL_MIX_MAXVOLUME)
+                    # A layer sound that is still being loaded is silent
+                    if layer.sound != NULL and layer_sample_pos < layer.length:
+                        mix_layer_samples(track, layer, layer_sample_pos,
+                                          track_buffer_pos + layer_track_buffer_pos_offset,
+                                          min(layer_chunk_bytes, layer.length - layer_sample_pos),
+                                          player_volume * layer_volume // SDL_MIX_MAXVOLUME,
+                                          callback_data)
 
                         # Process markers (do any markers fall in the current chunk?)
                         # Note: the current sample position has already been incremented when the sample data was received so
@@ -1203,6 +1496,173 @@ cdef Uint32 get_player_sound_samples(TrackState *track, SoundLoopSetPlayer *play
     return track_buffer_pos
 
 
+cdef void mix_layer_samples(TrackState *track, SoundLoopLayerSettings *layer, Uint32 sample_pos,
+                            Uint32 track_buffer_pos, Uint32 length, int volume,
+                            AudioCallbackData *callback_data) nogil:
+    """
+    Mixes samples of a layer sound into the track buffer.
+
+    Args:
+        track: A pointer to the TrackState struct for the current track
+        layer: The layer whose sound samples will be mixed
+        sample_pos: The position in the layer sound of the first sample to mix
+        track_buffer_pos: The position in the track buffer at which to mix the samples
+        length: The number of bytes to mix
+        volume: The volume at which to mix the samples
+        callback_data: The audio callback data
+
+    Notes:
+        Streaming sounds are played sequentially from their stream (the stream seeks when the
+        requested position differs from the stream position).  The beginning of a streaming sound
+        is cached in memory the first time it is played so the start of the next loop can be played
+        from the cache while the stream seeks back to the position after the cached samples.
+    """
+    cdef SampleStream *stream
+    cdef Uint32 samples_in_map, chunk_bytes, cache_bytes
+
+    if layer.sound == NULL or sample_pos >= layer.length:
+        return
+
+    length = min(length, layer.length - sample_pos)
+
+    if layer.sound.type == sound_type_memory:
+        SDL_MixAudioFormat(track.buffer + track_buffer_pos,
+                           <Uint8*>layer.sound.data.memory.data + sample_pos,
+                           callback_data.format,
+                           length,
+                           volume)
+        return
+
+    stream = layer.sound.data.stream
+    if stream == NULL or stream.pipeline == NULL:
+        return
+
+    # Play the beginning of the sound from the cache (the stream continues after the cached samples)
+    if sample_pos < layer.stream_head_filled:
+        chunk_bytes = min(length, layer.stream_head_filled - sample_pos)
+        SDL_MixAudioFormat(track.buffer + track_buffer_pos,
+                           layer.stream_head + sample_pos,
+                           callback_data.format,
+                           chunk_bytes,
+                           volume)
+        sample_pos += chunk_bytes
+        track_buffer_pos += chunk_bytes
+        length -= chunk_bytes
+
+        if layer.stream_pos != layer.stream_head_filled:
+            seek_streaming_layer(layer, layer.stream_head_filled, callback_data)
+
+    if length > 0 and layer.stream_pos != sample_pos:
+        seek_streaming_layer(layer, sample_pos, callback_data)
+
+    while length > 0:
+
+        # Consume the samples remaining in the streaming buffer
+        if stream.map_contains_valid_sample_data:
+            samples_in_map = stream.map_info.size - stream.map_buffer_pos
+            chunk_bytes = min(length, samples_in_map)
+
+            SDL_MixAudioFormat(track.buffer + track_buffer_pos,
+                               <Uint8*>stream.map_info.data + stream.map_buffer_pos,
+                               callback_data.format,
+                               chunk_bytes,
+                               volume)
+
+            # Fill the cache with the beginning of the sound
+            if layer.stream_pos == layer.stream_head_filled and layer.stream_head_filled < layer.stream_head_size:
+                cache_bytes = min(chunk_bytes, layer.stream_head_size - layer.stream_head_filled)
+                memcpy(layer.stream_head + layer.stream_head_filled,
+                       <Uint8*>stream.map_info.data + stream.map_buffer_pos,
+                       cache_bytes)
+                layer.stream_head_filled += cache_bytes
+
+            stream.map_buffer_pos += chunk_bytes
+            layer.stream_pos += chunk_bytes
+            track_buffer_pos += chunk_bytes
+            length -= chunk_bytes
+
+            if chunk_bytes == samples_in_map:
+                release_stream_buffer(stream)
+
+            continue
+
+        # At the end of the stream the layer sound is shorter than the duration reported when
+        # it was loaded (the stream is not sought here, the next loop starts from the cache)
+        if g_object_get_bool(stream.sink, "eos"):
+            layer.length = layer.stream_pos
+            return
+
+        # Retrieve the next buffer from the streaming pipeline
+        stream.sample = c_appsink_pull_sample(stream.sink)
+        if stream.sample == NULL:
+            stream.null_buffer_count += 1
+            track.streaming_underruns += 1
+            return
+
+        stream.null_buffer_count = 0
+        stream.buffer = gst_sample_get_buffer(stream.sample)
+
+        if gst_buffer_map(stream.buffer, &stream.map_info, GST_MAP_READ):
+            stream.map_contains_valid_sample_data = 1
+            stream.map_buffer_pos = 0
+        else:
+            stream.map_contains_valid_sample_data = 0
+            stream.map_buffer_pos = 0
+            gst_sample_unref(stream.sample)
+            stream.sample = NULL
+            return
+
+
+cdef void seek_streaming_layer(SoundLoopLayerSettings *layer, Uint32 sample_pos,
+                               AudioCallbackData *callback_data) nogil:
+    """
+    Seeks the stream of a streaming layer sound to the specified position.
+
+    Args:
+        layer: The streaming layer
+        sample_pos: The position (in bytes) in the layer sound
+        callback_data: The audio callback data
+    """
+    cdef SampleStream *stream = layer.sound.data.stream
+
+    release_stream_buffer(stream)
+    gst_element_seek_simple(stream.pipeline, GST_FORMAT_TIME,
+                            <GstSeekFlags>(GST_SEEK_FLAG_FLUSH | GST_SEEK_FLAG_ACCURATE),
+                            <gint64>(sample_pos / callback_data.seconds_to_bytes_factor * GST_SECOND))
+    stream.null_buffer_count = 0
+    layer.stream_pos = sample_pos
+
+
+cdef inline void release_stream_buffer(SampleStream *stream) nogil:
+    """Releases the streaming buffer currently held by a stream (if any)."""
+    if stream.map_contains_valid_sample_data:
+        gst_buffer_unmap(stream.buffer, &stream.map_info)
+        gst_sample_unref(stream.sample)
+
+    stream.buffer = NULL
+    stream.sample = NULL
+    stream.map_buffer_pos = 0
+    stream.map_contains_valid_sample_data = 0
+
+
+cdef Uint32 get_active_layer_count(SoundLoopSetPlayer *player) nogil:
+    """Returns the number of layers (including the master layer) a player is currently playing."""
+    cdef GSList *layer_iterator
+    cdef Uint32 count = 0
+
+    if player == NULL or player.status in (player_idle, player_pending):
+        return 0
+
+    count = 1
+    layer_iterator = player.layers
+    while layer_iterator != NULL:
+        if (<SoundLoopLayerSettings*>layer_iterator.data).status in (layer_playing, layer_fading_in, layer_fading_out):
+            count += 1
+        layer_iterator = layer_iterator.next
+
+    return count
+
+
 cdef inline SoundLoopLayerSettings *_create_sound_loop_layer_settings() nogil:
     """
     Creates a new sound loop layer settings struct.
@@ -1,3 +1,4 @@
+from libc.math cimport frexp
 from mpfmc.core.audio.sdl2 cimport *
 from mpfmc.core.audio.gstreamer cimport *
 from mpfmc.core.audio.sound_file cimport *
@@ -11,11 +12,17 @@ from mpfmc.core.audio.notification_message cimport *
 
 cdef enum:
     no_marker = 0xFFFFFFFF
+    no_scheduled_marker = -1
+    scheduled_marker_about_to_finish = -2
+    scheduled_marker_end = -3
+    max_ducking_target_tracks = 8
 
 ctypedef struct TrackStandardState:
-    # State variables for TrackStandard tracks
+    # State variables for TrackStandard tracks (bit n of idle_players is set while sound
+    # player n is idle)
     int sound_player_count
     SoundPlayer *sound_players
+    Uint64 idle_players
 
 cdef enum SoundPlayerStatus:
     # Enumeration of the possible sound player status values.
@@ -27,11 +34,18 @@ cdef enum SoundPlayerStatus:
     player_playing = 5
     player_finished = 6
     player_stopping = 7
+    player_scheduled = 8
 
 ctypedef struct DuckingSettings:
+    # The ducking envelope is precomputed when the sound starts (one volume value per control
+    # point for the attack stage followed by one per control point for the release stage) along
+    # with the list of track numbers to duck.
     int track_bit_mask
+    Uint8 target_track_count
+    Uint8 target_tracks[max_ducking_target_tracks]
     Sint32 attack_start_pos
     Sint32 attack_duration
+    Uint32 attack_steps
     Uint8 attenuation_volume
     Sint32 release_start_pos
     Sint32 release_duration
@@ -52,6 +66,7 @@ cdef enum FadingStatus:
 ctypedef struct SoundSettings:
     SoundSample *sample
     Uint8 volume
+    Sint32 mix_gain
     int loops_remaining
     int current_loop
     Uint32 sample_pos
@@ -68,7 +83,14 @@ ctypedef struct SoundSettings:
     bint sound_has_ducking
     DuckingSettings ducking_settings
     DuckingStage ducking_stage
-    GArray *ducking_control_points
+    GArray *ducking_envelope
+    Uint32 end_offset
+    Uint64 start_sample
+    Uint64 start_after_instance_id
+    Sint32 start_after_marker
+    bint stop_scheduled
+    Uint64 stop_sample
+    Uint32 stop_fade_steps
 
 ctypedef struct SoundPlayer:
     # The SoundPlayer keeps track of the current sample position in the source audio
@@ -86,7 +108,8 @@ ctypedef struct SoundPlayer:
 # ---------------------------------------------------------------------------
 cdef class TrackStandard(Track):
 
-    cdef list _sound_queue
+    cdef object _sound_queue
+    cdef object _voice_allocator
     cdef dict _playing_instances_by_id
     cdef int _max_simultaneous_sounds
 
@@ -103,6 +126,7 @@ cdef class TrackStandard(Track):
     cdef tuple _get_sound_player_with_lowest_priority(self)
     cdef bint _play_sound_on_sound_player(self, sound_instance, int player, bint force=?)
     cdef _set_player_sound_settings(self, SoundSettings *sound_settings, object sound_instance)
+    cdef _set_player_ducking_settings(self, SoundSettings *sound_settings, object sound_instance, float sound_duration)
     cdef _set_player_playing(self, SoundPlayer *player, object sound_instance)
     cdef _set_player_replacing(self, SoundPlayer *player, object sound_instance)
     cdef int _get_player_playing_sound_instance(self, sound_instance)
@@ -115,10 +139,68 @@ cdef class TrackStandard(Track):
 #    function (these functions do not use the GIL).
 # ---------------------------------------------------------------------------
 
-cdef bint get_memory_sound_samples(SoundSettings *sound, Uint32 length, Uint8 *output_buffer, Uint8 volume,
+cdef bint get_memory_sound_samples(SoundSettings *sound, Uint32 length, Sint32 *accumulator, Sint32 target_gain,
                                    TrackState *track, int player_num) nogil
-cdef bint get_streaming_sound_samples(SoundSettings *sound, Uint32 length, Uint8 *output_buffer, Uint8 volume,
+cdef bint get_streaming_sound_samples(SoundSettings *sound, Uint32 length, Sint32 *accumulator, Sint32 target_gain,
                                       TrackState *track, int player_num) nogil
+cdef bint start_players_scheduled_after_marker(TrackStandardState *standard_track, Uint64 sound_instance_id,
+                                               int marker_id, Uint64 start_sample, int player_num) nogil
+cdef void cancel_players_scheduled_after(TrackStandardState *standard_track, Uint64 sound_instance_id,
+                                         TrackState *track) nogil
+cdef inline void set_player_idle(TrackStandardState *standard_track, SoundPlayer *player) nogil:
+    """Sets the status of a sound player to idle (the player becomes available)."""
+    player.status = player_idle
+    standard_track.idle_players |= (<Uint64>1) << player.number
+
+cdef inline void set_player_busy(TrackStandardState *standard_track, SoundPlayer *player, SoundPlayerStatus status) nogil:
+    """Sets the status of an idle sound player (the player is no longer available)."""
+    player.status = status
+    standard_track.idle_players &= ~((<Uint64>1) << player.number)
+
+cdef inline int get_idle_player(TrackStandardState *standard_track) nogil:
+    """
+    Returns the number of the first idle sound player on the track (-1 if all the players are
+    busy).  The index of the lowest bit set in the idle player mask is obtained from the exponent
+    of its floating-point value (exact for all powers of two up to 2^63).
+    """
+    cdef int exponent
+
+    if standard_track.idle_players == 0:
+        return -1
+
+    frexp(<double>(standard_track.idle_players & (~standard_track.idle_players + 1)), &exponent)
+    return exponent - 1
+
+cdef inline Uint8 get_ducking_volume(SoundSettings *sound, Uint32 bytes_per_control_point) nogil:
+    """
+    Returns the ducking volume of a sound at its current sample position (looked up in the
+    precomputed ducking envelope).  Stages are tested in reverse order (the release stage
+    takes precedence over the attack stage for short sounds).
+    Args:
+        sound: SoundSettings pointer of a sound that has ducking
+        bytes_per_control_point: The number of bytes between two control points
+    """
+    cdef DuckingSettings *ducking = &sound.ducking_settings
+    cdef Sint64 sample_pos = sound.sample_pos
+
+    if sample_pos >= ducking.release_start_pos + ducking.release_duration:
+        # Ducking finished
+        return SDL_MIX_MAXVOLUME
+    elif sample_pos >= ducking.release_start_pos:
+        # Ducking release stage
+        return g_array_index_uint8(sound.ducking_envelope,
+                                   ducking.attack_steps + (sample_pos - ducking.release_start_pos) // bytes_per_control_point)
+    elif sample_pos >= ducking.attack_start_pos + ducking.attack_duration:
+        # Ducking hold stage
+        return ducking.attenuation_volume
+    elif sample_pos >= ducking.attack_start_pos:
+        # Ducking attack stage
+        return g_array_index_uint8(sound.ducking_envelope,
+                                   (sample_pos - ducking.attack_start_pos) // bytes_per_control_point)
+    else:
+        # Ducking delay stage
+        return SDL_MIX_MAXVOLUME
+
 cdef inline void end_of_sound_processing(SoundPlayer* player,
                                          TrackState *track) nogil:
     """
@@ -1,21 +1,24 @@
 #!python
 #cython: embedsignature=True, language_level=3
 
+from libc.string cimport memset
 from cpython.mem cimport PyMem_Malloc, PyMem_Realloc, PyMem_Free
 cimport cpython.pycapsule as pycapsule
 import cython
 import logging
 import time
-from heapq import heappush, heappop, heapify
 
 from mpfmc.assets.sound import SoundInstance, SoundStealingMethod
 from mpfmc.core.audio.sdl2 cimport *
 from mpfmc.core.audio.gstreamer cimport *
 from mpfmc.core.audio.track cimport *
 from mpfmc.core.audio.inline cimport lerpU8, in_out_quad
+from mpfmc.core.audio.mixer cimport *
 from mpfmc.core.audio.notification_message cimport *
 from mpfmc.core.audio.track_standard cimport *
 from mpfmc.core.audio.audio_exception import AudioException
+from mpfmc.core.audio.sound_queue import SoundQueue
+from mpfmc.core.audio.voice_allocator import VoiceAllocator
 
 
 # ---------------------------------------------------------------------------
@@ -61,7 +64,7 @@ cdef class TrackStandard(Track):
         self._playing_instances_by_id = dict()
 
         # Priority queue of SoundInstance objects waiting to be played
-        self._sound_queue = list()
+        self._sound_queue = SoundQueue()
 
         # Set track type specific settings
         self.state.mix_callback_function = TrackStandard.mix_playing_sounds
@@ -81,19 +84,24 @@ cdef class TrackStandard(Track):
         self._max_simultaneous_sounds = max_simultaneous_sounds
         self.type_state.sound_player_count = max_simultaneous_sounds
 
+        # Sound instances assigned to the sound players (by priority and by sound)
+        self._voice_allocator = VoiceAllocator(max_simultaneous_sounds)
+
         # Allocate memory for the sound player structs needed for the desired number of
         # simultaneous sounds that can be played on the track.
         self.type_state.sound_players = <SoundPlayer*> PyMem_Malloc(self.type_state.sound_player_count * sizeof(SoundPlayer))
 
-        # Initialize sound player attributes
+        # Initialize sound player attributes (all players are idle)
+        self.type_state.idle_players = 0
         for i in range(self.type_state.sound_player_count):
-            self.type_state.sound_players[i].status = player_idle
             self.type_state.sound_players[i].track_num = self.number
             self.type_state.sound_players[i].number = i
+            set_player_idle(self.type_state, cython.address(self.type_state.sound_players[i]))
             self.type_state.sound_players[i].current.sample = NULL
             self.type_state.sound_players[i].current.loops_remaining = 0
             self.type_state.sound_players[i].current.current_loop = 0
             self.type_state.sound_players[i].current.volume = 0
+            self.type_state.sound_players[i].current.mix_gain = 0
             self.type_state.sound_players[i].current.sample_pos = 0
             self.type_state.sound_players[i].current.sound_id = 0
             self.type_state.sound_players[i].current.sound_instance_id = 0
@@ -102,13 +110,20 @@ cdef class TrackStandard(Track):
             self.type_state.sound_players[i].current.about_to_finish_marker = no_marker
             self.type_state.sound_players[i].current.sound_has_ducking = False
             self.type_state.sound_players[i].current.ducking_stage = ducking_stage_idle
-            self.type_state.sound_players[i].current.ducking_control_points = g_array_sized_new(False, False, sizeof(guint8), CONTROL_POINTS_PER_BUFFER)
+            self.type_state.sound_players[i].current.ducking_envelope = g_array_new(False, False, sizeof(guint8))
             self.type_state.sound_players[i].current.marker_count = 0
             self.type_state.sound_players[i].current.markers = g_array_new(False, False, sizeof(guint))
+            self.type_state.sound_players[i].current.start_sample = 0
+            self.type_state.sound_players[i].current.start_after_instance_id = 0
+            self.type_state.sound_players[i].current.start_after_marker = no_scheduled_marker
+            self.type_state.sound_players[i].current.stop_scheduled = False
+            self.type_state.sound_players[i].current.stop_sample = 0
+            self.type_state.sound_players[i].current.stop_fade_steps = 0
             self.type_state.sound_players[i].next.sample = NULL
             self.type_state.sound_players[i].next.loops_remaining = 0
             self.type_state.sound_players[i].next.current_loop = 0
             self.type_state.sound_players[i].next.volume = 0
+            self.type_state.sound_players[i].next.mix_gain = 0
             self.type_state.sound_players[i].next.sample_pos = 0
             self.type_state.sound_players[i].next.sound_id = 0
             self.type_state.sound_players[i].next.sound_instance_id = 0
@@ -117,9 +132,15 @@ cdef class TrackStandard(Track):
             self.type_state.sound_players[i].next.about_to_finish_marker = no_marker
             self.type_state.sound_players[i].next.sound_has_ducking = False
             self.type_state.sound_players[i].next.ducking_stage = ducking_stage_idle
-            self.type_state.sound_players[i].next.ducking_control_points = g_array_sized_new(False, False, sizeof(guint8), CONTROL_POINTS_PER_BUFFER)
+            self.type_state.sound_players[i].next.ducking_envelope = g_array_new(False, False, sizeof(guint8))
             self.type_state.sound_players[i].next.marker_count = 0
             self.type_state.sound_players[i].next.markers = g_array_new(False, False, sizeof(guint))
+            self.type_state.sound_players[i].next.start_sample = 0
+            self.type_state.sound_players[i].next.start_after_instance_id = 0
+            self.type_state.sound_players[i].next.start_after_marker = no_scheduled_marker
+            self.type_state.sound_players[i].next.stop_scheduled = False
+            self.type_state.sound_players[i].next.stop_sample = 0
+            self.type_state.sound_players[i].next.stop_fade_steps = 0
 
         self.log.debug("Created Track %d %s with the following settings: "
                        "simultaneous_sounds = %d, volume = %f",
@@ -135,8 +156,8 @@ cdef class TrackStandard(Track):
         # Free the specific track type state and other allocated memory
         if self.type_state != NULL:
             for i in range(self.type_state.sound_player_count):
-                g_array_free(self.type_state.sound_players[i].current.ducking_control_points, True)
-                g_array_free(self.type_state.sound_players[i].next.ducking_control_points, True)
+                g_array_free(self.type_state.sound_players[i].current.ducking_envelope, True)
+                g_array_free(self.type_state.sound_players[i].next.ducking_envelope, True)
                 g_array_free(self.type_state.sound_players[i].current.markers, True)
                 g_array_free(self.type_state.sound_players[i].next.markers, True)
 
@@ -175,56 +196,50 @@ cdef class TrackStandard(Track):
         Returns the index of the first idle sound player on the track.  If all
         players are currently busy playing, -1 is returned.
         """
-        SDL_LockAudio()
-
-        for index in range(self.type_state.sound_player_count):
-            if self.type_state.sound_players[index].status == player_idle:
-                SDL_UnlockAudio()
-                return index
-
-        SDL_UnlockAudio()
-        return -1
+        return get_idle_player(self.type_state)
 
     def process(self):
-        """Processes the track queue each tick."""
+        """Processes the track queue and any pending track notification messages."""
 
         cdef bint keep_checking = True
         cdef int idle_sound_player
-        cdef GSList *iterator = NULL
-
-        # Lock the mutex to ensure no audio data is changed during the playback processing
-        # (multi-threaded protection)
-        SDL_LockAudio()
-
-        while keep_checking:
-            # See if there are now any idle sound players
-            idle_sound_player = self._get_idle_sound_player()
-            if idle_sound_player >= 0:
-                # Found an idle player, check if there are any sounds queued for playback
-                sound_instance = self._get_next_sound()
-
-                if sound_instance is not None:
-                    self.log.debug("Getting sound from queue %s", sound_instance)
-                    self._play_sound_on_sound_player(sound_instance=sound_instance, player=idle_sound_player)
+        cdef GSList *notification_messages
+        cdef GSList *iterator
+
+        # The sound queue only needs to be checked when sounds are waiting for a free player
+        if self._sound_queue:
+            # Lock the mutex to ensure no audio data is changed during the playback processing
+            # (multi-threaded protection, the time spent waiting for the lock is recorded)
+            perf_lock_audio(self.state.callback_data)
+
+            while keep_checking:
+                # See if there are now any idle sound players
+                idle_sound_player = self._get_idle_sound_player()
+                if idle_sound_player >= 0:
+                    # Found an idle player, check if there are any sounds queued for playback
+                    sound_instance = self._get_next_sound()
+
+                    if sound_instance is not None:
+                        self.log.debug("Getting sound from queue %s", sound_instance)
+                        self._play_sound_on_sound_player(sound_instance=sound_instance, player=idle_sound_player)
+                    else:
+                        keep_checking = False
                 else:
                     keep_checking = False
-            else:
-                keep_checking = False
 
-        # Process track notification messages
-        if self.state.notification_messages != NULL:
-            self.state.notification_messages = g_slist_reverse(self.state.notification_messages)
-            iterator = self.state.notification_messages
-            while iterator != NULL:
-                self.process_notification_message(<NotificationMessageContainer*>iterator.data)
-                g_slice_free1(sizeof(NotificationMessageContainer), iterator.data)
-                iterator = iterator.next
+            # Unlock the mutex since we are done accessing the audio data
+            SDL_UnlockAudio()
 
-            g_slist_free(self.state.notification_messages)
-            self.state.notification_messages = NULL
+        # Process track notification messages (the message list is taken without locking the
+        # audio thread, the lock is only taken while each message is processed)
+        notification_messages = self.take_notification_messages()
+        iterator = notification_messages
+        while iterator != NULL:
+            self.process_notification_message(<NotificationMessageContainer*>iterator.data)
+            g_slice_free1(sizeof(NotificationMessageContainer), iterator.data)
+            iterator = iterator.next
 
-        # Unlock the mutex since we are done accessing the audio data
-        SDL_UnlockAudio()
+        g_slist_free(notification_messages)
 
     cdef process_notification_message(self, NotificationMessageContainer *notification_message):
         """Process a notification message to this track"""
@@ -232,7 +247,7 @@ cdef class TrackStandard(Track):
         if notification_message == NULL:
             return
 
-        SDL_LockAudio()
+        perf_lock_audio(self.state.callback_data)
 
         # Check for track notification messages first (they do not need sound instance information)
         if notification_message.message in (notification_track_stopped, notification_track_paused):
@@ -274,6 +289,7 @@ cdef class TrackStandard(Track):
                 self.log.debug("Removing sound instance %s from playing sound "
                                "instance dictionary", str(sound_instance))
                 del self._playing_instances_by_id[sound_instance.id]
+            self._voice_allocator.release(notification_message.sound_instance_id)
 
         elif notification_message.message == notification_sound_looping:
             sound_instance = self._playing_instances_by_id[notification_message.sound_instance_id]
@@ -302,46 +318,37 @@ cdef class TrackStandard(Track):
 
         This method ensures that the sound that is returned has not expired.
         If the next sound in the queue has expired, it is discarded and the
-        next sound that has not expired is returned.
+        next sound that has not expired is returned.  If the next sound in the
+        queue is still loading (and has not expired), it keeps its place in the
+        queue and None is returned.
         """
-        # We don't want to go through the entire sound queue more than once
-        # in this method so keep track of the entry ids of the items we've
-        # processed.  Once an item has been processed and retrieved again,
-        # we are done and return None.
-        cdef list sound_instances_retrieved_from_queue = list()
+        now = time.time()
         while True:
-            # Return none if sound queue is empty
-            if len(self._sound_queue) == 0:
-                return None
-
             # Get the next item in the queue (sorted by priority and expiration time)
-            sound_instance = heappop(self._sound_queue)
+            sound_instance = self._sound_queue.peek()
 
-            # Check if we've already processed the sound instance during this call (if
-            # so, put it back in the queue and return)
-            if sound_instance in sound_instances_retrieved_from_queue:
-                heappush(self._sound_queue, sound_instance)
+            # Return none if sound queue is empty
+            if sound_instance is None:
                 return None
 
-            # Keep track of entries we've processed during this call
-            sound_instances_retrieved_from_queue.append(sound_instance)
+            if sound_instance.exp_time is not None and sound_instance.exp_time <= now:
+                self.log.debug("Discarding expired sound from queue %s", sound_instance)
+                self._sound_queue.remove(sound_instance)
+                sound_instance.set_expired()  # Notify sound instance it has expired
 
-            # If the sound is still loading and not expired, put it back in the queue
-            if not sound_instance.sound.loaded and sound_instance.sound.loading and \
-                    (sound_instance.exp_time is None or sound_instance.exp_time > time.time()):
-                heappush(self._sound_queue, sound_instance)
+            elif not sound_instance.sound.loaded and sound_instance.sound.loading:
+                # If the sound is still loading and not expired, leave it in the queue
                 self.log.debug("Next pending sound in queue is still loading, "
-                               "re-queueing sound %s",
+                               "leaving sound %s in the queue",
                                sound_instance)
+                return None
+
             else:
-                # Return the next sound from the priority queue if it has not expired
-                if sound_instance.exp_time is None or sound_instance.exp_time > time.time():
-                    self.log.debug("Retrieving next pending sound from queue %s", sound_instance)
-                    sound_instance.set_pending()  # Notify sound instance it is no longer queued
-                    return sound_instance
-                else:
-                    self.log.debug("Discarding expired sound from queue %s", sound_instance)
-                    sound_instance.set_expired()  # Notify sound instance it has expired
+                # Return the next sound from the priority queue
+                self.log.debug("Retrieving next pending sound from queue %s", sound_instance)
+                self._sound_queue.remove(sound_instance)
+                sound_instance.set_pending()  # Notify sound instance it is no longer queued
+                return sound_instance
 
     def _remove_sound_from_queue(self, sound not None):
         """
@@ -350,13 +357,8 @@ cdef class TrackStandard(Track):
         Args:
             sound: The sound object to remove
         """
-        cdef list sound_queue_copy = self._sound_queue.copy()
-        for sound_instance in sound_queue_copy:
-            if sound_instance.sound_id == sound.id:
-                self._sound_queue.remove(sound_instance)
-                sound_instance.set_canceled()
-
-        heapify(self._sound_queue)
+        for sound_instance in self._sound_queue.remove_sound(sound.id):
+            sound_instance.set_canceled()
 
     def _remove_sound_instance_from_queue(self, sound_instance not None):
         """
@@ -364,78 +366,52 @@ cdef class TrackStandard(Track):
         Args:
             sound_instance: The sound instance object to remove
         """
-        try:
-            self._sound_queue.remove(sound_instance)
+        if self._sound_queue.remove(sound_instance):
             self.log.debug("Removing pending sound from queue %s", sound_instance)
             sound_instance.set_canceled()
-            heapify(self._sound_queue)
-        except ValueError:
-            pass
 
     def _remove_all_sounds_with_context_from_queue(self, context):
         """Removes all sounds with the specified context from the priority sound queue.
         """
-        for sound_instance in self._sound_queue.copy():
-            if sound_instance.context == context:
-                self.log.debug("Removing pending sound with context %s from queue %s", context, sound_instance)
-                sound_instance.set_canceled()
-                self._sound_queue.remove(sound_instance)
-
-        heapify(self._sound_queue)
+        for sound_instance in self._sound_queue.remove_context(context):
+            self.log.debug("Removing pending sound with context %s from queue %s", context, sound_instance)
+            sound_instance.set_canceled()
 
     def _remove_all_sounds_with_key_from_queue(self, key):
         """Removes all sounds with the specified key from the priority sound queue.
         """
-        for sound_instance in self._sound_queue.copy():
-            if sound_instance.key == key:
-                self.log.debug("Removing pending sound with key %s from queue %s", key, sound_instance)
-                sound_instance.set_canceled()
-                self._sound_queue.remove(sound_instance)
-
-        heapify(self._sound_queue)
+        for sound_instance in self._sound_queue.remove_key(key):
+            self.log.debug("Removing pending sound with key %s from queue %s", key, sound_instance)
+            sound_instance.set_canceled()
 
     def _remove_all_sounds_from_queue(self):
         """Removes all sounds from the priority sound queue.
         """
-        for sound_instance in self._sound_queue:
+        for sound_instance in self._sound_queue.clear():
             self.log.debug("Removing pending sound from queue %s", sound_instance)
             sound_instance.set_canceled()
 
-        self._sound_queue.clear()
-
     cdef int _get_playing_sound_count(self, Uint64 sound_id):
-        """Return the number of currently playing instances of the given sound id"""
-        cdef int count = 0
-        SDL_LockAudio()
-        
-        for i in range(self.type_state.sound_player_count):
-            if self.type_state.sound_players[i].status != player_idle and \
-                            self.type_state.sound_players[i].current.sound_id == sound_id:
-                count += 1
+        """Return the number of currently playing instances of the given sound id (must be called
+        while holding the audio lock)"""
+        if self._voice_allocator.get_sound_instance_count(sound_id) == 0:
+            return 0
 
-        SDL_UnlockAudio()
-        return count
+        return len(self._get_playing_sound_instances(sound_id))
 
     cdef list _get_playing_sound_instances(self, Uint64 sound_id):
-        """Return the list of currently playing instances of the given sound id"""
+        """Return the list of currently playing instances of the given sound id (must be called
+        while holding the audio lock)"""
         cdef list instances = list()
-        cdef Uint64 instance_id
+        cdef int player
 
-        SDL_LockAudio()
-        
-        for i in range(self.type_state.sound_player_count):
-            if self.type_state.sound_players[i].status != player_idle and \
-                            self.type_state.sound_players[i].current.sound_id == sound_id:
-
-                if self.type_state.sound_players[i].status == player_replacing:
-                    instance_id = self.type_state.sound_players[i].next.sound_instance_id
-                else:
-                    instance_id = self.type_state.sound_players[i].current.sound_instance_id
-                
-                if instance_id in self._playing_instances_by_id:
-                    instances.append(self._playing_instances_by_id[instance_id])
+        # The voice allocator is only updated once the sound stopped notifications have been
+        # processed, players that have become idle since then are skipped
+        for sound_instance in self._voice_allocator.get_sound_instances(sound_id):
+            player = self._voice_allocator.get_player(sound_instance.id)
+            if self.type_state.sound_players[player].status != player_idle:
+                instances.append(sound_instance)
 
-        SDL_UnlockAudio()
         return instances
 
     def _get_oldest_playing_sound_instance(self, Uint64 sound_id):
@@ -642,7 +618,7 @@ cdef class TrackStandard(Track):
         queue based on its priority, so highest-priority sounds are played
         first.
         """
-        heappush(self._sound_queue, sound_instance)
+        self._sound_queue.push(sound_instance)
 
         # Notify sound instance it has been queued
         sound_instance.set_queued()
@@ -706,14 +682,16 @@ cdef class TrackStandard(Track):
 
                 # Calculate fade out (if necessary)
                 player.current.fade_steps_remaining = fade_out * self.state.callback_data.seconds_to_bytes_factor // self.state.callback_data.bytes_per_control_point
-                if player.current.fade_steps_remaining > 0:
+                if player.current.fade_steps_remaining > 0 and player.status != player_scheduled:
                     player.current.fade_out_steps = player.current.fade_steps_remaining
                     player.current.fading_status = fading_status_fading_out
                     player.status = player_stopping
                 else:
-                    # Sound will stop immediately - send sound stopped notification
+                    # Sound will stop immediately (a scheduled sound that has not started yet
+                    # is always stopped immediately) - send sound stopped notification
                     send_sound_stopped_notification(player.number, player.current.sound_id, player.current.sound_instance_id, self.state)
-                    player.status = player_idle
+                    set_player_idle(self.type_state, player)
+                    cancel_players_scheduled_after(self.type_state, player.current.sound_instance_id, self.state)
 
                 # Adjust ducking release (if necessary)
                 if player.current.sound_has_ducking:
@@ -729,6 +707,43 @@ cdef class TrackStandard(Track):
 
         SDL_UnlockAudio()
 
+    def stop_sound_instance_at(self, sound_instance not None, stop_sample, fade_out=None):
+        """
+        Stops the specified sound instance at a position of the audio clock (see
+        AudioInterface.get_sample_clock). The fade out (if any) begins exactly at that sample.
+        Args:
+            sound_instance: The SoundInstance to stop
+            stop_sample: The audio clock sample position at which to stop the sound
+            fade_out: Optional amount of time (seconds) to fade out before stopping
+        """
+        cdef SoundPlayer *player
+
+        SDL_LockAudio()
+
+        if fade_out is None:
+            fade_out = sound_instance.fade_out
+
+        if stop_sample <= self.state.callback_data.sample_clock:
+            # The requested position has already been reached, stop the sound now
+            SDL_UnlockAudio()
+            self.stop_sound_instance(sound_instance, fade_out)
+            return
+
+        self.log.debug("Stopping sound %s at sample %d", sound_instance.name, stop_sample)
+
+        for i in range(self.type_state.sound_player_count):
+            if self.type_state.sound_players[i].status not in (player_idle, player_replacing) and \
+                    self.type_state.sound_players[i].current.sound_instance_id == sound_instance.id:
+                player = cython.address(self.type_state.sound_players[i])
+                player.current.stop_scheduled = True
+                player.current.stop_sample = stop_sample
+                player.current.stop_fade_steps = fade_out * self.state.callback_data.seconds_to_bytes_factor // self.state.callback_data.bytes_per_control_point
+
+        # Remove any instances of the specified sound that are pending in the sound queue
+        self._remove_sound_instance_from_queue(sound_instance)
+
+        SDL_UnlockAudio()
+
     def stop_sound_looping(self, sound not None):
         """
         Cancels looping for all instances of the specified sound on the track. Any queued instances
@@ -806,7 +821,7 @@ cdef class TrackStandard(Track):
                                                 self.type_state.sound_players[i].current.sound_id,
                                                 self.type_state.sound_players[i].current.sound_instance_id,
                                                 self.state)
-                self.type_state.sound_players[i].status = player_idle
+                set_player_idle(self.type_state, cython.address(self.type_state.sound_players[i]))
 
         # Remove all sounds that are pending in the sound queue.
         self._remove_all_sounds_from_queue()
@@ -831,14 +846,14 @@ cdef class TrackStandard(Track):
 
                 # Calculate fade out (if necessary)
                 player.current.fade_steps_remaining = <Uint32>(fade_out_seconds * self.state.callback_data.seconds_to_bytes_factor // self.state.callback_data.bytes_per_control_point)
-                if player.current.fade_steps_remaining > 0:
+                if player.current.fade_steps_remaining > 0 and player.status != player_scheduled:
                     player.current.fade_out_steps = player.current.fade_steps_remaining
                     player.current.fading_status = fading_status_fading_out
                     player.status = player_stopping
                 else:
                     # Sound will stop immediately - send sound stopped notification
                     send_sound_stopped_notification(player.number, player.current.sound_id, player.current.sound_instance_id, self.state)
-                    player.status = player_idle
+                    set_player_idle(self.type_state, player)
 
                 # Adjust ducking release (if necessary)
                 if player.current.sound_has_ducking:
@@ -856,29 +871,20 @@ cdef class TrackStandard(Track):
 
     cdef tuple _get_sound_player_with_lowest_priority(self):
         """
-        Retrieves the sound player currently with the lowest priority.
+        Retrieves the sound player currently with the lowest priority (must be called while
+        holding the audio lock).
 
         Returns:
             A tuple consisting of the sound player index and the priority of
             the sound playing on that player (or None if the player is idle).
 
         """
-        SDL_LockAudio()
+        cdef int sound_player = get_idle_player(self.type_state)
 
-        cdef int lowest_priority = 2147483647
-        cdef int sound_player = -1
-        cdef int i
+        if sound_player >= 0:
+            return sound_player, None
 
-        for i in range(self.type_state.sound_player_count):
-            if self.type_state.sound_players[i].status == player_idle:
-                SDL_UnlockAudio()
-                return i, None
-            elif self.type_state.sound_players[i].current.sound_priority < lowest_priority:
-                lowest_priority = self.type_state.sound_players[i].current.sound_priority
-                sound_player = i
-
-        SDL_UnlockAudio()
-        return sound_player, lowest_priority
+        return self._voice_allocator.get_lowest_priority_player()
 
     cdef bint _play_sound_on_sound_player(self, sound_instance, int player, bint force=False):
         """
@@ -922,6 +928,27 @@ cdef class TrackStandard(Track):
                 SDL_UnlockAudio()
                 return False
 
+            # A sound scheduled to start after a marker of another sound instance can only be
+            # played while that sound instance is still playing on this track
+            if sound_instance.start_after is not None and \
+                    sound_instance.start_after.id not in self._playing_instances_by_id:
+                self.log.debug("Sound instance %s is not playing on this track, could not schedule sound %s",
+                               sound_instance.start_after, sound_instance.name)
+                sound_instance.set_canceled()
+                SDL_UnlockAudio()
+                return False
+
+            # A scheduled sound that has not started yet is stopped right away (not replaced)
+            if self.type_state.sound_players[player].status == player_scheduled:
+                send_sound_stopped_notification(player,
+                                                self.type_state.sound_players[player].current.sound_id,
+                                                self.type_state.sound_players[player].current.sound_instance_id,
+                                                self.state)
+                set_player_idle(self.type_state, cython.address(self.type_state.sound_players[player]))
+                cancel_players_scheduled_after(self.type_state,
+                                               self.type_state.sound_players[player].current.sound_instance_id,
+                                               self.state)
+
             # Add sound to the dictionary of active sound instances
             self.log.debug("Adding sound instance %s to active sound dictionary", str(sound_instance))
             self._playing_instances_by_id[sound_instance.id] = sound_instance
@@ -934,6 +961,9 @@ cdef class TrackStandard(Track):
                 # The player is currently busy playing another sound, force it to be replaced with the sound instance
                 self._set_player_replacing(cython.address(self.type_state.sound_players[player]), sound_instance)
 
+            # The sound instance replaces any sound instance previously assigned to the player
+            self._voice_allocator.assign(player, sound_instance)
+
             self.log.debug("Sound %s is set to begin playback on standard track (loops=%d)",
                            sound_instance.name, sound_instance.loops)
 
@@ -958,6 +988,10 @@ cdef class TrackStandard(Track):
 
         # Setup the player to start playing the sound
         sound_settings.sample_pos = <Uint32>(sound_instance.start_at * self.state.callback_data.seconds_to_bytes_factor)
+
+        # The start position must fall on a sample frame boundary (the mixing kernel works on whole samples)
+        sample_frame_size = self.state.callback_data.bytes_per_sample * self.state.callback_data.channels
+        sound_settings.sample_pos -= sound_settings.sample_pos % sample_frame_size
         sound_settings.current_loop = 0
         sound_settings.sound_id = sound_instance.sound_id
         sound_settings.sound_instance_id = sound_instance.id
@@ -972,8 +1006,10 @@ cdef class TrackStandard(Track):
         sound_settings.fade_steps_remaining = sound_settings.fade_in_steps
         if sound_settings.fade_steps_remaining > 0:
             sound_settings.fading_status = fading_status_fading_in
+            sound_settings.mix_gain = 0
         else:
             sound_settings.fading_status = fading_status_not_fading
+            sound_settings.mix_gain = volume_to_gain(sound_settings.volume)
 
         # Markers
         sound_settings.marker_count = sound_instance.marker_count
@@ -991,31 +1027,22 @@ cdef class TrackStandard(Track):
         else:
             sound_settings.about_to_finish_marker = (sound_container.duration - sound_instance.about_to_finish_time) * self.state.callback_data.seconds_to_bytes_factor
 
-        # If the sound has ducking settings, apply them
-        if sound_instance.ducking is not None and sound_instance.ducking.track_bit_mask != 0:
-            # To convert between the number of seconds and a buffer position (bytes), we need to
-            # account for the sample rate (samples per second), the number of audio channels, and the
-            # number of bytes per sample (all samples are 16 bits)
-            sound_settings.sound_has_ducking = True
-            sound_settings.ducking_stage = ducking_stage_delay
-            sound_settings.ducking_settings.track_bit_mask = sound_instance.ducking.track_bit_mask
-            sound_settings.ducking_settings.attack_start_pos = sound_instance.ducking.delay * self.state.callback_data.seconds_to_bytes_factor
-            sound_settings.ducking_settings.attack_duration = sound_instance.ducking.attack * self.state.callback_data.seconds_to_bytes_factor
-            sound_settings.ducking_settings.attenuation_volume = <Uint8>(sound_instance.ducking.attenuation * SDL_MIX_MAXVOLUME)
-            sound_settings.ducking_settings.release_duration = sound_instance.ducking.release * self.state.callback_data.seconds_to_bytes_factor
-
-            # Release point is relative to the end of the sound
-            sound_settings.ducking_settings.release_start_pos = (sound_container.duration - sound_instance.ducking.release_point) * self.state.callback_data.seconds_to_bytes_factor
-        else:
-            # Sound does not have ducking, assign settings appropriately
-            sound_settings.sound_has_ducking = False
-            sound_settings.ducking_stage = ducking_stage_idle
-            sound_settings.ducking_settings.track_bit_mask = 0
-            sound_settings.ducking_settings.attack_start_pos = 0
-            sound_settings.ducking_settings.attack_duration = 0
-            sound_settings.ducking_settings.attenuation_volume = SDL_MIX_MAXVOLUME
-            sound_settings.ducking_settings.release_duration = 0
-            sound_settings.ducking_settings.release_start_pos = 0
+        # Ducking settings (the ducking envelope is precomputed)
+        self._set_player_ducking_settings(sound_settings, sound_instance, sound_container.duration)
+
+        # Scheduled start (audio clock sample position or a marker of another sound instance)
+        sound_settings.start_sample = 0
+        sound_settings.start_after_instance_id = 0
+        sound_settings.start_after_marker = no_scheduled_marker
+        if sound_instance.start_sample is not None:
+            sound_settings.start_sample = sound_instance.start_sample
+        if sound_instance.start_after is not None:
+            sound_settings.start_after_instance_id = sound_instance.start_after.id
+            sound_settings.start_after_marker = sound_instance.start_after_marker
+
+        sound_settings.stop_scheduled = False
+        sound_settings.stop_sample = 0
+        sound_settings.stop_fade_steps = 0
 
         # Special handling is needed to start streaming for the specified sound at the correct location
         if sound_container.sample.type == sound_type_streaming:
@@ -1027,6 +1054,81 @@ cdef class TrackStandard(Track):
             with nogil:
                 ret = gst_element_set_state(sound_container.sample.data.stream.pipeline, GST_STATE_PLAYING)
 
+    cdef _set_player_ducking_settings(self, SoundSettings *sound_settings, object sound_instance,
+                                      float sound_duration):
+        """
+        Sets the ducking settings of a sound player and precomputes the ducking envelope (the
+        ducking volume at each control point of the attack and release stages) and the list of
+        tracks to duck so no easing calculations are needed in the audio callback.
+        Args:
+            sound_settings: A pointer to a SoundSettings struct
+            sound_instance: The sound instance
+            sound_duration: The duration of the sound (secs)
+
+        Notes:
+            Must be called while holding the audio lock (SDL_LockAudio).
+        """
+        cdef DuckingSettings *ducking_settings = cython.address(sound_settings.ducking_settings)
+        cdef Uint32 bytes_per_control_point = self.state.callback_data.bytes_per_control_point
+        cdef Uint32 release_steps
+        cdef Uint32 step
+        cdef int track_num
+
+        if sound_instance.ducking is None or sound_instance.ducking.track_bit_mask == 0:
+            # Sound does not have ducking, assign settings appropriately
+            sound_settings.sound_has_ducking = False
+            sound_settings.ducking_stage = ducking_stage_idle
+            ducking_settings.track_bit_mask = 0
+            ducking_settings.target_track_count = 0
+            ducking_settings.attack_start_pos = 0
+            ducking_settings.attack_duration = 0
+            ducking_settings.attack_steps = 0
+            ducking_settings.attenuation_volume = SDL_MIX_MAXVOLUME
+            ducking_settings.release_duration = 0
+            ducking_settings.release_start_pos = 0
+            g_array_set_size(sound_settings.ducking_envelope, 0)
+            return
+
+        # To convert between the number of seconds and a buffer position (bytes), we need to
+        # account for the sample rate (samples per second), the number of audio channels, and the
+        # number of bytes per sample (all samples are 16 bits)
+        sound_settings.sound_has_ducking = True
+        sound_settings.ducking_stage = ducking_stage_delay
+        ducking_settings.track_bit_mask = sound_instance.ducking.track_bit_mask
+        ducking_settings.attack_start_pos = sound_instance.ducking.delay * self.state.callback_data.seconds_to_bytes_factor
+        ducking_settings.attack_duration = sound_instance.ducking.attack * self.state.callback_data.seconds_to_bytes_factor
+        ducking_settings.attenuation_volume = <Uint8>(sound_instance.ducking.attenuation * SDL_MIX_MAXVOLUME)
+        ducking_settings.release_duration = sound_instance.ducking.release * self.state.callback_data.seconds_to_bytes_factor
+
+        # Release point is relative to the end of the sound
+        ducking_settings.release_start_pos = (sound_duration - sound_instance.ducking.release_point) * self.state.callback_data.seconds_to_bytes_factor
+
+        # Tracks to duck (fan-out list)
+        ducking_settings.target_track_count = 0
+        for track_num in range(min(self.state.callback_data.track_count, max_ducking_target_tracks)):
+            if (1 << track_num) & ducking_settings.track_bit_mask:
+                ducking_settings.target_tracks[ducking_settings.target_track_count] = track_num
+                ducking_settings.target_track_count += 1
+
+        # Ducking envelope: one value per control point for the attack stage (ramping down to the
+        # attenuation volume) followed by one value per control point for the release stage (ramping
+        # back up to full volume)
+        ducking_settings.attack_steps = (max(ducking_settings.attack_duration, 0) + bytes_per_control_point - 1) // bytes_per_control_point
+        release_steps = (max(ducking_settings.release_duration, 0) + bytes_per_control_point - 1) // bytes_per_control_point
+        g_array_set_size(sound_settings.ducking_envelope, ducking_settings.attack_steps + release_steps)
+
+        for step in range(ducking_settings.attack_steps):
+            g_array_set_val_uint8(sound_settings.ducking_envelope, step,
+                                  lerpU8(in_out_quad(step * bytes_per_control_point / ducking_settings.attack_duration),
+                                         SDL_MIX_MAXVOLUME,
+                                         ducking_settings.attenuation_volume))
+
+        for step in range(release_steps):
+            g_array_set_val_uint8(sound_settings.ducking_envelope, ducking_settings.attack_steps + step,
+                                  lerpU8(in_out_quad(step * bytes_per_control_point / ducking_settings.release_duration),
+                                         ducking_settings.attenuation_volume,
+                                         SDL_MIX_MAXVOLUME))
+
     cdef _set_player_playing(self, SoundPlayer *player, object sound_instance):
         """
         Sets the player status and sound settings to begin playing the sound instance
@@ -1038,9 +1140,16 @@ cdef class TrackStandard(Track):
             return
 
         # Setup the player to start playing the sound
-        player.status = player_playing
+        set_player_busy(self.type_state, player, player_playing)
         self._set_player_sound_settings(cython.address(player.current), sound_instance)
 
+        # A scheduled sound is started by the audio callback (at the exact sample position)
+        if player.current.start_after_marker != no_scheduled_marker or \
+                player.current.start_sample > self.state.callback_data.sample_clock:
+            player.status = player_scheduled
+            self.log.debug("Sound %s is scheduled for playback on standard track", sound_instance.name)
+            return
+
         # Send sound started notification
         send_sound_started_notification(player.number, player.current.sound_id, player.current.sound_instance_id, self.state)
 
@@ -1079,15 +1188,11 @@ cdef class TrackStandard(Track):
             The sound player number currently playing the specified sound instance or -1 if the
             sound instance is not currently playing.
         """
-        SDL_LockAudio()
+        cdef int player = self._voice_allocator.get_player(sound_instance.id)
 
-        for i in range(self.type_state.sound_player_count):
-            if self.type_state.sound_players[i].status != player_idle and \
-                            self.type_state.sound_players[i].current.sound_instance_id == sound_instance.id:
-                SDL_UnlockAudio()
-                return i
+        if player >= 0 and self.type_state.sound_players[player].status != player_idle:
+            return player
 
-        SDL_UnlockAudio()
         return -1
 
     def get_playing_sound_instance_by_id(self, sound_instance_id):
@@ -1212,6 +1317,7 @@ cdef class TrackStandard(Track):
             player_playing: "playing",
             player_finished: "finished",
             player_stopping: "stopping",
+            player_scheduled: "scheduled",
         }
 
         try:
@@ -1267,10 +1373,10 @@ cdef class TrackStandard(Track):
         cdef TrackStandardState *standard_track
         cdef SoundPlayer *player
         cdef int player_num
-        cdef int track_num
         cdef int marker_id
         cdef bint end_of_sound
-        cdef bint ducking_is_active
+        cdef Uint8 target_num
+        cdef GArray *ducking_envelope
 
         if track == NULL or track.type_state == NULL:
             return
@@ -1282,242 +1388,282 @@ cdef class TrackStandard(Track):
         cdef Uint32 current_chunk_bytes
         cdef Uint32 track_buffer_pos
         cdef Uint8 control_point
-        cdef float progress
-
-        # Loop over track sound players
-        for player_num in range(standard_track.sound_player_count):
-
-            player = cython.address(standard_track.sound_players[player_num])
-
-            # If the player is idle, there is nothing to do so move on to the next player
-            if player == NULL or player.status == player_idle:
-                continue
-
-            # Set flag indicating there is at least some activity on the track (it is active)
-            track.active = True
-
-            end_of_sound = False
-            track_buffer_pos = 0
-            control_point = 0
-            buffer_bytes_remaining = buffer_length
-
-            # Loop over output buffer at control rate
-            while buffer_bytes_remaining > 0:
-
-                # Determine the number of bytes to process in the current chunk
-                current_chunk_bytes = min(buffer_bytes_remaining, callback_data.bytes_per_control_point)
-
-                # Calculate volume of chunk (handle fading)
-                if player.current.fading_status == fading_status_fading_in:
-                    volume = <Uint8> (in_out_quad((player.current.fade_in_steps - player.current.fade_steps_remaining) / player.current.fade_in_steps) * player.current.volume)
-                    player.current.fade_steps_remaining -= 1
-                    if player.current.fade_steps_remaining == 0:
-                        player.current.fading_status = fading_status_not_fading
-                elif player.current.fading_status == fading_status_fading_out:
-                    volume = <Uint8> (in_out_quad(player.current.fade_steps_remaining / player.current.fade_out_steps) * player.current.volume)
-                    player.current.fade_steps_remaining -= 1
-                else:
-                    volume = player.current.volume
-
-                # Copy samples for chunk to output buffer and apply volume
-                if player.current.sample.type == sound_type_memory:
-                    end_of_sound = get_memory_sound_samples(cython.address(player.current), current_chunk_bytes, track.buffer + track_buffer_pos, volume, track, player_num)
-                elif player.current.sample.type == sound_type_streaming:
-                    end_of_sound = get_streaming_sound_samples(cython.address(player.current), current_chunk_bytes, track.buffer + track_buffer_pos, volume, track, player_num)
-
-                # Process sound ducking (if applicable)
-                if player.current.sound_has_ducking:
-                    ducking_is_active = False
-
-                    # Determine control point ducking stage and calculate control point (test stages in reverse order)
-                    if player.current.sample_pos >= player.current.ducking_settings.release_start_pos + player.current.ducking_settings.release_duration:
-                        # Ducking finished
-                        g_array_set_val_uint8(player.current.ducking_control_points, control_point, SDL_MIX_MAXVOLUME)
-
-                    elif player.current.sample_pos >= player.current.ducking_settings.release_start_pos:
-                        # Ducking release stage
-                        ducking_is_active = True
-                        progress = (player.current.sample_pos - player.current.ducking_settings.release_start_pos) / player.current.ducking_settings.release_duration
-                        g_array_set_val_uint8(player.current.ducking_control_points,
-                                              control_point,
-                                              lerpU8(in_out_quad(progress),
-                                                     player.current.ducking_settings.attenuation_volume,
-                                                     SDL_MIX_MAXVOLUME
-                                                     )
-                                              )
-
-                    elif player.current.sample_pos >= player.current.ducking_settings.attack_start_pos + player.current.ducking_settings.attack_duration:
-                        # Ducking hold state
-                        ducking_is_active = True
-                        g_array_set_val_uint8(player.current.ducking_control_points, control_point, player.current.ducking_settings.attenuation_volume)
-
-                    elif player.current.sample_pos >= player.current.ducking_settings.attack_start_pos:
-                        # Ducking attack stage
-                        ducking_is_active = True
-                        progress = (player.current.sample_pos - player.current.ducking_settings.attack_start_pos) / player.current.ducking_settings.attack_duration
-                        g_array_set_val_uint8(player.current.ducking_control_points,
-                                              control_point,
-                                              lerpU8(in_out_quad(progress),
-                                                     SDL_MIX_MAXVOLUME,
-                                                     player.current.ducking_settings.attenuation_volume
-                                                     )
-                                              )
-
+        cdef Uint8 volume
+        cdef Uint8 ducking_volume
+        cdef Sint32 *accumulator = track.mix_buffer
+
+        # Scheduling (sample positions are measured using the audio clock, in sample frames)
+        cdef Uint32 bytes_per_frame = callback_data.bytes_per_sample * callback_data.channels
+        cdef Uint64 buffer_start_sample = callback_data.sample_clock
+        cdef Uint64 buffer_end_sample = buffer_start_sample + buffer_length // bytes_per_frame
+        cdef Uint64 chunk_start_sample
+        cdef Uint32 start_offset
+        cdef Uint64 mixed_players = 0
+        cdef bint rescan_players = True
+
+        track.active_sound_players = 0
+
+        # Clear the track accumulator (all playing sounds are summed into it and it is then saturated
+        # into the track buffer once all sound players have been mixed)
+        memset(accumulator, 0, (buffer_length // callback_data.bytes_per_sample) * sizeof(Sint32))
+
+        # Loop over track sound players.  A sound that is scheduled to start at a marker of another
+        # sound may be started by a player that is mixed after its own player, in that case the
+        # players are scanned again (players are only mixed once per buffer).
+        while rescan_players:
+            rescan_players = False
+            for player_num in range(standard_track.sound_player_count):
+
+                player = cython.address(standard_track.sound_players[player_num])
+
+                # If the player is idle (or has already been mixed), there is nothing to do so move
+                # on to the next player
+                if player == NULL or player.status == player_idle or mixed_players & (<Uint64>1 << player_num):
+                    continue
+
+                start_offset = 0
+                if player.status == player_scheduled:
+                    # The sound does not start in this buffer (still waiting for a marker or a later sample)
+                    if player.current.start_after_marker != no_scheduled_marker or \
+                            player.current.start_sample >= buffer_end_sample:
+                        continue
+
+                    # Start the sound at the exact sample position in the buffer (a sound whose start
+                    # position has already passed starts at the beginning of the buffer)
+                    if player.current.start_sample > buffer_start_sample:
+                        start_offset = <Uint32>(player.current.start_sample - buffer_start_sample) * bytes_per_frame
+
+                    player.status = player_playing
+                    send_sound_started_notification(player_num, player.current.sound_id, player.current.sound_instance_id, track)
+
+                mixed_players |= <Uint64>1 << player_num
+                track.active_sound_players += 1
+
+                # Set flag indicating there is at least some activity on the track (it is active)
+                track.active = True
+
+                end_of_sound = False
+                track_buffer_pos = start_offset
+                buffer_bytes_remaining = buffer_length - start_offset
+
+                # Loop over output buffer at control rate
+                while buffer_bytes_remaining > 0:
+
+                    # Determine the number of bytes to process in the current chunk (chunks never cross
+                    # a control point boundary)
+                    control_point = track_buffer_pos // callback_data.bytes_per_control_point
+                    current_chunk_bytes = min(buffer_bytes_remaining,
+                                              callback_data.bytes_per_control_point - track_buffer_pos % callback_data.bytes_per_control_point)
+
+                    # Scheduled stop: the chunk ends at the stop position, the sound starts fading out (or
+                    # stops) at the beginning of the chunk that starts at the stop position
+                    if player.current.stop_scheduled:
+                        chunk_start_sample = buffer_start_sample + track_buffer_pos // bytes_per_frame
+                        if chunk_start_sample >= player.current.stop_sample:
+                            player.current.stop_scheduled = False
+                            if player.current.stop_fade_steps > 0:
+                                player.current.fade_out_steps = player.current.stop_fade_steps
+                                player.current.fade_steps_remaining = player.current.stop_fade_steps
+                                player.current.fading_status = fading_status_fading_out
+                                player.status = player_stopping
+                            else:
+                                send_sound_stopped_notification(player_num, player.current.sound_id, player.current.sound_instance_id, track)
+                                cancel_players_scheduled_after(standard_track, player.current.sound_instance_id, track)
+                                set_player_idle(standard_track, player)
+                                break
+                        elif player.current.stop_sample < chunk_start_sample + current_chunk_bytes // bytes_per_frame:
+                            current_chunk_bytes = <Uint32>(player.current.stop_sample - chunk_start_sample) * bytes_per_frame
+
+                    # Calculate volume of chunk (handle fading)
+                    if player.current.fading_status == fading_status_fading_in:
+                        volume = <Uint8> (in_out_quad((player.current.fade_in_steps - player.current.fade_steps_remaining) / player.current.fade_in_steps) * player.current.volume)
+                        player.current.fade_steps_remaining -= 1
+                        if player.current.fade_steps_remaining == 0:
+                            player.current.fading_status = fading_status_not_fading
+                    elif player.current.fading_status == fading_status_fading_out:
+                        volume = <Uint8> (in_out_quad(player.current.fade_steps_remaining / player.current.fade_out_steps) * player.current.volume)
+                        player.current.fade_steps_remaining -= 1
                     else:
-                        # Ducking delay stage
-                        g_array_set_val_uint8(player.current.ducking_control_points,
-                                              control_point,
-                                              SDL_MIX_MAXVOLUME)
-
-                    # Apply ducking to target track(s) (when applicable)
-                    if ducking_is_active:
-                        for track_num in range(callback_data.track_count):
-                            target_track = <TrackState*>callback_data.tracks[track_num]
-                            if (1 << track_num) & player.current.ducking_settings.track_bit_mask:
+                        volume = player.current.volume
+
+                    # Mix samples for chunk into the track accumulator (the volume is ramped from the
+                    # volume of the previous chunk).  When the sound ends, the position of the end of
+                    # the sound in the chunk is stored in end_offset.
+                    player.current.end_offset = current_chunk_bytes
+                    if player.current.sample.type == sound_type_memory:
+                        end_of_sound = get_memory_sound_samples(cython.address(player.current), current_chunk_bytes,
+                                                                accumulator + track_buffer_pos // callback_data.bytes_per_sample,
+                                                                volume_to_gain(volume), track, player_num)
+                    elif player.current.sample.type == sound_type_streaming:
+                        end_of_sound = get_streaming_sound_samples(cython.address(player.current), current_chunk_bytes,
+                                                                   accumulator + track_buffer_pos // callback_data.bytes_per_sample,
+                                                                   volume_to_gain(volume), track, player_num)
+
+                    # Process sound ducking (if applicable).  The ducking volume is looked up in the
+                    # precomputed envelope and applied to each of the target tracks.
+                    if player.current.sound_has_ducking:
+                        ducking_volume = get_ducking_volume(cython.address(player.current), callback_data.bytes_per_control_point)
+                        if ducking_volume < SDL_MIX_MAXVOLUME:
+                            for target_num in range(player.current.ducking_settings.target_track_count):
+                                target_track = <TrackState*>callback_data.tracks[player.current.ducking_settings.target_tracks[target_num]]
                                 target_track.ducking_is_active = True
-                                g_array_set_val_uint8(target_track.ducking_control_points,
-                                                      control_point,
-                                                      min(
-                                                          g_array_index_uint8(
-                                                              target_track.ducking_control_points,
-                                                              control_point),
-                                                          g_array_index_uint8(player.current.ducking_control_points,
-                                                                              control_point)
-                                                      ))
-
-                    # TODO: Hold sound processing until ducking has finished
-                    # It is possible to have the ducking release finish after the sound has stopped.  In that
-                    # case, silence should be generated until the ducking is done.
-
-                # Process markers (do any markers fall in the current chunk?)
-                # Note: the current sample position has already been incremented when the sample data was received so
-                # we need to look backwards from the current position to determine if marker falls in chunk window.
+                                if ducking_volume < g_array_index_uint8(target_track.ducking_control_points, control_point):
+                                    g_array_set_val_uint8(target_track.ducking_control_points, control_point, ducking_volume)
+
+                        # TODO: Hold sound processing until ducking has finished
+                        # It is possible to have the ducking release finish after the sound has stopped.  In that
+                        # case, silence should be generated until the ducking is done.
+
+                    # Process markers (do any markers fall in the current chunk?)
+                    # Note: the current sample position has already been incremented when the sample data was received so
+                    # we need to look backwards from the current position to determine if marker falls in chunk window.
                 
-                # About to finish marker
-                if player.current.about_to_finish_marker != no_marker:
-                    if player.current.sample_pos - current_chunk_bytes <= player.current.about_to_finish_marker < player.current.sample_pos:
-                        # Marker is in window, send notification
-                        send_sound_about_to_finish_notification(player_num,
-                                                                player.current.sound_id,
-                                                                player.current.sound_instance_id,
-                                                                track)
-                    # Special check if buffer wraps back around to the beginning of the sample
-                    if not end_of_sound and player.current.sample_pos - current_chunk_bytes < 0 and player.current.about_to_finish_marker < player.current.sample_pos:
-                        # Marker is in window, send notification
-                        send_sound_about_to_finish_notification(player_num,
-                                                                player.current.sound_id,
-                                                                player.current.sound_instance_id,
-                                                                track)
+                    # About to finish marker
+                    if player.current.about_to_finish_marker != no_marker:
+                        if player.current.sample_pos - current_chunk_bytes <= player.current.about_to_finish_marker < player.current.sample_pos or \
+                                (not end_of_sound and player.current.sample_pos - current_chunk_bytes < 0 and player.current.about_to_finish_marker < player.current.sample_pos):
+                            # Marker is in window (the second check is for when the buffer wraps back
+                            # around to the beginning of the sample), send notification
+                            send_sound_about_to_finish_notification(player_num,
+                                                                    player.current.sound_id,
+                                                                    player.current.sound_instance_id,
+                                                                    track)
+
+                            # Start any sounds scheduled at the about to finish marker (crossfade)
+                            if start_players_scheduled_after_marker(
+                                    standard_track, player.current.sound_instance_id, scheduled_marker_about_to_finish,
+                                    buffer_start_sample + (track_buffer_pos + current_chunk_bytes -
+                                                           (player.current.sample_pos - player.current.about_to_finish_marker)) // bytes_per_frame,
+                                    player_num):
+                                rescan_players = True
                 
-                # User-defined markers
-                for marker_id in range(player.current.marker_count):
-                    if player.current.sample_pos - current_chunk_bytes <= g_array_index_uint(player.current.markers, marker_id) < player.current.sample_pos:
-                        # Marker is in window, send notification
-                        send_sound_marker_notification(player_num,
-                                                       player.current.sound_id,
-                                                       player.current.sound_instance_id,
-                                                       track,
-                                                       marker_id)
-                    # Special check if buffer wraps back around to the beginning of the sample
-                    if not end_of_sound and player.current.sample_pos - current_chunk_bytes < 0 and g_array_index_uint(player.current.markers, marker_id) < player.current.sample_pos:
-                        # Marker is in window, send notification
-                        send_sound_marker_notification(player_num,
-                                                       player.current.sound_id,
-                                                       player.current.sound_instance_id,
-                                                       track,
-                                                       marker_id)
-
-                # Check if sound is finished due to a fade out completing
-                if player.current.fading_status == fading_status_fading_out and player.current.fade_steps_remaining == 0:
-                    end_of_sound = True
-
-                # Sound finished processing
-                if end_of_sound:
-                    send_sound_stopped_notification(player_num, player.current.sound_id, player.current.sound_instance_id, track)
-
-                    # End of sound behavior depends upon player status
-                    if player.status == player_replacing:
-                        # Replacing the current sound with a new one: copy sound player settings from next sound to current
-                        player.current.sample = player.next.sample
-                        player.current.sample_pos = player.next.sample_pos
-                        player.current.current_loop = player.next.current_loop
-                        player.current.sound_id = player.next.sound_id
-                        player.current.sound_instance_id = player.next.sound_instance_id
-                        player.current.volume = player.next.volume
-                        player.current.loops_remaining = player.next.loops_remaining
-                        player.current.sound_priority = player.next.sound_priority
-                        player.current.fade_in_steps = player.next.fade_in_steps
-                        player.current.fade_out_steps = player.next.fade_out_steps
-                        player.current.fade_steps_remaining = player.next.fade_steps_remaining
-                        player.current.fading_status = player.next.fading_status
-                        player.current.about_to_finish_marker = player.next.about_to_finish_marker
-
-                        player.current.marker_count = player.next.marker_count
-                        g_array_set_size(player.current.markers, player.current.marker_count)
-                        for marker_id in range(player.next.marker_count):
-                            g_array_insert_val_uint(player.current.markers,
-                                                    marker_id,
-                                                    g_array_index_uint(player.next.markers, marker_id))
-
-                        if player.next.sound_has_ducking:
-                            player.current.sound_has_ducking = True
-                            player.current.ducking_stage = ducking_stage_delay
-                            player.current.ducking_settings.track_bit_mask = player.next.ducking_settings.track_bit_mask
-                            player.current.ducking_settings.attack_start_pos = player.next.ducking_settings.attack_start_pos
-                            player.current.ducking_settings.attack_duration = player.next.ducking_settings.attack_duration
-                            player.current.ducking_settings.attenuation_volume = player.next.ducking_settings.attenuation_volume
-                            player.current.ducking_settings.release_start_pos = player.next.ducking_settings.release_start_pos
-                            player.current.ducking_settings.release_duration = player.next.ducking_settings.release_duration
+                    # User-defined markers
+                    for marker_id in range(player.current.marker_count):
+                        if player.current.sample_pos - current_chunk_bytes <= g_array_index_uint(player.current.markers, marker_id) < player.current.sample_pos:
+                            # Marker is in window, send notification
+                            send_sound_marker_notification(player_num,
+                                                           player.current.sound_id,
+                                                           player.current.sound_instance_id,
+                                                           track,
+                                                           marker_id)
+
+                            # Start any sounds scheduled at the marker (at the exact marker position)
+                            if start_players_scheduled_after_marker(
+                                    standard_track, player.current.sound_instance_id, marker_id,
+                                    buffer_start_sample + (track_buffer_pos + current_chunk_bytes -
+                                                           (player.current.sample_pos - g_array_index_uint(player.current.markers, marker_id))) // bytes_per_frame,
+                                    player_num):
+                                rescan_players = True
+                        # Special check if buffer wraps back around to the beginning of the sample
+                        if not end_of_sound and player.current.sample_pos - current_chunk_bytes < 0 and g_array_index_uint(player.current.markers, marker_id) < player.current.sample_pos:
+                            # Marker is in window, send notification
+                            send_sound_marker_notification(player_num,
+                                                           player.current.sound_id,
+                                                           player.current.sound_instance_id,
+                                                           track,
+                                                           marker_id)
+
+                    # Check if sound is finished due to a fade out completing
+                    if player.current.fading_status == fading_status_fading_out and player.current.fade_steps_remaining == 0:
+                        end_of_sound = True
+
+                    # Sound finished processing
+                    if end_of_sound:
+                        send_sound_stopped_notification(player_num, player.current.sound_id, player.current.sound_instance_id, track)
+
+                        # Start any sounds scheduled at the end of the sound (gapless), sounds waiting
+                        # for a marker that has not been reached will never start
+                        if start_players_scheduled_after_marker(
+                                standard_track, player.current.sound_instance_id, scheduled_marker_end,
+                                buffer_start_sample + (track_buffer_pos + player.current.end_offset) // bytes_per_frame,
+                                player_num):
+                            rescan_players = True
+                        cancel_players_scheduled_after(standard_track, player.current.sound_instance_id, track)
+
+                        # End of sound behavior depends upon player status
+                        if player.status == player_replacing:
+                            # Replacing the current sound with a new one: copy sound player settings from next sound to current
+                            player.current.sample = player.next.sample
+                            player.current.sample_pos = player.next.sample_pos
+                            player.current.current_loop = player.next.current_loop
+                            player.current.sound_id = player.next.sound_id
+                            player.current.sound_instance_id = player.next.sound_instance_id
+                            player.current.volume = player.next.volume
+                            player.current.mix_gain = player.next.mix_gain
+                            player.current.loops_remaining = player.next.loops_remaining
+                            player.current.sound_priority = player.next.sound_priority
+                            player.current.fade_in_steps = player.next.fade_in_steps
+                            player.current.fade_out_steps = player.next.fade_out_steps
+                            player.current.fade_steps_remaining = player.next.fade_steps_remaining
+                            player.current.fading_status = player.next.fading_status
+                            player.current.about_to_finish_marker = player.next.about_to_finish_marker
+                            player.current.stop_scheduled = False
+
+                            player.current.marker_count = player.next.marker_count
+                            g_array_set_size(player.current.markers, player.current.marker_count)
+                            for marker_id in range(player.next.marker_count):
+                                g_array_insert_val_uint(player.current.markers,
+                                                        marker_id,
+                                                        g_array_index_uint(player.next.markers, marker_id))
+
+                            # The precomputed ducking envelopes are swapped (no memory is allocated in
+                            # the audio thread)
+                            player.current.sound_has_ducking = player.next.sound_has_ducking
+                            player.current.ducking_stage = ducking_stage_delay if player.next.sound_has_ducking else ducking_stage_idle
+                            player.current.ducking_settings = player.next.ducking_settings
+                            ducking_envelope = player.current.ducking_envelope
+                            player.current.ducking_envelope = player.next.ducking_envelope
+                            player.next.ducking_envelope = ducking_envelope
+
+                            # Send sound started notification
+                            send_sound_started_notification(player_num, player.current.sound_id, player.current.sound_instance_id, track)
+                            player.status = player_playing
+                            sound_finished = False
                         else:
-                            player.current.sound_has_ducking = False
-                            player.current.ducking_stage = ducking_stage_idle
-                            player.current.ducking_settings.track_bit_mask = 0
-                            player.current.ducking_settings.attack_start_pos = 0
-                            player.current.ducking_settings.attack_duration = 0
-                            player.current.ducking_settings.attenuation_volume = SDL_MIX_MAXVOLUME
-                            player.current.ducking_settings.release_start_pos = 0
-                            player.current.ducking_settings.release_duration = 0
-
-                        # Send sound started notification
-                        send_sound_started_notification(player_num, player.current.sound_id, player.current.sound_instance_id, track)
-                        player.status = player_playing
-                        sound_finished = False
-                    else:
-                        player.status = player_idle
-                        break
+                            set_player_idle(standard_track, player)
+                            break
 
-                # Move to next chunk
-                buffer_bytes_remaining -= current_chunk_bytes
-                track_buffer_pos += current_chunk_bytes
-                control_point += 1
+                    # Move to next chunk
+                    buffer_bytes_remaining -= current_chunk_bytes
+                    track_buffer_pos += current_chunk_bytes
 
-cdef bint get_memory_sound_samples(SoundSettings *sound, Uint32 length, Uint8 *output_buffer, Uint8 volume,
+        # Saturate the accumulated sounds into the track buffer
+        if track.active:
+            saturate_accumulator_to_s16(<Sint16*>track.buffer, accumulator,
+                                        buffer_length // callback_data.bytes_per_sample)
+
+cdef bint get_memory_sound_samples(SoundSettings *sound, Uint32 length, Sint32 *accumulator, Sint32 target_gain,
                                    TrackState *track, int player_num) nogil:
     """
     Retrieves the specified number of bytes from the source sound memory buffer and mixes them into
-    the track output buffer at the specified volume.
+    the track accumulator buffer, ramping the gain from the sound's previous gain to the target gain.
 
     Args:
         sound: A pointer to a SoundSettings struct (contains all sound state and settings to play the sound)
         length: The number of samples to retrieve and place in the output buffer
-        output_buffer: The output buffer
-        volume: The volume to apply to the output buffer (fixed for the duration of this method)
+        accumulator: The track accumulator buffer
+        target_gain: The Q16 gain to reach at the end of the chunk
         track: A pointer to the TrackState struct for the current track
         player_num: The sound player number currently playing the sound (used for notification messages)
 
     Returns:
         True if sound is finished, False otherwise
     """
-    if sound == NULL or output_buffer == NULL:
+    if sound == NULL or accumulator == NULL:
         return True
 
     cdef Uint32 samples_remaining_to_output = length
     cdef Uint32 samples_remaining_in_sound
     cdef Uint32 buffer_pos = 0
+    cdef Uint8 bytes_per_sample = track.callback_data.bytes_per_sample
+    cdef Sint32 gain = sound.mix_gain
+    cdef Sint32 step = gain_step(sound.mix_gain, target_gain, length // bytes_per_sample)
     cdef Uint8 *sound_buffer = <Uint8*>sound.sample.data.memory.data
     if sound_buffer == NULL:
         return True
 
+    sound.mix_gain = target_gain
+
     while samples_remaining_to_output > 0:
 
         # Determine how many samples are remaining in the sound buffer before the end of the sound
@@ -1526,7 +1672,9 @@ cdef bint get_memory_sound_samples(SoundSettings *sound, Uint32 length, Uint8 *o
         # Determine if we are consuming the entire remaining sound buffer, or just a portion of it
         if samples_remaining_to_output < samples_remaining_in_sound:
             # We are not consuming the entire streaming buffer.  There will still be buffer data remaining for the next call.
-            SDL_MixAudioFormat(output_buffer + buffer_pos, <Uint8*>sound.sample.data.memory.data + sound.sample_pos, track.callback_data.format, samples_remaining_to_output, volume)
+            mix_s16_to_accumulator(accumulator + buffer_pos // bytes_per_sample,
+                                   <Sint16*>(sound_buffer + sound.sample_pos),
+                                   samples_remaining_to_output // bytes_per_sample, gain, step)
 
             # Update buffer position pointers
             sound.sample_pos += samples_remaining_to_output
@@ -1535,12 +1683,15 @@ cdef bint get_memory_sound_samples(SoundSettings *sound, Uint32 length, Uint8 *o
             return False
         else:
             # Entire sound buffer consumed. Mix in remaining samples
-            SDL_MixAudioFormat(output_buffer + buffer_pos, <Uint8*>sound.sample.data.memory.data + sound.sample_pos, track.callback_data.format, samples_remaining_in_sound, volume)
+            mix_s16_to_accumulator(accumulator + buffer_pos // bytes_per_sample,
+                                   <Sint16*>(sound_buffer + sound.sample_pos),
+                                   samples_remaining_in_sound // bytes_per_sample, gain, step)
 
             # Update buffer position pointers/samples remaining to place in the output buffer
             samples_remaining_to_output -= samples_remaining_in_sound
             sound.sample_pos += samples_remaining_in_sound
             buffer_pos += samples_remaining_in_sound
+            gain += step * <Sint32>(samples_remaining_in_sound // bytes_per_sample)
 
         # Check if we are at the end of the source sample buffer (loop if applicable)
         if sound.sample_pos >= sound.sample.data.memory.size:
@@ -1553,6 +1704,7 @@ cdef bint get_memory_sound_samples(SoundSettings *sound, Uint32 length, Uint8 *o
 
             elif sound.loops_remaining == 0:
                 # At the end and not looping, the sample has finished playing (return True for end of sound)
+                sound.end_offset = length - samples_remaining_to_output
                 return True
 
             else:
@@ -1563,17 +1715,18 @@ cdef bint get_memory_sound_samples(SoundSettings *sound, Uint32 length, Uint8 *o
 
     return False
 
-cdef bint get_streaming_sound_samples(SoundSettings *sound, Uint32 length, Uint8 *output_buffer, Uint8 volume,
+cdef bint get_streaming_sound_samples(SoundSettings *sound, Uint32 length, Sint32 *accumulator, Sint32 target_gain,
                                       TrackState *track, int player_num) nogil:
     """
     Retrieves the specified number of bytes from the source sound streaming buffer and mixes them
-    into the track output buffer at the specified volume.
+    into the track accumulator buffer, ramping the gain from the sound's previous gain to the
+    target gain.
 
     Args:
         sound: A pointer to a SoundSettings struct (contains all sound state and settings to play the sound)
         length: The number of samples to retrieve and place in the output buffer
-        output_buffer: The output buffer
-        volume: The volume to apply to the output buffer (fixed for the duration of this method)
+        accumulator: The track accumulator buffer
+        target_gain: The Q16 gain to reach at the end of the chunk
         track: A pointer to the TrackState struct for the current track
         player_num: The sound player number currently playing the sound (used for notification messages)
 
@@ -1587,12 +1740,17 @@ cdef bint get_streaming_sound_samples(SoundSettings *sound, Uint32 length, Uint8
         completely consumed.  At which point either the sound ends if the source reports is at the
         end of stream (eos), or another buffer is pulled.
     """
-    if sound == NULL or output_buffer == NULL or sound.sample.data.stream.pipeline == NULL:
+    if sound == NULL or accumulator == NULL or sound.sample.data.stream.pipeline == NULL:
         return True
 
     cdef Uint32 samples_remaining_to_output = length
     cdef Uint32 samples_remaining_in_map
     cdef Uint32 buffer_pos = 0
+    cdef Uint8 bytes_per_sample = track.callback_data.bytes_per_sample
+    cdef Sint32 gain = sound.mix_gain
+    cdef Sint32 step = gain_step(sound.mix_gain, target_gain, length // bytes_per_sample)
+
+    sound.mix_gain = target_gain
 
     while samples_remaining_to_output > 0:
 
@@ -1603,7 +1761,9 @@ cdef bint get_streaming_sound_samples(SoundSettings *sound, Uint32 length, Uint8
             # Determine if we are consuming the entire buffer of streaming samples, or just a portion of it
             if samples_remaining_to_output < samples_remaining_in_map:
                 # We are not consuming the entire streaming buffer.  There will still be buffer data remaining for the next call.
-                SDL_MixAudioFormat(output_buffer + buffer_pos, sound.sample.data.stream.map_info.data + sound.sample.data.stream.map_buffer_pos, track.callback_data.format, samples_remaining_to_output, volume)
+                mix_s16_to_accumulator(accumulator + buffer_pos // bytes_per_sample,
+                                       <Sint16*>(sound.sample.data.stream.map_info.data + sound.sample.data.stream.map_buffer_pos),
+                                       samples_remaining_to_output // bytes_per_sample, gain, step)
 
                 # Update buffer position pointers
                 sound.sample.data.stream.map_buffer_pos += samples_remaining_to_output
@@ -1613,12 +1773,15 @@ cdef bint get_streaming_sound_samples(SoundSettings *sound, Uint32 length, Uint8
                 return False
             else:
                 # Entire buffer of leftover samples consumed.  Free the buffer resources to prepare for next call
-                SDL_MixAudioFormat(output_buffer + buffer_pos, sound.sample.data.stream.map_info.data + sound.sample.data.stream.map_buffer_pos, track.callback_data.format, samples_remaining_in_map, volume)
+                mix_s16_to_accumulator(accumulator + buffer_pos // bytes_per_sample,
+                                       <Sint16*>(sound.sample.data.stream.map_info.data + sound.sample.data.stream.map_buffer_pos),
+                                       samples_remaining_in_map // bytes_per_sample, gain, step)
 
                 # Update buffer position pointers/samples remaining to place in the output buffer
                 samples_remaining_to_output -= samples_remaining_in_map
                 sound.sample_pos += samples_remaining_in_map
                 buffer_pos += samples_remaining_in_map
+                gain += step * <Sint32>(samples_remaining_in_map // bytes_per_sample)
 
                 # Done with the streaming buffer, release references to it
                 gst_buffer_unmap(sound.sample.data.stream.buffer, &sound.sample.data.stream.map_info)
@@ -1642,6 +1805,7 @@ cdef bint get_streaming_sound_samples(SoundSettings *sound, Uint32 length, Uint8
 
             elif sound.loops_remaining == 0:
                 # At the end and not looping, the sample has finished playing (return True for end of sound)
+                sound.end_offset = length - samples_remaining_to_output
                 return True
 
             else:
@@ -1658,9 +1822,11 @@ cdef bint get_streaming_sound_samples(SoundSettings *sound, Uint32 length, Uint8
 
         if sound.sample.data.stream.sample == NULL:
             sound.sample.data.stream.null_buffer_count += 1
+            track.streaming_underruns += 1
 
             # If we've received too many consecutive null buffers, end the sound
             if sound.sample.data.stream.null_buffer_count > CONSECUTIVE_NULL_STREAMING_BUFFER_LIMIT:
+                sound.end_offset = length - samples_remaining_to_output
                 return True
         else:
             sound.sample.data.stream.null_buffer_count = 0
@@ -1678,3 +1844,67 @@ cdef bint get_streaming_sound_samples(SoundSettings *sound, Uint32 length, Uint8
     # The sound has not finished playing, but the output buffer has been filled
     return False
 
+
+cdef bint start_players_scheduled_after_marker(TrackStandardState *standard_track, Uint64 sound_instance_id,
+                                               int marker_id, Uint64 start_sample, int player_num) nogil:
+    """
+    Sets the start position of all sound players waiting for the specified marker of a sound instance.
+    Args:
+        standard_track: A pointer to the TrackStandardState struct for the track
+        sound_instance_id: The sound instance id of the sound that has reached the marker
+        marker_id: The marker that has been reached
+        start_sample: The audio clock sample position of the marker
+        player_num: The sound player number playing the sound that has reached the marker
+
+    Returns:
+        True if a sound player that has already been processed in the current buffer (a lower
+        player number) has been set to start, False otherwise
+
+    Notes:
+        When a sound that fades in is started at the about to finish marker, the sound that has
+        reached the marker fades out over the same number of steps (crossfade).
+    """
+    cdef SoundPlayer *player
+    cdef SoundPlayer *marker_player = cython.address(standard_track.sound_players[player_num])
+    cdef bint player_skipped = False
+
+    for index in range(standard_track.sound_player_count):
+        player = cython.address(standard_track.sound_players[index])
+        if player.status == player_scheduled and \
+                player.current.start_after_marker == marker_id and \
+                player.current.start_after_instance_id == sound_instance_id:
+            player.current.start_after_marker = no_scheduled_marker
+            player.current.start_sample = start_sample
+            if index < player_num:
+                player_skipped = True
+
+            if marker_id == scheduled_marker_about_to_finish and player.current.fade_in_steps > 0 and \
+                    marker_player.status != player_replacing and \
+                    marker_player.current.fading_status != fading_status_fading_out:
+                marker_player.current.fade_out_steps = player.current.fade_in_steps
+                marker_player.current.fade_steps_remaining = player.current.fade_in_steps
+                marker_player.current.fading_status = fading_status_fading_out
+                marker_player.status = player_stopping
+
+    return player_skipped
+
+cdef void cancel_players_scheduled_after(TrackStandardState *standard_track, Uint64 sound_instance_id,
+                                         TrackState *track) nogil:
+    """
+    Stops all sound players waiting for a marker of a sound instance that has stopped (the marker
+    will never be reached).
+    Args:
+        standard_track: A pointer to the TrackStandardState struct for the track
+        sound_instance_id: The sound instance id of the sound that has stopped
+        track: A pointer to the TrackState struct for the track
+    """
+    cdef SoundPlayer *player
+
+    for index in range(standard_track.sound_player_count):
+        player = cython.address(standard_track.sound_players[index])
+        if player.status == player_scheduled and \
+                player.current.start_after_marker != no_scheduled_marker and \
+                player.current.start_after_instance_id == sound_instance_id:
+            set_player_idle(standard_track, player)
+            send_sound_stopped_notification(index, player.current.sound_id, player.current.sound_instance_id, track)
+            cancel_players_scheduled_after(standard_track, player.current.sound_instance_id, track)
@@ -0,0 +1,113 @@
+"""Voice allocator keeping track of the sound instances assigned to the sound players of a track."""
+from heapq import heappush, heappop, heapify
+
+
+class VoiceAllocator(object):
+
+    """Keeps track of the sound instance assigned to each sound player of a track.
+
+    Busy sound players are kept in a min-heap ordered by the priority of their
+    sound instance (then by player number) so the player to steal can be found
+    without scanning all the players. Assigned sound instances are indexed by
+    sound instance id and by sound id (used for simultaneous_limit checks and
+    sound stealing). Releasing a player only marks its heap entry as removed;
+    removed entries are discarded once they reach the top of the heap (lazy
+    deletion) and the heap is compacted when it holds more removed entries than
+    busy players.
+
+    Idle sound players are tracked by the audio library itself (players become
+    idle in the audio thread), the allocator is updated when a sound instance
+    is assigned to a player and when the sound stopped notification is processed.
+    """
+
+    __slots__ = ["_heap", "_entries", "_players_by_instance_id", "_instances_by_sound_id", "_removed_count",
+                 "_sequence"]
+
+    def __init__(self, player_count):
+        """Initialise voice allocator."""
+        self._heap = list()
+        self._entries = [None] * player_count
+        self._players_by_instance_id = dict()
+        self._instances_by_sound_id = dict()
+        self._removed_count = 0
+        self._sequence = 0
+
+    def __len__(self):
+        """Return the number of sound players with an assigned sound instance."""
+        return len(self._players_by_instance_id)
+
+    def assign(self, player, sound_instance):
+        """Assign a sound instance to a sound player (replaces any sound instance already assigned
+        to the player)."""
+        self._release_player(player)
+
+        # The sequence number ensures sound instances are never compared (the previous entry of
+        # the player may still be in the heap)
+        self._sequence += 1
+        entry = (sound_instance.priority, player, self._sequence, sound_instance)
+        self._entries[player] = entry
+        heappush(self._heap, entry)
+        self._players_by_instance_id[sound_instance.id] = player
+        self._instances_by_sound_id.setdefault(sound_instance.sound_id, dict())[sound_instance.id] = sound_instance
+
+    def release(self, sound_instance_id):
+        """Release the sound player assigned to a sound instance (does nothing if the sound
+        instance is no longer assigned to a player)."""
+        player = self._players_by_instance_id.get(sound_instance_id)
+        if player is not None:
+            self._release_player(player)
+
+    def _release_player(self, player):
+        """Release a sound player (the heap entry is marked as removed)."""
+        entry = self._entries[player]
+        if entry is None:
+            return
+
+        sound_instance = entry[3]
+        self._entries[player] = None
+        del self._players_by_instance_id[sound_instance.id]
+        instances = self._instances_by_sound_id[sound_instance.sound_id]
+        del instances[sound_instance.id]
+        if not instances:
+            del self._instances_by_sound_id[sound_instance.sound_id]
+
+        self._removed_count += 1
+        if self._removed_count > len(self._players_by_instance_id):
+            self._compact()
+
+    def _compact(self):
+        """Remove all the removed entries from the heap."""
+        self._heap = [entry for entry in self._entries if entry is not None]
+        heapify(self._heap)
+        self._removed_count = 0
+
+    def get_player(self, sound_instance_id):
+        """Return the sound player assigned to a sound instance (-1 if none)."""
+        return self._players_by_instance_id.get(sound_instance_id, -1)
+
+    def get_lowest_priority_player(self):
+        """Return a tuple containing the busy sound player playing the sound instance with the
+        lowest priority (the lowest player number when several have the same priority) and that
+        priority, or (-1, None) when no sound player is busy."""
+        heap = self._heap
+        while heap:
+            entry = heap[0]
+            if self._entries[entry[1]] is entry:
+                return entry[1], entry[0]
+
+            heappop(heap)
+            self._removed_count -= 1
+
+        return -1, None
+
+    def get_sound_instances(self, sound_id):
+        """Return the list of sound instances of a sound that are assigned to a sound player."""
+        instances = self._instances_by_sound_id.get(sound_id)
+        if not instances:
+            return list()
+        return list(instances.values())
+
+    def get_sound_instance_count(self, sound_id):
+        """Return the number of sound instances of a sound that are assigned to a sound player."""
+        instances = self._instances_by_sound_id.get(sound_id)
+        return len(instances) if instances else 0
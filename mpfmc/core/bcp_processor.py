@@ -2,13 +2,14 @@ from copy import deepcopy
 
 import queue
 import logging
+import time
 from distutils.version import LooseVersion
 
 import psutil
-from kivy.clock import Clock
 
 import mpf.core.bcp.bcp_socket_client as bcp
 from mpfmc._version import __bcp_version__
+from mpfmc.core.bcp_recorder import BcpRecorder
 from mpfmc.core.bcp_server import BCPServer
 
 
@@ -31,6 +32,12 @@ class BcpProcessor(object):
 
         self.debug_log = self.mc.machine_config['bcp']['debug']
 
+        recorder_config = self.mc.machine_config['mpf-mc']['bcp_recorder']
+        if self.enabled and recorder_config['enabled']:
+            self.recorder = BcpRecorder(self.mc, recorder_config['file'])
+        else:
+            self.recorder = None
+
         self.bcp_commands = {'error': self._bcp_error,
                              'goodbye': self._bcp_goodbye,
                              'hello': self._bcp_hello,
@@ -52,7 +59,7 @@ class BcpProcessor(object):
         self.mc.events.add_handler('client_connected', self._client_connected)
         self.mc.events.add_handler('mc_reset_complete', self._reset_complete)
 
-        Clock.schedule_interval(self._get_from_queue, 0)
+        self.mc.frame_pipeline.add_callback('bcp', self._get_from_queue)
 
     def _client_connected(self, **kwargs):
         del kwargs
@@ -77,7 +84,7 @@ class BcpProcessor(object):
             return
 
         self.socket_thread = BCPServer(self.mc, self.receive_queue,
-                                       self.sending_queue)
+                                       self.sending_queue, self.recorder)
         self.socket_thread.daemon = True
         self.socket_thread.start()
 
@@ -121,15 +128,25 @@ class BcpProcessor(object):
 
         """
         cmd, kwargs = bcp.decode_command_string(msg)
-        self.receive_queue.put((cmd, kwargs))
+        self.receive_queue.put((cmd, kwargs, time.perf_counter()))
 
     def _get_from_queue(self, dt):
         """Gets and processes all queued up incoming BCP commands."""
         del dt
 
+        if self.receive_queue.empty():
+            return
+
+        # BCP commands need the normal frame rate
+        self.mc.render_scheduler.wake()
+
+        tracer = self.mc.latency_tracer
         while not self.receive_queue.empty():
-            cmd, kwargs = self.receive_queue.get(False)
-            self._process_command(cmd, **kwargs)
+            # (command, kwargs, receive time) or (command, kwargs)
+            item = self.receive_queue.get(False)
+            if tracer.enabled:
+                tracer.begin(item[0], item[1], item[2] if len(item) > 2 else None)
+            self._process_command(item[0], **item[1])
 
     def _process_command(self, bcp_command, **kwargs):
         if self.debug_log:
@@ -156,10 +173,16 @@ class BcpProcessor(object):
         """Status request."""
         del kwargs
 
+        # Include the audio engine performance counters (if the sound system is enabled)
+        audio_status = dict()
+        if self.mc.sound_system:
+            audio_status = self.mc.sound_system.get_performance_summary() or dict()
+
         self.send("status_report",
                   cpu=self.mc_process.cpu_percent(),
                   rss=self.mc_process.memory_info().rss,
-                  vms=self.mc_process.memory_info().vms)
+                  vms=self.mc_process.memory_info().vms,
+                  **audio_status)
 
     def _bcp_hello(self, **kwargs):
         """Processes an incoming BCP 'hello' command."""
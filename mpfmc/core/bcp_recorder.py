@@ -0,0 +1,249 @@
+"""Recorder which writes the received BCP commands to a compact binary log and replayer which
+feeds a log back into the media controller."""
+import gzip
+import logging
+import os
+import queue
+import struct
+import threading
+import time
+from typing import Iterator, List, Optional, Tuple
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from mpfmc.core.mc import MpfMc
+
+# First bytes of a BCP log (followed by the wall clock time the recording started)
+HEADER = b'MPFBCP\x01\n'
+HEADER_TIME = struct.Struct('<d')
+
+# Each record is the time since the recording started (in seconds), the length of
+# the message and the utf-8 encoded message
+RECORD = struct.Struct('<dI')
+
+# Percentiles of the frame times and queue depths collected by the replayer
+PERCENTILES = (50, 95, 99)
+
+
+def read_bcp_log(file_name: str) -> Iterator[Tuple[float, str]]:
+    """Read a BCP log and yield the (time, message) tuples of its records."""
+    with gzip.open(file_name, 'rb') as log_file:
+        if log_file.read(len(HEADER)) != HEADER:
+            raise ValueError('{} is not a BCP log'.format(file_name))
+
+        log_file.read(HEADER_TIME.size)
+
+        while True:
+            record = log_file.read(RECORD.size)
+            if len(record) < RECORD.size:
+                # end of the log (the last record may be cut off when the mc crashed)
+                return
+
+            offset, length = RECORD.unpack(record)
+            message = log_file.read(length)
+            if len(message) < length:
+                return
+
+            yield offset, message.decode('utf-8')
+
+
+class BcpRecorder(object):
+
+    """Writes all the received BCP commands (with the time they were received) to a log.
+
+    The BCP server thread only adds the received messages to a queue, the log
+    is compressed and written by a background thread (and flushed each
+    second while no messages are received). The recorder is controlled by the
+    ``mpf-mc: bcp_recorder:`` settings and stops when the mc shuts down. Use
+    ``read_bcp_log()`` to read a log and the ``BcpReplayer`` to replay it.
+    """
+
+    def __init__(self, mc: "MpfMc", file_name: str) -> None:
+        """Initialise recorder and start the writer thread."""
+        self.mc = mc
+        self.log = logging.getLogger('BcpRecorder')
+
+        if not os.path.isabs(file_name):
+            file_name = os.path.join(self.mc.machine_path, file_name)
+        self.file = file_name
+
+        self.count = 0
+        """Number of messages written to the log."""
+
+        self._start = None      # type: Optional[float]
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._write_log, name='BcpRecorder')
+        self._thread.daemon = True
+        self._thread.start()
+
+        self.mc.events.add_handler('shutdown', self._shutdown)
+
+    def record(self, message: str, received: Optional[float] = None) -> None:
+        """Add a received message to the log (called by the BCP server thread)."""
+        if received is None:
+            received = time.perf_counter()
+        if self._start is None:
+            self._start = received
+
+        self._queue.put((received - self._start, message))
+
+    def stop(self) -> None:
+        """Write the remaining messages and close the log."""
+        if self._thread is None:
+            return
+
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+        self.log.info("%s BCP messages written to %s", self.count, self.file)
+
+    def _write_log(self) -> None:
+        """Write the queued messages to the log (runs in the writer thread)."""
+        os.makedirs(os.path.dirname(self.file), exist_ok=True)
+
+        with gzip.open(self.file, 'wb') as log_file:
+            log_file.write(HEADER)
+            log_file.write(HEADER_TIME.pack(time.time()))
+
+            while True:
+                try:
+                    item = self._queue.get(timeout=1)
+                except queue.Empty:
+                    log_file.flush()
+                    if self.mc.thread_stopper.is_set():
+                        return
+                    continue
+
+                if item is None:
+                    return
+
+                offset, message = item
+                message = message.encode('utf-8')
+                log_file.write(RECORD.pack(offset, len(message)))
+                log_file.write(message)
+                self.count += 1
+
+    def _shutdown(self, **kwargs):
+        del kwargs
+        self.stop()
+
+
+class BcpReplayer(object):
+
+    """Feeds the messages of a BCP log into the media controller at the recorded times.
+
+    The messages are passed to ``BcpProcessor.receive_bcp_message()`` from the
+    bcp stage of the frame pipeline (and processed in the next frame, like
+    messages received by the BCP server). With a ``speed`` of 1 the messages
+    are replayed in real time, with a speed of N they are replayed N times
+    faster. With a speed of 0 they are replayed as fast as possible: each
+    frame replays the messages of one frame (at the configured fps) without
+    waiting, so the frames run back to back.
+
+    While the log is replayed, the replayer collects the time of each frame
+    and the number of messages queued for the next frame (the queue depth).
+    """
+
+    def __init__(self, mc: "MpfMc", file_name: str, speed: float = 1.0) -> None:
+        """Read the log."""
+        self.mc = mc
+        self.log = logging.getLogger('BcpReplayer')
+        self.file = file_name
+        self.speed = speed
+
+        self._records = list(read_bcp_log(file_name))
+        self._index = 0
+        self._replay_time = 0.0
+        self._frame_step = 1 / int(self.mc.machine_config['mpf-mc']['fps'])
+        self._start = None      # type: Optional[float]
+        self._last_frame = None     # type: Optional[float]
+
+        self.frame_times = list()       # type: List[float]
+        """Time (in seconds) of each frame while the log was replayed."""
+
+        self.queue_depths = list()      # type: List[int]
+        """Number of messages queued for the next frame after each frame."""
+
+    @property
+    def count(self) -> int:
+        """Return the number of messages in the log."""
+        return len(self._records)
+
+    @property
+    def done(self) -> bool:
+        """Return True when all the messages have been replayed."""
+        return self._index >= len(self._records)
+
+    def start(self) -> None:
+        """Start replaying the log."""
+        self.log.info("Replaying %s BCP messages from %s (speed: %s)", len(self._records), self.file,
+                      self.speed or "as fast as possible")
+        self._index = 0
+        self._replay_time = 0.0
+        self._start = time.perf_counter()
+        self._last_frame = None
+        self.frame_times = list()
+        self.queue_depths = list()
+        self.mc.frame_pipeline.add_callback('bcp', self._replay)
+
+    def stop(self) -> None:
+        """Stop replaying the log."""
+        self.mc.frame_pipeline.remove_callback('bcp', self._replay)
+
+    def _replay(self, dt) -> None:
+        del dt
+        now = time.perf_counter()
+        if self._last_frame is not None:
+            self.frame_times.append(now - self._last_frame)
+        self._last_frame = now
+
+        if self.speed:
+            self._replay_time = (now - self._start) * self.speed
+        else:
+            self._replay_time += self._frame_step
+
+        records = self._records
+        receive = self.mc.bcp_processor.receive_bcp_message
+        while self._index < len(records) and records[self._index][0] <= self._replay_time:
+            receive(records[self._index][1])
+            self._index += 1
+
+        self.queue_depths.append(self.mc.bcp_processor.receive_queue.qsize())
+
+        if self.done:
+            self.stop()
+            self.log.info("Replay done")
+
+    @staticmethod
+    def _summarize(values: list) -> dict:
+        """Return the percentiles and the maximum of a list of values."""
+        values = sorted(values)
+        if not values:
+            values = [0]
+
+        # nearest-rank percentiles
+        summary = {'p{}'.format(percentile): values[max(0, -(-len(values) * percentile // 100) - 1)]
+                   for percentile in PERCENTILES}
+        summary['max'] = values[-1]
+        return summary
+
+    def get_stats(self) -> dict:
+        """Return the frame time (in seconds) and queue depth statistics of the replay."""
+        return {
+            'messages': self._index,
+            'frames': len(self.frame_times),
+            'duration': sum(self.frame_times),
+            'frame': self._summarize(self.frame_times),
+            'queue_depth': self._summarize(self.queue_depths),
+        }
+
+    def get_report(self) -> list:
+        """Return the statistics of the replay as lines of text (times in milliseconds)."""
+        stats = self.get_stats()
+        lines = ["{} messages replayed in {} frames ({:.2f} s)".format(
+            stats['messages'], stats['frames'], stats['duration']),
+            "{:<12}{:>9}{:>9}{:>9}{:>9}".format("", *stats['frame'].keys())]
+        lines.append("{:<12}{:>9.2f}{:>9.2f}{:>9.2f}{:>9.2f}".format(
+            "frame (ms)", *(x * 1000.0 for x in stats['frame'].values())))
+        lines.append("{:<12}{:>9}{:>9}{:>9}{:>9}".format("queue depth", *stats['queue_depth'].values()))
+        return lines
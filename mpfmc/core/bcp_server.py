@@ -22,16 +22,19 @@ class BCPServer(threading.Thread):
             commands.
         sending_queue: A shared Queue() object which holds outgoing BCP
             commands.
+        recorder: Optional BcpRecorder which records the incoming BCP
+            messages.
 
     """
 
-    def __init__(self, mc, receiving_queue, sending_queue):
+    def __init__(self, mc, receiving_queue, sending_queue, recorder=None):
 
         threading.Thread.__init__(self)
         self.mc = mc
         self.log = logging.getLogger('MPF-MC BCP Server')
         self.receive_queue = receiving_queue
         self.sending_queue = sending_queue
+        self.recorder = recorder
         self.connection = None
         self.socket = None
         self.done = False
@@ -243,9 +246,14 @@ class BCPServer(threading.Thread):
         """
         self.log.debug('Received "%s"', message)
 
+        # the receive time is used by the latency tracer and the recorder
+        received = time.perf_counter()
+        if self.recorder:
+            self.recorder.record(message, received)
+
         try:
             cmd, kwargs = bcp.decode_command_string(message)
-            self.receive_queue.put((cmd, kwargs))
+            self.receive_queue.put((cmd, kwargs, received))
         except ValueError:
             self.log.error("DECODE BCP ERROR. Message: %s", message)
             raise
@@ -1,9 +1,6 @@
 """DMD (hardware device)."""
 import struct
 
-from kivy.graphics.instructions import Callback
-from kivy.uix.effectwidget import EffectWidget
-
 from kivy.clock import Clock
 from kivy.graphics.fbo import Fbo
 from kivy.graphics.opengl import glReadPixels, GL_RGB, GL_UNSIGNED_BYTE
@@ -12,6 +9,7 @@ from kivy.graphics.texture import Texture
 from mpfmc.effects.gain import GainEffect
 from mpfmc.effects.flip_vertical import FlipVerticalEffect
 from mpfmc.effects.gamma import GammaEffect
+from mpfmc.widgets.effect_widget import EffectWidget
 
 MYPY = False
 if MYPY:   # pragma: no cover
@@ -25,6 +23,8 @@ class DmdBase(object):
 
     def __init__(self, mc: "MpfMc", name: str, config: dict) -> None:
         """Initialise DMD."""
+        # Import here to prevent the displays being imported before the config is read
+        from mpfmc.uix.display import DisplayOutput
 
         self.mc = mc
         self.name = name
@@ -36,6 +36,8 @@ class DmdBase(object):
         self.source = self.mc.displays[self.config['source_display']]
         self.prev_data = None
         self._dirty = True
+        self._frame_interval = 0
+        self._next_frame_time = 0
 
         # put the widget canvas on a Fbo
         texture = Texture.create(size=self.source.size, colorfmt='rgb')
@@ -56,13 +58,17 @@ class DmdBase(object):
         if self.config['gamma'] != 1.0:
             effect_list.append(GammaEffect(gamma=self.config['gamma']))
 
-        self.effect_widget.effects = effect_list
+        self.effect_widget.effects = self.mc.effects_manager.compile_effects(effect_list)
         self.effect_widget.size = self.source.size
 
         self.fbo.add(self.effect_widget.canvas)
 
-        with self.source.canvas:
-            self.callback = Callback(self._trigger_rendering)
+        # show the cached texture of the source display (rendered by the render scheduler)
+        self.display_output = DisplayOutput(self.effect_widget, self.source)
+        self.effect_widget.add_widget(self.display_output)
+        self.display_output.add_display_source(self.source)
+        self.mc.render_scheduler.add_listener(self.source, self._trigger_rendering)
+        self.mc.latency_tracer.add_dmd_source(self.source)
 
         self._set_dmd_fps()
 
@@ -99,16 +105,25 @@ class DmdBase(object):
             fps = Clock._max_fps
             update = 0
 
-        Clock.schedule_interval(self.tick, update)
+        # the frames are read back and sent in the readback stage of the frame pipeline
+        # (at most once per update interval)
+        self._frame_interval = update
+        self.mc.frame_pipeline.add_callback('readback', self.tick)
         self.mc.log.info("Setting %s to %sfps",
                          DmdBase.dmd_name_string, fps)
 
-    def tick(self, *args) -> None:
-        """Draw image for DMD and send it."""
-        del args
-        # run this at the end of the tick to make sure all kivy bind callbacks have executed
-        if self._dirty:
-            Clock.schedule_once(self._render, -1)
+    def tick(self, dt) -> None:
+        """Draw image for DMD and send it (when the source display changed)."""
+        if not self._dirty:
+            return
+
+        if self._frame_interval:
+            now = Clock.time()
+            if now < self._next_frame_time:
+                return
+            self._next_frame_time = max(self._next_frame_time + self._frame_interval, now)
+
+        self._render(dt)
 
     def _render(self, dt):
         del dt
@@ -116,34 +131,27 @@ class DmdBase(object):
         widget = self.source
         fbo = self.fbo
 
-        # detach the widget from the parent
-        parent = widget.parent
-        if parent:
-            parent.remove_display_source(widget)
-
-        # clear the fbo background
-        fbo.bind()
-        fbo.clear_buffer()
-        fbo.release()
-
-        self.effect_widget.add_widget(widget.container)
-
-        fbo.draw()
-
-        fbo.bind()
-        data = glReadPixels(0, 0, widget.native_size[0], widget.native_size[1],
-                            GL_RGB, GL_UNSIGNED_BYTE)
-        fbo.release()
+        with self.mc.profiler.measure('readback'):
+            # clear the fbo background
+            fbo.bind()
+            fbo.clear_buffer()
+            fbo.release()
 
-        self.effect_widget.remove_widget(widget.container)
+            fbo.ask_update()
+            fbo.draw()
 
-        # reattach to the parent
-        if parent:
-            parent.add_display_source(widget)
+            fbo.bind()
+            data = glReadPixels(0, 0, widget.native_size[0], widget.native_size[1],
+                                GL_RGB, GL_UNSIGNED_BYTE)
+            fbo.release()
 
         if not self.config['only_send_changes'] or self.prev_data != data:
             self.prev_data = data
             self.send(data)
+            if self.mc.latency_tracer.enabled:
+                self.mc.latency_tracer.dmd_frame_sent(self.source)
+        elif self.mc.latency_tracer.enabled:
+            self.mc.latency_tracer.dmd_frame_skipped(self.source)
 
     def send(self, data: bytes) -> None:
         """Send data to DMD via BCP."""
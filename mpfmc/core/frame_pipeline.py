@@ -0,0 +1,126 @@
+"""Contains the FramePipeline which runs the per-frame work of the mpf-mc in a fixed order."""
+import time
+from typing import Callable, Dict, List
+
+from kivy.clock import Clock
+
+from mpfmc.uix.animation import Animation
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from mpfmc.core.mc import MpfMc
+
+# Stages of a frame (in the order they run)
+STAGES = ('bcp', 'events', 'audio', 'assets', 'animation', 'render', 'readback')
+
+# Stages which run at the end of the frame (after all the Kivy callbacks triggered
+# by the other stages, e.g. layouts, right before the window is drawn)
+END_OF_FRAME_STAGES = ('render', 'readback')
+
+
+class FramePipeline(object):
+
+    """Runs the per-frame callbacks of the mpf-mc in a fixed order of stages.
+
+    Instead of each component scheduling its own clock callback (whose order
+    within a frame is not defined), the components add their callbacks to one
+    of the stages of the pipeline:
+
+    - ``bcp``: process the BCP commands received by the BCP server
+    - ``events``: process the event queue
+    - ``audio``: process the notifications of the audio thread
+    - ``assets``: handle the assets loaded by the asset loader thread
+    - ``animation``: update the widget animations
+    - ``render``: render the changed displays
+    - ``readback``: read the pixels of the DMDs and display lights and send them
+
+    The stages run in this order each frame, so a BCP command received before
+    a frame changes the displays and is sent to the DMDs in the same frame.
+    Callbacks are called with the time since the last frame. Components remove
+    their callbacks while they are idle, stages without callbacks are skipped.
+    The time spent in each stage during the last frame is kept in ``times``
+    and added to the profiler. Keyboard and touch input is dispatched by the
+    Kivy window before the clock runs, so it is handled before the pipeline.
+    """
+
+    def __init__(self, mc: "MpfMc") -> None:
+        """Initialise frame pipeline."""
+        self.mc = mc
+        self._callbacks = {stage: list() for stage in STAGES}     # type: Dict[str, List[Callable]]
+        self._dt = 0
+
+        self.frames = 0
+        """Number of frames run by the pipeline."""
+
+        self.times = dict.fromkeys(STAGES, 0.0)
+        """Time (in seconds) spent in each stage during the last frame."""
+
+        self.max_fps = 0
+        """Maximum rate of the frames run by the pipeline (0 = every iteration of the clock)."""
+
+        Animation.driver.set_pipeline(self)
+
+        self._end_of_frame_trigger = Clock.create_trigger(self._run_end_of_frame, -1)
+        self._frame_event = Clock.schedule_interval(self._run_frame, 0)
+
+    def set_max_fps(self, fps: int) -> None:
+        """Limit the rate of the frames run by the pipeline (0 = no limit).
+
+        Only the pipeline is limited, the Kivy clock itself keeps its frame rate.
+        """
+        if fps == self.max_fps:
+            return
+
+        self.max_fps = fps
+        self._frame_event.cancel()
+        self._frame_event = Clock.schedule_interval(self._run_frame, 1 / fps if fps else 0)
+
+    def stop(self) -> None:
+        """Stop running the frames (called when the mc stops)."""
+        self._frame_event.cancel()
+        self._end_of_frame_trigger.cancel()
+
+    def add_callback(self, stage: str, callback: Callable) -> None:
+        """Add a callback which is called each frame in a stage (until it is removed)."""
+        if callback not in self._callbacks[stage]:
+            self._callbacks[stage].append(callback)
+
+    def remove_callback(self, stage: str, callback: Callable) -> None:
+        """Remove a callback from a stage."""
+        try:
+            self._callbacks[stage].remove(callback)
+        except ValueError:
+            pass
+
+    def get_callbacks(self, stage: str) -> List[Callable]:
+        """Return the list of callbacks of a stage."""
+        return list(self._callbacks[stage])
+
+    def _run_frame(self, dt) -> None:
+        self.frames += 1
+        self._dt = dt
+        for stage in STAGES:
+            if stage in END_OF_FRAME_STAGES:
+                break
+            self._run_stage(stage, dt)
+
+        # run this at the end of the tick to make sure all kivy bind callbacks have executed
+        self._end_of_frame_trigger()
+
+    def _run_end_of_frame(self, dt) -> None:
+        del dt
+        for stage in END_OF_FRAME_STAGES:
+            self._run_stage(stage, self._dt)
+
+    def _run_stage(self, stage: str, dt) -> None:
+        callbacks = self._callbacks[stage]
+        if not callbacks:
+            self.times[stage] = 0.0
+            return
+
+        start = time.perf_counter()
+        with self.mc.profiler.measure(stage):
+            # callbacks may remove themselves (or add other callbacks)
+            for callback in list(callbacks):
+                callback(dt)
+        self.times[stage] = time.perf_counter() - start
@@ -0,0 +1,204 @@
+"""Latency tracer which measures the time from a received BCP command to the slides, sounds
+and DMD frames it caused."""
+import csv
+import logging
+import os
+import time
+from collections import deque
+from typing import Dict, List, Optional, Set
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from mpfmc.core.mc import MpfMc
+    from mpfmc.uix.display import Display
+
+# Upper bounds (in milliseconds) of the histogram buckets
+BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+# Percentiles exported for each path
+PERCENTILES = (50, 95, 99)
+
+
+class Trace(object):
+
+    """A received BCP command (the start of the traced paths)."""
+
+    __slots__ = ["name", "received"]
+
+    def __init__(self, name: str, received: float) -> None:
+        self.name = name
+        self.received = received
+
+
+class LatencyTracer(object):
+
+    """Measures the latency from received BCP commands to the output they caused.
+
+    The BCP server tags each received command with the time it was received.
+    While the command and the events it posted are processed (in the bcp and
+    events stages of the frame pipeline), the command is the current trace.
+    Slides shown, sounds played and DMD frames sent because of the current
+    traces close the paths:
+
+    - ``slide``: the display showing the slide has been rendered
+    - ``sound``: the audio thread started mixing the sound
+    - ``dmd``: the DMD frame showing the rendered display has been sent (a
+      frame which is not sent because it did not change ends the trace
+      without a latency)
+
+    The latencies are collected per path (e.g. ``trigger:jackpot -> sound``)
+    and can be written to a CSV file with percentiles and a histogram. The
+    tracer is controlled by the ``mpf-mc: latency_tracing:`` settings and by
+    the ``mc_latency_dump`` event (optional ``csv_file`` kwarg, the name of a file
+    in the machine folder).
+    """
+
+    def __init__(self, mc: "MpfMc") -> None:
+        """Initialise latency tracer."""
+        self.mc = mc
+        self.log = logging.getLogger('LatencyTracer')
+        config = mc.machine_config['mpf-mc']['latency_tracing']
+
+        self.enabled = bool(config['enabled'])
+        self.file = config['file']
+        self.samples = int(config['samples'])
+
+        self.current = list()           # type: List[Trace]
+        """Traces of the BCP commands processed in the current frame."""
+
+        self._latencies = dict()        # type: Dict[str, deque]
+        self._pending_displays = dict()     # type: Dict[Display, List[tuple]]
+        self._pending_dmds = dict()         # type: Dict[Display, List[tuple]]
+        self._dmd_sources = set()           # type: Set[Display]
+
+        self.mc.events.add_handler('mc_latency_dump', self._dump_handler)
+        self.mc.events.add_handler('shutdown', self._shutdown)
+
+    def begin(self, command: str, kwargs: dict, received: Optional[float] = None) -> None:
+        """Add the trace of a BCP command which is processed now."""
+        if command == 'trigger' and 'name' in kwargs:
+            name = 'trigger:{}'.format(kwargs['name'])
+        else:
+            name = command
+
+        self.current.append(Trace(name, received if received is not None else time.perf_counter()))
+
+    def clear_current(self) -> None:
+        """Clear the current traces (once the events of the frame have been processed)."""
+        if self.current:
+            self.current = list()
+
+    def add_latency(self, path: str, latency: float) -> None:
+        """Add a latency (in seconds) of a path."""
+        try:
+            self._latencies[path].append(latency)
+        except KeyError:
+            self._latencies[path] = deque([latency], maxlen=self.samples)
+
+    def _close(self, traces: List[Trace], output: str, end: float) -> None:
+        for trace in traces:
+            self.add_latency('{} -> {}'.format(trace.name, output), end - trace.received)
+
+    def slide_shown(self, display: "Display") -> None:
+        """Called when a slide is shown on a display (closed when the display is rendered)."""
+        if self.current:
+            self._pending_displays.setdefault(display, list()).extend(self.current)
+
+    def add_dmd_source(self, display: "Display") -> None:
+        """Called when a DMD reads back a display (only the traces of these displays are
+        kept for the dmd path)."""
+        self._dmd_sources.add(display)
+
+    def display_rendered(self, display: "Display") -> None:
+        """Called when a display has been rendered."""
+        traces = self._pending_displays.pop(display, None)
+        if traces:
+            self._close(traces, 'slide', time.perf_counter())
+            if display in self._dmd_sources:
+                self._pending_dmds.setdefault(display, list()).extend(traces)
+
+    def dmd_frame_sent(self, display: "Display") -> None:
+        """Called when a DMD frame showing a display has been sent."""
+        traces = self._pending_dmds.pop(display, None)
+        if traces:
+            self._close(traces, 'dmd', time.perf_counter())
+
+    def dmd_frame_skipped(self, display: "Display") -> None:
+        """Called when a DMD frame showing a display has not been sent because it did not
+        change."""
+        self._pending_dmds.pop(display, None)
+
+    def get_sound_traces(self) -> Optional[List[Trace]]:
+        """Return the traces for a sound which is played now (None without current traces)."""
+        if self.current:
+            return list(self.current)
+
+        return None
+
+    def sound_started(self, traces: List[Trace], started: Optional[float] = None) -> None:
+        """Called when a traced sound has been started by the audio thread."""
+        self._close(traces, 'sound', started if started is not None else time.perf_counter())
+
+    def get_percentiles(self, path: str) -> tuple:
+        """Return the p50, p95 and p99 latencies (in seconds) of a path."""
+        values = sorted(self._latencies.get(path, ()))
+        if not values:
+            return (0.0, ) * len(PERCENTILES)
+
+        # nearest-rank percentiles
+        return tuple(values[max(0, -(-len(values) * percentile // 100) - 1)] for percentile in PERCENTILES)
+
+    def get_histogram(self, path: str) -> List[int]:
+        """Return the number of latencies of a path in each bucket (and above the last
+        bucket)."""
+        counts = [0] * (len(BUCKETS) + 1)
+        for latency in self._latencies.get(path, ()):
+            latency *= 1000.0
+            for index, bucket in enumerate(BUCKETS):
+                if latency <= bucket:
+                    counts[index] += 1
+                    break
+            else:
+                counts[-1] += 1
+
+        return counts
+
+    def get_paths(self) -> List[str]:
+        """Return the traced paths."""
+        return sorted(self._latencies)
+
+    def clear(self) -> None:
+        """Clear all the collected latencies."""
+        self._latencies.clear()
+        self._pending_displays.clear()
+        self._pending_dmds.clear()
+
+    def dump_to_csv(self, file_name: str) -> None:
+        """Write the latency percentiles and histogram (in milliseconds) of each path to a CSV
+        file."""
+        if not os.path.isabs(file_name):
+            file_name = os.path.join(self.mc.machine_path, file_name)
+
+        with open(file_name, 'w', newline='') as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(['path', 'count'] + ['p{}'.format(x) for x in PERCENTILES] + ['max'] +
+                            ['<={}'.format(x) for x in BUCKETS] + ['>{}'.format(BUCKETS[-1])])
+            for path in self.get_paths():
+                latencies = self._latencies[path]
+                writer.writerow([path, len(latencies)] +
+                                ['{:.3f}'.format(x * 1000.0) for x in self.get_percentiles(path)] +
+                                ['{:.3f}'.format(max(latencies) * 1000.0)] +
+                                self.get_histogram(path))
+
+        self.log.info("Latencies written to %s", file_name)
+
+    def _dump_handler(self, csv_file=None, **kwargs):
+        del kwargs
+        # the event can be posted by MPF (e.g. a BCP trigger), so the file is always written
+        # to the machine folder
+        self.dump_to_csv(os.path.basename(csv_file or '') or self.file)
+
+    def _shutdown(self, **kwargs):
+        del kwargs
+        if self.enabled and self.file and self._latencies:
+            self.dump_to_csv(self.file)
@@ -37,6 +37,7 @@ from mpfmc.core.config_processor import ConfigProcessor
 from mpfmc.core.mode_controller import ModeController
 from mpfmc.uix.transitions import TransitionManager
 from mpfmc.uix.effects import EffectsManager
+from mpfmc.uix.render_scheduler import RenderScheduler
 from mpfmc.core.config_collection import create_config_collections
 from mpfmc.assets.image import ImageAsset
 from mpfmc.assets.bitmap_font import BitmapFontAsset
@@ -44,6 +45,9 @@ from mpfmc.core.dmd import Dmd, RgbDmd
 from mpfmc.core.assets import ThreadedAssetManager
 from mpfmc.core.mc_placeholder_manager import McPlaceholderManager
 from mpfmc.core.mc_settings_controller import McSettingsController
+from mpfmc.core.profiler import Profiler
+from mpfmc.core.frame_pipeline import FramePipeline
+from mpfmc.core.latency_tracer import LatencyTracer
 
 try:
     from mpfmc.core.audio import SoundSystem
@@ -140,10 +144,15 @@ class MpfMc(App):
         # Core components
         self.config_validator = ConfigValidator(self)
         self.events = EventManager(self)
+        self.profiler = Profiler(self)
+        self.frame_pipeline = FramePipeline(self)
+        self.latency_tracer = LatencyTracer(self)
         self.mode_controller = ModeController(self)
         create_config_collections(self, self.machine_config['mpf-mc']['config_collections'])
         ConfigValidator.load_config_spec()
 
+        # The render scheduler must exist before the displays are created
+        self.render_scheduler = RenderScheduler(self)
         self.config_processor = ConfigProcessor(self)
         self.transition_manager = TransitionManager(self)
         self.effects_manager = EffectsManager(self)
@@ -405,7 +414,7 @@ class MpfMc(App):
     def build(self):
         self.start_time = time.time()
         self.ticks = 0
-        self.clock.schedule_interval(self.tick, 0)
+        self.frame_pipeline.add_callback('events', self.tick)
         self.events.add_handler("debug_dump_stats", self._debug_dump_displays)
 
     def _debug_dump_displays(self, **kwargs):
@@ -420,6 +429,9 @@ class MpfMc(App):
                 self.log.info(child)
                 children += 1
             self.log.info("Total children: %s", children)
+        self.render_scheduler.log_stats()
+        if self.profiler.enabled:
+            self.profiler.dump_to_log()
         self.log.info("--- DEBUG DUMP DISPLAYS END ---")
         gc.collect()
         if not self.options["production"]:
@@ -445,12 +457,18 @@ class MpfMc(App):
 
         self.events.post("shutdown")
         self.events.process_event_queue()
+        self.frame_pipeline.stop()
 
         try:
             self.log.info("Loop rate %s Hz", round(self.ticks / (time.time() - self.start_time), 2))
         except ZeroDivisionError:
             pass
 
+        self.render_scheduler.log_stats()
+
+        if self.profiler.enabled:
+            self.profiler.dump_to_log()
+
     def reset(self, **kwargs):
         del kwargs
         self.player = None
@@ -556,6 +574,8 @@ class MpfMc(App):
         del dt
         self.ticks += 1
         self.events.process_event_queue()
+        # the events caused by the BCP commands of this frame have been processed
+        self.latency_tracer.clear_current()
 
     def _load_scriptlets(self):
         if 'mc_scriptlets' in self.machine_config:
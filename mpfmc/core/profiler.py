@@ -0,0 +1,295 @@
+"""Frame-time profiler which measures the time spent in each subsystem of the mpf-mc."""
+import csv
+import logging
+import os
+import time
+from collections import deque
+
+from kivy.clock import Clock
+
+from mpfmc.uix.animation import Animation
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from mpfmc.core.mc import MpfMc
+
+# Subsystems measured by the profiler (in the order they are shown)
+SUBSYSTEMS = ('events', 'bcp', 'assets', 'audio', 'animation', 'render', 'draw', 'readback')
+
+# Percentiles calculated for each subsystem
+PERCENTILES = (50, 95, 99)
+
+
+class _Measurement(object):
+
+    """Context manager which adds the time spent in its block to a subsystem.
+
+    Nested blocks of the same subsystem are only counted once.
+    """
+
+    __slots__ = ["profiler", "subsystem", "start", "depth"]
+
+    def __init__(self, profiler, subsystem):
+        self.profiler = profiler
+        self.subsystem = subsystem
+        self.start = None
+        self.depth = 0
+
+    def __enter__(self):
+        if not self.depth and self.profiler.enabled:
+            self.start = time.perf_counter()
+        self.depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.depth -= 1
+        if not self.depth and self.start is not None:
+            self.profiler.add_time(self.subsystem, time.perf_counter() - self.start)
+            self.start = None
+
+
+class Profiler(object):
+
+    """Measures the time spent in each subsystem of the mpf-mc per frame.
+
+    The time spent in each subsystem (event queue, BCP processing, asset loader
+    callbacks, audio notifications, animation updates, display rendering,
+    window canvas draw and DMD/display light readback) is added up for each
+    frame. The profiler keeps the per-frame times of the last ``frames`` frames
+    and calculates rolling percentiles (p50/p95/p99) for each subsystem.
+
+    The profiler is controlled by the ``mpf-mc: profiler:`` settings and by
+    events, so it can be toggled from MPF using a BCP trigger:
+
+    - ``mc_profiler_start`` (optional ``overlay`` kwarg)
+    - ``mc_profiler_stop``
+    - ``mc_profiler_toggle`` (optional ``overlay`` kwarg)
+    - ``mc_profiler_dump`` (optional ``csv_file`` kwarg, the name of a file in the
+      machine folder, dumps to the log otherwise)
+
+    The overlay shows the percentiles on top of the window (it is not part of
+    any display, so it is not shown on DMDs).
+    """
+
+    def __init__(self, mc: "MpfMc") -> None:
+        """Initialise profiler."""
+        self.mc = mc
+        self.log = logging.getLogger('Profiler')
+        config = mc.machine_config['mpf-mc']['profiler']
+
+        self.enabled = False
+        self.frames = int(config['frames'])
+        self.frame_count = 0
+
+        self._measurements = {subsystem: _Measurement(self, subsystem) for subsystem in SUBSYSTEMS}
+        self._current = dict.fromkeys(SUBSYSTEMS, 0.0)
+        self._history = {subsystem: deque(maxlen=self.frames) for subsystem in SUBSYSTEMS + ('frame', )}
+        self._frame_start = None
+        self._draw_start = None
+        self._frame_event = None
+        self._overlay = None
+
+        Animation.driver.profiler = self
+
+        self.mc.events.add_handler('mc_profiler_start', self._start_handler)
+        self.mc.events.add_handler('mc_profiler_stop', self._stop_handler)
+        self.mc.events.add_handler('mc_profiler_toggle', self._toggle_handler)
+        self.mc.events.add_handler('mc_profiler_dump', self._dump_handler)
+
+        if config['enabled']:
+            # start with the first frame (once the window exists)
+            Clock.schedule_once(self._start_from_config, 0)
+
+    def measure(self, subsystem: str) -> _Measurement:
+        """Return a context manager which adds the time spent in its block to a subsystem."""
+        return self._measurements[subsystem]
+
+    def add_time(self, subsystem: str, secs: float) -> None:
+        """Add time (in seconds) spent in a subsystem during the current frame."""
+        self._current[subsystem] += secs
+
+    def start(self, overlay: bool = False) -> None:
+        """Start profiling (and show the overlay)."""
+        if not self.enabled:
+            from kivy.core.window import Window as KivyWindow
+
+            self.enabled = True
+            self.clear()
+            self._frame_start = time.perf_counter()
+            self._frame_event = Clock.schedule_interval(self._frame_done, 0)
+            KivyWindow.bind(on_draw=self._on_draw, on_flip=self._on_flip)
+            self.log.info("Profiler started")
+
+        if overlay and not self._overlay:
+            self._overlay = ProfilerOverlay(self)
+
+    def stop(self) -> None:
+        """Stop profiling (and remove the overlay)."""
+        if not self.enabled:
+            return
+
+        from kivy.core.window import Window as KivyWindow
+
+        self.enabled = False
+        self._frame_event.cancel()
+        self._frame_event = None
+        KivyWindow.unbind(on_draw=self._on_draw, on_flip=self._on_flip)
+        self._draw_start = None
+
+        if self._overlay:
+            self._overlay.remove()
+            self._overlay = None
+
+        self.log.info("Profiler stopped")
+
+    def clear(self) -> None:
+        """Clear all the collected frame times."""
+        self.frame_count = 0
+        for subsystem in SUBSYSTEMS:
+            self._current[subsystem] = 0.0
+        for history in self._history.values():
+            history.clear()
+
+    def _on_draw(self, *args) -> None:
+        # Bound handlers are called before the default handler which draws the window
+        del args
+        self._draw_start = time.perf_counter()
+
+    def _on_flip(self, *args) -> None:
+        del args
+        if self._draw_start is not None:
+            self.add_time('draw', time.perf_counter() - self._draw_start)
+            self._draw_start = None
+
+    def _frame_done(self, dt) -> None:
+        """Store the times of the current frame."""
+        del dt
+        now = time.perf_counter()
+        self._history['frame'].append(now - self._frame_start)
+        self._frame_start = now
+        self.frame_count += 1
+
+        for subsystem in SUBSYSTEMS:
+            self._history[subsystem].append(self._current[subsystem])
+            self._current[subsystem] = 0.0
+
+    def get_percentiles(self, subsystem: str) -> tuple:
+        """Return the p50, p95 and p99 per-frame times (in seconds) of a subsystem (or
+        'frame' for the complete frame) over the last frames."""
+        values = sorted(self._history[subsystem])
+        if not values:
+            return (0.0, ) * len(PERCENTILES)
+
+        # nearest-rank percentiles
+        return tuple(values[max(0, -(-len(values) * percentile // 100) - 1)] for percentile in PERCENTILES)
+
+    def get_stats(self) -> dict:
+        """Return a dictionary with the percentiles (in seconds) of each subsystem."""
+        return {subsystem: dict(zip(('p{}'.format(x) for x in PERCENTILES), self.get_percentiles(subsystem)))
+                for subsystem in SUBSYSTEMS + ('frame', )}
+
+    def get_report(self) -> list:
+        """Return the percentiles of each subsystem as lines of text (times in milliseconds)."""
+        lines = ["{:<10}{:>9}{:>9}{:>9}".format(
+            "{} frames".format(len(self._history['frame'])), *('p{}'.format(x) for x in PERCENTILES))]
+        for subsystem in SUBSYSTEMS + ('frame', ):
+            lines.append("{:<10}{:>9.2f}{:>9.2f}{:>9.2f}".format(
+                subsystem, *(x * 1000.0 for x in self.get_percentiles(subsystem))))
+        return lines
+
+    def dump_to_log(self) -> None:
+        """Log the percentiles of each subsystem."""
+        self.log.info("Frame times (ms):")
+        for line in self.get_report():
+            self.log.info(line)
+
+    def dump_to_csv(self, file_name: str) -> None:
+        """Write the per-frame times (in milliseconds) of the last frames to a CSV file."""
+        if not os.path.isabs(file_name):
+            file_name = os.path.join(self.mc.machine_path, file_name)
+
+        columns = ('frame', ) + SUBSYSTEMS
+        with open(file_name, 'w', newline='') as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(('index', ) + columns)
+            first_frame = self.frame_count - len(self._history['frame'])
+            for index, row in enumerate(zip(*(self._history[column] for column in columns))):
+                writer.writerow([first_frame + index] + ['{:.3f}'.format(x * 1000.0) for x in row])
+
+        self.log.info("Frame times written to %s", file_name)
+
+    def _start_from_config(self, dt):
+        del dt
+        self.start(self.mc.machine_config['mpf-mc']['profiler']['overlay'])
+
+    def _start_handler(self, overlay=False, **kwargs):
+        del kwargs
+        self.start(overlay)
+
+    def _stop_handler(self, **kwargs):
+        del kwargs
+        self.stop()
+
+    def _toggle_handler(self, overlay=False, **kwargs):
+        del kwargs
+        if self.enabled:
+            self.stop()
+        else:
+            self.start(overlay)
+
+    def _dump_handler(self, csv_file=None, **kwargs):
+        del kwargs
+        # the event can be posted by MPF (e.g. a BCP trigger), so the file is always written
+        # to the machine folder
+        csv_file = os.path.basename(csv_file or '')
+        if csv_file:
+            self.dump_to_csv(csv_file)
+        else:
+            self.dump_to_log()
+
+
+class ProfilerOverlay(object):
+
+    """Shows the profiler percentiles on top of the window."""
+
+    def __init__(self, profiler: Profiler, update_interval: float = .5) -> None:
+        """Initialise overlay."""
+        from kivy.core.text import Label as CoreLabel
+        from kivy.core.window import Window as KivyWindow
+        from kivy.graphics import Color, InstructionGroup, Rectangle
+
+        self.profiler = profiler
+        self._label = CoreLabel(font_name='RobotoMono-Regular', font_size=12)
+
+        self._instructions = InstructionGroup()
+        self._instructions.add(Color(0, 0, 0, .6))
+        self._background = Rectangle()
+        self._instructions.add(self._background)
+        self._instructions.add(Color(1, 1, 1, 1))
+        self._text = Rectangle()
+        self._instructions.add(self._text)
+        KivyWindow.canvas.after.add(self._instructions)
+
+        self._update_event = Clock.schedule_interval(self._update, update_interval)
+        self._update()
+
+    def _update(self, *args) -> None:
+        del args
+        from kivy.core.window import Window as KivyWindow
+
+        self._label.text = '\n'.join(self.profiler.get_report())
+        self._label.refresh()
+        texture = self._label.texture
+        pos = (0, KivyWindow.height - texture.height)
+        self._text.texture = texture
+        self._text.pos = pos
+        self._text.size = texture.size
+        self._background.pos = pos
+        self._background.size = texture.size
+
+    def remove(self) -> None:
+        """Remove the overlay from the window."""
+        from kivy.core.window import Window as KivyWindow
+
+        self._update_event.cancel()
+        KivyWindow.canvas.after.remove(self._instructions)
@@ -1,8 +1,9 @@
 from kivy.properties import ListProperty
-from kivy.uix.effectwidget import EffectBase
 
+from mpfmc.uix.effects import UniformEffectBase
 
-class ColorizeEffect(EffectBase):
+
+class ColorizeEffect(UniformEffectBase):
     """GLSL effect to apply a color tint to a texture."""
 
     tint_color = ListProperty([1, 0.4, 0, 0])
@@ -14,23 +15,21 @@ class ColorizeEffect(EffectBase):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.do_glsl()
+        self.glsl = colorize_glsl
+        self.on_tint_color()
 
     def on_tint_color(self, *args):
-        self.do_glsl()
-
-    def do_glsl(self):
-        self.glsl = colorize_glsl.format(float(self.tint_color[0]),
-                                         float(self.tint_color[1]),
-                                         float(self.tint_color[2]))
+        self.uniforms['tintColor'] = tuple(float(x) for x in self.tint_color[:3])
 
 
 colorize_glsl = '''
+        uniform vec3 tintColor;
+
         vec4 effect(vec4 color, sampler2D texture, vec2 tex_coords, vec2 coords)
-        {{
-            vec4 c = vec4(color.x * {}, color.y * {}, color.z * {}, 1.0);
+        {
+            vec4 c = vec4(color.xyz * tintColor, 1.0);
             return c;
-        }}
+        }
         '''
 
 effect_cls = ColorizeEffect
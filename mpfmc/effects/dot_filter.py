@@ -1,8 +1,9 @@
-from kivy.uix.effectwidget import EffectBase
 from kivy.properties import NumericProperty, ListProperty
 
+from mpfmc.uix.effects import UniformEffectBase
 
-class DotFilterEffect(EffectBase):
+
+class DotFilterEffect(UniformEffectBase):
 
     """GLSL effect to render an on-screen dot filter to look like individual round 
     dots/pixels (simulating a DMD).
@@ -83,57 +84,57 @@ class DotFilterEffect(EffectBase):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.do_glsl()
+        self.glsl = dot_filter_glsl
+        self._update_size()
+        self.on_blur()
+        self.on_dot_size()
+        self.on_background_color()
 
     def on_width(self, *args):
-        self.do_glsl()
+        self._update_size()
 
     def on_height(self, *args):
-        self.do_glsl()
+        self._update_size()
 
     def on_dots_x(self, *args):
-        self.do_glsl()
+        self._update_size()
 
     def on_dots_y(self, *args):
-        self.do_glsl()
+        self._update_size()
+
+    def _update_size(self, *args):
+        dot_size = min(self.width / self.dots_x, self.height / self.dots_y)
+        self.uniforms.update({'dotSize': float(dot_size),
+                              'widgetSize': (float(self.width), float(self.height))})
 
     def on_blur(self, *args):
-        self.do_glsl()
+        self.uniforms['blur'] = float(self.blur)
 
     def on_dot_size(self, *args):
-        self.do_glsl()
+        self.uniforms['dotRadius'] = self.dot_size / 2.0
 
     def on_background_color(self, *args):
-        self.do_glsl()
-
-    def do_glsl(self):
-        background_color = tuple(map(float, self.background_color))
-        dot_size = min(self.width / self.dots_x, self.height / self.dots_y)
-
-        self.glsl = dot_filter_glsl.format(float(self.blur),
-                                           self.dot_size / 2.0,
-                                           dot_size,
-                                           float(self.width),
-                                           float(self.height),
-                                           *background_color)
+        self.uniforms['backgroundColor'] = tuple(map(float, self.background_color))
 
 dot_filter_glsl = '''
-        float blur = {};
-        float dotRadius = {};
-        float dotSize = {};
+        uniform float blur;
+        uniform float dotRadius;
+        uniform float dotSize;
+        uniform vec2 widgetSize;
+        uniform vec4 backgroundColor;
 
         vec4 effect(vec4 color, sampler2D texture, vec2 tex_coords, vec2 coords)
-        {{
-            vec2 texCoordsStep = 1.0/(vec2({},{})/dotSize);
+        {
+            vec2 texCoordsStep = 1.0/(widgetSize/dotSize);
             vec2 dotRegionCoords = fract(tex_coords.xy/texCoordsStep);
 
             vec2 powers = pow(abs(dotRegionCoords - 0.5),vec2(2.0));
             float radiusSqrd = pow(dotRadius,2.0);
             float gradient = smoothstep(radiusSqrd-blur, radiusSqrd+blur, powers.x+powers.y);
 
-            vec4 newColor = mix(color, vec4({}, {}, {}, {}), gradient);
+            vec4 newColor = mix(color, backgroundColor, gradient);
             return newColor;
-        }}
+        }
         '''
 
 effect_cls = DotFilterEffect
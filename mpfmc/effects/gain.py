@@ -1,8 +1,9 @@
-from kivy.uix.effectwidget import EffectBase
 from kivy.properties import NumericProperty
 
+from mpfmc.uix.effects import UniformEffectBase
 
-class GainEffect(EffectBase):
+
+class GainEffect(UniformEffectBase):
     """GLSL effect to apply apply a gain (brightness) adjustment to a texture.
 
     Args:
@@ -21,21 +22,21 @@ class GainEffect(EffectBase):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.do_glsl()
+        self.glsl = gain_glsl
+        self.on_gain()
 
     def on_gain(self, *args):
-        self.do_glsl()
-
-    def do_glsl(self):
-        self.glsl = gain_glsl.format(float(self.gain))
+        self.uniforms['gain'] = float(self.gain)
 
 
 gain_glsl = '''
+uniform float gain;
+
 vec4 effect(vec4 color, sampler2D texture, vec2 tex_coords, vec2 coords)
-{{
-vec4 outColor = vec4(color.x * {0}, color.y * {0}, color.z * {0}, 1.0);
+{
+vec4 outColor = vec4(color.x * gain, color.y * gain, color.z * gain, 1.0);
 return outColor;
-}}
+}
 '''
 
 effect_cls = GainEffect
@@ -1,8 +1,9 @@
-from kivy.uix.effectwidget import EffectBase
 from kivy.properties import NumericProperty
 
+from mpfmc.uix.effects import UniformEffectBase
 
-class GammaEffect(EffectBase):
+
+class GammaEffect(UniformEffectBase):
     """GLSL effect to apply a gamma setting to a texture"""
 
     gamma = NumericProperty(1.0)
@@ -15,21 +16,21 @@ class GammaEffect(EffectBase):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.do_glsl()
+        self.glsl = gamma_glsl
+        self.on_gamma()
 
     def on_gamma(self, *args):
-        self.do_glsl()
-
-    def do_glsl(self):
-        self.glsl = gamma_glsl.format(float(self.gamma))
+        self.uniforms['gamma'] = float(self.gamma)
 
 
 gamma_glsl = '''
+uniform float gamma;
+
 vec4 effect(vec4 color, sampler2D texture, vec2 tex_coords, vec2 coords)
-{{
-    vec4 outColor = vec4(pow(color.x, {0}), pow(color.y, {0}), pow(color.z, {0}), 1.0);
+{
+    vec4 outColor = vec4(pow(color.x, gamma), pow(color.y, gamma), pow(color.z, gamma), 1.0);
     return outColor;
-}}
+}
 '''
 
 effect_cls = GammaEffect
@@ -1,8 +1,9 @@
-from kivy.uix.effectwidget import EffectBase
 from kivy.properties import ListProperty
 
+from mpfmc.uix.effects import UniformEffectBase
 
-class MonochromeEffect(EffectBase):
+
+class MonochromeEffect(UniformEffectBase):
     """GLSL effect to convert the texture to monochrome.
 
     More information here:
@@ -20,22 +21,20 @@ class MonochromeEffect(EffectBase):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.do_glsl()
+        self.glsl = monochrome_glsl
+        self.on_luminosity()
 
     def on_luminosity(self, *args):
-        self.do_glsl()
-
-    def do_glsl(self):
-        self.glsl = monochrome_glsl.format(float(self.luminosity[0]),
-                                           float(self.luminosity[1]),
-                                           float(self.luminosity[2]))
+        self.uniforms['luminosity'] = tuple(float(x) for x in self.luminosity[:3])
 
 monochrome_glsl = '''
+uniform vec3 luminosity;
+
 vec4 effect(vec4 color, sampler2D texture, vec2 tex_coords, vec2 coords)
-{{
-    float lum = ((color.x * {}) + (color.y * {}) + (color.z * {}));
+{
+    float lum = dot(color.xyz, luminosity);
     return vec4(lum, lum, lum, 1.0);
-}}
+}
 '''
 
 effect_cls = MonochromeEffect
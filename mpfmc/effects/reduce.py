@@ -1,8 +1,9 @@
-from kivy.uix.effectwidget import EffectBase
 from kivy.properties import NumericProperty
 
+from mpfmc.uix.effects import UniformEffectBase
 
-class ReduceEffect(EffectBase):
+
+class ReduceEffect(UniformEffectBase):
     """GLSL effect to reduce a texture to fewer bits per color channel."""
 
     shades = NumericProperty(16)
@@ -15,25 +16,24 @@ class ReduceEffect(EffectBase):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.do_glsl()
+        self.glsl = reduce_glsl
+        self.on_shades()
 
     def on_shades(self, *args):
-        self.do_glsl()
-
-    def do_glsl(self):
-        self.glsl = reduce_glsl.format(abs(float(self.shades - 1)))
+        self.uniforms['bitDepth'] = abs(float(self.shades - 1))
 
 
 reduce_glsl = '''
+        uniform float bitDepth;
+
         vec4 effect(vec4 color, sampler2D texture, vec2 tex_coords, vec2 coords)
-        {{
-        float bitDepth = {};
+        {
         vec4 outColor = vec4(floor(color.x * bitDepth) / bitDepth,
                              floor(color.y * bitDepth) / bitDepth,
                              floor(color.z * bitDepth) / bitDepth,
                              1.0);
         return outColor;
-        }}
+        }
         '''
 
 
@@ -78,6 +78,16 @@ class MpfMcTestCase(unittest.TestCase):
 
         EventLoop.idle()
 
+    def advance_real_time_until(self, condition, secs):
+        """Advances the real time until the condition is met (at most secs seconds).
+
+        Sounds play in real time while the test time falls behind when the tests are busy, use
+        this instead of advancing a fixed time to wait for an audio transition or marker."""
+        start = self._current_time
+        while not condition() and self._current_time < start + secs:
+            self.advance_real_time(0.05)
+        self.assertTrue(condition())
+
     def get_pixel_color(self, x, y):
         """Returns a binary string of the RGB bytes that make up the slide
         pixel at the passed x,y coordinates. 2 bytes per pixel, 6 bytes total.
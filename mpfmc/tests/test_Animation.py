@@ -1,4 +1,5 @@
 from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
+from mpfmc.uix.animation import Animation
 
 
 class TestAnimation(MpfMcTestCase):
@@ -329,6 +330,56 @@ class TestAnimation(MpfMcTestCase):
         self.assertAlmostEqual(190, widget.x, delta=30)
         self.assertAlmostEqual(145, widget.y, delta=30)
 
+    def test_animation_driver(self):
+        self.mc.events.post('show_slide2')
+        self.advance_time()
+        widget = self.mc.targets['default'].current_slide.widgets[0].widget
+
+        # the animation is updated by the animation driver
+        self.mc.events.post('entrance2')
+        self.advance_time()
+        self.assertIn(widget.animation, Animation.driver.animations)
+        self.assertTrue(Animation.driver.running)
+        self.assertIn(Animation.driver._update, self.mc.frame_pipeline.get_callbacks('animation'))
+
+        # finished animations are removed from the driver
+        self.advance_time(1.1)
+        self.assertEqual(0, widget.x)
+        self.assertEqual(0, widget.y)
+        self.assertNotIn(widget.animation, Animation.driver.animations)
+
+    def test_compiled_animations(self):
+        # the animation steps are compiled when the config is loaded
+        step = self.mc.slides['slide1']['widgets'][0]['animations']['show_slide'][1]['_step']
+        self.assertEqual(('x', ), step.properties)
+        self.assertEqual(((100, False), ), step.values)
+        self.assertEqual(1, step.duration)
+        self.assertTrue(step.with_previous)
+        self.assertTrue(step.repeat)
+        self.assertFalse(step.relative)
+        self.assertTrue(callable(step.easing))
+
+        step = self.mc.animations['multi'][1]['_step']
+        self.assertEqual(((0.0, True), ), step.values)
+
+        # invalid settings are found when the config is loaded
+        with self.assertRaises(ValueError):
+            self.mc.animations.process_animation(dict(property='x', value='1', easing='no_easing'))
+        with self.assertRaises(ValueError):
+            self.mc.animations.process_animation(dict(property='x', value='abc'))
+
+        # the widget compiles its animations once and binds them when they are started
+        self.mc.events.post('show_slide3')
+        self.advance_time()
+        widget = self.mc.targets['default'].current_slide.widgets[0].widget
+        compiled = widget._animations['entrance3']
+        self.assertEqual(3, len(compiled))
+
+        self.mc.events.post('entrance3')
+        self.advance_time(3.2)
+        self.assertEqual(0, widget.x)
+        self.assertIs(compiled, widget._animations['entrance3'])
+
     def test_named_animation(self):
         self.mc.events.post('show_slide3')
 
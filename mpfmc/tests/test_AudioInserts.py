@@ -0,0 +1,169 @@
+import logging
+from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
+
+try:
+    from mpfmc.core.audio import SoundSystem
+    from mpfmc.core.audio.audio_exception import AudioException
+except ImportError:
+    SoundSystem = None
+    logging.warning("mpfmc.core.audio library could not be loaded. Audio "
+                    "features will not be available")
+
+
+class TestAudioInserts(MpfMcTestCase):
+    """
+    Tests the floating-point mix bus and DSP inserts
+    """
+
+    def get_machine_path(self):
+        return 'tests/machine_files/audio'
+
+    def get_config_file(self):
+        return 'test_audio_inserts.yaml'
+
+    def test_inserts(self):
+        """ Tests the master and track DSP insert settings """
+
+        if SoundSystem is None or self.mc.sound_system is None:
+            log = logging.getLogger('TestAudio')
+            log.warning("Sound system is not enabled - unable to run audio tests")
+            self.skipTest("Sound system is not enabled")
+
+        if self.mc.sound_system.audio_interface is None:
+            log = logging.getLogger('TestAudio')
+            log.warning("Sound system audio interface could not be loaded - skipping audio tests")
+            self.skipTest("Sound system audio interface could not be loaded")
+
+        interface = self.mc.sound_system.audio_interface
+
+        # Inserts are configured so the floating-point mix bus is used
+        settings = interface.get_settings()
+        self.assertTrue(settings['float_mix_bus'])
+        self.assertEqual('float', self.mc.sound_system.config['mix_bus'])
+
+        # Master inserts
+        master_inserts = interface.get_master_inserts()
+        self.assertEqual(1, len(master_inserts))
+        self.assertEqual('limiter', master_inserts[0]['type'])
+        self.assertAlmostEqual(0.891, master_inserts[0]['threshold'], 3)
+        self.assertAlmostEqual(0.1, master_inserts[0]['release'])
+
+        # Track inserts (in processing order, default values filled in)
+        track_music = interface.get_track_by_name("music")
+        self.assertEqual(2, len(track_music.inserts))
+        self.assertEqual('eq', track_music.inserts[0]['type'])
+        self.assertEqual('lowshelf', track_music.inserts[0]['filter'])
+        self.assertEqual(200.0, track_music.inserts[0]['frequency'])
+        self.assertEqual(-3.0, track_music.inserts[0]['gain'])
+        self.assertEqual(0.707, track_music.inserts[0]['q'])
+        self.assertEqual('reverb', track_music.inserts[1]['type'])
+        self.assertEqual(0.7, track_music.inserts[1]['room_size'])
+        self.assertEqual(0.5, track_music.inserts[1]['damping'])
+        self.assertEqual(0.3, track_music.inserts[1]['wet'])
+        self.assertEqual(1.0, track_music.inserts[1]['dry'])
+
+        track_sfx = interface.get_track_by_name("sfx")
+        self.assertEqual([], track_sfx.inserts)
+
+        # Play sounds through the insert chains
+        self.mc.sounds['263774_music'].play()
+        self.mc.sounds['198361_sfx-028'].play()
+        self.advance_real_time(1)
+
+        # Change the inserts while sounds are playing
+        track_sfx.set_inserts(self.mc.sound_system._parse_inserts(
+            'sfx', [{'type': 'eq', 'filter': 'highpass', 'frequency': 150}]))
+        self.assertEqual(1, len(track_sfx.inserts))
+        track_music.set_inserts([])
+        self.assertEqual([], track_music.inserts)
+        self.advance_real_time(0.5)
+
+        # Illegal insert settings
+        with self.assertRaises(AudioException):
+            self.mc.sound_system._parse_inserts('sfx', [{'type': 'chorus'}])
+        with self.assertRaises(AudioException):
+            self.mc.sound_system._parse_inserts('sfx', [{'type': 'eq', 'filter': 'notch'}])
+
+
+class TestAudioInsertsOffline(MpfMcTestCase):
+    """
+    Tests DSP inserts with the offline audio backend (audio rendered on demand)
+    """
+
+    def get_machine_path(self):
+        return 'tests/machine_files/audio'
+
+    def get_config_file(self):
+        return 'test_audio_offline_inserts.yaml'
+
+    def _check_audio(self):
+        if SoundSystem is None or self.mc.sound_system is None:
+            log = logging.getLogger('TestAudio')
+            log.warning("Sound system is not enabled - unable to run audio tests")
+            self.skipTest("Sound system is not enabled")
+
+        if self.mc.sound_system.audio_interface is None:
+            log = logging.getLogger('TestAudio')
+            log.warning("Sound system audio interface could not be loaded - skipping audio tests")
+            self.skipTest("Sound system audio interface could not be loaded")
+
+    def test_insert_settings(self):
+        """ Tests insert settings are parsed as numbers or decibel values """
+        self._check_audio()
+        parse_inserts = self.mc.sound_system._parse_inserts
+
+        inserts = parse_inserts('sfx', [{'type': 'eq', 'frequency': '200', 'q': 1, 'gain': '-6 dB'},
+                                        {'type': 'limiter', 'threshold': '-6dB'},
+                                        {'type': 'reverb', 'wet': '-inf', 'dry': 2}])
+        self.assertEqual(200.0, inserts[0]['frequency'])
+        self.assertEqual(1.0, inserts[0]['q'])
+        self.assertEqual(-6.0, inserts[0]['gain'])
+        self.assertAlmostEqual(0.501, inserts[1]['threshold'], 3)
+        self.assertEqual(0.0, inserts[2]['wet'])
+        self.assertEqual(1.0, inserts[2]['dry'])
+        self.assertEqual(6.0, parse_inserts('sfx', [{'type': 'eq', 'gain': 6}])[0]['gain'])
+
+        # Values which are not numbers are rejected
+        for insert in ({'type': 'eq', 'gain': '1x2'},
+                       {'type': 'eq', 'gain': '-3 decibels'},
+                       {'type': 'eq', 'frequency': '1kHz'},
+                       {'type': 'limiter', 'threshold': 'loud'},
+                       {'type': 'reverb', 'wet': '0.5x'},
+                       {'type': 'reverb', 'room_size': 'large'}):
+            with self.assertRaises(AudioException):
+                parse_inserts('sfx', [insert])
+
+    def test_reverb_tail(self):
+        """ Tests the reverb tail rings out once the track stops playing sounds """
+        self._check_audio()
+        interface = self.mc.sound_system.audio_interface
+        track_sfx = interface.get_track_by_name("sfx")
+        self.assertTrue(interface.get_settings()['float_mix_bus'])
+
+        track_sfx.play_sound(self.mc.sounds['210871_synthping'])
+        self.mc.sound_system.render(0.25)
+        self.advance_time()
+        track_sfx.stop_all_sounds()
+        self.mc.sound_system.render(0.1)
+        self.advance_time()
+        self.assertTrue(all(player['status'] == 'idle' for player in track_sfx.get_status()))
+
+        # No sound is playing on the track, but the reverb is still heard
+        samples = self.mc.sound_system.render(0.25)
+        self.assertNotEqual(bytes(len(samples)), samples)
+
+        # The tail of the reverb (room size 0.7) decays by 60 dB in about 2 seconds
+        self.mc.sound_system.render(2.0)
+        samples = self.mc.sound_system.render(0.25)
+        self.assertEqual(bytes(len(samples)), samples)
+
+        # Stopping the track does not cut off the tail either
+        track_sfx.play_sound(self.mc.sounds['210871_synthping'])
+        self.mc.sound_system.render(0.25)
+        self.advance_time()
+        track_sfx.stop()
+        samples = self.mc.sound_system.render(0.25)
+        self.assertNotEqual(bytes(len(samples)), samples)
+        self.mc.sound_system.render(2.0)
+        samples = self.mc.sound_system.render(0.25)
+        self.assertEqual(bytes(len(samples)), samples)
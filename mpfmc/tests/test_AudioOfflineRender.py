@@ -0,0 +1,155 @@
+import logging
+import os
+import tempfile
+import wave
+from array import array
+from unittest.mock import MagicMock, ANY
+
+from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
+
+try:
+    from mpfmc.core.audio import SoundSystem
+    from mpfmc.core.audio.audio_exception import AudioException
+except ImportError:
+    SoundSystem = None
+    logging.warning("mpfmc.core.audio library could not be loaded. Audio "
+                    "features will not be available")
+
+
+class TestAudioOfflineRender(MpfMcTestCase):
+    """
+    Tests the offline audio backend (audio generated on demand without an audio device)
+    """
+
+    def get_machine_path(self):
+        return 'tests/machine_files/audio'
+
+    def get_config_file(self):
+        return 'test_audio_offline.yaml'
+
+    def _check_audio(self):
+        if SoundSystem is None or self.mc.sound_system is None:
+            log = logging.getLogger('TestAudio')
+            log.warning("Sound system is not enabled - unable to run audio tests")
+            self.skipTest("Sound system is not enabled")
+
+        if self.mc.sound_system.audio_interface is None:
+            log = logging.getLogger('TestAudio')
+            log.warning("Sound system audio interface could not be loaded - skipping audio tests")
+            self.skipTest("Sound system audio interface could not be loaded")
+
+    def test_render(self):
+        """ Tests audio is only generated when it is rendered and is deterministic """
+        self._check_audio()
+        interface = self.mc.sound_system.audio_interface
+        track_sfx = interface.get_track_by_name("sfx")
+        settings = interface.get_settings()
+        self.assertEqual('offline', settings['backend'])
+        self.assertEqual('offline', interface.backend)
+        buffer_size = settings['buffer_size']
+
+        # The audio clock only advances when audio is rendered
+        sample_clock = interface.get_sample_clock()
+        self.advance_real_time(0.2)
+        self.assertEqual(sample_clock, interface.get_sample_clock())
+
+        # Durations are rounded up to whole audio buffers
+        samples = self.mc.sound_system.render(0.1)
+        self.assertEqual(5 * buffer_size, len(samples))
+        self.assertEqual(sample_clock + 5 * settings['buffer_samples'], interface.get_sample_clock())
+        self.assertEqual(bytes(len(samples)), samples)
+        self.assertEqual(2 * buffer_size, len(self.mc.sound_system.render(buffer_count=2)))
+
+        # The same sound played again generates the same samples (the first time the sound is
+        # played the track volume ramps up from silence)
+        self.mc.bcp_processor.send = MagicMock()
+        self.mc.bcp_processor.enabled = True
+        rendered_samples = list()
+        for _ in range(3):
+            track_sfx.play_sound(self.mc.sounds['210871_synthping'])
+            rendered_samples.append(self.mc.sound_system.render(0.25))
+            self.advance_time()
+            track_sfx.stop_all_sounds()
+            self.mc.sound_system.render(0.5)
+            self.advance_time()
+
+        self.mc.bcp_processor.send.assert_any_call('trigger', name='synthping_played', sound_instance=ANY)
+        self.assertNotEqual(bytes(len(rendered_samples[1])), rendered_samples[1])
+        self.assertEqual(rendered_samples[1], rendered_samples[2])
+
+        # Audio can be written to a WAV file
+        file_name = os.path.join(tempfile.mkdtemp(), 'offline_render.wav')
+        frames = interface.render_to_wav(file_name, 0.5)
+        self.assertEqual(22 * settings['buffer_samples'], frames)
+        with wave.open(file_name, 'rb') as wav_file:
+            self.assertEqual(frames, wav_file.getnframes())
+            self.assertEqual(2, wav_file.getnchannels())
+            self.assertEqual(44100, wav_file.getframerate())
+
+        os.remove(file_name)
+
+    def test_markers(self):
+        """ Tests sound markers are reached at their exact position in rendered audio """
+        self._check_audio()
+        interface = self.mc.sound_system.audio_interface
+        track_voice = interface.get_track_by_name("voice")
+
+        self.mc.bcp_processor.send = MagicMock()
+        self.mc.bcp_processor.enabled = True
+
+        # Markers are at 2.5 and 3.5 seconds (audio is rendered much faster than real time)
+        track_voice.play_sound(self.mc.sounds['104457_moron_test'])
+        self.mc.sound_system.render(2.4)
+        self.advance_time()
+        with self.assertRaises(AssertionError):
+            self.mc.bcp_processor.send.assert_any_call('trigger', name='moron_marker', sound_instance=ANY,
+                                                       marker_id=0)
+
+        self.mc.sound_system.render(0.2)
+        self.advance_time()
+        self.mc.bcp_processor.send.assert_any_call('trigger', name='moron_marker', sound_instance=ANY, marker_id=0)
+        with self.assertRaises(AssertionError):
+            self.mc.bcp_processor.send.assert_any_call('trigger', name='moron_next_marker', sound_instance=ANY,
+                                                       marker_id=1)
+
+        self.mc.sound_system.render(1.0)
+        self.advance_time()
+        self.mc.bcp_processor.send.assert_any_call('trigger', name='moron_next_marker', sound_instance=ANY,
+                                                   marker_id=1)
+
+    def test_ducking(self):
+        """ Tests a ducking sound attenuates its target track by the ducking attenuation """
+        self._check_audio()
+        interface = self.mc.sound_system.audio_interface
+        track_music = interface.get_track_by_name("music")
+        track_voice = interface.get_track_by_name("voice")
+        buffer_samples = interface.get_settings()['buffer_samples']
+
+        # bass_synth loops every 81415 samples (the same part of the loop is compared with
+        # and without ducking)
+        loop_samples = 81415
+        window_start = 22050
+        window_samples = 4410
+
+        track_music.play_sound(self.mc.sounds['bass_synth'], settings={'loops': -1})
+        samples = array('h', self.mc.sound_system.render(buffer_count=-(-loop_samples // buffer_samples)))
+        self.advance_time()
+
+        # The ducking sound is silent (only the music track is heard) and ducks the music by 12 dB
+        # after a 0.1 second attack
+        track_voice.play_sound(self.mc.sounds['113690_test'], settings={'volume': 0.0})
+        samples.extend(array('h', self.mc.sound_system.render(1.0)))
+        self.advance_time()
+
+        normal_peak = max(abs(sample) for sample in samples[window_start * 2:(window_start + window_samples) * 2])
+        ducked_peak = max(abs(sample) for sample in samples[(loop_samples + window_start) * 2:
+                                                            (loop_samples + window_start + window_samples) * 2])
+        self.assertGreater(normal_peak, 1000)
+        self.assertAlmostEqual(0.25, ducked_peak / normal_peak, delta=0.04)
+
+    def test_unknown_backend(self):
+        """ Tests an unknown audio backend is rejected """
+        self._check_audio()
+        from mpfmc.core.audio import AudioInterface
+        with self.assertRaises(AudioException):
+            AudioInterface(backend='unknown')
@@ -0,0 +1,84 @@
+import logging
+from unittest.mock import MagicMock
+
+from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
+
+try:
+    from mpfmc.core.audio import SoundSystem
+except ImportError:
+    SoundSystem = None
+    logging.warning("mpfmc.core.audio library could not be loaded. Audio "
+                    "features will not be available")
+
+
+class TestAudioPerformanceCounters(MpfMcTestCase):
+    """
+    Tests the audio engine performance counters
+    """
+
+    def get_machine_path(self):
+        return 'tests/machine_files/audio'
+
+    def get_config_file(self):
+        return 'test_audio_offline.yaml'
+
+    def _check_audio(self):
+        if SoundSystem is None or self.mc.sound_system is None:
+            log = logging.getLogger('TestAudio')
+            log.warning("Sound system is not enabled - unable to run audio tests")
+            self.skipTest("Sound system is not enabled")
+
+        if self.mc.sound_system.audio_interface is None:
+            log = logging.getLogger('TestAudio')
+            log.warning("Sound system audio interface could not be loaded - skipping audio tests")
+            self.skipTest("Sound system audio interface could not be loaded")
+
+    def test_performance_counters(self):
+        """ Tests the audio callback timing, active sound player and lock wait counters """
+        self._check_audio()
+        interface = self.mc.sound_system.audio_interface
+        track_sfx = interface.get_track_by_name("sfx")
+        settings = interface.get_settings()
+
+        # Clear the values recorded during initialization
+        self.mc.sound_system.get_performance_counters(reset=True)
+
+        track_sfx.play_sound(self.mc.sounds['210871_synthping'])
+        track_sfx.play_sound(self.mc.sounds['198361_sfx-028'])
+        self.mc.sound_system.render(0.2)
+        self.advance_time()
+
+        counters = self.mc.sound_system.get_performance_counters()
+        self.assertEqual(int(settings['buffer_samples'] * 1000000 // settings['sample_rate']),
+                         counters['deadline'])
+        self.assertGreater(counters['callback_time']['count'], 0)
+        self.assertLessEqual(counters['callback_time']['recent_mean'], counters['callback_time']['max'])
+        self.assertEqual(counters['callback_time']['count'], sum(counters['callback_histogram']))
+        self.assertEqual(counters['deadline_overruns'], counters['callback_histogram'][-1])
+        self.assertEqual(2, counters['active_sound_players']['max'])
+        self.assertIn('sfx', counters['tracks'])
+        self.assertLessEqual(counters['tracks']['sfx']['active_sound_players'], 2)
+        self.assertGreater(counters['tracks']['sfx']['mix_time']['count'], 0)
+        self.assertEqual(0, counters['tracks']['sfx']['streaming_underruns'])
+
+        # Sound notifications are processed while holding the audio lock
+        self.assertGreater(counters['lock_wait_time']['count'], 0)
+
+        # Reset the counters
+        self.mc.sound_system.get_performance_counters(reset=True)
+        counters = self.mc.sound_system.get_performance_counters()
+        self.assertEqual(0, counters['deadline_overruns'])
+        self.assertEqual(0, sum(counters['callback_histogram']))
+        self.assertEqual(0, counters['tracks']['sfx']['mix_time']['count'])
+
+        # The counters are included in the BCP status report
+        self.mc.bcp_processor.send = MagicMock()
+        self.mc.bcp_processor._bcp_status_request()
+        self.mc.bcp_processor.send.assert_called_once()
+        self.assertEqual("status_report", self.mc.bcp_processor.send.call_args[0][0])
+        status_report = self.mc.bcp_processor.send.call_args[1]
+        self.assertIn('cpu', status_report)
+        self.assertEqual(counters['deadline'], status_report['audio_deadline'])
+        self.assertIn('audio_callback_max', status_report)
+        self.assertIn('audio_lock_wait_max', status_report)
+        self.assertIn('audio_streaming_underruns', status_report)
@@ -172,6 +172,8 @@ class TestAudioPlaylist(MpfMcTestCase):
                                                      call('trigger', name='attract_music_sound_changed'),
                                                      call('trigger', sound_instance=ANY,
                                                           name='dirty_grinding_beat_loop_played'),
+                                                     call('trigger', sound_instance=ANY,
+                                                          name='playlist_playlist_sound_played'),
                                                      call('trigger', sound_instance=ANY,
                                                           name='rainbow_disco_bears_stopped'),
                                                      call('trigger', sound_instance=ANY,
@@ -199,6 +201,8 @@ class TestAudioPlaylist(MpfMcTestCase):
         self.mc.bcp_processor.send.assert_has_calls([call('trigger', name='attract_music_sound_changed'),
                                                      call('trigger', sound_instance=ANY,
                                                           name='hippie_ahead_played'),
+                                                     call('trigger', sound_instance=ANY,
+                                                          name='playlist_playlist_sound_played'),
                                                      call('trigger', sound_instance=ANY,
                                                           name='dirty_grinding_beat_loop_stopped'),
                                                      call('trigger', sound_instance=ANY,
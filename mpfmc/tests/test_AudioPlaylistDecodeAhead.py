@@ -0,0 +1,149 @@
+import logging
+from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
+
+try:
+    from mpfmc.core.audio import SoundSystem
+except ImportError:
+    SoundSystem = None
+    logging.warning("mpfmc.core.audio library could not be loaded. Audio "
+                    "features will not be available")
+
+
+class TestAudioPlaylistDecodeAhead(MpfMcTestCase):
+    """
+    Tests playlist sounds prepared ahead of time (crossfade and gapless transitions)
+    """
+
+    def get_machine_path(self):
+        return 'tests/machine_files/audio'
+
+    def get_config_file(self):
+        return 'test_audio_playlist_decode_ahead.yaml'
+
+    def _check_audio(self):
+        if SoundSystem is None or self.mc.sound_system is None:
+            log = logging.getLogger('TestAudio')
+            log.warning("Sound system is not enabled - unable to run audio tests")
+            self.skipTest("Sound system is not enabled")
+
+        if self.mc.sound_system.audio_interface is None:
+            log = logging.getLogger('TestAudio')
+            log.warning("Sound system audio interface could not be loaded - skipping audio tests")
+            self.skipTest("Sound system audio interface could not be loaded")
+
+    def test_crossfade_decode_ahead(self):
+        """ Tests the next playlist sound is prepared and crossfades at the about to finish marker """
+        self._check_audio()
+        interface = self.mc.sound_system.audio_interface
+        track_music = interface.get_track_by_name("music")
+        playlist_controller = interface.get_playlist_controller("music")
+        self.assertEqual(3.0, playlist_controller.decode_ahead_time)
+        self.assertFalse(playlist_controller.gapless)
+
+        # rainbow_disco_bears is 15.45 seconds long (next sound is prepared at 10.45 seconds,
+        # crossfade starts at 13.45 seconds)
+        playlist_controller.play('crossfade_playlist')
+        self.advance_real_time(1)
+        status = track_music.get_status()
+        self.assertEqual("playing", status[0]['status'])
+        self.assertEqual(self.mc.sounds["rainbow_disco_bears"].id, status[0]['sound_id'])
+        self.assertEqual("idle", status[1]['status'])
+        self.assertFalse(playlist_controller.has_prepared_sound)
+
+        self.advance_real_time_until(lambda: playlist_controller.has_prepared_sound, 15)
+        status = track_music.get_status()
+        self.assertEqual("playing", status[0]['status'])
+        self.assertEqual("scheduled", status[1]['status'])
+        self.assertEqual(self.mc.sounds["drumbeat_7"].id, status[1]['sound_id'])
+
+        self.advance_real_time_until(lambda: not playlist_controller.has_prepared_sound, 6)
+        self.advance_real_time(0.25)
+        status = track_music.get_status()
+        self.assertEqual("stopping", status[0]['status'])
+        self.assertEqual("fade out", status[0]['fading_status'])
+        self.assertEqual("playing", status[1]['status'])
+        self.assertEqual(self.mc.sounds["drumbeat_7"].id, status[1]['sound_id'])
+
+        self.advance_real_time(2.25)
+        status = track_music.get_status()
+        self.assertEqual("idle", status[0]['status'])
+        self.assertEqual("playing", status[1]['status'])
+
+        # drumbeat_7 is the last sound in the playlist (nothing to prepare)
+        self.assertFalse(playlist_controller.has_prepared_sound)
+
+        playlist_controller.stop()
+        self.advance_real_time(3)
+        status = track_music.get_status()
+        self.assertEqual("idle", status[0]['status'])
+        self.assertEqual("idle", status[1]['status'])
+
+    def test_gapless(self):
+        """ Tests gapless playlist transitions and advancing while a sound is prepared """
+        self._check_audio()
+        interface = self.mc.sound_system.audio_interface
+        track_music = interface.get_track_by_name("gapless_music")
+        playlist_controller = interface.get_playlist_controller("gapless_music")
+        self.assertTrue(playlist_controller.gapless)
+        self.assertEqual(0.0, playlist_controller.crossfade_time)
+
+        # rainbow_disco_bears is 15.45 seconds long (next sound is prepared at 10.45 seconds)
+        playlist_controller.play('gapless_playlist')
+        self.advance_real_time_until(lambda: playlist_controller.has_prepared_sound, 20)
+        status = track_music.get_status()
+        self.assertEqual("playing", status[0]['status'])
+        self.assertEqual("scheduled", status[1]['status'])
+        self.assertEqual(self.mc.sounds["hippie_ahead"].id, status[1]['sound_id'])
+
+        # The next sound starts at the end of the previous one (no fading)
+        self.advance_real_time_until(lambda: not playlist_controller.has_prepared_sound, 8)
+        self.advance_real_time(0.25)
+        status = track_music.get_status()
+        self.assertEqual("idle", status[0]['status'])
+        self.assertEqual("playing", status[1]['status'])
+        self.assertEqual(self.mc.sounds["hippie_ahead"].id, status[1]['sound_id'])
+        self.assertEqual("not fading", status[1]['fading_status'])
+
+        playlist_controller.stop()
+        self.advance_real_time(0.5)
+
+        # Advancing while the next sound is prepared plays the prepared sound right away
+        playlist_controller.play('gapless_playlist')
+        self.advance_real_time_until(lambda: playlist_controller.has_prepared_sound, 20)
+        playlist_controller.advance()
+        self.assertFalse(playlist_controller.has_prepared_sound)
+        self.advance_real_time(0.25)
+        self.assertIn(("playing", self.mc.sounds["hippie_ahead"].id),
+                      [(player['status'], player['sound_id']) for player in track_music.get_status()])
+        self.assertNotIn("scheduled", [player['status'] for player in track_music.get_status()])
+
+    def test_on_demand_sounds(self):
+        """ Tests the next playlist sound is prepared when the sounds are loaded on demand """
+        self._check_audio()
+        interface = self.mc.sound_system.audio_interface
+        track_music = interface.get_track_by_name("gapless_music")
+        playlist_controller = interface.get_playlist_controller("gapless_music")
+        bass_synth = self.mc.sounds["bass_synth"]
+        kick = self.mc.sounds["kick"]
+        self.assertFalse(bass_synth.loaded)
+        self.assertFalse(kick.loaded)
+
+        # bass_synth is 1.85 seconds long, so the next sound is prepared as soon as it plays
+        # (the sound is loaded when it is prepared)
+        playlist_controller.play('on_demand_playlist')
+        self.advance_real_time(1)
+        self.assertTrue(bass_synth.loaded)
+        self.assertTrue(kick.loaded)
+        self.assertTrue(playlist_controller.has_prepared_sound)
+        status = track_music.get_status()
+        self.assertEqual(("playing", bass_synth.id), (status[0]['status'], status[0]['sound_id']))
+        self.assertEqual(("scheduled", kick.id), (status[1]['status'], status[1]['sound_id']))
+
+        self.advance_real_time(1.5)
+        self.assertFalse(playlist_controller.has_prepared_sound)
+        status = track_music.get_status()
+        self.assertEqual("idle", status[0]['status'])
+        self.assertEqual(("playing", kick.id), (status[1]['status'], status[1]['sound_id']))
+        playlist_controller.stop()
+        self.advance_real_time(0.5)
+
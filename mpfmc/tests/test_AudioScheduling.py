@@ -0,0 +1,116 @@
+import logging
+from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
+
+try:
+    from mpfmc.core.audio import SoundSystem
+    from mpfmc.core.audio.audio_exception import AudioException
+except ImportError:
+    SoundSystem = None
+    logging.warning("mpfmc.core.audio library could not be loaded. Audio "
+                    "features will not be available")
+
+
+class TestAudioScheduling(MpfMcTestCase):
+    """
+    Tests sounds scheduled to start at audio clock sample positions and sound markers
+    """
+
+    def get_machine_path(self):
+        return 'tests/machine_files/audio'
+
+    def get_config_file(self):
+        return 'test_audio.yaml'
+
+    def _check_audio(self):
+        if SoundSystem is None or self.mc.sound_system is None:
+            log = logging.getLogger('TestAudio')
+            log.warning("Sound system is not enabled - unable to run audio tests")
+            self.skipTest("Sound system is not enabled")
+
+        if self.mc.sound_system.audio_interface is None:
+            log = logging.getLogger('TestAudio')
+            log.warning("Sound system audio interface could not be loaded - skipping audio tests")
+            self.skipTest("Sound system audio interface could not be loaded")
+
+    def test_start_sample(self):
+        """ Tests sounds scheduled to start at an audio clock sample position """
+        self._check_audio()
+        interface = self.mc.sound_system.audio_interface
+        track_sfx = interface.get_track_by_name("sfx")
+
+        # The audio clock advances while audio is generated
+        sample_clock = interface.get_sample_clock()
+        self.advance_real_time(0.2)
+        self.assertGreater(interface.get_sample_clock(), sample_clock)
+
+        # Schedule a sound one second from now
+        start_sample = interface.get_sample_clock() + interface.convert_seconds_to_samples(1.0)
+        instance = track_sfx.play_sound(self.mc.sounds['210871_synthping'],
+                                        settings={'start_sample': start_sample})
+        self.assertIsNotNone(instance)
+        self.assertEqual(start_sample, instance.start_sample)
+
+        self.advance_real_time(0.3)
+        self.assertTrue(instance.pending)
+        self.assertIn("scheduled", [player['status'] for player in track_sfx.get_status()])
+
+        self.advance_real_time(1.0)
+        self.assertTrue(instance.played)
+        self.assertNotIn("scheduled", [player['status'] for player in track_sfx.get_status()])
+
+        # A start position that has already passed starts the sound right away
+        instance = track_sfx.play_sound(self.mc.sounds['198361_sfx-028'],
+                                        settings={'start_sample': interface.get_sample_clock() - 1000})
+        self.advance_real_time(0.1)
+        self.assertTrue(instance.played)
+
+        # Stopping a scheduled sound cancels it
+        start_sample = interface.get_sample_clock() + interface.convert_seconds_to_samples(10.0)
+        instance = track_sfx.play_sound(self.mc.sounds['210871_synthping'],
+                                        settings={'start_sample': start_sample})
+        self.advance_real_time(0.1)
+        track_sfx.stop_sound_instance(instance, fade_out=1.0)
+        self.advance_real_time(0.1)
+        self.assertTrue(instance.finished)
+        self.assertFalse(instance.played)
+
+    def test_start_after_marker(self):
+        """ Tests sounds scheduled to start at a marker of another sound instance """
+        self._check_audio()
+        interface = self.mc.sound_system.audio_interface
+        track_sfx = interface.get_track_by_name("sfx")
+
+        moron_test = track_sfx.play_sound(self.mc.sounds['104457_moron_test'])
+        self.advance_real_time(0.1)
+
+        # The marker must exist
+        with self.assertRaises(AudioException):
+            track_sfx.play_sound(self.mc.sounds['210871_synthping'],
+                                 settings={'start_after': moron_test, 'start_after_marker': 'chorus'})
+
+        # Markers may be specified by name or id
+        instance_1 = track_sfx.play_sound(self.mc.sounds['210871_synthping'],
+                                          settings={'start_after': moron_test, 'start_after_marker': 0})
+        instance_2 = track_sfx.play_sound(self.mc.sounds['198361_sfx-028'],
+                                          settings={'start_after': moron_test, 'start_after_marker': 'verse_1'})
+        self.assertEqual(0, instance_1.start_after_marker)
+        self.assertEqual(1, instance_2.start_after_marker)
+
+        # Markers are at 2.5 and 3.5 seconds
+        self.advance_real_time(0.5)
+        self.assertTrue(instance_1.pending)
+        self.assertTrue(instance_2.pending)
+
+        self.advance_real_time_until(lambda: instance_1.played, 3.0)
+        self.assertTrue(instance_2.pending)
+
+        self.advance_real_time_until(lambda: instance_2.played, 1.5)
+
+        # A sound waiting for a marker is canceled when the other sound stops before the marker
+        instance_3 = track_sfx.play_sound(self.mc.sounds['198361_sfx-028'],
+                                          settings={'start_after': moron_test, 'start_after_marker': 0})
+        self.advance_real_time(0.1)
+        track_sfx.stop_sound_instance(moron_test)
+        self.advance_real_time(0.1)
+        self.assertTrue(instance_3.finished)
+        self.assertFalse(instance_3.played)
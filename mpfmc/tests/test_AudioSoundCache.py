@@ -0,0 +1,150 @@
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import wave
+
+from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
+
+try:
+    from mpfmc.core.audio import SoundSystem
+    from mpfmc.core.audio.sound_cache import SoundCache
+except ImportError:
+    SoundSystem = None
+    logging.warning("mpfmc.core.audio library could not be loaded. Audio "
+                    "features will not be available")
+
+
+class TestAudioSoundCache(MpfMcTestCase):
+    """
+    Tests the sound cache (sound files converted to the audio output format)
+    """
+
+    def get_machine_path(self):
+        return 'tests/machine_files/audio'
+
+    def get_config_file(self):
+        return 'test_audio_offline.yaml'
+
+    def _check_audio(self):
+        if SoundSystem is None or self.mc.sound_system is None:
+            log = logging.getLogger('TestAudio')
+            log.warning("Sound system is not enabled - unable to run audio tests")
+            self.skipTest("Sound system is not enabled")
+
+        if self.mc.sound_system.audio_interface is None:
+            log = logging.getLogger('TestAudio')
+            log.warning("Sound system audio interface could not be loaded - skipping audio tests")
+            self.skipTest("Sound system audio interface could not be loaded")
+
+    def test_sound_cache(self):
+        """ Tests building the sound cache and loading sounds from it """
+        self._check_audio()
+        interface = self.mc.sound_system.audio_interface
+
+        # The sound cache is disabled by default
+        self.assertFalse(self.mc.sound_system.config['sound_cache'])
+        self.assertIsNone(interface.sound_cache)
+
+        machine_path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, machine_path)
+        os.makedirs(os.path.join(machine_path, 'sounds'))
+        source_folder = os.path.join(os.path.dirname(__file__), 'machine_files', 'audio', 'sounds')
+        file_name = os.path.join(machine_path, 'sounds', '263774_music.ogg')
+        shutil.copy(os.path.join(source_folder, 'music', '263774_music.ogg'), file_name)
+
+        sound_cache = SoundCache(machine_path, 44100, 2)
+        cached_file_name = os.path.join(machine_path, 'cache', 'sounds', '44100hz_2ch', 'sounds',
+                                        '263774_music.ogg.wav')
+        self.assertEqual(cached_file_name, sound_cache.get_cached_file_name(file_name))
+        self.assertIsNone(sound_cache.get_cached_file_name(os.path.join(source_folder, 'sfx', '210871_synthping.wav')))
+        self.assertEqual(file_name, sound_cache.get_file(file_name))
+
+        # Convert the sound (the cached file is verified once it has been written)
+        result = sound_cache.build_file(interface, file_name)
+        self.assertEqual('built', result['status'])
+        self.assertEqual(os.path.getsize(cached_file_name), result['cached_size'])
+        self.assertEqual(cached_file_name, sound_cache.get_file(file_name))
+        self.assertEqual('up to date', sound_cache.build_file(interface, file_name)['status'])
+        self.assertEqual('built', sound_cache.build_file(interface, file_name, force=True)['status'])
+
+        with wave.open(cached_file_name, 'rb') as wav_file:
+            self.assertEqual(44100, wav_file.getframerate())
+            self.assertEqual(2, wav_file.getnchannels())
+            self.assertEqual(2, wav_file.getsampwidth())
+
+        # The cached file holds the same samples as the converted sound file
+        original = interface.load_sound_file_to_memory(file_name)
+        interface.sound_cache = sound_cache
+        cached = interface.load_sound_file_to_memory(file_name)
+        self.assertEqual(original.get_samples(), cached.get_samples())
+        self.assertAlmostEqual(original.duration, cached.duration, places=3)
+
+        # The cached file is not used once the sound file has been modified
+        modified_time = os.path.getmtime(cached_file_name) + 10
+        os.utime(file_name, (modified_time, modified_time))
+        self.assertFalse(sound_cache.is_up_to_date(file_name))
+        self.assertEqual(file_name, sound_cache.get_file(file_name))
+
+        # A file that cannot be converted is reported as failed (and not cached)
+        bad_file_name = os.path.join(machine_path, 'sounds', 'bad.wav')
+        with open(bad_file_name, 'wb') as bad_file:
+            bad_file.write(b'not a sound file')
+        result = sound_cache.build_file(interface, bad_file_name)
+        self.assertEqual('failed', result['status'])
+        self.assertIsNotNone(result['error'])
+        self.assertFalse(os.path.exists(sound_cache.get_cached_file_name(bad_file_name)))
+
+    def test_sound_cache_setting(self):
+        """ Tests the sound cache is only used once it has been built for the configured format """
+        self._check_audio()
+        sound_system = self.mc.sound_system
+
+        machine_path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, machine_path)
+        self.addCleanup(setattr, self.mc, 'machine_path', self.mc.machine_path)
+        self.mc.machine_path = machine_path
+
+        # The configured output format is the key of the sound cache
+        self.assertEqual((44100, 2), SoundSystem.get_output_format(sound_system.config))
+        self.assertEqual((44100, 1), SoundSystem.get_output_format({'frequency': 'auto'}))
+
+        # A missing sound cache is logged (and not used)
+        with self.assertLogs('SoundSystem', level='WARNING') as logs:
+            self.assertIsNone(sound_system._get_sound_cache())
+        self.assertIn('build_sounds', logs.output[0])
+
+        folder = os.path.join(machine_path, 'cache', 'sounds', '44100hz_2ch')
+        os.makedirs(folder)
+        self.assertEqual(folder, sound_system._get_sound_cache().folder)
+
+    def test_build_sounds(self):
+        """ Tests building the sound cache of a machine with the build_sounds command """
+        self._check_audio()
+
+        machine_path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, machine_path)
+        os.makedirs(os.path.join(machine_path, 'config'))
+        os.makedirs(os.path.join(machine_path, 'sounds'))
+        with open(os.path.join(machine_path, 'config', 'config.yaml'), 'w') as config_file:
+            config_file.write("#config_version=5\nsound_system:\n  frequency: 22050\n  channels: 1\n")
+        shutil.copy(os.path.join(os.path.dirname(__file__), 'machine_files', 'audio', 'sounds', 'sfx',
+                                 '210871_synthping.wav'),
+                    os.path.join(machine_path, 'sounds'))
+
+        # The command opens its own (offline) audio interface, so it runs in its own process
+        result = subprocess.run([sys.executable, '-c',
+                                 'from mpfmc.commands.build_sounds import Command; '
+                                 'Command(None, {!r}, [])'.format(machine_path)],
+                                stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        self.assertEqual(0, result.returncode, result.stdout.decode(errors='replace'))
+        self.assertIn(b'1 built, 0 up to date, 0 failed', result.stdout)
+
+        cached_file_name = os.path.join(machine_path, 'cache', 'sounds', '22050hz_1ch', 'sounds',
+                                        '210871_synthping.wav.wav')
+        self.assertTrue(os.path.isfile(cached_file_name))
+        with wave.open(cached_file_name, 'rb') as wav_file:
+            self.assertEqual(22050, wav_file.getframerate())
+            self.assertEqual(1, wav_file.getnchannels())
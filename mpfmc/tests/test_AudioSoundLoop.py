@@ -133,3 +133,73 @@ class TestAudioSoundLoop(MpfMcTestCase):
         # Make sure next pending sound_loop_set is cancelled with stop action
         status = track_loops.get_status()
         self.assertEqual(status[1]['status'], "idle")
+
+    def test_sound_loop_set_on_demand_and_streaming(self):
+        """ Tests sound loop sets with sounds loaded on demand and streaming layers"""
+
+        if SoundSystem is None or self.mc.sound_system is None:
+            log = logging.getLogger('TestAudioSoundLoop')
+            log.warning("Sound system is not enabled - skipping audio tests")
+            self.skipTest("Sound system is not enabled")
+
+        interface = self.mc.sound_system.audio_interface
+        if interface is None:
+            log = logging.getLogger('TestAudioSoundLoop')
+            log.warning("Sound system audio interface could not be loaded - skipping audio tests")
+            self.skipTest("Sound system audio interface could not be loaded")
+
+        track_loops = interface.get_track_by_name("loops")
+        self.assertTrue(track_loops.supports_streaming_sounds)
+        self.assertIn('on_demand_beat', self.mc.sound_loop_sets)
+        self.assertFalse(self.mc.sounds["kick_on_demand"].loaded)
+        self.assertFalse(self.mc.sounds["hihat_on_demand"].loaded)
+        self.assertTrue(self.mc.sounds["bass_synth_stream"].streaming)
+
+        # Sounds that have not been loaded do not use any memory
+        memory_usage = self.mc.sound_loop_sets.get_memory_usage('on_demand_beat')
+        self.assertEqual(['bass_synth_stream'], memory_usage['streaming'])
+        self.assertEqual(0, memory_usage['sounds']['kick_on_demand'])
+        self.assertEqual(0, memory_usage['sounds']['hihat_on_demand'])
+
+        # The loop set is played once its master sound has been loaded (the layer sounds are loaded too)
+        self.mc.events.post('play_on_demand_beat')
+        self.advance_real_time(1)
+        self.assertTrue(self.mc.sounds["kick_on_demand"].loaded)
+        self.assertTrue(self.mc.sounds["hihat_on_demand"].loaded)
+
+        status = track_loops.get_status()
+        self.assertEqual(status[0]['status'], "playing")
+        self.assertEqual(status[0]['sound_id'], self.mc.sounds["kick_on_demand"].id)
+        self.assertEqual(len(status[0]['layers']), 2)
+        self.assertFalse(status[0]['streaming'])
+        self.assertFalse(status[0]['layers'][0]['streaming'])
+        self.assertTrue(status[0]['layers'][1]['streaming'])
+        self.assertEqual("playing", status[0]['layers'][1]['status'])
+
+        # Only the beginning of the streaming layer sound is held in memory (1 second)
+        self.assertGreater(status[0]['layers'][1]['sound_length'], 176400)
+        self.assertEqual(176400, status[0]['layers'][1]['memory'])
+
+        memory_usage = self.mc.sound_loop_sets.get_memory_usage('on_demand_beat')
+        self.assertEqual(self.mc.sounds["kick_on_demand"].container.memory_size,
+                         memory_usage['sounds']['kick_on_demand'])
+        self.assertEqual(0, memory_usage['sounds']['bass_synth_stream'])
+        self.assertEqual(memory_usage['sounds']['kick_on_demand'] + memory_usage['sounds']['hihat_on_demand'],
+                         memory_usage['total'])
+        self.assertEqual(memory_usage['total'] + 176400, status[0]['memory'])
+
+        # The streaming layer keeps playing when the loop set loops (the start is played from memory)
+        self.advance_real_time(3)
+        status = track_loops.get_status()
+        self.assertEqual(status[0]['status'], "playing")
+        self.assertEqual("playing", status[0]['layers'][1]['status'])
+
+        track_loops.stop_layer(2)
+        self.advance_real_time(0.5)
+        status = track_loops.get_status()
+        self.assertEqual("stopped", status[0]['layers'][1]['status'])
+
+        self.mc.events.post('stop_current_loop')
+        self.advance_real_time(2)
+        status = track_loops.get_status()
+        self.assertEqual(status[0]['status'], "idle")
@@ -0,0 +1,74 @@
+import logging
+from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
+
+try:
+    from mpfmc.core.audio import SoundSystem
+    from mpfmc.core.audio.sound_queue import SoundQueue
+    from mpfmc.assets.sound import SoundInstance
+except ImportError:
+    SoundSystem = None
+    logging.warning("mpfmc.core.audio library could not be loaded. Audio "
+                    "features will not be available")
+
+
+class TestAudioSoundQueue(MpfMcTestCase):
+    """
+    Tests the indexed priority queue used by standard tracks to hold sounds waiting to be played
+    """
+
+    def get_machine_path(self):
+        return 'tests/machine_files/audio'
+
+    def get_config_file(self):
+        return 'test_audio.yaml'
+
+    def test_sound_queue(self):
+        if SoundSystem is None or self.mc.sound_system is None:
+            log = logging.getLogger('TestAudio')
+            log.warning("Sound system is not enabled - unable to run audio tests")
+            self.skipTest("Sound system is not enabled")
+
+        sound = self.mc.sounds['210871_synthping']
+        other_sound = self.mc.sounds['264828_text']
+
+        low = SoundInstance(sound, 'mode1', {'priority': 1})
+        high = SoundInstance(sound, 'mode2', {'priority': 10})
+        medium = SoundInstance(other_sound, 'mode1', {'priority': 5, 'key': 'callout'})
+        medium2 = SoundInstance(other_sound, 'mode2', {'priority': 6})
+
+        queue = SoundQueue()
+        for sound_instance in (low, medium, high, medium2):
+            queue.push(sound_instance)
+
+        # Instances are ordered by priority (same order as SoundInstance.__lt__)
+        self.assertEqual(4, len(queue))
+        self.assertIn(low, queue)
+        self.assertIs(high, queue.peek())
+        self.assertEqual(sorted([low, medium, high, medium2]), [high, medium2, medium, low])
+
+        # Removal by instance, context, key and sound
+        self.assertTrue(queue.remove(high))
+        self.assertFalse(queue.remove(high))
+        self.assertNotIn(high, queue)
+        self.assertIs(medium2, queue.peek())
+
+        self.assertEqual([medium], queue.remove_key('callout'))
+        self.assertEqual([], queue.remove_key('callout'))
+        self.assertEqual([medium2], queue.remove_context('mode2'))
+        self.assertEqual(1, len(queue))
+
+        queue.push(medium)
+        self.assertEqual([low], queue.remove_sound(sound.id))
+        self.assertIs(medium, queue.pop())
+        self.assertIsNone(queue.pop())
+        self.assertEqual(0, len(queue))
+
+        # Many removed entries (heap compaction)
+        instances = [SoundInstance(sound, 'mode{}'.format(i % 3), {'priority': i % 4}) for i in range(100)]
+        for sound_instance in instances:
+            queue.push(sound_instance)
+        queue.remove_context('mode0')
+        queue.remove_context('mode1')
+        remaining = [queue.pop() for _ in range(len(queue))]
+        self.assertEqual(sorted([i for i in instances if i.context == 'mode2']), remaining)
+        self.assertEqual([], queue.clear())
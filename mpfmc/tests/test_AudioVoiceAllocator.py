@@ -0,0 +1,115 @@
+import logging
+from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
+
+try:
+    from mpfmc.core.audio import SoundSystem
+    from mpfmc.core.audio.voice_allocator import VoiceAllocator
+    from mpfmc.assets.sound import SoundInstance
+except ImportError:
+    SoundSystem = None
+    logging.warning("mpfmc.core.audio library could not be loaded. Audio "
+                    "features will not be available")
+
+
+class TestAudioVoiceAllocator(MpfMcTestCase):
+    """
+    Tests the voice allocator used by standard tracks to choose sound players
+    """
+
+    def get_machine_path(self):
+        return 'tests/machine_files/audio'
+
+    def get_config_file(self):
+        return 'test_audio_offline.yaml'
+
+    def _check_audio(self):
+        if SoundSystem is None or self.mc.sound_system is None:
+            log = logging.getLogger('TestAudio')
+            log.warning("Sound system is not enabled - unable to run audio tests")
+            self.skipTest("Sound system is not enabled")
+
+        if self.mc.sound_system.audio_interface is None:
+            log = logging.getLogger('TestAudio')
+            log.warning("Sound system audio interface could not be loaded - skipping audio tests")
+            self.skipTest("Sound system audio interface could not be loaded")
+
+    def test_voice_allocator(self):
+        """ Tests the voice allocator priority heap and per sound counts """
+        self._check_audio()
+        sound = self.mc.sounds['210871_synthping']
+        other_sound = self.mc.sounds['264828_text']
+
+        low = SoundInstance(sound, None, {'priority': 1})
+        high = SoundInstance(sound, None, {'priority': 10})
+        medium = SoundInstance(other_sound, None, {'priority': 5})
+        same = SoundInstance(other_sound, None, {'priority': 1})
+
+        allocator = VoiceAllocator(4)
+        self.assertEqual((-1, None), allocator.get_lowest_priority_player())
+        allocator.assign(2, low)
+        allocator.assign(0, high)
+        allocator.assign(1, medium)
+        allocator.assign(3, same)
+        self.assertEqual(4, len(allocator))
+
+        # The lowest player number is returned when several sounds have the same priority
+        self.assertEqual((2, 1), allocator.get_lowest_priority_player())
+        self.assertEqual(2, allocator.get_sound_instance_count(sound.id))
+        self.assertEqual(2, allocator.get_player(low.id))
+        self.assertEqual(-1, allocator.get_player(12345))
+
+        allocator.release(low.id)
+        allocator.release(low.id)
+        self.assertEqual((3, 1), allocator.get_lowest_priority_player())
+        self.assertEqual([high], allocator.get_sound_instances(sound.id))
+
+        # Assigning a sound instance to a busy player replaces the previous one
+        replacement = SoundInstance(sound, None, {'priority': 7})
+        allocator.assign(3, replacement)
+        self.assertEqual(-1, allocator.get_player(same.id))
+        self.assertEqual([medium], allocator.get_sound_instances(other_sound.id))
+        self.assertEqual((1, 5), allocator.get_lowest_priority_player())
+
+        for sound_instance in (high, medium, replacement):
+            allocator.release(sound_instance.id)
+        self.assertEqual(0, len(allocator))
+        self.assertEqual((-1, None), allocator.get_lowest_priority_player())
+        self.assertEqual(0, allocator.get_sound_instance_count(sound.id))
+
+    def test_voice_stealing(self):
+        """ Tests sound players are stolen by priority and reused as soon as they are idle """
+        self._check_audio()
+        interface = self.mc.sound_system.audio_interface
+        track_sfx = interface.get_track_by_name("sfx")
+        kick = self.mc.sounds['kick']
+
+        for priority in range(1, 9):
+            self.assertIsNotNone(track_sfx.play_sound(kick, settings={'priority': priority}))
+        self.mc.sound_system.render(0.1)
+        self.advance_time()
+        self.assertEqual(["playing"] * 8, [player['status'] for player in track_sfx.get_status()])
+
+        # A sound with a lower priority than all the playing sounds cannot be played
+        self.assertIsNone(track_sfx.play_sound(kick, settings={'priority': 0, 'max_queue_time': 0}))
+
+        # A sound with a higher priority replaces the sound with the lowest priority
+        sound_instance = track_sfx.play_sound(kick, settings={'priority': 5})
+        status = track_sfx.get_status()
+        self.assertEqual("replacing", status[0]['status'])
+        self.mc.sound_system.render(0.1)
+        self.advance_time()
+        status = track_sfx.get_status()
+        self.assertEqual("playing", status[0]['status'])
+        self.assertEqual(sound_instance.id, status[0]['sound_instance_id'])
+        self.assertEqual([5, 2, 3, 4, 5, 6, 7, 8], [player['priority'] for player in status])
+
+        # Players that have finished playing are reused right away (even before the sound
+        # stopped notifications have been processed)
+        self.mc.sound_system.render(2.0)
+        sound_instance = track_sfx.play_sound(kick, settings={'priority': 1})
+        status = track_sfx.get_status()
+        self.assertEqual("playing", status[0]['status'])
+        self.assertEqual(sound_instance.id, status[0]['sound_instance_id'])
+        self.assertEqual(["idle"] * 7, [player['status'] for player in status[1:]])
+        self.advance_time()
+        self.assertIsNotNone(track_sfx.get_playing_sound_instance_by_id(sound_instance.id))
@@ -0,0 +1,71 @@
+import gzip
+import os
+import tempfile
+
+from mpfmc.core.bcp_recorder import BcpRecorder, BcpReplayer, read_bcp_log
+from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
+
+
+class TestBcpRecorder(MpfMcTestCase):
+    def get_machine_path(self):
+        return 'tests/machine_files/display'
+
+    def get_config_file(self):
+        return 'test_display.yaml'
+
+    def _record(self, file_name, messages):
+        recorder = BcpRecorder(self.mc, file_name)
+        for received, message in messages:
+            recorder.record(message, received)
+        recorder.stop()
+        return recorder
+
+    def test_record(self):
+        self.assertIsNone(self.mc.bcp_processor.recorder)
+
+        with tempfile.TemporaryDirectory() as folder:
+            file_name = os.path.join(folder, 'logs', 'bcp.bcplog')
+            recorder = self._record(file_name, [(10.0, 'hello?version=1.1'),
+                                                (10.25, 'trigger?name=test_event&value=int:3'),
+                                                (11.5, 'trigger?name=tést')])
+            self.assertEqual(3, recorder.count)
+
+            self.assertEqual([(0.0, 'hello?version=1.1'),
+                              (.25, 'trigger?name=test_event&value=int:3'),
+                              (1.5, 'trigger?name=tést')], list(read_bcp_log(file_name)))
+
+            with gzip.open(file_name, 'wb') as log_file:
+                log_file.write(b'hello?version=1.1\n')
+            with self.assertRaises(ValueError):
+                list(read_bcp_log(file_name))
+
+    def test_replay(self):
+        events = []
+        self.mc.events.add_handler('test_replay', lambda value, **kwargs: events.append(value))
+
+        with tempfile.TemporaryDirectory() as folder:
+            file_name = os.path.join(folder, 'bcp.bcplog')
+            self._record(file_name, [(0.0, 'trigger?name=test_replay&value=int:1'),
+                                     (0.0, 'trigger?name=test_replay&value=int:2'),
+                                     (0.5, 'trigger?name=test_replay&value=int:3')])
+
+            # as fast as possible, one frame of messages per frame
+            replayer = BcpReplayer(self.mc, file_name, speed=0)
+            self.assertEqual(3, replayer.count)
+            replayer.start()
+            self.assertIn(replayer._replay, self.mc.frame_pipeline.get_callbacks('bcp'))
+
+            self.advance_time(.2)
+            self.assertEqual([1, 2], events)
+            self.assertFalse(replayer.done)
+
+            self.advance_time(1)
+            self.assertEqual([1, 2, 3], events)
+            self.assertTrue(replayer.done)
+            self.assertNotIn(replayer._replay, self.mc.frame_pipeline.get_callbacks('bcp'))
+
+        stats = replayer.get_stats()
+        self.assertEqual(3, stats['messages'])
+        self.assertEqual(2, stats['queue_depth']['max'])
+        self.assertEqual(len(replayer.queue_depths) - 1, stats['frames'])
+        self.assertEqual(4, len(replayer.get_report()))
@@ -0,0 +1,130 @@
+from kivy.clock import Clock
+
+from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
+from mpfmc.widgets.display import DisplayWidget
+
+
+class TestDisplayRenderScheduler(MpfMcTestCase):
+    def get_machine_path(self):
+        return 'tests/machine_files/display'
+
+    def get_config_file(self):
+        return 'test_display.yaml'
+
+    def _add_display_widget(self, source_display, target):
+        config = self.mc.config_validator.validate_config('widgets:display', {
+            'type': 'display',
+            'source_display': source_display,
+            'width': 128,
+            'height': 32}, base_spec='widgets:common')
+        widget = DisplayWidget(self.mc, config=config)
+        self.mc.displays[target].add_widget_to_current_slide(widget.container)
+        return widget
+
+    def test_render_order(self):
+        window = self.mc.displays['window']
+        dmd = self.mc.displays['dmd']
+
+        # the dmd is shown on the window slide, so it has to be rendered first
+        dependencies = self.mc.render_scheduler.get_dependencies()
+        self.assertEqual([dmd], dependencies[window])
+        self.assertEqual([], dependencies[dmd])
+        self.assertEqual([dmd, window], self.mc.render_scheduler.get_render_order())
+
+        # the window display itself is shown in the (Kivy) window
+        self.assertIsNone(self.mc.render_scheduler.get_host_display(window.parent))
+
+        # all the outputs show the cached texture of the display
+        self.assertIsNotNone(dmd.texture)
+        self.assertEqual(tuple(dmd.native_size), tuple(dmd.texture.size))
+
+    def test_render_once_per_frame(self):
+        dmd = self.mc.displays['dmd']
+        rendered = list()
+        self.mc.render_scheduler.add_listener(dmd, rendered.append)
+
+        # show the dmd two more times on the window
+        self._add_display_widget('dmd', 'window')
+        self._add_display_widget('dmd', 'window')
+        self.advance_time()
+        self.assertEqual(3, len(dmd.parents))
+        self.assertEqual([dmd, self.mc.displays['window']], self.mc.render_scheduler.get_render_order())
+
+        frames = self.mc.render_scheduler.frames
+        render_count = self.mc.render_scheduler.render_counts['dmd']
+        del rendered[:]
+
+        # change the content of the dmd
+        dmd.current_slide.widgets[0].widget.opacity = .5
+        self.advance_time()
+
+        # the dmd was rendered after the change, but never more than once per frame
+        frames = self.mc.render_scheduler.frames - frames
+        render_count = self.mc.render_scheduler.render_counts['dmd'] - render_count
+        self.assertGreater(frames, 0)
+        self.assertGreater(render_count, 0)
+        self.assertLessEqual(render_count, frames)
+        self.assertEqual(render_count, len(rendered))
+
+        self.mc.render_scheduler.remove_listener(dmd, rendered.append)
+        self.advance_time()
+        self.assertEqual(render_count, len(rendered))
+
+    def test_skip_unchanged_displays(self):
+        scheduler = self.mc.render_scheduler
+        self.advance_time()
+
+        # nothing changes on the displays, so the cached textures are reused
+        stats = scheduler.get_stats()
+        self.advance_time()
+        new_stats = scheduler.get_stats()
+        frames = new_stats['frames'] - stats['frames']
+        self.assertGreater(frames, 0)
+        self.assertEqual(stats['rendered_frames'], new_stats['rendered_frames'])
+        self.assertEqual(frames, new_stats['skipped_frames'] - stats['skipped_frames'])
+        for name in ('window', 'dmd'):
+            self.assertEqual(stats['displays'][name]['rendered'], new_stats['displays'][name]['rendered'])
+            self.assertEqual(frames, new_stats['displays'][name]['skipped'] - stats['displays'][name]['skipped'])
+
+        # a change on the dmd renders the dmd and the window it is shown in
+        self.mc.displays['dmd'].current_slide.widgets[0].widget.opacity = .5
+        self.advance_time()
+        stats = scheduler.get_stats()
+        self.assertEqual(new_stats['rendered_frames'] + 1, stats['rendered_frames'])
+        for name in ('window', 'dmd'):
+            self.assertEqual(new_stats['displays'][name]['rendered'] + 1, stats['displays'][name]['rendered'])
+
+    def test_idle_mode(self):
+        scheduler = self.mc.render_scheduler
+        self.advance_time()
+        self.assertFalse(scheduler.idle)
+
+        # idle_fps is disabled by default
+        self._current_time += 10
+        scheduler._update_idle_mode(False)
+        self.assertFalse(scheduler.idle)
+
+        scheduler.idle_fps = 5
+        scheduler.idle_timeout = 2
+        scheduler._update_idle_mode(True)
+        self._current_time += 1
+        scheduler._update_idle_mode(False)
+        self.assertFalse(scheduler.idle)
+
+        # no change for idle_timeout, use the idle frame rate
+        self._current_time += 1
+        scheduler._update_idle_mode(False)
+        self.assertTrue(scheduler.idle)
+        self.assertEqual(5, self.mc.frame_pipeline.max_fps)
+        self.assertEqual(0, Clock._max_fps)
+
+        # the pipeline runs at most 5 frames per second
+        frames = self.mc.frame_pipeline.frames
+        self.advance_time(1)
+        self.assertTrue(scheduler.idle)
+        self.assertLessEqual(self.mc.frame_pipeline.frames - frames, 6)
+
+        # back to the normal frame rate on the next change
+        scheduler.wake()
+        self.assertFalse(scheduler.idle)
+        self.assertEqual(0, self.mc.frame_pipeline.max_fps)
@@ -0,0 +1,97 @@
+from kivy.uix.effectwidget import HorizontalBlurEffect, FXAAEffect
+
+from mpfmc.effects.dot_filter import DotFilterEffect
+from mpfmc.effects.flip_vertical import FlipVerticalEffect
+from mpfmc.effects.gain import GainEffect
+from mpfmc.effects.gamma import GammaEffect
+from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
+from mpfmc.uix.effects import FusedEffect, ShaderCache
+from mpfmc.widgets.display import DisplayWidget
+
+
+class TestEffects(MpfMcTestCase):
+    def get_machine_path(self):
+        return 'tests/machine_files/display'
+
+    def get_config_file(self):
+        return 'test_display.yaml'
+
+    def test_compile_effects(self):
+        manager = self.mc.effects_manager
+
+        # per-pixel effects are fused into the effect sampling the texture before them
+        flip = FlipVerticalEffect()
+        gain = GainEffect(gain=.5)
+        gamma = GammaEffect(gamma=2.0)
+        effects = manager.compile_effects([flip, gain, gamma])
+        self.assertEqual(1, len(effects))
+        self.assertIsInstance(effects[0], FusedEffect)
+        self.assertEqual([flip, gain, gamma], effects[0].effects)
+        self.assertIn('color = effect_2(color, texture, tex_coords, coords);', effects[0].glsl)
+
+        # the uniforms of the effects are renamed and forwarded to the fused shader
+        self.assertIn('uniform float gain_1;', effects[0].glsl)
+        self.assertEqual({'gain_1': .5, 'gamma_2': 2.0}, effects[0].uniforms)
+        glsl = effects[0].glsl
+        gain.gain = .25
+        self.assertEqual(.25, effects[0].uniforms['gain_1'])
+        self.assertEqual(glsl, effects[0].glsl)
+
+        # effects sampling the texture start a new pass
+        blur = HorizontalBlurEffect()
+        fxaa = FXAAEffect()
+        effects = manager.compile_effects([gain, blur, gamma, fxaa])
+        self.assertEqual(3, len(effects))
+        self.assertIs(gain, effects[0])
+        self.assertEqual([blur, gamma], effects[1].effects)
+        self.assertIs(fxaa, effects[2])
+
+        # effects declaring the same globals can share a shader
+        effects = manager.compile_effects([DotFilterEffect(), DotFilterEffect(blur=.2)])
+        self.assertEqual(1, len(effects))
+        self.assertEqual(.1, effects[0].uniforms['blur_0'])
+        self.assertEqual(.2, effects[0].uniforms['blur_1'])
+
+    def test_uniforms(self):
+        # the parameters are uniforms, so all the gain effects use the same glsl
+        gain1 = GainEffect(gain=.5)
+        gain2 = GainEffect(gain=.8)
+        self.assertEqual(gain1.glsl, gain2.glsl)
+        self.assertEqual({'gain': .5}, gain1.uniforms)
+
+        gain1.gain = .6
+        self.assertEqual({'gain': .6}, gain1.uniforms)
+        self.assertEqual(gain2.glsl, gain1.glsl)
+
+        dot_filter = DotFilterEffect(width=512, height=128, dots_x=128, dots_y=32)
+        self.assertEqual(4.0, dot_filter.uniforms['dotSize'])
+        self.assertEqual((512.0, 128.0), dot_filter.uniforms['widgetSize'])
+        self.assertIs(ShaderCache.get_source(gain1.glsl), ShaderCache.get_source(gain2.glsl))
+
+    def test_display_widget_effects(self):
+        config = self.mc.config_validator.validate_config('widgets:display', {
+            'type': 'display',
+            'source_display': 'dmd',
+            'width': 512,
+            'height': 128,
+            'effects': self.mc.effects_manager.validate_effects([{'type': 'color_dmd', 'shades': 16}])},
+            base_spec='widgets:common')
+        widget = DisplayWidget(self.mc, config=config)
+        self.mc.displays['window'].add_widget_to_current_slide(widget.container)
+        self.advance_time()
+
+        # dot_filter, reduce and gain are rendered in one pass
+        self.assertEqual(1, len(widget.effects.effects))
+        self.assertEqual(1, len(widget.effects.fbo_list))
+        self.assertEqual(3, len(widget.effects.effects[0].effects))
+
+        # changing a parameter does not compile the shader again
+        compile_count = ShaderCache.compile_count
+        widget.effects.effects[0].effects[2].gain = .5
+        self.advance_time()
+        self.assertEqual(.5, widget.effects.effects[0].uniforms['gain_2'])
+        self.assertEqual(compile_count, ShaderCache.compile_count)
+
+        # neither does setting the same shader again
+        widget.effects.effects[0].set_fbo_shader()
+        self.assertEqual(compile_count, ShaderCache.compile_count)
@@ -0,0 +1,57 @@
+from mpfmc.core.frame_pipeline import STAGES
+from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
+
+
+class TestFramePipeline(MpfMcTestCase):
+    def get_machine_path(self):
+        return 'tests/machine_files/display'
+
+    def get_config_file(self):
+        return 'test_display.yaml'
+
+    def test_stage_order(self):
+        pipeline = self.mc.frame_pipeline
+        self.assertIn(self.mc.tick, pipeline.get_callbacks('events'))
+        self.assertIn(self.mc.bcp_processor._get_from_queue, pipeline.get_callbacks('bcp'))
+        self.assertIn(self.mc.render_scheduler._render, pipeline.get_callbacks('render'))
+
+        calls = []
+        callbacks = {stage: lambda dt, stage=stage: calls.append(stage) for stage in STAGES}
+        for stage, callback in callbacks.items():
+            pipeline.add_callback(stage, callback)
+
+        # the stages run in order once per frame (the render and readback stages at
+        # the end of the frame)
+        frames = pipeline.frames
+        self.advance_time(.01)
+        self.assertEqual(1, pipeline.frames - frames)
+        self.assertEqual(list(STAGES), calls)
+        self.assertEqual(set(STAGES), set(pipeline.times))
+
+        for stage, callback in callbacks.items():
+            pipeline.remove_callback(stage, callback)
+        del calls[:]
+        self.advance_time()
+        self.assertEqual([], calls)
+
+    def test_bcp_to_render(self):
+        self.mc.events.add_handler('test_trigger', lambda **kwargs: self.mc.targets['default'].add_and_show_slide(
+            widgets=[], slide_name='test_slide', priority=100))
+        self.advance_time()
+        render_count = self.mc.render_scheduler.render_counts['window']
+
+        # a BCP command changes the display in the frame it is received
+        self.mc.bcp_processor.receive_bcp_message('trigger?name=test_trigger')
+        self.advance_time(.01)
+        self.assertEqual(render_count + 1, self.mc.render_scheduler.render_counts['window'])
+
+    def test_stop(self):
+        pipeline = self.mc.frame_pipeline
+        self.advance_time()
+        frames = pipeline.frames
+        self.assertGreater(frames, 0)
+
+        # the pipeline no longer runs on the clock once it is stopped
+        pipeline.stop()
+        self.advance_time()
+        self.assertEqual(frames, pipeline.frames)
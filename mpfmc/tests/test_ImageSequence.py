@@ -0,0 +1,98 @@
+from kivy.core.image import ImageLoader
+
+from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
+from mpfmc.uix.image_sequence import ImageSequence
+
+
+class TestImageSequence(MpfMcTestCase):
+    def get_machine_path(self):
+        return 'tests/machine_files/animated_images'
+
+    def get_config_file(self):
+        return 'test_animated_images.yaml'
+
+    def test_zip_sequence(self):
+        sequence = ImageSequence(self.mc.images['ball'].config['file'], buffer_frames=4)
+
+        # the frame count is the same as for the sequence loaded by Kivy (the
+        # macOS resource forks in the zip are skipped)
+        self.assertEqual(self.mc.images['ball'].frame_count, sequence.frame_count)
+        self.assertTrue(sequence.anim_available)
+        self.assertEqual((40, 40), sequence.texture.size)
+
+        shown = []
+        sequence.bind(on_texture=lambda *args: shown.append(sequence.anim_index))
+        sequence.anim_delay = 1 / 30.
+        sequence.anim_reset(True)
+        self.advance_real_time(1)
+
+        # the frames are shown in order and only a few are kept in memory
+        self.assertGreater(len(shown), 5)
+        for previous, index in zip(shown, shown[1:]):
+            self.assertEqual((previous + 1) % sequence.frame_count, index)
+        self.assertLessEqual(len(sequence._frames), 4)
+        self.assertLessEqual(sequence.memory, 6 * 40 * 40 * 4)
+
+        sequence.anim_reset(False)
+        self.assertIsNone(sequence._thread)
+        index = sequence.anim_index
+        self.advance_time(.5)
+        self.assertEqual(index, sequence.anim_index)
+
+        sequence.unload()
+        self.assertIsNone(sequence.texture)
+
+
+class TestImageSequenceStreaming(MpfMcTestCase):
+    def get_machine_path(self):
+        return 'tests/machine_files/animated_images'
+
+    def get_config_file(self):
+        return 'test_animated_images_streaming.yaml'
+
+    def _get_kivy_textures(self, image):
+        # the same file loaded by Kivy (all the frames are decoded)
+        return ImageLoader.load(image.config['file'], nocache=True).textures
+
+    def assertSameTexture(self, expected, texture):
+        self.assertEqual(tuple(expected.size), tuple(texture.size))
+        self.assertEqual(tuple(expected.tex_coords), tuple(texture.tex_coords))
+        self.assertEqual(expected.pixels, texture.pixels)
+
+    def test_texture_orientation(self):
+        # the frames are shown the same way as the frames of the images loaded by Kivy
+        for name in ('ball', 'busy-stick-figures-animated'):
+            image = self.mc.images[name]
+            self.assertIsInstance(image.image, ImageSequence)
+            textures = self._get_kivy_textures(image)
+            self.assertEqual(len(textures), image.frame_count)
+            self.assertSameTexture(textures[0], image.image.texture)
+
+            # the next frame is uploaded to the other texture of the ring
+            image.image._show_frame(image.image._source.decode(1))
+            self.assertSameTexture(textures[1], image.image.texture)
+
+    def test_widget(self):
+        image = self.mc.images['ball']
+        textures = self._get_kivy_textures(image)
+        self.mc.events.post('slide1')
+        self.advance_time()
+        widget = self.mc.targets['default'].current_slide.widgets[0].widget
+        self.assertIs(image, widget.image)
+        self.assertEqual(30, widget.fps)
+        self.assertEqual(image.image.texture, widget.texture)
+
+        # jump to a frame (at a low frame rate, the frame is shown once it is decoded)
+        widget.fps = 2
+        widget.current_frame = 5
+        self.advance_real_time_until(lambda: widget.current_frame == 6, 1)
+        self.assertSameTexture(textures[4], widget.texture)
+
+        # play the animation once to the end
+        widget.fps = 30
+        widget.loops = 1
+        widget.play()
+        self.advance_real_time_until(lambda: image.image._anim_ev is None, 5)
+        self.assertIsNone(image.image._anim_ev)
+        self.assertEqual(1, widget.current_frame)
+        self.assertSameTexture(textures[-1], widget.texture)
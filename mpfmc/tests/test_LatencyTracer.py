@@ -0,0 +1,95 @@
+import csv
+import os
+import tempfile
+
+from mpfmc.core.dmd import Dmd
+from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
+
+
+class TestLatencyTracer(MpfMcTestCase):
+    def get_machine_path(self):
+        return 'tests/machine_files/display'
+
+    def get_config_file(self):
+        return 'test_display.yaml'
+
+    def setUp(self):
+        super().setUp()
+        # don't write the latencies to the machine folder on shutdown
+        self.mc.latency_tracer.file = None
+
+    def test_slide_latency(self):
+        tracer = self.mc.latency_tracer
+        self.assertFalse(tracer.enabled)
+        self.mc.events.add_handler('test_trigger', lambda **kwargs: self.mc.targets['default'].add_and_show_slide(
+            widgets=[], slide_name='test_slide', priority=100))
+
+        # nothing is traced while the tracer is disabled
+        self.mc.bcp_processor.receive_bcp_message('trigger?name=test_trigger')
+        self.advance_time()
+        self.assertEqual([], tracer.get_paths())
+        self.mc.targets['default'].remove_slide('test_slide')
+        self.advance_time()
+
+        tracer.enabled = True
+        self.mc.bcp_processor.receive_bcp_message('trigger?name=test_trigger')
+        self.advance_time(.01)
+        self.assertEqual([], tracer.current)
+        self.assertEqual(['trigger:test_trigger -> slide'], tracer.get_paths())
+        latency = tracer.get_percentiles('trigger:test_trigger -> slide')[0]
+        self.assertGreater(latency, 0)
+        self.assertEqual(1, sum(tracer.get_histogram('trigger:test_trigger -> slide')))
+
+        with tempfile.TemporaryDirectory() as folder:
+            # the file is written to the machine folder (whatever the path in the event)
+            machine_path = self.mc.machine_path
+            self.mc.machine_path = folder
+            self.mc.events.post('mc_latency_dump', csv_file=os.path.join(folder, 'other', 'latency.csv'))
+            self.advance_time()
+            self.mc.machine_path = machine_path
+            file_name = os.path.join(folder, 'latency.csv')
+            with open(file_name, newline='') as csv_file:
+                rows = list(csv.reader(csv_file))
+            self.assertEqual(['path', 'count', 'p50', 'p95', 'p99', 'max'], rows[0][:6])
+            self.assertEqual(['trigger:test_trigger -> slide', '1'], rows[1][:2])
+
+    def test_dmd_latency(self):
+        tracer = self.mc.latency_tracer
+        tracer.enabled = True
+        dmd = Dmd(self.mc, 'test_dmd', {'source_display': 'dmd', 'only_send_changes': True})
+        self.mc.events.add_handler('show_slide', lambda target, slide, **kwargs: self.mc.targets[
+            target].add_and_show_slide(widgets=[], slide_name=slide, priority=200))
+        self.advance_time()
+
+        # the window is not shown on a DMD, its traces end when it is rendered
+        self.mc.bcp_processor.receive_bcp_message('trigger?name=show_slide&target=default&slide=test1')
+        self.advance_time()
+        self.assertEqual(['trigger:show_slide -> slide'], tracer.get_paths())
+        self.assertEqual({}, tracer._pending_dmds)
+
+        # the DMD frame changes (text replaced by a blank slide)
+        self.mc.bcp_processor.receive_bcp_message('trigger?name=show_slide&target=dmd&slide=test2')
+        self.advance_time()
+        self.assertEqual(['trigger:show_slide -> dmd', 'trigger:show_slide -> slide'], tracer.get_paths())
+        self.assertEqual(1, len(tracer._latencies['trigger:show_slide -> dmd']))
+        self.assertEqual({}, tracer._pending_dmds)
+
+        # the DMD frame does not change (another blank slide), so it is not sent
+        prev_data = dmd.prev_data
+        self.mc.bcp_processor.receive_bcp_message('trigger?name=show_slide&target=dmd&slide=test3')
+        self.advance_time()
+        self.assertIs(prev_data, dmd.prev_data)
+        self.assertEqual(3, len(tracer._latencies['trigger:show_slide -> slide']))
+        self.assertEqual(1, len(tracer._latencies['trigger:show_slide -> dmd']))
+        self.assertEqual({}, tracer._pending_dmds)
+
+    def test_histogram(self):
+        tracer = self.mc.latency_tracer
+        for latency in (.0005, .003, .003, .015, 2.0):
+            tracer.add_latency('test -> sound', latency)
+
+        self.assertEqual([1, 0, 2, 0, 1, 0, 0, 0, 0, 0, 1], tracer.get_histogram('test -> sound'))
+        self.assertEqual((.003, 2.0, 2.0), tracer.get_percentiles('test -> sound'))
+
+        tracer.clear()
+        self.assertEqual([], tracer.get_paths())
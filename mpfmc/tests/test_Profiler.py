@@ -0,0 +1,82 @@
+import csv
+import os
+import tempfile
+
+from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
+
+
+class TestProfiler(MpfMcTestCase):
+    def get_machine_path(self):
+        return 'tests/machine_files/display'
+
+    def get_config_file(self):
+        return 'test_display.yaml'
+
+    def test_measure(self):
+        profiler = self.mc.profiler
+        self.assertFalse(profiler.enabled)
+
+        # nothing is measured while the profiler is stopped
+        with profiler.measure('events'):
+            pass
+        self.advance_time()
+        self.assertEqual(0, profiler.frame_count)
+
+        profiler.start()
+        self.advance_time()
+        self.assertTrue(profiler.enabled)
+        self.assertGreater(profiler.frame_count, 0)
+
+        # nested blocks of the same subsystem are counted once
+        profiler.clear()
+        with profiler.measure('bcp'):
+            with profiler.measure('bcp'):
+                profiler.add_time('bcp', 1.0)
+        profiler._frame_done(0)
+        self.assertGreater(profiler.get_percentiles('bcp')[0], 1.0)
+        self.assertLess(profiler.get_percentiles('bcp')[0], 1.5)
+
+        # percentiles of the per-frame times
+        profiler.clear()
+        for frame in range(100):
+            profiler.add_time('audio', (frame + 1) / 1000.0)
+            profiler._frame_done(0)
+        self.assertEqual((.05, .095, .099), profiler.get_percentiles('audio'))
+        self.assertEqual(.099, profiler.get_stats()['audio']['p99'])
+        self.assertEqual(0.0, profiler.get_stats()['readback']['p50'])
+
+        profiler.stop()
+        self.assertFalse(profiler.enabled)
+
+    def test_events(self):
+        profiler = self.mc.profiler
+
+        self.mc.events.post('mc_profiler_toggle')
+        self.advance_time()
+        self.assertTrue(profiler.enabled)
+
+        self.mc.events.post('mc_profiler_start', overlay=True)
+        self.advance_time()
+        self.assertTrue(profiler.enabled)
+        self.assertIsNotNone(profiler._overlay)
+
+        columns = len(profiler.get_report()) - 1
+        with tempfile.TemporaryDirectory() as folder:
+            # the file is written to the machine folder (whatever the path in the event)
+            machine_path = self.mc.machine_path
+            self.mc.machine_path = folder
+            self.mc.events.post('mc_profiler_dump', csv_file=os.path.join(folder, 'other', 'profile.csv'))
+            self.advance_time()
+            self.mc.machine_path = machine_path
+            file_name = os.path.join(folder, 'profile.csv')
+            with open(file_name, newline='') as csv_file:
+                rows = list(csv.reader(csv_file))
+            self.assertEqual(['index', 'frame', 'events', 'bcp', 'assets', 'audio', 'animation', 'render',
+                              'draw', 'readback'], rows[0])
+            self.assertGreater(len(rows), 1)
+            self.assertEqual(columns, len(rows[1]) - 1)
+
+        self.mc.events.post('mc_profiler_toggle')
+        self.advance_time()
+        self.assertFalse(profiler.enabled)
+        self.assertIsNone(profiler._overlay)
@@ -3,6 +3,7 @@ import weakref
 import gc
 from kivy.uix.screenmanager import WipeTransition, FadeTransition
 
+from mpfmc.config_players.plugins.slide_player import MpfSlidePlayer
 from mpfmc.config_players.slide_player import McSlidePlayer
 from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
 from mpfmc.transitions.move_in import MoveInTransition
@@ -188,6 +189,36 @@ class TestSlidePlayer(MpfMcTestCase):
         self.mc.bcp_processor.receive_bcp_message(bcp_string)
         self.advance_time()
 
+    def test_inline_animations_from_show_via_bcp(self):
+        from mpf.core.bcp.bcp_socket_client import encode_command_string
+
+        # the MPF side of the slide player validates the animations of the widgets
+        player = MpfSlidePlayer(self.mc)
+        with self.assertRaises(ValueError):
+            player.process_animation(dict(property=['x', 'y'], value=['10']))
+        # properties like color need several values
+        animation = player.process_animation(dict(property=['color'], value=['1', '0', '0', '1']))
+        self.assertEqual(4, len(animation['value']))
+
+        show_slide_section = dict(widgets=[dict(
+            type='text', text='TEST FROM SHOW',
+            animations=dict(show_slide=[dict(property=['x', 'opacity'], value=['20%', '.5'],
+                                             duration='1s', easing='in_quad')]))])
+        show_slide_section = player._validate_config_item('slide1', show_slide_section)
+        self.assertNotIn('_step', show_slide_section['slide1']['widgets'][0]['animations']['show_slide'][0])
+
+        bcp_string = encode_command_string('trigger', name='slides_play', context='test_context', priority=1,
+                                           settings=show_slide_section)
+        self.mc.bcp_processor.receive_bcp_message(bcp_string)
+        self.advance_time()
+
+        # the steps are compiled by the mc
+        widget = self.mc.targets['default'].current_slide.widgets[0].widget
+        (step, targets), = widget._animations['show_slide']
+        self.assertEqual(('x', 'opacity'), step.properties)
+        self.assertEqual(((20.0, True), (.5, False)), step.values)
+        self.assertEqual((('x', ((20.0, True), ), False), ('opacity', ((.5, False), ), False)), targets)
+
     def test_slides_created_in_slide_player(self):
         # Anon slides are where the widgets are listed in the slide_player
         # section of a config file or the slides section of a show
@@ -0,0 +1,82 @@
+from mpfmc.assets.video import CachedVideo, VideoFrames
+from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
+
+
+class TestVideoFrameCache(MpfMcTestCase):
+    def get_machine_path(self):
+        return 'tests/machine_files/display'
+
+    def get_config_file(self):
+        return 'test_display.yaml'
+
+    def _get_frames(self):
+        # 4 frames of 2x2 pixels (10 fps), the pixels of each frame have the value of its index
+        return VideoFrames((2, 2), .4, [0.0, .1, .2, .3],
+                           [bytes([index]) * 12 for index in range(4)])
+
+    def test_frames(self):
+        frames = self._get_frames()
+        self.assertEqual(48, frames.memory)
+        self.assertEqual(0, frames.get_index(0))
+        self.assertEqual(0, frames.get_index(.05))
+        self.assertEqual(2, frames.get_index(.2))
+        self.assertEqual(3, frames.get_index(1.0))
+
+    def test_playback(self):
+        video = CachedVideo(self._get_frames(), eos='loop')
+        loaded = []
+        video.bind(on_load=lambda *args: loaded.append(True))
+        self.assertEqual(.4, video.duration)
+        self.assertIsNone(video.texture)
+
+        video.play()
+        self.assertEqual('playing', video.state)
+        self.assertEqual([True], loaded)
+        self.assertEqual((2, 2), video.texture.size)
+        self.assertEqual(0, video._frame_index)
+
+        self.advance_time(.25)
+        self.assertEqual(2, video._frame_index)
+
+        # the video loops without being decoded again
+        self.advance_time(.25)
+        self.assertLess(video.position, .2)
+        self.assertIn(video._frame_index, (0, 1))
+
+        video.pause()
+        position = video.position
+        self.advance_time(.2)
+        self.assertEqual(position, video.position)
+
+        video.position = .3
+        self.assertEqual(3, video._frame_index)
+
+        video.eos = 'stop'
+        video.play()
+        self.advance_time(.2)
+        self.assertEqual('', video.state)
+        self.assertEqual(0, video.position)
+
+        video.unload()
+        self.assertIsNone(video.texture)
+
+
+class TestVideoCacheFramesConfig(MpfMcTestCase):
+    def get_machine_path(self):
+        return 'tests/machine_files/video'
+
+    def get_config_file(self):
+        return 'test_video_cache_frames.yaml'
+
+    def test_cache_frames(self):
+        video = self.mc.videos['mpf_video_small_test']
+        self.assertTrue(video.config['cache_frames'])
+        self.assertEqual(16, video.config['cache_frames_max_memory'])
+        self.assertEqual(.5, video.config['cache_frames_scale'])
+
+        # the frames are decoded (downscaled) when the video is loaded
+        self.advance_real_time_until(lambda: video.loaded, 10)
+        self.assertTrue(video.loaded)
+        self.assertIsNotNone(video.frames)
+        self.assertIsInstance(video.video, CachedVideo)
+        self.assertLessEqual(video.frames.memory, 16 * 1048576)
@@ -0,0 +1,85 @@
+from mpfmc.tests.MpfMcTestCase import MpfMcTestCase
+
+
+class TestVideoFrameTiming(MpfMcTestCase):
+    def get_machine_path(self):
+        return 'tests/machine_files/video'
+
+    def get_config_file(self):
+        return 'test_video.yaml'
+
+    def _get_widget(self):
+        self.mc.events.post('show_slide1')
+        self.advance_time()
+        widget = self.mc.targets['default'].current_slide.widgets[0].widget
+
+        # the frames of the video are not used, the timing is tested with the positions
+        # and clock times passed to _update_frame_timing()
+        widget.stop()
+        self.advance_time()
+        widget.frames = 0
+        widget.dropped_frames = 0
+        widget.late_frames = 0
+        widget._frame_interval = None
+        return widget
+
+    def test_first_frame(self):
+        widget = self._get_widget()
+        widget._update_frame_timing(2.0, 100.0)
+        self.assertEqual(1, widget.frames)
+        self.assertEqual(0, widget.dropped_frames)
+        self.assertEqual(0, widget.late_frames)
+        self.assertEqual(98.0, widget._start_time)
+
+        # the second frame sets the frame interval
+        widget._update_frame_timing(2.1, 100.1)
+        self.assertEqual(2, widget.frames)
+        self.assertAlmostEqual(.1, widget._frame_interval)
+        self.assertEqual(0, widget.dropped_frames)
+        self.assertEqual(0, widget.late_frames)
+
+    def test_seek_and_loop(self):
+        widget = self._get_widget()
+        widget._update_frame_timing(0.0, 10.0)
+        widget._update_frame_timing(.1, 10.1)
+
+        # seeking back (or looping) restarts the timing without counting dropped or late frames
+        widget._update_frame_timing(0.0, 20.0)
+        self.assertEqual(20.0, widget._start_time)
+        widget._update_frame_timing(.1, 20.1)
+        self.assertEqual(4, widget.frames)
+        self.assertEqual(0, widget.dropped_frames)
+        self.assertEqual(0, widget.late_frames)
+
+        # so does a state change (e.g. a pause)
+        widget.state = 'pause'
+        widget._update_frame_timing(.2, 30.0)
+        self.assertEqual(29.8, widget._start_time)
+        self.assertEqual(0, widget.late_frames)
+
+    def test_dropped_frames(self):
+        widget = self._get_widget()
+        widget._update_frame_timing(0.0, 10.0)
+        widget._update_frame_timing(.1, 10.1)
+
+        # the frames at .2 and .3 were not shown
+        widget._update_frame_timing(.4, 10.4)
+        self.assertEqual(3, widget.frames)
+        self.assertEqual(2, widget.dropped_frames)
+        self.assertEqual(0, widget.late_frames)
+
+        widget._update_frame_timing(.5, 10.5)
+        self.assertEqual(2, widget.dropped_frames)
+
+    def test_late_frames(self):
+        widget = self._get_widget()
+        widget._update_frame_timing(0.0, 10.0)
+        widget._update_frame_timing(.1, 10.1)
+
+        # less than one frame interval after the position of the video is not late
+        widget._update_frame_timing(.2, 10.25)
+        self.assertEqual(0, widget.late_frames)
+
+        widget._update_frame_timing(.3, 10.45)
+        self.assertEqual(1, widget.late_frames)
+        self.assertEqual(0, widget.dropped_frames)
@@ -0,0 +1,37 @@
+"""Benchmark of the DSP inserts available on the floating-point mix bus.
+
+Measures the time needed to process one audio buffer through each type of
+DSP insert (including the conversion to and from the floating-point bus) and
+shows it as a percentage of the audio callback period. No audio device is
+required.
+
+Usage: python -m mpfmc.tools.benchmarks.audio_dsp [buffer_samples] [channels] [sample_rate]
+"""
+import sys
+
+from mpfmc.core.audio.audio_interface import benchmark_dsp_insert
+
+INSERTS = (
+    ('float bus only', None),
+    ('eq (peak)', {'type': 'eq', 'filter': 'peak', 'frequency': 1000.0, 'q': 0.707, 'gain': 6.0}),
+    ('eq (lowshelf)', {'type': 'eq', 'filter': 'lowshelf', 'frequency': 200.0, 'q': 0.707, 'gain': -3.0}),
+    ('limiter', {'type': 'limiter', 'threshold': 0.5, 'release': 0.05}),
+    ('reverb', {'type': 'reverb', 'room_size': 0.5, 'damping': 0.5, 'wet': 0.3, 'dry': 1.0}),
+)
+
+
+def run(buffer_samples=2048, channels=2, sample_rate=44100, iterations=500):
+    """Run the benchmark and print the results."""
+    callback_period = buffer_samples / sample_rate * 1000000.0
+
+    print("Insert processing time per callback ({} samples, {} channel(s), {} Hz, {} iterations)".format(
+        buffer_samples, channels, sample_rate, iterations))
+    print("{:>16} {:>14} {:>12}".format("insert", "time (us)", "callback %"))
+
+    for name, settings in INSERTS:
+        elapsed = benchmark_dsp_insert(settings, buffer_samples, channels, sample_rate, iterations)
+        print("{:>16} {:>14.1f} {:>11.2f}%".format(name, elapsed, elapsed / callback_period * 100.0))
+
+
+if __name__ == '__main__':
+    run(*[int(arg) for arg in sys.argv[1:4]])
@@ -0,0 +1,30 @@
+"""Benchmark of the audio mixing kernel.
+
+Measures the time needed to mix one audio buffer at different voice counts
+using the audio library mixing kernel and using the previous approach of one
+SDL_MixAudioFormat call per voice per control point. No audio device is
+required.
+
+Usage: python -m mpfmc.tools.benchmarks.audio_mixer [buffer_samples] [channels]
+"""
+import sys
+
+from mpfmc.core.audio.audio_interface import benchmark_mixer
+
+VOICE_COUNTS = (1, 4, 8, 16, 32, 64)
+
+
+def run(buffer_samples=2048, channels=2, iterations=500):
+    """Run the benchmark and print the results."""
+    print("Mixing time per buffer ({} samples, {} channel(s), {} iterations)".format(
+        buffer_samples, channels, iterations))
+    print("{:>8} {:>14} {:>14} {:>9}".format("voices", "kernel (us)", "sdl (us)", "speedup"))
+
+    for voice_count in VOICE_COUNTS:
+        result = benchmark_mixer(voice_count, buffer_samples, channels, iterations)
+        print("{:>8} {:>14.1f} {:>14.1f} {:>8.2f}x".format(
+            voice_count, result['kernel'], result['sdl'], result['sdl'] / result['kernel']))
+
+
+if __name__ == '__main__':
+    run(*[int(arg) for arg in sys.argv[1:3]])
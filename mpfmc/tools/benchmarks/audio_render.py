@@ -0,0 +1,128 @@
+"""Benchmark of the complete audio callback using the offline audio backend.
+
+Plays a number of looping sounds spread over three standard tracks (like a
+typical machine with music, sfx and voice tracks) and measures the time needed
+to render each audio buffer, including the track mixing, ducking and the mix
+bus. The results are shown as a percentage of the audio callback period and as
+a multiple of real time. No audio device is required.
+
+Usage: python -m mpfmc.tools.benchmarks.audio_render [buffer_count]
+"""
+import os
+import sys
+import time
+
+from mpfmc.assets.sound import SoundAsset
+from mpfmc.core.audio.audio_interface import AudioInterface
+
+VOICE_COUNTS = (1, 4, 8, 16, 32)
+TRACK_NAMES = ('music', 'sfx', 'voice')
+SOUND_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                          'tests', 'machine_files', 'audio', 'sounds', 'loops')
+SOUND_FILES = ('bass_synth.wav', 'kick.wav', 'hihat.wav', 'snare.wav', 'clap.wav', 'kick2.wav')
+
+
+class _Clock(object):
+
+    """Minimal stand-in for the media controller clock."""
+
+    @staticmethod
+    def get_time():
+        return time.time()
+
+
+class _SoundSystem(object):
+
+    """Minimal stand-in for SoundSystem."""
+
+    def __init__(self, audio_interface):
+        self.audio_interface = audio_interface
+        self.config = dict()
+
+
+class _MediaController(object):
+
+    """Minimal stand-in for the media controller (just enough to create and play sound assets)."""
+
+    def __init__(self, audio_interface):
+        self.sound_system = _SoundSystem(audio_interface)
+        self.clock = _Clock()
+        self.config_validator = self
+        self.asset_manager = self
+        self.latency_tracer = self
+        self._next_id = 0
+
+    @staticmethod
+    def validate_config(config_spec, source, base_spec=None):
+        del config_spec
+        del base_spec
+        return dict(source)
+
+    def get_next_id(self):
+        self._next_id += 1
+        return self._next_id
+
+    def track_leak_reference(self, element):
+        pass
+
+    @staticmethod
+    def get_sound_traces():
+        return None
+
+    def post_mc_native_event(self, event, **kwargs):
+        pass
+
+
+def _render_time(voice_count, float_mix_bus, buffer_samples, buffer_count):
+    """Returns the average time (in microseconds) needed to render one audio buffer."""
+    interface = AudioInterface(44100, 2, buffer_samples, float_mix_bus=float_mix_bus, backend='offline')
+    mc = _MediaController(interface)
+    tracks = [interface.create_standard_track(mc, name, max_simultaneous_sounds=max(8, voice_count))
+              for name in TRACK_NAMES]
+
+    sounds = list()
+    for index, file_name in enumerate(SOUND_FILES):
+        sound = SoundAsset(mc, 'sound{}'.format(index), os.path.join(SOUND_PATH, file_name),
+                           {'track': TRACK_NAMES[index % len(TRACK_NAMES)], 'loops': -1, 'volume': 0.5})
+        sound.do_load()
+        sounds.append(sound)
+
+    interface.enable()
+    for voice in range(voice_count):
+        tracks[voice % len(tracks)].play_sound(sounds[voice % len(sounds)])
+
+    # Let the sounds start (and the track volume ramp up) before measuring
+    interface.render(buffer_count=4)
+    interface.process()
+
+    start = time.perf_counter()
+    for _ in range(buffer_count):
+        interface.render(buffer_count=1)
+        interface.process()
+    elapsed = (time.perf_counter() - start) / buffer_count * 1000000.0
+
+    interface.shutdown()
+    for sound in sounds:
+        sound.unload()
+
+    return elapsed
+
+
+def run(buffer_count=500, buffer_samples=1024):
+    """Run the benchmark and print the results."""
+    callback_period = buffer_samples / 44100 * 1000000.0
+
+    print("Audio render time per buffer ({} samples, 2 channels, 44100 Hz, {} tracks, {} buffers)".format(
+        buffer_samples, len(TRACK_NAMES), buffer_count))
+    print("{:>8} {:>10} {:>14} {:>12} {:>12}".format("voices", "mix bus", "time (us)", "callback %", "real time"))
+
+    for voice_count in VOICE_COUNTS:
+        for float_mix_bus in (False, True):
+            elapsed = _render_time(voice_count, float_mix_bus, buffer_samples, buffer_count)
+            print("{:>8} {:>10} {:>14.1f} {:>11.2f}% {:>11.1f}x".format(
+                voice_count, 'float' if float_mix_bus else 'integer', elapsed,
+                elapsed / callback_period * 100.0, callback_period / elapsed))
+
+
+if __name__ == '__main__':
+    run(*[int(arg) for arg in sys.argv[1:2]])
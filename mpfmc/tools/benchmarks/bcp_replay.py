@@ -0,0 +1,99 @@
+"""Replays a recorded BCP log against a media controller without a BCP connection.
+
+Starts the media controller of a machine folder (without the BCP server),
+feeds the messages of a log written by the BCP recorder (see the
+``mpf-mc: bcp_recorder:`` settings) into it and prints the frame times, the
+number of BCP messages queued per frame and the profiler frame times of each
+subsystem. The speed is a multiple of real time, 0 replays the log as fast as
+possible (one frame of messages per frame without waiting for the next
+frame). A window is opened (hidden where the window provider supports it).
+
+Usage: python -m mpfmc.tools.benchmarks.bcp_replay machine_path log_file [speed] [config_file(s)]
+"""
+import os
+import sys
+
+
+def start_mc(machine_path, config_files):
+    """Create and start a media controller without running the Kivy event loop."""
+    from kivy.base import EventLoop, runTouchApp
+    from kivy.core.window import Window
+    from mpf.core.utility_functions import Util
+    from mpfmc.core.mc import MpfMc
+
+    mc = MpfMc(options=dict(machine_path=machine_path,
+                            mcconfigfile='mcconfig.yaml',
+                            production=False,
+                            configfile=Util.string_to_list(config_files),
+                            no_load_cache=False,
+                            create_config_cache=True,
+                            bcp=False),
+               machine_path=machine_path)
+
+    # like App.run() but the frames are run by the caller
+    mc.load_config()
+    mc.load_kv(filename=mc.kv_file)
+    mc.root = mc.build()
+    if mc.root:
+        Window.add_widget(mc.root)
+    mc._app_window = EventLoop.window     # pylint: disable-msg=protected-access
+    mc.dispatch('on_start')
+    runTouchApp(slave=True)
+
+    while not mc.is_init_done.is_set() and not mc.thread_stopper.is_set():
+        EventLoop.idle()
+
+    return mc
+
+
+def run(machine_path, log_file, speed=1.0, config_files='config'):
+    """Replay the log and print the results."""
+    os.environ['KIVY_NO_ARGS'] = '1'
+    os.environ['KIVY_NO_CONSOLELOG'] = '1'
+    os.environ['KIVY_NO_FILELOG'] = '1'
+
+    from kivy import Config
+    Config.set('graphics', 'window_state', 'hidden')
+
+    from kivy.base import EventLoop
+    from kivy.clock import Clock
+    from mpfmc.core.bcp_recorder import BcpReplayer
+
+    machine_path = os.path.abspath(machine_path)
+    mc = start_mc(machine_path, config_files)
+    replayer = BcpReplayer(mc, os.path.abspath(log_file), speed)
+
+    if not speed:
+        # do not wait for the next frame (and don't let the idle mode of the render scheduler
+        # limit the frame pipeline)
+        mc.render_scheduler.wake()
+        mc.render_scheduler.idle_fps = 0
+        Clock._max_fps = 0     # pylint: disable-msg=protected-access
+
+    try:
+        mc.profiler.start()
+        replayer.start()
+        while not replayer.done and not mc.thread_stopper.is_set():
+            EventLoop.idle()
+
+        # process the messages of the last frame
+        EventLoop.idle()
+
+        print("BCP replay of {} (speed: {})".format(log_file, speed or "as fast as possible"))
+        for line in replayer.get_report():
+            print(line)
+        print()
+        print("Profiler frame times (ms)")
+        for line in mc.profiler.get_report():
+            print(line)
+    finally:
+        mc.stop()
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 3:
+        print(__doc__)
+        sys.exit(1)
+
+    run(sys.argv[1], sys.argv[2], float(sys.argv[3]) if len(sys.argv) > 3 else 1.0,
+        sys.argv[4] if len(sys.argv) > 4 else 'config')
@@ -0,0 +1,99 @@
+"""Benchmark of the fused effect shaders.
+
+Measures the GPU time needed to render typical effect chains of the mpf-mc
+once with one pass per effect (multi-pass) and once with the per-pixel effects
+fused into single-pass shaders (see EffectsManager.compile_effects). Also
+prints the largest difference (0-255) between the results (multi-pass rounds
+the color to 8 bits after each pass). An OpenGL context (window) is required.
+
+Usage: python -m mpfmc.tools.benchmarks.effects [width] [height] [iterations]
+"""
+import os
+import sys
+import time
+
+
+def get_chains(width, height):
+    """Return the benchmarked effect chains."""
+    from kivy.uix.effectwidget import HorizontalBlurEffect, VerticalBlurEffect
+    from mpfmc.effects.color_dmd import ColorDmdEffect
+    from mpfmc.effects.dmd import DmdEffect
+    from mpfmc.effects.flip_vertical import FlipVerticalEffect
+    from mpfmc.effects.gain import GainEffect
+    from mpfmc.effects.gamma import GammaEffect
+
+    return (
+        ('dmd', lambda: DmdEffect(width=width, height=height).get_effects()),
+        ('color_dmd', lambda: ColorDmdEffect(width=width, height=height).get_effects()),
+        ('dmd output', lambda: [FlipVerticalEffect(), GainEffect(gain=.8), GammaEffect(gamma=2.2)]),
+        ('color_dmd + dmd output', lambda: ColorDmdEffect(width=width, height=height).get_effects() + [
+            FlipVerticalEffect(), GainEffect(gain=.8), GammaEffect(gamma=2.2)]),
+        ('blur + gain', lambda: [HorizontalBlurEffect(), VerticalBlurEffect(), GainEffect(gain=.8)]),
+    )
+
+
+def render(widget, iterations):
+    """Render the effect widget and return the average time (in ms) and the pixels."""
+    from kivy.graphics.opengl import glFinish
+
+    fbos = [widget.fbo] + list(widget.fbo_list)
+    for fbo in fbos:
+        fbo.draw()
+    glFinish()
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for fbo in fbos:
+            fbo.ask_update()
+            fbo.draw()
+    glFinish()
+
+    return (time.perf_counter() - start) * 1000.0 / iterations, fbos[-1].pixels
+
+
+def run(width=1024, height=256, iterations=200):
+    """Run the benchmark and print the results."""
+    os.environ['KIVY_NO_ARGS'] = '1'
+    os.environ['KIVY_NO_CONSOLELOG'] = '1'
+
+    from kivy.base import EventLoop
+    from kivy.graphics import Rectangle
+    from kivy.graphics.texture import Texture
+    from kivy.uix.widget import Widget
+    from mpfmc.uix.effects import EffectsManager
+    from mpfmc.widgets.effect_widget import EffectWidget
+
+    EventLoop.ensure_window()
+
+    # random content to render the effects on
+    texture = Texture.create(size=(width, height), colorfmt='rgba')
+    texture.blit_buffer(os.urandom(width * height * 4), colorfmt='rgba', bufferfmt='ubyte')
+    content = Widget(size=(width, height))
+    with content.canvas:
+        Rectangle(size=(width, height), texture=texture)
+
+    print("Effect chain render time per frame ({}x{}, {} iterations)".format(width, height, iterations))
+    print("{:<24} {:>8} {:>12} {:>8} {:>12} {:>9} {:>6}".format(
+        "chain", "passes", "multi (ms)", "passes", "fused (ms)", "speedup", "diff"))
+
+    for name, get_effects in get_chains(width, height):
+        widget = EffectWidget(size=(width, height))
+        widget.add_widget(content)
+
+        widget.effects = get_effects()
+        multi_passes = len(widget.effects)
+        multi_time, multi_pixels = render(widget, iterations)
+
+        widget.effects = EffectsManager.compile_effects(get_effects())
+        fused_passes = len(widget.effects)
+        fused_time, fused_pixels = render(widget, iterations)
+
+        widget.remove_widget(content)
+
+        print("{:<24} {:>8} {:>12.3f} {:>8} {:>12.3f} {:>8.2f}x {:>6}".format(
+            name, multi_passes, multi_time, fused_passes, fused_time, multi_time / fused_time,
+            max(abs(x - y) for x, y in zip(multi_pixels, fused_pixels))))
+
+
+if __name__ == '__main__':
+    run(*[int(arg) for arg in sys.argv[1:4]])
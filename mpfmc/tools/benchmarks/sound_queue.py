@@ -0,0 +1,101 @@
+"""Benchmark of the track sound queue.
+
+Queues a number of sound instances (spread over several sounds, contexts and
+keys), then removes them by context (like a mode ending with queued callouts)
+and by sound, and finally drains the rest of the queue. Compares the indexed
+SoundQueue with the previous approach (a heapq list which is copied, searched
+and re-heapified on every removal). No audio device is required.
+
+Usage: python -m mpfmc.tools.benchmarks.sound_queue [iterations]
+"""
+import sys
+import time
+from heapq import heappush, heappop, heapify
+
+from mpfmc.core.audio.sound_queue import SoundQueue
+
+QUEUE_SIZES = (10, 50, 100, 500, 1000)
+
+
+class _SoundInstance(object):
+
+    """Minimal stand-in for SoundInstance (same ordering)."""
+
+    def __init__(self, instance_id, priority):
+        self.id = instance_id
+        self.priority = priority
+        self.exp_time = None
+        self.sound_id = instance_id % 10
+        self.context = 'mode{}'.format(instance_id % 5)
+        self.key = None
+
+    def __lt__(self, other):
+        if self.priority != other.priority:
+            return self.priority > other.priority
+        return self.id > other.id
+
+
+def _legacy_queue(instances):
+    """Queue operations using a heapq list (previous implementation)."""
+    queue = list()
+    for sound_instance in instances:
+        heappush(queue, sound_instance)
+
+    for sound_instance in queue.copy():
+        if sound_instance.context == 'mode0':
+            queue.remove(sound_instance)
+    heapify(queue)
+
+    for sound_instance in queue.copy():
+        if sound_instance.sound_id == 1:
+            queue.remove(sound_instance)
+    heapify(queue)
+
+    for sound_instance in instances[::7]:
+        try:
+            queue.remove(sound_instance)
+            heapify(queue)
+        except ValueError:
+            pass
+
+    while queue:
+        heappop(queue)
+
+
+def _indexed_queue(instances):
+    """Queue operations using the indexed SoundQueue."""
+    queue = SoundQueue()
+    for sound_instance in instances:
+        queue.push(sound_instance)
+
+    queue.remove_context('mode0')
+    queue.remove_sound(1)
+
+    for sound_instance in instances[::7]:
+        queue.remove(sound_instance)
+
+    while queue:
+        queue.pop()
+
+
+def _time(function, instances, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        function(instances)
+    return (time.perf_counter() - start) * 1000000.0 / iterations
+
+
+def run(iterations=200):
+    """Run the benchmark and print the results."""
+    print("Sound queue operations ({} iterations)".format(iterations))
+    print("{:>8} {:>14} {:>14} {:>9}".format("queued", "indexed (us)", "legacy (us)", "speedup"))
+
+    for queue_size in QUEUE_SIZES:
+        instances = [_SoundInstance(instance_id, instance_id % 3) for instance_id in range(queue_size)]
+        indexed = _time(_indexed_queue, instances, iterations)
+        legacy = _time(_legacy_queue, instances, iterations)
+        print("{:>8} {:>14.1f} {:>14.1f} {:>8.2f}x".format(queue_size, indexed, legacy, legacy / indexed))
+
+
+if __name__ == '__main__':
+    run(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,171 @@
+"""Animation base class, animation driver and compiled animation steps used by the widgets
+of the mpf-mc."""
+from collections import namedtuple
+from typing import Dict, Tuple, Union
+
+from kivy.animation import Animation as KivyAnimation, AnimationTransition
+from kivy.clock import Clock
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from mpfmc.core.frame_pipeline import FramePipeline
+
+
+class AnimationDriver(object):
+
+    """Updates all the running widget animations from one callback per frame.
+
+    Kivy installs a clock event for each running animation (and each animation
+    of a sequence or parallel animation). The animations of the mpf-mc are
+    added to the driver instead, which updates them in the order they were
+    started once per frame (in the animation stage of the frame pipeline of
+    the media controller, or from its own clock event without a pipeline).
+    The property changes of all the animations are drawn in the same frame
+    (the render scheduler renders each changed display once per frame).
+    """
+
+    def __init__(self) -> None:
+        """Initialise animation driver."""
+        self._animations = dict()       # type: Dict[Animation, None]
+        self._update_event = None
+        self._pipeline = None           # type: FramePipeline
+        self._running = False
+
+        self.profiler = None
+        """The Profiler of the media controller (set by the profiler)."""
+
+    @property
+    def animations(self) -> list:
+        """Return the list of running animations."""
+        return list(self._animations)
+
+    @property
+    def running(self) -> bool:
+        """Return True while the driver updates animations each frame."""
+        return self._running
+
+    def set_pipeline(self, pipeline: "FramePipeline") -> None:
+        """Update the animations in the animation stage of a frame pipeline (the
+        animations of the previous pipeline are dropped)."""
+        self._stop()
+        self._animations.clear()
+        self._pipeline = pipeline
+
+    def add(self, animation: "Animation") -> None:
+        """Add an animation which is updated each frame."""
+        self._animations[animation] = None
+        if self._running:
+            return
+
+        self._running = True
+        if self._pipeline is not None:
+            self._pipeline.add_callback('animation', self._update)
+        else:
+            self._update_event = Clock.schedule_interval(self._update, 0)
+
+    def remove(self, animation: "Animation") -> None:
+        """Remove an animation (the driver stops on the next frame when no animation is
+        running)."""
+        self._animations.pop(animation, None)
+
+    def _stop(self) -> None:
+        self._running = False
+        if self._pipeline is not None:
+            self._pipeline.remove_callback('animation', self._update)
+        if self._update_event is not None:
+            self._update_event.cancel()
+            self._update_event = None
+
+    def _update(self, dt) -> None:
+        if not self._animations:
+            self._stop()
+            return
+
+        if self.profiler is None:
+            self._update_animations(dt)
+            return
+
+        with self.profiler.measure('animation'):
+            self._update_animations(dt)
+
+    def _update_animations(self, dt) -> None:
+        # animations started during this frame are updated from the next frame on
+        # (like a new clock event) and stopped animations are skipped
+        animations = self._animations
+        for animation in list(animations):
+            if animation in animations:
+                animation._update(dt)     # pylint: disable-msg=protected-access
+
+
+class Animation(KivyAnimation):
+
+    """Kivy Animation which is updated by the animation driver (instead of its own clock
+    event)."""
+
+    driver = AnimationDriver()
+    """The AnimationDriver updating all the animations."""
+
+    def _clock_install(self):
+        if self._clock_installed:
+            return
+
+        Animation.driver.add(self)
+        self._clock_installed = True
+
+    def _clock_uninstall(self):
+        if self._widgets or not self._clock_installed:
+            return
+
+        self._clock_installed = False
+        Animation.driver.remove(self)
+
+
+class AnimationStep(namedtuple('AnimationStep', ['properties', 'values', 'duration', 'easing',
+                                                 'relative', 'with_previous', 'repeat'])):
+
+    """Compiled settings of one step of a widget animation (one entry of an animations: list).
+
+    The values are (number, percent) tuples, the easing is the easing function.
+    Steps are immutable, so they are shared (not copied) by the widget configs.
+    """
+
+    __slots__ = ()
+
+    def __deepcopy__(self, memo):
+        del memo
+        return self
+
+
+def compile_animation_value(value: Union[str, int, float]) -> Tuple[Union[int, float], bool]:
+    """Convert an animation target value (which may end with a % sign) to a (number, percent)
+    tuple."""
+    value = str(value).strip()
+    percent = value.endswith('%')
+    if percent:
+        return float(value[:-1]), True
+
+    if '.' in value:
+        return float(value), False
+
+    return int(value), False
+
+
+def compile_animation_step(settings: dict) -> AnimationStep:
+    """Compile the (validated) settings of an animation step."""
+    easing = getattr(AnimationTransition, settings['easing'], None)
+    if not callable(easing):
+        raise ValueError('Invalid animation easing "{}" (animation: {})'.format(settings['easing'], settings))
+
+    try:
+        values = tuple(compile_animation_value(x) for x in settings['value'])
+    except ValueError:
+        raise ValueError('Invalid animation value in {} (values must be numbers or '
+                         'percentages)'.format(settings['value']))
+
+    return AnimationStep(properties=tuple(settings['property']),
+                         values=values,
+                         duration=settings['duration'],
+                         easing=easing,
+                         relative=bool(settings['relative']),
+                         with_previous=settings['timing'] == 'with_previous',
+                         repeat=bool(settings['repeat']))
@@ -12,8 +12,7 @@ from kivy.uix.screenmanager import (ScreenManager, NoTransition,
                                     ScreenManagerException)
 from kivy.uix.widget import Widget as KivyWidget, WidgetException as KivyWidgetException
 from kivy.uix.scatter import Scatter
-from kivy.graphics import (
-    Translate, Fbo, ClearColor, ClearBuffers, Scale)
+from kivy.graphics import Color, InstructionGroup, Rectangle
 from kivy.properties import ObjectProperty
 
 from mpfmc.uix.widget import WidgetContainer, Widget
@@ -84,6 +83,10 @@ class Display(ScreenManager):
         self.container.z = 0
         self.container.add_widget(self)
 
+        # The display is rendered into a cached texture (see RenderScheduler) which is
+        # shown by all the display outputs of this display
+        self.mc.render_scheduler.add_display(self)
+
         Clock.schedule_once(self._display_created, 0)
 
     def __repr__(self):
@@ -93,25 +96,15 @@ class Display(ScreenManager):
     def get_frame_data(self, *args):
         """Return the content of this display as buffer.
 
-        @see: widget.export_to_png
+        The data is read from the cached texture of the display (RGBA, top row
+        first).
         """
         del args
 
-        fbo = Fbo(size=self._slide_manager_parent.size, with_stencilbuffer=True)
-
-        with fbo:
-            ClearColor(0, 0, 0, 1)
-            ClearBuffers()
-            Scale(1, -1, 1)
-            Translate(-self.x,
-                      -self.y - self.height, 0)
-
-        fbo.add(self.canvas)
-        fbo.draw()
-        data = fbo.texture.pixels
-        fbo.remove(self.canvas)
-
-        return data
+        data = self.texture.pixels
+        stride = self.native_size[0] * 4
+        return b''.join(data[offset:offset + stride]
+                        for offset in range(len(data) - stride, -1, -stride))
 
     @property
     def ready(self):
@@ -329,6 +322,9 @@ class Display(ScreenManager):
             True is the slide will be shown, False otherwise.
         """
         # TODO: Is the show parameter really needed?  Why call show_slide and not show the slide?
+        if self.mc.latency_tracer.current:
+            self.mc.latency_tracer.slide_shown(self)
+
         if not play_kwargs:
             play_kwargs = kwargs
         else:
@@ -601,15 +597,12 @@ class DisplayOutput(Scatter):
 
         self.key = None
 
-        # It is important that the content of this display output does not contain any
-        # circular references to the same display (cannot do a recursive
-        # picture-in-picture or Kivy will crash).  Detect and prevent that situation.
-
         # Rather than adding the display as a child of this widget, we will simply
-        # add the display's canvas to this widget's canvas.  This allows the display
-        # to essentially have multiple parents. The canvas contains all the
-        # instructions needed to draw the widgets.
+        # draw the cached texture of the display (rendered once per frame by the
+        # render scheduler) on this widget's canvas.  This allows the display to
+        # essentially have multiple parents without being rendered more than once.
         self.display = display
+        self._display_instructions = None
 
         parent.bind(size=self.on_parent_resize)
         self._fit_to_parent()
@@ -637,8 +630,10 @@ class DisplayOutput(Scatter):
         widget.parent = self
         widget.parents.append(self)
 
-        canvas = self.canvas
-        canvas.add(widget.container.canvas)
+        self._display_instructions = InstructionGroup()
+        self._display_instructions.add(Color(1, 1, 1, 1))
+        self._display_instructions.add(Rectangle(pos=(0, 0), size=widget.native_size, texture=widget.texture))
+        self.canvas.add(self._display_instructions)
 
     def remove_display_source(self, widget):
         """Remove a display."""
@@ -647,8 +642,10 @@ class DisplayOutput(Scatter):
                 'remove_display_source() can be used only with instances'
                 ' of the Display class.')
         widget.parents.remove(self)
-        widget.parent = None
-        self.canvas.remove(widget.container.canvas)
+        widget.parent = widget.parents[-1] if widget.parents else None
+        if self._display_instructions:
+            self.canvas.remove(self._display_instructions)
+            self._display_instructions = None
 
     def __repr__(self) -> str:  # pragma: no cover
         try:
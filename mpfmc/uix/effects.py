@@ -1,18 +1,30 @@
 import importlib
 import abc
-from typing import Optional, List, Union
+import re
+from typing import Dict, Optional, List, Union
 
 from kivy.event import EventDispatcher
 from kivy.uix.effectwidget import (MonochromeEffect, InvertEffect,
                                    ScanlinesEffect, ChannelMixEffect,
                                    PixelateEffect, HorizontalBlurEffect,
                                    VerticalBlurEffect, FXAAEffect,
-                                   EffectBase)
+                                   EffectBase, AdvancedEffectBase,
+                                   shader_header, shader_uniforms,
+                                   shader_footer_effect)
 
 MYPY = False
 if MYPY:   # pragma: no cover
     from mpfmc.core.mc import MpfMc
 
+# The effect() function every effect has to define
+EFFECT_FUNCTION = re.compile(r'vec4\s+(effect)\s*\(\s*vec4\s+\w+\s*,\s*sampler2D\s+(\w+)\s*,'
+                             r'\s*vec2\s+\w+\s*,\s*vec2\s+\w+\s*\)')
+
+# Global variables, uniforms and helper functions declared before effect()
+GLOBAL_NAME = re.compile(r'^\s*(?:(?:uniform|const)\s+)?(?:float|int|bool|[bi]?vec[234]|mat[234]|sampler2D)'
+                         r'\s+(\w+)', re.M)
+FUNCTION_NAME = re.compile(r'^\s*\w+\s+(\w+)\s*\(', re.M)
+
 
 class EffectsManager(object):
     def __init__(self, mc: "MpfMc") -> None:
@@ -51,6 +63,54 @@ class EffectsManager(object):
         else:
             return []
 
+    @staticmethod
+    def samples_texture(effect: "EffectBase") -> Optional[bool]:
+        """Return whether an effect samples its texture (instead of only using the color of
+        the current pixel). Returns None for effects which can't be fused."""
+        if effect.source:
+            return None
+
+        match = EFFECT_FUNCTION.search(effect.glsl)
+        if not match:
+            return None
+
+        body = effect.glsl[match.end():]
+        return bool(re.search(r'\btexture2D\b|\b{}\b'.format(match.group(2)), body))
+
+    @staticmethod
+    def compile_effects(effects: List["EffectBase"]) -> List["EffectBase"]:
+        """Fuse consecutive effects of a chain into single-pass effects.
+
+        The EffectWidget renders each effect in its own full screen pass. Effects
+        which only use the color of the current pixel (e.g. gain, gamma, reduce,
+        dot_filter) are combined into one shader with the previous effects of the
+        chain. Effects which sample the texture (e.g. blur, anti_aliasing,
+        flip_vertical) need the output of all the previous effects, so they start a
+        new pass (the following per-pixel effects are fused into it).
+        """
+        groups = list()
+        current = list()
+
+        for effect in effects:
+            samples_texture = EffectsManager.samples_texture(effect)
+            if samples_texture is None:
+                if current:
+                    groups.append(current)
+                groups.append([effect])
+                current = list()
+                continue
+
+            if current and samples_texture:
+                groups.append(current)
+                current = list()
+
+            current.append(effect)
+
+        if current:
+            groups.append(current)
+
+        return [group[0] if len(group) == 1 else FusedEffect(group) for group in groups]
+
     def _register_mpf_effects(self) -> None:
         for t in self.mc.machine_config['mpf-mc']['mpf_effect_modules']:
             i = importlib.import_module('mpfmc.effects.{}'.format(t))
@@ -114,3 +174,118 @@ class EffectsChain(EventDispatcher, metaclass=abc.ABCMeta):
     def get_effects(self) -> List["EffectBase"]:
         """Return the list of effects in this chain."""
         raise NotImplementedError('get_effects method must be defined to use this base class')
+
+
+class ShaderCache(object):
+
+    """Process-wide cache of the fragment shaders of the effects.
+
+    The complete fragment shader source of each effect glsl is only built once
+    and shared by all the effects using it. Kivy compiles and links the shader
+    of an Fbo each time it is set, so the shader of an Fbo is only set when its
+    source actually changed.
+    """
+
+    sources = dict()        # type: Dict[str, str]
+    compile_count = 0
+    hit_count = 0
+
+    @classmethod
+    def get_source(cls, glsl: str) -> str:
+        """Return the complete fragment shader source for an effect glsl."""
+        try:
+            return cls.sources[glsl]
+        except KeyError:
+            source = shader_header + shader_uniforms + glsl + shader_footer_effect
+            cls.sources[glsl] = source
+            return source
+
+    @classmethod
+    def set_shader(cls, fbo, glsl: str) -> None:
+        """Set the fragment shader of an (effect) Fbo unless it already uses it."""
+        source = cls.get_source(glsl)
+        if fbo.shader.fs == source:
+            cls.hit_count += 1
+            return
+
+        fbo.set_fs(source)
+        cls.compile_count += 1
+
+
+class UniformEffectBase(AdvancedEffectBase):
+
+    """Base class for effects which pass their parameters to the shader as uniforms.
+
+    The glsl of these effects is constant and declares a uniform for each
+    parameter. Changing a parameter only uploads the new value to the shader
+    (instead of compiling a new shader), so the parameters are cheap to change
+    (or animate) and all the instances of an effect share the same shader
+    source (see ShaderCache).
+    """
+
+    def set_fbo_shader(self, *args) -> None:
+        """Set the shader of the Fbo (if it changed) and upload the uniforms."""
+        del args
+        if self.fbo is None:
+            return
+
+        ShaderCache.set_shader(self.fbo, self.glsl)
+        self._update_uniforms()
+
+
+class FusedEffect(UniformEffectBase):
+
+    """Effect which renders a chain of effects in a single pass.
+
+    The effect() function, the globals and the uniforms of each effect are
+    renamed (using the index of the effect as suffix) and the effect()
+    functions are called in order from a new effect() function. Only the first
+    effect may sample the texture (see EffectsManager.compile_effects). The
+    uniforms of the effects are forwarded to the shader and the shader is
+    updated whenever the glsl of one of the effects changes.
+    """
+
+    def __init__(self, effects: List["EffectBase"], **kwargs) -> None:
+        self.effects = list(effects)
+        super().__init__(**kwargs)
+
+        for index, effect in enumerate(self.effects):
+            effect.fbind('glsl', self._update_glsl)
+            if isinstance(effect, AdvancedEffectBase):
+                effect.fbind('uniforms', self._update_effect_uniforms, index)
+                self._update_effect_uniforms(index, effect)
+
+        self._update_glsl()
+
+    def _update_effect_uniforms(self, index: int, effect: "AdvancedEffectBase", *args) -> None:
+        del args
+        self.uniforms.update({'{}_{}'.format(name, index): value for name, value in effect.uniforms.items()})
+
+    def _update_glsl(self, *args) -> None:
+        del args
+        functions = list()
+        calls = list()
+
+        for index, effect in enumerate(self.effects):
+            suffix = '_{}'.format(index)
+            glsl = effect.glsl
+
+            header = glsl[:EFFECT_FUNCTION.search(glsl).start()]
+            names = set(GLOBAL_NAME.findall(header)) | set(FUNCTION_NAME.findall(header))
+            if names:
+                glsl = re.sub(r'\b({})\b'.format('|'.join(sorted(names))), r'\1' + suffix, glsl)
+
+            match = EFFECT_FUNCTION.search(glsl)
+            functions.append(glsl[:match.start(1)] + 'effect' + suffix + glsl[match.end(1):])
+            calls.append('    color = effect{}(color, texture, tex_coords, coords);'.format(suffix))
+
+        self.glsl = '\n'.join(functions) + fused_effect_glsl.format('\n'.join(calls))
+
+
+fused_effect_glsl = '''
+vec4 effect(vec4 color, sampler2D texture, vec2 tex_coords, vec2 coords)
+{{
+{}
+    return color;
+}}
+'''
@@ -0,0 +1,317 @@
+"""Animated image (zip image sequence or animated gif) which decodes its frames while it plays."""
+import logging
+import threading
+import zipfile
+from io import BytesIO
+from typing import Dict, List, Optional
+
+from kivy.clock import Clock
+from kivy.core.image import ImageData, ImageLoader
+from kivy.event import EventDispatcher
+from kivy.graphics.texture import Texture
+
+# Default number of frames decoded ahead of the current frame
+DEFAULT_BUFFER_FRAMES = 8
+
+# Number of textures the frames are uploaded to (in turns)
+TEXTURE_RING_SIZE = 2
+
+
+class ZipFrames(object):
+
+    """Frames of a zip image sequence (one image file per frame, sorted by name)."""
+
+    def __init__(self, file: str) -> None:
+        """Index the images in the zip file."""
+        self._zip = zipfile.ZipFile(file)
+        # skip folders and hidden files (like the resource forks added by macOS)
+        self.names = sorted(name for name in self._zip.namelist()
+                            if not name.startswith('__MACOSX/') and
+                            not name.rsplit('/', 1)[-1].startswith('.') and
+                            self._get_loader(name) is not None)
+
+        if not self.names:
+            raise ValueError('No images in zip {}'.format(file))
+
+    def __len__(self):
+        return len(self.names)
+
+    @staticmethod
+    def _get_loader(name):
+        ext = name.split('.')[-1].lower()
+        for loader in ImageLoader.loaders:
+            if ext in loader.extensions() and loader.can_load_memory():
+                return loader
+
+        return None
+
+    def decode(self, index: int) -> ImageData:
+        """Decode a frame."""
+        name = self.names[index]
+        data = BytesIO(self._zip.read(name))
+        image = self._get_loader(name)(name, ext=name.split('.')[-1].lower(), rawdata=data,
+                                        inline=True, keep_data=True)
+        return image._data[0]     # pylint: disable-msg=protected-access
+
+    def close(self) -> None:
+        """Close the zip file."""
+        self._zip.close()
+
+
+class GifFrames(object):
+
+    """Frames of an animated gif (decoded in order, since each frame is drawn over the
+    previous one)."""
+
+    def __init__(self, file: str) -> None:
+        """Count the frames of the gif."""
+        from PIL import Image as PILImage
+
+        self._image = PILImage.open(file)
+        self._count = getattr(self._image, 'n_frames', 1)
+        self._index = None
+        self._previous = None
+
+    def __len__(self):
+        return self._count
+
+    def decode(self, index: int) -> ImageData:
+        """Decode a frame (decodes the frames before it when it is not the next frame)."""
+        if self._index is None or index <= self._index:
+            self._index = -1
+            self._previous = None
+
+        while self._index < index:
+            self._index += 1
+            self._image.seek(self._index)
+            frame = self._image.convert('RGBA')
+            if self._previous and not getattr(self._image, 'dispose', True):
+                # paste the frame over the previous one (for the transparent pixels)
+                self._previous.paste(frame, (0, 0), frame)
+                frame = self._previous
+            self._previous = frame
+
+        return ImageData(self._previous.size[0], self._previous.size[1], 'rgba', self._previous.tobytes())
+
+    def close(self) -> None:
+        """Close the gif file."""
+        self._image.close()
+
+
+class ImageSequence(EventDispatcher):
+
+    """Animated image which keeps only a few frames in memory.
+
+    The frames are indexed when the sequence is created (in the asset loader
+    thread). While the animation plays, a background thread decodes the next
+    ``buffer_frames`` frames after the current frame and each frame is
+    uploaded to one of a small ring of textures when it is shown. Implements
+    the animation interface of the Kivy core Image (``anim_delay``,
+    ``anim_index``, ``anim_reset()`` and the ``on_texture`` event), so the
+    ImageWidget plays it like a sequence loaded by Kivy.
+    """
+
+    __events__ = ('on_texture', )
+
+    def __init__(self, file: str, buffer_frames: int = DEFAULT_BUFFER_FRAMES) -> None:
+        """Index the frames and decode the first frame."""
+        super().__init__()
+        self.log = logging.getLogger('ImageSequence')
+        self.file = file
+        self.buffer_frames = max(1, buffer_frames)
+
+        if file.lower().endswith('.gif'):
+            self._source = GifFrames(file)
+        else:
+            self._source = ZipFrames(file)
+
+        self.frame_count = len(self._source)
+
+        self._anim_index = 0
+        self._anim_delay = -1
+        self._anim_ev = None
+        self._texture = None
+        self._textures = list()     # type: List[Texture]
+        self._upload_count = 0
+
+        self.late_frames = 0
+        """Number of frames which were not decoded in time (the frame before was shown
+        longer)."""
+
+        # the first frame is shown until the animation starts
+        self._first_frame = self._source.decode(0)
+
+        # decoded frames (by index) shared with the decoder thread
+        self._frames = {0: self._first_frame}     # type: Dict[int, ImageData]
+        self._condition = threading.Condition()
+        self._thread = None     # type: Optional[threading.Thread]
+        self._running = False
+
+    def on_texture(self, *largs):
+        pass
+
+    @property
+    def anim_available(self) -> bool:
+        """Return True if the image has more than one frame."""
+        return self.frame_count > 1
+
+    @property
+    def anim_index(self) -> int:
+        """Return the index of the next frame."""
+        return self._anim_index
+
+    def _get_anim_delay(self):
+        return self._anim_delay
+
+    def _set_anim_delay(self, value):
+        if self._anim_delay == value:
+            return
+        self._anim_delay = value
+        if not self.anim_available:
+            return
+
+        if self._anim_ev is not None:
+            self._anim_ev.cancel()
+            self._anim_ev = None
+
+        if self._anim_delay >= 0:
+            self._start_decoder()
+            self._anim_ev = Clock.schedule_interval(self._anim, self._anim_delay)
+        else:
+            self._stop_decoder()
+
+    anim_delay = property(_get_anim_delay, _set_anim_delay)
+    '''Delay between two frames of the animation (-1 to stop the animation).'''
+
+    @property
+    def texture(self) -> Texture:
+        """Return the texture of the current frame."""
+        if self._texture is None and self._first_frame is not None:
+            self._show_frame(self._first_frame)
+            self._first_frame = None
+        return self._texture
+
+    @property
+    def memory(self) -> int:
+        """Return the memory (in bytes) used by the decoded frames and the textures."""
+        with self._condition:
+            frames = list(self._frames.values())
+        return (sum(len(frame.data) for frame in frames) +
+                sum(texture.width * texture.height * 4 for texture in self._textures))
+
+    def anim_reset(self, allow_anim: bool) -> None:
+        """Stop the animation, or restart it at the current frame (like the Kivy core
+        Image)."""
+        if self._anim_ev is not None:
+            self._anim_ev.cancel()
+            self._anim_ev = None
+
+        if allow_anim and self.anim_available and self._anim_delay >= 0:
+            self._start_decoder()
+            self._anim_ev = Clock.schedule_interval(self._anim, self._anim_delay)
+            self._anim()
+        else:
+            self._stop_decoder()
+
+    def unload(self) -> None:
+        """Stop the animation and release the frames."""
+        self.anim_reset(False)
+        self._source.close()
+        self._frames = dict()
+        self._textures = list()
+        self._texture = None
+
+    def _anim(self, *largs) -> None:
+        del largs
+        if self._anim_index >= self.frame_count:
+            self._anim_index = 0
+
+        with self._condition:
+            frame = self._frames.get(self._anim_index)
+            if frame is None:
+                # not decoded yet, try again with the next update
+                self.late_frames += 1
+                self._condition.notify()
+                return
+
+        self._show_frame(frame)
+        self.dispatch('on_texture')
+
+        with self._condition:
+            self._anim_index = (self._anim_index + 1) % self.frame_count
+            self._condition.notify()
+
+    def _show_frame(self, frame: ImageData) -> None:
+        """Upload a frame to the next texture of the ring."""
+        slot = self._upload_count % TEXTURE_RING_SIZE
+        self._upload_count += 1
+
+        if slot >= len(self._textures):
+            self._textures.append(self._create_texture(frame))
+        elif self._textures[slot].size != (frame.width, frame.height):
+            self._textures[slot] = self._create_texture(frame)
+        else:
+            self._textures[slot].blit_data(frame)
+
+        self._texture = self._textures[slot]
+
+    @staticmethod
+    def _create_texture(frame: ImageData) -> Texture:
+        """Create a texture for a frame (flipped like the textures of the Kivy core Image)."""
+        texture = Texture.create_from_data(frame)
+        if frame.flip_vertical:
+            texture.flip_vertical()
+        return texture
+
+    def _get_wanted_frames(self) -> List[int]:
+        return [(self._anim_index + offset) % self.frame_count for offset in range(self.buffer_frames)]
+
+    def _start_decoder(self) -> None:
+        if self._running:
+            return
+
+        self._running = True
+        self._thread = threading.Thread(target=self._decode_frames, name='ImageSequence')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _stop_decoder(self) -> None:
+        if not self._running:
+            return
+
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        self._thread.join()
+        self._thread = None
+
+    def _decode_frames(self) -> None:
+        """Decode the frames after the current frame (runs in the decoder thread)."""
+        while True:
+            with self._condition:
+                while True:
+                    if not self._running:
+                        return
+
+                    wanted = self._get_wanted_frames()
+                    # drop the frames which were shown
+                    for index in [index for index in self._frames if index not in wanted]:
+                        del self._frames[index]
+
+                    missing = [index for index in wanted if index not in self._frames]
+                    if missing:
+                        index = missing[0]
+                        break
+
+                    self._condition.wait()
+
+            try:
+                frame = self._source.decode(index)
+            except Exception:     # pylint: disable-msg=broad-except
+                self.log.exception("Cannot decode frame %s of %s", index, self.file)
+                with self._condition:
+                    self._running = False
+                return
+
+            with self._condition:
+                self._frames[index] = frame
@@ -1,4 +1,4 @@
-from kivy.animation import Animation
+from mpfmc.uix.animation import Animation
 
 
 class RelativeAnimation(Animation):
@@ -0,0 +1,241 @@
+"""Contains the RenderScheduler which renders the displays of the mpf-mc once per frame."""
+import logging
+from typing import Callable, Dict, List, Optional
+
+from kivy.clock import Clock
+from kivy.graphics import Fbo, ClearColor, ClearBuffers
+from mpf.core.utility_functions import Util
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from mpfmc.core.mc import MpfMc
+    from mpfmc.uix.display import Display, DisplayOutput
+
+
+class RenderScheduler(object):
+
+    """Renders each display once per frame into a cached texture.
+
+    The canvas of each display is drawn into its own Fbo. Everything showing a
+    display (display widgets, the window, DMDs and the display light player)
+    uses a DisplayOutput which only draws the cached texture of the display, so
+    a display shown in several places is rendered only once per frame.
+
+    Displays can be embedded in other displays (using display widgets). The
+    scheduler walks the display dependency graph and renders the changed
+    displays in topological order (embedded displays first) in the render
+    stage of the frame pipeline, right before the frame is drawn. Displays
+    which did not change since the last frame (no widget, animation, video or
+    slide transition changed anything on their canvas) are not rendered
+    again; their cached texture is reused.
+
+    When the ``mpf-mc: idle_fps`` setting is used, the frame rate of the mpf-mc
+    drops to that value once no display changed for ``mpf-mc: idle_timeout``,
+    and goes back to the normal frame rate as soon as a display changes or a
+    BCP command is received. The idle frame rate only limits the frame
+    pipeline, so everything else running in the pipeline (BCP, events, DMDs)
+    also runs at the idle frame rate and the first BCP command after an idle
+    period can be delayed by up to one idle frame.
+    """
+
+    def __init__(self, mc: "MpfMc") -> None:
+        """Initialise render scheduler."""
+        self.mc = mc
+        self.log = logging.getLogger('RenderScheduler')
+        self._fbos = dict()             # type: Dict[Display, Fbo]
+        self._containers = dict()       # type: Dict[object, Display]
+        self._listeners = dict()        # type: Dict[Display, List[Callable]]
+        self._cycle_warning = False
+
+        self.frames = 0
+        """Number of frames handled by the render scheduler."""
+
+        self.render_counts = dict()     # type: Dict[str, int]
+        """Number of times each display (by name) has been rendered."""
+
+        self.skip_counts = dict()       # type: Dict[str, int]
+        """Number of frames each display (by name) has been skipped (not changed)."""
+
+        self.rendered_frames = 0
+        """Number of frames in which at least one display has been rendered."""
+
+        self.skipped_frames = 0
+        """Number of frames in which no display has been rendered."""
+
+        self.idle = False
+        """True while the idle frame rate is used."""
+
+        self.idle_fps = mc.machine_config['mpf-mc']['idle_fps']
+        self.idle_timeout = Util.string_to_secs(mc.machine_config['mpf-mc']['idle_timeout'])
+        self._last_change_time = Clock.time()
+
+        mc.frame_pipeline.add_callback('render', self._render)
+
+    def add_display(self, display: "Display") -> None:
+        """Create the Fbo holding the cached texture of a display."""
+        fbo = Fbo(size=display.native_size, with_stencilbuffer=True)
+
+        with fbo:
+            ClearColor(0, 0, 0, 0)
+            ClearBuffers()
+
+        fbo.add(display.container.canvas)
+
+        self._fbos[display] = fbo
+        self._containers[display.container] = display
+        self._listeners[display] = list()
+        self.render_counts[display.name] = 0
+        self.skip_counts[display.name] = 0
+        display.texture = fbo.texture
+
+    def add_listener(self, display: "Display", callback: Callable) -> None:
+        """Add a callback which is called (with the display) each time a display has been
+        rendered."""
+        self._listeners[display].append(callback)
+
+    def remove_listener(self, display: "Display", callback: Callable) -> None:
+        """Remove a callback added with add_listener."""
+        try:
+            self._listeners[display].remove(callback)
+        except (KeyError, ValueError):
+            pass
+
+    def get_host_display(self, output: "DisplayOutput") -> Optional["Display"]:
+        """Return the display in which a display output is shown (None if the display output
+        is not shown in a display, e.g. the window and DMDs)."""
+        # Import here to prevent circular import
+        from mpfmc.uix.display import Display
+
+        widget = output.parent
+        while widget is not None:
+            if isinstance(widget, Display):
+                return widget
+            if widget in self._containers:
+                return self._containers[widget]
+            if widget.parent is widget:
+                # the Kivy window is its own parent
+                break
+            widget = widget.parent
+
+        return None
+
+    def get_dependencies(self) -> Dict["Display", List["Display"]]:
+        """Return a dictionary with the list of displays embedded in each display."""
+        dependencies = {display: list() for display in self._fbos}
+        for display in self._fbos:
+            for output in display.parents:
+                host = self.get_host_display(output)
+                if host is not None and display not in dependencies[host]:
+                    dependencies[host].append(display)
+
+        return dependencies
+
+    def get_render_order(self) -> List["Display"]:
+        """Return the list of displays in the order they have to be rendered (each display
+        after all the displays embedded in it)."""
+        dependencies = self.get_dependencies()
+        remaining = {display: len(embedded) for display, embedded in dependencies.items()}
+        hosts = {display: list() for display in dependencies}
+        for display, embedded in dependencies.items():
+            for source in embedded:
+                hosts[source].append(display)
+
+        ready = sorted((display for display, count in remaining.items() if not count),
+                       key=lambda x: x.name, reverse=True)
+        order = list()
+        while ready:
+            display = ready.pop()
+            order.append(display)
+            del remaining[display]
+            for host in hosts[display]:
+                remaining[host] -= 1
+                if not remaining[host]:
+                    ready.append(host)
+
+        if remaining:
+            # Displays showing each other can not be rendered in a valid order. They are
+            # rendered last and show the content of the previous frame.
+            if not self._cycle_warning:
+                self._cycle_warning = True
+                self.log.warning("Displays %s are shown in each other (circular display "
+                                 "widgets). Their content will lag one frame behind.",
+                                 sorted(display.name for display in remaining))
+            order.extend(sorted(remaining, key=lambda x: x.name))
+
+        return order
+
+    def _render(self, dt) -> None:
+        """Render all the displays which changed since the last frame."""
+        del dt
+        self.frames += 1
+        rendered = list()
+
+        for display in self.get_render_order():
+            fbo = self._fbos[display]
+            if not fbo.needs_redraw:
+                self.skip_counts[display.name] += 1
+                continue
+
+            fbo.draw()
+            self.render_counts[display.name] += 1
+            rendered.append(display)
+
+            # The cached texture changed so everything showing it has to be drawn again
+            # (the displays it is embedded in are rendered later in this frame)
+            for output in display.parents:
+                output.canvas.ask_update()
+
+        if rendered:
+            self.rendered_frames += 1
+        else:
+            self.skipped_frames += 1
+
+        self._update_idle_mode(bool(rendered))
+
+        if self.mc.latency_tracer.enabled:
+            for display in rendered:
+                self.mc.latency_tracer.display_rendered(display)
+
+        for display in rendered:
+            for callback in self._listeners[display]:
+                callback(display)
+
+    def wake(self) -> None:
+        """Leave the idle mode (e.g. when something other than the displays needs the normal
+        frame rate)."""
+        self._update_idle_mode(True)
+
+    def _update_idle_mode(self, changed: bool) -> None:
+        """Switch between the normal and the idle frame rate."""
+        if not self.idle_fps:
+            return
+
+        if changed:
+            self._last_change_time = Clock.time()
+            if self.idle:
+                self._set_idle(False)
+        elif not self.idle and Clock.time() - self._last_change_time >= self.idle_timeout:
+            self._set_idle(True)
+
+    def _set_idle(self, idle: bool) -> None:
+        self.idle = idle
+        self.mc.frame_pipeline.set_max_fps(self.idle_fps if idle else 0)
+        self.log.debug("%s idle mode", "Entering" if idle else "Leaving")
+
+    def get_stats(self) -> dict:
+        """Return the number of frames handled, rendered and skipped (in total and for each
+        display)."""
+        return {
+            'frames': self.frames,
+            'rendered_frames': self.rendered_frames,
+            'skipped_frames': self.skipped_frames,
+            'displays': {name: {'rendered': count, 'skipped': self.skip_counts[name]}
+                         for name, count in self.render_counts.items()}}
+
+    def log_stats(self) -> None:
+        """Log the number of frames rendered and skipped."""
+        self.log.info("Frames: %s, rendered: %s, skipped (no change): %s", self.frames,
+                      self.rendered_frames, self.skipped_frames)
+        for name in sorted(self.render_counts):
+            self.log.info("Display %s: rendered: %s, skipped: %s", name,
+                          self.render_counts[name], self.skip_counts[name])
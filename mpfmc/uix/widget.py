@@ -5,7 +5,6 @@ from functools import reduce
 import math
 
 from kivy.clock import Clock
-from kivy.animation import Animation
 from kivy.uix.relativelayout import RelativeLayout
 from kivy.uix.widget import Widget as KivyWidget
 from kivy.properties import (NumericProperty, ReferenceListProperty,
@@ -13,6 +12,7 @@ from kivy.properties import (NumericProperty, ReferenceListProperty,
 
 from mpf.core.rgba_color import RGBAColor
 
+from mpfmc.uix.animation import Animation, compile_animation_step
 from mpfmc.uix.relative_animation import RelativeAnimation
 from mpfmc.core.utils import percent_to_float
 
@@ -99,6 +99,9 @@ class Widget(KivyWidget):
         # dict of original values of settings that were animated so we can
         # restore them later
 
+        self._animations = dict()
+        # compiled animations (see compile_animation) by event name
+
         self._percent_prop_dicts = dict()
 
         self._round_anchor_styles = (None, None)
@@ -121,6 +124,8 @@ class Widget(KivyWidget):
         # Build animations
         if 'animations' in self.config and self.config['animations']:
             for k, v in self.config['animations'].items():
+                self._animations[k] = self.compile_animation(v)
+
                 if k == 'add_to_slide':
                     # needed because the initial properties of the widget
                     # aren't set yet
@@ -431,29 +436,27 @@ class Widget(KivyWidget):
 
         self.on_remove_from_slide()
 
-    def _convert_animation_value_to_float(self, prop: str,
-                                          val: Union[str, int, float]) -> Union[float, int]:
+    def _get_animation_value(self, prop: str, value: tuple) -> Union[float, int]:
         """
-        Convert an animation property value to a numeric value.
+        Return the numeric target value of an animated property.
         Args:
             prop: The name of the property to animate
-            val: The animation target value (may be a string that contains a % sign)
+            value: The compiled target value (number, percent)
 
         Returns:
             Numeric value (float or int).
         """
-        try:
-            val = percent_to_float(val, self._percent_prop_dicts[prop])
-        except KeyError:
-            # because widget properties can include a % sign, they are
-            # all strings, so even ones that aren't on the list to look
-            # for percent signs have to be converted to numbers.
-            if '.' in val:
-                val = float(val)
-            else:
-                val = int(val)
+        number, percent = value
+        if prop in self._percent_prop_dicts:
+            if percent:
+                return number * self._percent_prop_dicts[prop] / 100
+            return float(number)
+
+        if percent:
+            raise ValueError("The {} property of {} widgets can't be animated to a percentage "
+                             "value".format(prop, self.widget_type_name))
 
-        return val
+        return number
 
     def _resolve_named_animations(self, config_list):
         # find any named animations and replace them with the real ones
@@ -469,46 +472,42 @@ class Widget(KivyWidget):
 
         return animation_list
 
-    # pylint: disable-msg=too-many-branches
-    def build_animation_from_config(self, config_list: list) -> Animation:
-        """Build animation object from config."""
-        if not isinstance(config_list, list):
-            raise TypeError('build_animation_from_config requires a list')
+    def compile_animation(self, config_list: list) -> tuple:
+        """Compile an animation config (list of animation steps) for this widget.
 
-        # find any named animations and replace them with the real ones
-        animation_list = self._resolve_named_animations(config_list)
+        Named animations are resolved and the target values are assigned to the
+        properties of the widget. Returns a tuple of (step, targets) tuples, where
+        targets is a tuple of (property, values, is_list) tuples. Steps which can't
+        be used for this widget are ignored (with a warning).
+        """
+        if not isinstance(config_list, list):
+            raise TypeError('compile_animation requires a list')
 
-        repeat = False
-        animation_sequence_list = []
+        compiled = list()
 
-        for settings in animation_list:
-            prop_dict = dict()
-            values_needed = dict()
-            values = settings['value'].copy()
+        for settings in self._resolve_named_animations(config_list):
+            # the animation steps of the config are compiled when the config is loaded (the
+            # inline animations of slides and widgets played by MPF are compiled here)
+            step = settings.get('_step') or compile_animation_step(settings)
 
             # Some properties that can be animated contain more than single values
             # (such as color). Need to ensure there are the correct number of
             # values for the properties to animate.
-            values_needed_total = 0
+            values_needed = [len(getattr(self, prop)) if isinstance(getattr(self, prop, None), list) else 1
+                             for prop in step.properties]
 
-            for prop in settings['property']:
-                if isinstance(getattr(self, prop), list):
-                    values_needed[prop] = len(getattr(self, prop))
-                    values_needed_total += values_needed[prop]
-                else:
-                    values_needed[prop] = 1
-                    values_needed_total += 1
-
-            if len(settings['value']) != values_needed_total:
+            if len(step.values) != sum(values_needed):
                 self.mc.log.warning("There is a mismatch between the number of values "
                                     "available and the number of values required to animate "
                                     "the following properties in the %s widget: %s "
                                     "(animation will be ignored).",
-                                    self.widget_type_name, settings['property'])
+                                    self.widget_type_name, list(step.properties))
                 continue
 
-            # Create a dictionary of properties to animate along with their target values
-            for prop in settings['property']:
+            targets = list()
+            values = step.values
+            for prop, count in zip(step.properties, values_needed):
+                prop_values, values = values[:count], values[count:]
 
                 # Make sure target widget property can be animated
                 if prop not in self.animation_properties:
@@ -517,48 +516,52 @@ class Widget(KivyWidget):
                                         self.widget_type_name, prop)
                     continue
 
-                # Convert target value(s) to numeric types
-                if values_needed[prop] > 1:
-                    val = [self._convert_animation_value_to_float(prop, x)
-                           for x in values[:values_needed[prop]]]
-                    del values[:values_needed[prop]]
-                else:
-                    val = self._convert_animation_value_to_float(prop, values[0])
-                    del values[0]
+                targets.append((prop, prop_values, count > 1))
 
-                prop_dict[prop] = val
+            compiled.append((step, tuple(targets)))
+
+        return tuple(compiled)
+
+    def build_animation(self, compiled_animation: tuple) -> Optional[Animation]:
+        """Build the animation object of a compiled animation (see compile_animation).
+
+        Returns None if the animation has no steps.
+        """
+        repeat = False
+        animation_sequence_list = []
+
+        for step, targets in compiled_animation:
+            # Create a dictionary of properties to animate along with their target values
+            prop_dict = dict()
+            for prop, values, is_list in targets:
+                if is_list:
+                    prop_dict[prop] = [self._get_animation_value(prop, x) for x in values]
+                else:
+                    prop_dict[prop] = self._get_animation_value(prop, values[0])
 
                 # Save the pre-animated property value so it can later be restored
                 if prop not in self._pre_animated_settings:
                     self._pre_animated_settings[prop] = getattr(self, prop)
 
-            # TODO: Support custom easing functions
-            # This can be done by replacing transition string with a function reference
-            # when the string does not exist in the Kivy AnimationTransition class as
-            # a method.
-
             # Create the animation object
-            if settings['relative']:
-                animation = RelativeAnimation(duration=settings['duration'],
-                                              transition=settings['easing'],
-                                              **prop_dict)
-            else:
-                animation = Animation(duration=settings['duration'],
-                                      transition=settings['easing'],
-                                      **prop_dict)
+            animation_cls = RelativeAnimation if step.relative else Animation
+            animation = animation_cls(duration=step.duration, transition=step.easing, **prop_dict)
 
             # Determine if this animation should be performed in sequence or in parallel
             # with the previous animation.
-            if settings['timing'] == 'with_previous' and animation_sequence_list:
+            if step.with_previous and animation_sequence_list:
                 # Combine in parallel with previous animation
                 animation_sequence_list[-1] &= animation
             else:
                 # Add new sequential animation to the list
                 animation_sequence_list.append(animation)
 
-            if settings['repeat']:
+            if step.repeat:
                 repeat = True
 
+        if not animation_sequence_list:
+            return None
+
         # Combine all animations that should be performed in sequence into a single
         # animation object (add them all together)
         final_animation = reduce(lambda x, y: x + y, animation_sequence_list)
@@ -568,6 +571,13 @@ class Widget(KivyWidget):
 
         return final_animation
 
+    def build_animation_from_config(self, config_list: list) -> Optional[Animation]:
+        """Build animation object from config."""
+        if not isinstance(config_list, list):
+            raise TypeError('build_animation_from_config requires a list')
+
+        return self.build_animation(self.compile_animation(config_list))
+
     def stop_animation(self) -> None:
         """Stop the current widget animation."""
         try:
@@ -592,13 +602,13 @@ class Widget(KivyWidget):
         been registered."""
         del kwargs
 
-        if event_name not in self.config['animations']:
+        if event_name not in self._animations:
             return
 
         self.stop_animation()
-        self.animation = self.build_animation_from_config(
-            self.config['animations'][event_name])
-        self.animation.start(self)
+        self.animation = self.build_animation(self._animations[event_name])
+        if self.animation is not None:
+            self.animation.start(self)
 
     def _remove_animation_events(self) -> None:
         """Remove previously registered handlers for the various events that trigger animation actions."""
@@ -1,11 +1,10 @@
 from typing import Optional
 
-from kivy.uix.effectwidget import EffectWidget
-
 from kivy.uix.relativelayout import RelativeLayout
 
 from mpfmc.uix.widget import Widget
 from mpfmc.uix.display import DisplayOutput
+from mpfmc.widgets.effect_widget import EffectWidget
 
 MYPY = False
 if MYPY:   # pragma: no cover
@@ -65,7 +64,8 @@ class DisplayWidget(Widget, RelativeLayout):
                 effect_config['height'] = self.height
                 effects_list.extend(self.mc.effects_manager.get_effect(effect_config))
 
-            self.effects.effects = effects_list
+            # fuse the per-pixel effects to render the chain in as few passes as possible
+            self.effects.effects = self.mc.effects_manager.compile_effects(effects_list)
 
     def get_display(self):
         """List display."""
@@ -101,7 +101,7 @@ class ImageWidget(Widget):
         # Handle animation looping (when applicable)
         ci = self._image.image
         if ci.anim_available:
-            if self.loops > -1 and ci.anim_index == len(ci.image.textures) - 1:
+            if self.loops > -1 and ci.anim_index == self._image.frame_count - 1:
                 self._current_loop += 1
                 if self._current_loop == self.loops:
                     ci.anim_reset(False)
@@ -177,10 +177,10 @@ class ImageWidget(Widget):
         return self._image.image.anim_index + 1
 
     def _set_current_frame(self, value: Union[int, float]):
-        if not self._image.image.anim_available or not hasattr(self._image.image.image, 'textures'):
+        if not self._image.image.anim_available or not self._image.frame_count:
             return
 
-        frame = (int(value) - 1) % len(self._image.image.image.textures)
+        frame = (int(value) - 1) % self._image.frame_count
         if frame == self._image.image.anim_index:
             return
         else:
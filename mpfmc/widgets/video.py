@@ -1,8 +1,9 @@
 from typing import Optional
 
+from kivy.clock import Clock
 from kivy.uix.video import Video
 from kivy.core.video import Video as CoreVideo
-from kivy.graphics import Rectangle, Color, Rotate, Scale
+from kivy.graphics import Rectangle, Color, Rotate, Scale, InstructionGroup
 from kivy.properties import NumericProperty
 
 from mpfmc.uix.widget import Widget, magic_events
@@ -40,14 +41,36 @@ class VideoWidget(Widget, Video):
         if self.config['control_events']:
             self._setup_control_events(self.config['control_events'])
 
-        # Bind to all properties that when changed need to force
-        # the widget to be redrawn
-        self.bind(pos=self._draw_widget,
-                  size=self._draw_widget,
-                  color=self._draw_widget,
-                  texture=self._draw_widget,
-                  rotation=self._draw_widget,
-                  scale=self._draw_widget)
+        # The canvas instructions are created once and updated when the
+        # properties change. The video provider updates the contents of the
+        # texture for each frame, so new frames only need a redraw.
+        self.canvas.clear()
+        self._instructions = InstructionGroup()
+        self._color = Color(*self.color)
+        self._rotate = Rotate(angle=self.rotation)
+        self._scale = Scale()
+        self._rectangle = Rectangle(texture=self.texture)
+        for instruction in (self._color, self._rotate, self._scale, self._rectangle):
+            self._instructions.add(instruction)
+        self._visible = False
+
+        # frame timing (to count dropped and late frames)
+        self._last_frame_position = None
+        self._frame_interval = None
+        self._start_time = None
+
+        self._update_geometry()
+        self._update_scale()
+        self._update_visibility()
+
+        self.bind(pos=self._update_geometry,
+                  size=self._update_geometry,
+                  anchor_offset_pos=self._update_geometry,
+                  color=self._update_color,
+                  texture=self._update_texture,
+                  rotation=self._update_rotation,
+                  scale=self._update_scale,
+                  state=self._update_visibility)
 
         if not self.video.video:
             self.video.load(callback=self._do_video_load)
@@ -63,19 +86,84 @@ class VideoWidget(Widget, Video):
             return '<Video (loading...), size={}, pos={}>'.format(self.size,
                                                                   self.pos)
 
-    def _draw_widget(self, *args):
-        """Draws the image (draws a rectangle using the image texture)"""
+    def _update_geometry(self, *args) -> None:
         del args
-
         anchor = (self.x - self.anchor_offset_pos[0], self.y - self.anchor_offset_pos[1])
-        self.canvas.clear()
+        self._rotate.origin = anchor
+        self._scale.origin = anchor
+        self._rectangle.pos = self.pos
+        self._rectangle.size = self.size
+
+    def _update_color(self, *args) -> None:
+        del args
+        self._color.rgba = self.color
+
+    def _update_texture(self, *args) -> None:
+        del args
+        self._rectangle.texture = self.texture
+
+    def _update_rotation(self, *args) -> None:
+        del args
+        self._rotate.angle = self.rotation
+
+    def _update_scale(self, *args) -> None:
+        del args
+        self._scale.xyz = (self.scale, self.scale, self.scale)
+
+    def _update_visibility(self, *args) -> None:
+        """Show the video while it is playing or paused."""
+        del args
+        # restart the frame timing (e.g. after a pause)
+        self._last_frame_position = None
+
+        visible = self.state in ('play', 'pause')
+        if visible == self._visible:
+            return
 
-        if self.state in ('play', 'pause'):
-            with self.canvas:
-                Color(*self.color)
-                Rotate(angle=self.rotation, origin=anchor)
-                Scale(self.scale).origin = anchor
-                Rectangle(pos=self.pos, size=self.size, texture=self.texture)
+        self._visible = visible
+        if visible:
+            self.canvas.add(self._instructions)
+        else:
+            self.canvas.remove(self._instructions)
+
+    def _on_video_frame(self, *largs) -> None:
+        """Count dropped and late frames (using the position of the video)."""
+        video = self._video
+        if video:
+            self._update_frame_timing(video.position, Clock.time())
+
+        super()._on_video_frame(*largs)
+
+    def _update_frame_timing(self, position: float, now: float) -> None:
+        """Count a frame shown at the clock time now.
+
+        The position is the ``position`` of the video when the frame is shown (the
+        timestamp of the last decoded frame for the ffpyplayer provider). A frame is
+        late when it is shown more than one frame interval after the time of its
+        position, counted from the first frame after the last seek, loop or state
+        change.
+        """
+        self.frames += 1
+        last_position = self._last_frame_position
+        self._last_frame_position = position
+
+        if last_position is None or position <= last_position:
+            # first frame, seek or loop
+            self._start_time = now - position
+            return
+
+        delta = position - last_position
+        if self._frame_interval is None or delta < self._frame_interval:
+            # the shortest time between two frames is the frame interval of the video
+            self._frame_interval = delta
+
+        # frames skipped by the decoder or replaced before they were shown
+        dropped = int(round(delta / self._frame_interval)) - 1
+        if dropped > 0:
+            self.dropped_frames += dropped
+
+        if now - self._start_time - position > self._frame_interval:
+            self.late_frames += 1
 
     def _setup_control_events(self, event_list: list) -> None:
         for entry in event_list:
@@ -262,5 +350,28 @@ class VideoWidget(Widget, Video):
     1.0.
     '''
 
+    frames = NumericProperty(0)
+    '''Number of video frames shown by the widget.
+
+    :attr:`frames` is an :class:`~kivy.properties.NumericProperty` and defaults to
+    0.
+    '''
+
+    dropped_frames = NumericProperty(0)
+    '''Number of video frames which were not shown (skipped by the video provider
+    or replaced by the next frame before they were drawn).
+
+    :attr:`dropped_frames` is an :class:`~kivy.properties.NumericProperty` and
+    defaults to 0.
+    '''
+
+    late_frames = NumericProperty(0)
+    '''Number of video frames which were shown more than one frame interval
+    later than the time of their position in the video.
+
+    :attr:`late_frames` is an :class:`~kivy.properties.NumericProperty` and
+    defaults to 0.
+    '''
+
 
 widget_classes = [VideoWidget]
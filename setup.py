@@ -668,5 +668,6 @@ setup(
     [mpf.command]
     mc=mpfmc.commands.mc:get_command
     imc=mpfmc.commands.imc:get_command
+    build_sounds=mpfmc.commands.build_sounds:get_command
     ''',
     setup_requires=['cython>=' + MIN_CYTHON_STRING] if not skip_cython else [])